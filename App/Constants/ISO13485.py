@@ -1 +0,0 @@
-ISO13845 = 'data:image/png;base64, iVBORw0KGgoAAAANSUhEUgAAAb8AAAF7CAYAAABCaoXQAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAIdUAACHVAQSctJ0AAG1pSURBVHhe7Z0F2D1F+f4HFFRaOkQaUbpDUkIURBokJL40UiLdHRKCgHSHSAoiSnenlOQXBAQJKQkJ9399jrv+5/ec2XO2znnP2b3v67ov4t2dnY0z98wzTzjn3MXOuVtFURRFsQG8xTm3l3POjXbO/UcURVEUG8JzEb8XnXORKIqiKDaE50n8RFEUxaZR4ieKoig2jhI/URRFsXGU+ImiKIqNo8RPFEVRbBwlfqIoimLjKPETRVEUG0eJnyiKotg4SvxEURTFxlHiJ4qiKDaOEj9RFEWxcZT4iaIoio2jxE8URVFsHCV+oiiKYuMo8RNFURQbR4mfKIqi2DhK/ERRFMXGUeIniqIoNo4SP1EURbFxlPiJoiiKjaPETxRFUWwcJX6iKIpi4yjxE0VRFBtHiZ8oiqLYOEr8RFEUxcZR4ieKoig2jhI/URRFsXGU+ImiKIqNo8RPFEVRbBwlfqIoimLjKPETRVEUG0eJnyiKotg4SvxEURTFxlHiJ4qiKDaOEj9RFEWxcZT4iaLYX0466aTR3PPMGy2//PLR2uusE22wwYbRFlts2cZ11103WnvttaNll102mnPOuaKJJvp6W1uiWJASP1EUe8cvf/nL0UILLRxtsOGG0c9+9rNo9913j84886zohhtujB577LHo73//e/TWW29HH3/88f/hRx99HL322mvRq6++Gj366KPRddddH5122mnRL37xi2ibbbaJ1llnnWiuueduu54oZmTzxG+MMcZo+3/icFPvdLCI4K244g+ibbbZNjriiCOj2++4M3r33XejKvHGG29E199wY7TPPvu0VomLL7FEWz9EsQObJ35wnnnmaf1gtttuu9ZstAx32mmnaOmll267Rj85ySSTxP0pfz+Dwe2iTTbdNPrqV7/adq9pXHvttQrf//bbbx9tuOGG0YQTTtjWblbOPMss0cYbbxztsMMObe33i9tvv0O03nrrR9/4xrRt/esHZ5xp5miTTTaJDj300OiZZ5+zetVTPPDgg9Eee+zRWmFiVrV96wdnm+3b0SabbBptt932be+mv9yutTreYsstos022yxaf/0NomWXXS6accaZojHGGPP/9LnBE8dmit9RRx1tfzul8Mc/XhtNNdXUbdfpF+eee27bpaHH3ffcm0uMMKGVwRdf/CcaNWpUa9Vi287Cb31rtuiuu+62zfYdo0e/FK2wwvfb+tdLzjLLrK1B97LLLo8+//xz26W+4qOPP45OOfXUaNNRo6Ipppiira+95GabbR699957tksjjg8/+ih64smnoksuuTTad9/9Wt/5aqutHk055VRt99AgNk/8ppnmG9Gf/3yd/T5K4W9/ezlaZ511267VL84555y2S0OPDTf8aTTWWGO13Wsa77vvPttEbjzzzLPRkkst1dZ2NyazZ0Rn9OjRttm+4sknn2rN8m0fe8Fxxhkn2mqrraIrr7zKdmMgcPrpp0c//elPC09o8nLjjTdp7VMOA956663o9DPOiDbaaKNohRVWiL42zjht91NzNk/8MAewwV41jj/+123X6hfrJn6ffvZZ7pV0WfH7z3/+0/rntdf+KZpuuunb2s/KzTffPHrnnXds833Dk08+2RfxY0+P/bxhwH777RctuWT+SU1eYvbGgWfY8MLo0dGhhx7W8qodd9xx2+6rpmye+J199tn23VeCe++9L1p44UXartcP1k38rrnm2taqwt5nJ5YVPx+HHHpY4UFgzDHHjI4++pjoiy++sM32Bb0Wv6985SvRrrvuGr3y6nAN8k88+WRrYtLLPa5hFb8E9P3ggw+J5ptvvrZ7qyGbJX7f+973or/8pdzeUBo++eSTaLfddm+7Zj9YN/FbZZVVcpuqqhQ/3OzXX3/9wgPlt2abLbrl1ltts31BL8WPvb2DDjrIXnKogFMMDmL23qrgsItfgkceeSRaddXVogkmmKDtHmvEZonfgQceFH322Wf2XVeGiy/+bTRewRVDGdZJ/D744F/R1772tbZ77MYqxQ88/PAj0UILL9x2naxcc801WzFq/UavxG/xJZaMrrnmj61rJCbiYcWvf31CNNtss7XdY1nWRfzAe++9H+299759dxrqI5sjfphrrrzySvuOK8UzzzwT/WiVVdqu3WvWSfzwSCticqxS/JLB/XeXXBJ9Y9riYQOE0rz//ge2+Z6iavFj9Ytn4IMPPdxqf9iFL+n/VVddXfk2RZ3ED3z22efRqaeeFk0zzTRt91oDNkf8SKH08ssv2/dbOY455ti2a/eadRK/VVb5cfSlL32p7R67sUrx83HggQfm3n9M+JWvfDU68cSTbJM9RZXiN+YYY0ZrrbX2/xx4hl34EiT3cf8DD0aLLrpY230XZd3EL8F5550fff3rtUst1xzxYwbTD9x2223Rd74ze9v1e8m6iN87776bK7DdZ6/EDzPs2muv03a9rFxggQWje+65xzbbM1QpfsuvsEL05ptv2UvUCvff/2A0++xztN17EdZV/Eg3d8QRRxTeAx9QNkP8FlhggeiBBx6077Qn+Oc777QCfm0fesm6iN+FF15UeJXVK/EDd9xxZzTvvPO2XTMrcZ75xz/+YZvtCaoSv/nmmz+69777bfO1BMH5VQR811X8APe13nrrtd3zELMZ4rfbbrtF77//vn2fPcM5557b1odesi7it/zyKxQyecJeiV9iIjvrrLOiKaecsu26Wbnnnnv21NkqQRXiN9VUU/1vf7wups40JPd36KGHF3K08llX8Uue0eOPPxHNOuu32u57SFl/8cNl/oorrrDvs6d49NG/RMss8722vvSKdRC/V//+Wsspyd5bVvZK/Hzsvvsehfs49dTTROeff6FtsnKUFT/MzlRe6DU++OCD6LnnnotuvfXW6Nprr42uuPLK6PLLL48uuuii6Morf9/in/70p+jWW2+LXnzxpeijjz6yTVSGZHDfaOONC0++YF3FLwGp60gdZ+97SFl/8fvxj1eNnu1zkl0+EpL72r70imXEj76++OKL0Usv/W3E+Morr7YcQ4ru98F+iN9rr70erbzyym3XzsrvfneJ6MYbb2q1Y59BQt7F228Xz0BURvwI0Kd+Xq/wr3/9K3rsscdbInfY4YdHyy67fFsfQlzlx6tFxx13XPSHP/yh5VHdyxU05Zfs9bOyjPiRFIFKFQi9/Say8m9/+1vr26KCxr///W97iUrwxBNPRPMvsGDbvQ8h6y9+pB37oqDphjx9RfdqyB/KbN/2pxcsI37//Oc/oxVX/GG06mprjBhXX2OtViWCMhvq/RA/wIqEYG97/aycY445o7XWXrftGST8/oo/jE448aTC5sYy4kdw/lN/fdo2WRqs2u6+++7o6KOPbiUAt9fNw0UWWTQ677zzWjX+eiGC5CktGgRfRvxYCR9w4EHRD1daue2byMbVo9XXWDMatdlm0X777R+dfvoZ0R+uuab1nGi7KpAA/vQzzmy79yFkvcVvxhlnbDkrFAE/rF8edXR03vnn2z9lwiuvvNJKqmv71AuWET9+rLa9YWQ/xC8RpJNPPjmaeOKJ2/pQFRlEi6Ko+LHq3nHHnWxzpYFp81e/+lU01lhjt12zDJksXXjhhT1JJLDGGmvkzjAEy4gfq30yUNk2y3KqqaeODjr4kOihhx5ueW1Wgfvuu79vE/sest7it+WWWxbOsn7jTTdH088wY7TXXnvZP2XG2Wef09anXrCM+PF8bHvDyH6In4+f77xzW220qkgOyqIoKn6LL7549Omnn9rmCgOzG9Xav/vdxduuVSXXXHPt6P777680l+obb7zZmjjba3VjGfH7rwVmxbY2q+IUU0zZ2lqoYhWINYxCxfYaQ8Z6i98ll1xi31tmUKSWNiit84833rB/zoR77703mn/+Bdr6VTUlfv0Xv7+/9lr0w5VWautHFey3+FH89cQTf2ObKgz29giMLuoclJeTTjpZdN11N1Qq3ptuOioae+x8q9VBFj+IMw9OW+QhLourrrqqrf0hY33Fb4kllyycxPrf//60ZTunnQkmmLBwJYiPP/kk2m//A9r6VjUlfv0XP/C73/2uVPmjNPZb/BZbbLHKVk4ffvhhdPzxx7ddo9fErIojTVX7gO+++17u1d+gix8k69AhhxxqL58bt952WzR2nyY3PWJ9xe+XvzyqJWJFcO555/2foFfqgRXF1VdfHY0//vht/auSEr/+i1+y/3f44YfnXiF0Yz/Fj8z9VPeuApg6zzmnvzGuPscc80vRDTfcUJmQr756vr2/YRA/OM8880S3336H7UIuYGqeYYYZ2toeItZT/CaffIpW/FBR7Ljjjv+nvRVWWLFVIbsIOO+HP+yNeSyhxK//4udj++23b+tPGfZT/Oaee+7o5Zdfsc3kBoJz/fXXt8Il7DX6ya9PPHH0+OOP2+4VAvG6eZI6D4v4we222952IRdef/0f0ZZbbdPW7hCxnuK3/vobtOJeioDN3DXXXKutzSOPLF61+rTTTm9rr0pK/EZW/BCPKic4/RI/hGqddda1TRTC888/PzDZP1ZY4fv/S8ZdFnPNNVdb+2kcJvHjGY1+8UXbjcz4178+bGXFse0OEespfuSILIrDDju8ZT6xbe6yyy720My46aabom9+85ttbVZFid/Iih+44IILW+73tl9F2C/xm3bab7byWpYFqQNHqpBzGn/zm5MrcYDZZ9/9o/EyblsMk/hNNtlk0SmnnGK7kRlY/fGFsO0OEesnfnPOOVf0wAMP2HeVGdvvsENbm3DBBRcqHDP43nvvRbvuultbm1VR4ldO/PB+q2KfiPJHZdJjJeyX+M0333zRO++8a5vIDapW2LZHmuONN34rW05ZPP30M9F0003X1n6IwyR+X/rSl6P999/fdiMXrrvuurZ2h4j1Ez+qteNqXQQPP/JIy0vUtpmwjOmTRMG92g+R+JUTP3K/sk9UNKuKD4TL9i0v+yV+BFWXBam0tt56MPd+8Gosm+aLT+Lb3/5OW9shDpP4kU1pn332sd3IBXKv2naHiPUSv3HGGbcVWFsUBLTbNn0SNF80Rubhhx+JllgiXVjLUOJXTvxOPvmUVtHWhx56yP4pN55++ulo+eWz5axMYz/Ejww1Rx75S3t6bjzw4INtbQ8Kcesn12VZsC861lhjtbVvKfEbKtZL/Eg6/Oyzz9p3lBmbb7FFW5s+2dMhtqsoSItl26yCEr9y4od7/rjjjhttscUWhXO5+qC9Mumf+iF+M888c3TTTTfb03OBmD4E1LY9SLz0sstKx/6dd94FrT0y27blMIkfVqh99tnXdiMXJH4DRLJKFMVVV/0hU9JdHGKKgtItE044YVubZSnxKy9+U089dasdEgJT6aIs9tpr78KJuvshfvPPP3/pKu0vv/xyNMUU5YvA9pIkfC66DZKA1fz003dPZjBM4kds6kEHHWy7kQuMZ7bdIWJ9xG+aab4R3XXXXfb9ZAbenLbNEAmjePvtf9rTM4GcgdtuW32V9yrEjwrq/aDte1UsK35JPBfJDW6++RZ7SG58+OFHhROb90P8yOpSFqTvs+0OIin1Uwbvvfd+pkoewyR+k08+eXTaaafZbmTGZ5993vIWte0OEesjfrvuumvrAyqCDz74V8uub9sMkTyIZ51VLN0ZuPTSS9vaLMsy4scq55lnnouee+75nnP06NE9y/dYlfhBYqD++te/2sNygyDppZdepq2v3dgP8fvRj1axp+YC2ZMoPGvbHUTecccdpb15v/3tb7e1azlM4rfSSiuXqojxzrvvRnvutU9bu0PEeogf9us///nP9v1kxtHHHNPa87HtppF6WUXBbHnuuedpa7MMy4hfv1GmYG0nVil+EOcnPBnL4rTTzogmm2zytv52Yq/Fb9xxx2vF5ZUBIRJbDUmGD3KNlvX6zBLsPkziR+hVGeBbQR1Q2+4QsR7it8ACC0SPPPKofT+ZsfPOO7e12YnMmp57/nnbTCbgTH9cxYl/JX7Vix8899zz7KGFsN1227W13Ym9Fj+KtR511NH21Fx4/fXXo0UXXayt7UHkpqM2aznnlMHWW28bffWrX2tr2+ewiN+8880X3XxLOdM+q+mJJpqore0hYj3Er2jVBcAMZrnl8rmmk6j6N78pXgLm97//feRcMWeIECV+vRG/GWecqfUjLwsGtvXWW6+t/TT2Wvy41/MLFmlO8Mwzz7S1O6hcdNHvtrLQlMHBhxzaqvBi2/Y5LOK3995728vnBgnEbbtDxuEXv/HHnyC67bbb7bvJjEMPPbTQPhT1/opi9OgXo3XXzT4YdqPErzfiB8nz+sILL9hTcgNnrIUXXqSt/RB7LX7f+MY3WunYyuCxxx5va3eQ+dZb5TxbDz/iyGjCCTuvdIZB/EjaXxYff/xJdOyxv2pre8g4/OI3arPNC39wYNtti1UkXmSRRaO7777HNpcZFNq1bRalxK934gcPP/yI6OOPP7an5cZJJ/2m6+oB9lr8iPFj5l4G99//QFu7g8wyzh3g/PO7x/oNsvjRd/KdVgHKGc0000xt1xgyDr/4XXvtn+y7yQxydRattM4gzuynKG688aZokkkmbWu3CCV+vRU/eMEFF9jTCuFnP+se6iLxq54vvfSSvYVcuOii37bCA2y7PgdR/Mg1u9NOP48++OADe8nCoHSVvc4QcrjFj437O+8slmwaHHDAAbmKVVpuuumo6NNPi2WPIE6mKtOBxK/34jfTTDOX+tYSsAJZc80129r3KfGrnsMufox1K674g2ijjTaJNtjgp0Guv/6G0eabbxkddMhh0c233NryyCUkpWyYhw+2AFZfffW2/g0hh1v8TjzxpFKpizbcsFgQckKyPhC3VxQkVLZtFqHEr/fiB0eN2jx69dVig5sPsuHzzmz7CYdB/B4c4JyeIb755pv2FnLhlFNObQmQbddnL8UPHnXUUa1jv/j881Z8bhoRuyqStIfwxz/+sa1fQ8rhFj/q5BUFZqyyNfbGGGPMlsNMURD4/eNVy8+iJH79ET/IhKsK4C1MvJ1tH/Za/HB4ufBCObzkwRFHjrzDy8ILL9yKEx4psNc322zdU0AOCYdX/Nb9yXrRSyXSFu25555tbRbhWmuvHb351tu2+cyowvFF4tc/8YNlhQNg9k5ztuq1+JEKEAeOMnjuuefa2h1ULrLIYqVDHfbb/4CWZ7lt22evxQ/uu+9+0Rdf9GZV1wn07xe/2LWtP0PM4RU/lt9F8frr/4hWWnnltjaLcLrppi9V6eG/MX/t7eahxK+/4jfnnHNH99xTfgb+zDPPthIm2PZ7LX6Y744++hh7ai5QKgiPZ9v2IHLjTTYtHeS+xRZbdf12+yF+s35rtuj668uZrIvg1FNPbevLkHM4xY+PsEzw8QknnNDVfp+He+yxp71EZrz//gfRvvvu39ZmHkr8+it+cIcddixdFQFceeXvW8H0ftu9Fr+vfW2clgdgGZDseZddhmMlcOaZZ0affvqpvYVcmHvuudvateyH+EG+PcaNfuHcc8+tNCnHgHA4xY8KzWVcd3fccae2NsuQwaZMHcHLLrusrc08LCN+bI6/8sorLS/EXpMKEkUSCmRhv8UPnnHGGbapQjjuuOOjscYa+3/t9lr8YNkq7jiaXXnllW3tDiLvvfe+0g4gg5TYmpi9Sy4p7miXFXiKDnq9xhIcTvEjzqQonnzyqWippZZqa9Ny1VVXiy648LfRaaef2cYzzzonOuywI6Ltttu+xf33P6Dl/VYUf/nLY619CduHrCwjfuRopEo1efr6waI17rpxJMQPXnzxxba53KCqyFZbbf2/Nvshfosuuqg9NTceeujhtnYHkUUFKQEhA7PMMktbu5b9Ej+46aabVlJ4OQ3s6eZJyTeEHD7x+973yq2yjj322K4FZWed9VvR1Vf/oXU82eBDJOMHRTLZS4BlQi5AmfIwZcRPxWzLid9CCy8cPfjQQ7bJ3GACtPzy/80x2w/xm2eeeUrXufv731+rvEJJ1dx4k01K7/c98MCDmTzD+yl+VLIhY1DVoA7lEa1UbhOWioEeAg6f+GEiLIMsBUarSPyaF9dcc01bP7JS4jdy4gf33HOv0tXCwW9/e3E03njjRxtttJH9U2ZkFb8ZZpghuvZPxbMjgU8++SQ6+eST29oeJF53/Q2t2LcyOOGEk6KJJ564rW3LfoofXGGFFaLHH3/cNlUIL4weHe29z77RDDPMGH3ta52rV9SEwyd+t99ePIk1Fbrnmqv7xnWZ2L2iIAi36F6kxG9kxQ9Wtf9HCM6oUaMK71FlFT9m9gcccKA9PTeeeOKJtrYHhTPPPEv0zjvv2C7nxuqrr5FpFdRv8YOHHHKIbSoX8FTnOVGke5xxxmlrv8YcLvHbc6+9W/b3ouDH/pWvdPY2XGTRxUolrC4DPkTbnyyU+I28+E088SSlwm8SMAO/9777Cq8ks4ofXGaZZezpuYHjGStf2/Yg8JRTTy29HfH5519kcnaBIyF+8847X6mqNrfedls0+xxztLXbAA6X+P35z9fZd5cZ2LKz5KTbf//iVdrLAqeZb30rfwYFid/Iix9cepnvtfbuyuCL//wn+ixOUVUEecSP6uR4+pbFo4/+pWeOTEXJvn0VDiF8V2TEse2HOBLiB3fbfffCpl3OY/Vo22wAh0f85p13/uipp56y7y4zfvvb37YC0m27lscff7w9tW8gFunXv/51W5+6UeI3GOIH99hjj5b35kghj/hNOeWU0RlnnGmbyI2PPvqosiTtVZHkEUUnED623nqbzLGpIyV+0047bXT55ZfbJjPj6aefjn70ox+1tVtzDo/4UXm6zMf885/v3NamJZ6kjzzyqD21r/jjH69t61c3SvwGR/wIGyEoeKSQR/wgHqZVgO9ohe8XG7yr5iabjioVB+xj9tlnb2s/jSMlfnCbbbYtNek655xzehaDO6AcHvG77bbb7PvKDAKsl19+hbY2Lffdbz97at+B+/lP1lu/rW+dKPEbHPGDWBhuuunmVttFHVeKIq/4sZ/19NPP2GYK4cEHH4qmnHKqtmv0k/PNN3+pnL8+rr/hhmiKKaZou0YaR1L8Jpro69HZZ59jm82Mt99+O9p66/8fa9oADof4bbbZ5q1g7KIgvdHUU0/d1q4lmfYHAee00gm19y+NEr/BEj/4wx+uFP31r3+1l+o58oofHn7bb7+9baYQsMz86U9/bhVQtdfpB/FafPjhR2y3CmPxxRdvu0YnjqT4wXXWXbdUyS18Kqabbrq2dmvK4RC/sl50G220cVubliuvvHKpPcUqcdddd0WTTjZZWx/TKPEbPPGDxIuWDbDOi7ziBxdYYIHo3ffes00VAt6VpN6aYILOiSSqJjUKKbBbFR5/4oncq9iRFj949NFH26Yzg8QdeMTbNmvKwRe/qaaeOnr0L3+x7ykzHn7kkWjBhRZqa9dyJL08Ld57771ov/2yJ7uW+A2m+E0wwQStzD39RBHxI7B+r72qS+yAALKKmHPOudqu1Qsuu+zyrVpzVWKVVVbJFNvncxDEb8kllyrlt8C5Sy21dFu7NeTgi98JJ5zYmpEUxTHHHNOyh9t2fX7pS1+OzjrrbHvqiIJs/7afaZT4Dab4wdlnnyO68867Wtfpx/5fEfGD8847b6tMUZXABLnFFlu0XatK7r33PtHzzz9vL10KDz38SDTVVPlWfXAQxA+S+L8MTj/99IELXekBB1f8kod/883/dRwoAoo+rr322m1tW/70pxu1SrT0AkUHPGq9ZXHSgWXED2cg294wsoz4nX76Ga1Vmm2zKq62+urRs889Zy/bExQVPzz9SK5dNZhcXXzx7zJ/y1m5zjrrtjyjyyS9SMOyyy5baPAfFPHDBPyHP1xjL5EZ3ANjom23Zhxc8YMU+nzppeKeWzffcks0R4bsBSStXXrppVtlXqogmTO++93vtladRYHpKGvexDLiRyaRww47vFXcdCR53HHHRQsvsmhhZ4ky4keKrlNOOSX65S+PausX/NWvjot23333aOqpi60OGUip/EFC9F6jqPjBaaf9ZnTtteXyfYbAJJRk9IQrUSngq18tljuSPbgtt9wquuKKK0on5U7Dr399QuE0X4MifvAXv9jFXiIXrrnmj9EUU0zZ1m6NONjid+mll0UFF04t7Lbbbq24K9tuv8jH/NZbxQuekraI/RjbrmUZ8WNl+t/KFB+NKBGGCy68qPDAU0b8mGh89NHHbX1KiNmdJM477bRz4YGb4slVlD/qhjLiB5dbbvnos8+KZQvpBr61v/3t5VbY0qmnnhbtuOOOrdjAGWeYsa0fcKaZZo5+/ONVW79j3Pipy8dKsld4+ZVXo9lmy5bKLMRBEj9CNC68sPh+87/+9WFrH9i2WyMOrvhNOOFE0SOPFHdbJuDzBz/4YVu7/SSu11dccaXtWma88cYbrXqBtl3LMuI3SMD0XDSjfBnxywomMsstV1xYFllk0VYNPFDUHN4NZcUP8+fOO//CNls5SKvF9/30M89E9913f8ujm8omCflvvDfZzyMGrVfPywdOLkXMnQkHSfzgJpts2pq8FQWlnBZYYMG2dmvCwRU/vB3ffbe4+/UVV/6+NXO07fabP/vZz2zXciFJdt3pR1kX8QMMQEVMn/0QP3Dvvfe2nre9flauv/4GPTPZgbLiB5l4Ji7z/RCdkURyf5gJi3x3PgdN/MYdd9zo1FNPbbVf5D0St8l2gG23Jhw88UsG+RtvvNG+i1zYepttOgpGv0j6qKI/CEC9rnnmmbetXZ91Ej+KCI8zzrht99iN/RI/gMmu6H7I2GOPHR166OGtagG9QBXiB9nfpL4gKDJwDgOS+zrs8MMKm9t9Dpr4wRVX/EE0evSL9nKZ8dJLL0VrrdXdaXAIOXjiBzEPPf/8C/Y9ZMYLL7zQcjix7Y4EJ5988ujkk0+xXcwMzBY4Yth2fdZJ/Nh7m2SSSdvusRv7KX6ffvpZy3HD9iErSUR85ZXFzeGdUJX4wTnmmDO64447Wu3WTQCT+znrrLMyFarNwkEUP8K4jjnm2NY1ir5Dtm7GG2+8traHnIMpfrie//vfn9p3kBkUFiU43rY7UiTDTBkQ7tHJcadO4gc22GCDjvcbYj/FDzDBWihD8oQ04hH82GP/LX9UdFAKoUrxg4sttlh05513ttqusp8jieQ+8DCeZpps5YqycBDFD84zzzzRHXf89x0WAUk3dt1117Z2h5yDJ35jj/2V6IEHyqUp2mCDDdvaHUkuscSSrbi9oiAWD0Gw7Sasm/iRHSSvGarf4gdIQ5e10GmIJBLGmaNKVC1+EKcHSoKBugggYUh44Np7LcNBFT9Iqa0yYEz+9re/09buEHPwxG/LLbeM3nzzTfvsM+PJp56KFlhwsDyU2MM66KCDbVczgwGHGCnaCu1j1k38Pvnk361AXXufnTgS4gd+ddzx0URf75xBKI3jjz9+a/VRJXohfvCb35yuFQNXB1C8dcIJq889OsjiN+OMM0ZXXXWVvWxmYOo/4YQT2todYg6O+CWD+tVXX22fey4ceuih0YQ9zNZRlGussYbtai4Q9jHjjDO1tQvrJn5g8823aDmH2HtN40iJHyE1q622Wlt/spJ3WjZxu49eiR8kWTW/r48++qR1rWFbBb78yiut2MI831UeDrL4QfpXxtFq9OjRrcQjtt0h5eCIH2RZTVXhMqA6g213EDj//PNH99xzr+1uZmB332effdvahXUUvxtvujkaZ9zsXp8jJX7gvx6587T6EVqZd+P3v79iKwNKFeil+EHCATbc8KelKoePBE488aRopR6PDYMuflNNNXV00UXlzNdJ6FUNOFjid+yvjos+/Kh4UOZdd98dzVEiBquXJEP8LrvsarucC9dff31bu7CO4vfZ559Hc801V2YxGSnxSwYR8kxOP/30bf3KwjHH/FIrsLyK8ke9Fr+EmNEOPOig6K23qt2zrBpUhMFZo1ty+yo46OIHyZjzRoltJfpJ/Ufb7hBycMRvjDHGjO4rWZZkhx12iMbqkUmjCq600kqtVFpF8eKLL7aS7tp26yh+YNttt21lHLH3G+JIiZ+Pww8/Ihq/oMn961+f+H8ByWXw5JNP9UX8Eq619tqtgPgy3tm9wIsvvhTtueee0VJL9688D+JXNP1av8SPBO5lQq8AWzDTTz9DW9tDxsERP7KIl535LrXUUm3tDhJnnXXWVqXrMqD8jm137rnntofVAvzIJppoorb7DTEJGxhJIACrr7FGW9+6MVndzjLLLKWTOzDor7BC7wdRn4SljBo1KjrssMOiF14YbbvUV5A+bq+99op+tMoqbf3sNTfbbPPC1WHIbcvk2LbZC1Khvmzhbsoe2XaHjIMjfmRC+fnPf95KYpuXuPFutdVW0dQDFNsXIqZPgu/33XfftnvIwt1336NVysW2O9lkk7VMO/b4Yecuu+ySOeRhww03bDu/n+T5H3TQQa29Xdu3PFxwwQWjffbZp639LOR3sNlmm0XTTVfM/FoFER0q2BM8jjNQP/DmW29FJ510Uuv+R7IQK0kBsFZQAcS+m07keEyJM8zQn9UU+7YsFIp8Z3znnLfRRhtFY445ZlvbQ8TBEL+s+zrif6nn9X85aM9j0PozEpxk0klbQswq7KijjmoViK2qpBMWIgoE77ffftEee+zZiustkhKvSlb1zqtqR+zKwRA/URTrzaWX+V603XbbtcQQ0Tr44IOjyy67PLr99juiBx98KHr55ZdbyRwSPv/86Oj+Bx6MbrzxpuiSSy6NDjzwwJbFJLHykALRXkMUc1DiJ4riyJAi0gsuuFC01NLLtMz55Ev9yU/+y9VWWyNacqmlo7nnnqfSFGSiGFPiJ4qiKDaOEj9RFEWxcZT4iaIoio2jxE8URVFsHCV+oiiKYuMo8RNFURQbR4mfKIqi2DhK/ERRFMXGUeIniqIoNo4SP1EURbFxlPiJoiiKjaPETxRFUWwcJX6iKIpi4yjxE0VRFBtHiZ8oiqLYOEr8RFEUxcZR4ieKoig2jhI/URRFsXGU+ImiKIqNo8RPFEVRbBwlfqIoimLjKPETRVEUG0eJnyiKotg4SvxEURTFxlHiJ4qiKDaOEj9RFEWxcZT4iaIoio2jxE8URVFsHCV+oiiKYuMo8RNFURQbR4mfKIqi2DhK/ERRFMXGUeIniqIoNo4SP1EURbFxlPiJoiiKjaPETxRFUWwcJX6iKIpi4yjxE0VRFBvH3OJ3t3NuX+fcnqIoiqI4IDwwoFedmFv8TnTOjeOc+5IoiqIoDgDHdM59PaBXnZhb/E5wzn2FkwRBEARhQDB+QK86UeInCIIgDD0mCOhVJ0r8hBHDWM65y5xzf/B4jXPuSufc9M65MewJgiAIKZD4CUOD251znzrnPo/5Rfzf33fOfdkeLAiC0AESP2EocKlz7jPzbX3onPtBvCIUBEHIA4mfMPD4tXPuE/NdfeycW0QrPkEQCkLiJww0dnfO/ct8U2845xaNXZYFQRCKQOInDCw2jff1/O/pHefcHHGcjiAIQlFI/ISBxezxCm+hmAs756a2BwmCIBRAI8RvOufcZnG2mYtjd/nL43/nho5zzu3qnFsldpn34bvP98KVvlubDPb0/Xjn3AVxv+HvnHPnxvth28Z9Hylh6HYPRfFD59yR8X1fEYc0nOWcO9w59z17cJ/Qq3u1mNI5t1H8bV4YO/zwDH7rnDvTOXeEc25j59zc9sQOyNP3PMd2QlXtZMU3PC7onFsxwKWdc9+0Jw4o/Oc3eXxf0zrnvhv/Pvz7Wsk5N79zbkLvHCEdtRM//2PZ3zl3X9zffzrnPopd4/EahPz7v+P//168l/Q359xfnXOPOueW99pKsLVz7nHn3LPOuacL8nnn3G2xYIVA5oFfOOcedM695PWdvob6jimQvnOfTznnTnXOjee1N69z7h+BfpQlz+lq7zrswS3nnBttjnssXsVlASs82uS8151zH8TOLtwv5N/ZA+RvtMtEZibbSAq2cM495Jx7xvTv1XhAzDpQI75Peu28Er+vooOOf93t4m+WZ/i2996T79Z/Bvydvr/snDsgoykYJ6Fb4m/Qvk/I/z/WntQFs8Xn+s/1uXiyUhRjO+e2d8694LVJ+/wup7AHx98ev0l+Lwl5Nnz3lq/Ff6e9e5xzv3fOrW8bLIgV4nzGaeMD117WntQFjKGMS/y+k3v7e+C+IPfMt8MYdYdz7vR4EiC0o1bilwwi6znn7opd4W1/8nBD0z7YJ7APVYQM3j+1jccicW3Jvt/vnJvEa5NZoj2mKiICCRiAVgscw/NiRtoNF8UDOTF8to00Igh8j0x0umGP2EvUtgEZOLAQZAE/Anv+L51zE9sDMyD5Zpm1M1i9H2g7C8/O6PnKN23PtUQQprIndsA8gTbgX+yBOfBV59zBgTYR/2nswfG922Ozku/trXiy+TPbcE6QeMG2b7lfPPBmBeJs28hKJkoI4k3xBE/4/6iV+IGd45mR7UcRhsRpr3gmbo/NS1YLG5i2vxWbNO2xeYn4Teq1u1jgmCr4HzPAIX4/DhzHD3A+77gQyNTCwGbPzUomC0d1Wf3s1kVcmP1niRlEaKxAY4YsIn6A7yzPbypETKFZxA9Tqj3XklXGT+yJHYDp1bYBH7YH5gDix2rWtslKuGrx84kV5bp45VkErCZtm5ZMzGe0J3ZAFWMCZIK3lW28waiV+LG8Z7lv+1CUm9gLpIgfImDP7cY344HIB3s49rgibfMMJvPaXTxwTFXElJOgqPgxcBe5T0veCzP3NAHrJn4MfFlWf1WK3wLxis/2JS/PzyB+TK4wKdtzof/8eY7sMWdFncQvIdmE0r6jNGD+ZVJr2woR83NWVCV+EHP5NvYCDUUtxC8xHeEMYAdR/7/Pcc6tGdvcfbK3x4Yx/8S5hEGSwSRkJgiJH2T/ieuzB9WN7IWc5pxb0muXTWwcO0J9Zza5hnNuiVjI8ICEmDNpg36y18Z+A6uIzZ1zX/PaZtBjNmv7kZAfF/sU9p5YTeFkYY/36e8PFRE/Jiw2gN0nTj2YBJN3tXK8Z2WPS8jerXVaStBN/CD7eRPZEw2qFD/Os33wv1me8dqxg4//zfKuIWZMnIIw9XcbrNcNXIs9vhsC///GHL/bQRY/vl9+sz4Pin8P9lhL9nG7PVMfJwXM6n+Ov0nbNnu7/m+0E0LixxjEeIajXnJffN+/ybD6xMTLN9V01EL8AGmu2C/yr50MIvyIGHzZKO9kFgP0FWcRjqUOoUWa+LE/wcPkh9mNeGzhzee3j5AxWNh2mYFmdRYB/FjHNU4UmHAQV9sPiIconm+Ivr02s1iEhGPseQl954Mi4nd94HiIkw+iznOyoE/LdDCTHpry7rKIH+92BnuiQVXix8TlkUAfINfgmfHsOwXz874Ra77Zbg47of0+9pOIp7T/nxV9VseMQRY/RIbfJU5kCXFM4pvn+XKPOIjY8yDOVnm8Qp8ItIE44cBk/QTw3mUcyIKQ+LGCY0LMfSf3xTeAxYfJLvuwFGzFwsTxdlGAI0y3SV7dURvxY6Vmcz9CHFTybC53Q5r4sddYBszsQzM2PtJ+ICRa7J12myz4yCt+iHSagGVxkGFFaAcViPmSQpUWWcQP8sx9s7FFVeJ3TODakDCWPINuFrAHTKiPvdbJ8eobUfH/P88pixMRGGTxY1LXDYgFkxArEBArSpb9P64fElH223Fwedf8f34TWcNU0sQPa1Un8AxZ4eGUZs9ncom1oMmojfil7ZtgHqwSaeK3iz0wJ5iB4h5u2yWurdfgh7t64NqIXx6zTx7xY5USWm3CUebYTsAsGpr0sDK0wm3FLzTYJey0+qtK/BBZe13EPMuAnReY++1z4v4RYIQxtBeI52IWDLL4IV7dVsQA64qdAECcf7KskFhhMunyz+X5EobDbzu0F4gZ2n6jIaSJH3F+WcACIOQ9fpg9sGGohfix3MfrMHTtTjP4IuiV+GHiC83QWAX0GiMhfvzo/xg4FmbdCwHsg2Kesm2wEmcA9WHFD7InFNqTwfs0LWlAFeLHs2KP2F4XMzDp26oGzlv2WgzIidMVA6T9O/vYc5l2QqiD+IE/Bd4rzOKZSZiEPY84WFbwfM/8u/37r4xXdhrKih+Zke4NtMH+INaXpqIW4oejSii8gTpvVaNX4sfMkx+fbZfBmhiyLKaXohgp8WNfyR4Ls8yGE3BNa1KCOAOwD+IjJH6sfG5OeaeYrEKoQvwI5mcvyF6T76sXYDJgr4UzRjL4EeZh/45rPNmDuqEu4vfzFOcrkkR0ayM0JrKyShIf4ORmTfSsKrPs55cVP3BGoA0mn9+2BzYItRA/TA54MNlr4xlZNdLED8+wMmDA3zvQLmRlQ2wQPyY7oFeBkRA/jg29M2IU84gfCDkaIGjWXBUSP7xcEaLQN42zUcgpoQrxWydlj6gXcVhLpaw8/P1kVgchszt76d1QF/Fj79NWEIGMI52+SfbeyLBkz/O3XAjBCX3veC93QxXiF0oYwD7nSKUJHATUQvwQhZDpyw8lqApp4ld25QfYGwitYBNityctGvuAWT3xsmCkxC9kbuR76TTQhBAqdMs3ak1KIfFjwGdCQVybdVOHPBfbnyrEjwkb6cns9Risq0YofpRnT8abBDwr8oja4zCXkVOyE+oifuzzpo0j9hvwwUTL7h+TxszfNyYGkLAS2zbeoN1Mj1WIH6ta+33jCVpVWrdhRC3EjyV9SJD6KX7k1LwqNiV0IqnLYOij4zkxKIY23i3ZH8SUgjtzWZPoSIlfyFyJiGQdrBIgRtZrlB+23e8NiR8etqzuME9hhrL9eSDgeVmF+DEYhe4/j7NPVhDUbK/DqtbmRA2FPPBb59vohLqIX9qEjOfS6TdmQ6wgiRvs5OvWwHE46s1sjrOoQvwYV6yw00YvvrdhQS3Ej07ZwQ9mFT8+bPYNmSETCwX5KEL28JD42VlfFhJoGwLxaezPhAbGEDmOvRtEsCgGSfzY3+w0yw4Bj0/7/jFDZRW/JCj+wMDfIQmWfSecXoofA22VmDUlNyTPzAIPWTv4863zG+6EuogfCL0TtjTSxrBZ4iTT9pyQOZHvyz5fyHPvhCrEj2/Yih//XfX3NkyohfiFBj+YVfyICSOpMhv8SdZ0fgShDyMkfkW4r23YA2YQxCjkfp5GPmReThL7k+cH33TxS1KaYf4M7cPx//zZ+TCJH3uL1iRM33nOFkwCMCHbPpFRh28kDXUXP95V2hjGCs86yWBeDIXKsPcaGjupNtLpdybx6w0kfnEFhJBJgo/eIiR+RVZ+ZCHpBgZcPk4GpKzXYBObmC6Q9Ucv8fv/IMYutBfHQJwkSxgm8QvFUuJlmuZluGXgeEz6nXJR1l38sMSkjWGhfTzqhKaF64TSCBLyEnKsSiDx6w1qIX5p2V3yiB8lP+z5O9oDU8QPEp+FAwE/2E7E9ME/mQVmBXFGCBp5J0P7C5b8wLrtI/gYdvEjrKEq8QOhmFH2EJOYt2ERP+6fDC72GnjHknWE2D4sEAnxNiau1B6PqY7j01An8QuZJRGO0BjGNUO/R3Kl4l1pny8iGgrvYTzplIyjl+KnPb/sHEjxw1Mv5CTST/FLPOe41yzsZEZKA+ZQ9iYZOHFYSK5tV4U8C4QyKwZJ/Oh3nsEKUOncTn7KiB+ZN0Ku63hD0m9CBMqKH/tIoYG2yuwuP4pN+fYaPCs8h3kvPjHXhb5tSAxqGuoifmx/2O8DUnQ69HtlfAgdz3OE9vlCnq/9vULM02moQvzoq83ywvcXqlzTFNRC/JhhhQbSfopf2Ti/vGDAYTAP5QOF7NNkxUiJH/kF7bHsoeRd+WGytgHErG78gr4gq/iBUOUIBg/yQFYhfqzwQo4S7P9UhVBWl6JkNWy9QxPURfy+kzPOL2QhKMqjA99rgirED4c4K7r8vik+3VTUQvxYuodmuGkZOiyqEL8q4vyKgHsPBc8y+PNjzoKREr+QyYi4u9BA0wmhdggnyRLkniZ+zPZfD7RLsmdWmnaQzCt+ZB8K1Z7cwR5YEIgH+8q2/aIkbi1tVVoX8aNKQsiCRAKAUBuhfJ1FSZgNmWRCqEL8KD1m2yCGk2oyTUUtxI+BNZSdImvNqmEWP0IjDgn0hx9T4vjSDSMhfggcuSPtsTAPCMAOmQ/5sdvg4TziB8jvadtlwGNVaFetecWPATyUzo7KC1a0iwCrR+j58u3Sd5Iwp9EKe8K0PLN1Eb9fB/aOYWgSSZKJ0KST78s+T8vQNSBm6hDKit9UKeEuvM9OjjZ1Ry3EDxCMbK+NoKUVNvUxzOIH+NHY/mBSI24xC0ZK/MhUY4+FWZIpJ8BMGJqtc+82MDmv+BGrFTJN4vzCPfn/L6/4gdD9k4YsVEQ5LyhqbNuG7BWvGidZCJH9TrKOhBwzHkoR5jqIH9fDq9WaBmHoehT7taZviFPLTwLPNeFazrlTUrZpGENCdSjLih/7iaFVKr4Sob3MpqA24hfao4EMxt0w7OIXqtDNx561XtdIiB/A49UeC6mynQUMFAzIdr8PMiBb5BU/cEHAmSbEIuIXSjYMO3lWZgV70LZd7j0UvmNBtpuQlyjxjqFclHUQP8zZoffMiomqMRYhkzirum6p4AB7p6G9+jvjPWWLMuLHqi90PuxVEvVhQW3Ej4wp1pUXkguz20ya4Gbck+25ecQvdGw/QNmdkHmOmTt7FVkwUuJH29Z8mJDn3GlWyod7VOA8iBUgtEIpIn4LpOwpWhYRP1JOhe4fEz7OKnn3PhNgpguVi+Ib73SvCRCLUKozvntE0SJN/HgPRVGV+HWzfiBEoe8i4XLxd+2D0KOQjwHxpmlOKxaERtnz4Qr2wBTxYqzrlt+XhO0M2CEzNpPGXiT+HybURvymCGSuT0wYbOwyE+bD4odKrkZmaNi7+fiJsbkn0PeQoKWJH16KpCmiung3YqbkR2V/xPSHPjLgkpZq2rifDOQMhPwI+ScDA4MYx3Jd2xeI6GcdPEdK/EAo23xC6p1homMw5/1CgrMxHZ2aYnaCG6T0OzTIdRM/QN0zmxTYsoj4cXyy72fNbS84546MnTD4Hhhwp4y/EZIkQxwkGMDI6sN3naxwsASETMHEJ2YFzmIhYeZ3Yr+rNPFjnMCb0Jr+0vgDr82qxI/3wjPyyW8QqwjmXfLjhlZ8EBMx4Q8WePtaszfETJ5llQlwRrLfIsSBzYptSPx4DoxpfBvcE44riCFjC4LP7ypUMithpwxTTUFtxA8gTPZHnwwqDJTY9Jn9koGBgYCUZpg1mIWFNq/ziB/ns9p6NgMxH5HQ1ppkGdT5G8JFkmwyPxDAzR4Bwd+sdPgn8WZsVodMJ5CBOksGmQQjKX4IQNp9QL41VjE8B2bWeHHieWiPS8i7DA1YoKj4kTCgUx9hEfEDlDCyffLJvRLKwQDIj49vlgrrrPYx1VMCim+G6yeD5taBdvj+83wTPJNQqjO+cQZcH2nih6iwP8pvoxPJqMM/2UdLUJX48WwQgYQ8L94l/bLH+kT4EZWQmIVS4PF8maxmBdaoUDt4ElsnlJD4YernXTAZ4b6Y4BN6gdUgtNLzyRjYi4LJw4ZaiR/efczK7Cy6KPOIX15iNsEpwUdo0CpC9j+zOPokGEnxA1yb/RJ7Xl7yw8fUExqwQFHxA6zCOg0qRcWPHyATmjQPwKxkcgCoJBDaS6Qe5Dzm2p2AsxBhF7adULaXNPHLS3+PsCrxK0L2y6m/Z1e4gDEm5ATFpCzLfl8CvlEmwLYdxhYbnxwSv6JEKPNkl6ozaiV+gEH/tIoEcCfbeIXixw8M85yPUF7FvGSVQBYYkCYCFiMtfoCyO48Gzs1KZsCYSDuhjPhhciRvqr1uwqLiBzDDs5q3Vos8xPwNMB2GPPvymDwTYMYP/Y6oX+ejCvHjOv4e4UiIH31gVURVlzRgKg1NgnAE6rRHHQL7p6GxBFO3jyrEj9U1q8pOadSahlqJXzLYszeE9xYzqzR7fhayErMgN6c9rghxdbaphUJOBlnJIH6S5+SSVfgAP1piIm2b/GBsuEAnIH78cG07kCrZ3cCeBWa9UF29NFLXkNyu1hQXAvsc9nxm8aEM/CFwftr3xP5kVmcHH8l7IhUbHsOs2kOOW92YVFxnxWL/Bo/xrpkVeB6GEjEzKaKUTwImNvaYImRbIgHiR6o7ewy0ZkFQVPzYIiDZANsMOM11y4mbNvaF+tQNhCCELB7Eevqp+ULxoFnIGIM5lG0exrKik7O6olbiZ4FdGxMNMx7KA7GX9mBsXknIbJMBB7MF+398KJiQ2F8LZVzAvZiPE4cL9uKKENMsKwXrjYlZikGUh3xJ3Gc+fPrt95kVCB81fWZWyKrBzz+YR/gA5h3uNdlfhKyeDwtsvncC7XAPmN38++V52YKwaSB8AecH2sAZgT08/955f/y/y+K2eR9ZZ9xkVSG2KXl33CMDXlbRYkBCAHl//v3x3Fg526D6ImDwxZGBEAsG5GRfj3eevHsEiRqO7P3xnbA3nFgRcKTi+/HfI99yEVMXgwPvglWj/+2SVAGHmwTsdfG3Mr8JVkF+TUreKd+0fdYEooc8efn2uFf2hROyL55GnhFtY8nBYSiryZLfhH+f/DvfVNZvyAfXZJLu3yPfPc/BX92yL8zkhnviW2OCaO8nId8C98a4i9maahx5rDdNQq3FzwcfGmK4RGzOYcOZf7KpTdFaPjY+4E4rnbyikgVJm7ZtSqIw2DKw0G/6m5B+I5zMNkMxSHUBjit4OTJwJ/fO+2KlRnhKHtjnOwxg/47VF56XyTeLR+H8sakWC0coKDoNw/AMquwjq8c0FkGVfcuK0DWZkNr7SZh1Iig0SPwEQRAEIYHETxAEQWgcJH6CIAhC4yDxEwRBEBoHiZ8gCILQOEj8BEEQhMahluKHyy8u4Gks6ursg7gi4rps25D/38vYGsqUEL9DTBeB4RA3eGL1cI8vA0IskvsgjILMJoRbQMJB+Hu/32cvQcwYibN5fsmzhDxbwklIpE3ljDzxjv0E74SUboRAJH0nNISaiKF4uCJgkCDchjAT/xkl3x2xncQn2li3kJu+IAwKaiN+pDUjho9gY4I7yZZBsLAl/3/7OPs5sVP8gPlR+xkV0oAAkHePH/xGcbos2z4kBRKpysgezzUYSMm6nuUaaSDmjWuTQYWgWLKv2GdNbksqmHNdxDHr4IfIUSGC1FikdEue3e5xEC+BswTWEuxMPTiyiCQxZ/SJeLOsYED0RTshIpsHxLr5Az5ErLLEOXG/xM7R907Z70m2TBIEis6SfYe0ccQXcg0y1oTuowxpjz51C7jmefPNUjSVdxIqr0MVd+6NAG6y3+SNB2WSwzPiWyIQm+QCoVRckATL1GAkmH7N+L3YBA6CMGiojfiRqcNeOw/JkkIGkE4rJ0TNnpeVJC4mEwSDGyu3rGDFwayazBK2zU4knybPxE9DlYayuRlJq0bOwCxZXFgR2/PhZvbALiCDvW2DtFtpFR0SsIJh0pI2kHcjkwquQXUO+7cqSLZ+RC0EEjCQkIFMJva8TmSitHfG9wP4DVCRPFQkOCtJUScIg4zaiB8pgUJ58vKSFENkEAmZbFgxVnENVlGh5LwWCAUJc0lrZdvISnJ+hqqa+0AQ7HlFSMoxzISdkCZ+nZIJh0DeVjs4kxi702qX2o1ZCtN2IqsorsGK0P6tCrLatImNAcJHyStW9/acrGSF263aByZefuT23LwkX6YgDDIkfgGSN5G0UhZViR8kZ2O3agKYZl+Pjw9l189KBvxO5WyqEj/4Rrw6ScNIiR+p4MoKH8TcyTXKTEg6ke8LkbOg+GpSSqfIt+AXdk5bAWLOxaxd9Bo+/STVgjCIqL34YQrjh0iVd/5JAUlKvnCsHTxh8qMnea91jEkTPwZ8qgsk16AKN6IVKn3ikzI0oZphgJyWJNq25yRkhfBQnOQYMvB3KtBJcuS0PJAh8aM4J6ar5NlB9nYQkFCFb5/cOyuIEEZK/Ch5ZK+ZEBPo8/G+FnXvEibFT9k/4955Hqyi+dGQVJz3/mqAPCNMjaFK83w/fH/Qnsdz41rss/mgakLS/5AoUfA26TvfAibh0J5wQooDh3LY4iSTtv/JviJtUzLLksTr/I0+8k3y/VMaSBAGGbUXP0r1sMeGuQeHFRxPqDnHHghVA56Iy5rY8xgMcerwkSZ+OBbg6cY1mFWzL4RDDA4ADJJp12CQwEEghG0Dx0MElcEGpx4f7A1uEa9IQiVxOA9BDyEkfojrurF5lvtilYrZkCoK7H0yuHGt0N4ZAzQVCUIYCfFbLS7Caq8JeTc4tHQquYSTC+8VpyDKwrBCwpEJ8yRtW/KMKFAbckShwgXiZs+BOGvxN2sSPzrQDqRkDe+B9+QDZxUclxDB0Hf3oXNuH3MOoIqCPZZ3ycSH7zkrWPnzOxOEQUbtxa/bjxDRusLMqJN/384cmyZ+oYrvPjC5USrJngdxZLEgZOH2wLHUkutWl43VatpgSTmc0F5mSPwYuLuVwUFwKb2Dc409n1XPrPaEERK/GwPHQla11j2/KiBmTG7sNfOICMCrNa3iN+WVOoFJH2Vu7LmQUkgW1Je0x2Fq/ak9UBBqgNqLH96V3YBAYm6y51JM0y+dkyZ+7JN0A4J2Z+Bc6nTZGDJWFKEVFWbQLEBsqXlnz8e0FnKmSBM/XNazIOR9iFDz7i36LX6IfaiyOeLcbc+1DLA4YGK3183r1UrISaiALs88S/gCIQesbu35mHFxpkrAapbJnj0Ox5UshYIFYdgg8YtXS6Fqyb8xMVdlxI/9Ngpx2nMxD9rQh1A1bkyZ3Wb6PjDt2jYwdxHSYVFW/HhGdvXH6pkB1qLf4ocJMrRHeWiBmoB5UJX48Q3aNliN0X43JKt8nGVsG7wfQm/8Y4lNtcexZx5ywBGEYYfELwZVse25mPT81UEZ8WNmHTJHsprzg8QREqpa2+MIIu4Ww+YD787EU9QnK0KLsuLH5CG0+kMQ+cB89Fv8mDAg+vZ6ZEXpJaoQP5IihMzlTJhwiMoK4gZtG5BkCT7osz0GkeQbndAcKwjDDolfPOu9JnDuObEJMUEZ8eMZ/CpwrhU/PO7Yo7LHXe4dkwV4W54baAcnFYuy4ofZlkwitg2cLey+Yb/Fj7hNuyqFc5rjqkYV4jdbHHZj22BylOc3xb3iGGPbaf2YPZCoIGQiRgCZfOF1igimeSgLwjBB4hfPsG8OnItY4d2XoIz4YdpkJWnPxfHAn1WToi20RxNyUOgE9oNIT2bbYQ/HCkRZ8WMwZOC0bSA61jzXb/HjmZNdx14vS+abMqhC/PgWQsH07EXnAblmMfPadi41x/HsQsf5ZLLGd8GEzYYCCcIwQeIXe7Oxt2HPxWTm972M+HGNkBmSfUAf5GwMOd/gtZcHuLvTX9sOGV/swF9W/Fg545Vo28Bph/0mH/0WP2LaQvF29hlUjSrEj1Ab4uZsG/vZAzMg5MyChcHmm0VwiV+0x1qyQuT7IhkE4qrVoDBsqL34JQM4pjnI4EuAb1K9gGTFxDHZ86B18U4TPxJB+9dgfy+5Bk4Vq8YDsz2PQGScDHxUJX7MykMDHk4o5Ar1UYX44RFo2xgE8cORaVjFb504sN4/HxNkt9CaEEJhDJhCQ6EehGkQQ2iPD5FnS5wkK3++d0EYFtRe/A6IBS4hAcEMBMyeSfVkj0/I4GpTgqWJH3uDCEVyDcIJtorNU6EEzAnZZ7SOCxK/bGiC+NGGtUhwLzbBQRZQlcL2JU38AEneSfQQenZppPoHDmKhWFJBGDTUXvyKkmwpFiHxC6WbykJSYG1gLyDxywyJXz7kFT9AdQeSKvAt8C6zfOtYM2x6NkEYREj8AmTFFgorCIlfEbJfsrltPIbELxuaKn7cc7/ELwEiSDpAtgd4p6Hn6ZMcs1hABGGQIfGLZ7T8oJm1UscsLXNGWfFj4Lo6Fps0DKv4DarDyzCLH7k2cVCybeDFmxejAu1kFb8E7GWzqiMmljCWUOaZhPRbEAYZtRc/fqAMwri7J+S/ccOHH8WZ+3FasZlWLNLEjzYZDHyGBoYs2TKqEj888EiNZdth9m7TelUhfmkrP1uYtZfiR2UDK36EiAxrqANp90JVFg60B3YBzlfscdt22HMOVXfIAmpeHpuSOBvyOynimCMI/ULtxY/s+ph82MODOKLg9ELaK1YraWV+QkgTPzK3MJiSvxMnGf49lMoMXphiUk2AiFCaxp5Hodg8ID7xiEA7OODY+Kyy4oeH63KBNphcUAnBB+IXmhjkTfjMM7Lix6rapiwj0D+UJ/U75riqUYX48S2EEpxTLSQPSNSAU5ZtBweVsqAaRiiBN2QlLgiDitqLH3FLVSFN/EJxfgjc2YFjSbXVaUbMjDotpVWeWCrKD1Ew17bDKteirPixesBcbNtgVW1NrJjOQrXmTsrpJfh+oA0mFtZknbY6YeLTS1QhfpTgouyWbYPAfRuf1wlk2QmF8/B9VgEmfbZtKPETBhm1F78sQe5ZkUf8AHGC1MWzxxNcPLs9OAYrUeru2XMoR4RJNCuoN2fbwPzHSsiirPhhagx9EzwrC8SPe7HHPpdD/PhoQzULMQfaWDMci0JC+aNANY0qUYX4IeShFRtFY4mry4rQfh8MVd0oAgLdQ/eKlUEQBhUSvxzIK34glMwaUgA3DesHjoesbLIAAWB1ac+nukESkO+jjPghIHj22fMxSVLI14Lj2Yezx0NrskwDZXpCyaop0YO4+mDlyb3YY580eVurRhXiB44MtAF3swemgFX5/oHz+Y4pSlwFsFYkleZ9snctCIMKiV8OFBG/NKcFTELsk4VAgDFla+w5eGqyV9kN3HNonwsPvFBC5zLiR8FaqsTb87k++6sWrO5IAmCPh5RyyrL6I+WXjTljH9FPEO4jlF0HrhkQy6pQlfjhIGXDHeDdzrlF7MEB4HBknxUkl21V4s83hYnbXkNmT2GQIfHLgSLiB8gRas+B7HOFgBmR4GJ7PKT6OBUU0sD9pmXmZ/8ohDTxw3SaBlaXmBlDJkXIgJ1mVmQ1Etr3g2kTggR8TyGHGZI04+EaAjXxQvt+kNVPHqenrKhK/IixuyjQDsTpp5P5E3EPmd3hqfbggmAAOSjQPsS8LQiDColfDhQVv2lSBjAqq9v8oQkoRhtaUUFm2ZiZEB88V/GUZJ8QM1NoBg4Ro7TA45D4sXJjhcX+JI4zkNUC12UFyp6b9bZMiJcn+0xpwHGHRAL2PEhMHmWXMAsT/oD3LGZg6gXiVZh2TUyhaatGqmbYHJk+eQ/EvOEZTL+5LtfcK/aspO4dpYVIhxdaOYdQlfgBzgl9d5D3cFs8wSKmktR9TJww64ZCPCAhIaFVI5MuAugpX8T3hOmc/KIk2MY7lnuH7FcjuhxDlRDbPiTQPW/4iiD0ExK/HCgqfoBBKbRKIoQh5LnHqikUp5cwCcxnFQT595B5CyKIlGdKQ0j8kmuk0R6bEHHCW7Ub+CbSviP/3hjA+Wea6EFWMd1WbwhZaJ/QXtM+U67rXzskGiFUKX6Eh5wYaMv23e9z2jvi74TAhMAqE+/Y5Dj/Wfhxsgk7fXN4lwrCIEPilwNlxA8zIc/CnsuAnHY+4RJp5s+sZIA63zZskCZ+eclAiMhm3UdjzynktZmHhG74NRc7AZEMmUzzcCTED0zZwVEoD1lBpwHxCxVczkusDIRpCMIgQ+KXA2XEDxBvhcnJnn9Lh5RnBKR3WgF2Iis+zIdp5sAEVYgfibqpQp+2z5cGsurk+Z58EgaQJz0X2LrLCrAbR0r8AHuaad7D3YgJvVtaNMTvuMC5ecg9hywZgjBoqI34secRcmpgv6IqIHKha+RxGU9zfmHQSQMrKUofpWWNsWR1gzMNe11ZVmHs49g2svDZeF+IPU0G5m4imwbi2ZikEIphrxEiBWqJLbOZarIAcUYwSfcVepfduJhtMAV4WYY8dm39xrzgfX47jte0bYeI0LM3TBhJt4kJx4TSoGUhBXDZp7ZJBgRhUFEb8WPPh0GNWSczWP4J2S+pCpgu/WvAyQOB1Z3AgJ30LWmDf88yaHAuxyM2ZCghlOBQ59xhcfgAA/PUsRkwjzAwoHIfSV9ogxVZGgkp4DkwWBbNDWmBEwwfI+Y94sZwONkmFnGcgn4Q/3/6WUZoE/BNYlbmWX7TObd6fE1WVkxQSIlH3CBCw9+5b55rNwFJwHPhePut5HkvaeDe+eaSbwHnE54VfUfo8PLk+6DP3GPW3x/tJs+Fd4zpkjywOB3hTLNxbGE5Pp70IHZMynhnvLusz0YQBgG1Eb+mgYEKYWcwhQhYnvRngw7uBwFhkOc+ez2wcj3Is+R7Ta5ZVmT7Ad578i3Qd+6jyn7TFm1yDdrnnfBuev1OBKGXkPgJgiAIjYPETxAEQWgcJH6CIAhC4yDxEwRBEBoHiZ8gCILQOEj8BEEQhMahtuKHOzZVCUhMTDUDMsyTkJmcgwRnk6iZitjUOiOei3imov3ExZykwASVh5g3Fg63cmLobDuwWw5LH7Rj+5UWTxg61gZG41Jv+1Mls4JnYM/1mfd5A2LmiIsjZo04R74dykcRX5hwpbhqObF1XKeIqz/fpe0v95M3TIX4w52dc9fEyaX5tvmuSTxO0nBiPov0zwfPgcTWJFcg8Tft8/vhWiRR/5Nz7qw4GTbZi3iGWZIqCMIgoDbil8Q1kXGeDCDPx9n6SetEfkvbL/JQUrmAZNOvx2mZyMhBFpc0gQiB6uoMQOQzZHCwpO2shUcTkO2Eem30yW+L++F5ZgX1+Mi8kZxPH6+wB8WD5ArOude8Y3l+VDFYwDsOYfCPqZJUcs/6nVAnjuNtG5DKDxTRzSOmgIGcyg/cN23wrLlXS47h71yL+ohUK6dAcFotQQuEiZJTSX/5d3KOEizeDTwfUpQ9EfeDVHuhhN9887TL7/TsWKzzYLW4ogffH98PafJCCay5NhU86AfPi+MRX1K7CcKgoxbilwgf2SeYlYZ+qFlJxnseSlbsHWjD8lbn3Nz2xA5glZFWh40BmBJGWUAGDns+5YIsmK2HCsxSc8/PjUrGD3tMlcyS/YTMMqFCvZZUcM8DSgDZNrKSwZ/cpnw73XKNko/Uns9kbTZ7oAFp+igvlVbmKo08KwSdVWI30Hdywb4XaCcr360ghZsg9AO1ED9AySAGIHv9vCRVWB7xw6xq27BEROhfVlCslhWjbSfhb+0JKVglcC5VECwQP9J72WMpaLuEdxxVGOwxVTKL+JFiK4v4kRItT2o7zHi2jbxkFXSVc24W27iHMwPnXR3nKk0Dq/JQQvQ8pG9M1NLAN0BKtzITR0gdv81t44IwgKiN+FFs1F7bZ2KeIXkyZHYbMoeSHzGryWz62OTpn5/UVLPt7mNP7oBu4sfsOksy7arFjxyX9pgqmUX8EAE7QJO82f4/yv/kmcRY8bPt5SETIva/QsgrfiQdxyRrzylCvvu0VRnm7W6rX1adye8HhupTMjEhz6ggDDpqIX4k8cW0Y68NqU/GZjxmR0ruJOS/54t/9BCh2Ck+NssgDDjemqHYK2EfyPbj0tiBIAu6iR9EdLuhavHjYyGRNpn/Q8R5iKrnth0mAxcGjrfndnPQwFnEPm/Iat2WKWKyk2evy4ofPCU2MW8Q77XRT+4fRynMx2kCyV7YqvYCMfKKX1rFe/hUbOrHJLpgnOAaCwPmUXtswuvjFbwF92iPhez5UQiY30joN8RvD2IeJ/n1unFfBGHQUQvxw+EgVA6HWS4ei1nB4EpfsyYFDg1MiG2o6jbOJmvZBlKQRfwY7A+yJxpULX54JFqPUJ/8bflAO6wGGBTTPFgTdgMejIia3zbFcKmxx2rYXvf7GQQ1QUj8RsWemLSR9D2pBDFrLDYITUgEEfOQ41Qe8eO+cDqyxyOuJ8fn2Gtg6mWSRe1J3p89l+dH33zgHRuqGYkTC/UPs/5+eU5J8mtBGHTUQvxYbdhBEWYtPFoEDDqsZuw18RZl0A0VMmWAyYIs4gfviAfjNFQtflnAM7ftIH6Ek5TF5QGTMp6PCFNooP9lXP4oC0Lix/5it31DHFVY7dtzMcOHnFjyiB8iZY+FF2ewIjCBS6sdeZE5FksHK1t7HB7HlGUShDqiFuKHAwh7bfbaC9sDKwQrGVZz9poIHANmSBgZ+LIMxlnFD8FngAeh1Wq/xY+VIasz2w7iR1/KgPtjz9a2jSs/f/tDQBgJXclaVTwkfpgQs8QMUnPwU3MuXrm+p2yCrOKHIIU8QwmzIBQhCzBv8tuwbRAqgnk/QSfx6+a9KgjDilqIH3sxIfds3LtDolAFDghcD9MbeycAxxn7dwad5Uw7IYTE74GUgZNBm/2XEOokfgSgh1b3yYoS8xzxaPbvTICyfANlxA/nI2t251tY1h6Y8g5D4keoBiEQ9tjfZVj1+eC52DaoYO+bzPl9snVgj0PA83gpC8IwoRbih6ktZGZEQPiRZ1lt5UXIsYOBLZkphwYT9um2M+2EEBI/HGaoNG7bZMWbFvheJ/HDqcWu7nF+oTo6QCzY/7PXxikpiwNTGfHD1G3jMhE/kgxYZBU/whtCjlPd9nktCPmwbcDfmOM2i/+/v3/Jv2NWpg1BqBtqIX6AQd1eG2IqwymBVeAM9qSCwLsObz97LTzvEuABd1vgmGO9Y9IQEj8ysxBqQDYQ2ybZTnA0saiT+GHCtO2y5+mneyPNl3U+uS/jvlUZ8TsyXk355/LsfNNigqzit0UcH+ofh/jnDSPguVthhnxHPnDe4Tuyx0GePaEjiGCWZykIw4DaiB+BtSGPv4QMJOxh4IlJjsYyIF1ZyATnD0x4vpET0R6TJdtLSPzY0wI/CrQJ2R+yqIv4sXILBbZvZRxS2P8MvRfyYHZDUfHjPZNOzZ7LxGcOe3AO8WPFas24mFazZvdJQC7S0CSMfvhgEkEsqj3OJynTrouzwDC5E4RhRm3Ej0EKU469viVOEeRkxGMOd/BO3pJpIJzBthsawELedmTAIJNGJ6SJH3tX9DckquR6JEWZj7qI34YBhxLeo41Xo6+hwGuck7p5bYbEj+t2Am1ihgxNugh0D62S8oifXU2yguvWJws8Tvl27DVJSG1BflEsDPZYS0SZZAOY/kl8rWTWwjCiNuIHiL9iVhpaJYTIYMKsnRVb1moJM8WBwratUAYXqgKQa9QeSx87IU38klUI+0F2/wtSvcJHXcSPvS9rzuS5Epfpg1VY6NvE47FbHGFI/PaIV2/E9CFO/PO7zrmfxKt/nE9CHqgQwQ0hj/jZlV8R8ftOiuNMSPwAq2Qmhvb4NLLXzvO1Ey9BGHTUSvwAgdbsTVCyyPYljQwq58fC1g2Y2li92TYo62LBzB9XfHssItXJY6+b+DGQs89k28U7z19V1kX87KoPkmAg9F0RYmKP5/rdqiaExA+BvT02VSdkxcOAH1phJgKNeNhVaYJBFz9AAnPEnT1Ue14aybCE13UvnMsEoReonfglYMaOmzdeknbVkEYCk5ndd0IoqwuDIoNMCKF9FErZUHEhDd3ED7ACCZnbEP1kRVQH8ZsnsJLnfaaJC6vtUNgLnpedauaFxK8I+RbocxqGQfwAJl3ePcmwbwmcHyLv6XjbkCAMKGorfgmY8TNg4Cqf5s3mk/28tKTErLgQU3sOHoW0z8yX+L+EmM0oAmqPZ/D2PUMtsogfM+wk1tAXdxx7klVoHcSPKgm2Zh0rO0zHZEDxnzfPn4Bzu1cGWSnbVGA+yoofwkQu0LSYywT9Fj/MmDb5Ouwmfgl4p4g5Fo8zUjxHffJu2OsWhEFH7cUvAX0gwBxzDi7ySf/sqhBzFvX0QiA3Jxk27D2y/8aPHieMEO3gDTGzpu0zZhE/wKAUEvQ7Y/MvqyD7t2ETP2vChDxP+4wTho6HuOt3SnRtxc9+F91IUoOQg4tFVvEjdtB6rmJuT5IoZAViHEp0jTk+LyjYy94ezjwk1bZtJsRcLAiDjsaInw+qOTA7TZvFksXeCg1gdZF3UEwjGVvShCWr+PkJif1+YfYjXVVIiIZJ/MjqEnLsKUq/Kr2FFT/I3izenKwwISZs4uNsNheI00enfdwEWcUvFOdHUD/B6HlArGGoVBGemkVB6AkTydC9QL4bVXMXBh2NFL8E7GfYAQaeG2/6W4ScV4qSFea29gIxsoofYNAkftG2j8j9LOX/Wwyq+LGasvk6y5DsOtZDNEFI/EKJrTGdptWOxCTZLZVaSDBC4seeMCE59lgmNXlAKEJoAkFViLJge4Dft20bsvcsCIOMRosfZrC7An0m1ol0WT6YQYeyurC/hLs7zich8rfQHhRkfyqEPOIHCHy2bXNdVpf2/w+T+IUmJtA+Y8u08AM8NdMSXaeJXyiGjXuh3I89nr3fbgH1WcWP4HScZ+yxxLLm+T2F0pthNmZiUQUwq9r24V/tgYIwYGi0+GG+CTmkhMSPGbctmAqJ9WJ2jQCFSD5OUquF0q/hRTe7uQ7IK3701YZ2YAYNzfiHRfxYQYX2StnjxPTHoG6fdUJi7NiTCpmo07xyQ+LXKcMLDiOh54sZutP3nlX8yBEbirdDYLOW6uLHHUqwTqhGWhxiXuBVHfKuJUxCEAYZjRY/TFhWNODvAyEPoQK1DK6IWxbgAm7PxwkjlDQ4r/iBNQPthzgs4kcgecjkmTW3JV671mEEUg4otJrLK35MWkJOHzhEkSczDVnFD4S+GZ7JgRnMq4DvKBSTyvXSnK3ygn6HnIzk9CIMOmohflkGghAQrpcDfSZPph9HRvD7zYHjKK6aJTAehOqlQVzwLYqIH0m7Q/FclsMiflQTsCs3/jtrOjrKCYVWJJeleGXmFT9AaAVOKH7/+Cfp50LXAHnED6cR0tbZ46kjiUNMp7hFxDlk1YBlnF0sCMmw7bNiT3LRCsKgohbiBxgocDhAODAL4SmIuz+DUJJ1gsGCwZP9OwLgQw4FkB+0P7CQNNuKESRsIiuouhBaKTDwTWmOLSJ+gPNs+5bDIn62Dcign/VbYkKU9n7tqh4UET++rZDAdAqXySN+OOfgfOUfmwgsz4IKIYQ+LBhX/GC/kXAcTK+h8AaI5ydVSSwIY2C1jdkYT0728qb3fkOJoxDfCnvlfGskEifZtb0G+6GhawjCIKE24kdsG/XcGPBwYmH1hkcbrunHxUJ1aPz/Hgn0MyH7IdZsdUzgOIgoZgWecewT2TYQRFtloqj4sVql9Iy9hs9hED8G85DJk/AU633ZCSQkCJnkQntmRcQPrBenlbPnYjpHPCzyiB/ATGsFxl8REwhP1QZCLfhGeGeh4yDvgcQLwFpLCANhnw5TMf+kegP72TjY8BviN8De9RFxjGoovjQh37QgDDpqI35p7ud5yGDBqs93h+cBMTjZY0luPad3XBYQK2bbwWnCJsUuKn5gmRThSDgM4sc+rB24YZqnZhpYxYRycGKutNleioofuCClv6Eq6HnFj2fKPmcotjAviVtkhRgC3qUhb+a8xClsS9u4IAwgaiN+oUoLecggyewW848PZt6hWW6RFE44pbwRaIsZtr+iQfz8GTwkRVWWgZjK5qEq8wkJf7BIEz+cJaoQP1ZfecQv5OXJ4J/l/n1g7g7tmREKYQsbh5I4ZxU/VqqhQPJ7A7UbQ6t/JjaUHkoDzimY6UP3koVYRBBo8sECu+oDJH7oZBHJQpJGEEsJQtcQhEFCbcQvtDrLQhwWWDUSEM7DsMBUGprVMxjlBc4xoXppzLiX9I5jv8h66eHMkmUgBpht02LdHrIHx+JH2ip7LHF2VYgfYtYpkbcPkguEnjd5M/OYPBOE9uQgguUjJF5UyMj6zMntGvIuZZXpf/+hRAlMbDqJX4JV49VbqKp9iMSXEiuIIBE6AdJECSsGWwe2jSzkW2VgSLYB0q4hCIOE2ogfG//kHOR67OudFg8UDCxkQGHQh6x8WCVyIxzHHgjOMWkgho8wB1zncTBg/5DKDnZGnwUM3qwk2UehLYg7O+ZQfzBmIMSdnb9xDNdnYKFeXRaQgJtVC+cl14F4IZIz0gLRwsHB7xf3SWqvbqWAfDDosc/FO0ja4bnxXkJVzUOgH8l5/jNipVZkUGW1jWOG3x73OYtpjz3h5HlDvo2FcjxznGhIVs4zTtrg+RMonwgPIL7O/574d+IWWbFnAatAjqd/rCJJ/M0eNxMoYgARe8o68XfM6SHnnhDYk+ab4d2RfIF9PpxtmKzxe6Ht5DfEipbfFomuOd7PVFTkHQnCSKAW4pf2g8PsxcCDSYcVzOLxqiitHI5FWrsJuv09L2iv6jZD6Mc1BgFZ7zPrcWnIen7W4/KAHzAJzrEcINbT2QNKXhexZTW+cPz7gTjH2D1TQRg21EL8BEEQBCEPJH6CIAhC4yDxEwRBEBoHiZ8gCILQOEj8BEEQhMZB4icIgiA0DhI/QRAEoXGQ+AmCIAiNQ8/Fj6wZneqOCYIgCEK/QQEDq1edmFv8KH9C3kCy1ouiKIriIHD+gF51Ym7xI8EyNfaeFkVRFMUB4bMBverE3OIniqIoisNOiZ8oiqLYOEr8RFEUxcZR4ieKoig2jhI/URRFsXGU+ImiKIqNo8RPFEVRbBwlfqIoimLjKPETRVEUG0eJnyiKotg45ha/fzvn3o3TnImiKIriIBBdsnrVibnF7yTn3HjOubFEURRFcQD4ZefcJAG96sTc4qd6foIgCMKgYfyAXnWixE8QBEEYevS8mK3ETxAEQRg0SPwEQRCExkHiJwiCIDQOEj9BEAShcZD4CYIgCI2DxE8QBEFoHCR+giAIQuMg8RMEQRAaB4mfIAiC0DhI/ARBEITGQeInCIIgNA4SP0EQBKFxkPgJgiAIjYPETxAEQWgcJH6CIAhC4yDxEwRBEBoHiZ8gCILQOEj8BEEQhMZB4icIgiA0Do0Uv6mdcys759Zyzu3gnNvcObeuc+4Hzrl5nXPj2RMy4KvOuWXidraKSXvT2gMrxqTOuYkL9nk259xycZ83cc79wjm3pnNuVefcDPbgEQbvbPn4nW3jnNs+7jfvcVZ7sCAIQhcMtfgt7Jy70Tn3lHPucefc35xzi9qDYkzknNvHOXefc260c+4159w/nHP/dM69Ff/7351zLznnnnPOPRqLAcLSCUs75y5xzj0Rn087b8fkv7nWnc65PZ1zk9uTC2CseNC/IL5v+vqyc+5Me2AACMiJzrnbnHNPx317Ne7zm865d+J/fz3+28POueOcc7PH549h2ssKRPaR+B3Bx5xzm9qDAmBC8Uvn3D3OuefN8+W98e+8R/r6kHPuN865b9pGPDA54V086fWlG3nGt0hgBaF2GGrxY9XC4OdfbwV7kHNuAefcdc65DwP960RuNm3l9jXn3AHx9T8PnGv5r1h0vmcb6gBfbFhFnu2c+0s86H9q2uf+umGOWDhs3zrxo1gAWCEXwdjOuQcD7e5mDzTgPSI+PDd7bho/ds4965xb3Tk3pm3QObdjfD/2vG5kcjSXbUwQhKHGUIvfsvFqz78egmjBysz2Kwt/65ybzjYWr74Oc879O3BONyJeCBnIspKa3zn351hkO13vWntiAPM4574InJuFiMoUtsEMYIVq26IPu9gDDV4InJeVPCtWq/b5Hl9Q/N6Q+AlC7VB78ftpbMaz/cL8tZ9zbifn3M7OuZ8753Z1zh3rnPtdbEY7OmXlx37ee15b/4n/+Zlz7k/xPV/knHslcAy8OocZ7fuxOdL237aZRfxmjO/t1/E9/8w5N8pwi/jvVmi51h9sg13ASiu0Ku4mfr8KnINZln2+1eK9P97zj+L9Wky/9nje3bim3XPNfSVm3k5k1ccK9NumLUEQhhu1Fz8GbP/vDOIM/KzouHkGyIQ4jUzinJvGOTdz/E/Mdj4Qwz+a9vjnVc65ReK/TxbvrzFg4pzB/pp/LCZLxDYLED9faDkXAbvS3FcW8WPF+o3YSYb7xXTL/fF+fLLP+WPTPmRvMSsW72Bi7SZ+CJ09nv1d+mtXc/SX52y/AwSR+/RxRTxBSY7ZOF7RzdmB/J322X8UBKE+qL343Wr+zsDKQFoU28bOFn6baeZRwGDNStGuPi92zn3dHhwA93N9vErFC5P9y1ni/Ua/vSzilwd8GIisfw2edRYwAUgEP6G/Auwmfuzd+edeag8I4Cjn3CfmvKnMMTxH3+y7oPm7IAjNQePED1MW+2hFwSDrt8dKjBVEJ+BpepY5D1Maq7pumDAWO15UAlYheK767VUtfuPH+5r+NbKIHyvJm8x5eJj6q7lu4mf35fZyzn3ZHmSwUcChyYofDke+qZiJhCAIzUTtxQ9nEdsnwg6Kgn0jvy1WJdPbgwLA1OqfhxiwX1UEmGf3Ne31QvyONNcgDKQbcCrxz2G1hQnYX/nmFT/277qJH3uV3cTvAfN3HIAEQWgmai9+68V7Vf4xeAMiFqGwiE6YyTl3g2mLFVgWrBHHqSXnsfe0hz0oI/ohfuwJEg/nXwPnj07gHn3TIx6iOPZ8KV5xJ/+/m/j514T0oxuuMaZVhNru+VlTbMiZSRCEZqD24gcIL+BvvskLPhM7ryAkdqAMYT7n3F2mDTxEswBnGHsuAdxF0GvxWzJ2DvHbZzWGt2UaiCFEcJLjEUGcXgBm2jzit7e5NqJ2jnPuW/Eq0ierblaoHwSerfX2JBjePwbPXPZe2duEF8ahGeyvpu3hCoJQDzRC/Mj64q+6LN+P9wYZYP19IOtZyB4de3X+uVnFDxOb3Qsje0oRlBE/BOOk2DsVgbPk/9t7hKy+QoHjAJEhNMQ//ife3/OKHyZX6/EJyc5zh8fb4wmFdXThm/iOaZMP3VoA0sj3QLs8C9LdCYJQPzRC/MBCKZlGLFklsm9FmAPwBRBvS1aL/vHDJn6snvz4w27EoYdwEUy+IfB8bDgJcYI+8oofIMTg3UB/upHvgVW2xWIBL90sJG3dEoGJkCAIw43GiB9AgEiMTG5J20+fmEcRKkx5Poh9s/tGwyZ+5NkMrarSiFBxz6G9TQRhd3M8adasCbmI+OHkYkMespCYSEye7DP6WCqe2JDLlBWgz27f890ZnZoEQRgeNEr8ErAyIDn0+V3SfV0eZ0VJUIeVHyZFRHxD59wGARKUH0oHx6rJX/1hAv2uF4DPhIHk1ZhVQ7DentvZAzzwDu31CVMgnGF90991YsG1xzPJIag/AYH7rODIrWpJcnLaoT2qWuDYY9vLEpYiCMLwoJHilwCnBoQAB4u0PcHNvOMxnd1v/t4tQXMCYgttzOEx9qCMKCN+WcAqh9Rkfvt4p17mHUMWGypf+H/HgYSUaUwIfBJa4jukJKnSWP0lx/iwzxjzJ2brNOBRShiDP5GhEgTxlUVAmSRWiH4fiDVk4iAIQj3QaPFLwAoBD0diAm0uSgSKQHPAPhROFv7f7cCdBvplHUkOtgdlRK/FD+DEYldUrN4SMHHw/4bwEEKCs0iI1tMWk6b/dx9+CjKII1I3YH61ZtIyHpvWgQcv0LRVrSAIwweJnwdWF/5qBv7eS0LNXhYegP7fce7ws6+kYWtzHgM19QKLoB/ixyrnCHMNP8MLdfP8v5WlD+u9iYna7uFZEM9pyx+Rm7MoqGXot4UJXHGBglAfSPw84MBhxe1m59zc3jEUTPX/jrmU6gLdcIg5j5g4PxwgD/olfrbPvvjZlV9Z+rAVJUgf10382Au04oepuaiXphU/EolL/AShPpD4eSAvJZlC/PbYm8JDMsGBARMeItEJOIbYFSXOL367eYBJstfix36ZrRzhpzdDgNkXJNF3J+JAY/cPeX7EFPK35Dgf1nyJybGb+LF/aNOiUZmjKHDe8ds6xTk3uT1IEIShhcTPAysxW0T1dOfclN4xeAZaIXs+HshDDhFUDiC/pX0uuPJ3Q9qqhTyXOJH47SHaVYLVrl1JsadXFH473bw9bZV6ismOYw/ygOcp4Qi+wwurx6JihZDamMBNjfeoIAjDjUaIHwMtjiuHxnX0/BUH/07S6cMDuSxhaF/OL7aarAIxf/Jw2Cdj8MQBg8K49wbaJM4QEc0CKjrgjUr/aBvRZJ/RpkojdRf3x30S58ax3Cv1+xKwT0eFBVaNJNXGrX+lOPSDTCbseZKfk+tRcNdvHyeULKWFQqAOn99Wtzg/VrH2mZ0a942JCGELrEz5d/KzYoq2q3FW7ImjEiBMgudD8WLCIAhbobQVKeu4d0IZ8OzlueGAY69PliBBEOqDRoifn9mFQZwVDRUAIP+eFuuHx1+o/BHmSvYCk+PswNuJXA9BTUsVZoE42ZWQvW7a9RFkP9sJA3jyN8IHEMynYiHlfvBktfkv/eOLmmnzih9iZK8P6Ru1E6mscXb872kJC6j47leCSAoQ8/4x31LslhRpt8QmaDxxqexu24F4m07htSUIwvBjqMUPobPxeaFKDXaVlIWsAnFksSKVmCJZNdgKD91IlhMypeQxx63YYVDuRgZ4Pz4OIbTHZCEZYVghF4UVP9gtPpJVmj0nKxEr64FrHZmyklUoKeEEQagXhlr8yNiBY8Lb8b4QKyTi9SzI2M+Ky8bwWbIiYf/uTOfcMh1qyCUCSPozBmkSLltnC5+sTqkesLY3KKft51lgHv2rd49ZiWAi+n7NOhxA7ozfn62CYMmzIAcojilkPikD0pvRn6RvxAtaJxcLng/maBIDZBF/3i8rfByS/D3aBFS+J08nK9i0lXJCLAIEzWM+TstpKgjCcGOoxY9ipQgKzgi4w2+ZEoiMgPA3TG2Uq0Gw2Ps6I66wzp5RsleHuQxPxjwg8wvlfhh4aReT3Gnxnh81+0idVdRsxv3giJPcY1Zy/OomzyberLPHe16ID1lLqNbOHibPAdHnWfD/CN4ndq5MoHgCPDVHmf7ZvKlpwOxMoVpWzLwj3hn9hPw7AsVz537I35kGstZgQuY7YNWJhy77qLwn2uL+2S/l+2CPmImVIAj1xVCLX1kgBqxKqgZmvrRV46CCPg/qe/LBO6OfkH8vC4SZtrh/QRCag0aLnyAIgtBMSPwEQRCExkHiJwiCIDQOEj9BEAShcZD4CYIgCI2DxE8QBEFoHCR+giAIQuMg8RMEQRAaB4mfIAiC0DhI/ARBEITGQeInCIIgNA4SP0EQBKFxkPgJgiAIjYPETxAEQWgcJH6CIAhC4yDxEwRBEBoHiZ8gCILQOEj8BEEQhMZB4icIgiA0DhI/QRAEoXHoufgd75z7sr2qIAiCIIwgxgnoVSfmFr9znHMzO+e+KYqiKIoDwGmdc98J6FUn5hY/URRFURx2SvxEURTFxlHiJ4qiKDaOEj9RFEWxcZT4iaIoio2jxE8URVFsHCV+oiiKYuMo8RNFURQbR4mfKIqi2DhK/ERRFMXGsSV+o51z/xFFURTFhvBcxO/YWAVFURRFse5E+Lb6f85lqTzIxo1DAAAAAElFTkSuQmCC'
\ No newline at end of file
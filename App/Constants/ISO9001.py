@@ -1 +0,0 @@
-ISO9001 = 'data:image/png;base64, /9j/4AAQSkZJRgABAQEA3ADcAAD/2wBDAAMCAgMCAgMDAwMEAwMEBQgFBQQEBQoHBwYIDAoMDAsKCwsNDhIQDQ4RDgsLEBYQERMUFRUVDA8XGBYUGBIUFRT/2wBDAQMEBAUEBQkFBQkUDQsNFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBT/wAARCAF4AbUDASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwD84viB4v11PHniRV1rUVVdSuQALp8Aea3vXP8A/CZa/wD9BvUf/AuT/GrHxD/5H7xL/wBhO6/9GtXP0AbH/CZa/wD9BvUf/AuT/Gj/AITLX/8AoN6j/wCBcn+NY9FAGx/wmWv/APQb1H/wLk/xo/4TLX/+g3qP/gXJ/jWPRQBsf8Jlr/8A0G9R/wDAuT/Gj/hMtf8A+g3qP/gXJ/jWPRQBsf8ACZa//wBBvUf/AALk/wAaP+Ey1/8A6Deo/wDgXJ/jWPRQBsf8Jlr/AP0G9R/8C5P8aP8AhMtf/wCg3qP/AIFyf41j0UAbH/CZa/8A9BvUf/AuT/Gj/hMtf/6Deo/+Bcn+NY9FAGx/wmWv/wDQb1H/AMC5P8aP+Ey1/wD6Deo/+Bcn+NY9FAGx/wAJlr//AEG9R/8AAuT/ABo/4TLX/wDoN6j/AOBcn+NY9FAGx/wmWv8A/Qb1H/wLk/xo/wCEy1//AKDeo/8AgXJ/jWPRQBsf8Jlr/wD0G9R/8C5P8aP+Ey1//oN6j/4Fyf41j0UAbH/CZa//ANBvUf8AwLk/xo/4TLX/APoN6j/4Fyf41j0UAbH/AAmWv/8AQb1H/wAC5P8AGj/hMtf/AOg3qP8A4Fyf41j0UAbH/CZa/wD9BvUf/AuT/Gj/AITLX/8AoN6j/wCBcn+NY9FAGx/wmWv/APQb1H/wLk/xo/4TLX/+g3qP/gXJ/jWPRQBsf8Jlr/8A0G9R/wDAuT/Gj/hMtf8A+g3qP/gXJ/jWPRQBsf8ACZa//wBBvUf/AALk/wAaP+Ey1/8A6Deo/wDgXJ/jWPRQBsf8Jlr/AP0G9R/8C5P8aP8AhMtf/wCg3qP/AIFyf41j0UAbH/CZa/8A9BvUf/AuT/Gj/hMtf/6Deo/+Bcn+NY9FAGx/wmWv/wDQb1H/AMC5P8aP+Ey1/wD6Deo/+Bcn+NY9FAGx/wAJlr//AEG9R/8AAuT/ABo/4TLX/wDoN6j/AOBcn+NY9FAGx/wmWv8A/Qb1H/wLk/xo/wCEy1//AKDeo/8AgXJ/jWPRQBsf8Jlr/wD0G9R/8C5P8aP+Ey1//oN6j/4Fyf41j0UAbH/CZa//ANBvUf8AwLk/xo/4TLX/APoN6j/4Fyf41j0UAbH/AAmWv/8AQb1H/wAC5P8AGj/hMtf/AOg3qP8A4Fyf41j0UAbH/CZa/wD9BvUf/AuT/Gj/AITLX/8AoN6j/wCBcn+NY9FAGx/wmWv/APQb1H/wLk/xo/4TLX/+g3qP/gXJ/jWPRQB6l8MfFuuyf2lu1rUDjyut0/8At+9FZPwt/wCYn/2y/wDZ6KAMP4h/8j94l/7Cd1/6NaufroPiH/yP3iX/ALCd1/6NaufoAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigDvPhb/wAxP/tl/wCz0UfC3/mJ/wDbL/2eigDD+If/ACP3iX/sJ3X/AKNaufroPiH/AMj94l/7Cd1/6NaufoAKKKKACiiigAoor9N/+CPf7M2i+N4PGfxF8XaDY63pcZXRdNt9Sto54Wl+WWeTa4OGUeUoOP8Alo3pQB+ZFFf0yf8ADOnwr/6Jv4T/APBLb/8AxFI37OfwqZSp+G3hTBGDjRbf/wCIoA/mcor2z9sn4KP8Af2jvGfhNLcwaWl217pmFIQ2c3zxhSeoTJjJ9YzXidABRRVzRUWTWbBWUMrXEYIIyCNwoAp0V/S7Y/s7/Cx7G3J+G/hMkxqSf7Ft/T/cqf8A4Z0+Ff8A0Tfwn/4Jbf8A+IoA/mbor+mT/hnT4V/9E38J/wDglt//AIij/hnT4V/9E38J/wDglt//AIigD+Zuiv6ZP+GdPhX/ANE38J/+CW3/APiKD+zp8K/+ibeE/wDwS2//AMRQB/M3RX2V/wAFTvEHhWT9pA+EfCGgaPoWneF7JLW4GlWCWpkupMSSbyoAfCmMA9smvAf2aNOtdX/aC+Htle20V5aT63axy286B0kUyDKsp4IPoaAPM6K/plP7O3wrJP8Axbfwn/4Jbb/4is3xB+y58IvEmiX+lXfw58Mpa3kLQSvbaXDFIoIxlXVQVI7EHNAH81lFe3/tefsxa3+yx8XdQ8MX8U02jTsbnRtSdflu7Yng56b1+6w9R7ivJPDWvXHhXX9P1i0SCS5sp1njjuoVmiYqc4dGBDKehBFAGXRX7+/soXnwN/ak+EmneK9K+Hfg+LUkAt9V04aNb77O6A+ZSNn3T95T3B9jXs//AAzp8K/+ib+E/wDwS2//AMRQB/M3RX9Mn/DOnwr/AOib+E//AAS2/wD8RVXVv2d/hbHpV6y/DjworLC5BGjW+Qdp/wBigD+aWitXxZEkPinWY40WNEvZlVVGAoDtgAVlDrQAUV3Pwd+C/i748eObPwn4M0iXVtWueSF+WOBB1kkc8Ig7k1+wP7M3/BJ34cfCmzstV8fqnj7xUu2Ropsrp9u4IICR8GTBHV+CD92gD8cfBHwm8Z/ErUILHwr4W1bXrmcExJY2jyb8dcEDHH1r1Cy/YM/aBvnkVfhP4jiKRtITPa+WDjsCTyT2Hev6HdE0LTfDenRafpGn2ml2EOfLtbKFYYkzycIoAH4Cr2KAP5wdV/Yu+Omh6bc3998KfFFtZ26GSWVtPchFHUnFeQ6jpd5pFx5F/Zz2M+N3lXETRtj1wwzX9TmPSvP/AIq/AL4e/GzTpLLxt4R0zX1dQgnuIALhAOQFlXDgAnOAcUAfzMUV+jP7Yf8AwSa1j4bWN/4u+E01z4l8PW6ma50Kf5762QdTGQP3yjqRgMPQgZr86ZI2id0dSjqSGVhgg+hoAZRQOtfdv/BIPwV4f8c/H7xLZeItD07XrSPQHlSDUrVLhFfzoxuCuCAcE80AfCVFf0yf8M6fCv8A6Jv4T/8ABLb/APxFH/DOnwr/AOib+E//AAS2/wD8RQB/M3RX9Mn/AAzp8K/+ib+E/wDwS2//AMRVe+/Zn+Euo2zQT/DXws0bdQukQIemOqqD3oA/mjor+gLxv/wTO/Z58bafLAPAy6BPI+83mi3UkMwPoNxZcf8AAa+Av2p/+CSXi34U6Ve+JvhxqEvjfQbcGWfTXi2ajAnJJVRkSgDGduG6nbgUAfn1RT5I2jZldSjqSGUjBB9CKZQAUUUUAFFFFAHefC3/AJif/bL/ANnoo+Fv/MT/AO2X/s9FAGH8Q/8AkfvEv/YTuv8A0a1c/XQfEP8A5H7xL/2E7r/0a1c/QAUUUUAFFFFAEkMLXEqRIu6RyFUDuT0r+kf9lH4Lx/s/fs++C/BJjWO/sbJZNRZdpLXkpMk+WXhsOxUHn5VX0r8Y/wDgmX8Ef+F0ftXeHHuovM0bwuD4gvfmAz5LL5C8qQ2Z2i3LxlN/pX78UAUtU1ix0S2W51C8gsoGljgWWeQIpkkcIi5PdmZVA7kgVer83v8Agsx8c5PCnw78IfDrS7wxX+uXw1W+SJ0P+jW5BjR1+8N0xR1Ix/qGFfan7Nfxbj+OnwI8E+OUdWm1fTo3uwqbFF0mY7gBcnCiVJMc9MUAfCX/AAWk+Bp1Twt4S+K2n2rPPpcp0fVZI4mYi3kO6B3bOFVJNyDjk3A5r8ka/pk/aB+E1j8cfgx4u8DX6x7NY0+SCGWSISeTOBuilCkjLI4VhyOQK/mp1vRr3w5rN/pOpWzWeo2FxJa3VvJjdFKjFXU47hgR+FAFGr2hf8hvTv8Ar4j/APQhVGr2hf8AIb07/r4j/wDQhQB/Ulp3/IPtv+uS/wAhWd4v8XaV4D8L6r4i128XT9F0u2e7vLpwSsMSDLMQATwB2rR07/kH23/XJf5CvHf21v8Ak0f4vf8AYs33/olqAOX/AOHjX7On/RTtN/78zf8AxFH/AA8a/Z0/6Kdpv/fmb/4iv56aKAP6Fv8Ah41+zp/0U7Tf+/M3/wARVLWP+Ckf7PdhpN7c23xG0+7uIYXkigSGYmRwDtUfJ3OBX8+1GaAOg8f+Mr34heONf8T6gzG91i+mvpQzl9pkcttyeSADgewFdn+yt/ych8Nf+w9af+jBXlma9T/ZW/5OR+Gv/YetP/RgoA/pVpKWmM4XGWAyccnqfSgDwP8AbO/ZW0n9q34RXegzqtt4jsd11ouongw3AH3W9Uf7pH0Pav57vFnhPVvA3ibU/D+vWM2m6xp07W11aTqVeKRTgg/0PQgg1/UfX5wf8FWv2Kj4/wDD8vxf8GacZPEelQ41uztl+a8tV6TBe7xjrjkr2OKAPgD9iP8Aaw1T9lP4uWuqmaWbwlqTLba5p6jcJIc8SqP76dQR1GRzmv2KT/go3+zo6K4+J2nYIBAaCcH8Rs61/PdwKbQB/UX4I8a6N8RfCmmeJfDt8mp6HqcIntLyMELKh4yAQD271o6z/wAgi+/64Sf+gmvDf2Bv+TOPhN/2BI//AEJq9y1n/kD33/XCT/0E0Afy9+MP+Ru1z/r+n/8ARjVN4F8E6v8AEfxjo/hjQLOS+1jVbpLS2giUsSzHGTgE4HJJ7AE9qg8Yf8jdrn/X9P8A+jGr9JP+CMHwHg1bxD4o+KupW6yDTMaVpZkU8SuN0sgzwcLtXPYk0Afe/wCyJ+yj4c/ZQ+GVtoOlql7r10Fm1jWXjAku5scgeka5IVc9OepNe7UnSvnH9uP9rex/ZN+EratEkd74s1VmtdFsJASrS4y0r/7CAgkdyQPXAB6L8Zv2jPhz+z7pUd/4+8V2OgJL/qbeQtJczjIBMcKAyOBkZKqcd6+SdT/4LR/Biy1C4t7fw14z1GCOQol3BZ2ypKAeGUPOrAH/AGgD7V+PfxD+IfiP4q+LtR8UeLNWudb12/ffPd3T7mPYKB0VVGAFGAAABXN0Afup8Mf+CtnwH+IWqCw1G81jwRLJIscMniG0VYZCe5kheRUA7lyor7F0bWtP8R6Xa6npV9balp11GJYLu0lWWKVCMhlZSQQR3FfyzV9VfsM/tw+Iv2WfHFlp9/fT3/w3vpwmpaVIWdbYMebiAclWXqQv3hkYJwQAfv6RX5Of8FV/2G7TQILv40+BrNLa0eRR4i0uCPCxsxwLtAOACxAcepBHU4/VbR9Ys/EGlWepadcx3lheRLPBcRMGSSNhlWBHYg1H4k8O6d4u8Panoer2y3ml6lbSWd3bsSBJFIpV1yMEZBIyDn0oA/lpr9Bv+CLP/Jxnin/sXX/9HxV8eftB/Ca7+Bvxn8XeB7sOx0e/kghlkjMfnQ5zFIASThkKkcng19h/8EWf+TjPFP8A2Lsn/o+KgD9oq8p+L37UXwv+A2rWOmePPF1p4evr2A3NvDcI7GSMMV3fKp7givVq/Hb/AILbf8lm+H//AGL7f+lElAH3v/w8Z/Z0P/NTtN/78zf/ABFW9I/4KB/s9a3qEdpB8U9Dhkk6PeO1vGPq8iqo/E1/O9RQB/Ul4Z8VaP4z0W11jQNWstb0m6XfBfadOs8Mq+qupIIrVNfz/wD/AATx/ab1/wCAXx98N6ZHfTP4Q8SahDpuq6YznyS0rCNJwCcK6MUJbGSoI9Mfv/nI45BoA/Hz/grp+yTYfD7XrL4u+FbNLTStdufsmtWkCBY4r0gskygdBKFbd/tLn+Pj83K/oq/bz8DweP8A9kP4o6dMgY22jy6pGxHKPa4uAR6HERH0JFfzq0AFFFFABRRRQB3nwt/5if8A2y/9noo+Fv8AzE/+2X/s9FAGH8Q/+R+8S/8AYTuv/RrVz9dB8Q/+R+8S/wDYTuv/AEa1c/QAUUUUAFFFdV8LPh9qPxX+I/hrwdpK7tQ1u/hsYiQSELuFLtj+FQST7A0AfsT/AMEfvgkfh9+z1e+N72Ex6p40u/Nj3ZBFlblo4vlI4JcztkfeUoewr70JCgknAHUmsXwX4S07wF4P0TwzpEXk6Xo9lDYWsZ6iKJAi59ThRk+teX/tkfGf/hQv7N3jjxdFMIdSgsmtdOPBP2uY+VCcd8M4Y+ymgD8Uv+Cg/wAZ/wDheP7VXjHVYLgz6RpUw0TTjkECG3JVipHVWlMzg+jivt7/AIIq/GUaj4W8afDC8lBn06Zdb09P4jFJtjnGfRXEJA/6aNX5JO7SOzMxZmJJJOSTXvn7DHxnHwK/ae8FeIriYQaTNdDTtSLthBbT/u3Y+u3cH+qigD+irpX4Uf8ABVv4Hr8KP2m7rXrK3EGjeMoP7Ui2KFRblcJcKAPfY5Pcymv3Wyc18Wf8FYPgkfil+zFd+ILODzdY8HzjVUKqNxtsbbhc9lCHfj/pmKAPwsq9oX/Ib07/AK+I/wD0IVRq9oX/ACG9O/6+I/8A0IUAf1Jad/yD7b/rkv8AIVwX7RHw/wBT+K/wK8eeDdHktodV13R7nT7WS8dkhWSRCqlyqsQuTyQD9K73Tv8AkH23/XJf5Cp6APxN/wCHL/x0/wCg54G/8GV1/wDItH/Dl/46f9BzwN/4Mrr/AORa/bOigD8TP+HL/wAdP+g74G/8GV1/8i18YfEz4fal8KvHuu+EdYktpdU0e6a0uJLR2eFnXqVLKpI+oFf1BV/OB+2j/wAnWfFD/sNz/wBKAPFq9T/ZW/5OR+Gv/YetP/RgryyvU/2Vv+Tkfhr/ANh60/8ARgoA/pVr5a/4KUeKdV8D/sq6x4h0O9m07V9M1KwurW6gYq8cizqQQR+X0Jr6lr5E/wCCqo/4wv8AFv8A19Wf/o5aAPQP2Mf2ptL/AGr/AIP2viO3T7Hr9kVtNZ0/cD5NwF++uP4H5Zc47jtXu88EdxDJFLGskTqVdHGVYHggjuK/nL/ZA/ac1j9lf4waf4psjNc6NMRbaxpqOQt1bE88dNy/eUnuPev6GvA/jbR/iN4R0jxN4fvEv9G1S3W5tbhDwyMO/oRyCOxBoA/Er/gpT+xdJ+zr8RH8WeGNPkT4d+IJmeLYdy6fdHJeA9wp6pnIxkZ4xXxVX9OXxi+Evh744/DnWvBfie0F1pOpwmNv78T/AMEiHsynBBr+dv8AaL+Amv8A7N/xW1jwV4ghbfauXtLzHyXduf8AVyqfQjqOxBFAH7ufsDf8mcfCb/sCR/8AoTV7lrP/ACB77/rhJ/6Ca8N/YG/5M4+E3/YEj/8AQmr3LWf+QPff9cJP/QTQB/L14w/5G7XP+v6f/wBGNX72/wDBNDwVF4L/AGN/AYjA36pFJqkh7lpXJ5/ACvwS8Yf8jdrn/X9P/wCjGr+ij9i5om/ZR+FRgIMX9gW23b0+7QB7RX4Qf8FWPitP8Rf2rtZ0kXBfTPC0EelW8JxhJAN035ux/IV+8Ffzi/ttBx+1t8WvNzv/AOEhus5/36APEaKKKACjNFFAH7pf8Elfitd/Eb9lW20q/aea58KahJo6zTMCGh2rLEq+gRJFQZ/u19qnpX5pf8ERlux8NPiOTxY/2vCE6/6zyRu/TbX6W0Afij/wWY8G2ugftNaPrVtE6y67oMNxcyEHa8sckkIwemQkcdXf+CLP/Jxnin/sXZP/AEfFXZf8FuzF/wAJn8MwP9f/AGfcknI+75gxx165rjf+CLP/ACcZ4p/7F2T/ANHxUAftFX47f8Ftv+SzfD//ALF9v/SiSv2Jr8dv+C23/JZvh/8A9i+3/pRJQB+cFFe/fsi/smXP7XHiTWtA0vxbp3hzWNOt0u47W/gdzdRFirsm0/wHZkf7Y96+qrb/AIIj+NXuI1uPiPokMBbDulhK5Uew3jP5igD4h/Zt8G33xA/aA+HegadDJNc3mu2mRGuSsayq8j/RUV2Pspr+ltE2Iq9cCvlj9j3/AIJ8eB/2TZpNaiupvFHjWeIwya1eRhFhQ43JBEM7AcDJJZj0zjivqk9KAPIP2wNattA/ZW+Ld1dyCOJvC+oWwJ6b5YHiQfi0ij8a/m3r9kP+CxP7Rtl4V+Fdn8JdMu0l13xJLHd6nEhybexifegb0MkqoR7RNkcivxvoAKKKKACiiigDvPhb/wAxP/tl/wCz0UfC3/mJ/wDbL/2eigDD+If/ACP3iX/sJ3X/AKNaufroPiH/AMj94l/7Cd1/6NaufoAKKKKACv0U/wCCM/wSXxZ8YPEHxIvoN1n4VtPstkzggG8uFZSwPQ7YRICO3mKa/OsAkgDkmv6Ff+Ce/wAEf+FFfsr+EdLuYPI1rVo/7c1MEEN51wAyowPIZIhEhHqhoA+ksV+Uf/Baz4zGa88EfC2znG2JW17UYx6ndFbjP088kf7pr9WJplgheV22oilmJ7Ac1/Nr+1V8Yn+PX7QfjfxsJDJZ6hfslhwRi0jAig4PQmNFYj+8TQB6N+wR+x5B+1/8Rdc0nVdR1DRPD2j6d9quNQsIkdvOZ1WKLLZALAyN0PEbV91p/wAES/h3GwZfiJ4pBByCIbbg/wDfFd//AMEkPgwPht+zGvia7tfJ1fxleNfs5Qq/2WPMdurZ7Z81we4lFfb2fagDI8JaHL4Z8K6No82oT6tLp9nDaPf3QAmuSiBfMfGBubGTgYyTVjXtFtPEmiX+lX8KXNjfQPbTwyLlXRlKsCO/Bq8emadQB/Mv8fPhVd/BH4y+L/A14r79F1CSCJnxukgPzQucd2jZG/GuN0L/AJDenf8AXxH/AOhCv0m/4LR/BE6R4v8ACXxTsINttqsR0bUWXAAnj3SQtjqSyeYCT2jUV+bOhf8AIb07/r4j/wDQhQB/Ulp3/IPtv+uS/wAhXnX7SvjnVvhn+z98QvFehSxw6zo2iXV9ZySxiRVlSMspKngjI6GvRdO/5B9t/wBcl/kK8c/bWA/4ZI+L3/Ys33/olqAPyR/4e5ftD/8AQZ0b/wAFEP8AhR/w9y/aH/6DOjf+CiH/AAr4wooA+z/+HuX7Q/8A0GdG/wDBRD/hXyl8QfHWq/E3xrrPirXJI5dY1a4a6unhjEaGRuuFHAHsK52jNABXqf7K3/JyPw1/7D1p/wCjBXllep/srf8AJyPw1/7D1p/6MFAH9KtfIv8AwVV/5Mu8W/8AX1Z/+jlr66r5E/4Kqf8AJl3i3/r6s/8A0ctAH4JV+hv/AASr/bPPwu8WxfCnxZe7fCmtz50y6nkwthdt/Dz0SQ8ezYPc1+eVKjtG6sjFWU5DA4INAH9Un+cV8rf8FAv2Prb9qb4UyS6VaxL490NWn0i5OFM46tbM391u2ejAeprh/wDgmP8Atnr8fvAC+BvE1z/xXXhy3VRLK+W1C1HCyjPJdeA34Hua+48UAeE/sMWFzpH7I/wvsr2CS1vLbSVhmglUqyOruGUj1BBr2vWf+QPff9cJP/QTVmOJIUCRoqIOiqMAVW1n/kD33/XCT/0E0Afy9eMP+Ru1z/r+n/8ARjV+9H/BMrx1H43/AGOfA4RgZdISXSpFzypicgZ+oINfgv4w/wCRu1z/AK/p/wD0Y1fov/wRm+PsHh7xh4i+FeqXCxQ60BqWl7zjNwgxJGM/3kwQO+00Afr1X4Uf8FYfhLcfDz9qfUddSBk0rxXbpqUEvUNKBsmGfXcM49CK/dY18+ftrfspab+1j8JJtBZ4rHxJYMbrRtRkXPlTY5Rv9hxgH6A9qAP526K634n/AAq8VfBvxde+GfF+jXGi6vauVaKdCFkHZ0boynsRXJUAFFLivr39hH9gzxF+0x4xsNd12xn0r4a2Mqy3d9KhU6htOfIhz13dGboAfXFAH6N/8EnvhLc/DT9lOw1O9jkhvPFd5JrXlSEECJgscLDHZo0Vv+BV9n1U02wttJsLays4I7azt41ihhjUKqIowAAOgwKo+LvFmm+BfCureItauVs9J0u1kvLqZv4I0Us31OBwO5wKAPxl/wCCyfjK08QftQaZo1uW83QNBgtbkHoJJHecY/4BKlaP/BFn/k4zxT/2Lsn/AKPir41+OvxTvfjZ8XfFnje+3LNrWoS3KRM5YQxFv3cYJ5wq7VHsK+yv+CLP/Jxnin/sXZP/AEfFQB+0Vfjt/wAFtf8Aks/w+/7ADf8ApTJX7E1+O3/Bbb/ks3w//wCxfb/0okoA+H/gV8YNZ+AvxY8N+OtDY/bNJuVleDdhbiE8SxN7OhZfbII5Ff0h/Df4gaP8U/AuheLdBuVutI1i0ju7eQddrAHafRgcgjsQRX8vuea/Ur/gjn+1D9mvNQ+Cuv3n7ucyaj4dMrHh8Fri2X6gGUD/AK6e1AH6umvzw/al/wCCuPhj4dnW/C/w30m613xZayTWUmo6lCYLSzlUhSwRvnlIO/ghcFRnI4r9Dz0Nfjz/AMFfP2Vh4L8Z2vxg8PWezR/EEottbjiTiC+xlZjjoJVBz/toSeXFAHwB4/8AH2v/ABQ8Xap4o8UalNq+ualKZri6nOWYnoAOgUDAAHAAAFc7RmigAooooAKKKKAO8+Fv/MT/AO2X/s9FHwt/5if/AGy/9nooAw/iH/yP3iX/ALCd1/6NaufroPiH/wAj94l/7Cd1/wCjWrn6ACiiigD3b9iT4G/8NCftLeDfCtxbfaNFW6/tDVgysU+xwfvJEYjlRJtEQP8AekWv6McV+RH/AASO8SfCf4P6L408b+N/H3hnw74l1KVNIsrPVNRjguIrRAssj7WYfLI5jHTrB71+iX/DZvwI/wCiv+C//B3B/wDFUAcD/wAFJfjSPgv+yf4rmgm8rV/EKjw/YY3Bt86sJWBHKssImcH+8o9a/n7zX3r/AMFaP2mdB+NvxL8K+G/BuvWfiDwx4fsXuJL3TbnzYJrudhuGVO1tiRpgjoZHHrXwVQB2en/Gn4gaTY29lZeN/ENnZ26CKG3g1OZI40AwFVQ2AAOwqf8A4Xz8Sf8Aof8AxN/4Np//AIquFooA9x+Cn7V3xA+HPxZ8J+Jb/wAYeINV0/TdSgnu7C41OV0uIA48yNgzEYZcjkd6/os03UrbWNOtb+yuI7uyuokngnibKSRsoZWB7ggg5r+WLNftt/wT/wD23Ph5J+y/4X0jx94/0Pw74j0DfpLQ63qMUEs0MeDDIqsQdojZUB/6ZmgD6C/bP+Ci/H79m7xn4UjiD6m1obzTSSFxdQ/vIhuPQErtPsxr+dfRY2j12wVlKsLmMFSMEHeOK/oyP7ZnwHIwfi/4LI/7Ddv/APFV+Hn7Xui+EPD/AO1R4iuvBPiLSvEPhTU9QTVra80q7S4hi81t8sZZeFKyb/l7KVoA/oh07/kH23/XJf5CqXirwtpPjfw3qega7Yx6lo2pQPa3dnNnZNEwwynGDgivJ7H9sr4Ex2VurfF/wYGWNQR/bUHBx/vVP/w2b8CP+iv+C/8Awdwf/FUAc/8A8O+f2dv+iUaH/wCRf/i6P+HfP7O3/RKND/8AIv8A8XXQf8Nm/Aj/AKK/4L/8HcH/AMVR/wANm/Aj/or/AIL/APB3B/8AFUAc/wD8O+f2dv8AolGh/wDkX/4uj/h3z+zt/wBEo0T/AMi//F10H/DZvwI/6K/4L/8AB3B/8VR/w2b8CP8Aor/gv/wdwf8AxVAH4N/tafB5vgT+0L418HrCYbG0vmlsMIyqbaT54wueSFDbc+qGqn7K3/JyPw1/7D1p/wCjBX1t/wAFbtb+GfxM8VeD/HfgPxv4c8Tag8D6VqdvpOpJczhV+eGQopIVBmRc+rCvj79nDWbDw78evAGp6neQadp1prVtNcXdy4SOJBICWZjwAPWgD+mCuZ+Inw28MfFnwtceG/F+jW+vaHcMjy2N1nY7Kdyk4IPBANef/wDDZvwI/wCiv+C//B3B/wDFUf8ADZvwI/6K/wCC/wDwdwf/ABVAHK6p/wAE7/2eL/Trq2T4YaRaPNE0a3EDSh4iQQGX5+o6j6V+Iv7Uv7Oeufsw/FzVfB+sKZrZWM+m34HyXdqSdjj3A4YdiDX7yf8ADZnwH/6K/wCC/wDwdwf/ABVfNv7dOr/s8ftWfCOewt/i54Ft/GOkq9zot8+swffx80DMGzsfAHscGgD8e/hZ8TNe+Dvj7RvGHhq9ey1fS51midGIDj+JG9VYZBHoa/ol/Zm/aE0L9pj4S6R4z0NxG8yCK/sSwL2dyAN8bfjyD3BBr+bOaEwTSRMVYoxUsjBlOOOCOCPcV9MfsF/td337KvxZhmvJJJ/BWtOltrNorfcXOFuFHTcmc+4yKAP6C6p6z/yB77/rhJ/6Ca8jj/bQ+A8kauPi/wCDQGAIDazAD+ILZFV9V/bJ+BUul3iJ8XvBjO0LqANagJJKn/aoA/ne8Yf8jdrn/X9P/wCjGpfB3i7VfAXirSfEWh3b2Or6XcpdWtwnVHU5H4diO4JpnimaO68TaxNC6ywyXkzpIpyGUuSCD9KyqAP6IP2L/wBr/QP2sfhvBqELw2Hi6wRY9Z0cN80UnTzEHUxt1B7dDyK+h6/mG+FvxX8VfBjxnY+KfB+rz6NrNm2VlhPyyL3R16Oh7qf54r9df2Zf+CungT4hWlno/wAUEXwN4jOIzqIBbTbhv72/rD6kP8o/vGgD7L+KvwP8CfG7R10zxx4X0/xFapzGbuL95Ef9hxhl69jivlPV/wDgj18B9QneW0fxHpwZyxjj1AOgz2XKZA/E19neG/F2h+MdMt9R0PV7HWLC4XfFcWNwsqOvqCpOa1u5oA+Svhx/wS3+APw61ZdR/wCEcu/Elwu0omu3ZniRgchggCjOR3yK+rtP0200ixgsrG1hsrOBAkVvbRiOONR0CqMAD2FTM20EngDua8v+L37T3ww+BWnSXXjPxlpmlOqeYlmJhLdSj/YhXLt+AoA9QJCjJwB1z6V+RX/BVP8AbjtvGstx8G/At/Hc6LbTBtf1K3fclzMhyLZCOCqNyx7sAP4a5L9sT/gqz4i+MNje+E/hnb3XhHwrMGjudTkbbqF6nQhSpxCh56EsQRyvIP5+FiSSTknrQAZr9Bv+CLP/ACcZ4p/7F2T/ANHxV+fNfcH/AASZ+J3hH4U/HfxHqfjLxLpfhfTptCeCO61a6S3jeTzoyFDMQCcAnHtQB+5Ffjt/wW2/5LN8P/8AsX2/9KJK/SP/AIbN+BH/AEV/wX/4O4P/AIqvyy/4K6/FbwZ8WPiv4JvvBfijSfFNna6I0M8+k3aXCRv58h2sVJwcEHHvQB8FVt+CfGWrfDzxfo3ibQrprLWNJu47y1nUn5ZEYMM+oOMEdwSO9YlFAH9Ln7OXxv0n9on4N+G/HekEImpW4+022eba5X5Zoj/uuGAPcYI4Nbvxb+F+ifGf4beIfBPiKDz9I1q1a2mwPmjPVJF/2kcK6+6ivx3/AOCVf7XOn/An4gar4J8Y6vBpPgjxCpuUvb2URwWV6i8OzHAVZEXaSe6x+pr9Uf8Ahs34Ef8ARX/Bf/g7g/8AiqAP59fjX8I9b+BXxQ8ReBvEMWzU9HuWhMiqQk8fWOVM8lHQqw9jXD1+oX/BVaT4M/GzwrpfxC8EfEbwlq3jTRdtld2Fjq0Mk99ZM3y7UDZZ43bPAztdv7or8vaACiiigAooooA7z4W/8xP/ALZf+z0UfC3/AJif/bL/ANnooAw/iH/yP3iX/sJ3X/o1q5+ug+If/I/eJf8AsJ3X/o1q5+gAooooAM0UUUAGTRRRQAUUUUAFGTRRQAUZoooAMmiiigAooooAKKKKADJozRRQAUUUUAFGTRRQAZoyfWiigAyaKKKADJooooAKM0UUAbfhbxx4j8DXpvPDfiDVPD92Rgz6XeyWzkf7yMDXpulfto/HTRoGhtvin4mKM24+ffNMc4x1fJrxeigD1LXv2p/jF4mEy6j8T/Fk8cxPmRJq88aNnqNqsBj2xivMJ7iW6meaaR5pXJZ5JGLMxPUknqaZRQAZooooAKMmiigAoyfWiigAooooAM5ooooAM0UUUAFFFFABRRRQB3nwt/5if/bL/wBnoo+Fv/MT/wC2X/s9FAGH8Q/+R+8S/wDYTuv/AEa1c/XQfEP/AJH7xL/2E7r/ANGtXP0AFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQB3nwt/5if/AGy/9noo+Fv/ADE/+2X/ALPRQBh/EP8A5H7xL/2E7r/0a1YG3PQGt/4h/wDI/eJf+wndf+jWr9Of+CJ/h3Std8L/ABXbUtMs9QaK804Ibq3SUrlLjONwOOgoA/KfafQ/lRtPofyr+oj/AIV/4X/6FvSP/AGL/wCJo/4V/wCF/wDoW9I/8AYv/iaAP5d9p9D+VG0+h/Kv6iP+Ff8Ahf8A6FvSP/AGL/4mj/hX/hf/AKFvSP8AwBi/+JoA/l32n0P5UbT6H8q/qI/4V/4X/wChb0j/AMAYv/iaP+Ff+F/+hb0j/wAAYv8A4mgD+XfafQ/lRtPofyr+oj/hX/hf/oW9I/8AAGL/AOJo/wCFf+F/+hb0j/wBi/8AiaAP5d9p9D+VG0+h/Kv6iP8AhX/hf/oW9I/8AYv/AImj/hX/AIX/AOhb0j/wBi/+JoA/l32n0P5UbT6H8q/qI/4V/wCF/wDoW9I/8AYv/iaP+Ff+F/8AoW9I/wDAGL/4mgD+XfafQ/lRtPofyr+oj/hX/hf/AKFvSP8AwBi/+Jo/4V/4X/6FvSP/AABi/wDiaAP5d9p9D+VG0+h/Kv6iP+Ff+F/+hb0j/wAAYv8A4mj/AIV/4X/6FvSP/AGL/wCJoA/l32n0P5UbT6H8q/qI/wCFf+F/+hb0j/wBi/8AiaP+Ff8Ahf8A6FvSP/AGL/4mgD+XfafQ/lRtPofyr+oj/hX/AIX/AOhb0j/wBi/+Jo/4V/4X/wChb0j/AMAYv/iaAP5d9p9D+VG0+h/Kv6iP+Ff+F/8AoW9I/wDAGL/4mj/hX/hf/oW9I/8AAGL/AOJoA/l32n0P5UbT6H8q/qI/4V/4X/6FvSP/AABi/wDiaP8AhX/hf/oW9I/8AYv/AImgD+XfafQ/lRtPofyr+oj/AIV/4X/6FvSP/AGL/wCJo/4V/wCF/wDoW9I/8AYv/iaAP5d9p9D+VG0+h/Kv6iP+Ff8Ahf8A6FvSP/AGL/4mj/hX/hf/AKFvSP8AwBi/+JoA/l32n0P5UbT6H8q/qI/4V/4X/wChb0j/AMAYv/iaP+Ff+F/+hb0j/wAAYv8A4mgD+XfafQ/lRtPofyr+oj/hX/hf/oW9I/8AAGL/AOJo/wCFf+F/+hb0j/wBi/8AiaAP5d9p9D+VG0+h/Kv6iP8AhX/hf/oW9I/8AYv/AImj/hX/AIX/AOhb0j/wBi/+JoA/l32n0P5UbT6H8q/qI/4V/wCF/wDoW9I/8AYv/iaP+Ff+F/8AoW9I/wDAGL/4mgD+XfafQ/lRtPofyr+oj/hX/hf/AKFvSP8AwBi/+Jo/4V/4X/6FvSP/AABi/wDiaAP5d9p9D+VG0+h/Kv6iP+Ff+F/+hb0j/wAAYv8A4mj/AIV/4X/6FvSP/AGL/wCJoA/l32n0P5UbT6H8q/qI/wCFf+F/+hb0j/wBi/8AiaP+Ff8Ahf8A6FvSP/AGL/4mgD+XfafQ/lRtPofyr+oj/hX/AIX/AOhb0j/wBi/+Jo/4V/4X/wChb0j/AMAYv/iaAP5d9p9D+VG0+h/Kv6iP+Ff+F/8AoW9I/wDAGL/4mj/hX/hf/oW9I/8AAGL/AOJoA/l32n0P5UbT6H8q/qI/4V/4X/6FvSP/AABi/wDiaP8AhX/hf/oW9I/8AYv/AImgD+XfafQ/lRtPofyr+oj/AIV/4X/6FvSP/AGL/wCJo/4V/wCF/wDoW9I/8AYv/iaAP5d9p9D+VGOK/qI/4V/4X/6FvSP/AABi/wDia/AP/gojZW2m/tm/E62tLeK1to72EJDAgRFH2WHoBwKAPLvhb/zE/wDtl/7PRR8Lf+Yn/wBsv/Z6KAMP4h/8j94l/wCwndf+jWr9Sf8Agh1/yK3xb/6/NN/9AuK/Lb4h/wDI/eJf+wndf+jWr9Sf+CHX/IrfFv8A6/NN/wDQLigD9P6KKKACimPKsSM7sERRksxwAPrXnOtftKfCjw5qU+n6r8SPC2nX0DbZbe51aBHQ+hBbIoA9Jorj/Cfxh8DePGK+G/F+h66wOCNP1CKY/wDjrGulv9Vs9LjWS9u4LRGO1WnlCAn0BNAFuisf/hMdB/6Denf+BSf40L4w0JyAus6exJwALpOT+dAGxRUckoiQu7KiKMszHAA+tecax+0v8JvD2oz2Gp/Erwrp99A2yW3uNXgR0b0ILZFAHpdFch4Q+L3gj4gEr4Z8XaLr7Djbp1/HMf8Ax0n1revfEOmaZP5N5qNpazY3eXPOqNj1wT7UAaNFY/8AwmOg/wDQb07/AMCk/wAaP+Ex0H/oN6d/4FJ/jQBsUVS/tqw+wfbvt1v9i/5+PNXy+uPvZx1pdP1ix1ZXNje294EwGNvKr7c9M4PFAFyqt/qVrpds1xe3MNnbrwZbiQRoM9Mk8VNNMkEbSSOsaLyXdsAfU1+V/wC3lrPjD9qL4p2HgG28beCvBvwu068VJ57zxdp/mTyA/NPNbrMZDt5Cx7c55IzjAB+omma/pmtGQadqNpf+Xjf9lnWTbnpnaTitCvHf2XvgL8P/ANn74Y2Oh+AFtby1lVZrvWo2SSbUZccyyOucj+6ucKOB3J9au7630+Bp7qeK3hXrJK4VR+JoAsUVQsNd07VZGSyv7W8dRuZYJlcgepANXmIUEk4A5JNAC0VnWniHTNQufs9rqNpcz4J8qGdXbA68A1o0AFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABX89X/AAUe/wCT1/il/wBf0H/pLDX9Ctfz1f8ABR7/AJPX+KX/AF/Qf+ksNAHlHwt/5if/AGy/9noo+Fv/ADE/+2X/ALPRQBh/EP8A5H7xL/2E7r/0a1fqT/wQ6/5Fb4t/9fmm/wDoFxX5bfEP/kfvEv8A2E7r/wBGtX6k/wDBDr/kVvi3/wBfmm/+gXFAH6f0UUUAfj9/wVk/a18Tax8VJfgx4W1G80vQtJiiGsJZyGNtRuZow4iZlOWiWORRs4BZm3A7VNWPhp/wRO8Ta54ZgvfG/wAQ7Pwrq8ypJ/Zmnad/aHkgqCUkkMsa71JKkJuXjIYivENZuX1D/gqzA1wfNP8AwtS2iO/n5V1FFA57YAFfvOBigD8yfBn/AARjbwF458N+JLP4rjUn0jUre/NtcaD5AkEUqvtDC4fBO0849K6P/gtkP+LA+Bz/ANTOv/pLcV9H+OP27PhH8O/jIfhdrWrX0PjAXVtZ/ZYtPlePzJ1Roh5gG3BEi89s184f8Fs/+SAeB/8AsZ1/9JLigD5P/Zd/4Jear+0z8HdM8e2vjyz0OG+mmhFlNYPKyeW5TJYMBzjNe0eH/wDgilrmi67p1+3xO06dbS5jnMf9lyDdtYNjO/2ryL9lX/gqTP8AsxfBjS/ACfDaPxGtjNPN/aDa2bYv5jl8eX9nfGM/3jX0d8G/+CxFx8WPiz4N8FN8KItLXxDq9rpZvR4hMpg86VY9+z7Mu7G7OMjOOooAof8ABZ/42+JPC+meCvh/oupT6bpOtw3V5qv2d2ja5RCiJCWB5jO9yykYJC+hFeZ/BD/gjje/FD4V+GvF2tfEyPw/da5ZRahHp9po/wBsWKGVA8eZDPHlirAkBeCcZNfU/wDwU9/Y41/9pjwToPiDwXGt34t8MecF01nWP7dbS7S6qxH+sVkUqCwGC46kV8A/AP8A4KE/Gj9j9ovAviDSTrGhaW3lt4c8SW8lreWS5JKRSYDx5zwHVwOwFAH1/wDB3/gj7F8IPiz4P8bQ/FV9Wbw/qtvqRsn0AQeeInDbN4uW25xjODXX/trf8E2tU/aw+McPja08bWfh6GPSoNO+yT2TzMTG8jbshh18zp7V6l+yt/wUD+Gn7VNyuj6ZJceG/GIjMjaBqpUPKAMsYJAdsoA5I4bAJ24BNfTm2gD+e79tT9iu9/Y31DwnaXvii38SnX4rmVWt7VoPJ8kxjByxznzP0r2v4Ff8Ek9Y+N3wj8MeOrf4h2Wlw63a/aVs5dOd2i+ZlwWDjP3fSvQP+C43/Iy/CH/r01P/ANDtq+5v2BBn9jr4Wf8AYK/9qyUAfPn7RfwMm/Zz/wCCXmv+AbrVIdam0sITewxGJX33YfhSTjG6uG/4IeAHwj8Wjjn7dp3/AKLnr6X/AOCm4x+xb4//ANy3/wDR6V80/wDBDv8A5FD4s/8AX9p3/ouegDyD/gpj+1H4x+MXx1n+C3gy8u08O6bcR6dLYac+Dqt84AYOVb50XcFCHAyGJBwCOq8K/wDBEfxDqHg2K71/4l2Oj+JpIi50u20trm3jfGVRp/NU9eGKoQOcbq8Q/Z20xNe/4KfwC4d/3PjjULkFSOWjuJWUHPbIFfu/t96APwY+FHxL+KX/AATW/aVk8K69K50lbiOPVtJ8xzY39q5GLmDcByBkrIFBypUjqtfpR/wU5v7XWv2G/E9/ZyLcWd0bG4glUcOjSoysM+oINfHX/BbXw7Y2HxY+HmsQQJHfahpFxFcSgfNIIpV2ZPt5jfnX0H+1lqMurf8ABKfSbqckyvo2jgk9eDGv9KAPzJ/Y5/aEvv2Z/jt4f8XRvJ/Y0kn2PVYAxCzWjkB8gcErwwznBUV/Q7daraa74Nm1GwnW5sbzT2uIJk+7JG8e5WHsQQa/DrwT+znN8Zv+Ce+qeL9Jt2uPEXgjXrm4VEBLS2LpGZ0AB5IIV+hPykcV9i/8Epv2mh8Qfglrnwt1m53a34Ws5ZdPLnmaxYH5RxyUY47nDD0oA+Xf+CWQH/DedyMDAstVx+dft7X4hf8ABLL/AJPzuv8Ary1X+dft7QAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFfz1f8FHv+T1/il/1/Qf+ksNf0K1/PV/wUe/5PX+KX/X9B/6Sw0AeUfC3/mJ/wDbL/2eij4W/wDMT/7Zf+z0UAYfxD/5H7xL/wBhO6/9GtX6k/8ABDr/AJFb4t/9fmm/+gXFflt8Q/8AkfvEv/YTuv8A0a1fqT/wQ6/5Fb4t/wDX5pv/AKBcUAfp/RRRQB+CnxveD4I/8FO77WfEbNBp2meO7PxBcyxKWItXniu9wHc7H6eoIr947O9gv7SC6tZ4rm2nRZYp4XDpIjAFWVhwQQQQR1zXxX/wUF/4J7j9qhrLxd4RvrbSPH1hB9ldbvIttRgBJVHYAlHUscPg5BIIPylfh/w58B/27PhFar4f8NR+MbTSLTMcFvputRtaKCckxoZcDJ9hQAz9r7n/AIKsv/2MOgf+iLSvqv8A4LZ/8kA8D/8AYzr/AOklxXy58Nv2Hf2n/HH7QHh3x1488O3z3UOsWV7qGra/qcTyyRwuncO7HaiBQMYwoFfd/wDwU4/Z08b/ALSnwl8LaF4FsIdQ1Cx1wXs6TTrEFi+zypnJ93XigDO/4JbeDPD+sfsceF7q/wBD069uWvL0NNcWiSOf37dyM19c23gHwzY3MVzbeHdKguImDxyxWUaujA5BBC8EGvx68H/sXfts/D7QodF8Ma9qvh/R4WZ47HTfEzQQozHLEIrAAk8muq8Ofs1/t3WviDTJr/xp4iksY7qJp0bxZIwaMOCwI3c8ZoA/Xnp/KuB+LXwG+H/x00RtL8deFNO8RW+xkjkuYR58GRgmKZcPG3ujA186f8FC/h7+0J4yfwVffArWdU04aet2NVttL1Y2T3DMYTDlchXA2SdTxu96+L5tE/4KIG3a1b/hNAGXbvTULbd+DiTIPvmgDwT9o/4bW/7Jf7Zd1ongfVbiOHQ9Ss77TJjMHuLUuEkVGbA5Uk4zzt25ySa/oURiyKxBUkZ2nqPavyQ/Zc/4Jc/Ebxd8U7Hx/wDHScWtlDdrqNzpl1ci7v8AUplO4LO2SqoSBuO5iRkDHUfrhigD8mf+C43/ACMvwh/69NT/APQ7avub9gP/AJM6+Fn/AGCv/aslfPv/AAVG/ZK+JH7Tet/Dy48B6Xb6jFo9tfJdme5WHY0jQlAM9c7G/KvqX9kn4f618Kv2cfAfhPxFbpa63pVh5F1FHIHVX8xzgMOvBFAHm/8AwU3/AOTLfH/+5b/+j0r5p/4Id/8AIofFn/r+07/0XPX2H+3D8LfEXxp/Zo8W+EPCtrHea5qCwi3hlkEattlVj8x6cA14n/wS7/Zf8f8A7Mvh34g2njzToNOm1e6s5bQQXCzb1jSUNnHTl1oA/PXw5rL/AAB/4KXS33iWYaPbWXjad7yV13iO2nmZgx68FJVOeozX71xTJPEkkTLJG4DK6HIYHoQe4r4O/wCCgf8AwTkf9pHVo/HfgO5tNL8cJEsN5aXZKQaii/dbcM7JFGRnB3DAOMA18caX8E/28/BejDwvpK+ObXR4B5EMFlrsfkogzxGfO+VTnoMUAX/+CwvxNt/H37R+ieEdMMd23hnTxbStA+5vtM7hmiIxwyhU9fvV9fftseHX8I/8ExbbRpYngnstK0iGWKQEMkgMW8EHoQ2a8a/Y4/4JXeJ7H4haf8QPjVLb4s51vodA837TLczg7g1y/K4DclQW3Hv6/aH7d3wk8S/HD9mnxJ4Q8JWsd7rl7LbtDDLKI1ISVWb5jx0FAHz9/wAEcLODUv2X/EtpdRLPbT61NFLE4yro0ShlI7gg4r4k+NXhXW/+Cdv7ah1TQom/sGSR73TlIIjuLCfKy25wAPlyy4HTC1+lH/BNb9n/AMZ/s5/BXVvD3jexh0/VLjVnuo44ZxKDGUUA5HuDU3/BRP8AZIuP2pfhJAvh63gbxvoc/n6a0zBBNG3EsJbHQjkdsgUAfnd/wSmvYtR/bma7g3eTPp2pyoHGDtbBGffBFfuHX5X/APBPD9hL4u/s/wD7SFn4t8ZaLaWOix6Zd2zSw3iSsHdQFG0fSv1QoAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACv56v+Cj3/J6/xS/6/oP/AElhr+hWv56v+Cj3/J6/xS/6/oP/AElhoA8o+Fv/ADE/+2X/ALPRR8Lf+Yn/ANsv/Z6KAMP4h/8AI/eJf+wndf8Ao1q/Un/gh1/yK3xb/wCvzTf/AEC4r8tviH/yP3iX/sJ3X/o1q/Un/gh1/wAit8W/+vzTf/QLigD9P6KKKAGlc0uKWigBMA0YpaKACkxS0UAJijFLRQAmBS0UUAJijA5paKAE2ijFLRQAm0UYpaKAECgUY5paKAExRtFLRQAm0UtFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAV/PV/wAFHv8Ak9f4pf8AX9B/6Sw1/QrX89X/AAUe/wCT1/il/wBf0H/pLDQB5R8Lf+Yn/wBsv/Z6KPhb/wAxP/tl/wCz0UAYfxD/AOR+8S/9hO6/9GtX6k/8EOv+RW+Lf/X5pv8A6BcV+W3xD/5H7xL/ANhO6/8ARrV+pP8AwQ6/5Fb4t/8AX5pv/oFxQB+n9FFFAHxB+1D/AMFQ/D/7Nfxa1jwBP4J1TWdS02OCRruO4jSF/MjWQYBOeFbHI6j0ryax/wCC3nhtrpBefDXVUts/O0F7EzgewOB+tfJ3/BUoBv25fFykZBi04HP/AF6xV+xWtfshfBXxBYyWd78L/DDQSfeEGnJC34MgDD8DQBwv7Mn/AAUF+Ff7T18mj6PeXGgeKWDMuhawFjmlAyf3TAlZDhSSFOQOor1b4+/GWw/Z/wDhLr/j7VNPutUsNHjSSW0siolcNIqDG4gcbgefSvxb/b6/Z6g/Yw/aO0W/8AXN5puj30UetaO5kJewuI5SHiR+rBWCMCecOAc4yf0d/bK8aP8AEn/gmlrHi2aOOCbXfDul6nJDE2UjeZ7eRlB9AWI/CgDyv/h9v8Of+ie+KP8Av7bf/F0f8PuPhx/0T3xT/wB/bb/4uvI/+COvwe8EfFTT/iu3jDwtpfiQ2Muli2OpWyzeSHW737c9M7Vz9BX6Of8ADIXwV/6Jf4Y/8F0f+FAHcfDXxzb/ABM+HnhrxbZ2s1na67p1vqUVtcEGSJJYw4VsEjIDdjiuL/ac/aJ0r9l/4V3PjnWtKvdYsYLmG2NrYMiykyNtB+cgYFemaPpFl4f0qz0zTrWKx0+ziWC3toF2pFGowqqB0AAAAr47/wCCuQx+xvq//YUsf/RwoA9i/ZO/ar0X9rbwLqXijQtE1DQ7Wxv2sGh1Fo2d2CK+4bCRj5gOfSvcK/Pj/gi1z+zj4o/7GOT/ANERV+g9ABXxB8eP+CrXgL4EfFfX/Al54S17W73RpEhnvLGSAQs5RXIXcwPG4A+4NfYvjHxRZ+C/Ces6/qE0dvZaZaS3c0srbUVUUsST6cV+Ff7IPwvuv2xf2i/iFqOrQB4rzSdX1S735l8mW4V0hCk9dskq474WgD9d/wBkr9r7wt+154T1nWfDthe6PNpN2trdafqBQyoGXckmUJG1sOB3+Q+1e71+Lv8AwR8+JV34B/aR134f6j9pgj8Q2MsX2Q4VI7y2JfLg85CLKgx3av2ioAaXABJ4FfC/7Rn/AAVn+HPwb8Ral4a8MaZc+OtcsWeGaa1kWKyinU4MZlOS2OQSgIBBHUV7r+258Srj4Tfst/ELxDZXT2eoppzWtnOgyUmlIjQ/m1fmN/wSl/ZR8J/H7xd4q8VeOLBNd0fw6IYoNNnYiOW5l3MHkA5YKqNxnqRnI4IB6Npv/BcHWjexf2h8K7BbPP7w22rOZAP9kNGAfxr9Hv2d/jfYftEfCTRPHmm6bc6TZ6mH22l2ytIhRypyVJHUVJ/wzh8J/JWL/hWXg8oowB/YVrn89ma6/wALeEtF8EaLDo/h/TLXRtKgyYrOyiEcSZOThRwOaAPEf2uv20PC37IGleH7rX9LvdcuNZnkihstOkjWVVRcmQhyPlyQOO5rzP8AZy/4KieBf2jPivpngPT/AAtrWg3+oRytDdajLAYiyIW2fKxOTjAr4Z/4Kj+Orj41ftk6d4E06Uzw6Glvo0SeSQyXMzK0vP8AEPmj59jXJftJ+Fp/2Nf269F1DTVgtrXTZdM1S1aOLbF5YjSOTgdclJCfrQB+8lfG3xl/4KaeDvgx8dJ/hhqHhDXb/U4rm3tftttJCIWMu3BAZgcDd6dq+vNH1e11/SLHU7GQTWV7BHcwSjo8bqGU/iCK/DL9u/8A5SK33/YW03+cdAH7s1X1K9XTdOurx1LpbxPKVXqQoJwPyqxiszxV/wAixrH/AF5zf+gGgD5S/Zy/4KUeEf2kPjGnw70jwjrmk6i0VxL9rvZITEBCMkYViea2v2x/299C/Y+1zw/pOqeF9R1+51m1luopLOaNEjCNtw245ySe1fm7/wAEsv8Ak+2L/rz1T+Rr0/8A4Le8fEn4Zf8AYJuf/RwoA72P/gt5oPmL5nw01EJn5tt9HnHtxXunwD/4KnfCD43+I4PD919v8E6vdSCK0j1wIIbhj0AlQlQSTgBsEmrP7Gn7OPwt8afsk/DO/wBc+H3hzU7++0OJrm7uNOiaaViTlmfG7PvnNfEf/BU39jLwf+z+3hrxx8PrF9E0rVbh7O80uN2aKCZV3LJGWJKhucjJ5GRjpQB+zQbIB4we9eV/tL/tE6D+zB8K7vxz4hs7vULOG4itY7Sy2+bNJISAAWIA4DHJ9K4P/gnr8WtT+Mv7KHg3XNaaSbVLZJNMnuZWDNOYHMYkOAOSAK+O/wDgth8VT5ngL4d20pChZdZvFWTIOT5cSsvthyPrQB6n4I/4LI/Dnxp4y0Pw+PBXiLTm1S9hslu7iW3McJkcIGbD5wCRmv0B3jr29a/AL9rf9m+4+AXw4+BWvQ6TJo91rOgCXUpWcF/7RD+Y2eeMI8eK/az9mH4mxfGL4BeBvFyMpl1DTITOqtnZMq7ZFJ9QymgDyD9sX/goLoX7IXi7RvDupeFNR1+81TTzqEc1rNHHGi+Y0YU7jnOUJ6dCK+dIv+C3mgmRfN+GmoiPPzFL6MnHtxXlf/BbTj47eAh/1Lf/ALdTV97/AAF/Zj+Evij4AeBZtV+HHhq8uLzQ7WS4nfTYhLIzRAsxcDdk565zQBzP7PX/AAVB+Efx78Rw+HpDfeDNduZPKtLbXAgjuTgYCyoSoYk4CkgnHFfXwbOK/FX/AIKj/seeFf2cta8K+Mvh7ay6NoutySQT6dG7PHaXMYVleNiSVDBumTgoSDzgfpf+wr8Wrz42fsteBfE2pStcaobVrK7nf70s0DmJnP8AvFM/jQB77RRRQAUUUUAFFFFABRRRQAUUUUAFFFFABX89X/BR7/k9f4pf9f0H/pLDX9Ctfz1f8FHv+T1/il/1/Qf+ksNAHlHwt/5if/bL/wBnoo+Fv/MT/wC2X/s9FAGH8Q/+R+8S/wDYTuv/AEa1fqT/AMEOv+RW+Lf/AF+ab/6BcV+W3xD/AOR+8S/9hO6/9GtX6k/8EOv+RW+Lf/X5pv8A6BcUAfp/RRRQB+C3/BUn/k+jxb/1y03/ANJYa/emvwV/4KluI/25PF7scKsOnE/QWsVfpvq3/BU/9mrTbCa4g8fTapKi5W0tNFvhLJ7KZIUXP1YUAfJH/BcORT4o+EiBlLrZ6kxUHkAvb4OPwP617X8X0aL/AII+2QdSrf8ACJaUcMOxkgwfyNfAX7Tfxm17/gob+1Fo1v4O0C7SGdY9F0LS3O6Yxh2d55tpKoTuZnIO1EQZOFLH9Pv24PBkPw5/4Jz+I/ClvO11BoWhadpcc7KEMqwyQRhyB0J25x70Aflp+xf8Avjh8bbbxc/we8Zz+Eo9Ne0XVFh1y407zzIJvKJ8n7+3ZJ16buOpr6ag/YO/bYSeNn+MV6yBgWH/AAmuocjPPauJ/wCCVn7VPwy/ZqsfiXH8RPETaE+sSac1iq2Nxc+aIhc+Z/qkbbjzE+9jOeOhr71/4emfs0f9FBl/8El//wDGKAPqHRbaez0ewgunMlzFbxpK5YtucKAxz3yc818ef8Fc/wDkzfWP+wpY/wDo4V9deEvFGm+OPDGk+IdGuDd6RqtrFe2c5RkMkMihkbawBGQQcEA18i/8Fcjn9jfV/wDsKWP/AKOFAHF/8EWf+TcfFP8A2Mcn/oiGv0Gr8hv+CZ/7anwm/Zv+DGu+H/HmvXGl6pda095FFDp89wGiMUag7kUgcqeOtfYNt/wVS/ZyvLmKCLxhetLK4RB/Y10MknA/5Z0AVP8Agql8Wf8AhWf7JWuWEE7Qaj4pnj0SDEW4Mj5adSf4cxJIM+pFfC//AATW/az+EH7Kvhjxbc+NLnUh4k1q5iRBZ6eZhHbRqcfOD/EzEkf7Ird/4LPfFF/Enxl8IeALN2eHQtPN5OkU+5XuLhsKrIOA6rHweuJa+pPgd/wS3+B83we8HTeNfBk+p+K7jTIbjUrptTvbdjNIu8qY0mCqV3BOAPu+tAH5la/8avDXhb9t1/ih4A+0S+Gk8SxazbrfhondXZXnVx1ALtJ+GK/oU0zU7bWdOtb+ymS5srqJJ4JkOVkjZQysPYgg1+Mn/BUf9jLwV+zjp/gjxF8OtDOiaFfyz2F/G+oTXLNcYDxFRKzEDasmcHHA4r9EP+CdfxXPxc/ZK8FX087T6jpMTaLdswA+eDCoOP8ApmY6AOQ/4KxqT+xT4pwMgahp2f8AwJSvFf8AgiI6/wDCt/iaoYbxqtoSueQDE+P5GvtL9rP4W3Hxn/Z08eeELGKObU7/AEyT7Ekudv2hRuj6An7wHavyG/4Jz/th6b+yF8QvEmh+O7S9tvDWtFIb14YC01hdQsVDvH94gbnVlHzDrg4xQB+61ZXijxDbeFPDeq61eMqWun2st1KzsFG1FLHnt0r53/4eX/s1eUJP+FoWu0jOP7Lv935eRmvN/wBvr9qbwxq/7C+qeIfBOspqdh4ykGjWFy0EsPnIzET4WRVZSEV+oFAH5l/AD43eE7T9smD4r/Ei61OLSI9Vutbzbp9pm84lmgjYHJKglQfQKOleof8ABSv9pv4VftRX3g/XfAlzqD61pqTWd4l7YGANCxDI24nkhgRj3r0X/gmJ+wx4B+P/AMOfE/jH4leHZtbsjfLY6SqajNbqNi5mYiF1bOWQDccdeO9e+ftT/wDBMX4N6D8AfGmr/D7wdc6b4t02xa9spItSu7kuY/mZNkkrKdyg8447YoA9o/4JvfFiT4s/sk+D7q6knn1DSA+jXMtwylpGhOFYY7bGQDPPy1+Yv7d//KRW+/7C2m/zjr2v/gij8Vk0/wAV+Ovh5cywRjUYI9WtFdj5kkkfyOqjpjYwY/SvCv8AgoJqVvov/BQHWdQu3MdraahYXErgElUQRsxwOvANAH7yVl+Kv+RY1j/rzm/9ANfK5/4Ktfs3A/8AI43x/wC4Ld//ABuvRvhb+1p8NP2mPD/i6HwBrM+qvpdi73QmspbfYGRguPMUZ6HpQB+Vn/BLL/k+2L/rz1T+Rr1D/gt9/wAlJ+GX/YJuf/RwrzD/AIJZcft2xf8AXpqn8jXp/wDwW85+JPwy/wCwTc/+jhQB9/8A7Bv/ACZ18Jf+wFD/ADNfO/8AwWdcL+zj4eUsAza6mATyf3bVH+yf/wAFCvgD8Lv2Zvh94Y8R+PPsXiDSNIjt7yxXSL6VkkGcqHWAofqGx718cf8ABQ39tyy/bB1/w34W8C6Tfjw1pU5aB7qHF1qF3JhBtjUnC9Aq5LEnJA6UAfoD/wAEk+P2L9AH/UU1D/0ea/Mv9rv4saJ8Wf26ta1vX7kP4P0/WYLCR442kD2VuwVgEHJLBW49TX6gfCzw7P8AsPf8E9LmTVnlt9a0nRrjUrlSdxhvrjJVBwOFkdBjrwa/Or/gmr+y/oH7VPxe8UXfj7Tn1jwxpdkZ7mATTQeddTP8hEkTKQRhyRnnIoA9X/b+/bR+Bv7S/wAB7Lw14Tl1GPxDo97Dcab9r0xo0WIKUeMOT8uV2/8AfAr2f/gi98VV8QfBvxP4DuJ1N14e1D7XbxDqLefkn/v4Hr1bxD/wSp/Z3vPD+p2+leCJLDVJbWWO0um1m/cQzFCEfaZiDhsHBBBx0r88v+CY3jq7+Cv7aMfhPUWnih1oXOhXMPCqJ0JaNnz6GNgP9+gDvf8Agtr/AMl38Bf9i3/7dTV+ov7M3/JvXw5/7AFn/wCilr8uv+C2nPx28Bdv+Kb/APbqavq34J/8FIf2d/BPwU8G6NqvxA8rVtN0e2trmzTR792WVIwGQMINpOQRndj3oA5P/gtTJCvwE8Ho+3zm13KZHOBC2cfmK9J/4JMqy/sWeGS3Q6hqBH/gS9fnd+39+2TF+2p468K+HfAuiaiPD+lSNFYRXMQ+2ahdzFVLCNC2B8qKq5J6njOB+uX7H/wdm+Av7OXgnwZeIkep2dmJb9YzlRcykySgHv8AMxFAHs1FFFABRRRQAUUUUAFFFFABRRRQAUUUUAFfz1f8FHv+T1/il/1/Qf8ApLDX9Ctfz1f8FHv+T1/il/1/Qf8ApLDQB5R8Lf8AmJ/9sv8A2eij4W/8xP8A7Zf+z0UAYfxD/wCR+8S/9hO6/wDRrV+pP/BDr/kVvi3/ANfmm/8AoFxX5bfEP/kfvEv/AGE7r/0a1fqT/wAEOv8AkVvi3/1+ab/6BcUAfp/RRRQB8pftA/8ABNv4VftHeP8AU/GfiK516x1/UIoopZ9NvFRR5aBFKo6MAdqjtj2rzHSP+CL/AMFNO1GG4ufEHjLVIEOWtLm9t0jk9iY4FYfgwr77ooA8n+CP7K3ws/Z0S5PgDwhZ6Jc3IKzXzM9xdup25Qzys0mzKg7N23POM10/xc+FGg/G34eav4L8TRzzaHqiIlylvKYnIV1cYYcjlRXY0UAfFY/4JFfs9j/mFa2f+4tLS/8ADor9nrH/ACCtb/8ABtLX2nRQBh+CfB2nfD/wdonhnSFkTS9Hs4bC1WVy7iKNAigseScAc1zHx0+BXhf9ojwDP4O8XxXM2izTx3DpaTmFyyNuX5hzjNeh0UAfFn/Dor9nvH/IK1s/9xaWpbX/AIJJ/s/Wd1DcRaXrYkidZFJ1aU8g5FfZ1FAHzH8Rf+Cdnwe+K3xWvviF4lsNUvvEN7cxXU5XUZI4maNVVBsUjAARRgV9N7aWigDzv46/AXwj+0X4Dl8I+NLKS80l547gGCQxyxuhyCjjlc8g46gkVlfs8/syeDP2YtA1PRfBC6hDpt/cLdSQXt204WQLtyu7pkYz9BXrNFADdvvXzF+0L/wTn+Df7RmsXOu6vpV34e8TXLK1xrOgTCCafH99GVomJ6Fyhbgc8V9P0UAfnx/w5R+Df/Q4eOv/AALs/wD5Fr2rXv8Agnj8KfFHwn8HfDvVRrd54d8LGV7FP7RZHaSQ5eSQqAC3J7ADPAr6dooA4f4N/Bvwx8B/h/p3g3wjZGx0WxLsiu2+R2ZiWZ2PLMc9T2Arr7+wg1OwubO5Tzba4jaGVD0ZWBBH5E1ZooA+aPg7/wAE9vhJ8CPiNbeNvB1pquna1biRE3ag8kRSQEMhQ8FcHGPYVW+MP/BOX4OfHL4gal4y8U2Gqz63qGzz3t9RkiT5VCjCjgcCvqCigD4s/wCHRX7PX/QK1v8A8G0tevfAL9jH4b/s2R+IU8FWt/bLrsAt7z7XePPlRnG3d0PzGvdaKAPm/wCC/wCwH8J/gL8SV8c+FLLUoNfWOaMSXN+8seJRh/lPFX/2mv2I/h5+1dqWj3/jNtVivNKgktraTTboRYRzuOQVIJz3xX0DRQB+fcP/AARV+DUcyO/i3xxKisCY2u7QBhnkHFsDg+1fRPwT/YY+C3wA1aPWPCXg2BNcjUKuqajNJeXCEZ+aMyswiJycmMLmve6KAPP/AI4/BDw5+0H4Cn8H+KzenRJ5o55Y7G6a3aQoSQrMvJXJyR04HpWH+zv+y54D/Ze0PVNK8C2Vza2+p3C3Ny93ctO7sF2j5m6ADsK9cooAK+YNc/4JzfBvX/i5L8SJtO1OHxNJqq6yZLfUJEi+0LIJMhBwBuHTpX0/RQB87ftM/sLfDj9q3xBpeteMn1aDUtOs2sYJtNuxF+7Ls4ypVgSGYnOPrmvBrT/gix8GLe6jll8U+NrqNTloZby0CuPQlbYH8iK/QKigDwv4JfsS/Bv9nzUhqng3wbbW2tbQv9q30sl5crwQSjys3lk552bQfSvcwvvS0UAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFfz1f8FHv+T1/il/1/Qf+ksNf0K1/PV/wUe/5PX+KX/X9B/6Sw0AeUfC3/mJ/9sv/AGeij4W/8xP/ALZf+z0UAYfxD/5H7xL/ANhO6/8ARrV+pP8AwQ748K/Fv/r803/0C4r8tviH/wAj94l/7Cd1/wCjWrsfg3+018Sf2f7bVLfwF4muPD8OpvHJdrCit5rIGCk7gem9vzoA/pXor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EKK/nv/wCHkP7RP/RRr7/vzF/8TR/w8h/aJ/6KNff9+Yv/AImgD+hCiv57/wDh5D+0T/0Ua+/78xf/ABNH/DyH9on/AKKNff8AfmL/AOJoA/oQor+e/wD4eQ/tE/8ARRr7/vzF/wDE0f8ADyH9on/oo19/35i/+JoA/oQor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EKK/nv/wCHkP7RP/RRr7/vzF/8TR/w8h/aJ/6KNff9+Yv/AImgD+hCiv57/wDh5D+0T/0Ua+/78xf/ABNH/DyH9on/AKKNff8AfmL/AOJoA/oQor+e/wD4eQ/tE/8ARRr7/vzF/wDE0f8ADyH9on/oo19/35i/+JoA/oQor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EKK/nv/wCHkP7RP/RRr7/vzF/8TR/w8h/aJ/6KNff9+Yv/AImgD+hCiv57/wDh5D+0T/0Ua+/78xf/ABNH/DyH9on/AKKNff8AfmL/AOJoA/oQor+e/wD4eQ/tE/8ARRr7/vzF/wDE0f8ADyH9on/oo19/35i/+JoA/oQor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EKK/nv/wCHkP7RP/RRr7/vzF/8TR/w8h/aJ/6KNff9+Yv/AImgD+hCiv57/wDh5D+0T/0Ua+/78xf/ABNH/DyH9on/AKKNff8AfmL/AOJoA/oQor+e/wD4eQ/tE/8ARRr7/vzF/wDE0f8ADyH9on/oo19/35i/+JoA/oQor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EKK/nv/wCHkP7RP/RRr7/vzF/8TR/w8h/aJ/6KNff9+Yv/AImgD+hCiv57/wDh5D+0T/0Ua+/78xf/ABNH/DyH9on/AKKNff8AfmL/AOJoA/oQor+e/wD4eQ/tE/8ARRr7/vzF/wDE0f8ADyH9on/oo19/35i/+JoA/oQor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EKK/nv/wCHkP7RP/RRr7/vzF/8TR/w8h/aJ/6KNff9+Yv/AImgD+hCiv57/wDh5D+0T/0Ua+/78xf/ABNH/DyH9on/AKKNff8AfmL/AOJoA/oQor+e/wD4eQ/tE/8ARRr7/vzF/wDE0f8ADyH9on/oo19/35i/+JoA/oQor+e//h5D+0T/ANFGvv8AvzF/8TR/w8h/aJ/6KNff9+Yv/iaAP6EK/nq/4KPc/tr/ABS/6/oP/SWGpf8Ah5D+0R/0Ua+/78xf/E14T8QPiBr3xS8Yal4p8T376pruousl1dyABpGChQSBx0UD8KANr4W/8xP/ALZf+z0UfC3/AJif/bL/ANnooAw/iH/yP3iX/sJ3X/o1q9M/Z5/Y9+JX7UNnrd14C06yvodHkiiuzd30duVaQOUwGPP3G6V5n8Q/+R+8S/8AYTuv/RrV+pP/AAQ858LfFv8A6/NN/wDQLigD5g/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xo/4dJftF/8AQv6P/wCDmD/Gv3eooA/CH/h0l+0X/wBC/o//AIOYP8aP+HSX7Rf/AEL+j/8Ag5g/xr93qKAPwh/4dJftF/8AQv6P/wCDmD/Gj/h0l+0X/wBC/o//AIOYP8a/d6igD8If+HSX7Rf/AEL+j/8Ag5g/xr5h+Kvwu1/4MfEDWPBnieCG213SZFjuooJllRWZFcYZeDwwr+nyv56/+Cjx/wCM1/il/wBf0P8A6Sw0AeT/AAt/5if/AGy/9noo+Fv/ADE/+2X/ALPRQBh/EP8A5H7xL/2E7r/0a1fqT/wQ6/5Fb4t/9fmm/wDoFxX5bfEP/kfvEv8A2E7r/wBGtX6k/wDBDr/kVvi3/wBfmm/+gXFAH6f0UUUAFFfPniD9uH4eeGv2j7X4JXdvrZ8Y3Fxb2ySR2kZtN80ayJmQyBsbWGfl6+tbH7SH7YPw1/ZY06ym8b6pP/aF8C1npGmwefdzqpAZguQqqM/edlBwcZIxQB7XRXwPF/wWi+Bkku1tA8dRL/fbTbQj9Lon9K+x/hJ8VdC+NXw20Txx4cec6Hq8LT25u4/KlUK7IwZcnBDIw6kcdaAOxor40+KH/BWP4D/DPxTdaFHc654vntXMU114bs4prZZASGUSSyxh8Y+8m5TkYJrt/wBnX/goN8H/ANpjXf7A8OanfaR4icFodI163W3nuFAyTGVd0Yj+6G3YBOMAmgD6UopM147+0X+1p8N/2XNGtr3xzq8kN3eZ+x6TYxefeXWPvFUyAFGfvOVXtnOBQB7HRXwroH/BZH4Dazq9vZXNl4w0WCWQRtf3+mQGCIE43t5U7vtHU4Un2r7W8M+KNJ8Z+H9P1zQ9Qg1TSL+FZ7W8tn3Ryo3Qg/06joeaANSivkL4z/8ABUv4H/BfxheeGbi61nxVqdk7Q3h8N2kc8VvKDhozJJLGrMO+wsAcgnIIrsv2bv29vhL+1Fq8ui+FdSvdN8RIjSro2uQLb3M0ajLNHtd0fA5KqxYAE4wM0AfRdFct8S/if4Y+D3gvUfFnjDV4dE0GwTdNdzgnknCqqgEsxPAVQST0FfG5/wCCzXwJGo/Zv7I8amLft+1/2bbeVjP3sfad2O/3c+1AH3jRXH/C/wCLnhH4z+CLTxd4N1u31vQLncFuosrsZfvJIrAMjDurAHkHoQa8U+MX/BR34DfBmaW0vfGCeJNVjYK+n+GUF8684OZARECMcqZAw9KAPpuiuM+DnxX0b44fDPQfHPh+K7h0fWoWnto7+NY5godkO5VZgDlT0Jrs6ACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACv56v+Cj3/ACev8Uv+v6D/ANJYa/oVr+er/go9/wAnr/FL/r+g/wDSWGgDyj4W/wDMT/7Zf+z0UfC3/mJ/9sv/AGeigDD+If8AyP3iX/sJ3X/o1q/Un/gh1/yK3xb/AOvzTf8A0C4r8tviH/yP3iX/ALCd1/6Nav1J/wCCHX/IrfFv/r803/0C4oA/T+iiigD8hPi7/wApoNDzz/xN9I/9Ioapf8FSLNPBn7cPw98YeMdGl1vwI1np7yWxQNHdwW907XNsM8ElWyQe0oq78Xf+U0Oif9hfSP8A0ihr9Svij8JPCHxn8LTeHfGmg2mv6TLz5N0mTG3Z0bqjD+8CDQB4T8F9U/ZP/aN0CGz8HeHfAWpKY13aBc6LbQ3MQUBtpt3QEheOVDKCODVf9vfWbX9n/wDYe8ZWngmwtPDVt5EWlWdppcKW8NtHczqkvlqgAU7ZJDx3Oa+Lv25P+Cb2j/s0+AdR+Lfwz8TajptlpFzA0+lXUpaSASzRxRtBMMN8rupIbJ5znjFdR8QPi74j/aS/4JFarr+vPLqOv6HqdtYX162C90IbqDEzcdfLlTcepKsx60Adz/wS/wD2Ofhtr37OVp478Z+ENF8Yax4kup3ibWrJLpLa3ikaJURJAyqS6SMWABIKg9K8U/4Kj/ATw9+zP8TPhz8SPhnp0Hg57ydjLb6Sot4YLq3MbxSxRqAEJBbIXAygOMkk/Zv/AASp8U6f4g/Yt8I2VlOJbjRbq9sLxB1jlNw8wB/4BMh/H2r5x/4LdeI7KW1+FnhpJVfU3mu75owwykeEjUsOoDMWwe+xvSgD9K/h/wCKE8ceA/DfiNFCx6xpttqCqvQCWJZMf+PV+Sfxy0ux+Mv/AAV2tfCvjZE1Hw9b6hY2EVlcnEbwLapMsJB6q0jtkd9xFfqt8ENAufCfwX8AaJeKUu9M8P6fZTKwwQ8dtGjD81NfOn7YH/BO7Qv2mvF9n430fxJdeCfHNrCkP9oQR+ZDOEOY3dQQwdckBlYHB5zgYANf9u34AeAfEH7Jnjt38LaXZ3PhvQ57/Srizs44pLN4E3qsbBcop2BSowCvFfMP7Gfxh13wp/wS3+KGp295OL/w5JqNvpc+/cbYPDGyBQegV5HbA/vGovj9+xB8avCHwP8AG+veMf2lda8T6Fo+jXN0+jym4Ed1sjJETb5iMNgDGD1rlP2U9JutQ/4JRfHQQRF/9KvpR7rHbwM+PoBQB2n/AASJ/Zo8BeNPhT4h+Ifinw9p3ijWZ9XfTLcavax3CWiRRo7NGHBwzmbBPXC4GMnPmH/BQn4a6R+yh+1x8M/Gvw2sLXww2oGO+FhYRCK3jnhmVWZY1wFDqwBUYBweOTn6Z/4IxaxZXP7L2uabFcxyX9p4luJZ7dW+eNJIIPLYj0bY+P8AdNeF/wDBY3U7fU/j38ItHtX8/Ura0d5LeMZdRJcRhOBzzsbH0oA0P+CyXjC68SfED4T+AIbyaHTp1a+uLcfcaSSRIon+qqZB/wACr7Zj/YS+DFt8H/8AhBB4A0K4hWwNt/aUljGL1pjHtNx54G8SE87g2R0HAxXwZ/wV30uXQv2ifhDrV2ypZyWSJuz90w3CF8/g4r9av7Ys30b+1Ip0msDb/aVnRsq8e3cGB9COaAPyt/4JAX+reHPiz8Y/hdcXQl0i2t3llAHzfaIbj7PuU9gVdsj2HpU37f8A+wv8Kf2d/wBmPU/FHhvTL258VyatAsms6heySSsssxLDywREvplUBxVL/gkxqUXiL9rb4161Zh5NPvbS5nim2naVkv1dOemSOcV9H/8ABXgg/seah/2F7L/0ZQB6T/wTp/5Mq+Ff/YOl/wDSmWvo+vnD/gnScfsVfCvP/QPl/wDSmWvo+gAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAr+er/AIKPf8nr/FL/AK/oP/SWGv6Fa/nq/wCCj3/J6/xS/wCv6D/0lhoA8o+Fv/MT/wC2X/s9FHwt/wCYn/2y/wDZ6KAMP4h/8j94l/7Cd1/6Nav1J/4Idf8AIrfFv/r803/0C4r8tviH/wAj94l/7Cd1/wCjWr9Sf+CHX/IrfFv/AK/NN/8AQLigD9P6KKKAPgfx7+xD8QfEn/BQ/TfjbaTaSvhC3v7C5dJLgi52Q28cb4TbjOVOOa6f9tP4K/tN/ED4kabq3wV+IDeG/DqaVHbXOmjU2tAblZZWaXAUg7keMZ/2K+0aKAPyY8QfsJ/tkfG+G38N/En4l28nhV5Y3nW51ZrqNSg+V/JVV3sOvJ681+gXwt/ZY8H/AA1/Zzj+Dnktqnh2axntNQkmwsl4027zpGI6EljjH3QFA6V7LRQB+T1z/wAE2f2jfgH4o1VfgX8SRD4fvzuLf2i1hOVDHYsihSrMBj5hiuw+BP8AwTH8feKfjDZ/En9onxania9sZo5l01blrt7xotvlCaVgAIhjlAOcY6E5/TGigBMV8c/td/CH9pzxT8U9N8RfBTx/DougxadHbzaLc3hhiNwHkLSlSrK2VdB/wCvseigD8sfGv7H/AO2p8f4Y/DnxE+IWl2nhW4KrdxwX2+JgGDBmhjRfMIIBGT2r7y+A37Nfhj4FfAyz+GVnENT0ryJU1CW4QA38ko/eu4HHI+UDsAB2r1yigD8qta/4JrfHj4BfEbVdV/Z48epY6FqJP7qe/a1njiDBlhlyrLKAc4brj3Jrt/2Zv+CbfjpfjZafFr4+eKo/EviCwnW5t7GO4a6aaaMARPLKwGVXAIQDqozxwf0eooA+ef20P2P9F/a7+HMWj3N2uj+I9Ncz6Tq2zcIXIwyOByY24yB6AjpXw1H+xH+2vb+ED4Ai+ItsvgrYbMQDXHCfZiCpTbs3bdp+5mv1rooA+cP2MP2OtP8A2RPhnqOj2+pDWfEuruJ9S1QJ5aM6qRGka9Qi5PXkkn2r4x+L/wCwx+2B8YItW0fX/iLa634XuL1riHTL/WHaIKHJiyuzqBj6V+rtFAH5pfs1fshftZ/B7xn4Fs9Q+IcMfw60a+ia60S01Z2iNqHLSRrHswQcnj3r9LaKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACv56v+Cj3/ACev8Uv+v6D/ANJYa/oVr+er/go9/wAnr/FL/r+g/wDSWGgDyj4W/wDMT/7Zf+z0UfC3/mJ/9sv/AGeigDD+If8AyP3iX/sJ3X/o1q/Un/gh2ceFvi3n/n903/0C4r8tviH/AMj94l/7Cd1/6NavrX/gnr+3P4U/Y/0fxtZ+JNA1nWpNdntJYW0sRERiJZQwbe69fMGMZ6GgD906K/Oj/h9p8Lv+hE8Xfla//HqP+H2nwu/6ETxd+Vr/APHqAP0Xor86P+H2nwu/6ETxd+Vr/wDHqP8Ah9p8Lv8AoRPF35Wv/wAeoA/Reivzo/4fafC7/oRPF35Wv/x6j/h9p8Lv+hE8Xfla/wDx6gD9F6K/Oj/h9p8Lv+hE8Xfla/8Ax6j/AIfafC7/AKETxd+Vr/8AHqAP0Xor86P+H2nwu/6ETxd+Vr/8eo/4fafC7/oRPF35Wv8A8eoA/Reivzo/4fafC7/oRPF35Wv/AMeo/wCH2nwu/wChE8Xfla//AB6gD9F6K/Oj/h9p8Lv+hE8Xfla//HqP+H2nwu/6ETxd+Vr/APHqAP0Xor86P+H2nwu/6ETxd+Vr/wDHqP8Ah9p8Lv8AoRPF35Wv/wAeoA/Reivzo/4fafC7/oRPF35Wv/x6j/h9p8Lv+hE8Xfla/wDx6gD9F6K/Oj/h9p8Lv+hE8Xfla/8Ax6j/AIfafC7/AKETxd+Vr/8AHqAP0Xor86P+H2nwu/6ETxd+Vr/8eo/4fafC7/oRPF35Wv8A8eoA/Reivzo/4fafC7/oRPF35Wv/AMeo/wCH2nwu/wChE8Xfla//AB6gD9F6K/Oj/h9p8Lv+hE8Xfla//HqP+H2nwu/6ETxd+Vr/APHqAP0Xor86P+H2nwu/6ETxd+Vr/wDHqP8Ah9p8Lv8AoRPF35Wv/wAeoA/Reivzo/4fafC7/oRPF35Wv/x6j/h9p8Lv+hE8Xfla/wDx6gD9F6K/Oj/h9p8Lv+hE8Xfla/8Ax6j/AIfafC7/AKETxd+Vr/8AHqAP0Xor86P+H2nwu/6ETxd+Vr/8eo/4fafC7/oRPF35Wv8A8eoA/Reivzo/4fafC7/oRPF35Wv/AMeo/wCH2nwu/wChE8Xfla//AB6gD9F6K/Oj/h9p8Lv+hE8Xfla//HqP+H2nwu/6ETxd+Vr/APHqAP0Xor86P+H2nwu/6ETxd+Vr/wDHqP8Ah9p8Lv8AoRPF35Wv/wAeoA/Reivzo/4fafC7/oRPF35Wv/x6j/h9p8Lv+hE8Xfla/wDx6gD9F6K/Oj/h9p8Lv+hE8Xfla/8Ax6j/AIfafC7/AKETxd+Vr/8AHqAP0Xor86P+H2nwu/6ETxd+Vr/8eo/4fafC7/oRPF35Wv8A8eoA/Reivzo/4fafC7/oRPF35Wv/AMeo/wCH2nwu/wChE8Xfla//AB6gD9F6K/Oj/h9p8Lv+hE8Xfla//HqP+H2nwu/6ETxd+Vr/APHqAP0Xr+er/go8P+M1/il/1/Qf+ksNff3/AA+0+F3/AEIni78rX/49X5jftU/F/Tfj18f/ABj490iyutO07WriOaG2vdvnIFhRCG2kjOUJ4PSgDD+Fv/MT/wC2X/s9FHwt/wCYn/2y/wDZ6KAMP4h/8j94l/7Cd1/6NaufoooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigDvPhb/AMxP/tl/7PRRRQB//9k='
\ No newline at end of file
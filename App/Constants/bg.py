@@ -1 +0,0 @@
-BACKGROUND = 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABQAAAALQCAYAAADPfd1WAAAAAXNSR0IArs4c6QAAIABJREFUeF7svdlybUmSHQYgq1omVhX1IopGfRlbarH1DaJmDp9L06PUZJtazUxAFuHh7svnvXGAm/dmAmlpFzhn7xh89hUeEc//5F/+T29P8PP8/Ix/Pb094d9PT69v5nF8Nf39zb4ennl5fn56vtekGd/z84tr8+2JGnzb/z2/PD9p889PT2/r+fU/DeytmQ+Na1GgHiB9x9+v9p930/jG/n1/tvq0BPEtD+QK9CN2aSuW3ou2XYtrrEqLPUzk/zPR8O3Qk/pR+tJgzpwT7tNs6+/xlTXM3Xox3FxGeGy1GJJ8aKOrHSPhu8MzUvh9fcac57FlvUSOjioBD6DsMB8tfSfdmPTL67OV/4Q3ntdmOna2LHU6BmhP2uEGeK4qQ4vCL04fLPUODyoRFn7VNJ/ps9hf6Pfbkt7BPi37sV4PdGM+slCrnKnOPD+9PL+k3ZNaI72pPdHH57en16ObpJ9HFzt6ZvSy6mEJ6XQlo/Lbay/vwTzfUY9v8KzVj3sdbu4MMug1/F4Pw9NLHgYGbPs3KcE0qNImPD+9beOIsp03JvZdvra2hGiJto/txOv+/MWp0yu7Wmffrc5kOuF0qvHtE1m8v9pkel02jV0y6yy25D0G/M2BAuhwz7pZulZ8JX57x0PgZxKb8fZ6PRhD/078hVgBbWprR67FBxMvPuN7jQDq1r3rmOIX/l7oNRnQJGbk0Sz69/7zUaoQP61ETBFPFwOcSBX8OcbfuTRrf2QjnrYt2Jq95aqTHzAaj5IieZ95X0fYvX5qXvD+wXX2n1ODenwxP0CbdsVtbOkog9TnJxt/uxhw519dADHJ2jK36/3MZlH0bufOGu3zwDxvY+/B8d32Q5oVSL9d3qK2N+PxPL/VZ59/hpBtu0CJzSG/Zf3BHGjK55+ff0qF0+dR4lWCsKkPXDN5fX4241v9bzt2xMjqs8pW6ZU4/i7iijF3Mw1nMgPTT/wY6XCU600Pk/PndqrDHzTXru1Dqz9X4ncR8qSP/f4cY/TWq7fBXbzBolTbr8FuXskPWzzr6OehI9nTo48U7O3/Of/a3+z2dMSGvyG+4xg3n4focDHN99DH0/v5CwCsA953AYAnqPbMI2caWeZ7vyfsbwewUwDAO20LACat/94BQAkgTzpzjAaHDiZx9eRDw/DuGA4lgA2CGt3vDwBUORYZF7pA5MHR56YLaoPO8QsAHABATG54UQNAQErOEAQfAsovADBo6RcAeMFwtQDgUu8ORab2rR2NwbBKLgbTr09PzwsA1ASB27oHAPIcM/24Dnh5SvnE7/cEAGokQ7xkQIsXKQwo8AUACjm+AEC7Bv4FAObw1QWrTHa1AdA+GwAky/kFAP4uAUAM68G9Rm+q8WkGAC79ZzAxAvrvBQBVe94W4NgAKHvREX4iaAxffo8A4LBgR366jnEEk8po9AUAbrgf7SiUBQEAeGJcKShzAKCQ3+M/9wFAD0FkeHvnOzzg/AUAPlgBGFd4gPkH9PMmBhlkFPACYu+ZSwksAoAgEqE9l3jtfMhWUH4vFYA6o1acW+O2oaqhApBaZ6SfKr4ooQE+DpWJ90DbC/OB6rnvCwBkWqnB22tEhgD8R4DAz8S/AMArFYAslwzgcxXuBv0cCGgqkL8qAK/mTqT5puL91qtkNX7XFYB7QZQq6odyEQEAZSHMlsmnAOAzVXc8BgDa8N5X4N/juH369woAmjAW5J/tkoKATXGQkPL3XQG4K5iqAIIr3IoH1mtfFYBfFYCVDfsIANDXf4a+zEJvyE6+KgDbCqphwfZUxX+PFYCSCUCiJmULxp5pMcO3AQARzeP6tdzACtjnqyQrhfouAcA+gpkq+L4AwA4cVf1UW8pVous9rP47ObHDk+L6DMriPQDwCvg3YRHfJQD47iB8bdHze8xMtcJJ8ASToJBJAJ/FwoWgtwGYGrB0nGGro004SLxqtoS86SYImG7ZhvlGhNg5nRf7xPcGAHayMRm3FABcH4LO6+yJLpzQSwUgw1YFC7NS+Ovy7BtVcIwHOQKARrxie0E/zBb4u1uAfQLM290bBdqvoJG1AOCBXFOSbR40K3hxu19sZtrGsvGfR7YA8wpctgXYDIf17vx7Eue1BbgM4M8WZKKgBf7MdmA8guALALyufl8A4DValRWADAAOIA4f7yALKdYH2a103ga+BwC0PthOcgyjrtEE65pPk7+XCkDDPQOAHxvVxkQRJJjA48sM+eAHv8UW4Nd9kEMjoeADsuktAHAK+t9Plh98C/AtOXwflfr4bModqM86BZ3H9L4KQIh6XYCEixp0ugPtMuh+avn72gL8I20Bzrj8UmwBZnmQVJMPmogJp4gOyRYe6/O2j8zgFEYrAEHajoKVEhi2AOO7/QFe5MfOET7nNZcdW7H/7gDA5ye7pTPJ/+JhZGZOXwBgLlkslYwDiFycLcCMPejxS8eWG8TvmfClcgFv2B59OOWLoQyXEyyjiwc+fAswnTGT/RwSTQjG4OPq9sVsuBas012Algd5GDjYGO4+d6gbRH8GQ2fgN+u7Q7DcWYE5FfsIASvVENikyOJsMeSGXbUKGWSrAHcBQAIwCgKOZ7ToGYy2QuRqYDTxJlYAIo1p1JRgKu30TKvNvxcCaDIzsd5fAdj7RZwrDtn7LIIt0ItlmMemo/YFq8aAu2RstRMBwDVqAMHjnnFzZlSvGVvAh/DQy5c9M+O+flsOvk5n0G16Av3ChBojXJwBmEs72p0q8M9BwDaAPvyx230VDFRZye1hzn9FLOgMn4LLk2k8NqZvYEgeHqjA290PZ9I+UuE3uKavCsBNoDZkFv5wYgnhPr0dAhjWR9WhWxWAhmnsYOsYhR5/P4SC0r1beT0h4/5Czz/SYXl6wd/GDx0fOMQmE3xw9wzASeZXAKnB8DmDTegHdunYlV77D+2nVZppUJ/0/TcBAHdFN0jhsGvDi8Mkue+PTUh+pzMAo31F+Y5+0LM63QLMk3L6sCMXOSvsML2twJ7PSH1EdPZMTX7hW6viAPvcrCP1KNszzBcHX18T66Y88vLBdnoZ5l1/fc72zIJcjpvb+MXkBxrXTnaLZzwfOV/RmD63Y+OarxMDv70c/On3dwag0pekrzLB1RmA9JJ6TpGbkCtF6dBtuZZHWkyhBoDlu9KRyf5NuoXv24XI439RALN4eBfQgFyDQq1PCd88+pYQ+fYZgB6wNwoSbe+e305kCz05+W1uYVb+6XXojsV8ozM6Gyf0a58ByLNBl8Ms2+gC5JdE3SOzJ76bAMCeWgt8rhNYll3+l8coMpvI492CpIe3AOcJPJDqwVW4dYlH+ZM6fyvo+5IRacAeWE4KOmW5kxPvAIQFIPUm6o6BinTwJxa45IIBQAYRdgPwTLK69z0CgKVz2qs3vYHyW4B96CXwlcgS04f+XfTonA8ZcH2i5XYyEdpyfEaFXRtDo2YqHDJqJpQ4AJS/bI4PA4BXQznyRKQP6jB7gObwoDQAa4WlN7FonxhkDuH3jQrAmr/eTmR2w8qWRl5Vq3pIN2/91aQsAiUZGFMDgGT3vgDAOwGNfXZzc9r6GoLrC6s+V4f0q18Cwv6kcdEnQOUEgUyd2qkQsJhqQ2pXAMDTzfbb1SUgfiiBP17XphTiKjPOcwYApMFb/+F8tElRYyXljI318YnavxO4DpeATLPNAUB8Cy8N07Mf63Z/J1uAQXZFF+QoB6WOd0UUvR4ZnUJVR2RO/t4r4XLsRBljZEcoxBjESIcbjL+EQPJlChesrQAAUC1PP7v6kgiNqUI8MCnB+X71/EJX/hQ/U+5wsaOuh+4Io/cAgFytDbJJNiiPZ5b/ixyAjOu3AAByLL6LBeRqQMOV2k53MuB9QWT0p1wCAt3gDrgsz2kBQFjA4/mTbSP+k9jk/lZti+ZvGXjxIQBgG99H24sj9pc4BFn/VQBAHQVVAPPffnS8GIm5gpOxCQB0FZJqd6/Yrt8AAIhKcc5EtIiAje+mS/mQaqsdfD5yj55eQwgchlhA3rsZH2xePnoJyKMA4BTgTgBBTMAiAAgqrme87e2FwxZgWgMdDrK5GoDnCjMBgL2aZckEiJEBAI/Yys1ELFq2B3sJ9HwL8LeoAPwcANDzDcAZAMqmCiJSYE1rewOZH35vOCAVaydhMwKS3DLkE0gbluyCQi3QgDlWq1LNdj8vixSfOwPYxuN8ac2RvV2hWL/A27GbJ35gAJCNewMI4Bbgcx4ar8hzAGW3wceAMgcANXIzCVfC4DF5HCowpvLYSb+mMOPXrwDsR2hB50PNyelNk+bvvwsA8NpgmQ409SOn28RBlXOVaK5LQFyysXH/fULAfAEJ+n8FFa6N+/ZTDADCiz0AaEPCg8rTh1ew4m6BddHN2Nf5FuBpvhEAzN6Ag9/HOfw+AECkkgEAA0AM0nqMs0As1RY0aDxPt32b+ndvirLtn9bHPFoBuADAEAPzJAoAsCtaDy6svCVWjCgGSP12m0TUd/xbBqh9biDmblK65vtHKwB308wAAf/gyBEDnnhO0QJljBHUvvMOGo52TLXUhXn/+hWAzEM9+4sujlCiTTpUL5HHeM2T5CMBwO1SnA3xAJsH4DsAMAMsCPzTbyz2Zt942zGtruDvN52IMf9BRC9IDdi3Ln93xyv8OBWASkcFAD1ERBRb+GR1VBb7oZqg1n6xvRpzAmnwxwcA/R0ru+QKio48DSMAqALt7b0HAE/IB9SznBG6Ox3O+NJg3mryl2x8FgCot6jWEBdXn1RPbIPQbaFNKzDs6W3xfSkdoHWdxsPQuHzUpaOV74sasTV+G4BH1dE2LLMZUpqVDZ+AxOo0R2c4+BL3zHTTC0huDc18tZEahiv8wRDB81ocECQKuJq0OVAQgc9v6Gr06vFZJ55tASZ69BxAAJAdrFdkFY/o8EPAzhWHR4Mrh8jSYusfI1/lkpj1VVHlaHmiAU8auJguToIAn9XafuTLbHGuLmHAAKIPkpoK6uMAwVmeX80Y2wSatmjHbYqZy8RWXeDPDTiwDDbTnQazudKg94YcSBYtAIjjQWZQBauVCv6Ltp6N/EqCMit7lX6w3ex78AnkbO8s7X0FiefMowBjFRxdCYY4mLYUyM7dPH6mjsTKb7z98SHDbJ/7TtX2okxPUuPahDMAyZ6zIq4v0II5vYFm1tY/TFRXBeC2s10Cnk5tkrDp+4FJ50wi0DLIhzKwK3gAk0BN52/F+ATGZwDAE1FIwdLMw4wSvGWHv8sXYPVokRHrbhcQZoXwW3CuoaZzu+TDLxwxgqp7wZ5ywqCJA97iHqzXSdjRH9pn0gL+YnreZuX2CV9mGeF/hevyUCwAiDGI8YwuVpjstwETEgBj4iRVAKrHis+jz634nduEXZk85Cd55ZyOorU2zKBmkj0AuCpM7BlntpZEYwPk9NYpuGis9IFnfCCdEFAQXaP/zXYu1BN8DAA8PuI0zzkV0YCAW0rwGcTFC+3I4Sh4gof/q5zEGM7PJWQ88EDUJ6fdR/+xjTyaQwlHvQ6H/pvhHPlADXECufxrtceK7Qk5Yt5wzdmY3p6ac5fl4GwRPeGiaZPWB/cP8+6ed475SbCwzoDaWJ8LLlSAgrde+VpVNLEKjLb61X6/1l+Mn2v7S/4YbRj/TvKr6auPrahNe4RYZftVaGT+Ro4KriwbMmzRGhfwhwylt5+Tfjk7vHiFoekT2wd87tgFmL/qh9Mnt5vFy/amP/inbi5I9zCrBBDMAMAYezw9Pf/pr/91Ewm2l2If62oosY2pgn+96+V96dUASJTvHXNMxNEW0UGjA/ChjRjQzuNIxdJRnm34vGJZExO3CBh3eQRAxyut7cfIcHSCsQOwMspmY0D/hvnvCor1XUUNoqXSNFYQjAocQA9LH0xQjeMSRaxToD2r/VInQbn7QbdigqJ9SQZQfAAAo0Nx5rjRrnFkPIyxDZQQ+9KmL1oDBwLGW+SPBCZyzVJvQQE/CzvYS5f0mCZAZlkgCg0QQ9jRB+aOj2nTVrsMJc8LKmcZx9DhsiyCPldLMbupdcaE553yT1qRxJJ5I9aqEyE5A9Q+ZIk1Jej9FtfMP6D8uBUFq1lh7NkKbAdRor3oCVF/uwD+1nokX6LcedsslhS+cBphAZ59CVVnf6eZdf6HZTNvgwOSyr/k9LVjneTH2FLjaajXOEJP8OO1ivOG2gqciXRhATCEVmMLfrRIUwan1IP52fLiQm0DrJ8ah1M84OSLB7kBVPT/zjcfc4ajs/7ejx+OFbg81F5Gex9JR0rU9L08iPRBXu1/pBU8RHxrKoKEO0GkHQTij7CzTc4k/mN2SvzW6zd/2+p5O0noEJ7bkpNUvBrvhOA/x3TngdXq4h+IYzuKyt93NsgCjJmd9f4fNTrTTx1iHxcgFboApfFNUgJccW46A9cDmhBbnbZZusSL7DMpceeP4WY48mLZAxndiS11tMkljXD8i9wW3nB9t1+Qr49DO1FSO/+6468FAJ5Cif0agFN4XI0DBKmHwcca4eSAEuLDNrtboQHCbxk983myPckAdqXn4nO8hMi06LeItg4fz1gk2ljJZSlTPVyXIEmOWVQ22Rii1oWMEgrOzfKw6LLPdJdH9QgesaGpLNagNlU4R7/PslPnXySH+Q5ENaQLH9H83/eDgwXam9wuk1+t/KaebIwZLWbOE0EcGv3tFoDIL/SLcMb+eBanTtU/RGNHH7R99AG0kT86S6IH6RHSD7f0Hppl+FDuTks/iNT1OVJWnGKqfNdEwAcvbefdM9v/fgwACDN6IwDQ2wkOfqIaWuHC75f56M/YUBMs74kROYmDWaFb4/I7uG1WiodSZvJDxQtgwJsEf7uWDdCJ+Ygp8NsvsQRfJJIixg4CnOFRXsdW54/80QQgaqmKthoPmf+ZdwsAcgB7hCGrOPJbuPgZov2wgvOOPe+dGyBN8QBgf8aLDRePOQA/f89d6egu2a7W4G311graUIVG3FUHhYFPpZNdtQK+rwMzFToG6GD99BSCIPVCdcgYhBdAptruBZCe8Tal1bWaWwdgAStPL69ja4URAXznTNLtYQgYzSUnCyCx6/zKW6ZBucJ7Hqjsz+EgrBD7IIMBQAyparw+hiK1b2AJu1LF2Or8APBnfEeZ0wCJemE/l8c8INsscgIA5m/09mqmT5egjLrjAQt0ssepXQMArY7jqLPw01rBI2WOPNwvxQfvtbJZAn2vrajRlmPhjE1n0yzAngfjc51uLyUqme65vaBZv5vJR6wocbxtFzyyvnoJGOV/5T/moXv869qn+b9HL0GCeUvcacYCgJQwcA8mTGR3Oi2aDJco3WbHFVE6z2xKxwzWtGDjObfUfADMfOFniNSAnpV+rEfiGd+en056TAwQAQAcFaUCXXQ+HR9UzBGGRGdE1zI9XiJgtGNnJCJRmMCSq1fgz9otstg6Xx1PuFUSbfGijRzRcCblqqViBa+jyQLIKxWcw59BmtcZ0msuP524n2P9xTfennq81bKVayALkDAL6ptwRT/ZFmmIvy6M37Qs9NTuqp6ZZCW8t6YICxDZBFYbdoF0sNWuuCC2GePDt5X/oj0pQUB86rqNvwYAwkjBnrG8M3/reGkAANeLIZchWqYAIOhIvITJ8v555aum7S6GyMaZPy96ufnh7JhZjO1lwoBRXrX3BvD+EPdq+/IxV7vC+bo0+AHo2InXKoj7jGngj/leOo8LdK9bnkHOww7S6w42o53/zPt3llGhCcvG0vVN798YAJgRgEh8EocCADQ+BSTIAIDnc3x254sMfo3uZblbFM9EWV7VAJ54wq4GjwDglP5YAJDAPxrTmpe9JdBOSEerAv2tAcCPSX6uKN2ZrXFii0A1AMirM2I33FlVnfGbRkQB2fRU8j0YsR2csvynAOApUVdr4YyXbz8irqY+M8k24hZE1CY8A5AH4fnQ06B2ymzMNeDiluST/fI3BgBN8HgAQAnyLcN5Jd5QAD3RBYCUAEA/c6IAyVhd5c0JwhcAmNhFEWOQr6TaxSYvixMWsNr+JlslvKT6Ubbja3WANurOBwCA2Rl9xgK0ARwnXTUx7p0BGNuZKtgnNhg7nSxIBTvuAUAMPNNqkis8nkZZfP8BAOA7e4bX+gSib58cboUPPDq2K/ox9YFnYgVOwhmePIdMnrowYDriYAQAGxAiJD1usvv7GwAg41jCrwcAQB1KrR/rm76+yVB9N2l5HmXT0pM9Y8Wh+7obaa5jyPjxCAC45/t2/P+WA7jF20xUq/BophBRrB2clRKY+JMNnQWBRt39JgBgVgEIACAAMlo+cvLLtkrzcQDQRx5hy3njczal4RKulE3NGZnr/Y8FALfBUKTl+fVpAgBRulT+fU5dW+FHAECSdAvA57IOMo3eaAOsnCE5W3LigKC/ASDv97dtANDIoO3HFPi4trdGpomm3v5O81U7xjxgOkxb4L8AwPdXKV0BAL3k8zvyLsSb69dfljyyz1/+909//T+3NrjFV4/TsCVsJJCPVQCqm+kqAL0wWmIcA+0OCecKQJZ7P3mvkP77/MiPnIRUwehNBiro27qFxFUUHmquxw7zotFhDq49/quXvH92UYThU79m/hsAXPzKAxUdqRo4PVOOPrtSAWgCBh9EBv7AKvG7E+MpLA9qk5RRn9k3FUIkQ1Au/T0AgDi1FgCkFY7FP9VV58i84AVlyA4JtwFin6C8Pb0IfcEqgbzSdGoT1SZpEjHY90Xa98ufCQDyWViQaLiMjLYAn/+d0SRDPVX89cGQvQXd8pfk91cAAL36HfJwsGHFruZ9ZcNvaf87KwBJ9e3KKMoVj1rmIoEWLijwGTO5/Z3nceU9F3hCo63unOfyCkuV56kCsALohKvhjCodYLb6G7xpc0bRTL9pC93cQjCJ7hVhO3/uCGZugd/PTEZ3HtPlJ74bAPDyiOODGwBsQ9h3N+7Pf73bUGZfzUjdJT7GLx23V2svjebXBgDvbAHGxINpuc+oNfb/DpV7+7e+nQFAKzvBvrSAPetrDgtUcXU3w8Dvof/HAECNuTDW8NsO2zyrK+AJ8aePLxEcKajyrQBA3Eq5BRIuqAjACckM8QrjVj+HrII0xgydPKB0bnvkEtCsAAbjoh3fcyrpOtopJuSfmef5WAAQ4uAd1yYA4LF71hPqyCSkl7l0FnLasZRQPixoaPv1YsqR6yTf0C2ufpwn2hX9YaDIxehytmIcK8VvmDtEWqh/yKsUyX5EztvKQxqTtP6dVQBO9jR8L0oFvAW527bwMysAy3DF8gEPbRN/CeM0n50/0Jf6Ao5t1QAA3Jz/01//L2301H25iEQ7HM5TWxjzQ0PrRAGdOBMAFL4ZQOuYmCAFwMRGkQ0kE3MlzCZoP/ohpstsCSEArgIoxltM9yHCZgeiOYRyG8GqyucQtDuoeg/9ZfFD3ZWYl008vOAgElrVQ3mUryjUKujH73t5fvmpDN+JDxXIRH1OW5KmcNI6VJqxWdUYAAI+wwdDQVHCd4D/i75dUn2rYiXZMsD00CpQ1jXisb9cgvlVhbhW9qP+5m5LrZjdIo9yytJHjqsyAxdOKQ36KdK8u7gGAIqxdQOJAId9wBwQnADadAZsvo1RbA4SX/T+yH+6wEDfnRDjUysA7SHRHAiBTW9uad2WEwGgvc0m8XCNErfOa1L+Tfpaso/5Ca3oG3gYuC7cBBunSueCLTxk+j0zQd9ZTbYOkNF1i3y7LYU5ACgTMocYp4QabumtgmqVA3vCm8q11PiXh5RfYf8te5o0OAEwLUA6VPdfGf9jz/Txi9AaRPNRej023uTtx3aAP702h5SfK6DaEsMJANd4gu01zMH5A2/v3w+MaR9jBeADDOktpzYssfb5CGnGl1S9d5xYQeSnwnF8bVnxzKZICMov+iN4+grkK/YZeHVcn08DTRUUTGb7z7YC08+P8jOqGLKx2n0AkMvdG7+1aCf+VTIPisdY9qdb3JsFojUNe8nLXWE+vnFXUaEhWWM9l1NIPALjh3w3LuDgGKh9y0+VCdaLbNS7i7NtT32evZCO3nPtQ8C+ZwEL/KdJ2x1WAJp8hfyuAoAcRzRaL7kqxhxePsTKHRmwCHKg1VBhLIvnKesz/eutlvFv5wirSv+kyxDX0xyJv8AQH6tvpUP6eB3hJYR8zPtTOdDN84falfikGGNev6sVgOq1klo/NrDdVrXhjNjef/LFO8pco+97R/68BThQT+Rcs0ey9fESEDzD14tY5p/1Ur7Dy0B3W1Fq7ZfVm+SwOjMEjt8z6cgqALe47KIFXZr6EADQCLk/Qy1x+s4C2c3XTpi6wICZVqt0XDHhhIaNrz+EcitMsS1ivwMKu91pY08UgS0c04cBgHn7Wz+xwgrvtDrj1jOIoiNXcVRDas8MvHLGSZ2AkoVah+82438HANhfm2L7wgROqiRxK9bdW4ABD+/Kn8tJj/01AZdvtAIAxQCg8DLQRrxm48MGuk/UuePsvBqvIPw3zSO9RXBtSxEgAlcwMxntD4nN6CzSvEXzowFA7FEBVRP0wiMEAOY6wv7VuLgkIVGq2KCeK6iUAzbAoPYfqwB8BADcZEgDoFI7Pv6LdwCAKu02mEfHylwFzYDSbuCIMO+GXgsVsgDXk6i2vxxA4Bse0HoIANwK3iM0mV3RccUVfG9Nsi0odyj5KKD1EAAoC3yVWPfJyuPK8L0AgHc4BrP2Oc87CPLaJJjUvD/D2XbS60e07WamPzgAeIfcSKcfBQAk7vVn8H00ABiTVbXfmb3e/rNUnwkABD8Euw2uVQBymcxwhhfEcRpXwqIux18VEvAtAMDNYwcA7jMAC3DmJgDoLAZsgZ2PL2C9wVxCuJYUh2Atzho9V8AiDGUiVAAAbT5NvncXJEh8OuRyoisWyMhnWZ+bhzGTAiqFtakKZE4pRyxQ6H0qbpkmeugCgFezGFd7TmPxgngT89AiP7XjwT/qTbObOO79yRUAMCk86G3WCcYTAAAgAElEQVT3RQDw0Kc5BGAfEVFRnDGYeiwDADgsgNhsCHqpAEDcC3kqAD8WAIy+xOJPld4wmGgptdi69xM5wVT7kMQffCTAeegLAHSHPFcAIPsnXHFbNIwVTMqkUgD5kd8BADieEfAFAFqt/qYAIBsIXa3g4I8PP1cAsHBAZtXQBwiJBjhEMSTQ4NBF52Ql7TcIAO4ANw+sUoAuAID+AADl048AAFoA5gqg5ZzgnSw0e/YDAEAFauN57WaVkB/EmswvADBwBQHA8gpI8aGqO2gvrorFrw8AdiOdEq6rs6ye+x4AwCuLiM08z4LteykxA4CYOER+/O4BwItnCP6oAGBfYXSO0KnAq9uJN1wIL2IHAOCJtXDRxBck2GTwewAANdnRIx2O09tTg8XejI6fDgCeGDgAgAjIQMKGR7JwLFYCsJn9hhhnuATEAyQRANYtxh7g41CDz6ArF/ILAFB2rvAlRgYEVJtop87zVaCjvsRhBgAJAcuAWLT2nY/0N0jP/tTvCOQFgFbFGbwLKRJfqkMyxsU2+JjgCcdWeB2xEJjt4AsA7CugfwwAsJJlBwgnl4lUBUZ73qKYVublSIBj9p7//C/zLcCY1Oz2KhjXg5bJdjbJe9IorcbVac5Vxwd3HrZZ+jMTbAUg3YJqWMAXZDjjLPM/K8Y8qnjGXzzxrpzBAgD5CD72Q2cwu790/ofg4kNL70MtQQUgPem3OCOFM4AFpQkvbSAB5RuCslFoRV0Vnl+41r7Z/rm3rLqKzGnLBjmVM55zCLWODs5KZLkbATlXws5B2umnll6jpTqEsb9I6UoCaO0qXmISE2V1xvbQ3NUyzcDeVknDpYDEzxD/9ise/tk32CLCRkafMeM0csCSTDSszsD0Uod0Uiwmcarwoq/i9RVL8ZIT2+u0BdicEeJpKed/wBjNrYNZQMPP8mz9tlp1LPsbdyu6GX2yBcLTNL/kRcvMqUKw/lH91fHK08aT5Zr03q1j0sclALCZwRmAjN4N0zhpFTrpXs3XYMdTEkIyUZJ48J9Qsbx1Gugxb8jut9BRe/mRIGw/SDhQn49tMeRwtJEpxRXVPE6pLeR05m8jumQDh1tYy7iJXRDMP/Y1JyzT+KbvB/En6w/kexQwNeN5B0CC72/vlAKAvdfFNvotwOrn9B3wT5cOLLBjEROgFqC1j9dnkkiPxIi9FNTace29TsaxIsmJ0g4gRH/aOL6iAt+iXMzgvNb7Hw8w4Jwn/XtOdjBYmk3nU4boyQzWxSa3AEA6G5wqqPhntedvDbVHV8jFY6Cbdqsbj4ls72q/k1G1Lxp3iEHZ5D1H3ogQudZGAPCK35wk/PBZUDKWVBwz09C31d8UnZ2vJi3JVKnNMMoEILRJP/g/CfvOL+dduYQCAiXkJ/EPDfwZyYm3ST+B5263SqzvsjpDffmZsWHK6Ov0JwUAjyJcOELD+q9cn3F0/tIUzo6j3ebqQJSLKGd2d2QiDaKfnMfovxwV2QpM1Oa9Bx629OP8ztvbPzKdp2iAvveXW+JhK+t7FVuUi6LtQX977Y25XYjXmiM8aKw0xpC3neFKhR+TUbZuU2Zptn8nU/Ttmi3AfHM4vmecJR8BhDZP9t5hPaL7nRqcvJM8BX3imf97yv/0r//XwAMWdlHPwsLXzNObpaLy28a6Crppiqul7hBiZLxfgaS58XlrOiYOSNIVywTcwS0AemjjVYW7+hw6cDb6e/Z7B+OVHzYmpOAwX1mZOE+EjMCYR2PMw2oFOCySORLRUk7enuESiHwWnYHwq0v2vEHxiKZh+wxuMWN10i2RW0GGBC+Mep1J0Fs1eCXh/xk2N+G3yN5LWFeAaq9JrMA/3fZBPZ8TQNh8smcwwZ4ekg7ydAYu/D8dqg2yfDHzgzNjUF5JhvKgoQs+taxehl9u7690iC7Jyc5euaJ1/Mzhc+KIVVSiObcBgFpDla+1gIHjAAU8kY89o9Tr8jlBtCFiBvz6meev89Zt+22tT7kttGeo9DS3wd7An0OqSVdv3yJn1xcgWHI2vBjePYBl9h+d/ep154L9lm0rHa2nMEXnEMJJA3aDDsuC5KCXIhCVQX4+Z2hRzz7uYQq0s3u5uvyQt0KV1vX42u01d0xQ8ex295Ug8AIADO+efDYLx0Lxy84ynQEC1usBnw+EWzMHmuGZPCAVxVtDfHMA9W4TlF+AdtY8xB/exk38WPa7YW/rD7mv7n21zzmJ0qKuxGVVtns6zsVvV/WjmKSr32I4gTvo3+l3Y29dLJf6TSCQqKIf9HFSoeJjm45khqdNop2N9rPdBrsZHisfuYMAIBpHWVA+2uG20KOsEE95fK7iS1Ao+4aN+877PsYBQk4LLPMm2+B1sHVnmyOt9RKFREsSUJt9jEQD8Br6H/V2sJh6FtwxJrP6r7mhFLoc/0Jt+9ucCRjR437UF0Xgmq0hSyk6jsxC8GeWZruv9ZEEXn0MQ/Pzz9DfJN91FBNtShwz2Q9luVSED7p7tN0VQCRz8cMDcihFz3uic0gzzPf9fBkAFGnKHa7JO+yAEokWwNB+Z72Y0ram/weEJ+GM6XDmfxeDAkA8+TK05KI7a3GiP+HgFMHATA0PgzUTtSaqxfYRd9o76l9/cfZI/yRpyD0cf2qOsPBFbRUAuO02HBQYQYOJtfYML1Ny5RQ2q6DzU6x62+6t2WN+bN5+XZmqo6Ebca0AewDQGGwAALkyiAEC6kTR+2soUG/84rzXWHkFj7zyHQCQqgrViOzf4O8QwGC5O02wAADPN2w0jaANRvouwIa6ZmhOCmX/92OOAZ1doQGVYoDgxviuyGPkadwCZcz/vuUZHFQS8FUJxpYWBABBp7VFOPvvGC8MCDmBEHfr7A0GIzLO7eDtCkpupmgLPc6PK8r0eZQf7ygnO2TlNQZY0/sroF8W6nMBQK+XOCo6C/G4iyMqSC8SB4xW+FsyViq+laO4do1KRqles8XXGRflE/b8Ke4tA+h7nk2AnrR8yNQ//45b5NzwNFDiL3qqTQm9bX72H7cXMAJ5u/HO/feLeN6fuHD+AFBsY7JFuYl/kx/WMziPJDobOYa3UwldK64nXqiM4373ipbNdix/gm9hLwaQbHG7J58ad1X9zwl6Pze6RV7tnz/SL54x27dnAblH5Xu+ZAgP6beVVjROr78eBBoBRBff+dmjr/ffBcApkK63j5O/ZamrQByOsatFKF6cmUGgiufDJSBnAgGElOwqykd2hmoncRh/e1+RbZ809mh33+vuVf9DtlXPLOa42L5/8g+I2OKlCTpbfdfGbbioFujl7V2oILL2sOf9o/o7v08Acm2jQ4WQcyiYXqC+0Ly0Aoq5/LJssqnoiRWeb+t79mMIwLpKe6vfNFfRqVRoOa/3oNR1/xNluqex3SGCsq6ns12N+Xx+SK1ZG5YVWFTumbiOuxDuHmexAFnYZ5FW6iGtk3jAODz2g17IkMa2ajRkSCkIafm7593GLNflYXoy8MMhcvUWc8U6cLzd2A1GdPLXKwBgHpOr7oYYEs8gdAAjjmG3awBAz4d695u6qNpermfSCsCtFr8RAJBJxoEOBh3Z+XS3AcAnAgjoh9XpqiGYHUxUve8HAGQHhUEkyg2Zqz6BeSRBJR+JSsB9YZ/W+Plg8nsGANfI5wrAJvjwZ1QmAOC+9dqt+iI/KUhQkCgGqVFCdYu1raYMCUZWmh0Q7YSXl0vag3u7XQH44wGAQOVziHOXZNszRiZ3nAQCwyvewn0BgI8BOnfPTJzsKwEo1U/cYhuebHVxfv/1TVc4A2W+AQDoK2LWoekuXDZTvp3gDwtIpwa3YMDzE1UkdDy6p7M+WCX+9yDCI1uAzYp2GOrd+CfO1SzA8i138NhdAND3gPKZU3rQ5wEgfhQA7Lk/V7Bh/8E/D8frxMqcEwVzHgoNdpWA+B3qFy28WdnHM7g/AgBE2ZeejjrQ35a/JvEdLqjj6aN2GXubAOxe09ctx6X2b/XpddfHaxVY9RkAIFMP8yK/0+QLAFQluQMAskzEW0RfnjYAeIjvz5jj3hj8U3nWQgDOiaJkfWsAkLdIrlFDbr0n8VsDAHmOmUVHC+D8TahQK/aN47lXKB/G+187l/ELAFQeRduscqo7Qh1PvwEAqHruAECs9iYA8H8Lem4AnY2QH8deRRuOCrEiSfDIEMzaCsDM1dXB7w5dhwpAC/hpgEKfx+CNbj3iCibdFnRsjtaYneTkJVwffwTgEkR+NwBe40UAkC4xnVbRcT55BSAItAFgPJCZjVdXUAz4x2wbzmmYEtQuwKXgpgAAJXDUKNavKNvVLpYFy/9pfEE6k1sFixDtOOlaBnbq5xKIDQCYoNiPQP/e0oL5XQIA7oq7BAB8Pc2weKm7jRwxI4CkIQPY/dv+3Zd9KOb5YcH1APsNANBsZUh8Yydf2wycCkC3U2B6LVp8qaa10iC2Nq3UsEcU7KDNJWWmAjCMap3Z2Q/VA4DD46Gx6fn3AYBAI7GjM5jEFn1iDvq3qYJs2uI29ZUnYOKep9cjR2/emjzZr4cBwHYbcPSvfkL2jKoDdbkEnHmUVQBunrcGtv0yxCNfACBw6IMqAAPPjYGf+NOryIu7RMxXxP0IACDOMHhzMOBsSyabC9FcenYv9tdVEM72tI9fMUzJuJyBwx4A9Mdv4AKIVqzdNqMo5OblGE11QQODJtf7nwDOaPBxC1gWVvzKAOCKdyXWr5YqELxh406fhTPaPdz5q1cAdrzFM8gLrbTkCQvQJj7D+PwoO54Itr3pOjYJWB5uETWXmaz0SDJgt3vLx5LEDyoGWCmGj1NpfvY8utm/W+pBtZvxAQ2NBeDy4BRn8HeD+pND68Znk07hAgNXUXYSEKuTrxb/HGpKBWDWy4CH7DM46wMmtEXk5cdUAM5x13Wb2GqYW+CI8WLng2iupDfUC/7O/Xo/tf6m/PfaFmAv4wxWXwMAd5av2sA2gJ19c8YhVz+W8QAvoJ/2hVJgZ57/8tf/e/AgnHdz8lyvCFRbHPyQuItoMKyduWdQMmZ6YcJkL1Y11v0hsdBWrRVn7pcNsvGAnBB9OgBINKYdgnUQjWcc7KcAaNim0NSge3pEAJACGEzQYW1mOQ+7RCpI6vWg9brhIB2xAOCzOMC8R65oI/Or4DabB68kV87Qkp4WNucN1jhxa8CwApX4i7v846GhUX/YzNH5APYMOFizN1t0NUDbAcDZDqIm0/LETKmtEpj0nQG2on02RA0AOAEcMZC5Ll84/4qNl9Tc2AQfWB2VDADgCbgwAQQAkMfTg6wXAEA4BoF9Tiey/Ax70yl9R/ubUV7tDyQJMrnab1Rc7MZuQuHzYLfNTfVgmmUtU7mHOZ2LfOv7U0KeBxt1/z3AN+nCFdC13obAC2w99fLt9cxHtH7Cvxsx/3SGpQ8o/RaMUb8f2gJMNro+RfAK/Sce9t+3C4jJ4p1JkK50DQqZycFcYdd34gHAK0PCZ0IFkq+oahab2PZ28j35p1DB5RrzC4BeHvst2XMF4F16+efbLVgcKTb6mphA7WK6ZZXjlFFJ61nOW7wid/WT47PQ6bgVt96XaoLajJAi1fSsv3bz6dnGdc5ckw5yj3S7AlCqiBLpPx/p3DHG5S+RijWVTLzBQQcQy1eW3q2Qv3bEQjU+G7tfqdS28o60Y+ANJcH6BlwA1kUx4OcmBp1ZzT/q31yeAcdZgcJJToTbtKOd4z7j8TH5GW12TldtDoI2krlcXvwXCkB37E+ZRnQJqOFCVVFbDjqz/vBZa5twCzB3YIxJX/0v3dQeKMYWZ+6yTdyPFeLwpKJ+jdKMMHQ9JrwD+22DvX/z+rfyb7slno+wugIA7tYMABdtpY9/4myVfjMAyLcYczKCWMoik6WFxMTmY+6PvrVoAZ1xjRfZsP2Rt/7830UAELtuzwTY9LnD8EjQuwCg6W3YosAM3fNJtjSX5fAQuBhpXbf2pgCgN3BXVwGiAA/herjFqyX/qewyTrIDAJlQJkK2Tsr3hwpDwkVXn9MP3UP7WPVUTREKDjIA0FZJomn10mo44Fbg1ncTAOgDFLNCjXl+Oo3I/7BFEm853Cs+tqH8Ft7VMbltWwGoFzNoM0wRGgsBgMrDbn1Jk/SKRzGB3RYAfQ5UnIb2JFqyY8RbraYEK6syuBqA9M+dsMhHoB2fk+BFbFQKAGo16lEtqQBUikSbqkO4CQAO9tQGZOqeOhKgDc5IkwKA4PjYrdXX0A/2Ab72/mB/1cw52rN7kvMe/fjRAMAeADj6HwAAtcKZ/VK7zgwig8Fmw1SaO5aIvPDnzSUI5D5shc0XAIgKc/w3fpRUuF/WiiAHb092C9vlluTBXxsAnOovwhl+borTDpbRv7UJ6+cAgDaGms8hqrg6+Qaq/uvzi/dc0mQBkn4DjbdvdjgnZoIAExdsxTOHJFlfmC5pYYDexJXM8xTEgcFsY3YPAOT4fTwDsAMAgeEUM7g4FwJAIk3N4wnb/XwAsI+vpt1XKPuYfFudADlyCa5cmnGotKr/OOfQKB8jDZv7CCCCsSfEPL5eIzsHMi4yE02yBZBblzQM5t4uzrIMXc2tJQAABV/6sAAwBAB1MzHFA8OtD2HMXQ4/jdUDgCxrIASZ/TP6Y40LvYnZHXyPAPFtADAaMcrlvO52+jL590jLhwFAwB9YnlCu2AeF2HJPy80lKfCJlkvlFAFApJ7RX/DffgwZtSK1z1uHD9ZfwS3RpzGTA60Z/qkAAEWMunMuNn16B20nEYXjDgCIhJtESdzOyUGELWa4ubCKGPqppQBgNpJJ8TPjdGVGa0BuC3BH/wsA4BSg6qiIKv6Ws2UuBWQ5K7ISPBxQo6uyuTLr6hlNFFl1VsB4DHxiODNuG5PzgQAgd69VtLmcsExL2HYqSmRGLQDI1TMoqPr7rgA0+zP4fCu9pEe3YJwkGwHAsx3gyspmyqNTgszvk8NwFgH+xjBG/Rhy7XALgpkxQbpRLXRdFjVspflMNjCO21iAHcl56eQgS5vHFWAda+dwHwcAA78ckXxYEAJynlpB3AwAjKuW9yuhKo4EBzgw/X0JpuVO3cX9ed29pGCqAOz1Zx7fCADa9WJ3DPleYgbyaDWgDWTtVru1PQP5KLZzO/0IWkkHKdgLHmDHS7YSw8s/VsxnY/C8nhaQKP2IwTW1M29BuW6z8ic/vAJwyNituXw7Zxy+fxYfDQD6kbw97QincG+xAqbjf2qTBkB18m895S4AaDcrXkK8MlTkVJKN/g9NhJ1vtD8xIbwaa58eg5+dKLiNisgAyu+JmExQUyV6YqPcns8JALQL6tQK04DB49zXceJzEwA8R5WY21FlUif/wIsPJoSORpzokMbsbOsyTtAt6fXPDABesS15/NyN63CiR49d1yw7OKNMhvS14xvOC5v6DgBUII78BQFcOp+sAlAiRk9aqKjlTIFyuyo2jbFnqBC/XbGns/82AKC14Zte7UK4JRrJX+SoyMflCkCmJdu8IoJ9Vn/EvVpN6uMJ3SGnEiwUF16pvlK86XtizTi1ZUYJu3xk0sVoJx4FAKkISRf6t/64bflYJGIXgN1cDgDYZ3s8h44PQIcjb/sTxB+UKSXRJF8G8eN4nD5KAEAY/Hrm+Z80ACANKDPeMKbpEPEwfEu+CQA0Tw8VKtyViCskCpnx7SoAvVofctKtqgfIyAELttZT6MM9XHmOZ3YEEqv4GvqjERc2OI8ZDyXO5E1loAMAuXoMTPheIUAFnEzAne85SdRVMgIAnx1I6ttkvgWzBmCRLHAGgNWrv60B2Ie2n0dEdxoQKgTUGQDIwnfOfFAHjwE+d3r+XRdASA0mJ9AcbtA3a45LnlUCtfpPtwLf4Uh81t+gi/OlkcIde5l++wjPOKl4SQqOINd5O8bemFe6oNbB36KdU8ufX0Lvi5FmYy11m2pZ0DpsrhkaBQvkuu8BQKKP9QjOOoczB/38vPXKAMDuiAICoG2QkfNElOqSQGaU8X7hUkOfVb58RGisIHKDRACQ7V9XhZBfugIWui8hd+eNZvqd+y+1scjNuCnCVkBFAJBklIIp7mkDgC5Y0mCIrV7OXVN9vB9R2Vu/8RmA+5t1maKbHi+YrF44Se48OPvL2s70AXtzBAxYjWuSnD01rd/aWw6HCokLyZ7Q6hBkrHgdwqNPBQB3/NxXhEz6m51BiDLl5+/l5D4A6Cz4VEH3CACY8DtGRxy8lJ7RfBHna1tMAcBb4n/P43c2dluOAQDzvdkjd1z8E7y331FjH9jnf3n7JFaBDaR7oABAFciAHSCBVAgwqYW/Rv4ujySbvW2uO+OW5lcYgSSuvntLeYxn7slHDf5Qy55Kb2Bw1RbWtKHcRiPFDADU3RGrNw8ActuWhntcnqxwFjgWLmjv1pfHRevIP6JC6yEzqZfPVP+sr96CXzVrWIi0zSoA7SLDsvd9VE2dYizptNICZo1PzLGPDgBcwX9ckOKxMK26BcUUADQDsfJiAeSo6TY+6Ck32wmhqjx6HwAMQk16yNXSq4grMYnIT7LrrL3OyEBFdWopEhA1aMBpcr/vArwo0mobM/qRHmsUIgDgDlD5jMioRdzW85/+5v9oQyy9tWlmXyYeU4Bk37HnAYk4NSPkW+C8QjITjUgBx+TzJABKTKUY890fPGADvOyQ04luLfndy17BVobSOaybq6MbjIFLGFhzEKrA4e7DMrViYv22Ek59hIS3rAC8AOhODt0chLnARgAA82DUk9SdAYGrZ8udIsAqwTQrFCzHBTd2qCDG9Q6ftTE5E3CNa/FamjmGYecnZ6Yh2H8743dGHVb0OKHlAJC3/yIAOOQQpYBzkGHCBiDDnoELSEtZCb2csMSJq39sDD1GGcQQzvM0q9xzI5A92IcHXh5gi+LZtE0rrmf3DsCjYoMUk5qCVX8mZ8Kqdv4EMFe91EEQ9oMB2LrURhmmvLmuG2ngWkigt5beyU+W+bO/X+PxAF0A+Eb5rOtPcQGimstUAThtwauDEv3G2g8XjLBayOO8YIS6ZuWDAUCuPhcLKFviyE56uSXVo09FjlyAzreiatxgW1nyyypMoCR1lMYZe8dArT80DqsfVnPoyIdKOzL76vkxAUjTIeIUD6gNDFukQvIwa00Wq5Vy1NZXz7ckT5eAdPS54vcmANPbK5SmTP8l5DoE2fQeDDBIdFJJzpTNpQgBiZQHSXysw8nbRI9ZLbKvvrK3r8jrLGHXn/AAnto7jGJr/wQmpe4UXkd7MHq9oQCDY2PhB5tMiO/CmVVdBaTsGFK7ZqVn9cQ7kCyXR4pnjltsNEgU4+0hbi7kV036sfl9TNTlE9TDyBUzVeu/jRdQPyOt0p4c08uQH6wKSFw2QyBjN2Ruief2tapt2Y8aELLehhfD7O3aQM90l4rl/D2AvozQmopRpF5EF1gfmRNhS6TbAkzOW+e47LnJV7A70cfTqjmfnR7U/jj31gUkr6faEYJ+OytyXo9jBJCvA4DGLdedDJ8RIB9TgFJjknAEgvcH0pbn5ZSbVH7J6tAMAI6Wx2AQm7IQGy7AFzUeqwGxulas3QnI6tlxQKs09O0jh3Z0dR7ILE9/ySPNnRcJjF/ejeY7eFjc9xP/ZAAAyaoWRnGKkKR8+AqTzmSgKxGp0iY/n4o8EFNf9SdorjNU589+z79XxOX+LOKA+Bs9fc+BXKcMPgnK9iAA6EdLgBCHlCrE3Dv68a0ssM14C1QBAKKfNjMZyDUBgLiFaoMVCwDcIGCuomFGxgDGLT1hS4prF8/LCxKWrqzc4/gKGKtDeNccKcA7cppUy+klIDhzlevFb3WaeQXgpObVjFhWjEP1+u227GVxYk2xBTjfo6fXomEB363hRn3Aasx0JFsfolOQjRWGuBTA7TDiEC2rMMzomlNBb3XLvmdn2FGQAMBGl1o/n9gPZzDfYy0vhRbg5MV5s833gE1DgEt9Ne+389uYvvUYIaAbAMBWX2BLT6mjnf8YbnAv23STzqpCeYWVC6wwOEavq4cWaG8LAOT/OWCTxAgDPC8Dx9DpubQ2tllfM6CjFYY2BtgJn+EJV1fT+NiW8h+Y8Ke2pqkQWHZgOnJvWjCZAJUWYVya7wwsxUtoxE14e9kYb8sgelhrmU8rlMiH3g1Aup74CACw0+EpPpn0058ZFwjo6Y0PIIASEjHfUuK74AKo2odrBdIV5lpOzlukfZuTvE70vjJGQ8Kgf6cIocjKvKQafc86d8LjAcA5tspiDpb9KJlqY042Agk7L4CorXWzGQBAXqA0ieUcQJUsyWyXFNxejJ0xYad4JuZsht9NxWu6Y6oVKHckkjNO1o9xxEf5Fdm/aZugnhGHMZ+hmztCg+NHrajsAUCVIBujyhZwF5/WqxG1TNYkTAAK0cda7tXT2s3J8gbEd5cAQBjg2sFl8hU3eOpDj1DyGmgBwOUr1V+KLzsv0UL/sZHGfkfJMbtkDo3WU9MZsi3tvTOVh5X29wBAR7nJuJWxj/b/UfYecx38fQOAMGzLTzgqi3kGVddNVkT7Q44N4zYFeIMKQF1MBk7JIOKZ/6WfNnchYGV6pmMawX0AANinSJMMhADAaZRv3fobDlBPEpWBf6uDZoj9Fg9tn8dp+6eKNybnFIznzHtviknv9QFTXwEkggkD2xVvwjQ0hvy0He8XAIiXnvjo3CdHLRyQigcCgPrAcRCyJZiFPMrSRwCAd4NqfN6EY8UWXwSY2oQpDOR7AADRwCS6XAKAB7Y1InEDAFzdjtVhv00A8Io8eod/yEUhD24fTbYRia2/RON6NJwcdlo/3UI6+ZQJYJgq+Fv/8U4AcGsEB0xOJRD4WdVHO3+Ryj19T1+jJAn97gL/fnk5IOBRPwmkTlt+qxTSie2NX6xbQ7kEALIwSaM1hxd9feBvJOZHBwCNsZ+SNn1Y5aBP2MW6FrZuJQidfv3aAOBkq6YzmNsKnu8QAERvGM8Om6gR49mweIAAzuj/5v6mM9CvhB4AACAASURBVF4z+8r6zDLc9eLfN2eInob6qLAuwMhu5LbxFi4gHG60gA7pryxqu8T4CwD0nGYAMOcg8kKAo1NRTWzgTysJ+lwA0IaebLu5+jNz4LOtvgfY/PoAoK8hlKraQikpdqwXNj4dAASAdCMPTYH4bP1quRNMgyJmwTgCfwNwCdHzBP58AwBQCymyfOsc8VHaYeWzqqvGojlyA3oEAKAH/6YcgxdrNn4MPxVJsVJY+trv9Tp7DQBsJQnJEEmihu6aOHYLSjGQJoBOtsxhcpdzJwzicQBQm5yStUgBmdE14iRPPQoAcpIqAgkVITZ4yQFAvTWMzMSvUwEISeSFLcAAsBvjRqbOKkysALQhLgVLMTDQPWZsQPnfa4IpkrH5kZXy0udqkOkNP5Z4yYI1Cl0F4G6vHW4VuupLXp9tgBoNVBZw18phAfi7SrTH0kbfOHk17Hk/0dBafWCkQ51p7N8BgAMAM9ubGQDcHGho4M8AC5I+yodtHLfM8Df4xDXtmDnNcuTbw6TNOsraOr+7qLsMLMBnuAq8uxWAaI2CAZAtKzW92jMChxt0Zy7EJ5j+dJGHJqjIL9QLDqjx3Jb17s8MAB4a4zsM/m39SCpBO+D8MgAoU1N9zuiBAGCqax8EABbeeVggpDObjI7YrDCvAJQXMsPRGlQVUQHhe43fNvQQ1svI+pgvbalk8S4AmPm7bkb3Et7ExkyHMDYVgEoP9j1VnMC+x/av9jfnAeveu23yUI1V6Qt+3gKAJ+B57/go9rX6m/miqv3Mf+HYjdyyDHt7fynGyiUw3f7nQFHFS6mNUCHnCXzogZeAWDk5O4Qws36PI3Bb8agJ3tHig5LaxvoKQLoEKuMCfeZp5qN3c/nJOK/+jGWMCGkGGt9xfkA6fHgT+uO3nB9DHj9QASh8laAbY1z0KEjRwV7fOlM0xswKNvV+lTM1/RdgqlAByIRl+8hVmNQ/apfZVu/VDn3WiV+s78QjwBaTuAKQpdsu2pP9wQpA0oF2C/A3AQCPYT3Z8NEcWhwwCzBo4ZCXHPhesMxp/KO8f9S/ejPlR1ThP6yRzFGenVy8dGQjzlB1SCoAoeAgxhfUgsapbKeXFKytLtFnB5O9JBjiOMTDditNEv/85//h3zTxzRzM2TNQokKPK2zNHj4M+GpbrEoslR0sf33xHzmE0cjbOemtqhx9aAtZQh7b9yIz/d0PsI8fm+3bZ+4WsIt9hdGFAEa3QJFBQ5oSQLspWBF62uM08sci+7L9txB6UzFgHN/paMkjTjq0A1/ylgk/RpN4s6VYSvpMZ6A54xEClmBcKkNqA36mvwl/Nr9cg/Igtat8s1uApZ3SjvsVUHQICeOg0ke+dUmCsOQC3y3IeuUF+8wMoC3/jJdUTMch6NZd7ElF/ziH4/SsXrAdo4CAgejOhc7jnwHAuQIt2vR8bgn9E+ce+jPB2pWqxmt8RjliGm7qZ7FJZZvAj1zr1ckX/9m077cAG91lkwTvTwGR0Z8LR3BMW+5oCLOXrOiDtN8tHX7TOX6wwoq2wfx+NjWdz9ZIuALwl2P+1mesS9wf3vaWLUJsV3VudQtsgkB/OiONTgSZYwDUYzOeDwAA9/iB0KavAWCqQASiiW6ByfmrgXrFfw/AMaV8rFa9z/El8hft3kcCgHfBv8356ZZS5I2f5Dkj0thTb/D3IeG5/q1HN327KgxpPG9jvMTiVkLvJzjfQjzZ1amIpKV/UiEYYySVYR+/tnHrGTgCUOsjL+/9AuO0wMq2pba//szYMn7axm5p9DoiJ0T1PBu19gIEshNi58lHBFEb0yU5HX9Jj421Okfa+DirtjOe/mZmAgZWUdSB/4BJ9zwdjiv2gfJD47TH+XDEdyxtVHOOE3ERq6t63XxFcIsubapnT9yxRTo8J6ZE9rZ+1h+hFbnP+kqtx9jSVNAZACqTpLejb9Qa+pZc7pT+XFTh089FC9YhP3O0DwL1+TMDxV4yAAixwRmkiYk4RjM6yXRZ/8qsTnCsMleNc7Kph+ug2PqGtacL8GMESjlm3RHPhsaMR4jt6fZ3aMGceAxe/q7N5upT214WsRK2wewQ+8qvwRmAXKVn4y1mMs2Dcw6Te0hHp4Dn2CmGovnmc7pA01rIYAmP7drvwiWhKHV85E1GowEAnMkaD0FGpfZbUKN59WfM+B5LhwZEpED1rAAcbnTmyzB6nKI1UncAQB9QUFfZKi0PIhrEfnhTBVR0nCis69sJAAz8CAnFxwKAqdEdeKSOlhWmpuO+pRfIHc6YMrcqMzpRuFA4/9APkXiPxpt4b+RdFB/ePsH8LPcoM2DA3VC5gNCMT6JgeljltAAAS/onW3CzVX9ncNGthUtAZECjYj78wBVtI4AEnFIV0Z95+4DUDvK0c5hrtzbSaDhI/BYA4JbIsQLt254BOIOa19ludAiARhH/I2uFdoNeXO8Tn5wCNLa/lT+S0ApM1gQ4UJ86ownAmgBArYiIvnuiCvLSB0L092MAIJ8DyKYW6cW6namrGVe2AHURACT+WYPVLQJm/PQVSFYW+ktA0MXgSrcNSCvppp5KAFDAY/ARyYJqtwF3vZkBgDZWq1vYz3F1DIPC7ha/j9wCLIsDk2Cju27PFPMLorZhoQ8Eq17Lpi3ARN/zf/C96OFiLEimIvnc+esb5HALvcd33Dcd0uUEAE63KGO1r7H7pwc5n3crU4LBdPFI9rzzp732DUsr4sBqAtqKnO60owNZNOdjSzB4+hXNFHnYEmuswHQJTic7AgCiv9r69H4AMPrf4RKzdAfPVYlH3YnR5P7ksE5snt9htJ/ByjEfDVAD3FYvT0sg3wsAsqBDrKs9lwQh+buu4AgAht1WUo+nY0AaZoNA/yvZVkkkCwDuWBsBqmQx2vSZVXKd+CH6dpRj5WFmjzYdUgAwkQWw11N82UsxOJ3GnxHAb2Uwb5fkPwcAuwgbZEfmdk+mLmvrKqhz/lpMLK6hYq7gEUw+I/IsXniAjsw/268rAKAWPZCs69z3laz7XoMTqwUfhfkkxf12ero4WHHgAwBAT/7TKa4gNY5sAgBn5pLgcYJR+etOBFsnBZdibPobW2cdlU94GGkWw9QaVAzi6hGFW8uwwssNkFBhHbAYKQl+ZgDQm3a/ZWwLLN8EHAT0XgWgN2gcsE3uRZ3ExwGA6rg7l1tXWGmwiaPPAEB78zUH89PKsUoIGtAkgF3y4acgg6MvlM4RAOwDjmwLhA2ETNCdrl7aKgE0yLPuP/ZEDNlie58CAB49wXMbmO/fHAA0l/ZYQEBWuIosbE6YY8XkBDh9JADIgXPmE/LwJ/L/qg3iN7389vqzEZLQqR8b2oIRAHQgwJRAt7egCgGtB7ujdSEBOtNd4J0CF1ALAEAPPaFnAK5X1kjwAhBqh35Ydq7wQNdmklskLgCAwqNPBADX7HcBmP/BRIWDw0MHrz+TvqUAoA35Q3rHJJ8SrjWWDgCUuKFwdjumg+1xuz0nH98rAIh+r4pftv8ZKzTrCsAlFvtSia4CEJFhx0mKmX2yZUfb3QJf2QFlZ/Sw1+Maar2zXywfwV5eNFDEI3uG8xyv2MbN8wk/O3+GOUs9ZM8f179PaEtho7Or4pEe1v+obp9+8WuoMONRfM8AIPr/ir5TbtGLEvImkfULAKDas8THgmxyjtPHE98SADy5Q3dJUUK8zwQAt704feZ2IwKAoQKQY4mC8V5n8RIOzUN5JAoEiSzaArSz6PC9A4Anvgr4B1Kc5P97BQAFgF9nBrsAJsNF2Pe8+QDsXAJCvF711LYkTIpFAP+qitN2dAtmltpUm7IBwNfVx/GFkKtzP4oHkQypO6C/afnjzDAxdh8MAIIgpwBgEstOZ6CMzlyrCLrqmxRYSFbwQqzttijX6ZqWDu82XNtK+8yEM5POvz6qEKNGreCaeTzDCQVIoFGRIN/7VAHoZSYHAPH8BXzjGISubL1cQTlDrmWXyUz/HpphRZlf+8OEggnCtBQjcG55RDmog1DdQuDppO+4AGvJEzRoxghnvmGgXDl9lgZEpV34XiQYavK4wkcdpz0EONUb3PLmdkzr3Cwo7/VKg/YEAKweDso5God2dZJp3AVVmqCREJuKAeneBn99UGn1kzaGkMHgFdGrh6czb1r5cAlOIOHLuQWabcy6FQvmNSUwRglTdjiJHOx9Lm/acB8AX5GHe8+wKb6aKEzj971nh8J3I/QHv0d6qD4VbsQ0PwKAx5fVq/wDZQSA0Ap9G0STo8QEx8p1vARkNUlnCOqWYrFoI6PcpRxnS0dm73WclspoK3WBoKrS0DOGqJXgKRy7rf/0Z8BwC0BW06qXv+ivbXcToKx2KeqgWLJGKUN4DEX1RN+cYUJ7iA+2LXKyMm1BfGmviddbPNHHjyIEJMzoZ+W7tzfTJSBYgZG5v3oLMAdO519FvE0zHgDEM9AkpsrElltxYLTVQ+sXtylxxPWiY76GipuUillFx2mA2614ub4n++gAQFcFNAGW3sam/GwEqq/Q1lihkiIEwIXa0h8Sg7cAQ0V/6yCq/dNZBSB3eM87G/mS+EOsK2oZf2tldwCI73n69zztGetifdQbWFTihFx8npDazf3IpvdtNZUJADTxY9iDCdljmv8emcOVOxsxnL+ON5v3eJq38Yxdclw6Gz1zVOnANMprW/NLANU/c9cqn0ob6o3ci45B/myOD0Cub/vPPunwW7cxrwUe0GHXJvdF7eUgoMYMIBvCG5SkTn69nPKYyGKE+RT+LeYCUf5vbwE2BpbHNdu9O9qKhQpmCzA04u28vMPyLeQHfr89P/20jjgzZFD9kVlArOrHvfBF0W8BAEmQVuz0sr/3kSODmLjDFgHA4wkYT2hW0Z7/8q/+nR1+2NJgmdwf2RbdeetjuADCy1ESXIgqhy5AiNMS/gbli/FJkCsTQLtxIuMygTTmvPONYQWXGehaFSeiA9m39qZJhZgV2MJYFIM12mQrNCOjrGyxc1GD2wfgZIE5aalIZA2lDja+R3SzgYUz7gifLnqyBp4hJwU5NXUOIITjs/LuKv7E4eUzlT3/QGZrnuNQKgBXOWD70qZXy7qF3NN4JQZk8DPlVMmuZkIjPdfcn4e2QXS3NvKcKyIzj9Pvd/MThbQKbUo+9ojddL3tJDoBFX2C6Vf4zvEEAvSZIMAdqntWa/zNZC1tTtDR0ad1lgzIHdvCDpJmaG9fzdrpQ/7KsN9x352+zxU0Y09Nhuct6NiWCSWvPH20BMg0VeylPDBk7jlizgNpF8BEApqJyMEo+TPniIP0kq5jHti8SDLENJSgmsIon4/sT3fMMyisGZl6bLYrroBPz4g84xOPlpCVKYRFVtwePb4MFK/fnoG0FRMmYpAKSQy8Zd6QO6GN7LmfyNtwxhv7f/UnSlCyhb39xW957GyyiG75iJGrwrVjypFn259AE7hiv2XqnEFcCCj5D5Ah4cAVQjb+wo+/pB/y8TwUPXZtR4n3HMjivwk6koKA3Q4OXdQuyQE7DDw4qxUILPtH/hwzuG0j/ZI06dwlfmh4I7oiBC8Vd0se3pKO8slDnADA3rdOmyM1Vi3l05kP/1y3pU2QCd7CRwrbHgo/ey21oWSZccFwfaAAoX2Std734KQ9LXlWp4ALYKT3/S3goTcf4N91uBj7VVM6nXrJI/llxyIe4vg2Vn7UAlr8ElmE/rRt7EVOETvVP372ETjI83m0N96SMVBF/U5nAHoacMX+avW04OA36g9zj3BxjUzL0sf6FdI9BuPY1yA4enoqAcBUFyROtt/K5RDnuKBtiXcHpCWH6+YlEQXkcFoc4u0/tQkSNKitjgHHs6nTLcifM5KNhFXAqBkB+6HJ/kX5JJvlaFa4v22/cWoQzzJtcQTsP7DXq+ov8SefqSlbgHXhd/OYd2S6BWrsB30KnnGsck9ys+m+8JFs/m7XJSnjegPOaIW4QMdvG3v+y7/69+YTfwikZ+HdOxuUEYmM7i0iVQioK/yeYW4KUYHhhdp4HOUcHGx/S+JhfqF+IptXgskqiHNte1nIF7i90UEtGWyFU2QFAPM2ogJZjRy3eLsV/mp0WXWnGll+Sw0PORD9W02x3ZboV/AJT80NdjBXaHBSlD9u+a2lnca7t9wcJquDzC3gdnBuC6e6VRptrIKEkGKBfAgCBEAgOlhqVR3QicESth3aw/h25Y4BAA+HuhUK7i4TjN3FkA04ALML6L084coRd++HGlb8DQCIDvbQzDnQ/gzVO7qaP3vlFkwMRDZ/TBVEbTui/j0+3qkFvwo5baGb2pvOYKsg8LHdCw9IglQEOJn8YbPT+3EIxxqAEOeqhwOanFfnW8gGoHztp9OFuriFV9+OBOJ2dgJo0MFuvNYfrNcyABDHy7Yuo5OO4dhatz11W1/noClhKhjOtvXMh2OXDAD0idQVoCKTl6kCsK8QpQUe/Ck4JY8w7xX8y4WB20H/wvYGeeZX9H2F7N4i2+gi3aFBveHY7yYG6B9QLry98rQK/iQkWH3sRvRhuXb/hmBRfbeO48w9AdyMrSkSP4w/dvoBVZoMAE4+N6OJ2gkbr3l/6S2VofeiSwJQW5lS+4F827HVGdgV3apErJejGYyTM6WK+CcAgEEB9QOajz9y5oKjCo+oZX7dJcqgrQAAUm8YkXZ2jzqZthQb/ebqzclFwfijPfOVV52xiLp4VzYIsCCqCD8AJFJacowdaWZtCozfmFIPLnNcx4D/+ds3H2wGzHmfH2krQMMWSUc+ZE3m+/mID2uPDkwn64vWb9sYyPIk6jB9bwFAbsG2Ky2N8vS8KweNv5CzauGql/1AlUOd9x3PbEUkjTMfjvGQF5SYZ6f0ooXZegFv9YtbnPdY/JpvuYgMsd+F0dFE4xjRVvtmaHy2Qg5j5ux823AL+Mjrw4NDbrlUx+9aOd9jvLdjHYcLeHvhAXRZRGOb4AA3eV+KwUBABADkXYbiwaTIKhz58gUA9tL5+QAgOk8fyM2ak+IfRsr6AHKYPSQweTuPAoBLIBHwqhzqRwOAYryP4ea/CZDWMt+OPjgmr+hsuv2lHx8PAPp0sjO8fEstGYZdAYgG8BMAwDV/dMoRYOoD0s4BUHTZWHBYSRKX38SgnGBu2kCz+5XK0RUVEOL6ZXwnoAsAII8MHfpFrzSbh3AGV3CiHABABeAXAEhU0i3ZFwj9jkemBPPjAcATLKHLKce9HqoDb32t8y9giyBguQMA2hVrO1iiz/cDAK7RLABEf+iMGPz5SAAQu/JAZsbWTN4eAQDJUzpblfgQswpvAuIjX5lN5mbhO7bPXwAgStijAOCxdbyboXC4GZC5LQQs8K1XPxwA9Ft0oWKVRYPtJAP6EkMWAOBx52fiCjDmAMUQITfxhI8jYkvfAgB0spJUrd53XWrXvwDAe9RTAJCkUK3niQ9P5JH5PbTf+l4FAJ72Gbg4+s1b3hc4stTDA1mo/pwlEES0tXtXeJpRVxWbhyzoHXL98gCZ0mHbHCzk8LrGc3ILajZuwgUE76+s78I8JWqN9etfAKAyODeBXR5a6MwPCADyGYCZ2/wIABAXPET/YcmFc1MyG0dHt57i0xCt+zNjP3YLcGSsGWDC93QHKz+XJN0xebBJSrARsjqaCR2XANRG/HMBQEyeOBjm+VwDAdojtRIA5J67wgqGXM0tfyUkk26mCsAFCCHwgr9zIxUAQ896OtHfFARGA68Hj5/WD8LOySS5N92WHFsBZdo6d9ykW0EnSjw/2S3Q/WojHbhtKwDNRS6ZSPgdZnheQNCfmLAlO1hBROoKQNhskBS0qPF5fv5JQ5o1nlMBiEF7J5OjFmwArovC7XdXqxF8ixlosTmMCVCoKPIVgHZrw5IPWvFes+QexxnfUuH3VgA6KU/7zHT11uDe8bB3tK19vtT+RQDrUlv3HsKAPvVO54FKuq9Iipd3/04e9J7RtL4TrHO3asP2iG1RunIJUKOvoht8mF3lZR9a8cHGCiy/TBPjvcR26hZJ32pGO1+d8dkA4MY4QuVhPv9M3qaKm95+fAAA2JdImYns8NZVIHxGBSAmkJOOhRX9ZMW/aqOSH5w0nieVcZXsIcaM8HuIgWw1HbVHUi/JeaFvvxYA+HrGI7rpEhgUHx6jgPANAKhxHdl/5AX+fiVeKJ8pq2OYkz8yAEgyQwCgzge3ADONT4Q8VD5TG5M9+rEqAKPm05lx+Pn5/ci5XAwnegjPwuKxypz1aREjY+qfhbIDqG8AcPPPhu9Rz1cOwHnLkldfAVhXuKmOqaXxcbTKhlghyQetf64qxfEcNJVEoQMoJ+dkELlYk5rkS5JDGsI+n43vypudx+5cVnuhrusDffz56zQYzRE1i8os/918geNcjXevVgCCdn9uBaDZ/gvcKgLgnTXBGXrGhmP8BuSbFjwzSuP82f6wbHJ85PMSLhjxhUEhXkguccKzMKdb3o2LTwFAO6OkAvDfGvJOBJoMtCfgFN9NW7j897cBQFCowNzkgPxwaLbf4oIMk3OKcrERVUsjwCzx5ARGjXoPoOWHoDqWJ4PTAZEAFRoGl1JUihHedG3hIemTGWOlwiH18jMHUNsEoxOALajRWfKthXz+3THJJXmITxI8S194tYh19h6wRICQV7v4mZ1eGQNxZMbGBLr+dT7H8Wz6y/PrliB4eQxQc+euBupwFOhjD4HlgAFKodnHnVfZYRYk7uwxMKd+u7Mv5ED0XaYMf4KkSntwZxCi/IozdyA08Zh1HwHAearveeK7BwCnQzeHMyem+c00y+ywuvyr5zHO/cQnJMCrze9+qdON1LW4rrokdrKvXcUyddPTD6VdgiJXYcv2XryeqZLNA3ydIvZvk6Ho2pLvPYHBhqrvyDmAAadIjBl7cgbsrpjoOAogTXIpFMc/+xKUY3+M33TzwXjOy9tuy53JiqKz2923zObSzQkEfhsftfJhA+LovzOfrNo4b0HKAmbjgV08t//k83TAHwoIyGcUFwr+0QCgp/86jqQ7ZZESD5Zr9++SH7PCVwGAcOxDFhMfmfK2hpMP5tn6/tEKQN4hsLVkN3jgucTQbcmC+OguAEihCF0CInbwLOjhnFobe/dMJIl7aILTAnlrX3NMpDQv0frNXstvqdc3aDeJvYRnDcgCRNpn7ifu5pN2xJNvSHyu3/LSHhCQ0cfOQwEzmmmgh7Rf23z6hvVc/6XerfRdiTFRdsUdGOBP6ebFt26fbLVuudRoudSP4tgAzOGF//vMcbt9lsbiZ+MkwC1YmDNrj11PpIAo7t6lnqyWyC30wj76nm3fq8sfzJmNyfyj/PLyA3o55XwscHEtDGf46tMstyq/EwAYpG/NB87sZ3I12VcDf+a6pbnRIV4TKkk8c5paj+IlM12UFTWrsIXHMYi0ux2LBuDF45+WbTwLJCwrR81Bo7N4lfgTcmwcHqjEts8yuOMwsQKwC/6XJP/lb/+NoVNt8GkEdw32NQCwdrG/TQBwTpo4ImkDhHOGWyG6zcfgll3A593NaICCAwVxCkcEWZXMFCM6oG52PQBI7btb3njLbxE87TODzjCzVW87Gq2A0MSGeEt/Hzpze8kBzAsAFJrv+PxUAW4PlZfHa1wQb/TCoHz/bgCWaHB6gKMGAHmbtOcOAoC0cqgB4aYMVAJhcIvjnuVZXfUEQEwLDOcasNBlWGgowFJsfwzOzIIBzeGd+cNMovPEBJDJJSpnfuaMRsouS8Dinq7GIa+Wpwo+fwZJlLc2PevpNMwPV2MvE/zGg1dHPgUyvYXsBxTaNnLeVyyTHRp82QkAUO+zN8QyuUU1vnWb4wgTzwT+2fGaAFGczVWqE92yc2SYomzPkMLWZzwIACbVAGhDEQDci+ecLgJTMwAQxzvFc1MFoCRDpZhZbmcAoKaSh+anLR/gyxxRaJ1d/ggAEOOS0f6widy6oNYyldeERmN87Oyvj+eJRhxnsATo378JALBM5AcA8NClt5/2DMAVL9UJW8LAwYFX1ob4+CMDgBTLWftxElAQasg00jhisj+T96puEa/es/FgjIdn923tWQQAnbQNhoBzFLYcBgBB3T52hkfMvWh1XjJyqIKiij+WdZB5mA7bEmtjwKYY481P2/kaec8AQGcjzyW6AnoswG8fGiT+TGfqZ0jf2EWNcOYuSl0ChsQrZHQG6zfeoUbjIVoIydZc/BltMMg5f6T4orrGZrogcc/+kwFAH9ushMVfm9DZV7x0pdQt5ospjpijXo0PRBLIHuEuEwe3+TH0+JiNQCjUxXH5Ah3F4vYC7V0A0M3f7LIriGfjnWN/b3Do+S9/+38aSk8ChYj3aCyHCiNKAO2KkW8T4JETkPsFLmvEvdj0BjIq37epABySJhTa/JaPQyZ3hlvKkCwEQeAqjsWYQBeh2ta8iDL11ShXl4hwkGXMOyQxA3AtKUIFUNqb/cAonGu9Jchz8+NDw6+AgGjcKgDQJFAb3NP9+VmC84JVlxUAeF7k5NgYPNiCRPpl1qTy7QflKuj7AUDWO3SanCspGKCyt39DcLBcPXMB2FCBNK2wV/bO2JHGjr0fACQRfiwAHi3w+84A5GYDwGL725Z39tPmJZNcnQqjbhaTPxoB3pFEvS2eFkDG5ocHJjjqJnnt7qLDn6oP1jkcYgznr4ywGqUGzF31n4gbbnESD0f8KfMoACCzC7/Eju/25oozw65B/jP6fTQAyAs0EiMfdvAlILtCj/OgAQAkCtifyf5MAOBcIWv1qwMA2T/gCH1Cibcs+xhivz/s0AiXNh0jhv4HbdQEAGbqncnF++2E0k/ihaBumqSrDpDT2vG1BFmVrft+KwDX+iFvV0zXmpMKQARlJvlkgF94dnZMmLi0Yt5+qbbQ1vY433mEbIpPvnUFoJ8NntHtyZADgJCPHdCE5DaXvcn+9HrzPVUAknUNeHDiuGxsyXTRf33FL+cZaOe1WZv/Rh5F4A9vvuY9wAznUR/eS6h9eeLSo3iquAAAIABJREFUc6hszJ5mlvN3aKvRPiq9TvUfVAHSXIhalR77IxICAOgdCFTfd7GVjBt2uH8BgOdWWogjpvh0BAB9BedusIvJVcLZruAuMgsA2gy79p/Ypk/2VIDWbzEeCBbTAJDriASMJxjYph6d7gYAdPJeFO/ICLlk3rTL48s59fznmwDglJAFA9RY8DWk5xc6I6z6wS0obJfsVGKCos6bKgL8EybAc9txPADoA2Bf8ktszInLrEm/TSsnYsXFy7BFrj0DUIjqR0gAINEzjs7aTEs9/xe9bcy8WZWZAEDD9/SMi24TWsdfnZc6nze5tp4Cv4TeJ6FCADDKJlJBV4zJsbHDouzbXgKyPuJDdI/LBfJTLmITOssfAlaNSoMccaBs9OSFLuFQg4P8OqtajRWPknPcsRhqpI6uaMsNlmCMdNwKyGq15FlRBpnMNRcHewDKZvwv5wzCyr58NABoDbwz8rKKqKPxt0C1xrD8sibAlGBIQgwVgNxNZR9Umoor6otxqh7qA1OF4pQgTABg9A53PNSsH+/j1ye9VVWpoplPnjEaZQhmA6g46j644ABHwjmzMptbVcsvtqW4zcH7AxcNJP5+ayHrntPBvgKLbW1rIC2+YkC2qgIQ5+7adoi6AIDnFaalJIBcQZ5VAO4KBTyjK+HgUEHQ69csHxykswjaGM6knaNSbB5aUZBgW2xWeqaONm3ns/wzHaIYZPRMjQP+SgLS2DLLocfZZQ9E/QrJtggwJRMWBF/yV43QyiAuysW5Hin0Xzhbsnizl/OZR+5M4yskkEvCzhaqp59oi1ypp7gFj3VAxtnLp57BFbcAq48bRj1VAHr1Ps3dqgBsVtkSlpiQMchLMx0vbTvhHexDrACEHo8t1k+iZNH7jX0dyD/FKP71xyoA41htCrWO2FnPoNxhbmR37EC9MIAeMenvQZRmF1RS9afg3/Gt5xZVBauzqn+ew8tTBgAijW1mpFt4N+X2l3pkEgGmKnUnK5XqP6YPvxdEwQAm9C0eqRTjzVzWUh05L1t+0vg1nMLxU/8oD/xkFYNSF1X9H7fV32I/xcc0Kpz3+f3wosuuM3ovhHuOqdV6Mg9qNfbxG43X5p21ffDxBQKAVg8PfwZT0xWMiT2ENmK8aisQF/yX2mghiHWisQK4rrJYOvswAPinEQB0U3woYAzmOFmT1me2KfX1prfcBRlHNMFbvDi4OxVSpXCugKZB2FD4agHvTnDpvJsfdf5sn0Aj0MJmwFZcmkO013wX4FgKeBxD5q7IErLRsfOYEvbgTMpKMDa3szk6rk4lZ0+RPsX4bbXktwD7Gaszon5pPiwJFtjKOLYr/HYj+p6Zcwhiz7eSPB/mnGmTeDIweGYlZxqtw2rPRSUmUTjGUJtWc5SdeYmVmeZMqM60aWDCK2c0UnVGWA3CC4t86DcHyBZcRsHc1q+golKULyFJtWcPpfYI5psKXAF6BUkU2QV+O4+oAGAcxyzZh6KQIEyAX7QX1orhmWCT88ZDjztLdiRUWIkzlQqmooErAY5pDxZMSDX6gKUPr2JqEg7RvbYCU5Kn2kpPxqVe+eYGfWUYdmTocr7wUuYT6/tS2EVUJPcsR6L5RrCzAFBncWeL1+5Ni88NzeW7G+Er+40KfMBgX/gRezWf2C1D6wzfHVZO6mPbgGRKgITSwIn2kUi5rqYEf/bXtZXK4qMtAxh/OX5MFcXMR7Qp2KYvwbEVmeyvwT8A/VE+5Xc8M9hN1Vd4MWl7UNkyapJvewawfZeSlbNIIduArSTaS8gSScMFRLYRQT9pZp7T3r4wrS0AWKeYWat8BMWODTYIqIuenq6et2uMfAGI2sXeiwZw0d1q3FpgCkEu/yB9QAL792/aB7RJPPOOAsEf+NE8BACSbGZ2gLuhM/N6Itb6NEdIvXvOY3CnofBnNk7+7Pi6nVBU8f2xKsKkBTzT/OtYBXxotrAguYS3DWwh7bZfDwByEYT1j0rXs2FK5rQvAQGGZP4D3jZADkfrWnyCVoWtAVvebGusj9boWW+u+G+MO4g6eXSDdtxXeE3gq53LScVQYgb5nnzF5A8vFRCERpjGGdhbmyNjT4SUupswvJkM3o83VOTDufed3eC+UP7Q/7I0BZ81nrnkbAIwKLU2qiAGuBQpHvKDzL8bxMjREM8YDf5PKgDh2K1B/p7/9D+6LcCBQJYgk8BNCWgUr84IbwSu3CM/eV4yam78x4iK2e4q7A4AOIUQtQO74mCy0MobxtpBzgE6BFDbHJNwiFyLwyJqZgrZ0TkdGQSV/t15vM6RfQAA6I2/noURAzhTn4e+3bgPdcp5ybk6MZwNn+lQAYDoiFDvMWGyDuNUMJwgmarp9FBrdk7qxJwkY9XIGWg4c/Mc0sGS7Lfk9+6CzlOkXo1bFndMwN/bXljk3zmEoofOe4cg6hSOiR8C8A4AXG1d3eKVyznpSzUEDqpMQOg8Pjkw/j+3jjWN4xaYSb+mFXB2qPWIdDSqBXMWJBUm53UmA8tTZWMnAJCDPB5VF1Bk1OUkuqKxD9D8eKYKxtlHdZRugivW10N6tBHYp1Mfo1LZ2GZOTjM61nYzVANM4X9gdJy/BzWnMWGTcgOoo48Er60/sXPbI+udv6lIy7XXNmCOUHnmI1qnGcZx0SekgXfik/0sdPc4ANjLA9K99mNgUxpSVPM0fMrOZII2vb7ijo+YQMRb6/1sA6A6yIvRzc3C7gyow+WSJnEx0XT/9mwqYhzroVyFOsD56zhnT8AyxTGCAoBTfUm0b7wgzZeAhC26QMAMABSQjf1MI56pfrt8gBZoag//OAA42NPpkiz3Ouq36F7RhfAbv/ch4pAwR/thc56MR9jd69svLQEm+4s+JjS0d+DsKK/o40p+Nsk/f3+iIRGqrO3z7MmPCIxTANTLLinlytXcuXNmNrEfzSO0P855WgDw9IcehfANlaSQTzcF5jxq5QDlnzsfgQV1FTmMhRNHHT6yvEE7JPasO74HqpWZ9qtinsdzNiWbsQo1TuDJvKmEeAM2E4o3mIDua8Jj7sUP1B6DzlP8kPdOtCbZ7H8sj/oFdN4Gjn5jiI+h4jbz33fjnViY08xvD03lxedxZAo6GzPsYDt2AkfwOwMA+RawVgXKLzfpv3sAcHJCvQOaEn6tDuPC2hdQ2nWr0xJCFbGwReYYi4rIwfQI+MffWAWax2t76gOIiXbZqPFMjBkAzAOQ4+w3YPqSVDapI+MtRttx7Oq/AzEeufS32KG7FSd2ppEl+RIfulu+2MGqg0po9U0BwMgLXuFHAFButxTBQnfMjgt1wsmXE8iPAgA9L3g29oxFJ7tScSOpUUAUfm8A4AZMnU/1lTRX46HFalPBXCxg1FU0pz6hiZ8+GwDswN8N7rgS+BBAnbEjwJrZLAlwHXHnBOsqN/Q5DcQsAJjqkFsswoCtAjVxRChK3ldkcjUlpNh2ChA4ctz1Tx8BACodtb6m5tKQwE5bGIcAf5KfjD5o2r3qTbmSD8en1Mc/7wFA//7J6xQMOxWA0zwvx0dOeLEifn01LSjYhIb8ilTYn8lANBcrPn2AAfEdJlBWm3sqY+JNMTckcO2rMYHkCnTWvfcCgFesVqrf3wgAlAWwpV8VjYYz1LM5+oT3Snou7WT93QYArYDhDqxsvL8dAJDm/bYdMcR7ZtLHFl8BAMFIZgDg7sJU/2pHAQDEHUJpfkZSwqBODQDSEUbQ07kEI5cyfz4fzeMUoJhW+A/Nm87krMh8IACIdkqA143HEqJJ5Afw1QOWx1EgAJap8W8VACTGXMm/bfwRAUAbcQX/0RRHkL6t9kn+0H8Z9AEYMy14XpsTjNlsiXZzvQAAduAtAujc4+8PAEwSxmAVCm+vAKALZ3gL6L6lNtljDPaIL4WoA4ouwJ4UZPqexbqOomZAraoAPEbbrPBgBaCYQJLRIjIPI/stAYDl2goAgOaMvejIOgBwOVqsKPLB2+Y++FZMnNjiccIggbKpAKTxbCfFmY14ei1XN0l0tgUY2P/TpS10Ktddgsyrklz9p1WAKG48OtIzrbdj+bTBhxfTjwQAvQ3YamEuWbFPsDOzFYDIAD5jp7YhfQD/uRWAKM2Z/VMt6BNEluP9VFHRcAeYMVoGW/Q2ZdMtwHWG9WtXAH4LALADWNMkuHZ2l79h7dxB2hH5nAud/7xWgceDUn3TYXr9uSNnV2jzawGANMPH44fpGvI2vhjOk2TaI428DFSLAZcFLU3M8rc3tfjSFEwY/OPQpgBSE5JSDHiWISv/7wEApRL0ENf4c0fwDsjEBMpFzC07OG4R2ONila1U2EDrcgQFH3kiYEm0BZnuBf/vRj7Jn/dPn1IBCLI38bu3jrHCMojp5JrdC+HxdwGAapF/HwAgaMtDAOCB8g0TaMGUo19Z2D9dMljHcr+etf6eJUiPCbJVxz5Wt9tCbYWrP2+QCkiqOl8DAMocqAIQz7a1IgjjJYTTmKL8WfWG+EoVd2T2au0c2PaEAcD9kJ6V79JkAV9xA7Lf5bJa+AIArQWzAFys0OUYTvncWcDPAgDRaQyOP5yxDMp74QifvnrTn4W48kUtuQ22dTt33v5L454qRB/eAnx/y6/1yPR+TeRIgsuh4W7V55tiTCVScACCO9Mr3EIcav57Ae03QcwBvJzxVkx7BAAxgCKK7P/FcDnLRgGihILHmXBkGaOJ8Imr6Aix9Vgy7OTjw7YAc7u2AtDz5+WJOM5SUcdPx4mlq7TqxJA/uAXY347L6ZyOkn7zTiwGeOcT5rM5+JcAbnNKBiZM/hDRpILKVyjyGYlKn0x39bMrAOCSuV9kC7A1ibxdQEMg5chqO2zpcsFTp3/sbK5blOTJ6ZIeZiBso8BWxJ5nepNUaJp3N7hr7c9kD65uATZy2PhAqq6bsgy94Tkk/O4WU0/hacVu6nlfMl+Nj2/crhpZMvmhZ95G+fEO2srz7B9ocQYtdi7NzELPymvcu6khMh4afw4soITVXJwqrzDhj8Gj5TwG/ldmVCUQ/O7cXuRfvgI+SXE12lk+xgBw6NrYi6EiSUwdDNfzJ6hiJpBXmHMc5pZfdNbJJSDYXPAXyz8m9k1k9k1v8UNS8e9DejBuIe8XACIhTHhmzhqj4zZ8HLHiGeMzhgHbJPaadRAphPOL5/iJYxu7DZgTHOUrjaGyA9m6tJkixI9ePjPRD/5p2ALcx/culoWF1Cv02W+TAyt/rDzE/q6oUmsCVoACD3j71ftnewZ7PpZaxoxupy/P9q/Pn+b3J/sZh3Xy2VZgec6vcmmg+hLVY/GQcMxM3HIan7c2QCzZWfE/Rw7wOeEA4JH/BJAv2Hu+mUdnbY5Ac8ToAUAaJeVE50URZqbP+ReUxZovF/uuZhJ99/KNfptjhgkA9FJK4+AdGvQXyivZGr50stawKb6c9feajc7aWaO+egRSPo5Zf8K2WOOfLQCYxW/TArm3v3KJlBepmZDJE/5SH/8I6lZh3Yb8oV8ATeQb0TJUkyOPpthEpbL2H4+eAfi5AGBWBDk4Q/P12wEIVAEpwMHKGSvEFrBZUJkzOT8wAEjCsQAhBoXYoOsc2XBJETTc0pRVAQbT9gUAsisglfSAMjvYvVSnN2L5QNavJmnJP26vcdE8bgM+DaJ+irk6r61HzC1C7wYA66ziKgCIVYAm0ZLgh9cNrcTxmY2s9paOvYNih/Mu38Av3QYAsbe1gsqeKnHkXwDgeAvhxDs6gqMIwH4EAHBCwE603yZxQCSTML5ji9lEb/6ehk3614aog7/o3vXazbZGqiF4CDjoi9VJHNAjuOrnjonE1QD5twYAGrlL5MnTqAMsUhrWrkUSLswffULj+8MKYfLPOcAivrICAMGHdjoxq++9BM7OhzWA/v2eAECjci0PrRbzFieKQ0kL+bbejM6VaZd4QBTZLpRkbWmf+u1UAXgXAGSAgknS2e313XO6w4TGJ5RrGmlIv9sY/cYDACDfqNmPoZZ/BFSu2tdgo1uD08eHmz63zlgDfbwEAOoFHTRMB4idySgdTkWaK4vDWaAtVClBpAAqAf0liOvMUOfwzDR2UrKSBsgXG4AjBwBxDjxf0AaJB2DM+LVhcAKQXAAARXfcgoWpADwa5s8rtPJ1zljdZ+ElW1C/AECTC5M+mezOnNHJobq1F3ciQFqwR17cjjecAZnPeO0taHdnBqsRVsPaotc4d2OxUK2NR/AWoR7jd1gB6NnvD9mv3Ql/s22IACDrUyXkFwDoAUAo+RYjxlcpvkEFIH9mNSSI1hcAeA0A5PJyCXQhGpNyeRu0YjKlWxetd/SH/X4BgL29mBKILrnb330BgFfSCHHK2ZZplOuR3sFB9w74RwcAfYX8OqQ6/NwA8kJANGWIdxmCSQvUUtdASJ8A3gXg/IKDl44702VAoJKwWW5jgvnZACAv6iCAkqX5sjB15wxAJ2ceMBFOuoTN+q1L5kJy1wmgyIL9jsfoD7vnuN8VwGdywPI8+Y+7AOC0oG7GLAwgOTPVNEcPs4XFTqU/qgIQ+9BEJ/ZMCTYACq9KbwKo8riTW5ron4VXZmz4QEKYzwIAZfzdEUQYB6ZjE4z0nVb6wms3AUDrXx47o/QLACT+EB1Ix+22ebJSWENrAUC33UfyYDgWauF5Yiue5RZtlgzdgXNKrc+lgPL9DwoAstrjouFGCtwlINMOPozPxGfIiUtfFYA/dgWgBywT/9UGlG9PTxivp0em2BgxRb8gCPrGAGAVwOqIpi1nabYiH/pDzm1/MfgTiA+atU9pQHCM407QIwBI5yB4778QfWBBssUQD52sylPdiEovSz1FGusL0y1Wp8JsEkK5R3k9SACgVGfwrQtnKDT2M4N1ixZv8SsiLaaislTMILsVM/+78tJVkFHDd1I6mhsHlcr/w4nlF8+WRMhhUv6Z6+FlCMj507rb8qwl9nw2Vhw/JlJZAit7/7ks0PGObgKmufqKB0xmyOE5aa3OADxi8dOij1llq+U3q0iwvZ1bi49hXKL4y4tfSVNOcAik1al2C7ANPifd0uB5lqD8iUVlT18vLDSmzG7R+IT+cfBmO0NlRGgLsP5M+hW/dy7HBXSSYxYDqC/Y4BdIWFimS3rdqMzCoUxbhKcTB/ozAJ+fTjpa2/D2lsHyNfnCrxDGLYo/tVuwyAQGK1yPF8z7+6znMKcjTmhbox9H16C+2bfMK6PV+2J5XIAUR1iOoJ2MSX5KBezp4e/Y6w/BnuUlPmHjlW3T8VzMwm/fAwA5HnBbzaszAMF5Io9STyHZZz73inPox4z9c/LtW31xgEtl+yWKSQBAYxMbuzXZThrbTfttXoELQPbn8UZH41YubuHWEdW6yXQVz6YikjKy5OOu8FcueHvoj7gIjb/TbwgZR+dvDlCx3V9jsHmH+SF0626JHAFAvsmzsRu7o2aSk2l0R3z4eNEcEXOIqr3VsSGPePJcM4DezY/zp5o+0x2oeOj+7FfOfMt4j4WV9Up3ommsTEwHE0pxogCAOF+xUumRRXFu2i/bHQz/9+iNPGjEzb1ufsMzXfwVLwHZGQlAlpl8oM2h3/sSIGujQhg96rc9MxEBQMnNmwDGLNj4o1j2ETLdLb28xdRJVqOThhbNDfKdxKPtxgXlmlQdEScC28l4+47xOcuf5ffkg6wM3a4AHIbv7R3StVvYIn0hANjqsvX4k/2hBSjtFYe7Yz1zyTTTAmnS0+/5T3/7b1px887DMnAjZO2SrqHvppi9Rci2b4MBL8RknCBYEGtFUwjKv0voaXy6jYAIkgeQqwRax7fJaDJIcdtnaJG41xwWMHR8YfDQUwUSgp+wBZiy8mWAcgfq6ZUblONgwWtshYG/pxXtJnQRR9jr6BTBZG4b37EGpD1TLgRkfmRRHl6QP0JrNnFyhK+QjFfgdSWe+kDZphFTOb7K95mnCfLjJREY+K7hZDqT8UQkH8rm6bnMifuDiOlJCVeEbEcXEwDQVCIcEyM9rXmfUGLzq3HQXfAb9TtYnPaQY4a1Kvnc9NVrmg8R3NMy9mISnXjv4oleO6bvxzNIBgfZ6u/ikQPIquk81E0ziLFdNyAb0Hp77zsSie7JAN9OgLFRlEa/tMljc85QR/omwcRII/B2qMdb+5MzquwYcvugFqHO4Hc7jX/MvHGiwZOLab8fCuTUBGatJEcshPFNCLV7oat4asHwIU6oiGDO+Cwq0yfhZx+TyRl/NsotyGAeu+kosB8ff1z1d2ZOMG8vjt0Wn60fXYXXvAGz9c98jrCPiyd+4Pc+/LN8iPEMvku0nFKYPj6jM81qD/r61CXQd2ZaPTvFj1et47X2cfF0/96dgX4JABzo2xYYbAk1Azc2ZJtmJwNgEHdY5gAh21pn+7N48C4/J971+rfHP11y0rKfCyR43DhfelFlG8E/fj7XL2uj/E3ZfkCRBtH/qtdeZ92p7834jzsMZtnv6Mf1ima2AGQqGOidHFDuxPqlZDiADceT+hvvbxOHagsXYIfcIJ6lLYWBvJodHPGMuc6/a9Z48qZTHZ3zOxtsEjHhIY5pKGZ1OFSURxG6ocRR/sk+KuirFeA0y1X8En/0s/0mpoTOPpl3kzO+7xZICJZUjsrrpy55TNnF1oIwfp3r5owTOqJPrbc+/nn+09/+28GKYoNc0goqvW/BzJsIQxEA0IRoGuRvxsWAQCdqqRwOwPe2LQCAVuD2X45WL0/2ntPp0PxQ4npzO9aVLQytRt0AAEm16BIQvqq+8n8qV0MQ6JijFU1HYdsAeLaovTizY5sDgbyn2HpIGFzTYlxYbozRTAxaSPAIYCa5O+f2QBDNMmkBQHvQrxqOBbCoO4+2sQEA+9za2slDA2a1ZXnOoUqu7RgVmDdnACYJl5Tqk1VUALCtAJ2lp7+Fb93SXK9vUOu9ftgtwm48+9X3yi6xaAL4pu83ADjHeTecun10usTo3Q1ffNE7vOm1CABOxBn47zqc+OGod6HCGfpvfE9Gh1k7nL89f6LEegAwSnPXyxXaDQFNYp911PMVYpP2derJ71YYJW/H7STonjzUx1lKsFgJ+I8MADKh3wFA+i2/d+0BGVmN8j4WAJysUc9v8sN3tdjH0M362eDb5v5n/f4+AMDKCjxGW4jMhOgsf2QT9AyxVBI+CABsahjDAq65ZRJiLRnfBwOALn+dFSI80cmY32EWvWt3CYK03BjwtUCiFUtWXkwuuwPiTM7yzzmxp8q/+z9Zq6slBgCrVk31+IVu7wCAW5xONSOPjysb864IYK0psFbY7JEoZkEmOUPbHomkW6F9/+onahvgx5Vy1z1kx8cFONp7DwBivkEUpN1e4CBv5kN4xqW1TcfxYXtJqvDR+qt5np/fgYsHf4fytamaHZnD5D4AIPIt5oOW/7ZgYvZvXQR9xbtY/YpvxB2S/qbuaPNMReGfBwDQbHU8JY0YYK8E1wq+/kXDxayEJ4BaAQj7DQCQArHIAB/g2QpA+/z+yynoFwCoYYsuP9dpkj9j6wsAdApn5EvlX012LPnf4J+ozdEixwJqdl1yA2Fm8JSfDwBa+wCOrAgezDTk0pKjye4mYNTPLwAwJ+gEIEzffwGAzkUbxOeSi24r4ENgeSugv9n/JwCA3vJb/eVbxrtMoZvDlQCqp0FYkTY28LcHABpKu4B8X+j0/PxkqgyOvFWXX4wVbLgF8B0AHKcR9nDrC5nlecTEc+/o/wsA7GltqiXCo71+bs1sE7JZv39tAHA2x1dscEXjOj9hM8UXZaQtfOcA4I5AwV+OAIKb5BWAbbYUXwBgRqMKACSdpTc8vw7kcqEuGRCApoLSVwBSxkIVjd87ACj06SpofXDkwb6EMV8AoCeKldQAAG6Mhp6Z/Y0WkAmu0wGACx90h/x8LgDImJXqn0fPPCA1FSREgNz6qwxQNujbX/5VXQHIZ+BgGXMIGM3KMmsEwBsGYVO3Z6ACfkYAQCsk8tZp1gYtVgu9u+YtaHpWlgpcBQBy77utsAXYoyy2PYN3Dt4LjfHs6HBU8HS7su8ToLXioOf/7fUEZ8QMBwuQFcf6OQCgZrJ5+IWDRgMSELALHHCy5s8I8vThoa2u0JEWPdktkOulUwEIz6McsExOACA5KK0AzOXuuPTCMY27z10SxuOU5lbzxRaeuDKhIB9PHW/jNlufXaK3n8fVPCkTj7d0Rzb0MvHtKwA1tKAoyEcR1y3BbukjtgDfVZsbQ/ytVwByKHuViyO/DG2vJJ/R/6TsKQo9O9ZHX5C0PFZ4d3M4Y68GsQfQ00Bc1HnU8uEiANj0P20BliFmpPmELcChG+DrAvOXPfsFgl4G/rzcMTB2DQDUXrECXmk9S7/hk/N9nTnJ+Ms0n3u1WwBFkq68aIKc33MF4HG+mXx/AYCDJ7TJLXj+/R5XeVWbqOPbvrtsvxToKvXSbLGO9nWsABzOgLN6Pvuvzn5eCzM6Kn2rCkBnLM6fxvtUBrDaPSe57hCceVt2Hs+owtxAANADBKbCCdqqePG+CkDOBSbZXDry61QA6nxnGb4mp/TUCADW5vbU4rFU6Q3SKgIsK53M0HfM9z0e+cPOhI+YkE+/RQXgmT/urOJiL1KhzFrSnEjm17lIcLzAay8/3x4ARMnisYmy90cyJLGwOaLl2Hve0sUmp5WGv/yNBQA5YNTg/xDXZP12ElZs0CJlCu6H4ysAY6G0f6MKANdz+xpzICONRs+lU0CGrou2+uZurQqXgERj4G8puxNb7taGFyYAsgdxjrGQPohCuudvXUKg3EO6qmPuw5D2ls3EMl4+ExAU3fIfCVa5uc4kIw9nbmUVJkKb8wuOLz8zksdzLBMAXAu/RTmQQ0yLCkBsX4xk6agjfRA8vwoAij4tfXBO4Pn5Jz3b70yzc5l7RBiknNUdI3towKFNHocEMHssfYBEAN/M51xiZucfDbCzhmF49oP8TItOfp2THgFAPHM1tktnLH3ez1xh8VjfPffvt21v2e3EIu3cAAAgAElEQVT5j2GH9SN1v9mZeWIdjpg6CVF7HQKwWOFbSfpdOhkrW9qXK/QdrEEvng9ucbyQQg+E8WfkonxMyas9S+gKre4/k/Hb+Fi3Reqy/2W76y8FYlkQG33NtlZktoeux/n7Szt8jOJ92LyFyrqDCZDfK/BJJdZV3zm1P3E8W0jDdz5iC3A/Bs9f+/fdCkB/TuVUAegvuZrode/7a7L7/jMyavuz9WHnFxiPx9F3FZpSYdVOo/dhtMCh2jkBgOESI9d36bsKxlzlQM3XzsbP/vuhLcDJFlMcJ43sBPjvjkEbiW4AmSoz8luAQ34D9h5t7T29oqe3fCb+g3OARZtpga23f3GBr69ItbOwl0FWMyQZeq+cer/nAcDpvLZwSSPXTnJVnFmAvRHlHdnBLcAhntk5eN/mfAnfNKZcfzW2bqi/7zBY78PT3le3BRZzfNgvQM/vd2esi2SJcEV7lVYAojCGowWU3lPssHX0n/7NvzOyvQIWVlBWCf+3JCzrSTkoNnFegsZ2QmC/CyQtXtXnYMIL3jq3lLJbI6GGpyUj1eRJCWAZQH+hCtjvue3pJqvWtAyW5TEAkFZQFABZ44eAQy4BoRGiwVdj0Av55wKAh/ZCI3vBCB3A6QkYeWjpj9/PClwCgNIoSMganrn0g2UzCjEFdusSDxJPdsw5AAhl+xcOsdX5xvm9FwBkNdrUA5IvABBlR2xDIddS6XcU1J5hgVufSR495ShwPmtTDABaC3aGQB5O2fEeF94HkESTXob6RLE/r+FK0DUlmFPC/wUAuqDQHdI8BWi+AnCSsgkADJbCbbGz1otk7yoYcUWeKp+v/sC1Mk24qeBj+9eP6xEd8f7CJwDg99JBxEO6p4o5bOYzAEBP7owvrPNLViygzYDDdUmotliz/3r/4gpp1hcAOEj/cETr5wOAOL7o635sAPC6HrzvyTo20MhwlSzkSU6Vd2F8N0ITQxL/MAAowV9GoTl+eh9de5nUb/v+yf7UFULCvSp9vQAABvJMeIgnSONffXaB481e49hdhpABiB6wS47JusozusEU9g+ejlmu178jAMjnpKedfisAUHPjXNwtU5G+J82R0d8BAPdLWHErzljtyvL1d0WK8pYT+/hLVKD4go8n6Nr/LACQCTbZN7O+mZ3V2wrYvEPk0wHAkLtaaveXEvLLtZEYC8z+6X9vAcB1a6k3JOiIfIOeQTx8HRp9cjVJyZxeNj1qz5nAU7HnQYr3AoCrB7tFEKoVT/cEQI1ZUJFefHYF4AAAJiswRqQIbWnn9+kAoLtkA1eEffUlERmc/smOCvN8eJKmVMKvkACdW4YwyDAONWyJK4K7ywCgzmqD7bcOc4+8+wgAEIV5A4CrG3Duarwdif0ZTuvMv3OQbYh7wJBE/tGlKOvzDZwKCz2t357oFubZUOZBzRzAfgGAfTj4W68ANFsVCoti9CW5NVf0JUv2GwAwXwCx/Ljqd4P+hUrdWkN692d1yAJWcIRBKUb2/QqQyl+ffXNdYXPiFlcg6wHALjj+aAAw9VRuAB7w9wCbr6jrtTfGJ1K9ffzXe2Mf9tRfAOBgP78AwElEH/p+WkB7qPEpdj7xarUL4AoA2OkfmYZ+AeVRAHCQXgoML4BY76dzZ+P7+G1Hhp8IAK45XbHZ5dwv3M+G5r8CAPEZqQoq2g4Vujdydz+P6oI8CwB2uTMv9Fde9vMAwO3nYIeRzTtppjRylTGHRuRyb7bczfmF8iPPYXbB0zuU5woAKOVPHYuGI4xm+zrHaN30KnmVITe3ALN89vTreDSPfawAPAGVlyWecwRYY47rIn7z5yQbz/+VAwA3wxyS2gOAtnvI20FJ7gGAHkww8he2Y1gF9FuAdXTELBVItYBWvh3cMAI6sxBUArx7mgK8BWCEcxRPcsINl1y2KzAHMjEls5V+aKLWaj/dQjtJGbhBm6Bkbeshe8u06bX1RCwC/dgAU4VH5J88cFZXdYD9UCMvY8IZIW9pcw1nlJcz9pNAMZ63d8K9HUBsrYz5xO7wOjeoPY9Q/uK293vewwxrrS7jFhYD8HF1sIoH2hH6naqXsiCJx8k6oqJ+wlpefTX6Q43pGEHfHSO5z36FKbj0QCy/xcE/0G9heqS6iXqaHGxbAbhvwXpsC3AneWt8W75H+wBUmxqER+80W0q56y9scRoG74PcPEzT3m9XALoEypPzSvV5BgKq/EfKRD3NY9lUOwL/LJfCls2RifEBc2RNiTB7TkTBsrYQ+2H/wRWAEEW4gLcdvtiiG0Jt5NsZx+KMZDIEZx3m0GP1uMfmEtxb60fcBgiLoaqpSLjnR/hpSsAr+qxbUk1Jgi7lsK/xftI15flj/cmqwB8igoWQnF0xx0VTXDvK7TX73FGNx1p3RQth9wys7fHqPDjisv9S322VgXPguKWNbzjtarBofO/TnysSOfnPK23Uz4ze4Bz/knOYWDtZ+Jo2DA3Ux4wM9k12d2kfU8WPpcXg/C8AXDP9J9mwtLXxKxVYVfo1c6+WzaxNazuLmcF05ujT6fKxS0gRGQdWK3ZzdiVVGAvMvPBP7LfT19ju7B1PRcNbegYDFeIv758H8eALJnQIRDF1efx3xAvoGZXxwK+s7xsA4M6Ntv9RyfG2tj/DPBLW+xTcAox+Tec2+JehhHMeXy0jx4O2YjcDgE1+c+xbF3/MvrUf/2gvIdHVCzXVenRnbOaEofGoLPYKcBsAxE6nAIVjk24IlQP2QAW2ZWIeqJAgg3FClIVjho5XRVA0mr1h8wCcc3GM3Ny3jmI+uleJPs6RuqqQNgBBIsh72p5HqIVkFwLcbAtXOGy8Dd688pxxnW0LtFrFmY11x7x1dAXwls3O4ScVNC29w5kVrfSepgpiyTmGoNDnDQ5sD94uQ2KHO4U1Ood+m1s319XHdAZN9b5UtwAAyGAeXrgj8ft5wc+PbqG1PKyCDl69xMoaLIAnKnN1YB146DcEEHYOYDLgfYDC2zPrEGcKcCY5mBLYd5qlS6/R2Poo/m6CNeV7F8ySG3vv3ufqBJueijycaZMvUi4twFUsVTLYKSDqkunM344JPA/GV9/2lktqV7Di6wK7KfC4YjI/JK2vUiTrK1RG7cCAaxo0uF0Fl+7oqdX7gdODSKyWfVizpC7o1K8Vcwtf3l6ffvrDOof1+ekff/756Q9/9cen//zzz08vP708/Rd//Kunn35+enr65fXp9fWXfecdX8qjcgMCsncc3V0QmCxUb0p8AuKiK/JP0IWtQOyFLZUOM1wGAGsGUgDuDha/ZB3PQwPAOOrLcArT5D/uDNU/S7Yt/fSi9kaAKbbWW3Rc8H1kLmUcc9+h3BzGoB8sX2mrJz6+M8bUIWAD+jv9ts5p084xH9AsASImTPj74r6YtySiNPnD6QxIY5+nYopgLgQiLXnaVfCwYUIIa+84OeTK2CaUTGiX2YJbrEcA8DgN4aEDAHXCzieG/KcfwUwfJ/9u3nOF1OA/tvDmOpbFS1EEIX/aupMdSqwM9ZGFz809tUIBSdhirVq2xVP875EqbtCBVdIu07MKBDE2haIJSwcnA6dPijVq+1VFX6btYlxKJ8s/+zgPpKlydACk5KDou4opZBWANv6Jsu/zGcoHsAMrIVN9JtKXMo2VP8DdGU0F43qcp8+FKHSnAI2pqsBF/jx3W4ARhLsgX7kLGyzYBACyzeZgRMgtiqEKlHVlFXAK+PwUevBvy9iDAOAUTZCDtEaClvsvuoZ0zxS1t2mZnPlwtWJnh8Y7PlcFsFuMpj32XnlIATiozQFAkggCALnEqKOi0spTMbwVAoh4yH7sqWkVSsj5PZTjbPibIugks6jAWthJhPoVtnOG39gIPiDBBFUAosnTBE15y4Em3fpLDdE7dAu112mmQdBGOCuR7bupEGFNGVZ1kb5qMHMK9ADgXMEXVxiN+R1XOFleKv7cBdhu8Xl4mMaWncOpL05nEFpqnHyzjjmumiZpVlfV8sn0gFu2xeTVYJ6eP6wPpb90FWtTwOjpE5S5ScLQdIjMuwr6yougDuLvmTkKc7goZA2bL7bAVsCPIAnKSkZvL3b8KdpyanMHWONAGyq25VH9NNerWgF/jvzfly6R717HJ6wbf//whz8+Pf/0Qr//8Y9PP//y8/79p6eXp796oyr69cYvrz+vkB58Nk7sWOnbAOANVoVH307CUxH4+enFXFoGwOeFLcibmy3v5niQyHH4G3afXJj7BACOVVBD1DK+f2GMzSO5HbukFKo/t622Dmjyfw/O7gDij7Xy0NvDGVXG+EwhvxCrexDzpeSSBn9pkJucreCkL2sV62X3RPst+ab46T0AoFJnzAioAqv4IZ9qF+BpQbleF5VYOWFR915HJGzT6EtS9Wf8d1LBbeZ7Ks67KigCMDoja7/z9qSNr0fbNudnk/03DkIAQGYO5jAMyPUFJ4ZWyfhjvm1lUHfkkFwx9diXCbhzviB6dnKMc+BFxcFigZ9bMUb309M3HxcXcqj10D5M7nvmZZ93o/EAIFTnT2Eb56XI0bHgw8Xv9nmmNdK8wWo2gAdz31EaAYDM02k8CADutw8AqODfwL/pEhAO/usQrRemiQnVChAaCiHn0UtrctChxbH87gHAlD1Es51EeIR/CjKgvfX+twYAycER6LBkhC+tqaSQDzKdzCRHMnb6s4NpjW/mAM5AWC+8/Bt9E289aVGtg9ObLx8AAGIQyONnHik9lWc6Wr0FzAcxrP+ovz6h2wEkbhH7AgAfykXuvoy6WOpf2BJf9yKWvBHaG+bpqPSQhLR9FQAgCrwf0ALEwU/52dpbvOnbck6J/fDPTvq9nkf/KSHKaagK4IL//cCE5a6c9c9n/LURAiG2GaXwsxwE7CscONqsOPj+6mySC50HSeIKDn96en1+WTDe075B9fmnpz//+S9Pf/7zn57++Ic/PP3xj394+uXnn5/+8z/849M//sP/9/QPf//3+++311UK+Pr0sunw+vT0zJV+24uLFE4Bp+HFmKBNnP4WAGCnMdkWYCsn3z0AOOVyk4EY3v8CACcZfvD7suA2s2ETs65EuZgvzQCg7/HeGXHD7qlwxno2P08HfIYWkOXnYgWgWoQ+Nthu/gMBQB/jet/P4X4X40hKAIUCJt7Al4Ee2rY1CB7OigBgOkohOQFWvZHpalV+BADQAESbHNWuEia+BoDB+wwVgDUASJW61J5W7SoA2NkG4g/nT+Oa5BcAWBIzrwDkxyW6hhKX3gYu+Vf9tQDgjvngEp1gi3cBF326KgDfBQD+JbsFGBIYKaksrFKHzgoY0MhmdQeWT0BI7DVbUpNzL8EzC7KJJnjz6CvtknxvNIA4/bvxmK0AhN43ge6mw855MgD4zmZ26vCpFYDnht3dESkXyZRWALZbIGULMU3QmedUKj1gPG1B6Fdf8kPUMaTBQ1xRX0jWu+CnM/j0HetLJXNbd/ctUjcFwFUA4jKVjNicXSNWylQLUgUgfedLt3nMZmS4onmm/+0BQEuraQsW2bGSA0OFirV5Gcf7CsCbfJ1FyjzBq9+dTbtToZjqp2v83ow4UKvfatlji/FJTpsKqT3Uc8YE+ipjdXEF8XbCcpNB53G0A5lPDkEqvncMZy3Bt9xfbnPfN63zVuYHebQ4avi9Yrr4VG3z1wQACbhca/AUGK6avtfnnxaMRyDg88vTf/PP/8XTf/3P/tnTf/sv/vnTX/70Xz791U8vT28/vz79w9//v0//6e/+09N/+A//19Pf/d3/8/Qf/+P//fT68z9uAPD5ibYDb3+65VnnewsAPC7qnk7aaGjacvzyRLfM80/clVL7yB09GEWMUhyOkHQxoWwBZp1wkx3juU+sAGx1Ugj2WJRYA4CdX1N++Usm7qp6ZUfvtpM/z2cEj1z8mO5CK7yHK9Mgb8OujrHTRuthd02xByScf/O9BgCwVf4hRzmXNnbE7bexfT4AONn/rgLwuE6KG5z9yOLbzC2FfBMaw9zcx/rcFr5Pv6u9zHJ35G8uccjTt+IMaZ3dtFHt+wYA/XZK2FiZyr2LYC9XAKK9BL03FYBnY6imUsTNG853c+7CmiT62LsVgC47Kgeoz1kpsxWApEE/XgWgKqkcYVYYOZv/LqrYLcD0fc3kfUTk7u6dAOCf/+bfGw4woMKJQty2pzPZwx2ueeyPeD6HxF90r97ISeA6bPlD8vk92zEAxHTdorcZGyi+u+ac4/jjxHN6stE9/0pUdEP7ExqvZugMtosMgMc4seez+P5/9t5zWbIkORP7jkxxZanWPYMBhiCxpHFJmlHY0mh8Esp9kCVtnwqD39ylLX+QRlsusBgAjWmtSlyR+ghaaA998t5b1dU9lWM9VZV5TggPV/GFu0f4dkERkko/4ZBZ9YQQAA6qyDqAZnDCcKn+FDB3DABIDTLt0Zu9tl/xzYUtBRkCEmuvW5Sv8JQB+bsXOcQ2a5xBDX/lNmh6XchksxsFAiZPYgUCAIp1Eh/XyXFW3gIkFQur+Rl9IzPy5MuueHkupTM5beTU+27ItpteLRXnNAnwes+8Nomak/VHqLN8iu3UMUyjgPuUkse7ve3rTne0efWam1/u9/jI+eYjcQJH9YniXxWRHHPMPEA0EWGQ5TZtB/LUdw/yQhsQW4rzBwh8/ve45plrtsQtjPlZqRUIrXHKJod+o21kKU8tYQLfn2I/TFPE9Rdfyg0Ai/TT4F/RAHWLqp3j2fsf4ONPPsHl5QUeXy4xqws0LCqe8VQHdB3w8mqNly+v8M03X+Ll8+9x/fJHDgA2tdjcsIgDG+RyHPIEGQXF4lc4cPwyu4ipdfJLLFAfyhyuhNsQ3oRb08nyBh3LFRpsQlKYLWH0S83xDQCA7ghTNM9Gfzhz4atrNehyac73PUaWXI8hfwCWZa/sA7nx5353O8hzPH1D1fg03x3Ln9kJOg847Q92CCIF5HPmxfVl/ZHkSxWxfYPrP1KNKEDK+By9BCbnWeovK1/CUCDNm1NWPpaiHPJbLHDDmbT6Z0jUchzF2uXHOc6DdAymfdsmCR+HUNyr+RbqPb5itD6K6Ck2emk9MiUncim8uQCN0Dro2XoBFoxfmb0QfGHsm6QRiYzTe7UUvSbYP1fGdASmTC9XScCKU1165A7QLF1DAMDYCrqBVzkAMBQ+old8dAB64S4EOcI/2JPeKPEPOQ3cEjqkPeWDy25EUEnGvzaQ7rF6NPa84/MlbyG2fT9xKZYCALkDKDM0jQx5+39JuIIxhtzLymIxQvoyyqM4+R/+haXnKICgIq0oQW3jNQ0AjLuBDCBiI4w7cC6ZLYFxgQvajJy46xzZIc42wEKdS9FvGACkNFVFteXTFpgTmpWPcNszzAKAVpTC/ZiWje9tBAA1+KdBQFNrQwDSUshkCnCUCk4EYMxVi8uII8zBjtJORIh/KQ+EUoCpgbozAOjUBlMKNm5QxWYr52zwsdEIQMfr8HmeKC9dt8k4KzyDl8iqru1ILJQlb0oZBdZCOzk09eE1A4D2fH3q5U6A8qmJaRmfBgBOWtU7KJNQWvcxzaTlyzitkTa1MXh984sle6gRueA9Tw9xbI9lMwkgIGz2fQGUafqHbtbo392IZ8sWJ+oL6vnnPIwcOwQcpONWc9r8/WEEnAXrofzmNTe1YyO43Q212kCJaL8KPWqM9Qzt8gzLs0s8++BDvP/B+zg9XeDyfIbFrEDNKgN2PcY9cDgUWK0H3N5usFld49XLH/D155/h5uo5xn6PumZzZNGAxAVzDITAB8yK2GuTrvGrNl/HradNVRFhTWyIcstUPoAzXqsvL8JItmU5hSkd5FozdyYjBl6JMfF5zQCgu4EM2XfLfk5BNch0rBqq3ob54f0jSklXHrLy9uAPTJlfyKucyPFeRkNA59wzCyRNkhGIAID+XiiiQZM2Iq2b2dTcwAF7f2cqYuneHf59EwBgVGSUgkvtX+XLlk/gq5Gg362bz/E1AQDd/a6tg9WvZkZuhKUNMORrXNtDs8PLlP3y9/+GL0ZlfyJz/KkBQC9CVoGAysdL3RI2BQB0I86tmnBq3ysj91RSGNXPR9TsVZF0pq6wbfo53GHpflFnOPqR9jW+P7MBwFgkH+cTaw9oeqQHxJxrfoEAIJuXkhWm8fjRrOIzx8Bb8mkrSwm3qytEZIsZU1QsYwAgKXBKF8hlBjcFz/OhMwUqRQpkhMliaLHuRCgS/v+uYbD9VmM/rFus7g8A0ghAbwwB4/i2AYDHhBAHFUHo0iRire8SASi0gTI+ioNl9J92iARzJCNQMgBghEUc9zfnMR+3AVWypFp9EwCgt8ayc1c3CABwgvOaAADpXtJNujbRxGIAbFx2xCJJ8Zar4FHXWQ5vDnIA6nuvZsMDRgD6nBHmhclRFxmHMiR/v2QAMC+f6okIz05wwLIbpEx0t9FOsiWp8GJ63qsBmCwCn7vEIDN/x5lTou1urA1/Cgc+p/EsmmUADpe+/gk23YzET4jj65TTvzF9pqgQ+/1tAABF5F/PwD/+X4PZySXOnzzDyfkjPH7vfSxOT1E3wNlpgdNljWLsMBw67LcD9hvgsC6BoUR/2GB98xI3r37E1198huurH1GXI6qSnzNLkM1s4PRW0XFA7RN8zUmWR0bXyqLuHeTxGADQ3uyKUdj6MbSh9ecg3hSDtcuwu1z49gGAauhUd1obtKOEW0XwyBbeAYBpcyE4bnppHumf6vVxwG7Dh0cumjXK1LthAFCJvAsGhFzDmPRI6UvSgs3bveVbk5CLoHUfpvmJDOxtBgAVN1g0CpmbhF6c4I3rpF7X59A+MFUKjnVXtcMUy9i3QKtMLKpNXH6ig7d/M/N2ISIRoySGJQ+gIpL19gGABDKVEeBRpZC1d6r+m6Gbm4JNAzeCOMcREZRKMwWxErnErswrADC2DvrSG0kEvYVR0koCjDU/Uvl1AVUnkvWPBQAUHgetASj2x8eV0BAlHY6KAFz+j04KsCxwSY2ACrN1RZ8zlLr1KCAF6vQwZoJE0ULWSviJkEPndxM/pbBaVfrG2XC5Neo940fQE1uhimHzkk8OoKJmJNqyN1R+dIit4uMp1VJ8SQRg3i1IbX6k/p1iYSIajvWfrvEfTgE2m2bXfeAugXUjo6qxpqL+TMi9mH2uBproKzXJNBXFqUWcg6ckOVHy8RkTECoIACpeDVxybIrEhheFtefycBAAZOCbMy0hby4IGKAdObkO1cAzzdrOsJEHIjDyRMeM2RRFVTNMOQGmB3sy6p0kACgdI7O+U4TBPOPGbkmO1AsTMnhRZ2HKZAMv51Mw7TXI9n/UAw8RAShM39SPvUKeRrabyTpguV7VuNLjs+SL8XMiKiKUApzjuujvuuNcC3Z6kOvkUY62QY8cfabcwm63cQwAmOcKpd1j81eK1PldDyKl1wM5VRPIYT3i9JOfj71OrNYfA/1Y5B//s2jx+INf4ezJMyzOznF6eYmyqVGUHZaLAeenDY/s6w4HbNadAABXBaq+Zi0Bhy2Kfovvvv4Dvv/+C+w3txwEtG6Mk06XGit1QH1/zLXfaWvov58naA4A5Kkv6hOQdwEASj6RRsbmhtCqiO9Efa+UdmIAoE0Dr7VcBGBA/ZnxpXW37jnh5nktHKETjT2THXhyk9OPGf2cWf5c63nuuecTWT0Ran/6wYEMXSB+mEuve1JgwvhZCiGNclIAELVpyjdzZ2tGdzf/mPOmG9HjdOJGYPF3dHemhrQUWM/TD6UAmy6m+UZRva0UWpLNlC6RD4Vk9QiZjHXFdYF3uC2eFl26s1Deq/mTP2Xtj1VWEKWT6z3Yg1e/sjfUzte8IdqhUcWc/xL+34MAgNn1IaMOpQDLn4UcGPCSe785AC7Tt5AzQ6FUDcaQ/UyVhDLP2ytgDvF8yrsgstIHniaXTboluOh6cR5g943RDAKHDXXGl8O/GidxSsS4++VQ0BWlaKqGp5KLmPk8Zl9iOSF2Tn20Gb9f9g1NAQav1jz1o9L5KQDo4muuFiiW/5MPACqnR29wSe47HYxQ4MkQMJ7iFFOgJvov/IQgR3h5jNzY7pKr6tQJUcyIhYhLzS5l8FgIq2rD/V3P3AUBpVZm9A3XzqOjorQRFFERcnqchEReey76Q05x2fiyKcCREMFCI5/STZSG3F4t7aIaQ0Rz9uVYbPXkAIDaPIgIQLVZMbUR4uIreMH+3b/FJ36LlVJccSNELimJSGkIYM5FgfqbjqgLkgRgLVPt+vBSKn3+kw+qKEziQugpkjVMhZO7KfR8PUgEp6CDDVi6ALk2PBESCIdQDcjmN2GvPdNluUN2CoTvEMYMjHKtwiAgdbzSUVy5mo4p5c9mm6yBKV+eHIE4wdIIuVef+wKANMLGplloKCEHKGd/8gB9XLYMv8YJQ+1beD3S7edsSn78af3n4COmOSlofg0duWGZyDR5ADrDVIFbMNWMhM12/Qdi76VRdzS802EAwbGcbs8lUlIz0f+L0Z/qJGGJqF8RpIrTFIv+27O032qB9uQJ5qdPMb98hmp+gtnZAvW8RTtvsd/dYt4ceBpwf9jypvfdiPVth9WrDst6iTkzRLst5tWA65ff4bvvP8fVy+95yrCIAFS604xbWnYHQKNy6utb6dpM0CSynbR4yLIUylU3JUskl4YsPFVPCvqbPB7xYGhQMTDQPKt8TOvtIyJk9aGVHq1vj+hEBPUT6IEbYRaaWlbOCaAVlJvMAk7JKIisTq7laYua1o85Ic/XGLNrqJkIQEuLkaHS8dAIK/WIO94cFRK/W+sVppYAMPw21DfWBtoZGpXBcOsBf8pyiMMa0dPn8jHh65EYS1lCYxofhPyLggMUqU+S+tkSGTa4psUvxJK5Zc5Nku7RnXH5bCCzp3T5EbMOFneyGm5DKivI1v9K/ykVynxrW36YpTEHMpweqRrcyeALaVOn6K8I7YxVkfMnwTVxO0aiFycAgLlly+kXGvDBxpIgdPsAACAASURBVMvlVat8R76CpsAu02Hzgi+fqb0p9b9j2o3Ol4/XAQAtVSPXjnp47EAtpBVUf7kDA88+OviTi+ckS/A4h3u5tbQcDzmLWIa4b+sFx1Gfi0uXm5YdadBAufS2aFWiz1Yuql3e4+J/tgFAFUGkhVkKRYwxcpeApBDYuwKAyhDkF4QVUSQuXc4XkA1SBjwGAOQE9YTQ3FhrMacEP6YBgGpEbAIMIJN54oEgBX9DTIVcKWz5Jw8xTWX5xx1QMW5jAJRgWgqGgI1Kodr62qWNmp/q1/SvgKMgABgBKUOn95YCYZvLlAcgHejYVUtidGkv4C4AoB8lGuP0UQJAd/EexDtRAFDWv0zNjzpkaoS2ExDiH5VmKCL9lIs0SNkM6ZmUvGt5I8AidWjFesf5mPJw6LkcAEh541jwUjlAeT0WfoLRmumn2Opro3kX9og5TQ8OAJIA3cxJeIgP8gDU1LWP0DhhM7j2U7dYSwVnj8d2kEM9TAMAJxquQAdB/lV6LQIgmDqrec7M0z/ThusgksfD4yDrSTeD+r3pETjhGn3m/ZhZsWYULJvgrDs56LL0Y4Y0PQcAZxiqE7QnzzA7fYrFow9QzZdoz+ZoFjVQDegPt5jVB5wta8xnFT/02HfAze0e65sBDWZouxHYbNGMB6yunuP586+wuv4RRb9DyW4M0SAg10r61EJFa1C7buTQPJfnlPATuf0bLUvBaKcOLBX44Gs/nz/uOjbPoc9s+NXaWupWRgRPGsOR/KyzIlTjrppQAGDUP8rrp9Ah3rG1LSfN/bU9lNAHjn/qDkFTJ6p+VcoVfdP1N1zj644nZZ9yRJmyfok2itgtruadZMaJVgopD8QWGnqAKAu+aBdKNWeT29CH20olI2pfl0PwkiSUNcru6h9lAUA/e8jrKqcAcyxg2Uvp+cqagBb2HtiXCjrLS1bYOFz9w3MQpWMj+/FVDOFBQg+9llaQRwQAjNJftB0Tv9gFLIYkedkSEaZ0f53ytfz2YgD61GVL+wP+/pTJo7G/zniC9sMnrs1y9nzV/otShJoX7a+SB+LSLwD2tPdq6K/se2r/eywew/wFOr7jAEDpCx2RoWT7DGp/4FMgL/Zibdm+mM4gHDDi5NrSAJ1AjW5OcTmknwwAVMChW4TUNaVuBCDdBLK/p3X3OwDQBjWUsMk/JxiwHHji8hfdKLiOIl07sc53BwAtpf2TAoBpVe9FHAZQfc/xlMKZ90vuAwCKXm0AXykq5aTKGMjIQLT5sTQs9UhCp4eC91ToN7v5SCkk+qfnUsfGoJTdOwDQY0S9mnlGmuqv4OEjAN9yAJAXGg2TRzgsdpGTtx0AtJ1js0HRbph0OHIn09opvO8lID8DADC1vfVLJshNlQyU5SlVdwYAG+wwR1+dSQDwGZrTJxoArJcV+nGNujngdFngZFHhdDnj7Lo/ADfrDqv1CPQ1sDqgu1mh3G5xWN3g5upH7FYvMO5fcphxKgBo+19Sl9t7RM4aurZrqki6lc4XlrG3AQAUUXZhLnA3cP4GP64/vBnfEQCk7Viu0DsAUBiXOwKgVCfGLICoueR5K7ZRc3+3xpMHKeLGmYIXk004MQHvAEAL/zmWhBP2TznwQ+iPh3HQ9O5OsrzLHcS7lzNVNyyL/pVut8YsEAj9O1X1auyxHD8FMKoGhKSIFEf14RFYUQMrMkxS/B8+ANLeSeBVMjsdYaj6yMmiv5p+AMlxa+naD3vADwEAJsnnp8wHsj0p37wDAKcqCcEHArCLbyDi+kHwotgnSykIPixlV/Kyhb8EA3zMIQGX5UkRgPdKAQ5HmKkIsmT+v5MCrCZHxTQtbgYA5IsxZe2IUudL59zamFbokQhAebRC+1fRT9MiAKlCs1OAvQxfLyXbpZY2E5n6NrTP2Kz9a6ZfGwAonfAgYPwTAoDUIIbYiwICCuBSvJiLMMnz60MCgD74J+IbVYqLzwPTZIGmEBne0wCguvFI6ZhIxl7MSSCuhBWRqrk3kgLsGlrj4pgW6WZXOyzOpO+bApyKkM7xltJPcYBCDPaB/EvRFgV8jgSLQvJhOUATIgDdjLdcDVDbdXVHkN5AmbUNczrjYTdCwk7JzkvwtAjAKYYr/Ex47Y2sqxpLus7vkWv6+iMAqeV2tjAeYCJ/zylWrRzU+tANgB1zkFtBESFt8wdPEnoQALDFvjhFX52jXjzF7PQ9DPUS5XyJ2dkc1bJAV65xdlHjyeM5zk5bXtOPHeocDsDtqsPtekR/KHG42WL/6gbj7RrjZo3tzSsM21c4bL5HBZY2zJBYSg97U2T5XlpOjfz4fojc/t0LALRvpme92RGAgjdsH9LexN1X94l5hfWE0l1JHjkmAjCoqxM1rgMRbG8OAJzsUd9deT3ImzkAMD6PnOyHo5PM4akYPgWPlXND9UUOdEgRIW2/suR7sAjAVE+5CEBVFkaSympKF+HRfswbjwDMOLk5HvEzaMgbKrrH6iPXYpjWluZmgXuE1Szr5vhYdD/l0pZ7/04El59RkOZBk7GlvFmVvaZstUhpDX4yvogYSwiA1wbebzZgq6dHAAaacy9xs2xoVgLF1KM8FgcAhR/s6A7Pf5b+f06FkAWwou/IuCjwR/dFKVcrxD8BCuqvlH03Y/AZ41g85qePAEzzQNw/kf6TBAA5p0f4xNT+k6xEVQzBg0Kv5wFAOX4l5i5glQMB0uosHt5r1AVhYtkYZft0++LJY1QqFQD291zRSbq81Ek236uUR+0OEODtWONPnQsTOWWN4S0DAB28wAYjpANi1ofRw64BSIpWGUdcO+WSSyjDOzV30s75BAeKl0iJc3nJ+pvIYC5vZfWyC7i4LyQ2J3nTI54Q/E021nyQ5juL1AFLlZN/u4i7ojeRCZnCqkPPY0ouQWOpKg3E77YRfdd90O88tYF02cLtRlM10v8UnILeguWuKWs2nQIs9EVQ8QvfKWOd/EeCAGC2obSDpwcYGE9uhQpeUyb1SXFoILLHW5T4+zxDxklB8kviJvoPRvxMldwJzyUBVaG3BHeY2+j0ieNE5MSvqZpjKnvcqZvHubbwxkHoqSKcrCan62PBd77U0s2UalqnTHjTE7pSX4amogqscQu9J+aTXjfqEQ2YYT+eYqwuUc4eY6jPMNQnmJ9fcABwnPXAssfZkxYXj1q0zYiTRY3Drsdh22O76dH1LcauRLfaY399i9UPz1Hutuhub7C9+R44vEBZMABQjJGbTwosyRRn6tsY0JrYzyNq3Vn+SoIgvLQrr0NlHD+9NnKZwxkkhsjBJSYDyNVQNcsdU05xftfUyRnJkGI3lRc5DUKfny4FmMrNcfKe11p3JFa04RQAmDGCwanZX8atq5qH62Oa+YmWqP+Vp479xAT/NWka0++zX7M1wrO2P2E/+dj8GC/7DUNhrnceOAV4SoLisatinlfXeFJeIDznmSplsI+TKWqvqB/Nvyd9UB1uxmh4gP1Oa3pr20yG43Kr8H8SOlDaEtE374GXsFIUiaWYC69E1UALt6/969gC6b1MfAX9GuDOsxmDHUvJ9H2L8BzUGoVH6Mun1Z/7s9OFf8mQoz20cYxYOYd3XBCQs1fiDgi+hpkUYO/WY8Kz9A6FEH2mHJ5bJHJ8yfz7suZiVsfdXUPoGnWRJjwbbz3n+DmBNkqyPwrJy0QA0DivFgCYidjQqi5mAyZEfChVof1SOUlXpYbpd5xxpQ66+vsxACDnXVfOnVNaWykfNz6TziDeo+NV8w/XAKTUUSLh37Z6PA1ZBKBS1eJty+Fml3aQtdezVVEBXg1CZSDUk5Q+ZtxJn+Z1AoDW5OR8M5fguGN1eSynOpIRNgEFnmvP/d3Isw0uK8fI3MIWd+RS5pVvjpVMWOOVBYJZCjCNuo10k8QjJtMh0Lhl4P3fxTcJBydBcK1wI69bp22BdoQBTdRAuQ8AONHH9CN7nEtAvEsajuBAdbp1R/tgHJC78KZa18AJcg6lkVMUACAlpBuRG4r4sOnj2rUjqDfp0SRlNAAot2FsPVTKwdsCAGqjEphuLsVxEoU8o6WlPaSrLYutvXcBACr7zy3zPQBAUzp+hsNwBlSXQH2BsTkDmjPMzs/RnMzQNx2qsxInj1sszgq0LTBvS+zWW2xvdjjsRox9C4wVhn2Pbr1Bd3OD1Y8/YH/1AuPuCnW5QomdjlQS0zBRdSrCUfEp/dOKjLsXABjmUqH70gCgRLHDKz0BYE/ZV72xjgqR8EkS6isT4ZFh0FCUh/WKTA5K6s94BOG0Wn65CLqJhmSqLKZSdt02AhGQfjeJ8U8Yk01af0MeB/DUm2n60BtRJwzHeSQ0niNaydCPtZ4HAKf1F6NCijraf1JdjBw+MnXW+SUgmVs85LuuiIh+LW0enMhx3B0QRG94ZM1CZ1WTeNr3SOm+0rNb3JEMQZ1awxlqWM/ZukO52WaW6RrqYkxmvuIgo0Shb9pl/BW+51RLT+Y8T7v+wdXLr2+qBJm6bDPF4VEAkL8k6ZtYU+1CRLnP5kCvP4u/fGKFDyhMZ9nyFmRclu1XtvU1AIB0P5iyUcrFkp6XR0El4+JP/7D/7QcA3Ut0QkwS8Z2UdiskgkbkmsrMBABQCLBaFC8CMKMhc3up2OmmUs8/NwBQjZuKmFIEmlRaTvMKyl7y6RGAWrEoHeQ6jhM3eDkj6dcAJLeiBQFA22mxQ3SFgTCKl9JHvZdmOPdEP/n0FGNLIwC98G628WM1LY775IAf2tqbAQDD4J+234nppQ0YvTGLeHEqpYrzhx2hGw1zjhDZPD/FGc7Jm/O7rqsQ7jy37tqBzYw91g732/7IAcCcZIkDj+gOPfm6cv7st90NY3jrwF2KEADo1cRz33d6c1NyPIXqOIBuykmGQFnKWKFtf6wAoENjyU/sW55KJYnob4BEhJqKAFT6UqQAS7eT/yF9qIkRgBpSGmc4HJZAdYGivuQRgNXyEs3JGSoW6Vd2qBYVzh6zG4F7NPMRh90KewYAXu/Q70b0XYmmnvHLnob9DuNuhdvn3+Fw9RzobjFrOxTFQY9RZKyK8SrHWqWxcetMonBSAOD0GoBxncw2O8z/GwZaZ1PU1OMjlOtCV49ukELr5YpLLoXd2ow4L4f1R8DzywphysCmbFYggpk2lQPIp/g/96ihl9Pd4d+PAOzuO/7IAOPLZYBxw3P2+tjf5/OP/hgAwJh/M9l/Iq6jBUIwHZC9xI/kt8gOjd7I+YP5JAlvf+b6Ip69Jn7qHQFARTePfkovqkHRnb7E4nz/2m6FRgCagBPRoKYWe0XthahuJsQw+wLqlxcoGfjHIwCF9swBgCERtfYcSYBBjTgm0eISn2QOckaJhQFAZfPln28KAJwQ8ehPJ2xDXB7TexkHgE+VMBP7l7R3HooApFGsyseIraBgQzo6e4aGu39uAKCdOWqnqaeZkpKE7Y/cqGmLYrEagGqDQ51XRmc3wiyHIyXlM5jCY2sRc1kIAdTJkqeNiM0YOYOj5qyZ300BnhDxGBQw50vbcc17h+oJ7SwQQfcjdCSgopuVbryevNyYBCJ3/JHkDaRb9J5eR80ZjTQq4CDLXecnjLbTZG45FglqogF1Y5j6F/EJLOqGUnqi664NpP2E+hfvmxtwswKiM/OELvZER+ESkjZPo90yxoX9nK4RKY1XhoXifF+I9jUT+QbTyLffilI0qfa9+AhtDMXYrRqJmXm4usbmfZuvfMfM8ooilHf4XaXzHQ3xGoeJy0CEQLnDEc5pzEGJETigj72JkU4oeXN6W8uXsya2/p9yQhUzyIIwwSLPpM+czhb8mxKkOFMpXWR0knw2ExVKO2QVbi3xzl6KYcaj1I+1LscAgFp/ReafSwHmrxndpk6DzZ95BfUQKcApFzHtP9g1ooKjTdCA6ybLBghdz60UP5hQ1kZEKdtSzeSSbWikfeWBsepWUJZKK/SbCRBVdjdOU2XfdVTp2KI7LIDiHGXzCGjO0SwfoV4sULYVuqLHfjjg8ukFqtkAVB2uXvyAfrfHYbVHv+vQ73vMZjM0TYOxP+Cwu0Vx2KDf3qDfXWPWDhwAVJGfyt9jAX1yZoJLpK+mAEBNDV3HSkQGW2SS5tMXT1WagD1Now15SI/caDLasb+XGOgmmtx6HgLn3A1ZxqTYNU0DS5PWP2LssT6kdb7r+YR0NVI+mPZUg0ylvaeoEOVSDieAcZNAuLwesWRrimHUDKipHOgkH4HtvpTiF+rbCsqrp12v1G4lVoQoV2M2RjXDk2oUOSsZaWlqBODU5QsRU6hJ/km4MckeqK+ipUGybhyAMVFv/B2nc6M70hriOMoGZDUIAJrp+iUuIjLt0FD53i7h7PGatoyVTy+my7m0ZoXhdjLGyIGkGR+VTx8AHMc+UITDtrS2g0WPnVK6UclnvASYeDtRg9AhVYhT4jW8JY0sGfO5KQfIulLj8rsNsEl6HMW0KQDQnzGNmmN/dzMkKcm4dY8AgJqDnBrBnFtkDUsz91SpOFfHu2OO20jj3cVlInkLusO5OV8jqB6D8iNlRmMFZI2ygLekmiqRUshEcBoBqFiT8f/J//IvguyivkzVmLqrXbCYJMGsnJ3JhogT+GgQziyLUkp2l86yOUWbaQ417/6oVR4lgEQUPvEb2Dj4/GKbRrJQxoAapRcinT0+o7KFARRvmBtYRf82XekEcwrWHToF+KjiF33bzrL43XbiGdeyjYSI6vHrx1HDYG7GOUrfZYpye21FBZQ6gL6lUO24t+yK712HMSxJtnsZesalsf2MVn2W9bfX10oB1mNzPbb4RiE9ggD/eACgIEd8DY8SOB3JYhuiuGG0b7WVbx3FUHEtmJeetAbltE2muOQ3aNb8aErc1Dkmye+noE1JqVOzVvUtKBVc/ZobZsoBMTokvUbR0zWOR1DnwyaG1KZH2gR7LOnxT7GwtgR6AEiQgMQuSNsjbKNqywC7Ofr7Rc7JmBU4lJyGIyXeiZY7Asc+ZfwHqwSBMw4B8jFbwwSDpSINwvlEiU7WKmrLltsjFgmIqkbX96iqisvlYX9AXdRCRssRTVNg6Pcoxx7lyFqxByfkOayjuYXkh2FkfmOL/X6GYTxB1Vyinl2gnV9guTzF7eoat5tbzJZLLC9O0Q09Dt0exdBhv1mj26wxbNbAfgscdmJtmwo1G+NwwNjtMQ5bzOcDympgWcKi3qJ0BtRhnU5tlvaYRXDozbQs31DVDU/r4rX6mLwUIzaHDZr5DLuORUNWaJqK1ytt6hZV1WIcKhz2e+wPa5TFwGsP1iXQ77aM2igloUZUKIpK+C0AehlxkorMmyI16plUDSPxTEoCJgCAx5ov15WYFNURHiON3IzRRIhbbI55+5JPI85rEDO2CcRy9EMyhW9CZHgSQAoCR+6Bj1uDNmT1E/SNLEyMElrbKxdtGDKzTCnIaf7jMfJkbLvypUjErsvbUr7Sq247h5q62rlNzI/4O3EAUOxMwp9MhK0EOFL864uX01cUhHXsugzY4DZigpiYMeXkj4Cjnh/ulw9wAzxyNczcerI0BZhNQwV2uPTXUyT7fX0g52QNUfq7t67mZs8BQPnhvMX2w+QlCvC5+zFhz0NH2LIBK8hGM2yCXQLPuD6L50Ckdxkeq1j2RKZwR6MB/H2Tuy6uv+94Z8EMJromFsBGIvvNM6kVVGvlroz6d46e5oj3LjrOvjRNtpDJ0EmaW2sQQvdw+iQOarwMKKUcJC3Z+xp3CaQBRwFA5Ra8TgBQESOlz1IMplPsJ66e7zQGhMepZXMsAEjZlSs4YqDFJstWzWyDnnQPLAUoGogaLDcEnHdlEGDRswTdCEKshmXCaV0xpgSmv7m3ACsA0HUsxL8Ntc3vYQBQPEkLxCs1a2oaCKrxlo4xiAkA0FUXfP1S19TH+I4YUh6CS55LnWWEmstHaqWdFDfm0k3ptiMMfYUvWSgIrLnOqD/+wAm8CwDyAK6UBByzuJojLKPupjJY3HxkDceJqsaQ7c4JqoK3UydQtD5XaFzsfapfGCV5ikfOK5o6yUANv2xKnUV8x8lVQ3N0ZEy+cyeQXK/JSwymTsm1wR5iQ9HqSQBXuufcJQTpt/3FnAYAao2vD9gMEKDadA9nwiNJX+IxJULUtcE05zbErBNACTLU0C29RjkQABA9xmJg/4+xrNCXDVDWKIcSQz+iahu0iwUHoBpWbK8Ehm7AeBiw3WzRDTs0TcnBv6I/oOIgoDv+QkT0OgdA2u4o0Es5+WODw75B3y9QtZdoZ5eYtWdo6xY3V89xu15hfnKKk4tLHPoRfd9h6A44bG7Rb1coDlsMt1fAYSOcyLbG/GSOgf1v7DFgj7btUbXAULF05xFFJbZl2suQkYA8mozJkirgziN7Cg6MMqizrlo0VY2i61Ggx77fYn5ygk0/Ynl2htOzEywWS5ycXqDvS2w2PVbrFTbbK+x3K3T7LafZsNug7DtU/OCDjaICJADI1q0f2DpRFXasfbD5OF1CIKcs3wwAmKvjFNUREw7LXZ/UaysJQOYAkhz9jB6arJ+dDWw8vmdai1MAQLqdpLzH/u7bO7dmQGAcCfvrbmXp21pPUP5PZQgE6l7Zo5myPscHsNp+tNDvYRvue6c5/rN2Jt4BXcADVSCgQ3O1jmn+z9MnV4LQ1k4B23UUADiyI6ppjD3xKRrRJVo2a6X2g/YcHJpkS5LQ57kHqlOAZW9Jh9Te/0i4PwEACsDOGXHERIi2bQCdHcimAEALwPFq2DvS6gGq99eXvr4KYBhqGCH97wgiP7yMbTIDup/3RlgwFGCgumfPsfZd8lt6zLlEhnMLAQJpWwHplueVVGuGekvJTG5NcoJk+FvgPekdfn4/TxfPBQDdeYgSZDaoRObP+dPU2KSyrukaiwBkD4gN5H1NbJyASphSLlxqQznlfUskAyccnnm7BwCol8fyGOJFagV9XxMASEEoxwhyAZsMAFIKuu7JXQBAs8HkPGYpcxUBKJTaQwGAVGym1AhUz98HANTyIwV0uuA7G5SM/kkVcRUbKPeE0zYYboRiMBxPWz1bAWnVl9yDOSCgAwCKS4piCjph3KJ0sR0UMbQ4aJCPAMkZgPTv99uevgMAlUMQovJPAwD6W6j7cIirj7IAqnPpSC5FJK53pGxZByJUN/8yAED3wMO2ZibCgW+tihEd2xLUNTCbYaxr7PseZ2dneP+9Z3j8+BInpyco6xr9OKI7sNt2O7z44Tm++upL3F5fYVaWaFjtuu6AUsCJVoiFuNHW31JxLegBgDX2mwL9MEPdXGA2u8S8PeNpvS++/wbYrFFcPMLJ+QW6ATgcWNzigGG/xbjfoB522L96LqIA2TjaGrPlnEf7sZOAseox1nu0yxpjzaIcBQBoHTHKAxKliZX6Zv8emO2uG2wOHYqqxul8gWbf4XLJgNI9UBdozs7x0a9/hQ8/+hCL5SlWmw77rsTtusfV7Q1ubl/g5voF1jdXOKxuUHZ7Pt5q6IVpKCpz4Ek2XGIfI0dFzEcO0HFl9R0AmDmhegcAWgVgQgCg7b34Pgv1J1O2IrSfoVsJ4S/TFMhASLHVQQ7ASv/uevtT7VyOHqadCQdECf6btOGWgIULdOl1TDpoOfqJFMfsmuoHZGceQ4T8X7tvVaJBAYBTecr3re0J26CAKYqiAQJvcg5N7ggAqsAUddgUo6EfuUlifrksOLbU8o9SBRqUWX4IADCyf3kbAUCH0MJeRsb/EwKAPOPC+YR9Waql/H1eOkJc7j3vujnn43vdAKBsP3hQIAHAaISEAQA1OZ2lvncEYG6DG9vaK/ctl9Kb2xDl+neZKGWcBCBHDHggxz0VbcbbpsCbEwEYGsvdAMCIuqTOgTMOrujl5G0A0NTuMRGA9jbJ7s0xIBocEk8ZgaOUVjAU+VOHR1MlPRUA5KbfBJBHmECPgNhdCnip32M8ynu5SwQgNfilpK/XievaBRSe/Cp1QCM2mHEXxD5j9Z1Tv8agZ7V0WliIfxXPU6fO4xfrIcWIUrFZGTQukfzxpt0tpZDNU4I93XZMP68bAJyQhZScEosgjjpHEtiMLb/QZ+aAgT3n1vDK0zMRMPhAEYCWpiCT0fIZmeBUADAXw0Cbp2PJbTBStm0KXbm+dA6ccvbOBjh8580DQKLqQehd+4CPtifkND3HxA2jkgChNG9bOt3FdSNo6JiOi/5TFim+FqaGH+ulLwvw6zDaBpjPMLY1/uTPfo1PP/kQn37wPk7mLaqy4FG568MBN+stMDYYhwI/fv8cf/fv/xYvvv0ew3aLlu0M+4NMLVZUlBGAESfCBQCLscJuPWAYWjTNOebtBeb1KXa3a7z86nNgtwUun2B59gj9AJ6e3FQlin6PotuhHva4+eE7jBIArNoa7WLGhgw0JcZmRFcd+IUi1bzxAUA2zlKk3yp7K2RC1KYdWHTefIm+KHF+eYGPnj3DX3z6Kf7sk49QFHu8Wl3j5X6Hy/eeiVSposbLqw0OY4vb7YjbzYanMq9ur7C5foX1y+fob68x7jao+gOPoHTlQ9UMNiS0eeKXCADm9FfcPohlS/nI2eyJewGAvj2OezkTNGZwQ+rrwAkt6Udy/OIDEMYeiuHoYpneQSMfmUP8UBQGHa/7u/J0lRujZqvbTUacyKejDJCnXcj3zHuuakbiydhFj6oUUTQCSW+mUg5uwkKRwAd1e7CiI/eqspvHPH2OAwCP4kzrYQ0AMsDG2dulW3Xsp1gR/YobYSdXzDSpATXJifoFSfe7AID6osdUPpuofe0ukR256Qc4HBMhF4sApPQUB3a2J2H4X6TQRjkwCADmdGLa4wrrq/gGOMfi6Ut0/P0X/4YMMRkBKPEPQ08zGrElVLdIiwapv88vX3PpniSNGisZM+efnAy/7RGAmioBoDYQAWhrDVlCKk644vR//d+iv4pFSsfnZCOSJ7xPmdQrKp7h4HuBt4F0WgMAioE7+7NkuqlLLz70hAM2lb6uwAW2UwAAIABJREFUwc2BkKpdJVRKaIW/IloTAqZadtOEYyrPNzWiOVdJGqHTgJsb+SXfsesexQFASx3w3AvRL3Wy2N81oMPnZ3L8U7oj9puv/tz5O9FtCUtss7Gr3RICmvJvErKl7Lyt/twZsUtAnO9SxHDm56tWt1agTx8hX+pNJWDy3561V85KzoypgfmDt+tI5oxvYgHv8lNufSa06YiX9QanZOKWLS4PCQAwR1VqeoJDfWAAkEZXWCsaGegUANADf0MHI7Izd75aMo6QiQlLmnzkwQHAWG9qM21F+LvOUNLjmrKDcigb0J/e+FwAkMhsEIxIjDEjfyKtVegYXvevLNHXDbq2xuLxJT79zSf4sz/9GJ9+8BgXdYmTpsRw2HPttR1HXG077IsG692ILYtsWx/w1//Pv8VXn33GAUAGxA0sEk7WGaLpyF4xb7nRoptlXlfvAOw3A8ZhhqZY4GJxic3VDV599yXLh8Xs7AmGohZgHIBZXYn6fvs1TwHe316jZGmzfY9u7NAsWzSnc4yzCruyB+Yl2rM5ilktIgOlwhHwMNs2M7SQ2duOR0gy+zr07JsG1ewEt12Bpx98hP/oz3+LX3/4Pn77SYPzBTBfAF8/73E19uiritO5HwrcrA643THaDbhebbHbHrDfbNCtbnC4vcLu5Y/YvnqBcbtmGKXnwCt7r1Y9meI9SRhTVj6/echeApJTsrkxJgG49MsPor/uDQBO2ADQaSQRyRgxqQ7I6SybZm5JLU9DOc2p4WlbZW0Q7PFpeyK/VnsVa7/jtB8DCCnwQUlk16h1R5/nX3d3F6SwHKPZLYh+xNfpSxZEJk+YT8WccuuVFqAUgKt8JwX+0X1UyNcQs7GYMZmeKp5M6A9O/kyIYE7+iQVVF4ZYY88BcF7kEJmhtH1qCOIXul6hdEbKU+m1E+2Z53kwAmdec/FgkHrKFgZ4w5UDO4PMXsFcQAvvOxEBJ/xrM0efE2WKZmwNg6ovx+8TGUJOlQcIJNTifc0P9Z9d+fdGGgJsrRqlYrU1Bfj+wU5BVjUXYwCgl8Gn5EvbKcVRgvg5AFDE58TXJH7Ji5q94W/FLymaH4VXqRqAmtDuON8SADBplifYf8sgkgsxlH5KiYwQ4iOEhjzK1ZtTT0ADItLK/rQAoH0KMoUeVKdT1aWud7cBQKMwDR3d1UyrEO/SSkfp5wBAu2bDEQCgUoDKxCgnSxW118MWAurYOpthIvyTMO3y/WkRKT6P0pZzTlqct2NOjOXCePUySN8Mf2Ma8K7yE5Jty+EIAID6xFzOWyvgkPXIOFgTxN6/SOaOk53Ql/WI5D+9CZj4flb6yPCFwUna/58NAEh1WzYqRUlf5hYy8Zjhd3ctuCvqsINvYicECkxc2ymPPSQAmHfP5QVUjq6cMs7X90xOp07QnZ7sOUJD+IfLEEucLRvsUaE8OUFxusTjTz/Eb/6DX+PTDy7x8aMWpyNw0QL1IA7P1gNwte9xM5S4Xne4ud5ju+pwWO/x9//ub/DDV59jv75BU7IUI1mHhas48T92sy2VdbWRpfqK8SarMXjY9EDfoi0WOGtOsHr+Eq++/ZJH4Z1evIcBLHpPXpw19Bj2O4yHNQoGBLILQLoDBwBZhUPMKtQM8DudYV+NGOcV2rMFChYByMODhUOsAEAG9PF/FZ28CrhCP5SoyiXq2TkWZ89wefkELbMz3RZPnp7iN3/2Efpyg5tujfFsiXo+w6Ju+ebv0BV4td7j5fqA9W7AfjfisNkC2zW6m1fYvfgB+6vn6Fe3qIYDv01ZbRm4xXDW9hcPACbKV0yRwdwGMPe7Hz1veRdp53sSeOmkpuTDsqxpWzoumCaVppLYP4ap4G54tf2Qbg3/t7tBcLqjfqe7TwntXVwA0LKL1OdVg0sCQDnf0o9+mRKhaHNAwEtWY5MES/HYfb2x1AZdjUxlP9FhhXxnfyY5+mX8U/76fQBAQzmP9x5k/f3xm/UXPWq4hgRdUFAvtnmwR65Gz6LnudelFXlIBky/PndoAFDJIN1iaGEzvbsRjlb0YwYA5ATIyJcbQWex/gMEAGS0l39JoOVUPIDvSnS4qw+9sYW2cBb/O9H6fHEeCADkbovkLS/CNa5l3moAkFOH6Y/Y+H/BAKDr6FFDqhgvdKI2xSkyz/jnt28fAGg2CtQZiM3TOh2UKpxtKhTOolK+rFBqvU2eHtGm18BBAIWSMIbzbQAAVZpsaHOvhxsgaMC1cZ7KbVYl/OA5QhM2sRPOHvMAoCjoa98sac/qPreQBvsPnTgS4RW3XhMe+SUCgI7hD+muqJ7KpGxp0kmZdQFAN6WZrhE3j3eIeI+azweMALQ2OtldqaDelAhAevWQorlxRwkrRhYkrwOOszi5p18HABhePzkzawPrb3gmLkVuWkf8ntOpE3SnJX9+nSlKDwai9WOBoZxhV1Qozs5w8t5TPP2Tj/H+R8/w0Xvn+OC0xNMSuCiBml9+AdwOI14dOqzHAjebHrerEbdXOxy2PW5fXuGz3/81bp5/j2K/4ReDaC0sQUDtmrsbDAJIcHD6wEDFA4qhxQxzLNHi+tvvcPPNF6jbBZan76EvGEgnAMCh22M47HgNQPR7frPu2HdA36FHj0MxoLlYorxYomsLYNGgPVtGAEDmYNYyyl6kOrFLOUa0qOsLLOaPcbZ8imELPP/yG+z6HX71T3+Ly0+fYltvsXx6im1xwHzR4qxlEYwMPCyw2vV4td1j3xdYr3v02z0qlqa8uka5vsbm+ffoV1foNys05TsA8LhbzqaLWnZDpzdVMS0QMCbW6c1U7UE18vTx+/7wFMDGbl8EG4XHGQIn3Agkpq+jB1YTbLkHCpJ3LJtIhslnKYdMI5R8yuWMvU0vzQ9EQQYpYxkU20Iec3g3faXjT+YuxVCAlnX5GQVwSdNvJQBICeqCXowPkiGsU+TBnrWgl1pguXOwxJO2aZ6jK0R5RkVgiSfvAwCa1GfF/zpKjGZ1eIcOFAx05vrAAKArK/n9WVz3xDne9ub8FF5bgUzVwPH9iKFZ1l4E9J19iaErYWwudwUABR3M/JXfqPoQoxURnvHP2w8ApmT4NQOAnMApHs0YuLu8rzZArvDEDMtdo/8ES/gsrWuiTYwAdNnLotc96SM2+7YDTH2VEGu7/euYA/mwcliUEvVdL1tlxOp3KJEK39JsmFb/LoEht0agvf9REYAymkHd4MmaUwudMYh0fmKMds0MVxVQQCX4Wy7RLePxUCeSmCLjwSUYOK26VBNuEoXpRfACTdGIpeTe3RVzzFEEUTH9mhBuySMUAAwO434QzE8SAfg6AUDHOXcPmGlNRz9aRgbxKDrnGCzHFiqFh/BwFsCSbRo9xfjXllFvWBEvhjur7Na2yDgFh9EaTTaqnndoZGmEBB3uS0JP57gh1c4DvsNvOwheammQOOJLXgPQjRAmAL7Sjfd2InN8pH+Xsu4bJfmECw6GN7ieTorxFz+MKNCPJYZqjh0qtE+f4eLjj7B47zFOzhf46L1LfHDe4HEx4sm8AHYspRfYjAWudntsxhHbrsB2W2B902O36jDsO3z75R/w3Vf/iN3Vc1Qju1rE3Bhr6SQnxYjKswAAex5VWA4N5mgxOwCvvvoa668/x3xxiqq9QM+j9GStWRYByCL+Dlv03R7z+YwhgDIFuMeB1dZ7dIrq8gTdnEU8zjkAWM5r9BxRF7aWOc58NfglHIJbWB8M/Cswx6J9hLP2EuNqwA+ff4fNP3wFfPIRPv1n/znmv34P3bJAsazw6vY5Tk9Z6vIcNQNbhwH7YcB6GLDrgfXtgdOr7rbA+gan4wH7Vz/gcP0Cu6uXaCt2aKFG4EcAKv9mMou5D+YQi6SDKeiU+uSaT4/bkYdjJxkSXGe47iOO9ydT9iIdByPujtAW3L9Lf4SdiNPYtxXHaeRUBCDvmnE/0Ufqr8p/TgOA6fkZ39CM2QMRlL3kPyi9Lb7ke6SjU0A9AbCMotW/3L+o78KUtUds7Do19Haf2qPzHg7xQmI9+aVAptCPZ0uF2uJUC0b606E7cxVrngNQFRKb4OJcjnlSeQjtJkdi1lyyAufBbPs5eSBjt2gg3jOiJ9vRX8jfSbCHmIpsTwGJyolQFnBQQTfiuRDlxCtU0mwdwPiex0WR7YwWUe8AgvZgSn5ICRI2LkVDmiKcjXAz89FeWSYKMH1nbIg+jneTuRQup1+zJsUBVJP2IggAuvxnWhDib0e4iZJgfu1U7j+x9q0SUi7/2xmEgn/T/H8/ANDmUTazdMp4PuDAWg+t32KrFCjhZT2qaizGVzlZA1C9FiPhVOZKvR/bMMYAwNwGk05V6Z74OH12NrfCKcmNe0zuvI6l0zTVbF/j4PWZWQQOCBDBZPNTAiZu2hG3PRI9TUgo0pVSKaJuTr4dHi6KhStlq36jefn2CawjwErTWyZQuw+8JhH/H6UBqWk1xflO+fdT+DsHQFsxpnzx7Gu7j+FnX4zV3AVXME7hKREOiGDzjD0rxQ9ZQ6AfiMuDWWfTmphfjJJyw5nNQZ6yEu4MpIPhMYHjWGQmnrqkZxrNCL3caUxwgF25dB2+3BYqdMlJjmenzUuutrMJDOsRS6Vo/cOmL9ST49RYSjyuJTln5QAzE3sVOO5hBttO0bGWSB5AJLjX0kwhut0nwnbKOogUqAiNoqrbnpH/ttj4ZOnrRrN5AzbgbnAu2fdV3FxK/hPzJ5pHiRqVfm5eClb/r8JYzVCfPUJ9+QTF2TmaR4/Rns5wcdbi8qTCB+czPF7WaIcOh+0O+wMwVg2u1mv+frcvsF8P2Fz12Nys0R+2uHr+LV589wd0uxuMY8fBhErebs/VND2sD2zky7HAeBixX23RbQ5oe+DxbInvfv93OHz1BeqywezkEkMhi/fxCY0Y+o47vl3P6vaJMg9107C/YLPdoro8w/LDp1ixGoDLFu35AuWsRs+i7Wo2ylFcwMHli9zSNDYYhhlwaPB08RTNpscP//7vcfPFN0BX4uwv/hNc/tf/JapPPsCmHjHOCnS9qIHIrgwBerTLFmhL7Ise20MHhvuh71GzYoe7G7TdGli9wnjzCuP6ll8IEgUAud+iLimZIi35DbOtL3MemgCIYlXQ6CYwOjovYsV5kjFKfhjh5vkCOv6GcBSsT2xTx8cvN2ThDtKyl1sRlb6d0q+U/dz2BLsfl2Lp2c8k/dO+gng1pZuk9ycfCaUAewHYrs5ikyZdMDWRZoeQkxF/I3VJk2hJbLz5JwtmhC89UeumRmb0nvQNExsnEeETf0BwYHgN2LdsQ677lQMJtcZHovSx1sv50kHSy4yLdwbijgF4biouXwkSAajEOA8Apn1n6j8p30177IzXLP9CUk4yhH/hIzno1xSh1LbBP6VfXOKZEYflj9JBt84XO9RSTLspcNPmHldGKf9ZPJJTbnI47iG8q3hzqp3y74QuPSKkVz+nS3T54qi98PxbZ78VvpRFNCcO/m0bErU3+jn1PFFKenR2ABFXWSSAKki/4CFWitKhFTPfeRGZx5knr+NQBpN5KAcfE90dmdIkAHAa493tqdcJAAoGOCYPXqS8TH0j7R7cjR70Lf+OI7tNd1PjqT+vRpYIGeUixDc/QpjS0ZXpmx7TAKAKURXibuZjhN4+wGDqijms0mllGyClI/hJAWvGbEi4IShMEgBrlaY4T1mB+4AhyiCk+rE3CBTgFG/lAIzcHKgDxwri5h1Em8PEBuGIz5EKMzu/I7ufPlLhxoTX94iNCz8iypnR2Kim9KPdrah9or3ni9LazZgDDed7IZLZTxp6EcLpmuIctbT+YTohWYIyfwKfAtg09dWA3FN+XuLFECFkK1i0VgxknbS6mRpR2QXIPJCMAImkOuX7NHRPA5j3vwU4HWGeumJBzSK9CmTp9bTNBqLgN9gOqIF6jur0AuPiHDi9QHVxiXo5x/KkxMmiwKOzFufzCjNmL/d7lGOFqqr5xRr8YozDiG5bYPWqw+Zmx23d+voFvvnD32C3eYVx2PN6djoFXw5b2ZCQXAsAcMBhtUW/2aHtR5wWJV5+9o/YffUFmgGYLc90+i/TU3038P/EYRAzpSWKskJZVUBV49CPKE4WHADcLyoMywbN2QLlvBI1AAkAyO0T418ZqVWwG48PDeZ9i5NthdUXX+P57/8WeHULlCc4+Yv/DKf/1T8DPvkU27rE2FbY79Z8F8HqII5Fj3pRo1yUGJoRh5GNFTxisRr3wOEWbb9Gsb7GePsK5XaD4rBHFYkA5OAmAz8n6DG1+Dn9eSxgnysynj6EzAAgXEdnEZ+4OPPmbYB0yoGnekYAbCniTtGAaW0jLuIJWwxx6QxLsY2PQd0Knddp4gm6IRWyl7K/mfnxV+OXYPD+3BI5ZCrc280ZS2ti8oDX8Uds6tD55NbHL49g09EHt9Wegz4XO8BTdlNPUdlfa0+WKPmgbwmNr66Jq/af4ZhQ8pZk804YAMxlwKWgR8lvnu9oL3jsFlYbABQrfDwAmPYtuX4n/GkBgJKpjLw4vKRqs8qDIpuSdC2c+dKIxlwEqxqQmL2x3/JvbpBQmAPSAkZVS2g/N/LyHeJzFwBQgeZB2EgOLabdOP8y+h5h31waWCQM/JhtOmF/hP5y6Ovo0xRAbQBAM7D4gQ4FCykv0v7fFACYskfmwILpv1SN9pzNUuBfij8MrhJuLcc77wBAx8D+8gBAB2FhAKA+SRKC9LYDgGKJFJROAEBuFA3EzmbzxwQACmdMrqGw5m8hAEjNZ0BJvQMAkwCjC0ods4EVhiMMokzdd6SfsyNwQw5UyCwpAJA7AApfDVq5dwBg1klIpYC9AwC97ZfhPWb5Soxlg45FkdVz1CcXGObnGOanwOk5qkWDetajbQvMZzVm7CbgtkY5dFiUNU4XDU6WFWqGQY3gUYCr6xEvn7MIwBGH9S2ef/n3uHr+NYZ+i6pk7D7IQ0lxOOE6+FS+KzbYQ4f9zRrDdod2GNDuD7j58kvsvvwCxX6P2WwhU3OZ9FX8ht6Rhfbz1F2WP1vzvxdVLf6rG/Rtg+WHTzCcz9GdNKjPF6gXjA49BwFVBCDnPXmLOHNmq6HAspih/+Eah8++w81nf8D447dAXwDNYzS//o+x/C/+O+DjP8WmbjC2NTp2GzFY9KMAAIumwOxshuq0wVABHQZ0wx41DhhZpOTmJcrdLU8HLg87tExFvAMAc2og4v2/AwBdwrx5ANAegQc4BGtox5abbSi5l8sfUGDc6wQAg+g6cQpkwp4eMN1LKHBVPc59GQICijkkQKqfBQDoOi72fHy3xvk9EsGq+ETX0CNgEY0qS0cAvkYAUHqW8fhLBZmZPxUtlA3m659NYdac7p1Yv2kAUM3EleGYj0uyoYNnVMnoQCnl7wBARd13AKDLZ8oKpI6gfpYAYMiwKWHJRhQ5VLpTBKCLiEV2wVSh3c1DS7/1MBGAJoKJj1ceORol7J7fmTGJaceiqMRzdgSgc0rEa0yZFGA7ZFwdMREacLrLdCZ+dCKjGPgjPgDITQOJSBPzE/2ZJUyfceQEJLVCUwAPG35xC5VmMkgCnVuzkcc79Dt1/qC+y5x/yRShI7j3qAhAcYIvOSXcyTsA8MEBQMoPogbeVLjPX6K0fAQiABMR13pc9ABCRgAGTyon8NpREYAKL6cqh0YASl/TOlPMpOiltYurH4+Qs4mPvp4IQHOwQGtKhoaUqxGbit4RpSlSvPlwEYDEjdS2gaf+li26UQCAzckFypPHGGYnGJenwKzGMK5RNgWqukFVljiZtyyDFeezBufLGs+eLDFrBBcc9iyarcG3X19jve7Qrde4+eYP+PGbf0Tfb9iVvqhofT0e4W6f8NsA4IiCA4C3EgDsUazXWH/9FfZffgFsVnxcbEKiBiAD+xoURYOyaoGiRd8z1JFd5FFwALBZLHGoSx4BiMslDicNqgsFAA4aAFSR6yNJIa2HEadDgRd//Xt0f/s5hu++Q9lvUVdz9OUj4NlvsfxP/3uUH/0Wq3oONA06Buah1wAgsEd9scTsfIFxBnRVh37ciRTg/QqH2xco2Q3G+xVKVsOQgZZEyNwomF96BCDnj4m6wH2MQ0UPEgGY0nI5DZjzcX/ZEYBWbR3PNooarPST89coAKj83NcOABLwSYzV9jCyAQTKA2SRxCEAMDHpWISc0edxG8GaPSYCUJVKontGtRf15y29Wg/Asicj3qcEnAgAKjI7PhA9wOKPJAG04wBAPlRnfbxafJpZze43vnzG9w+Cf9nxU6vt8l0+JT2579A8aaSPAtW6ZxIByOnjqLMQvhDELwJq8I0BgAkVnNXemQh05n8bmvic4FTYsUeiLhEkdP1pIgBDljNGNBfjsJ8T4xdUnR4BGJYg1Upsjd4KAPBYQM4j9RRwjTxzbH93BwBVp/Ed7dsAAKqItxC7shmUMsTGAH6yEp+2SWn1nU9RsJ0BR8ItANCcFhkhshxcDQAKVECBF6KHNKRlzU/XKlHOc1zNlZktaCriagoAaCtIlcLs0jyrhg0FnFfdN/nNWM4z5jTRXp1Q+kRSvjRKM31D4LfnOEB6dzeNBglb5ppmCV6HaJ1W4lZDP7MUYMZvtgMi6H1X6uolDxA+lP6WA+RoSgSv4ZlAGHPpdWxIuf5sB15OQhKDbxBcANDxM1Wdqul8d9yTfgmF49737CmNCJwQARilX3onKrqdylSxtrLlOV4PAGh4kKW9tuhRcyCwnJ9hbE8Blga8PEU5a3FgYFRVoqxnKMsalxdnGPsDFvWIX338FG3NbtrtUdcFyrLFdl3wCMCrVysOAI7Xz/HDV59hs71CVXSoWBQcT4kVp1QiBTK85izyrWGXZdzcYHd7C2w2mPcH7L//DuvP/g5lt0PRHXidXTY+oEVZsYjABv3IIgAbgCcti7ImQ1GimS1waCtUj8+w/OgpVu2I+RMW7djyGoAqAtDIntIdBR/LyX6Hm7/5W6z+r/8b7WaNnl0BXC+A9hma9/8Jlv/hf4vt+SfYzc4wcHDywMG/ohARgEPRoT6bYc7qDi4KDG2HgbWx32DY3GC/egl0G+CwQcHoPJ9z4FV9qJ3nTjaLbpzKh/cTreDbOR113xTgaREyZmi2vfUBgBSt3A2wGHs8Q4T/lrmEIqXfdIRYZP1M//EFPnbprZIPD5QCnGIrqsHCY52iaFUPvnNn85ebIpzzc/IpwFzJW7X/7DZT/O36nbychi4nIE1IZvpezUavvnXCRkjwPMejhLoCAKO1WbmSMdpHyJdZybx8EhnUzsi0NXd1iz78kGPizaURluThsmvC1X6G/snn5229zM7Xm4nHELY/qi5ly3GmpriOkAxIzwQyuuvlyapzCZf7u6ffyTB87SovgdB767SbNAUA5EtN+szz23FGLrd+SfmWDOQvg8swcQdQhR+pJ8L7bRP9Z2pShrTpHVKAKbkm72/jVscFAHMlbkT3cUZ2/R3/kpF4DWKXd0Kcce8U4GMBOTqIfAhvAMw4Mprl5wwA5vK7+QKTSy985cVYS0QAWmHjWkGFVBhxJq0aJTGmT6lyOwLQPTlkylUAgGpA7E+WT6XGG3KfwsKiBIWLg4VapAXkzQKAfgSghGMnaW0XzHBXxI2O0I0Gap8J3e07Tw8DAJqRhTckZg0NAHSsK58jmeDt8C3AE90P3oQbojjB66CEz6IkcRlUbEx79A2kTTcGBthGw6xxlMJx+5xK0NE3lNPXXf6x+iSA1JTN3RT9dycA0Pjz5LY5n5+E7UjUKMqx4ITf31oAcMLYo4+QDaOligMvpKXpNQGAchwMEOuLGkPR8P+K5gQD+292AixO0cwX4jIMFkVVsEs0KtRNxcG+vttiMS9welJxYI/X90ONoWux23S4vV1j3G7Q7lZYvfoe3eGWRwEWI6sPyEDACQAgg+6GEdvrG+xvb4DtGrNuj8Pz77H5h98D2xXKnt1dXKBgEXeYoahOgGKGsWARgDMMA7sh2ACAVTtHx67WvVhi/sFjdKcNZhQAlKC8d2QwFmiHHufdHtd//de4+jf/BrP1CkPZYShnGOtnqJ/+OZZ/+t9gf/axBADZOBjYyU7FB4xFB4ZJ1ssGxbxEc1qhOhnRdSsMmzXG3QqH1RXAAMFhh3HosVwsUNe1jpSyNsHcPxE17nJ8dh92Tr37ugHAXMkHd2y2PvRtyyQAUDaq0jtTm0ALIAjJd+IE+ZcOAKooWkVz339L+98Bi2SHPXmXcrweANDsHWIlOWLQphig0vECXBPevvou7fWJCGn68f2LhwMAWT+8Rqtwju2NEP8XswX2qqQjFJ311dkEU31Is3cJgn/8AFOUlAh/8vxl8SQvt2DXuotHUAZO7wIAp/pKe9zygHqSt5+55Cet88X4zHpFekwcYAjqJfYKIRI4/Erpm9pBh9bP5RL276lg9jH2zuqHZLxMASht3gvoh/QJmJ/WHYxoNe0aeQutyz0BQO5I5PaG6d+PBwDTuuAXBwBSflACkeURqosfAACMGx95CYgXQhUWJz3+Y6TtqGcFs8WmzH7NAbACEBAzFsxk/h5Gng112N+4Q8lv4nCtoppISiByAKCqgaRdBB6zaMZrDJgBimyvh64lm5sxNHrGyfinnxMA6K0AuRUsKUs/JQCoM8DVWtruXzJF8ChZcR8W/dwfAKQKmvLplMHljAm3ONYJUMiZoyOwN4R++0rejfE2bkxoxFNP+IJmSt6wZVGIKCvq/FnaQr6gbvHmjlrQO0qD99xhT9gDWxcEZs8fiLui7wDAKTzuPxOLQJ7i5NrPvG4AsMBQVhwEZCBZX84FANgs2O0aqGYnaIcaxcBqb4lyFCfnZyjbCqstu/33gJoVqWNpQsOAoi+xaE5RoUS33+CwvkK5uUXZb9D3axwOtxzcEjXx2HvpCEAmJtUAbHkE4DWK7Rr1fg1cvcTms98DNyxabi0BwAXGYo6yOgXKJYpqiYLNZ2BpzKVTu/16AAAgAElEQVSsDVuims3Rz2rgdIbq2SVwueARgPVyho5dqMXv1CBHQ3pDKAHAscfLf/dv8er//NfA6lqAoWgxFo9QP/pTzD7+p+jOPsSepVEzULJlkYns0wMs+nFWoJiVKOYM/CvRnAG7PQM32YUf7LbjGxTjHiP7rxjRti1mszm/yVg5w9benEUAyh5+ikjAny8A6O9e3YgtFZ1hH6jaEpq6hJxbtz8yANDYQum7O2S2rQ07rM5vAA3Fc4DOwwGAas35Ib0cQKhof+oA273l2UsvzZoXBQAaGr1uANANGLFXx92LjexYIxEKT9Pb7cP/2B7Utp2sPISJwAz6UzJCLqz7cvxi6kiqDeJ0ADC2eGTPpvjGXA6sqTV1z5+LeIv5jbxreYmQQXMDvt59AMDAljg4Xg+oN7TLAaGudpia0p4VLVJDVJJKkkysH8skE5949pC/s5iy33E9PFt8wut9FwBQjV7cBDz54wGAoXfpd/bvNIU5dcEVGV1yaG8AAPzfE9TJEy4HQNHZBRVYFtBzTGb2eYfBHAPsKgw3hF7UTKFKLE2Du1doIeOM+gB5gUrT39z6a8L4qUAHKjApgkhCMYDMHOPlhMHnZVoDUPxq2uAt81u6KLCiNn224jFAkX1tqHrXbA5EW6o2oGnFHzubYu7WP3oteWiZcifqwQg4z/oleCzhH9IN0TGpGGaV1Bm1+UankLpLqceRkgfFr2SNdQCdlCk9UMFXAgSKfWK/EIcw+q7ozw/BJmOcsmMMRgCmnXbfvOfnIUwtEbXIvKZFACoZyGxPE46JMf8GnAvzvz03Kk/GeIlnaMS3/jsJj3Dbl7NI5pqmatSpkaWonzrB1zcA581geLUmsInQD7EHj++YOlBm/nEKuBt0xYN6Qp4HmvBXCD+pHlMkcAGHgPXQh0HxXtM2MjX8gV2aVJXo2c3yrF4eGgz1Aj1LaW3mKOolyq5GcSiAw4BhGHD5+DG6Arg5bFG1Ndq2xDD0/PINdCPm9Rzzpka/X2F99QPK7Q3m9YAeWw50lSVLiWUAoIrciK8/24yVQ8EBwP3tNY8ArPcblLcvsWYA4KsfeKpsxerwVAyEm/PbeFkUYNWecxCQRQAyAJDxRc/aa1s+Z5wtgMdnqJ+eY/70AtVyhj06cQswv61YejYWADjgshzx/P/7f/HqX/0fwM0r1LxOIvvvHPX5n2D2/l9gOH2fA4A9q6u4OJUgB4sA7DHWA4Z6QHXSYnYxwzDrcTis+IUfrOZft71FURx4tCCjWlk3mM/nqJtGXHJFUlLZyqsagBNEbfIegD6YbFcegKQaTm9089HF1P+YMgFfH9ozSOrUUESLVgghHSIBmsQkkxHOugZoXP8J0Ckt/Xm6mAbcDRq3uyk1m/iRvSZuKRYjsMEjKj9x/Uv3D/wpZ67iTfql/YC7/7D3ujHdaMYTPoA1ad/Kf5YWPOCgZPQv4Q03/XfKuokIU+LvOYByav8l6qv6UYTSzfK69zSxU3+T/26RXwCAqSrqas4ij1r6pKRna/1l22R1NPyieMPlJGXv01GAYUrrtli/TuSf4uXjACdFHKNl7JIvBIqb4HvydXIjQJ2pJAFA5j1wfgl7gvyXZApwoISUuwCuvLL2vHUUgz7em7MnqzLmLPtkLWJeotQTLj9xzpT6mM2aAoD2wOmE3RyyiMepXnGxGEkVuoa+/6qYU2ogfeJEqUm8TebLEX3pmQ5tcyitAm3pQaX1m7uqbokJdcgbXpmQYSPE0ll6xkiFUoBjq67WNMUVxdk//5cJvgwLznQ2M0+64aSCAWmEWKxVewEMoCSFKnKLkmqNQxxyGsKX8YluvlLjEYraGL2UArXNhndClQphn6AE4/h7WKm4gJM7XbrYHKEuSscBshnQ/Bhmk2MAYFdY1HrYKyJTlqXjo0Nq+SLSUzTqGEmgw7XQGs1Xzpg9B65aEtesM9rlijS7Idkud8Vr8ognUzUqcrpdScYx4J+gueRnHjEZ5jCLUm5KX1AcxGgU5KRrO6hLWeR6mlclpZKXgLj6x3Yw+FQ4gGyZRDU50aPHtpJqkjdyRlnoG9qDknfl5NhWzeMX3oHpJaTy878TPZqpuST0ltFfHGgjRDhOXkW/eszpvZgHYAqQT5zeaS1O69KF5Ivq6gQ0pvX7hAOh2Bor+Y/as8x8p9jBfApfmCOo/Yp6jlPsR0K+BF2M/GvpIv6US17vAE0+y9dXNpCTKTO3zObbiY4N0duDuNmAbR/V0zxKIln0TV+U6AZ2g++Iri/RnFwC7RJDPUNRLzB0Neq+xrDaoVttMV+eYihLkUZblajLkh8i8Rt3WUTf0KNhN+l2Gwzba4zrl8CwwfmTE9xsXqGsWSTcAaUuFm0i3t35MQCQpQDvbm75RSAsSq7stqg3V9h++Q/ovv6c65ayZzX22BhqDJgB1SnK9hJFdYrZ/BLDUGIcDuiGnsXhAbMW5WKB6vE5ivcuMX/vEYplgy2r19ey8QgAkLGOOAAUkUrN0ONRMeL2736P73/3l2IsVc8vGumHC8zOfoVh+RGaR59gOL3kACCjS920aFqWYl1gM27QcwCw4XUAh4alAG9RsBtUDlv03Qpg4F/R83y0qmU3MbccACxKdoeyACeMCZMpwFOZborQWhYkCTFk6w/mAMDsJTrZ8dr+Z/ZxJ2IpuEGSToLR2RHiygjWfJ+JJ4IbMvF8DvyzLWusjxR9ckyT+90+1GI9MZmlfofyEhTHer4KOWDkr1p1W/0IODpLO1PGn7/qm3p4NEWN0y/EAAR09f0FzRUBgjspgNp+mk4Uvxs/NMO/GX8nJ1889JkYBO1RRsyubd8cCgcBchIh6bRJDxBVoALdi3Kghe8P7RJNmq8tZz3M3zmALsfBTKda/EqyhYSLPByBXPlEFQCpkRNNUcXnzv495Z/63r9DE2t93L1DmBKFhT7J/aDVLHkvlfUs3+H7wYBfFue7mP8nvTNt6ITcuf6XeFvKkFIghOPN6Mk8iI5h66PAXtG23BPKZ1IlJcTzsp6xQzMll/aBCwGapYYXfYfXhsqHZkK9p1cduu8qWkjtR/hL0SqcFWYmoPewk0BAe/1cf98vIeRZALoh94Tc0rYBtDsXw5LeXQAZAFCpopwaybsA1GlThoctcO6WQTfE/E4AIE+34fFAQQCQRseZDb8BAJNGRp7qKAo8PACYpq3H/jQFL7Mh4w4Li3hMLa8ncPZ4jgcUtEYLRDwpZ0CsEyOtBQDyVykgY0yCMjL2EZ1JXWZhwEFFkwNUnBNH1yaHTqgYyfSpMLmUwQCYRNmkAAzLGYw4ABkJpwpCu1p6CSYAgI4xC/kk/DvJJyLc2kT2cXlSNLCmIFaD/RxnP6n+1By1gTNmLwwAUofTdpm1PpGEITbTJzBjHysCkPCndCr5+S9ZAyoP/Glnchb9WIpC5lzQpY0fIk+fsNNMhEzEx6dch5iGCa2Lu/4u+9n/FqfjJtpPlSGgG3iyVoReIdqFxnnfGnq5mio5A5qzfMwhSFtPLZVeU1o6Yw1k9cOI0joBt7sI1gClPKtr6JgB2PzMNqiiTaV/j/UU0uscp422t24KlgsAysG56yjGKwDAvge6AwOiCpTNEiWrAdgugJLV0GtRHgqM11t012vUzRyoKnQzBmjVPN2X2aSB/wk0FdCUDFEUAOCwes7Tfy/fv8QeWwyliG4rORTHobYozM0BwHHE7voWh+sVxt0WBbt1d3OF/Vef4fDdV8DhgIqlH3NojLXKgMtTlM0lUJ1jNnsiIgCHPfqhA4urY1GAFQMAH11gYBGAHzxGeT7jAOAoIwAreTAmNgDi2pJmZAAgsP3sH/Dt7/4SxXaFpuowDhUHANvTj9E1z1BffITi9BEGFkVZVhy4a5qaX1K8ZXGG9SgiAM+XGGaM/nsBAPY7cSEIjwDsMZRsrA3KuuYAIgMDeyZPDgA4VVfkZDWoX6JHZOLpnAOeAyjuBwDm5SNo1BTAEz3gMNuO+47/LjQ/5p276lbTh7XFOqZriw+VLWX8oEFAqzUxUs9/IhfccFVlHZAV6TseAjWc3Qm4Ht7g3Gpqr6/jb+kDateHUv8OUd/+zuJQ4r8ZOoQsrPLvxCUzMRusff7Uqg2i7iClrQ2ympdVP6Y/wxsKJKEBqWo6+qmAkaFpgFRPsb+z98T2Q+x1KOXUv7P+R/ISENlmohHl39ogkISU2D6G1Rg8SipsydL+D5+fCtQge2ue4kz8i9B+SP6c1XYEvJws33R/yxcyoVGc9kPr7gKAnv/uETM0K5vvBHjhj4uCyXZwjMmpE2/ZOo4e1B4HALK2zIlyDAA0csFq/LP6v7aMGV7L73+YfBgN4NIhpLslPZXMs/4VoXTJFUpzuw2zPOI2X9GM0ovOGjjYD3vSBgDdtfXxJ1s/2+NSFkOvYc7ZcORU66yE/L5xAJAqTca0rxsAVGpHrKOouePtyPRXNALQPPZTAoDH6l4KQOQiMhhN3jwA6BhcywlVAjAVANQuld6AmksbDPjHn3qDACB1j/h6EP5yczxyAKr2mQKMEFN/vhMov/EcfhUtZr+h1VxYVCz5oc6SUWY2AKhqM7rjYv2kLrExiteMX592SWf6tQKArgPMBUpt2KVTeSQAaBtDsYIpB1eZH81TloOiVkr9ScbHw1cFxBADKJX0uHbF1tG2K+WONTh2PRwxP9qevcEREbDKxroO8hR79w4ATAPoPxUAqA9AEv50iP/s9WS199IWMBsBKAUosDfjACCP5utH9DsGAJZANcNYzVCwGoCsFuDYotiO6F+u0L+8BViKSdMCixmKtuX/5iAePygYUDOciwOAaw4AdjfPMfQrPP70PZTzAvtix8EtVg+Pr5yTskJny1qsR2B7dYPDzRrY7TiwWG9v0H/7B+y+/xpYrxIA4AVm7Xs8RXccduiHPa/zV7Y1BwDrR+foLpdYfvQM1eUCu2pAzwPqTASg+JegMosAvChG9F98jq/+6nfAzRWassPY1+hxjtnpJ9iVj1CePEN19hhjM0NZ8cQlcJyjBA6F6KM4XaC9WKI8meEw7FF0exTjASW7VIRdAFJ0/AIRNDWKukTTtqjbFmMlrhQRSkP4CVRvHOsv5Z6PH5GJN3M66r4AWlp8slvisNdANr3h8Zte7zv+HH3v+/v96RPyoqaNygVtFB+GAcAIv7gprS4ASC5h9UelNrvx8T4UABjjk1wNZ182bZ712zW/c83BDzfCH75yOXTqCABQqxXdHQFipKyHutNPBX+067y69HABwJDvlZziGwAAp0mD/xSbCwdEFE8TEFB/l4kA1PiLiXOLD+ctAgCp3x7VUZIe7p6QAnZCPo4HABWR1C5FeYlUZvjf5X7CXH4jov1VCrC/P/2ZAICSAObWYIP/hMtCSf3syL4qJRZcgwkAoL27c3QfX1oKgtoAoPK9xJDCPJCSzTcEAOY0sMQvLSVg2PNNAIBqkx27dcwYkQAAmEuzes0RgMcq318OACiMu0DUJfNzVgpHTAjFxtaPxFSREF4hDAFVfJcIQLIosRRgjYGQW5qNMjAykwUAE+LlOgsUSInxjRfBk7lEIdSONSQFKqpNhT7RE8CPSDGIpxmnAUBqRm2Tppy1OwGAZAOkaBill0UfpgwMACg121ERgHY/+RMwd3x2BKC7eQmPj3rQlnyQlCV3/rTflKOd2gCbdHCS2kT0qeCPdwCg7wAqZ0TyR8yDfIsjAB8OAORcEt0CeprlyAjAoSzQawCwANjFGexSkGqGql2iGBsU2wGHH6+BFzfgBQCbFuXpCb9Qg1+wwS6u4nqCpUvt0ZQspHCNnkUA3jwHuluc/+YjzC4XOFTs1txegID8w0Kgw/NTAOCGA4AbDgCOhw2a3S3GH77E4Ydv0V+/RDX2KEYRAahSgKv5I4zFBeazD/hFIOMoAMDD2KGcNagWc9SX5ziczXDyyXton5xiV43Y87HJGoBaCYgIFQ4Asjl+8zW++Ku/BF6+YFenAGONDudozz5GXz9GX58D83OU7PKOhsk3e0YAnkNVoK8qFCdL1JenKC8W6IoeJZ/DHgUOGBggWBzAEpbHukJZszRikQpcNBXfnAiREDVeXz8AGPfCbP3nC+p9AbT7A1wBza7tn59S5j2ddO9DNXaP9Vjv9/z96fPwACDdeLnk8+xlAgDkG/HkBF8zAMh8O2af5RhChyiqvIfyx7zVDBw6U30eBgBJKxbAdax8CZU8NQIwzIlK05iouNBzcT9SKCuqo+jfPQAwduges4AZgFSqyaiQuRGAfB1J7ASP4GIDTgtauH25f1P+o5Y04rekbnn2jjeCAJ/dtctP3gFhcKRkcplLQSifh0ii5qN+S+l/QQ+nZIken/xVd+IDQBQcNWnAZG+pq+sbHefuGdn+mr3BAUD5o6oByGMIvP2hCwD6exjahxcBKPtTwGR0Xy7pkI4AZA+5q2BrKX9/Tn739Jr4zexbFFFSNsLuz40ApCnvqgaoWmLB3874XcdZM5ATKStfS/HXGwAA1eR9QEMxgbjFyNSAsgfsiXhAPG3iuynAafdBRCJRpaZBQPmixz5OzS/3lM/vL5JWPMWvCSn7CTWtpjTNRUMKcEx3y7OptHLn8h7X/jn4NzVWH7Ci/OCmYFOOp71KVSK/ssKFZQqkWP9wpJWtRJ3R5sDfQEqHspVajtWty7yjELXiFMy6pg4AoKmXMNaUwqEUQHe9svImo8zUqRUFfXhf3iUapIcsgBGjmWiDOlKm1RRHKorKPycwr1fDUQKAmpucS0zEgQbRh9ZaaLfAmHknJcelf3oD6XIIN+U6Mka05UgETZ9Tzl7AhnrOWoRWUwBArUHc9RYMElzL8NoGtG/ilskpevJ1pwAnRHHKmbZ2RmJzSbYfSOGl7dBakVTSHBfK0v/eAYLidQrsOjwWMx++9xCaZUJIQ4c6kh8UXbLaoCrQdQN6loF6YH8vULDba+s5qmaOqpihOgD7b1/h8O0LFGONsqx5HT0GAB7Y81WNoipRVqyNDcZ+jXF/DbBbf3c3wLjjF258/Oe/xrbYoat6DFJvFAkAkI29ZvfnbnY4XG+wv1kB3RbV5gbVi2+x+fZLjDcvUI7iUhF+OMEuAmE1AOePULdPUFVPeIoui6rrxw6HsedptUNdYzyZA49OcPnrD9E+PsWhLbEtOvSltAy6BIKgoogA7FH/8D0++91fAj/+gHro+AUqaJ+gmD3DUD9CPy6A9gTVYomK1RQc9hh2a/T7LdA2aE5OUF9corw8x3A2x74UkZMYGfi35ZGALB2YRQD2VcFTrVkEYDtn9Q1LAQDK6Ammb+mGdYrMT33Grdvl52+6EYAB/Z60MdIaUyF2UtCO1R+5A0VVqoNGmUylR0D7Bi7ZSreWu9Xz2LGkPdMJBt4tIeC6gAn74q42t750U8lTKOMR/lznOv4+jZAXhwr2FtGmX4B/PBfW3qDnUoDtSxPSF4CxrvQBveyXBnQwUvgrQDzQUAp6YAMs2qAPC+8kLRv8eMC6ZNDzaQLM5vInox61U56uyewR/P2n6JS3qTfJBqbSWVuy02yE8TE3nCaEywJ5WRq7fJaVYAqv4zRJ5SnAVlSr1DxTRNOJsFY0S71q6Kp4z+Z/uw0/MMFtO1fjPUUFtbx6qZ2HRYBLKsXBMgz2PlzhGpSPPGlTBzTOPkFOUvtIsmyB8sQ1ACgZ1ZYzFwCkMk7k0sp6ozyvE8H1/o2uggsYWntUuriSlirlWqmIPFf6F5/qNacLpiPunD1jsAPDNWz8qhk+duaW6Z+J7nNVWmTgRv4NAOjqhNge8Q0BgLbI6AgTi6qChTgprccdggSJYDNvFpAgbZjwTcmA3IaYU+OQYLpF//+oAUC1PDErFK0hkxdDagQNS1BTa2BHwTNkS6c1knk+JAQm/dEUOnVHFtAp5pGpAKCr2JVykhFOMQNA01lDFDOKJE7PAHYTfdg1oC4AEHoxecuqJ+P+KZUoIh/TbrltiM0P3todzX9Emec8K9lZCgC0+VK8wFPq1Sc4PlufjaIs/wTNF3iERDJKDWdFKIopTgAAY/wbAXXU41w9JLxw9/TV1f/csZQbLP/kNp9ex8bxtqcAH7uB9/WT47xF1irIQG8CAKQ1Z5Xee1AA0J0ZsQMh/nMAQM4jMfmSAbMMABzYJSAMBOxZzbqWA4BlzVJY52i6AodvX2L39XOWw4qmanhqKtjNu2ODkdW5q0pUFUsjXmPsVhgUAHhYsZs8gNMZPv6LP8WuHXBgqbbSOysYaBfx4Ni4mTYZt3vsrjboVqztLer1LcoX32Hz7RcYr37gUYfiUhE29gXG8gTl7BGq9hHq+pGoAdgfOADIoMKyaTHUDXAyx3gxw8WvP8TsyTn2LUQaMEcxBJ1FiRARpdAMHc7HDouXL/D3f/U7jN99i+rQoShnGGePUS4UADhH0Z5gtlgCLOLvsEGxX4GhrPtuh+bsHPXFI4znZ8CTCxxaNu4BBbsleNyiGA4oWD1A9DxisGwaDv418xnGUqQnvT4A0PVGTASUYCOi1INZBY5+T250/Q2BW4PqWP3xswcAbfGO2kZiYkOGMSH1IX0Sp3LKvqi36JAVAKj0Tu6ShrcaAJwQcWXdesmABHngGz245D/4Hr8SLfOb7FzqHt9TTNtFQf/7AoAKmiAgoBPNl47wMqF0FGCzwTZhpLVnqsAZ+WfOTX0oQJ32Q/06DgCyIaYVUVRO9SUgUiD0qk3YW2nbLfvOogUEuNQ+qswgMzsJV587+IWzoDn6RrfGjt43vq9NSFPjPr4HCPK+13E4EEmVPEvVGlfrLYYsiwYEMza5R6AHGo4MlrdiywM6OxhCrL7idrtfaV315WjK2obLVGn9f08A3NDFFTxh64lkTgqDVQCgYCMTwS1W3efg0L6HcoLGJ8hejwJ7PqZm3v5JAEAe0WExv1HU/mCzIq1gQ8N0qYgiQjmzObcFTt3MFBPcdwAgIaJanjcGAGqVb/wBfUMWcbOsJaU19mwlKvhNil4ELLovABizfAo4FjdExvZ4od2BvXvOuzlZH9nIjhuxyGU1XoTeGNF4H7ac+aO1b5Fy2glGALo0CfzbcgiO8Uy0mzXZo3mtACA/AUwDgKpWStw9MPMXxt6kKAvK+fSh3wT5nwJ/xHELjSHIwXp9bH5w5YD9+x0A6DigkshG26U1QJL7f4YAoH+JFj0hN7NVDlWpHXb5G7l1PLdx4a+WwNCP6HY9BwDHjhWoa2QU4AzVbIG6K9B98wrbr38ENgNqBorVNYqywTA0QMHq1BUoGXh2WGHsGQB4BRxWKMYdqlmJrh7w/j/5LcazBnsGFLKbgvnGikWwhVEi9m3NUpQ3O+w5ALhB0e9RbVaoX/yA9Tefo3/5DY8wNAAgS2FeomgfoWzP0TRnEgDs0A0DxrJB2Sz4LcdYzjCe1Tj/9fton55j14BfytGVbNMnY1/Y+KQb3EoA8Gx1g7//3V/i8OVXqDt2A3GLYfYYxeIpyvkTHMY56nqJ2fwEs+UCq+sX6G5/RDXusdutULH06csnGC8vUb73HnZNCbALP+oBJUuNHrYoOwUAlhwAbGYtmtnMpADLDYY40KURNdPtof+k2SZqTyR5yKQTfKjnaencdAT3OwDQWgMbW40j9w61w+sYlin/2bR+fQcAppeBZuhydaoAQElotQrUS/EAQNefJ36LkR9nneSGOH0AeRcAUAxcD4n5yMTf5LAi1TcRNiN3A8vtsLJYtuspCxi8vQAgv1xKfKZKlJIx9p59CQihLQGYUhrbBTHS603Sl3WjpoyKsRUS6nLqa8obAqzNmpm9cczuQgfhxytKEj9GRkgKngvoIivDilBWEiImV2b6hsNCtFMJfmZOwibxtdMHbXSFcgCgG7hjxsxb1YdmMvxElvBQb5kIQDGzXJZaHv9LeciC3gr4NAAd+8aslQ0CElngGxg1TsnbMgJQAYC2h+DjXVaEuKVnXKkwY/0JAMCkiNo/eiHzrtMeigJMtW8vYPaEU8mp3tm6DGBHANr7Y/tSEk7ypLTbDmNqFrHfvNG5KcATT0pi7bs1v+hzOsUlotqZQhKXWESEaFIEVpyANvgQMzMSo1djCC1IhEa8ReKBROC26LIpk51SIaGTFdUv1w/ZFGDqbtgKImAOjmQxf8beNxkAMG/sqFHzR5wEAKV82UYs52q4Dlk6xcYnmByjFz0XJm0IAFQ3d/qHDKqGqG0kbBoaeokUgDgAmAb/FN/QXRPTbfSSEmXIfA6OSRt13pTs0BWmqkLc+BxJbNddOn27ssrthX0qq7Vq3rqnU8z54FLSC54ilLduMSlIv0slO96HLfP2hsmvrxJyC6JtawAw3rsrPf5MHfvrTFmkqYmP5pMjIwDp6Fx94TqE3E3ma6qceFNDkn/n1By1bECIDBwAHAQAuBswsgjAotUAYNnM0fQl+u9eYf31c5SrDtVQ8Jtpx6LCONZAUfGLKlgE4HC45QBgv7/GeLhFXfRoli1W4x6PfvMxZh8+wrYWACAfKy+xJGkYYCcGAA4sAvDVigOB1dChXK9QvPgR228/R//iS5TDjqQAzzAWC4z1GarmDHV7KuoUMpCT9VUvUDTs9xnGRQucVjj71Xtonp7jMAOGeYVeAoCcnhIAZKRjKcCnY4fL3YYDgPvPP0e971GARQBeolw+RblgAOAMdXuCdn6Cx8+e4odvvsDm+89Rdrfo+y2qkwXKi8cYLh6j/fhTbOoKaFnqNfM3RC3Ast9iHHteL7ByAECuNznJTA0625eYbiYTCUFCt2VE3K8xZb+Q9h8d7clNk/N+VjvZEpvyj62C5onLp+wuvRgJ62dVUmcqxb0athN8yJQMe7/pL/Kei9Fa8UXORZi7b9LNGbe+zi227vNuyqziF84KksfpO34KcMwCC14y23kxWx1xpHS2QyaB3xGPTP9V6ltnoQUAaH5T+tv1L0iLAf6hXzkWUAsgp4h4kAh7TnIjPnoAACAASURBVD7FjUHmow7m7VmS3yX/xDjCvdU3dMAq2qa+kbaMOu2RTETTT7EumWkWdMtFqMXG58qrGwGofrdrmk2VciVZBU+BpzTntLEySzL+l6NAXT1P91+c1z19Ij0cHblp15x2dZ1o3wjFQwCAmtcsXpY0kvre+E5m9Y0OUC24/E/T4G0/0sxLzKWkpQhIMza9TBuqbyLegk/zBk137YL3Op6WNc4OGHnCmLLAYlD00g5basK8l98ipPiLZKzpyGTHnkpQ1trnWzxmStyp8dN1mwIAWtrPGa4YjdIl8k/3oCwhljkrWJz+839pdWkZPD4Te0Sug+HhMta19j7xDaOrUacVQP7cIf6+mwJslK7aPIgaZYZINoNTYxyncY7Ejorxavyl3z9C3oJDFABgmEZhk+6M1wD+0fajtFG3Lk9iUKkA+Ibc31RmTU9kD6VmHqNyGlBmIbzMgIXfNgBIhM+5PqXv2kpaGPy4uRe/pPlDXLIhPwFnOvS+7WKl208DeEZFm2GS7wIbKIveMorDUO9IWcoxhUz5tx9T9BaK263B4ZYYsFOgCwiHV9CcR/DQS2ec8bDZhOlnaDTwE9aEDktaODkXvaC8R2mk/3/23oNJsutKE/ueTVNZpj0AAiRIAjQgV+IqJEXo/0gT+iEKhbR/SZqVtBotqVlqOUMO6IYACYAw7dBdNs1zinPtuebdl1XdMJxhRXR0VeYz1xz73WPMeaZRIFOSNlhOPxJQKyNlhZFkyVlKgH+/o/AFrfNzNX21yxO0XtYYnQjtMcbDGN3oDsT7zzwEBMcMK6mYU6kVVnXblRmRJCOUTICI/GpcD1yPZ2IvmpKRU2zG52lW2hUyo4/wR6/lQzgrSetap8sINfU2ogMBfLvgtyuJPCmgXpDnVKOuR7Nt0Gwa9G2OPJ9LoKyYIc9rLLIK3aNTXH3yBP3pGmUnaUJ0NxcpqVLHUh0+AuPQXgLNOdBvMasKVIsK66xFff8Et3/wJs7zFhv0Im1Yp+jE7BzxFtI/uwbDusX6+Snm9L7zc2Snz3D12QfInn+KfHchDHwxJkpJzmoM2RzdUGM2O0ZLXXoJqCxmKA+OMBQ1UFTo6hw4qlHfXWH1+j10ixxtnQkAUPbapTlWCmgbUA49lkOH5cUZnvynn+H8t79FuetRDtQ5+RDFwV0Mi9vYEIA6W+Lbb38PVT3Dww//gLMPfoP+8qnoGkzNlnF4gur+a8gfvIHh+BhNlVMvEdkdmZqBdBsxhpYSmytZ/4+6AFMHY+FAiv2jCooTBkrK9hikg+qsPRMV+3CWD5j4r5ty0KcOIEKZyj9RsomPOUiBlzJUWVdSFzCbYyz6VL7FpkByae2MyThO+g53xD6AoFSHuiiUn2NiQ9pKkc10tl8Txj47p56150FgSgYG8pOlzvoAlTsPvTFyvL6/cRP/I2iqkKhBKEvkxHSjV8pF7bFOqVUaSS+g2hgVaRTYyindq3V9Qn87BMNs5T31S4of9V64I/T0vX9AaNYiqvUS1rp8SwhQ2blz3emvWpT+J2tMsvXaR4lze91b3zH7Q/dojD9e6UkmPDSgZOfn7qm/F758cmtq8ogyFb/lpWj7cktXtxiXENeQHQawsrP38ZCA/0dq/rm0KPlSrIz2L5SckvaRtWxc+zO0VU18m9N8Q8lqbT8bO9rOw3n3aIDQCFEpnvX3WIxczd9GA7qH/1Z+aY3l7kdQo3Nyu0YsbuNXxa1fTe+WX8fKiIX0y/dSAOBM202xoT2QVPJCiRnDSXscmE29g3+fHfz3LgAYnMB7J1gpAFCYUg4AGB+KXaB9BFRI1B6ZJuYbU3Du86QByYnE/T6lvq6z0EYQRQHAOJHGFdR13qoi+BIAw9TT8oki+0kAbQ8A0N1LOjGdGlHi+xtES6ZPzKe6sOnmInEq0fwQGhhs1gkDdCr8WRgUDoCtBLsROOKKSRAxteJpgNQzFM2DJF8bTmILEAcAJ6X4jYhCvN9xULS8Uf8rANAYNzQdFhFJ97vykOjBW8+Jpj38fk+VCSXvn8j7E007kHoeesPFiNlJna9O3Kfve7gQGGvaGBFvS++d3IPwvVa9ufcrSMSzqEaksJYvY0Jap09MhgkwfnQM/pTu0byW1mFchuthXIfaZR341BHOOAR5nffciMEcObNvrEH6TeNdJ7VRzAEMIWEVQEXAN0cD7N7FyMMASAYA3GG73mFoMxTFAkNBaawLCQCiQvvoGc4/eoj8Yoe6I+BIzoM62FJDD9lNj8CwRnQAzrsr0ciiqgqU8wobqr536wB3fvRdrOc5tvkA6kCsRp+oAzgAuw79eovN6TkqOoG4usRw9gzbh38GPv8ziq0CAMWJRIUB8l8/zJAVK3TDDMgp8m+J6uAIHTUxKQv0VY5sVaG+e4iD1++iXRIACAEAUkqx0D85AYC5ABjLvsds6HG4vcKTn/8MZ+++i2LToSLQsThCcXAH7ewY2eoE26LC3ddew707d/Hpe7/B6fu/wnD6EPOaQL0B7fwAOLmPgze/j+HWbXTLmRhP1zcGAAQ1ARmyOAAoVt/N2LguDZNuME3rr3uzuv4rBwD9CBlVgsfQvJAdyplSjpmuKSX/DGMg9VL48WNanli5EkaEmFfI7VFNIjxxztbaj6D0ZZZ1nlIAIHPiTAT8nhv6EgDA4E0pANCxUZWM4sNnD7uJ/R8CgOMhFEJzjc2f60xBY8quMDm/bNCKF0VELmvqJcgrltaoeUdFFKX0VDg+pm9vYO87gHv0fk/njwCAcgqu/RuzdXza4ABgyrfkbD1GB/S+dI3Jffxrd4R6L/zdHRtrOgIrDKhxI8pC+nDFWdhlnNO3lDX2EEGvv15jn67M56mF31Ns6MucGpgj9zqsNBGypqMjqQEWDbPXJc8yWrnQn3flZyhP+JAC8FnZz75damSuAB/TVqSUIbGJ+7Qn/5YArvxd7pfLb1MHYo5824v/Yza8BPNGo3e9+XB6cl2JkL/s/ikJoQCNUf5xlo6PlXn/CX1yTXINLt8LAHSIiANCkZod+zTpsAJtHwGVcsKm7p8GAMV4HQqedvpeZNFDQGX8fTcxANyx/SUBgIphJlLykmu/l0DwFF4CwKHTl6nhyO7CcfYWVZTIwUwMetQAM/FFaQHsN+ngV8v3poX4vin18Sn86wMAySHlSnFq/QSAzgjA7o+UTV8VAHh98E8rTAvASLcgTZ8xo1grSQ3ecNr6lwIAcp7naz2FRQarmezCPm2gpXfnRTSZvddx0l/wkX5NSOOQKCDD0g69VetOXtaD2wTcIHZXwgKA1ORiwG6zEQAg4U9Uv66n7r/VAlW9wKwvsPv0KS4++BTVpkPZUkoN6QZqU9FCRvESkNKr9FWq1bcWv5MDXC9n2AwNutUMd3/8FtrDGZo6QzP0KKiByFRqTdOiv9phc3qGvNkh32xQXJ5j9/hjdI8+QLG5gNAyAgAsBfiHbIa2nwHVMZAfoKiWIqoxr5foC0pZLtFRxN2iQH3vEEsFAHYzigCktF4FAIo+xAQAAkU/oB563O5bPPn5T/HsH36BYkcp0SWG8ghY3gZWdzG7+wCz23eAosTR4gAP3/8drj54Fzh7hHnZinVrKA15eYz6Oz9Ecf8VZMcrdGWOVgCADYZ+Q+6POHChCECqAVjWFYoZRTfapJhUk6opUvwrAPjVA4CxKGofhNB2cHQ/HfkoU9ans4bYk/4KAI46wnaVpKYXtqQGAFUKn3uNBQC5dohHGer0v4TRLhEeb3z27/0iJD2PaDJn0PPHvmgAcMJnSfmAf4kAYGgX2QMKsduOmn55AKABuV5iBJWgRFbDL4zujEgsj54CWafo4csCAHUBkphdKqMPXyIASDbcQDaS9ky/KgBQBu4oxMHZJCNT1LR9utEiSX5tG57oh4wDoiEtSPrhSeZfMwBQE7gDAHopjYZw9IJNRMRokS6ZfQrAkwDGxBlWCl6JoNPcBXdrdtn3qGteorDQg/yLAgBVimPKkE6miF4rAlCx4xTilhrMDQBAJCMc9wMAx2NfdE2q8UFLgTMOIKbAQxkBMXWCn04jngKw0k5UCgBU0KM3gS87AlBGOHA1qwakAQVHAOsIQDlruk/Qt55DlqETWQdMKXoRz766DCOmmeL5igDAmxjOVlm+HABQUr0r26OAYkpHfE0jAM0OM2IwJJRgqGiEYAQAtCwl129MRgS0mGbmG3/7RQCAgv/YxAToQxFFyiQwJqSoUaf5lT6VJ+XiMhEdLQvBu3aE/J7ojwA4MuKbzQabqw2Glmr5USdd6gI8RzVfou5zbP78GJs/fiw6As86DTgOWO+uVLoObVSPHC3yYSsBwH6Hpt1hfjDDjurZrWrc+uG3kd89xLbOxGdFXiYBQBFh0PUYrigC8AzDZoOq2QkAsHvyKXafvo9iQ81GJARJEYtdT12J56IZx+zwVWTVIfJiKQDNLWXYEuhYFeipxfA8FynAEgAs0M4pArADOSAyd7QUoIoAAAdqaNzhfpHh8c9/is//88+RrzcouwJ9eYh8dRe7fIHi7it46yc/wcOnz1APOZ79+X00n/0zis3nqLordF2DJquB5TGyb30P9auvIz85wjCv0HSNSAMeKJWaA4B1jXJWoZzVsji5ktB/6QDgVI0t3zxweToSgXeDCMBxxnfli+UzY80G4R/OeGMRgNzc8QGeaAmTCTxvFAD0XeuRWe7lg1xTNLJ5BBFfsQhA9ngHIHFk3X5jeGkRgM7rVHkFETGrUnR0FoBBZ40DqDhTWQzJ9Q0BHtfX8w/XtcNtVyltH4drNh2xxTlMELD3EG4Pura7Cw7E9ysAWl4CADhOGdMlSvx7fa6Z4qJRPNWnCw3lekaJTHW11pF/MB1LAWbSZ+8IQMOHL+jTO9SwR4QzX1+auh+x6a+vjSCTq0LlRSRDSazEwitaA/oYioeXsAGHSIrVH0a2OzbXPgAglQnhs+TWoCfNBABIh4sqeDYWATgVIcm+34/3w1kr4491+NWyyv7P7fUxEFBHADuz9I3uCbEtumyba/hYvwYRgDHDnmrmmB/D5B5Ex5nMK9GiFZQ2wcdOh+xLRjZQ7eIU3jhWv03SYMyBsjsoHFIOAOyng6951fj89PLuR+ix175gBOAeNc4I4OA07xggw4ul6FxzIaOXp9ZOBExMdJWexiPTEYDp0+h0BTE32kXpAcZ/JJimHKDrmwDXWfUQAOSAl1QfXqstTyPuk+Z8nRH5CldqJ6ZmHQtMpu459zCBIhxqr8aUhheE2hWPdiMOfPnvAoBc4kjFPRUBODl3bmCbVB2dBuzMnNWCUopOuNhp6RINedfGSCQC0N1/eULKn8FrzBoAUA0hqjtfEABUeQajy5hOsQ4d7PBBvgGmcBN2oaEVZcelbATfgZbkyBwe5+ZpA813OK5pn0ySn+afMSqaKqLvv4DLY24cS1koAXgbVU2AF6FYQN9TB1mSh3o/BvGZ5X/5NF/i5pQOSzUAKQLwaisiAPNiAVAdwHqBvJphSd1+Hz3H6a9+D2wHAQDmvXSGRUIrPbqoIKN9WwwtgX8b5Nih2a2RC+Qsx26e4+jtN7D85n2sK6DJJQCpE4F9VhSAZ98jowYeVxvszs6R7RoUmzWy81OZAvz4I+SbSwHQiYLaOgIwn6Fc3gHm95DNTgDUlKCMhpYnz0X9QZQZegrwO6xx9OYrKO8eYFt2aAoLAOaoVKdiCQBmbYPjvkHzh9/h0//4d8jPT1FRTcTyCG11hPzwLvrlEepbtzE/PMazx0+B9Smy049QbJ8i355i6Ft0tKblEsV3f4yjb7+N7OQYa4qn7DtZ+S+jfz36PkNRVqgUAEgdgVHICoXkDZGElvt6/R9ZgPwmp4bqXYY3b26h7QUA8ql5Hmh0/HxKiRRgemzafvCi3QPnmcB1d919+TW1MvumAI/trhtEoCMA/bqQiVF8EQCgEtnGqfZ0gf0zLb9vYv+/KAAYND0Tg+UAoJKvKiVRzkWvu56ZVeipFGB5xOoQK2csJ1VQLqm0N1PPnMpsiK3PuOSIAZSpq/lGa33jX++6++Jbnzw9kcTpIBh/SuwJfp3iwKnv03JVms+h9NV2Bz/kFfrMExghAOg+K5UxYbx33oyOSpaxlEk9eh8ANG+ZAhD49COqIlrjlN3jAM7ewUBsZXkKqbQb9Q76pU8k4fjy0/CjebgddIg0uPatkVeKJKYjAHkyLxd61gazc1S8q5oeaj0xlf0wWUP3uhG9fNFZ9h6P/OMWvV6zeASpvHJK5kywqH/mYbeQ07GmHRWBbfjrJoYPG1A0BZiLBJ+/Q8BEEpGj7LjgGQEAXYGeWqJxgMxFxGPP0Oi0XSXP3TcnyWMjiNbwejGZ6b3q6w0Auk0swlXyI9C+LABwXwYY2yrDtATgjDGRKLKbVoBhioKnMYL6ku7z3BBrdyCuclQCPwoAjkuBCDwxNaFrfP/1BgBDZRhaW4FBNQUAsq5mEgAsHAUQAC7O8yQxWaUtQ+LHI0j32IobAICGpNUJJifxAMB06F8b//J/utZPAb4OACgdhwkNtg8AmFqmZAqt7jo29oD9xher0Mf1ZsS+j7/Qc7AFeUUAQNeF2N8C4NEoe1DWXpeIJkmJK18EANSP1YYwge1DRnXiqKOtRB7m87n4v+1aNLsdSkpvpYMdEZCn+Y0bwe5oKQJPA4CbK2rgQYdWc1EDMKvnQFXhsJwDT87w+T/9HrhoBQBInYBF+gbV6iGZTI01sgxNs0FBjSy6DfqGgLmNALPyIkczzzF/8wFO3noD61mGnQgQTwOAQmJ1PbrLDbZn58jbFvn6SgCAzaOP0T/8CMXmygCAQIGeIgDLBcrlXXSL+8jqE4Aag6AQnYCpcUleEGiXYSgGZKsaq289QHVvhW09CACwFw4+Pa1UAGAm39G1OGwb4MM/4uP/+B+Ap48wo0bmxSH6+hjZ8jba+gB9VWN2dIJm22LYnCK7/DNw9Qh5e0YwLrqsRE9A6+vfx/F3v4/izm1ciZRqMqgJgCRgdcAgAMBSAID0L68r1XhFAYCihMtfJgAo6DrBP4Es9vkslmFBD70GAJg+AHVt01B+vHwAcC+hwy762gKAytRIS+cvAwD0M0Ss/JNy1bUQQwBQanmdWm26dAYAoKYVaxPKN401GpGWkO0CKv/27QEf4PA7WXN6sQfm41QU1pCbOKJ37JP9da2em5qVGlBojXvqXdhUcl/cORhgaNohMTeKHUn6Ly/uHYQAoNK5ygCyAKAESnzALAkATsj1rxIA1MvK5XeMOvR8ObjmA23GzlFf6P0X8N4oAKht8NQeKp5Ugw2QBic4guU/qutvBgDy8XDicwFAwRfGSE74ryl6n2yCo7lPPj+0w921MzzG+I+DyQYENBzm1tfVvHwdKcH9hEBqRQBAKsHA+XrKfZrSp0kA0CyYkwXnn65JsuLGARfafgocF8D2RCc1zIBsufqP4FPu8vMIQO0OuISQ3i4/xdUX2FMLPP39+Pw0cSRlePIFLx4B+HUEAH2llmKC2NrxFMipGn0y1CBhUCRPkP0TxHCvQ1rU9CiFi52bEvh/BQCnWeoaV/hdzDhgQcapz/+yKzSF5iuFoiKQ9D4GThv7QApurY2V8hFAxs053OkivWcEIJcrej5WIacMYn7i+PUAAKdc/xcr0j8NAMbKWIwZ8HyNx0jUd7JlhQJLH66Tk9KN4Ru+zgCgniGPSOJzlcZwLjA9igKczRdYHR3i5NaxiLzb7RpcXF7g4vwSu90OTdOgyDJUGcXwEiIo+c2ksKll1QBgu9tic7GJAIAlDus5imeXePzue8ierzFrZD08or2earwSiFhUyIoCu4Yaf2Sii22zOQVa6ga8QZFnaOYF8ldPcP/Hb2G7KLAeOpSF7LIbhOcqI5QAwqHrRATg9uwCRdsgIwDw7BTto0/QPfwzys0VChFpm6HrqGxFgbw6QL64g3bxiowApOYgQ4FWdL2QAGBWgqA4BQDeR3XvUDQC2REAmCsAsFcdlikNmKCAbsByu8H8yUP86T/8LfDkE1RNJwBAqjc4ENg4P0RL88pLVNUc/eYUw9VH6NcPUeISWUYAYIE+XwK3v4WDt36I4t4dbItCylUCVQ0ASKUEFQA4q5FXNQMAbQS/tQn2N7+/zAjAMQk/acCP1IySHk3I/9Z6UPw/EgGoM2/SXZTd538RAGD6ADUiw7yP4gAgH/eEbv2iIgCVfElT4xcNAGq/zKcKuSZST7lOcAgA6ug/VQPQGEy9lKn2JF3tjI7Si9Cft3c6+seuUSzijo1P2FyxSCj5YN9fivlq1wcA+aCvo2/jc0lF5PHx/mUCgHavNLgz6AwatXcOAKhsaDcFmHHMFwgA6l29dgkkhoXQbOnAyqcQ/rcDAGpAZ2Je2n7cBwC0UYAxi9K1KwLqjRwgcd96GgBUbzdbxmWJL3dDAFDaw2meSkXI053pJjjiDSZCVY/I+mo2Py4G/hkaYUCciz3Yww1pDSpv5BoHklpmRf2BGABIASPXeP6UKzwBAKqddQDAwMX1AEAd0ySX2Wcwd0PDCKK4yh9TozwnXisB91qLoEtimCpq6b8/AABfwFePb8bEmLypx18/Pii3bXhkBFMh0BP29ItFAO5rrNv5+Sh8zNnmszRMH1lHoo0pBUD8Nj7K+OmmFTBudKwc17hA4t/p+gLGsFGKxu9KK/9OjTANL02nCLg0Y3bCEfr2Gnd86QRkJSGuzZNTQm3/7yMRDF5K+zQAqAxj9VJP+ij60jPVFMBU0YsCgAF4qA12mWCjf6xRYbGG2IlsOuUiBABFCQAmfmIRgJw+/e9fKALQhLqM0/9Ehn+QkuIac1rxxZ8vjXQ/Ak5qZy6RfWM+vcYu9fIEc9/BsfJkP4oPTzD3u2/sKkFTLykCUK+XBgANvYq6f7nohkfORDWbo57P8eprr+KNb34D3/jGA9Rlgc1mg2fPT/HhB3/G4yfP8OTpUzTbRgBjlCRsDiVVxK1+X6kiANvtFuuLDbKWuKYGyiVQzUTE2aqeozpd4/Fv/4jh8RlmzSC64mYCxKKINAkAUiQgAViL5UzUsFufPUFPUW/9RjTVaOsMeHCMb/wXP8B2VeOyb0R66/g+UvRbgaHt0akuwBQBSCnAOH2O9tGn6D77WACAtDpkTLctAaRU4+8AOUUAzh8oAJByfTN0JG+IZ/MBOXXdHVpgNcPhN++jvHeIblUIAJA6AdNP0VPDEylTiH6Krke9vsLRxSne/7/+FvjsA5QEAObUZOQYQ3WCbHaIoVqIaMNFPUe7eYb28iMMzROU+RXFa6LXAODqFSzf/hGq+/exq2t01HgrJ71KtQApjXsKAJS8qR3OeEqhBQcc/hasOpECPGmicKcnzilxvt2P99Ipi3pwdg30J1b+2ENEDp68PABQuz5xKk7JQSsl4/armpVdqMDx0Z3B9SXaFpJ7Orl15qIXM+rH7hajmUB4pZM/TgvXHZmlF00TXokeo5m0nnJPuO0BqD78oudEIgAdDUfXWJtGOtN6AzgluvM0+6sYRP/tO9l2M3kNwJHIc+6rWuNZygilr3wZkOJEpeKZjJ6mKm3Hx/R8PGXTjiDkX/mdkSF+TaLUcCZ5gNmh+4kj7yo6bNL87/n9atASANQHcDIFWM9Fz4tbx75/7k8v/NumaYnvKAXYi3w0UtJfDyqhlKwB707XWS1FZz4AyOWO1AzqrgiIFLPHzDvE86cjAE1tQHWjuz6xiFo2p8ka/Tc5oIjpQz24SMbTBAA4lQKs93ucfF0PN5S1nnwyoLQbEclpyHCklnNeHmm4ryP+A1dbsQkwetXPFE1UFOPsI4mm2Do7/B/+p0DH2A90Lk0KY/DTa7ykRgUwmagrJ6RznxxLrdTjKxSUJHRCqNn4FfAyDgDGv5EOiVrqmAEiNMt11bTd+X0ASbP5dhiciwPtoUcjL0/VYJMAWGpNmPqJ0lKqCYXbgEHeHkshT6+eQ40iXYsTvgwhH//hBhYXrmo0kzUAp6KzghQFDTKrQbqk4dOyFk77sLIcfdh0JX1vTBw71CcAr/3o1xgh6gHmLjZXV/mqt48eIKR4e0p07fd9eILE14sbuQEbyZ0U8stVEua0iL6a6PLsr639W5s9+8jA+FxjBq1M1RGcZv4Xu8CwLP43N8a08TJKUWQwybgBU38kaHKiRI7hL2cs4TySNVaN9T1Gn5SGOUG7UwigmU9sjWnRxp/PdtBwhHSgLNfxaGO+Kw61jbzC7qC9ej9OHecNp+bXpIMQB0740/2aPv6bp8ar50jAGf1eqIgBuo9Ky1HH2mK2wNW2x2x1iAffeA2vf/MbODk5wGpZ46DOMK8KFHmOtuvx+MlzPP38HP/wq9/g+fNT5F2PjOoDDgq0U3ujAZCSwuD6Ac12jW7TorlsUeQzDPlCpABnMwkAzi8bfP7PH6D55DHKnSxkneU1Mro2q2REW5GjmFWYHcxR1AWaq2fYPPwjst0ZMOzQUj+N4wPc/cF3kT84wWXWiW684wCAbGBCa1K0PZqLK6yfn6HcblFeXaJ9+BmyRw9FSjA11ui6QQBrebVAMT9ENr+NtryDvjgQckzwqurEJ11pQtcy4HCOxau3sXr9DjZzoKl6tAIAHFD2lPpLUks2AimpccnlBQ4vz/HBT/9v4MM/IN82yIsD5NQJuDrBUK7QlwtRHqHsewzNOdrtp+h3T1BUBIa2AEq02QJY3sX8W29j+frr6JcrUO9fAh+HvJHjo/eWJcqqEp2AdQQgFXzk6yYavihAzwVdfInryXni73HxMqkZx/xHKVdtxOnYKxz5O6HSDMjJFG8IEIbS28ogfWBpD96TB6A8LMLRKHyg7H1MnhgbVC1QbP527u63PJrTga/8h+joRj0EZzHlh/vZNlNSanxj0ndO1Jg0DmT8+XI66RkE2TAGkLHgtmMvK7qUb6RIW6urpOrmNhkNUPs/+nMXXDUpweJ5NDDzOwAAIABJREFUEmwOwD96xZhRwfYs1s5Ozo8Iy1Zf1mOmr/walv5+BBF/nrs2xT+ubHYnIeSNajQ1RiFx19COctJ+mZAJTkT7xLUJKrvRnYZezCQHA8BZwckzBi1gr/WvzNCTdrhLe1xO6/Uieep5q5o+dGgFB00UTTrSiuHSWkKkJ8/2SoNDigwM5yRcMLO/Hpij/SQhIdQruPiSH8k1sTyl36j+N7yrrmYRhnJOZB8nZjcBvgUBU8Yed+U/fwU1+ZA/cozW31dXOTa93nv7vCl+iNXAnIJf9Lo645TLE/3h17klClQGl3ohP1CLH65rQhl5EdETAfoJ2ci/oncYAPDGHOveGAUA9SVEfLSB+4BUetN9QIQENN8AVyBL5zfBP07EVDhnLwKQobeSaeikW73fEDtXcHamWvUJumAUQKf8Lrnb713GvMmOKAYfudU4gFpAMMFjbgkUuLfBmhdj7zDFklJjdw0E/8pUF2Ap3Dyl6TnkY0LfCBG+GcIOsACgpCu3jbw/eytAbbaC3V7dBXqsk2567rHwaxkjpbxZtfbeChjJw4V8dHvUhw49XuPEyorh+P4Kty7NfMGNDvjlfSsMIkeeaUVlIRE/gnGfc/qbcJa+RwKAeseZEWv4wi9pIO80VzKl58gxnYFFjmhigK60sYaMvsW2o7/+LOnZfpMNP8JU0iKrOugDgd6RpU8Ozt8eAEjrmi6REJO1dp707YsBgFMRaFp/pTZonMelwp06MnL336Ycy+emA0BCA8gf6RR7Tho/3gP8Jhv73J+0If0uAN4EUvdqPhMrpcZJYBf9Su5eR7q7mqHJKhTzFV5541u49+p93L5/guWywGoOHBYDDmcFaoq+6wdcXe3w9Pkl3vvoIf7p17/H5dmFqKFXDhYEpH3p1cRlBCB1AZYAYHvZImcRgMV8gWU5w0HT4/kfPsTlBx+j2skoBuq4m+czkV7bZTlaEqZVifpgjmo5R9Zeonn8JwyXTzC0V+gKoF3McP+HbyN77RYuS0LUikSVCQlwlwSCNT3aizW2Z5coNgoAfPQIzSefoNhsZEMSGlRRo5wfIJ9TFN4x+vI2ehojA+6F06g7kBMAuKwwe/UWDl67jfagQFMNaAuaIwGAFAGoAEDxdyfAx8P1FT74f/8Ow3u/FQBgRt1/y0Nk5QlQHYoGH2Q7lX2LoTlD2z5B3z0DKAUYLbKhQJPNgfkJFgIA/CaG1RHWGdBSBGC+Uy2KIgBgQWnXku+MjaQBwCCqQfJYjMulaJcpNcGPl+pllAK/UDThCjWY1RPTNV4nAsR8DRuNKJNdrnXEtxuRbdSccV61XJL/p+w3MTNWocKs9Zg49QFA1UTO2CERYeYvvW8r+Q6Yt/wBgOVobzGedBbC9bWueweXXYHsVj5Hwr9TOmJMSk5nLI0DgMqmjSywbaLBgTVJQdYeZ7aS7zuZfdYHcJq7NABoU4uZ+bS3lWRsI+OLacBaEiOvG+cEaETekI6glYASf5+fVp/kT9XkcFRHJw/Y5Hvl+6e0/DjDvTgA+GIcYHxgTTmi8RZ/pmcBG9BeUaEAAG2E6fholNy6BgAon+VKfjEaNb6x5lvOGJh/rXndWPExf9ybgE9f5t3qsIp0q+OeOOEGCQDQAf+U/L8uAKiA1/E15xGI+iq+nr5G4PpOjSmWYegIBTcC/wsBACMZOVN2qZSGfoqyzYBywD9FZiEXT2rMdABDTH6o2tf7ca18f0q6vHQAUKK+lkikw8FOYR2B+0UAgMrYU5v+LwEA9Dfbla8pAExt/qh9wSMkE1ZdAuLwuwC7T9kDAEymsIbCW0QA6vmwEFxtdPvvNyzLhLVV6rrL6xijxNwG/obQuPwrAMgFjlo/Bsx/+QAgr7GnjA1HJKoDAratWj8JBcCVVXDAQFFAUwCgDyC5zDgFwKQEvVEvIwaXdgt1GQTurGjDzT3B97nHsUZMDDUHE3wH0t/foEuk0xRlSj6FBpy/HukumnvIN+8AxTFdv+YAYPzU0c7AN1SFMcAOYLgxPCr9PeMp0EUvCwBUofzUaVb85BnarEBbLrHLa9x59Q28+fb3sDhaYLbMUZQ73D4ocVJ0OKkyHFYUoUa2R4nzdYdPnm3w9794F++9/yGaXYtCRAGS7pDywACAWYmsH9A1O7TrHZrzhgGAc+SzJVazA6y6Ac/f/whn732IYksRbNTBt0SRUfOPUgCAlL7a5cBstRQg4Lxo0Tz9EJePP0K2Oxf19rrFHA9+/D1kb9zGepajLUr0o2U4ZAQgAYBlCwEA7s6vUG53KC4JXHyCzaefodjuJBBFDYnyEuVsBdRLEfmH2R10BGjqyEdKwRJgIZ3UC3QPmOco7x9h8coJipMFdvUgIgDJ0ZYpwDoCcEDRtai3axzvtvjo73+K3e//CcV2gyxbIC9WIg04IwCwWIrD17zbIesvMfTPgeEcTXOKIqN9yNFkNbpiKQDAxRtvol8dijqAEgBsVIQS1Su0EYDFjKIzKdVayl0eASQPoFTUlSHUGwCADvinUyVDDpH6YezwUEZCiQjZhJBPN+GQJ/72Z7wrqayFJOcagELKC5Dyn0UBqgj3cQdhGgAMIsAV//rACdc9rgWVcj9lZFASQIseALv2XOqQ7abQi+MOjw7Qp8VwrtaRjK3DiwGAxvmL2Msyqs7vqMtAP3sE6nVS5xGAUj7JDdLgnJI0Sq++HABQPV+NV0SPKSInC36cQqZqhJGCnwKsvH1xCFvWiP5LBgDjfpOa8z4ZAswHE9QaBShUpo2xnzXtyS63aQBQr64FAB0bTWS4WQPYsWkM8bHvnTnt0+XZ9QH9AIgxuWbkgzmc0YCS/EYGSvhNcPyzqBAADGtgyvHpXncuLSr5PSpidQbU2AVTAKCRMIZg/KaG0QjzrxAA5HjruOZRexQBALnvwwOAxqVAWsMkAc8I/1ETkH1/xuwBh39iKcBWuV0/AtAWpdcIMK9i5HddVABKAo41KH101n6Kng6XtSCgTXHlys1/mGSimEMdiwB0DJiEAzm9US94PmnSX2MLqI2gdAqwbJeY+kmDYOkuj6GA5QCBActSr+dgMg1F1XiwtyjFEHVUrQCl60NhLelbRymGrLoPAOgO3kCCTG8FQllRmgFoRkyIKD3ykL0E30gtYxVKnEK+zhGAXPFPc9LYFdLR1T/K2HDSY+MCWusonz00DRnDacKDCE14HwC8uQsSN661nJNz1tGompJNOpimjVQXYk8ByZHaUzB52OOO/6sAAMfZQEf4JujnCwUAp5scO0waGWaKOtxo2/gcfZn3tQUAC6mHKPOU5kwRXm1eYVeuUK7u4M2338HxvbsoZpQS3CEvrnDvqMZJ1uLurMBxDVTDgPlsgW2f4dEF8M8fPsLf/fTn+PzpM9kko+/EPw4AVioFWAOA7UWDfKAagAugWiCbrbCaH+CgB84//ASnv3sf2LQCNyMAMCd4Lq9EjUICANuBUpWXmK8WWNQD1k8+xOWjD9Bffo6+2wGHB7j/4++h+s49XM5yNIW8d1x+DSiHAlWbobnYCBCwpJTby0vsHj/B7vFTFE2LqiiQUxONnlKAlxjKGRrMkc9vo0NlmqAIWGroGAjYCgAwv7PC4sEx6rsr7FgEIAGypB91CnDe7rBodjjpGgEArn/7j8jXG9E5meoAFtQJuDjAQBGABOp2WxRYC/AvG66w2TxTACD1W6nQZnMsv/UW5q+/iW51jKauBQDYUwqwSPuzAGA5q1HOZqLxigRN3SZN3KlyZf54BGAspcZofeZAxhwHqU1ceetbAz0PoYvx94T9tS8AKB4tfIMIAKiECAcAdRQYAagpAIMH0PjXiZl749fgI8dJdJGWWDRV2oS5aQqtCwiM8dbUAcqU1aHfkkrhf9Eat5P5Ud4CuhFl/o4ZK8A2RRIkox+iAQHuK0U+4xGALwUAVMaqQ4myNI0cmhofBwDVZzIFV98f2TG/Zp5zCaWs+g61u2bGztPv8DZ7HAB0U6Xtaw3VSGvqhSIA9QHBlCMwbhtwH8G/ytjACUZwIwDlemo7Ud5mvBg5X72bBgzUtObiBPG4JTpQsT6ZtUfVAAPAxPXfov5UagEMb9j15fZU6E+GCyX2V0fmGeBPZbVHMuTcJ4QAoDy45P80sBhKCsFBgb/M37APAMiREZd2I7P1DqxiJb8UFRjd+uVGAL48AFDOw/Xvru/LTQGAvmTz7YFgDxxR4MGSSnbxUWZHf/M/j0oP+cX0KRQXbtYeYEplVIDIkNHksiULVYYOqB/tYlOY44aadWBjcFQ49+B0dQIADIwmx2F2ny+VjVo3rWgmatyN5q+oNZezjm/xXgBcNHmGPzzpoqowWksAHDDQ9R/S6ssV+OR4xX5cRS2v4PRrTm44R4kUHnmCGD+kdxVI7L1+DQcOsPDtZCvgPCa1BynXwk5wQugw+vGX7otIARYGEX+R4o/4to3NMGa4jgqRhHTxU8RJ2agmGUq2+TczthNfuYA1SyNXJ5+pGkqa70KTksvGxP7FToC8oh7O3YYJrAnmOmLu+DWX8AiJNDcLi5XHc4sIyLgMUoyWyKGhO/0aPu5+TPOfKCo9OugpA0fL2xHqnDwBjxzgePogJpf4HCX9jExg4v3izgnbP2Xw7HP/VI2AdASmoowUUalGkjYFWMoPqgnY5DXWxSEWt17Fyf03sDq5jdlhjfkqw3yxw/EcuFVkOCkH3F0UuLOaiWCAqy1ArSY+fTrgp//pF/jNb34nUoCp0Ucp6LUXEYCi3UdWiQjAdrcREYAaAMzKhWhkUR/eQlnUWFCa8ONn+Pwffw1sCUikchQZSuqu22eyqQVFpeUZ8rJAvZzhYFHg9NGf0J4/Ai6fAd2GumKgfvNV3P3J29itZtgWJVpeyNgTSEQfJcmsbY/2fCtAwHLbori8wvbxUwxn58B2J+aVQwKAlAY8FHN0OQGAx+hRRgFAUa8n6zBQc5KDEstv3sfiwRG2pawBSJE2pG8lAFjIOooKADzcrvH03V/i+a9+jmy9QZFRKvQcebkCioX4R3X72uYC2bBBgQ1ybNDszoGhERTfoUDTVyhfeQPHb/0Q/eEJdlWNXQ70eSs6ERd5IYDEsiLwr4aNAJTyJVbT0pi9KsoimQLsaWNhNyimMqzl15rT9+jnjwmgPQ6HJ5uQ+fLepGMq6c0iBIOuxv4BoNJZvO7bmPw1Zmjwfkd6udFXoYGhvFNuj4USfiLEb1Q+Cs0TRCC7OiM2JGcG3gXXtTzSKdzTvlMcmtYj3OP+qPy3s7DlaHzggCsXzx7xU35NqqDWVaxumQFk5PNthJT8e3oGaq6xd3qHjZY3ed9YbtB7u7eH/qSIGvcuvnYj+out+YhXmb7RkQvXA0B8e9VaekwoOReF1qf5Wnw1XkM9prZ9e0MWiuB7TaCt9rwsHcs3yaYhEqrKBa3Yv7k8D9Nix0MZXAYID0VdeeBxhoowHjNQIrLElFKQI5qqgawj8zSVav9VruN0hJ4tYaVS35Uu0r6FjvuWz/XWQkvO0UKAU++XEZruU32BE/tbr+eE4SfII23ApgAyKf/1IYHPGfZvbgO/HADQjtt6AGM2/MjnI4a7M9/Y0ngZAT7sG286pfkxjKj/AgHA8Q1hWxNR4PZbKZ/SYfS+AcWBHtnlVaf4jYhqA8iNA4COeuSbog2qESKOvdEdrwcAmnBq6xJKOTHl5cXUgiS8VIzhfurZFYJcW9I3DqDHdTEbNmeB2PxHZ6cUlIHyRA0yfzlstGeM4qQAZWYWHwwDAHkpNE6fKQGlOwhqh0OslHo+p5kUJ7wcAHBCgY1EAn69AUA9J4/+9hEr2qY0zhzfjfF6I1w5CN4lA5IB9nxvDVCY0HGhGozNJS6XtG70Hz9VI8OJKPOiYuP0acek55xa4kCeJG9KA3DCDExGwEzv/V8EAJhYUBElNfazhwMzqRoSKbz77PcXDgB6kdmFghQoLoNSf7fVMaqjV3By95tYHt9GuSixOi6xXDWo8x1uz2scFRARgIsiw6yqsGkG7LIMlzvg3V//Cb/5zW9x9vQp+h0BZcTYCgAcMszyClknAcB+02B3vhMRgFk5FwBgcXCEspph3gP983M8+6ffAudrmT3bZigoum6gOn6FTGeikgA59b/IsVwU2F4+RXPxFNg8A/otMK9EJ+A7P3oT+b1jbIoCTYIG6ABCNEbZDOgud9idb1BuWlRXG6wfPUHvA4DUOSUjAHAmQECqBUjgpI4aoIg0Ak0GioQUIGgvAcBViYM37mP+4EjUAGwUAChpRAOAQNZssGwbHG43ePLrX+L0n/4/4OpKAIDDUKMoDzBkM/QZRR3S3RtgoCjAnQACczQY+p14rwQACxR3X8Xxd99BdvsetmWNXUGp1DEAcCYAQIoA1LJaH+DF5KWOCBwDAJWBxLjPyhsp36XekHKTyyIrleM16vbXXV8GAGjsq1EA0NMyTO6kaoxJZyOdokviPWW9aj94XAYm9KPYHC+FM3YAo+yyqYjp2PdcZ17D9FCXWvt+zB78YgBA/Xr9fpbqaxSGpGd359VaXwsA1BF08nlxAHDCf9GMGLyXqIuXcPH5kDkcHjCu9yphngn7Ll3jNwWP+bFtnDqs3ePM3PFn4hQxbd/Z94QRrNP2pUvP0/aVN6vAFRX6RElJaxtKEFB7oPIZktIpIFMmrMreAvZ+eY2wB4O9VGvl+YNj/GhtIpsqbuhBPMrSvpZh8WeF9+v10ysndOkIkdE4xAEae/hLAQBJb6vIUbnKPFpWv0yvv/3fn6ONEPScVq4RE/bjOCg7IbOdgaRp8OsLAEo6Sh9w6MULvDgdAhqQ3VREIA+Y03tvJUkI8AWgsIen/csDAE3XHClH/jIBQNpSZkQyYDDGxKGFZRnwpQKAEWEwBpBo1eyfH6QA0FEhzCboClS5RuMiTp9gqFFE+FAXEda6xb0kFE4a9GNqmO+Uk3Jp1d646fhlAYBa7fH/XzYASNtUKMDMKOEbRwDu70SNrW7ccXMBQD9CLjB4vBRXbgDQtcJ3H7Fv9QwsTY0ZwozqPGsiIFme0iLYPGZ9xC0S7WzZUdiiveJR3M4aWVTBSfpEUfYXMREzgt79Jj9ehk2QgjrOGizVYfyivwKAyQW03Z8jl/E9H33KRJegF44A1Oyj3mMivPNM1IjbVEeoDl/BwckbWBzeQr1cYHWcY3HQoci2mJeZAP7o37ykGDiIbsC7PsdsXmG7GfCrX/wD/vDb36Ik4K+VzSV6ehEBgChBaa5906BbE8C2RdZXCgCcY1gsUM/mWFKaLwGAv38PeHoKUBruUCHva2RDKSLkCAAU5K6CjMtiQDE0aDbPgeYMPbYY5iVwWOHo+29g9foDUGXAZqRTqmTvTDUBydCc77A7W6Pa9igu1woAPJMRgIQ9IkfX0D0yApBAwGJ+oFKMpTMjSyKwYt0EWFYZsMix+tYDUQeQUoAbagIiAEKJnsgIQAkALgQAuBUA4Nm7vwCuLkUtxKEvUZRLDKjRo5L15gZK/90iH6i2YoMib2UX4KFDjxy7Lkd2fE9EAFb3X8OupqjITDQh6bNeRuibCMAZyvlcdFvWdRMtyBfa1JMAYOD3KH1v7BwLakhwQ4WrBq6t4h6DZlndNZZ9ofntLxkAJLpIN2Gwtb5SOjqZAjQC7Bg314sA1IAa17RcpfoHJlxTvkwAUL5f2uGGLJTxlbIx3e+m4+fGDoDknLV9rIEM3561o5TrqfyGLwQAnAIB/XfbEXEDKwrEO+N1KU3b9TH6o+9SEUSy2Qi3mO1TQtvOsxyFzJRL6s5cyxj1qWfvTQEezluCJeXZGUbCOBG02n6V33L5Fq5QjFfCCEAZAyinqt/PAUBOhzkDAOXVaQBQ7JC3oXEajsuXmP/GOrmyCHEjT5wHhevJA4xEAF+iBnIMAOQyRoCPyZJuakXZwY2t4ap3UB4gu7JLr5nrGUvb3aVhUaKWzdnyi+xule4wEOcNJ+w7vjHs03CP+C1T/PDVRQDKuRsJPRoK7kt0y3fiN89V2wcA5DvoHuGEJTN8T5BqLzv7/VJSgM0T/Zp8U7uvDdGx68aKdFoDK6gppxSfFnRuDcCIkHMiAOX39umayeQnvtC36iGu3PRdzoIHgIJW0pKLpdKwT5bYvlJDnvS1p8/cknVHmTIhrNhO7RNj0CgAaCNYfIUXAx+1weu+2ydTJo6ZBtcC1e5FeMJq7jRLEjHC2OO5ASuudLbSClL5Tl3Xg+2Zt3QyrdnK2fEr5RNjKls/UplE45vjWJZjl7mnWHxG4vmRLoaJJxmDxgXOrCFJTqgdt6WdMfNPn2K477RPmHKg0malLnjOV9SeMOrwekfhqD8MF/kCmrOa7FUw+uPLiylpaD0FK4H8xwcKYgQA1IareZI3bsMCogSD2r89Is5swWV5sQQA7cwCgN+rweMDgFyuhuvj8p//vaAuSikZDYPbIwU4Hvor5b16fUI6uTEUTFZpzZGmT4pQHyegBGlZfZTYM18e++unh5uaX7rGq1/TV8/avmkfESWuUYxkDFkFADblIcqDB1gcvY764A5mqwMcnmSoZh26/kKASlU+CACwUgXZ+z7D1bbFwcEh5rMaf/rDH/C7X/0S/XYt6s9RbTkCl+hnhko0uhiaBv22wfZ0g6wvIVOA5+jnMwkAFjPg/Apn732A9rNHwKYRoFfWVqKjLUU1yEhzFQVI4Fk2oK5y7DZnADXCyHeoDxfYlh0Wb9zB8tXbaOYlmkJHmXl6Q0SoEwBYIGuA7rLB9vmVBACvtlg/fCwiADNqCkINgJGhaXrRmVhEAFKX4nqpxqXBGAsGCLtCAIC5AAAPv/kA8wfHaGYQAKBulMJTgLNmi0XbYiUiAH+Fcw0A5hWGrkBREABI4N8MXU/NUjYUy4lcwH20ZgT+NciyVkgdigDsl8c4fusdzF97A5t6jm2Roys6maadUQpwIdKJqf6fCwC65SZC/a2/5yCMy5EhfVqXx0YBqs88YRfI9whYlY7wciPMY/oh7GLqWgU8Qs+PyAukZyQCUNZQcyUAF6dTDolu8hfVbU602YQZE3+AA16Mr4/dU63LtP6je3wny87Pnbkv7836TQniyMCCEVmV7q22S4+Bvk+io6PFIxzYRPsUGvDh0tnbea/hh9bOPCpL3qHXytKHBXtlowKx8sZJHo8W4hYAp21ta7uLa5+tPnd4LtyoQCUHRkSqRrqKADSTlTe7fD9CHAQARsE/vXhq3z2ZkYy41WP3jQo1BKk7rc3tjpbtgG/Tamoxn1t7kD/DzFsdAIv5UQScuIjHI3m1G82KEQAowg4YVMhTkHkEIF9pf+JsAVSAQVy6hPajnINdIz8C0JUVNp3ZjIDb0TT/ZI3JMALQ2DeaRSYBQMmSYsSqgROnKxtnyQQM3w+xBJoPFX3Qn3S5NKANYVi69lYpal/rtbXExOVqKj6Wy590jG2sxIO9W0yBjX9Uw/gZcPvK8wAgjtGTPiSN0Ws4Iruycl98+8M9UA+9h6BmaGBz8P1QspoNw6f37ORv/hfnLVqgW+fBHXIgP73FtP6MEiKjuzImzfgNPqLpm1zuhvCIP83IIcDAlYwvLP2QeGmghaTOx5iqoeCPN27waQWtBalgcOWguClyoeR3eVM7vO7GJ/1jb398oydlwPprK+UJH6NsMsFFk1hPLkQnDBx+ZEG3mQhARaCmy7O2BxQfWsqY4nZLD+I3b4n9UxOe8mJ5ZIzIp989DQCGQsC8jQRUDIHiKTwRBcmFzlQEQmxmUhnJbzj4opWbXcPE2NUz3IgxvRdWYk+toC9A3fGqLozmQ2l82JP5tGwTRo1X484dLx1gpOaoOMRcs588cDkmvYb++pgzKfGFK99iTwpGFNC/K+vs++Sz06MbKwIsnzm1t4rCkhok3WVz4g1p4pkcY5r/fd0Sm4ZXw2xspiOLvNf6JWrICm5LAJCTqjsiL208gJbc7ihjzjg3aCmCWMsXiiLLyiPks7uoVt/A/Og+8oMlykWOck7A0gWqYovVLMPRvMbBbIauBS6vWpytB6x3DY5PVqCwuF/+9GfYnD9HgRZD1qLLZTf5aihRiIKDCgA824iIviynFOA5upoAwAVW1QyzbY/LDz7B6T//Edg1ov5fPhB6Z1OaiP+yohD16kjUUKJrRl1vsx2Fz4l3b/o18gcr3PvuN7CuerQl1RCUdQ/1+ojDLtqbHqgIBGsHdFctds+oC3CP/GqL/tkFNg+fIN9JAJBWuuvoxlIAgMhnyOh/6g6sawcJX14CWkJ2k3wrKAKwQHFnhdvffQ07BgDKQy9ph4nozGaHedfKFOB3GQAoaiEWyLOFAAC7XtUdLCjdtxUAICVKZ9giA0Vh7mQ0YlaiqQ+Ae6/hlXf+S1xRE5cyR5d3op4idXXOqLNxXaGoZwIEpGYr0kZi8kXpPJlCxuULl1iuvSgjOGLM5R8qcAvQpWc38oLblty+HZeSiRYcSr96Gk04nKFh78hTPlx2GGnFnbzAjorNyamJNn2AkuxirHTQ2Oyn5Vd4fB3Yst4HpkuisnvMjquX+fayn9Hhd7V318mTiI4dezMbMAX4mD1NLOC0BtZ2mpyJnZ98qDETmI3EnXdr40vaTjd9VzqPRdCG/gOPRlQjCKJnmE1uvnOJmsvJMIbJtVIcC8aPGPUO0Hx5oCMO9Tq59pI+wItQsg4WVmnRdgwu18nhTHOCkSYO4GTXWzxF6wzD2STH0s92Sct9nn6ma63xO6T9K+WKH/Un6c3ax0QUBPzJwzLxrQIQ7fO5vLHj9iwIs5RGirknFm6EU1BhxdMB7Goxe89/5RIozoYTe6ebcCg68+nIlxq+fDK2kTAFZIq9sBM02Zhf9Dg8j1LQi/YKeESgbk7iN4rQI5KOu8iwUR/JNygacT5V+khcqA6UrLIZpW/d0XhcO/p7FR44+4dXUxkpjjynYZtU9ZT85nvsjlbQB2vkE1CDEx3BPab4YsZVAAAgAElEQVRw1pIfeNSxXmu7AZL9LZ9o+4ztGhM1Yfk8SV+Mt07+5n91RuIDgHzBgiGPpoQqIT8RUTK25O7nvhHCjaxwgSgkZRz8kwTq/qQg+OtGNAbsHBB/1MBQJ7PaJJNIv6wtoCOqRsnT2RQpZH0DcRQA9B7KgTmjYCdcfB8y5QxIOyXxKTZIqsm4l+EUzlg8TwtSI5XsfLmw9CgjQWrM2IgBgBHpZEXtnl0+nbf76syPceOKLwUPKrU5ouDlnsejo8TaqNfE6HGKL/n9PCVDrGRYNmP0cdKB4/MXO2zpV639mIo16iGhg9229Pr0kdHMxGRlRqslgiDFNW0Rq052XIW6g006UOIkfVw9xoLXwqhGe7//JNeYjSzEqPz2jYDxRUzPb4rSpr4nZenWCJq6I61brne3oIxR2ttHAvkn3td/f/qOaWa8Cf/zd/rkqQFAY2d4J5Qc7NPygq+jiRAXBi912D0EqlsoFq+gPryLbDnHMOtxcAQcHWW4fZDheFngZDnHoi4Ix8PT0wafPLnA84s12qHFneNj/ObnP8f27DkGasSRNQJgop+qL1EqAHDYtdicXckIwJy6AEsAsChqHFRzrLocVx9+hs9/9x6w3YqmGyU1qRCOjTpcENFqtagB2BCYUhP4RjTaIssa9P0WbXeF7P4K9956DdvZgLYCqHTfGABYKgBwWLfYfn6JgiIA1y26Z2fYfvYU+ZYi66QmFjWWMgUAUgpwtRAAIMkw3ZFWps1zABDAokR5+wAn330VzTwTEYAd1TIUJGQBwKHZYdFRBOAWT979JS5UBCB1QoaOABwq9KglwJhRw48O+UARgAQEEvi3wUDp0AOtSY5tOUd2/3UJAC5WMgKQ9kecHkoAsKhVBGBNAKAqIK/0B+2jNjMKU0NKUanDnyFPyiL03k8yqoQb3xHX3aH3afk93kVUR324Y/OLhE+4n+bmmJzy3SvBj7wrqpnL+FuSBwgR/yBYas88DOSZjqqN2GZhRBuLGPEAwLicjKRMTXRl9k25hHbeS5hPAoCpF3h+wz4vlDVnLR8EAQReQqB7yK8BwIRF5jzQ5zf1t8NfMSLRNjnPAHNtKP7XqE6PPNpfb19/cf6SPOOulWszyRrzURfJ7I17SO7qzkylIO/LxbEDC5vDaQFANe7JBpIxXzpmt4z73MbfiwKAHmAj9CSVy9A+IM8A5MEr3Ady3UeX//wE1dBfcuVTKI+NnaKWLAYARmWW/tCzb/xrRc22PcE/occ8fncBQGlvajuBLpUkKuvcy/vl/pkVFACkfKgFq+w6xJtG2FlYvNkDD807GO0KO0FHC2utnKZtfRg5LrtcegwDLjhtxjNSYs+WKzLtX+tgkfj4QtDbNTd8Dyv0xx36E/Yb860CO4Q30dGyMcyCcJW+XR/zG6Ox7F8eAKiafggBHCO+vwKAY8wWBQAnLBzfsLw+ADil/Bj48hUAgI7C1npVfShYdWr4vsWoRLHRH9GTeCXM9xBQ6QieUJlzB1yIaJU2t4/x6IzZzNt9h3bq9dcp8vkrAJiOkBOW5bUBwHGa/CsAGDHlrsfAAZv8FQB0l+RFAECiTwJEtFylSDJkK/TFIbL5HVSHt1AczLA8qXH3lRnu35nj/kGNZd5jXuQSL8qB8y3w6bMtPn70DE+enuFgvsSjP/0R508fIxtkJF4vAEDqapuhomO2thVNQLbnGxDypQHAtqyR5yUOyjlO8hk2f36IR7/5PbCmRiADZtVMNckgp4buK5GXlTDkKAE2n1NDDLJEJADYNmsM3SVw/xB333oN7RJoykGAbRwA1ImZZKCXWYm8B9rLLbafX6DaDsjXDdrPzwUAWDYt0Hcqq4ecgcrUAKyXRwCBlMqR3W0pwtGmA1P9v4FO1WYFyrsrnHznVTQLBQCqTsnSgZERgAQAzrtOAIDUBfji1/8ZuLwAAYAUAVhVKwH+iRqAujg5pf8OnUgBpkYgVBew768woBHE05Yz4N4bePDOT7BbnWBTFuiENytr+FIKsA8Aio7LpGSUOaedLHFgak8vPd88NPj/0gDAQABNpKDp64m2xh0h+U0cALSHZbH7kwFGLwMAZAVFwvdH7Bt9IPdXADC63xYAlIanSxbKRTToGo9/klemI9Z8e4VbHGOO7RgAKCmSDlfkz5cLAFq97tm3bM0EfBwDABVwqEEGCyRqLlP8psopx0GDOL+GEU4uAGgzgmJAXsT+cfKz2B45l+4BAGqAyZe4TnyNjQDUa2IB2ZsBgC76Gs75JgCg3Y/I8zh4oqTmGIgmI7pkkyIOvqRcxusCgExyGz7RQJ94j9IPtimL5qUJx15yn02xVTTNIwA1+Gjn4wYgpcEzxdUqGyFO7eFYv74AYHxXXdpwAUAN/vGdEPxtgD+eXiycdds1mzXz4DQTypKvDADcJ7xyfNstYfsoi4v4Bscv1CFOydmQxP17p5ghTAGcGrH7fZhCkY4AlEcAOj2H/pdd7sZ/3JDOm0YAKlWlXmSBLRddjo3CVW7uCZWwz0XdHLUTYvn9CEAbxBvulxTAfP4iApAbLuLEVhknzJbwga74Crr0oBlper3t06bxAz6rkP4i8Jl5uLw6LaivAwBywNJEAE6kH8TWwuUvOwMxXrbV3Gwbo53xCEBNe3EYnz87tQc8AlA+ieSD69SkVvjlRADy2Xsrmoo4EA54YnSRCD1nj1n8cewpeiSj9D4ZAajnNT7GLzwC0K9i7DgLU9J6OsVt6glpAHDqbtUFeVqITD8oesVXEAEoajL66b/MpGYy2qc7oiIHABwqZPkKXXaAvj5CRTX9jlf45luv4pVvzHG0BG4vgJzq420HtE2LIS+Qz3Nc9MAnj3f46MPPcPHsDO3lBZ588hGqgqL6G/QZNaMYkHUEAGbI2w7DVkYAytC3GVDO0dcEAFaiWcitfIb+0TN88uvfAefnwriez+cGACSgjaLteqWTKFItXywMAEgAWLu7Qi8AQEoBfg3tKhddd+mVFAXI5fLQ9SgI/CJQsQO6qx02T89R7QaRBrx78hy7z56g2HWiqQbVI6KUWar9N1AKczHH4viWBCbVYdL68lJ1aJTG6FDSOzsBAFb3jnD8nVfQLnLsyh4dpS7rqG4GAC77HsuNTAG+/PUvgMtzFMUMXZejnh8xAJDAOJK4PQrhCO2Afo2hv0I/rDFQNODQoStq4O7ruPfOT9Ac3cK2Kj0AMJcAIEVjzuaiAYhOA5YpBrLmFFkSBHVyWMPVvq49If6KRQCOHry48iLQ5oaPNWVrZTgiH1XK3pj85bJ8VACMAIBmKPQQxXNRMeM5tJls02mSjH1d6Y9DAoAj8/tSAED3/dJBVP8m3x/at4G+ShmDieCkfQX2zSIAuTx1Lcip9/rzc+2LMNtK0gx7n5OyGtn36IEl2xOzN+reZATVlwAAeuQrawpzimY6lGUfyRXREfzeqiue0PUKZYyxXisrNYTk0imi6nlTEQUhAOjqeOsPyPdNkK9nIaZoyZNpys7yAz7cqCo/ZVza3jJLRflsJoOG054ddUq8WKDEt0MtXQb+kQJXpNYIf9ymEuEVfD312Mb6oNPdukmI2fWJrMjrAYDBaJQuVKss6uPpeoxRDywpLmyXYL6+HkDlKBWOP3Dvgo/TXVPbaGfMl/CuD0p2ePo++D6um+SnPKoxthSTHlKk27X7nHA/WdSqp58k9+nvrd+r6UzwjRg4m7NHTyG/uPLG/z6IAHS2QWA3NkVC2BL8yC+pYPXCjxgHo6TniqxY11Unh9nvOmkaaXAnZFoMyuH4AlACgPvW2QiMI5arrb8bqzFiTkS08lA1AKcitCwAqDbaKFQlliYEDp9zGAE41oTFztTtyhVZAX/7PYCWl6DWtO0zp9m9QAG78KBU3EqxTBp/jJE8I5jPIqAcPp+kduKWRaj8zTsEfekfvYfyb1e0JWX1yJeWnrlRw39PpQBaBRdRlGqA2rgRY1UTcdQSb4riLWYoIegC1ULTOWlNCfF0FKauM2FWVNXrMqDxxLL69H0dQMuE3gfDVzSqN3l0DHL/RqVXjLdZR1ERYcntbO89DpB+bfKalu+cb6/9+L1v8Jn3mvom6YBMDGIv/Zd+Rqjf9p64uDBPdulNGfSKI16wBqDfxU680VkXRr17yWSlkei2oULT1MjLI+www+zoGK996w289YNXMF+qBjQtsLlYY9jtZMMMAuTmNU6bHihynH1+gc8++gh51+LJZx+j211SqwzAAIBAaQDABlenlxjaTDTSyMo5iuVSyKRlPsNqKEQNwKd/eB+4uBCAkwBMDLyWoahmAnCTaU7UXGMJKkyYl8DBvMR2fYYddcY9rHDve6+jvz3DthzQFwRquQCgtPYyFJQGS473psXlo+eYtRnKTY/+9BK7R0/RnV9i6CgCMMewboBqCcyPsTi6jXp1jF3boe9acQ39a3dbgZuJZijUApkacygAcPmN28DRTIGSBADqFCY117YBAYCL9RrrP76Pxz//Gepmh44Gn1Wo5sfosgotIYsUjddT9N8g/6FF312hay/FP/QbFBWl+5bA7Vdw6wf/BsOdu9iWpUkBFjJMRADWBgDsclUzUZwnWvqSKXDugamrrsOi7knhGrBieGAQN7j5jWl5FFa5Y7aVmh9/QrrmrHuvM4oI78mV4yCY3GM/osXVQL42SsuY8QZN1sZJn3FOWUH++jK9lDiIkG/3Iiz8/VZTTe3gi9ZQndrPcRPT2rnX0xgubcrnj9unfg05NwJQ7f2ke6VphNsMCZuYpTbGIazUCxmPRmh+CnDVq6P1GPePfBtXl0YI6Ff7cOogIQUAyvqq+meqxqK702IFfbBS0bX6itV8jFOJ08RlItggfMK0feHaB6oED0vrN6RnmMzd2zRpxd4/Zf/pQ/URn4IBSNb/GRuFSpAfeSXpLt4lOOVPGQrwnmVsKdUwWDxTkbibni/hC12MREb8xeoyuj6mv6dcHrn6QTsbnJd9H0D5byZqlwNWUt5quWv4LEG/TEOMiLg9+CVZkoBze+wVaeqT+6n5d4yeXOzf1F5WaxE7lJNPkrsbRsjyGouRmojRYeidVAFZbKo3AwDZulhBGQspT3VoHNlezyGLG1hWaFKXOMdA0iGlBgya1E7ezvOYZVUk+9qC0Qp035hKA4C2QLc+3Ziq0fSiAKAPkBgWVcs2VSNg0sDzKVwDgGqJ/PlppaYVr4+gayWsd9Xde802sQ5cIzIkAQDod4xT0JQC5N/T7xFjNgYAqqHaLs83NfHk+zmPaoXCI02S5pQnUPi1cq/kOzj4Z0An5qDZfbVzCdWBUiAi98uafmNRcD6txlbJBfD8E6o9zAuvDsP1AMCYTPTmnwBFdNre6Cj3AABTlPNiAKBW6GmDKxj7lH12U1LXhm8qZTpOIKPn5P7Yg6HvCWgl94DbRTeY+74A4NiyT+mXySF5Rcy1rBmzQ1Lbb75T65oNFbpdDWApAMCDk7v43jvvoJpXOD17hL5vsN116JoOaFohg6j5RrGYI18d4ODkEO1ug/PT5wL8220usL06k6molJJL4FYvAcCsbUUE4PrsQgCAGQh4nIkIPkoBng8l5rsBz9/7AOuPPwU2a9R5gY7Sb8XBqAT9KPpPmG5Ud4/+zeciPRdZhyrvMbQbtMMWWBW494NvAQ8Osa5CAFBGsskMHooApCA9bFtcPnyOWZeh3A7on19g9/AJuguKWuylZ9AXQL0SQFy9PEZeL7DdtWjaHcpCpgI3uy2GltJvO2QzAipboM6RnSxw9Ob9EQBQDmbYbXEA4GCzxeaDP+Hhz36KcrMVxd0JMB2KBXoRgUjNR3KR+ltoAJDQg36LrlujbSkScoOq6NEQUHr7Ae6+82/QHB9jNysUAEhqQKZVywjAOXJqAqIAQAEOegfAYU9bTsHxiOpJC5ETZiRp8sbmoSnOHucyYTE49sF+NY60rnVsoxFGNiCGtjkoo5CcGnWza77JlbKAYKjBHe0m+HgP/ZC8JGIzjQolzx5zAMDYLvvdSr0H7yHfv1oA0NY7n5TTo/vP1yy0eP39l11PmfW9l77V74hRZJz7Ar9m7wnuBwBOmSF23i5Ncf/DdN32HyampIphBCmOdr62wZKe3DSg4bwqSp/ueLl+j3KAg8BNrUrUgErvjFdiX0f/6chil57CR+1hoY+8f2wuChgbkUsOAKaIYNwHnq4hJ5vUqSGqIV3H39oLAGTPFdaHBv/E4R0/vpG8IdGTiFwVAYP+uvkBCIq+TIkFX36Q76bT9tMAYKinYnvmrxb7W6XQpwmQjU/c6ukI7TdIK25vKWOuHvSBY+y5MmVXPlfOzfqjFhtLcZ0EAOVeSV3NayzuCwDKaQnv2jvw3wsA1MsmHqI7sGmaZkJIr6+hd0Mk8XUN1I1K4wg2wpN6zplJAAAynDm5n/qh/kX7AoBj9/O5hhF0XycAUDKgJVx+oqAV4JR+j6aVsCUI7p8AAF1pOa58+SrrnbARgC8HAJwWCVMKgBk+lilcZkgBgIrpryWVnIt1Orn8kIN/es1EEXLGX0nlpAQBv4YEmiw8q8SUJ820A6OFfXTfzIdCRDGBJ184Nia+72NrFACAJip32rEQu+cR8L82ADBpEnrgqBEnI5th9vEmduZeTDCd8ho8Zo8DAH1PMOw9HMSpYRubZOrCke/3AQDH+ERGTF3P6PGHITPu2DPUmkS3eGK9fIMwp06y2wptU2OHBU7ufgMPXvsWHj1+ivX6Al3XYrPdoqB2HN2AvmkxX8xFJN3sZIXVnUMc3D1Atcjx+NEnAgB8/vShAADzgUDAHpRmawDAXYv1qQQAi2wmAMCuyFFXc5QECp6vcfbeB8Dnp6JrMNUdbHfU1EInPvEIQIpSy5HP5ugIANytgd2VSoPdiAjAk+9/E/V3XsVVRbidjGpTXbNELz2SqB1Ba6oGIEX3XT4+lRGAOwkAbj97jP5iDbQSAMzKJRYHJ6gXt0QqbtvnWG+o7iEwX8xQz2vsdlusrygCrwH17ugpIrLOBfB3/O0HwPEMO5GWTI07tBNB4GKPdrPGKstw1HbYffAhPv3Z3yM7vxSdh2eLIzRU+6+YA/USRZ6h212I9F/qtExRgNSspG23shZiv0WZNdiSTXv7Ae6/8w62h0ts6wxdvhNrQUXjs5w6ALsAoI6W1PJYU6BDz8EBSWhPTOp4P8UpAABlyuzNfrQzGr9buA4eAOhfGe16mOJB7wFTAGCYTu2DTv7k+aG//W7MnpyWf9N62k7Jc8KcIADPC1c3advFfYb+cnprv3IAUBw23Iz65CGr77i6D5OHGer5BiBgH0w5CEo6xrKrJO+llILe++tMcBoA9PVMbPWsvWrXR4yGlSAaBwDlPaJBmWnEIbjZAxlsExo5wzQAuM+4/XUW9kHCvn+xCMA96M4rUfDlAIDG4okOUJfDiNmrPv6VDsIY9//0CHgEYEzXTMm/KQCQg5OSPmX6L2l1Gb2v/SfJF7lpEhpGs0tW5fJc/m4OccxgNU9IZrCHPNZ/M5l4QZdrnxhjR0Rj/K5p2X5vU2L5VvsyTf3tOCCcRvTv19E1SiwaADDOC7LGsHq+CU5j6zeSii6fpmowcgDQ+CtyMlNNjfiopHnpru3eAKAkBBcAdFN99JBt1Ivp8JLw4PVXkrZ02uo4AWhBafRO7kUAMn/EUV5GEemZ6KXx3+URj+kZImtDyB95jd+COSSBWJcx/31SwZrmzxo0Vf8nHTQvfFwO0P0n12ncQo0BJP7VdsS+caBmnDICmBEuDVpVo1HdGs7PhH8EIcNGAfMpqSHJMWvgT8WMTTrooUCJs3H8U5u+M7a+TMhEjtRlBEMkBVgvqxDo1xNK7khVnScG/ik2MxQRnBDuUaOCiV/zOq0bAgphKam+oWr2zHmKne+UclRbnqJuxbOegDeMPCZnLJf79mmcHxMCboKgxjlT2903TwHWez02BB61GbvGUO/oMrmyUvNnasp7+Qv7MmEwrrTh5z92Wn4Hh7eOFkn6LnvOYS8aTzxrDADUppum5LGDmnSF2fQkTJFoxtipHZg6LBL3irQZ+ZSiL5FvK+zWOdp+iXsPvo2mLfH5s3MUZYnNhhp2tKjqGcouQ9802G7XwiidHa9QHtaY3Znh5JUTaveLi8tnePzoYxQU/ddvBRhFKbHUI1fUANxRCvAFIADAGkVZi1jBBeUb73o0zy6w++AT4OwSaDvUWYZmt1PyR3Ygma2ORI06Xacur2fI0aG9OAXOnkoQsN8AqxJH338TBz/8Nq7mBRpxcG7BFQcApBqALTBsJABYUwTgbkBHEYCfPsFwuQEo5bkvUC6OcHh8D+X8COtNj6vLHfq2RzkrMVsucHhygk2zw+XVBZrtFQo06PodslkhQMmj7xAAWGFXURdgqtunUoBVetH26hKrosRRN6D96BN8+v/8DDi7EN16F6sTDNUCQ7lEPjtAVRW4PHuEvG+pX7LQZWWeo2sbdM0GfbdG3q/R0gbcuosH7/wQV6sZNlWPoaB6jhYApMYq1dxGAEoAkIrwa4tQ0uo0AGiNB6NpRoWwr3sda5VFvqekeIqH9JFr/H5pL6WrAHMAkPPXPiMS1qlmOg1NULCqlxbMZ2C0kbGt3Dc5EQ6KnwO5y25JamA2tj3FaWjr6nTDCAIpZa+3Up6CmlrHLx4AjFjjjv0SoY+0WWOX0gCA46vr+1AyYos9gq2X4x7xiyIHhdon8aOr9DOsxSYdMO+t3oD5hEd8FHWHLLI/DexK0nO1mfE/TCkiLXv8Bdd2key2LscvuDkAACWLyAHRt8GBmrPWWpunZQq/KnD4vVtdADC10q6cdYgoMRxe49DY+0JmKxjOixAMZMUk4/v8wfbMJyb1VrnmajSev8PJO+7T8L2OAIB6mzVKYGocxieStP/YQY4TvKHSgU1kmHq0zOjRh0pKdxvrxAMAWRMJZ2Sj/M3XVdK3mz1os+/Y6uoeJCkKYdzt84fcKU/gOJ9J+h3jP30nT1/WNK55lNNP7P3jQ5d7l77HRoD6a2bfO6ZjjDxgQSsWD5Bz5gBgSK/hk18IABTbQcYt4csKQI6d7BmipuigEaBZL6tWAHoxA93FrBod+WefL1NE+DTFMosLJIu7gBN9okJyTbRhbIOV0GYKQD7TJ5oQ4HOfprpEjdJQnHC5EZWuAegRnxikjaBSKmW0kYBWTVYdsoo0EeEZKjCtJMfNpDDARAt/uSgBQQaPUh+ISDNXWTrqiqV7GGGp5If7SF/7BxTn7BavMRQoJ6M8YvPXNOSMMkoJ9m53LGKlJgTMlAGqQXjNRpo/9Dv5G8X7gg1zR8dPQOVk2BM8ZeoYP5FlFhC6SJnjP/pCSSfp3eGnT3Ems3yrx8p4Rrw4JcCnSxhIa3JklFHD145TyCda78Tt6fmPKydLdWkHcqrJjD81xwEw81PGlHqpHXMo/64NAE4a6z7vWUNFjmP8AToVYt8xcR6yjx2XfendUdyTaAITKvQRXeURiV2BadnzYhGAIX/6XVX9GlKpNfGjmXICtJoam9MO/a7GrLqFq8tBpJj2VSlq7OUEKiFDSWq9bXFx9hxZmaOYVyKqrS07HL52C9W9JQ7uLPHo4YfomysM7Rrt9gqzqpSRaUMvntFc7dBsduibHiU1p6CmGj01s8gF8Hb24WfA8wvgbI1qvkRWyJRfCfjlVJQR2cEBZqsDFPMZlkeHyNst1p9+iLMP/gA8+wxoLoFlicV338Dtn/wI6wOKuMvQUu8R1ZVdAzPU7EIAZ32Gqsvw7NMnqLscRdOje3aJ7SdPkW9aFAU1K5mhrg+RV0s0KClIEUM7oN1she0yP1yhPDgEykKkBA/tFs3lGbX2xVBmMirx7QcYTgrs6lYCgCwltGsalHmGsu2x7HPkj57g0//9/0R2uUZe1qiXh2izGtlsJYDI2azG6bNPMPSEXhaoKKKy7YXOF8e27RXK4QJXzRWyoxO8+qMf4OKgwqYa0PQbdMJZp1TsGtV8Jv5RejeBf6ILMK214h+pKwONFEAHQt451/kHLJ5GDGR7zGbjVH09eTBZA1B3Ox5hHL9G9xS4YcxYo7kZDyv7ykS9BClhcu4musMDSLiNHAsO4NbCPjKXj3UfWRq/Jq3f+eH7Td4xZX9NPTNdA9CV5PHDffcNjo6KuMb+eKb2QQNmI5on+Fja6P6PDZ5Ivc/Zb/EHj+bjkULaD+Ogw/juay3or434PEh5DMfOP9FyxsqbVAsIOU5rB3MO0E81Voq0VvY48I/byzEZNH2lRz3qT3uf9qUl4/tz9elTIZjMufBHIOUVs/En5jtVszE8ILG04a6w1g8eaOc0YZniVvfAxI+25J6LWRlFX9fTCnYcPs06QCDjb1f36Tmq/0UUoJLdAv6wqcA+P3I9aqx6w5ialvUau7OSYzPQqsRgEhOX7pcfQcjtdR4Bx3dT8UySd62Sl78pXhSALPcRGLFGHTG9q/GJTPln3gqp6Dguv9I0J5rSJAFA+4bQ/onwp/e6yQhAbZQb4tYAYK5AQPVATjhWzE0DgDYn3evuagbqOthGndPcDMHZbbCGhyLE3ITwqcXXRw721CWq3Jjz7hKq3TwtusdrBOwDAHICU882TEFdgFMk5hk3BgDkXU5DgRgX+ootnPfFPEvvswmQIw4A2hH4BlQ85JqvuRZe8hmcwYywZCcngUG8h4J1FH6iyH7c2NF3K7ETxR/2UweSp1IGbAyw83bXdJW268WNc5+6gv3wUkTcLsxqbGPT0ZGtI1ZfHADU0oOPbIwH4orIMYWcW/21nDidUAoqKaIT+6OB/NRu7wcwTxkm499PJplNeQDeo28GANpNuObrJprijck2ladjDgzi9LMPf/m0ZFQqM4puvju6htm4jDevib5kPOXZ0NyEhfIiDmxsL30QTwKAU2aSnJy+V9NY0eeo2xpXT7foLnPU+RHOzjqU8xWK1QpFPRfRbRSNRxF81JKjj9wAACAASURBVHDi6uIMBQGAdYGsKrBpN8DJDLPXj/HNH34Lj5/+GRdnT5BT1BsBX10jwL+c0lQHCQC2a4qao5p9Ffq+QFXNRZThPJ9hOF1j+/kFzj77HBUBhEWJvK5RzKhrcIXV7TsYKqphV6AhYzPPUDRX6B59jO2nf8Tmw38GtmfADChevYv7//V/heb2EbazHI04MFWwtDQ6RLfbGACYNz3a51doH54i21CUXi4AwKJYIi8PRC2+pumR9x2GpkFPNf/KCrOTOyiXByIisC4GPPzT+xj6HVBSCnCF47fvYTjJsat3AgAcKK1YpA4BfSvrLNZDhvlQoHzyHJ/9b38LXG1EtGS9PJIAYLUUe1RWJc7PH4lOv9QluK6XwiGg5/TNlhYbeXuKbbtGfnSMV3/0fVyuaqyLHu2wA5U9pMYiBACWNT1/jmIxE4fPtC4EtlLUJY+gcSnNlQ+al5i1GB6OBvJ8f/oN0xynJUPq6cLEnQIAKWLDixQZe6tvoxs7nSkonRKs1yoESFSMiSf/QvBPj0tZyfwdDKydWqG0/Ju6O2ZLOBI9KPGxzxMd+/CFSyikrANPvjsH/HIUvgz+KgBA7kKTnIj98Gv2oU+Du+tfTCot3c0c6JR+8bKPuH+gxzD0EyFobLCGV00E4D6azYImcg0Ci9v5dKrmurt2I/b3C9kmHjihfGwBG6lNTMlYP+TLPT/hNdG088b985AyJgHawD/zSnipR2rZFxx4XwsATIGgih+9Kejx7+fxuTdHAWtFQv7zzJ44af1SfnC9pyNMtZ/ty1d3b7mvrbPJtEwKbW8LTrLcuCAF2Je/mp9jstpPiQ+1pSzhML66lv5UuvIgrAr1w5uCjWliTZ/7y4lxHcL8VYWbBCPnGyAWVB9Y6mAzt4ajH5Gd5M3IwPYGAPW92iCRp7ARceQIiRcDAK3AVEaEohW+Vf72axTaAD/ihFgN1AGrJkJL+AZpIMOLANTTHwdpvv4AoPIzRmh2X4BknAGn7CPXAZVKJjxTs7s8lra3F/gn6Oc6Br3bZdBfpDQAKK8OgsQnAFMuzKTSSo93zIG3++rVAfTSgYM5sQ2T9O3O4MsDAI3ESQAINwEA/RmnDZBxYa51yPj+/BUA1PLPKooYaOQaiZMr7ijwuPJ/+QAgB83t71M1QNMdqoXJw/WTP/WJdPxJwGEyevIFawBGxveyAECimLLLMduVOH94ifVzAuqWaLYl8vkRqsMjVIsDbKkJBxnxBAIOPbabK5RFjmpWIatyXO02GOoeeHCAb//kbcxWGd77w7tAu0WVD2ibjWhUQbXuBAB4uUO72YluqFR7r+9ylPUCs+UB5uUc87bAxeNTnD5+LqPaDg5RzObIagIDK1TLJZp+QNP1aLtWpLwWuytkzz9D/vwznL73LoazR0CxA04OcOe//W+QvXofzbLEeuhUow7p2OvIQg4APqcIwL5A3g7YPbvE8HyL/mInmoBkfYmhm6GeHSMrj1TvkTWGZo2sG0CzrE/uUTFAdCXQ7q7QnT9zAMDD79xBLyIAt6IRR54V1N5D1P8jULRrO8yzEkflHPmTZ/jkb/+9BACLmagB2IHWoZYdlMscu90Z2q5BllWoqxn6np7RYKCmJMMO2J5iRyDt0RFe+9EPsD6a4yrvDABIzVgyAgBnCgCcz9DT4TOVEtFNQFRkiu9aixWMRAnY62IpXL48v469kHZGYpIt9fSXCQBqB1i7WcwHcoY1BQDqGl7SMvAPILiTyKWTLu3DYtj29Ih9B/U62kFem17hqSZ2U+97kQMUsYZTUSxcYf6rAAC11SnpR/Oqu08vDgAa8rsuAHgt8E9zCQPpPQdfUmc6GGWcBhVtR9Gg68si7bFom0r7ELpQwVcBAKYiUKX95Et9BdRwP0vvWezg4boAoLcZUwfaUwDmlO27p5g0o+Lcw+WzlqMiqF40ebKtQMbwMxspqOh4pIadfrm2iyk6X//IjOJQM9tl5DMMda+bQR3K8psDgJI/7P6N6YmXBQCG4F/Md3HogfbINF2yUZs8EvyLAwCV8+BHAFJOLw2yk406TYSGBkOCUFRx/QgZszz0mKI30QMMVJTX2cKWzpPNSSg7fSQHyxES6g4NrAROkn6i2jDzfQg2WABwjMhfFADcx0FjhOsYCEZ1juoPs3Zj/DnJvFqiskLY7FnSgLVmWNQA9otSRlIqrVCT6+yQE9s/TY+cLt137gFo+gI+gWDu4xr4KeomBT26K67SlkZ7+i2jAKBHt/Z0Rqn5CDgg3hTsh221RN8LANAoUsMBIzSm0jbUhrlSQN4bpgDzR+m5pwg0beikFeweO6h5YHQI48/4+gCACTdmyoLxbo1HANqL/MflHsA1FrEw5WjFv+eyml9hKU1R2ejtst5VykCxzXOE6nEyFCRvJEkjeT6ZBgC1ThwfndVRsQnuYzy+WApwODnX4NU17SbWVw3e3KucsooAwE2Bs09Ocfl0DTSVALby+hDF8hD5bCl6X0idIHrwotltZJpqVQoA6vz8DDiokD04xHf/7Vt45c3b+Id//Ht0m7WoQ4dhJ1ptEHhIEYTdukGzVgAgChkBOFsgozqDeY1VvsDF03OcP71AWc1xdPcBuqJEm8kOwKIXh5IZJCsp1TXbXKC4fIr5+hku3v811g//CGRr4HCO43/7E8zffAO7ZYmrgVJ5qSCe/pGpxSLNuc9EnUMNAGbNgN3zS2QXvQQAty2yrkC3yVAvbiOrT6h8H4phg+bqAlnXCWCuOLqDvp5hR22FKfLv6gLoZARgdlTh4Nt3MBzn2M0IAGyF/iYQkyZFKcCUwjvPaxzmM1TPL/Dxv/8/gPUWWT7HYnEIaqlC3Y+zohTKYsAWmw01QKGaRPQwmh8Z3p0CAM/QUIOUw0O88uMfYndriYusRUe1CYVrLLsxF7MK1WKBckFdgFW9RFFCRBro8cM4yQGpMgeyoA37CfTtHjrC3D4mj8alW5ozXl4EoLHPhRBLjEfZ5MZ6ZDWhpF0l10OSuKt7xVGjeJE6dFTX8zI/vp8wJfen1id9/7S959bAnhpN+P2/bgBQEhIL0hP2YTwJWK5daj+lvrP8Zv0T38azfycjzEcjAFk6sVfzLEUBxv5l/ug0xehaaa6/rFdDgjHTaxN/D7O/OU9rw2F6cBFhYB+kt9J422JvfHvHpnCKb8ke0o8w0YN2IM5yG1oZoQpRD1jK5zGRpeU/ewNLs7SfGv3gH1omAMAp+2nK+xHjTtCXY0vutVeT0k5dIPnDl23iUPEaAKCEppXBawKieASgHo+VA9r31pr3GuwVOazZIwJQlPQY2SnHx+URgFZ+pAFArvvjkaX7cy69UzYFSh3cc1dE6E1VgsUv/6DD/mMAs+UmX25G9NfJ//jvnNUTBOulUDocqCL/bBc25WIlTkZifV6kMvDcM9pLBkDEqrPoFtda8/hNJcTiOikRERCBCR7X9+MGnDZk+KK5CyoUgh5vlAanjEf/e0YcijL3MzC0oROZq6dyJ4UaD6keUeZmRZgBqBmJr6dzQjwSzRLOT82B1ZtIGg3qSwNwqUYgowrzmhGAaYNgjwggr0alDwCGDjinsWlwYmx8okanYDKlDJihxhVPCPj5T3SFpYin1XsZjdb07hf05EuAiJEXnUiMnmP8OE7VUwDgtK3EHZ6IACUHdOwlXvr1dXV83Km93lO0Qr7eXde52l17h1f3oY9EDURdGDs1mrBGDJfhUsuM/WiHI1VpUvOHlS/8kYw3uJXqgevWkI6NZNxJndIewhh/MQ95cqOTj58y4IXJM6lx1BXKiBSAqnQiqOZdfQk8//NTXD2hxhsV6vlt5LMjZIsT5LMVdh0Zutox6QWot1ou0G53QjdfnJ4CqxnK+yd48L1X8aP/7m388cPf459/+SvRpAIFRad1yCgNuO9BwBrVzBP3U+uKYo4hr5DPl6jKOWZ9hYvPKSLxCmW9wvz4FoaqFt1+s6rChtKHO4pIHNDvGnTbNYp2g7q9xGJ3hs3/z9579VqWZGdi3/bHXZ+mKrNcVpY3XdWWpoeiOEMIIxCEpNHLvM2TMBrqF8xP0MMIwkCPA1AYSRhBUGsgoEWAkmZIFinaHnZ3sdld3qbPa/Iev72wwuwdETv23uem6a5u1mlk1733bBOxYsUyXyzz2btY3voYWB0DIw9b3/wqJs9fQTz0sCxzVlOQn7Dw1aeEFQIAg9Jl9Fgez1CuMrhpCaxyrG5PgWkCZEDoDFCkBL6NkPmUbutg4DlIV0vkyRrUkGR4cBEJq1VYIp3eY+tP4CerFetniK6cQ3A+YhGASbGEP/DgedxJzeKMAYAjb4CxE2G4TPHpH7wFUBMSBBgMxnBdjzltSbrCYBRhuaSUbIqkpFKDBQKKPqQU4CQGshXCcsm6M2NrGxdeeRGrnQHvAoyU1XgsihAuAZdRiGA0ZCnAVPtPNkxxRW1gBgOarNYr3OtaSdVGMOyDTQGGeiPpg+iL8DAjFE17oM8Ek+/VHS+LnmoBSRsRBEZxeLn/a6lKoL6EVIX8q4REHQFY1z3jTmQFcijROL2ioVc62eWpHKs83GnOQdxX8Ye6Zn3y6r4G1XrTg0YAtj24pkH3eNvP/zjVmvyn04r2ug4A2rVW9RxjQ5jgvDzwNnaRosYVH0kBpK2z7AAAa2HRDRKr+o/NTDsA7+MFuT+4/du0xWQkVr0/+mre2Xe2sHNUom1kF5QiAtXO83zM8kFSx9YHKvQ9P3+p79f5Sb2Xj1zld36XzgFt87fLUZt/JGq8GYxt2tLV130AYEcWheSHPi7o+p7VTG5bq94MkDZuqBt0qHKAA4BkW20WAcjWRmMNZe+ptfuUAA/dXu738/SpU4q4Oidzb9pqCsox9a2CmbqscHel85v8qut12i9qDUH5bZelLp/JOmc0AEDT/zYP0Km0i9r4o+p6XDGNIeQ0MpgR+hZ+aQCArEhnLfhNRUK/E7gg/0mDRRWMJj+3qVST3PWSWJQPm2ftHFTv0CJMamSCC1uZi66/iQzjClHVaksIYdaJ0tYMR09h82+1GboYQwjthoOqKriSdYHr/5gAoMGYyiL2mTeyqHb/O/UT4AcCADULTVkbM9qvMSjhAKuANQMAa6XSoB5rg/5wPnyk3bUB+lKA9RMsuTr1gvVFJ9lmIg0NLiM4P6kRgKrIVPnLfhKp8ztdI+u8bARQKV2Aa0XXfzLP56XyQutMO0Maeh0w3X4xXmIosFroVNex/fJFBgAb8s2k4yby5f72S9/JNjcgm/E52oh6jCBdYW5qDNTz2SjC1jgQq2WoobEMOVtd15mK260j2h00zrh9Jfa67+9f107uYBPslqebAoDVEQEzULnUpGYXwTzH6fVjLI5mQOojjPbgRLtwh3sMAMwKivuTWQYFijzGOIp444uixGq5hDMIEZzfxfjyNl761atIyiV+8Od/hdB3kWGF0klZ9CDVEvRywqViZEnM6ur5BKRRg42IA4BhEWJxvEB8smKdbgfb1GE4BKII1Kl2MVuhTDIe8UZdOKjGYJHAK9YYpnPMP/4J8uPrwPwOMADGX/8Kdl68gvXQR+zXdhXvDs8N4goALBwsj2Yo1zUAuP7sEFjkQB5g4A+xXuaA6wPUMXeyhSKmTiAFHK/gxqtLzVFCoEh5pN7agUs5tU6B3M8xeGoPwbkIaRhjjQX8qITnc4chWVPNRGDsjzAsQgzXBT77s+8B85hC8jAII4S+h9V6iu2dCP/Zf/5buHv3Dr773f8LV6++iDQpcevmXZZGnMcEAC4RFHMk8QIYT3D+lRew3h2yJiCFk7MGbwwApHRiBgBSDcABS/+l2orE/wwApP+2GDbsz61MzCis6w9pG1Z7ttmmY1P5JN/dbv8qTojYipsd+Db3baXzW7a0dFYbtrkRoiFTgFULUrVKaptaP1zk1wsA0Cjs/kAA4BnUEx+nIk/F3lEZQOcHU1+cXX/0S9DuK77YAKChm5UDf7neBTviEZRntULt+qyiu/a97QDduF/dPJpfxr/YFKCX+4Pfo1nArfab6Z/KA0m5l/rXXrxH2GDqGKR9W6Xci3meHQBUeL5N0LQNlGScFdCQq2uTffWacfutPt6X7ka9ZZu8YAKApnxu1GQ0fDt1Kvx99Ts4t9Y0165VaKOtXw8A2Os/nJXmxgTMpmmmuDuL/VbTsinH5Jxpvc8CADYj+JpAmha1Jk6k1f0uvzdJVe0vyfvUX0K7aDMAsD3ATCX2pgBgm8LhNC21GoImNzZWT+gjulcFpmubowsA5NGXFgBQ4fnuEhb9+szZMSMABQBYRdGJOakAjwT/uAAQdds6IwDtEkgVsPXWZYVdWg5zeVOMSiyxATRMGmGKqABgbQWSUakaCUKNVANUO/A2w525kSMRP3rzzzsAeCbAz1zGDSIAZZNLqRzMRzQFrA5mtt1XqSjhf9bCT8LEbVqvdli7n92v3rnq6QMAbSc8tZRrhrBrFk9veqJtlNLQkAAgT82p0xdVQ0SLOLCALbVSrVN/KwCQ+QA9GlA04dGNny8SAKiM37RGLJ6jaXB+sQFACfy2rVHDxO1n+jNe0WXAEE9yoEOaw/p/G6+y8OeDAoCaw2iZW3WiKVSIqlKZpBFNnCUlbRH03TtEN5KtRlLr8nVHAJoG1hmXjl3e6X+zcT1cAJC9j1KAy4J13Q0WJaY3jrA4mgKpBzfYgRvuwB3tww23UZYBS70tHDpdLVg66zAIkMyp02/OG074HqKLB8h3HDz7racw3h3gB3/+Pdb3ovDXgJNyOZ7n8DIgjxMWvUeizQ2GADXXiEYIvRHCIsDyaInV8RJ+NOa1/4IArgAAV7MFA//cpIRflEio0YWTw3NyDMsY8Y2Pkdy9hvL4GhAWCL/yPPZeuYpkwjsBFy79k1YG5w0OAPIuwEQHZ52zCEMsMmTHKxTTDEESYEDpycsV9i9dwDf/wbdxZz7F99/+MfL5FNgbwRuGrDnJ1776Btb3jnD9nc8w/TyGn0coUSDzMwwv78A/CJENU6zLGYKogB/wVJw0pvp9BACOMShCDNbAzb95H+WU0rMLRETQMobnJ/j611/EP//n/wy3b0/xT//p7+C3fusfYTaN8cd/9Gco0hI5gaTZEl52gjieA5MJLrz8AosAZAAgMjisCUsAeET/OgJQBQApoZj1Ya72SJ0B0s/vdK0FAFRlksP6FWufrj1hHoQ2uvQqT7JZKv0R+fZZVTq/ZdLSAWxYyz0AoHycmmFRSQUlu4BZxlXEe509YwIcVaCANKW7Fqnz4KTtRkWeygh0zUNV7zMdpH6HqZ+nHuYVZLkp9iWbh9rgr/1dpk5tpVarcuJ01P3xJr0eFAC0h+3qEFJtINReorzvSwBQaun72CxfBADQMBBNALRaccYSzYg/O2DWjHxSX/MwAcAH3e1mzeRem0u8sG3bqkEf7FlKxDWPAHwAALBymOt9aLpMmr0sxyoWqU2P1jrz7ABgsw6toas1u8CUH7JBitQZui2uP4nfuzkAqD5LeS+zN+Q/WQKofpPqz/QBgJz2bfCnVLDdERTO9j8zUoCVttUNf1gJY5YphiyCiAzljvDoPvezGqpSX0R7d8XEsitubfDZjDH5Pq1eSQUbsvNiY99Wd4hgnlrR1c+vr5E3syUWDmCVd9yQCJ3mori6ch+V7c3fxyO0eihYEctk4G7nkj1fInTKpGxvszryNgBQkWCs4XtPwJ3+rnoj8vdxunRSUAglfrlutNipVtOkkmfGKmwu1DmftI1PCqdWG0upYdRloFUt3DccWB3tV9fgY26OIojlz2cCAI19zuVP1+xoguSe8UUUHK3kldjbvRgivIMDTIPUIFB1eliPsWEwmHtLnK6YO1I+WZMdsgh9CwdI0Xy/hcb7Iujs7KCvB3fKuj5dSm9DhnuAyx4+ACi1ySaDkqvcLmGq8Sn2taSnFQCUB2iWKPrmiJrvbRpJLdYT33yiZmf7Cm8UpdtBqi7Zyzd1O//w3dkVA2hoV5HOydCmokCUOQiWBabXDzE/PAUyStml2n+78Mbn4BAA6EQoCaShNF4G4iUYeC7WsznKNEMeZ3CHA+w8eQkLb43JpQBPPnsJn3z8KU5PDxFtUzppwleLjOOsYABgGXMAEOGAA1DhBKE7QlRQV+Il1kcLROEIMRX9IwAwpG61PosedAqHgZceRSCu53DdEp5XIHIyYHYX8d1ryI6vo8jn8J6/jHOvPIdsd4x14CL3qfOvEpQiOvCGFI1YOFgdzVCsUsIs4SwzePMUyeEKmJVwc581+ti5fB7/6L/6x7j88g7+p3/7h1hmCc5dOs/Sf0Ivwt/75VfxwjPAd373B3jrO9+DF0cMCMv8HKNL2/AOAmSjFGvMEYQpNTpm6cRpXCDPHIwYABghil0cvXsN+SnV+MsQukCezbG15eHv/8a38E/+yW/jvfev41//6/8FTzxxFf/u/3kLReaxKMI8SeHmdN8RkvUMGG/hwisvCQCQYIUErudzANAN4VIU52gINwp5HUFhF1GDEh4xyuEKvhM60qo0XjcBQM6PUqPTs2STHqkv7Qca0k4xZK+S8mazpdmb2Bf1fWYKcPf+qycjNaEtYqWScrYDFA0AlM06jLdqss/8jr+Z/T+7Ttae4r9X9f8MR1SIr24h3YJp9OmzyqowdHn1slqAC2es1u78px6bZhPV8pCu4QCgMmA1e6nlHU0d0j6YLn5uAIAyBK4aT8lrtCmotxrtqb6V86Xl4NccgMHAdg1Z233MHms3wOsmIlXknzQ/BZWMlHcbparHG+nr/XtT7A2L3S3fI5sxSNLaAKF+VrLZMf2jY/JS77JgSseGd1NDwsKaF4dVYnUtW0cfhxnxatrG6ngkH0t/ZnMAsI5OrulcT036fey/PUXq2iMANSHSv0SWK+gJ5no3/RO7RLKNq6YX5zuWraXgMlxI87+rjWc6to9oQmt6Q/X+a4RqKRlflVRtZUUu4NWns6a31fW2CECmlaWWF36lXV7X6yzGW8kadfyKoa6lu2vSqwr8YvxpzqdS7uoXJvAh5bg4qBYHOzr+QinOakAR2TbiwEfIfS0FuNKPyvxVYbWBLnMm//V/26ntVMOlVvJ1NJFqsKgMZ5KvbYfweD4plHn0Xw0W8Lv4QqpmWa2aPAPMqyYjFA5L961OdDn4J7aHeHa1bcTLdHLw3+prDHFm8ILRoGIDsdCMAFPfJ0wrRUk2I/ZUK0kdHf1c/66uYzWsqs6e3FAMkbKO2v5XZSOpZOO1K6ti0HIN9bXhVK1PvOXpTl/dO3Veeg2fikMsg7WKa8N5talRNeLTJEznxpF80wBg9MHZ11/aVE1wUQISbQ5JBfIJtijo/SZ40SKQbYATZweh7EX6b5s8Vy6t9jAHQVXwr14/Ziw6FOIslJx4sORVxl1VFyQbW/YXyWicEBm3qBEXeter+n31Otdjr8fYqt1qJbWBHGiXj91cZ8oj01xQ197+Dl1OPMBQrbd2NZlo2z+aGu0ssWDromjI8+4YNm7gdixhI0TfmGV/BDCnr92QNMdqklDZKy3EajdQ+bNcS0/1s6xxXxe79oOvGvRvX2dFPwnwgKFDVIuvKBFSnbvjFbLjBaa3T1CkLuBN4A334W6dhzPaQw6KXqNZUhffDGUWI3RKLKf34MNFtqJUUgejyxeAsMRydgvu2MPBM09ilpxiOMqRYY3M5XXwqIsHS0+NU+YblNEApRfBD7cRumP4eYD4eIn1nVM4mQvXG8L1Q2Zp50WOkqIIHQe+47G01CKnqLkYDlKEfo7Iy7DlJjh85/uY3/0MePIAF998BeXFfSw8B5nvsiYXKk96rAkIr4m4vrdANo9RxgWCpIQzjVGcrJHeXsAvB0Awhre/jd2XLuOXfuvXUOyUGB5s4fjeHH/67/4Ui49u46WXXsR/8Y9/DX/yf/8Qf/adv4YzD1BkKTBwUO75mDyxhXySY40ZgiBhEYCFAADTdYHAGWLkjTEuhjj+4BaK0zWKxRqRSynTJVw3xdbIw7PPXsbp7ARvv/0jjAY7cEofaZyxbsIoeQRgfHoTju+ijMY4uHoF+fktzJ0EcGM4HtlrFAEYwAkDVv+P/TcMK7vBIxYS5WGk7OveEyo3Cg+pEYOsSFENhLLISuVlihXVuS06ZX2/StNuV+WTqje5zWXYraIGlPoAswRCmyjU97C8Skb6CStZHrgZgGFV67uRJdRfQ1k7YFDTAaW8UMA6bn+QLJAWp1lEvsaqqhXW0kFrW6ey+VkGQ7uCOEuKntWC6QBg2Gi08ZkWarft0XiflbfaIscENzcOeOsyS1228cOxNYyxacRm3gM7K9roU0Wr1rzKuKTjAEtyUfV8hX7S1u21/lSb1jpQYVtvNAnbRYpMqvohbGrTde8/m3WiyzgCgHXJYNp7RV8XiBYCGlJaR4kEGZjoV97f3It6JGDDv5FAWAftm/ZP7fNW0uIBCjHzcmT1xySHImkFbtFdVKW297nv6MrDsWrbiu6/SvM6lW4NgFYtqcDoXW84fgAuERwFJbGIFKtOtoDvFc+xiTf3t8puXN+1BTgo1St55xNB5D6v3caQ9ZrX8xf7topwUmUzBy71J9H1KvgnxqH6xiaaxM+khQUv9rQEBMVBJT+AUTlI5c/24CR5Ry8AyJVQc3ErAEJhfjZEpUaYfEk3yfnE5DsYwGGsARe2hrCqij9LhS9VuuLQCYuI3VlFhwnAUbyjZn59Y7OnadhaW8dHOTu5sc4myVlKc6dzV5+osiGZIXWtCkxXAm1GsVpjjg2jAQDW5lQzF6ammRppQu/iEWdNmjbWtuIfuWnqAqVSwFb38AFWBOYz1C2ANl5rA8z47qkZTip2yU2ti6OIk36Ho+YR05i0AiSaoWHQ0ADITXHFrhZ/lFG69F9Jy26DRYLt/HpGGbadaqrKLsBtXK6CebWAVuavCDDaMa6R0iLlQAVk9kUYdilv5hnqPUF81AAAIABJREFUXcrUEyfbfjJrIEm66SpalyF9KuVsEqHr6qZB01Qy+mi+yADgJnTRpXvzDjtApe6ZbmO4D0Drr8nV54GICFhlX+qz6L+f8akteqf1mfUbHi0AqBo9lrXZIJZGPoHLKNKxEgAsEKWAd2+N9GiOk+t3GQBIXYC98T7c7QtwRvtIBADolRwAdHKqt5dgOT1hIKKT+yhcD9HeDly/wOr250AR4+BrryINMrj+AghzZD710ShQFhnydQJHAIDFIELpDeAHOwg8CQAukNy+Bzfz2JioQYhPXXSdEgWBgFQYv0q1cVlXYpeaWlAdwLGHp/ZHeOet38OKAMAL2wwAdC5fxMx3kVJdQlJxIsKN1t0rwQHAwkE2WyOerlCuCSAFinsLDpLemiMoBnCH+1iHAYrdAM//R2/gV3/7V1EMXPzwh+/g7d//E+BegWA8xD/8L38T63sr/NG/+RNgSpF7KZyRi3LPw/iJbQYAJs4Cnh/DDx0UhYs4KZAvM7juECN3ghGGOProDop7a7ZWkeOx9VuvZsiTBTyX1x4kmyVPHXhOwCIuipxqCSZwKCV6eQxQq5PRNkZPPQHsT7DCGp6fwvUo/slB6bkoA59FAXpRBI8iLj2POR+1/cSNXWHyKcxoupL17zxDobqr0pGqQa1LU1OWmPy/qZPRLvn6AKWG/jadT8Vm5dfqdnOz6ceD1kTmDoi0OyoKVGCd6NJsyDApzzoPUAx7j81GeRenoi4/WdF0uYClLBqv2HfaglpSwCsuEBe6alfu5rr1rVefjuurAdiePdCt1/rsM9Oeabve2sW0sustPlPfhA17u/dyLT7IomNEF/ju50i7iY9XHkpzxhWdTvsHokUrMZ0sA8067u22vyT97teClDxQ8zczl3tATTncSj602NiVDW6bnwRUzRIChv/Y1QW3lWwq0N9BWya51a7DjWs3SQXusQ812qjrxddMq4m6CQ+Z13SslToyvqw84rap4+qHqpzEALoqOl7YkGJRZRm1RgCuEYFmgjF6imqdkSlHYOqBbpLYaS/nxzSXYR43msi0nV8oek/y+YNFdgvZwTdYHRRDNk/1UfejHt3I75HR0nVUd+1/WDxzJjxkSKR8towI5BKorsDKuFH7t4mG+LkDAJlDJpwFZkRoSKuEKlRiKpVWRGHtSkZqAtyizP4uAICdpxe1gdsQFIz/lI2ghvIqAKD5+HaH++EAgK2GjPiiDwA7qwxXean9XimWm2/vAwBVA56eIpsmtAGaqtJmQKyiTLvddT56c53VCECb0dNGz1qIq/uKBlOfqP+8AoD8QIHT635Nt7PyWfU2NRq4AQo1ZdgvOgDITqAbTKjKpR4Dr0cg9AGA/Fyp5oKmwcsd4HY+0U/wmtcJB/rvCADITJqcatzlLAIwWmaI75zi6PPbDPTyBvvwqP7fjgAAS4oApFi/HB510c0SuHmM5b27QJbBCUbwowEwiNg18cltYHGKnddfxv6T+7h971NE2z7yyMWaQClKWk5SOOuMRTfoAOAEQRFidTRHcusYLFSv8OCPt1i0GvFCTs9gAF7BuginK5oPNanI4XsFnnjiHB7f9vC97/4bxHc/AXYinHvzVfhPXcYiCpCGATKqAyh4ig5c3ALwyxIBYaOLBPHpCmVMAKCD5M4JAwCLm3OExZABgEkYIY1c7D5zES9/+00s8hjz6RKHN4+QTXMsZzPsPLYNJCmS6wuU8wQZjXvootgPWBpwue2wFGA/SOAFDvKSA4BsvogwcAn+G+DOR7eA21P4ZQisc/iuhzxewy14XUWC8CgKhBqoZJRWnVOjlgxlkaJkab4Z8tDF6KkncfDMU5jFSyyTOYqUUqdTuEGJtMyQE8AahqwJCAGAXhAyXSjhHmESNk7D1Rq2uvMv9J1ioFhLdnRFgFmdN93pPKsD3CWOzAgWaQ+oukR3ALnkUQ/wvgQADWqZNSAraS0o+YgBwD47oGB9wG2fTdy75n1NwLJHP9oiuL4EALmt/AUAAGXxA7nSVYqgQOU75Yng9bYyPl8CgGaGyRcEANzY99CbpvJDFxlwJCMEdRlhpqCaxqsOAIoeCIp12wAAG8CBjs1YJFQFcNoAQPN6HQDTZbuOBlnwnT7hq33/MABAFQTk+qU7AIEAUKblRTQa/VeNSKcDLjUC8lEBgMpAVYeSftZS6JSc8zajRKd5rXzkc/siAPsBQJPB9BTjKmm0xhG1VAnNAWsAgKavqYMbmygEk+c2iwCs72o4pJ0RgFJN6fXf1DF0peixu8XzTUUitgOvQ2UoQjUC8KEAgNWAdWOF/9YXQbPJLm9zz/vhws0AwPYxtNHfFpkq95u6ByvHRyy1OpOqWY+YRiME3mLAmDO2BBhok2mLTOLCzRS6QoBVp1AkzvQUG1O+NByo/iWpxmerwdcEOPUIiO6uyzLyr1H5YhMmewjXPIoIwAeNAOmeVp986SNKZwQgAdzKCa0Cw1UGOo/4tDONBKm7xvCwAMD2d9Tyyw7W1gCg7Rl9EYzdTarEEztQ/O4Ilf4jhT6AXD5BRgDqAGCBYZxjffsEh5/eQrnM4Q/PwR/vw5MRgOUAhUPtcwlwy+EX1IF3ieXxTYDSWsMhRju7cMMIy/kpintHwHoO59JjeOFrL+HTw/cxPBiiHPpY5TGLDmEAYJUCrEYAThjQtTyaI7t9DArV80dbiIYj5GWJNEuQ5zH8yEM08hFSJF4KTI+n8AoX+zs7ePyxfXirQ/zw9/835PNboK4j5776GqJnnsI8CpGEIRJKfRWpLSSPeARggYB6oyxSJLNYRAA6WN48Ak6WKG7NEOQR4G/BH06QkF4eRyyy0dkaYzKeIF7nCPwxoojmlOHk7h2MMg/ZcomsiIEhRQCGGF/agbPlIXZWcP0ELgMAHaR5Cc8JEXlD1nBkgAEDQ48/u4NxFiA+WSJwfCSrNcpkzYIYXddDmmagUhc+gWmiwQtFAWZlBm8cwd0Z4+o3vopnXnoB7/74x5jNjjGb3UWaz+FTdKaTIqNcX4r8G1BHYKrJGLBn86ZwMg3YtC65wS2lNd/vdUQ4+1XLqJDZFsI4J8kha9haN7ANPFE5nmps9e0AY8w9KcCm/rJ1UZdP5HurBwAk/Xu2IRqU+CJFANZlZKTTZCvZpNlWDRtFdaLI33q0EYB9+q8LANxs2Qzt1+CvDgDQkjLOFWsTCOmbR/29+b6uWajX2q5THeSuEbRFAHLHts0+qA3JWkE2vMueRXikEYAioEWlLY+YqunWFaEq5UO3ADBtXTlhzkhmDUFrV9MzulfKGzrZisb/oBGAfetvbzInvF9GQBlLt/kO0K48cwQg1199dl+tA2Sjixqw5twhagEa8qCvC7Wpz9QMk2rdtKg8c/HNHWTSTfAbe0bP/hb2f5O9+F9qAHBTjuqRIaxmpq4fnI0iANX3q7KoT/VygK/mMbGvFZ7p4s8OyV5N1NkymoDogpr/Jh0lDnZI44h/p9fQ0plMLkF/JnIzzbhiYGHgscWUxpS0+BjgqKF0WjpnZQRUc1CiAcUL6u3L4YIaYDQqXDBpYyaMmgBHM4Kqi6Uq96lFQNpOYOwOaRcqIrZ7S6isbOLSAH7EmGx10Wp+4PM379UAQIkviOdtHgEoxVT7JuFXdAOAfQ583xa0hBfp8lvq2/uU/33jY6dzap0DtxaQcnNK+mv7VEmXaS5QzccNAE/lxdbwarH3hXCwcR8fi+5s8beSwyHS5dlvOgAlTzTa+ETOcRNy12JXH6H6WwOgUubf4Osq5F8cyGxwAtw3zj6ATK+x0g8AaoCtZf3056kKpW+kUmAawqrHEhFNoDd8ePMyEwA0X9dICaii7eTZeJdsbL6vbz82zBVGwnYB3u//2wHAOsK3G6Dt8T9qgMSyAn1mkTSwWxevWoyz0Vh9nnS+ch7OD6cs4BY5QBGAWYHBKkFyeIrDT24gn6XwB/sIRgesBqA/PocEQ2Slz1JmXUoDzhPky3uIj24w8Geyv89qyBGAtV7MUS6mAIGEQYAXv/01fHT8IcaPTZCGDnKf6vhRjboMTpJx4yukGoAUdbaDwJ/AK0MUywyLzwhgdOCEQwxHY/ghNSMpMZiE+Oo3XsM7H/wNFstTvP7qy7j2yTXM7q4wibYwCAKs7nyGWz/4QyxvfwRkCwxfvoqDN17HYhAhjiIkLnU1Fk0U4MErS/hlAZ/IMlsz0G3gjTBxR1jcPsHq+l3gzgk8d4gAA7hugCRLkK3WQBABQQiEBA5G8Cb7iIYDFGWM0HcRr5coihQFUuRehujxHYzObyOj1N2I0qKXKNwcORMsLmhp8rjE9nAbr7/wKvaiLRx9dhvXf/wp7n52G+v5mjVScSilmGWvUGo0rXIB16FqjVQTkaIDOW3T0QQXnn0WV156Hrdv3cT1D95HkcWYnBtjkd6DG8bI3RSp5wK+D3c0ZACgTxGA9DfpyBhMyvUapShVFixXlw2dpNxY1ZUTdq/RpdwiLQx707yiaR/22YOdO6lhf/a57nzurcdVVYps+6j6U1y/WACgtC9ErIuooaTOT5eYWvRTBWwpjTceEAA8KwCsr4SsUWlfH9Xes13BqnNRGYS2GobV4ZiF64Rst9ZA6wAA+/Wn6paqDrV9Bu32tzRuNtA9jfEa6Uqt7C+jpep3mBFQffvjYQOAuv1jgilCaVQAoIU2dACjibwuGWUDt5TrK7+kwwphKYwtBO7xL/psm4qTOp5vePFa0w+uGnSYxGbz16MXTVOUQwMzArO+VvPK2gXsmQDAKoa9zkDqYn9FX9R+nkwLFiNnhY77zPPa71ADMuSr1SFsgvXoNNJrVlTcJQDAhkY1DOp27pUr02flds9d2flMl1b+k9z42oaUvCT9qhqErIksRiwe3Ecv7g/z59W8JrMlpX6Xc1DmyiLb+/GoHgCQj1IFfMyaFKbAl/4Qv7MJuHXI2jqDWeEobjwKQpoAoIhQqy+XAlC+pbpTzEEfj/Etv6lu66tkejdYVpmGzoJ9CoFTRf+o9zQcXPPavra6+m6sToPMyKqKQgIxUIEguYacgXQBWbEal551Lrz4gv1FrQEo/FfrftHmpqcAq1Brl3x/MACwTzjYRJy+IGcBpGy832cwyfhVSVezSU61DIKx5IpU621TEFIxKDXQ2xRf30mT9n5zgpVDJelMVxMAyGEd/pv+ZmlgtRlOZ6E3f2v3CV0VQWJbHAvWZRrdm+z3VpnHSn11aXCzS9gjAACVlOyucfLvmjVVuuvNUEOA/qeaV6jcwuS/sg4mP5pFqDX+aImm6aJ4335ssLgqLBsTkTWoumjQDQDWRe2bz6hkQsfju2oA9juQvAlPO7365WOfcUn6hekLBQCken5OniNIMgSLJcrTBQMAk5M13GAX/nAP3uQ8vPEBcm8LpTtgiXKsEUgWI1ucID28Djg5RtvbKBwXReGgzDLkqwWrQUeRPS/96tdxbXUD7p6PYuQj98Ci0gigQpqxki2uAADdcAe+P4FbhnCSEvMbh0BMzSxcBgB6QQQCMaOJh+dfuYJPrr2LF158Gq+/+gyWpwX+53/1HQycMS5deAzx3c9x9+23sL5LAOASg+efwfmvfQWL0QhxGCHxvKoTMJ0wE0jBIwAdpNMV4nsrDL0RRs4A57cOcO29DzG/fh2YrRHmEbzMQZqlyJIMcKhrbgQ3GqL0I/jDHbiBx7r1BgMC1EI4kQsvKDDcG+H8M48jcXPcPT7CbD1FMKRM5xwFizZxMYiGWM6WKFY59ke7eOmp53Dzg2u49f41VlMQGVgjFYdoXJDx6rGIBcdJ4bFOzTlrOMKsunCEcnIOz7z8Kgu0ev9v/waYnbKih1tPX0AWJCjcGQovR0qChBqAMAAwZCnAsk6iPISs+FRxfLQSfw19pGycqlSGKjTo544mQR3OW/1ki8zs2K+9ETs9EYLqo6X13gUAmhmeDdtUmnmtY36EACB7t3FA2FkDUNoX0rrghqhhYehWp1njiy3AFwMA5DUq25mlG1wSBqGliVq9T6SXZpHwFQCovl86r5WV2Shu0ao/6RWVcpbv6+5Cy99s9z94+Fm37VSN3AoACqOi8Qz9mWZGiIzIqUbWA548WgBQwgoKv1d04X9rUMgAABsAmb47LN6q4u92yVP5nA0AwF78qWULVJzR5SCaXnwjpb3mLyl7a+4UVq+iWHiEnOrzt/BnfYLbbQCfGQAUbxdj6uIv1TSVB2ISAZG1AUlH9++ier6s6YT4NE3fJi06/X7L3OV8WgNAbABgywSqOfYZoT36mD1eHBxuDgCqWQntOIPsTdE2BFZPmj1KT/2VepFs3nr6ynt+7gBAJWJJXfxfNADQXCzZjpvZOgYj2+Raswtw04jVjECxydoAQDJw5Wtps8q24YLnWxUwH+ujBAA1E1oVOboAaokArEAEFWCpxlw/u63+hXKFsTct5mS/BG0VMf2AA6exXL+qBqBCkYaJ1nc4qraHVxyKhuJTJP39KummsnzEAKCyieSPXSqurQuzjftsgMmXAGCbgc7lw4MAgPQECZBqdFbqWuo1MFrsVWOvdG3X/v2ob2WzBqD27QYRNmoRe7uMbk/Rq/nbLl5onn0As2rKmk9hPltnke1Kc7TLN6kmWq5oAwC9vICfpvDnC3iLFQ4/voHlnRkcfwduuAtncoBgch65N4ETjFmUX0kNRJIV8sUJ8sNrhEQhHA6QExBVuPCIGfMEaZowZXv1l9/ELJhj7sVwtwdIvQKFkyPPKY2YIgABPxyyCEACAD1/DM+J4KYO1ndPkS9i1jBkMBzDDQYo3BKps8alp8/h0tN7ePrKJZzbHeC7/8cf4rPvf4YLl55D6LrIj6/j6EdvITn8GCjWCK5cxvmvvoF0dwfraICY6uixQGkCn1zWTVgCgPkiwepkgRHV4PMHeObJpzE9OsLTl87j3b/8AW58/wO4iwJpSvX6qAugA3gE8k0Af4jReB9ZkWIdHyHYifDGb/wannnleYzHPou0I/BvupzjP3zvr3F07xDB2K0iAEmOFnnJ0nxHFBWZuIiSAKfXT7C4fQpQV2ICLIsCZZawdF8WMUDGqBMzQNalVissOtBl9BxtX0bpBMiyFVbzEyBbg0IdR89dhjN2kJVTlF7BoiIJAGQRgNQMJAg0AJDZK0pqk7RfTPnOZXitzXiEvaKljChA0TuujXst+Q+GfBA2UqePysYkPbr2iAzV4d3E5ODXtEcAsm+U15kOsG3STX33YACg2cSjIYPuGwAUHNEAAHVriZuEYnXYL4aD/1OOANQOsBhw3ipateaMur2qeBkK4MH/qoBC+svEt8r7mP6ii1TLUE+nNcOHrPpTi/RS7YUaAGy3o9rsi4cEAGrs0NRnusug04ON7GcIANbLZ4v8q+mjshADsCrnSCrndunULInziw8Amjuudikkv36BAEA1vluqEMXerZqAiIh4FQBkl50FACSWakSQqkCXvlfNvdEA9UwAsAoc0mV0uwQkad3WBVhmo96/5ypNBUbWMwGA0hqh22zgnyKfSba2CnnObz8DAFBfSNXxNet6tUUA8kWrTRB1Edt0mowcUyFp+fwmIZUUL42z1KcbJpBWM4G5N830CGZ080Wrtrmi/5pj15/Bb9Wv0n8zGcL+rUo/jXZdFoElpFpG8GnOpTpEGQEolJkEAGvFZ1fAtSHN56Mi/fQXnsJUpzCoJkRDwFaGiVrDpWXbK0JDRseZa6Jued7lr12g9Cnw6k6aj2Vt+45P+sRPn4MutXUbANimrExDsrpOif6TBWErs0cZrLqlZNc0dS6aDdEhoaV4lsYni/kTD2fsYfBzFQFobKOGGDWUXT2Erv0kr6qv6QTUpRRQ5IE5VRXA71JUbd/1rX9fCrBOJuEwtNJGy4DgQzprBKC62dn9bQY6l6Cu0WWzfSfadyk58FIWaTJEyDp2ItklXJTHVnzesVCNmmA9i9oXkN1XopTvj9oBrficWx29EaycyvYPu1s54GnICvGHrvt7U9g6ojB66S1S0Li+qFOAKQLQL0oGADqLGYJljONPb2F+4wSOM4Lrb7MOwBQFmPlbQEgg4JAHhCVLDQCkDrx5ToAUr+c1GoRYrldMmD/9zTeQbwFH+RTuToTUyxnYlFP0WkqNKhwEwQilNwSiLXgBAYAhkADpvRXcpMD66BT+YIwgpFqEJXInhhcVeOHVZ/DEk4/h+ief4YOffIIyHmBvss8aZGQnN3D0zp8Bx58Czhq4fB4X33wd2N/nAKCIAMxpQo7HAECiSZA7KJcp4pMVxt4IAzdiAN8rL76Ab//KK/jj776FP/3ffx/lNEaSZPBcH05OdexCYLDFAMCtyR7W6yVW8RHC3SGK3S088eKzWCYzxPkaiHymt09v3wICYHR+i0UAUgowWTqUeksAYJC7OPmc6g9mcGIP3rqEQ0GTOTmYBUvjLSlfmHEnRSKmoAucgjo1E20BzxmgzIfIcxe+76AoMxT5kl0bPncZwW6EDAsUtCaei4IiAMdDuNTQJeBp3zTWKjmGdTzktY3k7jFrzOr7RdhuDQBQ0SZtxqp4gbB+WnZgffTUbgcIzSj2KTlYasSeTbSxfb1RJKDN+VCHeh8AYEPg6CVK1AiOemWkM1aL6nr8qjNt06460KMfksh7VWuElxipPp0AIJ+MHiGpy+POELzK7m1nkr6aWg19qDyKR85yNWCzU+3RP0bEpA0A1GS2mg6rei58IGYXzsor0qLq1P0iJqDNQ35vagSeUsfLO7Ul+5q0Vfmha3MalLVFAZrDquii2IcGv6sBSHIftqcp66WtmkKii/cbnFEdVMhv9INtGSEkGKY1hEpPAdbsD2OAtvJPWirjRhGA3QaKWSRIl04tYlX5s7QNrVcaXxILNJtcbMpDnBHsEYAW/tYcpA4Lq8NBVC1rxikiLVb35ZUMJ8Pu5/xZ60Q9+k+8uCtCUypRxUbV7MEq0l7qXFFPU+E9U3812bKmfz1HC+9bFpjvHtEV2fJ9vT/7+ch2hWQfIQk5/WUXZh1FVzAfnZ9quW3zmOsqhW38W79PWWfhc8lx6RQUAmvTCMDt3/kXnRiFDgSIYSq5/1YAUBWaNsDKIuy1xde4RhhIXB2JAdRml83Aq6+UJOInrGYONX+YaSHINvFCNHbIh9rQrElYA4Bi3Cp1LUqTO5zNJVRUqsYbXUWf7WzenAAbkmr0SldTjQyriKiKIfMNtQJTl4x4JjcAwLYtqNsiXICYacfq1iF6aTOyFdlSLugMQe44wZM0qpVtuxBpY5F+87s/QqchCgWgaTP+1DFXbFfxXH1SUxvfkta6Ya4znCg6a/KMsuCd89euc+BVNQDlvraLH/Wvtkinvugnbd2qMcgf6hG37aea5ziPy/fpvNd8nkq76ttOCXsG5aSupfU2m0Gpjtgy3oZG3oCbpWZkY+g7iW/3VGm0rOlTDwkqCaQIgjbTuUNcy9FuTHD+uu6Cy30Abrtjo2REKSMyadFeY6aW4V0T0pbKvNByYGR7Vof5ymnat4AtA6xlPekLESlWUDdfDgC6aQJnPYe/SrC8eYKT96/BQwQHA2TBDjDcA8YHCPcegzvYRhbT9TNERYzF0U2UyylCF0gI8HM8DIYThGGE6fEJMIxw8bUXMX58D9dmt+AfhEjcBI5H0YIZ60SMwmV1/wgALAdjuOEQLgIUMY0NiJwBlvcSpOsULqXoei7SNEZepijLBIPRCOv5CpPRBFEwRJGmCL0Stz95B5hRjcIZkN9D9Ngenv/qmzgtciyoaQY1uxhFWMQxSpdSgAkA5F2AnWWB1dECgzzEsAixOJzBL4FXX3kBdz7+BJ9+721k0wWLuvP8ASXtAu6A1Sp0/AjjrW2s1guspkdgxAkDDC7soxj6CLZGKEMfy8U9hH4OJ8gR7A2RsMhI6kzMunogdEJsuQPcfe9zYB0Ax0sgprKKA5b+S6hBWWag/0XbYwy3hiidHKe3bsBZLBABlAjMTgmHzgjTe0s40RB+FDCQMPMLhBd2MDy/hbhcIvfp/UAR+sBkCGcoIgB9XgNQgjhuyWv+Sf3GD5i6mzjIzr+VuaNkovQLig1QONOQEA+Vdp+0ZLmMk/WZpJNO3aP5FbImpJC4zEZSrNtWbdB+PMCfVNU0l+Pqn7RuHkjCCcEr7Xg2XsVilzK8sj02IB1/kd3+lLJZq49cjYzfwx3+GhBuTK0hHJuCrE+2mfa7+Y5+AFDMxKK4OOsoKXfG8DYBAPXxS55R/I0qpdGM5JG01wEceeguBb81/qYR8adSRZ+oTCmUS9G0mdRJV1ykBJd0M2y9RyQ3qhGMXHLoH/33Lv1Zd1Rttzrsa6S+sUd5qvW/LVPl+K6gS3UYq+4Z/fnEj3K0zP7qK9GiZMMbjpcCnndYCC3yr+YfVfI2J9hnzzFAqoOEXasrb1PMykriyFGZXVYrAFBsrMb+YvrGfGufgWT/nj1FAPhcrvKCVzxtlH/UQxb2u/Eo6p3FrpJAIIvgqw892pse1pHxbQRmXMaeKyQ121ptRWcknqLb+4VxQl6tSTVFYz82AkZUBm3dIK1CotM+bqykhBtNqVdRoFsYWb5t0l/R6gYbMUorhxT0ta5fFI5W9EbXoJxNAEAbe8pIwFYAsOutHQCgLg6EItecDN2saEvhU8cs86wrZ0qLWlGeV3ED7wa3Sbcd8yS2DwBUDU7mHBoAoF0EKpzQiGg7M89xwdECANKbKOKAqRVVuVhfU9NOVSqbAoDy8ZoAJsNW6cyl857TWdS+MUT9cNM6gzYFY47Nqsc2MGL7RH9nDTpjxFxhu41amY13VAaYbuzQjbS29Zx1sJULdPWlYn2FEcKVkAFcdNCA7TeFMejdLKJL2X+qAqmUmgWYMA0pFQBsO+y0s6yy4mzCdguIP1OVNWJP1JpXqj2Lwq/f3KTp/e3XekN2cVRzvE0Hqg+wU41HdbLKezUgsv15XbZfRYW2iGZ1Y1Ynjfw8xGivAAAgAElEQVQu2yyZvFJW5AGoXN1anU53eIFdKcOShTaVMTbZv0mFlocxV9sz+p2XOrLn/sZAjTs4dWwAoEOpuvEcHjUCuTPF8Qefw1lRt98BinAH5fAA2L6AYO9xuIMdpHGMYREzAHB+dBvFcop8OUWZpaxGXzTgEXyzxQLYnuDKay9j5iaY+2v4Bz6yIGUNMUqKUMtzljYcBtssBbgYjliarwQAA4QY+GPMTmJk6xw0VkrTzZOUWeEZNROhzsSlC9/zWY07qn9XZiuU6QyP7Q9x9epFjLYLXHziHKtrN0szpIMQ//4v/hzzPIU3HIIyeenDQVEH/trB7MYJvKWDYO1gee0QWCasdsfuaITVzdtIF3MUyOD6IXyqkehQ19+QdUIeTbawXq+wnp4AgQ8n8OGOh8gnAwS72xhsb2E2OwLmtxEcDDC4MNEAQAIBOQA4xOG7nwErD1iWwDKDDx9uLiLY3AK5W+Cpl65i+/we4jzB4ugIh++9j3w+R5ysWAMoJ6f6gyN4W7tI8xxukSJzMkTntjE8t4VFsUDhUy4zAYAeMBkBA5pLAMdnJjD7x/UaVRwUQJoQFAQAtm1fVcab+qRPb9f83lHjT7Mz1R3iMLtPO5A2AUDWEKe2xSi6lO9HfpecbzfA1y4rubykJhFd8Uv9u1pzoNTSDEIt6LZdrY36gLVa27ZJT2mHtMUQcdtGBTzss+le6e5x8nXs+nRHUNcOW9uBZikjOSwHLU353NTd3D9Raagr1kYX14ocNm3KgYRad1tor9hu/EqbPaHsHuV5qi/F6W5qesb5PQET+mrU7rR8Vm3T8jd0j0/jb2OhuW3XM78ND9naeNOsuW9eV2UlNcA/CbQYB5hmDcAO9mXStVU+cDpqgHBjEj225gYRhO27n79MbUpho2HX6rRZy+pzzAwctl8U+3czALBNQrRZsrX0U+fHAUBeM1leIVdB/kXNUuNVe5mUrw6XaEHVNat9fHWMco/0HR/VEYZ8McieqzO8ajnBdxrHU+pINuJtfgCgy2B1fqZ2amToWO7XqN2o+WjIhw18eJ0f+PrrI+6WAV36weSf/mAwfUc0uwALufmFBgClbFdEuXQWbYSVRNKFOVcubQpYfc7PBgCsN6kcNx+TMcOqyIy4ypB4DYS4BwDUnO4ucKYDANRBi81EqFwjZpTICMC+IsZ8CY2SFDKMuJJx9f4hAWNGAHbtrjNu7oYIFGshgS+rgtncU7CO9BceAFSMzxoAFAtvnCBVSuxRAoDaKsj6C00zo3a26l1b7QQNWO43IDdzdroYWe6FboPB7u6Z4/spAoDK/mmbXX/NoBpkkqvUZbj1GYwbULm65EsAsA9e+CkAgMkS3jpBfjjH4UfXUR7N4DpDBgBifB7YeRz+3iV4wx0k6zW23FwAgLcYABif3KG8VHjhEIPBGCgCLOIU/tYWnnj5Ku5mp3B2fZQ7QOanLF21oBqADAD0EIY1AOgQAFj6KOMCbuYhcIdIM59luJbrGMVyjSKOWQ08MmxzSud0fJZ9QACg53IAMF3ew8tXn8ATT+wiGqfYO0+gXIxwMmEg3O+99QdYOiUSz0XOgCIeAUgAYBC7mF4/BmY5vEWJ7GiF8mgKrFbMOR86DtLVAmmRwPMCBOEEpRMic3y4wRBbu/uIVzEW907gBgH80RAYD+HsbyENfVx4/BKSbIHpvWsovBUG5yJkHk8BZo1AHAeBG2DbGeLo3c8xCfZYJOLJzSPkqxQepfa6lHZcIvdLpAHw7Gsv4uDSBZzevYM7776P2a1bKOK1iD7zcf75l7D79DOYTqc4/PhDFHmMcHeC4cEEi2IOCnFkB7ImAEjhDSwFmDsiXL9IAJBHhnQBgNz2qKVJdShq2iQdQkM70DWvUw4yK93GfuC1HXlWCgc0pBzkNZZkOjx3qNiMmNNB3xEAzv9Rx+w6nsIu+bo0xiMHAGs1z6ck4aANDmY5vXrAFXZJexJh3QW3bQH7jbefJgBYwYHaUopujjYAsIoGatd6daSouhg1N7YDgOr1bZrX4C7DbpMAYNchlnRgpc8h3/QlAMh9xYcNADZquH0JAHaahCbAYgKAej4aca8OUHfbm5sAgPwJ3K+vm5jWBwZGAQMFAGCZAyzgQgFqRYmJbuC2eqPCf3xnmvJQAxPhwC1kAI8ct9jRAjRlI5HYgwAA23m8Kf/PDgDqKe/metRRvJt5Brzk0E8HAKxXQcKCgh5SUVBWhNnESnLLgwOATUBKA7CE4lUduEp4b0ZLhbPbomYF0wmUiJitPrXlCqoTAKwUkpn+S/fKrasYgBWH338EoL5JVAZWN3utsDn96uvMaKaGAdIHABrGa9fpt21E8hSOjbASJm0Ghnn+wJeUpeuIFODOIsbCxlD4maGHlt5VlfBhKT19dpsy3PsBX1QwWoJ/GrBa2089Jqq4sGO8XSmEJtXpMQ8cASjWtdpZ4uRQrrf+TsEh5sm+sm59BrI0/qSB57Gurgr/KyHkFVnF1yrZ1H2hArJd4OxGYsh2gq+B4/Uoql36swIAq3zSrg1gfmdyURcA2OVwqdLC9OCaXCNx396tahMQlsMJNXLVZjbdl+6xMIg+XlPfNG/4MgLw/lOASe/ZIwAJ7CpZVF0RL1g34OJ4gXsf30By5wROGaEMt4HROWD3CYT7l1kKcLpeY1jWEYD58hTZyV04vsei4cJgCN+JsFinwGCIgyuXkW4Bxa6HZJQidRN4VEKMwD+qZQcCALdQ+AMUgxHrCOyXPpJ5gmxBIKGPye5FOIWHYrlEfDpnQCClA3MAsESR5RjsbGMwDJFnMSKvwOGHP8FTV59EFp+gKO4hTedYzBeY7O9h6ZXYffJxLPwSie8hFUY/jwB0GQA4v3kP7gLsZ3dVYn7rELhxGwhCDCgNeblEnqwRRgPA8Vnqb+4EKL0IO7vnsKaU6ukpi/4LtyY4d/VpHLz6HNa+iyRJcevGZ8jWhygwR7DtihRcB6XncgDQEQDge5/j8sVnseNv4dqHn2FxPEWZUqMPDlYVAbD12AHcUYDLV57G9PgQ+ckJ7nz0MYIsx2qdANt7uPq1b2B0+TI+++RjnH78EZCuEWwPEe0MsMYSpc+7oRa+B4dSgGUEIMtvkgAgB/74gRqBY3wndwKAwliT5rwKAKo7vduG6o4AlDViKwiFyTZKpebgH++S7FYAIBn09eGTA6+QMY2k/Anw452UvTKDW9LP0rkzJWDtpLTJ4IcGACrEqmSz7YBZOJC1bakfAFuka+UYtOqRTgCwr4t5v4XQZ988zAhAuy3DZ25mGnEzTvg1Hea55uBarqtrmtW2qn5Zmw9TOQhVUIMtirG3y6WI0JH2YcXFbNqmpld9JX5lr31RXSWfJW1afueDRQDyNPOuGNpNoujbufARAIBGUceekvIbRgCqM1BXpO+wuQ/A79+fDzsC0HxjLwBIBKymTDz58ABAptG0Jjz1nrfzlXo9HYDxkkt81/DoXR4RrUZudvsSNTjHn2LNEBNEI1njMQCwBqykTOOaWugkBQBkpUBad3HTH+kGAC0eM2t606UBzTl18xyryWeN6m0Twt3P64oAtOpDVd48OgBQNybkOzWTQiC6thTg/m3Lr2h1VRX/shEBZ6CvpgJW6SNUZyPVgvvRpmITY5JIdUsKsPo+O2iiz77dgJDb0qJAKmuRb1zt84AAYHXSLJhYRZBV5Vuxc2eIOzfMpfJmayqfKwBAXpm9vQ6LupnUmlByzir97EVp7dymAal9VoL5iA7AS710o/XvsVJYk4SO8alihS5TAUA1elJ7RPXIZgpwxfViD1Tp1tZoyfqptugIub/aAFvb/vaEEuH3yNoUzTU0gXDVOG77eVO5o13Hmv5Y3t8in8w138SA7HIimk1q9LE0DZyzhrVaVkEjrjr5psKtR6Ma0CpTN4lndwTsq8MAcNsQFfozs8rAHG1bRtdaZ+cG+UyF6wVvtG/Qv+sAIANczipfFYNR6vfcFcZpWTAAjboAO1mKbL1EmOVwTpaYfnoD6eEp8nUBBFtwxucRnr+CcPdxlOEE8XIJh0C/+TFAtQPLFOlqBpeMXsejQEAgc1G6PgrfBwYOxi89geETu5i6CzhDh3Wopbo7BAASOOOHYyAcoogG8AhALH04qYN0mmA9S3Du8hUUGZDO5sgXaySzBbySHkH3UxfbktW2GwwiRJGPIl3h5NY1+EiQL46x5a0x/exDIPAwvHwRq8jBhZeuIN2KsKKmxS4BRASUcgDQWztIj1dIjlYYOAOAAMlFjCjNkZ5MkRzfw6BwkC6WyOME0WDAwM8U1DQjgkt1AV0PyWqFYBQhdnOcf+MlXPr2m8hHEZazJT5/7ydIb36CICrgjBx6BUrXQUHoqOchcgNsOQPcee9zPH/1dUQY4L0fvoN0GWNnNMFqMQelLg4mQ3jjAUqfnuHCLTIEcYzFnTvIpzOsKb/54AKu/tKvwD93gPfe+QnKWzfhlSmiyQBUvjAPEqRIeLMoavwxihgA6FEKsMcj45gFJVKAHwYAKO0Y+dw2SSKBuq4cY1mihsYnnckc1CyGbCWPNZnJMp7YS3OitSFak900ptqRXoQyL5HmBfIsQ56tkaxmQLaC7+RwBAjIx9h0gLq2pqi43I+inEGUVjWzDLGuATzd50fK22pX1TqEnhRCZmFs1OWyfrrVn2klYtNBPwOpFA0nQV+9f0m1pkYJDPkOrpG7dLYlQtsQ1iwiTGMbZbIWP4lHvKqz1InDI1VNK7ndOZb2jcYfVaSRtDnU56kAi8jgaHt8RTfVdqlt4k3op7XJNvYYH3O34/+oAUAlrpYxT50CyselHm5sZuUqe0EIwtq+N9eDCTVFfkjekBzQDwD2RaL1kLdzu+mZg/bZ6xFUPbuXplPKxlZNocD90wcDALWarPKwSBkWj6BTUQHT/uJ+lXCvRE2+JgAowXXzAID8S/2jrKVJHqFz5Z9p/iwCUIkUZHWDBQDJniTLSQnZ3Rfh2h0F3pQPOtZHhphcL9vayp4D7etu7m52QCdwDjadLgR9E2WgpSh3y/JKHxj80FgvgWFtothbagA2B8IXT4qUWqDyLo/391GXTwcmar/LBEDMyBJzAXTn04j8E8NsA5JqBm2PADwzAGgjTQWqKZ1drCSU8VOKsHkEAKCkmbpxVRS//YRLdClTTE+5OXgRaAIIJdBj55FNAMCaB/TosS6uk/x6n76ptsm7lLiV+8VLG4CEBejYBEBQ52kCgHxH8k/1+PsAAPuc+AoAVISfcL06T0C1sbOYGvWEqB0AVO9T6W9GaajC+L6kUIvMrZ6rRivWIrCygc9sgBuDPDsAeJZZckNAN8mVCYtN0qwR1HQk69P4/h1l7pe2/cNGYnappcffRwSgpMomKrSNghZz4ksAsIfdHhYASDXOqCA0NT2gFFovz+FkGdJ4hSgr4J2uMP/8FpbXb6NYFyiDMfytiwj2n0Sw/RjrBByvVijnJ6wLcLmaIUCOLI1ZRJiMNkyWMesGjCCgLh4YvnoFk2fOYeosUYaU+UutbEuAIgApbTYcwYkGKMMhvIBHAHqZh3QaYzmNsbX3GJJ1hmy5QrlO4CQEytQ8TAawFwQIBxFC30WZr1EmKxTrGbz1FN7sLo5vfgqUKcbPXIJzMMHkyQtYRqD+t3DCiAOAKOHnLsLMR3K8RHK4xsAbIncDdpj51MXHER/dwyd/+ldwSw9hDgYAZjQf10fJECdq+jEEwghOQR2PAfgFtr/2Cq78J7+K0yKFs85w7Sc/Rnr9Y94IhDp2hC4D8EqqP+tzAHDbGeDme5/j2SuvwEk8fPiDv4XrBNgajFgqNjX98IcRCt+lyodwPQdemWPLczG/cxdYrjCnaMHLT+PZr38TCzi48aO3geUMQIrRDtX6K5EHKZIi5gAggYjjQQUAQkQAVs7OQ4oA3FTC9gKAbGV4BIasq0wOBNlGOUU0UnyGG1HDadZcxQtCjLe3MRhPMByPEYYhhmGEPCkQJzmLJl3MTrGa3UO6PIFTrIEihcseLplOyO7KCdBPsnTJ3lFuRTMoNqUIBzlV26uygRRsQJXRpjbRf9edXTsY0JTaqi74eQIAJcn1lFnpQCtWuCCSWk+rbYX0yEFBK4UJtANGlWfkA7V63Bw8a7cAbBFr3Rr57ACgfJ74b8sBrjSI+VW1v8rBEf47//8ei6HRZKK+XvWXWm2K7vP9no3VHwHYBwCq1l9z/7TvHRoYd/fVjCzL9WZNQY2HmgCgaVl2AYCVX3MGiEFAFBVdu26l5zMAsO/5ciA9ACCPkHtAAJBlrEoZbvp2dcSv9L3sEai1PpARwPIopeoyL/eA0QWqL6LZZFg9QIcD4mrZAelH8esErqL4p48WAKQFbgcAzeh822bU+ElE3Kk+508fANQ96mZ5BTXop99X2xgArOyBKuSeM9lDBQDliY124sUnUQkDZX8wk8fsCqOg43qRZQ1GEoJNX3JuuMhilfy/EnDpYo4++aHfKxSIAgLatYDc4trMeZGbjo8OqFly9gW95HVknCvyTUPva+HS9k4eAageCsrNQUYuU68/QwDQFom0qSmrKksbgFGBppY9JoWGSrXqb8b6mbc3FaQRCiVSVqWRXdlp4gf592rXGI5AZb4YEYD3BQBWJ1TtPGkqiC8WACiKRllMWr7mYl5isXXacYL3GZB9RuKDA4Dte1OOkA9f7nPdgG2m3NsMYsOA7jNbFaPXBG9NPjNT4OVsVFOT/rZJBKBUDWeTx/VkmuateaLdnPgmAH7nCnU6CH0HRJtKs/u7jtauq0uznFef7Gh7uxrxzZocUPQf7aicogBzIMuRrJcYlg7CeYLltVs4+fATlOsc8Cfwti7A33kM4fZFINxiUW3Z9Aj5/AQggI0ANIpaY4zBwcVkTh1yHYDqyYUuoldfwN5zT+DUWSJ1M+4ssghAWnsfTjgA2D8dAMymMRanMSZb57BarJEv1yAkhxpb0CMY3xOBPA+eH8DzfASeg61RxCLc4ukRlnevI7n7ObJkhuHeBMOLO1gEBbafvIA4AJYEXBoA4KAMkR6vkRwuEblDFK7P6gQ+/ewVnBtv4//7zneB6Qrb0Yil466SBPB9ZOSYuD4jxf6F84hCDzfv3AJ8B0/8vW/h/C+9jjuLKYYxcO1Hf4P1p+8j8DJ4Yx9O5DEgj8A/SgMOWQrwADff/xyXLl5hEYAff+9t+IMJAsfjTVScAoXnIBX+UOB6GLgORtQz5OgIoEhA6gJ89SU88cpXcPf4FMeffAis7wFejtH+BN7IReyskTspS18i0MwXKcBVBKCQ3ZwXHzwFmPHGhp9Krlo2gLTeeNMrYj+eBUHynrDYjKI7iVZlCNcLEQ6GGE4m2Dm4gHA4ZP9I1QcOkCYZ1ssCaZwhXiywOD3GenoXeTKH7xHPEoIoP7UEreJEhJFR7Vf1WqHb2iJtzrq3VQBQLEkNsbREslltGL5ptWiXX2QAkHMvc2gUa0Sv8MjVeM2fsp5WF7s+DACwBiSEb9Qq0EWSn6LE9Uyr5o1fAoBdq3c/ACDzirVD+XYgzQLomZLkIQKAVt+mkeat22MGy3dKZuljmZKw7SYGABpdaJvXKgaaBQDU7T9R+6oXUVQlnu4B8gxtZY9b8YxaDNgjUOt15TaWLBZQpwBLRMVsUnRWANCU8RIArGaoLbrEVvi3spFst7q1+SMd9FPJycig87ipz6Td0CrSKsHMl+VnHwGojtTmHzw0AFBnRLFkyqIJE+cMBpNG5LYoD/LJBdHl6YAJ5KiGQJXSqhkM6rLKEwyFEwX4pvJmLSSlEuMOc5+D3oiI7+ZmRThLD6HbgdcZVAIW9peYgl4KRPUNlUMn6G8CgGzV1UORCqi0vVMAgGYEYGWndAOA5rqaKcC68cL5sS/kXhU8HIxsJFEbbNhE8AzIlV9vOOo/LQDQpLoU0NWoVbYWF9egS1PBq047E62sbXt/HS8J7HLBrcSDKV2dGmOt9nFFQtGVqm4fz2tTdG8alU9MQEkdV+/Wa1zA+dN2pl0BgIqwkapIjY7lFLbv4U0Akr4TpO4ugjYZXal2LWRAJ3E93mYXu+Zcahmk7wwJNtslg9AYklfEYxsKmOkP6S5bOYj9UUbQVPtb/qA4G3ZqbMIVNXU0OrWJ5uqRFAHdflFtkLZf0+Z41/PsHcQmE7yva346AGDNJ5Q2W0cAFkCeIV2uMICDaJVieeM2Dt/9AFimgDdEODkPd3IBw52LcMIx1sslktMjZAQAxnNm3oejSdU5j+roJaf34DAwqwQiH9GrL2P/hacxdZdYlxRpxm5DyaKyPCsA6Bc+stMYi5M1xuM9xKuURdsV1AGYgB5q3MG7UcALI/YcAoLIrhlGHkJqVOIWuPXxO8hOb8J3U1x69jJuz46wdjPsX7kEjELELpA4rN0DjwAsXAzLCMnJmqcAEwBYukjyElvnDvCN19/E9//ft3DnnQ+wN5pg4AXY2tlHMBzDpRTmQcTSfi89eRnr9QL//o//CKnr4s1/+A9QPLmHw+kJRosM199+G6tPPoCDFMP9MTDwUQQcBKS6gX7pYccZ4MYH17A7PIcLOxfw3l9+H/AiBoJSYCEJdVbfh+r2UdSg7yNyHfh5hsXJMYosQeJ4eOzr38Zg/wKuf/YZ0tNjIJkBQYnR+W24I4/VZczKhKVekbPmb43gVinAvEGK1PBMPrO+IFV1tN4urVUqVCWslf3Ws/Xq9Lo2G0I0LRPdfNnjHBcZAYCexwBA14kQjbawd+4A2/sH8KIhA2wd32eH60UaI1mnWM4zpOsM8XSOeHaCZH4E5At4bgrXoSgHWexcpnApmqlK5bQEu7BNXutzVVBIfddVosR84sYAoEkycwyVvVXbb+0AYId46+sCadzaSAHus016vu+xbITloBZXqkuS2O0KFZDotm0rfViNUTqH9aiaXSQtC6NMopkCrM5QRn+KZzDwqIcCIsKuaZcqml7T8ZUVJoxKUYPIYtsJMSS+sTvGbZZHreLVFNdqlOzrjezm3gjAHgbqjLhUxiOB/KpmXE150y/USdX+fm6/nDEC0IwGUThAp17DklOsKoU/e5yD2sYS7HAmS4e60HaBrOaI1a614ui/quEvXswiX/q4Xp27Tn+1iy8jv1IETA026PI/OXOKAydpWwudKFN+peQwy+M9KACo8QtXzsq61hlJ3Hdo+qdNrjBpqf6uUoffaeB9Wor6pvynspD5dgkAiq1xlvPCBmfSs/UST/YRtrO0avlwbpFrr4bMdUmYlghABrVwgirJbjyii/+1rr2yKbM3xQ53sjlTEC+wLm5CTvNtxBnEBB+UqTLDunZL5YlhfTcfnRhj5bHWismsiScXtq2Eshbx2OUBt1pNqoAQP29kRMjFbdJRY1gGaKjCsP3hkq769fXTNokAlOvT0NFi5XiEj8VA1gSDHG8N8KngX60D2oWrvEYKRt6EhCd/daUwt41Po7Ia0dS+G7U3ScXUtjsqmps1FzbihXpGvI26EH4sYocKtSsgUNvshVNARfibQGu9Yrq4VcA/BdixJKpXtFDDrOlZoqch+545+xuAj3JP8ofyLlLyb8aBmbY6tVywL5qUcOq3GthoNBli49eCwngNoC4Qp6vJyyaHB10AYBurSLFkmBaaVJBz5grfrmRrHjbfpKcCtbJsi2Op0rtRckRbjFoPmbRqHh4IGbLh/qleYxiY9tu7dnH3C2W5CRsH9gFsPaLmkX9t0th8IdsP93kAKFPzqiYgoJp5XCZQDUCXagAmGfLVmgGAQZpifecQt//2XWC2or/AD7dQhgfwBtvwvAh5mgB5wjrtlkWMosiRFw78EaVVbjOALj4+hOvmyKizrFfCeflFPPba85h5K6yKlQAAKQKQtoUP6vzLogCjIVw/gu9G8HMP+WmC5ckK4+Eu0iRn4CNFeRVxhtF4jFWesmg5L4iY0OTd60v4Lv0rGHAzP72J0Fng/MEIr73+Mr77f34HKBLsPn8F5fYQCxoERQCyNPkSXu5i4o0Qn6ywPl5h6A4RIMJsukCaZviN//jv4/b7H+HHf/BHLMJuPNwGygguzYGakIQeRgdbeO3rbyIaD/Cn3/seUj/E1W+9ifTiEKvVFMPjU7z7h28B168xYTd56hKKoY8yChkA6EY+K/S94wxx64PryO+leOO1r+GHf/EfgDRHQDGQtH7CcmSRnUzIE4hZoFgRjUtkZYpg9wDPfevXMVsn+Phvf8jTfyMfziTC7qVzNHQs0wUlcqOgdXUKeOOIAZleGLLoSmm/cT1CEYDcbuyHRoS8YHYC38Oqv1Kbdt32E7eF27Yib1LHbFu5T7yAAX8pxae6Pra297G1d4DJ3g684QAFCUQC/3wPHtVqjGOkcY7ToyVOD0+wPDrG2KV6kNToZQoHawEAqlactLmkfpVWsAWNUOZuzpRbW10IxtkcFlXXS90iDQX57roJilgfkTFR6XLDY+0T95vYF63Lt4Ft0ucCdD674rqa/yobR9p0LbpZcpwJEnYfGDKLv0NvSB/DuKYXbWh7ZJ8FVtfFZKadkQFWz1F9vuk/sTuNAdjea8691etppQ/nWQPUNJqMmn6IWhOxKSe66SPf163o1bk396O6kuZBuqR5u/QigEKxwSy8w+Rs9RJLOq2xQfQRNnmxWiXDh6nsVWWwTMopKci2vWbih2bKqeo/ieXVyGFPsZTagkA2lR8lD9d/U2sMts5WDryilV1qsLF0BFzUA+dv4vtJ6kIZ/SdpJmemj7/JCx0SzKgByHeinvZd40hCxlULIlda5xl1/dnzNPvSEYBZPSbe1ET5GCxoj/hTKNXaIKR710mJzfdUu0zt/FoMXL+7S2MIWafc0By+Fr0lRtYxvu3f+RfWb6XJYAMAOWgnbtvglMdGSrbQFXVqIKACAaubOEuYkT/867oLML9KBwClYpAd4czQaM5g/MS0imrS7B351HoGzYgP2wF56ioAACAASURBVAZqE+w2g6lvA/YzorqAesSiqfSaz+qMQKlOjtuY0gj5bzxeRshYRJ/1kaJ+gMLD+ga200rbZBSmK9aT6i/1pUkwh+EMQqAvYkcdLxuttjgqLi84uBMBaVl7hT5WAFDJFOkSQPQdBwCbJ7Vt5pHct7zGox4NaLPDZFQnXznuoNExjQxeloC/OVPT5qzorgCAHOTdwKRtZ18tWcI0Puh3FSDj9NIjZPuKCHdGEFvspQYdenjTJrz7gBv1HXYAUJF3xhil4pOM3Xi/Qus2KagaKvxApUVBdXQEl89o49NuqWlYDBsd1rQ9sUvGbiDb7xNA23x+939lHx+x/XCf468BQD4+GYleA4Al3CRDuVwjKgn8SrG6exd33/kA5ckUbu4gDCbIvS24lA5Mde5YzecMRZGiKBOuByj1dbiN0dY55EkGZzFFmcfIvAz5wEf40vPYf/EZnDoLFm3GjoxYCjAHAAk8YynABAB6EXwvQlD4DABcHC+Rpy62JjtYLhdMNlAjDAIA12WGwvXgeQE79uAytsQg8LCO53DdFH4Q4+vffA7f+uYLuHd4jH/1L/97YLXEzovPATtjVgOQOvsyoJhoULqYuCOsT1ZYnawwdEZAXCJeJMiWazz3/IsYuS7e/qO3ECQp3Jjk7RgOdTEOPeSBizRf4/KrL+HgsQu4Nb2HaQk89603EO84mB7fQvHxp7j7gx8A01NQd5PJlSdRDEOUgxBF4MINfbg5sOuNcfejm0g+voPXvvFtzBYrfPruB3BzqlWYw6cU7jxlsp51RBZbgYFhRAPkuPT8C7j8/Gv40d/8CMnRTZRZzK51zu3i4JnHUIQOZsspW888jwEnhzsOWW1BN4jgEABI+lOJsJMAoBrT1m7+soC86pBZmNfcHqx+ad/flXxrtdmFfcoAYG6bwguRlh5yL0QwnGBn/xzGe7vwhhGrS0mBpxQ9SnqDYkaTVYxklWMxXSOeLlEu5giLBG42RZHOgGItUoCJYekjD3QU21XIUXswjX6Yo0sLo0ZgQ5RsIN+Me2wHu9qBXk+RdRPg6lpbdT1tUlDSo8vl2jQ7oU3K9t2v1kCr5qJEP9bxrZYGIbVRVL2eR/jIjzmzPn+gv+TF2bWJgZAZD1DXU9rLKo8019fkuTb/S72zb97qoLp52jws1wEyzS2ugluYl9TKZN32w6YZT3wGTf9So5+WuSPu6NhAzDLTAEBz9QW41LcJTRkgfm/lzsq30GnT8KfoOfcFANYDNu13c52kj9Pke/1wpdpxhs8sn28nUTMiV5yWtW4z6hivR9W170ima6suuwQAilEwmp0BAGxlXttBW71/+F7hq6zvAbmuBu+rAQPi50aJt1oxMxdEAwAt/tSjAgD5nPrTmG3BNXLF2nmrVZs0Dju6umBLfK2rzmJrBGAtUOQ2FYvF7AsB/PSeEHbFXvG5sDp7wgGTzrVa70kz5BrOPnVLq7vW0JPY2XMVlsudywcBAPt7nLQpDNP9bQrnJo3Prl5N9fHzAgCyDWRoANmRtjLMGlLTTmsN5HrIAKBNb7fpO5uCUu+n+2xNPM6+6jVmohl8bAAC0FbtgZYBc0DriwcAtukbNg0ZESBkgQQiW2nYZd0bNYmqvaQoop9LAFBZ+z7b7CwAoNS9snx2g+YtYGz7GGQN2ZYrvgQA70s0PKyb+iIUz+7+1yOTAKCU9RT/R1wgU4B9slHjFA51uGUdcGOs7t7GyfsfIz46gZcWDIzLywGKkmrsDeG6AUDdfhnolKOgaHg/gBNtYWvvMrI4g7deIlnPULgJ8u0hxi88h/Ezj+GknCIPcrgOAYCFAAApfbUdAJyfLOA5A6TrlEXcgd5VODwCkBBEFqHm8eYbItKa6gDG6zk8qnO3A3zll5/Gr//6s/jgR9fwv/7u7wJH97D94otwD3axdoGMugmzdB4LAOiOUK6prmGC7HSBQTjAt77xNbz1e78HHJ1gO5wgyyMUTojS9ZC7DrIkBsIAGFB3jxTRV1/F1W++jpUf485nH2Lxk58Ad29jUCRYnx5i8vKLKCYDFBQBGLiscYhXejgIt3D8yW2sPryFaOcC3viVX8Nf/uVfs/F7RY4wWyMoKG01ZutKh3H0/uH2LuarFXCwh1/+9V/H6XSOn/zVX7CajU6R8T4lj5/H3rOXsHYyLOZTlEWCokhQujncYcABQEqt9vw6wk7Icq4elKgHwXJtOkVeLyWQBLRrP6MbPOg+gCIAkLo4cwC4IN50A/bPHYwx3ttHuLUFb0BNZijalNdzZE5jUVDZSiTzGOkyRbbKgSSHl6xRrKcok3twiiWckprcpCIFmO0g4STU41ab3jVBr6759dUgPbsEaHOIJB0bEYBGk6ifNwCwSxbzteC8qmnATQFAixHdBABNC7TLIvgSALQFiahr2AAADS9e9ZbZfbLrqWqPa0zRvf/OBgA2X9KIEG2UZGnnh0cFAKqjNNCFuhxB5dTp41N9PTY+OjBSLuky9znZdXpLu6Ntn7aDND8bAJDku11WNGfQDgByGnBa9VFMj+jT3/LFBwC1GQrCaRLxDME/JoU5b3TbB79QACAzREXKRFsKsMZOHREupoElwRNJsHpT67u7Ia4I8BAv5ezootDS2n5WAKAUNpr6sMiZsxtR6kNM9vtiAYC8Jk/XhxnmFRAj0lGFtW6/1fJXhc+kwCZgaLMIQGJog6vEK3Rjub6m61S3jf+lgfvQAEDp2BhduGQb9y4zTzdoagDQNBXldaaSZnMxIgDbuV1J6xYRgFqNphYZIcevvVs2JVDe3ZUC3M15Kt8ZpsHPEQBoo7smHyrZaKfGWQHA2pEWkkdhmm5VaHv/lwBgr4DsZeJHd8GjBgBp5KKHFAc9ZJRwTmAX4FBXXQYAUkTZGqu7d3D60SeID4+BdQbPCVAiRJbSQeAQwWCbqsSJQ0B+WOCOxvAGWxjvXkKRliiWM6znp4CTwt0dY/z8FfiX9nBSnKKMCpYezDrHUR1AAm4YAEidcwcsBTjwBwgRIj+NMb07R+APWRfg3b1drOZLZKsEo/GkigDkM6SWr1y30bOpL67rZijDJZ7/xkX85m++gXvXDvE//sv/Abh1iMGLL8G7eIC1R5Fg3MiUAODYHSG+t8LqmGoAjuDmLtJZguJ0jXSxxLd/49fwgz//cyzeeQ9RMIEf7KAoqPkHvZU66QZICVQJAxQEHr3+LJ79+itYZEvcevdvgRs3gDs3CH0F8hWGzz+LcjICogC5Tw0sSoSej4NoByef3sbyvWsAIrz5n/42Jjv7+JN/+10GhvrpGkGeslRuctJIH2fURXgwgrO1hWde+wq29/bwkx9+H6uj23CXMxTxEtjewujSeYyePI9ZskSWrFhaNAMAnRzeMGDRctQdmUUAOqytFE93UlKA1ahiWySrFFttACCTqy1OqClf23Ut2aYESFP6t88AwJKiSIdbGO7uIdzeQUaNVYIATkDIKl3rICcAOs3gZAWS2RrJIoaTFIiojmS6xmp2iHR9jICiSD1a1YxFR7IP60IptQKNTLZh4EqtsrOrSWwAALbZcIxAfQ6kLp+stpOib1WHnB7PAFnVvruPFOA2CfnTiADsssM49ez0r6VhTd++7BO26o2ah+oa9WnonxcAULVMW5lTWXa5CptYxebz9N8rkSB3mQk+KYukrlfrm7sAhA0OQLu1Px+7CgJWdjtTtqpv3HwSc80eQQSgunryZ4kHSP+N08uIkDPTO9n49BTQvohbLduENXXoiVBlWYWaxK/kK+cFPXtKjXqj3X1/EYA2Ctl5vsZRLJxA+rCSL3UE4Fk6o3eVsKk5y/TWaoJJAJuPU92HUhY18R2VF84WAcjf25QI7b57f4317h320wcA9Rmy8bcIl40iAHf+m/+uQyrWykNOlAsQtQZgTSBJeOt+EZeZi6MS0AT/Gtda1kIFvDYDAA2DRICFNkCDuQC99k2fEWRuDnMSfff3MKCRQPfTBgBFTmfHIHsJyDdtZZwKR6l72tq3ponDwT8OAFKEaDuDt6AjQstLY1nusL6GFXQ91XqyvVBNc6nMsM1IcwZKKJe2AGusCYzyXqngGyebgq/UITJ3QtSYrPeLNDLsw1TVY+WgKSnAfZOTOsNGP/Y3peal7Vl9JFbnLY0PYXrwSGJFw7LXGSnAnQq4b3IbpAD3PaLLoZL3qgrVfJ5aWNhKPwu4Xl+nF1A232May83nPzwAsI1OfeuvlbNoEEctgN32hm4Huq+o8iYuSR8PPKrvHyUAWPGmcFh513jeLZX2mJcXiEogn87hpQmCMgFmUxy+8z6Wt49QLmJ4/gClEzDwz/HGcIMxMop28yI4QYBoNGTywfGHCMfnEIZDxPN7WE5PkcdrYBRh6/mnMH76HI6Le0g8qqdGnXwJAPz/2XuzX02S7D7sl3t+292qblVXd/W+zTSnyeEyJKUhKQIiaEGiYMqwYcB+MvRm2v4D/GAYAvxsyZJlG34RIMiSIct+oQSDEk1xsUlxyCE5nCFnppfpraq6btXdvj23SONEZGRGRC7x3areZth3UNNV98svMpYT55z4xe+cQ4Lv85BNpwIAHQIAgxgBVW5dM5zfPQPbltg/OkZAlXbTDKuLJQLK2xcEnJdFBUAIlHHgcRZYulnD9xwONKbOOV75qZv4D375x3HnW3fxj//ePwBOzuC+9BLGz9/G2pOEZyFjFAIcsgDFMke+yOHmHgI3RjbfIj9dId9u8cwXX8IsDvGtX/s3VGkCYXAIDzE8YpYRudFxkQIIJmMkTgL3S8/hyddewGIxx+VbbwJ33+dsPLAVL8Yxee5pFFHA8/9RVd8ycBB6IWLmAfMtzr/7HpA5CG8/g1/8pb+Fy4dz/Pav/itgvQG2xAKkmIyC/4+KX2A2xTNf/BKeeOYl3Lt7D+9/+5vA8gJuvgFbLYDjazh48VngaIJlugbyLcp8qwGAxAAkAJAYgLxQS8WuJEsvAb3GCDf2SdoQFfgRF5TNLjRD2m0O/jAD0IXjhsgZrX8AL5wgdwOEswNEe/tgQcQLvRSUq5ibGgez2R4HkrPNFl5RIrlcwcsLWgo4WQK2XWA1f4ggyOF5OQcAKYCe0wV5sRhegqX6d7XLqkOqNu56yAP6y5pvyuK7XsG+SdtbH5grfSABwFpfXJGxMaT/P24AcBfd3gcACqlUz1+PoOVLkaO4ORIP2apqH9iNthCvanB2UHIYYFFHJf1tteCXGaLZqrqqJXHRPJ4dJqyaD9PJrb/Zlm8zZFkFp80QXDFFdbkF8bE5YRYAsAcf3mFs8pGmyA9fYS3M0g4AtovEqa9uM8CGQhK7Os2nRExTR0qhtry2GFUmAcJMu2S+VFMIoghIL4JS5dxrLmlNAKvqePUOccFnMusGdni911RNoWssCz7J39ynZ4T06uOT8mvzi2XDg1W8+YvNtxv9rw9IxtxVcq+l33qEEGB9BTr2F59AvY87jX2HHSZa7Z7fevdZSHB2/TkowNYLOJGDtN8SObsAgCqSKA21DANTJ1PKc+t3il42J990sIYok50KRAkRaEKA1cT2Qsl1T7RIzq0uoawaK8fclSJf74fFCbIK0uN931Rfnz4AaK6wGRcoP5dC2agYcYtvIvi7uFFG7g2HnOo+ALCjf51rpJtvGUounZSW4qna2BkANKblqkqpmT2j88r8dbVZV4GWzkB1w9cHALZzUAsAsVbnZhWsXnkXVanqJO07OPJtXaGo2yrUmwOAPZP3KA6+yhb5LAKAhv/Sy79QnSrNTCsNNBLeL33aecCQ2ZZx6QgBHr6R/bQBwKEKcPJ217Yzhx3IzwHAYQNIBwbac20AsERIRTWWSzjJBh5LEWy2uP+tN7A9OQfWKeBGAAcAYyA+AMIZ4MXAaIpgPIbr+7ySsBfEyJ0IXhDCZRm28yWctETuO9h78RamzxzhrDxH5m4BJ4WLXJzVeDRBwAFA/seP4HkhIidCsHU4AJivMjz3/Et4+PCU4nWRbzIOADpxhIQxngewBFV79TlQRcwuKoIB5Niyh3jhy4f4j//Dn8I7f/AW/uk/+J+A+RLhyy8gelEAgM2BlwBApwIAC+SLDG7ucwYi9aG82CBJUrh7EX749dfwjd/+bbD5FiNvD2VSwinonQ6Y5yJhBcoig/PsLTz91R9FMY6wvFxge3qG5O4djMoEKNfY5mvERzOUAYUPizXyRyECP0BAvyAA8I13gDIAJgd4/St/CV/68o/irTfexDd//3dRrOYo5nP4DsPsYIr94+v48l/6Kp5+/jl87fffwr/7rf8P2dkJsFnAdTKwbAPv9lOY3b6FbBxgna35uqsAoC8ZgFEFABIDsAa4FABQczPaNqK+cNQUXDun5eMAgLTuAgCkXJAj+BEVrZkgnO7DGY+Rez62JCNKmITv+EjWG7BtCgqDp6Ipfp6jTDbIVpfwkWK7OkMwckH1ZTyfGJaUOVD88JBz/iOBFzER/Zfr/frLdjlkDZesDM9OGrR6yAwBJgBQtSFXZWwMvftR/ANTm/X5HqrX2uuf8PmxAxC7ecAderYGANXPOk6k0hcz9sKQ5v7UAECVkVGDCzYJGxoJd4C7f/hUKSl1qpBT9WF9ytSznGi0XUSi5dUOQzi746eDhlb3a8Wjavqtri+Ls87Q+bQDAOyU54EJrl7c4ArVnNUT2wHeaJurmaBd9nNr/9oQtiqlklCilULTEAN9bHSB2eAt4gK5d4f3jLHpoyx6Mbi0gx+axbCuoj91NqP5mt32nMBnG2PM+1OD3h3yYwDCNgag2rrooRqyLAufPLIG3WHiP2kA0NQ+w+vw2ACgyKcnwlAklih0gpoHsNnFtbroAyLUtbBugOH55wJqAICc9Kpu2krVdbdEOVqqLVKjz7KQSFO0YOgQO0yRbS58aluldoTP0ZCCtcvfJwkAtrcRVYUWR6V68zWasul8/cW2sDZGpi88RSpduywIORV/TABQgh1XDVkR5kjMsmQAylF0gdXqgV91DkwGmzzwmtvZvuIDdy7qnrMwAGsAr7K8phSqBlnrk2TcGXlqhvvdQE3EhRi69R6aj1rW1TwmBqOx9X1DaHczW/I28rPFADT9c9tYTBCw3knKF0vVwVOBXWNHy3lV9Zhkzw2Z108bAOxQQs2vhjtXhXfsMst9M9AUqerbHx+na7KLLhl65pNiAKoAIN2gcwYg1b+gUMjNEsV6CS9PMcpLnL3xATYfnqNY5fD8EcpwDIRTeKMDeON9uON9lIFg4FEV4LBgyKj673oNb38P03GMy/unwKJEuLeH8e19TJ85wHl5jtTdgJVUYZgAQFoZl+drc4IGAHQcH7EbI0o9XN47R/LgEvH0gBchWc1XcHKq2xEhnE7gjkY87JWCNEtigRGDz/X5JUiWbrBO7+Ppl2P87f/05/Ab//zf4Df/yf/G8/NNX3ke/ktPYUkENypuUm18qr4bFD6KpQAAncJHGE5RbBmVy8U2ScB8hld/5DWU6xXe/84byC/WYJsUfglEcQgEHibX9lGMAtx49WWw68f44GKOLGEIqG7H2RmcLYU2Z2DFGkm2geM7yFjBw1T9OOAAoM9cDjCuPzhBtshQ5iFuvPwKvvo3fhGHT4QYxUCyOEN2cYpx4OL68XXcuLVPaR3xZ39yin/yP/9zlMsc6eISyNeAm/Hqv+OnnkRw/QgbhyFJN/ApVJozADMuFB5VISYGIAcAZY5F6UWJFDXiZ9gn2QUAlPPez7EYLkJFAGDphGAIEQQzhOMDIJoB8Rh5ECBhJXLOgBU+FOXjZWnBw8ipAnZEAQx5goLC1udnKNeXcL0CLJkjPBghnoZgTlYVG6CDp8g5KFyw6mBcOR6Vy95ZJkAyBNq6qO2bGsddjdHUpSlt2lNdKXq/mZPr+xEA1PAJywQM+0K2HIx2DW8ysloENI0dsrs1+jgBQNWvbjEAzZCswS7vcrbqBwDFGNUc8yLnnI1zVdPZ6rOdPCN19acXHhJ64bEBQDFB6rpL395kL5nS1JzN+oS43XcBMKm/H1qD6jmF+dXk75eaQV9g0wdWc15KHWffFcoTNiKCmsNKwytM+1K1qYTgq+Bpp5jugH9cBbBrjbsT67/CHu9lU9Yn4AFuWWWF1QMDPU3RXwoA2LWX1HPLRwEADtnvK8lKx8N9DEv56BChrdmHj9oLu34bAgC5bR1kAMoqqioAWOf/GnAXuOA1lX3V4bVVSbsdfWIEc6hLOXH1rIVcyqqv9rdIhSgZgI0j0gCA9DtPbtJOQKUKcFScLLWfchyy+232t63KWtXagBNhquB21dEhA6O7ytocc5vVhMD1qY0W1iq53DvmhpFGplYp2ovqmau7ZnMo5ZzXOQA5YKXS4NUWdmqtcs6FhKiOtA0A5H54NYSaet+RO69Rp7spAnMt1DNPrRKGAEDeMfF/wkHsrgKsKmK5P9QQYNHbPiVk9lLMXcOo3d0Q1XvTBKj4q6vqip3GqltH2Wa52a87AoC2Bgc+NyWwJZHGEGwSa+qfejtWH5j2WK6futbqM0J+m06YjqRMct01RNNZ6+p7W38oLdUXJP0TOChFtbz060DbfNpuwG3hBWaOxfaueAzh+ai/Wk2G2keVMdxng/vnsO8TRZ4MBiAHAElPcACwANusUG7WcLIUUQqs715g/WCBbFXA9cYI964D8RTB7ADeZA/+ZA+p4yAj1n/B4G63SLZr5E6KV19/Da+89AJ+41/9OpZvn2E0O4R7FGH2zAFO2TkybwMvILiOZ8sTVz6uxysBSwYg5XMbeSPERYjFh+fY3D8HmIvx7AAOc7E6XwiRiEJMDg/hxlSEoyoEwhzExA5EiSxZY729j9d++Br+5l/9cfzD//a/w9l3vs3DkvderQDAkGKAiUEo9qBbuvA5AChCgDkAGM+QpyXKtESapfD2x7h1+yZefuE29gMP2YMTuJsVplGIg4MZpgd7OHjyOs4LhnPm4tf/6A28c38Ozx1hRCHOWcpBV4ct4Tsp5hcnnGFWSACwYgBKADD78ALbsy0cZwZvuocv/fxP4ekv3sbkkOH4KMQTM17JBEVegBUe0o2D3/v1r+PX/4/fAJYFSp7jL4MzchEe7cE7PgKmI6ROiTyhcGmiwSUoGDE+S3hxBQDWOQCFRRGSdjUAkFuvqgqwtNV1ERDVqPYcc1Q/VR4ExFoJxiHPR+mMUDoxwvgA4egQjEDrIEZSlkiKgufYIh+UQG/6k66oyAflTiwRu8TcXGNz+QDs8hTIVoQIAsUao+MDRLMIuVOA1QcqNQS40nm1b9qVWqV6pmPfN3td38OqL15fXisKw6ZP+1SWtDmcAVg9xP2FOg2H+OVVD8RD/dmFMbTDHVFrSC2b1MGMr0azgwZXGS22+MZ2czUA2HG5V0nqgKfebV01Rubggrf996EBq761FAJzvdvnG9U/UTpTOzHDEmkDYAXBowHQRM64Hueav1ONGZNrZ3r48t+2+eFJ6naQkaFHqu+b0RuVwpO2pdt/k/k3h+y43r8akNsRIZa1BBr/03xXe/zqE5QDUP3p9KcHppDka2h0JgClstfEe421NdZLTENDMtLn2b62elGfK4rCDgBg/+6o+tZqoxmvsB7ibN35I/C++oKrttE1QNzvl8uvyfmv7aqS0qBbf+ud4fJhNUr2deid+Sqdlfy8pa9U9WQ20msXdl1nrjEHHxYkDfWRZqyu67YBQF3BVoBapSzI0ZBVN7to7SogwkWeJ6GsQJBaIZhdbg9AOlaNcpLLr2y56nDYDrFSBbRpu1EwiumtigpUw+MfiBBg9eatoamqPmHTsgQB20sh7EGVg64zPE4Neu9bR0silQEGVNPi1QVcn/F+Ges0yLVwCIalrqEboyeVY71ija1SvqL3vc8hMynuMg8gX73ejSYYOsYbqnfLzogQcu6MNr+q5Zr3XTYwEAJZ96EKWW3e2Qbfhna0dOjkeM35kP3pUwut9TKS2JqqQp1XCSbJ/dnsxj6jbYL3VcjngNGtFWllN3QD0OQKaZ5rSO6mm6Xs9F01qsreF8atNmBif5s5AG0N97sXcvZUSWhfLvMLjkEXpdvCaOum0OqNzcg9267wEPmc0OPVv4xllvq5L8RJ1atNe3oPbJrJaru7qgwpm7Jpv/tN1vaVue/WPcb6qatFqlurUq/bnl107KMcQNUZNr8/tFZdkmRbHyGfQz/dukH+lhxczd6XrAZDfMaQLxfANoGT5PAzF8n5Fpt5BgcRgvAAbngIZzQFZhFYFMAZESvKRbLNeVGMcehhfX4Po6f28dd+6a/i1o0Z/tHf/cdYf/cUk2AP6wA4fOEJ5Psl5puHcGMq3EB9qPSK5wK+DzcYcSCQh/MyHxELkM+3WBEAmDLEswMc7B3h/MNTJMsV4LuIZnuIRmMUBGoSa87z4bku1ssFzwO4Xn+IV17bx76/we/+03/Gw5XhFoh+6BVMvvASNnHIoUh+5HQEABiwAEgdrB+uEHhjOG6ELKeLHI/3MzyYYLwX4uWXb+Nnf+wJvHAAXA8FbhT6QJoBqQdcOMDbD4Ff/a0P8P5Jgjx14Tk+vKrgis+WWF98CJbOURQJT5bOGYCTWIyD6k5Q8ZG7l1g93KD0DhAfHSMZuXjtJ7+IV7/8NI6PA4x9hllM7EeRWvDbf/Qufu3/+tdYv3MOZCXP8Yc8hX/tCP7hHoIbhygijzIGIk/X8IuUVwEukKL0GNyIWIhxVQWYGICqE0wRCboU6583clrbCs2AVxfK9WOWFAG1XqVE9JSLT+wW4XsQ8zNC6e0D/gxeOIPrT3meSkbMQBlaWBRgecFBUl71d7VBvkl4NWyq9jvbc7G5vI/8/AEPlebFayIHsxsk95RnkkKIZT9FShv1YKSNv2Xr+c5rCEsd29jc/3y261+K9ynTZY1nMRld2mpxvEN/o60IiM3+DmomnpLEbgEe5x080LJ6RZ8F6tOx4msKAFhPfLVu8vOBWPuUYwAAIABJREFUDsoDqfoO7RKP5ywb0vL6Z55SlEW4Rv0Zpprz0m5zrD4l/94lLyrDTAfwKl1Q+2zt96rnkW5/0fBPFECnWcc+vcA9RIMVq4KAMiejumWGk4SJPipejI2xpnTfUG2tfW5bPyF9Q2tn5hCUY7F5DZrKECPs9C27AH/jQQ4ADvt2Nh/qKt6LyZoU/ZYbvD1bSgZIMc7O9eubY3l+6p/PYX+uKo6lrKFa9ETIR88JpTN3nGprazpMr/agp9UI6wZNUvWXPvu1X6j8Wm5n018W7Q+fsK4S4X11PS9CjIcYhiZJyNRnNobzsOzaI4zaYyr5ZS4RqT3fezQAUIKAcuNqwF+tz8yQSbHoulLSBUrtLA+RrB9WDlmKjuH8tN4DcqM6VZRaO2zwG2OtTEGdeLc2ixzgFodgzUAZe7LLmAjBpZDk7g1O80b6oL/Uu4yX7xZNat8s6nB1Ie7/xi5qvAXw1U5J5b50AoDKVrbMq9q7eo6NjqkAn/w7l9Eqt1T/OESREG1lNWStkVku41Vf6b8S2NbkuQsArAYg5U4w1lRMxbjhtSyg7Qa8ZfSN9lQAsIvBaL5e2y8aVV8+2bWHGwXfKDCxChIPGVJsqsKvAUBtCzX/MNV/q90rWH8pJ7VRrR1JMVbu3ilysMteG86jpDvf5trxma1zOvW9rW1MdYMpvtftKAjZ6wIAuW4R3xw8IOyiI7r2sPyd7ftD7qdYlK4bSNGqvP3qe4ecb+s7lAEMiZNmsqrvaPqxtX/67V81gMEDdb3y/f6j9n3r80bwzi7yTbeIgz9cuBS3jhs95TeVh1b7FAQ0laIKsE8hksslsE2BbQEv98ESF+s5ldegnGqH8MLr8Gd7mN0+xN6tQ+QBQ1JQnrQNL6Tg5Dnuv/sG/AMff+uX/waeeWKEv/93/lekb5zBKyMUvoejV5+FcyPEZTFHgYSHqLhVjgbC1SjU1PVjwQT0Qs7483MfXlJifvcBr0gczw6xPztAwBx88N57wHaNyfVr8FwPQRjC8agIRw6UOWckOixHll3iR3/ieXzw3T/BB1/7GpAlQOxh9KUvYPTyi1hT5V0q3sG3KR0GHAQshJu52Fxs4TsRSncEN5rySsdOGMKPCKxk2DsI8eozh/jLrx7hiADAYs1z8UXhiIh3eJB7+N7DAr/5e+/jfO6BFQFKRkBiigApArbE8vQOkM1R5BsUCgDoeT58wirnGdiHS6xPEyC8htG1m2CTEP6+j9tfOMazL97A7SdnHNg6uXeO99+6g29//TtYv3kXyANgQ5WGKd8gw+iJJzE+voalx0AYJwcdtysEZQGHAECnAgBDD1QExA1EFWCzSlsDAFY+hgWgFvhhpSE4IERJKiqdyQV1KIW2AHcIopUAILVEOf0Kx0PuUAXpa3CCfbjhDI4b8z8oReXikoN/GQjoDuggQ0BgUWC9WAJ5gSJdIgpTJPMTZPNzlMkKrlfCjVzMbl4DCz3klJuR1x0TTBiX50RUeCkSIO07KfKx92th8xN1uugtjwsAmu23GBSaf351BuCQbuJ+3CcCAEp7ZPbGFuLbESFUr5ecuWHrpQGAXSzAgSqSjaKu9hKlZlByMgo/oz/JvEyPdBX7qnqV9PduAJB/0uObSH+62y6ZAOBg3/j5TPGEKl0gthITe18TYO4hGoCQzgI05dtwMQ0BqUImld/a/P+2hA0TFPrJEXbr36RGUr252ouWHlBvQ438tD3EupUWYGb4EwMAIBdPK2l2WDr1T1VdWe3pWn9ItqQ5XF2/6utXjWXACVYoWK155C0Pdp8AQB2UVPeTILZ0vbzqcyc/SZ1/u/5qGKySViXnQ9VfzSBqU2yMq0tO6ZHvBwBQXTh1/c2CV+I4o8zFDrJryzHe3nwlT41DrwkC//EAQFX42iBgNwAoN6XoWPcGqBe7PhE3Qlq/R2MA9u8CwQBrxFy2LU2ycADEMV0GKTbfaX5bGyZlv4i36huodUDkDEDxpNlLCQCqn+jft99Af5wAoN0EVAfw1oONkhiiUIvlHbhj6rgc61rp2lgo4bUqU7VfUQ4ByHJtG+dHGhNu5nuAIM2gqwddqayrHCaN+vtoAMB6XgaMCZdBJYfKJwcAVp2ig3Wl4PqAFDl/0ky0GaZmWIVNSnUDrD3dwwxVtI22a7vXfXjCrwIAtnQEP6DIpO7d4+yrYqu5Yb3qsRsAVEe0a77GvlWwOf8WcbWz93vxp+rgbmMoDOmfjkF9DgDqk/K4ACCVppX6mdvmFgC4QskBQAa38OEVI2wWFBYaI4ivofAP4EzHuPXFp/Dc60/AJ8LVRGzbZA2cvHcfb/zpn2H+ztv42Z/7K3ju5lP4P//RP8Pqe8SoyoHJCNe/+BzcW2PMyyXScstBOoo8pR+qdUHVZolpxwHAIORsOwrFjcsA65NzJPM1Qj/COBxhFka4f+8u0u0ce4d7cEsG3wNyliAhQCcocTCNcfPoEH/l538Gz750C3/nv/5vcP+P/5jn58MowOiLryB66UUsAw8OVeCtDv3kzPtlCC/3kM4JOIvgj48QTo84AEkFR5I8gxeUiKISR1MXX/nCLVybOAi8DHHgYjqJcPd0g3cv1njn/hrvvLdFnk+APESeMQ4Ahm4Ony0wf/A+nHyBItugIC+GGIBjKoTiCQbgPAd7sMX6LIc3Psb0+EnE1w9RThzk0Qbxvo/9oyln5c0vVzi7f4apP0G+SDAqPSwePEQynyNZLBDO9jGtcv8VLkNKi7dewC0yuCwFo9rFXgE39BDEVAWYQNWPDgAkGeT6XU0pI/Ne9yqx5jBThwBTRV8qI1MBgO7oGG50yCtRU7GaopAVocmHYHCI4bhZ4MgDbhzMcHr2EElVAfjiwX0ETsIrV6frBYoiheu7cCIPs5vHYBEBgCIqRyYL+6gBQFMFqvqvuYCvnpIXpAMm2QR0TP1vAhytqsxXYEDZPINPAgCURWS67Zz9AC1DUOuxXBkAFIpM9YHVvnACQvsYoy9odcahV39SAKAcbz/g9UkBgKInzbmxYszKHJsGI7YGAKuLL3nGqa9TDfnVzgstgW37rlcCAC3BY+q4bHulz/vUASQJHBnSPnD5IM/hon2paBuF2xqvcaFoZWANgijt97X0nbY3JCGnGZ9Yv6qdjk0+nCOuG/9Q+/DZBQBF34fPN6IqsmRNdjMAG6yAT2U1hy1GaA+55nMA0BaBY0p0AwCGYXBVAFCGN+gGRYJgNUOKbxoBAHKgpDFBRm/0xa+VvjQ/hmVSARjJIuhnAFaKWwEANXChaluEGDRwDBUQaUKA256f/hvtmF0bUvkMdyqNG2j9+3Tj3kxJrY60TaDcQJvd4SFmtiP2o6n2nb/VeYParOsuAGDfu+R679KX2kArIGB9sBxgQPH1sdyOSzGUozLZgOp6m02pn/FxyCIa1aBsRWRa27fHAe534vQWTABQNbttVVHtISUStlbntdh17eHGcREKvWGy1g59h3PS3p/6jUgTDkPv3EXxNcanS4ZU5lu3jNUrLtwTJaVBPd9WBkW3jlO0U694i28SW6T7R8h320lUn+5jHze6tmm9a7/03xLusiv7g5dNXT+kA/rfVJWV7mGwNAxA1TNrxivW0BaCb2jslpPX/KJeaeUZVf93MS0HZ8hyoK5XfkBAVOmzPv8JMgBrvdMJAIoLFmJFEQOw3GZgCYObB3DyGNsFAScjhPE1MH8P8zRBeHOMp7/4NEbXI5wu7yMrN5iMR/jh117HnTffw9f/5b+G78WISx/Luw+BRQpkBTDycfzqsyiPY5znlyi9AigzeAWFdBK7ykPpEgAYwg1jwI8IEQQKDyGFAmfA/P4Z2IZAs5IDVi+/8CyObxxguz5DvjnHdnsOxraYzUK8/kOv4JUXn8drr97CbB/433/12/iH/8P/CFycw3MdZL6D2SsvIXj+OSx8Fwg9FA6xTaocgGXAAUAqvOF5YwT7N+GN9hGO95DDxXK9wWQSYxT7iL0MNw883LgWYzzxsTcbI89y3Ds9x/1VipOzFItLKjwRo8x8FCnj4GfgZgidNS4evIsyueTVeTlMWwGArutxBiAWBYrTFMlpBm//SQ4AUqGV6GiKIs7gTQBv5IFR7j4v4AVQIjdAsUkwclx4WYFsvsK99+8go7XwPRS+y8ebbFYoFhfAZsUZgCVSOG4BN3AQxCHcKIRDyKpyuUuKUrhDiv2xMQCrkGG5ZfWQdtsFrHhPc8hzqtBfH7njI6Pcf7Ob8KJ9MDdCiQAsJ9acxw9GfpkhX53jqf0Irz99HS8+dQ1n53P80de+jvvv3MX5vXs43Iuw3SywTROk5CxGAcoowB4BgJwBKABAeRCXIcC1zyIZuo/IADT9CtN/Ff6T0NC1/zpgGv4iAYDCnzEZcvoMDgew7cIAHPbgZA4xjfhQO6UyJLUrP6T02+R+EofzLgCw4tq3Vv1xGIC1f6Aw8HSyhTg4dYYAq2HTmmS2GTb67JnG3QGrcmSL+ZPh8qQX5Psr2ZfOax0CLCxvs3/Ev6/CABQnP71PVwIAK0BlyH/kU7WbK9fxlNk/FSBrztT9Pk6X72rsj7pIkny98bktBLMFAJqzMfxvk5DTnGXE+HZL8dPM8EfFAJQtPi4DsHcEit5qe7jNucg2fhMA7I4oUnzy6mXquNRzoSqE9K3vVwCQ5KBrDT9JBuCjAYAywXENCijOlhp6QFuDDsw8J8lAKKuG6Os6RgiBIn7KgUhuzP4cgM0GrRmAHSGMvG/1T4VRV3kAG4Rb7Ze+HbT+VSpBfVq7wWyBHtVGMhwoU9P2ARV9iv2R9blMurxjA9TtbgbiAKvNuMFs3XAa726pZ8Ohrx0c5ZZOGjU+rTIHY++YhgEac33500oosOpAqPPB/169kzM9q3+om160czUGoDmMx5EBPpYdQmBU4ID/XXMauuZP0QmGk2a+z7zxMdtXTEM1ibxEgJhdDoAPCavtALeLoOsQilgzcbGhayflX9qghldomGEnKPx9P1I/ykTK7ecU5LbLfVOaVuVSrgGX7d4wgV3mbtj126WF9uhVfS0BwG79LBwHNYRPP6JK89I/w/rzZhoIEkDJIJc90E1WIzumQzPsuFWtfQYAQCvDz7aIxo29Gm5p6k7a0jzXXFUQgQA1tlyCbVPkKYF+AZCEcIsRlmcpgDH86AAZASqxi8Mnj7AuVsiQgLkZB/OeeekZXNs/wLvfegvb8yVGbogHb74DrBKAQnLDEv5T13DjC8/iweoUjCVwyhQuyzkbsfQClFQJ2CXAKaISv4AbAvDhMR/55RbFfIPycg0nzeDmKTwnx0//1Jfxt/+zn8SNa0CREq6WYW8WcIAq9oFNCjxYA//Lv/h/8J3vvsMBwPfeegP+eAT38ACjF19ANomRIAcx4kQIsEv1ZOFkLq8EnBUeDm6/iNyLUXoR72NBIf1FCd91MQ4dTMclwojBHzsIImITl0hyhmXGkCQu0pWDdFGi2LgoM8bBQ7A13HKJy4fvodxecAYg30WBB3cUcpn3CxdxFmBzf4PkZIPxrRcR7B8jPLqG1HdQxAxFkGN2fQIqQUwh0C4NnkK2sgx7UYzY8fHw/Q+xPLtEvsnhuD4HPD1iPlJOvXSL5OwhnGyL9fwhT2Toegz+KOAAoBcG7RBgaaAla8maQ1XYKrkfXfViaSC8UWp/kUFY+poul5UcIUrKGRnvo/AmKL0xZ/85DuWBDFGkOView8tWmDkrfPX15/CTrxxg4oqic//vr38dv/Yv/m/MT06Qbk4RjANEh0fIwghpGCI82Ee0P+VgaRmIEHFpcmTVXKG52vrfTEmggqWdvsUgi4iKjugpVExdaiax/7QBwKsdsGzKrf/z5tBayQdfimF73GW/hxmAqpfZ6yUIP0UN/60XqSEg1NumJQSNfJOY1zndpYlSLiBVyyykT/i2j+Oj1lFitbdVeypC6M2XGkkz2kW89N50MtjqORD2W/eNZFqASm8oOdTEuyShQHy3zx+Qr2gxnZTzqAQAd/IV5HqoVWir3w3Nf2v6LCKvM3IV2ah8rUafyJZ3P19RE7p+MPyvLh92oEhK57eNyewE5JT3dAKACqHBNn8fNQNQnR8ayvD5rR0C3J5CfQ31+ahkXNqSem81UVg22Wzmj/HUKk1RDpkKZlg7NHq0SzuaIfgdo1MPM0O67ZFUvT0HoK2Ij36W1jshtMnQ/AztrX57IEOAHwkAJCNW51fTNn0DjEjniB+U+RAMRaH1bXgQJpAin24AQHOC5L+lU6aEAHcCgM0hVfRSPi8Jq3yXSfWq/bd9gGyPkztkBojZDN+2gM3Y+hTN4xnXtpDUVfB23RCdDMTdAUAbR8gMuTOTzsukpqaDU8+XLUeV4TDow26vp+oodYbQqgw/erjtFdW/+rQBQBrrLjlw6lkw2JVirrpkuJm3xoUSE9ECAJUpkrq605GkL5cV+Mf/Wx1xuPz17Y6PCACsrZzCDa4ORhJeagyhKjP2Kt+Poxv5lCjOSKeJtAKI+uzVTIFKsXw2AUBlvTX9Yzgz1Riap3VZrW1Ir66rnldeZ+rbhnHU7IZGHJv3tQBAuXWG9OwPMgAohLd2b6SjxxjlUxMMQBUAzDIK+6UqFiECNsLlyRos8RGE+/DCMRBQddiQ59BjHoMTliiDApmX4cbxNaweXMLJS9y4fgwny3H3rXexIIZZXMI9GOHw6ZtYpSvk6YoDgDw3HWVWI/DPI9BLAIDMD4Eg4iCghwAeFeR4cIHyzgMgYxiPAkwiD4vLE/zyv/9z+KVf+hFE3hqH0wgs26IoGDZpDmc0w9ffuIt/+bvfxnJTYPPhHZy8/y5nvgVHBxg99ywHAFOfcQCQTxaFANM7cxflhqr+uth76nlkXgRQbkInBGOewDXdEFHgYTpx4UYlvKnHc8cRyzDNc6zTAlnCkK0Y8lUJtqJ6HDlmU8pRt4WDJc4fvAeHGIDpWryfgLlxyI+1AXMRZQHy0wzrkxWmT72EYO8GyvEestBHEZZgAUM0JVSr4MiWQ3+IS1gUmEYR3Ixh+fACq7MFkDD4NNdRAC8UAGCZbhHmGdxsg7OTOyjSBW8riAO+1m4UNDlAqz0qcwDWPtcuAKBySdDKAaiAg63zA78IqkAIXvXXQ1YGQDCGG+9x5l9aEoBMuf8iOI4PFz5QMLA0hZ8t8EO39/HzP3YL7nqOfHGO9fkGf/6Hf4pv/Obv4fLeHWTbU7gjH+7RMaJbTyKb7iE4OIA7Jll0wTzhr4q9JC4kGr+k7YfZAMCWNz1wwhXWjfz7fi/0LywAWANu1TmknqKrUK5sDEAb/NBI7McFAArwXJ61zAPs4wKAQ75lB6mkRSYxL1CHfVV5btXjEMXCNX6R9DEqILACoMS5QBzZxW2C+CPPiH2+chcA2Kzq1f1XLcfbYPjrrgc8/blPFgC0O0miKGK3/pG/rT+VTobyfJtRqchI6/JDWXuFDTo0kx8XACjl5nEBQJNl2p4PKY2NTDfybctBqAJ0VI1XAma6r9xnPeRyDWEfJj5grgXH0/vOQJboKfsO+RwArFa4OtxrG6Y6LHMHTGycXTakOumq6HFV0MkAbLksVRPSKA0DgE2IsuglHT9kJWBK5qyyACtTUJ+YBS6oime7KtLjA4DdaTq7hLPfDbOLsnyC+itHpG28Hr+lG0DaHQC0UYiFYW36r1bV5LNPIWTG7abW708IAGxsS+Mw2Gb90wAA+wC/IUOiKmKpT2sZqQdu7txKJ1gYgPJbZrsmMiC2Gk/IVf1XzHPT7w4zIRkcj7MxDAZTnfWCv04697oOaHRC5QQO+Ok2ANC2P8TmGDCRP/AAYIfcVestJbCZHf0A8DkA2NZQpjR9bAzAavvIrSnViAkAlqs1ioTy52UA8+AWEQIW4+LeAuVFBj++BteN4Y8mcOIYZRygCBw4kQOEwNGNPZ5a7+L+CbabNfHpcP36dYRehJtP3UQeZBgdjLFJt/jud/8c+WaJstiiLLecjVg6ARxHAICuH6GMYg4A+vGE/84vfeQXG6zeusMrFU9CD5PIx/z8BKNJjv/oP/kF/Mjrz2KPijdQ9bUwROYH+GC5wbfeeYCvf+suPrz3AGGygJuucPfNb8M52sOYA4ARipDyEMpKc5QDMICbu7wQyDYpsffkM8gI/KsAwILYgZmLyIkRhQHGkwBUi8KZ+rx6rB94yPIc2yRFlhTINgXYukR+SYw7YgASu5HAzxXOT96Dl85R5huwshAMwHHEj7WUAzDMPLCzlAOAk6deQrh3A3k0Qx6GfA3gMwR+AcdngC8AQDof06VC5PvI1htsL5fYXq44kBr4IbxRxAHA0ik4YDr1PPjZFqcfvovt4hSuXyIYVWAvPVdduNW+ZR0OW+1+8j97We5C2lWOsC0EWNW0ggku80dT1V8faenDi/bgxfso3TEYCJwlAJDkiEJ/HUoIiTJNEaQLfOHWDD/340/jz77xDXzrD/4Ae84E7OwcJ9/5Bh68/Wdw8jlKmrebtxA/9yKCJ2/D2T/kzL+CwD8tx7QEAJWs04b+HwIApTs7ZC5NQGO4Sr3I6an+/IVhAKo+qYljDPgDukbeBQC0NaYDWBLMkkdwuTymn133Q/UvOhiA3+8AYPsCVbWAjb/Q+KdGmOvHCAAOX+6KFTJXv1VEp+shRciu6hp/8gDg0CmqCqnu8XG78AYByTajbhEIDRBZnx8pG9V/64uj/j34WQYAq9NLDeBzUVEYqDq4Vs2bAm4LXTKsf1QGoAkAmmqxa6WHWu/VWUpDnwOA5qwaOQAPfuW/1+a4rrpZrU5TDVe4SQSKkQ8jWYDSeZKLUYNkEvSTACAPU2hAAQXSseEkNVNAvKM6+EswsOXcyQ2u9ky9wdGVpgzlk4aROIt8jFy4OwBAA+TUaQzS8WrGuStDpG8SrEk2H0GZD+1ZyhFXm0DtIN1JZtOrwGmDqDwgTYNKUWuMrA3gMA2UGfJthgC37N1OAOCQCOoqSHWSVQUkHQTVwe6i96rjqWV5iOZr8e+uasD7gD5bKHA9FoVFKwxGv+Q2Cr5Z976qRdKGS6PU7QibDEAq4qJBCMbXqsOdfmoxOjx0I2+6EE3VrDp1QCsERoebhhiuMpx4WPq6V7i+AewF/6SDaJeQusfG2nKxtIYAD7evTb3yqO3YIuekff2h6g4RAt60JZWz/I20Rtqu0882g/yV2gg23zEWyyRAt3VrNQJDzDSftWcydg2e6pvLrpXhzw4smdkW3192EeoU4VbIWz05lX3sZAA2xcMCypOyFABgmqYomQuXhfCLEIt7CxTnKQL/AIzKxkYjhHv7yIIAZegBxHaLHIQBZdEssF3OkeUUGlyKMNQgwo1nngILC+xf2+Mg0J0P3kWZrQG2RVGuOXjBCmKjBfCqIiAFFZ+IxggnM/j+CA7lAcw9LN65B2+dwmM5zwMYuAxn83t4/ku38It/7WdwY2+K6XSMZZLiLEnx9uk53vrgIVYLB5cnp3BXZ5j5Bd79xh8C+2OMn38W5f4YmV8iJwCQz50DjxhmOQFwHtLMweyJ28gpJJlClRGgSFyUOXETQ0RRhNEkhBt7wMTj/6Uw4DRPkVBOuSSvAEAGNs9RJgUmxKLklZC3OD95H3625AxAhhwIXLgTyoEIzkKMUhfJyRLZ/SWip15EtHcDzvgQmR+ChcR8KxFTcy6Bh45gAbqU6s9F4DpYXy6wuZgjna/g5A7ieCwAxtDnB4si2yIoUkw8hvn997G+fAiXGIAKAMhoA3I9VV3V1hEXlYwNAIAN+0HR2VpOier3yqZW9we9ljMAeVQMAYABmDeGF+6hdCcoKvDP9WK4ri9y/+UlyiwHiAGYrnBr7OC5m/u4+96b8NMEmzsnePDdb+H87T9GufgQZXopKvweP4Xg5S9i9sUfQj6ZgREASHuzAgClnhQloxqvsTQOtK0LQFVhDYb7VmrAeMZWpV4cKJtZawOAxhHbcChM/XrVHGimYmqHANuU266WqnmT1LGqt2s/5HQ98REBgCYYqVgzWg9pZ7rPBao/U3nr9a8q8HtoClusvKvNRNsGSnlq702VmSTeIhmA3faf75RWmL8ur3WEC5/DDn+SV6GVe4NrhIb9J8+qcsi18W3602YAiqJYYhfbKXymdNr2h3kc61u63t+b7rImNMbaNDOjLbqx4zX9YOt/e7z9DK/ae1e+pKVc4ilH1K51MKa1nquyoYaCqw/pPTT9107G4YCKMYuAmJVj7QzAIYevyWlZi6ihf5vl5addhXxR+dYWFp34fgOam/bgkY9m9Z4bdk/tNaOurt9VTW8rQrNLCPCQRtRSknQ+aLNf5pdUADCEc/Arf1ebAY0BVik9oSgrhlwF/kkQUB7om6OyZMFJBV3zZAT2bl+R3mESYCJCHIYqx1aC2jq1iDwvfAtXnVVDOMXvxXYTACAxAeXmqb7QCskyjYUMqRRjl8fPQYaOMlrTAAvXUoxHLpK53F0hlbuY2D4QsJ6jagCqcJhbRVSBk/Pd99aWytaNAffwrnAi7XtNs0SK8Ryeia6t31aoomGpqLQbkg77rBbZoPZFhb7mx1R4Zkiz2ePB7U3RRxb91Ud+4PmYdvyppbwnhH7HZgaYalULpndSN6waHj3EArJKbqdAKw5Jp6UZysnTaDRV4es3eqJ9+l3fMthm2UZhN7+v6i/qly2E22be6s97cdC2jlOlWeyH/lG2dJplQvT9J3unenB6f/gnvXKj8s7bUroTAM+Nn7F/FXGtjmiqpDb6x/BN69Eo/R1ef133X0k3KA8PycBQESm+so8FALYWR+T4q+ZU1fyNHMrcMEQgYyhXSxSbLfIkA5HQHBYiKmPk5zku7l3CLwKUTgRnPEOwT+CTjyJw4dAfCsqkeNic2IMZZ7HlOVHXAvgxhQ17yKncLw8Z9jDbHyFNL1GwFVi54kBhkRDLK4RPOfbCGFkQwolHcKMx/GCC0JvCy4ByvgaWG3hYw5BAAAAgAElEQVRZjjJNkKyXSJ0t/EMP125fx7Mvv4Djp27hMklwvt7ibLWBiwDJ2Rrbh6e4fPcNBNkS27tvAbMIo+efRXDtAFuv4H1kPOk8BVwGcAqqwktAnofx9dso/REHoOizbFWI0GQvFGvnlogmEcJpCJ+DgVShNkde5siSDPmmhJM4YPMU6WLNmXkulRNxU1w8uIOIJciTBfIyAwLAm0bcpxUAoIfi4QrbkyW8o1uYHT0FFkxRhmOUlCvR9+CHxFKjCsIOHN+B75EPV8IrGdaXl7j48AFcYsTlDKPZDGwUV5WPHZ480c1WCPI10ssH2M5P4XkF/IiYiFSUxUdJhHBF1kXJJCXaZCBJ7HCFVtmosXuMvSvflhMA6ATwokOUzhisHIMR9TKI4LoBPPofc5Ctt4hcj4cA54tLFIszPHt8gKnLkD28hwd//ic4f+ubKE7fgpOcogSxL0tgfIzxl7+Cgx//CpajGDm/iK/0A2Grrki1I1M2NOZdctb7ADw9iW6nmTT9F03b2SycPn8qI5D72oP2Q79Q7/MzHt321tBXM6KWwzRk/yRI090zzXe2TVNXE/yco4Sx1odtxa8ZcL7E+UX3TWTEumrR9K7pjoD+mboeYnR1jsKO8cknVAMtQjav9tNu2hi/NKIa2FhZFwsA2VlErQVqyPNXf9/rPvIolcbumTmcbf6SrnWq910halw9n3T1tjWXCgKpebw10N+00oR6S+DITOmjhnhKv7B5Y5dHLVI4NZKipgURc6G+3/xNdf4ZZACqKRGq2W1uz61VbHV5VcPOu2a37a8+yraXMsBtC0+JItqVvu7VdtCAb84bNfRz9bj8rfhnk/OvBsS1EK2hfaEWyVJzPFaXB3S32aMOxHj7z1bNLutv4HHmX0zP0Gw/fgiwDcClC76hH5s+7YofFTkAHYR0mX34n+sAoHT4axWrMlzIJ9MAQAKAxI2HmOhqsVXWiKK8ZGc0ENC2Qo0O5MCfqNprEnnVKZLCqk5ctYE6hEm+XoyXQD+3Bv+kWlI3gw49tp0DmYOlVlW2E76xupotk0UiBg7YNgCgT3i6uqUqGD4yQxm026L1sFVjbc+RtlpWht7VnAXVZFgVZYdh7QYAmyppJgBoGqwuBqBqn8x5t63f4PaoAcB+FdqHz9oYf+asS3kwjZDtwHD11au+0UKOlOIfqkEiALDxvozXqQZ5l5wxquntnlNZ0EiyR4ZDeIdHXztEA4Jq9kLdl9S6TX6Gd5+c6/4riurKpGcgFIJhGaPx+UBEsnA1hg5ghrC13S1TmXb1remQTBB+FRWtroc4YugWQbcnOjhZr4XyUHVM6ZxEJeNk7yTz7/esQRcD2WxoUA/wxm0Gun/9u+yH1J/y8k2dr/qmuDp8EADIVkuwzQYFAYA56eEAYRmjOM9wee8STkJ2KuS558KDIxQx5UbzeNEJHnGa5XCKDCVLUbAcecHghRG8SABNbhxgvbwAIg/T61PkWCFnS5TlGg4rkK8JUAvhUQ7AMEYRx2D0/XgCP5zALWM4OeBSoZLlGmy9hVPkyNMtMreAsx9g9uQ1jK9fQ8EruEYgsAhUSZc5cJcpD/lcvPsmnMVDbD/4DjANMHrhOcQ3jrB2C84AFGHAZLB8uMwXlYBZgNHRUyj9MfdbHOah3FAmOh8u5Sp0HCRZAj/2BQg4CeHPQgEAOjno7FWsS2Bbgi0SDgAGBCSWBXyvwMWDu4iRItsukCPlIb3uLK4AQI8zALOTBbLzLaLDW4hnx7zoBYIREMZwAkIMgdIr+R8CI0NiETpMAIAXl1g/vIBL1Z7zHOODfQ4AIoo4oCkAwCX8fIXs8gGS+SlnABIA6NUAIOfHCd3BE0QY+3HQPxE5tqx+wvAVJQficoeqNYcIoiMO/pXlCBR7zQvHlC6cnIqfFPAKqhRNIcAZ2HYDtl5i4hTw13M4lx8iv/cmFu9/C+XlO3CycxROgpw20vQWDn/spzH90R/HPI6ROlT9twGHXK8BAImVKAHAugCe5CVpg23899ryWViAXT7g8BHOOGAqIcECALTZyGELZlu7Ie0liAT6E3qEQn0K6u2kzZ4N+qM21foRAIB6ji+bva6skTKp7S42cyLtX/8GUtIvVTNoY3hpZwPl7NdeAGVtWgCgtKoDqYjq801fnr2dPKcOh6OZsS7/4irjl42bPvfQjumqMtxFeGna0OdI9Sda4asVFqD6FeaFbaON5YLrHo7mr5AOU/SBSsgR326vgenTDIV4ipUwCEOqwuDnv+FN2J0Tr0/rtD1S2xYfWkv6rgkA7qJvhjWq/mmbBNXMvLSpNehXg+nqmlrO9xITqpREwwCvZp4b775Zqji3jziJQ77xrnP02QAA+yfATLHR8u8NBj59ztPs7AoAqjmmeNivSzedTQhwgwhX7D6SqMGwMXPLDXgcUvMpzgsHnAaTo5s0VbEppaOnNMnbEVXcpKoRZUuk09RmDJo3hm3h/34BAOWgtQNYB8NLdWC6nL/PIgA46HRpHkYb+Pg4AMAhZWMDcAZ13yMAgC3G6I4HfNXwaka4faW8q27d4TlpUKXBacIr6nAPDiBzU2m0ZxrjzwHA3gkfvGEeMvC2A0UbnLI5MHYAsBmFWGFbjlRVLvQQ4ccFAOntfVXeNTtTdflzALC5Ud0FAPQovGqzRrHZIN+mKHNiAAaIQAzADPO752CrnFfkxWQf3v4RvOkMzPcBXxS8KDYJHGIBsgSsyAV4FVIBiRheRCw1F5v1HBj5iA5GcIIUWQ0A5mAEAFLePQqzDSKwKOZ5AIkBGMQTXnTDKagqLkO6XCM5P69Wm/GKtv7xHqY3ryE+2EdCmFbgi9BNOphkJWLmwLtcYPn2G2AP72LzvW8CUx/xi88iunkNiQdkHhUjodAwAQASw4/yABbEhjy4xQFAAhSdwkU6TwUA6PpwPBHuS/n3qHJuOI0Q7Y3AvBKFWwjwPnHgVABgttzAZawCABkuHtzD2CUwc4WUbUVOvwNit5W8EnGYuNjeuwRb5hgdPgF/dIDCG4N5xHwjhh5V6VUBQGIzMHgOsSoFAFgs13CKEqwoMNrfB6ZjAQDSF1kGRwUAF2fwgxIBhXdTqDJVwHUJCKs0Aa2tVgSDplmvUqvrwN0AQGmD+X+NsHWREodYlQQARgiJAUjgHxvBIeaoS8VfSuTbhLP/wtLhVa2LNINXFJgRKLy6RH5+D+XFHbCHb2Nz/ztwVu/BZQueCzF3AuDgKVz/ia9i/PqP4DIIawCQ7CAvXEKpDjkDUIQlNwBgYxnbB6LPAcDHBwBNv6MbMuuzvYP28HMAsLLwXbP3FwcA7D2DdfhtHwkAWL+wSXlTs0mrCxMpt4KQI9eHABs956cZlv1pAYCyh1KHS8GyXSD0F8VoxmzaFOOIucM5p/uRPgDQ1uehF5ra6XMAcHh5fhABQDkmKwNQ6AF5zKpAP89pAMAqbFag7FJrNJRPO3DbRsz15WiQZimoUuHo9wrK9q5RagntVaMwwn/F0VGAlk0InwQAm7sH8wZV3MJX79O0iWhPL9vcATpY1MEnxQCsZ6wqYieHxc3qzpTzzyYDsE81m1Mvx6op7J6ckvW6qElSjQMBlyn1+wqg2rfsNgBQymmvA2m5QTEJEG0AsI/BqZsZFQzXIBULBcyqA3a2ZmJ36bdR9KuuA16jVwQQ06dnzCpxqpvQ3XN5K/pZYQDSevbfnwnpGZ7iJpyjW8Y+HgBQU6HKiwcBQOm1Vc/LFA36+LQrDQUYrp5S6HLirw27t98Naz5pOVBGlXfVNnTdLmvAYH2R1b1CP9AMwE7mor5PfcoBuCYAcIt8u+UAIBUCiTFCfp5ifu8c5eUGoLx4k31g7xDRwTUwzjxzQayobJ0ARQYUW1AMMZcvKiwxGsGhcNfAwzrZUNlchPsR3KhAVq4qBmCOYp3x8E3XjVBSnr3RCODhw8QCHIviGxTGwhleOZLFEm5ADDyPg1TTJ66BxZSjkHIT+rxwQ84oDwvjVYmDzEG03iJ95x3gwV3Mv/n7wNRD/OJthE9cQxb4yAgLIwCQUpQQA7D04BUeijJEsPcEnHDCC0wQALg+uRQsQV692ENR5PBGVJnWhRf7GB9MUVAhWpfAOA9B6fMKvGyeIF9uwPIcPsFvLsP84T2MPSYAwHILEPi2P6oBwCBxsL03R7kqMDq8CTea8Rx4VDmZ5opCgEXhDyrpTLqaIdmu6xDg7PISbumgzAuURYl4fw/u3lQBAFMgXcIvNoIBuDyDT0VANACQ5qUBAFtVcFsMQHUH7wYANr6iet3Nl71m/xFIR9V+g/AQYDEhvfBLKlgToNhk2C7XyDcJ/KJEulhxWaGw3ZHnICCG49kHSE7eRnn+PeRnbwGbDzCdeUiISeqEwPVncfyVr2L02uu48Hyk1SU8r8NLOqjSQwIAbFLRqD6OCWBy3WeECFyFDS20YrcnLj5r2w6dsfCDwABUxzg0F23rUn+z14A/fgjwR80AbFhh8lw4dFj4KBiApn+j2gg1J5/qFMh16MihqHhLnSkANF+x33MyvQzdQxCfNv5Fs8A2xo7leKh9LCLW9G90AYDa+cZ8gRIirV10yP1L/n31gcyXqEU0Sf+zOv/vAgA2XTCqwkoXrX7AOINU6qZ9/jAnQV2NhuHY3p129rcNAGr03C7e41VWt6I1GCHA/Bwm1+NqzSnV4ZX5MS60zLYrSe4JA+7W8bq8dYUAc2hTiNVAFWeBPonUbY/yI/CdR/mmIqGfiRDg/gmw6RMRbWvso2pMvufDOfqVv6d9qlZZFR/oX6YbVzUMWN6wii7KlzU3B/bpH1qhZstqjIE+BqBBUa2izJvcf4YCEa1LxqL4UHWY6lFIUGcHYWpVSbJIoC0GfDDfoX1yrU/I98tx1+ZVkbn+Iezi8OgCaFbxtXbwMR+wLpk1F15/GEE9+r6X8AceUXvtPO5hB9z2+u4qfo2TJQGLIfkY6qpNAe80Oy3qebUmgxT+yrgPVOqSCYHbfdjlUCPk+nFDgAcBYEPPqQcG+ffh+auTLvQsUTsJcPvBtgFR3at++r54ivdPipNyVlDDUoZF3Txg1a125EQxZ0M9LLRtGT09DMAPhxBJm9cHscpU/Kp60HLqycIF/avTylHTVeXvsxwCbCb9153DLgetmS2PA4DbigG4BYoSZeFi4k/grkvc//PvAStKwBcAo31gdojg4DqcKIIbhNy3pD3OcmJcrcDyhBeg4GnWPQ/haMR9AwJZEAcI90eI9wMUDlUA3qAsUs7cInCKA2phDH82QxmOOAAIygU4mSAII7A0R+gSO4/Cex3E4xGC2RhF5CL1GTKHoeBhm0TWoz7lKDY5vMRH8uEp2AcfIDi9j8U3vwawFcY/9Dz2nr+NOWPIXGKZiZBPfsXIAUCfA4De3jG8cCoYf7mD1QcPgcKDG8Tw/IADkfTdglChwMXhE9c5MJmVhWBDEty3zlAsEpSbjFcqpvnynAKr+SkCzpzcCACQCJMzygEoGIAcALy/QLmkvIpT+ON9+CMqgBFwBh/1l8bKY7ErANChecgSnpexWK+Jq8jnjhUM4WyK4GAfJTEzXQ8lAbfZCtnyDPnilP+9AQADDtpSyi15kOfgF7HhlBzRumk2AK9WAQB9I5JsiCIJDfOPplFqGQIAC2KZOj5yRHD8KTxvj4N/VIjFTV3sexNszpe4vP+Ayy+SnFJOwocDH5QLMQc2F8jP30Nx/i6S+9+Gmz+AWzzkckCh7BkxAG8+h+d+4a8ju/U05n7IQWHqn7jAJjdDXD3zEGhj/OocmFWOd7K/QwpaARA6bYehnCikTbUf1hQSHSCi+h6bf2eOT9f3XUUizNZN+6e8sbZnioGz+m1Nj1R73vm1j4EBaNpr3Z5Ufo8+xLprnfZucAHaAKA5ziGApSn4WM2ZcZHbVSVXpqTi7zFDvGskoWmPV3qvO1X9rQp17UuM0ufT6H6R9H3aYeZWEdnxAdFb3fuwhRi3/IeO/dshodW5uAmXlnMm95OYk44ibPIAUY1JT6GkA4B8NJ3ypPeoEcg2gKft964UWlrOgWoHPoYS1PXZjgunacD+78g5VXMA1gBdpXtIejX/0ti7JkFAnV9qn3LIyeHLM57qKYvPpF6Q5yL1fDR0PqhY6YoOV3O+tkO+W9ph5xQdXbPIe2kzEJYlawHqmsFqj90E5Mz3t/bf4AFdFPmynbH6h1AVvOsAALlckM9w9F8YAKByY6oJVsUGJGeLnNiCbqXpzVUHGwUgJ+UxZ74WPCGAXQCgHLg+yY2Q1sdzaahbl1VNUtu6DeMZW44Ac3FaSey/DwBAufHr47JJcjQP8ppLYNOe+ib5pAHAof1NPaP1soVh9G3AWg32ibrwzK9uFaSxlLp3cBCqMm4r0BYDUH2EH5hE3cD2j1i3rtDf3Rmi7Zkzt8NOs9MFAFb6YUjLNPmd+heoG2CXverqnarfPhkAUFuyHVilzfNDsiGe6kyCrQnDkIG3t9/lLGs+oTXnlPp+fV1kO/rqqu6MHEit2bSR0ZO7AYB9Umpbf5mAv/m+aR+aFP19O1Cf4x8kALBWb/LcZUwBhTKW6wTFdoN8swEodxpzKgCQ4eStO8DZCshdYHIA9+gGRoc3UBI45/mcaZduEq6EPGQc1GIE6uUZZ+n5YQTX87DNUs7Q8yYBptcnPO9aUW7BWMLBKppzAgAJ9IsOD+ES8y8cwZtMsHfrFtwgQLLY8Aqv6Tbl1jKII/jTGGsnQ+6XPOyWwKow8jkI6VCBkW2B7WWOcJ3DPztD/u7bOPuD3wE2pwheeQr7LzyNbRAiIdCyAwDMywDe7Dq8eAbP8eEVLhbvPwAyB44XwnN9+D4x8Qgoc5C7JWbXD+FT+CyxA7lj6CJbpSiXCZy0QJGkFQDIsJ4/xMgvULItUpagjAB/SsCqAAB9ygF4ukYxT4FwgnB8ADcYo3C8Kp8y9UP8IQDQcSk0VQCAZZ6CpRlFFaOgwil0EIkjjK5fA6KQ5zQsWQ6WLJGvz5Evz4CUAEDGGYDuiABZCQAq4a9Kihiu3zpzvFX7sQcAVPWTBLCb8FoVAKQ5JQCQqv9O4LpTAGOUuc9lMshcxImH9GKNxdkFnCoHoFcwOKyER8m48w2wOUd+/g6Ki3eRnb0NtziFi0s4TsJZrInrA899Ac/+7C8guf4kFn7ARZ7W1Hclg1kwpQiAbgoPtPVWK2eXtcq7zX0Z9j/a7AMDADQiBs232S7YbKcMcwY+GgCwUVi29+vjMXS5kti/2wX76BmAjwsAdjFKWn2vJr3rAqzloQ4gwJ0pOmpwThZFqFiAlT+o5nBs5XjsBADV7wuN0aS96l7dLp+ma/3Ecx8nACgmWtVxjwIA9sWQqOxR4fPLyreKh1kxAJvzfzWH1XrUt7TVV/T+EflmSAFIQerxvzou91tPGgzHFkBjiY+xab9BALArx7w6PRZop55T2cd6XzVResKG6x6/+rjp3z4+ACi9NnWm+7Wg8G8bH/5zANBYr08RAOQreTgAALYEi35RAX8cAJQMHH4TKSW7WuxK0uwG0gYBiM9NALA+PLRQXmlkhejRLbQKbHXlCpMKnf4rw0lsG1983mbYfD8BgCoA1gX+yTmoj92txbQDAGYYyOcA4G6SVfkOlYEf+s6wA25EJEuzLBokez4EACoJ0lVq+FUAwC4dYhoh64woAGDj7Nj0hjSSQxpoqKK4DjY1ffz0AMA6DFtVfoMK1r4/v78AQHXgfaEQct3ExLT0seEsDUuRZAD2PaXKQpcUN7ao1qWawW+CfLu+LVo3Do3GgYl/2iMDu+zTj7sIyBADULMvHUAwsa3YhhiAFAK8BvICruMjLAMEqYvL9x8gufMQSEtgdoT45m140wOUfgzmeEiouiwdwDwHEYWOugWW83OUeQbH9zhzz6d8agVD7jtA5ODg1hFyKryALYqSgMAUdGjgOQD9UACA4ym80QTBdA/B/j6CcITV2RwpgWgMYMQYpAq4kxiJXxIhjFfB9QKqvOYjIvCRsiVlJRaXCfyUYbxao3j/e7j/e/8W7OH78J8/5gBgOplh2wUAMg85IwDwmAOAvhfAzYAFMQC3FJPs8w0SBxEc1+PhuMx34Y9jjPam8KIAFFFNf5LVFi6FOhfQAMDV5UOM/QKMEQMwQRk6CPZEFWA3c+ClLvKzLbIKAIwn+2A8gJhYh8LyE8DKTYwEACmUuchRJFteDINqgxQZFWkBL94yuXmMMqwYgAQASgYgAYD5GoFHACBVAfY5A7DO/1ftg5qRUqF4lRaot5fGEOoDANWDVhVCI/YZ5S5sWM3kW2Ye5f8jpuU+HGeCsojBMkrcCISZC+cyR7lMsTq7gEcFVrICbl6AUXGaPEFQbuBsTpGfvYP84j0Uiw8QOAs4zhKOk8JxGTZ+hOi1L+PJn/wZrPdvYOl1AYCC7doAgN32yzxvtEOI7B67rquG/Q8bAChZ+N0+gNSP3X2i39r0i6m5P30A0PAkhg6An0EGoA0A1C/Th663Khf0EwUAdf+BTKvOAJRO8bBdvxoAKPblR/fTtCV1m7o7bIzaLgagDQCs/YgOfSkZZo8KALb1jzlXtrkzdYMBsGgMR8E4vOobhtZuCADsDqcdZqW1+9aAZ5V0iqObZADSJWn1pS5fkHjhfTPI8Y4rMQDV/SP1/rC9+BwA1KXns8AA1M7kBxoAKEMk2ia+dtYpHIXnPhFCKB09IWSG4rRWWLMfUOv3KgcEE0DQD0CU+69xfgQAWPXOoJBrEyG7r9ww7aK0zQOaPYeVMbetENRmu8ocEv2rYc/w1brxMwZVFVXWQFJzS9ez2QkAGka1NWmGQjbGa3M3bep/lzXqe0YCoP1tdDvRnXLT0QgP0VEA6EfxA2zzY8vBI+SxaUWfT5kEvOl8w4TVqeXi9q/a4TvniGxPimmkxAFgl1UUukIYO1teO0Pp9jRfl/TppYCa66+Df83da/8AbPK7Swhwbfg75t/WvpmE2ZyK9oXHsEPVvaLdEywdZdnH6kxeWQnaHB21WzRhMENKut/TJ918fQYOWGZJp87WB+nBEn3rW/82gNjFAByW/v4QH8VSDDYxtL1a86MIlF0/NiBsr44lB3WH7S1lRbUmxABkm4Sz//ItheQW8CnMtvAQFj5W986x+d5dYJ0De9dx8PTz2IKqAEdIad3yEvHxTZ6lxCszBE6O85M7vLos5ccLqRBIEIMRy8phKN0CB08fI3cyZNiCOSkYqHpwIRiAfgRnMkUw24c/2YM/24c3niCKRlg+uOChnpETguWiypo3ipAF4MAZ5d/zQpeDkXEUIKAw4ALYbAokl0vEmy1G5w9x/rXfwfqD7yJ4+hDXXnoG69EYW58KTJCjL3IU8xBgJoqAeNPr8OM9uF4INwcW758Am4JXniXnLKA+ex5KT4CA/ihCNJ1whiKFl6asQLLZwkkYHAKlGOPsPA+MhwDHXo6CcvAhFeOYhdyfIgagmzhglxmyRQYnHCMe7SGnm+FKTxclg0d5AAlc5SHAJWcXEmutTFMgF3nwsmQrQOzAx/j4Oq+UzFwfjOUoOQBIDMDTCgAs4cdUBKQKAa58TGlXdgMAK4GUrBZDPrXLrhoArMAoDQB0kVM/3TEcbx9OOUGR+ShTB37uIEgdZA/XYMuU54YcBSGw3cLJUhRJgjJbYhpkwOYhsvP3kV7eQb68Dx9LOO4KcFKUDkMSxpj+2E/j6Ed+AuvJIdZ+iJJYnTy9orBJMpUHD0GvDr1iKxsW3zAYLUYO/4qyY62bd8iHl19uGmkzmIft/zADkHIIdtgrxeCY9rGVM9fK0NIP4OLWVAhMMzrrJDUC15I1tYfm4kjwSLWgxhlL64nReKd86+9rMcYUe9fyfquUFfrom/ZMwEM8N+yhdKSoqgfRJb/qrIvmdQafCvALm9LPwOMzaYT0NReiFp9Oflz5o92+gz1+bAfTaMyhMt8d82urqt0dAtzfCy1PYoc8qftJ9MyYN8N/as13JQDSrzcZg7JnVj/X2JHN9/RvaoCjNfrEJr32CwjT+5F2qm/G2+M09U+1+xQAUI3h1XZ3nQu2eZvZPgGA6k83aGloApNJ2zMYKQ+qDhfvMz3X7r3WnBd21a/tjtjDjId3oLlfdHvTTnVn5rhVzIWQUPMC3xYh+JghwKKKdP+Pc/hf/n1tdttVXZWPlfCzGvzT7LcqrLss2pDzIDutt1OLYvVrfUMRoCHCTxpVJByl2lgPzIaZ4FYaut4zoJRQVaCNBbWYv2qQmjVpGc1mBvSNyI8DBsCjL3XLhJvR4BWgIt7QNUeSUr+bAjYErZ6fbgG0na3l/D/Su6tXDudYpIf01tvPmwbElMfuIhrq2BpF1qGgHmdwvLmr76E+cyAcJnVGyILQ+Cr5UCqA7bK7u1Zd7tfaubPISK0F6nlqWLe2Puwytf0ApOyhGg+vOt/i7UP6u737ho1Nzy7Rfs17oHbJZkB44ZTuH30N5IZRx1jl6H2EbquyJOehtg4VKN52j0s4/ILAdHr6V1r7pOXd2DpuL2J0Nai5R+IHDAjfXkM/xtDbOZvaYY6yuS75N2dSzHfzY9tT2rO7bLDqC7u0a9p2AQAS+2+DNNlyAJAX5GAu/DJAOU8x/867wKbkLLjx/jE2RYDCF5V6CbCb3LiJgrCnPINfbDH/8G2gzBBFEaLxFInjgwUecgrRdTJExzPMjmZYbOec/cdBGJ4vj0CsCO54Bn92CGd6CH+2h+hgBt/xsbz3EOsHc8TMQ5kR8OwiiEOUsceZam7kw4no7wTEAa5PRUo8pEkJLyuBizmC0xOs//QPsXzzT4Anxrj+8jNIZ1NseeVg2vf0fx4H99zSBWMBwskx/GiPhycTA3D1wQnYMuGVgh3H53kLC4eYckJOosmIsxMJFPSJnUc6ncKRiS1Z5IhcB5dnJ5hS1WCXYbucI8vWyJ0c7tgDJgHvBwGA2ADZWQKXRfDDMeXiT50AACAASURBVAI/5vVWaPsSaEoJ4SlM1w1clBQGTLkIs4RXAKb8jiDn1C2xWcx59V4/DOHvTVFQaDatTZYiRI58dYFieYaSCoIEJXweAhzCoXaVS12Sn9p/lf6hbYPRnHbIce0L1QiFqZNomMR2pIrFE8C7xiv/sg3gZQ6CpOTAX75MUKwovDqHl2eIihxOtkGyOMd2cR+Ru4ZfXCJgS7jZEuuLE3hYY7P9EG7AODidj6a4+fP/Htzbz2NL88KL3IjUHbU15LkPZS5AYSC6uB+mf7NLlcvhbW7zP4Z3vi2JuXA9+troePdA/ra2f2P4Tx0H5rbq1vvSpBmx2Zpurdy2gYY/2uqAFGzdTvf5DsMhoVRUiNqp3tkBiHQfoFtWpMZt1E9sOp/k0wQEzHF0X5A2c6AXOZHr2bRiMkytRR0qQLHLLa3nQiuc0C//DfupXzZsczTs39tyPIv3amvSSRHs2+G6jHUDvLr6FHtMvrHdrvkbYmDyr9Q+bfd3ds/l1jWjze/0HIQSIO73gHhaw55Fsp1fxdeaL3edB0wGYXv0ut0xz5WanHbURuiMtupfnoHLWrP3Sl61avrMvot/G3rKLBLN1789wWJcTQv9VqAfxZVjH7JfNrky11jTHx3pM9r6xfCv1f3XYW/ammLY+tpk0MaucQ7/KwUApLkkh0kTEMPgSYe+kw3Uv1v6Fd2QA9F2usxDgjY9JR3oqvwz0hbQTbiaN0uGLbdUoxiYeePYlWhWW6TqtrU27x0AoGUJlQ2gz0X36PXW6PzWf0it2qsmv1OBG4zHlmm3OdA2v8eYn5aqHbgAlmtxhXNmqzc7AYDqraelKIh5Y6KFFClvbynqzkHQQdE2gbbPbQ647fv659JJlr8lB0yMRa+YqIJQu76B91T6bvzv9hAR2bYuuw0T0EYverTZaYybOR96fhgbw8x+g2ifu0YL8L81vjpv3FZEyMYA1PPkVO+qdAL9y3aj3Nd/c61VV4CEXrypMvD1HpDzWTkF9Hubh9zaP4Z3M/h9CQD2bUK1l/aV6n5i2L5ZAWTDv1EdjKZ3/UpEfXvbnpC913ttOpRDEtx3IKhtoTEhuy6l1BEcANxukG0kAMh4GCUlIPacEOU8QfrOCZwlMfRijCZHWCbEuJugjEZgYYTZrSfhRzGKbYLt/BTp5T1eEZiYZ34cI6EFiAM4sxhlsUV4fQ+Tgyk2+RZpvoHn52AsqwFAbzyDNzviIcfebA/x3hiRF2DxwX0s754iphK7KTEAXQQjYiM6KEMPHlUCDgmcdFD6DpygAuGcAF7GgOUawekDrL71h1i88cfAoYeDl59Gee0Q28ATOZcrAJAYgLRvGfMRjY7hcQAwhpuVmL97B+46R0AVO9wQ7miCwqWoCLGVgiDg/yXgN/B9Hg5NPg7BdfT/RUZsyyVefeU5LM5OcX5ygixLwNwc/iwEiz2UrssLjrA1EOURnJwCmonq6FG5YjAKcS0Kzl4rvZIDdZSHkPeAKjGzAh4PPWJgyFHkKW4eHuLo2jV887vfBUYjBAdHSIsCMaXTW12iWJ6iTFdw/QJ+JCos83aVCwOSdQ4AXsGecwM8YIPJ3svql9J4CTkm8ITmMkaJGRyHAMAxGOVzTAF/UyCfb5CvUrjECE1zlJsVoiLj+Qyz9Tnc/BJl+hDILoBszhmBB+MYLraYL97HJl9yNmR5dBNP/uwvoLjxJLbxCJnvi7Burh+bIiC8V9WGbi62dBjQDgDqHpr9AkSynB9BPxLY0nMA3K01k2Ft5m9raxzdngvtqC6/kB/xdpt+Ez6RtGy79Lg+vdQPa/q2fqkukG3xVA/Vw1p1GGAlGdZtrPou1Ya3R6fbWdMfbNuRrvmhELLheev1bwaA3g6Ptplv5QBuAgRqjrvOg3VVYdvYUcYA5AxWWsJCcRxePZv3Orz3uuTXliOw7Q0oPew5q6mSYNsOpj8iGVVSfsx5r1N/2ZyHTjFq4xGt8xsHB/Q1k3qen08om0aPiEoZ7++avrnau59CcPUN0L/XdZ2k+9NVB3cBADXwWmD/u09txwiU832PdtMv9FsAIF3PdmgXDRDus0ID6GzV5BDAJ2X1KutrFrERKRGan24AsHmDyUBtE+52sSPK+wZ8l11acg5UALCVM2m4iVrp150QAl9PSfV7+e9uQRs+IHUi6D0SK8jedDNaCQx3kAwAUGNMNVWNBhUfv07teennAKBdSHpUqE2Bfg4A7rSFrWEWu7TS455xgIlvo+oIqTp69tsH3bhIh7JxLMXe38UAme+V4JEthNjmQvXPjcKiUDuoOZ6fHADINauiT+XfH6+IhQBhG4e2clg+IgCwRX+nya4vY8TB26hBVgHiqr4dvCGwIoTdVa5Vi727/Xm0fTTc/tB9Q5eD8pECgI6U30bA9T3dvuXVnB3DvpvzY/omqgzLZ81DmGpmCbZiW8EATBIKAWac+UYgEwGAuEzB7pyjOCcqGoX07mG1LoBgDEQTqrgB//p1+OMxirxAtrxAFDAUyQqMmFiBi4JYfzev4caLT/NKuQ8fniAaR7zIwiZZIIgZGEs7AUBiAMbTCJMgxOW793D5vTvwiQFIAGAFMFI7FNrqRRGckPhslA/PgxP4cF2Pg4cBK+FutgguT5G8+U2cvvEnQLjF6OXbiG7fxDb0eH9MALBkVMjkCH60XwGADIu334ezyRF5I3jEhAwjzgBUZYmYlKKwiUB/CeAqyG3yGFyPPtviZ37mK0iWS/y7f/u7nHkJvxD5/0YEurm80Aix3aJyhFl8wNlw61WCNCHwj4q1MLCy4GG/PASYCp8QtlIWPGyV/wEDkdnSZI2//JWfQJok+J3f/C1guofR8Q0UjoMwcJAsGwAQTgYv9uCNQzi+C8+n2GIJyUkAsJFEk+Ha2sO7AoCU3LE+ytBsknQGYOUIwAyucwiHxShWKQcAsUixfjhH7IQc4KU8lmy1gLtdothcgG0v4LMliu19sOQURUIg4BIHkzF8L8Nq8yFSCj8PY0xeeAXXv/KzSA6uY+0HHACUa1cfuqqbBK0IQqVsVcDiswYA2o6fVt9AUyp2AFBdf8kOU/WUOn/1eg8esqw9NEROb0wDysRm3MGf0+30kF0aBABr1EXZL0pjjZ/W9YZ+AFBdEql3uvv4UQCAV7PK2gGeD0H1QPQ0N62WOQA4VNSjbfGEPdOBoLpdK/hik4VPGACs/DfZf/NcX/d2YEuoI6LHPlsAoFwrMULBULUBgEMpTh4fABwiINWtS7H72AFAQwCqWZIz1M24M6TkswYA7qA+VHH+HADULahRhFpsoBY7SGXgtT2wAYOnC0/t7PQqGAeuBABrXSxuvxtVbxjgTmDPVNjS4Bqdb1nvNiOnz3dofq++S1f4bbNRz0A9IgIAPmcA9u/iT4MB2Hnz1ikInxUGYNdRXcwply8SRCXXylVAQA07qxiAjwMAmkzAjw8AlOEBhpf2aQGARvoFKfGtnEbaVjAZEu198nEDgK3uSHeYi5wqd0Lb8XOsdmoYQJnq5/oMgsxxOXCCG8wRZL9htPsPbSdd1f1WAFD3SVs5RHhYaN8ddUd0hMzl2ciPPoI2qP//s/emS5Yk15nYF/td8+ZaW1dX7wvQINCkAIIYkkMMKeMP/qCNSabnGJmeZeYhJP0UTWaUmWSURA4pUuI2JIBGd3XXXpV73v3GLjvu4RHuHhEeN6u60QDZ16y7MvPG4svxc45//p1zpLHT7F0XQ6ZJqzSd8De5lUz3EAMw3CBmIcACALQkBmCE+PEF0rMlCwO23SEyKwD8EQvVzb0e0OsBns+q/jqOhX5gI1zPEG9WLOcfFf64/c49BgDO1ws8ffgADoXp9jwsVpfwB1RsI2S591gIcH/EGID5aB/+eIze0Mek18flg6e4/PkXsFIbeZwyJhYxDGMaBM+D61O+wQAJbSgclwGAxEKkPgY0f2EEd3EB68UXOPns74H0Cu57dzF6+3WEgYuYqgCzcH5i//FKrwQAOt4e/N4EoKq/cY4ptWGTou8NWXGSkCJtCwCQVBcV3CBab5oQFMlniBiJuU/9oz9F6I99fOujd3D85Cme//wJB16DHP39ARKfciVSfkUb2TpHvgSyiAqq9NEf7GC9DpGmOTIKAWYJ13OW95CdwxIQWFQFpH5boAIjVGl5g3t3buHBP/wXwPHg7OxidOs2ct9jgOFGMABjyosXw/Yt2D2PFTL5RQKAAmYkWeD/+cgJAMxHcK0JnDRAstjA2mRIpxtszuYY98bI1zHSzQrWZonNxTEChIzxl6xO4WRXyKMLxJtzZNEcdp7CczOE8SWsgYc8GGD3O7+OvY9/iOVwgpXtIHUcJjuKK94AAIpNbFUVuO6fdoVEdh/PvRoD0AQAln67pkjKX4lQylR08RfNNneBi2yLrymkGgBoMB3dur/7irrlquvz2jVbs99ofNopdkyHaIw4ubuVn9bUj2YAUAb/Shtj2K+9GgOwe3x1GdA38IJBW5rZ4lBS+LjK9MsAoNr9YoMpXU1zVMuZqA3EFgCgOYtgAUa2jG/TAX1X0RzNGzAfsGr7+prr1jA9snT/cgKAVaOZtWIAYLMSaKqK3DV+tSfRC6T5q/lMWoSe/PzrAoCln6XJbuvy7FxeorX8X8Vtb0tktgUAKNxMYW/bSSLd/nlXiG9nF7ULavpDqcFNWU3U0eSyU82qCHkX42UbUjRt07ZtSDim52zNAFRsrKTZeXerTtOJaw24emkAULyoEgW9M+oEi8FWtljlLXrBDlnp1xeu/G7TEtEmfIuYTnnZ8MvlFSm3vW5XZGESp0vtPkoxHsXjGzdsxhDgepGImjB1rTDDiaa60Otiug0DsBvgMy+jthDebRYf13o86XnTp6t/rSeDW79cqJFX8VLrDqfcLhMASFPbNf41AFAOA942BLgWwl8qIONp+TY5IIxD3QgOCe3G/+2icL/KzFTzUB2qyDJFP5ufLxxEg4bQGIDcQBWz1umgViFnTeNYc2YKgoOQCSY/pYCIsF9Vn3KGo+poVO+qWRqlGWx8DOuTad5XcvC2WahV+4WqlzW8EoLblIPJ8Are+6b1W93Evi3NizitrsZYyNM2PaniRXgPXgYANL1HlxcKr2AAYCgAwLQAv2xYmYte4mL22TNY0xhu6CDPfWTBCP5kH+5wgiQjkMxCWlSYdSls1AVcN0e8vkKOBHGe4Vsffwe93QEePfkC548f4ODuLaR9G8tkhTSPWbeZX0d59jQAMOh76Fs2opNLnH1yH05uwaX3UoCrZSEhoMZ2YDseXDeAQ0UjcmpTxnQHYWmUE89KE/jRAtnZA0xP7sPbsTG8vQfncB8b3wUF6hKQR/cKABC5hyQNsLN7k1Xf9RLg8qefwd5kCKyAiiYjpg0+hezSf/QjTQCFtRLrkNaWbSOhQ1vfQbAzQO6kLPfhD374Mf7ur/8G4fMr2MSk7Fvo7QVI/JRF+hKVkQDA+DJFFhLDz4dFlZItl+cqJMAvp+IrPEk/Fa3IrAy2Rzdz+CwIXDYX41EP69kU09NzJCcXwHAHB++8g8R12HMIAIzmZywHoONmyKyUMQApxyLlMywLf2wRwVJjwAkTalxnVfoLlguStZ7LGzCElQ7gZgPYVP13HcOLLVw+PYefeawoTL6JkFMRm80M6/PnsOIpYwAivoSPOdLwDGl0jjxZ8ohmK0FmrZH5HjDYwdH3fxuDD7+Lqd9H7HlIbQtuAeqKlUxsUvlDfjhf93WQS77ulxUALDVUgw0q9UQBAFb2QSRll220OrE6wMfvbbePJs9/C9HZTq0WV1W7HLU9dT9St3uG9msAYM1d10JUqcq14l11DYBoe8sBJRsj6Rl6DlsdgNUHrMu/NA5w+eKmThSWUwnh46lluO7mT5ZHlj2O/AXmM/FPcw7HSv4KS9nOAlSAfL2dRYqctullAK65quw2AIF5itUXKCG0XwEA2DSfig9z3RVl2p+W09Q8wPy9Jv1Ah3KZIYKp2T+t+TmKQpZ+6UiRUD69EsaaNpPXT93/7C5i0j3cam/qPpzUOFoF8pCIBrWMoPBtW+Wz436he9q1o9o7Xc/qByRixVf6UaSwaB8leX/R1I9t29Y9Dy93xRYAYEWLlg2D6EydUaBuDriS1IdObqzZAJu61STQssquBEgMc/1dldFteFMr+i5PpbrIFYPVqrgrt4Ol9SlDWNT2lePW8pxugKN4XvGglwcATR3p8BD+BQOA1HMdYFBGoxNAaTYQ11vKL79+zM4vb9s2AOCWPmIF45RAx5bsgW8AwJJVLRupVueumBBx+mRysnUG4JcJAMoONJMmaT3wthfuc+nF1tdDBQA2ybl5/bD1yfKftTh4OoNEt1OC9foqVlrTf6XPUmwf9BSrXecpNV9RqnKv6426faiPV70KdO0p2h+qNftlA4D6m2nm0oIByEOAKXyUAA1iwbnwEwfWxQaLL47hxz7LA+hODpH6faRugCSxYKcEtuXICXga+AgmI0qXh3h1BsdKsZouMDo6hO87DGhaXZxi/95NOPsDzOIV4jwpN4UWVXENhnDGe8jHB/BHO/ACF0PHRXo5xcnPPoOT5nDpUJ9Ft9msAAksAqkceK5PJUwY6JxR7h/Kg2dR1ALR9FJ46QqL55+g74f4o3//B+gfTfAnf/mfsSSgPPCRwkbC0MxiY5J7SNMAu3u3kOYOqKDs1Sefw5qHvEhKbiFMCalj1SHK/4g9xqoU2y6iOOEVggMPVs+D16OwYhu3XzvC/Z99gn7mI1yvkDkRRjdHiL2Y5fVjsczrHNFZBMQuLGJHugFj8LG6cwRAEUxGuD6RNik9IP2Z2JVWzgqQuB6BghF2RgP86Affx/MvHuGv/7c/Aw3a8K23EEx2kCHFenWFaE45AOdwPfo6gd1z4Q8CuB7RFiv2QVfI78sBgNT2IgkGU2KUZ5qKsQQs75+d9mFHHuwQsDcxlqdTJPME+8N9JGGKPIqRE+N0M0O+Oke+uUSyPgeiS1jxBQMAs/gMlhXydBtWihQhy/+HyQ3c/OHvwn3zfcz8HhLPZcCy968AAJTtm/AxdFXM8S3+16roQgXA1LSZnvTUAADqG0J5/1Oo70r2rue0tV5d1Jqufa/a+jpQ1PZAmfHFAQ3VgsgMQfqeV5Xmn/r17Z0Utl3YefnKrxYANOxNWCfadp/SSJf7I0mCyscWYJ/wWWUAkPyHRgZ+JX9qYUlt3ii6xhIRak2+DAGShviuLQBAk1h22W8uBGq7vgEA1fXzMgCgrkfa3UtzjtRyZqQH6P6jniJI9T/rVWm/JDVW6I/6Brheg8bkw3fkiH8JANCkOeu6S5z8igHW22oGAJktl+wTDYqwKcJ+vMrWorJ8Lz9rHQCg0Hr1OPc25SEYgE1NagYKXh7A6B48vlmpWBJNAKDp/W3HK21Cq+VUaju9lJge3B+p3Bt5s16arm8AwFYJv+4JYW2Dfc0y2zUFIjGM2hxGg9tkpthvta5ffv18AwB2DPAvOwPQoF+EC69T0HX5/6oBQDHCdfBP6D2uS5srsIuqnkLGa9s/4/p5JQCwPJipH4BttSzVbRT/TWP4Mcuk1SDQ50dxGBpe3MkA1DZ86g6wbXNkclF/cQAgjU8WhSUDkKrG5imxx1wGAHqJi2Hi4eqLY1iXEZzcx+jGHaxzGzFjaFEFCQtUZDf3LWDoA7sDHN3awY19B8PAxU9/eh/z4wu4SYpkuQTiNUav38L4zVu4ipeI85hKY/C8d64Pq1cAgKMDeOMJLMfGyA+A6RwnP/8MdpTCJnCPNm6M/Ub59wjks1ilW2LYsBx8DJjjTDpag4TBufkayeIplvNn+KM//n384X/7B/hP/9Of4Ml0xioVh0kKx/HYGJCcWIwB2MPu7i1kuc0YgIvPHiE+m8JOCGok5iBtUUj2Un787nms+jD9R5vPOM5YaDILt3VsOL6LwbCPvb0xLo9PgDDGejVDbK3RPxwg9mPk1Ikkh7XKkDxfAQlVOB7AYWHOvOowhfzSh7BCBoY6FqtkTAAggc49BmimyJwMu7s7eOvu61idX+Kf//xvgOUG3r03MTzYAxwCAC8VAJAYgFRR+RcLABZ87BIAdGFlVABlACvyYW0ArBJgFWL+8Bk8b4LDyQ2WFzGLImSbBRDO4cZTpKtzRMsTpOszuOkVAwDz7BwOlXFmAGDGclNmQR+48Qbu/psfI755F6ugj9ih0ikW/H9FAKC8MZP1o77B2gYA1Bn7DKxuYwA2MJxqmy4d07mecahdXcJS8p5TYltX9pS/uNovNG8S9JBPFU6igwcZ8KPcnNV+5JcfABR9bvILpH1VIwioAoCC+cdg5HLeBdOPs2nZWwQAWA5bk/zQxSKSogID5Ug5vn8uipAxR4Vfp4rT1wcAlhF/WjzfNwCgvGRfjgFo8q5UhXB9AFD4mUJPmVMEvUKVv7KhzahOdSgjKzIqXKapvFaSVdmD9kwO1wQA9f25uF2B9xRVolYpr8e25mCECQMAq++/9NGi9dSNY5mNyqvcvwUAWCklHfRrZKBsEQKrdqe9+W2x9x0SUVOiPHRJ3kRW7+zaQKnvqgBRRZlLHeKMDj7NTUujNCTFPbzoWGHMWTtrLobqn9Qe2jX99e/VR6i7UhPAVRfDwri1NaHsS/MF3YCZAAbaF4C5CIImaU1jJ5gRWzhutcVLWzv5RLmV8ad5c7Ly7FKAbfq1fMZXDwDyVxUOisbiqk4w2wZQdjD5NdUa2L7tJVRRDKVYMcUTG1/ezZDtmvSm8CnZoePVNNs+3e/vnNzKKWxgQcqgmmhDaRMV+VBHSckJVeqcYpZFyFDR+C7ztA0AL1hm8kZOlimu8dRxLftjOVIOFmmsS6e5rmkViaP12aqfaFCb56D6qxkANM+gukGpb6iIYVtJT5NDok1Pg6h16X/9FrnFZR3mFhHW16dqnwSLs8sFFA/fRtrlhnAAMEISbVihCA6ccQCQWFhu6mGQ+XBnKa5+/oz9TjnTNhSC61Devz78YITEspFQjjsCAIcODu/t4Q9+/F28+UYP/+9fPcT/9ad/hvR8gez8EkhDBHdv4eiDt3AZL3khBivl7DliABYAoDU+gDuaILccVgTEWa5w/Ol9qhzCwl4pdJWHu1CeP8Amhp9lIVquKBEfAwAt2nynlM/NgePk8OwIVnKBy+PP8W9+/AP80X/37/E//u//Bz4/P4M9HiHKc1A9DsrJx80GMQB7jAFIoalenGP1xROsnp9TKj+4FHZMhUfyDAmxIItwYFDhDAqvtVjlD/hBH5brseuIUWfZOcbjAU6fP2PVeh07Q+aE8MYuIqIZugClTyQAMHpwDqQ+7N4Qbo9AwD4LUc3IEWIh/nxlpywPYA74LhyX2H8u4iTCaDJClsasSm46X2P1lEDHBMHrr8MZ9+EP3AoADGdwfQrPqwOAXId0p6SoMQA1hSl5YqXVox+Ivci8EaZ0Sf4IAOzBinqwQgfWMgGWEZbH50jP5xjv3oZnB0jjDFm0Qb5ZMOYfAYCU+2+9eIFseQrfWSOLLmDbCyDfMHCUZIeBo70h8Np7eON3/gDrvSOsgz4iYiIKBqC0oPQQ4MovaveimebsLPPeaQE6jKhJPwmdrz5CtvW6j1izb9KGkmurZjvSLB8EpopvijZoJka2Lqo2b+h20fDramT5SaVGLl3G4gfNtywBmlIGmt9qBgBJsKsB5PZJnW/996bJlueoPl9qw/WQ864Q4K4UK83SqclVDQAUq5w5Eco6Z2u82MNWuoD3gY1PDQDU5Kd8GruwlEcF2pOGhHKAiRZwf07yPMp2NM8tD1F8uRBgGhJ9/y6LEv+5Prp61Vr9GaYIhqZeyEVA6p6clPzlus6DPKttjWpXFYVWaPL/5V5wALDu30iNbTzR1Xw+aVGpY2RmmJV60uS9FUUcW5V0DZHrUOe1rxsTTbccqoico6Vy2+JlhjC60hi0C0dt+Lf2t4tVqQGWOgjI51/acShN0f1nVdMzeW/Zf7RLiDpk14kYahpsa/8//Ee1yQqAV+Q+KQaNrZcWQ1RfBFVYxhaz3HhJFcImr5Bmp6FSV9UZl1DgkhoRbmL1wNYQ1SZ1JZ/sFI+oAQDt7ZPBP3o6H0/1+prBq8m23K5Ol6RpuRqnoxnQaHNpRGhRyyOFN9D2Ru2Etb4gqhkUj9Ad+Nrv2rtqjCfpe2b+WYhg+8fkH29zvxoiLKtsbrlNNaSoVUb33RBevd2a61JQRZ4o9rCqYrbQA8LdNiAsRTPUeazmxPT+9h6oTma7u83tg3kD1DVO9ZxBfCwkBdL6CO5Qm95QrH3D8lJSGkj4S7uW0d+nNqCLEVi9T9z3stuZwoUsjHQp58rjhP5odmVE/hV+i3RjcbnquldnJ9XTtshhWm4a+bjVk2S393+rEBqp3XV5aGAAatNnFJ8u4d3qe9MGX1ufmj4n20X6ty2MWJ2/hlQgki8hfDk9yXKWxMjiiBXtSOKIs+YYvcyFm7rYcUZwpgmufvYE8VWINCPkzQF8KgAyhLd3hDzowd0ZshDgjZNg91Yff/zf/AiHR8DFSYY/+Z//F5x98hSYrhhlzRv2cPTeW5ila4RWiJSxOQQAOIC7sw9rZx/eaBe27SOADS/c4Pj+50jnc7aly1mYrQ3fD5CxENANksUSATl8cYgkCRn44jo9VtHVouq22MBKZphdPsO3Pngbv/6jH+BvH3yO5+Eam76PhErmUhJDOjVmjiMBgAMEvR1WZMRPMiy/eITo/Ap9pwfXdhFGCRzXY8xBx/OR2S7sXg+Z6yKi5ee4oE2o53gMjE7iEPPVFSYHOzg83EcaJnj84HOkyQLB0EXaIzYfr+KLZYL0ZI293i7Oz69Y6K6/u4+D27exzlPEaYZ4E8F2XVh9j4VhOz0fy/WKAQ8ugYSEaIYxA07tTYLocsby6vZuHqF/uItNtkaOEPHyAunqCrbHqxVTARCv5/GcgtImR/cHYdXXLQAAIABJREFUageEtaq/6gpja5rtabjsCz3LWIxszB3kmQMr8xkDMNt4sNeAM1uz0OvZ83Nkmwz7h3fg5C428wXcNIQVThHNniNZvkAenSNNpkA6h50ukacL2EQhtCKWc5JyJbIcZDSv732MGx//ENmNO1i6PmICVynlYtFCwlRZS1uKgGiaszNnb816dACEZutQhJ23n8DUDGQJSBa6QSRNb7ZGVXim6Gc134XPoSvQ2n6y6kF5qbTfaVKhxj5vqbBNz6j8G40QYNgLb6XquYEz+CucWSw+6grofgPdytZI2bkWQoP0KKH3m8e5sPwSyiTvT6qmihdKXlFRtVt9bpPXVHkRfI1zSVKfLfJpFlWAC5+St73JfgpUjhcC4Qql8IDkiVf8GA7+lYdqpQyKG+oSo0Zv8J7KgH4jQUceewYC1vVfXUKqd6uXFwCVNPzbeIuNEigTC4o2Kj3XxqpbGoU/pyM40tuZOBjWg4gA0hWDos+q+6sDUWketcfr+wEdPtDHz1jFe4v4se75UNdEHaA3j/Q2MqY+QW3Rqx4v8fHZUulKgFsXcGYmhhVjVnal7f28irT8UQHEBp2gX80UkmEWNQC368BEn03rwAAAUvMo94l4P1PwshHawiB1DbRJvPiGSduEaJRkbbyKYDJO4+YaUb9frp6mf9d8T7X+2QioiG9R9KR4mXiA3iw+hMJZk67SAUBz0k61vZ1JMrfVkrJRqOVIMTyENadbxbQ+oRMArN/Z5eArrWk4nNDtrylknd4uHIKmPjC5MJXx1BmCXCCr/8ocYy0KxFChtFm2rzvhLfIvtbMcbylEoQI+TPeLtlQGpjToikG9vvwUPlqn2ucVgr8KALDet7aR5zqs5dsS/G83IBV7uZ5Dr9vsSbLGmiDmi495c9skb0655zqyVc15daqtOhrlo9VilrWXtCVhbmJXynIhxsZcBKR+fF5nxJhlvImFub0s5LyGUPHR+yT60OZkdTFMX/V+3qwq5FfvFwcA60wCtT+C4fByACCx/ggETDZLxOGGgX/ks+e5AydzMbFHwEWI6SfPkM8ipDGdMlNOu4ADgAc3gcEQ9mgEa9QDBi6cUYYf/d6HuP3aBDsj4NN/OMFf/ulfIL6cY9JzsFjPsXP3NjZ2ygqBZDYl+uYAYE5hrju7sCcH8EZ7cOwe/NxCEIV4fv8zpFdTDngRsEbFP2wXFvVhuUI8n2NAA0YAYByy01+HmIoOAdUxbGwYIDQ7f4ahbyOxc/g3DuHduoH1aIAVhRBTEjwKHWOD4CJJegwAdHyfhTHPvngIe71B3+9jSGxFx8PF+SUcy4NVsCLt/hCx52OTZYzBTABgYLusCHC0mSPNQ7z53j22OcziHI++uI94PWVsvDQg9IkAwAzZfIPsdI0dd4QwpFyCHm6/8SbmcQJnOGAhy+vZmrXZ6ruAZwO+A7cXYL6YIQsjeLCRLddwwxRBAsxenDGbOrhFAOAEoZ0gQ4R4ec4Kt1gOtbkOAAqZ0wG/GgBoOLAV+kOPGBE6jPsCDvLUhZ35sLMAycqCtUhgX81hTdcMALQzF+PdIzau66srOPES6fIcyeIY2eYYVnqFPF/Aylew8zWsnHL/UbGZBEkeclaJ47I8k/sf/zb673wbyf4NLImlSf4myxtJ/xVsenaOwvU2gcmmzzaMbfl+I0Ohwb+qK/D2Iml6frHSqhabcuZtG6rYChsmHAEaAX0DZGKANI1TJQPXsXfXvHaLcSvboe1frmNvGltlBADrOQKrsOruPvL5kr2Sbv9Q7Iuans5KmGnGz1ylWWzMdb+HP523TPZDqvbx11jM3696oLaf2sJz0MrMtJYoJUaxq6BEOQqCOV7lS6q3VeBf1dLSBjeAAFUxksqHbgIAdT9R9rgFICH7Cm39ZyOkPYyqtMuf7h2FQY60/WD5LOmd3RJVPb8uj8WDRCeYKLR70eX4KjJo7iHNM/tPSJumUHQAVff/9N1QN0Ose122X1FfJ189AKhKy68sALglsKXmAKynOuoCUPUcgrW51KtId9h//f6XBwC3AP+aFMZ1xJVvUJsWnLxoVe0gMjt8WQCgOkHyguFWgBfxUFymug8kMNxvAEB1bL5qALCy+uy9JQBVtILm7RsAsA2A47L+DQBo2lDJzmSzZvsGABRhLQ1jxXZsHRahheWqrGWhgBv0ydcNANaSMCvGQgUgfxkBQIuFiTZ/eFeyWiiRuJr6Q8UvdOso21SxYRQbQZ0ByMKAGQC4QhKGLASY15DlAOCONUT0YobpJ0/hrACXqt9SCLDfgzUYwpscIB+MYO9MgOEAayuFPQSO7g5gORHGwyE2l3NcPHgBa7XCzZ0enjx/gP7NA8QepbpLkLKdnAXL85BQuO+4AgBtpw8vt9AjAPCzz5AXAKBLlXM9nxUgsZIMqQAAHRuIo4IBmHF2HhXMsCI4CJGsLrA8fQLPThCvl9j58EOM3ryHeeAj8n1kbDxpa5zByhwkoYegNwYCH3aaYv3iOT565x3cuHELnu1hNBjhwf2H+P/+6m8ZM21y6x6s/hih7zMGIBUfoTx9PgMAM4TLKdbzc7z7nfdwdPMIxy9O8IgYgNECvaGHrOewwhxWFAHzNZIXM2TzkDETe/uHeP299zE8JPDuAD/92We4OpnyUOSAWJk2YjvFYG8EBA7CMISb5thczJHP1hikNpbPzxgDcHDrkBVBSQJivEWIFhcICQAkoJQASN9VGIAkY03pQF4GACQfUhwesQ1KEZrHsBMK/81c2GkAJ/WxmdE4RMD5FfKrBcInx7C8AQY7e0iTFOH8Cna8RLa6RL46BaJzWPkCOVawrTUDAG1EsFguoZQVAImShOVSdI7u4PZv/R7SW68j3NnH0nHBkkUyALgAIjTg77oAX5c/3gUAdqZgIXk1nPHpAIJoD8+f+eoAYFf/9O+1/fp1b9/u+lcAAJlL28Ccbnxx0x7tXzsAqETd6HvLLxEAZBOiptgQslWCbYIRIscBSQft1Zw2g07V/ri6Ul6v/D3NRUQkyFCBRmWyT3VgLLXkVxoA1DaE7FeNoiWzTUUEltLnbwBAxZ8z6HYmfe34aiGb5gd0PB5fGwNwSwBQJaDVAUBTDelKPE0GlCrOSevzywUAefUzOQ8RZwAKimu3vdt2nJqe1A4A1rYUxR+qpKlc2TbRE7ZgABZWVs0FUSgPhbWjFf1QOlFNmnySIZ05lSdSMg37+gzApkwN3fPSdgWFxCof0wJmnelaooa2fAUAIDd5LZ8mRqDC4Kzf90vBADQeE7zC+JeMsKbx+uoAQPE2scl6GWndJvzyl4UB2N6/+gmcei3XFuIUXHb8t2MCVK4mf67qvDSDk0KeJFTNtINr7FwF9nUyAGsheW2WYLs1raurbwDALoaecX+OrxMAZJ5NToU/EmThmgGAaUIOO1WPteEUIcDLxxdY//wpEDnY6e0iSW1kvR7QHyKn/wgAHO8xJqCzM0TsxghGQERhra6NXm5hTbnbphfoZUtcnD/F3jv3EOyOcLWYE8TJWGk5Vfv1PFYFmEKA3dEeLLfHAMB+HOEFAYCXVwzUC/p9FpabpTlSym+3WiGazdEnACdJkCQbxpZxiSnoEMgUw81DBNjg8tnnSGenQBYDu7u488MfYj0aYmVTpRC/YKXnsDMbycZG0BvB6vVYnsHw5AVAzDrXx9tvv4v9yR4WsxU+/clnmF2tsXv0OtAbIQ76jAGYZwnLWUhMPI82rOkGV6fPMN4d4Pbtm5jOZjh++hiWk2C4O2C5FDNq13qNfLpE/IznG7S8gBUiOXj7Xfi7u/B293BxucB6GjEg0gscWB6wyUO44wBvf/Q+0jzD9OwCJw+fIjmfw9tkiE+vGADYv3HAAECMAqQEAC7PsVleAjmFFAsAkPI8Uq5BrrO+TABQ1pVMmzFGD1VwdpAnDtysDzt2EE5DBl5mp5T77wrpyRljCfbHe4ijEGm0hJtukK2vkC5OgXgKy1oBBP5ZG1j5BlSyhmejI+ZfzsO2/T76d97A0Q9/B/HRa9iMd7F2PF6MhgrKsBhhzvyj9gnm378UAJD6RuvjugxA0vcv6xGVtuNlH7CtI7MtACjZbNkqKyCl4VlcbrVGfYkAYNPW4MtmAHL/p+qDzACs+4BS6G1LpFg9XYUMhfGcevS6YnUpWfAaGYCmiDSJASimsvT4ihMvBnOXTZAPSeXRbQedZDaiWDPSaLEfzUk++Dt14FuAh7p3cF0GoC4jHXhQLaqnGKaySyb4rbyoeAnzPTtyrCkAUrlYxOwXva8phjYFIVKmtTMAlemmmTFEgLC568wRt63Sad/jyQhSd45OdQa7GGy/GABwmzHg7Rb909eN/IRi52tAEuqRQ60tUAgMMluYP6Oeckh+klqEpHmr1QIANtgFfY0z/8EcAkwAYHGCIMCa4gSlfeJVASGn7OVBQHESu80E82t42fSqzYUGLB6gq492dVIpTfEssagrIyPwr3r/hILQQMBiaNQshWpuNXX6q7Bh/neR00oyWk05TbpWpXjJFizOriS9nQwe09Q1AIDbzzS/susEuqaqNQtkKuJAz78uAKg64E3yJYE+W4UAU06rr8ojrbevaj9vJwupKU8lucKqHK+iwna7PeT7FcmIqZdWTIvrzjtf68Wab7mZA1xbuQytrzdvqMxJetmKNQLkZkPC9UoxRnLwyhbrVu1Qu/y06y4ZALzu7BQyXrazuZ/M0aaKoW2PLw6btn17Uy/1XB71nKHqCXDN4eqQn+suTWMICBPqyuUWBrttfIRzbFh+yuGdPo5d9xcatnX42fxJRazqz6+HcDVuSqUbZYeIOeeU4yRNkIYbpHGELCE+HukdB3bmYGQPEJ+vMP/kKbzEw9AeIYotDpb1+gwExGDMADsCACe3jhA7GTKbQJcEabSCs1kD0xny2TmwPsX69DHs12/jrY8+wPHlOaKMqgAT+ctF5gWwhjuwdg6QBUP4gzGryDqMYxzfv4/0/JKBekHQY6GvxOYiHZQsVrCTFHaaIY1ixPGGgTmUl48O3YKeg56bwYunWJ48xPzRz1lFYozGuPfjH2M1HmFhOchsr2ABUgVPC3lkoxcM4fR6cIgB+OwpktkcSZiytbV/dMRyIsZhhuU6RW90AGewi8TrYZNnsCxeiMaFBTfP4MQbXB0/BVYzOP0AaZaiNwiQWRs4Awd530WWUbXbFTBdIHrwFEh5TkaWoG9yAPQHwHgHbn+HMeUsytlopcjsFIkVI3dz7N+9hfe+9T5zHz75x59g+vgY6eWSsQppDYwoBPjGHtKei9xJES0vsJpTtdywZABSFWDHp2rGlQAp9pzhturqqK/XatNdrbfKZvCiAML3o5yFLrKYwOce7NBGtoixePQM/c0G0ckp0uMTxvwkgJoVeskj5PESVryClVCV6RmQU17DNSwK+UYEGwkDACmlvOVaSAn4olyPezcx/M5vYPKt7zIAMCRGadFINy+ALq3IURcA2PW9voa7NqCdvn0HA5Cn1Kk+OoPJvEFq4Cjp/l2H8ajpVk2ZXne8trZVOu7DTT37yDpS919Ee4Ucm8afrqkVAekAH1XARcRTNfeKtZMOaMTXNUMkCBjSfkVjXOkATz2Hldl/U+2J5Fs3AXNK+ioJJSq7x/1ZOWkMi7Armt8EAKohxfVxolvlOVN/rnID8ldU7a9+LwSjwdGo7zLr76+Bf/JzysFv9zDYdMmM09qllW/XFMEgmLzbrosaet+wno27IW2c6jn09Lsl31QYAKmxnEQgt970dg0ApFuZemv30HR+Zh1g7QiS1eWiUyEr2lYLiW/wEJUcdKX0lhd2+b9fLQBY3wCW9kN5cb3dAgCUq/DK/na1b5D1j6Rfth1nDQBUHPz2nU8xvqJoSsvq4Qq4adGbsu4q4tgBAFL4hZS2sIxvb8MkKmdKtOqrBwB1B0+v06IvPvn3duPCeyI0f3FGUk56JQjN/as/V0acdWWv5Icop57/oMrZlwAAasPRpvpLm27cAPOKdS/9+QUAgCb1y77rYDB2FQHhCFf1qQOAcgtkB4VPbv0EUHoYy1/3Sw4AdowfS7nUcorFXS1DErEtBMvEhGOr8OsGAI05Iuv6smaCtfbLRqp7eLpdxG3tWPe7GhyLTgCQ9FkBIje8oDqtV7VUg5+m6EpZxX0DALanSBb+v9GhNih4mgcdAFSf9WoAIE0qMdQYAzCKeEXgOOYAIDF9MgcBfFiLFIvPT4Azyqk2hOP2YU32GAstJzCqN4Q93GWAIBWjoNx6LH8hUthZDDtcwZ5NEV08x/r8ITA7AW4e4N3f+C5OphcIs5j1M7Md5EGfV2cd7wP9MbwhAYAORkmCk8/uI7m4QsCq+roMACT/icZkRcUtooSF2lIfSG3SdxlpeN+H41nwEGHixJg//RSLT/8B6FHYrI/XfvQjxHt7WDgeEsujVnPXkQDAhADAEdwgYDkA10+fIp7OkK5C7qS5HtzBEH5/hIw4fu4QdjBE5gasqjAV0aC2UDEJL8swsHJcPnuM5OKUeUCO72Ew7mGVzmANHLi7Q6RZApsxAOeIHj+FnVI/fKIBAsEQGE6A8YSFwgbeiDE2Cdxi4a055brL2Dwc3jrCcDTE8mqG9GrJcjAuXpwhDyP4tw6xd+81RJ4Fy8kZA3AxOwOyDQjbtX0HXy0AWPh/IvyX2TEbVuoi3ViMAYhVjnwRYv38BMP1Epvnz5FeXjImJQdeMmRpiCxeAREBgFQBegWACn6EPJw5TyoAkKobuwT+WUhyG9lgguF3fxM3Pv4B1sQAdD3ExYbMoSyA5H4Z/Y+6Uu3yd/Q7fuUAQN0MmXkchZPdbt2uO17b2slyP9By4CODTvKOrctfV7r/JQGApj7JVVAbpK2Wg10HZEwAIO+rCQBsikQThIpm36oCLMRISharzLldkVb4OuY55dl6Y6H3/B51H1f1vpwjdoFaSIjZtHLfo5FJ2I1i5ymzhVrGYAsmqTonmq9dHrC2gUxVEYN2wLkZABRj0AXgb7texHUmaahojGJOeQRB+Skdx+p73q+2VSXkwOwhyS9QcgC+BAAojwcjnTcWmZGu0gGmazn02n60NhmkQGoWQRmvXzwAKK/XahWKVlb2SgL9yjmu5nl7AFDe3xfjVUaBbiG9rzQ/HQzQFgBQB+LLsSl+UM4AFAYgS3VTdZjYdKzkhdjIfY0AYLOg1RcoG5Ny4ynOciqhUZd6FwBYCJgC1EiCxRhSTQzH7QFAUQREble5ba/ppVcEAK/NHKobYJ3B8qsAAJqWaReD0ORwCbaporRrgJgKR5TGphhI5fm6YvkGAOzUsL/sAKC5SEzdSa25Gk0ApnEd608w/K6HqHSO9rYXCEMppF0+ZZV0McuhqjMAC7daOWxRnTRhC/S1yQFf3sbyLTlPC1E6kNr65BZOcuF0sLoDQO50gGrv0/xNqVqhDsgJf7XdPdUZ4ur8vOr9bBwNOQDZrEg5lep2q16FWR8vfYNQBxwoBDhFFoVIKKSSGIAsP5jDABkHDsbOEOGLJeafPQfWLix3AHf/AN7+ARLfRx4MYPd2kBPQ1neLyofUWtq+JnDjEMFmhej8GZZPf8pAJgz7ePPjX8PF8gJRFvEQYNtBSqBef4ScQor7O/CGOyx8dpymOP3scwaKUVEQjqrZLGfb3u4ewtkCy6s5Mgphpuq/nssYhVZvAK/f54DgZoZhvsT6+X1Mf/LXcAcuEtfBje99F7h5C0s3QGL5IMgoY4aXwlE5AOhQpeM0xfzhQ+TzBfJNUm6enZ0JepMJ4PcBt4ck4zkUqT9UrZg+AgDs5xnmx8+LUOI1y3vYHwVYZXPYuz6Co13EeQJrvUE+nSF59gxOSl3ykTMQMIC9e8gqJBNYyYBHi0K2eThnlqXIs5QXH/Es7N7YZxWNrVWIfLGBnwLPnj0FRn3svXmX5TYkUIwYgIupAABz2IEDvy8YgBZ7XtOHATgyyFJXsOWClNdLlftP+JNUIdVh7L90TQDgAFhlyGZLpKfnDABcPHqI9PICXp6ysG4CStMkQkZsz2QDJwuBdM2Av9wiEDiBnacMiOZ/S2C5GStyHRML0B2g92s/wuu/+TsIJweYETDIUpYUR2e5VVYDbtNv22rstuu6AMDOgFtCa00fYtdK9uyVGYD6u7oQs469/b92ALArfMtcpfTVGIB8PbYfEBbJqGoEK36oXvetVFEQqa0KMI/9ysE9OeqpZLDRZQUAyK8Un7qAVTtEbgfod1E8U/FdWBvpCEgUDKngQtbrEvyR95Pa+7ocEGk9iMrmIsaZP6kap/pSeDkAUF6Cv2gAsOxj0TdFPoWCl2evAzDrjIBTvUfuD0l4wXUZgPLjvgEAawHoxYaiXWmr9kpsBoSMNwCADeQUfrVYcwIPE3sa/VkdBuRXGwBsUFxFOfNmvVNXuhxgkTZgXQZZM+BC1Tbf1sAwUDbH/N1ijdc3RGYAsFTxxc6M36+od1aNrflTbofY1xUDUE4MW4X/6s9o00tyTis22rXXN7Wn3Vw1baLVtqjP09tlCgHjzynub2hWXVqu764qETClgt/+Oc0AoDCNIgF4+/P0szO9Spl6p6yQ+Dc1uZYdFwUA7FA023e5tsIUo1MCFrxl5ABTmJjIE6KGAPOQe9OHMwBNK0Sr0nuNOWwDglQjqoZ0XHeY1JDo+t0mB5hXSTUYK0WfVPlGtBWnchhofL5EANCcIaZRQrcbwsJONEs57yHrirRxLySOf/eSAKA8pIVrr+bxqQFyqhZSHYhiJlqcbPPpcaH9tKrqhSkpx9DEV6/bK3Xo9Wc1ToxBVsT97RLKGZqmEBYOwFczV2esq/fry1uvuqxsGIQuzDKkVDmX5VRLCgCQg1iu28fhziGyRYqLRxcIIg9IPeRUAXe0w4p2ZF4f8IfIbBupTYADba64YoriDXwnxyCJgMUZrh78E+yehWzYw603XsNifYUkjdjQ0v2Z6/G8ghIASGysYZzg7P4XcBZreAVtPKXwZceFT8U7ohg9v4fp5YyREtzAhzMYYnTjJoLRCHmWIV5cYHP8BbzFMc7/4S9huyky18bRhx/Aufs6Fl4PMRU5sQjEJGY4BwApB6DNAMAMs/ufw1pHcCwamwC90RjOYAAMAgYeeYM+1psQWZrB9QKs1xQG7LLxIAagvV4hPD9FRAzA1YIBWW7PRpQvYR8M0bt1gDBLYG0i5LMZ0mfP4KZ0Uu0jtXzA7qO/fxPueBebzILr95FaNO5FOCJLdZfDpdkjbMjPsVnOgdkMw/4QBzt7ePTwITDu4+YH7yMiE2xniBaXBQNQhADb8Ac+XN/lBVoKPaKbGmHfSx+wJuxCeovVI0clSD9zBpCDPHI4AJj3kC8T5Jdz5BeXGG2WuPr8MyRnxzyXIvU3S5DlCc/lmESwif2YbgqwrwD+aJNPQKDNQcHcjhhYmjoU7t2H9+H38fZv/z7i/SNc5jnigjlKjh/5nk4tR5rka2+nqY1XvWoREApvN/CLwNd/lWdcvK/0sotiIE2NLDWLaU9hcE+22Yp0AYDdXlnLzkW4gkp8ZWUthUZVQhAVXS6ea/AvGANQPeBSri6Usf4EdbdgHqUugFhNgs9DhhX/TPdGNXspIDH5srJFtRQhcr56bV1Xy7uQN8VqcXCviBhRAUDe3mo+RFRJ+7KRCSicrd4CABbJLETSKr5H5OuBA4DKzrl4oTYfCp2nydsq/GtZ3lQOl/Kb7nuK6TIyAJWxrcaF9aSjivd1VVSjrEoCoe0m1Pc37C268VM+D9t8hD8oR/Tx9dG2RtUiMY3vMIWg1SKcKl26TXu7wte506M/qdTMfF2YFGABqpva0hHgrEDt/DlmFpMZAKxaUvoDLfKphgALDaDnGC3aUz62CeTQ/raV0y6toY75r0XXSTpDfXOlD9sZgFpIJE21fnLBTsKlia8tjtrJS3WC073h0PIfdUpx4QI02MJSYWsSqm6qTJsbNXeDqlorjcAYgE3tLJVNTaWW+LJYgLJ+qVWNrKyPJPvVHLAQulb9Ir5ouaBhLXXJZ/1JhdLRxoC3qXiByCOpX9O9no0ACpOs2vh3u2RKM3Tlrgm0TMRvmmYz4Fe/Q/dvlNeXgy8JNNEBSprlNfvWuX7MF5TjS0bMsDEyGrgO41mvUaauSV2/CGaGaLnu5slVndmTNAaXDji0rN7KKWJFKlSjt/2wCq+reRCYa9DEEJNfoLVflwDz8Arnr7jr2gzger8V/bDF89TNRB1u1HWXuh74b/ocN/hxksVsODWUD6D0nGCdDmqHh1O0sFkmLJ5DU5lPyQnRbqK1ICelLkffyGA0S6NJPvhcmgDyhvnX+sNPu/mHrze1PaL/be2QD2Cr/spGj4fxJAQAUhGQmAAVCpO0kecuHHeM8c4BxpM93LlxF5dPrrC8WCPeZLicrpC6feReH3YwgOX6rKovqVNiXjHMyLaoIC28bIN8eYGLBz/D7uEId779NpbxCsfPHiGLQ9jUTwIzKA9gMEBOYa6DMXo7+7AzC0GSYP7kGSsEEVBBVwKA0hy27SHJclYEg/pnWy52D25gfHCI0LIxoz/6HgtzxnqK9dP7sC+fYvZPf80KcvT6Pta2hf1f/w2kuwcIbQIBPX7wklNBEQt+MMDo4BBOnOHy51RAZMlYgYOdXViUAzFw4Y4JcHQxW10hzjYYjwdYLSOsZw7snBiIDsshGCQRkqszrI6fIL08Ybn74FIirBD27UMM797GJk1Z4ZT542fAySn6bgDL9hGmDtzhLoKdA9gEvtouaLoIAMxdixVHyVIbnuUgWa/g2xkOdge4OnuG2cljjMdj7Owd4emz53AODrF35w4DXKnoCFUmDheXALHonAy2byPo+/B6PmyHs4g58VL3t66xPjR9JvuKjHVXAIAEAtqZj2wWwp0ukJ2dw5meY/nkIZKLM/gE+BHTkdWPTln7rZxQUgIAQ5Z70ibKpWD5WAlxeO51AAAgAElEQVTgUCWVkBVbobrTqeMhG+1j8sH3sfvh9xAf3mAMQGJEUohwGwDY6KNIf+wCtPT7u/zB7W2hqWXVnBFgpdqEdg22zX7CtEHtcE0krWbqpWkL2+U3FJWcG/lkYm+jbyC53JQ20GAMSyBCYUDUQaV2llOX9ytyZLePj55DrRMwlGVV+lm2DfKoqsxfERIsz2zD/os5Xux/JTgtwDbS5fIdOiAt7Fxl9FSGot5OwSAUIGBhcsuecZZfATeInwvmX6e33xY+LhpZCD9nNqpzJJ7NJan6sqY9uxEyzb8RPlt9V9C13pr2lqYiQPx6uW9NI6b1SFkvlJiihnA1Sd211Bx/hRgH8yyaANJt9Fs9R6EQiq7RFl0yX8fkv5QBPXFpoftaH6Hu5ZoG0awPxO6wfQyV/aM2t2zPSoewTbcXYHvT+Fcir6enagIA5V7VI170l5f7z0I+usDlLn0pWx/hf/Pu8knhak746IVMFuPBvuouAlLAVGIQGwBAdZNXSUNjiGRXEtriduPGsFKfNXR9GwXGVB67UFzdLmA12ZZnjBcHNHyaFkBlVKuJkhSwzhjRbJlQ1+X4mBtQgHAtjZRBnTJgqJ2xJY8Y77RqPOSBkBdRqxuxDYDQUUShDsB2mk3DfFWuRfUTZwE2fwRDZnv7oDvginwJjS/LNxtIXvnv6/iQeMnsiZqD09Ess4IrpbnomlgvwrTXAQVVpzTIn7YeWEiHNHYyw4i3rQkA4c9lCrKkMG5rUJVVUO+A5l4oAH6DbtRzJOrD3dUq5f6G9dZh/kU5JUXj6q5Dm48o5l5us/4+s56vQoe7+tm+NlQdXFt/r1RlrV3/ifbYFELb0vgm65MTUFDoVS6e6gbjuhv4LuvE4g2NH9VBlg+oKqZD9QCVtVAVYVB8s1KAeNXFZnmqxpacNAYARiEyYgBmtNGj4G0PtjtBf7yP3mQXt268htXpCvPjGcLpBnEErCnUlQGAfRbOyp+aFoBMBs8N4BPLLd8gXV5i9uQ+bt07wr3vvQunZ+Nv//OfI49CFo5Fxt7yA6TEKuyNgcEIg90DpkGCNMXi+THikwsGjiFPEUcJwpCH4u4c7qI/GODyfAaXwn7HOwhdD87uBLnnskIn1nqGYHWOm06Mn/3ff4r87Dk8z0acZfA/+jb6d99C7I8Q28S2o7c6QAx4vQFGh0ew4wzz+4+QTNdwvB4GO3sMZNxYKeyRg96Oj1v3DvHuB29gtGPj+eMp/ubPPwHiHvLMgkddXC+RzS+wOX2K9OKYgW2WTWG7G7g3DjB643VWPbhve5g+fY7s6Qv4bg9wfESpDas3ZnkSvd1d9Ce7SHMbmzhGRjVZekME7pBhisvLSzhZDC/dMObj+tEnsCZj3Ln3Np6engM7E0xu34HTGyBOQmxmF4iXVzw826EqwBZjAAb9AJYGACon3Fsoji6QiB86WbAylxVdyWMHduohvVrBvZojPj6GPb3A5sUTZNMLeMQYZaHOxOrLkOfEWk1hUT7LLOK5J1kOyowXKWEAYFgCgKmVI7Zd5KMD7H77BwwATA6OMGMMVEcBAIkF2GaCm/TvdfVH1wbl1X0SVf+ICINiq1KzP/L7ujbIQueYRKBRL9Uc2eYRrthabaPQbR/acxTL4bPi/cXzijBD/lZ9kyrpUxG50eb+C/+nnUFgHH96k6lIXtE6xf51bWj1kZR7Tt8JmyPYVjV7rkQeiBZUT5GtKZcL7h8wu8VCfNW05qLIiSpD1ZrT4V/evgKWIOZfAUCIVFqiD+zNxUNZCwrwj/FlC6O4zdpTJKPY0zIpKb4o8xVqvmV1nyqjqqi0y1arxLcW/Gu+Qx7X0h8q/shAU3ZA27aCi5DtUgPq16n7CX7gorYjA/lbL79+TfqvyT/Sr+9aDyYZKD3bWre79c62eru5feL5XexIffzrb+1KIdDNEJT7Km1wCuOgEz5qLWD+tqwzNQuj6MYvAwBkGqBc/F1rvEs+5BznXI9ULOJKx2iRphLu8yUAgPIUqZL4ZQGA7YZcVVD1DVWzApMVZDewYkI4RIhfu4JqPgepxqwWAtYGAGrhKIUYtea+qcTYoMR/AQBgeb61BdjXpJTqDDt1rDkAKP72qiCZcDuLf0tGQZ2npoyvUZtqroMAqJqcrkZ0R4B/r9q3bVW+et2/ZACQK0gVIOK9F462YJS8rEGVct81DD89tcbgrYGA9TQHmonqkL6m/lW9ZD+1ihbLQmyEnrsOiE0GrvuQp3v8uqX6qwUAO89fWBGf5lZ+3QAgl/8tAEBJPuQNl+hWtdmoswDF9c1yUuUYEiNUXcfXHPt/niFNOANQAICsgIbtw/En8Ae78IcT3Dq4gx0M8fk//hwXT04w2TvCynOR+gED7qjYRk4HmJSLLg6RJxlcy4fvOHDyCMnqEssXD3D37du49eFdJHmEn/7t37KiFJwNbcNyPcbOSvw+rOEYvf19xkDr58Dq5Azh81MEVOk3SbDZbFj+QqvXxxFV480snDx6zlmXe3vw93fh7u0CBQCI1Ry7VogjJ8I//tn/iuyUKuxGQBIDb76F/Y++h2QwQeRUYcBEaPSIAXh4gwGA6ycvEF4tYNkBesMxQipIETjIeoC34+Ho7j4++vh9DMfA6bM1/v4vPsVmliNNcvQcl1VEzhdTRFfHCE+fwUcGBzHW0RL+jX2M33qDSlhgEPRw9fwE8fMTFoZt2z4iFt5rgR7u3zjEcG8Pb7zzDubrJZarBeIwQbKxkEU55ucXQBTBitfI5+fAi0eA62Dv5muYhhGynQn2790DggBxEmEzO0e8nBYAIDEALQTDAH7PbwQAZY/gOjqotkErFGRO65hQzNhBFlqwExfZdA13Osf6yRNY03PE58fIpxdw04gzOvMUGcvxRyAgMQB5wQ/2bwkA0iKMCwZgBMtOkNoEAHocAPy1H2Lvw+8iPTjC3LKQOpRPkft0gtnzSw0AGvw+vkeTc47zMPHKP69CIdv0fJdX1OaZCyvfea7a6B/w1vxrAAC74h/NOc4K10KahK4NrT7P2wGAFZJWQhOlYFT7n8b5kg6I6wAgZ+TXIbJ2qRN7XiHDcpXkxgMzadNe5f3j/ekCB2TXjb+Pt0uEHZdjWfiUAiBQ72v3bZWcgd2OFn93AwBI/eg6ZJHbJBMO+IF9+/5aPeDXr6UeS0UUC0Bc7go/cG37vKzfX/jXW+x5u9bDVw8AmjVoM0BXrrIOGf1FA4D6iiAGoMECMIYgz0Fb+7TtC0sZasIcdEJQ3cOvUl6YLFNhX4oiMKal98oA4P5/+I9KS/QTle4Q4PYNoqyURCfaqMjl98UP5eZC/N4op9rmtmnzzLSSevM2yLww8eq/9angOrdpMuXJl81Y1TOhruX79ZAx/U7RFdGHriIWphNCJayzjQ+pdU0byXbVqYSM6jBndZtZ/TTloFIbxIuwdC8mtaGNSFvprZRqvwAA2dNblfn1XNBqfTWc3KsrsWiyzP5r1FRbmuaXu6wLAHy5p4q79FWugTUNTtCXyQA0r20uBVWI+XVlrNALBgtOTzSH8HN+YhtC18TwUJwb9osJvO7K4dgdAtQ1KtdbHbo0mQHANs1b1y5VK75sBqAOANY0iwFgq7sHtAEWDEDeC67v29v/auuP7t4CAJReUmdcVNaLudvalMkh+XVZURmAal/4+mN2jjEAowIAjFlYB8vHZ3uw/R34gz0E/V0cTW7i6sEZ5k/PER5foL+/D//ODcQ9l1XTtTyX5d4jcC6lcOIoQx7a8C2XsdGS9RSrJ58CA+Df/fHv4+ef/gRXL16w6sMiXIzCiHPXQ+IGyPt99A4PWCXdvu2UAKAX8+eHmw2sIMDB0Q30e32cvThHHmbYLJasyIh3uI+dG0ewXWIApsB6jokVYXPyCE/+/i9ghTMGKLEwg8MjjD76LrzD24iCISKbKgy7RDTjAOD+ISi9YXh8zisOgwpwDFnIsjcewJ0EyHtA7iUY7w3w4bffg50Bf/N//hTzCwJXMwy8AEGaIF/NEM3PsTk7RkAVkpMQy3AB/2AXk3ffYiHJg34flyfniM9m8LwBC3UmADD3fOzevIHd2zfgjfqwPRs7kzH6fR9JlOEn//AZq6S7uFrCouIumxWSk2fAagYs5rxysuvBPjzCjXfeYWAjAwAXV0gpBDgNwZIOEgA4IJCzmQHY5J6/zFqpHGwbeWIBsYs8tGAREDhdwZvNMXv4BazZBfKrc+TTc1gJVWCmYjVUHYWS/FMYEhV/iWET4ySPNQBQhADzPIAZFQFxAmB0gL2Pfwu7BADu7mNBRWhEDkCZudTSsa+dAdgUUi3rEukAQvizco5hcRBnsiFdIEnXAVWnTLwSALiFhWptoLR5lk9YFHZ4GejV0g0CU9tDrsoIiLY2NAAmNQvNCOLtM6Rvj7oAD/358v5H2EMBrnH/TBWoEpoo/y77TyKvXqUdxBiwXtQYgC8LAFZRc3LEidhHyH2s1qgAu6u8cF2yzUde3kVWOcv1KS2Z+RIYWEmnAWDrFmFlytoAwCYBNYpd4fuIKsxt67Qevq72hTKlVnTI8kixfBxjZqs90F7V5eG2a5BtcIau9dAFADavvm2By6LnBiXJAMBaI6rn86/a5UcwbNtG6ctlANbfUs/wI7W1LUS4XKgNOIERANRTkBS6R3plOd+SbjX6Kh05AE0hwOztBTYip+qRcR9rTwMAm0J8KoXLc+bIv3MEvvnDr2tfQMI4mO5vB1646Ovwo/w6tiGpJZWtxLUm900auta7JvBI76NsdFQDJL2dLZyiCF/rAMoGkNorAIPtHdztGYBNykQ34DUD3TC+wlDzf+UT3Xo36+Khj6/pdzqXlxmA7cpY/aZtTvhVXHEXO9mif9soc7q3G5DVWyLNZClGos8C/GthEZWT8/JGyjyfVOW6cu/oLcKh2dax3i7kyOBAal1Ti46ohk7RU0XH9BBgub/i0e3mSwCA7eNrNuA8GXyr8StCjE2z18XQMq7PcgPWPr61EBYFTOfja9TPHRS40vE02AjjqpWq5DZdJ5+Abbv6X+W6+lhUIbJNc2FRpdWWFzaNDQMApZd8eSubN0Jdj3X72eBCmakILISxeLZQmQ39bdafJtvEZY/9P885AEhFQNYhC6sikMTyerD8Mbxggv7wAE7sY/V0ivUXz4DLGYZv3cO7v/tfYe1bGB9M8Pz0GHGaIokT+K6H1eUa0TSHE1NV1wzZZo7F8QMgneHGWzfgexkSColNM1zNF3B7feSOx/MAEhOw14M9GQMEstHYrkOsnx7DWq7hsBDQHL3REPfeehvHJ+c4P7lg0Z5UEASeDXs8RK8/gGNZ8G0XTrRGNj/D/MXnCM8ewU+XiOZXDEzC4SF23nkf1tEtWHtHSHoj5E6A9SpilXb7k33YuYXFi1OEV3MGADo+VRgecSBu5MEd+ci9DL2hh4ODCS7PLnF1uoSLHlbzEHmYIF+vEBB4Fc5ZKLC/XCBeTLFeztC/fYTJO28h8lyMd3dxdXGF5eUKO6NdDPoTwHaROhZ8KuDxxm0EQw/hZoH33jtEHAKPHxzj9PkCUWgj3ACzyxmS9QK3d8eYP32EbHqJ6ePHDDTz3ngLk9fvISa2ZZ4gWkwRb+ZAvOKMOY/quvgMALTdopI4hWgL/1Q4M4YF1KTXhH3j31ksxJGx/8jPTW0GGDuJh5yYjNMlhtEa0y/uI704QUI5EwnIjNYsbyUVz8pTAv14GLAA/1jVX1b9k0KAadGkyK2IVwF2MhbendgBrINbOPyN38LgrQ+QTw6womIqxHwtwgypfSZ/o8u/blJLTTkU21x4sUIVX1RzZ4wMYIl9JWy37l8w8LRjDo37jw5l324Zixs7D3BoHk2frje0dI69V/ZTxTsKn6d4bJd9oBD0tg9jZjGd3dLGLQBAnWCg+0Nd+4dr2eJaFFTdvxJyVI1LNYbsJzmioei/aEMdAKRvpCx59ACT46u1jwf50/3V+CojXTSyzHRWhO+JoiBGwWdNq9LXiHfw94lciNXoKocBJSbcJZuFXacF2CVoYrm0MABbfWCtCbKu4akXTB5oC8NL8kd4eDf/A/+nAMVL2Fo/5Jb2FFsMj4lhts2esX3/UFigjnGvN1G0X9HK7TqgBrDoT1RPdOUc1cxCdjA0v14AUGyARJ/0/IgUgdK++xPSz/+VxlUG7zTyke5f68whZb5FtWhpdmqj31UERLtX7Cn4v+oOt5RHOQR477+vMwD1IVE21qyql/zRAcBqsPl9ZgnuYm+ZqcNcueuiLg9iU44Udn0bo8tw4mc0yNqYVNfW49JlYTIBBLLxLMehcHDVGehwQFoNfNWSpieIcWzVg2SAGqpElixFweCo5eVQl5YqIk1OT2mii7VYyZiaA3BLK6U4VvV7uAHl/+mAa5fDoiYl1q7WXlWYpeIirWADa2NRAMTUra2ctK5WS46CIpDdAGDnKaURIOqUsNrhkyrKkrEWKrrmUMhOUn0cuvRTjeGlzcVXDQAaGVod+VQrp6dl/oUilBzUehWtduErDyRaHt89u4bDw3LJm5I0F5vz7cX7la/UNzSWvMFqmg/KAdiyb2gDALcF16/fGR7GKn8YuKEZE3XG1TWmv1MpuiPYBbrIGNnTbdal2sgIAJCAs3i1QUrhlY5F1Dc4/g7cYILh6AhO6GH++BLhyRT5fIndOwc4+N7byHYD3HztJnqjAH4fODlZ4sXTY8xOl8DKp0SBcOMMdryGE89wfvIAyKaY7ATIwhVG4zHWGZAQA4uqs3oEADo8tHhnAicI4NkW7E3EAEBnE8KJE8ThBnuHR5it1thkQC8YIglTpAlnsA37PWSbiNLsYT1fIFstYG2mSKfHwPoEbrZGup5zH2o4QPDa6/BffwMZAYCDCStwQkU1gv4O+lTwAxbOnzwFFgRAuSwf33jvkLXX6jkIxgF2D3YQp2ukSYReQABiDNfuMRDw6uwSyWKJke8gJjbk2QukZyfwswTT82O4+7vYefMegoN9DMYjHB+fI/CG8JwBPGoLbMxWC/R2eti7M8Fo7MOKV3j73h3GfpterXB+GmI2SxHGHjbrGOF6gZFnI4jW2Jy+wOzhAyxOToEbt3HwzntIgx4SCgHfLJDQf/ESORUCcXP4Axd+34PrFyB7EwAoqZiapDWs1woA5H4IpfAqc/AmFvKNDTf1YYU2sukC3mKK6cP7wPSMFU+xwwUQbziTl6ol5zEsygVYAoAJywHI/+P2lUot8grACXIrZQVuUqcPHNzCrd/6XfTuvYt0tIdVbiF3GCTGwv1o6/q1AoAsR5e2Gyh+LUlrRZG6Ziuib86LEGDFZTYAWEyxmvhnBW7RrmI6I4BNOVL5Y00AoMmXFZq0AiRU3VoAgE1ULmkHVprwVmPwDQAoJETeHJejLwNWDTkACxFrx780B1jASWyzbQFpk8+vzWnpJ5UFQcqnmE18CQBWB3lU1MIEAJacwa1BQN4BtsveYnt1HQZgc+eqxcpluyOCxRT91VDgrCR2FC8XuRf5r4WvswXwV8qPAaB5ZQDQQK5qHjvRftlnaz9krfnnpVxKgFk5LpwiqzL2RL5KE4hm1oFfLQOwqe+SwdAOAPiY6pMvj4UOAjZUNdcpyTLQxKJZdH1fgfWVKhFrjiJkuhZd9T3Tb5IPLqNjHIurk9+sXQ0AVKpaSNalAqD4hkEH3crBk74ou9qOIBVy3NXJStw1d6MRAJQXh2AwqScLXSGdRYNr1rVJmJs2SOK64l9lsCQhIheuIwKLniBu59hkARsVTVROdhq1wvUYgPoj6lOn/qWeo69onwD/ytMoLug6YFRbbjUAVrtCM551AHAbWepQSgUAmBEAyABXMwgij1kX463ef1k4REUrSX66cnR9TQBgl5yUvaoB1m0KVjxR+l45xShMtHK7uvaEklPmQ2MZyLprm+q+9SrTqgx/1QBgDaAxu4QN32rOgGbguDxKThczOJXR6wJIBSO8qVlMijuWI3uT6ZoOBmBXCOs22uA6Qyq3V6hj2UVVXSfZBNfJA79YALCQA4VyLuyTMCZNU9Fk36oRq1fdbndNa76V8bCtSlxMIEOWxEiiiAGAWZIArgXb68Hxx3C9HQxHN2FHHmaPLrE5vgSmUwS3dvGtP/xN7LxxwCr6Xi2u4HgeHNtluf/yyMXDn58hmiXwwgxBlmDXz3D54j7CBYX+TrE+foKdWzcxOLyJVZ4jdGyknsP+y10f1niPMQMD14EbJ7j69AvYUQxrvUE6mwN+ALgegpu3MJjsg6iLURRhvZkjWy6BkzPAchl7zklj5KsrZIsTYPECCKccKCKghQDP/QMMP/w2cHQb6c4BYofF9BYA4B6LdlhdXiBZR4jDHEFvBG84gt3zEYxorGxMJkPE0RqrxRQTKtJhuVgRCGgR2JnBJdaiawPpGtlqimef/DNmz54yMIuYiPvf/Q4bj96wj8vLBYaDfSSRjTjmYHyUJRju9tHbc7E78XBvd4j9gY8kJuDWwWLl4tP7J5iugNUmQRSHcPIEez0XycUpFg/u4+KLB8DOIfbf+xDWcER1dIGE8j+uEK5niOIVA8ssD5jsj4vM/dxO6wxAff3X/BntAq7PxVU8RyUPI7MJwwQ2FgMAndgF5iukZy8we/Q57OUl0uk5vHgFK40QJbzar0VFSyhsmYAiSthIgGDJAKQRowOCDLlN4b8EAOZIchu5N2QA4N1/+/sI7r2NJBhjSVHEdsEALA5eTf6G0FWt7nfDUr0WA3ALAFC2D3UsS/XDaOQ5fCF/zABgt/3o0O7a/Nflo91B59fqAKDZt9Rbo76+2MGxP3YwAFsOPOt+2TcA4FcGAJbOTeXDcx9UgPQNADkDBLQ9VDFpVUXgrwoA5O8tC4Ns7fiIYg/d3tSrAYCV3i3dwo48erUDCLlPjf6Fymj7VQcAlRkp94LtPn99/6nJYu30uUQf/oUAgKrQq/s3Vf7qy0PFbuqAaEcIcENRG237VeaVZe+mAz92KNBmwaW5KfZaYs8l/yvWUg2QJjxmIgGAgtEhuff85XIST4FYqTsdaaykL+Q8cI27PJ2SadZIvLuWVOFI3bw23V2GMDZ4gs3qTDLg+uy0UvJbt78q0lh6K5UgdQGAuiJsqxraLCI6BVYFuFXx2cYa1BdInfLKn1PRraswYJXMXRlN8WY+PLK4dzhTrDCj7KDVN6u8xaqB7qQlF+w/eUPRhlLUnFpj1eIGQITFYXA55mtNdvzEBl1fXmIlyH0T13QbadNMq4CuYChUd+gGV16BwrhUDNBKIfK/dSlYbT2zrlQBFPpylIIzeAMbnAU5RUEp78piMY9X04ZIHj9zlSkK8aeXNb+DbTULhoT8TPmOLgCwa7bV7Jv19aRvoPQDJ7GOm2SGtZ8xwts1aRdDo2sD1549VMhKs+YTstI1PttoPX1uRHfpzZzBU71FNYvVeDfJnn54w7QXJR3vQk2v2+gyfKFscPEE1gMtR44i3cUv7aPI579YfgY2juEJ5QsrXcqvFnJFThABgGlMDMA1+xeODTfow3aHcP0dDIc3YcU+nJWF558+Ak5P4d89wrd///uIRxbm6QJ33rgDlxh8SY7NMoZvD/Hgk3PMT5ew1hG8eIMgWcFan2N98RCri6eIntwHdkY4ePcDxEEPse8hcgkEtBm45wz2WK4933fhJinO7z9AP8kYuBeeXTAKCIF/2XgH3miCwWgXw9GIMb1mlxfIF2ssL6dAlGJ/2IebrBBePsP0+WdIzp4B4QIWgY2eA/QHGH77I/iv3UM02kXiD5i9CPpDDHf2GQAXrtassAux8g6PbrKiEXbgIrdzpGmE1+8cIY1CLKZTzJYrLOIUrj/EchoiWiWYDEawshT9wMJk4GFx+hwPf/5TrK7O4Qx6eP83PsbgYB9eL0CS2dhsLMxnEVaLmL2fwLrxfh/OIMXBxMe7RzsY2Sl8O2FMyicvIvzjT58ixAjLTY7z8wsEro2BB/TiEKc/+Scsnz4jZA/7b7wFazxiIa92liCLN0iiJVarGdI8hOVm2NkdMfy03FcX7kCZSUtTD8pyLX6RPRGuz7nWYfaYpUDiTHzC8Sj/n5cFcGMX9nKNzbPHWDx5AGt5gWx5CTtcwkPKxjpLNwwAzFPKZFgAgFQFmEJ92e+k/wkApB8IAKRQ4BwJVa52B8DhHbz+X/8h3NfeROQNsU5zXsRGqgwu7FOjFnwJ5aczCtu2HmLRNvkDiidSUOibWc3VgafQ16IICH+G2UPdxpuoqcqOMVH7W/zWQskuQzcVOkTDiLW9U8mTXY1a5d1x+6GaAy0kr8MWcCiq+cP8DGMOvyofXesTNKes6UDULENdQloMksxeKX098k+lA/oaw6U+fyxHrdQZWX5pnPXvFVluE6ZygkR6rC4AsD6awlOQQcBS/ssh0qWzvKu08JwBWLC1ZI9bmqfWkG+tWfLbdAZg5eeo8/dlAYByl00SIuuLuj4oxkd+gEKYKIBW4fR2OaMNi4DsRZt8c8DFLN/19SL56FswANXlxzzIhv1G1cJ6F/Xv5KySui9YMADLW6qK1e1qyMxw6mK4mUsQyvGfLS2o6W51tprHv603kj0q5KgWEl0DdNQIUL2qtSId5eRUFkDPYdjkv4jW1tl/bENR86+V5TD5H/5T+TtzehhDQCjOwrEvH1EtMdlpMg2XyqBqEk6pOdJr2xwGpUVbhMCVg6M1snVZGlkJ0uIsnmdmfFUKunJo5EXKT6xNHx21VSZPtMEor9LzmwASCbCSgZvqkXr7tN9bFxifnIqOLjtzVS9kwKk+EiJEpH2M6iEw+sxqAFJ5slofNH6nYJ6I32RgqctZofVjmE/j7XSfXZzOmSr/qmtIVwgd+KNR1pjfoDygab2qj6gb3UrS+Wi2y49qvDqbVrtA0PlNw8qLxFS36u/sntF6u8wrVr/ebMJYQUcpRFTyJQtT3m5ARV/a+sC0T5eObLy56uoBflYAACAASURBVKEK3LavGeGsyvZPGaeWTRQzUC0d2GacazmHZH3GBFqVx8YetAFuDSEk8vrgY2taI6q9KDWgrJK1vjcDru0j0QhAS05uNRzFi5RHidCh6o/cQZG0v1Gh8BQQQsLr1lHXJ01rvHCRxTooq4Dy9tIzqY8EAGYEAK43SMINLMq7FwwAtw/LGWF3chu+M4YVeXj86UPk0xlee/cd9G7tY+HFGN4Z4/DOAZL1GqvZCs+fniFc5LDjAeyIijpEsDZLpNNTuKsLhGcPEF48Rn71AkTSGrz9Doa37mJjeSwHXuxbyH0PQW+XA4CDAE6aYvrwKTJi/q3WsFk14Axvf/htBPs38PmLU+ROD+OjQ9gDn1VzpUrEySaCm2ToWzkGVoTo5Ake/d3/g+j5IyCcwfVtuL0Am/kczocf4Ohb34J/+y5i18Xrd2/h9p3X4PXHOD2fIbc9hFGOXn8C23WwiSNWiGMTrXHzaIxxDxj4wGoJPH1xiWWS4+RshmhtYz2PQUVqfddFj0KG3Ry7Qx9ptEQczrGJVvjg1z5iVYtHewOsIuDTz44ZCHh1sWJgVp8V5iDAcY3xAPjOm7eRL87wvXduUB0WPDoH/urvHuD5WQbL2UG4jtimO1zNYa9XOP/pz4D5DPb+LvZfv4O4R0VXbCBJkUYbpCEBnBEyCgN2UgR9h41P7lAB4spmc4muH3+owl1CzOWfxUpgW8MsZ3kVLZZ0z0UWW0hWOdzUgx3b8DYxNo8fYf3iMdLZMbC6RI/aEa6QxxvkyYYQQ2RpyHP95USTjFgIs22lPHw3d0CbdkoOSQAg/SkmwDEYAW+8g9d+99/BunUXoTdEmPL1phaGKlafyZAZFGl3xEKXhVQfLtvXJn1Xs45yCJ0O8pQhzs0dELqh3XNQwbLmw6gGrSUaXqSAaXu+sK+mIGRT6CTpepZjsiE0i7+zYovVR7lrXsQTzCk0tsoxLA2AErL3qg5ceZLW0pcSAKmHgdYPi2Sj1XQk1+wLyfazlITthpa9sHT3SzCXE1RE8UwGMDZEPukyJfx45vkXocBMAnT/oPydy0ZxXlH4kMKWqnqtlB3WFKEZC/mo2fdKA/L3V5In2tiw4svuyP5Dkz+g9LvBN63y/vEr9QOGmjetqwZlvOotqCwC99saJEtpoumAQ7y6Tb3yN6idNIa8srEW/n4xTzUQsOqgvG/gjZZ90cIW1mRZam0twkrnmgnmpzwkGmmL58ho+XRKQAc8Kh7bPsJdAKK6furtaVRh+pgJwS/HWLSLlLdZvyq3aN0o7WPZTRFiXc2jcktbip3ifl1/8d/V/Yluky0BAAojxE8k1U+18KsBLG2kYfrpmmYAsHLuNdEqWTztAKCKYrWJhqFZZoFt26iyuxoUSieFT75HTIY0wR0AoDAkTY2+tsFSGJn8iU1FX+qzbxplU4ixnpC2of9s/Jqfz/pnBGTNG0z9hJYbD2KsNL+PKwMRuC5ktHhKQ8LOxjm5NgInmxEeamRmKNaVg6zkOsWxY2G8DABoNoBmI2Bcbh1tFbkaTZfpAKCib4qGX8Pfu5ZaKWe27QVsg8HNNq1zth4lxcpn+hUAQDrRpoeaOmhUoNsUiZCMYZnSoMGCmgDAmhHgf9Cb1tRUHQBrrDprCiMxhRgzg6sW4JEB/usCgGIqtpP5bSwsH6dmEJA7JjUAUJFgziZSht+Y1FgXf9rZqPJZmzOjQqrsgfA/1CqgxfuyHDkBgEX13nC9ZkAIAW8gppTdx3h8E541hIs+FucLpMsQg9EYoePAnvTh7Plw+jbyOMKCCno4Aey8h800QbpKEK8XwGYBn8CusydIT7+AvTpDNnvBQzgPb2LvnQ+QD3cReh4i32IVfnsMABzA6fuwswxn9+m+EFQJ2IeFDeUDDPp4/f2P8OxijjQYwpvsAH0fqySG6/mINyGsKAZl0Tsa+aygxNk//xfMH3zCw4AJbKS8h0mK3V//GB//3r/F4bvvoTcZ4ehgjOHIIQIhTi4zfP7kBPNNCjcg5pyFIPDg91yE0Ro9z8L+gMKfqc6GjTABjq/mePz0DPNpCivrsVBgx3bgODkcm5iANno+MNnx0e97yJDifHqJN99/F5fzDT797Dmi2MF8FsJ1PNgElg4opHmD8cDGbg94984uvv/+PgMfPzsD/v5nZ3j0PMZiYWExWyNwPVh5hmyxwPTBI8Snp0DfgX/zAMNbhwxwzFMCStdINiuqooI02cCyYgQ9YoJyAJAXHKvsdpfqU+19Xd+Qb++QYKZ0MMcBwPUshpf58HIPvSjF8sEX+P/Ze88lS5LrTPALHXFVZlaWbo0GSAINQjSBBcWSsyP+7tuseJVd230aGme5a2MzVMYBCYBooruqS6a4MnTE2nER4e6hbla1ZqdZVVbdG8L9+PEjPj8iEQBgHa/BEFRqApIn8OwKVpmgzGNUVcGAP6tO4TjUCbhAVREI6LEtROm/1CmYAYAkc6ITWO9+F/f+9M9h3X8LiTtDDqfpsi3lEqtBOnDII52bUfE/Yq/0ORAd21ARZl2HdLxnAlufnhpH6nht8kdGJjDlALIQTuWno0MmSqxw8dU/AAbFTghzPcVQpx7JXqoRJ2Vfl37CdpKOny6pJxS71KETDupkkxN9X4xnPNzIPBLo1rj1Je3/sauO06ft2LQDYVPfTQkNY4rSfzJBXA0AHPRwjN0k7LW2UYnsWiyv4yUJpH/AmozQgZlw0NWGizI7xrS+OymgfRFL3Krg3q7hf6lRRq2v1M7jVQBAuScbz0bxU80UTXkgfZR11OM7mgAgF57D3DXF72PeTVsCrX3+qLxqAMBWSqlNDDsZT0rggLAEOzJhNMKQ1rgjf9vVGMQX1CjKySYV0yXIbig1DHt16oDDlP6GvSu30+QgWr9bHwDp31f0IHvwGOpKzfmx+0y+H4fZVUUSJD8M9diQMrMXAOxx37gz1gvGjEyejVjZ3kJQaeczyu2qwfItAMiX8FsAcBxAGsPbOOepEYD0iQ4AatzbRCzyDSh5nn6bxWOlEOjslRsBgOqWlYLyWwBwUhaLC/6tA4BTtuqgAm/tyYkTuPG9Z7gzfM/0OkzDRsBU18ApEPBbAFCoetMQE8AmB/SllOpq9tcFALs1YA2n5jMCACktlVJ/yzRFliSoqwoudfTwZ6hqH4v5Oew6wsxeIt1msEsy9R2ktQ0nipBRJ1kUyKscs+UMwSLCfhfDrX3kcYYy2cNKY7jxFvnLx6hefATr8AJ2eoWSwMEgwoOf/gzJ7ASx77MagHYQwQtX8GYtAHjx0cew4wRuVsK3LKwvLqhdMSyKyJuvMLv3AKcPHmCXURSjA9uxkRwObF5uXeIkcJBdvkDy5FPsnn+CimoBujV7/w9/9nP86b//D3DnCyR1gVu3TzGj6EDPQVYDG+q0+3KLi32K0g6QV9RlFlguZ5gvPMxDIKiBPD4gTnIGGlKluk8+vcTzp3s49hKuHaGuLJbCStFq87mLKLRYNKBtl5jNQ8yWc/jzGT59donffPQMdR0giQuEYcRSXWeUz2tnWMxtOFWMD95/iO+/eUI4Hh5dFnj0MsWLKwsvXibYXO/hEshDYyUaHGK8ePQIhVUiOlshuncOUAo0AYBZyiIFK4oEzHgzkDCwEYQuKocc4TZ9fgqYaWSnBhoaEo0BgFQP0YZNAGBmIdnkcCuKALTgpzmyTx8jefoI9fULFMkW9tLHfBHCyhNsn38KN9vDB9HGhe/VuL58BsepUJUZ8jxnJUzIaZYAII2gsF1gfobg/d/H2c9+IQDAiAGA0gG3awIlmYU4XiFo7PCjE/Fv7N2RCAJ+pQ6ANUBW30nNgFIfcoilpHpdAHAsBZabh+Mpat8CgF99AFAxZzhXCuaRPmSj/Xoi8absjylblKUgGxGcEshlv28ADrAU5CZrg2dGmPH1vQAgmzSXfe27Wx9G3Y7TAGA7468eACibH6mrMlwhrQ+v+CYAgMOAd1s3ufFPOynKqk0/nsL7LQCoelgDOBdtyBvscU2evCIAqMk7ZVhdtdsX4WroeDMCkHlwJojR6RjUwewH5SRzQJqRdR0R7TRGXNc9CVOn/G8nAlBVJH0EnnTwzZtuHAE4BQCMoPtCE+sdqSSy3SLc3IHstxinT1h5l96hE5zuwQ7ru6ecoMmIv5ZQvP6WMr5G2nLeVUfKFb8uGLopNVPWsKSxpKXy/95dpYxNfP9tBOCwmfZNjgCcMk5NfjWvH4KFVBNwxLwyHicMzsafUvfFsJzQavBIfh6aWF/KSCdirXXo1PSLwWOqLzACUHVEptdOXj0hP9QIHDUdQcixVh71U+CrBgCyLml62RQW4UgAIMoSRZoywIwAQMcNYPkRavgIgxXs0oeduog3GQJ3huXqHHEGFJWFNC9QoMbibAl/GWCb75DmKU6Xpwx8y+M9kByQPH8G73CJ/MVHqC8+BnYvgHTPALjzD34E3H8TBz9ARfmsPgGAJ3AFAGhVFXbPnqPa7lHtY9ZQo8wzlNS8IQMQzHD23ffx3Q9+gE+fPsGde3dYZN5hv0OSxEBZYBV6uHryBF6ewa1SPHxwgt/7/neRlhSE+ACO57OsioLGvpoxcMl1PRSOT82M8egqxvNtjLimtF/qNEsA4ByrkxCRBxaRV+cFAwC3BFTOZrjapPjk42vkmcvAvDyvkKQJiiLGm2/ewf27ZzhZ8GyXzXYDy7GQV8Cnzy/w7PkWlh2ye+azBRzXwoxyjK0cs5mD06WP0M5xb+kjTRJs0hqFvUBeL/DygsBc6pYLFHmOKo6B3QHPHz1CWZWYna0Q3jlF5dqoqgo5rf1+gzI7sK7AlGIb+hbC0ENNoJrdtpDgtkOfBGz3gfy6jRpUDX4+X6d2YFEEYOUCmc1qAFZxjWKfA7s93PUV4qePUa0vUaY7zN55wNYr367xj3/9l8DLJ7CqFK5bs8g/q05wspojDDwcDgdcr9coqcEKpQATmGdTixCHNUGZ/94PsPzJhywFOHEFANhEARAoSeOdiPB6TQBQP0DtxiWo+sG0V6csH0btqS6eI/Yhv38iAmSKPkcBgP3SugVIhqX5TVKAu34PtwWlfafTs7UDx3TJeA/VTgiR6Z9ym7cJF6n7o82nldkAAafncEwEoNzlJp1UfTuk/29es1CfCi+BwX9MAJzN7gbggA4A8vpdrQfGbSj+OP4p/ZOlkLOPJAAo9aewxwyf5VgAsHXZZckBPscvMwJQBXRlJGD3oEfFJnS7k3+jNlghg3JcfnypEYCiBI2OtphGsKnPWo+UHf1qKbpmAvgwACjfyX53No+SBvxVjwDsFIY3pOikkpqQUV8wAKiuxTH4z1QOVycCEFqXQCFsNAbQIBDOHcpHnZpsfcyjOnqKRJIQS1cRSqFLNVD0GoWT62eonqm202aHJkPcd8Cq4yIgTMD0BoV8J1KEbzz/EWXNFZj6xAkAsC/E2jhQVdNyWmCt5Rm7N8WxFT8j0dlS7Y6GcGsAM1OavKC3/OmAeAPht1LtquzerW/Y1wWouXOE8oLODT3H6P4tANisnYg4GzLuGi4auMA8IX5VO3bovr73d2tE8qLNQynA6CnJcJNxThmgKthiPpc3pTkeAmTSg3tF7d7kZmN/LliPc9qteaMvnjRA27H27xV+V/dEtDPHsRzpnhqA6v3HpACb5QbM09sh3m013oTAlvQV8+X/Nek//Jabpk+Z+vA4/Tc0BynLWtBP8muzN4WBSQCgXdesE/Bhu2XojON4sNwQsHz4XgSvDnD166esJuBidRtBdIqsdJEXpGVcBLMZat9G5VcIb0UokaMoUga82WUJJ0tRXV/h8PR3yJ59hPLFvwL75yw1GI6H8K13cPLBH2IfzFF4IeDPYfsLuLM5SwGmMdlJinK3x/WTpwB1+bUsFikYBTNYnof5+RnuPryHk5MFbt06ge872GzX1DYCp6enCD0PvuvBd1zMZx5mC8LEKuyShIFkdVFg5nk4nYVYeA4imyLzHMS1hZeHDJd5jZeHFFsC8YoaeVoiCHxEcw8P7kRYegD1LzkcMlxtt/AXIdLcwvPnBxRFgDgF9lSXz7VZo4o8pxRdC2fLCGcnS7gUsZiluFzvcbHe4uNHzxDNllitTjGLZiwaMc8TuJ6F09MZfHofRcDRuXJdI6ssvLyKsdnbuL5OEfoRwiBkjnKy2zPaPf3kEdPQ/jzC6uEdVJ6NaL5AGh+w316jiHdIt5dAdmDPDwnZdGtU5AQrtiVJrq59oewF7UBUfM4AJe5EUX00u6T6g6IDMHU73pYIESK52qPebpE9/xT19grYb1mtyN//iz/D4mSBl598hKuPfoXDx7+Bn+9RI2Hpv2mygW1VCHyKWp3j8uoKJdUGFAAgDb+i2Z/exekHP8LpH/0c2dltxE6EwnJFWh6ViuDaZbwG6Xj1h2P0iAnwcana/qhNrhrLRDN3xyQcr7M4WkNvFACUNZOGZ2I2aTLl19i7uUgdtrBbGOYYSvZfI32dXp9H2IPDI5ie/3Qk7PD6SA5rnzGeLtk3w1EAZcTWbp7Vm3XWfZNqdqjsJ5dwSs8Or+CUhyUsDSlLxOXsU/psEiBp39wFAGUEoBoc0Pq/zG4UACPzs0Q0cxPEwBCgcQ7v86+aGctJKH1IP2sA0IyeUvcBkwzU9EhZHHW/8IqGao1vnhLd3eP8E84jQkqxifOSC9Je6rc9pYzq55BxT62tyThoAanj1VKApe3dzq9rq7fp3/L5+vw5LXQK6hK9L0W09b7Hqgyo+nJM/n2ZKcADq6MaCZOiu9FqAwL8844A1OVPB8DvjKrlf3bnhP/WAwCaAJDcOr3iXXyovFSJHjRFZ1fY6AUl5XlHrzIUrPxNAwBHFRPj33EFNKWezFUbe18LABo8MOolqptMNjVp3/LqAKAwPzrvNmdwvFGi1wDkz+c6rqNiBsWCCkBwPtUFRLcr8jErJGj4ugAgBUMe87oRofdF1gBs7ItJITwge7/iAGCf5OxGiFIB+DaOw6wB+LoA4FgR487hWIfM3RpHU+zF+U/uSUXTNlEEXad0TB+bRbp1mk5EIPfsT3OKYyleXHmOOIATTUB4QevxGIwpx2SU3r3OkSkPx9/weh2H5YHc8AYeBwil7JSGrOLQiIVuuuxVJRyqmZWm2G02DGxjNecoCtD24Lkh/MrHy//+CeAscXL7IZxghaRwADvAfH4CPwxRosA23SE4D+HPXJauur66xMlsjnq/R/LiGa5/9xskT/4F9dUjuIcXsPIDCnLkzm7h1o8+RHF6G5kbofIXsP0VAwCpqQfqEgvHRbbeYn95gcPFJRa3ThEEAU6XKywWc/zkwz/E6cmcpddmyR4nyxUs10btWYALpEmNJC3w4nKN1dktXO3WLFKR+DTyXcxcF0vPxcrzsPQcrHwXRVHhOslwlZbYwlUAQCBJK5ZmbNkFzk9DnC8c2BWln1aIsxTBjDopR4gTB1nhUJlBqmIH2wP2hwJpckDg2FjNfCxnPoq8xMXFFS6ud6y2oe36sAmw9Hw4rsMisqjuoOsCjkNBmxl262tYRYnA89kB42abYhdbePlyi9ALMZvN4fk+i2i7ev4CLx4/QZVmcAIP5+88hBX6cIIABdVv3FyhoDTtzRXqbA/PpYYnLgMAeQqwcPZEwXsOAKqQgL4feEddaQmoRbglAOgChYU6swD6E9vwCgeXj1/CS1OUl09Qbi6BIgPOzvDOH/4Qz549wYPlDNb1C3zyX/8z/GyDstqhKilyNWbAqiNaF5dljoJqTLImIBUDc0sBAJ598COcfPghsrM7iJ2wFwBUsxVeUY0at3Wsdu170zZXATapz1V53ie/2wfKmmZDI5+WL2YXRvNJNwcAzVOpEfl/BAA7tiYqLft8nqn614xrBWCtv6cd880AQH1v9B8AHm9vs/GNAWDHAIDG4WGfK2JG/sn/mwe89P8OyDNl0IwCkC0tBtdycP5dq0cFAKVbIrwgpfyWnjHF7TsB/n2GAGBLQ/0QWD+A7YIjN60BOAQASnqqEZaMn+T2ZIQxD6gVeWIygdggegowyVvDf1O2gIy2HOPhLxMAbAFBxd/WAFD5Of+tAXtC55kA4HHgn5Q2xzTB+HIBwOkuwlNas8vjukLsAQCnZIp4gL46/MNuDcBhDusPjmrHO51BCUwAgGZEWB+xdKXRRgDqTCfv7NJGYV4ltLkfc/rmRQCOumf/5gFAM42nd8uMF3HVWJYHxLaB9VS/w1wBQyGY5rFyosaVlHG9hsC1m1cax6Y13Sj4xtAZUymK4G0EuhGz+ZoI4OcBAJpphlMi99jv6XyNFVAfuKFRZgMXfN4RgH0yrw8AVE/2PlMAkHUZNJPUdWJpfNk5LZbANL+na0B0CT8KAPZE/JlLY+oHM0VY367H7pVhKft5AYAyRUXuzlE5P8LwrwsAjr/X6Oh27MZrrpt20F8LAOQWEee9mmK3awYAUgRgXZVwHRc2NfOwPQRewADAp3/7L4A1x+kb30HhRCjdEOHqFMFiwWR1st3gkB4QnS8QLAlUirG9vsKd0zOcBgHyy0t88g//Denj38DaPcM8u4SV75EUBXI/wvKHP4H/8B3snBCITmF5C7jRggGA5Iy7RQk7y3EahbhzfgvvfOdtZHkK17KwCFz84P0ZqIHtfrdm0X5lZjEQLXctJFWFsrLw7GKDwo2wywu83FwhK1LMQhf3zlY4CT3MbBsLR/wOXMSHFLu8wgEu1gUYALjLSiSlhc2+gOU4qJHiZOnhfGHDtQoEQQTX9eH7Lj755ArrTYGi9rHep/BnEZZnc5QVRaZVCCnS0GH4JLI0heeF2MU5i4qsLVoV/kMNQjzPYVGNVVkjTWPMowDb6zWyOMM8miPPU8RxwaIanz29RFnUrHag63nwHAd5kuGw3iLbHRBEAbzTBfzlnIGStH7UrKU47JBvLlExALBCELmonZKlADcy9zUBQIpItGoHDqX+FjYHAFMLZ8EZkssY1b7A1aOPYW1fIKdoxHmEt374hyi9ABfPn+PNeYTLX/8jDr/7J3jZNbL8GkWxhY2MWyCsbTFFuFQoqFswJahbFRzfY12ArdO7uP3DH2P+458gOztvAECKglUNe1mbuAsnHLGZe+W9Kul7DmsMgaRHfAsnRryaLu3UaDXtsdEMvGn58roAoJnxwvXLcR4c1z4CgDmC3OYlfQCVes0YACiHSSl+ZoSPOv7pDBr1jabt25cB8OUBgK8Xrd7OcwAbGrEih/ihXXt1LdVxsoj2zj7rt3pMAJDrPWnj9JcIkvz/WUcAflEAoJmhIm3hhoZKCbGGOxs70jyglinSzHBQpJC69vIplK1CNXINnleW5vMFAPmL+PwFf2kRgDJ6qz2CpitlphCfIb9P4zcJOIsFbAG+VtK13KynAN8M/BM0nuyC++UBgGpAWd/mPsafmTxg60sBnii70dEDygc3AQCHo3tb3tckV49uYwBgo0xYwJmtM9QNFVubsdp1PUwxav5fmPpNIVP+auUqEqSUoqxw/HGqup3EdArwmAHQdTi5Qz88iq4DpEfHdKikaGwmGibaut5k/ua7uvzQ9s1taD+odfu2j16TrzVO1TeLf4t56if0mvnD6No9wZTPUp/T7+Y2VzZEUsE/vs7dO/Xnq/Q1TxqZ6jAsrKEagL1kFE6KTuvjV1SIfz1p+7UAQLF+2p7vp63cJWwMqg5ThRmjz9R8hr8XKnJUAr1u1+Ph2d1Q8B15eTcFuDUiG5qKzoBMrkxOsEu/Zk4MABz2sFq5z5/BJFlXIDW21DEKUwcAVWbgtWC7MmicPzpFuo0HTCco98ieZlg8YrlVl8Yidmrf6t9zR75/4VtQV+7SIxnEuGyQOq2FbAxKl1+T/D0ZhTG+Pqwb6ciP3SkpouhipdZqw4sGYE36mkcd8KObSqQAU0dg6lbreiEcmxosBAhKD5/+3W+AzMXJm99F7s0Q3LoNb7linWQJTLx8+hS2a2F+mz6rcXoW4t7dc/i2h2Kzw/bxY/zmv/y/iH/3z3AOL7GqNrCKA/K6AsE3i/d/gOX7f4ALy2eNGmx3CTeaw5l57PT2JJzhjdt3UGcZHty/x4C07W6DqshwErp443SGs8iBgwSh68GufCR5hW1dILddPL/cILU8JJaHq/0BWVkiSQ5YRh4e3jnDzLYQWkBkuwiJtnmGJM1QuT4y28NlUuAy5gDgPqtxvS8RzuaUzItFZON07sB1KpZO7Lk+irTAxcsNSsyQVy4OWYWcIhlPIwSBAxslQs+GZ1UosxSr1Qk8n9J4M+wOCZdPti0izytQRBulHNMfz3NR5imKNGPptPMoYpGbeVZjf6jw6JNnWF8fWCQndSshXb++vKKijSj3CearBerAZbUAk7Jgtp9rVSIC8JLVAXScAsGMmoAUBgDIJQPnT8nDJnih6n8hh0leUiQNAW2VA6f0YBUOBWzCSm1sn25wZ36O0Apw9eljHJ59jKJKcPbO2zh/8y1cXm/glQW87TUufvUPwOUj2OklMgIBsw0cK2eRonVlswJeBJhSPUeKACRE0Pd9xETT8/u49cGPsfjhj5GfnSNxPJQWNQHhh6JS7jWF/4UAN+XRVA247oGKbv9q8qOvZEO/0mglrBEBZcrrfvXUypwp+/c4AHBYQHUAQGbPTNksjcUmjB9hqRx3m6J9lHEZtOV2Vb9vodrtHABUf4z/TSoA9V6+B+SP3EGa0lb0xTHTHc1AaCGMgQVqw70+i8Paxn4RU5x+5rhvxwcter0q69cHyLS0Mv0L5R2iCYikt7TKNBBQCxRoI0CbTCslFXjK4ujbuh0aCe7SbD/peon5q++5aQSgDFhrbVGZlSV+KyWwOtdwD1Esg7CzGvbtWnXShlBLUREAqMpIVR5OAYBTnouky1iQSVvTUd3vLU+Y/m8l/KmWi9QeC8qBSw8AqEt2YVPJA1YxWC53pjinmRkvlDv6M2Hfs3uPGHV/hwAAIABJREFUkST9Lxnzb9gMx/xPYd9Pj3CYIMw+NQim73Bdxmuz6DxWZCBoi3BD2ijP1PaspLOh26yT/+X/0IahDb7n3V2Aw1Qg4xxkPlLbcHIvNzq4r4ZLl42PZVcpsHVUd0rIj6eZjTWxoPepNRE57Zvm4Hw4GkFktI4pvIaZYIo9xvYyC4lvUmBMOoj/D4bAyzf3vKHprMeLrMpi/OaV/A1Ua2hoFnIMxgo3TCNqjo1ILJ3f1ZKY3e3RvkURrz0bShF/vaBGswMEfdVF1gDoJj9fYXwjzmrMAJ4q8Nm/L0Y5gjdV6RiB/U9iJ5a6/tXA+2k9MrYGohLTzTRSZ6Dj+9PYizcTJDe/mrGzzutTNfrG5W2Xfjq/m/JE4XB2a4+KGAkKY5wxWGOFr3YDAA5RR3N0+PunwvTVR43pj+kFUbRbg+brAFZXEikOkWb4CvE94CzKj5saPQOD0wDhnno9vfwxBP41enPQBGGAp/6jO336d+P7kzY7129TWmhoZdrU30ZmKv4347cmwqUFALM4Zs1A6P2eF8F1fAZmRbWLT/7bL4Fdgdn978A/u4PV2++ioFqBtY00TrFdr5EWKU7vn+HN9+7irfdvIU428OAhvd5h//gp/vn/+SvEH/8a3u4F5tUBTpUwUCy2XZRn93H+g59gszhFvTyH55+wKLjZMsSDB3dw9/wW5kHIAMWyLHHIU2R5jLpI8da9W7i3jGCne7xxvsLCB6j/Q1oBj9cHXKYlHl2uqagdCseF43qo0gq+7SDyXISujWSzYb/nno9ZQGm5DsMJ4hLYF8BlnOPykGBPAGBeo7RCVJYrzmgITM1xdfkCcbLFWw/vo85SJHGOq13J0pmXJ7eR5Bm8ADhbRfCqHPPQxW6/xmq1ZKDgZpdht0+RlzUDvGbzOYskrKhxB7UaFsAu6SeHSugVCeaRjygMsAh9li273wGXFwlevoypBCP2uz0unr9gacD0J1/vANeBOwsQLGbwWKoyBySzwwbx1Qvku0uECw/R3EVuZwA1ARFyTUZysS6dWgqw5EUT/OOnH+wEXo6/tOHmPqzcReBESC4PuP7kEvdP7yEK5ti8eIGLj/+FVWn4/Z//nAIFEW83wH6N3ce/we7Rr2Fvn8Kt9qhKatGSIksJRubvoMNPsn/onRV1ialLRK6Pve2hfuMNnP7oQ5x88FPE0RK547DagCr4RzOhiBC2g3u2IEV/8N05rIlfrWmZup/H5Ie573v0lQYQdr/v1BQ3HskdwGlLY1o3tHwxdq3pkDcRgKoJpzxArosJzGqf94J/Uj8b9oL4mGYsTaMx6TsdAajTrrVPOef0P7td8ynJb65MV5+NaH92M++yq+oH9m/xmVwPcWlHtanjM+nFaGi3Ecz96z6m32p+wCqIPM6FKtDUXknmVJenOEu3YxdjUKIB9Xv4wYYacCEPBkZVs1xGxa7h8sXc3z1WwURtweN2kwSsxjspq+tt8oGwwkSwiPzfkI2jNwDhe1cHcHS6qhGF/YlmrGnZAL366SiI3vC0an+aUZ7ynerheSvN2ZNGm8x0jXldHvCsCjOwpZkOf0Fn76nTnTpgGpfNRN9GkvVuv3FvlZ7e1v0d3r/DEr3L7+a1U7plXP81ByB9h2e9lJ1636h2atFzGdDRd7nyig4AKDfY0DC6DoTK5ioxpifSJ5BllIg05IYjxBQRc+SJHed0Q+oJE2mERcYLAU90KdPp1Z4W9a9LX3j9dJ2rISU8tQJcn6hGl/nvoXerSrFnAzBm5zV5eHUz3dFr584B3mEjYkj5tmtoAlaa6uoYDubzugZne79QFiOKjhsd/SJQ0t7cL10AsGf2Cug6BgA1s7kx/w9xuwRU1RXqi8KU39caAMhWZeAkdEi6N6fMPReY6U3mJc3qDTA6B7gp/W3sZ1yAj956zJfm8hoA4PgJuX6A0H0d5wBtfh1F0z8/KV87EdYTjoVucHTlwCQAqEzimBp5E+ruFXw/oz4h63ov3tJ7IqjTTzcY+lKk+LNeBwBUWaaXPwYPZVRV1RqaKn90Heox/h9zfrgqta0x+T2+Qbj81JdQfsaJKGvM8DESdlkXObJDjCJJWJqp50dwHB++G2AGF5/+/T+juNgjuv0W/LO7mL3xFvzlGZ5/+gLxZs9ApVt3bsGde3jz/bt48O4K+/gK83CBue3ho7/9B/zyP/8Vdr/9JdzdJbxsB69OUZYpDjSc5W08/PCPkd57Azs7hO1EDAB7+52HeO/dN+G7DuL9Hr4T4ORsiSQnKVayVOPArhFaFW5FIbwyx4PzJWO9Q1bidy+vsC5qvNwd4K9W8MKARTaWhwp2SaG8JZy6hudY8CwLge/Cc2y4IoK1dGzkNnBxyLCOM+wzqnVYoXIiVJYnCF0jPmyx3VzC84B33ryP2ydzrK/3+KffPkE0v42Sog/TDDVyzHwbd5YRAg+IswNmc56qS5F/VKewrG24HqVg89p/RZkjpGYoDQBYwXVt+K6F5SpgzkYe50gPBTbrDNs1/S6QpTXqskSZ5sjjFJ5t84YgRQHKlA0Xc9hBwLoPh4HLAMBkc4E82cB1CyxOAhR2jsouFQCQ7yJ5gKbqJc6V4ntNeuoAoF05wMGBk3twKwfbp9fApoRXu/jggx/hk48+wsvH/4o7d25jcfcuLi4uYOcxdk8/Qf7iE1Trp7DTC9gEAFYpLOQiAjBHXRWoSgJkbURhiKrOcNjvETo+Dl6A6r33cP7Tn2P+nR8g9mfIHX5QQtcr4qrTedTccZQyPCQkufk3bH3165uWdu1zpyxN+aSuPNFThLvfk7wai7J+bQBQkT/SHxmWWgIQa+wtMW8ja6e5f+DZU+Za+zidHqa8NP2nvnEfBQCq42+askzxRQtoTfkfKneo9sOU/dZYmYYdr9FP6sK+QfTY7p0IWaPJhE7DCf3HmnCUR55/9fmesol3d/BdXpRjkfa4ape3No3eCES3x/vsZ45fSlnYdvkVVsyo7OA6enz6k1xEJdQMn6HPjxiXMJw2rW2m+K2Gz6/WABwGANtRq/iaCZTRmDpNN9SF07r4dtefz9MEAKV8FWsiJq7a62znyT0x2mRmPF2fHxDVopt8zzqyAfIBDNF/fH2nfSuungaeMpFKy+g/1eV93ARVeGbiwsGvR+ZIZhutz8A8+Kzb+xsqSGIbcm96hDpe00ivkc3zmgBgG6LdCAwtpWh626oCRFVwXxQA2NaD6yevLIQ7RPypCEC9i1HrlDXKTXvwqwGA04zRf8UXAwDyOffv8fH4P5GUaAxeFaTjTS+6J4d9Ct0UPq15zRTEKAAotvCgEa2EyIlZHAcAKg7KSBfoJhpgyqJs7O8pgXxzAFDqrz6lfRRfjjRa+NoDgL0pUwq/TdTooysZYDMoRrsh7t1L+9f8mwAAqq7oUbymKVzR6VOJAOh3qBSZLKKT2hU05IkiK74SACCLCjBcGkNWtQZxHwUnHKAvEAAkx4aJwqJk4B8HACvWBIQAwMCLsICP57/8DQ6PXsBZ3kV0dg/e7YcIT27hyaNnQFljdecOVuenuD6ssbwzx9vfu4vt/gJ3zs/x7oMz/OZv/wn/8Fd/ic1v/wnYXMDab+GVCZDvkGUpMDvFnZ/+At53fh87ijwMQrz3nffwnffexPnZCWIKbatr1uSBRfCRkW0Dnu+hLHLs12vWhfc0inDrZME+S/MMl7s9cjoMcz2EsxlrqJFRA4/KZRFyVCuPIsQoZYlANTJ9KXKMdACluRS2xaIG90WFdZwwUHGblijdGUrw7rE21Si0CtjIcXY2w9nKg5XVuLra4e9++Tv40S3UVsgi+0rqjIwcbz88RxRRlGEJh5qVwEKaFaxWIdVfpPTfLCtRUPcQiwN+8tCPBBdF/VHX2zAkYHSHw5aiIS3stznifQXPmsO1fCSHA14+ew6vthG4LrIkxX63g+M78GchQLS0aniuhSLZIdtdo0jWcP0KJ7dmKJwcJWukITphSadWAPxjlijf9/S3TMHhMpNoj9iFX/iwDwVefvQE9VUMbBN898OfshqHebzFPApRUDTks2eotmvEL57APlzBKTYo05dATQAgRfhliAILtlXCdS3UZYXzs3MW5brbrRmA6DgBstkC1ve+h4c//xM499/BgWpEElDBwDD9QE4DNnujDPQ6T+Yun4qw60oF014at/EN6dOJFv5SAcChqIwxh8n05qaiv1pzsiGFapeqX8t/HwsANvpvxEb9pgGApk0/doA8ZLtrNB8FwCf03zEAoBxwJ/hEMBnLoJyCycQ1Auxsa4BKcPyLBwDVUY/x2NTMCB+R203Ksj5AsHFh+syUhi78Sw5oSmDNAN6UdTgOAGyFwc0AwPZwuKWBPpZxAFDMRfqNfGa8EIrCs+Nd1I8DABmXi2l2pPtEF+tvAcBhn5rxsREh2qWXAQCqPoTc9kc7N58hAMhsop4X6xFNPRFivVF2/TMwHa4vBQAcS2Fqaq0oy2YQZRAAbLS5uuT6huzQVwNPFZE3APBIeo3yxxiAxXZ+M1AjJbAbjtw15kwuaaUIj3Vs59s7VirsTkbt4ARMBayDf+xMfESBHwcAqi/XR9IPAOrXdBMYWvOC3t/gN+LjowBAZUijKcCSPwcBwL7FHzPY+wHA4ROa9voxpT20vNLxGk40kakNI/JDUV7mVZz+X2IE4AQASOP7zCMAO6Q6AgBUWKLZcQNy47gIwCHtoQ/udSMAj9aL2oWKsSwihOT0+819XUEz0L2hl36H1GfCVuNne1MnqCrA30Pz4RRgVW63E2zrzfDOgOZKqPKSj37YgOk/gFGIKQDAsXXoGJTGxabo0qVT25VVAoA2NcpIU+SHGGVVobZduG6IwI2wtHxc//pfsf7tY1jhCvOzB6jnt5DCR215uH3vAWoC1uoK1/trBKsA7/7Bm8jKPU5XM3zwe2/g6UdP8Ld/9Zd4+etfAutLYL8F0h2QXANUq82fYf57H+D0+z9COV/g3hv38JOf/CEe3jtBnhasWUmRF7zGm+WwOnib3Q6W6yLJc0SzOTbXa9hViSgIcHK6hEN9Jgg/s8G651JpPwL9MsIdKdNZlNkpK6CknGGKrKfHCx+npJRZAgEtB0lVYxOnOGQFNkmB3IlQExhpEQBYosz2OD+d486dEPF2D6e2WATepy932KdAVpK8dDjflDkWoY17985g2TWL8CP+oa7DsDwGau7jGmmWMz73fYo0pO/atMw0jlk34Cj0kSUJ4n0ClDaypEK8zbGKTpDHBQMA99cb1DmHKz3HxfX1JearOZzAR+26TFZm6YHNoTxsUCdrODMbZ7cXDADMQQ1PeA1rebAr+X1I63H+VOzYumrqprq1B7+cIyx9WOsEn/7TR6heroG0wOr+Pdx/cBe79Uukhz0unjwH0hQu1TzcXADZFr6dosyvUNcxiwAkAJBqAAa+jcU8ROj7bJ5xfMB2u8E+TlA7AerVGew/+AHe/sWfIV/eQkIAoIgAtIWzK7eROq8uOMJ3/1CaFpNlo/bXq0nY4bu6ErZbQkq/pi0Q011Brj/NGlTHA5L99BruKddIXOMVXTtz2KZs5LGwDcy10XSIkZ2k+kedNwzo60kA0LigBWRVyd3atIqmEbw1zSOq7d/XFGZqjCp9VZCI7dyRA2Sp/MZAiukI2H6rgM9apgAP0EDbq2rmgaJzm4jLKTqKcUiwS5QPavhF+I5TEYAaLRp3qpGCRkTUmG3Ax8tGNbLlxmhP9/MmddMpwJI6/e+Ta6Q2jRTdAfuAV/FZBwBsSjIpXK6QoG8umvxRN68BSkp+0TIQGz2lzM5wlM2dx7vWS6nBEKaRDMUJAJAFuLQhUH0g4GgX70noepp/tBqIPVtg3Fv9akcAmgCgZA8TQRjTFqqrcZRmUwxq1Zcbki69EYCNkuoBAb/uAGALSo27fY3yUFJ8+wSAmqLcMQToBvEa/t3EhugBAMciDOUMxo3b4fMlfTStEG0NYvWzQRYSXzTaRIS8KvXV+oAQls/V1qjpV8Sq8lWeLxdnQmfeHACUKo2vVXfDNiagZge1fMHHy2U4nz+bl0iJZk/VDNaucTFV9FoTFj0AoJly3iqeKQNjiD8Ng1wDXPma9IF/2sHnwKs5fdl5Zu8Vx0QAjjkw0xWQjtiTx5BtZGtMKTA9Qrj7oHED6pgqkP0yh69Pf3p3v6Lqm6TJvzfboyylbbIGz/QCDOLfA1ylymGzSDCX5/JHzEdYRvSL6pOp+71S/M8+ajS6dMoSVl8p/s3UR1+Nl8axUAxBIXPa/f4FAIACQB2cmmB+04iVBJw2aOQc+G+WskKgX54j3e9RlpTiSpF2BKbMsYSP/NFTPP3vvwZqiqQ7g3/6AIfKQ3R6jtXtu4irEklVIq8LRKuIpQJXSHH//inee/sBXjx+hIvHj1FcX6ParVmtuctP/gVOsUNJgKAfAfMlHvzsF7j//nv4wU++j7feuo/QsRkwWaQ5ZesiKwE/iFgUYFqUyGGhchykJbDd7REfYtYhNZyHDPyhlN57t8+RZxkDEAlHCym92aLIQa43bMfCPt6jrAnosuAGHmzXRV7XyCtKJS5YJGFR28gJ2KttZFaAioBIx2YAoG+X8B2KHjwgOexx2CZYndyGHS6Q0GupGQohigAcWqgswTwMGDDpOBayjCLZyLmiuoIu9nHKqtlJHVcUKfI8QxD6bH50wHfY7VCVJaIwQpVX8ByfgYBPHj3Fwp9jEcxxfXHJ0n4JlKQ9VuUFayASLefwogCWH7DXWlWB9dNHQLIFqAHI0sfqnEcAEgBIRQdlp0SSLzY7AGphlj5elXpIbsGyKNm+C6wQM6zgxRYOj55j+/gZ7KSAVVDNvoKNpcwOqNIYdZrDLjMUhy2sMmGgHzV6qfMtrCpFXac8DbjmqcAWgZWs/lRby42afBD8ibM7OP0f/z1Wv/cDZOEMqeuh4E2D4VAKsLQp6V4jhdGUhbwLJL/BnHuHFhPpfNOSuHtF58BIG2CPPaWCXqLGKL+qq8dUu0Ozc6YQpa6Eb+gzpvuGvpM+ezPCRuC18zNlYOsPdIp4KFknrUZpbH2zZIKwoQej3SaEbJdf1DU016f1OJg8lnw18g7TBjdTgHkWy/iPOXdGZ8V+mbr/VfhWv2foDbxZUL+Z0bXt+cKqNhLptGNHz5/H3QcR99ihHdeTvPwSH5e6R/r4V+00zd6g6ezpGtl9s9TNp3EG5ACgMk7B39pnCoE771NsodaeFVfJV2s0b2s2svRXbmQZS6gIWPrasPE069BYvrbrLv9C7+Gr2pNifbS5dQOqzANkEwDkGYoDHC4XXLlA51d9D3fX/4iNOVWDcKIAk4xqHHrTWI1DmvZXPQVYXZpegNWgn6rbTTt52l7uSq2GBYZYxGwCol7XVbnc4Gh/vn4RgCYAOJUCTDWOxroOmwCgqqxMmqsRcaqQbCh6BAA4IKoGd+qY0aevL10pO+ZNRf/J16niWFFsUgnJzd/UyWtHLwE/CWG0AKC2ZQZMNU1LdeY+TKNRddV5Tldh6vfzzTpEYZliyDRMq5ANANCMIPzsAcCbiI3eHa/NUQNq5amjoJx5OttwycAQOH2/BQBvskIDIn5EU/etqW5Amzf3GYr9LxgwchtnbXxmnwUA2Gc/T721NcQbmL+Znl7TTjXW+SUMAGxeoBeJZtLAeHmviJiwq1Td0DVOhcwRhm+3y1k75s89AlAAgGPT6dDjWH+HS83mIEU6nAQAoiiQEtBVligsG24QIfQWWMFH9fg5Pv3HfwYhbUF4AndxB7k7R3h2B97JKXZFgcpzWTppuAjgRQ6WpwHef/8B7t45ZdFcu8trxFdbHK6uUGd7PPv411g//R3if/kVcHYO7/QUH/7FX+DHv/gjLG7NsFxGmDkOB4byioaHtKhBSbRxkiMta+SOzSL0DkUF2wtYSu8hPrA0XopqC1wby/kMPnXOLengyGXNTayS+yeu48ALLGqQi6ykhheA4xH4V+GQ5YizAnFOwCYYAFhUFlL6U1PzCAeOZYGgsBV1Hqkz1owiT2OcLc9YHcW4oqjIBI4XYh9nbHzE6wGAeeDDtamhh4UkjhkASBGOFClIdQCpjhFFQvADrwr7/Y5FAzpUo9DxEB8Slu4aeAE822eRknmW4+XTl7Dzmte92+2QHRJWB9CqatY5uEgT+LMArgAAOc5YId2tUSUblPEa0fkMy7MZMjtDQZ10XQ4A8m1oMTp2dGwfw0o9RPTLC9iOi8iawYk9HJ6sET9+hnq9w5KAyCRBdtghj3eo8wxWmcGpCjh1wdKT6zpBWVPEXwqniAECBCkFGBnqKm4BQFpcUYSdtGBueai9CN7738f5z/4U/lvv4gAbhe+yBiMM0BRdgBWB1bpYYm81fi+7SIE/J8AW1QE8VkRNXTcNABr+hGpP3RgA5PMdDUkyBqxqx0abCTr1iaohbFE7BG3ewZ/YOGFGrTPOoT36uXk/t8P7DljlK1i3ajntnsWYwkKnAUCTCny8XLd081+G+KHxiwyHVz9Q679b9aka7caGJVLiJ6yfKR59ne8b+psP0aL/1C91EHBqfdo7OS+xmn2yfukrAIDm+8wIygakIEI3zRyHKTTqUbHFGrPGKIKyDSCQthK7TQECzRrNJk1kt2xZrqtNC5e8q9pxbXQ683g1gojrpBytmIXKDrIG+dosqaLNd9g/7jvQ6Cs39nkDgOrhkATj+4Cq3vkfsb7D6CR/4hT+8rUGAPvkseEjqBlgfdzCHqHuhRsIK1WfDd1mnf6v/+cgd6uCt/8BX28AUBqJY2dQnxUAyIWaruyleGpk0AQA2KzHDZhAvbR5n/iwO5rPAwAUiquxggTVheCUTKo381BZkgNorSBRvmueKXZJT8Sqztyj6qpD1a5hZUZMTT+PZ5i3J2l6yopKG/76rxoAyAGG1gjUIzXbdRkC/yRR+wwdTt9xAJBHOPSLKJOfOzaYiCYYM0Emo3Jfca+pgnvQeOiJ4Oi1IwfHMNagRd7U42AYJ+jm48ccCv3aPv5Xja0pyr9aBODYofnoGzUZJE+eFQenU9NOnUub7qLsBu10uJFCpvh6DR7qNz4bqdlzANGOmYFmA02K5FhfKwWYPWSqi3IrPca5QScSv7YLAIK6AhcFkv2e1Z2j2neuHyH0lzixAthPL/Dx3/wDsI9hORGs8AzO/Ba8s9vIvQDWfIHo7ATRcob5KsSdewsslg7eevsWgsBi0XuHbYrLJ1d48fQZwsBGur/G9dNH+NXf/Q1QlvijX/wcP/3Fh3j3e+8irVKEgYe5bcOtLJTUfTfOEC5XWO9zbA4pcstG4TjY5QWr80eAZZYWuL66wMO753Cpvp5VsWgESqeN8wIFHJbaHFJDiKJipSSCyAYFByZpgqIuWFfcwqrZ9Uleisg/KnXIAUCKQswrgv1sFglHAJ7n2cgzSp+OGWB193SJKIoYHTeHAklh4/mLa8T7HJHn4/7pCes6XBYpa1wBkbLGAUAC21wWx8ZP4iukyYFFx82ojqHtMH1GYCI1bLFrG57tYXO9w/p6jf16i4AiHClqMsuRHGJ4FLGXl8jiBHm8hzcPFQCQUoN5DcAy2SLZvsTs1oyBsBIArCUAKAECiqhTiqYPOdzSEa4r7mS7rou5s0TyLMH6dy/gbA9w0wwBRVtuN0jXVyjjHWtsQl19nZpWNkee7lBXKcqa1/xzCkp5Jtp1AUBCdy3WEZhMBAe57QPhCg/+5N8h+uCnKE5vY1cSYO10AECZWWCWEOuKnm8BwDHxq2pH1WEasuyOAQDb94mnyEX5BgKAU6pNhWCYRP8CAcDX9Zda5LZ/lswzESBR54pBALDVaxz8P1YrCl5SNnw3enI6AvCrBwDyzu3cP+ZUlP9WP2vo24kgbm2hBsw0ogJbG1/KQun5UwTggG+p8OowCNX1qDl9lQ2vt2wS0zAjQfnHXwYAyBOw5fvbJjBHgYCMdGP82+97qHvlmw4AKt6F0POGnavQz4QzGup9uQBg23GmVwz2HiHpjtOQkmiIo+4X40yMAXCjQeImiRs3rOe1MjyavuJxvWMMSE+eAgDNFN1G6Zih+przqZsI7f+6G0ad/2srtAF3Udn+4goZ9TgNcOnuHR+/TG9oRYPkoXZ+bQSgeHtzkqLepQrTntkLmkpx3sdnunhS58P5ZqqNuRmib7aJH+dNWaOwrWWnpgA3KaoKC78SAKhMvJtKbQroCYNDpg40qkrfX53nm9f3bceeyChF5Y2GsI8DGGMr355tDZ9TTyuodm8MSbEx8TQEXfJn0du7XdUNaTBAz4Z+jARDFw1LjKEU4C74NzoAMRFxTcMLgq7iYZpiU8jIitqLmiYj1NW+OibibxggVOnB/91NATbn20aUMIPbSAFmxqF4oepAduYzuEQj9CUdUo3B36Z8VvSuWIspAHA6imN4fIx/jS7KY9zYXeP+/asaPtJ4bw7PKAKwLJHtD8jzHKVtwfEj+AEHAP3nV/jdf/171FdblgZsre4A81PUixVguwjffht3334Dd+7fwe27S0RhgSAocPt8xtJcLy+usV0f4FozHPYxA3Ki0MP65XP866//GbdPTvDHP/8Q87kLz7cwm4cIHAc+sUFeIgwi2B7w+MUBOwK1CqCwXOS2jV2aIyOQ2Q9ZFF1GEXirEJFHzbBKFl2XlQTC1Sgsn6U2l3kJSkml6DequUfkTqkGYpGxArNUH49gJIr8ozTgfZqjqC3+h7oHw4NteawWKt1rU7OQgiL9gFngsq7EQeCzpNTNPkNe2Hj69AKHfYJ5EOJ8McMy9BAFNksj5s4QMSZF1gHbA2+8IeB0PHnyCGenJzi/fYvXQmTenU39S1AWFZJ9hmdPnmG73rIoP2r6URcllrMFi1I8bHYoswLJ7oDisENwumQdke0gYq+ljsLxbs0BwGTDOgDPzkKeAmwXrMajjADk3EX1DEdSgEUZDek8WgSYllTPMMCJd4JYSgw/AAAgAElEQVTnv3qOw8cvgDgFDgd4FOkY71EdtqjTA6jLrk2xnnUOBxkDAKnhR1lTJGMGmxrIjACArR3qorJD4P47eO/P/wOqh++iPDnFPs9QEQDLcHbZBER076UaeBMbTgP4j4gAHEolHZbP4/qhU/Kk14GXT+8GFLRNSvoj+zRrpkE31E/HU+RUC6CBEsTtfGbKs0bo16+GBW3EnE2Ao5W9/e9QAYG+A1Y2djmmHrOOzWfC3GtrxiqWTmcyco0lYZoK3xpbjHlijeY1HF51fF1/UOhoaYsa6aGM9UcPkFs7a5B/2UuN+TUXT9mHrAjlgP3V8nKXLgoAxNZvfJGaNFKKBm22gfRf5GClPaP6uHp5HpMfuF2mF+DpAj/jNuyozcOePzY3XkNxDPhTo18VDlXszmbXNvKR6yf185bGUh5y6tHBGnkHZh1R/ngZnTUWhaZTjwBdQ2Zotrn0RBQ7VN0APUJEiwAUNQMZV9IEGt4fs/91+pspwDzLQrdrVR4YBAKF3BmjTW/QjiEx+i3A9qLRGulH1FCfikAc8k2G9Z3xzYiAlbwgV6ePlib95DUt3wuOVZbYWNFx0TaFng1FAMqF4TypGFCdLoIKdN+g6VJwit+KfDXlgc66xIl6REFn0xvTNcXLVFdetUg67VbWpnnAgaaxHQMA9gEMcgF7uwAPLlmrYKVy4+qppZI53wn9fjQfSzqTo8C8jcEUM/ORwyOSwmWMYce70PUITPZ6Saep7c0N5fb9hrIQzxozkhqHZ4CSKmDHn6MwOxPS+h7oUMsAQMzvx5ukHGHgqUNqKCEVlSnMDJHdYzub69Upsm7qoomT0HH3QQ1Q7y4Ar+HBiDyyoybMq9HFJ4NrWD4wThydgAIAD41wxD8xTYn+RxxHweF72/ulMjQ+6ZWPjXJT9QFzSFUvqTV0BkfZK+/5aCVIOZZoZNpMpqzRHdAuRU0HqNN1WbEQuHpr29aZJrgEB3WW4lf12HYK8wyv4Th/KQ5zr+7lm1+liU0dJpofpQXfqKYYHt8YgN15pOFAM9hILaIob+gcnrX2BLunLJHuD8jSjArTwQkiuOEcKytA8GKLj/8LAYB71KUN+/w+cHIL1tlt+OfnuP3eO/AWIeYnIWYRcPfMw51bEZYzh9UXPGz3rKttVTqg7hxu4OLl5UtkaYLI93G2nCHybDhVijsnS4So4dG8KupQ6yMrayRliYvdjtXjC5cnsLyQgXQEAFKabklwX02RcdSNd475zIXv1LxL8D7BZhfjkNKhmQfHoxqFNSzPYZ2BKa02S1NURcFsE9obrMZgXaOyHcRlxarLsf9XDuzKZ2mwDlt3qllVorYqWLZIhSpLwlNZV9+qspGnJZ58+gSzWYjTxQzniwjzwME8suDYoqbfIUOckPPmwXJ8kWTKPVNq9hFGBFLS2nL+yvOSpQGncYb9Nsb6aoP9bg/f8VEkKXzbRbzf48Hd+9hvt4h3Bza/lJqlzOdwKQU5CDlQmSWoqDtKEeNwuMbiLEK48lG6OUqnQmWLFOCmAzavAdj30zrAEliz4Vk+XEq/tmysn6yRPUngx0C+3aLYrOETGfMEZbJnfyga1a4I/MtZFGBBEYBlhqrKYdUZrCpGLQFASgtGAgsZLIvqDPIUYGoWw2r/hUuc/uwvcPoHP0J15x4ONqWNVyxdncJDeU1DUdxe6nUVgO/bcH0ppuK6o6I8JuXClAJrU+5EDLUifozof81WaIUFl1+tLlGH1JWPqrRTmwL0T0QFGJh1qABqbYXV46zsPhlvHug2sxAsqTeF0z0RtT6b1IdMEsp7RYZDw919w1T0VYcCvYCpZKyhhVdWo2dbTQGOpsPdeYSWbtkenGvzN1zOsTaCU0nKegCICjJzndOrtyVplLIBzUcawMn1sz5HE8hWFq0HYG7pqVobfZkfYrxyOwr51xufowDDxH/q+FQbkFvWndFrjMGk0hgwLlV3o9tVJtV5if6npQQbkYFd8Sb9uUYY8vq0TR1Rnf7t/mZvErJXyqfu5lGBSXVX9ILWHfkkU/PlGFtfVrEIu00AjaZx0ruRfNhYQuwhkg+G7LMpuaUvjvkUkxekaa/uYbPLbVdqjIyBHXCPKBgBeGryXtlfU7Pj941dxec/bN0qfNU7zCNGwOxbIWXE5ZIPpUwbml8Htm7kvqLA2TP7xzE+L/6M3hTgVkm1DobcDKZC0wR6nxPSfMaJObrgrGbLVMSfvhKmgGb3D3lNzQlSK4SnutzwmlAt5TtEHRhvY1hoNRNNaWhylXGc13R66l/KqaeNbK2Br4j+CgDYgGdjAmZ4E/CCtOObcMyBbBH0rtLgabX6FtcMOLktBP35tVIY89/8+vFNPBWh39kPzWmvFC768823yaKuckHM718HAFSVRkspPeRbEz6SnmOH5uYBwEgX5o7BPyhEh9ZAVfDdm+lbvrwjPDgJ0o3sEnHiOraPxgEa2WT7CEXR8xLTALn5fp66Q6evqvCFeug/HFEMPr78rWbrRqRMKNkRB7a9c1iVdU+IdY7mDta4jFK/HzuQIHmk1fwxAS3y07WoC07fRk6b0xgFx8WOHfWv1fWTbxG/1aNEhSQ6ADjFH9PfT3dR1J+hG88cADQhet3B5fzV1pwiALBCFsdI4xSW48AOQjjhHEs7RHh5wO/++m+BlzwCEHce4uQ738Pq7XeBkxWKyGWNP5YnPhZRjbunHs5PAhblRt02KBU1TXIUlQ3b9WB5Lp69fMFw39VijtsnS/h2BbtIEKHCme/BqyqEfoiyqrHeH1DYNg5FgW2aYL2NEc6X8KM5qwn49OIKtevDdgk4q2G7lPpbInAp7ZQAPh/7uEBeeoAbImMNSyqUqFBWJUtZqqsSge3ApzC+CkjzHIcsY8Cj5fusIzABgGVpcQCwJp3O+YIb7LwQOn1Cte7SrECalKw2X0npx1kKl/BPFPjOG/exmrmIAiAMHISRhcvLDBeXBwYCul7Em4Aw74DqH+bwPAe7/ZZFAKZxgjTlNKUIQEoFpi3pOQEDs968/xBPP/2UXUc0JOBvc3WNPM2Q7/bUSQWO48HxfVZXkCDPMotRpXvE+2vMz+cIlx4qv0BhU1MYW0TFyZhEHgE49NNE/tVEKweRSwBvxNKSLyjy77KGn1ooD3uk2zUD/wjwq/IYRXKAnaewihx2lcFVAMC6ylkNQB0ApDTgA68ByNJ/KTW6QuV6qN0AuPMmvvMf/2fUdx8iCSPETHdRhIw8SOL2cSPN2PbvOzBXrAnN/u7RoRNRgeMSQLWn+hQYCcwpAJBHcbU/8pkyndF8rg6gjNnADF6cUNAmAKjXeNWk97Qw7Dno6cvoUO2yPgCwoYYS3cbmaaQQT6XPdfTV0fZXn15pb+7ala21MBVBOmau0Xc8ol48T/BuY+crgJD8bAx8mrI/eUKoIRsMH3bMvujjr26XYwlCC/qNHjh3JZV5uRytDg4L2a4ABJrtKG8Se72180gf6AiMaQPK9/SvuaDgJAAoBjAgi9T15bVklRqAZlBwZz+bsoP8fxMEVDy/JuJSAoCyPFPHM+OBhMae0d7Wmr2NfhVWW2NzqlG8Lbe1TzUjwPoi6lT7sbHyGpKO+0jjQmtMera82BxsC1Of+838yXy1Xv1nFH9pIh5bqo9HHPboiiMAwON03M3nyA6rCWCXzU4Vfhkwz40SCZz55X5g5DdAcbXJ181HCFhn/9v/1buCagjiWJCyJtC/oQCgKpY7AvkbDQBO4ePjAoTz0LiAuDkAKB1C8dswHVUDjukKpUteazBxoakKsqHNMylwRmtgjdOHb2jdCDGp9aoAoFTYQmaz6amFm4fskEbA0A0iNFyljenwjwMAxyinCRN+xMEx4JVh83bY/5vQj90mDx0VM/FsDSC7oYT+ygKAClM1AKzhnLRTVWpQ9c3/WwBwlCvGAc5pAHC6hMYNmdK4/PMHAPkGIyCEayNqEVsj3ccsEo4AECcIYUczzJwQwXWGx3/9N8A6ZvX/7v3BT+Hcugf71i1koQssfPgLB6uVi0VU4fbKxa2Fh1ngoMpS/mxKoy1tOK7PQL0kzRg4NY9CzHwbTl0icmtY6R5ngYMlAVOWjUOcIMkK1u03qWvEaQ7H8uERsOV6OBQldlTfrgb/U+S4unqBs9MVFrMQVVVhF+fYxQWymkChEBmL7KNhlUiSA5aLCJR8O3Md+JbFoudIRxEAuEsS1i23oCA1uo+MR4pkVJp7EQjH7bmap8paFqs7SHPOqQEHKDU4YDXrPLvCm3dv4WwZ4PryGR7cv8vqJF5dZXh5tUccV8gLpmQbAJA6AEezgAGBtFTU+ZcaftiUfh1GDA8q8hJUa48ahGw2W7x8/hKB71OlQp4W7Dgs0vbp46dI9ik7lKxtG57nwncdVhuwiLdINpeY31kiEABgKQFAYZRyzcIBwCZSvdN1jzfWYH8qB4tgxaIAr19cYvNsDWdnI6AWvEmMfL9FGR/gUfRekaCgCMAsh0UgYJnCrlPeBKSSEYD0OTUBETUAqS6gCgDSWCogJyA3muPsZ3+Mux/+GQ6zFVIvQFJVsMmgYc1VmnZpHLgV3dPHrSsl1XBgm48DKFOyQcqfASXIwJwxAJBbYdrdzaGITF9soB4xmK82AGhSTAKAKm6hginffABwwv5XDVT2b/V6Lu+bMIIOADjVBGTc/vxiAMCx4weDWwaAtGZ/aIBTX/S/OOZRNpTqB5gRXBKg0Ox7ZT24GBU0VNKv5YblwMZ4BCAP6FQQyAF/UNo5MiVY2yPN7fIfQ0a30EW9AKDi/cmsLEEQeVSkr4YefSq/mwYAhT/D0PfGy2S3c1mr74evAwDYjl2spMKnoym6E+mnjL1GGqxwANbwj6cicrRFnPK/p76XvPtqDuS3AGBPjNZUSt2XGgHYs85UnUcKsI74oY3QAwBqjvvXOgJwPICWS7hhBX/U9tLoo4tgGZ3XEZpCIvE3t9KIZcqIP40eIwCwUV7SIOBreozx200h1GliCUO8UXOaEp80z8Upk3LCYdgEUwBg34mrqjzlaFsDlI9JA+4V7dasmaKzNaX3BUcAjtVE/PoAgFOOlPp9yzNfBACouV8dA3QawJUAoMnpkge1GlR9ZJhIAZ6KchjcYRIEGIkA5GNsHQw2W6pL2Dy0RyEYKVWmQdjtaviqEYAS+JqSwaZxrRigsoTFRJLDTbiz6+DezDjS1QUH8/p+WnklpD+7UUQLUpdYAtuSlBmIBABasxlCJ4K7yfDi//t7ILOwuvUmbn/3x7gqbeSzGfxbSzgrD+HcxsnKxmJW49bCwdnCR+BSc4mYRaBRCjDVz7MdDxZc+F4A3/V5O4kyQ+jZOD9zUacpTn2wunBFlrNUV4oaLC0be4rKO6RYREv4QYTKAXY5cHVIUTguSsdBUVWgSDGK6qN9RIBdXlm42iXY5zXrCrtLM9iei9oqkcYHnJ0s4NYlfIqUyFKcL+YcFKtr7NMUCWsgQt2CK9YIpILbRPXT81ntPuabcL24T2MUVclLoVQ1XNvGPKLovBL3b5/i7YfUFAWwqxp371i4vqL+KjUOSYmqdjvLR88OAiqXlzNAMz7EWF9vkOU5AgJCq4rdQ0Ak0Wu32zMbihqG8D4ifAxBEGC33sEFjYW6DVO0ok1NfpHtd0j3a2zWF7C9GsHCQe1XKJ2ySQHmu4YViRgBADmAQOCfU9EfF6vwBNkuw9NPngKHEtjXcCmVOktZFCBF+6FIWcpvmR7gUFeWPAWKBFZJoOAOoCYgIgXYZgAgdQHOARAQSPMloJVgWnKAHJRU3/DeAzz8kz9H+N7vIwkXSC0XGQGArEZVGwEo4EBW+mJaP3xRAOCIBBEpUPwKw4Lu1TfqdUI2021ysoa9OWZjflYRgBNFRJrJ90mySQBQKYHQ9S9aeJTNUztkaxOUh6h/bASgHLcuyYdBG92+bN8ubcquNcsX2qRPn/2tAiJtdIu8v42Gacc8FuU5br985QBA3Z3pXdZh26Sfxr0AYLPvhiMAW5fAsLKVdeTgn57eaA5aAwCPjQAcPEw2wwE71ogoX9UXAdiutswsk75j40dqHHo8AMhHIQ+6dZnbrSGvA8IdAFDaQ8pmVH0y+e9WHE7b6MPS+RgPvZXcZiQgm7Xo4ixIoEl5xa0cHMJUl1+uwxWJ8o0DAHWp26HH1zsCsG+DHuNuDDsVZsRBN8J/REj0pACbozGVFEsBHkkj6KvTIeQ4U9hDXVP7qfDFpwBrEXg8ZK6tAShliyqMVIeNpaaMixe2gUd9xGGQjBsU3Rz91gDhtXGkaUECyhHyV37KjCYNAGzn16q2kTkYIfKd0Wo1tQaAtUEHvNaaQAyBbzdzsaU6khF/nBv7DAH6Rk15lEZmHzWk4XGziJ9jlNOECf8lRwBOnd+O83ZfV2edg8yivO3q6V3RjpGaves2skFFDOwIhj+9fvL01OTR1n3oPyRoHCOxN/r4iu/bce4f+lYadRqAb1zcnvzqa9JeNjB/5XLtCnH4YI6JzWEolbeJeOnXlbImzvT6833ExKFiaN/0QG36PeNXTMkHjd9lSpK5iRRatSfMnI9YrFnFU3UJXGIdbsMIVjSD781Q73Js/vUprF2Js9V91PO7iN0I9skK/ukczsxCuLBwuiQAkKLdaixDF8tZAN+2UeY8Gu7icoN79x6ymnxUqi1wPCzDAE5dwbEKuF4F3y5wZ+kjoOjEsuZprtQVUoCAWU714RzWpZgi/rZZjieX1/AWS9hhiKwoEIUu0oSi3Czs9zF2ccZShQvHQ1bbSCnFl+rMOTXrFLyaR/AswKZU2zLDg7MFbq0ilvW03mXwIx+7Q86enVIXYFANQYIuuZrMcyBNKG24Ql4WCOYe/NDCdpux03hqRlLmCXwPmIcOTlcRq7kXuC6KNMfl5RpxkuOQFKhqBxl1H6mpTAr9VJjPI5S0PgRuUsfcPNf2MAF7TRyEZSHJcpTU1IV+FyVcKkFS1ZhFEerSwqefvMCtszsiAtDD2WqJ9eULVn8v2W+Q53vUTgH4FayQ6FUwHJGanbB910SDdPmW5B9FHfq2hzqtcGt+C07h4vFvH+Hwcg0LPqzchpNTyncOtyyQ7rYs9Rc5NQAp4FDaNQGAOa9LWOd7VGXCawBWGaziwCIAUeeoq4RHAAoAkMbHav8tTnH6P/wJbv/opyz6L3Z8wAk4L8koG5LjbG+3Kb/yAEOdmaFdNFkwpNdfxb7gzzrizk6NT1MID2kOzrDcPh22EblsHRiHjMAZUtI9MllmkPAnthFOx8jFaUBWAfHEu4dSPJv3iQxNHQAkm3oaljwGAOyAcp2Jdu0zFQBUwUNur0uukN9IYKp/DeU9/dqvzR5ontaZd18EqXzauP0iDxebkTWDaWAWluI4xH2TALOactuha2shDfIWG0b37ead6hqYzzLtfrVEyeThrNg/8rCISXhWQkLufgVC7Yle5NcpAA4dtg7UANP4W4027KWbYqFp5BEZO4MRgCpYydeYB3CYPN7arJP7Q8o3YXN1aGrYiprUNEvKKKm1nYhhMy1a0JaXsHidn2H/Sx1DI6dY12s1prOVQ63MbMfTTYnXx2pGEJr2ox5BetN5Ds+NP2k8gIlfMu0DqaPSDjAEX6nAKS95I+Om5OH2yAq2PQbZ06Q8agHgqTmO0+xzSwGWbDEVwXHTJf0yAEDN0Ok5tZQAoWoANAukGSfKYvWuuaI0BfNx9utnkNdbeiHE1Qg8FQBsdKieB2oCFn22VyvzpOM77qYPGXi6QaFcpRpuzB6WqoZvLJY1I34a8I/ZkfTXqwOArRHSPn+6a+/YqVXXwDUV9pj4GVJOUpmKhIAG/NMMBXlypzoUYpn6nvtvEgBkDuSIcO4FdfTru/yh79ruCVj7/TEOxZT8HANkJg1YTdV338R5VRhShqHT1rjg33d4SgDnUj8MA4DDMzTlg6aIxZfS4DTf3xgAY0ZAo/yHeUDbn4MAILeYesegGhiaZc8NZxr/FMiszkUFAOl9UwDglGS+qXF5MwBQarbht2gAoAA467JAXRQMAKRKalQDENECnj9DaEfYPr2Gvc4w805QBqcogzns1RLuMoQbUedeCQDasK0cgWdhGQU4mRPoVCOJU1ytd5gvT3Cg7q9ljdD2EFFDjjRGGNiIqHGHW+J86SG0KTIQrGMvAyRdDxk1KskL7LcJbC9AXlvY5wV+++hTBKsTzE/OWIOPxYJSYoGqqFlE4/YQ8wg+ArAEEBQnKesqW5U5fM9hAKAHILJqvHnnBDZr7GGxKLnlykWSAettjs0hwS6rOcjE9J6DJC5QUGfigqcAH9ItvMDjabllicuL56irFG88vIP333sDZbZnwKjvethcbbHZHLCjJiVJDsv2EUXLtpwGw2K4UU0AYFly9EJzJMSGkXG3VL+wKEsUBaUFV6yuYVWULAKwLiw8+ugZlosz1pCFagA6FrC7vmCwZpnHrOMunII1AaEuwGDRkvLgtQ8AbLUgDTVwfVRZiQAB7p3ew9OPnuL66TWKfQ7X8hj4axUlAwCdskC+37PUXxbxR80/8oIDgEXMAcBMAQAp5Tfbs/RgAgCpJiAHADMWAUi1IhEsgLtv4K2/+E+o7z1EGs6QURtpS6yZqJHZ7CuziY+SAtC1B4+LAJzUIVMXjHxPDuC49GRKZOAJU020BLjwNQUAGx90jL5DAODkwTpXzZMlbBR49UZehgHSNHqwUXK0dvw/bQqvrgGHkodaB7nroPdF7SlwkGGvjTvvXx4AqEMoowD3wP7p9UWEK6Suo+lP3AQAVLyqxodQAcA26k0PfNDMGBMAFACIaavJcUoZNmjz9ABeZpfkTg1AZqbqnCOjS9smnYb0bHhX35zmHmkBzTYCcKyuvHo/c0mN9W3tZp0rTGxBrs3nBQCavofck6wGtoKBDMOBwio152fIOp2f9IAUuvQbDwAecZDTYBlfFwCQgX8K2jAOAva7ZkM68YsGAFUHSm5eXXF1lUwLwAxEAA45g81ZuaDJF9AEpD8CUJlTc+AslLlZo8OQiOSIaMJ98nzCXP/2/9yH5+JdAnlCx/FXNIe/xj0G86jfcrD21VKA+5Rutwh3nxmlmCjadDkAqH2kMtfoCWJPSoWYNz2PnDv1hEOncmuU89gNPZ2oAa8Vg+LfCgBomKht+r/Bpv0GSiMhGg7sAiK6ofF1BQBbw5LPp+EP5RST7VtxCtah1ysCgNru6jl15u8UxgdrmEAND4ZMbCVto1fhtHW3BvWR6r6+BgDY5SexL0VR7GkfnK9DHwA45IJ3uVXQzXjZsAPfHVWnRqixb7oZv+bTDf3R1OvhwojNj9JIixxJkiAvK9hBBGs2h+PP4TlzpNcxcJVSJib85TmcxQruckloD7zIxXxm42xpYxZRpwsehzX3XZzM5yiyjEUAJlkJJwiQ5hkDxkLLYzX3qiTByckMswWBURmWgcW6Anu1jaqoEEU+47c4p/TaEs8ur+H6IUvt3afUrKNAaTmw/RC268AjNK8uWVOTgtJkwwCWa6O0alC5viwD69IL12JdgMOAmnrUCGwbq7kNwr922x0Sql9o2ayhB0WOxWmKfZLDDuaoRB08qrsHqiBY8dRYqgmbFxmPyqipzN0el5fPcffOKd568y5WCx+reQCbovkKC5cvrxEfclxdb3BIMvjBDLPZidCndLJN3YWp9mDVAIAUY9fAAAQM0rtEPUd6f0J1HGUqETkLlN6dF/BdF2UGvHx0Bc+JWNMUAgCtqsR2fQmryFAQ6ObW8CIHVlghpa67vsd0H+dDSg/UU4ClJOCOjIWAojWTAnN3joW7wONfPUaxK2FlQF3wiBdaAEr9dasCJa1Tsmc1AKkZiEWdqBUA0MoPDJisCfCjxUl3rEEIAyrrFLYVtwAg1To8uYXZ93+EN37xP+EQLZE4HgqqeSgyT5oaW6JWqqnHlZCrThxLq/9vZmPLXa3K9GH5M/7sqYytTpdcQ0DwDIWhd3x+ACA3L4VuUyZvglam3J6idGPHKijJqHx9HQBQAAxjusMcb2csU2mb4uFdXSJp1zYC7LOZeuMYtSjC7ghlRD0XHGp4hHlg2/XNur6JMgJpMzc7idolfR4RgOq4dHvQXCu1KUprVCo2jsqbSmkfdR0bW62JuFejNPs5tl0rYYeIXajSgzUnUvdmjz0mwpZbz6QTEdwejjJKSFutJ0K24THdYdJLC7CSo2oKsHAV2dhaWjez6hiUQ56SeI4hiz5rAFAupzoK1fcVLN+EvHweAOBQ4AGTxDICUAyQ+/utMFPBT3a9AAwbnWIw+BQAqPOP0MfTxnDLbyPR4190BCCXV9zW4hTT05uPkdNfUgSgiCUytEOLBMtdK059NISYT7T/lE929zt6RY2UWjNAZ0rg8/cwkT5w/GQCAKqBIvVDSwZd7Zmbls28czrZzrlP+aoCldN30HttHNtBo+MIz413TVbpr3dhZsWnG8VonigqKcDNMI9naskZ7dtbAU3/kpuEjU89cVTmNXL4K7YYX3EpvtuUbWE4aEqrSzA9AkXwj3qZkaLaONuKgafMRBkTH5XGHw1PSuk6nWTD1sYACunuFgBsOF5ZZP58tlsUAS6p1IYXS6qJ3/SeXoJPMdrQ9+KNI18zgHrgOLCtgjNgxEg1MDW8DmVUdSW40HiFOqT2K10etPRV95dhYHQAHuV7se8G9/cRYnOyhqIagdb7vC7xGoNSSFPGS3IpVV4k7888SZWGnZAroxGAgknV+TOajhBEPUFlkl5E0PXdwmdmGLEGDcyIA5Ma6ljk2MxrzH2lv6KV+DpQx3XZUMpM+wwhAKSz2qTMCVnKgANjRMq2GxxrIzHHmaxDD+Vd3XWyOKAyeiikP5F3rZUynABAYqAKdS4BwFIAgAvY/hxBuEJNzSle7pFsMjjhEuHqDN5yidKx4YcuZjMXZwsXs7mLzCrhuBYCB5gHAbbX18zIdT0flmOjqG/J+3oAACAASURBVAv2TreyYJcVA97OzpYIIgdFvkdg15j5Lm/GUdassQVhGHGWYhPHLPXXpsYcFZBQN9yiYn9q24Hn+wgjD65tYb/ZsHkRyBXOQriBCxZAVxGoBxAGKHXRZr3GYbuF67ocDK1r2I7DOiKXJYF6Ba+NSJGHDOxzGl1KdffoAEzdD/HhwAC768sLOE6Nt9++jzffvIfAo0C3PQPAQm9GTZKRpxVevLzEIU0xmy2RZrypCNP6lJrM+ndQx2JKAQaKjNe64/q7BmX4sghBFlpHDVc4AMhLrYABoVmSwnNcFHGBzbMdfCdiD/Z9H/vdFslhj9BzKTQPu2SN+a05vIWL3CpQEgBJjikdMBA4IORbq7cENzGwnpqoeAzsm1kh4ssY2+c72IULq3SQJRlvvlEVDACkCECqu1gmB1QCAKzimEUA1kUMq4hh5wdUWcxq/lFNwJoAwDplgKBFXYHrGI5ToawzlJ4PvP0+3v7Tfwc8eBeHYIbS4TUkOXgpdDTTu/wkVleFrb0kv2vWtbHZ9GtM2TOlQvgeHtNAqi3dtVW7AKC+v/m6tM83D8RYDeSB1zeBBZ9xBCDXCdLm0ek3JC+PlZKmMy+2xuDtPIVOpoq1I1PtzNHVmUJgRwfeaK7h8Q3qCfNwjTd16f50Ry9Ztz9FVYK+4kmK/SIsNYWduA4d/un6KrJRngQHTIBCfVYjWxQAxHxXP++245pKwx1qsjBsz7TReHLmjb2m+DpyX0sbSI5bXsufr1jYYmvLrq9sV5j+irDNjB2uk0QDAJV9L27S36/benJ9RwNweGerzrq3lrlszsHlGpM/2gN1yo5HuJF9qcoH1VqUQVCj1OjUQFaloSrLtZ2oiNkGI5gS5JM7uL2g4Ze+3coiOFuZrJYi4PavoW8U+WMeKLErlZRybge09FKkcDOS/oCJsclP6C7G5oMKZkJ+dKVL3/i0iEnqCtyoVLn7xmSULmA1eUQPntTP48+2bv3v/3fv7LWIq0EMShopcmuymHND5MrNKCar1ABQuzvJJexNKVXnoOWTMARDWf3uxu8U2ZSnAGLRybCSBOiSirrH6QDZ2HY2hZeq3JsN3K6+4tjwKTSjl+mZAvUaWkJdSLcgGeMvcZNpYOlbRW7k9g1dwGCMgRQwsxHg+hoM07Zv3wnhoSgDLhB6zwk5lNszPFVwcn6UPNlVDsrMJ/L9ZS0Tg4KC/7QQ7Wbh+ca5SZUGLXqWvardnuZU6Z2saYG4TH7PlXOr0jlfmtu8uzKSn/QZ6vuZO+DqFd091/JfGxnWjMaYhApAdsV4VzQp24ddbpRgHFWDmhIdurIja6Rsa0n4/7P3psuWJMl52Jf72e5WVb1OTw9msIgERRBaKZGUkQQNgvRD0OuI5LNAeh3RZBBFAoKRIIEBMDM9vVXd5ey50twjImPJiMhzu7rRPeCctra6955cYvFw9/jic3dXN7pryhqdSRfsARCMmJCRUtUfA98b68TXHX144F/DPHMzAKA4LIkMq3ECL55ndkeDa9aYmYqRHTD7BeY8CQfNhPB9TqFsn3vwJEEH891uV1wH3JwKoY0YthgHwJ2qyfMCw2Xrf9+WWrMN3RWv3jFZ/9JqiOvpxZIuYjAYWJ97blSrVmVvU2vWtWHuenMlwavboiIjGjOOx8wGdXQQFYDE8FWCnnL1nc44N2dkxABcbpASI219i/40oHm9x/GxwWL9CjkV4thcIatKZCWBZGesFymu71boKqqy2yGl3H5DJ3P8Dbi9uUaepTgeCexp0VOxh67Har3Eek3FLFoGoo77LV7e3eHF7Q0XsiBAi8JZia1XVCV2xyOz8SjXHSmrc9uhKCtUyyUDWsRQHYG8rmd9zuGzVJhjSPG4rTnnXtMQqAdkWcrv6LuOK8ES8DeeCgMoF5W4diAQs2L2IAGJxGLsewqtLVHXNbI8538J5MrSlHPwnc9HvHxxg/fffwfDQIHIHTYUHnw+M7hJlXybc8dAZjv0XCSFwnxHP4SAWXLo5Sk3+169BuFpnfeytR2xBDsKO+65bXQdsf+a4wn7py2HAR8e91yIo6spDJ4AzXIMaReQI+U53GFxXaK8rtCmFApMACCNYyr+J7Y/ySMbCrVhA89V2qcouhLLoUL7cMLjZ4+ody2ypGLGIYHAzemA82GPtG85FPq832KoKYnigdBNjt/OUlERuj9tkdLf6wP6hoqCUE7ALQN/FAKcUEhwc0BRpmiGFu1ig9Vv/wPc/J3fRvfqJc7VEkNODEZRek6E63mKHBi2XalOpePs9Rs/3BBrOabcbf/Db59d22R5VE6Im+0rKL2lgQTHknKKZ53z0G+F/P7HqBLZeAT6yDrF/s4OFZT+aMwHi3ocIc0dvcn60gSANBhh6NDYaZhxaBB7o+kJXrrBHu8xUghNbaMxflJ/+9rhe7+wO1P5Few/vR9w/Rdlr5TXFmK/a9mfRuCwzefOhPwyY14t/8nwXNT+0rWFTk5S0pXh3Y1Yn+E+TMdnbjW7IIw7Z6MeMXxLU6eonMTqb2qMrN2E/EWPkjGOFsPXHC97tNU3RoYnedBkr2fX/xDwgn/d6aKSphSG5llJkLmZ0h0b8wYaA6j2bkIjyWtDuke2chICrF1ZLX2G/2vuM+k9KqdcaH1fQiAKrcmQLIkuSx3kChDPr39MR01tiEPM/Rv9iqD6VmBuaJ1eomfj+xvyxUIm0l1L9LZJTkPVhMmaEF/MVVF2bh87NOI7NNbB7s/bHy8A6AP/gjZUOijKJKmqQHro5bTLBxCpOrj8PEUlpu81FAA/2pUO2yGwB9g0SGpGHMab0zjhgITVqjX2HqBUCcm4cK1r7IViLhD+eWbv7RoHfppS3NLgzoVQTKoUzQCq7pIiQ6lAAvu0RFxpGQbnZt8CUltutemfy7EXBQCNykzCMQg5i+rv/tMjdRroUydcjU/1U7EUrROa0DunT1Nzrr9xmKoegEMBgCFDrmbBd1qnnSD1RldhGAZaXsLrwRV6z8BYCso84beuFQB73M2arhHzEXM5xybyqm3XBdZB6xpzbnxOku9h0/mcyoLaEIcaI5ZjYIQi5GA1t9ECRnJzFHMax/XtaaBwLrQLpvSVva71/FmbVDUPvg2euX5GpqCWVlPWzeFx+2HOk6mH9P1TJvhkHVlJr6crZmLMItbCdKQNH0rm+ZZuoxVSIZ/uMHzVO8XIql6rvtgOmJXiwWismqs5ADC2SJQj6JOxmEyNEs1kvrjzpgBAU8+Tzu3qBvVZAoBlhXS5QVatOF9cd+xRvzng+NQgL+9QLG5QXgkAsKYwzu6MPO05dLS4XaCTAGCKFmUGXC9LvP/uS1R5itPhwGHHXdNit9txxofr6yssFgtm7PVdj7IoUeQpA38EqpHTmGYJ57F7ImZfmqCoKixWK84L2HQdupZCdanKa8rPoLBXvi/NWB6oMEbXUzXfHKdTi7Zr+bucKv5SYY1hYBCPWYo9XSs0CbEK+VpiLeYlBqoiR2MsT+apL9TGPBMAIIcPn078vMWiwq/96g+5qvD+sOVqwEPbYEnFT5BwjkLKHXg+12h78f6WEgqyaRXvEQCgnFNynhUoaNhI8smozXQd5+vtevQNhdl22L15wOFpi6HpcHzcod2d0DOLMEFSlBy6nOUlg6gphU/nLW7eu8G+P6IverRZyxFgQu5tBiCDhlLeCDylqr9lW6F9bHD64gn10xkDFf3IKiRlhbwouOBHez4hTwZUeYaupmtOGOojuvMJQ1ujQIesPqLd3aPdPjAASN9TAZC+eUIyUPGPBimFBbcn5EWGM0GhN6/wzj/8PeQ//DXU11eoywIDsTqJvSmJKV4AcFyUxHSUFl75HlKvihm4FAAMrVb/Rs7yTya2ybFxFuPH8LNk+2LRODQO0wNHy/rLX3T7rZ6Mh68x/91srzwsHlks4UihC5wHPTGzIGv4aQpeHy0PK0LJBmVkO6w/efYCRRdGG+IOzYw+Nm2PwOLsB0ybI2Uo0E7rgNE2XQYwZllvDxwr2qB8AXdGw6Nry6qwyWI/Mw8AyntNQz7Oh143drfl3EljRr+J+Ql7wHEAU+0A4zbUWjHOpZZ76dEh7sHCyEByfE/fPm8MoTff6aSQCvWdblH+s726XQDQ6B3ZupmhsKU1oB+NfaIYH8PHGvWr6W/pNgi/ynjuzAG7Cgkd5Ve7fBbs4O4x1fUCAAzLz2R/bw6XepfsXmyrYWtd6avKA3JLB80AgFY/lVsS0I/c56gjqfT1xdr4eReqlCWBu3z4TDTnqgfPmdPPlr59XutNSlnwzuTu/5gyAJU4zW101eJQlNBxwVuEI6UoxUx+1wFA172gs9hYEQ6TneIb5RgA6BoZcwOtlN8chd18p7lgxNzJkKnnKIi3BABDBsu3jp8DAMYVwXTkhQFxwhC8DzGd0l9QANAIFVL2ylaerhOmtwejYxk4NXMNNFVNvOSjhzq8iaDZEcyM8GdCKXcufS4A6NqauL+gnTwzeTL1zTxoDJtfn39urwSxbY/0P2aVLwAATf0xPaE3nVgtCZZOUQC/p4mqirBJEnR1mHka6DqTvEa/4wCgzEJ8icjzNTF/Re0VTGdO2ERxp+Yq2y6vGl/32eI5hnM6shbUevcdkBkrnhk20xab7YyvTdHu5wKAlp2KFgmQISLOeiOLTKyx8+mE0/nEufqy5Rp5scKqusJw7HB6s8fhqUGSXKFY3nAIcFpVaNBylSiqcptVObCsOGQ0JYAGVBBkwMubNb73/isU6YDmdBR5Wyiv3umEl69eMrhEoF3TNgzcEZuMGHv0M4NGVDQiSxkA7LuBgTYG+/IcDf3etqibmoE8vrfteCO9oH5kBQNjdD0x9whfo7x+tPEipiBdR6Ab/VsUBdIi5efQM6kNFAYswMGM308fmmPS2wQ2nk81mrph8I7+ff36DQ77PTMDP/jgPbx6cce5/OrmhNWyQlOfsNmsGQA8Hk7oJABIeQbpHQQ2jv6iBP8UyMbOrQQFlRxRP6idIkSYS6Ywu7I71RjqBo+ffsHAH5oWp4ctUuo7AYDUh6KkiGckWcHsPJQpytsVXn3/XRz6A444ocs7SnM4rikdrmSAgcwITJB1Ocq6wvbTR9T3OwynHn2dIM8q5AQwUh7C9oyc0DiKf6YiLBnlXRQAIIUDJxTKfD5iOG4ZAOy2DxgoR2BDRUEOGBQASOG/VN6FEhvmKeos5eIfP/rd38f55Xs4LBfoKqr+S+VdyG70kgEoQ5lVpIGbg/ktAUDfoa1e83MAos+2O6CKCUCNm2Gts1z1b2+I7APCUVNZBtPRla4OntmAq0Ms0WftJ+lj3bB1ntOT4wHJVwQA6fk2gUGNrfKZwr7V2JuLi0jJEbgQAFRdihcZEyy+8AGmjAEzN0l0veGn2+CGjw0XsJVy2uL7BkdWxcJ7BgDoWnzVV91n2zbS+8R6Vp85AHCOoWuBTRd7KfJC52DR9EuUjZ78TR2IzvqeigXnRAFdCACqrkxBFmO/MAFU6IDHHQSXNWGOqPK83HvMg38TcNSAe+jg4m0AQCVNPr3i+xtJ0XMAwCiWJofAh9NP1pChU10MQ4dE+8fWasMFAKBI+mxYJNf+GfnHnyv+s9d/3QCgUspWfyYCO9usyy+w9ZvvvuTWAwByOw0202hMHAkaE1CqYhVj+K+qFKNu0IvoFwkApH4LxlNg6VyiBB1DZG1+xg2bmBoF+ulNdIj+bThQpjB9BxiA3xUAULoz4nQkeCzkgH/RcBG/I/idYABeBACOq9hApXTYoZbAiHqZhOREnGMpoiNV3vtYAQCGniIeEXdyfQDGpQpy3LgGbxDyMa5LeZ3pHHmVqvHHyAE9XxVLMs064dkAoKurjHAZ62Bm1DhWF0yHSzgdql5nqKfifVPgT/1NzJ+yJ5Zt4RBul1FqsJi5/xeEAMuJnABkntAJE6w0AlHHzpnPEA5W/Aw+vAKmK8p04tTPWsKFrDkJC7ysBtVYMbLaFqiKzHojGwYA1eyHjrfcPbavn1+FAWjaP+47b/jC25wx5MiYS9a5BAAeTzifjgwAFss1ymKFos0xnDoc77fMAES/ApY3yK+uAWKyLanIBrBY5KjWSzRppgHApEaV93j1Yo0P3rljdhexv6gwSF7kzK67vr7G6VzjTLngCOijXH4FVW1NmLXXD/Rvz6G6xAxMk4yZg4fjkYtzEHOOQoGTNGMQqsgLHOm7tmXAbmQAMkhGY0MgmwgNpjZw+G9Pz6eceAWDcAQmUjENAuM4PG4YOLx4sVyIvHxpijzNkCU59rsjh/sKBmCDn3/yCbNQ3v/gPbz37jvYbx9xd3vNi7dpzqgWxG6k/IY9zkfKZZcwiMjdIPYhvVNqcJ4ryfgTyk2yAQ0QkNbTGOJMzD8ak3OD5nDCcKqx/exLnB4EANg9biEqoTTCO6LxpKq9MgyQ9tLFe3e4/fAlqpsK96cHDFWPPlOFfwTop6qdazYdMctSBgDzY4Ht50+oH/dIqGLyoUWWVxxuTONNodDEjETfcJ5GYgFSqDjqI/r6TCVV0J/2OD++Rre9B45bGwA8P3LeP+CEhEHmnis8d2WJ5Hu/gh/97v+G3fUdTgQWE+iYEgOQettLnSoBQLkRshkGukquZZPGtaK0Q9jChrbA2n9SGipkJN1n+zZsozPgwHOawTjqNGsHT7o/EqHjNsnMcTba6vAmaKq/fCzqS3wc/9io8LvnpIAxn8RzSmtqVPESQDJ1vm0BJg2hA8bnfKIMFs+DogDgOHSxMTT9O3XSE2rxBRvaiS8cs9BvAwAqCzqZMQvwtEMwHQCQ1ukMA3CGAmWzzZ4z0fLaWOSQFwO4AAA04E2ZE077QmZRiDj712Z06q7Z+sU9fHTVR2z/oFzr6e5eyoW0HdYGRe7ZbeBLP8ECAEcnL4AfsGr1r09Tan3gn5K+2RBgC0yX8xBYEiNa48EsbNHS68ZN38ApjeSebXxexHSIrbl/fPirCwBA6/GzUZPPWSSUqzjMsn42A9Dzai5S+I19LtCXN/88kAPQBJO8VEy18bNzkJkhwGKAlPGX/zoax94QTDf7LvZmVuX1uyaxTsvnq0U8bqDCC9R933Pnyk5qKe5WfRJ9131Wp9WUnDrkUmhVKnsvKcfT56onTMfUVKbTkE7zzcJRNheoWOD644YAPxcAtHO86LaagIHZt+eNv6gaGVG/zCiQ0KtfEam5CCA53zQAaJ6QK4PFY2CGSU6AHbtqspQ6OXS2w6WrNgdGyZFFm7EVZpiOMu6A3Pb8PT8E+HnzP3+1N0easXRoo8saxTGarnzaq0au0pjvqWZj9hAhsn65YS6D0tmAsazoDdhklp1wh+ndEeddHfDLvvhBQGFA1VPUuIkiNUq/+OeJ7nEjzt25MNeE2zdTz0ptOdEF4fAJMefssAbE6ILpdSG6seq3uazEDAu75eZ5UgzEeRkU46wBYyW4HgVoNFw919dHq3/B9BY2A3AMOfaFO9D+Th7GjPKgxtd3vaHnVG5vApAUANieaxx3Ww4Hvbp9QVGW2H/2iPPrJxDRD6iQVy9Qrl+gzgsk6zW6IkO5WWC9WSBflji1A/KqQJpS7rcGi3LAuy83eHG94hBgetf26YkPKl6+vAZF/j7tgOPxxLn2CLBrOwr9bbj4BjH4qBAH5dujruaJZuKdKDwYCXYHygNXcv4+egZ9BKiXM6i23+2xWq9Q5CWH29Lf6UNAHwF/dSPAPgIPr6+umI1Yt/T+hsE+yltIn+VqifVmzSwByuFHWMDxcGaQifr1+ssvsdvv8OLuFq9eveDchkVBXD+Rn4/WHuk/AjqJ3UgFPdhecqiVAvVlzj+ZX88FAKltnMuLJpzBdBGG23Ut93273XF4NeoOuy/vcX7YoacBPnMJXi6DTCAqjRVVECmrJQOwLEdUCOSqwuK9W7z3g3dxf3yDvmrRJgSE6jVF7c2IwzikXPiD/0WGEhWOX54Jm0N/ajBQfsPtAUM7oJAAIFJR2bhgFmCHw9MTKPJ4QWHGbYP6sEOze0K7vUdyIsF40gBgc8Bwvgf6PdKUCooQkNmhpoHNSrz6R/8E69/6b7Bb36AuKwxZgSzNeayU30IcSduDcbWO/l1Ffdi+QVxLiZA+v4Ybj5/VI6bpWiWjyVCQlqFUIddhDSrMV8zG2P58zJdTj7GvCedQE7rPfL6ytfY+IeZFBP0ARYp4DvvPsxm2n6/aqvZeYuxUf00bO7owXoDB8LPnYiYvbL8hIsI99fTFN45TIEUbmulc2+Gf1DRzPzLastGWKPA0JF+2bGl/Yy4EWBom0VPlyYmDznG8+WlOEUe61iCUGEC9eIjbzjlA1Ak3jQlq4DufX2u2ZKypIe8PhQCrx5vP87ET7QNm2zd0m+jzeexr7BoEbEcn8hz2n+n54QNeefAykX/xvGHMt+zopzEE2JzOqNaKzprrw5rrWh8wuMU59SPdqrx6bYpr3Ja5BAA/FCHXoRkybsrvuOeLkW/E+LgAoHmgwCM9q/D1mlGXPme051LQuHiHOVnKY4/ah1n9at/99QKCtmz62pn4AEBz4NXPUxUqHj5u+qTWMDcU1gIOACn2JE8X699EAJCHamRY6j6rk2rOizN+3C2qFm/xk5EEkv8gOVfjZWEFOG7Ag/7XLwFAXU3FP0izAGCMVeisyKnBs0/I5fSOmttyulymuxdY8qwvxabwaQfLOZavdUIGxQHNdGx88j19hSyyEzeB0Tw30Vsv+FIkig98RA57BwCUq27ivJkr9vImx4BE8cTI+mWB8QGAo2awgGI2+J6wCdMNsB1C8W53fMzZVhFDo/F1xkuFUnkZgDI0MQzR007Ynht3jZhtmziz6tYIyBoQX76THcS5IhXqQu8y8CTpTuWIGA3Xo+wCgLzDGdsSBqH1hvUiAFCNi8mYiZyc+jaWSpaED2DYJPPE1tRJcg7EiapsgARY1RCG+mcyEUYGASFRXY/d/T1XjN1c3yJrgNf/8Wfov3gAKE/c4hpZ9QLF1SvUBLgRWEZhtusKi02FrMrQEwM5GZClPVbLDKtFitvNAquKICLBVqMGU2hvWZXo2p7ZfAS2ETBHIb7MYutETj9OQEcQGhXx6HosF0sGCelD31Oo7rlpRK4+KgBSFBwGz6G0Zv48AvzqhsG3sqgYOKbQX2IWdlSVNkmYAbherLiNBEJSKDC1i0KO6UPf03tYNAmIo5BiWSCE2nY47LBZr/DOOy+xqArklMeQQlQpMT2DPfQ7MQEJAOwsAJCfOR6kyo2cyvencg4S848AW7qY/ka/dwNamb+R+lfXVEyF8uk12L95xHA8UwlloKHG9gBVCU6owjFx7eTGgwQyL4CSQrgLYJ3h7qOX6MsGXUkAYGMcsgo/lQBAKvqRIUdKc9RRMsQUyTFHd+rRHont2QBNx20hq1AUlGORbu9A/1D4L+UmPO22zADM+hb96cQAYLO7R3LcISEA8LyXOQCJVfiEpN8ByRFIqV0DWmr71Qt8+D/9U6S//rewW12hzSsgoYrQBFQq4gPpAxMAjPlyYj50PmZpr2dsYLTKqdogjgqf/BHWivKpNB9u+0xFKIDimH4ncPXZAGDQX7VtsGiJsU1zDJkGqcQXdtivalecUuJvit6KBs6NI7Nib9pC+67RtDkX2PslE5AyX6nHPJ6Dan4DOTV7ek94iQROioy5B87WSMlxHfeSNgBIl5I4KRaW1lFe42wc/IuXsKRyQMIlAKCyWqqBYkx1CKT43ssANDyqcfp8B+Uyp11Mht4qBNh3sG10S+3NTfs/HuCFnGZrudj+z9T3FOMcWs7T/dB02YxRiPIrPwDoX27CvxNMa8+TRbmxCQIl53m8yfJArUiYGdU7+3UI/GNZHQ9OBcXK66ca5CDTj7dBWrsZLgAYHjmJS0x8a+2L6vUQ6OrXDAAq0Q3u5zzNmAcAw8bmkrU3t39wm/StAYBmN22GmtyCTkZVOGNqkY6mwtgAmt+FgBSlZLQKtgd8DgD0GaDohtJI1GpuvIKrkXOUBUTqArqpjwEoDJMaV22MdaiKeqMC/+wwPrOtdsvGuspWFdiwgyUBvqCM/xIAfFsAULMLfdpHuAjqI9aLtRItfMcCKxwGoBlGx0+4EAAcWUfjptw2aK7suynDLgEAQ1X+GICeyykYDUGdtaHRC3i8nwUAaodY663pBuYSx2V0G78RBuDUOJvbsHGGlaA4MqiZFFpDmgNpypdJMBi3PYZeVHjQqO8IJBhP9lSVdXmnx5lwIgC8bMzR8LubIXNhxSQhsqGcZQA6DbTX6BQANJ3pUQaCDMBvHgC0dY/f0vnazGMuBSEIACrjbJwUTzJeXgBwuiwEApLIrmYEAH75hvPTrdfXSE4dvvj//j3wuEe63qBYXmOo7lDevot+uUJ6fQ1s1sCyRLbMkVUJhpTCRTusVwvcXq+xqDIsyxRoagzEsisrxq6I3UcAHLHwCGAjAK6qFliUyxG4IyCwpOspfx8x6GQKEVXIhAp27I/HsVjHqT4jozx+KQFtHYf35lnB4bv0s6j2O3BuwJyqw3KRkJQ3LVRkhAC+qiiZTUfXMQBpFLrgXIVysXGl3YGKjdRoqYJyfUSRZ3jn1R2WyxJVRc9vmHlGeCX1r2l6nAmLawgEbBn8pPcwk09V1VXhPrRxZgCwH4uOMPuPcgUmKdI+EVV+z1S85cQFXPiZPfB4/4jz/oR+S8y/RjhHHSGgLQO5nL8wy5EQc1FW56UQ6g49urRHndRY3i2wernAOT1yNWCTdSz8KmoDsf4K5EmB+lBziHiFDdASqNpx+yh6+LjdcUESAgCzPOWKz1QlmniYy7zE9v41jk8PKClHkAQAFQMwORAAuONCIUmzR9Y8IR32QHrEkFIGyh5DuUD+0a/iV//x72D73vvYLddAsaIazzxO7HGyItEAoGBGhAAd6T3/tQGAUmuMB4Smz+D4728JALr+0xyg5qpyEeEQSs7qngAAIABJREFU5XlbLC4/CBgzHqHtpvi7ZQ8ucle0j6H2CeNtY0TVpVvcv24AULR9CvSEOx4xvYGbnB2PI18CANSh78JEjRbMeaYz1s8GANUMK9BD5GTTnykAOGX0yqsjAKDZaFf+LwEhotIbmADr0M1Y7gyYTJhfZo9tT9Fced8IAOiAmJdWVVXaVVRhdj6GX0x2w/6o9BLuTbbsz+mp0febWcrT6RE3mKHUbBl8B9UGE1b111oOntXg+37aRK1TrfaxXKi1IP6dK4rxdTIA1Wq8VDvyOM7kPI3J0yVr7xcOAHTBP0F3NSEkQ2mONHdxfKK+GVmB42nMaAonp31TAJCnxRLNEQSk9/mqJMrHa65KSASkUBrKNp4EmZNURfSnMHaxj5ujzN5M2WMrgAPzmTbgYI5ieKsm3mBXfQ01Mh6CxwCvA5C4VZXtsBMDsFR7evnq0IyQc6+/U/MjRtRsdZwK7J8Bdp+F3xz8aAVktNB42ShTgYlWDEAx5gZfa1wztpNhN0TNtXIWnbLmHNJnd0A1wxwP5WSqHpgAjf0+1xFSd+h5s53ladtdwM8LAI7jIOU7shztEHDPNEVOCKdSEl+Lvm+j75ehbjqRvF6BWm9JgycfPo7ohZ5tnAGoFo/xMPeEXDLKdN+kWXLGXD1h6uzoOR5/stZsIEeJfFAIAFTtIfmwbIqRQ4ZHk6tA2xpA/6rXr5bU6SyqNSH0py0V1pp4rnhQ2xUF1HMvvWpSBdG2XEHlY5/uauafbY8UABgL0pOaUnZ8ZABKMODSIjnm2IWGaXIYJ/9gypT9PvGNafMmDpUBAHojoMaDMqNVBEBReO0w4PjmAUk3YLXaALszvvzDPwZOHRbrDZJyg666RXH3LpKra2S3dxiu1hiWJdJFRoQrZmUtVwVub6656i2Feg5dg4Yqv1KILoF+xMQjtl5eIMsSNBTK23VcwOPu+lYc4iTCN+FQVWb7CQYg6VO6nz7E9tvud1y5l37enw5YbTYil14rAEBi2tF3VJmXwEB612KxZLCPPqoCMLH1SgIPyUbw+wYG55hgSbQ1ebpOBUTYCaVcfUOH/faBi1oslwW+/9EHqEpqPeUyFK4O9ZnWJDEVT3WP7YHATAIDqbJwxoVAWFaovyNQJZjqAgCkfosKvxoATBg8o835qlqgbzsRJt0lqNsBn3/+Bsf9gf+nXIBlXnCIbn2uUXC4MuVMpPDoHEWxRJYXzJ481ScGK/u8Rb7OsH6xxOPpDbq0YeYwAXfcziFh1l/WZ6iSCgUKnHZnPLzeIesp1HqJalFw36ka8XG3Q3s+M+uvosq8XYuMFB2xMZMUx6dHdIcdA4DnJ2L/PdohwMQAbKgK8BE5A4AHID2gT1uOTB/KFZZ/6+/h1/7JP8MXmyvsF0skxACkXhMASAuG3U6tF9S64pAkQ6nZNl9Ff9jGJ2R+6Q2XbJij63vcLPu1RnwDRHJj20/XP3JPMkPelOXZKNtk8Nen/qPfooxFx8Y9QsyQO88I+Lqx8Z+M2giqSr3p3qzykl1ky1wA0PKohW6WB3L+x8Wsrn2HGF+Zc9PYC1oGwHlJjOF0Ufe4/eK96uMHAC0r5JgZU6IU9VYxAMVTg76Tbd3G8dRtNwFAZQt9hBLXL1dPmDJo7W3I7O41Poyx9CbGnt/0UWcZgMYbx12FAU5NxTm2/uORND5f+xJ9ZoxupEq2zh9rVQGWEzDVCjoS4hJfSrUh7v/7pk/KkUqrIS/x6Vm+0gAB7d/HFlgvsXS9o890n7VesMZh3KtJ4IftSzzHnWnOeCUbDBM+Pvcqz6ke03MqOn2ZzlUpKsLLZB7AixfKmpPHyXowDxDGNCbh9s3hT3Mjkdz+iz8YR9MEDsTPrkOhKP9a6Sqh4iNLI/6dDtbNypmjuDlItd5I+wXS7fq0aqQ9hD6h0aCJUDY6dEVVobxMXKbTEA9hVCqf/rVE1nBQXHG1W2Lsnm1PTzZFAaLG2FknSUq5hpwY1X5//30K1hwDU3n5Toy4b1oXeKWYnfvRwup2+n5yFUTcuumQjvjsGg7AqG3UzIXJn9Y4GL+4IKCbxNp0DsKnpdooGi2ZApmyYyYAInU+v8ZWnn4nQ68nMQ56PU5z52gDYrRvksPHnjnlGM7NVej7KIBhGpyv+IKYPjGTeNuKVhgmlcTYFN/nGH9fgQ3XYBCLx169Oucqrwc3Sa40muFti52SnFhLmm8sDyCssdRzzVe6lDzj/ukU2PmJTH1hqjO+ymH/KeBb9d5X7IX1qlOkwzxldo1jeEwCwjPLzpwTOjl2hgJy5ZmjJfXRmaFwzJe7a9dwwMZnG9dYuQBFG0PrSDk4fudQ9883dgE30BgUlcRf/Mnr7Er/0KejhS5SlSLl4YqRT44BwIcHDhVdr6/QP+zw5g//iIHApFqhun4HTb5B9fJ9JNe3KF+9RLdeAesFsmWBtEywWGXYbBa4Wq+QcXVfAvda7I97BvUoZJZz6yUpA0Sr5QJFlvHPBBCt8hJZSgw1gaDtjwexXnn6qEIvMeJE2wkcJPYgJean+aC+lcslf0d/bxpiFmYMjhHbjuaGKg9vNhsO/aV2KGmhd9IrizzhdlNeP4LZKKS27wj8onFL8fS0FaBe36I+7ZAMNe6u1/jwvVe4vV6gbbZcnOL27oYbfdqfcTi1OLQDOpRoUGB/qFE3DU5HSpYnNrW5dNQZYKOuJ8RAbLHf70QbE2C5WDCwulktsFnmKCl3HoVSZ8BnnxH7scLuAHzy6Zf42U9+hu12j2W1EnkCpRTRuicdTWHUlB+vPjWch7AhEHHokJYpbl5dIasGLDYFPn/9CY7nLfJShDPz/bSv71OUSYGrYoOHzx5wfDxgUVxhGBYU9YuyKnB7dyvzOdbY77Y47XeokGBJgCQxBAmkfdohoXk6n5A2Z/THPZrdAxoqAHLeoT88AvUBfXNE1h6RNlukOGBITujTHu2QAZs7fPAPfwfXf/vv4nGzwZGq/+bEY02R8/iKyFq2nSYDxaOPbD1qHvwaPmFMTWn1Pr1qZHSYX7kr1fP7aBBNb8TXiKl/6vq/gg8pdZjzr/lES0M6hwYipNPTB8/uUrM6NAhkd8ct6eH0X5IilLOmtzviKe5oTfWq8kcth1+PgZmTWykaoV2lknWfaI6MY0eMnKxzliz8vcdPpPXmpJfQ92t/2/WflI3wvWvcw032j/p5yvcSPoDoqzvFOuegOauml23LijvE9vy5dtktumOm9BCzb4XEO+Gy/jEO716036+vmWNcTdvv94pccNbd64W0i/V8FwiedDCmfIRMx7i7fMVMkbZ5ACbkFYqe2DlCVdEW3ZHRLx3X/TNYv3L9PdsvtRSfc7eaOBIOyRj2HZAriRfjo5/hmz9rrscLQjOjn2WTkMRTzPkY/cfAABB725+ASK9R5bfqIZmngVnDJ/MSW/rJUA2TFAkmOWh8eXgGLwMQ/SvfbzGm15r7HPN92g+NaG8TAFQKcxQJcr4tBo6d80MpXHGfWjBiAr46ABg3RdZGcNTOhgI0nSR2oKzpFv0xQiVkwMVXtn982h74qEU2GiN5nZYhn4CbD9PGzX6F6qQDAFqnlubCDiu5uSIn5hy73YwCgHLsLwEAw4M/NRDPq/o6b0DETs1Ue/aY+08gwgvWXHTiMDcUQi7e659h3e+pgvMoAPkn12UcZ90XXqDuGRm1WqH7Fa+4QTtXAtm1Q4Jth0gAO3ETHnZv5Ptm7nfL0D93IfsBQN0qlWMkBACa4c2mA3pROww9pK4XOceMCQ3k+FNyodaDK3fmirfH2JY4AQDKsWaWjpnTTeb2UmqUp9OZMY8DZq7aUSZdgI9fqfOVWpJDYYjje8Q3/LujxljFOFVkTX1lgoHibc5nTviC/D39nNEEeSd8qr98AKDBnZe6yG2Y5xSFlMtkbcj3TdblhQDgRUJrXMQMghn31UmhMbl6LMLke7nhf6hNvQEAZsOAw/0b9OcW11c36N484uFf/zGHAqflCsX6JdrqBtWLd4GrG+QvXqC/WiPZLJEtS+RVinKZYr2uGNjLKc9ec+ZZP5xPnIgtowq4VKCDcrNhwJJyCbJ8AvT+ksAwqupLIFuWMmCnD4EIABRAnPoIEE9IPukOzgVIBTFaCrEl9l/JOfcIACRQr+laDgkmR7Rpa6QE9tG7ubIvVRGmnyUAmOQ4nwQA2LUDs/geCQDMKaT5jKE9coGT91/d4tXtBouC7qWcfw3SPGMG4araYH9osW0G7Gpge+5xODc4Ho7MUKQCuFTYhN5J/SaHvusIlCO2nWA+rtdLXF9fYbNZcRXdjsCw/sxFVVbFAnm2QNuWePNY44v7Ax6eDnh4eMR+f0SeUc5C7THRgYMAAAnwzDE0gulIjMSmpxDhATcvNsirBDe3a9w/fo7Hp9dIcqow3HI4IIER+ZBz+G936PDw2T2GY4fl4hpIV+iTFOWixOZqw/Mo8jm2RLdEtz8ibTv05zO64wnd/oBUAYD1Cf2RioA88P84b9Efn4DmgKStkXR0L4GuFP5bc7XpLq2A61f4tf/l99G+9z0cr65xrgrG+Tis3QUADf/E3ZRPtIQnhYJBAZkuMFqMF6w/daPekMQUp2lfpvqPfYixJR79aLaS2azaf1L3TQ525BejDZEu3RiO5gGCdCumXpMZBuxuQMWh4NSi6i4pgFC05hsFAPkFsi1qULwhbWqclX3QgxzLAXmZORDzrcZe2V9F/pj6r/bYmf4Tty4gWsqW24wie/80+l9mJIDzvHHvF+D1me835YnlVv7B6YEDoNgWzj7cc0I1L0ghFZsDJYtme+ZCGqfD61+j7jiY/qWlDwydMz7bGKd5F8v/fvUOroYeGYS5/s4BgPHx9QGA9vxS/JrbPuv3mHv0NQCANkDl0UtumjZHhnXVXjESc/Pldmd+f+ywaR39ZFoLdy6EZHjsiStzY6PUghIRInN94StMAsPozGubMM2RarcnlsNS6P+wACg7E2qnsrcxFp+rX933zc1PcvfP/4CfbxnPccP33QUAR2UsUBbT/hosJnfTJ/vzCw8AyqU6OkjKOjmGXm41wkouzgBUCiFEM/0lAKhHlhkdelpGGQyT9EMAoDmHzBH0IBf2jI6OsfzzuJZHKxo2siqkfjy7lLRj9fvEuKlNvwQVXTzIbOwcADh1DqeSOmXA2dd88wCghGdGPS4dXsmO+LYAwHFtKt3n6HA2PnKopm6B/ss3CgAagKFqCzlkWmOLpPUjYGI01AXKmMnjUWTKARzXgJGDVjnt9J3XDM8vregeiJ45YURad8SdW7pU+ENqRNTm0u3pNw8ARjsa/FIAgDH74IZ4T5y8sf++l4jxm2w+JOhMOQAfP/8cw7nBzYYAwCc8/dv/H3lP1Lg1kuoK2dU7KCgH4HqD9PYGuLlGul5yBeBskaFaZlgscywqgvKIeVcjyzOcmxodAX7LJc9xzgU/OlAxWPo/oTx8GFBwIZuEGXrEUqP7uNVSj7oAIIFLelMyYLGsOESY/qe/KwBw4DLZIocfvZ8AKeGMEhhJrD9iJIJDlpmBSAzAhMJmqWBHz0zA7e7AfUiTHmXaYVOl+P77d3hxtcC6TFHltKZ6rvxLeoyYgoetYAA+HBtsG+DYZzjULYN/lL+PQ5SJDcmAnGC00HdkB6gvV1drBv8of97+8IQs65h1uCozDv/NQSAlhe+m+Mknb/B46FF3KU6nM07HM6jfo8PLQ0CAp+gjA4AUOtz0In8gAY9pyxWdF+sSr969w+n8hL/8yZ9jSDrkuajcS3n1OPdfn+HxiwfUuwZJlyJLKgxJibyoUCwKVMsFjyMBplmeIKXqzg9bNByafOSKxBTym9ZnyQA8YRgBwHuAqgA39P8RoGIq7QFZt0eS1EDSUKpBDBRu/NEP8bd/73/H68Ua5+trNBRmTFWF5QEMrwQuRqDsv9AH3wkA0MvKMB0P/4ZN6WKl7cQdU/3obp6/LgDQr13cCulT/1m0x2iVs9+Y+kd688g9jIRZmjZat8+wBeMYGd+6B8q/cACg67/p35Xe9M3VLw4AaDteahOvZMjaoF8EUoQt81cBAN2nabB7Zl6cZWCtXo+7Yno1cd/imwYA5zybGEDz1QBA843RPc7XDgCak0RW1Nhjun6xbKQLAM6Nlvn9HLgkZMT2XV3A1kZvHBn8JQAoD1dCEKGYb/Nbcz/nmi6vXn3xz/9AkEDlU/TpdSwEWJtFHV4r/ybp18wA9Ci4CUIZOfXxNVgxQYTgiB2cfeZmFtj4rgCAoidTYEYh3KFlF1secvLZIXAdl8mbgtj+33QGoBilsJLXm285BybFl2+OLT7TMZsCgEI8QyxPO2eElhA5lwaFexIf6RGXgA0WV45WaDoOYoMu+jlKEV8vZc8JUzBPx6l3gqkVGt85husFpzRGyKnvLd8MAGjMq6FfhK5z5tlAP3jEZkLeral7Cwageo7FADQeHsZVbJ3y1woAksPTOye6Ks0E2wExw4LcpiRaJhUPAYDyhM0N/VVzMYq/Z834tKRXE0dUQDC0Vmn8qAfIdRm+VQDw7U7IhcYIDQ8DGE6OR3d83RxO9vdKF9oahnwI8i2yrsP9Jz/nwhG3qxt09094+pN/R1APkmqDLl9hcfshspuXaCnP2vUN8rtbGwBcFygXOUpi+g2Um67mfHvEnhvSBMsVVfEVDD4qnkHXEWiWEjOBN/c9g2EE/tFa5Gq+ypRw/j+C4OQIMUOutwDA9Wo1sv8ojx89px8SZgASiEcMclV5te0oFFmwrikXITEAsyRBnhMjj3L3ZTgdawbRDvsT7h8e0A4dqjLD3dWCgb+PP3iBVUHFcxNm5NF7CFx72j3xv13do09ybOse98cahz7HselE0Y5zg6ZuuOgKhUGTaqZqx5SXcEHhvnc32GzWHCpMfy8qynXYYr0ssCgyZhc35wH7fY3tvsX22ONh36FPCpxPNXa7PYOX42ZZhk3T6BE4SSAsVeElpiTNBQGAXV9juaqw2lT48KP30A01/uzHf8rhvwTk9XWDYkgZAGx2Nc77mouBdA2xJInx2aNcrBgALGRFZs6vWGZYZBl2n79Bs92jO59QJcDjp59y6G9ypvDeE4aDYgDec/GPtDsA7RFDVyPpT0i6A1LUDEi2JEdZhZd/77/Fx//od/BFvsD56gpNwVVXtKnmdWOuKnuFmXbQgpu8DEDT83RXn8OAmCg/FWol9fKYkym04nVkyujPmPrPGxLo8UlUO8wD7hl2imnvNAAf67tqoQIBHR/a8r/MTYruu5oxNzpA+3KyyqjXqPi8JmWbTRttAiSeHOgjACjohn7A0eib0Vj669vof+1cehiADuAQsqvm7Jv7UI+k8oC5jCcz5ROH+jvvnTD6xqJy6s3O2jJ+HfW4Ut/yD1Pp170IsVN/0QHAcSU5nbelczrLUfcnsi9RT4odMHKbIgwr+n6mxoP3EEK/WwNo6m9uCKsvMkXfr1eIT/557FRO7ICOmPtzrIr3cwDAS8C8UFtiu2sB0OgrfABgrI9zDEC6V4uk4XldBK5fwgD0Sbi2ugIvC4/AN80AdPGLyfvik4MkDgCqUBXl0ZoGymbGcAgw000FI4AUsVDGM+IR2Vz5BUOBfkYVwtHhlqbXyAFiv/35DMAow8M5DfQaLQ8dPTgiEwfO3qz7xkMAeI7zwhf63MTpYAeLqsiXmRtp9/2i+zp/l2nAR0CZclZHtEt8+s3FJ94+DQGObT8N/C5GUwluYadJeEfl7gEGlROq1RDt37LwCrASOou+skIfUXWl3KQczC1mZx2wcnRztjmTaLZ56oDpHJcqOTavZyOkmH+PCbSHIm82IQ6g6PXsSrR6xtcPANoDJEKA/TLmjpdaKyYYFZ0yDwBovn0q/ZfkLHUcWpXkW+mWic6yNzQiibY2cJzc/4LQnEm7PY5iqBqffr5iAyqTKtg/4/h7BtPMYRcDAUNOhsjBpz/T9RKeQaH+5ABZQi2kVdwpPJGgk/BtA4Az9jk0bnJlOlXLPVc7IcATGzITgjjmIbYETPgYBADuPvsczf0j7ta3yPdnfPEn/w6rfIHq5iWwvEG2eolTWqJfbTCs1ujXa6SrCovNEqvrFSgxXV4J1hep9CKnAxEphxRaSzQ7CciI9S1AP2IBMhsvE+G4pMfUv1wFuBfVcAcqJKT0MvmbXc86mQuGcF47AS4So41YcCRPBACKgh4JVyGmsOK6PiNNB67cKwp2KBagCE0WxboSdA1V+m3x9LTDfrfjar+3N1cc9vujj9/HqqT0LA2H/y5KAt46UeGYch8SmHeiAhoFjkOCQ5fg9faMjtKc9MSO7JiBR4VJyKoRA5AqEFNY8/c+/BDL1Qo//+QTbstyucLmivLrbfHqxQ2KLMf2cYe6psrCPXanFscGHAKcFUsGwqn/u91RuPRST3VUBGW54hBtasPpcEBPYdRU0bg9oyxzXF+vcX17xUButSzwF3/1Zzgc91xtmKr2pu2AjCKdzwPSPgeGjPP+UeVoKkSiQn7Z9lK4MLPxOq5CXNQDin5Aezqg3m3R7bY4Pz2g2z8ib89oH+/R7kXeP2L8MQDYnzD0NdBT2PUOCZf+ALo0B6o1fvhPfhc3f/e/wptygcNygZrkR4F+Uh6UXXVtz0QbzbKY405DNMKA90c6JYXQ07Zin8vJbWpXfwhlXMMIv8PQz57LLb+TF6v11ugLxqePPo1tdQVGofrs9J1XnFnEbvoqsUGfcdzG28z9lbbBfl/eUCosPf53jO+3+qfbaUbxxGci9K29R7H3fqqNgXudHISTeZwBfYV11e8P+l/jtNn7JDGt8UNqc3xieyHVQ9f3MyNE+F1uUYR5hCo4LT4G4PPn0Jb3EGBh7mksQqxNeBS20lyvM6I/57+rFDyhfs0DgHNrz+dlj7PJdsnqj6v/Imv7Enl5ewA+POPi/WJ9KLkct5ajHIr93Fdtx9zougCg29rQtlxcRxEQ9AZHFwZtns7Baa7D6AhFQ4CnOR9dyso0BHh+RAzpmsXHdI5wfZfZH/E2S0Lt7s7ol5kQYA0t6afaCpf/znNk000FADifI+jZyLMSaNkg34mLz5CIy7/jAOBko20bV58g21ViTQNnXh1+ztSBs98SU2LfNgCohd9BG4zQEsWeiLHUYjw0zdBxVsAFAKBYm+EckUrJKdnkza7jMGowZpp7JqzYjLZGAEBzYxpaM6pKrsv8E2pHzkBQ55n55OzejurMN46OgndDn6x+jye6l4zG9Jp5+Y/ssMavhPwpo8OFDY1PeHhECGwIf/a5JiZjl59r2EbZCuuPyuEcHVkvAGjc6TA+uYrv1woAuqOh8wCyhh4LTwm7IuRPt88d1xEANE7+x+3aBaeAOgRXyqcljzHnUFzP7XONmNxs6fUlnsPMRqcDIkeqs/Ezh8javNg6PZQgeZqb062uJp/z1kng5+17OAeq1HqWELvrU46blPNxWGQIcN522H/6Geov73FdbnCblvjJv/0j5EhRXL1Atr5DV1zjnFZIr24Aqgy8WSNZVlhdrbC63aAvEmRlhrzIGcwjeeczrSylehcYMsGQFlVviXkoAEChVnuuHkvhv/Q/r01i+HWUf04U8aCfLd1K7EUKZ+Vqu4kMnxVMvPO5RlUteNPRdbKAVpaJ6sBty6w/YvMpBiA9h/5TicYIcKQKu0+UT+9ALLQWQ1vjhz/4Pn70g/fRNS2WVQp0Z+TpgKosOWSYALwzVa2lkOdqiSHNcOgHzv/XDCXqtmfQrz7VXAWYWIdX6yVOpwPL9dXVhtlzFMJLLMYiL3ksmvaMq2sKre65XYLRmOPc9swqPLfAm8cjhiFH11FYb4czAZBGSHzf9lhWC1RUKKPvcT7uuV+U34/yNd5cb3D34oYBwLRIcTju8LR9wMPjvaDX1j1w7tDtaorCRZUvkWYV6n5AtVhhQ9WjqUgy5SpsW+wen5BRrj4u8HHCsG2wpHntzuhPB2b+1U+U8+8eeXNCc/8aw3HLrD/K+Zf0Rww9MSDPwFCjZwCQgMUUfVoANy/wG7/zP6P41b+Fh2qB02KBhsLHaZNGgKpc7+IgZsamzYJ/8zaRXxd6jwegETpaPtfRz/Nv8/sA4ftUegHZQNfN083gn6Z2arQE0abpXIH2oOux8fvP4mgqDgD2lDQz8pl2Sb7LDe0NPSNKQhi44NCEIGC8dE7E5ufUHhsvABh4CM+XAfBaenLi10wfIqyDVNjK/yKZNGXaWiPG/khFGxgAoq+Z8wCg0X+H4aryvFom/zsIAJqHky6gZsrn6M+oDnn0j+vfxHawYr69Xu44ZH4AUL8lxoBjC20CIF5l577fXpFuhIImLKi9TyxDmxF8FVoDMwzG+fUXvkLs3cUMuIfj47jJ/dNXBQDn2ndJiHmsB4IxaCiD8UB9arY0lP915QCcZ5jaAL9WPJfoVdHe+JV+AFCMx/TO6WqbK5JjVQFWxn1cEmrzZ82Qo/BHI6zKZgvHRbH/yGGOfb4qABizh+MbqanW6/8mAoBqJEz17I55WA3PAyBhR/S7AgBOVLBhVHSIasTLDTIAJYVcCqnpTrrMNTcHoJiVmPkTV2hZlZtdCwAUint8zrMXi2YAhnqvHBzz0ea1AoBRiso0lnrUzY2KbT5t0NLnjttl3+WYGI5FqF16/TsU8zmL5Hw/J//zj5MG1gAAJ4cSoYd4GIDueIzTPwqLeJ9PFISRN8dcbQCMCqwXAIDav9NFXkKi5ztpm27EpJxPnD0haWaVRlcexQZLSI67WaK7VU5B/t4DAppD79tQzwKAzk3uM0yA0pTJkf8nnU43V6Re/EpHTMNNJkbe9IO8ukWzcxWOOQKk8g/uPL6d4zduwbwSzrP7tgxAn8OnCjtQKOibe2x/8nNkTYKPb1/hr/7oj9CdGySra5Q372Aob1BnS+TXt8iub9BXC2YArq7XDAC2BTipH4X9Ui48UXOH5D7BkCWoJeDBhT9YPFu+AAAgAElEQVSGQTL/KPUBjXWPgu/LkRMISEwuYpQSA5CAv4GAQAoB1qwkwRQU4F/XdVxcI88K3ggTAEbMOWL/US0g+p8AtZryCg7ENkz5vSYDkJ5FYCOx/ihHYVtTBdsdsw83ywWWWYL/4ld/xIAl5Tdcr0scjweczwT4ierDeZmhIBA0T7EoSy6KsW97bE8dnnYNcf0YTGNgsxO+Hf1wPh3w7nuvGJyk95OrV5QLBiUpp+HxfMLmas1MPAohps1Ymhdohx4nanNPIdJgFiLnQOwGtK1y+GksE+7boqTCIRkz/9r6BAwC/EvSAZvNEu+89wrXt9fo0ONx+4DDfofHxwd0TYOKKgc/nXB+ODADcFFtUFHuvb5Hmue4u7lFkec8T6fTEU9v7pETW685od0d0W/PWCYZkpYAwB3q7QPqp3tgT9WnjyjPlAdwi6SjcN8jhnaPoT+jH6i/xOgkIJAAwIxDndMPP8Zv/s7von3/IzxWC5wJACRAWAKArVQHXBOYZSniP39LAKClU4NFzvxGz9Xh8/Z1Ajv4dY1zGKcvirxxPCCSfo0HjHCLOLj2RDBvwx8GAGMXTA6ppAB8DQAgH6ZxBECkf8+fEGGLrU2WfgirRQnCxQDs8VDXKCJm+g3KD5gZOovBR9cq4NyBDOQEmdErqgNxH30KAPpaJP8m/S+1PZfHuxYK5AJWE1/xGYDQ18EAdHO0uSlhXL/L1UbRLYk35N/y3D0AoIMvhNaHmlGzaJ5nGVpFY8bBNnth7mmmOxS/fyjuHwkQoeU/cwDN8MRbMEDndCePpAcAZA/HYACSDIhjyud/YmtcrYMgO3nWfrkpKpQe8xHTTC7vXxcAKMfMGYTLLJZqb3zcXQAwWlPAsyeYC7m2AEDTUTV/tjciPoUpN8HOBkwo4zjKOYdp2MPjgxBsofVtPtX8qNOGaBVgR7+HQhTFBi5uPELGy+yTec207XMqRmxUxMcvjOPoeAaaWz+pMmqPp1AifsWgAMDRmJuAsbKJMsSLf508J356YvVLNsHNjSPe7Y60XoJ8vVfxG/dFhHByAiQf7YYiq3Ecx8IasrAkqHWmVNrUQVAyFnA8QvpDXq7Gy13PqnmTNW+0W8gHmyk5wuZalkbQGbvpPOs1Mq5eo82m+I2zZslR7IzENN5KQKZiFlOxz6sq7VsHMkQ1Aj5ZvrLxCLNKofqzGYI67Z3WfyGRpTxb5joTDADzT7bO8oXQ6CbqHI9aTi3J8VbbsvWYdgP861AXAlEqVfdbhErOAYBqJbunnO5sKdnUGlOGGBisP1u/2I6eGki9Ej05mYzR1jkNdTiwtYplhTbzoMBNl6Dn2Wc1fGtDjJ4XAFQ62ZRBI0m9f53EHRSfjtaPJ9RMV8D1rR4fw9qUPxU+bcofOTXkWxRth2y7x+s//0sUxwbvLa/w+Z//GOf9EaiukN++i3TzCk25Rnn3EsX1LQ4EHq4WWF4tsb67Rl+khM0wA5DCSUkfsckggC4BGomnMzOQwo6ZxUmt6VXQA4N/JYOAGVcJFgzAjkE9riY7Mh1ELjv60Pecy67uZO65jMOAy7LivEVcyZfAv7rlHHscnlxQkY8jA18UAkzvrYoCLV1Tn9G3La5WC3buqXjJ7fUGt4sKLeXu6ygsmSCynkNeufhHnmO9XCCRJ7bUdwqxTYscZwoBrju0Q4GuS0YGIDEVq6LEYbfFzc0Vrq7XeHp6ZObi8XDGarXB6VSjbTvOSdgSlZHe1vUMZFIGUIJEqcQKhTpX5Rq7p8MY/kyMRIsB2PUo84LB1bamKsQNA4HEAlyvF1xc4/3vvYvNiw3Obc19/NlPf4ZkyHB83ONmscH+zQ6nhwPac4s8X2B1tcGZ5icB1oslVlXF9x12O2zfPKLKcmRDj47YjscOBY3dSeT6G04UAvwGw+EeSXNCft4jrYn5d8LQijDgrjuiBwGnDUAFQNiLzzGkJYof/Qb+zj/7PexvX+CxrNBUC3RZxgAgfTqZUYABQRacSIqN2Q2Ub8XZf/P7Zfqa+MYwpP/m3zt/hat3wnrI9m0Cvta4GZ/6itpCab9RrFn1jW0zR1tNz4wAgEITywOAQIenvrXr783pX3/blMUfk/xb4KZ+puMuTFoZ8lz1wbSyvuJWEwD0BTdM/FAHALH85wvk29xB8EioeVZdnHRAeRfmBf5e+kZerMqYjGnvQs2B6JN4munf+/ZVcyGt5gTp8P3QLM2tMjvHp2if3esYwCPWSPwdvgNidYcCH5036ogP+YX9Cnv87arQ07aYQJf41l7jPh6Znl9RhEt/jP02n/TFsX2lv6NDZDHc5ubred+L9SDe7up5Mc9qgHUI8CXaxpZBP4Nc99ne44+j7/FFzdlRbXZDsJkuEBFKxThUl8TFM2EA1kqz4Qj0dD0a4ymoC9NJMQkscyHiFzAA9XoRozJFTUybYfaYDlB1+9Q31hW3/+IP+ArLwTZ+H5lNyiCaF46iJRrAwjZQcmzzFMgQNJ/8RibTXqpu801FK5e2Z7bdDZ0J/ml9IG/0GJwoQDADANLz3ftNcXF7NI6UJUBu3JgziNwG1+rpa2LJpFmcZjQ4b3wCeofba4QIetvPORTkopmslSk4bI6XuNxmO/m+9zdPGtwg+KfumjOeU2aOrVzs+y2ZtYoZ+FrpKjN3gNwQWl9b/e03XLxxAl3Tx6MrQ4Qny1oqhYkiV9pCbojFfBhtmDmxc0dBKWzTMCi5YslRRUoMO6PXjd0jvk86MK4jOc72hUVdxutnLKIwrNooqPBfuSpHFeNfZiaAP5UPn3NuAfasbnWVVLGe7edoA2YbBn1+qeFdumKa1Nh44OhF6HHnHH3uO0fjrnNoavmyL+bMESbLa6KDdbvNsVbD7jrU1mogJgIBUG4XjCFycwBO9f3cIYVf9nWfpk623UbT/fCZaNMtsq2H0o/mjCsGm+60Xz8JzSo/6rHjvJlPjNnved0ZPUCTVW4D5kX82bEv/Ddibw1ASSDT/QOOn3yC/ss3GCjH3MMWfT1g+fJDJJuXGK7fwXB1B2yuUecFQAy1ZYXFzQr5qkJP1XSrQrLgcqQZhWLyyQfHAxN8RyPAa0PmamOJ5Rx/FApMufxSzh3I1XllwQpiFKZZKvPLdRyySgy9qiwES5CYOcwSJB1ARSAo1JjWC+Wk69G0dA+x41qRB5OBSWIBEiOQ8uRRCC/V1B1w3D6hSlO89+ol3nvnBYoiRVER44+YbC3u75/QUplZqhScZZyfkPLcLfIcOflrxFgkaJC8bcpPSGy7JAHV46D8f/ePO879V58b5JQf8EisxQx3tzcMRhKLkO5ZLtdcqOPNmy2HMxOzse8pFLgXYGc/ICtKnJuGw6uLssSb169FqDSzJilkmvpJbETqmUySTjqOgESu6NsDbcfFWNr2hNVVjh/+xkfYtg8YMgI1S3z2yZd4+uKETXaF05sDumOLFDmWiyUDfQwU5lRxOQcRQAnwo/mpj2ecnk5IW3DxECouU3U9cDygOzyh3T8gPe/RHh5w3n0J7O+RdWdkzPw7oefiH0ekactFP/qBgFsBBDMAuL7D7W/+Nj7++/8Au5sbPKUZuoUIuXaLOamVFT7xj64aY2HHDdio0n2PUwSMyKs4BD3ymQMIwrfG9I6+a7T3qscBleQHrEJFzKTvyOGlIf6KZtvH/GNiCcdmYHqvJ6dscJAc32v0f1T75Zu94J/4TvEDA9MvVLDVAbvFav+gtyFGvjE2Xdp+ihm1jz2tHJTOYPj8VaudHuGdk2dxvzsjgRmUTsv029j1uoWh8EfLurohwZcsa3mN9jqn6+GSx6j5iF07lTD76jkALgYASs/P83rT5/ONtfibsA/x9WUBXROSzNT/1hVRVc+1Jp7ss2dTzGjihOqkLZ/THPP+A4Goho1rh5n9i0s4meprx1+fLB/XPzfhU7tpPF+Oj+mmADD1bVx25Ep2iwryXkJI9jwIKABAc/860R8WIK6MgS4764KR42ipfY1x+OtO1CX9s3TFqN/1mA9sf419wziBCiiM++jMANSbM60e1d9MBpEo9MEmwWgXu8YSAJQKX86BinEOY3zxRCe2C+CqIr0wY06GHVKnABdj5Zr9cUKeuWe+JO9TKxRehBHAwadc1SIZ+x49BTOf4K508XuM4cd3R0FMcpDiACDnSTIXttNegeBLUzVRRlMA0Now8rPsUYpvKF2Fc0kinbBylSNoVJsW1yoloQ2wvchGx4UrNtJ3YS0cT4I7zaFntzZsnpVYuywzd/m6DEG3qe5K16deok+0PsLre859GM24MOiTzb4qQqIr7yrLL55sawjlEJjPUj+PBniG8WqOrz3PfjkxDQbrC2eq9TwE7o/oBz8A6MiaqiJm+CnmFTYAaHxDxQlGhoOWa8G4kx/PetUFYNT8xwBAlZ7Mmb9xKARTzRyjuL9iGDopCBPGrDPMZgjxKANG99wQWJOBOe9ATOdU3SPmTuifUJ/88uXXJSEdYuZAYm05CqR6a3gN+t5v21J7ffkkeA6geGsAUOkF065IBmDZtkgfHtF88gnan/8czedf4vzmCUCJ9TsfoV3dIXvnIwzXL5Hc3KIrKwxFhWxZodhUSBclmmFAXpYoqBAIVarNUwbuyKUhWVA1SsiOqmrAIrefSNJH9lPlDSR24KIquEIugUsEkp2ItUbhs2QIe2Kzieq5yq4S8MWMP85DR/8mIhceVbkl4Ixy2HExEULGKF/fCVkOrFYLrKoCqyLD1aLC3XqFzaJARTUuaFufCO5v3XR4/bBFywy0gusX06fIEizyjIFDzltIjDe6k1iL9DMBcgOwO585ByBVyz3sThy+TCzFqqp4vOg+YhRmecHA3X5/4jyB5FSWBeUzzDisVxU3OTctWgJPucJviqenBxkqTeHFAgyl/7OM2JhC/zObsuuQEGBat1TjmfXs+bzHy3fX+N6P3sHmHcrrd2b24ac/fY2f/ocvsOjWSA89kobmtMCC2I4U7r3IMRQEOrbIacF0HTMcm8MZh3sKFe4wnFtklHfxdER/2HLRj273gHI4oz084nx4g+H4wOBf0hwwtEcu+kF5/5KEKkETw5DmTIC8lOcQmxd4+dv/A97/r/977K832FJVY2J8KgDQVRQs83GALey9qG90EQ/ftab9mnw/AoC2TjKviwfAzjOE/O2f1zujiXJyyPkAu6m/pt8aOw+ctd3sXIRHQNz/3OC658y3pCcbg6gBDxOdcMdT/z4HAIYZitJnkDJrA4DKM57696RfzP3CXJE1HuKgkL+dfz+3dsQG/RIfNvAkGf0WXj12kZ259lzy/XMYhOPYhho4C3ApRmN4hp4Lcth9jI89vXUuhcm4HiZEELU/tr1COoDTkX3uwMh1Mzp5cQag3BmPXRp7YwxXKMLM0FBhxqmz/3Hlg98Xd6inAOoEb9C6YvS+x2dO58d8p7Elkd66kYpI+eAO49TFcmblx6JoqrZqQlT8fgnAGi+1ZlxsKO1hHaN2RgtksWCtq2WKpxA+Nds3z4KfAKYQB8dSGzuyGy9wxObp5l8KBqD5GafcYDAJpX0ZAKhAAlUE5JsEAGN0UO6gYeF1UtbnAoBhFT53whlzkHzqTRlHcw4i6jWgHPQdGgCcPkUs1piS/YYBQOtkUorwxCOz2+duKKP6zfP8S4yoXtosQQLcltbSVOLKzXHNgGoTyeY3DQDG+Ek0tYKgp0fJHS9Ll3sMvjnePoMSNzKXOE9C0qfgnwB/x6IX5hIcc4vYjq3Q17T51U7jxKA8AwBUsx/1Px1A2FTq5tiG5NSXS3KUP9nnmIzPbS8E+0TLsetYuM+ehLZbF0xz6MQZgJcBgKYj6tdS5gzYgjCXBFowVPQ9jhhNHMi3BQBtOzoPAIZrTIsnzdkXFyAYAUC55t0TzslIeta8llt7ffnXQdzJ+NoAQOPlzJobwOys/PEJ7SefoPnLH2P3F3+F/vN7oNpg8d7HaDcvkb/7MYbbd1C8eIm2rJBUC0KmkCxzJFXB4Aux0ggApHx+KRUCKQTYNzIBOe+eYGlxaDABZhziK3P4MEBHed46rKqSK/USg43+Z3Yc6WGqKIwEBecKTDjfXpanXOCDntdQ/r6OGH7EkGu58m9zbtEdzyKnFpcdpkIZR9zeXePVqxe4Xi9xXWZYUiViOmjrWlQ5MRJ7UCI7ynF3qFt8+bhDO2QMAJ4pbDrNUBH7LUs4pJn6QqAcg36yX1zFGAmHDpOPvdufGAQkeV0slsiKgtdOO3TI8pzbTwU8qA+cJ5A4d1mBw/6ENKECKwWDWQ+PWx5Lkmt6F1U3FrkSRY5ByiFI7aNrBGhI7SO2JAGAA5rjCQti7NUtzvUOty8W+I3/8lewuMuRLVJ8+vPP8Wf/7i9xehjQ/PQBRXWDAgXKcoGyqtC0NVcNXm0EgJmVOR7u73H/5Rucd0cMhxYg1mXbY6Bw6NMW/e4R3f6BWYA5VUuut2iPVPl3i6Q98P9UJCTpa6RUaYR4owT8JMSoFOM3JAWG1S0+/B//Ke5+87ewXa1wovBfGkeSDFVtSco5hXjT+L99iqjvOgB4iY4Je20u4KF9L+lPyj+EPPiYflJmM2i7WUH/EgAc7dSYA085YAEA0DLCcQsY9e9Hts9zvPrLr/3rAADd1swx6uZa/0sA0MEyVKhrgAVrr3/pKxJbXu779HiOmkVG3M2HAH8dAGD8gDWeXu0SAFClCLL3vF40SMNM1qbR1qzmPtl6pkmuMm6ZA3BnQbJvEgCkmfaF0JpKySU8WQ62nd7IXbuzffMs9ikAaDL9XPA6RLwwdoEhAFBtyngDbm1E9eyJcaDfbQagAgAp/5+ooRf6zBt/A8qyqY7ykWKDFH6HDQAaVYdMqoa5uTAmVNT4ck/kjP7PvJseG2MQCnjEbjuPiGS+CQckzCBRSso/unJ2RsDDv7W+BACMGZ23YgB6KrhOQ/DCAOCIa7yFfMX6NmEfmkltpbMTAuDU3H2zAKBkSFogt628aWMRkyBrDL8SAOhoQBPtj4LLhnkwKr/aDrwBADo2SaxCR38wY8GuujlRus8EAGPy4YLCI2PMWWqXMpR5uZtzGQIAAwbUpwW9DMDIvEwAQEu9mgCg+OLrAgBdZ2Gc3ugJPDGWmGLs/TBwEklST+P1dTMAdUN0aHZo/QnNZmUgsfoxtwEVF9v26esAAM0+xI6Qlf2PHUK8FQAYcq7kqWxJgNHTDv0nn6D+D/8ej3/6p8CbJ2SLa5TvfoTs1Uc4Ll8ge/EeipevMCxXSMoF+jwDFilQ5EiLCsWiQk7htFXODMCEQDRi6mUivJdZscR0llQ/AZSpKr8iHJgYgZSXjkC1PM84vx79y2uEwowl8y9PKF9gxvn8CICiwhOUJ+9cC/DsTMDWucbucEBzqpEPKYe7LhYEYOW4u73mwhqrFYX/AkuarPqMtOtQZlTlNkFRJAxoUv+eTg0DgA0FC1NBjKZHRsw/AimzFKf6JFh/lB/QSKiubB+15XRusN0dUFZLbDbXHKpLhTwEWULkeeSiH6caQy8kmgt6NB3XvyAgMM9KpGmO+4cnZhCS7BA4ygc2EgCkoiir5QppJgBA+v9AlXhpvikUl5iIxzOyAWhOZ1RlimLR4YMfvIN3P36Fc3fCm/tHfPbTL1E/9nj82T3SJsOqWGGxXLNYc6GXoUWZJ6iqAtmi4IIh+6cd0mbA7vUjsmZAdzwBhx2S/T16Cf6lzQn9eY+BGH/NDmj2ADEAuxPSvkbSnyUASOw/AQByAWFQRWmibd7g43/8e9j8+m/iabFAXZEsFuiIXerY8P98AMA4QBmzv2yBPEUT5nwa85nfLQDwkgNTq/WTE6LLGYDCfs8zAF3javzuTfeiI35E+K/tlRglSbgjswy7KAI4ZQCGgN44kBj2H2bbFxVQOqjy77sst8p4xtyB5ldZD7F7onuob50BKCQk5OAJ/y3s//EYKwBnBADtPYPeHivQj0Lw1TtViK7pncr76RIjvN0/xvbc+wA5sV6NA2p378BpCPQqsiGHMAConjjHACQAML429HhNnzmdGy8k4oB/5vvmAOtZkMwLACrSy1wY8JQBqCRunHHnBC6kX6z9i/rlr4UBGAMA5wkEyc2//D8n82/+IZRDzgSqTABwuimOodTGYgpoqbEtxqI0F4wGAOdVPC81BYhYAKAL6unG2AtIIapqQYZyiIwSIPO/GAvc6Cc/hZWsaLtgbMnAaSs0LtS3eYch5uBohRQ2m7Mp02g8DaDCBTto/fhLuUsHxFHgVnt9FHyzQXOrUVZzjAHEPPqBylsWAGiAf1om/A0YZ4u1l1mExCfkDohlXeJRsF6GpL7JNegx8I/vkjkADZ0V9BemBswnf2Z/5uVTER9GGZqE4QeeMa4bOdryPgYALRDf7s5c0ZuvWhREGaoRBJSvnddKbvtsXWTmYCVfIHZi5nPm+PrxC+3YsOvNf4/nuHMdDreQhyqOYPbC1AfjSap3qUxl3wpBFgIaXL48z0M4yTq9MqX8asYkmPqJ304hSQE94s6l2UcdBeLcbJw0q9eGDqnEbPznDQCqMPSQ0onJe952yJ/2WD/e4/4P/xUe/82/AU41imKN7OX3kL/4CMWrj9Ft7tBvrtAvlqiurlHTkUiVolxRAYxU2N0iRbVZAkWKbJGjXC44Rx05+QRgEeONGXXnE7PlCADjar0ETPFOhP6lEF8Cc3R6grIUTEKxTgbkKQF6VOKBwmprro7LDMCm5aIfdHEiwa8szfHq5TvYrNaoSrJT4jUqF1HWd3ixylFQLsK+QzZ02CwpFLdH0zdYXK3wcOrwyesHdGmJbkiR5iUPdSbZM5T7r24pV52oYnw6HHE6nbiIx35/xGZzhaKskFFSwYSqBS/w888+R7moUK3WPBa7/V4AdUR4SymrngAAKe8frd+yqFjKD/sjswNVoXt3cyaAVuqnBlhpDogR2Jwb1PsjCmIF1i2SfkCeA+d2h3KT4we/8TEWmyXevHnA/uGI/esTnj57REqVf/MF9/vp6QlVnmJFlZv7Dsf9Fqv1gvtLhU3QdAww7t7c4/DwCByfUJ7oX2L7Efh3QHvaM+A3dMT6OyEZzhL8q8XPXPhDAoDMbE/Qpzn/j6uX+PXf+32kH3wf+8USp7zEUJZjmK+VjkPuRL7tEOC5989tMOcYzMRqfZtP2HcTT51zEb99AHDeRwqPzzQEeLx2Ev3iG+e56p/KR/CPomkfla2zrZkDgEn/Re0dx01PYJZGwCE4AB7fOcRonxOEwDviBAk/AG1749r5MPfGUouzgD7HR3xbgPC5a81d39P1Ft6/TAGj5749voLZ7M7BV0a125EwMOmUWoOKAWj7yaLVqp9qvyH96otyOIqRmIJZFDlgz/6UlzSNsBibP1nj9jvmdDO16dsGAF2J8I1HdOmGAEA14NFcgH4A0GpTrAiXJ0LH3j/KjKeRDrhzZO+3ZEvMiDZHXnSVYCmzFk6mCG8RC3LzL/6vqP7xGkhjk04OjkpEOAq4BZbEAI5n5HDgjtnhXLwsx8GNvUcvYQEAjup34iJMQgadPzCcaUyIwE/8Q0jG0JovxziJWzVAagOACmwMVJoZ3Zu4ZYvmAJw94ZE5pQKvYECV5l9+bxl2KXMxAJDLj0cAQDE+eovM73MAqznzGQcwbefL60w6bCmvEQ/YKeqfaG9sib0tAOg8/ZkORQwA9E27C4hPXeznAYCcVUDJj48mbsz/VI1JB9O4z6166/bhqwOAoTnUwj+6DRqTfJZzx2LkMADnAECrVZ65txiAnkOU2An1KNbjS1x9LVMEOEPzNgAgBVTZcxbOiSQcQAIZwp+UyzLozzcDAKoW2yHSYliUfpzKj5CXXwKAodnj+ZWn7JaZlXKedx3y7QGLN1/i8Md/iNf/+v9Ftj8iT5fI7r6H9PZD4Op9AQBeXaOrFswAbCifHuFUC8rXJw5oWgIimKS1RrEosdisONRVMABTrow7UCVaqmArQ2bJtpUEqBH2x+gcFafIjErBHTYbeoZYJ/T9ZrXCarnAksKNE2LrCcBMeAHK2RfvJL+K8u/1PQFqLTPmFotqHC4C/Mq+xpLaXRRYEPgIKhpCbayxuLrCYUjx8zePQL7kgh4ck0FjyqG+PfJlhYfHR2bBUTVhBiSbFlebK9zc3Mr8hFS5N+Hw4Y4WUJZjsVohzQu8uX/AbrfnvIUMlGbUn5RBzZbCaIcBRVEiSzI0dctVj6mgCOU3pIcT20/oPAIoZMg8g6sETYoDNP626dCdG3TnGmknqkDTPS3BuXmPlx++QrVeMsBYHxo0Tw36Q4ecyjh3A05Ni9vrG/zVj/+cwb/0eEQx9NhvH7kS8ma9FrkAT2cct1ucd5T37wHp/kuk5x2G8xF9fUJ7FuG+6E+ABPySoWbgLx0o/LcWdY4ZBCTblqOlkGcCRl99gF/7p/8rsg9/gH1Z4Uzhv7kIjaYPyYPlDbCcPycnnG8lvV0I8Nz75zaZ3xYAGDUKxpffPgD4NvP7tgCgPFAMbSGsKvVy0AwzNgI8wcG+AAB0GV6OmfT6oOP71MUGyGb6KuMeaZ4JE+rC1wkATvyp5/rqivF2qXDPXBffOYqbv30AMNwJ0i1zIaQWIzYUMm5hC9MwStECBwBUf4sCgMbGxstllKlDTH0k5Vf70MJLVGJtz5knh77CXqKojn7hNwUAurLFzXHIHT7w+2sFAFUoqgQBp/I+DwCyr+SIoDm07jBzRJShn1QxwLB+sb/xMR5NXMUdn8sAwLAwJHMAoI8RY04mVYv7mwsATk/A1GSoIaUc2jGKCu0LRoH4BQQA5/zP5wKAtijGS3oLA2SDdDYAOHUA3IU2F4LmOyO2FlkAALTeEzTk3zwAGKpCxM0eQyDjRtT81jT4PPLESFEXeABjShRvj4UDAM7sABQFX4Hqpm4x59/vrOh3qXUZyqEyOqszIcB+BmBIzqYusMsEfK6v9hwAUI2VMeeyRzYAACAASURBVD0TwNENAdbryQCt5AMUyGKOtQW8TByorw8AVO9RBlQz7CIAIDuAlGg/MMqMH/wSAAwNkG++7ZGMH9CNAGeEZzOnf0MMQLXiRgDQ0D1qredUzXa3R/7Fpxj+7E/w6R/+K2RPe2RDiezqAyQ3H6Jbv8sAYLe5xrBYiJ1gVSC5WePqdonbTYmXL65xe3uDzWaF69trrmzL7U6pEGzNFWvpf+Ka1kOPhgpfcOVa4GpzjSKjHHMl5/cjBiCn65Nw3qISjEABAA4MOBaZYPIRIEahvESUO53BgBkVAeGCIP3AVXgfDjVFvspqwfbKTCnnYDFgVSRcCGRZZKiPewsA3LY9PnvYISvXQFYyEMbgWtug61pmNFK+wa6lsNgCeZrhar3Bglh/Wc7toHv25wZH/rfG1e2dqBLctHjz+gHnE+W+Ezn/KEyY/EEqJELVf9UGjcJ+CYxvKU9gTUU3GrQN9V+E5jIAyAUzKBRZ/i+Lp9DvzPhLMizzkkHA43aH7fYJXXPE+t0XeP/jDxmUpMIjX/z8S/z03/8F8HhEUa7x4uYOWVlis95g9+YN3vz0E5w++xQ47FGRg981fBC5XFUcxt13DerTEcNpi2T/JXDaMgOwO5/Q1UeAqvsS4EdsPwb8GmQDVRpuMBAImIgcgCQzSV7iTD9UKxQf/AA/+Ie/g/zDH+BQLXCi8SVwUK6fXwKAz7WWcwys+ef9EgB0nDrHX7OOpxyHQ2ijaBZqOwTWwwCcpNmJbKf8gKPtm6moBscpnc2lG96g2/sP97p4CKMF588Lo9pJRpA5SjfxdX7mQMBvHQCMnDDQ6M7lSA0CgErO6fkGACj8RQ0C2jkA3fnkJMDuBmj6uxRRnyRZjE4nGjDkX5kAk7v+nrv/+CYAQCtyRqqXCQCowEA3zYuHERmV0RgD8GsCACdrXv5hQhbjo0/RWqUbaX7cfZr5vAkDMMBgHgHhixmA4i3ivrAeuggANCfAVLdi0y6rSUqgZFTSRoiemwdiqsDm4Gq5dMaRNJbATAfVIpLDIUOATStji5e1IXFCUMXrjbqqniIPrrCaVXCVPE4WsOy+YACqrImKaRin6cUD+OarAI9rxGNVBIMtbG6o2QqQG+XCGQDBALSfYS+cS+Ze3z8NEYzfLxy8mArxfSeXr1MifFzYE9DLhoBN1H9CWJwM5/P7b93hDK41D88EAH0hjwyIGRPmjhYBgP75ZOmYDcJRhDebNWapyDFTjF9viB4rUCB0IjjqJYcS6vZHbwjcefHN09QldY2fYQ1U5J7TDfu5JsDNIyhDFNVNZv9Mo6q+n7R6NBhiLmIAoCvf096Z2l+Meky+te7VLGFHEyhTOhbZyWShKWVG5/SbYHyG1pAMKTTXv0mnnwkBdnXjKCsWGKVk3BgbKwxYlVH3t5HlLdz8UbbDWthcY2bRIbkuIupFmc6og+XJ02poY+t02tfGbxwAPByAzz9B9pP/iE//n/8byZt7FH0JrN/HsHkfIBBw8wL91RVAjL6bG2xevcCHP/w+PvreO3jnpsC7t2tcrzPOobcoOAqYQTrO35YCzQC09D+AXQ0GAWsCAKkQSZWhayH/7zi/n1oTxK7tmjOf3zMIOAxYL5d8pta3HRcAybmYBqW3o4ki5tzAhTcoL2DdJ9i3KRfyIEYdhSFTrj6VtiJLeqzKBFUGLPOMq/oWyYAsA9quQbFe4bOnHb543KNYXiPNK+yPBPYRAEdFPRou4EHiuqwKbhs1ZlUtUBOolxc4dR2Dfk+HM4OASVkhXyzw+vERZwrLPTRU+0QUOCkKLFcbtgcEkDadaDePU7lAVVSojzXac4vj4cg5Aq+vbwwHtUfX1fx70xK4RuzBHA3lOKQKy0WB7733Hoc7H/c7PNw/4M3TljnAaVGgqpZYr65Q7854/cmXuK7WuP/ZZxw2vLq64jZ+79138flf/RU+//GP0REIeP8G+SJnZh8VfyH2HjE2ae4o119yvEdy3jP4N7Q1upYq/VIhFeJEtiMLMOVMfy2GoZYhwB0DgFmxwJEaWK2x/JXfwPf+/j9G+v5HOC1WOGc5y9QEALQW5Hwlv7iHNuMfhW+Wuiduw6MMwIsYTm8HaMzlkJrpnky5E7gqqhiltZyjOF6gP+faGP3eOaAW106Z+iEjM/WX7E4zQ912OK3mRPd2bg7AAACo5H/qb0xNu99b17ZXRzSov0lffnYuVbecCydVP539YiB90DgPz4gB8flz7tx/nSHAYl7DEQj8rVulddLfsH6RIz9biTYq3zMUY8GAimhAVQRk9KRsuRB3Kx1H/qI8MJbrSnfX9H2Nn63nS9kI6ASffLP+GjtgRwMq/1n7wNqj1j02PWSR827U2ONzQ8I/TQFgj6Xt74/tnzxXeetjdhLRBnmduo9+NWWcGZxOGO3bMQBDui9cDdnNwThZbwGE2TfF1E8Fl5gjHmMBuoQbHx5jjZkHABxn3LEFPN7mpsWzTJJbJwTYddgn688K/1XOi1d1i4AWa4G4LdDVVb1LeHQg9HCGQ/imaoCXBt+qRVBui8bXTQRukjReLCd1nwA9tYGdpqTT7VAKVr1fLQrdm3FJyPaod2mzqphRIRUnQpovtm6Tx/CdIQ3KAGdEuSofKHAJq9YZBMx1QNxk2Nw82QYfQDXnPI1VZAMXTu3LqD5Hk2FK0Nz7RKVpdZXKETl3l6HOIw4FjyfnFNTXMyAq5y8Moonr9WmAvt8cb+/4ThxM7TBoBaNMvVwlUaGa6oD50QkbMPNe18BM5s2Rc55pezjl4xTC41sYelcjxtNumwDY3FaJ39WwmOs/FCKuTL0JALqtMQ3DKHFB+ZFyPc6naZbtFps9mK4P2xEKaR99lSpF7Z9l097Qu0geRXifsSZCAkJTwScM/gtU/ksrD6a8VsiKnWCZ14g5fo4Dw3M4eZ1t6uVK46eLA53IFkl+H5P/kGo2NEBQ3ubWFbWcxi9mPXw6w3r3bJLYWCvk4WHgEp4jOR+WHMolmBEodjwgffM5hp/8GR7++N+i/fFfohgqYPM+0puP0G0+QPryfWTvvgJub7F49xXK22tcv7jGey82+P6LBe6qBBsC0dIed4scVdKjpNDULEWXMa+Lc7l1SYJ9U+OMAScMXLyBXD4aQWbvcTVgNnocOsxBvH3LwJ8qiLZeLJFzRWCKOB3QEuOMwUQqxEFVcCtmHZ6bBqcGOA8l6j7Dsa05dDkpqJBHDSqYkSUD5/yr0oTZf4siR0mgE4EOxJqrCvzFF1+iTQss13d4fDxgfzgy+LZaVaCCJOvFCleLBd+PjphtPQpipnXAoW5w6AechwT32wM+ff2Au/feR5dluN8+MfuvSlboa7FxoarG1aIEBe9SWzvqNzEDi1IWQ0tRH8+oT43In9j32KyvjNPynoFJEikqPkJyWRYlhr7B0FOBkRq//qOP8f2Pbrki8eFwxmefb3E6D3jz+hGPb7ZoDi36c4diSLDJK9zkBR4+/5KLlBBbY1EW+OiD9/H0+ks8/PynuP+L/wA8vkaS9xjOO+RU824gFmCPpK2RNgegPTFjktiJjHZScHJPY0Xh1gTwtkjl78z+4xBgwQBkAJAWUbHCO3/vv8Ptb/19dC/fx6lcoslzZlIq22A77NIvM/SVb5mIIkfhz1wO4DkAbc6zjOsn25fyt/LtAMA5HTd7CGn5p6ZtM7Wcsvn2aJj6yduOiwDQ+R7MXxH2OWLsj0ueO/VnlLSKXZFrP2x5cvYPMwCgfrJj3QJCpnqtWH86gN5zg0eQp1eNTwwMzVQO5taHu7matefGA809p2qQWZWU/3ZRDjp/d9RhcAxjc5ISBPOl+96gPB9fmhl1/dz+0H2u1X85VmR3L/p4Omrs1qeEhcFJ4TW+RO/bPRn6rKa4bXPlZSo/bl9M/1HtCvQ17nqj7MKTgGFjT+Jeb6Kzo/Yz9JbYs6j3Oq62A46b+xv9s7YB9BSV8kvZOhcANAfvEv/UnVJZAnIENcz2i65MxzcuO3qGrGd5Fr6Sc3P8rbd51PS4Rrhx063MbIi7SXCKAoDjirO6GwUAzQmV7bPiuBUDMBaDFYWnFMMudIrmMaBxRoE9lb4NnmsQbYFQVUeNweJdnL6LQy5HhodiXIjrpwrPdoD4t8kka2UiXiTyHCrgL3bAyHsNhyF0kSK8+KJ5hs/cAWiUIuSpwukCgO7zp+MX64w7n9Nrp6ebUyfP55iE3kryYWZttHMCzA98zCEXe0tbvRsBusIfmDgQ4g+siAxmkmqJW8V1otc8AKC53t33hd4T7vklmwTj7pitdw4nxi4HXq6YOdOvnY2AGhTROQv0m8qn+b25tkMAYOTtkhGsNYur30RTzCEJy08st4l/gGwH27xG68CYcyfkMT6/bwUAeg260U4eG0+aaDMXyci4FvdNHGz7cZ6CRuymOKco8nfueniL4K7nee3w9V4x52ApcY8uuW8QAAzNh1pz2dAjO52QPb3B8LO/wOk//im2f/THKLriP7H3JkySJNeZ2Bdn3pl1dPcMBjMACGBBiiRMPJfSUrtL02olmfSLVofpr+j4K1qRlGnF5QHjIYIEBuiZvruq8oqMU/aeu0e4e3h4ZHX3HAS62sq6qjIO9+fP3/H5OxAsP0R89W3ED7+H5upDRA+vUa1XqDcrJOsl1pcrjvz75ibBgylwQWm0YYWraYRpUGFCjTjiCCVFAXKd2wB1EOJAHXvR4Bg0nABK6a6UtltSXTvZrFbZHRTNSmnKBAAyTEj18KJYpNqSM1xLAJAqWXLNvBKT2RRFWSJjEBBAvMKpCXGsSpyaktOPs1PGabIUqUipv/M0xiSJkXDWMqXKklioUUchnh0zbLMCp6xGcao4+o9k/mIx5Yi6KYGDMX0HiFFjksagDrTU2+RQNLitamyLCj/52ROUQYzl1QM0cYzbwxavX92i2FN3XiAKA0ymFKFYsglTUx50GHCE43Q6R0INL6oGp2POzUAoBZh812k6lUwtQMS8yNhkoOhIasyRhhHSJERRHHB39xIXF3P8+n/yPWwu5siOJX7yjy9wd5sj25cIihA3T29QHk7I9weEeYFNlCC7vcVhv+cGLMWRuvfm+PBbn2A9TXB6/QKf/u1fobl5BpQ7qrqIgABHDussEJbU3INAP3ZfBAgYUPOXsgUAKfKP7qHoQZH+S8ni1IyKuklPcCLKLi7w0e/8Z1j/5u/huLrCaTJFGcVGbSflFLFcaJV2X8brUsBnX9hSySU9zgIAhwTAWQDXWI27LxoA9NeQ1e0pqQEM51Gsw7AOIwdt1AZ+t2L7nk97c/qKudsWpvV6C3xxAoBSBTI/Er0kSTs4w60jW6p7FFDnUylu17h+WPW2k+g/eswe1T7XUjb99m33aWtCnrGKrSeh2/T2AeXXGgAU4JEvSvStAECmofRvvJGYNrHFqis+NPELnWkCaQ86kBspuce4xQdOjt1rWdzyyNrkWH2/dcXY9DvNDC43ANg909ybph7qjVePNpSvNDOgVIXrjgNUynH7npEEmLEDahcAqHI0XfJjTN/1t6Xpz4mgtqHN2+d1u8SBeWd3/RCuMQoA9rLs+v6pOVwro88XAaiMENv/bUWtTAH+5QYAuyWVokhjEHMxOmVlb221RL98AKBPD3YCWqOxNwLHsX1HTsh/0QDA1l5VEU5afIUTALRSAAzHoyWnqRS/MgDwDOtJNCXquh916+sy9XwAt7reKj52TwDQMH4c4L+LPds3vwcAW0NtUOX6DL83AgB9pryItjWjIvQDIXWv1JDvAcARN8cfAciyzHW6r0UAhqcM6WGL5snP0Dz+FM/++E+582u0/ADrT34DePQ9lJsPEFxcoFou0KzWiJdzzFcLPLiY4oNViAfzgIG/TdzgehpxBOAkDBHHIZo4lH1KBQB4ahoRAcgAYICCo/cCFCVBPpTKSzCROMCj0/gYASLpBHFaad1gOplwFCBHDVK8nAT/KO13uVwgL0pOgc2rAIgXOFE0XikAQKrZx117Qd1tY6ySGJv5DEkSoqoKBuIIQKM0YKpS9/ObPQ45dbcteCwU2biYThhUI9Awaqj3SYN5HHMEIacqh2Ie+xJ4TrX/mgg//vQxdseSAcAgTrA7HXB7d4ewCVGeCm61M52kHDVJwCnRrYkCpJMpdwGmbtzFqWQQMjtkyLKTANOlAFS2U1WdUNcld0jeLBe4Xq0xm1CdxBy7/Q3++u9+hB/86vfwve9/B00d4bAF/vZH/4jnn71EsStwOdsgyGuc9nvU+yOiQ4b6eMTh1UtWW/PFDPnxwPS/vLjAbD7H4eYV9k9+iu3j/w8obhHWB9RNxgBgVAfgsgQSABQ1Rylti0DBCkGTcepvBwDS55T+S9xA96Yo4zmD0N/65/8F0h/8BrazJbJ0ypGUyqFQb1AHv+8BwDMQkrMueQ8AnkUmx0XvAgC0a4grwLSzroZhkPMBQBXFrkPe/tJJuqY2pz4Gy+gAoP5eF5WV3dzZz2eYsO2D3gOAfZqa9oBJ3/PBHcEnwk/wrffXBwAUlOgf6XxdAUAaLeeKaYcn9CNFAKo9YION9mqzThzJUHkPANr8e18A8N+ZXYB1RN6Vw21Gw9kpwPYSjqD/LVphI+w2TqoBQONF1bSbBTEszNx4+GgK8GgEoNqYHSzSMeW5AKAaktgwAsSQJrGsOTikxINQ1Qx8UzXvu++LjwD0v73fvasP2ElBM/AgM2K0z2dvlwLcB5VcEYCDa+f4wOZH+w12BKCeAiweJ/ndSp9vn6NPWKZc2lRpf3eedHQ8bRszrXpyRBoOr/OYwaXd2b5wWF6ImqQ2ANhXnIpSIuJ08EhHxmXrAL2LxoryZtMgVf7AO9oB/6R9oyxJMJTeba/B8InRu4oAlCOTa6zSb9zrq2r/DVPgy4gA7GmlwQhAt8Gn7weOh2hTH2Ssr8HvFnD8PgLQI+LfEACUT6TIOmQZ4uMO0eunCD5/jCf//t8j2BdI5g/w8Pu/he3iIxTrR2hWG1TzBWYPHyFeLpDOZ7i6mOB6CVwvQzycxxwFSADgNKg5mo46+lJdOF5lWtYw4qi/E702oDqAVB+wYbCMvikCkOoFisZoBMQFDCBxBKCUMwT2UWQbg2wlRYqJKEBK6aUC7+v1ClVVc8ffvAKKKsGpBqcAn+oKh9NRpApHIRZpglkABsomkwSn0xFxTFBcjSSJOHX3P/7dT7DeXCNtgAXV6IsjXK5nKHJq3EF1CQnLKjElYHA24ci8KE64Acm2qLGPQ/z02R2ePL/FMa9QhwmiyRT70wF3uy0W1A2YwcgEcRxjNpshIGCLUoqjiOkWhjGn/FLTk6YEjhoASNGOEXdSI4pRJGSBklJu6xIPLjb48HLDabmUXhxEAf7hp/+Aoirw4NEDhEhQHiOcthVePbnBk7/+MYIgxTKZIiH//5Qjf3WDeRjh1YtnKHZ3TJv1co4yz3DY7ZHOV1jOUkyrI3Yvfoa7Z/+AqNkD9b4FAEXRC+KBSjQd4lWjGoD0XSCgpiA1RQQK8A8hRf+Ro0Np4CmqyRrNo2/hO3/4rxF867vYTmbIkgRNnCBsKEK0sx0pbZhY7T0A+K7s2XcFAAq9b3/RKvush3c1izd/zlcXAahqiHe2p+jaqhx/npMnfPJsALAXlaPpYJ1wDjPEXLs+YNenu/mQsQwI47Bc2ufnVmx6DwD2qd8HAM31uA8I2AGAwx6aeJ/LfhU+xZj38q4iAMUI3wAAtNNCjQPz/uG1Dcrpeqg3V08EYOsRyfergy0jBViK1CH5KQDAofAycZcbAFS0kvla2gvuX0NTn7XAs77MCECdn1106nPgvQHA/9V4ruGQSaZT7K+cTcWG56QA+5xr8VwLJHurlCJ7I/sSkIecUlfecbf1yB9XII8QAN2mbNWHrvF6NcKGA44F24qaQioN2KsszkrBeHPTgUcz7LubinzoNfcCbM2HMBl793f8YgPUSuh0FNYFpkNUuw4JPekeDnXUk0AGAMhZUH4C0gbXr7BT3G2AxxYC5vOtzS8H7DNQjXf3lIxqGtHN3DaY9JqcQh64IqKGeXCsRmPvzpH1cUUAtnvUXgpHCkeP/j0wUzykXRfNgGXqK3BIa4I0OPsRoJQxBwUAqrX0GLFDIKG4VZYWaA0aQ6o7h9iXZ/3aiKMGsGiTftYXkeNeNQDHntpaL4JrW7dAA8fNFiJWeLz1fLG2dlF01cm81Yrdm0bkM5uWWkr/2HTe9eejDpYOlA683CvfRgYswHqPfJQpY4OqhfilqBAd98DNMwYAn/3pn6B5foPZ8iGmD7+D6sN/hnz1EM18jSKdIbm8RrxaYbJe4OpqgcW0wMN1gg+WE1xPQ2ySBrOgwYxSV5MIdZ1zNF0cJgwA1mHEDUAoCrAIRJ08gn7yimL5ApQBx4Nxx2ACveIm4p3H3MHRglQrkGrIiZ8pbpBkDqX0UpdaSlMt8xJlWaCuAzTRlGsNHssCu+zA+pBSiClaj0A7lDmPk8CpsjhxfcD1eok0jfHqboefPbvFbLbE9XSCy/kUF/OEU4fJESfwjcZIa0h/o+hBkscFpeoWDQ5NiG0U4idP7/D0+Q2ynOoexgx6UpeU2WKG+XyK9XKK6lSzYUzyKi9LHPMcp7zg581mcwYmy7zB9m7H76wo+rGqZSMUSjuukRdHzOYJR9bVTYGL5QxxXWI1n3KHX6qPmOUlXr2+weubW2T7HMW+wTxaotyX2L+4Q7U7oD6cgDzHhKIx90eEec7NWFCesL99xfX6KLqPO/6WJaaTBLNphKA+oCnusH35GKftS6QE4lG0JafZCb1GDgSnAct0YAECUgMQ8T+n//I3rW2EIJghxxTJb/wuPv6DP0Tz4Tewm6QoogRNGIHS2AkAZCCWE0CEtjLdjmEreiwFeCyFaFSmGEXqbYHoL3Fg2/audwlavvnXWJOh4ewk8U7lmHYj6OS4WAMlxN1yqn//fefil3/3fVofAPliAUA/4KIOyCStNbtJtyMHKSCEpp8ENcVbKzNcHLp0b9NXdSAisJeCcc/1GKk/Z+KbrUU1OCedn5Ut3dotkhYtzc8Lchx+lyrBNeRkqsh17QkM4Jz5Jb1Y7wG7XdP/XgDNALh1HgioRwAOTci0B/tXSUBI+8B+9xcNAOpjYs3B+0GBVAr/6HjakJcO/8MFALZ3u/hN7j81DndGnTsF2C5fZNOXqxlyBKDDcRPS29lgtPPNhPgwxmTNuQ/mSWCxlSKWJm6EneP+evsU4CHp4wb/VBds24vvxizwCJNLjKaeF//uf/MAgDqAIh9i1dkay3H2R9fQM03Q4j41/sblkAP04ZvGNrb1ZG3OBgBITTKIvFqRTH66DwAUfKtGYfzfiROxcVm+ne8/j5Pj3ld83QBAaz3bEwhtA+gatwUA1Jr3CdDbcO8YAPTxM73bDnE2DQB//R+eleFA9/ndX+K/Hx+r71dBPrPph/xTKwx6CvyLBgB9WkOl/7YHy3L27FE5KOFQaCY9VX2f/im/YLPOoFM1HNpaDu8AABTrK4A79eWQyEKcDRjXHce/KwDQUicj9vlYDVBDNZ0JALpN/E4/mbvcpJhp4FDMkaWhtP3fM9elwazX6+ia/qj3aAbyewDQq3HeBQDIEXbHA+rb58CTx8h+9FfY/e2PEaZrXH3yqzhdfwfF6iEwIwBwjma5RrheY7Je4uLBEusl8GCd4sPVhNOALxJgTg1BCACMqVlHzjX1IqoJSDXbgrgHAFLUH4FinBJMYCD/TnwQIqpDBI2I0qeEX9XsgwhDzlQYhQwqUWOOlNNwU2HVcaRMSO1tUYchjkXO6b9UUy+JIqRhiCQMEFG0X0ygNNUQPHFk33w2wWw6wc12i5c3B2yWK3y0WePBMsIyAaiR8KmokBUFpxdTwxICAMMowCkvBQBYAoc6wi6e4Gcvdnj2/Aa7Y4FksuCuu1TjL6KOx1GIOIpQZieu8ReCuiKLZ1NU43xK4F8sahXXQHakphlUN5GmWKMoCk5fTiaUap1juZpQIjUDgOvlDPMkQFDXDGKmkxn2+wLHY4GnT19ge7PH/tUe9bFBk1VICiAhYHF/xOlui+aYgTqpBEWOusi4mUdU0c9HrgVY5xmKu9cc5ZnMEqQppTPfIayOqA63KI9bhNR4heBcCQKKRG8RDahAQAH+keMl0oIJAKTc6goRwskGRbrB5g/+CKtf+01UVxc4pimqMGLwO2740lbC6wCgvnmGxOx7ANAH2AzZ/x1lBwFAshfa866Bd5xxQOI3uccBofua7F82AOgHmNXhmJiFcsx1jeytES+EpJ8ELQAoaMkHptotbGOrTsyuZew1fbwnxWs/INY/4PLz5HsA8HyA0fbjFe9/eQCg8J/0HMMvHwDsmJ3Zm/ZDG1Ty5QCAascod1uDG2VGmviLngJ8Tt1UAQD6IgBdAKAekuXCnnV6iQ7MLu+q8zH0/UrXnw8AdlDikI7q1wB0XdkeADhEEwe8GFtGjVfR/C0AQEZYLbhTH8zbRgAKpjAF4rsGAAe7WJ3DgRpnK6VlA4DK9dadwnMBQB1CEApS0EKlADNuYeqzHgv4zJ97qjIXe33NIgAt5akccrWFW+i/NTfMYEDHDN30O5eqjvQPvQnISJdPNk6sGgdvAgC2rNwDL8cMTH8NEyXQDbIZoIaIGBEyQaHa91HgfYDrbXm2TQHWrMBBKngAwI6V3OCfpXbbU+g2nUsCgMo4cJqxZ6RKvwcATYDO3pnm6VX/uMkyB9qoZaWcewAgM6B4iyvCWAd6lf7q+F/APO3XewDQu53fFgAk3Z5S9bmMAMCXaJ48RvLpT/Dkz/4cKCNcfvwDlFffQrkUAGA+maNabRCsN0g2S6wfrLBaRXi4TmUEYMQpwPMo4Pp6syRAEhRIwgZRQGBXBFAEXA3k1LBCRgCqVGBKDS6CEFlNUFbNBfSjOhIAINW/CcDpu9QdV4D21Dk3YgBuv92iqWrM5HfFdwAAIABJREFUk4nRaCYg0DEMOALwkGWYz+Yc5RKzs9tweizV8yMAkKLcQpkeTPX9Doc91xm8Xq/wjfUC6xRIQ+qBUWOf5ThyQxMRdUZTC8MIhyxHUQEZA4AxbpsET26OePb8Fjd3B9zujgxCcp0/qjeYTjiib55OkRDgRQ0vatHRuK4qBGWFSnY6JlnWdp6kyGCiQVMiSoDZcoJ0FmK9mXIjjarOsV7NOLrxsD+Agvam6RL5kaIHQ7x4foPPf/4EkyDG3fPXOL7eI8wrLAiCLCqO+jvd7VAcjkBRMOgXlBkmFJ2XH1Bme9T5DsX2BQIC7IKI06bpukkMhFWGIqM1OYHzluURiwkACiBQgH/im8BLBQAWYYwmWWH+/R/i6p//a9QffIxsMUXBtItZ91O8I+sMJcisJl9qA70HAN2i5AuLAGQA0BV9Yo5DHSidZbcY9qnhNmu3n2t7ut/4dQIAu0wpOdYeYNp6PMPkGwUA5TMkbXV7SdivMnLX9PQ1HW0esJ61ju1FMvhjKEpRHkj3c76G1/g9ACjsp7FzZbEEZobS/QBA89B8QLp4U9TFCL5KANCEhgQAqORWNzqd/951BCAfjCnXr5cs3ZUd0lOA9UMXn7S7PwComqd2kKxZI9FcZds3EBGFHWwn+PDNAMBW1HsDivoA4JD8GY40l5hRKyffKQCovKD+dhSKb+z8Rj/rGVBYXzgAKDaC4ZXxyp6raFUXYEkDPQW4deC7SCM9XFUYdeZ7+oCkTlu9/p+MALSCFW1Q5txZDFB/VN95M7TOdHAHmdr7dkVvOwRS25BtSp5jfQ0VMqxO3o5+lqJSKbDtaaeq/TQwUbYfGOZtL3AatNog7ZnQ9ebfXLTwGBwcwTowPicCqF9Le0Otj5762xvl4ErfOwV4hGOVQX7OCJwAj6Knxdv6VnaRi7mSU7l0WdBFWA4DgD5zp9/F2vUcPfV3OA14OALQuwfsEzKdJ85IQWH+HBQiFueqmpRnPFexwdi6KBWuU1mn0Zh/YdNGP+hRRqiYhW6MdRaRz5Dlnf8VpwD3NVS3wZy8Zu0/u2u7K1tjiL9Uur4vTY/l4wARSdcmQYQmy1Df3aB++hlmnz/G53/2Z8DhhNXlNxA++i7KxSPU8wvkkyWCq2sGAKOLFVYP1pjMgOs1NQMREYAP5wlmIQFaMWYUCRiWSBloCzkKkADAsm5ElF8QYFcU/DN9E5h2rOnvYBCQOunGQcpAIPFcRTXuKAVYgUkMgNWYTafI9gdURYk0pLpwXekIaqpBp3BZWSDLMizmC5HmJlN9CPyjeoAEAFK6asp1/WpM0xj5cY+L1QIXswk2UYwJ9RQJwCm6uzzHgVJwZTQfH/SGIdcdPFUBjpwCnOD5scHLbY5nz27w8vUWr262WK43mC9nXOMvK0pstzvMkymiJkRYR2K+tG7kjBSlmFtdcSQg1z+MqMNyzDX9mqBEE9VYbGZYbqa4vFoAAaU/n7BeLVAXJQ67I/bbE8o8wKPrb6AqA7x4fotnnz1Fvt0j3x6Q3x55zbE7IMlLBoXDskRVFGhUBGCRIapPCKqcv6M6Q3l4iaDOGbCkaiNlfkQcNtwROUKJ7HjLoD6RnNaKUrVB6b2qM3AgIi7EetRARPX/qFZigCpKgeuP8Kv/5r/H6cNfweniCoeI/i6i/8gWpIqNeg1AfhGfDCrpIv4fkiNjEYCq6+qooTdopGn7z7WRR5qsmbOwXyJTqn3mx8jA/V1ER9J3pfDraGvKcDHd4RyK9uqzjcixzCPd2XyzFXu3AKCffjRCjgAcmH97dCoNLZ26HV1HclTGFLR2gN41FdLs6Ra4l7vIsKXJvjJpfo7dqK8MyQTbAu9sE3s91cs99rhmK4kUYHFQxKNXKcAaTdxP6mYhPh9cIC3F3X2ZXeKln6JrP1tfTxWhpVHVutyVAmzyyfA+UL628qlVNOp5EYB+O6f71Lcn+/mPNn3GUoB99pc5c5sqfSoxaRkA1ONezPGb8rL/DGVPD/k4No5u0NqqCSieId6v/DKVQq5s8OF0Wll5l/FgnWm6MbfyuR2swk86nekEAPXJaQMQqdM6oNuNXY2C6jQP7Xcl07p969/vHdioZaq1i27uGbf+V2srKdHSSlFGZRCqu/vjCXwpwL0t0nOKVZH3QevhDCzfYlDdWdSEn08M+FRlB7hp77kH+KeabCi0WJ1q1bzLmK21OcoukTqgY6yc2SSA7jUcKJ6vtWEcsrufZ2+KK8NaHN5h1tjdVOQIL4+B43NwedN4agAKB3jIuNXpqsamM7wwpiidyB3lKe7ptsLQSP0q/77z00Wqdg4xwKKODekAS9RVPuHcGR32q+zFM3/3skcr7T1UUA4AP1bfD7rQ6fZeH+D0MJdnYxsyXIvWUicl3YmJx9ji+8y5KX7VTSilvDq1Yg6MZ6ci/rS6gn7aCuYU9Biir582La9pl+ljNZ8qT7rbEyllPrn2mb53DPHWt0l6NWEsenpTbCjCvJs//cTy0PIpDP6XI1CObQvmaetoqzubjTR7wZDe7p1j0ketdUchlzkg7znzgGRMxvj02/hnHjS1rQHkf4pNf+94tTm3IsG3j8dq/noDiqnLasT13urtHnjxHFfbG/zkT/5P1I9/gmRxgWb9CYKrb6HZfIRm8wDRxQNMHj5AsF4iWc8wWcXYrCa4XqS4nIS4mlMEYI31NMEyDrCOGkzRcFMQAgFp01LX37ymdN8Qh7rBsWmQUXMQAHtqdhFGyOoGWUHAEfXYJTupAdkM9D9HiSrbgVN2BAgUMiAU8v+i1py4nkBDIZe4qhz/z7UyqclIGHBKcEDAFDfzCLCYiuYSUZ3jepliGYZYhSlSqk9Y1siaCjtqKEIRgJQySyA0pawSKBVPsc8r3Jwq7MoIT14XeHl7Qt1EOBxz3Nztkc5mqPhfzZGAnJIcRUhAUZNz3L68xXZ7RFiHKA8n1HmB0/GIMs+xWi55LtQkhN4ZzVMUyHH9wSWW6ynmS6JXjkka4GK1QpAHePr4JX7++AWiaIL15gLT2Rz7fYaGmpS8uMHu2Svsn75G/vIWy7JBcfMa+e1LoMi4MzHX/6sKBv2q0wFgALBAWOec7tuUBxTFAVV5RBJT4w5Rly8icI/bvtTcmIVSmmsKRWQAsOz+J7lVi0qPTViipLWYzoDlJb7xB3+E2Xd/DfnlA+SzOYo4ZDpTR2laSVrP9iCKD0s02csbzdy/vRrdWokO1zYbqwE4Knt0AF6OzdC9dokKQ2X5CqaL0RIc7rffRyTcaI3p83Ro9xZ9dv4MCV6de5kvbwYA+qyDcbDDpG//+vEJ+AGuzsrWV6obs/aTYSMqe7Fz71320lgJQALexQiE4hE1k11fYhz2ehk1rOWT3HbAwFNVfVDnx53d231s2d8jTcJYpuj2nQ2I9vZnZ4MLcou6xUNfNs3tA2Qfd7Am6m1fBaAoIMrkXuXDqPHYAKBeY3BMNomxmSO8L3+bTUX6VBLjHaCCqwSV9QgCjPxfI7PkDdBa+po/2+0f8XyFPZj2+v1LQGlvcxhw9p8M3uKhdm/UR61HsLlkZn/vy73Ta8LiowfZTYIaQ1R1rrfSudSsjQNi1Bz6kk9c2j3dvsLgX754GC7s/B3xPPXs7h1UJ9rHH/wEifIJenXzV09RhwjtjjPYsQ8AjihUUz2OKUDTeXJvBFNIjhfh15/iErDmW7ooPHntvTQ2HacLhdICgCyQhTHPRaGlC6mEkQ5GuTaLDVbZ+kqITxXK2i9SbIsilVJjLK9apNEUwzPWRzo9Q0Js7AmhFwBkjT2wXYcEpwrZlwBgQ4b0GQpukBb2DEyeshWWTYd+BF4nHswNPaBcLAFhd+G2Z8aj9WhlvzpRN3YPGAWp2AHxPJUYuP28E/kmFRRN1YnriE4842NjXaQDzaJZpZm0QIRPRqjd1r1QX89OLCvHrM/t/PS2VlD3vHG6SrU96sAME0OnttIg7Qh74NMwADjayMO3HnZXMTselQAaz5eYfsdf+oGIHaHZzpfmRoaBNscxR3dQfnn2krjHlEN9m2jI4RDFS3z7kT77wiMAvTrA75C2O6fVJ+Zxl4umPQdrzL710p8i3fzCgOAaCrWjum/Bq9dY3rzE8z//f3D68Y8wSabA+mMEl99GufkmmvUjhBdXSC6vEG5WCJYTJOsUq9UUV8sJLhgADLFIGmxmCS7SEFdJjBnV2QvANfeInMR6ZU3VAUOcKG22IhCwRoYAu7oGpX4eqxrHokbJVfoI6Rd2gyipQrwrIscY+JPFrOnnWB5o8XtA93PlQPZB6DraTWwhcASZqE1IAFzCacE1ltMIsyRE1FRIUODhMmUAc4FEAHI1AZUN7uoCVI3vbpehiUKUYd0CgNT999WpwF0e4edPDxxYhyDht1ONQKp0F6YR5qs5posAZUH9NajxRo1FMsPLJze4ebFFU1AEYIPimOG43SI/HrFczrluIKIAdRJg+XCDrMmxvlzi4nqFeELLSZGOKTbzJaOqN892ePr5LcIwQVWXuH54zQ1BDltq+JHj9skL7D5/gdOz1yhfvEZzd4vi7gWQHzitVzT8EI0/qpwAQPEzNQOJiRrVEXV9RFVlXPOPAECOzgsIaBX1/6qqEc1bKMW3KVoAkKMDaX1lL4sgBgqymaYLLP7Zb+DjP/jXOF1c4zRfIKfOv1HIXaJF6wJaUwEEuuSA7gi09p3mjArQw2f9dFFDzr16xvE8exTW/jcscEu+2+ldQrcMCAHa3rIrrGt8StYOiYivXn6eYagYl9wfAPTan0zaEQFrCVA3QOKj8Njz3faV+67hLJEhe0lMzzO+FmCRDbq83oALAOyerew9lbFg2x8uC368aYXfR/WlsOv2jnp3D8AwIuRN+grbdOT9RrRYR5+urJAvPr9nHsmIWbHnu2YUHeXs5XQBgGM+l7EOFqOZ/D0ydwYw/RG+fvZzNYUzuWSsSY7Xt2r3dydDW5o6kVupCzzy2ubhvj2rosakXS6bSGiP7HajJE6rgRzyyLDZPb5rP6hJaj8HwKxoJu4xI/bGxOFYRKbI4BqTee1u7F3b6jMpVsaeZPg7RhaRsBC8/MOblFNSu0hLuSaG1vX4IcHmfxhuAjKm3vglXgPeo/zbh5ub9J8SAChO86XQVfXoLIIY5HGcxtiHC3pdpBbMsBZi7Jm6uPUz8xnr80sHAJoGxxjY1m+C0VFfrZPPvDLhDzNisgWWtPUf23NjAmc8Jd3e9ecCgK2olwa/PutOQL2rGp+GYvYAgGzMDTpJbw8Aumr+6es2th7+FCY/gNSpIfmTAj8lC5vv/qcHANqRgO1e8QGA945AG9Ny7wFAGwDw8fSXCQAqo5Ei5mpK+7y9weTlM2R//ze4/Yv/wA0hwvVHCC8/aQFArC4RXdD3BvUsRbKeYrme4XI5wXoW4nIWYJ0GuFpNcTGJcE0dYoMaKUUBMgBIaYsEAIoIwCJMcKwbHOqKAcBtRQAggYI1DhRtV1O0l4jWY8CP/ucIPhF9TAYnAXtseBKgJ2La+WeKsMspApAi0ji1l2oRynv4fmEATpMEcwLkkgCrNELcCHBrNY2xmARI6wppGSDkVOQIWVNjW5fImgB3hwIVdR4OCdoCmmiCHQGAWYG7IsSzmxK7Y4O77YGbg+QEdmYZLh5cYX21QhkUCMIGSRMgJlD09oRXn7/G7fMdlfLDerZAnZ1wOhwYJOSM5jhAEweo4xDLhxeoEyCaxFhfLTFdJAiiGlEMrAkAzIH9iz2effoSDXURvn2F9WaNy4cPkSQp8sMJ2e0Ot589x/7Jcxw/f4by1Utgf8sAYET1/STg1wMAeQUzbvSChr4LTgEmeE6kYdM6iTRVCurjiEyO/KMezxQZ2BURpzVlMIAyJuYrBI8+wg/+1X+J8tFH2M8XOFGtxCSFyCihKFLaRaLEgw7+6Y4WA4ROD03IrPcA4Fd9gDKmOxzuttdh6gMWfgDiFwMA9B2W+gFA0fRAt7jtrvRDEW7qnl7Nba0z/S87ACgklOeLLjBLHhsAoMpnMzPSTGdGRWyqbUERVHYU4tAI2rFpBskvNgDoqZkpQSBDXYwcQLeerm3QtfepIKd+OAevSSucNC4ZSNnXAzPM9exn/IiTcwkA9hC9zh/92gKAZ4J/TH/jQE/zoQO5sbwlEMhOfEsAcD0CANoCwOCVUQY7A2CSKa8ugcw8NhbB4BdREizuAIj7xez7IwA5HViOTzj9ZlHSvvrvnwDqAUAC3BFjFT87mkwYD5Xh3dqi2Ov1pQKADm3BkQoDEpxnNxgB6OIdbR3V6fe5EYDOSDZb8pm/K/k27PDqTTD6kxTz7lJ8etCalNb68+0IwFZI64HgHq08BjjZwlelTgyq+bEo0jYCUK2X7sLoAxW53mOA17km9bsDAFtNJlZLCmQxC6mEWiFt8iRzo9RHatd2Hbi6mfjWZIwe50hQfYO113sjACVfSi1+brSic216EYA6Pfs1DO1n+CIAfbxg17Zq679Ye2NsbuMB4f01b8flPV3vG0+9+cgU8Pvt2XN3iLxuTH96CNC6o9qWHuPHrwQADELUZYVmu0X4/AnCzz7Fyz/9vxAdToiXDxBdfhP15hPUmw/QLDYIN1ecAlzPpojXc8zXc04DXs1CXND3NMADAgWnCR4sJpii5jqA9E0gHEWCVU2AqiEAMGYYaV+WODbAXVkhjyIGBfdljX1NPhIl9gqAbxInbZ0ZkhWRBAAVGBiJYEF+D8FMJwpw5CeI2n4xj0H8TutTlQ3mkwku5lMsJwL8o0YXcVBhMYmRRjXipkZSCWORmopQvcJdReMNcJeVHMlYBBUqAq/ChAHA16eKAcDHL47Yn4CnL17xnE9FidligW988yMUnLx7QhjWDACmTYS7J7e4e3aH7LbgDsgU/RdUNYKqFN18p6nId04iVNRsY5ZiebVBXhcI0xAXVxvMFhOEccgp12EF7J5t8fnffobTzR5NnnE03+pyg83FFWLqIFI2OLy+xd3nz5A9e4H85QvU29eIygxVtkNQUZQfpQBTM5AMQV2K3xsCJAn4OyGm4ohNgeywA3X1JRoL04RgUYoUCXjdOeIvpEhAkRqsMjoIKCyZNyKEDz7Et//Fv8Llr/8QL5ME+3SCKp2gobWXEUokv/jwkL/dxUIY3vUAgMK28Lro/giCcyMANZHT8xW1CEDbXhL60SMx3kkEoGpCpgb5jqXpmP0zKo619TGMFteN/wQBQC2ooaX8oF+oR6gJO2FUP4/RzHKQbQBQP0S0H0W/mwfSch9Ke28cABR1Qce/hvfoFxUBqCTK20QAnrWTdACwLX/T+QJ9jpbUUumzMgVOAUScQjmKK3QUt8XjmwCAXjtTd8DsC9sa9MNPGE/R9wRYMBl1v6ofsOCyRRW3nbV+DpBX3Sdq2Ynfhry6LvpMjuSNAEALI9DsapN+ui7RyzN0o1M19Ydo4FsPtsHOkEm6Z9dPARYp+2fT3sgA6yjfIuuOGtidNKEXyQxISTNxufJbx33QYPU/DkcAqs1lEPMekxtPGCIB7E8Re1sAUNSUsoCjcYmtvKeWmP0UYAHQ0el3dxKsv0c8wlZw6tTW9WG3/CoFmJ7PVujAiPsGYE/VaLeqz7pr/O4cK0h5Yj1EMl2p6uyry80h9ecHACX9nPUXBJ1VBITXCDYEkk5PXbDJEbaL1RHNb39Qzr1HucuNODQ+kRIm6kMNmYO9pXfsv3OFTf8dCqAZXqFRUdZqYMFLnUGjc5vcF/ZAGQA5ezMaFxpk14rPturyrBRgaYRaQ9CHaTawkHPU9rWaPsfXecLHWxV1z5Rf/w5txZShpBXPmuTWIwDl3lK3vzkDjRy/jK+t7eDaBrHNHvZQdYXOtLJucEXRqlG5rh8f8X2uUPV7hgn8riJiB0f1FgCgLsN1mg3qAodsEiCA+45xQ2k8BZifH4SoqNvsbov47hWCxz/HzZ/8MZrnrxBOFwgWD9FcfQfpw2+hXlygXqxQz5eo5zNE6yXmFytcXM2xmsd4eDHhCMAHixQPljPMwhrLJMSEogA5LK9g8I3qAFIdNwLMqPsvpfzu6wZ3ZcmRgFQDkMC/bQkcKTqxbhj8S8IEURgijkLKguXUXYrqSyKK0GvQEFDWVCJSjoDEssbxRKmpNXfEjZoS05hSfAkMpAYgCUcATpNYAJR1jmkMTGOqDQjEBLIR0FgLAJBM3JIq20Uhpy6/2p8YAMxRMgB4Khucmgiv8govjyWebytsTw12hwzZqUScTrmBRzJNEaYAtbFNkwBNnqPcZShuT1hEcxxvTnj62TMEdcPgLNVppFzhy6tLBgBf7++4I0m8nGNzfcURcWTrxGmMdDrBarNCWVDKboFqm6N8ccKrnzzG6eYlgrLAdDpFmk6wWl9gvljydc8fP0Z+c4Pq7hbY3aLcvka1f80AINVIbEqqBZgzAEg0buoMdXVAHDeIk5jXIDtuURVHBgEDgl6rkqM2Sc9zuhhn/FMjEKoFKBud0CEn2YHpDHkzwce/94e4/OFvI9tcYDdLcZpMUIUJmpCMdVFoXAEVwv4V+tG1TexOhTZg4U8AlqUSBjas37YRN/lrZPUbPOlzEHvfo8H0iHXHGMWBuksKdRebMsS2QMdldQ8wsm8ZAQBHazSNjN98vwmXuPSTq+i+b5aiWY3va6iEhbpnGOASto95v2oK4hb5OtghrhgvP2LRxK7Z7Clx65q1K+LP0G16RI6chM9EFfvDYz+P2Le9jDerlvGYaebgGDkdBa76B6DrZ9pL+kHqmO3JnqnA69qvTl7JVEpXPWftb6rGvG6z+uZsA66t++Fk8a4m2tAOGHM/vPv7DADQfq8bgPLYh7LEmEp1FU1nHF8jqd7jkrB/hQIAezJdv9R+7xgAyOVQrHfpGVoGVqOnwNrcKGSJrR8VeqxeQcMZoq64xkwBV5kY6n6fv2GmH4s5KZk9tm+F8LPHpoOafbnbetTtw+kvegSgbL5GNJTPHiuN5AUA5Ri9NUD8jDUmQn75AEBl7A3RTTCQjPwzABK3edhP6ez9pXuVBpRo7Dq4hKza7gkA2qM0FZT5qi8fAFRNazu+7HcoVXUd5Vi9gLcL2Oqkm1BOnghIub5DAOA5QvssQTP4oDMBwDEt2Sqp/omqeLUOwhvao2sifM5ktWt8kUamEPZx4Ij06s3brGuiC2SO2lH1QNWiyAt0KTgW8dczGM6J0rB4VDemuue9ewBwlC3OWNO3BQANBecCoDwOgsvBOmPIZ18inFO/DvRFSJ/9It+Fv+AAINs6FAFYVCj3O8T7W0RPPkPxlz/C7u9/jCCMOAoQV7+C+PoTlLMN6sUawWqNZrEElkvMrzZYXc6xWiW4XEa4mEW4mia4mCZYT2Ms0xCzqGEQkJtHcNQHJ/JyV+C8CSQAWGMnG4JQN2CKsNtXIfanAlVRc70+alpCdd8IBOQGHpQ+GxGQFyDm0ni1qE/HjSYa5EXDQBgBUpMQWKQhNospZkkMlBXSMOZIuZiBRKohWPNz6GMBIlL6sWgwQlFs3ASEmn/UBPQFoHp/OTUwaSpOBSaQL9MAwNsiwqEIsD+ecMor0bwiihAlMU0dYRKgrnLUpyN3/P3uh99CUAR4+eQVPvv5U5opA4DlKedmHGkS4VScOKpxsl4gmU+xWKxEXxQEOOwPSCcTXF5fc63A436Hep+jeZXj5qefYf/Zz4FTxg1N6qrGan2J5WbDzUiqIsf25XMU21s0u1tU21fIb54hLDNRB7DMOTVaRP8RwFeiao6c5hsnBMwCdUXdhg8AdQumCow1XUu7WMhPdjgorTiQdQDJBKfu0CFQxDM8/PXfw6Pf/F00H3yM2zRFTk1O0gR1GHMwB3VrphRjWn/WjAygSEPeIevHAMCRJL3RCMAxGeOLmPAkpCmt/w4AQL+W6R8ijPsc+pzfNQCoDns7u8wev/m7eR7ogHOs27+OAKDuLIvGRUNOtx3tJMBw/5dFk3sAgE6PyTpxZh4eOIUejwAUhwJeAJAnN2yEfFEA4FhkpaK5DgDS3yjqXLeLfId09A4h07oVtAHAln1131MHANm/PB84edcA4NvIP9Vg5VxaMyeM8rvlH32BAODYzut6HOjra3H7mwCADghT+crd08W+79bbDQC6gsw6UFiW2hhs4mI2eWItrGV0yZ1rsIgdkWgf240CgJo8V/RXeZ4mIOk+eDH3q7RBW/9aAoAafUcBwKUVATiqEMd2jEmuUff1Fz0CsEeuEaReOY0KFBLr0bGK+TzRMEQX5mxUqj+04FOHRDhMjMEVfRcAoKh55P5SYKcvyswdISNmcf8IQNk0x0gHNkenhz27BIBNfxPGbyGh1gD26H42lESA6qgoHt51nEJ0r03ZXayQIv8KnfH8Tji7IwBVaJY9UBVRcf/xvysAcDwFtK+QdcNQRZiJVGAzRF8H4lpM8AuKANQ56IsEAN+U1YZWeAwA9HEGy0pPEXmWhW8JALZb5P4sKkukWAcK2nNYislmDm/w+PNu+QUGAGn9KwkABtT9dXuH+LhF/Pwp4n/4Rzz/s/8IVBXSxRVw+SuIH3wbxZSAvw3C9QXCzQXK+QKz6w2WlwssVwnmSYmH6ykuJxEWcYAVdQNOQywTcGotR9m1qZ8hN6YoCKhDiF1VYd8AWRCIzsBNiKyKsT3kOBUFZzuwvm5C7lbJwBwqpHGANAmRMghYMwhIzSjqskSVV0jCkGv8TcIG1+sZFmmElFKDsxNSahvCQkxEX3N34IgMQaqlRH+TPCaNxCwvUNQNj5lgRQIBT03N32UA7KimXhNxCvCLY4UDJjhUATf/yMsaZU0OvlRcFLEXh5w2G6HAejbBJx8+Qnms8OrlDV48v8XpWCGJJpikCVIC6aoCh+Me8SzFdDnHZD7HKcuxfXHL6b7Z7ogojHF1/YCBwEO2Q3MsgNsSu58/wfbTnwIvXiCkcRQVJtMFktkcwTTFZJ7idNymwNaNAAAgAElEQVQj39+i3t2i3r5EefMMSXVCXZ5Q5ZT+W3D0pEjtral9r2jIItcjSULkGUUB7hEGOeqaOqCQMS6MawHYEwAoagGWVY44TbkmZPLgY3znX/43wIffRrG6xJEi/2YJyog6/4pMF4r2ZNBDKhFlw6gslR5c1Hkzjv1u2n8ugTDmcI7J87EIN1+XSeGseAC5syIA/SP8OgGAXaaHcuXsFTHtQ9qzpn3vsM6t6b8HAE1beUy/sw2v0VD3b8WTTJrrK+YEAC2DsY/nqJfZPpvbEPm6AIDKy6TiBiTteF+dk+3natKgDsK5tq0G6aifv0YA4Kjn5QPs3lkE4JApp0e4iZ/fZQSg208w/R3bN+/tlrcGAMV+EWrOfvqbAYDt8zhTQ8yn9b96pO44gOv+fpEAoHM/dV2+jcMQWQOwn0HaAe5C94qawuoQ0T6QGNX/i/+pSwFmYeoEbHwQjtdFezsAsI2g8L1jWIDTXaLHmi7otblogsjl6HWEVQkawpipJWhDnYAJfyEXT9lpAu7yGC0Gk1viRzOIzgcAO3a3zQsBPpnjMRnKY5y1JDND/G2BaUfQ2Z+PAcpu8Kt7Sh8A7GbZGs8D9BYnVJ2Jyusk18vkqE5pC/0+qhZMnmovN1dgzLhWTttbA4BqMuMvNKd9DroxkgLTPVCaU7KGZbfnJCM53/UWAKAu5a00QwEsq1Xs+N8mj7rOJ11sgqkaf6obl0pT4rdIY0GdCunPfxMAsN2dZ6yrHwDUZIAmf1puPRMF7a5XVBnYJ/JCbRcPkFg0Q9C/egbxiOgfPeHybecR/TJuII1zztjeFiUq/Dr0jOV3P8BR0qAn985Y+046OsSHLnudKcBjsnS4Si29104x0p9GerjiEmohd5stt3cIsx2i508xe/IUT//s/xWNQWYXCC6/g/TBd5AlKzRL6gJ8hejiCsV8hvRyjdX1CvNljDQp8cHlApuEatoVmEaQUYDAPAIu5hOuqcdygKK3gpiTRXMJ+h0a6gIbcVfgYx3iVEe4PVTYHTNhJVC0GKdtCL3a1Dmn6lIabRpR6i64gy+oJl5doTwc8GCzxoPNiqP/FjH4OgI2yyzDJEj5IEzYJFSnjrroNigq6h8sauyKBiR0Gi6SVigpkBqTUCowA4B1zZ2B6fdX2wNOTYibE6UAF9jWMacEnyiKj+oZUiRhezIfcCTbcb/FfBbgGx9cc3Qk2a6nrMQxK3HzaocoSpEkMYOFlJJYlDkm0ynysuCIwtM+w/HVFjMkKPc56rzGcrXGZDpjEJMavNS7EvvHT5B/9hj5zz4FjkfE1IyFBhVHCCYxpos50kmEbH+HYn+HevsK4eEGUXnkyL7qRE1BaHwlg7hMDQJLRRsWthUmKUUWHlHld6irPVVh5LgYmjerHF42Ag0JQKQU4ROS6RxFMMW3f+dfIP7BbyG7eIRmc4k8TdCkMQOrNE8GZ1lHdIXuxRaV0YWObAF1QOLeRV8FAGhKI6n1nfLH1QXUvnBU/PgyKBwlH4YPywdE5OiBXN9G1ilgl4BTx909O1lwT883EOaS5p5adpJNn/sDgILPB2bv91XaxPSB+9v6f52G4C6Yhl41qKU8fTkclaZ6/vhsh3bs7Lx3UGxEA8n18JsxZoiFvT49gMjWlurhZwKAWgrlOQCcrT272n/jtonOeqxrhWRqAUDSKbr55LJDbP3cRmSx8yU5fuB/sSW6dEXnfC1y9iIARwTIWMCd1wXire+xX75wANDEHZigLHDsMamFkjpqfOm7dfWanxrvymcaEqylvcYZZ6UAd1yrDk34CY7gqG6/23JYHaL57Us+CLXoMWRPcxaXAgFbCWXZvHYEspXhw6PUMjjF3eKNHTW1ETkFmJiroRpa+usLpvS/WhUt5V2uzSgAuPyf//d2NE7CWItiq3/hsPkWwQ771gk6bsAIxvBxdF+pGm/ohX+qGfSbMyh+FosoFk4Yz0pHC0lGgpHAP/pm+K89zVXLrVNJ+7nVAZ1UM+hnAIDyWWEHJyhamDKxe347M41ezi5arb3RN27sE7KefLUjztgh0L5sJvKtnYxO6K9uX/DoG0kPEz6nyG37fN6Y2jGUtjkVm9ltV4aERbvSsohtN4dug/rvVTvafGPfHu34200Va0daLx12rwckXG8trS6ovRQKKd/6jCKpq+jhNB/eOAVYDVO9VslRXaFrYtQb4+iTLh2vqad1beK70yIxR14pnT6S33xGxojkNANMnQM15Z96l1dkSpmulK4eo+vlWcYT9KvdHNnNt5O1bhqLCCWfvB5zEMcAQJ/6ECeqfRnY3mM16XCNxX6/oa8cxOyd6LXyvU8h3rvMV57VHPOAvMpTpeb7d8DQpyJ9SpkqrquG5LimJz2bgy0LqrumiyrN/hF6WOhpAp1SimR79RzJzWvMXrzA87/4cxSPP8U0niHafIJo803Uyw+A9QeoF1fIJ3PU6xkm12ssH2wwW6WYTIHNIsH1IsU0rJA0OTbzBOtJjA2lBMchkrpkkI50TxOmHN1VUMJoSE1BQq7/Rym2FDl3V4bY5tQ9t2ag8FRSR9mGm3dU1FqWov2CGgl/V0CRYTmJMUtCgsNwMUvwwcWKxxNVlOIrznwJSGNjlbrT8rtpLCH1w+COvYfjEevNBfJSNLEQUYLg9F0Cvaq6xrEocawaBiyRJNwQZHuquLHJ7fGEF/sjDki4k/GJxkw1BKnsXUV1/QquuzidzrHd3eDyaoqHDzbIsgMW8xXubo+4vdkyOEuvJluJlrqqSiwXC1EXEAR8TvHk089wernFMpwiOtWoMqqZGDBwOFmuGOQrsxzN7RbT21vsP/1HnJ79HGFOtfoaUOF4omVdV5gv55ySXFDdxCJDlG0RlkdZ7+/I9f04+o+ASgLlwgRBOEEQzPh3qgEYBCdEwQ51Td9HCdjJXUiMpr6pViOlTtOqLB7h+3/4b4Hv/hoOmyvksxlKAgAJYCQhxx2kNVegVfRdnTvxuSk09AjpvhTw2766HGv1peWg9WWLTwPIz5RzYQi7ASnhTZH0yx2f3tTleo8unoOP+9dc7fRDX5vJupD6mrW2dTe3Tgr216t/IG3T37LvbEDCpxoc5B1zCHvmn+P55oj0OUl/SDrBYo16Bql06OSDjS6+9oDH+dubYSNUg2VfWDUPHaCDuoH1Dx/29KhypsLU7Au3+esFYE0gdVy/MrVawNxrAQpdYGVI8OpJndr+LGuoOaWCbZu0F3XvVvq7fZcGBvIYdABQA/Q7W0s8a0jUdHVCBX1c9uCYDalT9j4A+zld2O1Vs2uqeu3t9mYlg1QEoG6zOqTS+NJ3T7YG0Moq+Xc9Kq33JpkCPiozNFyDDyEto7/bXw75aMxFzF98eVJ7WsjIsf8s2ujTVwCg4lWH+OhtQl5PLUhGgX99P0y9qYv4cwFbnf/v4nvVQqwbdStfW8Cv3dkSi/czQ6ADgH0RIxdEPsMljsVa+l7ylgCgd/zjCsKfQtrN2Ab/1GspVYcZQ01TA/+EUdsxoiJFT0FqEshS50YEjBK6/Crl6FiIkC/knZfeopcTAOwJlo4OvQgcbcD8aGM84/Qf1JRynOHgCWxnTGijsxSmyZ/2u2yBJTblcEpey8ndXh3Jrh3vcjo4/4EPxgBAJViUDLRPlfVTNBmrcd8haNfrikb8eZg/LF7QBmo6NSaD9ssz3EN7aQZDCwAa/GqOqbc35LXDb9Tv78LxRWSDDMBmgncvNQB03sNWlWRrNfoU1i4YOJ1T4xVv7QxaXX74F12MuY0OtuX7AEGYGr0I8f4MOuU3Lh9s/UHyVn2dcwLu68LXV8ImVWh0TU01ucwJ63Rsu0I7LDW+TktB7pti/cXuPWYkAqVX5Ni2e86O0HVxxNsDgP0aqvZ7fBwuItMcpO0eYgEWiifUGukAYNLUKG5eIbx9hcXdHXZ/9ze4+9FfIKlDRPNHCNcfoVp8CGy+gXr1EMV8hfh6g/iS6gCuMVlNMF1EmE9DXC4SrCYBp/4SCLeeJthMEswpZbcuEXMjCQrkEwAgRc9VYcR19A5lyYDfsQlxW8bYFQ3X3aMuullRcC0+gVw2OJ4OiMNGRP+FDXetpW6+j642+OByhUUCzAJgSumjFYGEdCgpDx0pDbZqOC0352jIEIcTRd7lOGYnrNZrjvZjKaH2ODWiCAUAmJUFR/tRFGAdp7g9Fpz+eygbbLMT7vICu1o0Cyn4oE9ELpZFiep04v85ArI64frRAheXSxwoHThKcfN6j+PhhIRAsKBBxZ1zRaOPSTJhkC+kDnZVg+PNDvnrHcJDiThrUB0LNAXJzQjpfIWQOugSWJgXqJ88Qfnk58ie/BTN7jVQnLieH4F/VV1iNp3w/wQ0Epga5UcE5QF1c2AQEA11/S04N4hSsuN4jiiaI4gWiKIEh4OI/AtxxwAg3cP9mFWpDk7NodEIuRESsFsTAPghPvzDf4P1b/8utosVTpMEZRypkMFWb7a8Lh1fdcKjnI4hANAtksflq2EvSEBd36GmfBl5nitCwyt/xpv4jBknYzrAnl/3PLfceSMAUDtdtCyKXoSyK9xErZ2eUdSOs3UsBuSzJR3vA+C5fOT73K+m7ZLP4jMrgEM6QMInEpE3onam9cXXSUd+IGKou2Ocx708ZG0ckn2dgSHmMPTFEpojvce4dOhzCVgMvIIf6wEgx3wVAYJ0gxOBKkMxqO5lsP1JjiTnCHEJBmpGVH8aco95FDjZV4rKOsDCf+OMQ1HCSO3W1g9vo0i1XeNYBzHfbgDcRVj7ug/4x8uhA+x+jEm8d8x+scj+ZgAgj0wEG3FTH23dNf5p7c835Nd+AJQYvM7/9lLrB7TtbrLffzYA2HKKpFqXWanIyPb+GRtSDUF0lR7Qnsomkg9Xe8H+37f7uwCCDgvinzTfkm1kNQQpI4ee2SuJZDCwkoVDAoUiAOlFqt47M7TXvv6lBgCVgnSBf+pvVLBbdPgUqkIIRxH9xxGAugCW+9RcHtPJMj8zU+B0x/MXBgCUCI8+75E90G5+uwV5P4VCbogBgWc75EKXfd0AQHPw/ZTpzgBqTVo1MaVA1RbvAUZdtNqgieKNke8b0WcBgIZVrq98Zwqr8Zjz7X8+ZnqpfXoWAGgr447TBl6jG58dLb9KANA2aEQRefGl5IdP/4vVUDLJNJ6cyl57GFPDPr1zhMB3Bt248c4KT5ehOgCo5nWGgelcQM3wcH0uDHw3AKjoqZq2DNFUP3G25Y1zTD2HxDO5blXVqon/9We8BwBFpH4TIK5rlLsbNDevsD4eUP/sp3j6p3+MZrtHmG4Qrb6BcvURgquP0VxQFOAa4YMr7gQ8uVgiXqRYrKeYTgNslgkuFyk2k0A2A0lxMUkwrQsGAFOuA0jwfoSaavsR+EfdiCPR9ONUV8hqqgtIACA13qCGE8CpoPRTao0R8VlakR8wSQLu8EudexdpgMvlDMtpyNF+U2oMUlaI6wZpEGBCEXycQkpMECCn2nxVhaypkTfAIS85BZhq9s2XSy7qLne8sGGikLsLU8TckRqnBDFOdcA1DF/vM1TxFK/2GfannGsY3lVUyzBg8JLSYKk+X57lyI8Z1+4jEC2KA1xeLxAnDYqCUmZDbLdHBEj48zqoUYfUNZciBqccgHe4PWESpgioyy+99+6AendCs8tR7U+osxODjelyhXS+QE1NR/ICePUSwavnOH32U5SvniE4bBFQExKKpqQ1CQnYk5ESTYHmtEVI3X4bivzLEKLgCEBhgxAtJ4jjBeLJClGcoqpy5Kc7VMUrNJwCTC1SCAAko1408KB1j6SOa5oYRTQDrj/Bt//o3yL51V/DdjZFloQcESoOkOmgsJW8QiyoOoryOUoM2tKAeEQdMvdkkOX8uuSNoYrfA4A9/TVmX5jOtm2BUgSg+QTDttXsMW0Xmje8BwBHlmDchhh8gM38vO3Guh53TxP2wRcMANogqjGZvv1tzvXdAIBKPyibR51PcTSgoqETDJPjO9M+o8tUiqWaB3vX7wHAcTH0FQKA+uBswPiLBwCl1msj3N4hAKgYXkXDara1DgL6FkcHAAW2YNb0F7+/KQDYZQd0Y/DILzqkfbcAYGs6Go5Ht99FUeR/qhGA+sLqzrPuZOspwDxTeahZhwrx7cwy94mZJh0dQlQPABkDAH0ncmouvSgnhxLs5n0fgEeu8j0iANlFUddrc7eFiHuDCbrq4Ky0nLXLzwMAjed/LQHAjoeMCCix64xTSns5hUEjeKwPUnyxAKA5Fn0t1Hhsy8BMvxZ32CeWdoq2XzeqOWuYaHuD88Tdepz/hLA/fucpkR7ha0V02U1lejJHt74cUzV2aA/gVY1wxI1tdNSAQdbJD3utuht0B6blPB0E1OYnru14TLMV2xIK3hzmtgGfJkMtA300AsT2wOz19dGXievuttXylZxvf29JmnveP2QX688aq5HanY33pZ8cgbXzxwBFnUDy2vsek7fKxpf+qy7yOTHvJgJQpAEFiCiq7e41ov0O6/wEfPYzvPi//xjli5cM9GB6jeD6VxBefwJcExh4gWBDwOAKyXqBYBpjvpljtkwwn1G33RhXU+oKnGI9ITAwxioGJpUAAKmeG3E/1XcjALCmlh5BiGNZ4lSWnDq7rwLsi6oDAE8n7gZM3XsTioaLBfg3nyac9ruYBAwuUbOIlHivLBCWJaZhjOUs4exTUUNOvDsjsLGqcahKjjLMCQeLYpRVjel8xrUASQe3e58ieCUAmBUV6mjKEX8EHr7cHVGGE7zY7nEk0LIJcKB3UM8MSraltFxqepLlOGx3DAQm6RTJJMZ8kSI77ZCkMYNeh0OOJJly52AaaR0RMFhis14jPxTYvcowCydIygr53Rbl7oC0AIrbPYq7A8pDxt5nOpthttkgDyPkWYZgv0O0vUXw4gmKZ5+huX2BiBp81CWapkRDHX85RZfCM6ljMwF+Gaf1BlTPjyIAKXqTZVeI4tQgThdIp2ueC2VDUw3A4+45ymLLFRMDil6kiCYGAGVaPqVDBwnqeI5mcYnw4+/hh//1f4fbzRq7SYIspseHIsrRCwB2wKDLvlM14ly7SPG9T0OOAYBiB+ta1Cc/zMNsITa6Ejj2ODhF3pcA5Fft0pnyy7O+eavm4pY7948ANC0rczRmF1j1mX4Y2dcb1nx6/px+h2n7CXU7pIncxkPPgrnH/T5/Q3wmxmeMqM2Kks6wK/6kNTKonsDYfPo08LKNORh5qWbfGDWq/e+mu+5F797A9JRF96j9NqpPd0q+1A9PjQhAk2+HaMbU1XwzeuMXDQDqfKUDsrqtJ9hLswsHlkqMvVvfdxcBqMr6DPPIu4sAPMdSFLwgMl5svrDsd22xzwiWa692BUI5rEXzAJrkiSRRK/9s1nurCED58C8AADTmpqWm63J8zJo2AMA28q/jGV6pFgBkiaIFHfd5y+4K38lZ3egeHlUn3qXcHJGvIxGA2ktdwdKN6mI1YoIMcuEZNQC9MrqvHM5X8NLwCoKe4ywWTTpccr1UCo36TIRKd9bNOeCcJdP4BUM19+wIwI6EdpLI2AmVT4H2FYxZw8wElehqciY0sdzjClv/GqalvcmG1tYCOpSt4TamBvIke6pf/EFETnTzdtco0fh5hP90wG7EnnV+7GuCIF5N/OnZ8BZAaL5kHADs1TAz3tW33of3l+SzFkxQNZPU2BUhzf87/rd5ccz4kftzgOiKdq2B6iBh+4YxKa94SZKja/zRryNqD6cXsWfXUPSzr9HBrqWcRlJ96LrccpPFdaJkGQ9WSoPPgOjMf1vhKblxjvFurrNL/ni34MimGwV4xxSkdwomL7vG2XPA7iMkdEdJ40F7j1v5Bd60pn7K05nMf59xG9f69vE4ANg70FLGpPY/RwDWosFClR9Rbe8wPR4xu3mJ1//hT7H78Y+5Z0O6eIhq820E198CHnyI6OoRqtkS0XKFaD5DMEsQzhOsrpdYXc5wuZ5iHhRYTyJcLma4JJAONaZNxWm51PCCIs+YZ6MEQRTjkBfcLKOoaq4LeJNl2J1y7robxRTT1yCNY8zTCaZRhNU8RhKAG4EQFsA1/siukpFmAT2fOhkjxCRJMJ9HKEqRThulEW5uMlRRxCnAuzwHgXoNReURkhUSOClqDSr7JaZIOk4BrlA2lN5LgCXdW+BQNJy2fEOpwGXN9QHzJmBwkOZEAGCRlSioU/B2x7UAwyTFdDFFmsbc3KMsC0QUZRhGCMOUv/fHA6K0xHI55c692faE07biSL+LNEV1OKDJcpS7I/LXW8QETO6PyHc7jr5bPfoA06sHQBji9sVzJKcj6mefo3z2GOXzz4DjnYz+o/Wgmn2EglJxRE7MZtAvDAj8yxBRnUXuAEx2E/E+dWamRi4xg5zLJXUl3qEu96jLjNOtKXKRGIhsB6qxGE9mKKsA0eoBqmCK9JPv4cP/9Hex+u738TqOcEhCFLFoFhfVEUencukEEc6nKS46AREIUHuwxEaKtoGkvaJsIHNryeOzMQGpbXE7BU2vX+RNR5S2iC0/BBDtHsBZAKUHkFK2mT+JSaeIfnjoljvn+wfC9vJ9CfHsL2HQs8Bame56sm0jjetPL0A1ksLIw/fQ/1wA0FgBrSyS14JjX3jcPtVLnJylgnwptT0eHrcxx7SjHyD0P1/Ya+Yam8+THcMHJz4UAUh6VfDSWBMyxeW6f2sAgHzgNMTjcn4eIukpwPQkVTdbvVcBgGMHvUMksINJ3hYA7ISzDgBq9q22X94EALTlN5+QDBqp+vrqvKT5r479ay/HuSCgEwAc8DX0Z6pL+MytbYSo6TEjwtMv08R5evfSsRr29nr3+KT19/scZKhZqXd5dAqn0P6m7tb3p+mPdSWidAUuaDpQasc5Nl1ZCxnZqVdVcsyDBxj8oHzyYcl5JgA4rOC7LrtDL/EdAZ4DAI6JYPPz+yl4kkhURtqMNOuEUdeJRUXq61E26gRU6fT+SE26ua7rxiursciHuABA8ZG+gcYUhH29vUZ9BfVOAMBe6kNXcLZNp/YYJ8rYNcwhJ1AyzuB9G07NWSnIMf7ymB0N1WM6P6XA9aQxANA2EPor6BOo4wYWd23THmrWZBzhD2Mwai0EPRVoaZbwl29qjWByuYh+ypDQR+J4d1+6D5aD6BymXhW19in96FLXCqkxCSNIGDDK8Wqr6DmZxGX++fZXq2TUDw6eHzOUunk7htSO283TYlbmS5VCHDTA7BRgPe2WT75G9pelBJ1dgN9wi57DQaoUkWt+PHfj3ZYe1PhYXzv98Mg0Z8bJ4TZTuvca69FaYR2P+umtZIU+Kbdu90i9e37kc4K+AACQQKjdFtHxgPndDfK/+xFu/uZvUN/cIZ1cAlffYwCwvnyEYPMAmK1RT6aIFzOEiyni5RSTizkW13OslglWaYN5VGMzneDBco51EmJaV5gEDWJuPFEIcCeKuWYdxYhRTT4CzAhmuqVUZALE4hgMvhEAGIWYRjFH+AnAD4hD0dyDu+gSAEiZUZRiXFVoyhJJEGI6STGZxNw9lxy7KElxtz2ijmJQpbp9UXCTEarLRwAcqaa6qThqQAcA6eEMACLCbVbhUABbBgBrHJoI+5zSl8HRhBUlzco6g3UZIN+fUBxyZHfUIKNBmCZIZ1PEMqqwqgqEFPnGIGACNDTeHGFcYz6boMxO/IzsNkdzEABgk2XID0cUuwPq7R5JTgDgAfluy92QKQJwevEA0WyOY3YAsgOql0/RvHyK6umnaA43Yh3CEnVzkh16qdGHBD4pEpC7+Z4QUkovAYPKQWb9R5GbBAAGSNMURX4EKmoEQrwr036DEhUFZNKf0jlw8RDzb34XyYOP8OGv/iaqi2vc0Qou5ijiAHksIh+jOqZk7y4TQts99D49AsZ2ZsWlYv+4xagZAT4kw/S/6wCgsl9NVNIjbB3gSneg6n676vI4JDT8AIqyid1jcjq2xgFvX7aN+wf2u/y/60Xy+3N0Hd765GG33uJZPttOcoe3S+kYhPkFAoBaRoJPYVBKvf9zqjvaXTF6oOe8QF9Dez1d+u98nTgKAHrQF/EW0wfWn6cs12ETxAcACl46BwCkK9muVdJGawTSpgA7F0nZ7cMraNcAbLlakpj8J37KoNjx7AEJIOu3vjMAUA6oVx9aBwClsf2G5qmWsuPZAYPyTOqFkYjesbHp7OkCAO1AKDXStwMA9fmaI+yXVPDvxd566wa3pj+Hdr1mObeNZpSN7eK8Vn/2MA6zRryaYcfXPhBQNwqstxpNklwAoEkfUx6N648zAMBhhUXOonDgfV9vAwC6Ilb8bxtX8Ob9lKYxHPoq5q4cf3WnKpBKn7Yk1qLbNHVlFmzSkWV5kRivYE9mISvCQTXd6IxDfVG/egDQFUGnWFJnTX1T2a227RVtOc4AE1wprpIWQzLCCRoqftS3/ggLD338HgDUKGPyseLnThDackT83nWVdXzukNp9hdYtsgFrSA3ViuUBTdi2bD+DBYQckKCFOvn3Atkix9XYBy2iJP7qMnz06439NRYt6DWkhGb0N10wHcpzoppFSpwccW+/jiugXoqrI0LyjKUZNE9NPNMcjzqx9J2QDkeoKrFt8q1uzDLLOZyX890LlQbT6SEjg6A1cFqzbDz6j2tGqs3gktT3o/aYgdlPVzGNv7EmIPeKAKS4L+pOmx1Q3t1icdwjefqYuwFXP/s5ovQS0fUPgIuPUa2vgeUlovkaVZwiWswQL+cIVzOkl3NMLqeYzUPMk5q7AG8mKS6mKTZphEUYYB5RtB6BdQUibqxBkXUR1/kjp4nq8BEAeCwKRNMU6SRFFFHNvxM38qCIPoIDWRdyNJpwBdOY6tIpnmpQFtRtt0QShphMUsRJyIAalSCJkwn2O/o5RhY02OcFCjZKYo4AFGXmKjQVdSwWq04gJCGDVVOhQISbrMJdXuNQ1ni1P+KEGMcKOFUBA39BQ/UCAwJmJrYAACAASURBVFRVg9OxwGl/4iYdp9s9qqpCOJlgspixICOgsSSwLwoECBjGTAeSYfQ3inyk2oHVMUexy4Bjjk2SotjvcTrsUR0zxKeCvwkIPG1vEVJ7lShCOKUmLRuE0xTZfovy5gXCu5eIXj9Gs3+NU74HCNwL6JvqDVInYQLgQlAUZRjmaGqqS1ggoFRhrv1ZC4CUa10RsSLBnAQcqnp/vAXFtVTTr0ynwOoKl7/1+/j4t38fx8kM+WTB3Z7D6VxEV4YNikhEDMZN4jwkVM6/XZOsDwIKJ94tM8bkuZiOoRe1iGcFAHZPH5PX/c/fGgD0RWDz60b8Cxs/eisAUFFqSKrZn4/JT1eAg6kv+m/SPx9bj5EU1a8yAvAdAIBCf/bXX7eZzH3hiogdp2Ff43VrMHZ+OQoADuzc1i7WMnz0CCopiHoNykybYhgAVPe7vCbb7mwjniQxdR+U9NkwjCzp5DEC7g8A2raJZ/2+FADQ5A4DoO3M3vsZTZ1T5DePmPSdLdDPx1Ndbv2vH7PRlI315QCApv1na6j7NknRAUDFqqZM0Gu3d7vCMs1bPan2l45X6CNW69++o/XJxHuUP9RysUH8MwIi7EMfLwDY1z82ADgWPf/lAIBD/MnEs9lT+93K7++bM/0HdwDguJslDjQ70E0vRto+OVDGeYfl6QJS7VHFMKa47IMaOoPxta2BI8bBVWY0ENAsHi1p02ql8Qgv/ylin4GGIpRag9VIAe639NY3lnq6bjaxsiGnR++sbOmYlmpG6LCLiaRyGFrqHmBip4jIF3tZxS8+VZfoYRHsCWIOzCYwgh+69wkwwff+8Qha1w7rjA+ziyn9vR8BaIpKfwqwoKfiFZ2s3UmkyXMCYNH2SWvh9BfF3js93tZrmbQFWTu16QbbPAcU1g184CEBQAGmOUwjY9hDAKC4SNGkN9OW790OiTEs/ebBKNmOO8cBwG4zmsamW/rq8ZX2vu2oM8TDkg6akazzX186vYGdZdDENCZbANDQ8PIXyZZvAgAqa8IlVnTDQTDBwJyMfWDtqEF5NebsEDF0AFAOwCvihoXjOQDx8ARVVLj5ctsYHTqhFvtHNtNtgXkqmVegKQsU2zukhy2mr17g9m/+GsVPf4qkniDe/Aqw+gaKxQWC5RUCigBMpmimKYLFHPFmifRygXCdYLpKkAQ5rtZzXK3mWKcRVhEwD2vMQ2AWA6tpiigkwIui7mLkBaUAi8685DyVTS0i5OKQG0wQwBeR40Lps1zrTxqF8ujbBACB0+nEUYCxBAADii4jAJCzjlMcjgXqMKLWFpwCzF03g4gbfVB2BkfYVNRxV6wjA4BhgLKqUAQxtlWAu7zCvmzw7HaHYxNwUxACAMsSiJqU8DCUZY3b13dAXqMkAPDugKqsEE1SzOZzBggp/bduSpkCTCGN3DKDQbEoinm+FAFYZwWq4wnBKcekrBkALE5HBHmOtKoRUWOQuy2yuxukQY0so7p+KdLlGvOLDbKMogNvER5uMNk/R3H3DHlO6cIU3UfXioYjDABWiYyoLLmjLzUBaWrZ2IMhWorUq0WcH60LN+4g+0T1T6YgwIbXqSBAc7LA8jd/G9/8z/8l8ssHuA1DFMkETTTlGoJNSYBijToWdRrDOhKHLr3asELO9gBAWyZIB9C9C8dTgO2tbQMWqsFIZxOIOzrbzbTHexpvEJyUV46kyNolSGxpSPZGG4XSk5e0d/QUOk1jDJzqjAcI+O0tUwuOaajOFhL3ua8332ivtN/+/LqmAOtggk9rD+VniFn3I1xbCipXSCnbVm3bRtCYThwanbLRfEraD8B2wPqADrUOh3kkEhBXq65D/+1M2sedAwC6x9/Z45odq6IANb9LVZwbXkOv8yRr1nUZYLafTPKPn9AuWzdzc6/ptpLiDs1vkAMUNfK6L/sA3WePGO9rIwCt3dnrEuyxj3yMz8si5ddgqQF9fvZcJX+O1MAeG0JPP0gZ1WEQktbaNFuvxP6bTAG2vRZzzzo5uguCsg6E/NKPtotYb5OHTA6Q7GXxhX6Ar5in8yhtUFzd7AYAdftcAoFy0n05aPsg9gyt3216aDX/Xbzc1+9+DCFY/i//x7A7IT/xqkT//h/jP9Mwaj3boTe6hbl7CDY4JhepB2BZuLoVxcLpPXpeuPYy3pJyqLZgUxPvUgS6DWwWXe7Yk4xQsj4J9FGv0def32GciPYFoGng3Ff5Wc8TLxSgDs+zG5facH71qaXQ0f0S9FMAoNhkgoD2GvYiIR3RTSK9ZMRA6oXMmG/yRf+ck4LhBIFaedI38A16OZog2KLLH8I/DgDajoe9XrbA6BvIFr28/GeuR1vDRyNyV8RWrLrRRIiXss/T+pjVJW3ybQ/VE1aM2JsqekIqS3vyLesMCTE7Ik7EPOt1f+xQeNqfKu1JqQWl6/W59cA/y27t9pdlgPQ2nHWjcbn6TPtjT6F0n4nV0661NrlT8cvaCLoC7uTiuTUSO/r35Jt/g0oB7JYBPA7DQOpfZ3CsMd9OXwwrMb0os250ip8Hozu1JXOXEFB7gCwqZdAqi8KnUvvy0Gwyoj7X6eAJK233o0/K+w0AOwVQf2Q3Wjkex6PU+jmjPnjoyqCUCexUB/CU47TbItxtsdjvcPrJP2L7l3+BuAgQTa4RLR+hmG1Qzy8RTC/RzNdo5nNgOcfs6hLhZg4Q+LdMMUlDXKxnWC9SzJMGFylwQTUBJxEDglGVcxpvQjUAg5D9NwL/qOYfdc4lII5kHAGAXAKuyDFJEySUMltSBBpNWq1Hw6nAKgVYqC7xGT27qgWoVFFqMIOfAdccZKgqinCg6Lq6wXQ644hDel+eVZjEEVAVyPMMk2nKsrGghik18OpUI14t8PjlHrenAru8FF2BCQAsIoT1BCgDHPYHnA5HIC9RZjn2t1Qjr0ZCqc+yxg1HAFYFkiRCMkkQJQmCNEFJHZCLkgsJTqhZCnUqznI0xwz5q1tOAa4ptZdAwLpCTIAlNz+hjsB7FMcjmlPJ0WDzzQaT2ZTfk929QHXzOaJiiyK/E80+uNOvqP1HWydoiA7UcblBHAUoTlsGChtKmm4K1Ew9oScoGpDUG9GfqC72Tsi1DqnJcBPPgasP8f3/6r/F9Dd+iGe03rM5Ci4jI4B1bnzBBo7Yt22dKLvWh/rUjnCz90AbAeLag3IH+beg172UwzChKc0Zd6fwdvzaWa9uGWE75L2rxkKsNPHkPnAwZbqdkms/fgwA7NtD/gjE0fn1qN8tFu98ZjhFlWE7xEldVhP+FNqevafpf7/l3IE2Q9Jf8XY7es3uEpbcSAjiwMedjTfAU5Lp+rE9CnTuWYwOgMlMzmrnYKVUqijZceBI6nztfmV1+lhcXaPbVt51MWqCWYfXfKBk2qcOz0rY2ErlMj9IHSMWTaNVl6U6aAHcs6kMS1SDzc0AiSF/pzMDdRtHzN+7ayziG000eqaPkqftashpdyvSr9Goe8V9Ko3tMRHxNnSVHR7l943Gsi0khxqDtN+sR3SLjEQLrbD3rCZ+6Fl2V+BONuhj12w2A9BSXWzlXY6MSX3w9EQuYTVoPpqcYWotxeedlybGzyhMVwdwpFQZ8VMnI5T80fdlN1fNy5GWgWBAbxVZJwBo89kwf3a+mHsHewFAlrMjMnzMPxsSHOrv9wOs9M3fsbNbwOpIrCQ9T6ZT6K4IHAU8sSxkgEZUOdQRYaWg2muZczS4SOM7sTSaQycjCjvDSV0hz8I4JVm7y3BKzQgx14a/Hz0dq2MbnCwAzEgmNSSf6OrWV5oCkkZmDcAOYLGmKQGckTVWNc08TObrwqr4e/j2Pr8ZpsVoioUq8u0R8L6u3mfU8FBrMzSH+xu8fpXVf14vB6c7zWkNtVYNWIAMAYDayNXGGhEaQuYo3rHGK4tQC8FHykE4zW/0JfmrfQP/3tWkaQW3Ei/sNEaazaXxT1ssXZp8ckztyGwAcMxy4AmRwvRdaPKvUtA6LewutOYS9O+3SSnEqez4p+GNal7eJdUPW+SgTEDME53ZspR/j445aOZ89GcJme2r8cn81XZlMzlsSPHafx8FANsUAI+Za1g2Jj/YEUb9Qw0f/c4zOIdjnM09qniht+U78WASkfiDQa9OD9j7uNXhfE0ASqCt8oKbVGC3w+ywQ/LiOW7/8i9QPr9BHC8RTi5QL6+A+TWa2TWC5SWqxQLBYolks0KwnALrKeLVBPEkxnozw2opAMBNUnNn4OtZjHUcYhEHSAngY5Ap5CLYeVmhoAhAccTB6bDUGCMOAlRFzrX8KG2YAD1Rg1VFiMkagFQ7jjr3st0h9C+Di1yRjnsAi4i1IMCr3R3HsEVxgv3+wP8v5guuOUi8XZcNOLG1pkjCkgFAekZOnYqJVpMZXh4rbvxxl5e4I/C0ovp/IaqCcpYTFMcKGdXoOx5RE+B4ynGkFN6S2meEot8Gn/7XHOVIUbxxGgNRiGiaiMg6SgUuKkRUGzE7ochOwClHfMwZACyzA+rTERHV8itzBFWBuCpQ7XYoDwd+L5WbSZIE6WSCMmiQH7fA4SWCcoeyuAOqAwIZ5Ue1FEk2Nk3CnYtJzkWEtdQUpUhA6QFldRQdg4mCUlfIHAxhtRGAGFAtRaLZBE0wweKHv4NHv/P7CL7zXdzEMeok5XXovsTPQVtVX/3ukNPcHGQkxXUMABwD0M5RfIOZFko2DOiYEQeNuF9EaPhc9LMUndR2btBmyCZzyeAxetv64r7Xn0Nu4xoq9vk2X0aK2PiDDABjzLeTfs/wUzX73Qqc8KeGyyd6AECfydatq3kA7tIvuq/SAS0dz9nv6UXQtAbMeTak3STA9mtsK0GBBy24be2p3ltHAEDOSJLZKf11M/1QJeN0AMowJQYOMfXnjkXw2nuz9f+E2Wg0QeHDPKe807NturVTNr6P69t63UKia/LIBR7SswWAKr76tlHvgIAn4eYN/SlDY+w1ZbIu7EvH82yy9jHSLjK6mnrT0jt/TtBXRmgqahhT5doZBoDsAgC7derq5LX+QQsAipn26OuJIKdnKP7TcZtxKaiWVz8+FqttAIB2lqL9YJ7+gH5rI/elv2eAvJ1eHSuBY3dJH8N3+vJruEkXc7gvApAvGFMS58nFwTUZmxAzRSuVHBtyUFOIgVkxa9z0o/uyiKM54S2D8vVdJEsLBHY6TEuXcJ1ASUnXCjaB6vcdT+EsiJqEcjPQrbIrThtpaHdptTazTU9/CqlrWUwBwykYGgBoKtROTA4tsBhuxyRq7uLPMoVlIAJQPXPImdbvHxSwjMwOM+nbRACO7Q3mBuOEwx4lpRwNi6tOIfquacMInRd9+QCgvrvM08S+gLcAQLFhPQ6D5DcZ+dlFgHZmi+pKqAyJDgC0TRs1To8DIpVPe0WviUbHv+ppoXC3peyR6X38m25wSKWglIQ2BJ1TlQQbXn0hDz3c3TtdNItMk7ljzt8kvylv+3JLnad8vQHAwRXu6Tb7SuJPn4MmkgedofieCEDdZx8HAHV5bK807X2hN9xfEmDoMYh+fV+nmjvYx11ibG8DANrjVvK4Bf20FI+hgz6x58WcKLKOIsyOEgCcHvZYHfa4+6u/xO3f/yNCzBCmK4TrB6hnV6hnD5BePEKzXKGezRBQN+DlDOFm9v+z955Lli3Zedi3/TFl+tqxxJDgCAwAJKigHUJkAAIpF5T+6XkghfQkohR6DkVQEbQACAgeIEEAg8GYa7q76ph9tlOslZk7V5qd+1R33zt3Zrpu1O2qOtukXebLb62F/HaDfFPi9n4/A4A3xcAA4Pu7GvdNids6R011IbICJQOAlP+PeGUTLsPA/xIVr+DKvASqKQCQimRQIQ7DADRMaFP9l/MKCknCBUZ0tKMBDakoxUsqiEG9z0ucTicOQyYGYFlVHLZLBUe6tgPGCwNghgHIAOCUoas2eNkBnxwu+D4V9ihLnHtqe8EA4HDKcHpscT4ecX48YLp0DMZdzj3yAch7Fc5McoXZV5pFp85JFFOR9xDl0VP0SAYQCaQthhE13dueZgAQ3YWZf9lwQTF06A+PGA5HTBeq5Jsxw4CqKY8FqfULsvNLoD+g76hgyAnZcGIGoAIAyaGgcVc5EWlMqyLD0J9x6Q7o+iOQU3EQFbZrwGRnPRPwmjVA9Qy4eQ/f+O/+OfCVr+Ly7Bnapsag7SNZzC0mD3wm/pz7eQXAW8MHn0gAWxIT9ohaLzqje5Jlrj4HADAokuaJI9/3ljZZzG58KqD31OuXdfXCJz/iAKABj2Yt5bAAVzJQvQIAKOdUe1La1vJIGEIru+CAZ+8EDDF3gV0FZIqpDQFATzd7DoflBxnbVvYqIkmuBABnk9NZdmaWrE/kVl0N1+ja+cJnBwDOHvjsf4fW2XpRtZ9oANAJq5b+Twq08UOorf1rniD9IbXe1V/o/yEAaIL81ZpjG0FUjlfy1c6sn8NOyfO4fcur2RTz0va26dmMl6S6Ktsxt18wAF8TADR7222CsbfVv6sYQiJi6xqA2vjDS3rpCwgAziiAkmGOc+w7Ky5YFRFf+k8CgPJCgG2STXWp64Cr/DXcIv2BQWxj2ynYIPPzhOAVLrvveiugzQKA3B5RFpue4ubImpe7dRUMQMgPtydkqX3gjps7pmx0ewCgVKhL7qN5nzXgtDHgGI0SIBFup2OE6nmJyoD1KnjJMISoASJHKuUcW6xqyf02zA0HhBXvpM3pp/iTz/rJAABZbTzJbjZOiR8CroxDS8lWPxuAxsxlBERJACTSGbQVcq3CUwLKzhoxAK2Np9a3+tSvyGZPOyVDMZ4TdVkBvg4ASK1iBqCRbQFcGO5P7q2wzdTtalHPUk6GbQXPFPvczLzo3loIerhQvD3q7WmV7F9a6O4T0jvcT7ngS0rFAIwxTGPOp9Ev1wOAdAAkQoAjy8B1F7zRobFIHkAYXbsswVJ705h21wKAs2YX+81/s69XYyHA7nSqEBAzB01VM8BEVWpxPKF4fIlnlwvOf/yH+PgP/xjToUNR7DBtnyHbf4Bh9z42730V2c29AgA3W0zbGrjZoLin62rsnxEA2GBbTbipJtzVGd7bN3i2qXBDAOA0YkMAIDJsqgojA3sjumnEeej50LEsShXG23dcabYoCw6NnbcSpxqh2aSKvcQAdIFnYqIZW9CAhgQ+ffTyU85kR6DY4XhCU28YAKTCGWQ7bKoC52PLee+auuBCIjReCgDMcSlqLgTyn/7iB5goF2KtAMC+LxkAPLw4oz1c0J7OeHj+nAFAYvJNLTHySmSXEYXxJwn8o5dOxGzk+Ft0FPqrT9YJ0mRiHLEBqTBJP2DD5ERiFx743/F8QknPISZhf0F3eMDIIcAtOw90H0fbUlGRKsPUHjD1lI/wgIkYgMMZ+dRzYRVyRkj3kkyhUGViVW65yu8Z5/MBl/6ArFBVg2UgGc8JOwc5DSxQ32DzV34W7/3s38b9z/9tvKgbHOsCA1V1DhA6f0WrGX4LAMZU/Jr0Zew8OEC25gIxPD15Lu2ryCHMUwG9p17/JEOGFfAXmwGYjuJV8zd7DDP4J+dsAQRMEEvMlMd20nwwJA6+JIvGB4C5JaksF5795od4PjV65OkAoFoxxkY06QeW1hEftMwfev4fFyW0eyocRz1TAoRMhaAqOZhe0dcCgKYthgFon2rba6K19HGyvsTmOU2th6VWvjoAaN7mvjUIAeYF5gshPafCrl6cz1QRpOjwuwhF+Fzhvy8CgPYut+UhWSaVwkVFINETrD8kAcBgpS4CgKI93li68xfpLUdQqC9jc0vbO0nwWQMAryDA+VWI5cgq8M3/Mutd/eunrAjW+OjKzzXC3OfOAJQO5JOVX/QGPQTO4vU5ZOZGF6yKPc41vELGn2K4LXx5jqxx5o3CkYpvSVEaY9L2QBuEZsU6lAdb5pn10swutsvCd5B9BWXkv31LwIFcnqbZ2LJ3MwCoYqGjDr6t4uo+VmAEmiWiBKVr8qVz2M0be1EJxQHEp6zD8NHumkqFAGoxn9SSOhCdL+W+65ySavrVu/zTCusE+6BRTNy/HgMwEE/JoiOxkV3OQWMMiMX9NT9u/Qr3zcYosGdDVviT42mUAYEzKhDPnJYECs23v2eDUG1AN0m177B4OQL5xeK8yjEu1VxbeSSNMdV/y6WS/Uo7SVLZhbMT7o8whMEbWWcqvN3KZKaIGWYKrkhj2y7iRRuSZ8VGVHNDguenDFBdcVUaILzPEstJPm4+1EkIjDSD1oSU6AdIBnmk3VJfuPLRb4DswLKO4xUqDoii+k84BPFuptbXmn7VazoR4hfL0+oMzYIj6B78ae0ZjKllno6aTVtRNd5hYACwf3hAcTzhrmtR/eD7+Pa//bfAC8oBR1V/KRfgl5DdfwX53YfI9veYNntMVYNxUwO7BrjdIr+7wfbZLW5uKR8gQNjgvs6wr3K8Q3kBi4krAt9WDXZFocOBSWcOzH7rc8rVp/LIETOQcgJ2XadAwapCS0VL5O4fRy4Usm0aZuwRS5D2LM3zqMFgk2eUnn+eBpy6CwNdx8MJz569w0Ahk+06YsJlXHl4U+XY7Ro+QCQZ1PY9Dt2AS9Hg2x+9wPNTj1MPnPoOVbNH3xd4eH4GhhLt8Yzjw4HDdvtTCxAIN4zI+gl5R5V2Ka+TYv/1bYtp6DEOVGxDyV3FDlT6f1M3XNWY2kbFWioCS8/E3OuAjp5/oFLJmC4t0J2RDy1wIWCQ3kv9GThsd9RVehWj74ShOwAjhSWfmP1nI3DpxSO3h8BJzrFIzMRhxDCeMWVUNITyC2otMYc8ZZiKCtjc4P5nfwF/7Vu/jOn9r+J5vsGhqnCiTpcU1k0TbHSgdRrn3LbaporLEWvvxffm2v57cgq4RRFg3uQyfqSzErn1CgagPRaKSic/wim4aA0AlCwIY74K1TPP61Nsws/z2jWG1VpbwhDWp+UEXJuAlPpVg6v9Cwf8M96OcV49EHA1dU54uC7tnBijj1eqVpuyzbMPYQxwOaCGXbQ0CQYgSAyCH8IpARGp75fmMfCTHIBvbfYjx79eyKTbdClPtNZ5quntNekaAFDuy5DxZO0PC/wJIErY0BHLM5pnWTbx1QBA4xQoHyD1FaIH9npln62wYD3r2K4n1dtUfE9ctpo5VvcrfCBu4817Yx5Yt69q3jwAiv9mRsTzD5z+RshHIgrSjuny+Kr3u1FWQdEjsYGMjHDs7GSV+TAE2OA4c6Sn17y1nOKyX3MUmrOAXJ2qZ2m+Qsrzmd1oQNHA/woPwAJPQoCcUQ38uiHAbx4AVOtVjbsZHlsJzNncFiETV4spYGxEgkzzUbW9iByklICXgThCYcxGhjEcnY0h+6A/CDS1c3ZmAQrN2JhxQR4I20C/SqwdK/Ue/nxGnsUmTGtyMayu0WlPlK4HAP0trZSzhMLU68K/hEs0bSCpzbQkQoziSQvwYMs4Qj+ZA2xedcuD60OeEjBV4se1htwTzJ8UADA1Q1GxpU9P3L2utgplyDKnvjS2FCCnlKDKjeLOlYOPzHvNCGm6X4Z46r8LBWhZgWqfuvlXpIJU+0rlFFU/2/yUVosZdWuUnwHel0bI9DX++ToA6N/n7plQwQfy3oQxe+CfY9jGBIKWAJrioZthisK4Uj61OnwALNiJnrMhP38TAKA0CMzyWZoTxzDRnUqLZVcWh+Pg5mCJjVMI2HpXeQwI99N0+gTB+VyYooU8neLqqIz2GBtyXKPSWhf7ofaUeYGMwJ3zGd3DI6bHA/aXFvuXz/Hd3/pNXP7kT0Dxo8X2XZS3X0b27GvIbz/AuLnFVO+BZoupIRCwwrgnAPAWzbMbNPsK9TbHZpNh0+TYNxXuNgUzAqki8H3TYJ/nuKkqNFQVmBZXDhz7Dj0VBFFFaRXzjgBAkhRlxeUq1J5X2pAYanVFAGAJKtjLRXyHjgFEMggJ2DKgKgGALYFbRY62vaBuNixfiHXX9T0XGaFrx75DU2bY7zcoCAEDFAB4GdAWNf7se59wCDD9XjQN8mKD9gwcHy4Y2gnHhyMuBOwRaHdRxTyYidePKIiQN1COvwHZOKK/EAinwL25QqvGJKiXVVlyBWKq1kyAXtF1yAjw61su/DFQMZCuxXi5ULJAoDsi66lyMP3cMrvPhOxymDGzAi+YqADI2PI9BEZytXYWXwT0XZgBmaFHQfNC4CyPZ4+JQoD5kEjNADEtjc6eqi22P/M38Td++b/B+dmHeF406Le3aCnMvFC6mUugODaadtzmgxId+hQ9WHsLAK4QYFYZgG8BQE9iPzUmfG0CkqaZtQ+k8+3rEGOhS5zhGndE6gaX+eey+pR/od4qf5btiPoRc3jhUmtC+zzQP15VWO/XOZ1Tyn4z7WYJ9EQA0N67YAE6tldoTwSASuQxqbm6FgC0EXS+ux3ayC6w5dqgzpxGGL6BPesASNfmAAxYAYu7IBwbO8as1ZMAYNg3y8jUesTyaxfa4M+pY3mL6BT1PN8UV6rL74W9SjHU1O9za4X/42ATVwOApitp+9b4QDIEeCmHqW97myYm12eEAegDgNxvMWjyeWaG3IlRtpz079wxN6Noxtx86kZI8lxpYWLeSXe4KZt+7AFAbRb7TLx5xC1nxvzJH1aTg00pALPgxALnI0Z/W9inqTvsEjTGd/Aeb3uaBWmrnMbeYZLI2+1Fia7nyn8rDMDQMXIBwNmQTVHgA7HibkoDANqzPFf5xhiAfk8V7dudKzOuDOBdYw1ExV+aQTgrx6XpjXL3/P4vh2gYsZg+43GF/FsAMFDRSQbloubVH6gk+fqki9e5CgFWc+Plm4gkRw6ZGe582RBieqKvsF2ALQQYJeCod+PMADXGJQGWUmkLtZIEZ+w+XN4/qr3y6cGJtdx7AaND91fsnygDULNYQ3m0UrU8kEuGISlabB66tBASDDjTNanAZXd/FABAX3S5olLlRHMYkM4Nk5MyIjqEnzEASPosdcLmfdF/GgAAIABJREFUhjSpFs4SWHTWlcqiJzoE3Zy20oENAUAUXnp5eMTw8IjdpcX96REv/uD38cmv/xrQTcg37zEAWL73Uxj372GodujLLcrtHSXKYwBw2DTIbm9RP7tFuS+QbTJkFAZ8t8FuV+F2W+JZk2FfAPdVxQDgbVliR1VwCyr+keFwOXNV4GGg4F7gfOlwalvOzzcRAEgFJvjQjwJOJ2b+EQBYFZSvbkKZKdCKxnEaFLNNsdtUEZAX7Qn7Z3d4/uIlcs5zVzLTsBsIpBtxs71hwKvIBq6Caw4HqVDJ4dLjOBX49kfP8ZwKffQT6u0Wlw5ojxPOhx7dqUd37pi1NxGoeO5ULj8K4aXquP2AnNiAVD2Pch8SckihzQTsjRqIE6eUlPuQQp+JBZkNPWq6t7swuEcswOGkAMCpUwxACu/N+jMXCqG/o6fSJT2ndiDWJ4/aSAy+C/KJwpMVAFjQiBE+jh7DRCHQJ2TZBRgJmBx4bPiwiKr1ZiOPL5nXahbo3hzD3fv45v/4PyP7qb+O0+YGz8keu7nhvH88JwQ0GnttkWkbBwBtaOmyg6sOjOKCzzpCWsY/sRiE81QvfYP9zHdWQiM31fprDgh8/CkoAuU5wLMZ77ikUmdaaRPTR2v2xOf9+avbvqqlnzUD0Mjj+LjY2Tc2l6+upd0/L+UrGIDSn5tdZMEyVDafcrPpyy8uYe9Pe2oxhrrt6xUH8A7gSvpY3m18m2UHR9pmrwoAptYsz9BsE4QHeimA5Br76McTAJRSTQ9eLKwkmp/OWiqMLLwuAMivTx3EmvfF17kfSRHu55gE99+nvfUgJ557r9/fGX+YN6NvxS1adbN0X2QARmSIlPdGHr0OAKisLPfLD5n37XF1h+qXDWmXz1gYb+OpyRQWP2wAMKTrhqImcAh9j8W7JRjQmPQSBonMLRWbEAnexZ5tciAtA4DL4lN1RTrQavJcWRBhoEnAki04IUTkws0mjMICUjVGYwCgMMlkFWPPAmBXUPjsSklqA3Ghm8J0igKkMqfEDOGJ/oWAgHqiVWxaDHgnW9bJS5Oc5RaMLy1/1v0tSVa7vwHFeMbPROyph64CvWQImfFdXEWeg+2OV5wBOD9rZnLGe+6zC6Nbyc+irS9a2qZrRUPCdyRCTvRUpEVC2oVIGTdqoZlCCMpYU0rAhgbK00TjPNgVovJDydWgfrZ71iaBlqaaf4/tqJM0fWYMq0eyMTyvJ2NcqlxZuuHz21U30mNj9vfS+Col6O0Pz+PyHRBftjnyIaCgG4DVNt9vS7CePEPKNQEMYOWaxckTgoQNYXoezWOipVTMrpNrLsagk310QgIiestfv9JImfXZ4mYMj6ac2YwUoDNr3LyX1IUvIZ02vREAcHmXskOf8HKjBlrkwMqMW+xNMlcqYVxEtSMwisJGuxePaM4n3J4fcfrPf4yPfv3fAS+PyOtnKG++hOr9b2DYvoeu2GEotsDmFtl2h4nCgIlRt7tBdbtHflNhbIBL3nFOwHvKC7ircL8rsc8n3Dc19kWGfQ7syxzbqmDArRsHDKr2BUXNMhh4PLe4dD36rOA8fAOBljoQwTjMFP5b0Td6zuNH1W/JNtAYHs8pV/PFgDEHHh6PnFuQioAMBDhS/rtxwn6zA9cPppDcqedrKPy47Qc8tD1edhm+9+KAM1X9zQquXHw+9Ti8bNG3Ey6HFmM3YugVw29oCbjTOfw4l59iA1LYNYXejgQAarCQrjMhWMqWVAeUAwGAl5aBw5Lu66nyb8fg3kAhwH2L6ULg35lz+mXdmfMDMjOwO1Ht4pnZTRk+af4zUIhvz/0kYK7MVM6/bjhjHM8YpwP1jAuHgJh/FFJN+UGJwmeqfdNhEldbLoC8wd3P/C18+Cv/HOf3v4pht8Mxy9AWlKMZqAhkpD6ZHJuL1Tq0Fenp4bkIiCPxQ2lhD5Ddz2SoIY9sFABM7vz5gTO7SgskVxwldNBnEAIcBwCFhg5kZeiCyRMvY8Ov2hE/hAt8XbDUhNQsrgOAK2tghQEY5tAWz9MdcB1v+T7tMch18gTwT46HsnXUX4j5bMA/kwKJmdFqK8/6Tv1u2iMpDHI9pWwsk55n2YINcm55OdvDCA53PlxLR6dKcOLflhdmwmxwbrJvNHfYO1MMwGv8/zUAMD4n1sp2D9WNMSeNuuX5kWtice94IdG2aqseA8fWMAf63p6ZjSpvxL3wVNUG23b2IpL7a7ZQZy0QMgD1I+fw2ahFKaAqz6K2rsncOmsQplJoaRCQHqf7P4fFmibMw2G9BKuH1N9mHzU6hgnjXb8jyPNucIR5n7tzMh9E6Hk1+ZKj62OFARi7x8l5GNVFVt5YAop80pI8tgzAeXg1acphAIqc7az3RQ7GcGXo8U2ogOz2V/+F1w17Nf20FkIkbzZTLhsScwDkEDlCXixWxyhZlIGhCIw/WygBh9C1fMIzi0pHn1Foj3yA3cBOS2JhwbOmNkJ+XuFabqhnUehKCDKaAXAFxnz+JawADnkOTnRjK8AMthSwNkTaJKe0Ocvs7Mq5sevDPMd/l1qEfky9aaNrCJsxCWHdZRWsAi/NlwJUjUDyFV44flZoa6U0h4RHKLlaTEu5p36WfXb774YHqZB0+xU/2fFE2uLqDxlp4aU+/mfZcfHHPgkA5K6kc86k5o1Hbq3MYaL3esb4H5lwlUBZNhK1Mg5DUOSK8dcr/R4aShLSdmRWjBVo1oMGANXb9EqRBwKCkeyuTAUIJiswauWq9qLbB9n6VYZBosrUzESeNZJOZm9eYMY4kuyWL0koHvFIAcFbo4xv1w72FY+ZpyQJYPJCic3e8ioNHKxEY3yD1LOPojzzNQAyWsVdNDdlAMzrfm0TLk5Uukq5LzsXJEpyBy82TYzzavOVBJi/ud+0rrse508fUJ2P2HWPKD/+S3zv3/0r9D/4BBhroLoH7r6C7ParyJr3MW3uMdVbYLcDmobDgZvmFuVui3Fb4FJNKO82aG432N5ssN2UaEpgU1K6wArv3WywL0a8f7PBLiMC2wllU6EbBhzOZ9SbHbph0mBghn4Cjl2HnoA1CqnlXH8j21wjgWqYcLfdckEQ9Z2hKDKUxA4sC+RFhrZrMUwDHh8PHAJcUYGKU8v/sq3S9yg5NBooCwK2Ckx5wWy/l5cRf/HpCZ8eO2YhUtuIGdieO7QHYuFNOL44YrgQYDZi7OhZuWL78XCrcabf0VNewF4DgAOzBekzmgYy4slBLygU+nLB2F2YHUgszZxDiS/Iegr5JeDPMABPKpx3VH8biBVInxMoCBobGq9BM27oJQQFUuVfRvZQ0H95hnHsMIwHTNMjgBMmAhR5rSg7bswGDhKh9tFfx3zCVGyA5l3c/Mzfxoe/9D/g+M4HuFQ5WgJpOS4bXPDF6Ha2FLSiXdOfYTEQYhymdk569fv5550nRYRwmCTcsUbmX1y9sSD09IHQskg0e1K8w2NMpW2YySlSFR8ld3w862sVSnmqfvTbcK2eWxSCq/bPSnyJtzyC+fUcxCCHeBKgEKgad8Cznx07QDn7rr5S88936UeZ3JxXmge6SrqW7vr1yrbTNp9WoL5/Id8pV7jwYvSfpf8Tm6W1/ed/7iY1dgEy3/+InY1Z/9C2NbHy/eg4D/DyjxD9jPAp+4OtVpO/NdKEq9Z+BPB150aOv4mIs3IjVcRMrYG0deiHVKv9oeYsPrOeLb1ifNoCNPJp4h0rxottjhoHNTZLL42D2I5Fqx8ogXvThHC+UgCgGiGfnhN4Giw/fBlsVq5+/lxnwX9eiL+E61HkANSvsW2wPTN/o/1Gw8eJm8iO0vJvZrPK9RIBAOfrFg4qfMBbpYASLZoVsl5jT3FeAka3SvuSpkh5M+LkIFBtSDUhu/vV/0PMXigMkzn+Iif1ftJ8HwD0G+NsG/G8NaAi6VUsfkgME6kOLGMoqtiDvWgYQ7oX845aDmM1C8owEPkUPCEUOHeNaUxUwi6PIJOhogCg3zsxzw4DxChsq7idnIOm2wHD0TwvIlD0yUXsNIneEsuxpwS7abN6dihmIqZjhBEjT2TixqYVQvwmHY41AzbeXLEIFkIkJv4sABmGaKgcjXKC3RfE1v3iBhbrb8lESAGAMT2z5sCE73li0mnvAU9/n3yAXccGACShb9aPVfNKiKpxVIt3/tlQjP3HzisuKT4jDoYrQ90TLBPS5RoLohdeqHwojx1lr8HHmDhJszrEU5IAoD1Vn3ejU7VQZ7H0jVB9cVR8efMf29dy568dQDkKLjAQzKcLc7iiXM1drgxfMhxVq+WeMv1fEvfK2FtW0EZ9p1zAtRw+vIIS+iatR68BAF9NE+uum+346g9xDBzqqMrZydWf+wnt8wdkpyPqy0vsHz/BR//+X6P99l8AfYGieQe4+zKK26+h2HwJY/MMbUmVPnYAhf/WOzT5FtVuj3FToK2A7KZGfbdFs9ugagrUFdDUGW72Fd693aBBiw9uNrgtC1QgJp6qAnw6n1HWDS5UYVezAZkZOI0YyGhlYCTj3HjznI5AXdYomMapZEdVFajrEpumQllmaNsT33ukPtYNsrLG6XxBVW/UvPcXNEWhi1/QK0qMeYnTMOFlC3zn0zOeHy8g+IzChvthQtcSAHjGRDkCH04WAOx7Dq2lohcGADSVfQkEzIntyAxAAwAC55Zy74ELhRDg11PBj75HrgFAyh04ESA4qJx/VNWXQn+J6ccAYK9+HqkYyEhAZIucwT/F9ONwZAP9GvuE2YhgAJCuIwBwZACQwpPPfHWeESxKq2VARmOrQ3aITTnlG6B8Bzf/4L/G+7/4K3i8uUNfZlzQhSaBdBYDodJFuhoA9FKKpHJQX8GWSu7/iH2QAgADq2TNefnMAUA/51HMSl8ToCs6dK2Pawy5tfsTko2mh+zNJflurN6kBeLbpx4iLPAOZf14VYfdpPaxxkoNrcfS1ycz4cAHAOedORMAZqbelRKfD/QjzHrDAvQZV7MDLxWMlhBqHI1DbTrxGhOoATK3Ky4AGO5Pae0tYz2GMZ2yNlw/SbXCL3oRgjNiTlbsD37ga67/JdvD2iVyf74qALg0h2FOxTV7Sc5lbHz9ZbsGAK6l2LQHuDZf8rK9tgYG2bxxNnJJ7JBgmNYAQM3aXzyiovWh8ue6X7PlPFtndre5vo/BRcz9MQBQemuuvWxlk3mjBABVciW1vmZb+w0DgD6msC5PrxR8vJevAQDd5/k5Ctds/59wAFCzhJyNYReodcDsIJMCdVSHBtCWQHsf4KBTavk6nyLsKkjjWV+npJ4MADpAiFUMs5Jkp8MarKbfEqSyJzTGOPDa+gUHAKWgpBFQgKRn9EiZxd2zfYyLZPV51Pl2ELlIXsQImLI4+xED3xUH5Oh4f/FA9kB0v8EqwNeIujcBANpwkPm8WeQBtEbfPBRXA4CzWlI/RBCt8ARSGDTB/BCg4iktJzyG1oMKalNfK85L4nMffFoEoz5DAJC7sBCCbkaWFfbCQqHerwGAvoIL90piDN8CgCtb9PUBwNT+Vjthef6vkh/O4lFMsFkKjBNXAx6Pj6jOL3F/PuD8e7+Dj3/zN4Fzj3L3LnD7FZS3X0Wx+TLG5h1c6g0myptHVXibHTBWqHc7jJsSHZG/9hVyKqaxqZDXOZpthmaT4+amxrv3WzRZh2fbCrdVjm2Rc+XcTVPj0ncoigojhfxyTsBpDmWjPUJ2AOXu66mAST/MJ9dlUTEg2Pc9M9UI/KPvRv/btkcGpDoC0agASlHOACAJwe50xH67QUWMRAqzJeCLAMB+wmM74bufnPHicOG8dvTucczQX3q0hxMmCv09XTBeqKrviJGAO01al/uM9iDn3TMhwAOBeqrqyelIOfkI/Bu5sMd0uTBQSGAgsRPpZ8sAPKM7vVQhvx0BiWeV/49Au7FHTrn/Rgrh7ZgByDn4CEWl3whIMbqLwUjKnUioY4dhOKoQ4IlAxFaLJHUkpA7kSOYOzCIfUGJs7oAPfxpf/8V/iupnfg4vmy06wj0LfY9mALKtIA5cWWKvMVI8AIZR3WX/dZVE/eMGAAb28pJymBXyWwBQysmQAegSdHwAUIVELn/5hI7oic0PAQCcfRDtX/De02vFOPv+xrKAqg9qXqNp4teE++8tAChH6i0AmF5b1wOAas0us8E0vK0PAH54AKAE/2zfl+B2E8I/e1oBpd3a7zOINz/2xwEAXFZw1F+KvLgO/VGD8gYAQON4qgf+2DEAdZVc6ptUA8rfDidDns6xqRkFAGdiUbDbpUGjt6izidMAoDsXwcM9QCIGAMYITuo5tkCBhLPmUTHA3SoAWAigInaikKYtR0NAvbwMM/DoDUDo2rtJ8dXl/pzKwiHKm3HgFi7S4BsI8S1oAeL457Mo1C8w8+OKRbd9PgMw9mQJZK3FWf64A4CW8Wfm0YTAm1Gys6QUqGQA6v0VLhG7bhyGbLgfowDg/Dy/SE0IAM6hK7xUDVNRNigsdOOuCR/hDWWRBP8ChukKAOj32D0QsPvHHIAEIjQBAPIu8wBAf73HAEB3/a/tgLcA4Nop4LKJ+sUGAKMGoazaPY44vHxE1p5Qto/YHx5Qf+c7+Pa/+bcojidkU4Vp/wHKGwoB/jKm5h1kN8+A3Q3GZsMAYN9nqIgR2JToKmDa1sh2Daa6AOocFC1ab3Lc3m3w7js73G4LbPIBuwLYUsK+tsMdFY4YOj5Ma+qtztE3cg46sx9HCrHVkcsUhkuVfIn/VFY1/50AwHGkHH4lyjJHVeX88zQRg40+75R0yyscRAjw6eGR308hwOfzmavcEgPwPACP5xHf//iEl4cLFxQhBmCGApdzh+5EefcGZN2A4dJxrj8qBDIfUBKDT4NdDNRrAJAYgATuUcVgkmcEAFLyw5FzBw4AAZUa/KMiIMVAVYXpb6qC7+X4UhX/IAYggYBUvXfsmPVHxT9GYgVypsKBy3XQ4FApjj6rOH+fMuNG5AMxBS/I8wtGAgBHYv6pZ6lyLEouKAYWybGOQcSRJvT2A3zlW7+C9/7W38fz/R0OFRVrIWagOQylUaJ0MOZ+y+SJA4BWnvsAzBcVAJwtp5T38RkwAN8CgFYaf9YMQKV/iScT/wr9Fc+5F4bzDE9EK4raFEAyV592Q5bVDzm0AQNQWOezYjM2XoxRL+1Ayf5bgiSSzQkC6lzGT5hDLvhcdJrHbGF/qa6ZUY23KbxfpSWwMWSBh6vBBGETr7CMU0UsPPdzsZFpH0baZ4IBqOc2FQKsRigNj/iAWTonX+hgLsMz2oueJ9COtdk3dMWrMADNhnT8cuOP04fRRqlxNCHOBlhzfOdgqN4EA9A/QPBfEszAPGPCTdIDrxib7pddH1F7T/v45q2GAchRFezqaT2vt5OjX95ACPDrMQCd2Ynvn5UF5I/2awKAoYOrQniXNUQ4XVLo6Jx5Qsr5DZb3S+fU/LzGAFlLQuq2XOcUMcttzhPm9y8uVJSBHTr18m5foPsAalpc0WG0Cq8x22ZJQWjxEzD0ZAiw0TXx6bM5bNSz9LzNJ2paSXgK3cyLapcRIKbSYyhQHCEWWUgSUI2tMgleBLMUVV7+CZwvTwiw1F8iT5z9U6g0UxCDETALOyTJYDJVgpz1s/QgYXrINZRkHETGx99jwZh6873GaPBh9DWK/frzEgMQfKQqYRoGoML21P50zTtrSKn9KHMAehLCCFwa5NnCWdq1+j1yzMRmCwvwkPwReR91Va05PJ7nyz/xWQMARfv1u+ema0ar3LMSdBDbICrjWXUmcxTpwitBHhq7vxbLWOpLfIXla6A1h3BNniZZlMQgSjxgNj3EYvIZi65B4Q6jWnUuw83ZHysOtDXT13sZ2zWeu/aUjWU05Nr0vcIz7S2x8XnKA5WPYPay0V+KAcifTMD5eER3eETRHrE9POL20xf47q//Oi5/+p9QFTXG5h757kM0+5/ify/VDtN2j76sMVUb5KUKq80o2d+2Rn6zQ0/g37ZBfbvFVE6otgW2NzWaTYZNM+JuX+N+W6GZRtxXDbZlybn7CEBrqpqZfgrwo5x1g24tMdhyHM4XztPHKQy7kcOFCeAycjbPJ34WVQqmEGACAek5BkDM8hIPhyMKCmWeMlxOZ7xzd4+mLnC5dGgpnx8BgD1wIADwBw94+djOACAR8rIpR99SRV7Kv0eVdXtmJVKxD5XzT40vVyWmohjM+OuZ4VdTOrxxYIBMSccMl3OL/kwFPgjYo1DfjvMzTm2LbZlx/j8C/PrzgYuAMPjXnzjnHwN2Uz9/cwiwZuzRmFB+xZtn7yHf3uOki5X0j8+B9gFAiwJHYDxjAlUAVixCI1GVnqAEgEBRZujyEuNQ44N/9Mt49xf+AY7376G9vce5oLyJriOiSrUpBiE/R6dfCfVpgBm4l7wmA3BtvyiC17L8WLIvZ9dkRT6mUhhEjth1qLvVPGsOfvrwwuz5hVFY1d/J+kSzDHHsMz/E9tVEs9o/n3cIMC9hNwT9GgBQarXAcuKFb6Gq+HryAMCYj78whS4AaN4lB91oychZ/zzKagtY6NDa+Gv2qGvPrmvUtf3mrKUEAGh3bQwUUU+RAMe8owKb3/NnRI4yBaikIbQ1e35N/qQ+N/rbyifTVhdDkPJL4gF81cr+m21r3RAfL1jr3yxC9IYNX6cXv04jwR6IUntexFDcC1eqVINUAdmAKWCCqhTzTa0sdeW81tH68bM8d+TX6wOAfoE9f7+Eq8vrgyPgnwoAGilqe278G5UDMAQAnfX4CgBguJ6tXWDWVioM2D8fYQa2s6jcdWJDzOM7KV1lmvCkJcBYPc8LAfZfok45l48p4vwq+9cvGgDohpTZwgHCw0ueKFiDT4tgPXl20vxtvgZgBiNOBrYITVsVcJkFtJRBYYuArAtnT5F64B9vHydm3pp0FgA04J/+12vwGgDoJGX0GmwSmcZFpxabzoe+gnYZgQrA9ZNuywesGJRW3oiWWgEQG29fYS0JoPW50hvWM+fXInYDAf3EEOA1A+mHCQAq9p9e76byr8mLZ9gpcxIcNc90oOEaBWbNaIU5H2gZLZ62MAIFp987K1wnTNdjAEYBwLjxIyXU0lrxjR0D4Jl7KW/OQInyI4bTYqiGH7LmvNxWsZa7SI6oOjBZ/pInsrGdFDCor8iL5b4ttT89ANBrqC9NeNx8xmJEPpr3q5l8CwAuzX5sfK6Vg7PZ65/ACwYgsU369oL+eMB4PmBzPOLDbsL3fv3X8OK3/p3KIVfvgfo9lNuvo9x/CX1zi7HZo68aoN4iKxtKvIe8rpBtGvRNhWy/RUZhwLstim2Ncltic6sAwLwkxl+FXV1gl0340s0tbuoaFQFlDEBRYYqBQ2oZ/JsIcVMg30icNcLYiIlG4F03or2QQNIAIPdtBNXyqCvFBDQsQA4T5qIbGR6PJwYAybYc+hHPbu9QUcGQtuUiH1NW4TxMOJ5GfPvbH+N07pHXNcvSlph6FKbcdugZACRwzgUAGQSkCRhHFEw/pNx/FwyXM0qStwMVC9EeUJ6jo8IfF6r0qxiAJhSYft5kI6aLAv/oX/7W+f9AeQF5zCjnH4GAHUCAYEYgHgGnE/ppwv7ZB3j2lb+Gu3e/xGP7g7/8c3z0538EtJ8gmx6RTS1XQKbDlZwYk+aIiMaZx3pSUrHcIPvGz+KvfeuXUP3Vb+LlZodTvUFflsoOGtUBspKrZFuIA5KonNQ5X1Mq5AsKAM6mjhONEUrWtwDgUyWWvV7Z659jDsAIALgWAqyTfSpnMdC9VkMam2LRVjepTrTN4xgFif0hAUAF4fkXq9/jjzC2lGiV4+N4/k1kKkMAMP5+vnXOQe7alEn9twZgMaAUH1Vj/8rnh3PkAS7iWeq56bxyawy25bFf5g3NupvHTBR5mCOv5CG5a7/JIkraYl9hsLqQtc8ATAGAS3ayO2Vyrg39QPeQGyg+9+daM/6dQ2oBAnJe2tl/0UAgP8NfD4lUYZ78DtbzCsDg0imcmeNm+AcC8vlxcoz1jFwCjI0UdH0RO/+m67Eto0BXsn9UVEUUAAw2orXOzVvmNAJX+xm2fU8HALXdMbfLjo36k0/SCvWvWc+LY5Io4sNvcIuAhKIqVqRBXuULZD988nWLgKwBaE9jAHoAIMsf33X1trfvFMoTtAiD0I9pN+1POcGOANcA4LWZ2ymkx3wpg+IpAKARUEbgSmWhWuwTgKyin7cMxcZoQUfsu7h4ZFc4hjJwHp1lFZnKEMUtcAY2dPbtiZzmI3gAoCOjw6DwoGG+/DUsL2MA+F0JAEBHIHvKeWkYxN/dHhoDZtHs0ne6rZrFTGTcA8bVGsLojdnaido6oHjFIOhlO7P9SODPodwGFNSGoZfnjR04mQPQDIYeizBEYMVCk8rYFCDxAi2kEaD2k95bEQBQGtxqL4XvX2qRNP7MviD5KxmABAAa5egbjrGRTzN09foVSbpl21geJQBAupbXi56DWG8/awDQw+8c2yo2zkEVsLcA4JUbNrxMrZ7XywHIooAXmtlXlgFIAGBOIaznM9rjA6rTCXfHC7o/+xN899//S9Qt5YYrgOIOqL6CbPshxt09ps0NxnIDVPTdAMQA1ADg2NSo3nmG4u5GFwohALBmALDaZqjqAft9iV1TYJsB72+2uNs0aCqCxAiAGjExAKiq2BKwRc1nIArUlhptT8DfwN/TWFgGYEZMvx6FzgVIDMCmoRyBigFIypoq+TIAWNSqSO8A3O73KDIKxz0pRiHnAMxwPA/4zrc/wuncIWMAMNcAYIbhfMFwblXuPmL39R2/g1OYagCQCnnklK/w0mFoW67uW1A7KKyXvgF0JBumCaWpAty2RG3kYiFZd0E5XDCeHjnnH1X7pdBdDv2lir8DFRAhWFSPE/3O+f80AEgTn+cYyx0273ydAcAPPvgAD59+H9/9k9/G6cVfYBqeI5so/Fexqxn0JZa1Ptemqr6XtuNxx817+NJox3WDAAAgAElEQVQ/+W+x++bPYXr/AzyUFS51gzGnmsLa1dEg4MwOZwDPK+whLDIWDykV8hYATA7QWwZgmqHlj08yByCvRXetzgBgBOhVy9baqCG4ZPwHfVUULDZ2mD2wn7fELLeXVYgPABoen7pDP3txg7GwcgGTNwoAhsCLwtfMhk/b9zGAyR8JtmY/KwCQEUuZc9p9O9vXHEoZF2AzWLIwfSk/w+htt4pqzA91BajrP6gwz2WoMQRQwv2x7JmHcIxcdeq1fri1A1H7a8EfxhkAlGvGEq6UfWyAP7OWVlvlzIYvPV4fABTzERk6d6kuKT9t+RGTn/EK9Tt76BpxtnLNPsNMdWw1rgGA8SWq15vIw/75A4B+CLU/qG5vQ3nv5j4NtoM5rF3Yo9ndr/6L5R2gAaW0C+wyPOxvSrrTCZfPQpLikbeveIEvNNYAg9cFAA193dnaukGmWbL/sj1qf/sOjDuc6vrlKsGOEz5vgOW8ed7TwxA9DaglJ9UTEUqX+gJGCVZ14qKepv5vZliKOj8E2I7YPNfz811xvcYQcq/2e29mTVoertCZKdZaGPsh3I6MvgYA9AZ2DQAM1u8bAADt9KVDGO2atvPhqI/Ixn41AFC0aC2ptGeARnSiJ6oiK1mEnJi9lQYA7Uio2o3CJ3MYRLaKltuIlAQURt4VAGAuY05nANDsrJgxE3l3fEhmDIR3gL6GAUBDh9cMQBMVZh6TsqGeCgDO46abrULk4l8sWTwF5feW7veVXlof+e9aMkK0fGP5bFuYGgu+wzPGeb9E9JdpBesn8Tk7NPqLW7YCsK+lGHDWckyuJ9GHhYmZ/2yqVi/P39oT1j43OVvWrlv/XOovNeb5CBQ6H93ldEB2POKG8uN99H1899f+JS7f/0tUPB1bTMX7GOt3ke3fxdgQALgF6p0CAPm7BjYbZDc32H/4Icr7W4x1hT4rmAXY3Daotzlfut9XuNnWqLMJ23HA3bbBnsKHMaChZHxDr8NpCY3r1Yl1RrBUwYzDx2OLh8OJC3KUBEQamcXFPs4oiPlX5vzvdltjoKq31N+iYPDw4fGEnEKAKeC167HbbNmJPByOimmYV2h74Hju8dH3Xqh3EXhIYB8fQGYzA7DOcs4BSMAjh/zqgh+0JwtiWJ7PDBRSaO/UdSgphQn1r+vQDz2734S2FXmBivrIIcX03SLrWgzHBwb+pssZ2UDflAvwBGL/ZaNi7RFQSj9T8Q8qAkJhvMRlZvukUPn/xuoeKLco8hzbCnj85NvIx5cYuk+4+Ic6iJsUgElAIBX1oPurEl0/AVQQ5sOfwk//s/8J05e/hst+i0d6e9Vgyos59yGDIFJwsj5bkkhX5NBcEWbLySrWdwTLq1cMAXY00XL3tOO23JbAOvZC0FIpJmb7m8d7QeklbTYt+xMKaM1ONjmDTQ9dhssKuLsyRewhaf28dGmKP290lZyepwKAcwjwAtNTAVC2deFSsDNsTClPmzp5l2NtTj7dFDXwDQtn5Xk2ndBfapfr9TMrd6sr1gkm/szIEfDXl8nBZq5Js+uMXZZaJun4CeuTSZvCbhXX9mAgUYQAW/aftWGlvOG/BhGEtv/XAICuf+X1VANo7pqybfHXkVIl4moRwhkbQzXdkmHo2m+qf2kJ4H8azL4XgaCi9+SXXQv8V8fApGgAlgL6htBWdRmAQg6awU8y+JaeJ9q3QDJQV8QOH7zeeQMkAXDr1fhSgz6hA8tRBTdIGS78AdVFMX/6XTF1pLS7YkwaX9CEAHOWgsVptn00Bxw8amuKQeAhZv7MWnpSCDDbMbGveAOcvk8kb9S9c9u9MVoNEb771f8zMTR2wzlLSSoEnRtlFrJC+Bqx7AOAsruGnRIdgoW8Ku61KxaU92Df4Qo7H9++8SlSAlYaOd521wDd0pIVG1pvOLPp1B1WGJr3pxxCFiXMcLt2TEzvxSryDS3nwNC0yheDWrLN0t4CntHxnm8P+R+OPIsmtHVnTAfkeJaYfoFojxk/n9LuGqByYeuffUajDgGyMxeOtbMGlvKj6V37VP4LAyJij8WFtF2tkiEqV9uS3lgDJBak1Sv92ejCpfGyRr/ZZ/Y1ampJAOq8MLEQYGH/WEDMjp6ji+WYeko6tuLmbSKAbTW+7uw49H4lquc3KUXjGokxVXnN4BoFYEKczZvo7yxF9MGiZP/x34ixk/gKktY717ohwPQeAjiv0J12JFao9kuHR95KSPXAHfMo4JZQtisGonuAFBqUV43Fgrjme5MGmj6BNi9hfWk1hfrJffiawesOpNY/4hFrORnX1mrgoOobQufRfVJao0k9Zn/me6gYxUAhqi2mwyPKxwe817c4/P7v4ru/8e+B0wEYMhTNuyg27yHbvYexvkPPACCFB+8xZSWw26G6f4b87hnKu2fIdltgu0Gb56huNqj2NYo651DT29sd9pQjMBupaDCaYkRTZ9g3BYppwM22waYkQHBCkWcYxgGnS4fj+YKi2vC/n754idvbO5QVMfwUk49yB1ZliZzyCQ4XXC5n3Nzs+RmEK9LhFhUA6cYM3UhtUfJl6HquQHy5DKi3ew4tfvF4wssXR4xDho8/fo5LN6CmCshThvZ8Qd91DPDllIeQwqiHjkE0AgQzKhZCDEZiKrZnNbYXKuTRo6FB1ww/CvXt6e9ZjjwvkecFzwWxCacLMf1aZgASAAiq9DtQ9d8jJgYAW877p4qmU1y0CgFmVqAOASYnYqTCIBw+3SCjeeIVT4zBMzKcMPbPMXEBEJ3+QeD1KoR4VEDvBz+Nb/yjX8H0tZ/G8O77ONUZLkWOvGhEcZGwKrk54DWrNWSopCSAyUm9dI09bI3tKxrq5H6O2D/B9StV2tPya/mgWunCGIAge6JTBEWFhnqztYPNE/2LQxvZXsEadk0kJXWHGq/XeYYnx4T+mSVV6vGJfMXz+IhJCubXQ3CkPlfzI4qAxFiA0oYKRspYr6F9ZveDdSB8BiF12zU/1udrdrLntriD52k7TdT19YNlmqXt3VhRQXf9hmtDtiAEAGWEibLL0mvLByhdwothwIkVH92w6h2kC/Rx8OxbuoQdyWhTz3TfFzIek0v3iiIYKqWCbbRdv2ptpexPdcWyhFJmfBoA1JdEZQDbzgn7T9nvUtrYXJe2Xb49LFmOEgA0IxmOqGU5ynUcF1s+wy+FvagnrFhWDkDpybLIAb59ZowopO1T7TNNnMvXZehKGcGeLuewc30mfwdKzWDSupl/TYblaE89/9BIn2vAP/tONy1BQBBwhixcq7Jaszu6am3L/RDOlyrkqta59TQlML9W9Ca7TQCA/EJtIEh0VO45s0HdrklqZVqorzpIKwZK6GDHN4ZVSG9OmZsYdtkH8/TZJxMhulJULNPErdKwxo96mgH/wjETfQpy0ayJaPk0syPM+2InlGvjp1utL3Orhip5I8S9K8CjBogcUS3wndOPedvGhZnnQPsGnW/AqzmSisVdv2snhnL1KQUfCk0fPFrdA+IRMgeGzeGxvOYJAPSfnzo0+rwBwIDSLMJJaa2YPgZAC0t0AQBqCWizcJgU9FpsGgHpFznxBycA9GLqxghdd7+YK+0jfdnn/q76bteabwKsq3upbtWjGAAUhol5ZgD86camkoAr8b8U3mbSJ5hqW7otGgCc5V/KxODhCyZgHnB7AhibA3+fxvZAaFTF1vfS/ovnPwnVtLPn1wBDcTG/N5FjS4miZf0ZGriGcaSNB34AHcZYIbRmEAS98zbo64ZkxwxqOQ7mZ6cdSZA4tkuU/cEG/EAhqYPKZXc8ID++xN3ljPHP/xw/+O3fwuUv/4wr3RblDYrmHaB+B1N9j44BwBtMGbH/NsifPcP2vQ/QN3uUd/eYmg3GpkFXF2ju9ih3FCo6omlqbLdbbJsK26ZAmV1QFwPKYkBdjAx6UZGMTVVjv9li7C8oywLDBBxPZ1TNjk1iMo13ewLrLuwkEwDI0bXDgGZToyzpbz2qqkLJAKBKB0EAYD9muEwqjyBJfyr+QTkBKaSYWIaUiu/x0OLh4Uh1hvH9732Erhuw2+4xjZQH8MJViAl8K4YJPYF19A5iK1HxjkvHob9UsKxlkK/lgh5536Om9X9pGRQkIJDGPafMh0XFICDl6CMGIIX8EgMw76koCBX8OHGxjhkAJNCOQD8ujTwwGMgMwEEzADPK5Uf9oerH9FVw7kLeMlxYpQOyC6bxgGlqrWw0uWH1GA8EAN5/gNuf+4f4+t//JbzcP0O7v8GFxrfIUeQEKtq8wb7+TzPm10LU1gBAbfMtgQS8zRPWw7yZxP73r1+1r5dti9gBtW//KP9x2WbMmALif673rxbxbloh7w1r3trKAUqqd2otaSG9duGVn4cRRCkI4wr5741eIN9pfYsl4gMqMgdg1F4VjmVMVfMRYGIOAvvBk+VzijOtq9YAiRmQWgpZjpgT1puR/oP6OV3kTM//4hZL+7bGf3MALsFAiOXw85dRQKDw9q8COlQDpd2nrbGFA2elYeaFoW1ea0/YVjw1ZFTOH7XKFrmIbRAVwSR3v8+wTUeIST8tfH5oH0UYgGvubCIJoj/e5nf2WaSPOkfB+OvPAOChnWp6E/pqgTfnmko+wzrJEFwTWirPbfIrpIjqy9XeCPiQmvFngS83BF3NmeBEElHQ6bI7YXKYrR2pixNynIAGkiOdmOdL+ktS3iXhZUOscGWAL3/Ty2tJdtp1bdmE0qMynVkGAGfUZK2K8M3/sswAVFJFPcoZLD1J/PegqIKZQd3g11TAyTKNVyoNOfdvEuCIAYChABdVZ+cP5aLxhZhWTGIbzcJA/+CKAE8JOQbdsmBRj4oJUPt02rxh1WO/h3HtaOSOUbDSyRPqJWk88PryKNZKOvhry4xBZLtFAUDbgngVOjku7vi+LgDorMWVEyyxzezKEfO7BgAq29tdf2v64E3uj3X1ElKtDSPYrJcZANRCSK62GRDXWsOYQZIla4zT+QBjdka0XAsMRjP3xmz015SVh3YPhT01bXFDiJbUgTXgYmO2aH8KGWEUpwEA5+cIvWF+lGyrNwEA8jrVBrnK6SHPPxMm/Rwu4Ss3McaOw+DLs5j8is+XEXfsADljkhrddAhPdK7eAoDJbf9mAUDt+gQOqNCh/ahApJ6qzh6B0wM25wOaTz/Fiz/4Pbz43d9CToUvQBV/bzGVd5jqOwzljgFAFBtmiGV3z7B773309RbY3XBoaEdsvP0OzbNbrgiMMkO1qVGUBTZ1g92uQtc+oMg7FFmHqpiw31RcBIP8r6YssKtL3N3usd3u0FMob1nh5cMj3vvwfQbsXj48aABQsQX6fsBut0FVE6w2cW66MstQFgpMOhxb9FRAZKSAY0rBMuHSdcgpt+Bl4PDiccpxOnU4HM6oyg2+8xd/if4y4J6ATQIP244BQJaZ48jhyhRqSxWMu9MZ3fEEtBSiO3JlYwYALwoALIgZ2FoAMO87FAwA1goAJDCW8gleVJ4/BQBq9l9/YCDQgIEKAIyHAHNRj4zYfxd2Zhnn0LKCWM0Th9b0CgQEzS/JoRwFJVDU1w10uFFvMdx9gC9/61dw/3N/F8+3d2ibDXrQXNDoqrzG8uCNVdGsRzxrzAO7QnDEv97bLsFa9uw7eTkv84T8MkpUstLfAoBrZonz+Y87ACj1Py8nT30uET94kHT005MAwGD9Si87XOvzEja+D8nyKwrT2PaZFwq7ThzyxgkAwkNJOtCJvSnYq19MAFCPhyiaZcEXuwjccEbd30WR49pndNlbAFCFZRhvwvqv6i+WARv3DdIM0dmit+b+5wwALjMk43tDqUcNfNEhrUe44Mhg7fjyEzglieleiGdcCwBqcRXIfjrkNNgWX/OFAQC1dzlXgY6prc8YAGQAwQAOYqCcqY0yRIxwSZ9gXaWJV08o00LYf8cawBHgAZ4nLV1VpZzSQZw+AGPbE9vwLvgQc3f13tCPifQ9xgB0OiXfK8C0yGTw/MsqZWZnuiaSd6cWdfo1MwAYVdrp00M1vKa97ti442jGITKmAQAojzRUjsroCbRECYQB/SYBQHW+vxywHYU3ngQAxqoep3fd2v64as9edZEO3g5ONH3+pbsjrYHKq9OOnhcCPJt9Zs0a+UXjJxwjd0lLRp9V2QGDIclIkp23CX2vGpKVi+ImgrrJ9GO9aJO73GNVAOWIp5+n5Me8TnkbhvlOF9vthT+bnjjXBwCg/7SYxBbXeLLPYSQbY8ShSAjJ4tITgtmJSvDPGwCcK4Xp0RM5VVTXf5wZgKkTVM0u7SnvGwGAxDw7YWoPKA4PaB5eYvjOn+P7//r/BQ4n5GOJothjym8wVbcYqhsGAMv9M84xV9zcorq5Z/Bv2uzQFzUGCmklAPCde9S3O0x1gXq/4bDSuqpxd7tD31NBjgFVOaDIKDS1w91+j91mR3gh9k2JLVUJrkq+50yMun5ANxArscSRwLRh4lBd6kaeU+XfCgUR08Yem7xCJRiARw0AthoAJBpf23XIKO/fZcAnzx8YNjy3PU7HFttmjz//029zrsD33nmPw6EvLYUXd8zcI2SNi3hUJbbNFpfTCZfDCcPxhLG98OdU0IMYf8XQI6N3cQiwYgVW06AYgHmNvLAA4EBgLBUBIbYeAYDjGcPlMQAAqY8q/Ff9y/n/uBAIVU/ucOkegYxyAnK1EZbtxmnNOX64V5WWNWhnAED6fchKjMUG5V/5Jr7xy/89+q/8VbzY3nHhj5ydEx0+NmWc2sCR7A4AaIVMwNgJhISRlvSByrFs73Y1vro1Yd/y5UGSLtHM0GGKMWxeXTfFLBT7tBkAeCMMQHquL+sNdSPydzN2s65/tV7+2AOAXDzI2lxfJADQTJ3YXZGQzKW59+db+g/W74nb/2INJ1OkpH1PtfvcQ0QnBJiBoZRVF+YIDlJoeABKyJayz+fWzjaXKS5h/SHfvWMJ5dszSQaBOx5cbikZQv8mGIALcoElp1rYTtIk0R+zcpJdehUGoLGIpe85pwrTb9UTReshtQbWQsR9mRiEoK4xPpJicZ0B+DQAUOeUNqzVRQDQzJsPAIb6cBkAZJhRMQAXthiDfRFca41UboaMJYpX5evNMADtG1L5BHk0dOf8gxqzE9cifrJ9ggFIzzYGjREOSogYyMQAKHIVuUaBat+ykGNAZU1/ryzSNdp43HALHzo3wzTX7NUZvxfeqMIftIhfbuAyACjHRb7QKirffJsF1vw6f/wpE7gbshenz9r3pU7vrPoS7fO1RNB11f6AAbgAAKokoInxm3OghL2nu6yCUUveAnSqzW6S1dh7YkrcLkgfAHkKQCaZVvE3q7Fa2h1rCoqVuUehlw7D2v28AldykKRn51U/1a4Nh6wqR2gWecYY1YNiZY2hXKtVab/kWpajacwvN0zXnvgKJbO0hiMn4v6ldEDjz5/dImptpUzUNcDumhF23h8BJ1M2gA8AroXEuEwYvde1KJsllzcgi9I/AgDGjFB3rpd1ibpO7OeI8xcCgMpQsF9yANcZgNcaC7F5NKOXdGFWQoDdnKDzLlIyWI/HuhG5tMpcXe5fpeZqrUxB2kEjA1I6epEpc0JC3DakDpA0D5jy1dEpMsXY9hd0pwdMh5eojw/YvvgEh9/5TTz/oz8CuglNtUc31EB1h4nCgZtbNDfPMFUbTFQMot5ipBDdeotis+cw4Gy7xbTdoNg3yPdb9MQC3G2x39+irkvc7DeoKA/gJkNVTtg0FAbbY6A43KHHbV3j2e0tLhcC3S7Y73fMqhuGHv04sAFb1hscD2f0w4j9bs85APNiAmGAU9vhbrtFXeXoLi0IAJyKmkHLM+Xay8FgIoF+igF4AUVFU6GQF88fsN/ucHw44vknz7GpN7jf3+N8OGPoqLBIxkAg5SHcUjjy+YypH3B68YDp3KLJc5wOB2Y0ZpzX74K8U7kA6bucRvSnE+9I6sN2u0d3uaA7E3h4wsCFP3oKSkaV03iccX78FOOgwoExdvrbBQCpEMg4ErOPQnyPGgAMY5VmDTCNKtSMAD2h7/q8wpTvsPkbv4Cv/JN/ivbDr+Owv0dblBw6XbBqopQKVuaEIb9CH0VtI19eCV3HB+xSn+n95phbMftE7wLj3Ca3mPt+kfHtGtWyck1aPqi9vAJyROWbHwLs63zZrHQbnuIbxDubGP/XHEEp9xYftZYCwvOunhoCzDmA3yAA+CR7ZgZn9Bqdhb89RHQZiu5cmP297EAG1pqNegqiiBY0dHRPm2vTB7zW+hN73gGg1u3D9SXmkTgcWRCOFx+GzUe2lGOMDlL0TYHtqIqarOeRE+Mh2caz/bGws3Rbliy62P6I+ytxAWgBQGHdeYDmUhHR2WZ+AgDI4o7HUPt0s21kfBxr60j7LGV9va689u3Tp+WA1utHDO+cg1NPWtr+letPrDsBANJBm9y/Kqedejh/JP2riCxUa9NEHdH4qhEzOQC5IIhYYLL/Evyzc+cxAn1Gvwcg+wCgM5cem5A+C3N4ppR3+Fl0/mLkPLOXdVGVpbdku//1CSHAWg/zkGvh7Z6guJO5DoBoo8zX51K+rkrApynoFODhCxwj+00OkiVHOjWF6wBgzEBU4xhLAe2+i6xaiaDFAEDfQbPvU29J05m88ytLNVq2WD5jANB9sd1Qah24AKBJsppaROn1s5bzJ/Xk9fVv5jn+FDPXyycYMQDQroe1+5V9vqR+Vzfea1ygxpxkiCJWCAPpKgBQ3iO8JQmnCsDZhOq7/bWhYCGEYXbG8umR6ryu+iZAECsz9OeBQeQO25MM5siIp2YvJpf86z8LAHDlUFv0goxLqzNM25aNithe9XskjZbw+nQOJt2W+ZFp59L3DZ66k+wqS2ylHwkAMGXCp7SjYhhIvWt+jhlS4SilGeSqguWEfFDfBLhdjg8Yjw+oTgdsXn6C4+/8Bl784R8ApxZNucUw1JhKqvD7DGju0OzvGQDM6g3GaoOBvssGoOq8dYOC8wHWAAF99zfI9jsU2w2a7RabzQb3tzecr6+qJ2YCIhtU4v1RVaStANzt9gz+jUOH25sb7UCMbMT2+YRuGBkArKsNmqZBlk8oygwlmbvnDjtiBGYjg2tUzKMgkDKvcSImHgb0VBmPcvtdRpzaAW034PHxiMPjEVVecTG+hxcP6NsONwRsdiOGC4FuOecDzMuS8xFSKHB3vqA7HDGeW5QUknw+MwBIVYCJ+Uf5/4j5x8DeNKI9Pqq+lhU2mx3r54HyGrYnjJcWGef361BTxREGAD9RACAXAblwjkRi/FFAM1VMzqlqsgYAAQICj8gyFQYcSw1Ca4Cd2AgA2OWEzN7j9uf/Dt77B/8E5w++ogFAqlis5iebKIWGXd+uvDaMBrMyZ42r/zBLNP17GC1CcynqqDr2lZKDVoYFu2wGAK+UPJxTPb0fn6bU0/JRNf9NAYCxlqXf/7S+LF39NP/iKe/0/Y3ovT/BACDPrk5CNhNJPGN4OT/k0kwYHa/3wSpDyveP5P75ggCAKQaNPLygbKYBACiLMLhyhH5TB9zXWpmuvFvzP65JYeSHez/FX3FtcbUeAgZlRB7yCjFdeSUAUIBIgsBi/UEL2q4V9aQyV6/z9cMFAI3+Mv6a6bex24gB6tn/fOCmvSsaMAaw9F8CWahCYPnp8yGGKvuh5lBXBBbL15l/AdCZcfKZdL7/7zPoP1sAMGLxButV7bJY+xWAqlbYktbPtisAoJ/0W24qGnxlEEknXL3KBz9mRpjXkgBgMWtFr511c+VpCvqzBgDd56+1Lfb5vHyjAKAcHhbNHKJrvjwAUAufJQG+aj6ZHB/i8eFS8mfInf+1EOCnMwDdTfEWAPTPuH+yAUDJuFMyR8MsWkLa/an2njxxsivLQjNp+1ADgLPCUpRsq2/UO3y3UK7gzwoAZLNB2m2R0yi65IcPAFoD1HeXQ/XnG9yxO8w1RrZ6Rq1fhdFJ4WCcA/NmW+VYKbUFtqdo6FMYgXaVJUy8twDgKzIA1YQxADhOKCkUeBjQE/Ps8IDydEDz8mMcf+838Okf/A5AYFhWIxsbBgD76h5TfYtqewuUDbLNDlOpwL+RAUD6rpHd3iHb7xn4w80O9bM7ZLsNmt2ewToC9zg/X9FjJECLilYQIy2nohUZ6rzigiDE3quKHPvtBmWRM6MvLzO00wWXscfx0KKuGtRNwyR/CgGm/HgEbFYZUGQTswabzQ7DlOPlucfD6YRmW3P14HHM0VJF3yHjPICPjwd0lx7dqcPt/gaHxwNefPwpyjHDtmwwXKjqCNCeOs7jdHN7i6oocHo4YGoJwLvwvwUBuAIAnM5nDOcTFwDJpxFdR5WGqSBHiaJuUFLDhx5Tr0BDygeYjT3qkiqcnNGeXugcgAQOEgBIQGDH4B+F/RIoSKHAxAAkAJAYgFlGIcEUBmwkLckAVRGYHCja8hQ67cjdPMOFGID7d/Glv/eLuPn5v4PTu1/C8YYKwJT8PJLk+VgxCLjMPEkBBK4Q1paR0RYM/FkGoNASs94yIT6uRpn78RYATLg2CZn6pI/WbPgnPcy5+C0AaMAl4+Cb/WLzCPNhyXyYa0Ly5TB6AMLqdDwVAPTeJfamok4ug2PW+rM+kgsguPbhatOjF6S8OHft0m8hACjv969XVZCXAcCYZWvH4y0AKCMkLJlAEhJ+/AFAa0srlMr4Y8o+y4MclJZxbwEsvS4/AwDQSpwFEI2iBgTE8fkDgK58cRjec8MsCCgBTDN+KbmyDgDOObOs88PTobUX53fxAMAY8+laAFCaTCnHWXVKDc5aEJIcgCUAMBRWdlDVS3zzTT3VUE3NO8IQuogBoV9mWh8DUJcYgGrbzG8TAKBeKGzoWoW6NjbGCIktEnMynQ4T9gFAMy6qnQTwLhs6RAFbXp5K1zoZHIKLXQDQVC21wIAKAU5ugfUQdXH7U06gzPpYacBikKi7JvVvnr/hpiZy19qaAuZlnXLOzO4AACAASURBVKjyqmdyrfmv8LkynLi1IoT5GoPYrkXh7KmdqNshALfZWFMnT3RFDAC0EkQYaoz2+IyN0NgLKOUBAGjDksOVKBmrZhhFG+bXSQPZDvc8295QsIr1Qu5lKLV5LF/HDCwhUYIcou70uuvfKPTwwMdRCYsrhLPEeBItvVctK8asTrnmzc8WBAz4zw7j1Z5E2tF3N5g01ni/JMSJ4xskpYrtY5qRY+XY0qgkgQm1wZMh6Oubd7nDKsQm7QDZcKP4m0z/19nSCQ2VmBTqPTk9RT9xgQoCp4bjI8rzCfXLj3H4/d/A89/7/4CXL1GNGTICfMobDPUzjNUNig0BgMT22zITcKwUu47APwYBt3vg5gbV/R2w36O4uwU2Gw4DJrBuW1UqX11OBSt6wsG4oEZBYaZ5iV2zRZEX6NsWm7pEnedo6hK7bYOqKfHy/BJlU3HBDioSckNgYw4OASbZTwAgVQGm+6jCLsnznop89CMejicuSsIA4JTjQqBeVuHFy0dmAI7DhPZA791wLrnD85d4/MEn2NVblJS5b8xweDwxULi72WPXbPD4/AXyYWQGYHc64YaYkVTUhJh6HbEDD5wTkEBBCqOlQh1dd8EwZaiqWsl7LmesgD/OHThRlWT6W4v2/IBxoKIgF8UA7KhSMeXxI0CO8v8pRuBE4cEMBlKIcYeM8isatgRXA+a3YyTQkABSPzVKVqAtauD+Q3ztH/0SNj/z8zg9ex/H/S26ggBALqFyBQAodY+3RiNpT9zdpHIAypC8WedKIT3buepTu9xNNXprScoWBDtXMADXrKJ1uaD6rd68YAPSp0n5I/Pxei3XwjR9oLKeouG6fixK19mmeL3n2Lv9kVoloPkUqECvuBrODwEmAE1KaN/e84uAyNcZfbakhYxHJPvgp3TRK3Z5+KIHpnZVsX4Q+ygIR5UhhOlgJrvPAlrUkg7z/67tnVnRL61f2Ws3xU+o79+sfo73xAoTZQcKu80p8+r6DzTWyr5dGp/Zw0hYeMu3KwagPCJ3HzPvFfH6p/pfawy4xaJkuimpkFlpU5uWO3a2dmjMarb+jR1/yfCOy+tXDwLm2fQe+vQQYDVD5otzFnrLYdECnN8tw9RV39VYvHkAkA78TFQj/8QmqvCpIozPRfacxi8czSTxBN7+y/avq6u1Zg9y3q9pYvf5VwOAWhYawu+ihPMZgH61M6Pfo0pAMwBnoSwHesEoCHMWpQdwtQrwag6iddU9izGR89AYNb6BYzaxMXtsOevYe5aKTFiKZOCgigVigyfEAnZeY64QsxMtaiGNNG+8Uzn4VqbGN/zkOFrhbcwE1XDJ+GTowZNQzitnAWqMZNUPxzb2xsMK1LRytretbOCVENnU3UYQLZeJMQa8aA07KkJIzktFG7tCXrCAd5KQulA8jQUZHAoMiguadBLktIL398b6TuMV4IAGnFzdvEYP5pJItOHq6cI72qrQj5XKVo+XOFGeWYDCMJrp5IH34RpIsr+zEjEvXxuM+TRLriBLkTc71s6Pt9Iko0+Mn78HjcKPGStaJQVs7VTTXca2Xqdh08QjfAknZ9fMjTvjKztSpqxRCLIzlmaOBAgo98yMmOt3Z9pgEC32wdNlAn2EEegt3lURmuSwXHO3N1vSIYo8ex3wd8ydSNJ12Sb3dFTd6UpnKyPiuzqIFHhyiGLagCL9Qo4GMdVKqg7bnjAdDwCFAB9e4vF3/wOe/+avAc8/Qj2OKFAAOQF9dxipKnB9h6naIqOw2mqLsdoD1Y5/J0AQ1Qb13TPUtwT8bTHUDfqqQk55+ahab0FsvQxVUyCrKNsdhaUoEDAvVLVg2lNVlqPMgU1RcO45ruxbF7iMHTiPjbYmN7sNhwCT3MyLHIeXD7jd7ZjluG0aDBQu3LY4UjERyr3XNASBoh8mBv02zZ4BwBcvHjBQhWTCBEegLiv0pxbPv/cDFN2AZsxxfDgQ0sgAZVlQWGyO48sHlXuQw3gv2JY1amIzjgO60wGPzz9mdh+HBfcdX0vjb9jYLO6nAePQIx8H4HziQiBUnHcciR1JIb4d50mcxhbD5YGZgAQkTgT4gT5rVSGQiSoRn1V4sJNsX9lFvMM57x+tSpXTkBjXNRUz6UZ0zS36d7+On/rFX0L917+Jw+0dTpSnkPrM7PAc2agrAc/bQq238CAkIjUdANDYQWJ/zFtJykFf51rbjn/yQA6T50ruPNMSZ2d4YOQ68LSmwPRuT+xXttTWAMDkaybNQIp0nO/jii9rLth1HVm8ak0Gr30esd0Tdo4vzfynuyZJPEebZ1E4PQuK1PhFEfwXJkG1mLLzdbprMyUBHAacrP6mJ82AmXQBpHWxkkPc2DhWh7v2oAVEwnl0D7jkfWZQ6G/L8+8fVi4tsbQGu375Wknh6nDnNy6Xrv9CMsEjSDi9EfnYrmuFO7Z0jwFwY/er8Unv32A/OIQFSu+wHCKr5GWcAuNaKbZ1xl+S7V2cYe6uaGEkyiacWwmGGXlurSQf71d6f3n0OYdn4ivYzquEGPdhKev9mjVh3+/b/dQvKjAmDu5MRJZMqSTXYIQByPuX/i5SRxlcgSOIPRKHD4BybmAh42YGnfQZIh31gfynAavXjNx115j1L0FMpoA5Cydmp2v9nQQA9SDEBYvaXG4IsGl0KAjMJ2EVVVdB+KLLrZLmL87QILpu2Ny3mLFicc4CRrQ/JimcxRapAiAVVFZE/EfbZ6nQ5786i89TWM6Ojji/1P6YBSBfJOmYYRWJpw+hvmNu6RyP7wm7KwFA38iRTqV/XuYKWOq4y4CUJyyv0rG1E6e0+eeFEMYa4Ak1fp+29C0Dk1Wp+bN3omsNJtYVekDUFBMAaNhgsT0ZK+LjNdIDFPwuyBxu6+Or50d4H351RX//S4kyD4CGM69zYtx+G0aqGZ84AGhA09jsevJKKo/1AbBXPAEAtGECqj16eSgGpffOYA+aU9aolamvjjBVlroSOL4LFA1rY0qWmC8PlvVE7P2zHjJrnAdDHIJ4QKBJECxZAwHjRoQgmDaHAODyxKb2vwsKP2VxXHetbK+6Y3081+SZ/+bQsFnW1zPVW7fF2g3xdkm9O+/zJwOAqbHSrF/NBaOiFPnlzKDTdDyifnyB83/8fXzy2/8B03f+FNXlDOJ+UcXaId9pAPCeWX9Zs2cgkMKC6d+83qtQ4HqL+uYO1f6GKn2oCsFVjaEqiXaGZlMiL3Nm8WX0t6rkfymvHoGTdV2zxiIWX5VluN0R+45OxjMG3TqqkquTZtO/XACkzFFUOYOzl3OL/WYLSqFHYGLbtmi7Cy4UfjuNGLMcRVmBchGfT61i/bUdHh9PuJwvHIKcs6VM2FqP7//pn2N6+YB9vUV/urADRzYetwdA+/iowsioSMnpzCHDOYUi07s6xdxTAGDLAODYUniuWpvEx+Ocd1Q5mCr6MgB44FyBpAcY9KP+TgMGnRtw7B6Qo2PgjwDAcWoxMfinGIA56Fs5tb7ZY/YxmUQUIk19yAjgzUqcuxHj7l08+4V/iPd+4e8CX/0ajvs9DgTgEuDJDEg6rJIAoF3H1+wjF9y2EnHep3ODzXNT+9eGP8p+OvInMgZGYQTu1xNkfmqHpe0f496vXbX8BgVQhHak0oPXAoCv/v51SZyQh548jsm7QN7OCj4G9oZ/U/iH7V/MHpDv8Akea1Ui1/vvWWyzvSjXu2hf8kCdQk6tPauqyK4AHE8CAN0DVpZKvL6spnL7a3OMubo1vh7DsUoz5J82tutXzytRDr2/Bn0GUgoAXGH4R1vkH0Am9Pmr2EchgK0qvC99GRvQ2QPGVNJbR8rGFGAZvINFk7jbAwD5Y19Ae0QMCT6F14eRPIG8SAGgummOXnyKfRUB/40MW1+NKWzGjBkBgDJ3r4rFsiCcK1vDiJOwyjSJD2svhePn2rO6CrWZNw8ITFqW/j56yrheNXjXXcTjJ9adBDBpvAy8vuCmIQgBdhTEmnP7Iw8AqoVoWGisCmYAUOkFW0vRZSpx4BovNldBXZcDUC9s/8QgetpmwxxCH16AP8b59UNdjLCbBbNnIrgxpNetuoWrAvAhYrhdwwB8CwCqSXsLAKqFNq97g3x9rgDgEgi4YKBfu4OC0yxzo93lfLA15/i0ylACgEuvM4ranFRF8X/tQEWijJYNKi+Edikm1tqgaQBwrQq5f0DCNpsBAPXUOADpPK65ThDsGvEhAGidbgmohbI2PiRvAUAxLo51aE/2lxK1f/YAoJEeSodSqGk9DpgIADwdUT6+wPQXf4qHP/o9PPzh76J4fEBOwFRWYso3GHIC/O4xlnvkGgDMN1QUZIus2jH7byhrrghc7vbINlsGAMe6wVBXmMoSJYN9BcqmRlaWGIn5R0U76koBg1XBOf1KZgBm2FIYcFlyAYqyLPjYZwaSaOEXGTbbBlmRoes6XNqWQ3OJAdhUNQOAlAabAMB26Pj+gp6XZWhPLYOAFHp8PLU4PZ6wLTfMAOy7DhSF+/j9H+Dwg49QXAZm93VtqxJJj1RNeUB3PDIQOPYd+nOLnIA0KvoxDigxcjEPAgD7yxkTFSFpLyLkjKrxKgCQwD7K69dfjszOK3Ji/1DYrXIKmBnART/OzAAk0E8BgAoMZAYg5+mjb3s4ZlYj7UtOAk41PKiSMh8N5hwKPeUVuqlE+cHX8Y1//M/Q/PTfQPvOO3hoGpxp7vKcxyIb6ICMcgAalCEF0IXywWe32isMqCVlvgQBY7ImDgDGHFsjk5YAp2uAqGvV2Pp1KYBs/e63AKAdo5jef9MA4OsBhBJg+6IDgNr3k06LsxzVunV9EbNvpRxIWgDJFBnrq/9pV7wFAMPx+mEDgIxnz1+e3NcZsGZ7NgAMfxwBwNnKVr6dB2DyGjYMwAAPkbY8ewKaIawG2QCoDgDoLYkoAKh9ivkYQLx3yQ+4ppjM03bvK14tGKBq7Cyj8Y0BgIsi7hUAwBAgsxm4/CFgQI4Mw4WxucYRjphl/pJwQuCkAlQAjHq7zlg2LzSJNDtGmAOoLZ0AqRE14RtyfGeMgy9wN0tEvAXhb7IoiHuutWC8ruT8esqy/HwAQHHqEpxiU481A9BxRlNKOt3DtZP+9JPfJANQ5LvRy4I3/BwCrNeU9jrmMNYfOgPQX92StUrJ2dlVcybB/ubtfXG6GAQBJxkN9okuA1DvQlI4TgiwZAAmHJgI5f/6/RJrsLuarPxzd7Jq9Tr7me43GUR80Ey1M3W4EO/J6zMAjarm+pzppHqRPrry0RzQmDmSa4sAQCULHBCRfXnhbDtrSo/KE9gxXwwAUO6fJW2p+rYmzwIdHJxsevvBeZ38TObnSgAnfmjimz5JNcZcNjBLrSJmWdcC5zOKw0tkH30Xpz/5I3z8H34dePEpSso9x3luKkyFAgCncs+Vdadyh3J7j7HYIqO8gNUGfV6h2O6RNduZATjWNeh7qiqUzQZZWaGqFQOwzzPFBKRQXwL7tjXn9FMAIJu02G4aBgC5UAhFEGgQkAzbYRqxu91x+O/5fOIMzLvNBhlVOqa+5hn6ccR56NAOPQOPLAf6ngt9DP2ggLBhQnfuMHUThwFTBWFiAG7GCd3DIz79s2/jbrvH8cVzoO8Z8CPWH4F9zPbre4AAwBEYDweWNBXlIqSAh75lAJDu4Uq/Yr9x1T/N8ONw347uHRjYxDigKAvNAqSTbar+S99U9IMAQFUMhBmAfPBKgCEBgMZGs6qEtQoDgJSHkNiLDAGD0iAyg3N7j5tvfBNf+9YvYfry19He3uGxqtBWFcYsYwCQYrVzqtPsAIBGfuidcoVpEd+R0hkU8mi2MB2r0rEXzSexV4fyMZTjT2E4r+mz1LOMM5eMYVt5gQUAvXGfdWAqD2CoN9f68/TPE/bBjyAD8CcXAAz3WxQAjEbELAmBz5YBeM3+96MCAuDijTIAQ3tuLYfebMteufFCBqCbQ9p9jLH93JGStrNk6LGeNPbHFXJdbW8h3RMsdGNvS2NUsrVMu/2oprQ1F1Y19ocxiJh7in2VYACadiWHaYHQJNvo5FAX9r6jxxxVKw1GjwE4Rx4q7ESFArsjkmIA8lpc6rN4DD3yixICDAkACkBZowE2wD46F0C2+9/+L9eEFzH21ziZPsJuGV7WRV8K1VOOWbrG0BoAqM9F5+lJx2LHATV7UksjqAAJ2Wa5GGdgxaxDz4G5jgGo+70wKbOBZ5ojFl+8ipQyQtR/lhMfwgmRfAufMQCYerypgucLk7ndM4hne6LCPqxEcEME6DqTY+464++pDrEvYMOQdk/gJENotfHoS3m94FwGoJKOvkDn9wfhpPYqm0Q55oS/fgiwgliW1FRsDgxAqz+LjI/dpda4VvtxzuykB1ldOV8faKMQyaH1OI/E3IRlADCVI5ElhS6zfqX9Elzm53C0HfKL54Sqdk0+m+2zbEQkgJmrOmSqWKYudh0k2xYtZ1dCfEKDRjAAnbg/bx9Q/i4tC+TIuVU3SQBbA1KuozXDa5bRia6/SohL0N+VHKRuEaprW33V5EYu8pKCz/JZjoYZbbW2ZvBnJVT8VVuUXnnCAcsILBpQMgB4wXg6AocHbE4vUXz0fXzn3/wrXP7sPyPvWxTMTssw5Q2GYg+Ue2b85RUBgM84R2BW6qIgJYULVxgpzJZCcW/uMG22yDYNA4JUQCQjILCuGfjLmhIDhaIWBaayQLGtmSHYECswBwYqjqET93OV4GrHIbzMFCxzXKiiLhcBybiyLeXuGy8d5+ejn1VRH+DQnlFuG8qYh1N7xvl4QnducXdzg/Z0xtCpKr9UBTgbM3Rtx5V79xT+2vX49DvfxemjHwDtEbkG8tB3qEiA9gO69gwcj8BACODA4KAq7KGKe1AeP/qX8vPRGqAKxVykhHPxmcNN4irqvH8cyjKy9UIgIfWPkEmqAjzpIiAEHFIFYE6HoYt+qCJC8QMRBgAJVM0p8Leg2UdPBVyaG9z/1f8C3/zWP8bD/fvo330f580W56LkCsCUN7AguU4yZCp1WKJaaX7NrJXt6eincK3qHFaODkzrUl8LBEURgpe4z5OAnWKYpz3dtdxGaxInxsCRTUy/3e+M+zal/9YKgXhWsOcAr/V/XS65+s2z/pzDzXV9HBLGfAZ8aG+I979uyN56Z4OccX5/w6rWqfGJaHd9aKesSuPgLzQsaVvLe4yds85QdN5Et80BXn748KLXIh7x+QCAzgqXW2R2XO0f1/azNOWZQbRqIspFtyYN3Hl8E/ZRKgcgy+sI+ODbzbLVlm2v2pocrxX/ne+flZN63ugztuaLIvl8Ir6Vm/MvvbfUu1cn0F3yCUDTNNUf0kUZvoZvaP8ppQ98s9F9lw1xNc/gHI7mFw0CLudQVPmhZy81EgLss/j9vkZTKDyBQLC6H1dksq8fOFJj7ofNhTz30TNgPhMAMLahlvoR8wukC/GZA4AiSSSHo1FOqblR4dLm7eSBf7K/LiC0rvwW/CIeLr6b89bYLxd5Ns+3zq8FhDwFyMkufxwAQGFTkYEfVLGSAOC6efm6BuDnCwCyCpkndl4fHgA41+ajZUEnfHMou6+gPw8A0IFfdFy93BeRU0PBu53hRf0YySaRzEGzLx22QQBQKMbhHFytLQFJm1bgv2UALgOAapSVQb6+zhbl3+yAzSJ6BnTXHAbfkPHfsXb/NTnj0vrndQFAMjBTJ7jh24OQHKkseB4MwKzZf158cwoANG97CkMmNfMp2e7Zha4RJn5LyRdj4F1REmfFjLj24yUA0N/js6koDNCnOQfXtih9nSrkoJSpAp8oDJiq1YJCW0+PaC5H1C8+wcvf+i189Nu/CRxeoCQgi6UEgXU7ZgIS4EcAYLW5B3LNACw3nAeQwoCnssJQVMhvVDEQqgQ8NRs0N/dcMZhCfqkIyFSVmAjpKwoGAuv9ThcEUTn/iBVHFpzS1TmqYssVg6kgCLHjOmpbSQCirSA+XDo0eckhwHQNVf0lAHDKcwYdz22Ly+mEoeuwozDXw4Hz/+UTcQELZropALDHBhkDgMePPsHDd7+D8ePvosyJ8ddhPJ1RFTkyqqZM4b2XM/9MwB8BgAz4jT0y6gP9jcN0CbSjnH7E3KNQXYqtNXueAEBV4ZdlEQGAnAKXWHvK+1afq7yA9M35/nTlcCf0l4VxJA8gA4mUw7BER6zOvAE++Cq+/l/+Pbz/s38TL7Y36G7v0VL4dFFgzBXjkvIS8tohAFAsXd9ecGpwPXWJk17mJOhPc9Ich2kxlYTYg56HZXWlsi9TzX5dB0VbsdZm8V726ppT2bMmy+C18sLvT8z+86GdNRmzVMbAT32wro/fAoDqMNseKyt/Z2GVXA1umP2l/3WAsYSPxpdrwkESpBe2m7NYPnsAcO5KbJE6/VQXPGk/z2yXpR2wHsGRbN/yzF67nVf7s4gvrLDbZuAnxZh7JQDQCsDoypO6RusF1/+XKcfW8QXjz1w7oM76WBgjaR8nW3AlAJiigKVt6PDtEh8xBVqX9JuFx0TYbOTiAPAU1yxVkV4ivQU+2lMYmZFJ9AFAYgRKANCn56iaHfYr2//v//ei/l9zMNmu9gwQE2LHwkas3KRS1R/6YpRF/0oI8NMYgMYo0v9qoW6rtfLxs2IAKq8hwOCj4J/oZ5QBmLCwUuYXv92bMBdxVu2TyTHl9a7aJKciokp/5BiAP9kA4CQZD3NRFSkI1axLNaN+jinrKwyUFSNrnQHogwNuCHCsXdYdIjDeXcVpAFAg81GNp5xm5QAZY9CeAhlhug4AWumwCgCueBOBvPAMYEVlj3+tyed1h+PVHU9tTgaMmOWWhuuSldNTGYDzYJgf5ACbfeCygJ0VyOvJzr0BE0y718fM7WHSgb3CQPTv9+faD8kKx9fmCr3WyHv1664BAOXTCSCWod7EeEoow1dvWHy3c2i/BACpyu+EjMJZLxQGfEA9XrA7PmD6j/8Jf/Qv/x/gxcco+xMDWRQyOmCDMdsABeXd0wBgsUFebJndN5a1/iYWYI385o7BP2w3QK0qBKOqkdeq+AcVARlzykNH1YZzlDU9t1AVagms4uaqnHbKtsoZAKyqUoXHZiODf/RNtgoZvEPfoykrbAl0HCfkVYmH4xGXfkDTbNB3Pfq25Zx82dCjPZzQtx3yrEBFhU0maABwwGYE8kuH4fGAw/e+g9O3/xjF1BFMiIHCefuef+YiIASkUkiuBgDziUBAxfxTAKDK0UcAHxX1YLCL2q8BPAUEUkyuBMHU3swpnpnzAdJ96l9rsCsA0co/a0XJ/cRX5DRmJTICAAn8u38f3/jWf4X7n/k5PG626O7u0G426KgKclZw0RTSA5QzUFXQWgEAhX265uy6lreWQrLvSWESLnGlr/y8SO7+83O0zlJTq0pbdOwVNh/X4Fjbz6GTtnbofW1LPgsAMOXsxdpl888ufWrH5xrdkno/a64g4kCM7xtgAKaqBLMVmawiag4EpV1xDUghx87qbssAXNgYrwQA6nc59y48n7th+uLbG/58+96r2ptBDOK1i/uK6+aRXTMQhQW5vl/Fi6MA4BrjT1rv6f4/UdxFR2StPz9SAGCwf9VYynEKCS9ro6ie8UqAlGjPvMRkmO2MkCws1lUAkIr+pAgUK/5JpEq1AwCupBgyvqTBRWKMVOUreja/2G9fSACQBbVChvzDqacBgLqji0tMv0TCSkaBxMA/LRK91eJKLwlS0SdZOoaUDWf7/msdDOsAKkBFbBCRw08FF4jem8XvxJpLsMUF7JRB6CtAMagxRp43Ov6EyQU+V7mcWS7E6LLt9efNBwzU+C4LEDsza0LGNloaOeSampDLuIhQDqI7gjItWKhU3ZZ80RmA1wreGAygRn8WgfoSA1zNwspZ/+GMS8Htj7OmBibO4YwEX7AwdIj60upQd8lPzV5w92zYLkOdl2c0Ao4no0xodtc0SxuctJ/UGqXVqdgohhlrcnLaMP8YQ3LmV6r54SLgywak+cTsCzOnZj+EBwYueLVaJEOGxEds0jX3LBZW7qm7hCka27/uG2UpCHsaZecoVKB+i8XYOgZFzCA3zzWnXH5+BhPyJo36GDAuD4DSlvj1kjH+HN9ADYyN1RjD9Rm+wpe4+pLQ3/f3t9QFyiG0kiye9Pnql///7L13k2XZcR+Y1zxXVd09PRZjCEcSJAiCFEEQtIpdUrESxdiQVn/oH30bUdJ32ZX2M2yQXIgOhiQMYQcDM37ad1U9d40iM4/J4++rajeDroiK7nrvmmPS/k6aAy+kYtIKACTgDBQA2HcwIpi138Bi7GG1PoP27bfg+3/1F9C/9ybU53ehGbB2HcavLbC1BYzVnFJ/58trUNUrqBtM7V3C0Myhaxj8w98KAcCVjQBcPvMsjLM5NwEhAHAGPZIlKkYVbYaHdigHsK7fbE7Qk5Eou92eagFit2AEAJsZAofYyLamyEGqRTyOMGtbAgB3ux20szmcnp9DP4zQ4tj2HQx7rPe3p3nvz9fQbzuqL9i2CxjGigDBcd/BqmqgQrBws4Xx9A7c/dkPoTq/T6BpO/awPb0PM3z/iKUBcY04LRcbfyCQRwAggYKYRo21+rh2Hzf+sEAfyz3UjxbMI+4lgYpAIaf6Mvin03y566vuHIhj0PaRlcpMjww700LBgCnazQKgXcFzX/x9+NTv/gHcXqygv3YN1m0Du7aFvm4J/MN78F4DACJkLCq5O/KaBuxKgKnyQPOEOQCZDGZIJmD5Vn5nKCO0jnu4AGBcFz9oADAlFmLr4tduCiIAhcrg+0XJmeBFlENdOKDz1r6QHjYFAHQpQKzxBQDAQNt6/kO+Zlw4N749o8PN4GN6S81F+UwMAJbCxIyFXNAO8n3a/ysplJEPAWyRmcwNoa9Stq9L759me+T5312fEmDmvJGEhCoirnmhkNbgRr3mDicuN3d990VSdKMkagxy1+dyU27DMeeyf1zfi+8dBIAeSMcEOnWbEQAAIABJREFUACjfGs63JP15/y8EAOoMYs0BQnbpufkBWA7vR+SRM1oss0IYiPo0EAkTIkw9fCXsGp6zj235CLY9eKXlGGn1vCWWLJACAKc2VjyIH33y89aXLCqMANRzMAO3EwgyGLIRgMprDUhM5kqj8aoGZlyyiJLTctx9Fhdo1kRjRKjgHP5vmsjZAJQjiCkf+b1oO62TASNRNmwgaQDQmAKq869QCT5xSAVq1i9YIXfOGe7MpajKxiRa2WTDacledQece75NJS0JmVAw8tSV8NH0EWEk378N35R7t6fIRfRUCLxeTOEUU3wnWeCpOYTCSe8HK1IR70aHaYbDlLCS98cMEHV+VNJ42aXJCFBywPI1PMkcNOSvRZNdj9j6KrbRJoczOsuJ/HF8dEYERmamwB1aS6wl5Qt9vlfLHTsWpjVeSiUAYwcgOX1Da+E7DFaV2nQpO8tSBHSpBpLv8PgL4qcpud/HaUpeY+W35EU5J3mGic/TAKewuORO+ifzESXmjlG919ETMiLIpZiKIoukVvE3zDeWMvJnkvOdkI3qY//pPkf7JSAcYzAhV3PsnI/gOFxG8vbIWeR0cfj8wzXL9DHSYaKiHwaasMYcIVeUulrtdjDHphu7Lcxv34Cb3/4GvPeVvwG4dwPaccO17SpsojEDwN9qAXVzBFW9gLblNGAEl8YZp/v28yUMqxOojk+gOToGWB3D8vpz0DXYCZg7AGPa79BgfUEG/ZbzJZxjLT1A3HAFi8WCjOKhR+BrpPv2CL7NZjDH7yqAo5MTiv47365htlw4MnA2m9Fzt/s9rM/X3AF4BOi3W+jOsZ5fB/0GU4KxUQc23ZjDYrGCBvmy62HYbqBfb6AeR5gPHaxvvAObG+/DeO8WVLs1zDDFt99Dh2szYko1R/tx196eowLVOo/jFqp6DRV17R3otB9FZ00tOWY0hxF7bODkB+68y/UXt9A3GxgRBMTSgCoKxxrLIydqGMpDIIZiOzHe0HyOwOpsvoLNeg/wzAvw0pf+EF77nT+Ae8sj2OAvNvxA8I/KvihbTz0Y5096gMA/N22G3jvRjspHOPsCRMqyUFKHdnA++Z80mVSm6jjRNTcPLSDgc2xO18a1ifk00J9y/q4OiXG9lexppevjFbopltE+kQMWX3vlJU4YZWE1W3xczqcFQFCOH+cbpuhNX//YPArmSuB5+UX0+Zmxp2g+dCfoHvjjAb6v8dwIwLIjXeIZLSX0e8S/2Hcom4HAZQnSc7Q7rU6VnSVm+szbD2X4Pm1kuLwdp9K8fTdBl8qM0+ReC1lcjPpKGu38dO+EsQRcFfDI6ATljgTvc+7wacYfn/UTkiuZM3Am2I8SgAz4fwJl8glRRj7GDjgclnUnYFaESoopAM86eIqcLU9ikRHBJU4EcYw/wgPxgoRKnBDwkDjrMffDJTgs/aau11MMxhd5flQaXtTQzUZcu7LX6vsJfK3nPAkAjHChcQ09BepEDUtfIBouigCgHax5pljBfIg9GmKUkCJ+fIUgFSQyg1tzyqQCxp6ijUIlxOnJKqo5RVeBYegg1GpsysnlDcsr8HKNOruA+Wfxu4MQ0EyECc/3YgYG2538Tr1uMbJE+PiivGHOagydaWPdTzOdzhD+lUUAMHtyr9YuSSyage0FBgDkBWQQWoF/MhqMVE+0Qyffp39KCvTiK8OKvLw+8g3hemQjfBO2gidWElOI0a2WDVopuvLHBeAsiKRpWa+5C+G578kpHH6OiGp0jpL0vnnjzkTolqP38ik7JgQ+SwRT5ZNYWx3zRRslHSQKfXLo03K/vN8OyMr/lJSIOwAamLIAEEsiWwNQ7bbDm1z/0dVIeQP+UNml2DrQWLEtYGmWf8Oh/H2RE8ecDeXMx/+jtDgTDODLyCeKEFMLNGC7WtR/KDP7DmpsXrHfQzOOsNzvYHF2F3Y//RH89Mt/CcO7PwHY3oOWDgiwsQaCSy3UmEIKCwIF8XOoF1DPVwD4u1xBP19BvzqB+ugK1MfHUOH/T65RdFmN9f8w9Xc+A+z2oQHAtq4pag/lKKbrzuYLMpKxWDimzSKAhzX9MDqQQESoYHV8TM/bdR01ENE2F64VAoDYHKTre9hix17sgIuRbfs9dOs17E/PoNrvYb/ZKQBwBqvFEcyalgDA83t3YewwjRfXZwdzrP13/zas338b9nduUMo0pvj2KsqvxTTfcQ/D2MMwdDBgTUB1dDrCDqpqDYD/YuQeOZMINc6hqRYw1i30OH5cH/wM6WF7hm2Foa/vw1jvVBouU6B21ilqQNUKNPqHAEDsF8w2C4J/mPpLybwn1+GF3/oivPrbvwtnV6/D+eIIdvM59NhARYF/WhMHB3AEAIaELEut4Oiom33MGaCIxjgHpT/1v8nJYF9mCelFEbCufRXau/JdWUNFPVjYFpESOb62d60R38jW5WukyPX1SH7uqSNA+V69/BzQ5AKeZfs6rl94xBezjeUqlOR36HAKW5GINozBmSoz9ZNSY4hGxDg2Z25t1Ap5JGUODImMLgsAlt8fA83N+qga4mmq52jjdIynQ2VRUsyrwAkpwiX/Ihc84oQQTKUK77oiAOFZSzljQbmEOfs9BgDmpFIJ4CnNOm8PhfQVAoYcBXyhnwn2jw/4W0Ca30gjTLyeP85bb1xGIfyxz5TyXr1TfcQAoKfeDL3yc2MAYG61QgCwsLIJ+kwBdv7TfACQOLpAw478jhn03ksMFR1KJnRjyfr29MGB46+u/rf/2zxBn8ZootMnDLlOYxIA8ME/fLCS8wl1mQcAeW1LDmhjady8LGZASWbgLckxj2Uufr+vLFP3OoBI8oST38/DzSvwsoHik3TOUbYpM/qufATgUwCwDHBNMBCzdrV7fwkA1I9Kn+y5++/XkAwF4AHSLiKLD6NPxcvilRcBAKcp25jc0GsdAwD19XqMiueNX6fDxe2/PA73PaUTJB1VbBSUOYHT++aN+0kGAHEZTYkGsbZOpEkaANTyz5gyCWO3VGcpMHLMngnjRRstnnh0jfuY3sho7QkGXNQEE48scR83dUpQ/KEGReSEvcRLRfOjMIZSTSmK0isN4hLfU8AngkeKtijJE5tNYITdHqPNBgK5TnZrmN+6Ae/8/Zfh5j99laIAZ23NKf6YRoqV76o5gYAUEVi19G/dHhEAWC2PYFgcUQQgAoDN0QlUq2PYN1gncEaNO0as9bdcQIsdgpGv6wr6DrviVgT0zdoZ1ftDmw/TZRH4w8+0rNj3PQGHszmnFCP4h9dIABDThNumpcia/W5Hz5/he/F5my0BgAh84tzHHoFGtj8abDkyjrA9PYUGu/COI3Tna1iMI6zGAfa334f7H7wFw/oeVOMWhoGbfDTDHmoN/lGHXisfuaEJpgH3lJrCWQozqKsFNNUKoFnCOL8CI9VUXFJq8f70Jgy7WzDCLQA4pzqC2ulxAUAc9QA6opcAP2wRMmCKNKb9YrMVrMV4HV75rS/BS//iX0D//AtwZ7ZQkX/YEARr/nEdxbQe8yOWBTGSqPaKansMo9OVA72bpOlIxEbmkDh1gM2OTA5giw0gtGXSTbBY91GZxIJ4SvJ3dnxyLHmbNrWUsbuCFOBCjXGaXcoJU75J0bzLyK+fTwBQaUUnAk/YX4reSe9nIyRztvcEpXFpAFDYbAkiyOu2pwCgv7/5iLxwTy9jO+C9pZqWvnR7rAAgjdcNySzKj6gBqtfRpsAG+slbWB//0PrlKQCofcC0vDFS6lBipRuLFrjzYv8VJTDTAQA1cRsiZwQu2kpbv1UDJDHwz1kaZei7A0ynAGvCvnwEYGpjbKpXcomdNGD3OUnU3U8NiUUAyjQVYtA0ZdgafSVXsazw8AkPPwKQx6lIpwi0PtwIwDJzllbtsQGAii50yqhtTMHrawFAAXJ4kyGTynNQAkFfLOKdX6EyAOhrEvfvxw8AesCb4dcQAJTOrZtGaucUE7hWlqknxOpGGfZ+dACgOYQoMUESopE1Ej0AUC2EW4QW5yYdatQt1hixp0WurNMUHx1mEjS0V8v1d5sk8Zgz0reYwlPS6VYOhqM3RlVi/Wm1Lnq6nHjmIRGAwfgiky1ppYsCgKXnFklWQ/P4IHQ0NQCIabX4iwAgAmrjCE23h+PdBo5O78LZ978NP/mf/x/A+29BS7mzGAGiQCWEybAWICD4hxFnM2gUgIUNPzACcFxi+i8DgPXqBDYIFrb4i4BfDbCcw+LkmBp/4OHmbo81+2Ywn2PkXgMNRsX1WC+Pa98hAIjRfwhcrDdbbhgya2G+xHqEC9hhQxNH3wK0eE9Vwb7r4Pz0FOZNC9gzBLv87u7d5+hHrNE3YAORgToCD1uMQuSZLXBswwCb+/dhPgKsMP5xv4HtvZtw94M3AYYNDMOW4u0QAMS6f9zlF8FMMxpu3KHWHcE7BFIrwPVbQNMcw1gheHodxvYI2sUK5s0Iw/lN6NbvQd+/B+Nwn96lT+l1Oi1HAJL7BlWNEYf4bATi8DB4Bn29oO7MWPPv+S/8EXz6S38IwwvPw/tDD5vVCrq2pYMLjq7Pxfd4stgjOiItAh6ZMczVQqYxAOjZjurPKI2XTpB8ws9ECNka0fIm+dbYCNzP8vbDowIAp3D7tGsC+Zc9YFN2Vgbhy2kPoomCICs68N79cvzMahePALScml47X+RPTwHmZ/rzd2uOywjAGACoMyZS9KtnUHKS0woW5VJ6e7mmfLbKY2F/Hz4AqCVPOEevkM00BvGvOjACsFQRSaiHKLjrA/SH8schk9QAYHqPtE0rbEnhLxm79KI2mqKdHI0EgGOEXjPiyc22CS6cAgDaetj+XiBvXwQA1KsZm3eJPoL9TUUAKrYoyl+RAhzjpPL9af5zNG3JUYgRLpFfSbalvyeJWpJP1/6rjQAkcRpNKyyP3rBKcGKjjCMDAPoGhp05X2m/NwyWE8FBCrB6hpm5fl4EiPA62jh7kMmDZ9Mz/iMdHt4AaURKgaJnJ51gt7aMy3ChMEoxkhwbG7pijQ8QVvTGg1KA9ZvcOlr8HGUQ+E1KLhUBolP61PzoJTLFUK19gQlySqNI+RQAkBPBpSek91W7FHr9dLdqk/psBp42UR40gBCsFTpeqSmaCFj/rtKaCIV7iEangAzNuDHnTa214zThZ5pOXPox1Gy0Et/vJQdPimCye+iOy6acSS/erk/eAMrRjuK33Pol90fedAhtu+urJZx9gjDy6WCJlWcYzWrnpS6Js5izL+5E9X3soPNPaMBYDZOQ5g8dAMT9z6VgTeeUaYwyFQC0kjy+dindUz4QcMcZiwBM7de0GQpdpx5Eh5Oa54eR0n4bNBwRAMOiyfs9LHZbON6ewfrH34e3/vavAN76EcDuHFoEAEeMNUM5hwBgS9F/NTbXwAJ21TFAcwTjbAGwOIJxcQKwWEG9wKjAY+ixy26D0WaIrjUwOz6CsakpDRjBPGzkgagZgn+Yvnt8fAJd18FmvaHU4MUcATOb6oPDJhAQQSxMJfboGtN/27aFpkEwsYHT+/ehwQYjFNF3DtWuowjAAaMD9/jb0S82CYFuD9evXqGOwWf37lEaMNYDXFQAqwpgXg3Qre/C/Tvvw353HxpMq95voAbV4Vc3VKNcXy7uTfyHGBh240UAFddqxIYmV6BHaHF2HVZXn6Vaht3mHnT33wXY34BxuAEw3oNud5+6COsfp6ZehUAgN3LiRcK9wai/a9BXM7j+278PH/vcF6F+8RW4v5jD2ayBfrmgqD8CRHHx0D4SNq9Lv6EOMdkxyo7R2kCnAPv8mqoB6O/bVNoOIlYOBgBd2S5rcE8dg+AwU6Ikdi87iBmIbFIEYMl4K0jIQo290pxLDtRlAYrL3E+aM9tFszQ7xTaJy2IrG+oPd38s/5T2Tb2bZIWwC5wDWO0R6pFoZ0E+27eBvO+MjRCfpLEvYl/To2UTDP+igvMSDXrxnpGJ7iUBVSJA73Fuk0itOdJ0ULIvShH6QUStK16KtnFu/X0bhGbj4RPsY0+j86iMytxKKoIaV9mfkF9dHTHVvrIKzR1AaT8CgLQwdb/AVrhWLv844yfZyYsbk+J6rM4zPX0kv4vO7QCAOaVjckvg71ewP97+4rP8cebpK+ZnunI1J+Oz9KLlT3KCthayvsTh/9gBjB988iAAQENCUWXLC8SCJEScXcDMI0aalUohSyjysAagXgr9LC0d5LZahROTHTalxlNuE4SNC7jEoiftHA0DiQ2W6+E6Qr6is+nVgdEp1oqe5//tEFRa5LCRmibwkC7tGCXRS2PXB0hLJ0Z5+fbzBgBqApS04MNRdsVo5zJNOi6uNq2AK0XwPewTan8OhwOAWuTrdAwLIFv+82WJNU3y9WGYR7WRw095zACgI9Im8HbKwUwZrub6yMmhsfaUTjAgYMSIj2rdqLT2AHjlNCixRgCb2mL/bu0bpCVgYX0mHF6UDNwnEQAMDO9SFrJY2FxX+YBXM+sndcaDkFMuAAgEAmKUG3bArboOZvs9LHdnML9/A372lS/D5htfAbhzk8EzjMjD9iFVDXWNIBNGBGLtYWzYcQxQr6DC6L/ZCmBxTP9W8wXUyxPo2yVU8yV37G1qWF3FlFcLAO6gJ0APu/hyt98FdBipt9sREIifswGuo2E4dZjG0tTUGThsSKG6CmMzkO2W6/n1PTUCafa9AgC3MHSYvotNfDvodluqE3iyXFC68PrsjL7vNmuYYQTgiG07BphBB9v1PTg7u4WdRaDud9BUGK3YUx1AchkEAFjjXQN2OMZUZqybuIKxwpTfE+irI1hdfwVmq2MYhh3sz2/B7u5bUHW3AeAOVHAK/f4+hi5af0mmQBEAqFYHozyhhfniGdgiMPvqJ+EL/+E/wubKc3A6X8H5rIU9Nv2YYYwjRzpSXcJsM4+Q/0MAkA8WtN3ni62UgX9R+n6wAOCU8lUxmau3w9YoTjlnlwMAVb1us6hKUh+gw3w7VI6z5GwTy+Wmn0/eYe/lId7/oADAQ+RrCeCwgLKdeGoJyDZSzXbYSbF+mawdbMEH9aQguMPXWOLvDEDOkoP9I+fHDJhylDOHgMpuSRHSYwEAg64dye3Vy5jjg0MBwIC/LqnjrS+ufA55WKPJ4RAC9q4tAlRehFhIy5cEAOV4JtiTCPAE4s+ff0I+0kgDI9i1vS2AZHmI/xdSicEv5DMzAGBg/xHAWoqhzm/uofJ1CgB4kI7IAvjZ5E6263IRfrQ1OQXyAADAZ/7b/2PeEKQAm40vgESKPuJDvRwAyAI6U/EsGgGojUJJ3H5kEI+LDeu4/OeIK12rT51TFYSOA3BFw/NdhvMFrHUIrQNNs1GM5Qw1MRYWmoptVYqD3hvXQZNrEjIajfQpAJiXQI80AvAwABAH7kcATjF6cxMO9IepAZe4yxOQh76/YD8HLz0cAFQK3DM+lQRhIe0oNWlsCvkQm76jGHXc5mMEAANhF4s+0zskB+/KLJ6qMNaNcFFyJ2t0u4Y+++/+Sbd9n6WX2Bj0LokBqLGx48epgnraAe3y5j7WFOAnHQAsRqhIRtERuHmJab7NOReseyY+qHAZP0vRD0UAYnMQTAXGRr8jVPhZ38N8v4bZ+ibc++E34ebf/iXA2z+jtNkZOoF1zVGAWPcMD1UaTGddAIxXALCeXYsA4BKqxTEMzYIAwWZ5Al2DjUIW0CDwhPX5jvBajvxDILCnzFUdtdfCgA1A+gH6rqM0YEwB1uyGM+hxzKp4Ptpr2DlY/uBn9Esdd1UKGzU+YeAPU3rx3367oWYfLfJHt4e9AgDxbctZC9v1GrrdGvodNuUYKMiu7hEIHKAeO+i7c9hvTwH2WwsAggcAjlgCnOBDjp5slwDNCoZqBXV9An29gisvvgo9DNBt70F3fgOG++9BPdyDsTqDulpD392nWoP6x6+BRCVNaq7jN2B05vwawDMvwqf/jz+Dk1/9LNxuWzhvZ9C3mBY8hwGvH6k1CFl/uulPPHJVljjgEYQppC7x+fWyn3wAMMdkUtfFmOwRAIBO0z6tq/2xyDmo/3uHFjE7f8rh86EOZjCyggFTknG5938YAMDS/DhDPgT/jG8WZH9pp8enzcjftHhu00ePW83BihUwHj8UAUBvx+WGPSEAoG8d6RErE8mZgC8NLgMAaisxpZ5L0iVW/7EU4XSoxeCDYgEW7AGA4fMfIwCYDLiyo2Ry5FnxXN0Z+jVkWV/ZncmJr58HALBEw6LwR0AaU3zXjwYAmA2zdwFAXlC7NK7hpdFg1aDDFIHNVGGIAYBGskliDh39lGNojE1lIciTEi0Q+bNwix2ALZniwPfqYTrmi0kJs2Kbx6n+Tp4S2LFQvTh1j0yBYyzVNZb4LvVZMB0NEEzxxFxxbuWMGwkUpKROOPVIC3W3hiTPw+0ymmNQu8/xN/jKIXqVWwM8QhOugnCfUVKBvO6mE7CxWF26zj0FI/Typ1xTxJQdtX91PgIwXuQ4oKbUEC6QvmPp26gnNXhpONr1c7rMJqPaNK/LgepneAScWU6uN+XOPp4CLNa7yHr5/fPexryuRUnA9pJWJY2p+ctIDMPgMYPCrpdjbzggKxv+rhyVlOzHSvrjkfLXykpeOQtsUg8NMc/QwM3xZ0H9T5BdWsckZVihJEN5+wtXeB5kKYJDykRa8cMeH6lZmK2gFC3uYaigOPmyeYbaR4PBNDfsqIv7pv/FPsv4d9dB229hsb8P/bs/gTf/7ssw/vM3AM7PCMJCxwMj7ghYw8YReLBWLaGBqzCMK+oIXM2xpt0RDPUM6hmmAR+pWnRYK3AG9XwOQ8tAIEb9YVOQcYbpvA019sAGINvtzgB3GEm3mCEkZ+kbG4Fg2nKPgN7QQ7tAENKlLgQO8ZdAv6rmJiDjAP12ByuMXOz20O92AD1GAHJXZEwHxoi/cbeDk6MVpQHvNmcw7M9g7LFhCAB0A3SbDbRNBdjMGFN/N/fvQVtjoEwHI6UCc+1CGtSIHX9n3Em5aqChdGiOAKyaYxjqOcxPrkA3bKHf3IVheweqzW1oqnMYYQNVtYW+O80AgBXUaP9VlIQMYz0HOH4eXvvDP4YXf++P4J2qhv3xkiL/xlo3bmGFjfGbSF7mYDXKh3kAkLuK01PUBsiMD6W7U10W00aN9427uUFNqAxCJJ2/2OtI8hVLwuT1i2M/xl7iz98TiBb8kTqGZT1LDqRhKd+586T749q09CRHduRlUHorMEo0v1GHykf/aXx/StDl3z8dAMwYWJPpkC8s6Q+ZAqxL1uTezp3BlQ4ODmHlvnlPMRsjbQbPJjDgcXoTwxrFnj1wUIqislH0dibsA2e3PQIStypTpkCA3v7pRknyY986Sm15LCIw1wCU6WF6xGFUPEyw8R2rO5ICnOafUgSut/uRpTa6zEh4OQtbZVF/WuKPqBz2STvDkxIADfkrtGV9AFBmZLFt5OsXvZ/+YoSLE9jSLCHU6MuykzSn4K+0FIwvCM82T0Dh/Lz54uFmsoTXFOE4yUhNPqhYgj8rfxj/kOMvAeRBtoiMAIwL+LyD5DsJPplIBW+Xyl4VLj5/p+0EDWB5doNhx3wAaTgaq2xSuFdM4PLIkVcIXlKX0NgpxTYhpGMAoH6QmmXARBGDLDaLkKK08tHgqT5+8rrUiaYQ2vhwnx9n6zwr+EpYGQtqXeRuBwRY4LGSgarMbFc8CyAnb2Clq/fpYfkCJhiPq82N8NNP1hGs6Wl6q6/23+C9ptaQu6b2e/W5MnrdFCF0YGyR6FBUafpNjI5IKq3gqcpTtslI6Xt0yAsGzpQi3cnF9aSLTBnTtS10hKsHTiX5y/lC8ZzzmV1lf73ZpfFS8n3lI5djgnGUTbkMGhiGAKQcuobcTPQcRdBhmx6eZ5zLSaAJupf+DJkY4mu8zgXoXXCa32N52h6SyLfoWEoWyike1k/h9+OT6ROxvuwAp8dDl0/R7ykSnnJvQf5lvzbRi2nTifVmmsdyBquhbrHGuZqivgNhdzI+PkuNwlhUXTn91J/4OujnCsvCsaiULSGdRQX8EQiID6UUFE4HbfsdVGf34Hi3hbMfvQHvfPVvAH72Q2i3p9B1O0rHrbBmTA3Q1Wg8L6Aar0IFR5TeWrUcCQjNAnqKeJtDu1xCNZtzI5DZHAasHYjRgwjsNS30mMo7a6kRSItRgghmjQOl/yLqhuAaViAkWlTpP3LPEKijTrR1bcBXAv/0tu87Bjyp+/FIab4Ifo7YxbfvKL2Z2lioYvf4fUe1AXcw7LcwG3bQKB2Az8BxUfdd/FWRgf1+q4CaHvbdjpgMU6VrwM7GS9hjt+GxhnZ+BIvVVUrVxQYq1Kl42ELXncPYraEet9Ag8Ddi4w8EQjcwDmuoKLJQ6Tm5v0j/I9ZSnEGPoCx2/f3Mb8Av/8mfwv6lV+B8uYK+baEnmsKFxDRufg5KNbtIogtwoG/yTEyy0bCXtpVDujTj1/pukmwIJW5QcytXQ9STdzEemjSMpBBK28opfmX7ROhI59DN2rAaAKyJd+17fGDPOApCVkt706aYhnqiPHf/gPkywjq3+mn5jQcWqR8+QHPvjdfoyymo8ipcdNak/SnNPkOITpaUsg8UTQSpv5oOzJB9/hB/K7oZUXZmpuiqRmGfmHUt2KfB4njX6wwysQRyOCWA2cgNddMhANMUs0QChuE2qeyIhBFk4S/7Jl8+ZUUQZVh7Ka0HE5uWueGNej7p7Y+UJPMXTd4cAXT9yw/ZH6WAsocMPsDqDkfbtnoU/lpwjVBH3ppoW3v4FW6vkKDmv8qW8vxBf211gJRjoyf2NLYvPj/4Y3PWV9u/KSMdA6EuBVC7uic2jcP3Wz5FM3VGQFEN0pQ2DQH4IOOvIL6qBwEA+gFkkhwJo016USEDGoGH/1ERa9IRcZdCpSAUhYYjcgtX+5suABSVqWbZ7IIAIM0tTlxpByunqPlZOmWZhK6KAiQHV99KwxU1zjI1G4tL6lwQn4vSxHitAAAgAElEQVQbXsyrVgL0/PeWrk/bFgx85hx4Yy4kltZ00RNMVK5xpddCGz6HnS/4tYTk+OnJaqxSUEpn2VXADMAZeo0pt7T+5K3IGKDMoH7Epcehhe8vBwCm5YeVI5L4Rc0oExmkYQi1EGLB9Z38b0oZyM9DBezTswsCThl/nhPzACBGS1gDgLffp0dB/CQPxHqZFHI7xxIgFhhEjpzDF3iAm4dP2WIPdm3oETgsxwBTMi/Ku7wPymQJeMbRBhLA9lJ20nrnMOn40K5WzlPm/MnRCYcaMEY+Crkj9VPsve525PWz2SXRKADpmeLHJoDfsejulANs5CaCVir9l8aqAECqIDf0UJ2fw3E/wO69D+Dmt78B51/5S4DzuwCYHjxvoR46zB+GDqPeYAY1IAC45AgzjALEJhc1ppoiAIigIIN91AikncPYzAGwYUiLoGAL0My4qQeWUsC5K6dIoZNQYydd6nKredkafSTrFSCG9+vDmF4VtsZU53GLAKCWOggAYvffHkbs2tt3FPkoAUCsB4iRgJiCDB3WDNxCo2r7oc3CDiM+GNdR9d/A5wE26higw6hCqpU4g6aeQdsuYLvrMHgQ2tkCqhrjKbmeItUNHNYwqo7CFeC9e4BxRzUB8XP8vwZASQo7NaAqqKGhiMuumQFcewF+4U//A8w+9Rm4f3wCPdYWlDKNCI4p1MpN5nJjZxQOnAL7xBF4Wv7LlEZXIh7sMPgAmNeFMldCoCR3rLNWujL3fU7/BavlnSdmamQTcDJAAACyClM/boaBtI/4gli04GFzNTUmD7tt4tUl40vbX3EvrgwAlh3YKRkyEycTXEZvJ4DHL/EhLnUAYFwPTNEXfGRAv9ga+POztrf2r/wIoDL/yvdru+8SKyCUpPZVHPsjvrXhWqqbDpYfmaHz/mQAZrUPjk73xutr+GiTioR/hY+KAYbTV7vMPyUZZ+3N8lvDA06+x/HRiiFd9j06Oi+Hjzhd5AMAMozgc/iZ+5x5EcZyzWL3u+vAYxT2f45ekHsNfbi8GfNbQ+0QnlX7dqCj/xWYmSAv3httr5S3N3FFXoZenh9zo58QIOMBvE8EAOisZLZN/aMAAMtCwt35cMN1lSiKAMSIKhnU4nql3qMUeBgT8gcBgC4UEVKqcoaVopVpTw8bANROdvwYIzQOS4BeIBSmpMhFlejjBQC14SEjVP1hxlj/IgCgVkLW4NKr+BQAdAAtLwJQKyUnDViElD0IADA4oaf0VAtOeahW1IjO6a6DAUAHWPFqgAagCxaZVcibGsQkQN2SnwecXgQAdNOELc8omRcwkZL3o1pjMSezn4IRnQDWpwCgq7r1notPJb35BnFIp08OAGhIUqV8aB1eYQ1A0puYGjzATDUEac43cPrG6/De330Z4O2fAJzdgRY6aCtudjHWDQGAFawAqgWMNUbvzQHqJYyNAgSblrr14rX4PYF+CBQS+Me/7XxJNQW1BkcQkEAqAvQQaGNgTdOujPAm41NH59WNAbWwhqA2+8fNjkBCvRMIAFYIvPUdRQByKjR/j/8OBAz20GM0ZLeHhhqF2Np+dLCo0nz1fQgoQsVRevhu7JQ8b5cE/i2WR3D/7Ax23Z5BNpqrPhzrKb23AgQhMbIQx6bBPwT+8Ht+t/5xAUAsn9jArp7DWK/g6u/8S3j5D/4ENs88D6cIuq5WboTJIwEAfQBBO1A8g4MdhqcAoLv/mrA1hQuF9BQA9Onrww4AKq5Phsl9+AHAwN/xnIRsBNSFQQ0lixRAol/pm1I6AEK+RoOY1sRzffinAOBERNccfOcDpJ4CgG4A3EcPACwwcTZDLmxSdDAAeF00AYkbKBZAS53BmCnEEA3nhMef7MMCAJ0zlgPFZAwAtOljIQCYK+FhowfDQejVdFc1BMhK4J/OAeeTNh11pyMAA4KQEYBBhFzpXe4szMhNuH24vzamiOnooQCAsR1GujNAS5wEzA4kQPiLRgDy2rtqNQqcRELKc1174wCiOMOKhNQ/jQA0rjM39DEWjE1NCQBAz+7kJ+SMabnXruxJAYD8RPXMzCFQyZxAQCZ1DUF34oCXrvMBQPlBJOrKD4g5CACk9/kWrY0AjAJyZp11+q8+fuG1ygOAFvwzEYAiAkin6zk7JCskqFRJQTEyw+xAPfIILn+EEYDG4BcEUTpd5z3I06dOvzV7olIaOXKr9BMe7uVS4OgdBAAyWdK7FQA4agAQr9nuoEWg7PYtWL/+Pfjgm/8A45tvUCQgZu5SRNpYU1prVc25u22D/yIQtYABgUCM9MOmFJju2zAICHgdfYYg4IK+my2PKYKgw0hrBPRwfZuagMOGoiERGOM0EBy3UwNINfnAIWMEoNb1WCNQs16/3hjZhZGPVBdQRQAiAAheCjBFfCPAiZGOCNpRnUCO+iPgD6MAMVKSQEO+lgvt8zsRC2ybOSxmR9C2Szi+cg1u3rkN2+2aQVZif+y+zKAhRf1h9CDWEBx2AMOe0pM57VcDnEgJSgo7ERZYAxC7+x4BPPMx+MS/+fcw/6XPwebkKtzDMc7nLg09MgBQRjm7euMpAOjCCWH0i9aJiQhAIbyN3hbq17Om800US+LFBoxmrixLqfTNofwKriVejr/jwxMBqOynqH+ojBKWWF4EYOY+Y5Np20zaaDricGqEk9Fu8fdPoJP4JWHko28OhaCbfZI9oBafRUpclIeXNjAxoltGZ7lXanuK32CoVZCjH0EX1CiV2+sNFB/zYYwA9Nf7ohGArNOFDIhF+HGXHP6JRgBK+vf894cSAejLIvs3ca/508U3pkYAErmoW0v0r8vLZdwnm7GQYJLcvWbRM5bowfq8yKze+gYAoDdiL4CXmqKJn1KJgeq5/2q7AAeErYjTAj12SVLzcB1EV4AQqXoCLEhI0zXPHEWvVGC0iYXjzqlhlbc1vQ++o8+zl8JPOxD0RbYLarwJghDnSrImjAizmPH5WAZgRTMdABSkHUTY5dcuGCldzmtmWF49gh0X7bTzCj5oADDPT3kDyx+v/6wpAGC4HjblwVKONeEChS/WvxRR47/LQiNutFN4nQWwXekgCTu+kiUBYsGzxP1PdAowrxSxmU53EOO1fK6dksgc6RG+DLJ/u9HCKt1YgRt8a95BzLkXjHEX+JVSHIXc9gBAvwaeMx2RmqlnfmgKcLhiLk/GDWJeEy1aePziM/F3XN/wO3guOsVbfeLNKdaEyovPdLc3L3Ae7bcPAAAsDZhWPUFiDwQAxHRcBXDRduk02IcEAJox69RfFRGIjhDue4Nj6Xto+hFm6zXMbt+C29/9Ftz+6l8D3L0BFeyg6bGOHnfUG3APsK6figDEuoDUjEIDgAT6YaMPBAcxShBThfEXAUH85X60xsiYIUDYQNM21HRkT8BZRX+7acCuZNCRgTO8X/z0HYJszDvc+Xikrr8Y6Ydg37DjRiB0jQb/euxAjNGBPf+aTppYAxDTdHVqDQN/+P0ACAoi+DeD/XaA1eIErj3zPMyPrsG901M4P79HAF/bIpDYwVghyLiFoT+jfzEdmIA/jECktGctF/FfzZEuIeJuDUMLcOU5WH7h9+GTf/QncHrlGTibzaGrKqgRrRXLRNGrFIVoFyhI8bx0CjBGAD44AJAjQOJagFYmUwOwxNtl/i09wcplS8A5feTbw3hi6b9D61oGACkKVm+i92hte6R1ZN7+o9EXUvby+tVYkFMWKnJNeXy6NmfCugrWz/evSscosSgv+a6SvvdOFJ1hxhz4YLedlEJcj0gKbtbEkXsgZIYOSigYsC4ALVP3HavpgvsbT30201HGVnx6yjYlpWhfj13i7U8mtVpflAvAiehY486Zl1ga1fawHY6usaY8HTU0uXIE8CX277LcU0pfd+3HFAfl7W//ruA8O29+5+kGs1RI94qH+GVuvBeG7495e4JCTJMd/sxNCZ4KkNt3hPJF6wAF3wfCmNfXAIACoIrtTywlPSXfuQlS3jzPlx8I7z2shuoFxYLk4Cigb2fskJfAg/Q4tQ7XQDoDgK7/mRtlFgDUJ/hGlihhVHJK7QuV8BA3PHwA8DIc6Rs0ihuV0ygJlv9fAXZBzRoghvJT2+AKoJAk8yCiaVJhovAUGKhqAIYRgFJ8H9Lll8dvhLZLmQ6TSwWloxe0sM4VkY+tUAngkGMKhDV9ELTpNZfF5yKoV4NCvhOhLjE7F10L2/1YjlFeStzhATiHGeXMX3IcPjUpljVgirNGWrdnWOZxAoBlgGtKDT1hjgQRgEI5GQAQ+0PyjzZ4+I/EyjoWsjWWzDMc4fBwAMC0gmQHhyJ/BJAj1UsAAHq08EANHlWzIyUJ9Zo7YJ+K1NKSR0ovaViIHTNgrnUQ+S7NKfLQKQQAXcC07ADlZvOQv3sKAAbh96UIQC1fETCjZFRT007zCe9/CxW02y202OX21g24/Z1vwO3vfhPg5jtQ9wgCYiQdWteYrot16DgF2AKACPyp31EBfZgGTOAgAoAtA4AaLNKE3dQuALjbQYURgSrCL0ix8rsiCn2i10LPUQOACOr1CGKOIzTKtsG0X4r8o46/GJGHjUJ6BmcVAIjrRbUB6bBPRybx91wDcIS2aqHb9zBrlnB0ch1Orj0Pa+wovD2jun5U30+l+Q79mgBA/IzGSJGFFnCUcop9ZVc49YBp1FcAXvoEfPLf/juA1z4Bp6slbJuGoiu1LYVOPoJ/OgU5BQDiO8o1fl2eduUjjk8DgPK6lANVlg8ffQCQVt21qIyuxS7LMb1rNbSMCQ9XM9TH/jWXAwC1ZZfziEraLu+vlABA3wF+5ABgBmAqA4B+kX7FP9JOKBmgbNmEvwcBgBKA8Y3ii+6tGtckANKnAUvz+RRgOe8YneUNfOP/CHvX2mCaJS0PaXtY2mBBl1xvuR4nAKjN9hyHlSIYyxL6Mle4TTr0OC3JlCNIS/ap7bLN4/QDyg6rkRmrGWlpNaQPy5sxADC2P7Eu1qkV1gCg1QbulWwzyGw8T3drFhUfP34A0GWggHaVvH0KANKm2egO3sOywi+zqxCqtPo2/YbVk90S2eE4MCzoMgXeZaMZpIFjRIB4nDunvD5RzzLRgFyzUP5Ih5euLkQQxdaL71NqV69RFAaVAA3XOsiluEZVWCnCKW8/UZfA1I9RgIln5CIAfdDNvsNGYxKpqFpkqTD7WM5+YUoBbfhj8U0WQ0GpLzIvLNlfDzoC0FdoYZdhOYlLAIAVOq0CGHtIAGCocnix7Z65Dk40hSJBwBogTZmoRH4qskm/U/7LEbnuiVGw/t4HJYMjL19LEdESzrauHQGYNBl5PMLrlo8AZIltY5DxHo70MkaDli9I6KZWGn97UflY1jEP6IqPAgBoOtCqNXnIKcD2xJQjq3oFgDUqUpbr6gE0VQWzoYfm7BQW56dQ3XwP3vvmP8Dpt/4R4OwutNi4YtizQV1hjb8ZRfcN2AikXnBXYEwLHhGIwug97Hyr0oApArClRhkyWox0qopSw+g/CrVTP/i3lIX+SbmOAJTyg55HACH/EuCHkXFUw081F8F5U1dgjMBjAJAjATWfWKDPAKYKNOUmJAQLUhdgjOxDfTZiHUDV9Xd19TplSSD4N/Rb2O/OKRJw6LYcATiuVR1A1YmYGphoO8bEAZvu6ZJz+moFcO0X4LU/+BNY/vpvwN2TI9it5rBvamgQfFX2IJXB0M0/vAhA95SnHFHtc24cAJQ2myudS4BTYEd+pCMAtUeq6dymbhqaRTw1ecResvdL3182AtDR5BcQ6uXxFQFAyyqss4KIkpR1wMPNRQBO0vUPCwA8aDUlEGZ9ILYPDpy/mY+gyYPGIi+eFqHnRIAJ61D7WM4T/f2NHkwb60Y0VIlPIuYSyCt9+nADFGSJhsTzMxG2xv+68PqG/CNpVo81RwI/fwCgp4+K/rO7OWGEnvVfNADo3eFEsPv+nB/wchkAkOSZeDnN9IkDAIVMUBGgwQGYmMMjAAD/e15CejV8eFHTwiT43lMQYVtr9/XaUHOfY9nUP6F1TwBjANoh0kWKJG9cyo0kAMt8lS7gaYE1C1IquMElUQOgeQX5zSJLwNF3ggNz0SF4VH4yJ5x8FQ9Qm6TkvdeQG618eTMnMw97sY3+U8YGYM0enudUkItSXFJbWEwTyxVYtQ9NrQHvs1fH0UtR98SpyojQIKBlFn2dL/ByAGCBMR3AW/OLFcdyH/T6B6KZm/jmfjJ7VQL/aPalFygnEq+N7YMLUPkmQwkA9GkHIwrwTTqtSroWbEzg+8xeqXWxkF1koQIDuGTUh2OST5XyUe5pcoucEgQ+xfgn7CqOTvpbeL9Bp8OEIQLtFbdGDbapjEwTKAGAvJ8SInUeb2jRUvlFAEAbTYj0IA19nXasZmpkz0GTPEThXO5a2puMQp7gAJUGUJJBofPiy5j82pmoTP0iVdMy5vyEYw31fSlFhR0ayxfYvxZlMgYa0dPUETn+HyG7WbeH8fQurNZnsP3ZG/DW3/41wE9fB+jPoaVOtR3UKgJwwHRerP9Hab4L+rdGMFCBgAwAaiBQAYAYBagpnkSHAv6oCQimGCON1tA0bgqwXgsL8PEnDgCoYvVY4XKtYEr3xVTgWqf9YprvQHX9MAIPuwBzh18tWzWv8ZphXUIbDV3BbrNncBFTgOkXwcWBmoEMVQ2LoxOYL5b0vm6PACB2/cV1w2hArPe3oeYfFqTU9QVVhVQhj2l+1ESp5rYozQnAJ38LPvdv/y/YvfISvIuA7BGCsDW0GHWpwH+y2YjPwxIkuNySxg/NUCDuE/Zg9BBavOBgAJCiK9Nc+HhTgGPjyvG7b+MSwXpsbenNdttLzb+sa+OWj31laT+mpQAXDKjk13l/RdvPsiSF+yiRQmiSlfyc6gztGKMr3DOpV/M6oLDfImsotgxuBJnez9K++k+SlokLIpc6EAf68wIAYGoF+N0steI/qf3XXpW2Q+zdDzQFODIofy4mw0xdSzvjyDPboCq1vyUbIvt9LADEucEdse9DkF5PviCMH47bDyUrqfR9mkf44M6lQjcCUNBPxBfTPkKKvmTTMDZv7PsM+2eGH2QABV2A3cUl+91xoKytTroyUqNOrk4IACpvQF0Ujsedj/s9L5jv5ZnpxtYzqo9SC5TTzPIe4WN4E3AjuEMPK6AcReA2ApAtcDcFWLy7gLVUz/2X/3Fh+R4MVwAyMuIpDfeURIMmGE5VNe/LAj+hCMuxZwgvxcZkZ+p2aU0pKjVAU39KETENRBo4+u8Y+BcKDfkUPSfLUGI3HCKzixWNGPI5yj8hV0MUJMx7oR4r4qhoSOQfqMFpNUaMz5xoYzT1/0sRfnhH4hpXtMR3mZq2ZAggR4Gs7Ozd9D71Z0oHmagynvTBKb4SIJT0HpuCPJ3TisCsiRaYGP2QUYC6sHvq+XkAL07/UgHktzde24nHopRiACBKqaNm62+w0Yr+3tsmObJ4jlke2q8QAHTXJkZN4jMPEIwOTcpnE6ETJ9K8cSQiCQOtxmvDaW/22fHnpTmkppjnqOQx0sw83VO2ch/1/8Oi7/puHpkPAKZH7msfTYvqX7UP3HFZG1jyHo5sCmfmr1BOetgnpERM/u6cZpr4Xe4EJxsdYDTIxBdFJQR/KMZwaAplkEIkDljK1oGVE6lJuAeO+vAO/+W9N2myKgLQj3BAQKvZbWB+dgbzu7fg3ne/BR/801cBPngLmn4DVb+lA4VhhnKjhgpr0iF02CAAOIe6WkKF3YIxRRhr1hGsyPX/6HpMV60Q3ONIVT44RJ5FINBG/eH3qMvcFGAX4Odo30iajiDCtsWoQ1S+XLuPunaorr7cHESlNqvaiAyIWqeaGoBQk+KKOvBWUBNo2G03MHY7mM+wOUqvSnmN0PcDzOcLmM9xLSrYbs8pUhDTgKHfqvXrYai5MQhxK0ZeKkejxwYq+BbluAwImLZLGGZLGK6+CB//1/8R6k/8ItxbtnA+qwCWGH0JMBtRctXGTiE7gCIBvSLZB9b8KzKL4QUtc1z/vwQ4Oc838jTPCRc5xCXOoZ4zJQmVf7fvUPrrk7JirfKIaEgjt4StHF34uP1R1tfFXZx8Ae+nnYNfUkIJyOTzfIAlvNAtSaHMaKUrkXXdGmK+A+zTm7Pawk6S750O/pWWyc/QSkpp9YUenf9v+j2WOiXYZunGj/DynxT6+1Noyj6lzD0Z/iH+Tj3Buy9pxJe0ZGGEEeEh73D0Jy2rfZ8OkJBr6r7N8Yaim5htApI5gNXLYfgtgQloPa/H5fCDAUfSexCrSVeieoeXrMcbv03k5Bqqd7bU3d9QWnoIj7efvv1zWQDQnYSbgcO2kzw4tFfrWfjj9wNiyJxUZp32CIKFEw8bVcMzaQnKd0hAkT4Xy2k4PcVCxQAj20gyvrnaXjPU56t30SNBaQoPYA3CRZwcbtVC5gADICg5VgQAc9TuLZDcOBcAPIRlXHGiDTaSPWodp0UHaJLIC0A+ZSsJUXvsYVJYzS2x52vS8hWga0y7qyKjY3JKSCs3np8DAEYdPhsFxz6xI97D45GEQawFrgH+1HB9hyToGipUu2Z2zYg8nEyEH00xV2Mxfbam17Zs4KZpk8YnSEPToLGb1K0+9ci/pUMcE3b+230AMMvbfnSWTssWvIIRoDkAEMu3504o0YnKx2u6tOoboCrwIoiq02uUiiLUn4f7Z++M1+XTm8LjCg0SeULsqzMktzy9xddCvEWCIYL2pe6RypBr9MVpMAo2e5e69GENXw5955pWE6RbdAAI1vldpfhCt7SBfL7uQm6u09frtfAAUvviMPpPfqfUY2SccjWt3NVNXRgA9H/wE05x5AYHF/1R5k5CxUzh94u+efp9Ul8E0qbA26W3hBGdU2q2mqdSiqorf4w+KHlWpaGp74V96Jyz68gA7cBrQzmUv1gnr4f5dgOLs3swvPVTuPWdb8D9738b4NZ70PQ7qMYd9IjjIWDX46QaAwBWsIBKNQLhyMAZQooqOg0BqpruY8BPNQYxMDjqd478M5kRXgpYKqPCoXlhp82w/qACADkSElN3GXgz5QIwJbjHJiDcmZhT8JmOsAmIDlJE22M2m8Owx47BCOjtYcTfqoeBu6QQwIgyZD5bwmw+p27AmDI8YOOPYUdp1AhG9tgZWHUTRgCwVZERDADWFKGJEYX9bAkjNlhZncDzv/NH8NyX/hXcWZ7AegbQzRoYVKo01nCkIaP8Mwdx0l5SEqpwQDiRzLzL7IGu73RcBAAspTFebIyHAIBpDwm3KWWjlOWfd/CdBP4yHlr2ePeiKzP1PozAc68N5V9O/upu5NPeJ30gc0cBQDgUAIyBfwf4l+5EfEO5OE0p9FMKwLfopAoT9o8ue1CwfgJ+9O2TnB6akMmUW4Lpdpn2G4sLeNgFZnB2kq68cg+Y8DsfUHIO/7SNp/7l+eXTsP0INWcC4vA2sFzU4ukD7rSEUKUl9Jgkw2r/KSNefPvksAWeAIAXAUBPvjh/6oaT4kOHftX+CfwprAGI96aJPO078jt9/8M0FBN8J3kgiDdKRDXa5+axkFINSsnfEnfQK3bY/GLiLV1jkODQApP7JR5Cee3qD5dfngKABX7MEY8yAAsAYCyiwYPQImOw73VPeHwFJW8Vzqs+NfCJx0hn+4V7ou0SC4/z4QCA5OeQA+e4/6lgPZ6RFwFIoyucwKPxn/spKdGHAQCyWlM4iDe4YMvE/MoGsWsQRg0++b4PCwAodYxeIOOUMt27VKRvUCnjZs76qjSIZy+dCgBabsanlwFAf8PTMialVsUSqCYdcQr/8AOAoXER1hyy1ol7euhzUorT5WpOAQCtDKYukyYiOyVlch7Akw8AllOgLoO0XR4A5BNaqc/ciNXDDG7/6go4ZUprQqXztfNAXeTcCBpu7KGMWxxZjemwPcwQBNycw8n6Hpy9/gN4/xtfh+3rPwA4vw8N1rOretJlNaFNDfQYqYZpwJT+i6nB6peaf2BzEG5SYWBvAv8wQg3v4//reHmt42UXYH1w6RuMGrA3KyosXI74Yn1KZispJE7ZNSm4uiYjrgPWA8RmISJrAbsDU4qvugcblOD3LYKIQwcdpvgimEcA4AD1gHUH8ZqWIgE7BAgxApDqJ+6odiA2esCSItyJGbH5QUX8ITDKgCnaAQM29jg6AXjmOpz8+ufhpc9/AXbXX4XzdgFDW0OPHaTR3sGGKZT1XNFzCQTUtpDXhfDQmsTT6VFnPLin5E8BwJBH7Scx+zhn4ZXt++n7dZErHz8ASAeIyiCNSnLf4xfT5PvcNfRtDum8X2SFDjt9LO2nnqFrs1n8wqefUomYSA1IuR7FCKA8gFu03ycvqJrXZVR17F1qc/0utA4/ehFJUwBA91UPBwDU7ygdOHJKqoii/XkGAEm1uvLUZBwkaPEwgEyvdUiv2gq7KAAY1wJhDUr/+R8+ANDdCG7gaGcfAISmDNA0YRJEAD5fSgEWz40pg8Bx11FISli5YcI5ZR6bgD2xlcL0gUcAFmqs5JY2LuT9lF7hUjinnPLJSvkZBZRShi5BBACXF7KmMGL7ogcUAZgGAHHc7j4btS3Qfj3McoTS4wUATRkPD/Rz6DFDIBeJAJSP+0hEAOKELM7D00sAgJpydA1NjkBUFi7dJwGczMIrPnJtJn1iJnnIPaUr06PHsxc+HuclKTmEWYkpIj71GhlnXUcAUlOFi1mOEjDw1BI7DsH7eX9SlTF8hyNW/FqCDSxHcmN399EWGNDAlC4dIYlPGycaeuEop/hP2SHhtM3E3RMiBKap7Ytdxfo6tx+8ThejDsnE9gmlAx13JiOltMoIp8sc2BjBIl4SiwB0jEQBELKYQXpQ3ETLg+AYwko9LIY9HG/Oob1zE+5977vw7te+AvDOWwD7DVQDAmU9NEQyNVCqKoJ8GA3o1P6bmb/rpjVNeBiKxmhAFQWo0lVlDVSdAmzhLFw/NWsDbHEqsTX0LG0TFsAX+KwAACAASURBVKaIdUC60I2QHJmKoXYMwGEkHnRbqEwjipFqBSII2Pfc9ANBPgTx8K0NAn/dlj4bKm7mgV2GG9UERTfjYBCxgwE6GgPX4VP1DqkwtgoeVM1VaB0ROG1mUP3qZ+HTv/t7MHvlFdgeX4GzegV7jAhUCf0oT2n+qpmKjgDkVQgjAEslQi7GeVplqfqpQryU5L3zPpUC/NGNAIytrgRxpqz+xaXXlKfnr3kyAEBjFkWXk5saKWntXRHWyC7atQ9luTWD+AdKsZd5gKWZmLEcnTJLpfwHlx+F3ybAv5x1EF9XpT+0GHBW3X9aSf/qzTvUd55A3WSfhId4+k4bFW6f5dZoS99r7jC6JT6ei0YAmjGKDA+fWvjvDw8AGNBSxH4M/RmZpubjDl4E4CMCAG3JEHfPiXM9MmafIBBL8kg4WqiH10pkLahHTAEALX0r7yLD4DmuK9nX0yMA7fxJHhmHIixRFAKAeQ/J57owBfjP3SYgMQPcOuWuYPMfzguizpKNzyUFdvlExh2gvVcrJl302IwpG2NZcuA09QkjueAsOxF3E06IQuQDT8b992rwDz+3J/9lES4dYL7aERB0Cp5L4dRNEQQBZpxZGrWa86AEb2icuiwjFTADCvwCHw/StOPrSqwxlP2J1SzUNzwAB9xfDsfMUF/mhEQJAPTvpZRdNf6SyvcBFb03EiCPCV2x27kKuYrZ8zzk05cr0LHYfHr3tFMmo2TdE2iZgiodA9epDd8g+clXLq6DQe/2NpmergeSPQKbYABliLdkS0t5mnoMpeCbB9lOtiYFWNUWS92fA2zSEatq3gkAMFaZ0L7fgnO0S4beYwZ8ING8aXAKo5V8mlbtvrgpwGrvlVFKkEvUAtGvKe1vAVyl1+W5uHSCXdYB8SusPPXSRByZGPJJiSbjvHbRUXIk2iUQSJ+5bWh2dEhcNN+8UEQGmMvFfuHYMC1VR1G2QweL3QaW56dQ37oB977/Pbjxtb8HuHWDgDJMZ22Mw8ORgBzBzvUBdQ1A7AoMNYJWuiZdRY1EMB3YdK32IgDxeym39T7p2oFkN1QNzOYL2Oz2MHQ9VG3LzUP0jSraEdcAI/QI3MRQORWHSCnAqvmHBgBxTtQZWM2LrqkANutzaBcNDDU28thB1e2pu3A1IqjX8+/Y0+MJAMQoSFMPicFHAgopBRmBRZ57hc07qhbqdgZ73IvlCuDoGODlV+Fjn/01eOlzn4fT2QzO2xa2zYzAvxE7KjvF3ivAyEQ+A8KChRqkD/n5UQOAB3GKAgAzNTy8mpAHPf2AGoBpDyl7uDSBtUNANLRpD5lVSZ4eBMAWX3y4f+E/ckpWiDBnnTJIpB0z6gVHxxHOQvsGJTg8nhA2bfhoh8mKq0NmVCkHzonA9/VRbH3dz7QTzoMJbYgSAOgqH7tScu65M97DIqT0GPXTeS55EzPPD+X1zWzTBADQr1JYTJl2Xsf6s1yoKTXGcgqt4zfKABO11DarJPIOlUGVs3n8DIVJRG8uKo/fnOCpe0xEr2D6vE3mc6m8OgQA5fi15i+lAMsn+jUb/RRgE7EWIeq8LxpfWV0KKibmpgCA8qmxdcwBhqW91rIn16U+K/5oA7wmOsGBfFrAs3wPm/D485RPCCMA/7MLAKYcQhprAfCSDisTRszByAu0Rw0Aql5zlmUzKanaYfWZKEcoTglfJ/ovxrihA1siQr9InaMeHwsA6K6OIwITRacl3fjEW42PFwBMrb/mB2l2xK6dAgBKrClecy0+CsYu7I4/MQCgGS42oUhTMHNACKK4AktGALoGaFqh5AxzLX90AdeYiSiM4uwJZgkgKnIvX1BYoxyEhPCE/tFpgfSviQBEECL988ABQPXuOAhoYAsVeWa7gtt1sPtTXBxVw8xe58nPSISkG0GKACCp0cQClfb3yQYAWa7wesbxbOWA6NlPcNgnUvTkyy4RQBt5R2y/XOaSGTC8PK6D7EQ4qPVDoxdTSbExxWy/hVW3h8X6FOqbH8Bbf/83cP797wDcuQkw7KDF7roIfKmDK6qRhgzuNQGp6xmM2KhCAX01RripKECOBMRmGvYggjvZWl3IdhLXCNRNRQhwrFvoeoxixAEjmGaXyabfWwCOUnBhICBcA4BolCIAiIAe9ttFAFCnCc/nGLVYwXp9Bh3W8etPqZsvRfthyi8C8lQDEP/FZ3AjLWyEYg83KRRRpSHr6D98E0dM0tgR9Lt+HZ75pV+E41deg2uvfQKGk2uwXixh3bawr2vocI2oniKmXitrU9dLxAmJ+qfGHvUI7ikAmHcvS4c5TwHAy6zfxWsATjqfRNZ3aoz5EX9x8M9qjZiIPQygzQNUsWfJ9bSHhUKKOQaTBQAdyM4paSBnETrHcVvRQInqhoyFkNV17n0egKoBOPEEo7KNXZiz3qYArJnhfcgBQOk36uUygLopN5Wh1ycUAMzRq7ObRXvtww0AGv8w4SAdCgD6nGC8EcFiEuCcItlzGTbFCEAiTWF/FvfTnQHN3wMAHflhHUPj4TwFAMUaauUhEVw/AjLoGjfZtXHPozhVRnhasbhXpxZaAfiKuz8cfatV5IcAAPSFuNF7Zqm8rn0BF2dqRh3IUAdsLbvVBeOA5lKoASifk065jI/sIgCgC/i4RX6jbwlOjD0hVIgwLQVwCmqlBwewuEYQI0DcFAAwNJ+0Eaa/ecwAYOlQpaCFXIUViwB8kgBAyd3sjBAAYrfCSd9hSsstQCEC0AEA5b6zUYhPzpcg/WgAgKkUQg0ImRW+kLzMOyglmXrR9PSkRHQAHgE4qxvyBl4oD40jiGsz9DAbBmi7HaUDr87vweaN78Hb//BV2H//uwC7c6iaERrqYsv0hYAizbHCZhat6QKMXYERENNNlhoCCIkiOWoQmxGRyWA7//q2CQJ/7fzIPBPBv0GlymK6LDnfGBhIy8BWwdh1aiVwZh01MMHafbIBCEXGqkhAOtHHmn+YDgwjIAB4/fp1WCzncPPWe3DnztsA/Zo792I6L6YFY5MPijBUGR/E59h8RDc/4THhVnWk9FS6NKbyXnkGqpdfgec+9Um49vFPQPv889DNj6Cvl7AeaujaGQztDKgEiZAOhoZVxJ+0tKwIeRoBKPlGZmSk+TQH+JQPQIpOVNiG9RIRQ1z3MfdzqYip4MFx8Mi9LA+YPcwIQLKnnBqBIQDIOiAMnE6OupDS6S/R4QCgQ6EqpUyus7vmPgDINrGv64UlEairOA1Pte9zFop8Bo/Ay4BTY/EptsQzcoUuRc8fYgAw6jdq31f6wLkazx8CALBkAecTKJ58AFDvY0pmjxn/80EBgEl+KtjDMfzInUehCciTAAA+50UA1pGcPWMEC9DDKA1v50yUoDHQXA83XnTdirxQgSsFpR+jPDYjADJFbn1wIVBOintyACBbzzyG0J3I2hqydKNT5ygdHeMkzKqIgPw7AuXhA4C4nykfjbrjuTuZq2fF0VpWjdH/VaRRbJSyVpEeQ+DERAAQQQ1Bi7lgvlTjLL5GpfD8/Mrqb+MPtwoo7wDLmnKm7qF6tOEr9YpDAUCiSSUgpUL0U4Adk8qrARlrc59bf3/NcinmVI2JojACWE88Jm/uGHmQAADTCtDGntq3yxNYOaaICWZCsUsARznJJAliKd7JvqEEEHpFYu1o+KmcImh/DuefVI0ay9326dptiKUK6VGoESi6ZXmgR+VoGvXYkkPHkUY2EtY+z1bQ0Ja2GJ+CW8IKAjFacDjI/ME8lxmfUvA5OVNyWKfJKPcq1zi20X8B7xoHIE0f5feX+KOkIw9xd7xnBbf6AE+osUsOqS8PFRexnMV0ja6jrsDt2MFRt4Gj+zfh7a9/BW5/6xsAH7xLYFgzdNBS9wlMgeqZ0gwAyBF7OuLPRgByJBunCnOtOp2u7Hd+I41NcqGB+fwEBkBADNNxFwCLI6iOrnKn3L6H2dGSI0BHLi2xXCz4b3pTD9v7t6DfnEK/OSMQD4E+TuNRUKRKC8bPcW36oYOTk2N4+ZWXYb6o4MaNN+Hurfeh25zBSPUCGQDEKEDTaIQqTWEzjxZG3RG5YZATlguAZ6/D1ZdegsWzz8Pzn/pFOPrYy3BaVbBpZ3AGDWwGjH5cQjNbUh1ATutnXqaai0rCscOt5JIvUgzpONpNlCAoU3r8igz9l7pMkvzIvVdpzowhI2tcJseXsY9sCYbY3VpeZmZeqi9bcqKiAKDd00N3pSRPLwWYBIMpeQRSn4UzMdsyVYQKW2BqBKCeLwONLgDoN+Qyw/Aj5x36idFEmohj9mWorTIOiskii6+11nVaBjCrqDFSbIAYr0eLxj6IDF/L/VLWW4k+YymSOZZPW5MJP4QOaEqjSH0f1igNRZK73yH/hHUk7dumpAAX7LuEgHRtHCVG+bzLNJukcWRyMPnN6RqMbL49vBRmshD8phzFlHl3L0urV+a/dJqyUK3mpX7TT9/3LqUAS3/N38MolU4CAO2doao8jDliNfayGroAMgRd4v3hePx7iDXMEYDuoYLZMz0uXD+hN4IIwOs+AOgpdBkBxwYWL4fePPlAo+7kC6N2hZt2k7OCJJHg/zWgYsbh1bgI2cNd0sBeCQAsd4dsjR1+cmmD4nYnP1OmZMWJSjqvDLSViqpLJqW7PSVXNIg8YCV/Pb6BHRRLC/kuT3p8qXWLCnK9OBMiUkr2p2/g+jUMdE3J2H7o01GtIgJzzjB/XMhIftC040eU+u8NahJ4FOevo9/1MeDRIs2GY3dcJE/C04myuoVki+iq6M/F8qv/DkvnOpXNShV1rXyJVT9O0ZskL5rXucIvtJRi+4aAuTYNQp73+SOnXnR0ky/tHAOJCuynVUxZfckrwjfJb7M8qIbgRqyWHBwW9NaEip+8R+I6jQ4J6Ucw/QT+R4BFqH9xYGBnq6SvWGc2an2wtHzEoxWbu5K5A4iSvsgCiBOOgKK0JXW0WhxNB3I8JdmcM3we1HeBwVUS6OLFWnfE919/6hn4gTyTkfkcsef86FA1UuADNcjgXrMDLPsdHK1PYXz7TbjzrW/CrX/6GtTdKYznp1ANNcwwVXXYQY1gF3azHRoYsKQFjqGdQds0VKNPShms4dcPGHE3wNBjKrE65DEHn6x/CTwba1gsjqAfG9hBC6vnX4VXP/dF2C+uQLU4hqqdwdhjZF4FbdNyvKFKeR9qjPLrYdzcg1tv/gje/cG3oe130DQtLJcr2O73cHrrBswbgP36DOaLOXR9B3WDB24jNG0D166ewJXjJey35/De2z+D/eYUGowqHPaUFozdfblZGDsZQ7WA6upLcPW1T1Fk33ByAs/8wqswu3oC82vHsMXU4hGgQ5CvWVA0I9VNHFVUpJ63gPxqMng0HKjlveXsfFMZJedTDFwkci2gElK6BADGPCzvnfkamXF5JPUL65aUFplwfz7EpLhCRtCnrow6vIGlNe09j+WqvITnshyJgUXk9IOeggUAGewxh9DKsfb9Fd/fks6jQ1dO2H5RywktZBcD7+LxpRdI1wBLrUvc4We+tN/x8/1R2rnm358DAUv+lX2xsjkyBh1bxe4FrI9ydlj+hDgGeOfse0dcmD/smGIR9NpPCveoBACW5E8Q/+G8gvdP0JMXAejapmnOytvFef82x6+4LiU8rwwAlngr7V3EAo3C/StkuWTIK7SfpSWT0oneihWmx12L4xcloUvH2PXkTeTETKp/fz+spxqjbi9yOuKvSP6T6elaHpXoI4fuk/zUKcDm3ZHgCwUC0jt9fO/6f/4fzk4FF3g3SGHIAIDnDHlRgjHBy4wZc0kSi6wVJe2GG/HlF7l1nxBunx/xFrxRAGLmJL4I+0nCD0dgTbCcsuP7OFrAnlvlupKa2amlpL8PAgBD4TYVAKSxknAozylKA8IkyArRgkWU30/ZRIIf5AOA2RxAL0Q8mGlEQfrDpXsEi5Rq/MUBQEdlO6/I8V/G1oiuamBmGA9bTMCPuM3kUJLoFnWYYpzhAkB6hYUQ80+ADkxBKZCPPS2mC3GeLgDoq55DAcCceiZ61E0GygNNXDGN/yQPRo1+9XTnwCFz+sbPi53+qvEE+5SQ95ds4uOuX05dRzkzsv85i+SQ50+s75SbP8nzgoM0ATDz5YCZ4QSA9cJkOfHGywCARq+aCYXGrOPQ2OIYZnT+Cb/fFVLzLxlbmM5rIgJGmA0dLDdnsLh3B7rXfwRvfvVvob79HvSn92HsKsAuvwPWx6NU3BZq7GJbNdDOZrBaHcFyMYfVcgZ930G33xPAdr7e0DvI8cPDTR2JjCnBIkKQ0mYppRd76TbQwxyaFz4Ov/7H/w5O2xPY1UvsSQxtXWG8IcwVAEjzgBH6Gjv0drAct3Djje/CO9/5OsDmDOazBSxWR3DyzDNwvFrA7XffgtM7t2CzWVO33m63NZq7Ujx+/doJLFqUBXs4vXMD9ttT2K2xNmBPQCHSHzYN66sFPPfZL8KnfucPofrYK7A5XsG6rWFTD7BvBthBD1RNsG6hqefUOKRG8E/WMZMHTlhjUHe5NpkJrn1ItROTtFhK8Z9AxDl9NBkATGtqo4JTGrsEXmb15YT5P3B9KyZCoi019+l6Lb9LZQd6wi5f+BLfHpcP8m3DC78kc6OOItZyhO1L1ttyZfQuaP9O012BMovHy+HQ5BO5ZEnu5zAAUNse/EQDdiYtJ3t4kBoDydyEjiX7doL+1YPRYHDewhCAcaUPpFJ2R5l/8xFNrsWvdaW1D8P1CZ7nYnDeMk4BADOrUch+If2v5JPkM/3/oMTJgQzG1BTLZpn4IIeZ4vf46xmLsExHCJRkpMsPtF6e/8ZyIL4HZfnEFklJwk5crehlDADGf8rWeGR9PADQV5/O+k+wjx39HAMAnRqsqueamU6lIvh4BYOZFnQv2XIqAM6NfJbzdmWEH1BWPQUAPeK6BADIqpV/SDkE6rGk7NS9DwAANMovCcDwKP36UE8BQEEPH0EA0BcAjnOlpi4BgoCKHxgAyNxiAcAUcKS4ypHUl1DKgS7xhOVTANCu0AMFAFNa/HI1PJ8CgGXz6ykAqGkvopGzKT7uCb4E/yj9FAGu7Tlc7zuYv/s+/OivvwznP34d4HwNFSxgNl/CbrOhyMHlagFXTo7hyskKlss5gX5n9+/AnQ/egaHfwX6/o88IsEKWqFUaMHAnYZ2JoFOEGQAcoakr6CgqfwnwwqfgC3/2n+B+cw029Qr6agZtXVMP3nk9M4eDeAiGAGANO7hS7eDmG9+Ft/+ZAUAc89m9+5Sa++wLL8Bq3sJqMYfdeg13btyAzf37MOz2MO731MW3rweAfkuW7dGihRl+tl9D362h25xD2yFoOgImBnfNCuDlX4Rf+eN/DePLr0B37Srsmgq29QBD28G+6qGjJiIVzJo5YAMwHH0aI+Au3rrUBB8r2xTgxJGDEERlB7rovDwFAItLlLzgoQOAwZGmNxQDe118DoU7LwsATsJ3M2OYAgAeDv5Jd7Wsf9LD4/qiuZ8nAQDUpY9i46QMoinUY+qh5rPI/AAA7qKr9FaIEBQB2HJKo92/JwoA9MC/tCxn+91wuogC1Ot2UQp9CgDmIzB1Fs1F13cK23yYAUAN0DnWp+BhBF7Z/7Yr6LD4kwwAasVUjgD0BIwKiX+yIwAFiEc1tC5G4mWEOmQBjbprWOKiEYCPBAAUJzAlZk6tYEl5lla+dADnR9wdFAEYiXByGVQbQulZ+Kcocjyxu7QStusZUpFck0MjAHMAoILanK0M6sQEKcDpHSLRlgWgZQqxTB+NmloevF6inBJF6u+951DXaZ5TjH+fyAhAky7tz9ndG2kkEeWqD+QKpGqwxneEHWj3Lf4+5nkjW+LASS+OjWCkiF57iFFOKVE5yyLyzweAcxLnMImec/6MUZBxIHgkhUOjkgDMe1eR098HxVfT+O9hRwC6Mi0EfPI1fvIAIHbJHddn8Fxdw9Wzc3jnH/4R3v3a1wC6EZZHz8LR0VVYtXNY378H9biBk1ULt2+8Daend6DfnAMQeLahTrvmh3piNJQePNYN1c0bqsYDAFX9PABoWgQAsXPuAuCFT8Jn/7d/D+vFs7BfXgVoFwAdPqGiCEBKSeoH6LGWH0YAwg5W/Tnc/ukP4MYPvwntfgPPPfc8jHUF690OztZrGsfRcgnzuoaTxQKWTQu7s3PYrc+h6/ew3p/DrttSw2GM+ttiGnA10O+420Cz3cPQ9bDpe9hXS4BXfhk+/S//FexeeAHqF56HbVPBvukJAOyrPXSYOlwBzNR44wCg5lHbxZtLeTB/Go4uGQ+U31i8KE/IHwoAMDOF0vwfZgSgiGCIW8JTZEjyeEPdXNpf//4HK/8uAwDSSApRUCUdg/pRRurz9Tpy33U8TXZX8p1ybdKQzJRds/JOlvCIUUFe57K9rMYSGs8yQzQyrGkRgCnITmfATaKYCwGAtgFUfAxle+SQiCa9fFa6Pr4IQCctUyhxHyCVpVxs5F/Ogp9OnU8OAFgw4pJfK00oRODTCED3wOFhRgDisjsZqhqcNvuVjwBk+S/9E3ej5fOdCEAZteoFcQQRgM/++f/rYhoZh8JEtGaKCkqFxapHmuAKSlMd5ng6roKWNVskeOIAY55Ol0LBT+EJuvhmZWYoynn5S0ZEnAPL4jmdQi2Vf0rB4PPlepEAVIVQZYZ11gUvNBt2AQFUSNbIpt2jFFD9Bl20Wq3HoSG0/jJOuN+/JV/zx73aB+fCXSzXR4jVWZDP8d/hA4C0vpK8gs3yQrS9733K9HnGn1MJcDFd4/SNmRDxkirFsZQBQDUDI+giPEgkJrmJr7kYVxZGbd7Dsss/333SAECdAqFnZWVhKH1CAy90MCantKgU4HhlHSsPeFxpCZSnR19/hHtHXVadj3NUoR0FrVQ5gsiOrySxS99745sgvyI+i33IpBSYEhdmvtddmJ1L0gZH7EkPtqh+eS4B/znbrfYnC2p4cgQjUESImW8/OKezCDZjhJqCmLBT7qquYLbewuLeGXzwne/B3R/+CKqugl/8tS/A6b0NDHdP4f77b0O9uwent9+GcXMbgBJdsfZnD1WFUX8Abcspr0NfQV3PYIbgXTODXVXDUDfQtJg+XMNiecQRgTolGA8oESBsVrCfX4UXPvtFqJ97BYbjK1DPFjDudtCgTYByXNkHyDF7bNbR72A+buD0nTfg3W99BdpuDcvFjKIK6xk2KsEU4hb22x0M2D2472BGn2GEXq3qAWK3XzSquS7ien2fIxp3G4D9DmCzhW7XwWbfQw9LaF77NXju174A/Usfg+3JEVx79UXYtQgObmFo9lC1/CxMf8b4vwp/DYPrzcboSOumWlVlJba2n8oZDZcAATH9OBdBavgrJZOsHEpRPh1YJkXaJcauXujW4PVGkdHJZU6ddgXxm68epip2U0pIP+BA+Rwd4mHyLzdLQ60J9Rc7gBNml3m09AXk+3B7AnstKqR1/T+lT0kWWLvSsRmVzpErah/p63Vdw2/aXseucpp0BBdMSTCUixu3BBzz2slgKdd3y0UgXg4AjBO9b79le1xGj6jdRSwDgHYcoX2YB0jJLBcBAeH+TsjUiWSZ+GXGtIVG3O2IQ+ZVOW7/mvz65emWnz5hDqnHXCAFOP6onP7I7Lc+CkvczrSWbuKSk098p1j/xBpc1j584BGABVHlN00JAWf3AY5+puUQfC0AP/McPwXb42FfKvAWxRUIy3+0u/QlpjtD4NMYee6V7KqmAoA+U6YeqJmV/3UVMtMh1rWRBdhd6ny8AGBUhE0L8dYGlW9D+Y/09jKIyFJYh1T6CfuBK5YJwPZRAYASEGUAyxoGetxqq4sgjXN9ZK2m2oL61gcOAOaOYI33ntoh5SqKSQQAYClCzkfw5RrFag4kIrv0baWmMmER1LyTUYJbJgGAjqPhrqX15SPG/QSA5TDTVM+V3+W5k/SoJx4AJBEbd4RCA+9yAGA8RtJzoAoRJFl+VfPIus/FJngRlSro7XEAgM58MjSccvw8EXBxJDwAKPTepeVZIKLLVYwPY8HC1QcBgBEA1Y1oZgBHgvxhx127W2jMSgAQvyHYbruHxfkObn7vdbj3+k/h+pXn4eiFT8D53XOYnZ7BvTffgM27r8PJMUDd3YOhW8O+26kGIQMdktQVAm9zqKsF1PUcmhq75tbQHh3BWNdQNQ3VFGzahagTXMF+v4ej4ytw7dqL8Nbtc2he+jRc+9RnoFudAMzmUA89NFRLEOE0tgsxrQxTbcd+C7NhA3d+9gO4+Y2/hqo/h3G/pug9rO+HvIl4Z7/vqDswAn/kklOUIgKV2KRMH/Jgx3e0DLBbcA99vwfoOmj7EbATyL4H2AwLOPr45+H6Z34TNtefhbPlAq5/8mUYlxXs6y30zR5GBAARUEQAsELwT0YYW10UA/ZiEYBPAcA8Q2Wbkj0CADDIyJggLVx9wP4E/8T0nq89SrLN018TxpO7JAUClpxr6W8ZlR570SSEwwJ+xE9ar6qlMGOR4J8eeKCf3PW5rIOfBwBDHzJYAl0DNLI21jG2X/pdTIsR9hmQ7fIAoEu3xp0w78SAi0nUlbwo1tRArEZwOGvHwKiCCumIPv9hA4BEaYJ9yd918DhLi5rztSuq/zXrd6gjaY75ngQAcLoQitJ3xoDWXk7qDTnyewoAqp4CQlYaAFBG+ykbhtWpjECM+2l6LyyqEt8d5j9lv5r36a7Vrmx5CgBqEyG/5sFKH2IOGGWf4SafF7WBKg0CPxT/iQYATQQhj/IpAOhuvq/EDgUAOcXSpRofQHDeKJzeGN0cCgCqhJG0BioAGEUAUHuliWYyTnpnBE5OdyCbrjTtlU8BwEMiALXD5dBZAPiFElTSb7FLZyGai0CZ5DFDTIXKFOVHHwHoH+YF+kARoz/y1DJkD1BKLPARBwCja+bI0zCCy3GAEO4SxG07ViqaxrSuqoJmP8DRdoSb3/0xnP3wxKcnzgAAIABJREFUTXj+mZehufYy7Nc7qG68C7v3fgrrD96AZ1cD7E7fh7Fbw67bw37AiDekRwTTsPHFDJpmATBifb8Ghn6AxWqOp3z0PYKAGBc3UCMMHOkAw34Dm/UO5vOrcO90hPkvfQE+8dt/CLujq9A1LcwarACoHSeOAkQAcI8A4LCFtjuD3Qc/gbe+/pcAd98FWN8BGHcA1Mm3p2A8fhfO1VbZQ8fSrK9qzIbDotKE2NhoHMhZmw0N1GNDnYo31RGcfPw34Nlf/k1YX38OzpdzWL5wDY5euAL7dg9d00Hf9pzSPzL4h/LB8gimzCiox+9mh12R1aGzr3PTbKCMwayMyTDRRyICMJMC8pABQNonkt/TfuL2tdQvfjSLf0fJpdIW7NQRHThuH3DL3O77ANPeFF7FEVpM5xr8izXvcoKVIpip/ejBAoClDBrF7cl8Dz8Dwl8BV577EYsyECW+wg8yAtCNVuN15HWVh+wGyqLPy/huHtk6FADU0p45Ie/9PnQAUADSelUkACjBY/pe+yKOzhYQ74EgIM/+cQOAE06IBekeCgDm/LuSFHwKACYAwAD8U9kXhP9xxJ6Wazn7vaStLACogRctz/AQVSob8cYwAtDvAhw3CA6JANRq1IYmWIiU/+ef2lkKplNnSdBaCKhH6AUziKZnvIU1hdz5FEsmeUKiBABGHbgE58QMGFlE1lX6SvwWBoz7KZ1KEpBy/bIxeHiUz8Z96keeELPB5oblc1M+9375V64Hn1EyKcF8gQivwwCMUgmguMnprlV67fgb4ShRxKalR/yeaxclV99DVKcH+6RGVVqfMAVOmgThOHVns+gMVJfwnCKxyxHhNFXg3RqBoXn3cABAnjMbHe7oD40AVNIuscG6S1qS/UoV4MImPkajGNPSebgPQPm0J+dXMgBodYIadr7ask8JuAnFT7YEQSnFTdfIyQgQV5soUtK0pgFAuURRiS4uiLwrs1DB07xrU28LVjExRe4an6aftGxnxcryyOpn9/oyBVw2AiQ38th3fkmKUHZamkkDgPbJsRROs5yo6wgBVFaLk+5p08eaHmC1q+HuD9+E02//GOaza3Dt1V+BBu99/6fw7rf+DuD2GwDdXaj7M6hhz80qKJSOdXCrOgQj8IVpL+NQUY09GDlFGFOAMdyu6xEBswBgBTuoqwb6bg4wHAN88rfgs//7/wnr1TOwaxcww1ReZSPQLChidoBuQABwB/X+FJbb2/Czr/4FnP/4mwD9PWj6Mxi7DcDQ07P5h3mmwdRjrCHYdwq8ISHPV1DzEr4O94mm1qPxi92QZ7BvrsLi5V+jNOX+xVcoBXg37+GZV5+DcQWwwzqA7QgDAqtYi3UCAKj3GOmYqfXAGoDFHIU8hT70FOBiDI4f5uoLA/94xP0+aw8UorcFFyUWqdwggbpdZ8yfQOMHIsnTL37EqKKJ9Fj9B5Zl3sEyS93g+GTGag7f50QHTigDkZX+HgBoU/6sZe7omljUtGJ/7bsZeYBdassIVWF7lS7O6DDN14GhrBY0aet66062uBOx/ugAQD/S0XhRxsdha1Nnb2i9jstrNRDLN/lTotZSSmMpAjNmP0g6yKcAp9MXzRwi2SoGjPZokdSlkwasdI2gT63j9POdCgNZOykkU4p/9B94EPMjg3g3eBuWtJ/Me7PeU+DAXgQAnO5V+pPXuiU2Rv5sSoJIblt8ANsdwZTibCUO8Z7o6aOLpACbrAXibQv+ccquOx7jrkW4Ore6ln/U81Q5DCzDQhkUsgac0IG+vq+e/fP/7ozITwnQhlU2TDzBFEZwa0HMJOHoYn/zJQAoBYF3pzqUDgGaUlHxEgBC4xOD0q5ibIraxc4RSYy45fU6IssoYR12rYUfAXT2Ke67XDeRrlQf4f9tR7w0i5XWIyBQVWibrX29K2kV7NOAz8D2GZEVnggAyreXItz8t2RTYCYI+6II8ogjBFhKRnK4dzmBaSJKzdgP03qhQsqKZyVa4vsf+9ShtwAgPPS0LV2/YsLWRS7BiBN0PPErzd2HKRBjeJj0BddsDuk//XyXu2PDjUgnr4mJnUkG5/e2OPreqCOSqtGjhZBv7aiYQfPxSGmEeZCqRL8l+vSFiBxTTrrrlSu8f6KMkrvnPHHCAW+aQrTsSI0xciSujQFF4xyBqe8/ZG14RiUA8GLck+ZeV767utGaF2o+0RTgvGTQDpO1+1nPEaWg8aZOcHle3MWyxgjAoYXTn7wHd77xBszghADAaugBPngdPvj2/wS49UOA7jZUw5oj5Dgh10TV6Whaeqp2Gkh3YP9cTBPGRh+a37grMANt+D0C4XMYq2cAXv1N+PTv/huYvforcDZiWjFQTT8E5rBRh7YKUG/VYw/D7hS2H7wJN7/7NTh9/esAu3eh7TFNeQPVgKm4eo0VrxgQVO2sd6KsqILnNgK0VMMPAcAFbOtrsHj51+H5X/0SDC++BtuTFVRXKrj6yjXYLwbY1nvoWna6UgCg2QwNOIoDNT07ucP54L6SbJmqRdL2DzmAma/5lCnNJdTkKDkMn/6V/nKu55Rt++PPOcehU4RbWoaWOrgyT2UWaCL4pWckI4DMLClHXUw/OPHK64CSA+hvjZaHelXNDoml1OYFvTkDsjrSWIs0n94LXXR5/DwKgvwM4CILuU+lc32dtRBK8r/0ZJazUk+59Cj6uyYflbLB5dpruUT0Jv2WAoBZjgAsBBEIQNpETIkpava31iY3ndS+r0yRt5BtzqZ0pJ/6o2RB2O+t3tN040sOu/c4n8Df9l7FZRnSP34XVCIHmcUkTBO9n5bPy9RhAKTEMHLDk3xaomPDGX6Kp5A3OISg5mlGwFj5mHq75unM6Dz54teElHbH1Dm61/ncp+SpWm8+IIgvvpHbqRcXa5zmZfdF5uMD5qVnuOvJh54a9KN7sfxKRsWH9ollIN7/lPlg11RLA7YOVQ1lx2qwfoKfcRUBAOVmsUHBikqJ0FidiNIqZTbYJw0NAMpTMCkQ3Ef5BlDokASIp6dAfWI+FAD0u6T6Uy3Yd6qJht5kjirQYccsgNCAUepB0YZds5ABXAGO+xaukRyjjEBMbpPYpHjR6LSFK8WDfxU9NnfKPMH+NPaNGnwJ0Az2J0sPZcLOG7khoBUHAPNKsjwKoaSlQyaMv6nPOMygc4X9lHcE++M3QYlFbCUf/DABQH7pRXfGN96TJlghykLK3vgySBmAwjnSxTht/8Uf6RUCx4tijrSm/ejjI/OSJ7j6xbEIYv2d4a3C+LN7VIxiSRsRKd523jdBRqXIV8vq1PjLBuiEIunR+dsoOb9LutLyJuKrxNMleeHL59LzSt/7EYA2aqJ057TvQwBQBWYo471SDiObtZzJUHcDrMYGTn/8Ptz+xx9C1a3g2sufgXlTwXDjh3Dj238FcPv7BABCvyYjDRt3cIRbGGVsR4pv6VlHSscdQTWKzEPi6xhMrBbQV9cAXvw8fOpLfwrzj38ezusFNesg8K9FEJAbddAPOaYD1MMO9nfeg1vf+Rrc+P7fA9x/HdruDgz9lgFAjOBTKcAcQaMAG+W45PQtXoINSGBsYRyXsK2egfnLn4cXPvu70L/wC7A9WUJ9DeDqq88QALip99A3FgCkk3SsA+hsnfUOCSg0kX9GojhX5wHAXO7D5eS/ubsEAEYyKKz8UylGGf3naiheLwnoB8eLTsRNOQIqyzVGtsQFtNUPaQk3BQAsqS9j4erUKymTHYA6ZgvnnciLAICOzIuMSet0vq7sxEo94GeQlBxWA5YoENCVIxe1bkiA0O9Fajj6nKodWP1M6w3pw5fEOCPRY5JeJV0YniIAUK85HujkqSsPAHKksy1T43OLtU+1HxhEAqrN1TNEWa4BQBYdanxOpKDV0nononxqnMH4HPlrF8AJVlqssU35tDRbBAApQyFNZ7EIL+n7+3fKABf5/5ScKvJHhgXK9lf4Vvd9igIdZ0AgOpn9Me/O0ueTAADKNdD+oKAPU0IkvkNZdIIek+PPsuycZvUJi6twoOI/LwQARcQfHeZeBADkOZMcSJY4kivHepz5U9t4ct2eAoBm3/IRX5qAXRM8RYIs1AsAWyEKWtZI45BjBo10+LE06EKBFzLAIQAgOTGlExpPQNrrrcpKCl9tdCQABLJ/cnUmJjjXjrE1YT6Bin4KALoO05SYbXNHuYtauN6eOxcAgBGFknGAHnQKsI0A5Jde1ER2dH4ukuHnHQDUlnFkj7MAo96bkowoOlhpI8J/v6aF0Ei2gz+EXrSsTrvHFnxKmU/TIpB9DfYUACw5DI4eFRGAEgBEE40aY3Q9AYBnP/0Abn7t+wDrFq5+7DOwmrcw3vkRvP+tvwS4/T2o+zswdmcMAKo0XuwknI8B13vHdgYBfxrk17YCgmDjnAHA65+BT/zen8Hqk78B62YFs/kMagT/GnRW9QkxaX5yNanW3+lNuPXdr8E7GKl45wcCAMQOILKIx4MHAJtna7j6GkYAjrCu9tBVPVkENdUArFWTM8EhgpTxcDMEAN2dzQGAedf/Yjztvl2lgOUMyIcMALIbIX9cx4G+n7oQgTIXQEpWfqcl3KMHAGOcf9EFCJ9FgIZvM6tzYGkxU1BDAaDRT3dcOWmvFiIkOUJrUPur992LAryUhfNgAECeZwgeaAuM5x+hoSm+l360WkyOABR0+xABQFN7UaStug0wNXe6czMAIG6V3vyInWO+yhodafvG2DMZ8pf+7SMDAPV2R+Ysp/oUALwkAKhAppyXc5huCHmY8bQ0gf68AIBJFzb4wvJrHgDU64oryPc4EYB644wBxHtwcAQgAVAiIsSPBMxNrOgMxRhc1JORAi4uo0KX7FGnAE8BANNrxCdIRv0pg4CiANXUaP3F5P01DWqUeQuVCsE2bkW2Bl048hJg6BgtODdMW0oYKmLm0SXKYAPmejJvxaKE48sbdw8mBTjjwnsStBgBmEUDymLESZEz6GiRE+16HgAA+gVyp5jRfop2uWtz5qkq3Lq8KqUr7Pp8OAFAPT/XuGf+mbIr3vp4/KrJyH9SOQLQtb7DCEAl/xJWhlZpWR1zaQDQ8xC8jD1HvmTfpYCS4JqC/ClsTzGFpuTAPcYIQCN+Sux3wPfxCMDLIvWW/w+JAETFPJ81APsOlgQAvg83v/I9gPsjHL/0S3DlaAnjvZ/Be9/6C4Cb34FqvAPQYQ1A7JTLKcAU70GBKHFCsCnaOEaMhsPIPzab6Q4yD/ApCgA8+TR84g/+DI4/9RuwmZ9As5hD1TAAWNecHqJMQaL0fr+FZn2HAMB3/+mvAO69Dk2HQCWmAHMTELE6QQSgv3Vyf4jfCfzAFOAl7FQE4HO/+jswvPBx2JwsYf7iDI5fuQLdEmBb97BDQJIAQEynUanOONGY/08HftgYJWNhefcFMqygGn3RNF2TKgP9MUcAhjGO0uUKweeDHL7HHAHogAFKjGub0XwXTVGfLnAO1Z6xiGit93R1IXLXDgAA5Wj9mtzaN3NnZCEzCwAqenxgkYD8jmwNx+nLrKKZBTAX3BuBCi4NAOIETL2F6GhzB2wcgZxOAWZeUrWkTSSo+8TY8zV9YPWFPABoy1PElzoN/mlqoH8PBAAt4BDJuBPP4unnsxR0hFSKVAJ5WwAF+Tl2EKUMhYeeAuwzqMzpVP5+LA7d2NwPMwLwggBgWgcK/lVExeyVviPC1ZYU6HFZ7e5Z6wcJnPjFSh6UMgf0zVNSgKePKuTXTAa1yArRNK8OeIXNz2Uf7AgCAPC5/+I2AeGaTJqN7AlrKiW3yGCF2acAJTNmLx2t8qrG54tEhi8vAlgBwpYpsq4BiKnUEgyHa2CZZut6rvQvW71hhFN4omuGHOEVfWDoA8L6Un/oviPiE4z/Cvm98x0NygamaoEWGtQTlFRSBmBaU06EWIDVMqxblfWyAKBM0Q6pLZybDwCyPlA7mDnRNbqixE+XTAEuCSuXXtz5XYQNsgCgJprMoEoVFP1b3fdpzkl7iYc5fK7uIg4g/vbNEvVBxgCwMvhAcEOkABvVeygImKDDEMhX/C0WyZHHhtmVQ0JFnN2Ik1wA7sMHAFG/hfJDd7+T9Kz3UDuYLl3ZZwR8molALJ9gl1N8rasXYZKkg67GG3WgFE8XIyeVz+a9dgLLlkTMAd+7YEbsxry+V00+IoJLkzR2bTMHoJjuqwhB0wNFAA4DtN0I481TuPn178HuvTO48sKn4Xi5hPH8Pbjxo69B/7OvQNXfgqo7hXrsKPOMaSln4GoOtqn9Td0KALCiLjoDNDCOM+irKwDXfgme/+zvwwuf+z0YrzwHQzuDsa2gbrGOYK9SgPXzgBqNdHffh82P/xne+eb/D/DBd6Dq7kBNKcAIAGp9yXTB9l5Y2iK69pgCTIvHKcAIAM4+9uvw/Ge/RADg+soSjl47gtnzS4oA3DcDdCPWNARohppAQJnO6r8D5UMJAPS7DPn0OWX1hUEcuDL5FDNtv6W0iI6gj48iZaPZdZAHPvpTd82c+RYcKtJURJelVREjyEYw8ljSIErYhdvZ40gpCvl9oL2LKcAHiJYH6FpqnaH/pW1Qg0+nj5bHqvc23C3m0XB9JG3g/2tKUcvnOeQsoKRlUx68usL6G1qmaJvSn5UeuzQ2cra/PibxNtLTa9ZeSfNoCr/QujfHLbJKrz4QyS2Opg1JI3p/fN+J7LFkjTB8i2uf++819JGZgBvgog8MrPwvHRgwfpW3os23hcNc37bCv+P4g5x3jkby65Pmr/QOPugU4CwjURkP11gP1iNrx8Wb6GUBYd/ecwBKn4eF/RKzE40lk5hlQV+V6Dtqk2i2SC2sSgH2WWKKb0vrJg5M5QGAfl2AVzmLHZfk0+Wz4E/1wiBAzEO8q0MAQEdx6VOsDEIdKKDIoscM9Jjhoz9zAUDsljfdWCFyPPRE0C8iLOcwFQBMyj8EqBRA64B/rpljQUBX4erknHQa5Kjma51u6cTHiPqiAGBMzsvMdKMDohEy8T3Mqw0+W/MjJH0D0j/hCbpiXTIF+OcdAOQoQLvqh3GjG5JsDQG58/+LvTf/tvw46gTje+99W5Vq14p3W95o0wbbWMZgwGDonr9rTs/QPafnL5kzwMz80HCgu+ew2SAMttsG4wWMZVlSSSpJtb337r3f2yczMjIjIiMzvve9V6rF9c6Rqup9t8zIWD8ZEek5D/yL/tdrALBfR+PxYNOOkAJ+VwFAXd6TgjkXZFCzYCTJQAi5k4IgDgAYFW5xsjATQjpdPQD43gCAckVRf8jfUWN2Cs6sUERSLDmZ4gRK7oC39VvfgTaCnoYjZfLhBACQsjjxeS8Iq10RKyjpOq1nepE797Yz723wIJ5VS3nmewcAjD38xhHm6xF2bh7B6y/+Axy+/Dacv/x+uHj+CRgPb8CbP/oGLH/0NYDj6zBb3YQZrHJvGCrdaGcApoy/BOzPBAAYqjNCBhz+twoA4PkPwtVPfAGe/tQXYLxwDWD/AMadGcwWaxji6XBjihrDMwOsxiWMN9+A4x//I7zyzT+D8eVvAgQAcHUMw7hKgGGhrQYAI0DKfrh/FnhjHh2cBWxGBADnT38SnvrkF2DzzAfg8OIBXPjwJVhfAFjtAaxmI6xThuJ8DBmA/fUtAGBHS+sNY6dssseecTRKlB9kAND0ydIhNq156hJFT1yn9HC9lwCgBQqENcocsa2/nyZsxSAeLcyAU4GSfCMeVY/vs3R9DJOfUV45+ITv0IDxkA4casnPlAiuD6J4NOsDgDnqY1ABdzZ74M42AKC2s9qnZAzFhArNhgeX01rQhg/jzfQZ7mNZ1XZEQ71K8c0CADTvaC6Bpc+ELo8uAfWAVf5MZuT+CvcAwIq7vOw+qwza9G05T/Z4pM+7tNTbSOjDDgBOAf/4Pfapwxb9CxXlVd5ixHBuzzgDUNgGi3WNDMCGi1g9jQAgt3bYD1DUUKhTyK3sT09nyuvaRyI5pa/24637DgA2G4Qyw8YFsAIAt2za6GYAauqzQziqhZkAAPaRYwQAs9I3jTneUISuUAMVKL/GmQ3vi4An6zOkAcBtlJvFmBTAa2czuyCsxFmKQnJJKKOgwfUe/KNLNsVr+v1nt5Oz1t09/jB24B6lDECrBFjzu+ffVinJTllHJZ5F303KTDlrALCbwZyYNwcTzcG3pdAK4tqMq0qA48MncNAfWQCQ7bYkIpoZgAk4wwOZpvyUAEI6GET79lu6+i073+27uuNzAMAC/vEQhI/ZfntfJ0+h11ndUwNEHuCnv3x6ABAzAGfjCs4fjREAvPnD1+Dg4nvg4vnLMKzuwM2ffAdu/8tXYXb3pwDLt2G2WSa/r/Tk6wKAWScOQAAgZr4FOB3/C+ftLuEJgN2fg8uf/AI8/W9egPXFJ2F44iJsducwBAAwHQISnPZhg88v1yvY3H4Dxpe+B699+y/g6Id/EwHA+XqJQOVmjaBh+pkCAAZQMPhpURZSCTDAQQQA4erH4JlPfRGG5z4ER5fPwaWPXYXDgxUcz9ewDADlPJ0e/C4BgJ58c15/mADAlt2oAFslEI8BwBKSWRng22gu4hf9Z7TKecPf48D2F9sARfa+RSYgvok2vJCzMR7VoBr/ptb224FMHr00AIh4bbFBeJ0DdGcJAAYAVL/f8pkkZMFD67oEW8B56D8kO6zBB/p3i6LIf3W8l3VxyoCTd/C39X0/zpfmOuUWOy3/wE3uSwnktsfgAYBq+pkLuFMWuunWP/Z69e+zr9ol9h2Z1KcAn7IEuCs/9yAD8N4AgJxjeUSSyuN7KbbvAgCYuTOeOsx8HRa/Tc8AtHrullWsAdPOCnvtjfKjlnwl/Ae1fNYj1aG41/7X/0tIUJUhlzKkisHCr8ZXRmypE9xMsW3ODp1+xYkAQHpJBIQCsaq3tvRfdGSbP8kxbwVE3vSj6Umvt405C3AazCC+LXqiJQagE4TTnPM6JsPkjjF+oHxFKohNbirJ/YjMG7xXESOidKqVkfIGJN6DJXztPYS6BNhzSLa5juvHT93TnEXKgJlolpIomnxOyEzwwLS4UiLlkQfI28zMYfl0WZxWTb9TwmCNWay/Tkk+QwDQkkt56nXlgoiJkwPSku+a3kzRM+NB+rKiqvZw1A22TmitTcyHyX0heNbw1vpJAIDIu1lKBZ/WOQamgcu7xXXXQG9DRmao1XMnJ9amCilNZgCYokL5tWREncRuL5z6Lb5H60deitXa7Wvzl3/KNTfzNQ16pZpUmle+nlcatzJNkno6qCcrZ6OB+Ft4eSFyaDuj1B5ZK4Eghzzphvh2owQ43jeuYdgs4YnjDbz1zR/A2999GXb2n4Frl54EWB7B7Ve/B7f++a9guPVjBADhOJfShgNBwizsXlrsVNekF6kEuACACOTBZg7L4TzA7Cm49IkvwDOf+gKsLjwJiytXYb27gGFnDUCnAIdd6k3ILJzBcQAAb92AzSvfh9e/81dw57t/AcP6bZivjyMAOEYAMEl/kP1ccYGyhf9m9m0Wygo5ABgkOJQtH8AxXAK4/BF45hd+DWbvfR4Or5yHJz56Ge7uLeF4sYF1GF+oat4ALBIAKN2BKLHSkxCn3hocxvw3S59yvyUrupavMjkDJRvIjm+C91C2sSUbtStkWrRMk6ILkl42hFVXzAhqxhcUnyV/vynU5F+1nLYJLQzoVGmLAFN8ImZchTVPQ9q64odx82kBwDC02AMzYUCajOgnb+HwVv5BL0IkubQC0uInoL1mI3P9L24vle9+AgWfNxRS9jlWRBW7bQN0ON5SntqxoIK8tT0shxSYq8NmxHwI/tvq0/gL2josPMQsNfFmaodijb4kaiCNyz3SX6k3jsy3NW25dkHl06WvMRJczAxn2TX4dosN/Uj+N8kKjdbKCFTikuevJ5JtkueR1BYmE2uC/tGEnZQBKB6yZWgK4JSzM9kU7BLgtmBq/qnVkYyu6wx4Tj/6O6skCRNRayMp3onf0enqaJXt9A8No8d/LQBwChCMOH99qJagkJqPx53bm4fsuVbWIsyhBgD/w//doTA1aWd7Mun9PJOstUJJTTezHCNvhBPseoZDUUhPwD3mu3p5YppEWX7KLvMlmoqt2YS8TwTzKhMXvB4VjnDJlHEWyaRcT+W/xwDIIChni7h2ZGg71Kf1EV8VKa7MASS+4Lub4aRBp8RWnwJX6XHHqfDe7x4y4QDQlcKr+LEHAIq9wmom2dXm2a6VwlMmuQLM+sLjGRJPwQh+FIuDIAnvcVcxpOJDS9nV6+OpROmTSXeIS3ASKS0LVJKbP9P5Xs7wbdDYYdboWqcA1V4H/xS9aXo2OZfxj5B5I93FHof0ww/yVKkrXnqTAgH7IlreEe+L2chlnXoBWnGZ7TUi3vU5puG8k9JVO5AlsxWf0zSifctaoPVIuPTYzkp/7M7Mqh16PaIUhliviZNSAFoOvsK+eqG+fmt3VJXTrvVXZ0PN0fXW5bw2SjfRvWgPaQz1yLXDLJs6S7gpXMsACrN3oVfeMC7h3GoDt7/3Mtz45o9gvrgGF/cuwe58Bnde+wEc//hFWL35Pdis3oIBjmOpa0CL5yF70AEAAxehnaNTgMPHKfsvAHl4MvAKDgDm1+Dihz8DH/jlr8DqwtOwuXgJ1nsL2CzWobFeLOkNcjMbQ3e+GaxWK9jceQtWr/4Qrn/nr+Duv74Im3d+AvP1YQQAI/8n2pKvJfqGMQNiZZcF+sdsw80eLOEizK98BK58/Jdh/qF/A7evPgFPfOwq3No7hmXACGcBMNnAIgKAKXsw+w9RmxYFlOQybMDpgILziXC+LcblLV5MPKUou9rWWCXBWls4GnaCDSnzsUaAckw/YoslrE3wJ7TPwoZUNo1Q0/E3SfDCC8SSvdUl145MFwDoBMLPHmnZAi8juBU/ZN+87x64g44rlg7D4SuVqXkqdbiBsbFRgwNrFV+T8jI5ul2ylmxGYSiKpTpThbELAAAgAElEQVRk8BzQXKpc+mFWmW8ClGQ6IBwwGLKg3G8U6ai26EWGYW0/vRK9GA/SkMimkr7MulO+l0S+bJ9K0ED6fKWUO0mYeJndA5AxbV4zrT0Th7AWDprVuS7gFMx/T0LX0rER2uG6xogHtL2lHrtFVuRcKg+Ln5LCq13EmvTEFG/kNJfsNMFDbukIcvkar0hfzkXkXOfYHquah8jmMebIfBSbAsk+NMiD5qPYXUvH1r5xngUCxDyjLi2qttfNBB43A872qfl0xNJM2MDLuQrM5+lzgCHbTIO2Kjvoqem6yzU16YbJjB/vH651AUA85ShIcSQ1ByomoeMth4VbbjxleOpPDQB2lkfvKLDUclLsHABsK4Eyuur7JTF56hSkAte6mr8vyh6jYWZgm/HjndHhrofC2SLMM5wwlUyAEeKmK+FdDKANj+hTm3gPGPpsPL0qgZmzeHJh++e0AGAPQIiOl9fj7wwBQO00egCFpfDrjFopQxWC72gnzzeaBABm0JFbNNz9kxl1bb7LCk/d4mWAdYWqkm/j+5o+DAD0FDsFR331ZMsivjscUhOPvWhOo3eKHuncKYolQjnxowUALI6m/QbyDV0XR5XCbjOu8mVJJ3R+A4DsbAB1aOfJl0e3EiwbRhO38/IrpEOmeynZXyqhCpcbb1TbXPcOGfDCF+RRsgO89yFlpnj6gY/W5jfJ+15Avs3sw706WNIlU2VDzPZFagBQ9bRjwhEBQLZBk+Vgs4bZegkHK4DlSzfg+te/B7C+CJf2L8PefAfuvvbPcPzjv0EAcHkDhuEI1rAOzQNhPmIRbysDEEsESiZgyPzDncLw+/BkAP8wm28N+7CZXYEn3v9v4f2f/W2Aq++FzaUrsAoAYMgAZADgPACAATRcLwHuvgOr6/8Cr//DV+HmD78Kw82fwGK8E7MacXSR0nnukQZkWFwAMLiPAQDcheVwAWYXPwgXP/oZWDz/abj71BU4/9ErcHt3CcudMKUBFgEAHMN/CVwT9tnIKKt6NBfH1LN96F4x/9MKOBj4UHGQYX+kw+/LvTdGKQ9pBI2H8Nfl4LVgEOiQGWO5UmKGlYGB46Zn9IZIT0a3lW9vA3+KPujZAW88ve9rf84ai+9DSACwescpAcAAAZ7qR4Br3B4kqyAQJkuH2v4PPu3Hf+QHRL0d/QwEArm9lQdRsPfmQGaLAFK1RCkAh4fiNGx84xjZbJeMOJnsJNld8t1ifJWGUebfp28/Qaqmv/y2rODL/kpmapkxackD5/967JgBSz8mgMQnwIDywolW/FveKTJIWab6JJkgBzjozFySr72+XgdTlZCuP+qrf66tM8aC1rZIUHMuEwBATz9hE1D7riB32C6kyIaWEv0kXi8T1xs8tenq6IgzAgB7Pmz/EFvyy1wqiiXiMwr+QOvpafHlFB9+ErebNz0GAFkJybYAIC6sb+RayyODl6wm6zIXCtLeBQCQA2q6YO9RAAArANfxHbbJANQG0gMo+P3572YGIFPAW2UAmv3tpbJydFvkgRMCgJq0FqkfdgAQSVMTkQdjGJTZP14A4gWIJbBL0poOCwi8ZwMyzHlK6qvPAuSYy+e8cdWzlY7sgwsAcq+Dj5lz72MA0OLmBwEA5OoxW2bm6Fc+utK31SFRTDgsAHAdqm8DADiu4GAJsPvWEn78F98AONyFC/vXYH9xDu6++i9w/NLfwOqN78GwfBNmw10YY3ZdysiLvaOtQD7oXgkAEviHQCCCgAEADEBdBAA3F2Hx3CfgA5/7HVg88yEYLl+F9f4ujLulBDgEZREAhAGW62MYjt4BeOMn8MZ3vwZv/sOfwXDzJVhsbsNss4YxBAGUs0vl0A4AGIOG2JojjDZkHIZx7sNyeALgwvvg4EP/FvY+/kuwec+zcPDBS3Bnfw1Hc9yU3BkIBETgRPpIEgDEDSi5gbDZ0j6KFi+PMADYltfHAGDTP08XerbOCw2jDChgQ3zvQQcAVVP7OlvjdAAgBwuwYaj0WYM+fhgBwOgVTkqSwQy/FrBSAFJbgh81AFBE07rCwRA2XUK+PVyCX4xcrBKcMIPWk/AO+PIzDwDynnpIx8cAYOGXKQBgdl1PjvF1n/QBwOBf6v5xXcU2JexnY+qdsmsM/X5mAIbFqAEkb/epfT2JRBGKvBuX92Jw91/poJ5RiCU3RDf2HB9FzNBjpT0ia8LZcacMwLxDER2Y8qGsSE+TAcjX3dG/vR6NmAEo6f+gA4B2Tw+cQzRVWwY4HlDjZficBQDYk5BHGQAs/euKg1EBEJ1TGYuMNsDDyBQRlsdsulQOg4albE201piMiwsAql4v3riao2UDwcyUIKBeBNTmHg9g92ymmQGoMv/svdiTAoBeqOmNWF9/sDIASUdxn1mXd3gZOdtSQGcA9gFAA5ZWzL89ADjEPnmzcQ37K4ALRzP44X/7a4CbEAHAcztPwN1X/hWOXnoRlm9+H4blGzCHu7CBY4Ah9NfDnxMDgAnwjwDgcACb1XmAZz4G7/vsV2D/5z4Ks6tPw/pgB9aLFQwLBBzD6brz9SLak+P1IcyPb8Nw42W48d0X4fr/+G8RAJyN72AJcAIXo5WPIKXq62RkABYAMEgYAoDDsAfH4ZCSc8/B7gc+BQef/AzsfPD9sPe+S3Bnb4SjBUAAUxfDAPMIUKJ0xhAsIcu4VDJc5j08kxYUi+x5Z6JC4IQAoHBXzFP+2hrWs8+SY1N4fIIMQEuukKyPAUBPK58FAEhAYKXBY3x18p+zyKCUoB6TmChQfHRo92qZas2gL33ofzCUJAOALJ7IPbU4NMTkIJYyeVIuJDT9I0VfMUPHfge+lcZnr1HXf6U4q7u8NQCoKK6ellf9MzBV/KNIwTOg7HWVa6tlgV+1MgDzRnT6bpVQwfgrqXmxmjX4K8lhZgBuJU4JADSrG6cBgE3uY6zdGhLL134gMgDl+vgZgCQhaJlRXGK0k/6B8SxxiW5Jw3EOg0IPTAbgVgwl+DduGjceJ/vbe/t2/sF244xrpkuAa4AEFzA72ilgy9mn+tSbTrqoObx7DAAKQIyXAIti76Tqqx0ApWwCwRhAZi2s/F3N4IK+qeeSTHhPPeXYCZC8oX+O7HPQX7uIXBjp73y6HKRD21dG7R0iQT2QcuYRSb1KX6cMKNth0AbZFhHfrNOClTsrwE8xXV3Crf0HtYI6QFSDEiXk5FqkezyAIqtFnn5eKYzS4yQu1SkBwOp5rsErAQ3BbdDCNGne9BtLNWIJcGOhtPG35N8DALsp2gng7fFJK4OT075tnFsOb3milwFYXLs2jWLD/MYASE6ty1m+8sWQLhPsbjp9M4l1K/DIy+7sUtNmAx8L//s0QIc1Bd463FEOLCvpD1d69PPMYR8ARA4p/KmChLxZQ1+pVzG5lqQVzOHoFgjemLW2dx1k94VFtq0S4H4DB/sQMEEJFTBO4xd30IXrBf8GfcRkkzml9hsTmMUkcDsAcIB1+H4IUsc17IWq3rcP4fq3vg/w2h24snsJ9mEfDl97CQ5/8vdw+Ob3AZY3YA53YBiOYRhChl3vpOmSAUhwfqRfKv+N5f7UYxQGWEMAAM8BPP0xuPbzX4JLH/4UjJeuwXhuD2YHGxioBHgMPQB3otlfjUcwX96G4c1X4eYP/h5e+9Z/h/WNH8Js8w7Mw2Elo+xxG/WGUADMQMbf80zGcChL3MKEYQynFJ+HcXENFu//JJz/+c/B/kc+BOc/9Azc3FnD3R2A2e4OjOs1djdMKmMTWgQwkCAeeFJYNvdGJH0WMgBFy3w3iGDwwbYAYNd2cnBjOj/7dyo9pB4gm0OgaTqG03wtBSA1pFN8fpwi19/9EZ5WvrcFtDwfyxuPl4Ef599xMFrBHbcKvWx8cQggWhyfBdgdZ9VDMY9XTVb6X7rf3tSxtqkU1Vku3SwlwLqVA2Y681OL0ybc1gCgFFrtR9WH5Ly7AKCOH3WPTmSRdFcs0fTYpUN7pb/s1SxlwAXGUd9MD+rrWVOlC9FfU4ckaP+ehZNpqr1DHsn/YEibl9GgyRVoGG0G/mRcIw0kXmmQkOjVlAKdwZj8VT6EBwkArBON0gqy+fO56rWqtRdvbZKyexmd8a99HdIDjD1wnt7eYwmvBNiTLqvHH5+R2wOw84FkhfskOiVCOAkA5D0ZQsaGCAY7AKC/vBFR83hAkGjbDMCTAICR3w2+DL+vDz0o0oHPqQfZAuHzMuMl9vDIDm34SyrrSbnwupGq2DHLfb8KiYRSYoo3C0EKmKhP3yQAkPv4FLCk9/AegGRPypR9AMUTYkc9VN6Z1fNPKC21PnKta2PfApCywxRLkOQoMzjK6G/JuWV0zAzAFERHdXzWAKDVGDUPdjsA0FK05vrRxI1TiSr77JwyTqVmLT3aWz9a+5aLxFO0W/fgfoC8WvRjMu9pzcx3BP2pLrD4thl8oKPCg0EqAcanKeiIPVgaQbA//yzR0jliQZEXYCW3Su70e1ZVanyl/4v+jA5lB0D1PqNbHGTCsV3/7QHAwvHcubPHQk2SXS++MZV7nwF4EgAw68bIPuoUOa8nq7do6vqkDMDWO0VAmThVpVRw/VGXAKfgIWSrjSOEKtudwzW88j++D+NLb8IV2IfZ4RoOr/8EVq9/F47f/hFAzKy7G/sAhuy4voPYAABjMCxLgwMvxxLg8QLA1Q/DpU98ES4//2nYXH4KNuf3YdgfRQbgbB2a7gEsV4cwHN2G+Y3rcPdfvwOvf/v/h+Ub3wdYvwmzzRErvytKexsAcJhhZvJ8XMAazsF650lYPPMR2H3+F2D/Ix+Bq5/6ENzaG+DWsILjYQM7OwGYjDAf6pzsL62TLiwAH2q/wKEoc6h3FQBYq2dm3fCvWWJPAgB2+bX2J7Zkb+N2rvPryz9LAKAH/sW1nXQIXUs7Jx7sOKGe5o6rZfnh6ZM2ANj3evlo+wFsR/HlS3IGuil9BGzoXkpKEEFnBQmwj3L+r4UL46Esuan3XzkMBHsA4AYCbYCIU3vDOE4EABalwMGf+FuekRZJ088CO6sMQLGmSSth7KflXfmaZrDK7+nrIJ/T5PPW57QMMPe+0q8asfRPJXcAQDqFnmeSbqVkWYuLbUuAG361tCdy/eqDsgp/lbjBrjupppXRysaEp5Sgsx6AtT5NY2cLLKR9wuYa3+Dm8YbJtpa1U8wl9Z1vX7v8nQ458WWgzVC9Hu5an2zFlunmsvmZbJF4Sd8XmPK9xwAgU7AS/becKw0AUqPkpsoTLwmiXp16PLAd8ziWqQBgMk46hVo5tDQACRWg3cxT9zIAtYbnqe1Z8RYGfbAAQCnetcFu9fzC+bR2D4hXzFOk0yc9B5XIyvnu3QQAyTnlgFNxjeLsY0Alf0jp1hmA3nxNeqaM2pYjTQpfj4K+5Z3yfBYAYE+RmgBgzuhEqcs9tIwX8QyEOEfGjtwh0I9OBQB72QePAcAEHFQeQHEspgOAKC9JayTH1yshOT0AWJT4FHNv3VOk/6wyALnNeZQBQGxYNQv1uxEA3BkB9o438Mq3/wmW//wqHNxZwuJoCYevvwTjO/8C6zuvwma8DcNwCMOwjJCdPlRLrhAHAJG/6BAQhMjCv8lJp0NALgOcew8cfPwFuPaxzwBcexY25w8iADjbCXw9xsrjecwAnMHh8SGMt96BnXduwPjqD2IPwOM3/gnWR9cB1rcSvMa1cyfrJIqNzAAcZtjDazEuYDMewHp+BeDy+2B470dh7/nn4cnPfRKOLh/AnfkGDjcr2NvbiySg5vFjtj8JAFQBMZ2OTHZLtqyo9mYq95lLrblRwr5nudt9ACjpkZNGGGaA1Xf6HwOASoIeAgBQQXBuVgyfoZ8BVnkOXaHg/lLgNA7QICBVZwSXL7AGfiIuyJ5utaFJh0xiHuAGxnAACD07BQCsnKSpwoZjejABQJxDoXfbtovNmGx4NTDiAyWdL9T8wkjcAv9qbwhfUwHWxjHGEmRy9F0uMS1xyeQk2oxClUNAiA6UQe32ADTAsccAYOGm6hRglmWJTN63oKfNAOx5xaTfpmoM612nBQC7s6eAMGWIcLwgxxmnzwD8fTGGEvCQgqQTgNNtVQaghmgV4OLFJV4GoHq9PvVV7yDoz8kMwFY5QxlzOR23HngYiiwBJmPF762ginwxPi8yxrRiZgCgKAEWJl8o5NxMP92SeYY9YkI4LINPuPcV4GOIhyq74kqzBi3a2xAp/O5yiCucajcyro/k6JwhEPWNmJ920Iujgt5BOzmVABhvh9menGRqnsUy5o6bZEKTM5Ae4d/LprGlRQzS8/nH59Uc+atwLbkB5vxKTeY8eVfuLfsnyVO2w4lYYgypZEA6Bczl1BmRiuDUD08advxX/o5iMiEPib/0GOkFWOImfwqgiw4xsai1TFXJIR9YZwevlK6Qi2JnAGpQVmQ0pYG32UfKA5dtCYA3RFhYb+Kd1tdaakD2QNVN+2OTcM/GNK7n2ZkvwKsSAKQX0QOcgOp3JWehOzq7BHgqjfrOcWHyNoVyfkcKujZxQ4p6tQSYqd+jUWSIWDO9hxmAta3hLQpwMF0KGSVUVUkS11fqFGAENwkAXMPuegM7d5Zw/dvfhcPv/QgWb92EvdUxLN+5DuOdV2F9dAPG8TZAzP5bIQAY9VvdBJ5GXzYMEfwL/8WkBz67zRBLYUMG4LhzDWBxBfaf/2V46pOfg+Gp98H63DmYHQwwhOZ6AwJyeArwAId37sLynbdh585NGN54CW7801/C4fV/hPWdn8CwvgmzeFAJfRCp2ToFOMbrqgceAoAQAUAY9+EYzgGcfxbGp94Hs/d/AJ791c/B5rlrsDzYhaOQLTgPh5uks4djAtA89wAsc+b6n/MnjbTwe0+SssSym2pJKUrY4iVuESv2t5yxLXQVPV7GVOsY/rqksUSFTq8EGOWjYWRIH5AQsazo3hRO5g+VN0p7iGPz9HsvSPfG0yoB5rRsDaCwjc1lmr/I3xL0q9TrBJ2eX5AqNDoUQh5qbXIb3K5kQW5QeBnnEwBAPvl8vhxKUaw0o/+YE4+jDFnPvGVD8q3E1HryQdeKT4M+neSeqiee6GFWc/5M9EyX16X3VD/b7uVOPKBLrrMw5pdh/KvWUSVleFVWfZXU1qCWX6s5SqvASt6KMTOH0dRP6e7ifyRNzE6Qbs0rjzE59dY8chUXlQB7SijKmVwJnLvMYKxbjEgLopOQdHzGLJ+9rCJ4aVYvM4UrDx/TGwC4ySm+WrTPBN0c5qs5SFRt3EcAME5EHHJky29PPryWFV6GdtfTz8KDd9XxSt0CrS/Lhg669h/+QIwBAx6mJHM2S/odAYC1LmJvL4FRz5xl1mfCVWdo9fNYPQJzAJDIyHvKVMqzo9DRXjCDkY6t5/pXLmg9++6CU0ZB2t2P7plCeJFUXGmULBOp2HA5KoWcerbRGzSgqlkkZxikCxnxTi/m9CDBxr5xOEpvB0XPb1sGlvdjhiX9FAeaudAKALQ3iENQ5pjF+MqyGpPHrYyzzggdARUmOaB8BaMpUQP2xtkzgi3jwh2XAjQh31UlyD15yYEtZcrWCpbLr7WZEUt8maHhgFay39VLmwETz64rKsokEb2bptdiB6sldlHWrAhUqTF6Px6GobkY/+2wYC6J43fHg0CS8GH/klJirN3jnoNK9/IMy8iXjG5R3rvquQZkipeUOLwzScuB0rTyDHBPLmuDWlO9XeLDqWkbYtT+pAjT1xSTx/F3gdKe50kZYD0pt6xAub+QH3v98H5MhQntMZT16VG57zmbMjxRmaKepPfb3CwLRvUGUG1fe/5ECLbqnlgBAAwgVzgEZA0Xj0Z441vfgde++jWAN96A2fFdmK3uwjDehc14B9bjHYBhCbA5xgMyaHd3LI54kb3UbiUszWwBOzu7AMMClssVjOM66uIZhMM8cB5r2IXNzmVYjwcAz34M3v+53wR47iOwOncRdvZ3YJiHfnpj7LM3hjGPIyxWI6xu3YbjG2/CcOs6HL38HXjrX/8O4J3vwwJuwWa9jFmD+EO6Ra8p46IKAERbOg+ZQ5tdWG8OYLl4AuDiNYDn3gtPfPZzcP7jHwW4dhnuBtO9wDEGOBODp10ACKBgzcfRv9Aulpavjn7CWagNBq4CsgOevt5ol3HKTfgut9f+0QR5mig/fc2A2wDBH7G0Bf2u9i+9Q52mDy682zvkoHcgXvhSzBD1DCmbjNAiocK0cTi30JvqA5El1TcFnTgfNQFArddsimPFCH+7fC63yMgD4gOr7ZZ4U7pV/k6uuNy6qPUC665mLjyVAEfLE3pKp+XCGI02FHi5EufaweCPiiORPhnRKd41vb/t25EymMpANm/bT1Pcpjd/SKHpOct545e0PaLv8y/K+U6XPv9Ost30tUx5g2/y24yWN70v4Tvb9M89BdnHE+ek1yYOTNcpliBxyHyW7ta6vNwnR5lH1CFv0QMtnS0PgAmvCvG1OYY0EPwj8YiJDRRtYA1N+zfWhmelTRj5tX7oW6MgdvXacd3p2U6vR5/n/7v4ggcAOoBy7/v1hqgvU/Ud5JeTxKc/Mz87/oCjugYbAEzKJUHakZFoISMAKIWqOS1KEmrckBmUzaEKuFTJh37VdgAgflHXVfN31j3+5Bf5+HLJFN1iOpvaQ3XUXW7wnYii5l8UIndV1DlWDYGNXw4eMyvh7e1g4e3FQyEFJemF15FHJEqNYGFbQ/rHYHvqRRs8AsjKc5Uj1gEALeentVqe4uJmS94r6aH5PTaFp6U38lewBAx/4m0TdmGsOZBxsijM5VKvnuCXGJhOyfCUDWAzbYKD3ahhIRbOAD7pEuZcmA6IoIeSPVVe6+3sh/frHpdKG3g5RrlPH8mH4Njg8G5fwyOGgCVvhdtsABCJRmtNf3INonmE7uE9Nfkc6O+9jGkEjK2KpsJVPQAbebSvPz0HoKdtNf/gvdJieofUlBwzO5iyAcCyAmL8eXOAS11fB3oZLk4OXNLO6GQUXa2/b49hyvr06B+p3d/f8x6XAKAeZtyAoPVEPqozoCV/+QAgRwRSSVzIYtgs4WC1hkt3lnDjW9+GV776lzC8/hrMl3dgNh7DGP87gnGD5b+bTSgBJgCQBXJMRxH4PoYMv9kO7O6dh9l8F46Pl7BaH8UDNkIvj3CqbyiZHYcFrOfnYTV7AubXPgDP/fzn4NLzvwirg4swD+DhbAbzRcggHGG9WQGs1rC72cDq9m04eucmwO0bcHT9B/DTf/oqrN/8LhzsHMLx8V1VcaCzgKS88JKYCL6GFs9xHWaw2ezAZrMLy2Ef4PxFgGfeC1d+5Utw7mMfh3UAAAP4twgZf4EuSzw9GPZg2CxMPRvBal6RaNjCvn6qMzQkCylbreyt1ukus57oBgZenOj5Uzw0UBP3dhShRc7XR9PHgwEU2QDjOaGz7PeGDOZtvMjse5GPHMW9fgPex3Vm8cnaWTtljNnunQgALOOpDxEqtiX8TQKAeh1r3mKuhPAZiArSXve73KJmbfv/8Z2pByD2mecAYLLG5B9lP0B46alEubXCpNu5jpfj6fdg7XlIPh/3+Q7HUSdIpLE25qt50T9ErE9/fxb9O8iHItepN2fkx7Yuqb+Uxt54KQEsldknryZ+ENNMczyRXB18Rlbw5ZEVERLbizyOy/c6RgB9pBYN6/UnAJB7LeSXRmnLBMeMWP3T5nQlT+nBXsVDpdsN+9rTdThU2lS2aeDF0acFAO1T7tlYuvxoVXjKebjxx1b8XtMorLlmMf5vz9bgBlZbKoerZgYgcS2yIX4wseRDDADiniYz2gZdKEAQio25wF0A0KK1F8CKMQSDzHsA0tLVKo5YhUDIvLNBC9bQOZTxR1TYFgCMrzfoRkyZTWZ0oPo9rqYBgJ77xg1cDQBqMsiecfLUyL6obG8qOS2U2sj/1BXXMZZMU7YKw+41AJipSYG5kxEb6dkwcGRkCaXkt5F8cQdMXE80oBbv5JhmA8cspDCWZwAAchEqp9RZ688dzAZ/MAeEK24yjqcFAOV+H2Wcsbb4cccVKUSSxPybrN9bsyMAUI+dgJu+AX8YAMDeKaz1oTuWiRaUZYYDucPKACwrcBoAMHwqBtwtFRllgbuE9ehR3h8DgNmedgB5zAC0AMAgYwgAXrh1GAHAV7/6FwBvvALzkAGYAcBw8u8qZgC2AMASLIQTdMPazWAcZzCb7cHe/gWYz/fg8PgIVuu7MAvltes1xMreuI5zWA67sFqcBzi4Chee/TBcfu/HYD0/B8N8J4abqxFzzNfjCJv1GoZxBTvDAHvhv80x7K3fgZe//3W4df2fYDbegvXmWDWlsMrSCl9pALD0SA2u7AJgsxfHCPsXAZ56Dq792pfh3Mc/Aeurl+FOAAB35jBGADDQdIA57AFswqaXxccbOgslRTe1KHgAc3+DoQ7QuKhxz2N772DaE/IU0GnPnNldjwHAlGFmK1hZSZQ4VG1UegFu1XEn87m20rSqUg7uNQCofWLyw9ChkAfu2D5EPmnJNJ04/1L6G91JnkhAVSQtAFDra0Fw7p9xehZPsw0AZu89jbvh5Hrl183wu6U9eOZfBcFUb7vfAOBWMZPVA7CrrBKNGv4NrwbiryF/Jj4dzPVEAJD7/da8Kv+dHugIeeTAFusYAPCDBABaNOBzyfFEVzTuPwDYA8BibNQcv2/h7yUAyHVttTGVGL7v3VMGextDGa78b1YJcObsLFcSAEw0y+9tfOC+ZwCSEy3VA89Kq1RsKpEVyoAZJAEARgnpB5Bd5qvAtBYA2NKSBaGuABL2COfvEFRw07YNACi4QhHubABAi4/47/T1WkD1oRyacroHoC4B9jKStnGu2wBgeUsfAKxG3yhx3mZUeC83TJVrlMv+U8Zo5/W6x2Y14tRDpdo9o28kB84C/9DHLCXAgsfTA9r26h1qXaKrU/qbtpkUbCxJ6Vm4tnLNpScs45Zn38bkvVNmAPCyOPEAACAASURBVHIAEOnDe45QCXAPACw9BCtfNiTYJAEpoHRx0L3gpp8BiNrEk7d3JwOwzQXTMloYD7ANHzTOFkBeJE46EBqI67vXEQBMLTksEcVNob6L0AYA+RttHkcd4rkgfd3kATSeZpObJPU6ygyLOgOw7tHT5oUWABj7UI4rOFit4PzNO3Djm9+E61/7M4A3Xo0A4LA+gnEMoN8KZrM1QOj9B1haSxkyuZdR/DyuyiycgLsJfb7mMBv2YXfvAgzDHhwdH8JyfRvmsw3MhxHmqU9qWO3VsIDVsAvjbB9g/xLA/DxAyLiLmePhv5Q5sA66AccS0wdnM1gMK9ibHcHy1mswW78Nm9UtWA+rrQBA7RDPUpYWHuYxh816BzbzfRj3ngC48hQ8/Ru/A+c+/klYXrkMd3cXMC7msI4ngISy6hnMYbccPKAUTvRJVYWn5SF0U8AcJea1MGlyi+EfmTLadu2SnX6cAdgs47qPGYC4OCWhgPwpHfBH/ui4CLLlEulSrlO5j5tD7sw1PgDIQWzNrW29LtiSPSafmAgAdko4YzySWymlShFy9IIWpM1LEwDUPUe5rHBatejZqkDRcQXZZSWsWXfgt8zopQP+EA8Vj5wCQs4HdQzAf3O/AUC2VJ6pjte9ij35kgYAOKXqKcXl4XvcRwimpWRN+RlePF4gWRbcQYFvY/ZaH+j5afviAYCodsJbU+q74i/T/rGPuiXA5H4Y89Hv9rLP8BX9CEua3/pej19cAK4pmTi0fg/rGl/QZOmNjzJU+4LRiT0i+RLVWQzJfeau9x2qQpwAd7jyv/9h45ZUnx4DwFSHrAZRFFfDwr0LAOA04moLhgtLyouPPva0S7/IT3UBwKkuor1UwkHI/yh1LS2AAMdoBDyK5pXJT4gT/b4LADIAgOicM3+UxSM9SO/F+/oCFKYQW2DlReyyM5pYoTFCyUB8S34D/q28UZ8SqwFAq0eB4GZlbOgafbHj2xWgtXNTvwRYuxVWAOtBzFJC6Hstw8Qzu7jBs+QMzVCPAnUJCOf3zCv08k45oM5wbRk6wUHJaWyN0NGNcf38EuCeBiqj4X6C991JnpSQGdQFqBIkAMi1k2WwRQBhbGZYJcCOz8PdjUYJcNFdPQAUeVTqhGkGfxoFy+nMbR7u90g1VtIEAIuOQodBa5GsXeMhDbJtQntsyJ/YJ86UzxMDgNy2dGjzwACA0gZwWpQSNJyHLgHWpyhXJTGcm1UGYJC0yEPxFOB1AgBvw41v/j1c/9p/B3jzFZjdvQXD+jj5UOt48Ec8hjfk4QUALoJw6ScvZAD/aE6h8X04/GMP5ovzMJ8fwHK5hNV4GLMOw22zTcj9w58AtK3DQSGzHRiHHRh2z8MmlNCG/4Yd/C9k4kVAcAM7uzOA1V2Yb1awvHsTNus7MIcjWAxLGMfDEwGAGdRPTf6DjV1H8s9hGBcwxl6F52IfwKd/69/D5U99Gu5cOA+3dxaw2dvFe2N7hAHmm108aEU4SjhXAgB70m48Vt9+CoXctS3povf66h06i93faZmm8La9y+hxLV5hBOJVk3vnFN7ekKwNDFFCeL8BQJY5nf0T3WaERDstcr2hxLmDbB3zc/MciVKSW2LFSEv/R/+6WLk2rdscij6FfLJYrxArOf6faMOgR4D+LMUyBATqFk00hqhvu8LEs+eitk8f5D5EPyYRZd15avwZRX+WEJ4sTPGIjbHKp+mwLaIxW39n4y6bjNxmqbW6TgzmrJ+rMnoZVO7DHiCYxq5YrLdpnOli6N5kVljygw8AEoKSQRe+mZ83eG0ZiBY8b85ZxKhrvFAGmMjligPVziSdxm3J5wSy51u6AFbSH/x9eqZ6LbipQnpz8ASViRAL8cKaVz0A0I9++9bXLUl3mtC2ns86squwrB7phdp6856oI5JpuvzVbrGVrcmV32sDgHEXOjhfzBGoB9ExABmMsu/Jy80ub9sDsM/sjZ0bJmIVQ3OAjF0kNpIZgLK/gD2W/KR5WbInN1TJnLR6pDUUXDR7yjETLoZS+CcFANEBL1MiUIC+dTYAoFodw5vX/iWNg+jQBQCN/gRCgaXJ8FFYxqclAZwWLT61DlmhaarOjvEVdQDrq0ChwNP698bcMna1+xYyxPwSYJZjhhgue5E2Bi13RRjv5JTyOdhS1i9Xy75tR4VRico2RpWrcFodzpe1SeoMwP1wNjUnBABpPdLuu/L2dQkwn4c7tGYPwPRkNzigLFWuE4NDZXVl90eCd2j3G3/XOoNVy1v9FVK0jPuYjsKRy00Lr6cJAoAEAtZj5mMIn7p3AKBP0+zgOZsAvTedTQZgW5vp7TnzkDE2fu7QSc7DYDpnpBALRwAQD9QIJcDnb96CG9/6Olz/2n8FePOnALfegZ0I8gVeCesaAMARxgj+pXU2fNSQ/If6KfDPHCAAgPOD+F/43Xo8gtUqHCSCfUSxSBYDmtj3bhbO753BejPAzsFFeOLik3BwcAmGYT9mFA6wE8tsd+ZLuPXWa3B0+y1YH9+C9RqBxQBUjrCK/3GXnQ4caa6pOjUh2OcwHgQAgz5eBNgxZgHCuctw6Vd/C57+7AtwePki3N7Zgc3+PqxTX7CwvTTf7KQMQEP6AkjoJMgZLoPP2C37pDVIJxOl2HBax/SwWuvK/9S27ZQZtltNtjLwKcOt4yzoSw87AKgz9Ps9lNBbIQvCQUCdRJATOVxANGmd/EA/gEUA0F6g8Ft5ii8tcNMDs5MKGkxE/mlrhDgqq89dsWsEiOIhIAkeyJtgzGpTm4MuOVrls1yTtzzMJHgUG8bBZw+e/V1aBV5CzPsvF5KVtaG/lawyJl8iw1FbnrYUVxUE1a29+U5pceJokG0qWIy1c/2haDflGHqgkx6tiH1ZbIzvOAEAmOLe4vG1DVCUPweg0R5pkQNyMMjf5euIlYJU3dSNHvrqw8/IdABe69ukj8g/5BuCEv6zjKHk1z5/UDDpGag2EawWAPltboYg9litzCb3H3opeOIUdHrI9AjyG6M2ZbfY+r0MgLdksSR5uNwAAGnnHBV0WhQzA7CvILJSNG7LS80mdKYAYLMBZQsY9BUiLzHN5oGv2UTDbZliq88N7wnEzGHpk8EBdqYryRnRrK/p+8ADgM7ud5wPF4jkSEQXI2YwKoESPe2UsuloUg6qxtRetb9oSYHJH/zGsF5RvtKHYzJJOjY9rms9oLMCAIsLVgZE4A4PXroBlEVfNj90Y1gPGLV7ZmnOyl0hErDeOtk9MnbbJcXQOHfMg9nPko+r9LByHCHzcvkyBzoyS2fidk248+FCIPRZt80AlPmzOrM4O+i8LHwyKVo9AMm5aQUHRdOdbQagdKyLe8/przio2iHXGrXSsJk6+LXHAGCPXR5OALCcHBuzVWIGIAGAN+HGt/4Wrv/1n8LwxssAt2/CYuQAIGb+5dOfM/vk8FBo0GEI2XrhpN9d7KE3YC+/sC8bTgIOHEbgXwAXh5RdGMC9ALzN9g5gtnMAu7uXYgbhzs4FGMcFDKEPH6xhtbwBd29dh9Xdt2B3vobl8g7AZhXtEAZIHIxGfu6erKcdYqo4jmKQDk2JIOAuwMElWPzSF+EDv/YbsHrySbgVAMCDfVhFm47NcOcBqAzBTrLbHKCNp4beQwCwD2yQDpPczcxVdWJ6trlW3MNXnce8jwFAAbve6wzAuAzMT8H4re1B0DEY5KdzP5GDgPcPALS2vVqczQGvKUY+zb5BHqSFBUAVXZd7rmf/gu7HwDpvz90zAJDTosS5NfhXIB9OUR7f1wBg8j1VDFN0BAeguG8i/ZSu/ZQDMABci/7ljf4hZ30+8DO02Leifyrfd1oAkB/aaXE1f3+kKosjtgUA+fDLkt5/ALC3QhgTtO/w1s+7XicbFd4lene+LgeXB1sGXH2/wgO08uEWmE3eyNyJkhFLxEu8obW9zvDTX9MAYH29Q/wKAPTkPqNyWQX1AUA6xKu9Ag0AkBVHMQBQ7Gp1yvXocyUg1QNggbHiz6rkalsHKL+aFracqoqj6Bs5XiJZk40OmZBvkiZWM2BbAuvgp2YAfBsp8XI9q/U6w7Ykjxu8p0sQSqmRmm16lpcAxpGw71m7nJm6k0qAB+MUr8IbUxpg5ww69j2OwcYecnxqEwDAVkivld2UVHSimSmCEQAsp/piNVkpCyiKqYxIr9/UMWSZVICG4FYD4Hf83xpgVRPVGTi991mSKdaSXHEBdKen2EQ4B/WyuxzbGPnmdABgIYYJACpwSLlKPbvOrpWJW/q2XwIc+osVA0jgH1IUiVx26O3Df+Qga4XTTXigBt8NDwXBBmmSdYZJx7wa9Kv1Kz7PNYQ04bWDLL+oDX5l6ZT9sh0qxvlmCXD9lTyK7iE91D/THmX5Ks9klAHDtvObyLT5Nip5aT/XH4GVJc2kLq0s15/ttY5czwIqvLPYD8wATL+Lf6bm9ZsRZutNzAB84uZNePNbL8L1v/4TGN58OWUArtKQwvPrDK5JeUffgt5PpcnDbAeGCPoF0GwBs/k+LHb2Ym+CMPcxZB8GOYoHZ6zheHk7/jmLfQY3sFnswCaCfaEP4D6sl8HIUClwGNctgNU7AHAEezsbWK/uYJZiFP7whhoA5LsmlX7PMp02yVJ8FMDIQDI8DXiOAODeRYBPfAY++OXfheG5Z+GdxQLg3DlYsfLnGSwi4JgBQJZxEt/XAQBJdfR0RI+7LHvUCjeYyqS/FgDQ8NEsfs/aKds3L8Ohg03RB7ZTkHJYzgmOpDk5TXhAFFSf10MVbVZL+pEi/P06Y8MGmMr7Sp7MdM0UNWD8KNlHZROK9qIc3dzLNo44zaf4x8Wn8+hRkgCsOKK2tn2AMiWTi8ekfq+psiXDsJ7ite0jALAeN9lc2sAvcQOND/8k/UJ8YiWccX+vtHQQng8TFD1/9m/BjEX6JY9JHyLSPy10thcMpLB7ACd65Jil5YN41tc4VbcqGe+v9wMPAFbpfkVCov6fyZ72yWQXCVX2XAOAvR7+gfrkD4isK7Lm8Ybap6SPx8tOBiBfeSr+Fd9iJcDCX4glwJXEiV9we9LSfhwAs97mAoCV/hbSmHQ7SYbWLYk38yM1r94XAJAN024JU26o/UWxSoV/GgtQx0c9mS/aMNuW3OLB/oDXI3S48nvyEJDymjTJeMogXziWxGmAgJZBF1NiGSqmg0Y7vVlHtjw8fKsGhEXJXtXTSpdsdZwC7oQxox5KayTPtxWApKVtWOX407voVvFqdJ+t3UgK3JH2SgDFYOlacS40AEgOSgtY0kCG4AwFDnrHo6R8gorl+Bw9E0gZdEwkBYkI79JOGX5UKhwNaHJFHhU1myzxuTc+4nGT0wwAMI9IKMXydJXRWO2IqC/1EEI9OAZAlh3rdo/LyI1OD5Hu/Bvip3mKaB+/J9agOGnxHnpflh+/SXVlv9iYwvtODwBKuc9bK3GwinsysTyusgmXpVvQqAildAiK/iw+LD6IwyDpTevf4EfdU7PI1bTgtNdBFde7T4ut+UsshwgvOsbAoXfvyUkbWGRrw5+85IMyCAuvcB2FuljbFUkvzEpo/9R6kzRQgc6bz5+SXxFAs+ZQad7mBPoAYE+68ZX9Dr4FgI79pwIAGB0ukiTMkMNDQDZwbokA4I1vvQivRQDwJwC334KdMQBtqcQ+Z8il7JkQ0c5mMJ+FPn1R46QUpFncHJrNFjDMQ/bfHDahHHZ2DhY74WAPPNBjZ2eRAuVVPmF4vT6C4+O7sF6v4wnCi8UB7O6dj3/OFgewWg+w3gQg7ghmwx1YHb8Dq6ObsQR4DKcLp1N4w7zC/GK5cqIWz1iPJccs48/ikwhqpjUOf4YNxQAAxj6AuxcBPv5L8Pxv/XuAn/s5eHsxh3F/F9ZznHvMAMRj2PNPpQ5YAJjVPxuI7XWV902RDf5NbU63fb5iZOWv6U3GdvYZvql9iimtWD8DpKv0KjChvrseL1urpLZaa0D+aouGvmy3MszY+nbKtONduoqgynSvNYQcb5mdTYt+vFRRlFeEGIujA1IXAJxghvmKefxU+Z+d9CKkR00tabONKEEIWSmxI59bk6V8ISxeqaiJ/NN1H6T/L5FovIaHBPD7sheFw6g2+BLTK97qyhm7yLjJfCQnyGRHwJIu7hfrOU4dCal8T4PKwWtyC8DWPAW4eiK9EKv0+NfROkqO4vFoInnO4M0rkVuRlfiBZDXatrYCksRSeEf01joOKL62VAtYlLdKuCmep/ulBkr81/iuSAhV8ZL1/SjvnfnX69nhB+NVMomHV/wkvlTYksedUv95G2Q+3mNU8ApyVAButokpVsqHFBm2MesHpiqcCaJ+tS1MpFi1A6LuVdejb9op0x+u/N7v9yWcmtGQtWQiGQekOKTnEERx0ApTO2tbA4D0ApwG0i8p77TnXMY4TRmSoSEBFkIsxpfK7TwdmS2XvDGr6UwDBXYSL2QhoeuW0qS3yWv1DpS8HqfDhNACALmu4WPO1FRrqJVyn+drhs+Kz3Pe4nqjwTfNYCoR4l/QK4BHxpcRWu+hyxUA6Gkr7/pEAFDsZQrAzal/QoHrRAA1v1FGGAcAe9NwAcAJmcK99+dxpIWRspnmx7JOtMX2MgC9JQry0QcJvDdojmI7lpXhbcm39w28bvOpXOMsCxvWfDvr8WTUEt+gfm85aNG61QDwNimpjnwr1WQSYTtdY7xiEkBn07+tudj9k95PLSlqWS32lIrNEj4U10b16MqKuqxZNj2TWEiOo/BKVwNsFWLKN6UMuu7Y+lSeAhK0X98vQSepotKuuNsbPWwa0xQA8E3Y2VAGIHPggvyFfLh5OOAjAH30ZwD0Aug1g9mAvxtmC9gMMxg3IXNvH+aLcxBKg7E/IPIMHi6ygs1mCevw3/oYxvUIi2EHdncOYP/cedjdOxeBxOUK8/rGzQqO7r4F69VtWB3fhs3qEFarOzCDVewPGEuVOwBgDJhDhkLTwRwQ8GP6JGZspAzAcfcSwPOfhg9/+d/B/P3vhzsH+3A4BxhnCQAM9OEAoBGA8QyQqJEMW97aQyBVVanhxDC1f6asC7dJlmqh93Q/UPg7/C0egLzFjwfYbCf/+sPtVjlkbzx139PPBSBqEYhywOzrTCPaFGOBf5OkLQAwG1RmE01NJxlOaiupz614qRpXBMw79FA9pXLG8BY807vV67HLMxhzQVqHZ0X8wSpMqMy6W58YffO2/1rLL+pN8oTIHLaH13o3+33Sr0ry2T+5UpKHlFS+qrNG/nippVHisjhMM/JRyQ1bKhU+zgmbABR8Zf8zPx8y1JXFNwEMepLonv5U+j7qRw0AZjkt6RwtTIL7kwIA9GSnER8S+Xs9OGVLnlq/2vLW0buOP3kSAHAb+9jNCKz8eakNUV4ZoK7ANG8Z4tOaf7r06Nuv+L7In219K4/RJb4s+oHWz7KDVfufzmdo7q0M8awbhEDVvnFFn3h/W/4fYgAQF04ybzgVFpmM5xUUg9o2JnkBKqdOMbEGYIola/Nv9sLkQtQOpgMA8gwB8bXWvOoSOj3IFgBI9+kxtv6d7+dZgJNCw3aA54HJkQMmAIAtEUfwr6yJJSbZqKmLE2TZ12ePAcAujSrDxEt/85OpCbep46ZlAPYG8bADgDxr2HJIpTwnvZluxOCtx+nqFKttheIxAJhY7zEA2DeefYDAy5Jqv3sKAIiblpQBiAmaZLPuJQBI3wilwfPYz28MAjnswGy+l1pHDDHLD/c5w/+ov2DqObjZwLgMO8Ah9Q4D4/nODqzHcF/oD7OB+WIewUJYH8FmDIeK4AEgAQAMJxSfBQCIWygFjYnZjLAL495lWHzic/C+L/4mbN7zHji+8AQcBQBwjuBndO7SBjRtNOmMhXiKKFvgxwCg5PbHAOD22iF709k3rPtEIZUV5FEBjtIvj//ybOQjBwBKfuQ08GGp+wkA4rhLQE2jbS8g2ogy3+pOw9+hwJ5TCb9kf69kCBGaqqlIPJc9Oz8O6d3hAIA28JGj6XsOAGZKMXD5TAHATgJDpLRzCM9jALBIwaMIANIhGxxcLtzPgHqHj/IzrCaY64+HCgDU+kQoQqMEWIBN6VAHVF9+hp0G9yoAsOpR0Tc7WqHpo5hlxhNbYE/NGpqyAgC1NcgxQPTwWbo5B836it4roSv0Si6NKkrPjMedbO77lBAWzVYDANTGsKzC2QOAhYyhvCrNy1x2/xQoPW4va8BjA3H9ZwQA9GjSksipAGBwluzMidMCgJvY4/BhyQA0xLLKuLYDwtInNR5qkJr/47pYvUaYk9u/3F/6RwAAtGguJ71Nlq4MGPO7s0LDDS8eoMpgoR5NtweRCDQoni1jiNLjRqw+BdpM8DBkAFLj8BTciQzAYO8aJcBf+xMYbvwEhts3YLFZZhLkgDJlAKL/MsQMwAB6lVNH0fLEgDKAf6ncaAj3hYxA1g4kiCxlguUd6SHkSoQDh1GHzedzmMXS2nCCcOgPGMqDA8wXDhgJH1pGAHAzYPZfBADDISMxA5CV4bESxVIC3NLgKYMvd2IMG7ThqXBC8S6M+1fg4me+BE995gtwdO0pOHziPGwOdhAATEebcAAwaSZZFqaypR4FAFC7ij0RfJwB2PHnJ1SQtHQT2sEoGDmDlRxc6ROqf4nFUvrcqYaIzQVCvPLIZADW24eRIolkMgawVuJ+AYBlLF4PNJldE3dpumkPPKnBiq2I55iHJQjTBwA5+NePcz2fPF/vAYBuhu29zwCkcXK/aDsAUGdISXkueoBWWl5H/WuDwmhX+aF8muqhxLw+RRb7EjTW70HOAKxKjnVsH/zJxKNMvxJVpsRZD1IGYJwJ943c+ddSp1d5EBW3rJ9scrPloSM1dqLp45YAX/2Pf9jVFDrDjk+hBCJMXTHjZYMl7R0UfB/2bcBBWSfOseHG+af3iXRSCmLxHXyCdcmiBNM0E4YT6PiPlMuyQ20rVF6jbpCZ9cZJvoZ8Tboe9UuyFnhohAYAT6PspZMSS3aMJWq6+Jn+OMRYQmqkbseVCHqt6tnTBgDpmb6xwudpfLIprFSkyC5lcuiMyPnXAHC1JNnmtzl5qnm1Mj45/9PM2gGWu6Xc3cGrv59diImT80qAe5RoO0DtpwjAysOj+ZEzktYXRYZ4ozUZMkYN6U1k7xumbWUvBfbpk0HhizdMKhl16MMu16foyvFG8qVSUpT7lNUkdqDbzFAd2jSV9fFT3fzCuHoOeXslZpOGcsb0rr/Z1294f5Y6SRRBn6LnUG/RlzSBhLVL4E6H/0mgqoFjrzukf09+JlG5cdPpAUBM+Z+orIw5agazTn0jPgy+XjkFFzXMOmbdYQ/A/eMlXHjnJrz1rb9lPQADALjKjBwO7Sj2GwHd3FdP8WJ8bxpzXvOUFRd769EGqbBrid/Su3ADo/AYdjAZYYwHfcxhM4YDQkLp3ApGWMJmCCcUhwzAlFkd74tKIvsghYwUwHTsk1obBDjm8WCS8dxVeOqF34Zrn/483LlyDQ7Pn4PV3gw2izme/BvmGBxitrz6S/g+m73o3tZ1bzPvXj9PPh1NMEwjbGQ9BgA5h7U38dwSYGL7bVWUAf5l/zK+KzGcWfLGlLOTPYXDk8xb+QNq7Fo/yVignqgPYMlnTlsCLPyB1JqF/Cdut/Dv1iGAfDynAQDTV6s+8Or9qjxOzp9G3rZ/kb7EL5Ef1L1M+dAVfkcb600617Rt5Q1lg077EIxjOz6Uyx+nBABZMB8JLzcsLN+IfHL8k98f9SN14E1zymDyiTMAefwnx4OuD17Hz9Xj5ZtjWvrQteoBgBJAwuf5/A3F5fqraoxWkzv2WorXLRVp2UeXX4TO1fSKx5Z1EiqmVWSUsZKvw+yFbjrpBBAnLQGmioacAZhjRW6/bd+/KY7xdoU3ET0tFZR983KxOiQxTrCtAIbtAEBlLIxX64DQC+A04yEAyAAdwfBcWIUfXQdRqcF4AYeQSDVgoVNYJCLPAUAKBAQDxkNSWh6Gk/1BAGBrgQQAiMxUmnDz0MDzcHpRtALJqGdPeqX+SjZixPAsYzP8ikp0uLHPepToLwBCW0hoRj7/lPAGWUf3WJNz1+tfAYDaP2D/rgz4KXaY8bU/2wBgso+NYoeap21eKDohchI79bkAgB35iKeutn88QLinXO23MmUd9f3ZAoD8m0njiSwudKjqAx5iN7ngLKdTaLPfmo2MIQgR0D9FCuAjAAB2sSfDQNc8QYqUO/DMwmQalXCXZ1BI00POY3qeApKW+kcPtcn85QCRdgCED/fsS1u2qAVD/+m+fThzAJA7kCzDIegBbAhNm5JIEwQAsTfgAQcAv/YnMLvxEmxuvxW67mUaoYPG9H6Wn9pZjnIaiYMDiT0DE/CHvyV/QEs9vguv4ynzmM0ZsgHRyY4AYNjc3CAAGPoBht8FADD8iWs/xtOEo0U1A48QoPUczHrtwvjDWzezXRjPX4OnPv9bCABefRLunjuA9d4cNotZBABD9l8AAHv8UW8oGhLWYN/HAGDX9CW+6+iHU27QeAEyBd3tHlvSlnmzmX6dBf0ZQCI6FJ4m9SnZi/O8ilfUAMr8mL537OlDBQAmnZNnx6uDCLDp9uA6KwDQiX/YunCAI69PM74jAIfu1KZQRgx1/IgtVNobzI7tywky3HewssfaqacuoPMQAoAlgShBduRiMX2VMdtGT8LMMbQ5Ho1oHc+LU1Y5n5Df5gKAWkf0eZ7scDv6V/pH9QzVOvCeAIBM4LFPMf4C+dwCAClS0frc8yvTXNltkp87mZTkIp+wByDGSyoDsOKzWn6rGelkKYa/VHiDXjwjvtAAYN8/AzgDAFCZP72l4SM4ZVo0ockAYKyhZI1iZRBVAqVCyqkAYKZt2IlOI4wZbLT/l8d6vwFAz61pOSHIipT1Q2/RTSjF6qaKWr6ktANPjB2PFU8lS9bOfaT/mQKAOPLCOhoAZNcj4KKted9JE3MlPiBiPQYAdODAjQAAIABJREFU3VOAXe5kvGA51KbvxX3xUhAZP8VPqaPAoV1C1V97Mlt9ENAzUpoCZUbhyXsJAKLRlUYIDWREMwR2xcE/1AtpXuwU2awT2ZT4qaDeWlfXH3YA0CnpIv7xM+iy9qzAtBI0JAAwsQ8HaCVHMaKeSD9xh83IaLAWUfxOyoPFM9zgTzkpvpvhd9YZgC4AmKQqHaIT/GsCAEMG4MVbt+DGN16E63/9pzB748ewOXwLZuNxDQCSLanGH1az+DEkvUjVIM28AiDYUvI/OA9RK46QHbeT8iaCm7SBeXSX8PAO1AAI4AdHMZyIuJmtc9ZFvP9eAoBPPAVPf/7LcO0XX4DbIQPw3AGsdkMGYAAAsboiHAjSK4n0MtDbup+dCNlQXJmiDQDgtADiz3oGYORoJ6OFl7rXy7RtxshUC5XkrwL/UAa5PtL+sbxO72l/V2pLLAHu6bt7DQBOpRBSIgXsbBLSv277V5S538/AOQ0ASDFBOihr4sTQP2KQnFe2rTZAKlWhFBC/TivdUC9mxpmcBmXos7iXZa8W/yPxreGqPqoAINFJx2/63y15Ir8FKVs24DQb1RmzZKkJlvAyANnaoULsb6gmfTkdANQJDpLb7iUAqBMw0IOVG4Zc/2d9konsxWcPFgCYl48k17BtQgQt3WJlAPJ4izNgdq5ZBKBKykOtB/ex9SnuPgBINo99WBst/m/hkFFEP1H5kuET+SksAC2ZBiSQqQl9FhopTBIARCKZPfyMAKbMCZmsBGLMPJsZMEqdVx4oWyzzFEduTfHvTKWoDMC2GihT4quj/p4cHPptnGOLAVMwGUtU+M4vlfTSjl4AABOwKL6WrtsAYJtBpvWgMgBAIVysiXPnVGtrFAT6ZoOiBDBx1WQOr27k/IELIABSUor2B6yyLK4tDItvvghnIULISeCGlVG7HSmo5J8GINxfF8CoDQQ5oCQ5vQAQR+rRSMpzHfT1n6+vShew1keocKvn2l5im+CVgQgle0gz/YVyIE5yedJEqxJiZQ9cANAhb29aZD5a93AnbTuu43f3Ay4ESxtvT1lZ/W97CyekTtb/sew//AbTBkz1M4uSbkvvdOVHj1zqE3pvfwaaOOXf09anluEyKm9tsFqgCxC6jCG/rwMisnXhT8wA5JZgiC2f4qZXyABcLuHizdtw4xt/A9f/+r8CvP4jGI7eVgAg/56VwUfv51Y//S74QjGjD8ueN+Hfs3k6qI6fyE1tOAJ4FjL8wjPoVSF8GMabAoMkZKHsN2QBIgCI18J98zjnMJbCBaUsi+ZiC4jefIjvjDvcAdjbhfGJp+CpF74MVz/9Aty5ygDAecoqjhmAoVy4zYEeANhb/m32plvv6clGluyOAtMlg9rf8NjXSfDwi+O7+jmnsbS9ho6O8eXf8V8SF/ZpcAoDI0VNOvZiY5F/Qy+m9++eflPG1PC/9dzrlmGOdu70KPN9H7I6HQZWG4k1AFj7WJwvmgeI54m317f2xShDi/mzHSG33lwBgEzd2/crQKPHrIas6FNt5eO+bcsZ4pGVHFtqTKCmP7+pL//0SZs70m8VCGL3LGXOTO4Lg+MQ/Wej5Uu9bckkCoAOf0n8Ra8iP5IEnI832MHyb6Q319vW3/kaVRln7A2oywmktRkj06PCMKz7S0s0TjHp/6jVEKfAEj9Zttwen15bPd++9tXtG6itSHmKx/cktehvlEyr1iZx9i/YIOoMwFr/lJl6LQgwwy+rEPKVkm3ADED+8bISxHNVAoYiM+8xGaes8Be9KmI9MqOXu2QGc6j0kDpB+0vNU4ArICg5YbRz0zfKEpDhQmn12GGrrYrTuIOsFBOHK7KES4e0GJqiSD0C54YypL8SJ5YFVSq6OhU4c65BIlo+YnUcL4EUWGqTqCUMV1Gm1AOwlEr3HYzCMIaz3gAAK4XOMh91jxozAzBnFqpDQeIypLcLLdzgppwJ2nBAlEENM8wlQRnA0gLAShaN/iBawPi/LbroHWE+E5xu1RWknmxi7SxbIiuuL8CeA4WvbtCvgWwIveIgaN0AzAURpTyEkerDPGLpnRp+EQ1sKs8d2UgtUtRChvqmSi8K3W1RrqUL7HcgoJt/xDBQv8lvMAeEHnLp2NPGRfdFXbOhnl7cDNLf0255KBNU48xD0QC1k4Gl/W93x1lNpcW5ZcSeJepf9zJMcMesxTsBAIpa53SDyDUS6jtCEOU32vxJzhPaEn9kmrk0N/bsnR8gmGA2e6VXQto9xCSytleC3qeA3mDRpz5yQCZeS8oI32oDgLf/4Rvw8l/+EWxe/WcYjt+B2ahLgHvahdM7bYVmtgin4y6wdDd+O6zdHEHBGfbMC+OjYW42c1gszsWwKTia0R2nQCO1PogZAOMK1qsj2KwPYdgJjQ5RR4Q5zkbKYAgZgpzXuT9hy0csbqPbaEMhAoDhVONd2Fx4Eq796u/A1U9/Hu5euQZHIQNwMcBmMcA6fjxkNxLgaYuY3tHeVhBPAwISD7TUQ7FD9qiibWMGnOwKt9h9q0W+RZvHPavHv2mN0usJ59Hf+35XQ02we93xT3i+/r70kw1rzMhkHNrBJ5xLxBpUyMkNZf36gLYfsCptnfir5/85HNbN0KyLs/P4q0w0/A6ZNPqqf4hNexFr75EFHsny6QC75ee19Ebc3EkCafnSvATU4kVPPvqAP/fdGjqEx4xccUyaqNYftCokA6wSpPo8rn2I52uPIf0m847NfyWzrrxc6xv9pK2vMVOUcViJqWPLDiJMsEe9lj+1j0VnuhSK4FhzzK71N0cwonukfWk214os6SuV7BR6Ro7IImtKgFgpDVDhcAtfZf422Mv3HSXN61egf8R/CiSIF3j0U+ZW/Mq8pkm4JH5UHxJbxxeeBVJrrnsIFq2Ff0sOjfXWejXqkvGKRoqhvQ3Nan696cUziRACbP2cGAAsAtAwoYkaNKGcjacQ06KzNFqMTFoAOz6NShxVGXAS0kpx6xR7TRq5gyTBOTsOlDte3oLXCr3uQScdEJEOFnsAzeMOOmVOYchuL7FkSK5cuKos4W30uY2AKu+0NUqAuULkCiWn+VN2oOrR1+HLfIlOSWwysEbAVEaiDt7rHoBKQTFSuurVKV+JCi4AgG3/r5pWXCWhk2S2VjX+LgJY+oa1ad3pkzBxfq1313PRd0p5iM5QA7SwSx7r+B+/ibwunT/PEMixtb6X9dUEcAVtbafDy0aekslHIDTcpECmKSEMoNIAoKRJdOhYvrH1Rq3PvQzA0wKAU3TEae7xAcD+29HB8V2lrvzFVxj8qZy16fMs3OOObIKM8+9OLfEqz/SCmNRDrhOfIgDYuCG+2pth//tVJmxcUBTusBPN307ZIdjYG394BuB+ygAMAOBPAwD4yg9hWN5MAGC0kpjRQGBY5cjXK5z83nQh6AsGAI4BCNyB2Sz8t4i+0nweMv7C4ANwNofNZif6C5g0SHwx5l6fYSbr1TGM67uw2RzCCIcwQDi0JPUBjC1QwijoNOAQRBUfBcnf8j/SycmMv7EHYAIALz4JV7/4Fbj6i5+Hu5efjADgejHAGADA2Sb2/xuGBfYDbPx4AfZ0mTFon6bV5bCO/BQ7ZI+CAMDq/cm2kPhz6irXoGrxIJZigt3oLF8ctLdh4wUsLv0d8fWstif93vNyA5f73vgkvp/eYsQLcQOyrcA8AFVXuHgJCm7TekXwEvBbKyG8jOoG5I1+CaN+CPmBBEfSzQJ8qCdxQ0KQvxv6P/vn5iLT1bZ/W0bX5iJaPxyCzlhNFRVkuw2f0JOPswEAfS636EvZSTLXpMiAtV7lPRiXSACQZCH96fgW3Fen91oZ+K4OyTLKxp7WS/fsLRl30/Jfo32nrEDGJkhxFZspNy723K2O+eEUxL/Tu1CNcB3EZ47Zf5GyYrl7+kcfMkL2uDxTl0BPo3ZSDUacJces8dbM78kXqdMfis7N8CKji9gwS/zF6eHZK292VkYn5xS9YaE1h/bX+rFBrX/tFmWMZ7yMHzXBuMHbmfT9BQC5bVW9NcgwnykAGEto+KmByjhEhpLXvR0kv6RYCoSdzlSWqGQk0O+4F3cyADCOIDv/WsGUECjOvgcAptdwptcCHAFANmT6+5jsOD+kwxNGVDJ9BwuFn7G4AgCZG4BksAJGfVMaWHYwWgOdEDxPAQC5gNa+Dq5XHosaf1/hPYIAoFoL3dKROxVnAgDy77FM2CnZVRjAPWgAIJWsJD0grKcPZVXyE0vq2w70YwCwp+V0oKTuRQY6AcBYHAsvQLYPd2iP+SQAYKuJP2akxqN17Z9UQvPuA4BoU5DyxQ5jBiCtCQ45/io5ZfvHK7h0+zbc/PbfwSt/+ccw/vQHMKxvw7A+SvOrM3BLib1NBO3sIwBII1vAAPswG/ZgNg+ZgDPY2z1I/BKAtgWMs720YYg8EcfKgMCd+RzWy7sRAFyPd+B4+Q4MQ8hYxGbdQ8gwjKO/BwDghSfhqZAB+IvhFOAAAJ6D1Qxg3BlgORsjABjm2wMA3QB7ipPRuCdvfHZFuC2fJwYAyaVpAHiZUwz9IAKQBx0AnDC+UyzfxEf5+nHfmKOwysekN+cTvJsOopNxVAfzfg9AqX+8SW4LAHJ5QspIAM4LsMvzpU1T0pSoL/mAU4ZKL8P+5ABg+lDWdTWlcCw68UTeVwO4Uk/rElX9FVc/dTeSfduPVWOPLgDo8Xe5zv3ZYrMRNEMeThawFEU6+ifcb23wFheAxWYsNigJM1MBQF5JUYNCOMeTAIDJv8pECgAg8RTy8f0GAIW+IXc4a4qSfUvA6LsLANZ6X59KHVemKX6W/Ipov2JvCb/QveUZT//qF+oej2dWAswzAC0hzdepdDjZLZvhNNRSmFQCgJwgipAC4GImJws5KgE6FU8qDmbRU1Ns+o3O0LMUfBmJteDFYODfRH2nMom0o8CVAN91IgAwGa14iSO8ihOFrWLODTeKDHFqAYAEdsTZqU9ogOvdBgA5OBaGRiXJep2ySUj82MD8xGNnBQD2jJjg4vRBSWJyUxIU4AKA/Ol7DwD2SpzJULbdEykvkzIAFTH7AGCW4k4Zp706xciz61sDgPrAG/WtlAGoi8QrtX+qQEkGOKVkhRwmZuSEAbbpUreGCOWFbQ5/eAFAJEZ1ZpCa6ukyAPkaGDTMTOjCeJqxMr+7T07YxOAv3xYA9DIsH1wAsA4NreqhaO8IAFyu4OKtBAD+xR/BJgCA4x0Y1uEQEJSzzWbFdFEJTiQKynyGyAPZeqUMwCTTww4MsAez2W7MAJzNQsnvTvZzAgC4GnZhDG0Gqo0v9DX2dnYAxpABeAdWq9tw++6bEQAc4inB4R7a4gunHeMJxtGHSz5EPBhxmwzAmBMxTz0Ar8IzEQB8AW5ffQoO97EEeFzMYDknAHB+7wHAhoFy7X9cmnsDAFo2wNx0Yt+3xtu2vciRAjC0VJADLngAR8/34a5w9757elFrSO4n+1lC/QzU0nO3NQVtH+sMQDm+nHybX9jX8O8uAMj7kFKo08lAGfxTxE8FABoxIV+HssXTpqGXwekF5G35SNGgyjKXfOIDgDz+IRvTTfkRH/BKgEt7qpp/k5zwUDVrlDRuswSYaaRsO/oAh6fD8LNMbtNgMV4tWEL4NWVE5SSVrm+NLV5aG5gEKZIOzatFccLkDEC+KcftvfC8TpABaAGA0astuc1eE9mO7kW/X1dayTFXGYDJDyLNWh1KQf6OMEzFGsqSZvSf7l0GYD15DQC2wT96VsZf0qLUnF0AQO0B4L89faNHrEu8KwDw6n/8w658WSWTUdTcyIKkcJIbxbIcuMB2jLPQctIhJSJIACIxfTVw/g29WPyU3JpM4TdVCbDwauq5Vw6XmGLYcacSoeL0F2IrADCtQ2KNKIwzdshFOo6DrRVXkqTWSmPRqBoaJVVcyXHWtpxSSXdkedp40Gxdp7xKFvYCyJaLZgLQzDBIR8DWci7nTgiePQeZC3SkTchgFDxRFBz+WvKh5Cfdk+uUAKDKgYl2lvGHxRNT6FrukQ4OGuy2xcl4CLulDQBSsk7loagPGCUmHaeAj9FSgXK9ZTasNbPWKYiCDGcIAIoSgzABi6hsoE54UQELWr36BlLJ+wl3szt+SveSrV+KlnL1U2wpM9UYVuYZF6D1eF6b3vt7NnLCyCboMOHSCYHzZKvk0dmL0Gk/kFSddZDEaXRMbV3aCgfLVYodjs6UcJgxwI+lUJsN7K/WcOHWLcwA/PM/gs3L34fZeBRLgKlsdgzltbnMnrccMfyQ/P0yBpkBiCWyIc8gVzakKobQKiSU2sLuAYyxHBidhb29/UyC8MXdxQ7MQl/QzTGM4x145+brABEAHONBIVFFJMCPehSTHcoZbh0AkELM3FpgQwDgAsaDy3D5s78G7/3il+H2lafhzv4BjLvzCAIuF+EU4GD72m3yo//llIC7ktlxZGme3XfcAwBQ+0hiz7hSF8qGdr35Wgorf1Tdsm3AUQUYzg6K1wPupHp96nM2/xS95JHT4y8PQMoN78k3dXqKy/XQJammh9G1T1XPNTYh5KxtMgD5oYxJ5fS2Xh8CANDjI2999fMF4C2ase8jSfnuf2/TjN9a86h7+CWOpwMqmwTggERiGuGv0Lg5/+j4JBn5DmKp1XNbH9m+COq3QkMC/mioWOLb/unjY6mvLk8MyH4LthCZVgLM/SA9mmL7ty8B1jTRGYB1T8RtMgKnAIAaKMoVjonp60M+me+NTktanEIXRpFQmNCNGX35lfSu+UtqeAEATmgDhd+nd+j1qHlW9rTXc/esUQ0QVi0GlD12TwE+DQAYHTT64ORAgymOKjIighmEZDvStOgk5DnIq8YglavVDyTrtJxALFkqHzqRF9p25DkbtBV+GGkLAMSxhhJdOkuHdFtSxXEEMyqBTcJTl0Em2oVBUIlVonNkls6hFdpZ7Dk/mlVz5rESaTfAbpTAlTn3pdAqObZC5pbrxNetumcCT3sBikDog60MJx+KD+m+D+WqHaBw2Tg9AFi1+FUBV6VgPI2r5qYhCg8w0g6BDQCS80m83hhUN3izn+HztcaqM6TiCLqoptZBxnfvCQDIv1NLctTd6ZZ2kGgcwqJe5a2nnu22AedW7Gbc3AYAUx84B2DYtieTHELhz+LUsDuy8elpWs4/tX30AtR7XQLsbuA4iP/9BwDLelgAIMRDddDx2l+t4Ilbt+DWt/8Ofvpn/wXgpz+E+XgEw7gqzaNDBmCe81QAkMaAG4B4CAiCq0O0FxSAhT9pdx977cFiDzap7clmE0pqZcl+BABjtt8S1uu7sFrdBYBVAjWxDBiDAuF1JOCaOhDbjmnanydPBD2kBACuQy/jvQtw7hc+Dx/4ta/A0dPvgTsH52Dc34HlHGC5CH0LZ9gTtgXSRdbvc3j3qiNfIsOjpWjuNQBo6H4xJ50BODkowQm1dXuyoVtuyDwSAGCKJXL41WCiKnvPsi89+qXNA2GJK37WAJCWNc0gerB9/0L3vOKfxye3BABVu846xGWzvdcAYAxweiMg/9i1kk0348ECAP2Khdrfah2K0V25HMVJ9k68JrLurGiL83D7O6T2xd2GPKEar99TfHXGw0lcEAjEfrbtFiWYMdj+SQCf1rknzgCsVkdWC2zdA1DT5P4DgDxTs9ge5BF9IFvJbi1rUPCY5BfcUwBQREBxjJEf0nAmRG5qQfV61PFp6aGarU96xwTDbhwqVsXn6RDH7FGeNgOwJx5xUR8YABBPyCs/evms5aRTMdHdtpqi6h6AUpmUd3rAQXK3TgEA4htCAmBhHb2TyUqMEwDIQc8YPmBNT/6x3Am66K09534uuJy1TwIA5u92jTtOwwLgLJNkKfla/LU8+yrAAwD5GT1RHTR6qsUvKYJbJ9RJJfoYAOxY7xT+2M5fHXMi8T051vwctUYvypoAIp+uVIrzKDdAxEw1lxshBuM9eZX3rCiOGNMf2yiJE6S499fXv/ogAIBV1qRQsJ6Osda3rLMb2kzhP241f+YyAMvk2wAgMvnBegUXbt+BG9/4G3j1z/8oAYDHpwQAOQ+HgtyQzYdrHu1b3PBjMpwyACH0zhvmsI73hdN0Q2Q+AwSsKUrfwM5OyLALAOAaxvURbDal/18IbqObEB8iAJB4Cz1v/Jct5C4AuHMehuc/BR/+9d+F8X0fgsMLl2C9u4jg32qBrQWwiXvxI0WGQiRDn8O7V7NTYt913wFA5orlioaK1Km1DQPzXJlXXnAvBWbbDZlHBQCUDejbdsQDAbv0OxMAUOqHOqO/bz8eVQAQZYB0la2fQn9xvq3hewv1HQ87AMh7GMrZIe3augRpKjPkiNfSn6ZvwbLdqgx3ZmvZh0lNxxEpQK6sbF1NgJtHCcROM8mxZ3z/ACMd89sIAHuHKGTueQwANkTHqq7iMhm3MNmzhE/wX1VBb74YNwbPHADUU5ESMDK8PGvWVoxTxX08/mL6iX1CAoAcKZlQaIQCwuhTVwCdqgSYI/KUSluO36bvSoLJprb1dqa6uy4F5sQVgI9BzCGkoBNhS3VbVGNx15x/TRtGy1CeBgCUgbUHHCD1SAAYV6vdFCr1iXemTwgSJd++BOPSRTcPGWF04SXARMqWEeCKuaE/ZX41d2jTA30AsG7QKxU4p5mdym2dqlZWun9CDpqIXg0D3dE2kyYAyNYNd5iKuxIQXLGelJ2ZxiGPlJAyQNfoz9LjpOfa9HcW7m8GYE3XHLMleUF+FW6AOIQGZ94LiRrfEI8VOqPDX1ElE7jIT+GtEwGAeVg4t5aN8Ys89fysN0ldpcwOwg2ZTRTPJUAoj1IJzMORAWjIRxp4jS9IG4KARIeH+KtNNiz6Oa9CXiK5LrYUW+tbVrDH+XncrQwrQ3R0iXu/gAYPcer6R07DolaJPNEiUq8xSVxCjwIdyVKyzvv9kb3ejAixhZ+D9Rou3L4NN77xIrz25/8FNq/8C8zXlAGIIFrpwalth+GPsNOGUQmkDEBmL6oKhOjnBMAPAUA8ARhBQ+4HLeaLiAnOFwHhW8FmXMXTgFercGAJlf6mDEAGAKLuC/5J2Lrq6yaZvYn3UgZgKEse5/sA7/sofPC3/heYffjjcDcAgHshA3AG63kAAFN4cEIA0PNfVI6zIV6k5z0O7nlIdh+trBdZRgGZKu7jZG1LnzBLgJl+blxveQCef/PgA4Bt+fVtv7VBjATUniF9pWdN9bXombgZgNK664QCPYf+euiA27cfNQBY/Kl8/i9TsDYAU9aAdSAqmwNxGJaMUA/Atn/aPQW+U6VQPOoefwwwdjYQPM6KK2c1hm1PJ7VqQHqg7PVANm0TWvzE6C/I7M/AznBjpbpMnzAVhLYssNtYGloUXqVxpz8j/6SxFMWXrZj2EKT/mVYyfVyOl+tW6ZfSEsxyBrnto3kJzvF7PfVuQMg0xfDYzPuA8O4NJJHz0ruQAbh9S4Z+D8CkTFkgzddJ8qeV0MKJX+nX8HgrgVXIoL2AkSs5opcyQns+41YAIDo8Shuo+YvrvIeqQacuHxKJZYai0LzkR7EhDdf+0//T1RKVcx0c+tx6gk5pYeaxcrq1EVKzyAqwVnZRSeYBWAJOSoWM6CZvbtMw8uTM3Qg6FbgdKFgniWbnIE2lEJCfMqznyXLtmJxrcoW+AaUMOPFOGnsGdNLOVRw1S8HhGYrUnwfjc6lS8a22S1P1ANQOKmfnSaWJikj6mW6PmBDwFFOeYqA8ehRgyRcaFA0lUvRDIEaROdwi6rn3LoAR6N8STD5gvpT0d2YC468oPT1dzy16hQyktQtgdzA+eM4E++FNLSyZKrdWMqJU1ZR/VinGxkNtvVWPT9K7yD/XQ3m9IuDPnIsEBmSOiJf6NPAyNGMWTN5JpsnhF+KbVUmdkK0Ob2UyWePLMmLJrRJAYpwpi9W9V+pp/uVMwaBesz4pJbJlPYxB9KyLkcG7bcDZnXZli1rM2Rqkpj+nUaf/ktBxbQCMeCWWWfJgRgxHSo+WpTZ5u2adcUJPeQluNhdX9iypb/Ecyn4TfWMHWbG/O8stmlxXDqa2m1Hs5Rc3qQQ4PHuQSoDf+saL8Mqf/AHAW68kADD0AOSeavmS7unFe0RRi458t9gMRJCiAIChnCmMbw6z2Q7AEE4FnsM8HgpCIOAM5vMdmCebGHDBcTyCcQzlv0sYV8fxT57xh30Ak0YN+izOl58k3oaA9eFG0cRRD8BhhgDge56HZ3/lN+DCpz8LN889AeP+Hqzmc9gsAnip++HW/GXr32xgGw1EJitL90aX/4xeWqRC45+KP7NvzWxZtPiJCVr+SNTR3B1OD+FjHgjfnuY2PaGst/gVHi6JOzd4h2wEf7xv/+XLGfCRPeTt9GNbh9jT0D0ApT6sv91XZy0A0PIZkm6vACwezfDye5sO8pBEpRtz9QN9v36HB6ChrJTnqgyW9GohU/x3yruX9sipkDHjm57Ek55ssKzS39aY5ZNTeJePR/9djcfAsip+YgBd9k+M58K6YwltMInSLypVFTj+7DIqELBORtHSWN5LrlzOyEsgveSfYA/LOzADsJyea0pBz0dMp1R3XVgVG8g1TdnrXRUn16yWB7pOmhxfVuxAj0dyJMQkgioh8Tntn+nve/54/5BUnsBDY5E6tuqBqtJf0mwzBSv7N/YAdLR9vQBdv8+dL/f/mtgwlwfNPZwO8gjX6EkVYUnrzGKQlimikvOoKyXOZPE8f81WAGAMUlKPOXRULACFETwLl/hkXpCoALoAIDdAUxQvRqh1+n4rkOAAoC2ldXZBESqaHjeZxSEt1kPPPq9z+qQUcVWmmw1gMlbJoaG7sKcPqeqyI1IDgK6rigzHADks/2kLGGPNjoqjkw6LDhIjcZpE0xmEGRxLxIy8mABAoi9fD/q7cBgSPiyFvk4dZwR18kciAtTRL6p/Chs7KbZIXfX7wg+lvKcQmMaLfBjI13XvO9k98Q1PpuxHAAAgAElEQVS+f9s1Xx4AqPSZ8m/qDE++NlX/GTbWsr7E++lPhsvEe+KuWXuSfQAwCAAF7tyYFp6J8q5FqztpRU4XAPR2IKc4idoM9Ba98KzmjdjUOHs4adLeMbld7kkWi2dwTtoxdV/KxMVxkLoIv3agmEPhAMslkMfvV35mXFZ8v7APiaxCpxXVWU18mlZv08sT//776x6Q+kvRYW98JJDeBQAdDWytEI0h2odgv7YgkhyqfHu8Vh0CgvohXKsAwLdfhfnqEIZ4CAjpEcmPGhgUgFYqX4pBTJKzIZYAc1uaynDjacRBdiUAuLu7lzMB4ynBO7txLKvlEtYR+EMAcBxXsQyYB2VoXyUAOOZTjHuUt/kNT+zDQ0BCZuI6AIDPfgCe/eJvwqXPvgBvH5yHcX8/AoAQQEDq09RzfOmAE+OT22rGLbQKdxH6OazGJkccF/FkAwDUG5ne2Pg7M7kS/zzaAGDIRm1QJ8zf3KBrUdPwBcNCsCxmbtq9NZpSQq51k60PywR5xYg5C8cuyYBYnxKq3DMXaMDsH2oEUI1HgN+2NHoBt6ZP5a9FJVVmJf3HmkIV4NEBCOr4ztN53Dc3Voeys6uqnp50O/6LqX3SOLPuYRGqsIUBAFLfrvRVijOYaAQWiz3dI4DEN9nJn6cxl7Ej0MM+JsbWMtDlefoMrV+WvbQBh7OQh9Bw8E9vjkz1CTAD0B4f/pbRlsyymGZ7/Wr90JdHvlJnCgAy/TmKjLgJp84a9o07KMW7lXFrcWEQA2p5DFUGoA6HujsifQ8ghzLs454+0tfbfERE1Z48yQFhZ3xCtX7B9xN9bDplaWP4YcskVvr06v/RzwDkCxM+/xgALItUGwiVAZjWS7OCBgAl858WAEQuIKNcSiSnRUEPCgCYhVN1Jc7UT0Tlp1jx9aC/P2gAYLaXcdFVMJgYgVaKALAqKGXG8zEAyEv95d+RnPKUa21ovAzAGgDkzpV/CmXPtUP/wTBSIgPw/gGAeXg5EKAdVmaoHACwZYgKXaTR8wywS099Qzcg6oD/2bmrPOSUqovrZs2PZBxnltaX35iXNGXxKjsRuTb9zgPop2n1NtW89em//zEASABeoGMAAC/euQtvfP2r8Oqf/iHAfQEAZ5gBOAtAYCgDxhOCMVtjA6t1yOAjzsSMvgj+xbJf/I8CqRhbpz6AqEpDyR6dYlw7q55smgDglefgqS/9Nlz5/K/AzfMXYL2HGYDDfBbL81CWKJNLBSQR4GGAqBpA3/33RjvtuksFBwC0Sio9YMkaWZwr0yNZf3gZEM40H/wMwHcBAGSbtBzD8NbpbABAycVWRrXU0Qx04bFjXmf+voccAGQZerQRreVAs/djAJBT5NEAAIsPoyuCSvZfTlTgGVITVHzokdisEVMZojnOZwLZa2HyGABMW1OPJABI8T1nMgn+5UYTmYFbAKCpyFN0W+x+LHdXVcd1Eodk+uGKAwCquMUAAHm/DAV1EQqTwyRpzBDkIYzYDkVkCXBLYllQThmAOn27EQhO2iFkC4SyXSS8InDsu5PmyR0yGrqrgDSTFJAAS2Lw3TIDMI1KZGVicJsz6Pr71MU9uAcZgDxQrsJp3YMjRh04nDhTdl0AfA8KAFgBIJqPuXlCvKfQgNZS8rUAACn1MefNPmAZgIZu4hRAGW/ILStlpzu2yQBMm/MokSrzT9AwCamlYTwAsGTAMrlMmc8YKKtj7yY4FUoFmxmETMNMeKMH40inr0iXfnWnrDUKJJac5x3/mBzhl5f1RyeN3oMDANIKaPePbBg5l/XsELRIMIuiD8lDkXzMUBMyw/5N7+pZvgkM0rzF45zHAKDU1s0MwA0eAhIAwNe//lV47U//EIa3X4XZ6hBmIcNOZACW5WiXAFP2MlnPMA6eUR58AQx4cISpBDiA0gEUi8BYbV9wh78ESiXjD/sOD7nlAY5RVgAEALAAiG3FbrMbbmilw0goA/DCM/DUl74CV77wRbh14SKsdvdgvQgZgAEAZAB604QEf6v1vV7xz2mkhq1fx7zhshhOfbKJ0dVhwQ+XdU/uhUZn+iIDIYkopRyvTaMeJR59AJBH62lhOEE6G0jTAMBe/qVxsJvwh2W8RPIohseqONB3smIsbf+ZT5r6e9Y8UOKy8l55F37uPmUAkv+fhiTtajNpyzhEoq5CqZY//6KW5YoiQt6VdY0MI3vRe5loso+qXiVdQkjXS4wgvTOdDU8loDROlkKk5jxLhzFFHswZgCkhPsuIlwHI5MvIAKx9EWm/4nfjqb2scilmqBdLhOFxsohJHjg43MoWtXQgUlcf0yhlydqgFTFMC3eIr6EontmTpjzKET4aGYBJx5wGAOy1KJuy+aV8by/+mJ4BSOvFZIvKxRnvZ5Ut5K2sta8fFACo58PYxox/r/7n/7fr4+sMK5kBiEwshYB9RhikEjhxgEeXQGlB9AiA9yfFHG7OACAFbhKOqAL+joE3g6MI+LDwnA0Q2Rl321MaXhxdNskc/CsIhZoyAxpEGkivBBifwaAzpZYmJisAoKXiZMlvi/acDtphZSrd/AABrFwMuGjo9eW8hMuJT+aAOhHUYlpit6bzzEqA85yYwbAp1AOwdAhEby0UawGY+K16B07Oqy5flX0z7n0JsLuDEDJMFOEkiNekahLd2smV/FGui/WNPMH5voicScNGIp0PANJotFziv2fKoXNmW132Mrz67+uqblseSZgS//ES9LpOVb4CAQcZ1E4BAPlbap3ad6o9g+zS+0QZgERXo3yVObvRmY94ipxV1FXUo4ZnKaTBFsCPSqrr06WF22AaoiQ+LgH6N3RejXq3+/i9zwD0APb+KX1bAkDm5pziT6MEmEQingJ89y68862vw4//+PdheOMlWKwPAdbHzcMA6lMUJcGLLuUOA9OZucdZsT1kcwNtgnzyEEZq6xSA5I9sAMYA8JWf4ptzOjBduAX/YTAbWiagj7Se7QPsPwmXXvgSPPubvw23L1+G1d4eLBdzGIOfFXy52NK2ZADqz+FBJ/ZP27JsMWjPfHky0gIASbgSgbnP0vRfOmPhmwhiQ6Gr/7aUj7MjW37T9hZMcCeW1reUmFsCbAEeSv46GaZ5CU/Mf33bJwF/4yMJEBH21YtnzOt8FYrtQ7L2LQRm1DXmMaEE2GOp+HXNJGZvPnyTBnu67zc2GKz4hmlDR9p1CbDVk5HFwfHFnR5myeFttbAxM9OawJq1RpgVLn/sf1cAYGINrBgtc9L9/ygOln20dTkofrOKnhKvcn1ILUVolGFc9JNHznQu8U+GeZmNJ7NnczjCf+X1tqbih5yF9+gNEysDsMyzJf+WPOIsxXrFuUgr1z+kLaw38SQ+pw850SXAnvw0ZT+taObuii/THMspMraCY/qnrCWTSMW/Ek/oewDW+/Qg3Phjco/ptNaKDl78NwX/Iv8z/8nYx/PvhysdANBkaNEDMDFlxwBz5ZD/ngaIj/WbOE4hQNb8wVLEllxUX03LWQZYB/yMSQyQgE8tDDs/z8r0ykEhQc2kU/g2Ze8lf2FLAJC/N2oidmx93p+jk/KSsS2gCBI5AmgdL6vXpNlSkCcFAOuVwN+EtNVK6NIvYrjADgHxQMBkL+UOEX/5SQHAjomswG8l0YLf1FLkJrrc+gl6FN6sjQYqlHtdAkw0z2ZerRcP0PMYt1BAvUM6UKEVGnBHoAAsdBARM0VCaPF5Uo6a1zwAsOh3vquKeivyb5T3k/94BqD/5uKsTx0BGb2SHdQ3kkJ8KAOQO1heD0DFC7WpaDlBybactifgiQFAHLhen7K5k3byYzMcOavwZMxe4sAKI2ThRQYAks5T2Twef3RU+ySW8ByE/vsfA4B4SBAGnvsMAHzpj38f4PqPYWdztAUAWC8ZshCXEeK39GeUPyvQTO9SG5axL1L+DDli5Iynkl/mMKD+s2S0L7c280WLnrNg1sM+wN6TcOXzX4JnvxwAwCtwvLeLAOB8gE0CALl8VYcAPIQAINGG+9ck52TjtpXr7PwzPYJ/VT6Ett+TtMS9u2nbecqRpBLWTvzRr/DxWkD0S8xbksHX19OvXgDdA+CinakC4Npn5DSzSxL5KiS5FskHrfUnAKmhC94FAJCPnPufU7waHLW8sx/wezrPAABN3cy/2ZcAvV7CtU3Lkt/ggn/1t3o93pMHFv+IQFvyTci/CfGoDwCi+cBxE/3aAGDxT6XuojgEN/xS3/QYz+G4aj9JrlWumVMAYCWfZO8S/8d/qk2cQkVcRyE9HXnkegFf6+mfmt/qDDTJv9sBgEl/sKzjdxcATP3/miKg5pZYSMhAFwCUPKS1GPFaT0efHgCkydk87/n3U/Evbv85buM9P1z+P1kGoAGAVQynMrLimnQMsExJVwtK/mfHv/AmIL+dStRyZlAhPgqyPDUXdVLJspIMISdFbwqAVH5r1la0U4AlLggCGgAgY+A20xUlSQEk31VJXaOyXxAEnt6FOxb4PD17vwFAiCcO2qchiZ3qBg9Yh4BktVgBaiwLzCKwcQgIVnD6bqi+gzvsZei1wsqro8cax5cMqM4SKhY9g1fZDrHy04cBADSVLv+ls2NNDhAHIgvtUxNqKrc0dBE9TwqyGo8uQc830J5lyZ8pxXaFZwYFAPoOvxyBPGXcEgL9xooT1UOOQ5mHTs7LFFc5uYINALD1xTxypudr+vSdatcAp9k345UTAoC01mJ0KWOA9HvU9WRYElNm3swnQNdZJsVAp4xKlSWe3RZfLXUs57RLHr/2h/AYAKx6AB4ewtvf/FsgAHCxOYJhfVwF6rQ6Hn+ji8EChczPSW4JANSZOnHDEM+o4vYJec8KI9NduQQJV76b4TPBbkouDN8l/yiA5AgAPvnLvw7P/OZX4NaVy3C8vwvHO3NYz1MGYM4wwTc9igBgD/zzAgSib858UhsI0v9OK8+E2pP/aVrk5HedTsU9/AAgJSuYFOzaLoJTSh4YyXb2Oa2Ehuqdyv6ymCbrqMbyhu+UjCdjJe8xAFipslL9WbXVsKaAM5dKssrgEg/2fRVEuvg9vCQ2S6rq+yzpVsmjcYhdifeSX8aVAAfZyDcyfsftT18H4PjyxlEaLu57egBgsjWRD0ssLulU6JU9URX/RBOYfC86BCfc0vLp85KJtUjZ7k0AkOYZv5aMTUomSv+uY77ad+4B8owDEk3vJwCIa4MZgIUDHj0AUPs7RaBR1fWOiJxwCEo3A5DxvOJF4jHPvrfwL+s57gPQrGOCVcfIDpdVBmAVbmqElQAwFnS3/Ul8G/+/cD7TLHoKaGsAMJUAl+Op8fQ9Iph0IOnLCFAJRWdkdYTrPCMNbykGmEqAUd3Vs+K/scAvHEIxIto0lB6AtKaDOkVxewCwfwpjbTatptX1XckwMcCV/Aqp5KXw6bVGG4NUy3F2Ngbyd9Y9elxaQOJ6bwEAIg+x8ZgTl+tOpzRrGaT5xB00EwAkqUGKyUwQ5JHIZff4FGCtaKo1ckqAqzUgFk8Xej2Kst5I1j7qskReoucYnEzV/49/Ex2XsnvJr8XXtjLYCNBhBXQZAIwPJoeB9wA0HO6WbBR+bbYYTrqz0sjqlSZnsXuUFhEBgOWgtkesS4CJfi37kkde/ClmD+g7HesUsQ86PbVDSUX3wiNMhvJn2PeU/s7WINs8fHFa6ZRZzLK8I4CfXdG8M11KR/jcpCVGqWa92NSwuL7s4iyMPeiZHs/V8ujQv1sCtj0AqPWHdwrw1iXAXFx4xv0UopgVAHLdeEuUaPsTf4bP7q9WcOn4CN76xovwk5AB+PpLsBhTCXDDUezxdwnkpwCAxTYJ/cc2CEl5GjmAWRsjoh3+Q7krvQsdT3KCLaQKBrKhIxwA7D4JT37u1+G53/7dCAAe7i3geCecEBwyABPAzoyQ0Ncxdrl/h4CQ5HQlyHFgaf0zdc2NQp95rV1/OkSMni76rbyv53vnu1wF74+vdUdf+0jfqH5HkL8eX4btuexxGkOoN2fkTXSoX8cmduKr3pfxjbrMsNbO7SPU8V4bcCgxV+WvVZGjNDz4ry1knZvnitet/rnb8YqwaYxZc/c7vYGrdb7DYNRTPXsjIt6N/QcakaAxDzNTTHOB9rnKAIXNz68Xk66scXxaCDGtneF7aIcMGaiaiNQJyfuhWD1UtjEdhY/THPXckv9V+V4yG4p/r1aXKd5SAGDWacq3zOvI+TjHSLLfMt+IzV4eJ4cAsJPECuLItY2UTz0Ki87V2fkcuPQAwFoW7RJgps+ZPJSh0qTYqc3pvrJ+SZ+oU4C70pqFs2cgAk8knszykXgq+k8oY61MZ/Lg9Xrb8lpvcPXGn9/dQOHCdS/+kP6g9TW+xtJjwM0fTx/qvp064U69oAK46+f5F4cr//n/66rIigCIOEgTQWOIDllpciqTY5MgC4VT9zirTGAnQ6dQrxgsOpaeAEAP4CkBRjkxyEOFhZIRDhtXhGUmQqekX2cwyjzkggeeYrlSEFpS10MJYqJszv7Lq5Oa9LdYLI4hAjiFiYrDL1Vpg7VTWbLPxFnEuYHeBABTdiXijiwPfDXIgw3CiZiMH4k305Qs/zuuEhmOBgCoM4oih2UwsnC2F8DiCG0pz+pAX04gDepXLiPUNLYY+VkX4k/82FBw9Y6Wt471dT30bBPSrWiwyl2BXnpNek0AmGqJb+TOR/i75oMqQ4RoaWg5b/elni2NlDltTf00jZYd22c4ny0pbKnwEuDkzJ/YhF+4XCVbeYIxoqAlDy7Zg+Zs2dDc1xsv8Z7ZJIeF34eyypQDzTjudkYuyl/SlCsbM1Jrk/zzPq9BH5QedMUZxDXVwU9xgkSwHvknweBRVErQUeS/zUvWGUr8bi+jAWfZc+Da+qtsVtnj0/qtt8GTV0sMZYAhgEDs9XqkwuFOa0730FL3eEhcUy8nu8r9GLkBVgDAoIb3wiEgx0dw6x+/AT/+4z8AePmHMF8dxgzA5mEKXYCbgofi38iMrhRwIQvxPNK8prQBRSTM/6ZALp5yWKxUlKe4UHhYiOSNFp+0+LPIBPmM5B/GLwwHAOeeg6u/8AK85yv/Dm5fvQp3dv8ne2/+bXty1YfVOefed9/Q/fq97qaF1JIQyIaYiBkhEMiWVkBZy4H8Zv9XeBGc+Pf85CS2YxBisJQYUIzNEOMhwiQgQBIasEG0pO5+4z3nZFXtedeuXd9zhzd0v6vVevee8x2qdu3xU3vv2pQHxysuAfZN882bFgGAszHnGmZ2dyY9UwvQerjZDQ4vM+n2fXtBP37+JNj8ou9EFsczJP2TzqPTc/msw5YbyRJEp97aN+QrRJt/41FN7m8VLOMf34NUzw+4P3u+2rwMX9GDB3rJwyfvxJvKTiBlzlHCL7ZAep/NEjCsPvL6QkvHzJJnOsRYNEySgM9kA050mL7a+6P+LR4AjHlriRagO/21vYc89XcTXECX7I5H5S2m+tuBMJ0G8ZupeCv7j+ytIP2N3dHcDvPuD/G0Y9H77xGvkb0lv9/HE/CObsUZXG8Jno0NuXYOL8ZVaPfKA2S1Il723KPsG1lL44PY79tXVT75dT0AGMvbjP/i7ymul1hWPBrKpCT5nVUixNJZDwUjPyG6gqhJtIzAMORA5iN5TnNrlH3sNEhwT8QJaQbcDIFLDxmZA4QyHrbsLgaZ2IfJBles9agXKgHe8I5IA69u/+wvJyOwx8TXC/UhIN2SO4fMOtBoDt2Og1WGgTOzCABEIUblRiAgnVrJ6ZYBjwKAg/+hw2T75MSsb9QGSlibS9VUg9LU9iQDgFV6WgejiYpRIs4kqYyUlhlWATQ24krQ0Hmf9fhbux10HajoQxZGVMgyuBgsqCQhQ6LBt3bIx0YY09OGVbXsBDfQh4AgxS5ENxYz/G4EAPI6HAgAEgRHg84hbGsAIhrq9ZaxCk+KAQXm4V4WvL6ZoRK+Dt+d8NmY662C7g2wvVOLe31dA3ydxpmZN36iK/X1a97G4k6xhuzJ2PmcAaCiv/Sc7GhnPQQzOpL9Gs2fnNex6zxzUsTgXiQASMBAU3XJKcBLeCi7huY9nj9kQAhoB08L+YK/MZrbbD6254TON5aDmxPY4UT2bd3xbZ6KHa2wnDb8sl4kA7SBQE4qnMQqZj0P4iSDkAy8p9UcAJzsQpqMUb9aeQbNSBfrMfaAPVhjcllCAFDprVlGOslQxGdT7dymxxq/PcICEuAftedQD8CH98udP/ps+WLNAPzS5+AU4FN1CIgXdg8Amu/1CNnIG1eu95+IunA96FuhOOtHBABthh8ESpIBqP2Js0izjJ+GUP0VkM9K2XoIyDvKre/5kfKej/935Y3bt8vdq0flwdGqbGtiX/ON/IaFHUfLABwoUPQ4JwB3pl0OyoU6nEDBIQ5aO0kVy0xLjudAGfDa5opdmdkP24O3H4W0mlk6+cwfjZ6RHfIzeydr5MUORv/E2XhnACD5bNFYte8Xz2WsoYZTMgDgyCrI28jHkedZUDKTDgGFtM45B7FDIngdiDxLMZdrEeAfken/Jmsc/w1XaMZm6fc9NUQr+Yg8ipE6i3tQT2Qv3zbzbkQrvea6GMJvPoE9RB4L4l7wvfVbempA+DvOUtIAYLvS4wcuthTI3YPYPQAYGQ7w/zzdUikwZGSgsn1q5bc9xQCApO3J24FHWQuesVeuv8EvsWOA8enTn1EDGL7KbaKMaAYA+rXX/Ke/izc6mh/Y/KskQppkcaQzmagqeH+eQXcYcOoBXxUbhMts8bdDbATInfD8aCNnCgCaHcrGSzYF2BA4BQCBtUGAyex4WLI3eHmArRiHwL+G7GCCOJ1aSWW6ATfA8xEkMACgQ/FIz3WrIItKYJjmK9KPVkuIkOsdeu0Q8O+awdWQSGXA/XX8+Fazw0Ondg5YBwE4I6ZKwZ4XAPT9TSi4ZkN3BgAQmuu7zC8CBHUihNM9funpb8CL5k4LBS0t3FPrwAF8+IixA0fD02suDgDe1ym3CADMxj96Drx9BoBlpkcbqpFyacZmp8rv96VsKr8qzIFV4EKbQ/TS/xpTcqEAIEnZmD+eAYB5jsOMh7Lvl7AEGWA6TKgBkk4/kIj754H7pDKgkC/1wUQNsFCbLroHTcsANBtUyrnHiVkdWJ0J4SUaj6ggAZtkrIMsEJBgbAEhDuTU4XElTrMyBF9i2WeyjWUD9EufTaLHGAGA5AVXalCGvnkLPqCtnyu58fyUqfepdj4QAKwZgDfu3y0P//T/LV/49C+W/Z/+YVnt7xsA0I8n3OHmyeoR0ocWELPU72fkN1w0oFHvlR5/mLXKGYAK+Dwo6HSOPfl6zOwgT2B/Tko5frnc/J4fKe/++E+XN26/WB5cv1LuH63L7qi2U4YTg8Mst1baTPYtc42zIGnKAYcUQx6u6gYAoFj0JQDbZA7k0+JD+eow0O2nMNuAmPewtc+cAWp+BH71Dgm4mOXm7t1w7WbjXQIAdjuebBtQDsZvH1aPsP+Ik2Qf7EAA0EPcbOuIeJP9IcsfmawdLh5wh9eB+I6nAAAMY78aAyNYJnKOs6QQrstqE9odwv9hBreJD51sKh3B/GWCWVoL8Vw4kywEAKMMQPvO8wKA3tpomprQuc3DbuZ5+sCs7DWzLNpOX5nqSKub21/bKP9T+YSK3uQ/jSUnl7f2Pg8AVv7DyhX9XOGruU1U3DjJADRvwOynaMyXCQBOlH8CIFZKXC4AqLmVJU4RbRkAOEpw0QDgiIcWAIDOCcFTgDvBQ23XnwqqBcoBgMqRl+c5oZmW2ClLpWrNKfCCDJVRSS1ksLT/Ncsnv4elA2Fmn2Zo2/uPDIBnQQoC2kx1CXD7grJNyEtQ9PCl14V6ALoecUrJzza4TAZekOGgA7iIibIMwCUA4Mbt4GsH1agPnHsIAGq6uDXKnEDqwTWCMLztox6M+nM6hMVm70VmKRZB8yw/YbdFSDtTskM168FFARJRwY7hUQCAJgOwAb59BmDXUmBs8bp+f51sXTgAmBVs9E3pk6HzVx7MGJkorSfG3JMZuFkJsOiW2Fnt3BvKr2Ng5zIzANvbY9YVWmLAw5l7aJ90aXjm0ugArl5XwT+TLUOn3uNgqASlaX3cTRUfwjky7Xvr8HhdIzvO4gDYKWejr8eRNDfFkGpIsjYUo9Va24iMg3yGeFeSl91M8zfBpL3BlqjibqsCXCljzGfVE7VmJYIkQ5H8TF3dQwDAAiXA1+/cKbsvfq584dO/ULZ//NmyKg8WA4DM7kwiH/zWK5YAgMIBvuXCEACkDVR3CIil38SZ7ois9AsbYg0AXinl+Ha58V9/sLzn4z9d7rz0Snlw/aTcP15LCfAQAITKCe2nRXw/357IFUw040OpMLQJCQBY7yH/KX/fjIslA543YOHhQaZLP1LfR9BcEfTIin1E+XQ9OzVePYDmbTTWAWB05vstsdONvybjzQBAaTcxXkHZXBr4jJMMF3gHKMz26w4ykuHvGW+AbdKv8DHLTH/CzUBp+P8owF9K7ZmWpmerpItJi+C8xT+EyGMn43xz6eM/5kjxX/C3NgpkE/27p8hlAoC9/cHzp3B12/B4vXG1ucVPv/oz7mvvw/58XYYyTpzsO0uQk3/6XGtx1huBaocNWOsDcTUXlgkTzYH3ZxxkV2iWAWgAQKcWujmw/yQX2goVlN+BeAEf2VWgGNb7TW9tAHCkf5E2g6/rt5cPAOrF6/XNrAdhk6GhjehbVnlWWd1KS4BBoRugoGuJAUSMDAWpBHHCLMF7ACI+PCMzHyI0QDzq+Uc7k4SvxYYWnnxeAFCdw8V94vyyDsx7If8CeJAKjrzmwr8p4ORRI4Ap2tGh7OMMwHoLrIYqwUWGl7FSJuV4BWYAIDhQODtV4gvldgS49s/3yrCtrsr+05n/LDYOIK3PGGfozYWD7B29m9bHrCU2WZdyCDajsEopAouuh14/soTkPfAps8Ih4N1pZTFTcIElfEQZgJpmqWNjyZv+/XcAACAASURBVNZoF81KO1WNh52Dbnrw4MUjE94omGQQCeAa8KfbmFiaCRjp6mz18iazvcEwI2UAikpbCaAip8BqzxnYJs49Oh6XUAKsA0R25BIDQD1xKGuPZNVXBmVZqvz44JRwa6N6l5Yy5OG6Sl/X0sHIqQs1GiAuk+vBirkLrR3aSMrNZ57RAgfTkNo5j/EyjMfoN97AR3BFq0aORCcLPYOew5lD4L5LKTjLbuHxCuF8D8C6/vSOk+22XL97p+y/8Lny+U//Qjn94/+nrLb3ymb3EA8r6JWad/CsH6VHT2NwM2opFGqV3ZqlOpeBVl8apvQKB9gTXROuiRqranVCenu7Oi7l6GZZfcd3l7/5M3+v3H/lneXe1ZPy4Pio7I7gEBDKABwdBqPpRVSIrd0yppnpcTbLyx6XXlWflQHY8C4+7iB41kw/wPceWND06cvd1GsWyb8va7LDtP6hbVmwhISzDN/sGTPqLHn/7JpUKpA5h1ssUZGR6qE+e7fIvSq1VBti8/urTy0zML4VMYkrufR21ICMrE+1oRl5N0tGR04hDYYyYnDM8vHgYTWDfMYF2fdLMnDG8wB6dlt+saZEMrEOOyPZvH2SlxHNaL3HL9D6oe4H0SZLk+U2H+U3qkPQmrl0ynfkd/HKOgDQ2r/+FNYZAKrj/JaUqOgPQ/NZgGa2Ze1AQL9Y2XzqtbWeRCSqZns2a9ceQ7aYK0ycMTHsjBuz7bRlavdEG9Q4D4qQsvhhBACyb+0B1YMM3OElwL6lKvjPl50BmFJoWABYST8DAGdarJPHlIF6axL1vLQynY9AVxxFV04BQG0UGqVqxMJZA3Z3Ub9AnDE9KVS2uB4elKN+DJnu884d0FOUG8QTkrXIp8gGxpbGuwgA7MpvaeNNjFFUAjx1UIzvXhVG1vMG0neBPmD0Lf7RK/mR/SMatwwPRfDegORR0lIAUAciUgq8KuvZDietLoF/aGRAMcJP6Ljgd3TESS93uePKz+VMH1bhZkktwNg7E1HgYnjYkDdyJ4kflOFuk1lwOiqXSMUh0aPIAPQAoC7/9TT2smJsEfGoy/bsSgj1KVj4gCcNAFzq2zUDpEp6el0S8YuSi8AZE4fA8uoyu6+dR9gYuugMwAoAavoYWgVsXJuA1489AOhti3csySPTzycdZV1CUY/KjWPNUwEc0T89ANg7nHYV8wSTLDiB5/Q72vJ8scGxFYK5Z2WGwfs7Rol0i7iyXUBQqcVEpwxmnEsbTt9SQ+t4M5MFgpRS8AIAQH0KcAUAb9y7W/Zf/JPy+U/98/Lwc39QVg/fBABw4SnAlk/16JUCZCKssE8e2SadoUE0xXBtYGdBTvDZpjwMP+Nx57om5jA1fu/5r1dluzoq5fi5Ut77neU7fubvld2r31buXDkpD69c4VOAV+gPjYA5Ta+5tMSj1J++HQBAmi/QK1nXcwOAvoMm+quzKFotCBzycLafi+CH2ZuH1EMVqKtgoplYH2d+6rAdD8xQ+9atx5jKJpuOn9slwZU8Hxq/oj/TszPKYhmtf3cWneFHbHUg6Ft87sioq0dwBrnWmfi7bNrH/nHTjOkhTTl1YW3nSS0aoGfZPCPbxwCZjx0OWBfeSSVtYWk1LQFm493TqvltCgCk5TT+lwOoZhn/HgDEFENm7niTFW3lvlZUeNq4DcvJumQAYH2LrjCpkguP8/wHPlkbCdrnxkW8QW1BzMgzED6yWtBXsXU9lJcFAvj4ZwDgVL/6U8WnAKAWGAsg9++ilU+YcubjZhmAEtjQqwFxkr4fVDbryqZIwVqTwjln5G9SRpcMv3cY9KTjgEYLbO2JVO/Y8Ri5h9B5AMCw9Ffh7woQJZdqxBi+5Imfgtl9rcRHOet08iwZKxBgTPRDBSrvIsMoCv9xAoCQkQmDZSNHWYBYojA8oEERkDP/FPhHil5CTXtCLKnVJQBg6JgpnUyKWO9UkFq1h4D0LqcHAPsdVM0pfndKlyjotdUnL42cF6JAvLvS1Aw7qTM1Fn/P8jjQP5TFQybUG3itX8JHBFNjzsbvmjypmyEDmAw60OAZACj0eJoAQM0To32C5sCgY9SCDyrZJZ2tFAT8Kk+tv0kHQDkAxMioR+hMaiE8S/gY5R8HmwbXHHxnstfrE3/1DAD0gEYXIEwyjGwANXFI2HnURM885ugQE5Bw+H+Z/2j9Z1hCSsGZc9QW1znb6NARL1EGaP27ZQDeuVPKn/9p+cL/8YvlQS0BfvjGJQOAeoY6wxc408zflTNJgGHlQrLL99jlXfyJwyyFevsQALxeyrveV977M3+/rN77/nL35Hp5gABgOwRkDxZ8uNFD8l/ltA1zEqFNJvAMAHSO1zQtPNtIPT8A6JfrEEBwrj0P4+boah19iOMBv7F1GLRZEL+SPRbuebpkZFSe3eZJbH8WABBvNuEki5MCQAJ9qTOMegAnpM6Sqalr9Cr6DEAzYgWkiKW38txHkNMel29zABCmL9GOb4gjGUrK23E+Vxah1LOeCNzq+afPADwXAOjNnONEANh0YgXwlwYNZ/7GDADkA0broznm9yJhAUDaRG7ja/+Jd6Sn1HN3vyH4DADUtCZ/PVZJ9dtHmwHoGHSRO+P9ncP8n2EGIPvyPmSaAIA9E/oBWQzeZnIt2C3xQmsQewQAVySGdQNGes7ArTGqIMaUshoFNohILAGJZFCMsuH0G3sH05VYGwAQMv50HwJSSeRiQAaa/tSW88D7VBECDobu8ABKFCAOc2SxZDmz6JSQRU4K8wcDgb2bJgG1OFKV3tz/rwbueBtXzEblFK1jEu2QGjgBWUEF8N7v9VRloyZ8ARmYvibe8lf3fRh0ytj8DpV8w01ecKQ09sy8iuEerdFh6qJ/SvZ2UGf2Cn89m7IEoKe3er5o0mxOudwXKCHFWbk+ONFc5zu8cQ/ALPNwRKV+/Dn120zcDnz/7LGTHZVjSE8nK3c+Y86+J5CdhrYBgDPnoRGX9MLAGdtDeZQvyEBT1kF7CzSV6TIZYJA4UuXFaYeSdJRxEfDUUrIcUBITrAJ/qL7lPluZhpx91+tHuqNRfgJ4+J5bXQA98WgPAgDJvhLjufLniHdtJf2gBFhtVvhnzBzymXb0Gcme7z1PkH2kyoNd2bJXcWW7Ldfu3m0A4J9/+hfLgz/5bFndrwDgg0UZgDxWFii99vShmxEDa768XwKXdgeD0qJNm+YI5VcCn/2+zs/rGCW3qfDL+P1pznWndlurD46ulfLKu8t7//u/X46+47vKGyc3yv0rJ60H4AwAJP3Y3sK9XubaKPdXcotmnj4xfktGsqwEeDzivEOVbP5pv0v0B/LIwjUc2p4BHYSL5E7ZT5mg74MpHwoAkt6eadmzfE9k68inS+t9CyVjXLxnrTMAZ54VgX5QCUSSRhUDVi+O7S/3gPUVTgwACiACekTbP6kAY57qiDH2T2Y073sYKgDQZCtrjpYVr2+mQ8HaFc4fbFcaJ6n3Tuf+4XgWeX/B/j6t/+erH7/3ojMA+ZRf5DA/J/FPgQP98mfeYf0OAEDZfIU1kbnp+TROmvg7swxAeTJpTsqQJxmiuEprL/rdjg2eZVeq9QRVsmR6oCt+k1gg9CY5gQmug8Pj6pUEAILv14+AZFS+sc/nBCKMzeIMQM9b9IzeUEhGrlqzkDVBD/hwGe5n62TvbLfMKt3GgWPMkcHcBvav+Rfn3FCMS/LlhTM5nwHelgOHFmmopFa3fvZXQpVNvK0ddHAYQZNCFmDfYNgMqAEkTkDUn/I8GJ/0GBgrVcvgxDoy8VWrBROjY4NgYJah08Qnpmmm6pfIjLvriShwHL1HFJrdLSUDRQEr0ECXAPc7+r3OAUXAIuSsdKU/Uwcv0gvu6dkpBH+BWZp+Z360ckbJqyxAOsW4zX0gy/XzLZKijp2AwEhuzWqxY0QZiNoZiR1QvbYC/chTNTkkM0G+h6b8Y7H23xBAC+uqy+N8HYcWbpk5ZdmRwt/XUxz5h8YSj2eg99wS5irKy7e+GWiZvcUq/tGVcaZibzSagWy0R2PDwpK5IZon7NRnyrkt2aJDivD9Tv64Wwh+nmeH4govWzTW0zbE8A678OrwsWZQ/iqgXTokVwJj6TU3WFp/+/cwBwRf8KryDgGu7QzwMs+CN+gM1ok6NNtlqa0Zm7iD5K+H2Bc/eHphvK7OnocX0TX9l9pxNZErj8ZZJ80AXiAXykJqkzLubUxUbQe8uGkWarKPnCEO8Koc77blyv275epffrn82Sf/SXn4uc+W1b3XDQDYTcE7uAH/pVrJAYA+aAbAJcgCX4GdMCVcZINwbk22GQCkUegNRnp2TmHQk2sG5klv7labsluflPLyq+Wlv/1T5eUf/nB57frz5d7JSdmtV6WChnQwG72BW25g790cwJ2y+JkvaMs0MRBz7ZYHGPSOEZvz68fKGzPgHQfh9eST5UTI/Jn5KcWxfaQBLBHgJdfIDPyGTteU7GDtOmGRJLuPHPOUDzQP1fjD9ACceyAa/GvuY9NXwpodYKP0DfCX7TFpABTF4vXa0ONSy9N/r3TGmSRN9TZEn67pWwX+9S12hGZMd+NfCT/3rgBWi9CNCw65yfGBPqHFx1c6QcKo3zPRK+qZR/EAeETUI1/lp1o95naNoUJC4lDhJ7A0HgC0w9YZ/rEvAD33BAQkGsgqQtWB+HPWo+3iVRwATwM3hMmkiSWXkRK4puN0wjko+86re7i25/geALSbZXQHJD5JCTCzHH8Kn1CPTpLpRi9FM50cpPnZzFM9nOjoq7NYUg1D+/nFJfGShANPH9utmqDl/ccxwAf8lZvZGUDXxVS6RRROWo/IbzDNNXAuqPn4+oo//7QZAEg90OU+L2e5/Vzd+tlf7a4Q3gYBrmxqGaexJsqUzYgy7gICgDoc0KczauALnkhNRpdpP1pceH6k4Cwaz73+Ro9nABAuaOOJao80UBUAgHA3iqBRFEhFI6ngGAtFyWj0O/oMbDquFDrgoR9qfnRIQnvzIEtOx0AxADhejzkAItRgx0Rl/1GGnBmfoQfMmkE/nIPOHNWja7eSf0kCzpk4Af3d1KzTYA04PVsbJ++ArBGCWsbBBCCNymjY7OHj3N8604l26ExA6QHkpaPyFB2rwXz95wGC7F2LYY9ELnIfItNQj7SxpZeyhv4ZdN15lHw+f9GGxN9saOkXlyWV4VM9/8XraeVceKbXf+PxWYOSGRHPo5Z3qIUBT7cDTJP7DX/3c+XRB8OLMrQP5f6oPGiWcWYO53H25ND3X/r1uW8grx8ISLWPh7To6jIWveffTXjcvuCiaDNrOkIOKNku25NTA2SrcrTfleP7d8rVv/xK+fwn/0k5/dwflHL3G+VIZQAa/6gd2jnb4c50cc2SYyIKWKYUKNh/T8dqb+C9UEKvLZo2oLXHT80AdGVRRmdlqdsy22rntQ6EzGEAAPe33tEAwHf86EfK127cLHdOrpZ9AwCp+kHG1wKI6ldiye95dPd5eMi4dYMHZZqR7UCCIIwDKfGpcgDUc5sSaYpL00S88f08/glIMt4gzEqHNUGXUFGutwFTrj/ms9OpBINFdvbb2PfAj815TgOAc85u4ydflwtE4APwFbCCSL3UZlQBbbtNtkk1Rj8yMSTWPs7nkNFD/B2OPqEnn6K5BUzt06wvrzMmE3+2EYO+n/uvIL7ZPC0P+owgnxE19S8mSqvP6BoDgPHQZfFb1ZU6xALsCCWo4Jz5EJCIDg4AdJOrf1ar4AE4AbBhLarNJZ/WxwY+QxDZnqnUHwKC4+R2GADCWNBcHY4DqHqX1iEAoKx9i1NbD2PUG8Ep7/Vq5uZ2K84RRyzgHskmyjPGsASYkt4nH1XrgvbUQK9r+8v0dDPrASsnD27D0i4pli4n+sMe2jjpsSliP+T6DGAT/aHsnj+80UnvIRnmS/yH6fi6Q2nkqW36mFEavYs3fMbUsQkJwXWLAcAmWPS4tsBkOCirDp0SlY7eHDXaqcV7Lw8AhBHaDMALAACDtGZDxyEASPSwAiQ7MPA9KGGlRNAAUemvBkjecgBgA2uAgF7Ba+PUFKvKAPRgil4PEnptjkAZKm2SWFkdE/tDaXqF0jdtfgYA6tWYO1AXCwDWkFJa69JIyHx7vONJBAANL7sBL3Wn+bbmbUgA9XYCAMURXMKDsQXVzpUo64nZ1wHhUwAAzngqi2+WAIAm489n25FpHOrjJwMAZDe9y7DZFygBrlRalaPdrhzde7Nc+9pXyxc++c/K6R9/tpS7X79cALCW0bYeeWusBlc0a/upLcTCao1SNutN2e1OEQCkJt4wQ7BvuuVBnd/p5QOAN14stz7yU+VdP/Gx8rXnbpU7VysAiCe8owyR1I0AQG4dcM6SnSVOvfht+dVLoKssQHgkAGA6hb7E018OJaTesspVzwBAtbE5Za7HDwCyz4RBPAEWnY/NH1gu7wHAmYUZE+UZADhlmO4Cr0+oRy2BpnRIpqmzNU+JAEC2gLiZpIJe3huidRbwFEJbBXmdEQCsz2mZdRgnmghD6XsP+Mr7PZloYwk0efVR9OEcLRblw3FiABD8QekvTu/mHoCUqDKwR7JJ7/CBBt5RZpgC1tXnNg5VVZjRhoCa+uMAAD1g21UAZSW+zwDAywcAXwgyACl4aqwJh/4iv8MvwLwEroHAa8SZfm8Ivwa3fBaaQ4ohA3B5UZNkvrHZcgCgS+Bj1N8ZJZwfzkSJTN6TsNJhVgHITT8pTGi6UxtN02IUE4A5MuIdAlyBFNFto3VTW5QBqJWES+mIsrGMMzAjAF6slZbsVgiAFiknWVXkOZURNBrXhQKALiMVnm0LyC8+A9A70waStOv/FsgA7EpUyNdwhqt3hWKHg5oKGyfB7bLRd/CEuMdf/774k3kGLMiyd14guJuHiGfdEdYZcKwSsP2BPFPGRnq9n+VsjNn3fQZC1APVFnUY9Ws0pR8bu06j+JPsVLaYCYFBd0/SIYwyZBeUDGZyBM1SDrvE6xa04ZoDgAB+xT+wuz/8ecIBwOaGI3szr6F9BLZxAOAeAcC/+ovyhV/+p2VbMwDffK0cbx+0AMZrrPqEc2cArjZlhSAgAIH1bwkqqKUIXAM9a3fb01bauy9bLPGFuZBKktXcIcBps0jatSw3h2UAanFqHaDWV8vu6s1y8yMfL+/5Oz9Vvvb8C5ABWIdbswBbxon81A02mAd5a5a/PCfOtXvCnwFnGwmfYBszzdmo/hgzAOeaBYLLsXSDDcsAwL5Ek5ztJdQh+5yvkZ7HWysDkMCTge/RyO/iL6OfoMen/pllANK1huJKxMlnkmc6+euWSr9/IjBumhIzCBLQxm8yAEXXRVTyw+kPHZQxkX/Pz0H/ITNgQM9sXgdkAC6wxzOZ7Xvm1QMxSb9jfOj8TkMBFVhJBiC9FWkt9bV4SNRojSkDEN9/TgCwPcVjBgcAgOIHC89Q9h+H5YRrLAEAsQUa2wTM+JPsOsRJgkUTvtT8S9mItjSU/QYEBnk5wWLD/0itaiymY37JTBQ7ZuXnIjMAfczTRqsSwhp1zIZjAG+YDNNeO00z7JxMdb3bn4AMwGH8ozJKQ7lvBM5sI/p0yQbd6oV/MCgBZuhJH4YByrcpBieMjY10xp/LBERetQFdu0kpD+xXl7t0Qgp4p77a96fRZAvc74nCNXvhAx2fAQBEEzOKdmipOD/SihSEmRz2+m7bsF+UuDZQ9CkZ5uUAIE3IUrvrUaG/Dnz9GQBCtoIBYsMXqxaQaEWhlacujW7DwCEz9aLxEEHwcg4UaFclAV06lxT7lxEJRNGODf75MgBNeIHLrNfJjfBcAGC8/l7RZCUWM2cEykvGCorUEy2sXuPQEe1e6NdhX2rveA86jFoLiIM5n8noihn/w31wcnedH/XkFLlw8neYj9wNa9QTResi+V1tcAzieOgBpnTuISW8bd52Qo8eAMzMK3lNMY8uAgA7/lbPestnAPbweVfipPRxKL6RkdQGbrIDZUtKDpNjAvFGHUIZAERbwuW/vEmGJbItWIAMwNoD8OSvvlL+4lOfKPf+4PfL+u43yub0PgM9XrwPBwAJ/KqKrqXJYauSddmsj8p6jW3VW2/AKtSbUhr4t4b+YnXsq33Z7R6U0+3Dst/qDD+9HQO2ppUAN0Lpk+fRDtXJZP5nVzil9Ugd96asj66Vh5sb5dqPfay88yc+Vu6+8s7yxpWTUo7wEBDKXkQ9YgHAmp0B4CQHFmY87BUNGEPVwQZX2EBLzLH2PzKO6/yJw9hTSskG93HoNlwDG9wd/HqXfRnfP54l+c/sR7OupHtS5kF3b94naTyvyfwXAC6RT2Lf189f+7Paj5ltpgNS40os2wMy+ySb0o1fOwAwX/VZBmd/tx7LoM4wVPT04XIHp6mXdqqxprGW2fr55HnTEnfwz8yPOPxZ6Dx/NxdgyPO1fYwSNg6V0dH1xLfQPw/oZ33xHZeJjyD+no9RnkzNuOtbbnR+PZQvmdG+RrtSfhslETV2VstspC0osfUAoX67+PuiF3SyEslZk4mFACDVz9N7zSnABAhmJGgtLfSBJFQSLXJG3COZgcKxtNnXfFXF6/r3SAfB2vb6UR86CPfpa/qSXWMjkWbEHlTtybEOqrJeYtUnJgEJ/RGlhCGjNbcbWtN4G+7jI12h2tTnIT1tLkBYVw6P8PSf2QzbkibQ1nuU85EPcTMAAC0BNQAIKN8OG9+ysKEj2MxXRXhdfxFa3tBxMgCgzY2zzNfPAFhTnYTIq60ZBN+OpbX+KfwM9YVXMkOHr86zIdoxSxMQoedffXBSyPA5izclI4vQhQ6YZf72LPX6ZQCgFWotUCkAGKRgZwCIcZ4cIAwjwNIlpD0ZHDZeek0CgCJS9lrg2ztwx8GUACcKxFA3BABzh+P8AKBXbl561PdvBQDQHRLh5XOu6i19KgDI2SzMV5GUY9HbgiAg0/PLAEDZuewBQBHfKHA41MZEPVGMPic5RCFr7nXC0m9tAJA8kizAmmQAZlmcbwsA0MVObkfSO2DmajJDw02CeQnwZQGAwBHS47DNowWjFJQC72yxBLg60xUAPL5/rzz32n8uX/3UJ8qd//C7DQA8UgCgl+fDAECRZNg4g4MyoFdxBfjoTEU6dGNT1qsj+Hy1Kev1URv/0WZdTncPyvb0QTl9+KDsdlDGrD0R8sTY4V5RqTONwXhJI/dyEiQflc3R9fLg6Ea5XgHAH/9YefPld5Q3T64KAEglztjzjzb0uLJEBwRdyxmY0TgLcBkAaCwMqYMuKypwvheHKmPyZVRmL25oJLWfd6glAf7vM6Y8XDIeIeazuBvo+iX8A/59doRXPqvJ/BfYfuPDhi/r5xHZ8UW2nQFAj5rM7RPP9AAAEOY2zuCM3YJ4vsu46zB+FF3r36kzkMdv9mbFzqc+UzSefoqmdk95fU8eCzTd4xae/DPSTHIqdjyPuf87uI9iA0xht+Cf0DPsc8x+c9QCX825PUaNMIixDwEAkR0BcsLH+gQnwwlnAADhuciHKialzcC2ZgsBwG67rNJclSrXV1FPwGiVyMcAPUuWKgIA8UpuZSVPAzs4OIzVMQ/5+cKSvTyeGQDkbFnbr9HrPSuTwEsGP/EAIGcIwrVvKQCQnWNZqPzQkMDHSDIAK637Q0LsM1YXBgAC/3LPPw8C4te8q0nDMAG0ATRIUBMFTyqciNARFJUVK6ZeYXsHA3rmwE9VBJXhtODo0TTxWa2HThIAgOJ+NpNDAKAqrZYMqGr4aedeKaohCXikcAUMyFwdlwBrwbfG9aIAQE8zNpsGHFYlwMqhJqXBYhGBfzhfbyCZBZAKtlSI5rrQrD4DAN2pdGNZpG+IsuTgTDMAzw0A4psRiAHpkfVtTuSwBFjvvs3nFl0xBwCB4YnzGgCog0dVYuWNpdaZ4eiiDfigJIJ1LTpW4mCh9kv82GcA4DMAcJRkATxtmdA7kGkJNZmhJwwApBihQQ/m/As8TZ6c1BUAgLChRxmA98oLb/x1+eqnfqm8/m9/q6zvVADw3rDU88wA4Jo8FwwAqt/Sxgply5wZQABaOVIBb81TQEDP7XiT3n5UAODR0fVyf3Oj3MAMwG/efrn1ACybdSlHNcOxAphrPBBESn89AAgrAKfAkzqjACvfRR/7AuRLgA1R5WdOJYzUp/WszmBfOn/YOe/s/46e3Qd4/kqOh9HYOO8xOCDmGQBoadiv8siOz7I54gzAhD9Viwpe6YUAoKz7BAD0Poba8IKR2UNEOk40k57zo4+v+gxAYtSYLknBCWa8oX/IgYJwPOsLNQgjH9y/gA3XVKhTALBmwEHXq9i9o/B1+pb+AjokEQAoWWPR747Syg/V+jPz3/v+LL2v1A5rGv2oDECwXPCjs9d8iziTfNjwR8sHswzAHgDUWWbCz0syAHVcwVlvOB4aR/UOsh+q9BsDgLIB4rP6INwn8E/oHGX/0RhsbN0nL50JAOSNLsqcFLMhvhSNwI7TwX/qvDHQq34ub0UAULfQ6PCXieynJdBLAMCoBJjfGfTwgxLg2vumP7ihLpZOqRyloRrV445B8gIO1w6UPSkMPWBzPWUQxIYnOgRAnxpUx5IBgPVV6+pg4/C0KeE3ckNPzGR2m3twD0EWtJuPzQWt9YlZwWegdACgBjSJmpoe1oG5LACQFbzPBGxlTHaPd+RsGy4YGEe268QbtY9QyxIlw09PGSnmyCGgVZJyi5FcUolSr+6iO1SPDLOONDZvPGmthOFk9dC0d1tmmuH088TMa4PvR9n38Mk1Uu/kUnjc3wfsne/vz3s40XYhUEL7G363yT8LeCXO4J3oXf56dgoyijdrsKZf9DI4AJB9THxDqgImAKDWnNq5Yllk3TN0QeHUPfUTl/COqbWoBHjgtS+V1PHol6ziuIMVaMnzA4BLRpFdk7jQ53v0OTNgJAAUXWodyAWy1Yic6OLzlgBP52jfXYfDn1T7r3vQnq2hBwAAIABJREFUVFtev8STe+vQIAMQJIpKgF+6+83ylU//Uvn673ymrO58vRxfOAAo1oUzABufspQzX9RMQdlUrBmNqCex6RGBhsJIRAG4DuS/EjEoAV7EfRn31gzAG+XB0fXy3I9+tLz64x8t33zhpfLmyUnZb9ZldbQpm6MrjbYt47ElOgLwCRub+7JXpyjXTzZYgUJD6wOQRYMmtS3MoMA4s4EzeVwe/k1udgBgRMkM8BhlOOm3GvvSyYrNwO25iyxMPEvJLtcehvY3c+qcNfOvp5P6xL1yplsz+0v6L1pFf18009jL81uYYx7h/ozoQ7S5OACwrVAwffhMr4XVAKxhDE/Y69tfxIBDM+mzuEMuDidZ11/sic4EHWfuRvJgvF72j5130S6yPd9hfm68/hTciQjr/ZWmsTCLvL2txcv5A0bJJ9ldpJ8gfkU9joQZg0MwkI5+WYZoPWU66YHYTHvSIx7GAuug2Mj8ziXAsDwdEhC2vEkcQpyleyfadX4HZbFhpmniQ3CbA3wn9SBdCgDCpGDTipORzCEgOjPf0qkOt254wQ88IZZb+Bz4Ga7Q+khn4OkeqgKWCrd18QA+SZ4tICCNS7/Xw906wxzkQ9Khen70Jci97+blgtUcfhGVAOt7Ds3Am4j/9GvdDq6tS1RBkzzFr4fnAZMBGBih1a1/8GtDK+zlSJwpOe6ZgEBRaFrEeoVin4l9bNwErdOGRkf7EIrlvUqox2TLDyl0JRjmXRUwaGzXkZjNgwIotOMHgqSaJKOSAIWOSs0AT/S5uDWWOQkYABCQnkCn3oU8gA/QIWwNCAxDs0bAUaEBI0Vg+2tECxG82SjiAfvwNf18jUF2ADBTj+7H+VglopRYlCOuh0yGjyhq1tuPXStTIRypYK9MgAPsT8tWcAswtvEIABqrOxqTdlhEJmIXTi26Sne3RkL3nVD0dIYC+G+oIuDGwKj4uD2i3dy5sUYtkgHQFUSFvlyISKvT9TV1DgUAvUOT7pBSs/o6UUWj2Qo3GRgzTSqkcRPfnnIeHA31y4JeG+NTHq3DwTR3DmE9ZmC0wUP3jLhvCYn6HU0104BvjepAZZS/JylHaosY3+35KKPj9P3x4uGnMypZ6s74x/RI4UOwxis0a6kC6j9Z4SkAmE5+jC3ibVCyY30WeaIbFwKA5HSRTar/Vm1KAOCLd18vX/30J8pf/85nyvrua+Xowd0LzgAUDdb3aO0sks6toFkbIWDdqGm9Al0KABvxuOjZnOrLvt2Xo7K+8nw5XV8tRx/4ofL+j3683KkZgFeulv3RppTNpmzW6wb+1UBhu1qX+0el7I42ZX18BJtH2OOGTnGkjBrRb+h/DACKWQa3dzu1H9J+n9jGzqFfeGga2VVt3zvvJHLoO9LPtEf2/XlLgGvFi2xAW8CJPFw/4JF1jHnKBKydxusJlAOm/TuabAxIpD2yKcerZ/j7zLrWvequ8iR+erMuKLMM7CgAsH4P/pFQ3vpc0ITf2zzy1eq/EE8lPr7a0Iz9udlBWgK69ZqrD/ilv/PEJ/VaTx+gIDVerA8pnhNIquUfoR+mVqhdmDW2s2ulR9meUgFA/DBiK69veDwD/UWxn76vxam05uzjjOpg1Hh1cgZ/nEUYkCE/8zBmmxSa3/TvMjJ5A59qPBW47AI68V7AJnpDS/jRwPYB72k0dyXAXRxk2Nb6hzoLkCUW7TAVWmgAt6erPE+uk894JZmXIhlyqzlx4HiDkGMWDQDCs0SOPDHR7yIdhgA5XKV8suZgQWm06Cvli+CQY7mabOC7Ic3s+QHssOjSFH8JNG8/PhV/uGSWSg8PAPp2davbCQAYmmZWLJBWrEGxer1vquiZlAQc1jgGABvTaCbFnoPMFoZvBZ5vOyoKrQcWsQxtRS4/xZdcFDDI9gQiBtAwyKPdDAEAeW8AFD4jEX4EQmUw1rq0x56iHHFU3wPQzteuT9tCh70GFppMwQ942AOAAw3vTU6k3EcOOBtk2vnXdkq/vzooI1+AmU0ukPdF8+64YxjAt6UKdoZ0xlxszDRN960kfPmPUnqq9CJ3hXBODEYoIxHs+FnHwWbUZePkMQRlSzMHYdH4By8HmRG6hFkD5AUHuuAiAMBRDllVti0Dhya40BaRrpnzBT1YKGgNBKx1Jh6HBkR+TBcBAGanSM5pML6izj5rkktsMVMfOf9eDAAY9bLLAgVrNdIVnpDQ6sGIf/QDfJNk2J+J31/1/6MBAOP3z/RvNL7eOgt9mjOFThXNmvRlDcSPsQfgS/e+Wb7yqV8qf/27v1k2d18rm0sEACHDL+PQzN+QjUbZHKJn4bwvGQDcr66W/bVb5cZ3fk959Qc/VK68533l3vFJA/9W9b82nFVZ79fl4Xpd7l27UrbXT8rDo3V5wOBF/R7ACvA/kR84+gIQJ+KSGQDY+cA+sJ4GSPatZ3mfHoPxnwPJHq92fzFAvDnvZKcAwxPH/mNze7sUp/5657GyPmH/MRli33LAS4N932H2DukzeP8ZPGcgWZDZqddV4g188SADqa01slcHALqQgz0kl5DnAVR+TpWnVoI35pD26pqRq2TCcbsE8qGK7vnPk1q3IJkFy57DLVhC3A6UgPfAoCiO1XCQ+AZaoiR+WuKXeP+ixacKAIyeobUvMwsdg9LxoRzsocPL+t52AEOn8xZIvFonyc4b+xdZBiC75imxgL60VjP91mc8LVkJe00YhyInVHmA8t+BctUfBxf5Q0BCm8PP8Nmx5K2ztALwxYlEEnOON/CBSeD7wJvRuoeJTaO042n+s9og6HVnrQQ1PVKEdsR7FHcOYx/Vv5B6JjahxNONvY3hjH+kEcd+UTyO8x+xb7DETyQAqOTe2Lv2uavQavgOao4hACgPvBAAUNNRZ6xFdtMI+BIAkE6WoUmpl3llUf/uAcBe+PW4ukMz1AeNxXhH7iwAIHCeCcGTrBCQWU4EbvdmATbKiZlgn6GkHd8nHwDUa9PMNO4ga2NmDNsEAPQptuKQimIVAnqFmbvTjwIAtLqrV3pz3UZKkOYic9IOJNHAA4BZwoJdK+fYosKfgRiLxz+w8yAzymA60y06ol9L+G5BmaLWOY4g2Sl6FwMAzijkOCTMgB4QbwYdzF490U9tVZwR8PqpOhDPAMAoUO7LPeJVJN6Pvs31F9xh758BgP1bxu9/qwGAbe4O8OEePwgAXnl4v7z45jfKVz/9S+Vrv4MA4MPLywA8HAAUgdShMLqMSiPgulINVqJjx9ol/2a1Pyqb/Uk5PXqubG9+S9m88mq5/q2vltNNPc242v4VBrI1SFiXe5tNeccHvrtc/7Z3l7s3rpY3ayC/gd6GzRYjAAg+F/3Ab8MQduEOnA7mjf9xTgAw8pH9eE1iZjaZMOQbr8ECOKBlmI3GGOkP/bZKM9/j2+ub/tmiT96+AKDLPrsgAJDiBW2XNQDY4g1VXfs4AEDNPwBAUIsFYPxDy8KFf+VwBQISSTMwxzWf1WcMaxv69ACA2x5bYvpl8qxBHvCP8y2CiwIAyY3PdY203yA+yTPsYt1HMYG2DPReavnl7YV/D1sXd2HLAHRgl86MtfOLMqxdLDMFADMfzzGBA/9g6KJvqRCZjCXIn52gAQHxjAReCzpp2iToqPEFIKA+hKZeyfroGQAofotimksGACM3yTqMvHuFDqE2JvVKVwBpJJCfRK85NwBoOaq932ZEIhEJiEPHUE3T71DqHoDg77eO2gdnAIqRUS8jL3LgUsHXFwwAam+Y09d1WW4fwPHyDHxHq+DGGTDjDEDlnvuehV2yJPb+URmYWhk3BTX07glakAssAIgIrwkWtIrOA+jLBgBp1Mw2rKzNN0mURXMhQ0Dzgc/5W3ycB1mbOxQ4EmRADWspsMfrhAWVpJM5jN0CoI02mjZCgrEqOqg30XezEMc4pecBAANALJq40G/BOjvS2Aytujufu1Sdw+cGNMuYeDoyAGMaUPb0UH0gK/ljBSyJRnezixjytgdCn5YMwH4yvf0Qh/DxZgCyahhql358PafYoFNnlLaZY8lP1aY1A7ABgHe+Ub78Lz5RXqsA4L2vl81jAwAj+2X9uT68o+/JKOzAvnY6VhN1JgPxAqz3m3K0Pynb1bVyeu1W2a1OSrlyrZT1BqrsKLmRDOBmU8q3vbe882//RDn+jveW1482ZXXlatlhSR74n7QDvmRMcghZYoDYEedATrud5wAAO6ukXUX8kj9yyxKNN7Zy45ktAwChvD3+Gcs+a7/O/qh7usdae/e2BgARjKJ0wWgFmnQjyZZkAJIrRP4F6C855LAG4xYABFB9BLq1V19wBmDHZwYAJN9Oy/bMv5H+as2f5VJgy7uaJpKhSZyv/ehZxrXMgNQWjbat0W7faDz66cVcslD72/zhHpKkMgYAs5oQ27KL/PyMwjEAKCOd+Y8+S81f799dW1IYGrkL5u8DfQbXCQ/QYyADsA8po8+0/NF6comy09/EC2bdG9iuQEDTbxHH1kpf4S56n31vtjrW/vNsDRCoaIDj0dtnUYa1pk6bL88VnqVpBT208QJHV+Avm4ARAoB4kE0jQuuhSWOW95GvZ3UVzn+JK4ALc/EZgKn0TDc00kP2SEDF4UZbDe+sfEMtUsCJ8fqslNWLP6d7AFoDDMbHMZFeRDolV3G1Dwj99NupNUTsOtx26m5PJGAiEgJTRddpWH23BgBBkStlFJU8NkrBE+qVNjCTE67IQNB1bciNwCCaYIDpVCcYd2w8LT3V2mG/josFAK2hqe+uJYmuL19rMCCUYoOFN3ujdD4A0Ap8Fwi7Eu7mYKD2M47LUK68tGfSH/C74cV4rYimlwkAysiQNwcgV++cdRIHw+1KgOE6XaHjHRZQ5jH9SPeEp3gP0717bmTBs18pzssUqM4wQ2PgD63g4ffPiQxQOAz1YdQDcHEJMDPO+C1s2pjuZP3jdcj2Z2ddX4giTJnJgQm85jMisX6fZwACfx1goSfvtiVN5OiNeEg1ew6eK45ipwE1R0xGlM8tAv60fkHVl7wjo1+uv1AxZPlRXY5o39OMLSKIsjmFelZiWDMf7f29hsjlPytBnIkbyQe/UznaMg4JgGlungbtOTUDcL8tR/fvNQDwKxUA/O3fKKt7l3sISFz+q9ZdlYQ0fa9aTsjMxvLhjkEO+PDs8luz+jbluJT19bI9vlm269r7rx76URlpV1Y1+KdG81VP1JOBbz5fnvvRD5WXP/hD5e7Nm+X06vWyw4NCmqxQywXnHMdm7OwA4Egg056jQcZ15y8rddHb47ninUmLfsLcPtQeX9bCGLLW4NS9kMYMaxhxp9OHkxYoFV8dZd94asTVBpY/lwAE8tx8A419tEOIrmyjHr9+hPi5IseRr9nudz3/2h3OZbDAtQ3Qdf59vW9NBxJQP7j0AATpBa99c00/4oCR/Hn/xerWgW6hhyXVVNpuUmzGSRnmkAVUN1SxgvEGnKIrpakkK5Kx5H0CfI6xf7hBhJcCfa1MzPixvXd4UF5PH4rN4hJgiFGz0EnHE+Ifj/TO6BAQGZfMb+QH9T6KGZ+j16wEeEZPkA/qS9knr/gY07CazlBTgBx7MN5nD2Q9zqhTvMSxk6IhPod0gJZxo2/9MnnsBoWC5ogca/w/mIJeAfm9/gYALKzlKF40AKAC+Np7UT7EjiwEAIkGnKMb64Y4Hh4raH2I2Ny6zq/oK2g8Pb0FzuIDjCwTpvanZJPMGv1Hr4xalr34c7/qXQ7FEH3Ks0fCfRN3HSDrwJLGoI8Fr6ooAwC1c0+D7JeyN5JG6TjieVrqIKDOzWYASj68Fhq9ZCEAqAzMUoZkdr7gDEDLslkKu4CAmtae3r2hPyQDEAIlo158BqADAGuALLRBjhikWEcKbYHIWn5/ggBAWAeglgAlWooBZO7WODLxAwCwc+DV4kBvlFhBkdR1gJjK1JzTPggQzOt65yC0cWyOgqbWiX4VB2e5B38hAODYn5K9LQ2MDUAycuXGLh0EMKnr5b4cBhrOCVmyttbRgDviQ1QyI7jkTXJNDwDmazsr4danlIl+0WPyz/eBAc1tIEfJMYBxQNtJwEEAXk/N2JHC1XpLAIBjDproF9zU415RqGvDg1L2q3K035ZjBAC/9Gu/UL7x279ZCgKAozHs1Cm2h3E62YaIv1k7uw3cvQMAaWaJjNApwMPBZfyTz2jV8vU2ZbW+Vvabm2W3vlrK5kpz8df7bVk1ELAGmduyX23Lw82qlOPjsvqu7yovf/CHy8m3v788uHmrPKw9AyvwR/8pe0Aze5IAQO0Xtw0AVA08ViRbrjkm/RsWMNMcAOx7qErgBkjT4QCgHljtgZwXdT4DAIErLhYApMASKpzY328ZgJgxtwgABL+Ueqb1WVI2NutZsoejPACYH7IW1rnya/jtqMd1VRb0VRPBIy1Gh9YAaErZV6JPYwBQbLvdAOsBQL2OuW4igCWD7HrdOwcAg5N+mWLiUYJ1Ad00zgCGDYLei8eYkEOVw3wM4105tykCAE08OfX3MeuO0jydb00+KwDADgrJSmIVcMcrFmxeZCW1beghAGh1gMU3su3z3r9J4/cQ7BcZA5mxPec0uSlGtXrAljkzAMjvsmOMMwCJIyhnXW3KGqUSZSvnPt7lA4B5/GH0kFeQlMBmnBcToHfnc2oAlyyrvr2LVl78uV/xIqaGoRxJlgdrsPUpMI1/fUDjnr4UACTpm2U4aZAEDKWcbmo9KygV9crMgCxt/HRqmXK/cCF0LT+zZNN1ZDRtBqDqKBHQ1K42q8hnAKBJ8W6AQdC7oC9XFSVxWEaRNk5eWeTKI3LKLuoQEBqVlHDyJ8re9oZV91SwulHLsnLMnEYw5dUIAPodeAoC6r8+g6E3MAsiEbxEB0bw0SRANyW1QIu0Z4UbCszjEfYAnJFC8TkDvuyggD6KSvZYxbYJ2T3cvIMLstIgAI0yOGYAoZ4i8YJx6IIS6sPkNSfi5QOA2fu9efUhfO+dPm0ZgP3srQ560jIAyakOV22R7FunsvKXBmaB38BJrgDglQf3y+03v14YALz7Wjne3h8yzeMFAKXCQQZoHUzwMJOoSpVRzdRb799WCLACgDXz72bZ1QNBNldrHQWWV+ywXG5X9usHZVvTZ66clHLzZtn8V3+r3PrA95bj9/2Ncv/ajXZgSLtP+W8UiI030B9PBqC2c1EGoI49Z9lvs++zNVkEADYQNuQOsEZ5fDNlCa//PKc9AwAfPwCY8tAlAoBQ/uY5wsA9wdCs/mIP0mT9CZAAPpWqUjSHDuJ1avP8IgFA8nCXyGh8Ta+bzwcAOu8RjacVcQ9AoP2zwQb/Zcs1o1nMfXz9fn0KcLRBmmUAStyi3+n8F/LBfVxEiQ2q5QNdovU1xfz0Lg5jcOq6RU/oLXYAIGUrSjTkE5y8l2m1tX0L8Yf4RXb+sX+vZpi0vBgBgJRJ22SNMgCfAYDIGmojoneQoIKVF5yYQ9a0j3dVbI++2QQA/OXMu1PoPuOJJsjsAMCJRxADgLF6g2m6EFaltYbOjwEA6bmyI0H4Pyl+/S9kWxMAqL7B8ljajRKCQQo0AYD1FDrAq0CoJBSnOwJlR/EDzZT6DeLQlxwCYp4+a2qNpwB3FA9LgOHJxiHFDwR0kD4U/Sq6+eqAi4yLAowj5T0CANvqGGWJ62U078z/9KrTq3Sa7MjL7ffGopLm8ShqRkZ9thVBPaoeAHScq+cb1PjDu7XioDVBx9LRywCADvjW8yBDYUv64YoIKJ+thOYzS465g0C7tUsAQO/M9Ble+UjjDMCx/jKnANNlA3bidWdZJOUP+oSk0eo9Z+BdButZAEA9TC+TmYPV65QeOogzADOaT8yTy3aNDWIigZMJ9fwRum34gtF3iYuWZADGJXR+LofRx9+d599EgLN9gr+/y4AYFxyBZpqegj7SvTSOfP7i6AY8EAY4OX11SWTT3OwQr8pmv2sA4Atv/HX5yqc+ARmAb36tHO8eDBkQAMTZGg5u58kN7FbXwsXamzjD29F7dozzOQHA6m9VALBsni/bde3/d1L2qw1MuJYbNWVXAcCHZbfetdOB23/vfHe5/v0/WJ773h8su9svlf3xcdlV58sAgHAy8PinAoBz+0I2rZPigDXDEmDlQLW3qSFp/45Msfa3JCMknoX3gf1sM+npSuAjEWkAoPZ44SJ+rntBph2jGZB/F0lzfWuYYDRa0KjEycnWQe5h82XGFBR7nfsM0bfZOjWN0Hwv4c3QN0b9wx4dPnS0SUen3eqMPbNh5jIAOV1CD9aQA3x/7e/1MRn6maEY5hmAoN50fDGT1f57oAXoWBgJ/e59bvSuuoxUuo8ymXxbEfccp2/8ISuyNiO9pAms9froevd+dPWpBJhmTDI789+8fjKybiW/kXLaA1BqWgZCMltTm1/oAUAvnfP5eRDFKg22xqbKTPG4Onke/DO/LqouJ1iyWY85imXA2wfaaLvQr4+VPyYyjT/I3tBz1FWW/Vq7JWs3ygZo5ynhQOUUZbW2SGYNAIYJHsqf0sAhjI0wlUeVAZhZz4E9DivyMg9kCQCI9wfOrJc/Ha+QviP7zdpE8eXqpf/BAoB+/AB64a2ujBCew+wUzlIDfh3DBOLTlxCTwtV3y8IY/h72qyDL2Je86IwtmI1xv1QJpMxWO2XUJwoEU4xLD/5Zg84KWfUfbCzuAMCZa+HlG04FTH4cE0UODvGHKr7llfYOad7DCxUAvlN6avHsu5JAPfJ6W+Ufw2Fd+S99S6OmtR4ZzJ4L7SdO6BXg3Ebd6BsZ6QHNPU8aCxWN0XaU0wAoKUF4k5uv1vxmKNbgwXqTPGNPKFcK0Z7O2gIyMLsfKhFx7CZN8WmU9uapSg2XLbtLf4e84D9qQ5FMv+kuoZrsjIv6she5uQ5Dn4pu6MqXxQ4cpitLH1S63vA/q/gB88FaZ67mjBYzh2p2CEgKbnCQM1NY6Qz6JAG9fikAkKvK/lvtkI9k0NqPsZwue7cG2JfdcfhVI+ma8b5iyfCl9X4fAHnVNEshmuqLyXSXzmFGNe2EgzbBH3RYq99wtN+1HoAVAPzmv/718uVf/9VSXv/LcnwaZwA23VGb8A8klKQ7HZvzycT+K17VTgILNAXvEwpNAUAtBzMq+u+xBczqSilHz5VSAcDNCfcpbqeo79et71AF/2oZcAUDdxU0v/FCWX/g+8orP/F3yvpd7yqnJ1fKw7oqekOx5QRWOoznODskyRs/4uelfGVIT6WcyifoNgwdifx7zN/eVUmswGhl5htE8MYui0CcRKauDzCWbASOSoDJTW0ZM87n03MxJBA3v1Mzh3LmkuvZA0uUlI8v/HN9SaN+5gyg1UAf/+56Asr74MkUnO/W+9KK+QjgxOqoVgLc/gMtFwEWwoM2Q695Xwcp7LyEdwn/WPXUv1xAA1ADWqc274jirzbh+FAN3uxWscDMLyJwA/Q7/FhvLQr8m8eoWCTwbWf2TmWwCYiM7w/jY6thPICQ99zrM5LgTfQiDRZlPlw8Ka9P6lW2wqMv+fSnpLrZdWcahG/WFWeDLFSBhTHmQB3ZEoJUbDY+8MVzBVFO/AGSf+17NJ51pCRdqS3xSA79KuyKPmU7Zy6Rgz4k1LIvmwKaf4moagQ+toYFFt9KyxuBf0TfUAD17DR9lyslWxLc97gM7bWekos3ug267lRl4R9Qx2qsq4n/zFpF7umz/egsilgHrF76+U8qfV4nbJlAo7lyYo1Wq3YCnoVyADDIEFFdqskIZVk6hxmcKCMlO9Up7oGmBY50HQgm0MIYHSSIkBWCcvqhU5PF2OV9uzR9vYEkg7aU3WclIKzMSaEFjtgMAPQp87SmRIMIQGCOwp6MrNgCh1dSZD0f5nw5saPKZFslFgKAS5kQnYzxu/sx9wAg7MKkqEfHJDIHAwDioTXmcpfB5xVeL9/a7HiFBbxuTd3ZE156ullZ6viVb4DrIuPpn6mvycA9uu8gADAMZGQtu9XnDMyx85QHcBF91IyHGyZoLAJno6PXtAYs49Wsvw1TOGEY218kkqvZjusyPUBXLeW3TqIOe426OisRPvNDSbshW43sBXHdSL2Rs5Hdf14AsA51qT3z9JiNf1mGZS8LPJ4msPX/gI8rAHj8oAKAr5XXf/s3yp//y18p5Rv/JQEA9wUyGkbyLdkr8VojPyoQEABApe9VFpE8gynjerwG4zhXj8IZh6KntL7SDgJZHV0raywBBhBiDQDgfl92LfrYlfVqWx4gAHj9A99XXvrwR0p59dXy8NrVcm+PGY5qGoAHjumbm+5e3mmDa/xELbx2e7yF96gOObid6k9LQ+N7OvJ6fp/J52x1+HtnJ0Y20ttXGmtKK30qjTVNkAWHPafGFnA8iwub/+AVU/3CG8bjMUYAoPgUE/tNgLL6lzKUNdsDr6F3UYPKGmdXALB9gZyIACCcBAzAXP3G6+9eXqzXstQVZq2a3DAHAOsp7qB/458eIPLqQOwr0Qf/dU5rA3JQz879SFm3+FCTqFcZPT+KR5fHMsQ7uIQd4GXnb30zjrdVEszs0I2M9o27FinKxLq5+z09uwqEaq+EpZnzxYovO8VZdBfQXnOYBebd94xIwxqbQ0m1G6miIr26cCo3TDoDAGk8hjOCVlkzHX8IAFif5e0XJSpqXciiYl6OYH8PMLH8tjlVANCsOcy0eQqujH/sGGqqzHWoHmYPAFoKZoeWwvAtw14uAOjmFtjpxkWNbigB/pqnGQA8zNgM3MDmgGgjaNghPATBOGGUCZUAgJYl7KJdJADYBNQfquE0QDSWXEcrYYoADJOi74Slbd3SfFGQmXjw9zMA0PKb51JWOFrjh7tSIx/I8tvjAADNyM7hEPQzjJR75CzBdXPHDfdtcYzPAMC5AzcDiGE3eBy+zTJQ8gzzZwDgzMHLvp8FyLMAd8n9FwEAnmeOM4B+KQiodYcBQBwAePX0IWQA/vZvlC/3QXpDAAAgAElEQVTUDMDX/qIcP7wXTqE6+pcJAML6jUD2QCbbgtom37UM9/J+CAA8LvvVtVKOrpWjo2uYt4cA4A4yYvatKnhX1uttuV+rJJ57oTz3ge8rtz/0EyEAyA6vj/i9PzTCDpB2PsB9BgCObaSRi2EQrhYAW+5E/EVB5DMAMGVQPhyEsnMOAgCZxzE4bKfe4n8YE3UBbbdYB2xGd/eeNwPwcAAQNKL8SIYm+I1VJzdQiatiIOhpjaGeAYAHm4LHBQBq6yZgXl1LBwAOsovruAFERYCvA6UQelTfE4AFRHobAIAGCAHB4jYDXTawBQCJnLpn/TMA8NAMwOUAoNZ7JkuwBwDr0gjaoHej4FQgAXQIpzaghbNXWQlTGKpPMgA7RPVglSQ3tJlqALDbsVieAdgIjAh1lx9pwBtZtPobAWBECwJoGEX3fnrgD+hLolOYzevNfngEoHiCulXqFOYM0RF+EcbDz+puY9ADS78Rdujk1DI9OjTZCDB4boq4ixydZUzTl2BQ03DjQvQPS1NmMnr1Y44BFkmxn+bHmLHU7FKtCuDQmo6mynmfATwgrjIn6zDmDt6yVciuGgGA0T2PEQBUw+kdE7vm3s/IOmyCwc0ChIl8P8sAXMCCnr7+77GeIUcwLYOejOAtnQFY5571QCTNksfA0zUcaVzChpY8XoMbXG7XEgDBX6IMwKu7U8gA/De/Xj7/G79Wyte+ck4A0OpXO1m/wbYqlAEIc+ZjMNo4e1ei9izW3gFk2RnQfVEJ8HQJBhfA+Ha159+q9gG8Wo5ObpT9fgMNG1oGIOgwiNu2ZbPel/s1i+n52+WFD3x/ufnBHyvl1XeX+ycn5UGrAAbAkDtW0yIPRnDWDMBsVYw9VcxFPKT5Z2ZfI29spPJpfWlOM4B+8arpkmW8iZ6ts7Q0qTs/fRBoRy1rJGCnEvnxSFPZndi3xfNPLvQxsL/0LCXAl58BuC8VVxd9IFSsMtc2S+vp26jf2MdwaA7c1Xk0B5D18QCAMkB9CBBHYNwzEBQJMC5kIIFm0bYgnqz4XZeZARh6IroEGDWhjhGsOnQZgG05bV/zeQZgvtyPHABUJdfMmax76uwr4+Om0rS1AGaeEyLinXNgBwD7SNfwhtlCALAKO2fu1UMMawYg0PRJywCkOfJcWfmJDwGngtP4VUsAwo0QWCdSngsA7JQtfWAQhINqSA7OAHQq0Fcc+RYj5ntTLg5jP1sJMM57kAFIOlr7HUQpWwKMCoDpiogu7vkhIbXTibPnlFVZeJKN1uR5oCO8w9KtJylc5Kgl4N+hWYF9SacexTi408qlzbV9gOW/amH78aigvO4scQ8KXiZ4ChLNji8eTxrgBLS3hn8W/gTvVLfMMnhgN00DEfg7fhZmALJi3uOp0mcHALvwfSUGbmScvALWZawiCyPDlzg1uFuk77QBwAxM8LxJs5utobrPlNz079PKu1NIwZQ9AGgv0es+olf+uT41q7/ysOfPHbc+u6Guz0i+st5ErGCzJuLsjcEbvE6xfNfPvl6/8xk75rIJfZ5SAFCFK4c2HTqQCXv69SXFM5mdfZ8P6S0PAJKjgPyv9aEGAg5cuHb5VCseABBo3TECAOshIFe3D8vNN14rb/7uZ8oXfvNTpfzll8rRgzvh8OcZgNIAPJ4/8acAf9XWVptcNzabH9Hq/MSfEMcC+BLsL2iSdthG6wmkQMDqsM9QjrMsDq5QtTe7simlHgSyPinrK9dLKRs4HXi/Kpv6XR1RI/oWSoA36wYAvvT9P1xu/+hHyv2XvqUBgKfrDfboJc0pQf1oiIcCgPQc0tVphisbAfwF/b3IEV9KwmwpvD990QAgmasIeCBbSNzk7VlsQ6NTmG3PP930P6JRKuP40qkeWEp8d11vrwMPZdKT+9GXAEPvP5AnryXJdwXdIRpUAnyYoY0gZNbMgQspWvXT+FLviwbU7Q5psYfwDEpt2TrQIUBaqkFnNK8P4xANfBDFcmBr7Hft91W/0js8Q9X7bIaaxEexH6FXpulS3OjpYxh4F7uctI5qIiP5zhZz1mLlsgHA0eYqzZ/0Byc+NPAPaJxxK+gxAUjjeWhPFJ5GpaqMBbiSVltyDqYWdDrEuHW8hwCAtN68RnSITQJu6vVcUgKs7YixXWyMhAs7AFAfmhJ5ZAobIB+LqYrPh789tkKrp+IzE0/J99oTnPGr4fXkfA7WGJNDxpTU9WLUfKu8wiLFV6ww40aFfY0/x8HzcQ8AhkZOHE3QiuhUIuNqIfSG3u/waWPsHRZPId5xUQDgMBhXKafZNf4d00MzBuG/D06AecV4EFv2Y7HGQWcAMpsr0GFFJ+LxwIOU+0MmrAgAayHj6R8TGx2XRG8b/yq5I1DUCgG+7xECgJrnWoAZ7GhrvhC+JD4nFWTpFRtGBQCGVkNTWWdgsErJ7K37jmZ2gItrMm5gfTNgfZah8FYEADWRQwBQkTvVR35Hp1Nw1snoAu0kw4/e2wOAekRjR5T9v4TbyCBnDDnjDxC2EZUO7wFoON1sLBwgNosv7el3GAB4aEDUD+xtAQDStBu5la5d6MSm/OkU+wGa0jxWB0daLnwG4JXT++WFN79e3vzdf1W++JlPlf1/+fMDAMB+dPkp5WRL15z5R1l/680GS2krgEaHY2h+huzv+l8NSk+3D8tu9xAikpYFiCBgdVAvU84QANyvTxoIuL5yTQGA67KpAMoeepZRCfCD9brsnnuh3PreHyov//hHy/2XXin3rlwpp5ujBnxCkEK+y8iHgeU9KwAIvtqSJt2WO6u/dy4A0LGI16wck6lqlrPyvHE5FXhAz+N3B3IqWWwZnREA5N3ufq3OBQAu1vOXd6HNAAw8bN8zCnkSrpzYb1xj0kf133kJMNQU6FNiZfZQIlmPzgH+1nEfcbz8G1hHfNTSgCQAACNeGi4P9Es3Kp4ylhsxlgKAmqOV3kC/JQJALgIApBUWOavjuBgAULLK7CqBHcP1IaOGA5A/ifvmmmMGqFw2AEj98jyLsOeFgJrIU7UnwtdeT+nniCcyOvnW2lOp/JN+dasFACDYoeUAoI5fu8z+CwYA9fo17rThq9NRUDFpMgDPAwCigaZ1YPoaudYxBMUa2o5Y/p/xq1UmIiojFRRVVtC1KtVoXAQU9oAWuZslWEFsJYvSy5t8H0nz4QBgJzy2TNbplLYj61/sHYiREzYCADOnrU13rrfAvFZ+URlhS90AcrK8mfPof+hgOmdaZ8CBMkKGpt2nCAB0oKSn+dJ5CJlE1dl7I0M+c0o69zAYDj7jEZQA+9FqbqSReqERo4Aqx53UnOeWeAAwh4gAQFnqMHUuQ5Dn4pnfPdsBgN6Adjw9aVL+VgMAPbN6gGupbiE3OQNwgNYKIAsC7eh97Ny04L2zyIqfJrL6FGYAGu6+TGACLEQnX3MAMAzJl6rk7rq3IwA4sq8REb18ZAEH2cmF7oF5nbaxzBXN2aj/B59sdttyZXu/3HrzG+WN3/2/yhc/8+my+tqXy/ruG+H69xmAPb/NA00oaZLDP8BmbY6OSlltymZzXOomYgUEPZDXyo12pw34O90+QABw+2gBwJaNtCkNANyclPUxAoDVb9zXPEDIAITKRDgEpHZU3F97rlz/wA+Ud33svxUA8EgyANesF3tQSS/G4wYAD7H83pEeahpk8IvOAPTeB9uhzmhaj2YcZPuWKv1azUoQZ7J8EH3PoKVn7/cAIGQV4YsC1qT4RQCL/A06O615kniKptdXlHUGmUYQpPexUju2gPVZG0NnY1WwafKoiHgxxUcZVKbDwEHgH3BjCADy5EfAjbLt5tAkAgxpYcA3e5IBQK/LOCOMy0qtTfEZQb3oaqY8f4/lywQAdYaeoYNOBjIlwUQL+XcGsGT0gpZo8uZDAEBIFhKACWQRegJnGYCsg1GNdBnoAwCQfCq/3pCROv557ACgq66EkVI2oN6kgM8FEKOFsfx/0QDgrAJgCgJ2AKAbbx8RKONBxHE61/HkOGO7lBQAtI8V0IZ2mavyBeRazJV1ElyKtTowIzcXetbYjwLtoDZanQM0s8YBnzcALvUSgi/NLbpnAihPAgI1Eg6vlsUlG2V6ADawBVVOuwAcJDsCUdB6uvz7AWVNeq30O3KnaQIqGO8mVS04v3jRSGERAMNjUpejCuVGraQc9L+GRlSCo4Y1MlAajLVBgsx/4Oq4SWfU1CVYqR7GL2k2Mqv+6Z6e7goFAJLRyQQgy/BqlIDN4vHPFDHLhXamYPNd8l6Daf97EcXdsezaPRKZjp6EOpEMsucKVABdgbFrUgzkk3nQb6xbVG8voGTEb47GeMlMXdKrs+uWZQDGlCarkUlIl8JupjjTRUtWaK6j9BU54Mqrs4S1Fl1zmQDgobIQDdixp71ElSQtm6zKAJyZZXzgIQCgtnc0nkMCFG9j698UcNfnHe12DQB8oQGAv1W+8JlPAQB47/Xh9O0hIJafe9p6SYSMnaoDPQAIfsO6gX+tJLhtJIr9AD6u9qf2HdqW/f60ldjSv5IBeJklwECWfdmUXT0JeHNSjmoJcO0BuKolwBUAxHLEil+WbVmvd+XublvK1efKle/+vvKej/90AwDvXzkup0e1lyD26OKKjJFOBHLMAsDZ93P7ZJe+ZQCq7LypecxM6yKhyi+a2QAyKaPrRuCe6HTpcdWPhOIDenpvXWcAYCTTRl/PGwFMqDjxhl3PNPvu6h81LcEfywmfII2gP6zlJt+370HdqVcBp7gHGVpVEwcQF2OGDtR9IAgI60M/AgAq2RgwKffZTAMoyHiN1ql+zACg0vc5xTUN+goC0mvtpWkshK0SXIKFzxymv7XM6t9j5hn5JdDjjbRep30anbVDrePniCqinYhnYgBQRhk3tImjP7A/uY+VASpL/MeZCvO0Nvp2cAClZledQWwzWol3xi1+RCrJU+3lz/OYTQLCU23RBLW5tJR7KUCWCgINAOp+va0bLt4jggq0rfyk1q69AOfjMAofRxAPsrwMFsICgHCqseYmk23V3hllAIrfYV5DTIsf0lpHtoYA017n+Kt7GzIuAfYyhc9SH2cVvvCmvrcyzVH4X82fn412oSsBtvOJOQ8ZqinVaL5qhdIS5VJWL/78J2cWDnlFBIYAQNiBASKQgu+b3lqmbTtWehMMU19HiqAyv5gvHkr7pU19EiiMHBd/WMY4kI0JXD9tY2t13OLArHhBgCbWgZSeJ8QcVIKsjb7uARgujlr0JhDOwFqDO6JAT3F6l5FLN4C+ZNo/X2ghhs4pDeQW4pohAxKRlMnUAXFbA51Bx7xon8jiVwHAhQApAYAG4WoyK/PtAd6ZOQsMyOwYB5OBFymHhfmDTk5IdlqJ64BFgLfG6qG5K5MMwZwios4Po5xcDQ7kiMet7IaGxZ+aPZiuppGW1XELAftu2vm3MgalAsagtibFaPRRg3T3qokMTJh6ZiAL6iPb8vnwVZgBKLMAl/gwejM8W8p4eNomicKuqtYPswwY0T9Kpo1BXqo79VrT4HKzatf8cLrTHbMm87MnOxUbXp5RYbb+tUQ9o0RUwiPyJcMZPeNggLTT/0mWg3eu2jLLSMSPAR5tAODpaXnhzW8yAFj+6otlc/+N1pvJ/zRzgkAcfOcobW6p39F/eC0Ll3wH+lhl8qw2GGQDkOb1dfOu2jzrOp2WUrb4L5YAX+ohIESRCtxdKav1SdkcXStlddzKgFvmYusPSBvN27LZ7Mub29NSrt8s1z7wA+XV/+bvlnsv1x6Am3J6RAcY6ADL9tixfp5yzAPOn0kwf79QTcz0UVvV6Y7aTKKtzJwXQBtukBILpnRTPf48jZB3rX3QFIffl4x/TBEJnpdTzV2ZBVjGTsdvaPkFBFQgDbzFh4kq2V4IhrXH1Yp9SqxQpoeeVgEQeK28lcE/kyWm+EYlImTVLv65PeBG4B9c2cakJq+zEOnj7tRhpBnLTucPO584LKnrNW9f3kzXgC2XbC6MdlF/A8Bjkzit7tY6WlEd+Sizl2SLLSC80D/3/v0AALI9EnsAwY9PtlMGEjR18CQ+DZ+QESRKGFJ2lMGXVP9agEYD3IJfKN4nc4HjEh5Hb9H7D7wBgByFPitbc8zIJdkQ+4NPVv5mywBc1QxA8iehmmxFoHATGK8jeyul/SeziWB0WaiF+CwD4lwCGEke7HIJr/tR+CzGkf61ACP6QyY+kTs5WpyAWnAHefdeP4zoh36Ta8lHtMyi7KFv2sTL6gP24drnsx6A/pRzepMmEPFKbIhnrkkKAMLk6WXkWOp/Nanh9xggkmE0AIaFCEU4G2Vtam1KMAWDaX0sLCZjqKAVdWcCzOl37vQVfXGioOpXVX4liMbFQEEjFtQgIJREo0HUh4A0WqskYu0EhPSRdHXew1AKE4btmW8khrKOWnmwElO3dQ70zAAYpUOTIqtOAOmIASzD1796AFDtmA12hLTzsRgAZJ/MHRvvSEi9G3LKxt+CQ5SLaJphxQ7c/O0ewOK/J6dwUl/L6A115PMemjOem6mo7P6qIGdzTxRkAGCa0SjVZ57Cshk1MafxoHw2pgWDRLyiNy20owkpKdikWDkWMwCQ1jLWd3b+1gk/TD+EPDChf8beme6md8nJ6soRcO/U79ABdKb/7SrJqp894NS9DnOeUzNJwOsZX8P3FwkYdDZywWZJRuNKhbYDPxBx8i+iPdQOcB/ltppDjZbRTHgLLMNQBwfBfz0lTk8H5l9lfYcA4La88Obr5fXfgwxAAgC7wIsZkLqA53pObDm+HU8yRC5gPiIAsGaSQOYfZAJSIODtiWS80AEgNQuQyoBr872lvHwY7e3V67IuCAAeXyv71XGlZlmtjhpgKZtUu7Ja78qdGgC8+Eq5XQ8B+dDfLvdffrncP1mX7UZ8AfB/IEPCrNcEQNDjYu/jPCZK+074QP04rz7Pa0/9KuiSski+QQIGP4n8M3iTPaDaMFNiqd+DAXDoXwvPnV0fT2R7MbtqvW5vouBuCJLW5DoCAE1MIDEM+emQ5eOCVRL1wVjb1wsAwC54VZk6sr1m1waGsozxTYRoGBp0q9eXYnsxgUP5sT6jiZ9NsnNRACDHlNoHUjGV0huS1UW6XsqCKcbr9DNOUnwcKVucanqcKySCTOIDiIC7TTafGMOAzARAQldVa62cDzqAQ26tz2r6d+QjBvZ1pKOYZ4KemakCc9UzFgD0IqcBF6Cr8gwhY17PBecOHITXO53pS/LFPqP+ayXK8FDon1f/o8/IN8GNLcwYJlrgEzrPCPwqgbENTZnmWmrVmvH8kK+4354GOPUIZBR+7dodySGKxGvGHrr1tQkSsrFnabDcfvUZj0Z7tYxs0ntCx7Y6Aw90LM1t+8nodNI1StenGxZRfKvHMbZNwFBzDZ4DgJ0BUmmzpJiccF82AKizrvQOUrQMcwCQ0lWjwxjgiZn6vQgA0B77fBgAKNkxqKjOBACi8lFAqhitHqDqd9BnToIXHOfkTEFKy8X+lMja9FscilxIG7QyjkcNCzENhg4sgOOx+c1MvDaQdMrjmIYXDQDqtW2q7iIAwBkIPCLHwjK/TMVeNAAYOiAaaDWgK5XeRSM8PwAICsjyNKlbrwfp0p6T7P3NBLHO1s7vMp4N6ZPc+vYDAInesYNlSXUB9L/AjKFobWfa/VEAgOR+hWz2qAFAnSHK9rYGBgQA1gzACgD+6/L5z3yqrL/2560E+OIAwN751tlDOsAQAFD4rNP3tBONpcAtE7ABgMjHOzoR+Gz6YX5XfU8FAI/KanNSVsc3GgB4uqoHekAHQDg4AzhxW7blwZUrZf3ubyvv/JEPl83f+O7y8KWXyoMrFQC0mdMtAKUMDBzIIf6L17XzueRXkN4lmYri4kMB/Zl8XjQAqIMiY0ZCE/gMANQAIPUss+tOvN1vRGgbH8Y39UPMWCE9zPoYdVMDUJHxmJ/Zr+iKUBVcMuMsAk+khNL6FhA9HQQAYsuIcK44+Jn8AmCsfZ5oHgCsCT3gGin3Fd+N4A2Zm80OBKRFBfYuYhR/+3IAwBEwcVYAsPcBJj7KUwcAuvko9mgr1FrqWH5ojFKxLLeZhCibimBtdmjzW1qFoIaHtY2CDGejUzEDkKsquSUQxIrej5ANPFk5eZ7MVXR17p9KbICRrQYA2zy0PMnvotP0Z1n7B86LME/0LXZoI0/zpZfooaYKADABAGHERCv4Ays6DSahwfXIYo9tPq80v0TpCVbumX+VAIALwPMzAoCqJl6V97J65PRwEhILjAIAqIMfuzw2AxBQ7/THZQB60C+7OzNhcLqnIKgjoCV9xgVkANqMNlXubMoAlMvIAxJBltRYpWgM02UUlqbAKAPKfPYlFGsNGHF0P6ISWe14lYLivqmP3a1TG492qYN3IS0r7xH/gcGPf8RoN4Qsz2BJuwBkb6HH5o12Z4dILFJJeocVJ01yNCvhjTMARfabvJtBzB1HTfWp/KcccfEZgJ0DhB+wtCn6VYORlQArTYq9MdDoKNnW14DDLE24wUBpZxZ4hh1XGguOMaa83N++N0Zx4txNpTE54JfolrCDkbPBu6IMQD0HY8CDjLgZQGVKJJrD5moAgnFpbWPcLrO7qm3giJAXQP+nHQBUNlirkSV7Cs0vrxluh6kcXgzOvhk9IMoAdAAguMT7stpty9F+W06223LzjW+W13/v37RDQAAA/KZz3Ck6bwy3oIeD55Pgb5yD6CPQLHWDTNN13KKF+lNBT8BHBgC2XdRa5FQBv3oK8I2yXV8pD2sZ8HrTehRulF58WPsVXr9ejt7/N8t7PvyRcu8dr5btiy+WB8erUo7gBGDz8wQBgJFDPtNfmQpekuF8GQAgxy4zubuQDMCZh5NHALMKi7mJS7IsqAR4NIRKn7Y/Tdn/8Cx7+dkBwDZ2taHdgYBsz+SNwm++cztQYkZtSy8LpDWt5HxBTX/vf5D91zHdqKcmg+eLMwBz+wsAoPe+gqoq8q040xv8KQGDUBc3oeirhcTH8aBizHlWpCQeHPOp9Q95DYOS4PbdghJS/a6+hNGN5IkHAI2HxjCv52P62yYUWA7p/We4S8ff8LfIEpfQosmnMwfomsbvptqP4nHgX6E/3KHXD8bTrz8OSp3ireWa9JmSD/zVehUYq6C/Iz34NGMJt4oLpT4jomaBtovDewAw10j06PAVEwCQKqtomAQAW0B/QN+54WieIfGMzRA+ewagYFbxuAwdDs8ARCZrcLdNLAZFBs2kZUngel6E+kLX9NZwNx4jPfMbOiODb6hMRk1OieGEwL1IgwNslbx1uGrm34KVVJfoy/sAQguXGFhO4+aXyy4A4WloVkCdaICglfDgW9m60uLTXWfPANS7kn1GJfUgyGjkTFZH0FyA9U7cEpPo1Tn06PP0kat0omq9aqNL0CMFgQzNzsmEPaRfQ3ShK3kOLpHm7YfxYdP9aqyzu8URsX0zDwcAxUw0l8ccopOq42CIkoE7G/+YN2YCfHYF3sir+FnTG/RPDVzH7ycX0/OS7OyjkefJkbyRHgaDTzwWOiANoMYxdKLWBy9eXy5qp5EsTs3dyX5mGYDa+fHPGZVVSOZz30JAk0DbpWiMtIamSLBlPI1/DP2Mk211/zJ+ti7XsnucnXuKAUDQYVY+Z+CCBrBorR8HAEilIjSGdSsB3mIPwNfL13/7t8pX/9X/WcpffaEc3X/DAssELGozPuc6vMLzjPq7bnDVjEgkCNhzqxSgCflYT3MGzaPIAGzjq/K2Kkf7K2W9ulrWJ8+X7fqkrK7eLPcePGigXvuhjfL65/UbpXz7+8srH/xQOX7/+8u9526U06NVKZs19/jl8MbZ+BgAFR2uNwDOy1/dkqpAi+032nC69pAMwCUAoLb77Z0KwPYZidF4vXXzfsRM+c9LgP0TrFDM7VNm3+enmM51bg4A+pwY/TyIP1AGVR9Ab6allNhSe5YBCOtpe6prEFDW273RuQuZh55XiPQAlQcADX0Cf3urABCK76I1WQoAckYc3RAZBy6PlENIVO1VA3R6mBaAHtqQbGLL81GtWyYZgJ2Pk4ZHc/8giz+W6a9cfqAFROJjTwBAp97c9Oe+ud/Q8YeOzGw/HbJh9K0ahd8A7vAEtQkY6cvmo6o1rPqVqNX5oioTUHKkLBDPZcA0xuaOavvk7PmgNFUii1CDM9RvMvr0+PD9ZkO849WeP/16jI/IgBfk0VvfoCCqpBh6M4297KDhL+Q7t8FLvMDtUsjjSmU0tyB0gAvNFoYjPpjfhrAbIL1+FXmPZcfTc5Zf50qAYUGt04AuOmb+GcBFzb3daQBAdsHkqvAQhlkAb7Pi+JQj9+5IsYJusk1UNYO2ZN+JjvUE1KM9DwBIhpEOsQC+sOxAJTxmbl2WCaWkS3YPrYWgzmMmpQbFHvwjBWIZeO4uhQ7DSICmJaDjQIVCG8hwGPGQrC+ZsVoCjJuykuirWJXFirPmZjD6RDskBhKWPO8xmFLclKPma6MDa6066FTC0d02A9AKS/2rB4C8QOX06TMAD9G2cwfpLL0bNC1yANADoJaKpE1Jn3qHzM8UnA/YHCBDJUco2BIS4Pi6URMBcNoFmdD/EHIHTPK4AMBRlnlI00Q0lPaE7MrqwA1oQs6hcfBYhz0DAD2ZKxmzHoBwvWgj9o1ADMKfJwUArIGR9GiqvfK2DQCsGYC3790pd37/98rn/+WvlvKVz5XNwzdtbo12PA+qsPX6rtd/a3WqJVDW2i/QZ3pjyn7PDvajAADbOtdRrhsAWNbXym5zrZyur5ZycqOUK1dLOV6XsqlHALcarFJOjsv6W14pN7/rb5Vr3/7+sn3llfLg2tWyXZeyPtq0Db465dofuv74nr+PFQCcu08H9fR8+gFAf8AB6QKlE6b2KQ6EKOC67AzAWQgLSWEsiaDxnG7r4wjUjHhdRgKKbzUv6N+lJFaYb7l3MGsRE2SoTSoMvG3VGZ9BNwAAACAASURBVFCPFgCEzUPK+KLIizYddXVY87TaImA3VVwQ8QfAE6YT2bWYk+8X+aHen+jVQ+7fgr3swUrz/ll4PQCQSH6ebgBwZXq6RepXbLgF0r1vQvdanQtyrUnMJb14AycqkVwYkK2HmXWf8PYIfyhFtyMy0X9+h93gB7bFF/Gj4Z90B6bnT/LhhH7k4y0wft0llwgAstxo+lHPTQ3QNSGTkc3gADcHn0F7HgDQyLsDL0VHWYt0bgBQFBiyeuu5IwTRqHgMACqKVADQpIlnAA+LnJwCrDIANZ35KZGlbCfI9WVzwJb7OH7uFrE3nkJwvcu4PAOQaFgBGHLSdTDaFAeXUKgBXTAAuKPGo8oxkTVfsoNqid6XUucWqAeA/PXub6VR65uhyfnoHfvSEiKQfE1dkQJ2CpnVlCm9nmeoze1rbsRzAHOuNK3Cja+n+TPIqy6jDMDRPJYBgPpuPV9+83Ai1hmeX28flNN2ZMTnVFXynmYAtgMqhz/EayRPeh0iswgGGOeE2TuyA4f7UksyWoyM5BHUPMMip9aTDgDO1hqys9UiugxAbUC9w64BK6it1gHs7M3kWEw1SPqgQzKGlozI2NUFzk4GQlRqvK0AwP22XN3ty+37d0v5/z5b/vCXf6HsPv+fyub0ziUCgHZVewDQ8hdkABLvKSOIj+lKxC61ByCNrZb6VhDvatkdXy/rl7+17G7eKuWFW6VcvVrK9evl+o3r5fjkqFy9fqXsr10rm295Z9nevFUenFwruysnZb9ZtezHJw0AnOFXnbdzQEbvMwCQrOiIykv815lWnGcApk94RAAgxSM6Fqq/N/2LHrCPtjLogOZ0aAagocXglGQaR3t/ReBoI/sCegAuzwBcCgAKb1VfWG8osOw2fwsOb/OA8xQAzK17+Dy+BR0SDyPNsuLsK3MA6ekDAJVGrcl5zcGFz8S/xsgAL5Wef/C5+HxO9jt/KACoqKffAOgX+fSxDlVdugQs1+TcZ0BmCQ7RwUJaPsB+WHp5dszjAzxkTFB0SYZkIh4a0+kRPAIA0ADoWkNqP0nxj+GPme3oTwF+4gDA2//wk7hCJA20K0eMCF8zyJIAgG2HxJ2ua/Jj244sHQ3PJmaYCApvhnGRzxr3iPDPVAuDEboBP1jwKwCIANxgLSnoo5HYIDBwMFQQSOMXhUzIsghdA8wM6ITzrf+0jEop6RHNBEqbdqtEualybEW0UYgJxglALg1SGFDJneLVk8kakFmT3k7BdBB15xJ3PVM0TwEAOF48X5Hcwn3F8f71eu76dCbNrfqFefjuXS40PMqCp+Of6ZdpBqU8QBwR+1Bar3geUloud+krawmsLoKNXExmxHA2htdE0s21eRCVr4DXPzH/jglN+syCPbKLPzlDhXmNMlJmZT1ktOE66sslGpibahMP+wHojNNkd5jHMWl5N6Nu3wNS0XLCn/3ad9qhpfA3me14g7jCjtA/U9uQaJVp04WfggCgOGpOXjQ7m3YopAcPcXhkZguFo7tsdojPTIVk3y8BGGY7jKOeTqwJ1QO0jI14o8vITbIFp3NnBzi1kO0xdAVnyLVm4eQX1UgDewDu9uXFh/fKyZ99rvzHT/xv5fSP/mPZbO8qANCBbufKAPQz7A9d6EqcjEHMAEDk40sEACH4qI23j0pZXy3bo+vl+D3fUd71vT9Qjt/5rrK9+UI5eflbyva4fg/pfNvtg3K/7Mv946tld3K9PKzHhBzV79cNAKQAndQaZfsTpfqWF1YGATCxdjPZXzS8QXexvVpgnztvxwGAM/nSvBloT9Ca6iW6hIp0aqbjO//I+Kr4xqH4LDgEpJuA1aPzDarcO2gh7uySVFHMbp5YSAQAxZcMXjbVQ/EAG6XU8HwWYFt7x89+tNPZJQ7OzLYC7XP6EKBBqy4VD3rOsoZ5ggE5RTom0S0PhF9p3joDUMdUttcW3Ffp6zOKQcDq/1U/uG/hwrNImHC0BhKrCA3NtRhr+vuXA4CaTpbeJJa+JTK6pUrwl0VAYxEbjUFobvSxYnjvk+MdAvgxAEjgH8yKQC/21HgK0YnFlrq9t2m/J3mL1sDEnVw6LOkrko0obcu6kueuR7V+fzBWFQ9ovEA2BQL50PZPAajRGrb4NQIAKUjugMBU2XZf2jH3h6Bo88GvQhtV/26nUOv5kMBibGRL6LWhJL/A+gcdt082yW0GIB4y0q2JDLBbb13+TfLOGJMlF8mmHuPM9q1u/vwvqSlUg23DLemhB4/lU1c7Dhe0VrEvjpAYExQ5HI9Mg/dBELkl9L0AVHqxRdjx02AhvILwIGD9fgYAmne6DMYWjJsSTskC0aU3ZCjFGZclig4fseMem+wGXe6k50CvwuUTrXyEsq2JmwCA6CzS+1lW1IP78WYKfBLgTnRBoxf266BLzRkkLQMwNkCZEVT6PvftrbWDIfgMLFWBCTTuXHoDUBp15MY+c8Y8uQ66Hofl70H8ebISMY0r/3eHYMT1LZ0KZukfLJQJWpwWyQZrDqmZzKp+rXfI698+QKT5sbNgnjlYgUHgFzss3YpouMHQDRxC1MPIi/EUab16pcjSipdkAE2kMxaQVGuLaUlb3iNESwuO3Fk0+jMSPbiD0vrjkZt+H7o8Q2UKj/Sq7p/KykEYG35LewpO9KMGc4eEP1+GSpZwtAQA7HSSma898a6fgtgOn6U/DIqUAYhl8jAOBY09CmKcQx04lCA/rZisbPa7crzbNgDwxpc+X37vf/mfS/mzPyyb03sYJeosURzneQFAo2vQHzE6NecxnwBrSwZrLW0eoB1ObbmjtTqohxhsrpRdLf+9/Y7y/Pf8cPnOj/1kefDC7fLafl9Or52UU+7jTBu2pezWm7JbrctpbelxdNweWnW32bChE4SzQTrFEfUAzNgj5ZyBzdXDGR8iRRuVOXf2GSHy9Jl/QJ627ZJtiZVlGMf2zBF7osP8+GFDXEY+PD0bJWrZBsh4lbK5t5k4/ySjd8Rm1GIH/FjgX+tCqFggZLQERVYZcxH414Y/QVC9/7wcPFoi+XMAUD+lrro9FIFoM1q/NkNLTg94uhY7fYAtm4ut2oVBNWtXiSUNANh6rmohJ12r1nQGgGZTaz0HEzojT9EV3aXu+54f+odnh35AOGRteuo/zliE3dPxJGeHBPpYlTOs6N1yCHb7hOYgf8CFMIK5rWvrTcMNgBg4RVh+ug0U7BEIn5N/yw+kInPYGMP4U7OIj1ecMsE/4XkqUuDL6DAP5hlFwBlYxPfggDSG00qfK9jmNhhpDjNWyL9PhIAO+VKhjuEJv6GP42uF801p2hJ62bAQ66hj+u4Qli4j0Aq0YAJKN6jp9ABvPFcCKiXm0GsM1CO4Qnt8Ux/g+X9IACCyC3uEtMq0NPBYWWD/GslIExJ4F10dC2/STzXRVM8/LquyZZxW48s4vC71DkoEAKY1fI4r9Q4QB8eq5w6rEoMuw9JE4F/7ZgRgiQQPM9zqfCsAOMtyYgrpAJc3rp5cAJDopm2o95/mAGquWkhozFUDn0sLGK21OfSGsyV7CWjqnk/QHo/JxSPn05vTu0lhj9SElvHgYQgApj6MFVZjoLIdYg8ALqXLSJ5GpPA9cvT9dV4aAJwpU7GyIpFi2iWLWYU3gexGNAfHRDtgId9O11sdAENZv5NTb2cgUE4TAohHHDJ3uFinmhJbmSgDgMErWkCRNHkVqlIukuoDMwAArZ4Y9N/RjuHbDQA0p+T2p8h7PUtOd1sLXEMNBnqWNj0A6foFfH+eS4i1YFlVhhhnGFRmAQCw9gEkAPD/NgBgswDtOmOv5+ZbDb3XDTa+DDKuJgCM0ZfVb+GSQZTsyaE456OrAICnm+ulvPit5doHf6K89yMfK3dv3iyvr9fl9PiobJXRp/WncdeAb73etGG0frbOn8oAtmjsS04Bp/tGGyTs9SqdNNKTMwAwLuPCETQAKM6ZWrIuEuKMtfisxYCW2/CdUwDQZlz6903Xo1UknfWnLzHrnuTGPx2Pe4Bv6t9tuCT00fY+5FWX4de0g1vKpwkArHNsPd7Z/574n40o1oew8yV9KNQL6dFsPT1HgQKKmOwH+U1CE5BQBiBrCFyPsYc8A1xtCx7HBQsqLPwhIRk/SAbjSJ56QHfGX6lknhMA9PF94wZ1aEajugIAxY7TbyAs7HcwP41HbQH83n/tT+m1KSGkP8R26GdULqwVbdBmDebn+XvmMIx9ao0DwAxrRpqd6wwEHOV3NOAzBAAXR01nU+IJANjAMtXTu82/tVwDtAxAQE1PSkyDeABGbvucdhtWIQAo8t4luk3sSSRPxAc6K5kPhlTk1fiE5fCEn5+bAIC+pPMwAJAUtFaIcjQyDNIrxwsEAF3vPxYNCn4xA3AJ55EBaDtAmuiXBAAy5fINQOWw57PwBoyfXw2YogcbX8VBeoUeZQbgZQCAJPyk60dwS0RNLWDM0Y599X49KRAxMv1+c6cex77CEjY98JpHAQD6Geq/xzvETwsAmDlwntdI3QkFImM95kjhv8jALFt6Ld/t7ecAAKNAV4+CMqQnOSwLBo50CnZcnwGAT1gG4NsMAAQPuv63K/Uk4M32YXnx9EG58eXPl3/7j3UGIFrcZwAgyztlAJaaAXjyXNnfeqU8/5GfLK986MPl9eeeK3ePjsr+6Nj0+OWWFbSZ1oKOdXPsycHXCuUZAJg4/+gEnTUDkHzIFMR4BgBCmx1chosEAOsjqWTdbFKoJZ8BNE9SBiDM5xEDgFxRMQIA0YtX3RLAQ8PPVQuiGECzDn3XI3Di7180ANghPlo9YHbfGAQKNqDmNfpjBWSA1/iyJf61jig8AFgziGnUlI0la0BgL7x7CVR10QCglJ3Tb9BLsiaLwHjGAGDMOhcPAGZrUAvfCfx7EgFAOpVZErY03oFZgGrlbXVqpf9bHAC88T9iD0A01LpJdCOG21HVJcKqMw4VW2GMOxIlKQFOG7ehLtDpo2xAvZ5QDoYXCM74UwCXbjjblneQgccAD76YdtcqAGiC3EsEAJv4z3Z5VJPfLJKm8ROIgAvVTh4+PwA4e/OCGD+8BM/mUgsLG26yCNEONQEvIfTkAbslWl+Nzb2+KxnVyLsAgP60O3mgAYnOSqYz3/eoAMBMHwzMmOP7pXSayXOnPpz8ZBkkEVibwZskv03P4IXWmC4FAGHUIQB9IP+eBQDM2CvfwYYekf0mDz1x7KzYd+rSSSX7bmARKWYZgDA2uyml6ZyX4DzLAIzlSQz4GPy1PNA4AVXBE58BqHyCVjVGAOB+W9a70wAArD0A0W4pALDyFuOHi3R4EIAZ9fl0ZgDujwAALLdeKS/85N8tt3/wg+Ub16+XB1dOan2w0R8eAORCJ/TjBPCDRXraAUDQTeNQz/csXMRGxp+xOti/6fFnAE4M3KwJb0qQy80ApPjlMgHAbgPPdf04BABc6mON7bk3yHPt75fn0QKA0v+MTgHGvCA8nZxkQ3VS5QxAMgKok+s/VNU2cIpAtmTTexSnEE0oK3GEEZJkDCWES4AlEmn84GNYXoRZyfZFAYDKhwsBRKFtJv0R/foWebWMGimvqg6bX6dKpJe60RcFAEorKdnABS6DDEDdGVBnHPlDfXr/dOxT8+rxZOcZgPMMVfRsHlMGIAO8rgSYdS8yBMkQVw40fxMIQf/qjH6O1xg+lnlqnUW4inxmZeQyMgBNf1Kn7ynRS+uMjLdXz/1Pv6LcWd0DECJw2R1EIWLAzL9C6tmtwqLX0/NIDQ4sswuUFa+yD20XwDax1ABMXbuW4ElgAgGBClzom0KrpVRlYLTQvYME5SdCZEkhl/4FUQmwpud4iWYAYDNYk7xdH9B2zJFkAOojHg51Ls9yfVcCYkr4xCBzgq7r8cFrsRBAmqU8R3PQ9OtPQSWlos043BGu8si6n4V4wT0zQAzEecR/vcG3r1Al/cPxjg0SgS+jWzsHp2LVE8D+ULJlJcD1WV0PwGS9vAM9dyowM0AprUw7ajlm7pq/xJDE68IZvaIMQf3KJq+phyo81I8/yV6zo1Y7ocsnDHMd8zC5xbBzL9Pw+nJIo9EhK+I9YE3KGeVrkj3DBnGkxBbcf+E9AI0Hbm1zrEtBP7T/Rz56GgBAklNyQGtp77qWAO+35YX798rzf/HF8u//9/+1nP7JH5TNna9DLZIqAWYWydRjR7Cel62D/nQBgKT/t+vjUioA+O5vLy98+KMCAB6flNUAAATS+BI/3ZMWCHsoADjTh8b3bABu34OZ7ZbSiyMNMBtf1pOrPnPX+Gr5j1cVXUuV5Y9in+Y8GYDz1+UO0sz3zZ9/OADon5cHyOCbm9ggHFA8R7BDeR/VWQY/9PBMfs4EoCo9NEEIEs8X+McBQGQHyDbPwcaz+5eAAPFRRIV6AHJ/MF0WjNsQ1l0Wp4Gj3MTmQgxpdbi2e36VWtQ4ybCTTLHRGgN92MUM+IG+S9sNoL6drccMcPYZbf2o9Xrm8Qf525rDzfv3kJ2ms7q4Eg5fDD1Hl2X/5WPtv4X1tp9b+oj+IX4n8A/aRVGFjtIgPmGhXaTeoapkfGjH1OTre/pq+oB9yfUHbGKOrpljE3P9P9HgdX1dux5J/JJDFGkdKt5jfU2Vna3Wi3GviTzX0bH2JoZUAVHXU1CVqEczC/U5lyvvIeOb4w57wImmA699bj7L6kYDAFWQxhEBZUXQS+CaOAC3SkbeaTjTBFnjZbXMRAdBdIaXF6s3kPoJ9fRNrSh8cBEBgHpBqemrRod5LLX/zGpjng+ThMyQRwEA+h4PXh8Qg/qglg0CMqvPlqQ5nsk/OIdURwCg5wgyIo0jlwKAA0E4CwCop2cznNB4GYMCcsO64Ry0OcutM8DscQKAGThDc/V0m83nUBrNAMCeH51B13+ewZHw/nPGj1qG6bWH8u95AMDIWZ1liBjbgoJs7cMkQAE3SP47cMJzHkO7pobhdeWQp5JTluEe6EFyZoB9AYBH9iYc44L7LxsAbPQfLLFoRnUSPRqsEVc8CT0AxReAHnawIwsA4PFuV154cK88/9Uvln//zz0AWJ034Ady1g47Y6N32JcBgE5J6XhBb6g84h6AzS6uVmVHAOCr315u/dhHy+0f+mD55jXJANRubt+SRveAe/wAIPGt1+sjfp4BgARShPJ9YA9ADvS1rnMt9HyAPLOnkU0w9yzQQfk7MhDgvAHm5QKA/SFRM2ra78EOnQ8A5A2K4NV17ZYdouJvxjVZsLa2vLyXgscOAGIcacC27oRQgmekCqNRhDKIpMAbPh7tiPoMwam/OONPW54Yc5fE5nXVdurEVr6ecczDMwD9O88CANpjMwRUBfLqwM0GcTqu53jBA8q4P6LBOPP7umbbnfWH/NL4/kjf6kNTJOsUPdwGTlH2HwJVzn/U8YoPaeFvOybtLl8GAJhvMJxXP8/XhTJa8bB1oAAnfikAkOScDxSLqyvB/mk8a7yJzevLzEf8KivTAf4XAADywVI+vUEdUssA4ISEq+v/SAGADdAijwAmYR8kp6zZ544AQGJIm2qt7+3AHfPCjsTM4vSMaEeFdAaLQpD514xfcOqnF5iu558bfAUAaZacUrwIAIQHdT048PkM0AVGwtBMIf56HGZ9fONaBZ7iKLqTgOHzuoNeR3J2FTkXYXvFGACEIBF4EmqnmkJ73ACgPwUas1kk7kXe99r6UMKc8foZYPYkAIBT7lK0m83nUDKdBwD0/onWN6QUZsv+tACAOtAz6zVpwq71s3a8SL+ku0KmSTRS9ykDAKenTCYZisBDeQCcHxN4vvsPBQPacFUG4Bx8FWfLuK3K5qWnkKJwTfXHoUrBXW8cedNU2gGApR4Csiu37t8rN//zl8rv/7N/XLZ/9p/K+o3X2inB0JH8EQOAxl/p/anHeQhIOzu5GqBNzQB8vqze9b5y+0c/Wl76wQ+W169dL/eunJT90VHROXYGsOhOodcZgRK0axL4Dd/sFMsZ20D2g4xOg3/0O/txg4fNAMCZDLVDQGZGhnxKVy4E/qcMLApYZ4++aACwn4tkafUkPG+AmQfw4GvmWcwZ7Z8IAPDAU4BnPE8euADTOYdwOOfiFHrP4wUAcYVbLIEn7ipQT5IrLIhmVGoXG03o4TMA08sRALQBn3o9AoDJM6iHIHkRDQAM7CZF+75HoYvOuJx2xCdzALB5CRxTRgks+tnW3bO+0BIAkPQ7Z0fh61nXBfHjMhmw8xjd45emywBE+aRqFTkABA/nVABgi8TdoZ/++XKYDUqq4h2mHn/W+5aHZgBmp7T7A0yW03X5lTMAsNpH7fVwCfAAfNcA4Ez/d94UB4SyKk8BAPiryA5g6MRBAuboSwZ6bSNBTux06fQnHxCBkbQq1Sud5uFEJZ282yIP0LpSKwivLCIAsEsPdqmlwBAaD9M7zlTCRGn/WskBLYU6ikGUB2YABZxI5GAcAgC2BGhZ4S5dlojPGYA4SXrHPANwFn7NXEi32q7Ek1LcvaEgg00AoLeRflSGtux96Pyk5UqHnKDGQ31XZyhp42n3Sta8aUa+2bAm5J0BZj0A2JuUTh61C8InHw9dguEM2K06gEVm85mRy3/vU67jnqd416CsPNI57Y4g4Orez0plfL1Xj/pvq48ms1el/kvLHshhYW2maNDUMjcr7t+NFsTsH7TPTHQ8CcI0CDgIIrJZzwJoXQZEzyGa9g6Te9OCDMBzA4DD+mqlxFICzBTEmP6aDkvlygMqnv7anmlnS+tnLU9Gv842w8wCGkM9Hn5oGGKNB+yHgSL6AhRQ7fEQkKPtttx6eL/c/IsvlX+nAMD9fltWZVtaxTw6/ZW+eQZgtHb2sz4DEDYkw58ATBb6AtWbPmQ5288GuJQtBtcBALhvGYDPl8273lderADgD0AG4P2rV8t2sylb5RN4ewsAmvanaAM79kW7DdfzNLGvs3KnJPsKkxmBlgCAQxehZQAe5kD0/nzM62CWoF/YSIOIT53omEXoJN4fBmXw3WjfZwYgwOyyGeT0y09hxtYFo0XG0q0ZD2TfU3uKsUzn45/xR9YCKX4n0ZKA0bnzBlfEdkYDIjQTYhnJ/E05cJJhn60/cgclEzCYZ2M4Hd/6kfTU78dq3B2VHzhaOWP/UoCRKBvTh0FNlIAqQ8QPI7HMAEDwB/KMVNuTNBoXr7IpZUxESH1FmwHyXB/3aX4Hc63sgIvnm3+XlUCkuoN4Wv/rf+95rz9FFuSCYyHKAKRS1RAAjN6jEQahik9oMiNiJrDrRH8R/UZ8Wq/LAd+Jb38exYj3egCQbBJUflavDFJAGQNRLexg+nZ24pOSbkgyenEMQmOlG5F3ukN/JuYa4lHn4xGHrGoJ8BbaSuBLNbZTp0KZkDK1XD+vnvtH/0INiUMeJBr8PXxEyxikVURBG1rqaLXJuxhThRDUxkoqk4+e1k6AozLW4BV0n/7KKli90ALw8VI6TVkdtiwJhRwScUx0om9NuUcHFZ8rxk7WXY+v/p4tYV4CbBlS74J4gYhoq2lG11ty0CEScmWf0ZQzIAmsXzoKkuy4RKE0zqzs007hAoC4CTr1TlioXNLRjQans3ZMjxcqN9eKz8qUGVaTHyfsBzr0SgAXzthfZpV0lFEpdzgFh+PPaGh07FIATQ1xGYCSTT3XuLaLgnsOD14ZVOUwNNlUKeVnXIDhbaKDxk/uHIpJj0QN6DXzl4un0T7supm2CraAw+gMl2FtjBVfeKiToBzI3DqRebYip+WL5VuIEI9xRP/Z2CfWnh87XYQpj5yV9/yhSmd9Dt1n+VFKlDTveLuiZ59RjADnkS3vQW3LK/3cqM1JrsFYg4NHzJto9XktAwvbftQS4PXpabndAMAvl89+4p+We3/0H1oG4H5/WkoFADmfDd+ZskhiO3AyIQCoPvQZc31JFc0deJkzohEE9BnSXr7PUxxA4EotAd5fe75s3vm+cvUDP1ze8SMfLndu3Sr3r18rp6t1Awnl8A8A/PxGNY1rvIGzVBb/f/be/Nny5KoPPHd5Sy3dXd0ttdCCJIwEZsAMIAuEEIvBjBljwJiAmImJiYn5p7D5fWJ+kdgMQgwwchjkMcYOD4vBiEVII2ipZUmt7qquqvfeXSbyLJnnnDyZ+b33vldV3f2eolXv3ftdMk+e9ZPnnGxaOwUPlGuoxxT97P4GLsFs3dgpEcSTF9VitAIxwx8KzNN+B/pRSRGYZkB6Ru0BUsC9v/6SDOexHYo1E7WIboyvEeCq1WvfmxVaTwZlo7e98iMAbgRAjPwf5L8O443cyf77vX0TWig/MNhUMG0p9NgSiznAPFzVzPej2ef0hYbZms6XREMpuVWng6Yv8neyY6M4qGr3UyJmb33i0Xj9UdoFRZJVbYC7DXhbYirsLYdvFj2VRYNLguXvHi8pL2m6m+B3/HT2H0M0LQ9S3G/73nkFQho96GMMBQBm387IC/0Rr42Ld8JZ61VurfhIh8h9UlFQRkN6PRJw6Z9dviNVaK/1SU1+CiP90KKMZP5l29c4zIX4dR/LyLw6HiBF40wO9sagtH5T9Mm/Kvri4utr1FkWUrLf4fYaMKdnl8w/z1n0rlbv2mzHBR8SO58BzQQA6rZCKsGrAgDH/Du7/fO/5VanMCsxTy8FPpWIaurUTd37KrjF3MoJYwODV/JQtJj1AYt2gFtEzoJ+WmCIL6zwouOkKFbNLyj/FVcq3UaOF92F5oYf4HeOW45bJcB5t77mUp990QUAeapCZ/00bRQqgM8RIAYA21yQSWyGb/mC+ilmj4wpx7tRmFKhjqrZ4ZCILB5d/dRS3vJOPbYGANjxbp8sANA3Vfc85WgxBQB0tNWkkLU3BlxbY9WPIdbBPcNq+aV1f6vHqHLxjAEzPcgeAQDYc8hQh3iDPxEAFJ00zATUDn7VSsE3Oa/dBc/fdj5O/7fURKVv2c5kA+2VUNti14GysndMlL7NcvbuAOem41dM/mr6WKNH1hyd/AAAIABJREFUevs9+bXNC+uAl+ir7YqW9+y88RN7qlgAwOY1FWBS+yPezIxK/MgDUpUQG21VqSmzbMIlABAuLvAU4Ge++HfwJ//6Y3D2F38Ms3tfhe3mAgHARRaADrqTBznWbxUACMtGRlzty1hpTVTd7AQA4hP39+2RrvPtDNIhIJtTygC89e3fA2/94PfC3advw/nNm7CeLxQAWOxT8aOsBHhAIwcgew7U3+ZN+RDgyYq2YYEGJRbN8M/3uqqOv6T3ab9SZA3XjTeyhHqipyP93NMxhB8coIXEvxc/uKFZ4jdsMaO2+xMCVMo3GPFF737x9TsDGJVE9uOXfnyUaPLoAUCbcdvcQWzQdXhoiaLlODo8pIKnIY8MuOTECgYAZStL91Sk8dnqNJOxqSsugtcpy8jflmSRVshQ6TcpXeYn6DM+SN5Jckpca22xz2A+3APQT/D2i2xMDqAxg3ndfaWRe5wLJ/wEmYgZI9A8JACg2vwoJrhwWFsNjG1wyW6NOFbub2gwE7/zqbzKpsb2xYN/dAO+wWVsjzRzt4S3057G651Yzx3eQmykP7NXwzRL1+eDX/3kzQaXit8r6WO9ws/s0XDr7INc2wUA1SEenvnLfIlvcsYug4YoL45n8sZdCAD2OeBgANAeAhmr7PYQxiq+lwGY7qaMupZ7ME2dacEZAYB6ByYSuOgAEPEBCwBIbEvOGY1dO2reaevGmAcCgOL45ZVwWZYjB9jjDVcHAFqYiGg/w/VvNwnvr38R1t51LQMQA4D0JJ2i2zcgB5ckjWu0B0KgZfAaAKyJZXXUmw0A1PpXwMKinywAmOVJETEq2S7a2tJWJNzvRlsnkOEkUUyRAe6AEo8aANyvyfo0u1Vn7Ey8L182tr+7PnFXANA7cP59nn7dET9GAHAz2+IhIPNzBgC/9CL88a9+FM7/6r/A7O5XEACcbdcwz6e2XjUASHbHBoyNsr28o/zoAcCkX1IG4DplAL7jvfD0d34Ynv/A98Art6kEGI6OMWeS9EgNAHoApXlIHeuLveyt6JPAzRwBgBJ8t+RopB+uGgDM8seOnPi07KGWzdbGBC4TAOxiiWEp8oEA4LCFwyAB4hoA3NU8mB6xo5unWKcp8Ez/PdZZIDWhMgDZn6f3bMECgKqtk+gG/bhLBwBr/zxlfKn0BwYMaDA4ZgExVDZTviN9OSUjc7RQze/96siK8r97AoAolez3ebKLDsm+pGvZYfSxj51DHTOFw9y8hB4qk7W9SWLjL5/wlg9t0TQ24y4MNwL7Kt+qe4JvfWK1vj+XVivgLYqdDj1D4FAA0JjuBgBYlovWwuM6LbrSsx1/ZB7iz50+6IPFPqEjAYA0Ojn4g04BJh1FPypz/5EDgLNUAmrYgv9oM6Ul5kDFqwwPvJJvlt+xv91Bp/hkEpbyB7dT4LPoqowWtxaywPYEYF5EVxJH/e0sAKjnOdK7fGczxdb30IgyAPV8PI2VHmMzKMxYRnaZAGDhmoAvVKmt4SGVUYni8AgyAK3gtxpRd6IGtbB7BSSaMS4FANTr2QbUlbRkhk780zM8EYCsdaIHjE0QcJ0BOMywucoMQAHZc8byIANwKgBYuM3KudbvYlrxX8UwRecxNxqGcbYxUKARAGg4eELfxtb4I309CvBHOr77fVWyt+vTBvZ318dhhZSWblnFdgZga52z7XH6rTviRwEApvmpvpSSAZjsfQEAL+AZBQDC3a8AbM4zAFjkqvgFMal98FFrWpKZYmtmOQNQADPuCZiBcp8yle6Vw0kePQCYnLr14gi2p0/B/B3vhTv/8CPw3Hd9N7x84xQenJzA8uT08QOADTlAynVKlLI+9CKh7f9jzgDMcsZ23PvnBDC0f64CAIw0SNyL8HIAwNbysAS1y4iuAcCdLcSTlwFoLUrZVxSuEG+f/9YpdiN4fDIAmKUw94KbnAGYfWSypLok3yezCCxoZmwyhzuKaueVLrbf3ipvpyy2SRmAeVhpBhyfNDIA8V3aD1DrVenjIHmmzgTcFwAkJ2F6H0saOPmnRePanopCyUv02wL6lPVqnwrt/egokxDRDbQr+/PVVQKAOCzjP0kJdRlvH1TV5zpwPJLdMR8NaT1Sl2/nlXX6xQKAWKPh8J5pAGBrHrPbP//bweqwqsinArdux+LMwq9GGWk20k6qZu+akVsCiFfiMEowget3yQAgAho8JT4bSnRKqAL9eLGVilIsPfdpBABaVRBr4FEPp/QOpBqvcgQCpiu0ubOBeAmPcTym5sKWv+IqO1ah97bFSH9dGLGtMDJgxjXxniqHAoAyUhkBzd4fc1OMG10nxKXf/Wx76m+X8UYc0KkupnUfAqJ+tH2VZ8YwoQTYjzle73KVYZdrAPCJBwDFH9NioNe8Lwt1iWbR87psRdkSBb7QOy0A7ex5rDT5U3GI+yff9R4hPdPa17zxAMC+fogBkTcOAJh7vrFusgDgljMAIwDwDAFASFmASsn1DtGpC9zqYMT2AE6yICXAFCyhvd7Kpo5kkBQrlw4neVwAoMwvAYBwehtPAX7b9/0I3P6274Avn5zA2ckpLI5PkpPHtoznY1qpsBSra0gatdUtesbbwxaA5/2AloQ/LgBQxtMNkIIkU68ffUWLlW5qEdCrkiX8s68TtG9Z2wbnXzXGHI9hUOKfHdLG+BCAoJAq+kEJQvlp388RUNfO9L+sZdp6Qx1feEj51HNvvD7t8QXBpjH4B0x7wq2Zb9rkN6dwT3hkcImdY8VnnSyxvDId9u/5/pxfqlSVVIVN6c1cfJ/y+hnojDHiLN/bUx1cgz0ZdbxSx+P70VTuinhb3jEVANQKQZ6nMtlbijr4PH1kSlf3AACbGeYZmLE6ida/rFBcgaIkvttTVa+P/G5pHAGGHfXlRud7XNr2b5rNHxUAOOI/8ccycO9KgEscX8qjxe8nvR7hV5rO7QQXuqqcP+DdDrkTx5YNb+kzOqU3ovT6FTOb/A3NU7gOkgigMgCJ62j9ZN0iGzq7/fO/09RR6QZ/yppeEGl+bRapkaofY+G1wpkGABZFeRlN+GVtyODrk4+5J0PHCULxUxQkP7TM61AAsIcm4buR/9pmpiqnU1kjGRTkBdQG1youZWJMD0O32yJut1K+fddQeubRAKzYlc9EhdJ8FRiXCV/mPwa8CrdGguHtRi6B5C9EEHPtv5kgC7fVKXZHymm0XcYbKcPdAUC/Iu7vGMGN9fAEANBzZm+8lUN1DQC+vgBAzyW8oJUvllnO6n/v8Osd7OxSevvi/s52duQ55OT9Xo/b0UPerABgW6u3ABFcaa1DFWm7DsoTlgFoS19o/eVUtpQtlUqAn19dwDMvvQh/9K8/Chd//acAr34ZYHOGpwDD5lECgAnwWzDhCQS0JbNp/KmnTAIB0wo92gxA8lxmsEkA4I3bAG9/N7zt+34UAcCvnJ7C+ekpzJfHVw4Aehvlubtrs9yOvdYYPb7O+mzPDEC5//UCAIrfVMcKFMDWvqf1064BwNoW2dC/4aJdA4ADI259kJrP2rFVjlA6QU59t73Ybj4qAFCCHoMqeF+dgnwVndUAoJTKii/NlVRZ3jgDsDyjjslHXlD7+4hD5fkTAUDX4qVsilm9YVzKwLcQDObRAYBEYR//W31d08dmAEa8p+iHb7DPiDMGC0G0Hva8np6kM/kk+SXfnSsy5brifF9VBuCI9w4HAPUbInAu1rIZBxgMMPfgLLm9zBUT9AoD1jrprfQEZP7fbkxyl5wCTMOiDE68svG6nQFA+5zBDpzJ1oiSYWtl8yQBgHRIR1u7ewANSS4RaJ5Iu9fPMANwwg4uHSqsADC30GMAMDiFygRqzmAhwkmfRUJgHL0J5XT6+tj00LuEiXFDloWOepHRX9nZ7hhjL6uRgy6fyTs8AFioTbyhyY3hTFAy01MWjxYAzDNueIv+e55dS3sMAMBMG8NP9tWhXlKLwLlDDTU7yQVulshLANpPYHAO4iM+BbiXfYG8eIWHgJAqKzSW3n+6B2A3IaBl44y3Vi7ylzflU13oxV3U78hxKK7TmwwANJsTEzJoKkL2Ze7NCgBiD0DgDMCLC7jzpRfhj371o3DxN/8V5ne/DJvVQ5jDCrbrRw0AlpIpyghMJcFFweLpxI+pB6ABAE9vArzjvfDCR34UnhIA8MYNmM2PyoEVM8oAjE4AzodaZP2stUk/AzBSU8YP6LVrvAYAh3lo2YJ6ZZ0DymsAsOGQdXyXOj84esZ1BqCnSgtU4ZB5FJdXRO7bUPu42nZa/67EFCUu0v4n3+/8n+JOuRJgDPzpHtpMpWeZHs6vUwDQt+aSZdH+XxQKPnoA0KpHC5R5fvAlwFFE7D+zz9AAYDj/jmOcrjfxhC+zlmyyrYyTx8KZpHV8fXgJ8MiPv2oAkPCfmpIZgxgBgPy9yJ7GCNqxnQVW9UFDlAGYsr4obqGWCqVv4aUDgMmx0tOv9GOVRmu9JbpXQBr+N6Mr8h1/UAFGBZBAVsM/S1Ze+gwzwiJOH3GO+l4DedWprAphHwao2BMRxUgZ7t7gyqlP0regzJOf4gBIyzS2Bwqyqhuk9CLUc8yZNRmsKgtChqeMuZozBhD0I0bKJ5Fr0vdmn4VIXZTflz1w+kXmtisAOGKNaBekjF+BA4at63UrY9RNecuTQr8C5Xg0wpqRTWgzuN2fGtYt18mCZMKf9vYBA4A9URvJ5sjfunIAcHRqruu54EvgxxnIo/VtU0A4vwcCesDF6y+/Nv763vqQM1UM4M4AYMgYZb70W+3kaIqZ7Ors0LY5TjuAIxOQ6dtl4P5TRj2NrrQEuLGz1+Q4Z19L+46yEiOajcLOVkaStmvGfvAfrTH7HrXFmwhGGvUA7PafyUUa8bRZOHQpR84AxIGUDMD1PPUAlBLgFTz9pS/AH//qx2D92T+F2Stfgu36IcxTtt16zTaauc9tItmBiOwZibAlRVj/Uez3DATgo3vl8AzsnbT1AGDK+EsZgHIyYysDsCNv+OqRFm/dT2PEEuCTBAC+B174fgIAXz69iRmAkL5zJcAxACjzlR6HakyqUkDbW+TJXFKjxhgwY3OGXILTm2FPpnr6OvtHnQeMeiSNEvrDntYik4mfsz9rB5E9evQhLcEiWoV2pgEA6jehj5/H4whRxR4RodobPMk3HmXMpAqoVosIKb/fl/tptIf5B927MUAc2K+BjTYBRfYF8ooMzEW/f+QUzeHjEf3CtPwG0OmNxlQLdYhibGSLupFuaZiQ6mOry6t4LR8OGVlJyy/mdHq+vKy3lP6WMsAMAKJbxzZ/u9YFqgfo8r6Op2+1rycZgKkEP16PnN1olAfp+RZnaf8vKt60+rKO1VoJSDK7drzGc8s6if6moRf7LCWbVvYLT9iWCt43rn1l749ZAK+uDoz0sIknK9a2fQCFphnI5PnGpwmL/Yh5eaT52uKs6UUZcPKJlMhirKL8QVkG9hJU6WGrBJg51vRxLFw8VNtm8JIYxE3lGIwnXouo0AIA6VAQg7doADBVsJr9iJIBiG8KxGx2+1/+3/njplrXTFGtimbKyGEtboxehCxQQQBolDw7f2UxBQCM+rK5wU2IBvlQ8SavScA/AjLKAyyV+xk8rMiY8ELJUipVr4hVQHb3SQuCYlWbIcjHxsuTrYNX09Syp1W8Ypy7Zc4TJCUqDSv0JnoiY+9YAkxjb2/fR6JnaSjGxrNHSdXHJjn8g1fjcCOZiFgsUuhttSf6IkvUBA3qT0lsP52/cYxOAEbfi+y7SQe6x3sApMM5qgvaHYBo1j0AR3VT6bxSdGK8/mXDIPp+AFDsMtHGtb3VIX4uMpB+RQObRUqaTkwdiN4gERtcy0AN+tHzi8OrHYBgBjuw3EiERoDqKAAfUWaHoYaPsg6v0Eld6nokmp69eFkZAemXljuutJwChUe6oXJwFMGLZ9ALgy2FuvSqFrPlMBf61LbLWbwMAtI9umcSWssNlQCv5hyWnJ/DnZQB+PLX4C/+r1+DB//l3wO88hLA+gzmmxXMNlKyoXhYL5eJ2HXJLl1PLVlIGvLstMCYID3tMJX+f5gBmAFC9h02FgCkhjKFbiOAm06R3I+LUZ5nc7hI4GTKAHzne+GpD34/vPCBD8Grpzfh4vQWrBcL2FKZA8znizz/emOLNYTpUax7acVjDLm9l/HnpHDkYvaPyBpph1LhML6ydUVbw5E/Fcte8YNS8JJZTvEcf+b0i9YoaCdSxNJTskaX2DlovzB7wsYfGPtP/R6F0wDA9gSmdAAcWZiR7AzWz6rwijt7ACD6NxUDaJriFQHHS8BSj80DLHURpNa9ha8i7iXKWP9pa06tJYioH2MxgVinxQkavTXy9oDpwy/tJADn0bfVY+0b4tM9cNEQbX8Sbr7MyFQBcJLFwJYVGZhK56uX9aaZjvhxN02kDyWRZ+vYrhyWGT/X+oIezE+AiJyKSkN3q5XBe6XC1IuIHv3VHx2KqB7nwD8akLaPs6Anp337GACs6SR8EFOwvZ4RplEfImNpruUbI0MGoJrWR78+2LAZy65/spOZ4BRrk6jgBJRiGtErwjBlkGU89Jmu8tNyOVUKRKbktG5JHbLzjjjQcmyqLxHwL29apoQzlt/0/Kwtk01mHeAxIe+vzG7/qwIAigB1BcLwkzfA6U4tMPZ7ebl2fXv963BCbPArAFCV53ZYvNvBmFhpcIopG8ixqxEIppjP5gDrMlIxAKSKawNR70Co8pbQ19IvLwh0ZpYQYJGdi9q46jGRAmnvxrTm4CkVCRZ9RlQXoSWHVZmpSKGo+RC/jVbYjkYERgQ0SgEWiqYx+ibumrfpyVMcwOlGVyu3sRKSAHJ8ZVOBHwzA7SM5ZTRxoLf/fPydm3QCZuMH3d/uIUNT5lbLcHmdP0U9Gkjv/sujQ/PNlw4A6tmTwqrK+JU4aNkvDW2VlI088ANIhNZslCE6SrEYvH8KBzVl02sX2STRNyj9F/bsVddSYDDSRcyP4j2Oru8E+KyeOyHHIdQRT8/Pp5XVLYSw8ubBaN80PQF6qfw3A4AXZ/DMagPPvnIX/vK3fh0e/NHvAbz8BYD1Ocw2K5hzD8A4T9yX9I8AQO09aYdR5CMZKJ8RuOSdDaYtOtDlFOAaAOzxAwGg+waNyTLPgQDALZYAvxue/p4fgBc+8L1w7/QWnJ/chNVyAZvJAKAcUqb0QxfMa/DXJQKAo4zZvno4kP+z/xH7IIl7Wi0Isx9EThz+aEDOi79+g/FhR/pxR/3Q2wCPaNkvgZ3Qw1W1vKmfP2V9+vZ/LDvt+0sw2+aiHgCK/o2poJL56Hm13h9/bgACfHk7PQDZaihr9j0VABgA0OE6MRBD/uSU+UX2gDJ5io5MG6I9CZ4CTlrZFNmJtHn1JrHt1RiEZhzh8vcWAJS1ERDwAEepc+uo4sQeYlU/yAMlPhsXny8kjOLfjn4RevQitN0SKJz84OA9AOj42U05AgC748trH8njWD95EFDzM/WPswJabXgPAMCezqT4fBwhl2cEc6xO5XZ2yrdI0plwEwDJHG8rXSV6i4xim/nzaCXjD3WhnBOg9WIfI6ArCwBIMlU2ajUISDYh6R3u+azGp7zCPOhrAPANDwCaaLDqUVcBikYo6mPAiZ+IlR4pAMjClgLyIoC1gvOn2u0LANJJjQAb6QGgLLKWeU+/7CSz5RqfMDpW0mYFWR9HuzeB+XSnNu9u5PcpUbZv2W1+foTXAOAbGQC0GWesVeyhSrl/jTgLzmG+BgCLyDQAQOshtz2WawBQbFvhsREAqDMAkXEvzuDZzRaeu3cf/vq3PwH3/uCTVAJ88QBmmwsGAKmPS7QSvkl4CUBoTDYDUG++6ZBRzQMDXnUKMJ4SLJ53AvDsKcCPAwBczxawPjoFeOd74JkP/QC8VQDAG7fgIm3AOACwZxN8wNbftW/YpiEoYUOSftLMIfr7MNtJo+wBSGMA0NtjASj05yIjKg4vYOE1ANjZBJ6yvtcAoIYIpgOAOvItwMyjBwD7wX1Lvi4PAGTqMQiRD63KyRUtS7R7rBDdMQIAafs39klqytXxqAEA2ayVCFWC1HgNrhwAdNn0mCyjDuUxQBITjxLaaLylb1x7LfwhMrvGXmMA0D3R50u8GQFAnaHbCcSbAGDeGEkcMNYPBAAuOAOQqrB2BgD5NX6/fvaUKgE2ghPxXIXWegNGSKUJOMTZVNlwZcpBDb56L5LHZACKw+uapTblw5bI+stogcYZgHrncxe1qBkgvm/3DMA6I8WuwXi3wO7IGYDHI+KqR4uMX6tqAQAzIBhMstWsVV8aOZWSAShhUt4tMFvWMpoyKgsAlv4XU9ctkUA30ozGbwBANR6ZByl2vmq4QznFCSyjv84AnLqS0657/BmAibNboEy0ZzNtXpdxlewmZVfkkkuAlb/GwxVp02i7Ooss2C2Me49cxuxJq72uMgD17mYmgXKanX6vuW6UAcgWzeyqd2xsdo7aVmkvgGbq8kbZidphq4CeWt4iAFBeXzIqANZoNDawOT+D52YAz91/CH/zO78Jd/+fT8Lsay/B9vwBzDfnVAacTtvdCwCcMT9yA2hzSJkHANmb0xmApgdgun4DkHoA+gzAvC2fMqTagDHqrQMzAFNAvoEFrI9PAb7u6+HO9/4QvPUffi/cvXkbzlIG4FUDgI0M1t6sNfuJX9IJ0SY5+fH9u/kGLR+zFWSMMgB1PJA9rYYoezJmn/kaADwIAPQncRrfM9T3LmCPUIZsbXsZgBWXO/aKfRPbg2wMLo03si0AOq0E2NukIkfxhnY3ajLxbCmZpZWw+48BZGUm2HpPWVUTQ3The1XdVCmrGjSmN0vGK4NuqYSQgcGpJnXX66JDweyaT9FxAoipNGQeSAUAslNZKN3uAYqeN5YAt/3v3RIQZC7qX2MgZnxKs6Ax3vPnwzUygWL50Vw0Lv/tW7IaAETUBanry0cJwCzf4+j5EJnpfKFi9WqtpjzFydAeGYDlLbRO5ok2oTRnKIsazdzKvQF7CT4UP9HbSumvKtudWG6fyn8pA5A4lfrWko6zJcBSLUk4XDQ276/M7vyrT1oOmer5GIVSXGILAPIK87UZxMkrYBmc1FYB5DTYUZZqznXZIrYDB7VTouTfF7KfA3imsKimRt9B3A0AxPHOopbLSqgmrF9heOnJJSN2EXb+U9/hHAzfo8PJ5xgAZBZ260SKiUoke+a5UqGmBFga4U5bNRFYq/jYmIogu5oZ7Rgb4y2DzgqAxlA1oW002W6N+LIBQA+g+J53b7QMwKqnFWeXRPTWSj9ej8so4R0JbJ/7p3H2fleRPBD/a97WWa51T7n+u3zPQy/f1Q4VliAUYfINB1qnzu43Y3tX7QBdxlO9/tR9ynZ7/mh8REtjUQ3YrHUXa6cAjDbuJtds6QCjt8k2SKWSbObmtPsbeJOo1YswmwBgeXIFAHpAA3sApkxxtlebC7i92cCzDx/A5z75O3D/D/4dbF78LMDqAczWZ7DYXjAAiMYcNq6HTT8DMAGA6TAPkUmWBhdkFPdqRi0M0vV4alw6QZdKginrQoKfVAKcgMAUIKZ/aS5keJ17aOZ/GAAo2Wnb+RI2KQPwLW+H29/z/fD2D/8g3Lv1NNw/PoXNfOkyADk4Ub0QkcvZ7puAbcRfDIiPNHCPz4ba2YDl9ZOGAOvEIKE1xl4JGwGAaQY1BWReah+zFE76SQeZx/LEkX6mErMGFUfrlzNsOivk6B/1qBtYrIMAvH4JuD3Ez4/D6++sr9mP1AFmi49GJYxi12v9L2/rcXjmkgYJIwDDPm/UcdbTz5YY02vjEeZQvegz5GBtu6ZYEGfrTPlw3bLBjCboSVfxerAppzfFuqPtlgDL3KzvhDqe3ynqfdSGq0elUQ/kkfyPS4D769U174Hu1fEOar5eD8C0fp34INDmqrxcSytfiRvo5S761XOv/rugHsWmKw6WAEU9Y1f9NgLgPcDoDxnZHQBUvtWkDYy+dfbxgvQorz0X+16t7/o2vEiHTwQTbKN7Py84emp4YJYHAPvzwzPGEPhLTabnrH0K+Jc2RPSmRInZOBFPq/EggWL27L90AKDj6sHwuAmkVjZR00zFyGYQYwAwOdbFSBEhhIxlEVsq6rAMQDQX8/3VY1ZdTSLuDgCiw2aeN+oBOHBvBh5s4Ou5BxYFHQEmhwKAGW+b4o+oQCCr1h16DIhDJYG1OGBaSUclvxocQX51RNOB+jUAOMXpUsraNXXf7e7ARPsdq8cOAB46o6u7vxgTDQBKf1BpVr2DgKFDZfWXxtMrVy87ONrRtzZj5GAeQp0RwHbIs+VeG4Dt9sQp47MOnA+KvK6qv68DJlFwJbDYadRKNwYucu19dDbwhu8dgC/oJI7sn7PdVRNsPuSAAMANnvR7Y30Bd87O4MVP/S7c/b1/C9u/+xzMVvdhlk4ChgQArnMbi/0BQOcHZTrxhFh25BRg6SNDAKDuu5kuFABQnQLMV3kQsAowgibc475mxV9E+U0n/R6dwvbp5+H0Qz8I7/zIP4LXnnkW7h8RAAhzGvN8Ps+HMgnQl5tdZwBQLegIQMIDb/oe7ojHBuxjTlGPnvWkAoDZf+JBZ83g3M8MATXIqAMyP3/SX9cAYEUXElD8MfRR/Iyn3+pCk0am5f4A4Ijziwy3t+hH9iT6PqJGkbK6x+AuAKBwtQf1enONAMByvd1Qdh5MVP0TBQfq9eQPFK20HwDo14bpbMBG6UU2SrDo88FhACDFri0N3NUNopd6Cjjo/14DgOqQo2Cq8SGAPZshPF1fQ9/o+Wbt2SCylY8C2Oq9OcshVwMAan538zqgBU/W/x0WGx1CNh0AjNdshO4kHpQcQf0EEuOudNKskD6MWInOVuX31COy/ZPCVbo7AYAF6pPsvwgApLTFGofT/JM1xAgAVLYoGKVvoptesT8AmF6gS67QNVX+gRAC/2XZkUnFJHzjA4CKJbKvbkI14MvNAAAgAElEQVSzUYDTaHKvTK4hbS1GuwKA9YBsEGzEjA4xDNJyWyJT9wCcbuDEodoFAET54AwQz69ZyPT4XQZF/xTYepbXGYBTHdOGRrgGACcTsAYA5QRgktG8Uz2MgsVbq0tqvbx6fe4frfUd2dfDAvgeMaYAbJOJ2XPxptLPPWPS+AwINsqoGwVs7PT4Z04lQiMhsL2Co/FGLokmZkRY+9no0JOqtNHxmzjcAgAezbdwdPYQ7qwu4Kv/8Q/gy7/9WzB/8W9hc34X5ggAnjMASEahDwDqQy3Ir6IMQPpdNkOJCvQ8cVZz6YnJlJvnnrBCcy4q4dMKNQCo4FlFMuOQI7tUTYE6LQ10D0OS3US32eIItosT2N54Bo4//I/gXT/ww/Dw+efhwfENOE9lywvqW5gAQPnJvRA5yCsZgGqw1wAgr3esYHoZgNl3UTkt0g++8A5d1Y3B06nxDf1wDQDGGYClbEzrW06+lvV4wgFA9hDqQxid7RgF4P0MQAmuIwZrgYsSr5goqWPBdJBfP3MMAO7WUFT68GoZa8pXMwNQS6/YBgtMkZ/lyh+n2nF13f4AoKJla4KHbuBdCQDY4itNPH2NjaT9llN/BeoEKYmFi59sQajLBwAtU5Tn87wOAgClmrHJAC7BbMyg+YRcX+vSAYra8iXWja4gmeTf8Z+Bf5n9IwEAyWsrspc2Xvv8lAFAPosgcwSX/3oAsFjkugQ4HO1hAKA/BtorVy8Utqok1y+ry3RAGJUAExJqHd0O+3RPAUanclBgemgGoGaTCDzzCkCnf6fvaG5lhnq8RG311Aw0lc/082rxSacM+jcQqxcnxD6rCII2MkpAjL3zBXtWoOQJOdSohCFuUh1mbUgZik4p2iE5CUcmz8j/WuWK1wSAqdA4BTMCWFdOMj/z0WYA1qcieh54vZcA94KPmld9yQbuODStCq5h13/jEvpWltIEB2Zs0q72ihH9cgkw79Tm3Wn5ezQ8LS+pv6aTnwoAdErSj+8aACwEHwOArL+MMuo5HAr0MXZHr8KOGYDK8fJPF7t2iP027DdJ3uzbegBgGbqygQEAWDYkN5AAwOX5Q3hmfQF3//AP4Ysf/3WYfeHzAA8FAJQS4OT8TQEAxQZRHxjM6Mm7u1QSQkslITddXwBAKQEnyZnlDEBxFVVgmGQaS4BtsGi8uOSR5rpQCiJtxl/foS2HmHAvG2SnJcDyBmxuPA3H3/fD8PU/9CPw4Lnn4eLmU3D/fB0CgDkDkBX0nPW48R/FWW/pqNd7BuBIeRNk3NTQ6faO+atEy8hvujko/fUvG23Q5JMmg1HW+iKaSmeTICoB9CXs+MjaMxfpsP9W3hN/0L4/8q7LU6QFTxQZsPOhHRDliyS6oqTzrf0S4JgFyL/REcQ0itun1RY6UzRndxUDRDpV7olya/xYnb7eVBFT0MONdZAfWuYH7de31i4rVhV/1bptNwCwIbBZdxPlqiTBFn/yfCaoAaPTxa6Nwdem6shftAFAGpWVf81fI7or/h8Mw9BLnPa8ajX/6JUdAZjWX41tWz0TfZ2NIX3Pwj4VrHxoeS/VaUInmtXlAoACVimNVRwOonAFAE5ZV6VVA5BW60fqdxf/RHwv/Ga2nZQPOubocoXVVYI50VtLBqB7ot8c5359VAIsAGCq602/p/YxPX+Je0Jm2FBlIyoAMPtrWa2yD6j8wCYNRwDgtOUsCn5EYCeORnnrODqDf4nJEp8h0eVu/ncrTbE7bx04eaMm79mYNV4x5X59q1XuqQeQ+lYZeHTW8atCsUQf/T504JyDp+vBiYbMNC0roQZEbINF59RgMv2jeg6KbtU84Ut80xqV71sAoJ4XXZ1NAzOBnodcXa5RQirjCxi173yxElIlphJQywnAU6vPNFAtICBlhNhGqlHATixdBt+tENAlINOs/mB/3vJXxOKjHoD9JrmjQwWG+HxXnThtUF1LVN3PzZF1EEMSgs5p3boRVH1qWT2haRp2pFf3+T7TrzuEYvBod5rLB+Vf92LLL9TioLEwTrvxXn9nLEVU9sgMaxEoXtg8trGYjdav/wShaXP9DhqfNG02Fkgpz1IKWj608/EdZwmAGlOlLC45OMZmVI4K60oeRAkT7Dp7Smf9bpxSz5D9gtSRb0gBXmuNpRJBJrSB+WwDi/OH8PRmBdvP/BV8/td+GVZ//ecwSwDg6gxmmzU6flR2WwOAlm6sn7NTmQDABe8hC7CT3l2cyNKXhoxF8ReYWnh/8aWKjWM7nABA/FDmbX27ih4VfWKHVgN/OKvkJ2y3kGwt9QC8AasbT8OtH/on8I6P/CC8dudZuH98ArA4hlUiVbLz+J8FtHobCpI91JTQRwAA6lMfZd5GGkeHrPRKlIPNqaoComMYxhsIBBDpPfIim0Vmm66lk2c/FCyvQkBnpCNH1q0tn/7OOuA/TH973VAdQjfBA+sCkG54mOGiyNVrQp/m3s9wJpnSkFoBtNh7cvbb009igswN6gMaZ621Ld/16e9LAL1Pzt5Jfk851IFyraiEs/w3A+qBKv+lvly9H5pvNljqUs7gNgCFPFcYnzdfjH2yvN4CALLW7QEEU+1wyVtyiR0j3h/JXbChbrw6L9diV5gv0P71xuDoOR6OWtvg4syb4jn4Csb6njIDb9fYXlb+rb/OzsHPdrhBoqNplaBinLgmXcbz65I02UcPUJiy16h9g/hsBTzsaXfaP2xcMciOw7E7fDDbJ6Mo2jzWA4BFfYmHpfL3mGwRf8pnxAf0fF0CnHr2ab3Yl0HiD63DLFbiEyIMX0iLjY59nd0Z9ACcJHN7XhRmABI4WsrL+KS7mk9olzs5hF0HZODkjQCO0dR2AQCjOWj7EzlX6f15fuzQl/mm/V176rLQVAy/BgBjViMhJhaTvhCHAoBabfrVkb9ro0r6uVDBM3cR7rIq0hOxrWT6RsQ4bKxgBQAcrb3+XtbWA4AypSzCbhEMABg59FpX7AUA9mYxNrAj+XicAKDIRk/+PUA9dU2L88rgRSsTcJBCcegpXVPHu891uPpDH5DNVZgBqJ1jGkHdI7PDYy5Dd8p4aLyXDQDGHJRH3qLRFAcFMzjaDs40AHDP8VU7wo5L2DY2pxcEr7sBgMUZbvp5UsIZ6rmyzi3bRX2C2tw/ipH6/N92oMUptJuSyblbw9H6HG5dnMP2s38Nn//1X4TNX/85wINXYXFxDjMEPNKAKZNOlwDbVZZJaecP62VdkJNHokpU6B7MrsINMg5WEq2wjJb6B+pMwbzdiB8nrzr1KZSDQdgpy/ykCJ4PDZE18AEQfR4BgGmjcY6AxhLWxzdhdeMZePof/1P4uu/7Abj31FN4CMhWAYDJ1pum7Ik9XE/RqmdTLyv0DQ4AGt8xEJFJAGBg37y49e1vBwHD3aTEW23vbR+71rtnlPFz6PtGLS0Ofb6MX0g28i90P7no3b5HoASsueBtBABWSyeRBL1N80r2/CdX5lj9i/eH94rOkVNJ1d8eAEz6U/XHGgKoIUBYdNzGIBDO16lKdGtfaHQIxqG+TvbQHHhUbIJfpd04VHpR2rt8jKdtgyA2xBkF4Gi9dxfdMIhnwoxgOfSqfr+dhbZr9DvFqz7BINKO7TmMAECtw1FfT5YdWtdRD73+apdTo+m6NA/yH/JPmLFS5K8/3lmdQFgNKPYnaDRpA6megY7dRtw8DQBU/pNNWXPGTfMf8wjrD8oApAM7Rhyjx1yVXPM6kD/dpo2sVt8+ADxxAKBWFZLBhtBUBI6gg/vmBgB1QGay5nL6fckAjOIkHQgU5ixM6gHOmuWs0qUMwKLw7DtbhkGcBdFu9JYod0ueJ3onrX7fRPSNQgQA7qZkLWAtJcByeI13evyzBQBsYgTaPr8JAcBebNB2CLXz2chCazqTfK88PBv6Bs7wpgIAdQZg1Mx4HwCwSG8sd06D4J/XAGA28AP/vRvwPiYAUENbGagK9VwPAPQAVuzqjbCFfQBAbW8o01s+STZrDcebFdw8f1gAwM98GuD+K3C0uoDtWp+8GwOA1p6x/aJogw8l4ytsKhD76OnUXx5T2jBE/SQBSwIQl9RQOmfC0G6rlAbTjsAaZvPUD3CFJcEURMg7lceNj40CqNrTEAAwtxxJ40rZBekU5fkRrI9uwvrWHXj+x34K3vbhj8ArN2/CvXQ4yPI0jSZn//kNhqymefmvAcCae1pB0CQ/p2HfrAw3ZE8AoJaDdg0AjuLTOhyuAKmef0sVGJHfLw8eAoDuEMQxgKrK1NzovS88nvxVAYBCs348gpozzFB7fQCAet21r2xs3qRNzPZKUQZv9ONp6wE0umcMAI65pFzRj/Voo8GOtpx6X7+HruR2GplOBdwqVUK9Mdp3elkcy5OdXUpOGW/ayz1XCAAOs/Y4hu8ClpcAADpAogzLIxWxFuwlAJPMFBwCOd1VONrNK73WAQCYQUDLLz39XPMHveMNBQBG4lOES9c92yspA3DxusoAtAkLqQymzCmDW+LMBgbUwp3cFNwEIOLs09ME4Ivkla4oTEsoteQM8rd+B1BuyTqm3E/vsLBdbR68uSjBE8UtRcGmJ8n9+i5ifhpAHwAcGASXsSQO8XQFq9YuOAjEG+D0XFTgal2pt2fvJCy1jfpmAQAl1lR0ipRkXt2WBtUl8IGSYdKH1lt2kfolwOMmSqMdenp5zwT0nIvDvtMOeftJdBUFEhxQsIx6/YHiq/VF7tXaiADllDwW5tgdt4acR3N5NOtkCE3hL11+GdPw9Z0BaNV9XYLZjy7L2onO9pwuJ/1514mkogUAKps1EJ2rAgDTCMqcig1L5b3Hmwu4eX4G28/+FXzu1z4G8Dd/AfDaK3C0HgGAEnJoxcef6dLX/DrpEcM6JJ2SO+PTgZkuJcMcnaUCAG4pk1AAAAEASX5TGfAKNpsLzALMWQQ4YU3wLYF4E/RXBABiedE2AYBLWB/dgs3NO/DCT/wMvPChD8PLpzfgbjr9d3kD1tj7kLIIrwQA9OppB3Xc0Gx5AR9nCbB31bx+Ej+nNYdEhvgUzOpJsQ1Vm2dNI3udAbiTEW8FhPFDRgCg9AAvHFAyAEWnWO7wGUu16JBubvlr4uKP5Eb8ot1LgNN2AcdAqY2ROQSJNzqyURA70hlNDwDEFmjaP3HxxmPMAIxiSZylywQc9SAbMmdwCnyhZk+xonYZAIAdx745sI6/hffYhBHqMRe/R/smZdO5xKfkn8RZrjQ8yw/+LWROpxub9LRrAFAvvMVPLEs4P6Wxxn0AkNqhKXfLAMi5uiy/qvZiRX9JcpW0HCgeY1/CegBgDzfI3EegSltaHmcJcJTlpQ/dqPrL8VyE3lZA6znS3P25O/a6UYnjSAHuXAJsOK5k57Fuxtd54MiwvAqw0/xTCXBRaUU5YfiE6x714dPvsExbMarvceB4KVyjPGBxBFoMaD8vxkgFjjyHDM7xeAwPdIzBLuurd8TFOZ4aQOrMP8n+8/cm5S0KPM8cs6nbRkCMttiTvMLTPKjw0JJCLuewjJg9+L5VAiyyNwoOW3Qu68tPaMx3BNaOSoB7ZKQeMuKKxsQZ88eIxn0HoHKAG6d277F02UXp3SslMi0A0GcQ2EOTormrzwRQUCSoes6p/mZlJUgKJorAwMK21yd/01siI6D6VYqDO7ulV10C3J18KkFNAEznorAHoLq+OX22vSL/uGJhtW7pk1SFCxXQLC9WIcbAfx7LZ49C9Xa7ZDykEdCctI1Lh1YlADBlAJ7B2V/8Gbz4G78C8NlPw/zBXViszgcZgAEvpgwL1fvO9tTUJTAbKo9FhVV21tH+IR0pc2+WDtxIJ+vidVIKTPdRNUWac8rqW4cAoF4j3KDbSE8bomOraXdYAgwpA3IN28URrGfHAHdegHf8i/8Jbv2D74CXT07g/MYt2M5OECBM1MYS4KoH4EDzdQB+LMF2BqTLz5H9Gyle9/5dAr7h5sKgByB5f+2fKXMdA4Bt/clbRu1BSPm/kuEpJXEjkj8p30+yH26wnj8q/9UfQuRABvu4HgBInOHlqdCfwA1xN3JCRpCxIDxGyxjHG5kXc7shVqBdB67EATKvquQUh+mCfWxhIJnKVmPhRoeSSe8fVjaoWQLM3ogBkJwsHAQA8pymCKnnIf7bm0bNj6YEuLkGfIfxzxyHqfnLUC0NLXeUu+XzvgfOVObb6nsqfdHT9/op6TrsQJD8n9iJqADAvCFJfCkblDpWwVdk0GXgoQb6O9/Kz9H8/jhKgM0ptVupLuj0gXaZkqMS4J6FovBADsrgK81StW2P1hf9GLTlQFIiFNI/XcIygvoiL7jXdb4kWS7MaViYYHXIT67uUKhBOwd3HCM91hLg7OAoOalPcStfinAUgSv96yKi0vVPDgCYhmMV1hgA9PPSDlkKzheuB2ChKVGpBYBkRWMUpgTW7RJgPZ6Rwc/vb+lB924BANO/KCh4+AsJOf5/cIqo32Wp6LUjYOKzAKcEkBLY6lOA5RAQPZ40hzn1fi/NeN+oAGB2XPoKLwIAtZyT8m2r8JF/RAFz2xD3AUQCAHszGPPH2Ei1DUKdwr8LoH2IodEOO/n1cQagBwDtoSh+7rVDST2gZKT2evpLBwHye/ls4GKNSXBIBmDr6aas5jIyADV9rAs94v8uASYAgF6/7tTjStEBV6wBAOZd+Spi0bY7lqPhBsDIB++qpz4AiPac25MQnRJItVUA4J/Cix//JYDP/SUCgMvVOWw6JcCRLZODEkQSZikrTmW1ELAmAYkc7iGOKId5eGJcyraTXnwzWGAvwPQ9gYAFCEhzTuW/KfNPegDaRjvGI3MZgDaDqHBfCADOtrBer2G7PEp5kwDPvgDv/rn/FW5/+3fCl4+WcH95AjA/BWAAMPGef87wFNsJAKAO4HaVp6H+eYIBwLFyrE9tt/cE+lxdQPLeqVm7BgCrJagAQGHwHEtyQJqrYNqAGyUBtOENygC2HGxPKU2bD7LRQUOtxuf0Z2/DlfxeveEzOiRO2/4p7xdeS/dRZpd0N6e7bQYglfSVrUSRfU2RPmAf9UhTdx8KAI6MW0OAa6pFPgNf1VVgzubyWlv62Ay6PuCTvcoqO66eSgFPeOXDe9KGnIU59Jhj444cyI77Bnvdxj8hAKhAwAIASiQsGZbTff4chzfSQJD/OAZ6MwKA1GOzrJAViTGdqYRfODaqR9arb3/PAKCJQYoTK7GlGl3dkzANWLJuucJyit1tXaMBQNTH3Q2XuI2afvZjAwClxM4ni1enSPp+chqARe3d7gFHwvVkA4DUlLv8SKAkn/geFB4AxLKYjEJoAyiGPxaSrHgCAFCz1QhwGGVY9QESFRzLOrn10s9PM5F8x+K0DwCePQHAXYUUXQ4uA5ZswOgZGmDEkaMP0o5CTUCyRwlwf/3GCnREh2YGYB54N8LOQKjmE+HNSjV7ZyUr1niU5OL054hZJU0PoK87UAEPAYZDaHz1AGAnOQ2JWgJuctYxY0xlZh0MABpswTpv+S8+lbxkxBQXdxiAjxj4SQcAjXGwvFToM5pky8OdkAHIGWWhLhPXqiM/UzIAOylCyvnzckQrP9pRHctnj3YdAJDnjCCHRMlpPPMtnGzXcOPsIZz9hQUAUwnweiUlavUhIAYARDtIgNdmwwBdAv8QsJMd+FQCw4FuPhSYSnvn80Uu7yUtSL0Ht+sVld1KaZtpkk877nRACWVG4KnDzV3r5NwSSMiuVh6P2iZ3ekT7OukNG8wA3KQMwGffBi/81M/Ccx/4bvjq6Qncmx3BfHkDy5ZxDnMGLndphH4NAO6pHOi2foXLNQDYI+4++rk65IP91+JOKQCQpI6A/NAQHgYAkvwXHwelPNAFObzOQUU9GBwlyq2O2ciOt3V0DWVFuqi8Ta7X/+btJd7osIco+RwZ428z4Nn2MV5/AKDimG7lEfG1s7mRnXcltOOML/XckfOZ4yINAOnVoBLiPgBYD3oaAFhAwpC/gnhVeKfXlb4Vz7X0SNYHshq72L5LOATkcWcAHgYA0inzBgAUNC4kuNY3kgEoPZvrG0pen3zXKEm+NABQnu850soEjcZDg7GTfkkAYDMCqHJv5MoQAMxNq8sUqgRvnmteVtllaSyonIbbErAEkPQhiuadDQep/7Qk0EqdJQ/LZChZAFAYuIwhAzrpNrWjrxe9BMqkbLOBVlMh+kcOnMAm7NR3AbQxuDEKwEQ4iSriDNC7kYXzOEsGIE+d5qYA4Ijyu5RoI0X4Idbot1wAGSdnt8wA1mrHVI9HnqANJGU00kxlNTy3+VPKJIum0LXPb1cPAMa0kfFpGDqSJM+b4kPqWeXf/avCtbJvmQIAtiTcylF81Yi/R6fMtd/NEu2OuRoB8qPn+e/7PpjLEMgZYwSMoA7WGZaoDrRx8vrB/m2qBbIEFI7IMsPaoAYAxynuXXr0wAHt/u5lIOQmzbQ1wxYNUkba5Sk15kzNvcZHym5YAuxKLjU9x9pfrBLPUtlu+qalV3uawt5H+rpBgP4BwWUETfpZABDtDgNnclJ8yfQWq7SBm3OA07OH8PDTfwZ/9/FfBvjsXwE8vIs9ADUASDvMUQ8iDtzRPhxj2e7xySksj05ghtlwVL6LwU8C8/gZ61ROi2D5HBaLBcznS5gnEA3XcA2z7Ro2q3O4OH8I69SPkA/wyD4Z97PC56GhksNB6tLbnOm3XZHdll5YkhHIO9+yxj5zj1YtwX8bgMUxbOAI4M5b4fZHfgTe9f0/CHefeQbuLo9hu7wJmzRn7Oc1g2XqcyhBkBgLZgm/jMQbNZfm+SIWUTZ5rL7paA71oi4HB/pl9xLg3fjbZ+juag/89dG66WtGGlj6ZIXjyIFRoaI+FXs3/XDoTC///n308xQA0IxUjEVD1/keb9YfamcAZg8cDwFRMUu3hE0GEXvPAgDaDdcRAGj5f5SRl20BOxc+Ywg3NEzVVHvdUYW5+dqZBYcsGONdsh3LW9wT8gC9n7DTaQ+WJfivllmTqoq27tLfqN+jB3r/NF8TXSwS0dC02j3KdMnamuy1o28yx/ZNWt+nb8q3ZSY6AzAqAaZn1IkB8jy9NiWLFZ8/sA3mmgn+icULolOA+85f/xTgCY6jqWaZc4YbVQ/EP4pGAs2617Q8/Oh59pTt+BTkng2yPXh5bJVLzh+YgGRfADC9w8pM4XYixGjTuqORygFvzRJgS13it7Yumd35hX8zgQt6xrG+PU+YHbAyJHpOviNLAxOGv9RTSH1trBjbrBvqydNjxmZ4QIvhTrmqHaDo2S1XUSmr7ABb/FkzB86rOmRD7+bV5WMJ0CrgijxNU0waVyqaqklp57e1w2Mg0W6NzajhqkLUOixkVDxrXQmsbBNfekgB6RgATFNusMCOCYC2PJfeNlR2tI4lAxB/V9lhOutPnijzSLEZ0tsfDoKyUPNZBgA1IbSR22nCvfIRpnVHzZP82DWRy2Wc3ezrDCCVl+T7ZPrKwQ2HMtBeozOie5qNsk76+mMUpHQBCt5h7o+h7aYZXcoPsRnC0RX2bV7/VGPJ9NdSKgAgGTvhf+QH6dGJw2bZMQrfzqcE6UxJJcj1zCWl3VuEmIItLZ2vTmcYdAKaLPkdHpu+wcAPaZbB0qjIZI7mV/RunztapxgKs0hZd58D9bdVKedA/owVUnOnzwtN+rKtZ9nTx9PnIdSOHOTipDsAUA1XbJC1O4mh1nBrMYcbD8/g1T/9E/jCr3wM4OUvA6QegJsLzKjapixAzMRbY8mwBrZX63MGu9II57BdH8F8fgxHxycIAm7whdyzbz6Hs7OH5f7Uf/D4iA/rSR8v4PTkGZilnn94lu4aLs4fwMX5fTg/ew3WmwTepd6BWWvngFfWLdnfBCSmSgWsNkjyzsBj6t+X5lBOCpY1TXdT8w4XH+YFSs8ivZH68C1gOz8BuPkMwHu/Gd7zAz8Mx9/y9+ErR8dwcXob1ssjfFaiXRrBgrO2cSy8UYhvdsIgukVsgPUzmOpSpioiUStA80nhDfpYaNLi38vpadcRsjpK9Qq+KxRzV4HiLx5tOA3En/VZPQQC0gscFfaOHGzQ4FMnBNEtAvi13FV7jK5HTTXaIexsXpjnM6E1IJXZncxw/KNazBC1Se58HJJpmUoq+VmhjtYLHvWg5JvTPzR/GpbQOttkmY95VzQFx2G9bGRFSwE+y4Y7+bp02FE7bqkBxhpeKKQu2Zh25COrLHpSS4C2a9SGYcoGdIsHi65TjRw5E1wfbFDfL+OgORh6DMy1PIvvDDbmZnRmlOG/QivPI0KdtgdOvW5rHSTPVPZbHTinYwIdb1S6TyuXrCysva4uIaqVpI4s/7GmbAHMef2Y342I51jRWLSQFfrqR3i7rcXtITfcA3DbBgBLy55CA7PiKs7Ftw4SsIg+RUlYn5we1rNBtC+p+UGRiQagdKGtoJQNWtuGaFAC7Hqkes81J/vkQfctaJXA6BT9sOUCCbEVOUWCywEAvRMiO3tswBX5s3jkMWB/GrEG3o4l5TWvewfpQKJ5DHlLNbrPFcAVLUUc4GUz5h6mlAPTpCZNYbha+ZCRKp+XnQp5ETrOTaaXtE85zZfXPTC2RTFYY1iZrmGTnQ4IOAxkaXxZjSlnQOZYMozsyMS5mCsnsV4/yhqYem56cRbkFt7B67CSZC7qQ0BGAKBWO3JKo363fB8eW6/KgLNXdSgA2PJXOunmojsFb6z43G8GN57lA4wMcOYxaQU9Uablsp3S5aNnpxSc0Tt74+Nelj3+GTaF7c8/2zBxqwwAPOH9gx6Jduix86NtbM6ozr11nAkMAL7CO9GOeRkBUcKNYbA8oidal10GADjF3ad8J++w1Gtb1rN2oAwlmI6jd/cyJmzW9YjP6XtvD/v4Q7zBUAWYzYd423KALmhMT7Lg/NcZuFdjyxs5KrAta5rGRiWxN+czuHWxgnuf/jT87S/9Iizu34PT9UO4MQdYpCA0HZyxWvFoPuAAACAASURBVAGsL+D+/VdhvT6H1cU5rNYXsFjQQRo4ru0CtpsjmM2OMPNveXQMi8URAJf3Jg55+PABvZdt7fFx6hEoim8JsDnFQz/m8+QbpPN0CQRcrR7gIR8EABZeKyVHRGsCABcIAC7Se7cFAEzg6WadTgtemUxGAhT5meEpmgScoUQgAJh+PwI4uQ1w4w7c/K7vhvf88A/DvWefg1dPbsLFySkfUAKwmC0QAJQMTF2GEwGAUnKI6xu00OgFgD4At8GHyEOiSVt2LgcAbD1/QpbQAEQbbWCMNsi1/zZNg7DPx3aPPd72Rsxg/EN8bWQf+vHXLlOqriXb0/cPRtuL/qERYNDiPwTBjP9Sen4qF8kmrKgKpSFpIgCQHyz3ipzW4E7tWQwTwlGlRKPytrJUEmnfQvRZAQBr62npy8/lywyYKf5Wl0hdaAKfkHtUG1DFA4DynJG1D2jqAQ5uBdFmbOFX9rbcKb/TRxDP3SxfIBveX7PgS2WlGwBguU4qAKX3ZKuiKqaHnq33fUfSwbhGrlBr0cN+Lm/MMXEjPiiJBZ1xDDdHxj3i7MZMqjpITBsDgFP8cx3n6rihRX/LLwWuKxuwvTZNvVOCBRj0HF18KQQAN2njVDt85Xry1a2P6wHzlvaftH6qk2lTXjv2JfJXKgm6lAzAFgDY2GkxLCsAYBiskwMqjJLv2wEAFAehZSQxYOU1jUSp7SAJI2iRFYNRDFIIAKqTbGl+iqmYofJYbP9tcpwvEwDsllBjxDdyoTrpd70gVilpcRrUOhQAkJuVO10shiIBgJIJUA90fwCQZJ6DoAYFaI1KnxUE/lwJMO6EZkC8kEo+kxLgawCQAwNFP/rkgKB/AgDYz3AYNakejW8CAPeEA4AVQJt7fhUwSxvyawCwpS4vCwAUUIwU4qiBRR+AIP3cC6KHAEHXD25nGBeb2wMxegCgd5UHZqqlw7kMtnKMcF51BqDYneLslkwyNNWLLRxvN3B7s4Hzz34OXvzkv4VvOD2G55cAi/OHcPerX4N5cipXFwDrc3hw/2tUlrs6h/V6BXfvJkBwBavVBWZLXJwnH2hJPkICv5bHCMjNU1bcbFYyABkAJDBPskfSiZfHdOovZ3+kjMM1PvsCT/udAWUB5lPueMuZ1od5LAFu2H+QNiSxogR9mFKCXGUBSgYLZ3rF5E8AReK/NLoFbBc3AG49B/D08/DsRz4Cb/3AB+Hlp56Fh6e3YLtMNCDgMIGoSx7bNQA4CEQPAADRdxlUFIzC4KY2vAYA98rwer0BgH5TvRVNUDA90OForiKOq+OMAplJAEVxRK4oasjF5QOALQkR/4n92woAlDmJLt/PD7YZQtQLNi6LFdpr/0J6zO5nW9mj55tpcS1AUs/JA4DGBlf+fCsDUMWWORGH4sTdAEBhSlmLOr5vM+0YXMNRNjbIZAatDdxJANI1ABiri0zcSKYaAGAgAtcAIIl0nWGVBVWUm6We0fOSJdYBAFFOHDPnoKUjQMao9DKQdFZVHiqNsg6AtEJ3qJTaic+pnkwiemwCGzWCbHvrUPaf3vOoB5ZKos0jDWl3zwDs7VCmmeqSwtgMXHUGoJxWaB2EAqrVSl2pfx7/NDe12uEbgaNcwkSZDLqkSDVOpjgpw1jZMeHPNACoTDAn99UKKr8nO0zW+Rk57F4SKbBsGPh9MwBdpgU+fkIGoAa2MwB8DQA2Foc+9utn138CADk6Jdm3KGgAgJJd4wFAysCpONtqWfW9vT6yG7uXAe+boSNi0YxL8qnk/opGkMIDKd8G8p1JFW2eWOecLUpQalPoRk2yGz9iezsc1tMnPbnO9q4T1ZGM7wMAarpN22RqTXGvDMC8oVMA1GS3sW1FAvpSGfB6DbMvfBHO/vhP4eFf/SXc+/xnYHPvVdg8PKPy3/U5zDYXsEAQjoPU2RZu3ryFAOD5+TmsVinDLvUgWMBsscRYAUvYZunv1OMvZeexgcFV3sD5hSoJTkDZgjIAM1C82cAqvV/aG2APP73LyBl+bPtTAJJ4gA6rIlcvfbaYU/+w5TIdUpLKgDd4TfqdehHSZ1Tz1eBA7L+XMhApMwkPAlncBHjmeYB3vgve+6P/I6ze+364d/MpWC0WMDs6onfPFnCEB6FQBo08/c2XASiGtUHfAfiH+mO0wSsL3xSgKahNfbMEto89A7DtTHft7tQvI9BB+6dTq1PknupQwNFAXAmw73/ngTfZMJrkMQ8BBrYCyv9tZitmf7YzoZ0AQN68yNqBbGfm98auV1QCnE2Y8mH7tk9Tr2Gfsi8gtkwOdtItQEiniy0dI6QR7bytHACAWWfQfdN6lva4pUCxKGqmRDIGAO0sLJCm+QfhTF0i6qef+7tKr/gAAFR8156FAgCzz6TnFfl/YwlCyz2oYJwEAHZUcH8UY5DSbiAnetc+qME6+PAJVden+Le0ApCAsD8+2mz0MbMGiXUP35r7LyMDsHcICGUAarncKDyqGz9kXdKnAPrvrU24rLxjBsgj67zi4BLgUu4RKB+XQaWFV4aMKabtHPZ8CiWKoJrnSLzkWmFgUdipfET/CA2tmi5LZwHA7GqqRygH3CgHurYYCnrmNvdcYQWbn0R/5wwyBj78hpc/ddVmOE4HALND0QNYJuwAV6eAVtQdrRQLuCttLetRBEw7KxoA7CFYtH7jMchaYcCrAOxeDxcdwObxOvDLZ6Bm7stOkZ2pBcoCcFN6Vmbnq+FgjBxD5s6rAgBND0R2siM1pXvGZelSjiX1HBsFGYPJNpZ//NQ6A1DkWYS714MBg+xhhp9zd3a6noNfpdOuGgDMZXEKPIp4n/PmXXawNZZaFiIn19A6c0HZoSP69tdeOwuTRGLHi6S0xDutlc5hetnhlgx3YwbyH7rJeOR4iemsQTT9nlaGO2rGRgacDKF3SFbtvlceePeY7N0AQHkb/5smmEgyGH9/Odu6U3bYC8DGHCobN3IrM+AGAcBUzrqBJWzg5moFt195Bb78e78HL33qdwG+lvoA3oPZZg3z1PuPM++Kg0/SYO37HOaQMt9S43qed+qXZ6oGeCA4Dj7BNzvhKcBI97EO3SbAbgmLRTpIZAZr7veFgdQ6AXjl+6SGEpBHB43QSb+L+Qa265SpeIag5dHRApazGRwdLfHei/Nz2MAaNus1gpipNDj93rO/W8wUJOubegFCygK88RTAW1+Ap7/jg/CWj/wIvHbneXiQgKqTE9hAoskCjhHUVBvDfCiRXm/yEdQG5RuuBLh4cTGfjy3cqMS3lx2c3plWo7uDiAOLlTTpn3aAlbdNGzq+XQmzoxK/osvDjCNf0zbRN20O0VUIVddVPQAlK5t5wxnQ7oZRoN799a2M8eyvO1/QLG3ArtMAz5pBJPoqPgTr12FLF2fJcdeFP+PX5OhQ9EvF496uRJtc9LDiP2o5El2u5zW2tm0doCfgAcAIxXW2tisflvb9Qyem+QeWDXoglZwC3BsgOQoii1UGoGyQBvajPFXbWFlbmXe0LjvEm4NLJx960yDB6P5xBYmxqLBBf0L/5+JX1f9QuLs8wQnSUPfZChLx5bVP7w858oBljZ9o7gqSl1RcQyXA1MuYfoQP5M8BAB1aRvV+fFyPAXR1TqQc0zjs53r+6PkNMvivFgAURnHZPzotHPvdNKK4JKzSdNwHNF2y6RJhRWByhe2xAPicKtGuCHWcAejfboPSzCgiKnonlg81sQtH70NHPI+FP3M7HPrUTRk7TgH/GAOAno7y3pYK9Rkgng2vAgC0AatVsNkhzVkY9ntvPHYBABMNZL2Jnn2jS5dwI30niyjbfBgIJtlp58E4Em6HS/QMmy3ctdSL83oBAJUMihMWqDBzaITQTPPopQCAHf+gDyAFAKAT/dzDJXzHZQCAXtfU7pFmEAsgjN/fH39UAuadIWUaHYhPilXzL8tT1+kJ5Dlfrx1p1nUDB0o7C10/tuVARUzL1+YWAeESFcfIOA/mPTPsrdZ1X+UUBbMzr1wq1vseCZUhtcC/4tMkgKYnIPtlCNMT+z0dpwOAmicUDz1uABDnyJ0UsZUIAYAnsIWT83N4+tVX4HOf+AS88u8/BfDgFVic3cesvwT+bWdyem7K/JDgTyoCZI7J/0kAoLQJoTJg/Ds7dloeawCQSozI80n/3b79DJye3sQThVebBPKlk6AB1mvimOWCwDwCCNMJidyPEE8RvoDV+T04e3gPVquHdIBJugaz/0pGYKJJ6meYnNsRAKgThGleRwDHNwCeeQ4W7/sWeM+P/wycv+3tcG8xh83pCaxnCwIANwvsA7iZJ9gzziJ98wCA+2g2vqeTATjSHUm6CQDsarA3LQAY6b+wxPSA5cPq/cYGKWomvTxon4tuIRVdjFf6baeelcm/dRnmOl6SJ4sJ1SCgvFbHMBEZpgGA9Z353SYLlg51K/Z4THhzCAFfnn35IQCoHIMq256+6wOAenz9WKQ9E30frrArAW5VcMl9u1V4XQYAaGft/Sg7U9T9ox+u5KLNWptJRKfskv1oPymI7zMD77suJaO+QpjVfPL4SFiDmfbpMzrFehoAmCWYD3HxYLWWqRLcUvKDNDjzY++Pm55YzkQQVZVsvsST5ZeycpcLAKYNVL9BpXwN7oe8W4KK4hckQXCKTSYV82T6e6QoeQmeGACQlqRMVoN+No23HMNdGQw0bbWD0dv5y99JMMoElpFcOgAoij2VykQlwDkLkkVtKgCITDDDFGHNYAK4aeesBLkTAEC34SN3tHRohCBrUX5sACBZz7CvQxkf9wBk1d6J5fP0zXw7JcAlwFZNSNULULaDzbWsvGRVtWNQAeX1ISS2xJKJMMUIhgvMOywtwhxQAixAtgE+gzH4DEAfdBwKAIbYjB9HsVnum8cNAGYuE9fT/esTrCgI1w7FKAPxyQMAraNjWVOv5tUDgFMC4HaGsHNwqgCA5ukzuivWNC0uamez1SRb9E/WEExID3jrDLpQDQxLANveN7nbKYs5vmY/AND6FY81AxCnJe0fxEvbwCls4cbZOTz16ivwX3/pY3D/P/0+wMVrcHxxH2B7geDfZp4O4EjxWDpEYkF8gAxHQJ38PkfAr2TtpBJgAQAlhCRDKMEdB3ipt/J2i/0GyZFO96Uegjfg9PQ2LJcn6HuuMcNvC+sNlSNtVNP3HHykMuHZmsqVN+ewXj2E9eoMT6qU7EAZgxxqlQPBbo+jNN/UWzDdnTaC0ziXAMt0IvAtgLe9C979c/8bwLu/AV47WcLZcgmb5REkmhxvlpD6/6asy1YZ+TUA2JZN5fCEF1XVNqIcNKbh9VfoL7QDPZSYx5wBOMpwnEDBziVByaGWh9AmTH8j0g8LqGIHLm1IoFoxj2Qbku6RFgzq+0sHAJ3d8ZmA+OqOY74/AEgPLRv5pGVKxRqlThbSBYNAA2Xjr/JM6e0dCEbOgrIbllEmbAEArd9WX1vb/mmc4p/7+gIAcc0aDgRavNYx89lTlk1o8UOYL/h7fcptsaeOsllOBSh0wFZXibSZm+L2/rpvDGDb4oEOdOnpY3R0rZv9aEldyadyinMr61s/j9etNTSmaT8BowMA5iWyc2gBgBlb0tVSKkEtP85kAJJ9spVGlw0ANvbHmDAFlu4oyYb+Rm/yajMABWCxStyGrWV/SoOAMmZxFFuBOgIA7sswMNNZf0qxJ4bI7Jt7NpWNr/pZhdmR9SsC+tmJMhBGVEBg3iEiJUT+PR1qEmcAFtCIArgEAGplJCVjYrzpOxSTDGJIYGznLcauCgwxPa2jpPR3gYMnGZp9Y9RWUGSWbRZmnQFYnm51rXWwcBYeRHNTG4lRfcplrHSJjmIyMvHJqeDhet7K787ayPOSr4aPToGWsk95T9vBHjkIpaysceUIAEzLxvi80F7zGQpe5xlavjRYqtd4BJD05ljLWeRrOvc41DXlQ63DRMKKpNnRqO5Uo6Uo5qxKCdfra3WT0NpoiLLFnXVDEx/WGQGNEcb6r+g6UWV5lLLxgkON+nM6eeqoBq238/Ayo/Hq9lULmfimg9Y/AEPLcmsBTYlhWcWgrUU8UAvYev7hnjnmVuswtnZwRc97XdQDAFkNu0F0MgDtotQkyrLf0rpqhzMisBgGYTITKdIzxUGbLGDVhbX+1HraJ2jmAJbnJv1fRbMkmO1ks4Lb5yt46pWX4f/9P/8POPuT/wyL9X1YrB4AbCn7bzNPGYApgF8WADCXq0rJ7pwrIGSV5wgUJqccrTyabr1BmgYlAR7tXCMAiL3ykt+R/lsS+AcL2Ky3MF/QMyUDMI0JbSATYbOlHoXpBGH8b3sBkE79TUBg+hfWeUse14Id6PQ7PqcbHJXsx+1sTVmN6eTjdNLx8SnAcy/Au//n/x0W3/hNcP/WTXhtsYBNKjeGJZxgBqBUTIj99brcZaBOKAG2nNrgDfWa5P+0MrAS3UenjE/h24GKm/KI+BpUJbVstn3i+jFaf9X6uljI1iAJAGz/tGyr3DGJNo0XWO8rmNv+lC2a0QT4oq/8gyfNIhgNpuB1EDQMeJRHKraD/hXvVQdYOmNoyqh8BlZ1aJgYlVyxQ9MY+eF5fU3PuPq+6DnF7yOBL9c4ADBnfcU+PiVguHeq5+UNBtLkan1Yb2jgqOGEeQAwr0llqFtjHDGp9Rf0gU/VBol5lOaV8oUZVgAgRxmAzbV2slHJtPL1WryIG0etFgOSwJGrUAo/yJhsBqusm1tKPQ6zpir7tiks7XUT37Flcwh/XscA/mjZ+fuyHkUq6IHyt7OZjgdsj8UEAEZ8UWZQNqRr21ncOfpOyNr2DmtNIaeKl2/s+L29JfVRvOS6otG/3VqFvEGV5V7PS3pkTtVm2UISlTmDsI5PSprjFB2sl+zSMwBHPYJFncviejXol7AOQOIpCnNgDx53id2dJGKZ92owUK9NzhhTCk1NUEFmA/EqwpN22TXTS1NjnHcelMq0Yoe9jJeNsQqc1dNziXgWX4xIbNhHACCNPk1Hsn6M6mGiUVNJolcGXVQjbZm4CEpmWXYUDasPwB3KcOkZriJMekzeEOR1US8X+ukdlFqh1LyVgpJa4faWuxHEZB7LJrvmQ8sE+JIYkVfcYIZsaVcbX8w/affQHBoJXXIWX9zfoemfkpumYlReIOrSlNnwowLwR4eaFKMSjJ95vhmg4e5iX3lXKfQuBX0UoES7vsNlMRdYg+PvPTSDAQ8V6PxU699warP8ssLP+ip09ZXDUPGEXY9608g6Fv1DKuhZTQAwlWymFhSd+VfrH/JLy4kY7cCNzTsewsDOgrJa/Kuztm4YRKkRf/dLgIeHBDScePZwJrK64gftcFS6sG6ZsisAWAFmOkLUwR15aNX4NQDofZ90+WK2haOLc7izWsH2s5+Bz/zar8L9P/tDmG8ewGJzhiWxs1kqmU18RxlvCYwrdneOGXmb1Tql58HJ6Q1yFBHsVBoV6YQQH2UMzlJfP/lJUeuG/AA5hZeBQXHo6Z1J/6cMRL7P9Pwl7sk74AgCEhC43VzAFoHFBNqJPMr16p7BAUNkHdL4kx0heqTxbFJJ9OIY4M5b4N0/+7/AM9/1QfjqyU24d3QEFwhYpgzAGZYAA59OLGvhVWckmX6zSU2f9UWhB3tKMR8LqNFNYerL3yh0KABBNASrC1u2oavfOgPo63DyPbR+0Lq6/N5+e3p1r0eV3DnWkm0102ovpO9oPZ+tx7DP7FjJFSJbgGS0+hOe3HEA6Cvln+aKLDUelfFbK7vDvBfxzbR8Rf7kwEJ1idD2T6O4Q+mqvFEhOpXBIWN/nP+dRsIZnO332nJRjMfYlmR+1nFMBnB1NU6fI8dcoa6oMswkMGXplkUSlWf4yflizE7yqV9fP646HvMZe+2Vt89ub9T27H/uz8wPs7EIr4rx/1xAK4PgiZRYy+rdPIumoormKdVdUZmYfr6qMMuHshS+9K+s9KnYf/ZzaG9PaVbfYipSAmQVuSJR/Z45mz7DK5CEeiNSbzRY3kN22uEU5IiferIwsl+hReWy5QKQEtPLLEju5W+pzOjYn7yBYbiPN0ZH+h9PXOOH18w1xS6O3jDsAUgKrKeQVBGS7gHVoEnlkDVOwcnM1AnQyZGTtNz6kBAPKlmFQAO0gExkNFqLqzPtSGCFEjR2bfYkECunUJVlZUVkQMtS8lMcdsoITAGMD+rye/GEvLwhrwqwBVEpJ/xhiaa8M1i33AtPDEOwDlMEcgQwiIPdBQADLi7ULQBdFrGOZMQAYJ+/RwY3q+uI/3OAFPFb8GRlg7zzLzKBKogn65ugjsZqv79aAFC/S3ilchLY4dLOEdKT5zcE6AL7Ke8gevVk2paI17RzOzw54LMZxFMU8W7rIldbRyM0WCMNP3jxSD5DAM7tglb8n9dkrE9rR7rco/mdplHTYwgAdhyc9DRbYlETaxoA2CZyl3+zUMQclL4up8T1+TgK1UbtHZCio0NAujuAowyv2uHz+sdniPXl3e+46kNSpklY9Xytn5V8t55mQQ52illfSaFtAgCfXa3g/NN/Dn/5Kx+F9Wc+DfPtA1hs06EYlKGX7HRanzX3+JP3HR/TSbdo9zdbzHJLOoyyAYhP0nfJjhFgtoQtlhBTr0D8QbCPD9/ACoI0sQsCHTGjgHmJew+yB0K3ut6CBQBMd/H9KS0G+Uayt4pclpIs6//E9BSeFgAwvT+ddjwHmB8BPPMWeMc/+2l4y4e+D7721B24e3QCZ8m/mc/hOCU3YQpkAjLVCZruRZW/qTc+3e+1vhnw75QNUL87PRifl48RgN8DKDXQ2eLn/jVtnZNjY2fYM0CuNsB7JqoXAE4Zf1fqOT7odffq3c9HBxyGgrkX1IDn2EY2xziq0FCELxJq7WvvFFJZ40P8mwqfdGphtMHcI3729z2BZOAVMM9UUDq/ZMwQXaoMIeU/4vtSvNokiAX/0ti9+fT0yO9HXdaOtKdZt+iqiL8kXq0rdHr+so/3tJ8ej48tjaLX1BLz1iZN9R4u0QxnrjP/xAzmC9nq9UqI1dpjnCWgMfuherVa8U3f7rVkX6S1Tu6g4cp9NQDl9Us5xIKeJS06CsBlA6i2rmZfR71fqhBwjrnPouBFUonAdBaZc8LTK+FOl+YNcE3Iod3V8F0fvapUhwHctPVlfCf7iMTUI/tsD3lj6jb1U8AtDsANVV1HOYzCw6sDABuBuRmQWmCvVMUZ8xlTWve2AEBRTPpfolFdMjq151tNYwX4cRZgQYkjiK42MBnEqZzS/KR8zDnNhXbICx5ddpck87C0Exc0nkfOyoz6+vDpeQEAWJXA8u1RYOYNQqiEBxlGhwOABS0KHQJncZ94ANAQUQK18mEV0DiAcTdH4dEBgK1xVSUjKjsVJXaUoXcNAO625O7qJw8AFAeH3RzjbNee95sHACx0iWxRxARvPADQZcFhhtpu4ellAIB5JdDppZYeshEz327gxnoFT5+fw90//kP47K98FODFz8F8+xBPB16nzL4AAJRxLRcLBPcSyJWefnGeegVKsMJOZ/I3OLsO/QEGABMQRr5lBwDEnoDpKgILiX4lIMTDPNi1pe/FkUevAf+mUl8G/1SLlXT9qCeT5dMYAMR+hQkAfPp5ePr7fwTe9UP/GF57/gV4dXkE5wvaRD3KAOARH6ISq8ErBQApAmj+jHpg9iRa/NVRgHENAHbM3zUAmInzxACA3v/oqu8y6jC2kNjEfzkRAMSnmx786dAlpzFUH/B9AEDzuMBXtRXOHPfJECYAHWPnbzcAsIBLNTjo9ZUsXSsJ1R4CQSOdYq/zqiu8JC+pnjBe2D4GmzCEDqSlE6xCB6rQTgBAPvIrg4GCWxwCAFoRqEFkM2UEPWRcOtpn+pqMOrVBynEiAdJarlR9FA/EUkxGtysAaGU3J6pcEgA45ntqbzGynx53Kvxpx58rO9/MAGAQfhXnVGclqd97PlJiKdmBEsCvONdcIOIUcgwAMkvrDCw+gTXLCw9EjgMXBtIKvyiMEW6qnWZBhmVfnUYoJbk5dZbd6h7goRUqP0Uyzjlbj3f8dU27MvGYgZBPnKWdqnyMhCojijL/WhlXGVR7DBmAEe9o0NQbJK+Eaew2S2Xaqc5C1Mh4xqpHDFTlsqRdF7klrUeYUdPygqwC84ArvbPvJPUV5dUDgF3/zmXgRrt+oyamrSyBQqveGl5OBqBa3kl2afpF47Xt+DeTXjMFADQPYn6TrOOss0TUJCbmDCfXQcc+qmccZJ9zwEBvLgBw0pI6i9C3Za+vDMA6gJgSUGiqTQEAzfViQ/Bfn/2RNhQJSEsZ9Vgiu1nDbdjCrfv34av/+T/Cix//ZYAv/n8w35zBYrvGvnvpJ2cAphLg1EdO7GvK+lvM8TTe+XwB5wgA0o/MFXfFFQCYThFOmXNNABABwRXMZmsABABLZYkAfAm4S5xCfftK+pY55CO3m1D+j8uw3RcAxANFUIdwSfT8CLZPPQdHH/heeN//8OPw4IW3w6vHx3COlcszOOLN3Fk6NZjXIJKOFgAoqsfrzyq75xD7GhwiFm10t6V6HMD0EMgUdI3s774ZgEK/cqhCXXnSz+6yPN2iwWj8XY2YAcAsQTsp0DdKBmCx0dYX0vFXRBjt0+5EOHXxyD8ZHVJ2lRmAaX72kAO74Uw+pD2Ib0YNWBtF/x68kR7ZtALZm8tKyR7yKPQ2tD4YBDwAAFRZvE35DDfgJXqVbLAixaOSTyZ5sXli+wI3RjLEWmPTmEJ8zaiHZk7tx0pD4mVpe+QzwhqbQZH7pTMLdZ1elGGolSj2jEsE18CfzX73/hDZY87+yxmpOq4oAzRgZrUCGgBEQ537ENOldMhKqZDYBwDkMny9WILQd4xJ20bwmBsMouPybCFcyS1dY0uAMxjI8+7ZKHuKOL8xr/8EnCkDukEs2El+kfmM3rBTBqAJ9mTy/KEHZkww31kADWrk8gFdatcrAZbMOQX8aXALWd8RqQsAcu7dqAAAIABJREFUZmXLoFFTuWmTKnkWrPS4ZBr702TOKEpYLwh+zYeCZPq5MlLifz5AJCkLfSogWvBCXA0AZtexctCVMka5tU5iCwjMDGVO0anbz9Ulc/0eY70MwCyUjn+0U6HZIwN+6saq/1vo8bdEuFPixgspekk7S/5psubIBWrAdE8g2GL0pO8C/525SL9gxwClPlSjB5CN2guOewC22iNVpRZS/uBA/FEQYdLQs7LWu5eXBwBq/WRsFNm/YbDVclTan7d5I7P4SMO7h1u699c+HlfJfJYZe8e1OLrxKe76uaPhi33YnXbcleTAEuB93mvm18tgzZOL9Y+2jfuMA4s2e97JQP/g190MXH9IVTDKrn6q9esw43fHjL8h3fz4jD1loIw/E2dQW1w5pTxdgh35tgQA3r5/H774+5+CL/3mrwJ86W9hvjmHRcqe4xIa0mtz2M4T4KWkQJ064rMXxJnETVNs5kMla6n0Nx2MkZ53dJRKgjew3pzDZpMO7kg/BACm/0pJEM8Gx0G9MNOYyoYL9fEhgJD/y7QSCU9lykMKdy4Q/SPN+RMRUw/A5O8cwfbkFsw/8GF4/z/5CTh/+9cTAHg0Q58JC38F+NwRAMQZiy8+Gv7AvrZsPZkiq1+zH+B4rD2EKQBgz3r07bMMsRdAtQ55s15k+Uv7Om2gZET08v1IfXWfVNlkEeTy1E1HQU4BAEf2qz/Tw9YX168nf2r+HJ2Y4WD40GjBRFrhcL+mDwDKhkrNP1PW3fCanll2SPzqsN7KQAtNsJUlRPbXAYC6TYRxfDT4l6mneqS26LkbB1UZS+722l9u+Xh1eS6RsD+eqsQ0ZHCmRY6nOzFOx55H/Of9wXZ/b5mNSfE080v39vi/PCHxCE2GgECaT4mxTd5kpojwcM3LZU0sQKRPtJd3KAKjMHHPXwYBKYHfP88LQ+FNycrMdexKQGN5ktGTr1ZlrGp2qVqo0NkEJTbSho9+NxuGPA9vQ4gtYx7yJeVRfKPpX+ETA1NE/FHWgmLAAv6ORCa3W+H3VCXc4SFOIjh6wzmYP/Njbwoj7bIzAGh0Hp+SFAmqAG/2ejdUDfTx7wk4KyhyPwAR3tfv8tltGxfA+B4HWG6juJoIZgFAK8ClLp+UrQYAS88HnIeRw/xkK3vzOR30LQ7pLgCgU9aoHvgQkNxF0FlgERgJZnSTZD1PfTiDnoYWMFQ7TrtdBQAo788KNRPWZ3BZFSbGoqxDZAzbxilW6xboEV7VMuAVvn5rnQEav5+eUTsnXqBFOQ30WP56JwBwuPvYDjDqtbIjjABAMRSVX9WZnClzzIbZHsDTdmp2ywC0O1x2UP1Miqmr46/r8SZdO9ph90+8DACw7Ii1T3EVkzntlPA2fbzDtwsl41PWyhPSGEc9AHd5X3TtoT0ADwmirwHACavXA3hQqPEIXXqQu5YAMzpMI9FaAMCnZ1u4+do9eOn3/x289Ju/AvDf/g7m6zM+kZccePFDKgAwpVSJz1Lp38B+5YM2FpgZEAOAa9huSw9A4il6Frk+Ss+wg1tO8+WS4Xy6sFzLGn6IMI/c0zQO8psSmVNG8hp/WcLm+DbAt38QvunHfhJW73ovvHp6ggDgFgFAaucyxwzAtpvrvzHBwJRNm+4GHetgnmIdQAUAt/OZ+g76YQAR+cd9G9K3W4m++pTpaC3j5x+itydI7bRLWhv4ymm9DABwtEnZGmxq6TMqUetPlHuiNvh/BHKj5D12ALBIZE9WQ9vq5C5fkx3I6IkFDGn52PIc4uGJAKDZHBG9QO/yOkfPxccKlb/mPrg8ANC1iJomUdWp5jHrFRuR9UAoJOMWHmEsZT6MYroymSo+UmDZiP9L9Z4Gb3cDAOP1LZZCWnJlS4L8It6zXRTyZzUASAeGFQBQeiR7DtPr4ey3whDyqPKglQPCdKPxypX14Swau0GXibnf0qFgKC0AsLIfgR3DmXBLsyyzpsKutr+7Voxgz098ONFNcJ0MpHblJm1kah2kM37Z/8o9FSOtYN9tX1UA6ZGH1f3+zi/8m64O0oeAZFOf50QZAKJvI+fKBPMN/yE9Tgh7uQCgLB39Kwq9AALUTFuYVKsN8kajDisKAFSMIacBSw+dUgJMT5XdfFx2JhTJ1JyyFOVdOwOA1sjRISDU3CCrRrMw5g92ENXMfSNan0E5MQNQ3kIBUu+HuErPv3U18ZI2qNEproUeatVZv0bGoqxn9V63gx+NyyiqkF8sjDgFABTa+d0D//7C3SM3Qq+vd+iJJi0ntvSEqmefVoIAlEo1VRlxXg8IHeS9CXDW+kVmVBsl/y7lRF8DgANZ8xsqfecpPazytbJzwg1UvI/NIxAXZhxA9odcOQLDGWotToq1MUScyTUAmKUupOybLgNQUwF3vBN9isNL4LfY9BEA+Cl46RO/TADg5hxm61XO1LMAoOrHh+XAWkezFXNAjGTqkQOdrkmQ2AKWy9QT0GYAbreU/QezBARyViAHtroHYJl64Qnq9xcFEKwdcpPqHQQzXyr6xwKAGzzV+AjWRzcBvvm/h/f/+D+H9bv/Hty7dRMeLgE2CQCcpVOAk2wf9fs8RbZJdNQeAGBkab2tMhrIRcja/0N3pku2wwAiXLVrALDmgDcQACiHBLbYqOcZJt67BgAPyADk9A8OLuxGCgp3OcE1Asry2vQcFKcjHjUA6PlHAyjtzQNrL9o6jjLPd/mpPNZBjFZie6WleTGI/3s6mN5m45LLAACL5s/7Zzkr1fpjlnbSciSV/RIQWAOAUTQW2e/aaomvLXFl4etCdQ0ARralBgDLU4x/wYy8KwDo+dFkAOIGYllxSQAwLp3LOO3hUzjEKwYAfZWA7UGouc/iNjinCS0++v4FwKQMQB0GWkU2g3yKvHOmTAbg0M0hHzOBfxlhRf8ylYbUU9CkkNNs2R3NiGu5xqsM9TzcwXcCk/+uVYdh5RyZqhRRLqHRKaN4D++4i3DocCI5+zgHzubR/zIJ2iXAun8AGwo65jsAATOBLCORAChqdXou4qWqRAlH7bIUBJEXPpljeVLPwpUsIpl7bRAKxfSpzzieqkStuaAls5NfYBWdeis/AqnSMTByv15PIbOeQw4Y3Xg97eUeWQ36ty3C5f09N89Ss5UBGAOABJC3flA/OgBQFGqgrsxUPAAogugVcvrbGiZtRlRpPAsaXav31SuXQU0nApDtbA0AkOQ7yHr169ZasumrFHNCtQ5TAliv3nLGkHwRrW+RDKvva0ciulvr3prfmuwUfpHVbPO2gXy8LgDANk3GPZJ69JxQAjwoXI97lioZDHcwNf920ogD7+vxlAC3aVjHJ7YfTCkBJiuXSoBzBuB/+BS89Bu/qADANfXqS4d2oGClzb9Uuiun/NKGINkQ3ZA+5/PDYpmuT4FL6tlH/QLTycKpN1DKnlssFrBeJ8BvDZvNimuY1wAz+owAQNKqeLpwnmAp29KZjr4ptt0sTSXAckjIdLk2/gBvtM6SM8sZgAQALmF9dAvgG78N3vfPfho27/1GuHfrFpwtZ7BZEG0wAxCWuQ9jNAKvHYxdGupPp7E7G3yt2fsybrRG6rEjB320CdijeilX6/D3YACkv3v+G3Gr/xnr7Yn8MiZQR3lGI+Ox8iLEPcnKS+NDBOj7ll+itGN3kodnAFIPu7Zf0Sde+nbUk23XCgM/4fbYSnbLvkus/Wrz3sCumDUxgXPv7STwWl95gMPmOJXSPXqf+EtxkvJUf1CPUOuOaG28Hx+BIJpWvdmHvnwEoFRcXubdr1BSh1RUCsRRR7kRecyZAOMYyT6er8/ubOv+EjtIrFZiNo7ORJ00JL23xoiR5Aw2HfVpD9quFvUcFgBQ/DvJdLMlusKDZQ14zDrj31cR4iU68yxrOtR4BLiVfohe+5hoK09D6KsNH+c55g3MgpPgGz3hRF87OlclwJxIUvSzXdu6hH3AOwxwCQ0LPtVVvGqUHKOyMIn4FLtuKFb0cTo7IPNWZlQhUra5Ix0y0q1DAFALsF5PYSVxDjT7Ck/RsO0EW06aAIALk5DFE9eOmkLs8Fs1Q9Mrj1+UAKjRPqseU6n1p0+rAEheaFK+tcBy3Ts/VBw+dOFdjXy6KzlY5AjQXBIiLr8L7cy8dA/AZJqwdqbM0BiLIBMwdIhb6V88B81kOqNHwDgtsNGuEPVdZHVkBmDZ168nPtc4oKx8VD+GULE3HVabEtxyIAwvC/8qHiyOn71SxlLproZxiK6fM3+PBFvuDc8U6bwvBkxbDm08vzzuIIDS64+ikuUlHlQv4M9vzwfbWADaj07LGhkmn8ETjaFP6QpKFBnOypl1sRMs/VTW/aGjjjtWIy3dXE8xDO0Fr5/t9HE1fe/0mO2f7NSmgJ2AVlfEJIAxr/2oR8tANHrRjdLrMQGLnJa3mB3siRkyvTEOVGe/h94EAIJWY6o28CNVG3SNSYwO2fEOVv2Ynn0f8+dw/Q+9YKQgByWslfzonjC5Z146/iNtdAEsMwB4F774H34PXvqNXwL48t/CYnMOsFrDFujQigQsJPgqZbplSJFLArGcOGW4YXUCZfhhT7z5Eo5PTuH27dvwystfhcV8BovFDC4uVrBebdBWpgzA1WoFR0fpAJEzgG0q4U3vPQdImYD4d/Ejy/rqXjfKCTME8NnyBwCAGZhPJxenjV7KliFfiOiyWd4E+HvfCu/7iX8Bx//dt8FXj47gwRxgs5hzq5OU85jA1FGZas1EZoO6pX+zX8USOAAAq8cEYis2SkbkW6rE8tUWgp58TjkEZCRedsNX6dH8q51kpsG+KksPKPIvHAAx0r9xllKJTNDHNERQ+izau3Abwn3T3dd/lwMA9g56mRZ79XhgqP8H+rUGwLXXRr/3aCjvj9ip5b/7pAQ9vxJjkH9Ylao4Ynj/pQTldKGlTxml7hMnjxQ/UP892iANdYqJRWJBy0ClK2GuABM/X/bfvM+aV83Jn/cfSka5nmVLDuqxm/tz0Fh8INlwa8l9GZ5/tvztHXVb4m25UXtflUdPZnTHnsT1hrq4uPR8nZHv176AuRoAFBmnf3VLgyIfmv4Nfa30OfnNDrnBvrySqCTP0NUBRLkqozgfWCJOh5IRfE3CO2jsOX7r2A5T8ssT1JePNpAtu9f60a6n6KfSq5TGaKsrO+4Dv66sRNZn+FGqoG3paKUbUVXRGpZD2ejRxBMNDY5f9Q3xZABQK6+iwgMCKmoUAKvvZsjCJ3TVAoA08ZxIjRdyipvadyxT5HBUxoA9Ysgxn/LDJM6plYnhqxK2EAAsys4Ha6iIt8mlZWq49TAAIGdUZfqqgIBe6w4B4UChaQilPyE/UOjsDeJkAiH5LTWzoeN3FCXBDOoAk9ghKyOyClJOqfUjpjTsmrlHDk8NAPaEV6tAHwgWA9QyblM4rr5GAMCpd3d79AcPqQ4hUQB9pl7ml/7corX065+drJaOGkzAj8AD8kb5s56kNdUGdaoGqAep35+eUnpA8Mwa+tXTpsn3I4BiyAi7rNEE+dAGpdtDicE/BgHzMJV+zv1z+jZoOMP2Bf35kCNjXbp9AMCOfW2WzsuYRz0AR6Tp76CPSDc+pINApvgnja0fAI74SeRwNMvRPA74fiBfiR/iLB8pnyz+Fc42AYC8C55GlehHG3QJ1AsAwE+kDEAPAFIGIAGAcggI9YtBmzObwzydApz+Xl/gacCwPAVYHMP5ag3PP/c8PHjtLlycPUSgb3VxAavVBq9PGYKJ546Pl/DgwWuwXqXefysEALEPYMocVMvhMwB7TcJxFUzktT8AWHoxM/dlADDRWwGA7/kWeN9P/gwcf+u3wVeWSzhbzGG9mGOiZCoBJgBwd/0+DQAswWHxyWp/O/KrWhzrrzX2bNhzt35qHwAc7J9MEKtQf/VjjsNfmpVn/Sg93yl0b/ubweYV2j7LS/YdU/SdJ2rbPl89AIgCu1MCRDX6EcAxCQAkmlISBNNjhNzyQHTA761IM+4ZJJ3bPQ0PAPWFwg8b7Ye7pSRG1Guv42j0TbCiajf9VehAz4/uzskmDrAeAVYi7/hk9WAZt88YjQFAIYjMf3qMZOyR2BvuS4uczAkhuwOAPY0szOZlRf8dz2FEz0qeKt1pn6sz7jN/G8aXMaXy3/Qf20uWczOenHDUpr/4yMW2Mz/pZCUT2+vsvxEAiBGTYiS7gUj+pbQwmQ4Aau7y+NflAoDkv1JLNdGkEvfQKOqM4IjPaM3Enxa5wichABj85AxA8c9pDSsA0Mm3fdL4ELArBQBZ5YfziwJ3XQJcbpKTcdgZ6JYEPwkAII1cWmWio4/Mk0p2aoYhALAki6eSyuJscnDROgVYlQnFbGSZN40LTydWP8Yg9W0fMXwF2FgjJIZD/i2GiOkyyHq5BgB3cwb2BQCLY2yNnuYPzMVIX6fFDIYVAQRvRgCwdgBrXn+SAcCiEqYEC2LErwHAKQHoNQA43fmfYH52v6QboI4yhNnp4rfieisAkAKSAQD48Y9hBuB8fQ6wTqW4x1QCjL5AAroWBHhRQS/AfAHz+RJmDAAmAG95dAyL41swPzqBu6++Ck/fuQOzzRoevHYP5rMtrFcrDASSL5HGkw4CSRtJZ+cPYLM6hy1cKABQ9wCkHfjifejgXLRCzx49AgDwXd8M34gA4LfCV5ZHsDo5hlUiW/rvGgDsAvSjzdYpwnQNAE49UKxFzbb+uwYAxxz4JAOA6BqHAGkBvvQhi3626FbrQ5/G5ODYUi58PQGAPflQ0b7puZEj4Qxjkz7SPctr+7QrKJffXoEpjxMA5JCrArPLmDCtCAtxBER2/swlAIABWlCSbxCFLT0cUR7MoULXACDRrw0A+g2aAoAXu0McLgCg0Jtkwx9q69erp3/w/tEhIJKBoIGiWiyVABt5rHfUcCp8jXYxpQS4Cqp0I9U0YFXjXYir3o876Pz3JWQAxj3TZEHKwsgIZLEEM7GnxpSsoUwmzpgRk7ErAJiaYfd+dAYJZSO6jBjhT5VR2XteXTI2BgDzK5goDoM0r9sFAKQbdR7gCMCYkAGYBmBKfYrwEl+J4GkjrKfgZzcC9Oz1jyoDsIDO2HiJlYnnDwIAWzN4EgBAWhEevyqzf5QZgI8PAByDKzYIrOWDuVkx8AR+5XR02dGXrGdyaK3+7aaodzXXlC/78i7iqmf0xssA7EnntAzAHqXfeBmAll5xBXB2IIxVRH5nAFB4vg8A/i689HHKAEyHgGQAkE8BRucND8lK9QEEBC6Wx/TZbInZfCm7b3l8Akc3bsPR8Sl89eWX4eToCE6Wc1hfnMNqdQabBCxiNcAcNpvUZ3AGy6MEMm5gvT6D1eoBbLfnMEuHgOBBJCXrsQIATWsTsdwdHtuzB2CUAYi2HG1v2hTlEuB3vh/e9xM/A0cpA/DoCNanJwQAss06NANQe3JkBJU0qPK57PM2SDExoamypcafeiNmAI7MyUDNe29qvwxALc/Fb6vaVzzqDECMVfZv8JBmkujR86cfawZg7p+n/TO9yTC28TsBgEwIWe30r6eNxLH5c1ciOxqRCgE4/IioX/yy0SE8tJOxm5CUN44BQH+K8aikmzLaSQ/qmeXPnMGclgHYompNOw2AlBGojmnY+5WeR8d31rQb9bW0o1FKN8ymEh8z9rV3ARuJhlres1XJQ9LPi/xXbaBwCz6V5ma9JT0AmSZ7AoA4TN9qoYywHCwlZamaoJVDRe1O8o8ylBQ/6gxATpZqKjR7anTEp70N95pTgnhIjz+P1WUA6pZrowzp3EE0ygCs/SsDALJzQuMmovgSexpi2z97IgFAnIhxtIqZ8j0WdJ85kh8tQEIazWDWgRuVAGuATx8wgeJe5Eg9NAr3C8eaYDiXDNryXw3CSU9+US/5nRmEKlmNlHNDxcTYJ4gzAE1JT8gLHOYHAKDktvadCCW/zlgJwJiN7mxGh5q4nnmRgxwJsFXOUYCvjCv2DtJmvr7eGrwBAJiZsvQ70Oh9KX8q9KyMiRLWIphtAUUDOjV6yCnw8tbYKPWcmJzir/jrEADQ8I0CTot8R2s4crPK936G9aEE5flyEjepRBqZPyVvtxRx3nfh5fObFPixM3iavkVtt5tAj6rXSoBONLEbEhOk1vRMJVoZbWVOOZ2yLiUDEKFXVwJsS9q4vGbCMKe8ub4manrsNMigHCj5380Qatijr15/P8arzQDUoY5+swoRBofsHdYDcIps766j9uOFxl0mAzCmV3HD7Q56khQtf0n+F6yuy8Ya5fpvZ6kUVUqAN3DrNeoB+EUEANMpwGcMAB7Rib0oRiljrwCAs/kxpP8SGJgAwKRaZosFbOcLeOrOs/D8W94Kn//852F19hBunCwB1itYXZzhGLGSALMBaMxHx+mwkRVsNgQAwvYcTwHGQzvS9ax4dgUA0+Ej+kdvME5ZNyqZIzuM/8unG68xsMB5oI5awjr1AHzn++Gb/vnPYQ/ALycA8OQYS4BJZlMJcL+ErpI/J9M+IDb+dAAAVr4rV3VMmXulG/iDHcz/Tq+5sgxAMrDxj9b1U/TnTjOKLEBn5zrHCjJYHXCTXrLTYH2WAQa2ufLaCCCgGrz4J++tKn1saEdykL8N440GmTnwlDilDXpM0dEHLkL3duWfBSXAXj5FFnIcpOfp3hPOjP2xLFMNHhTZ6GfQ9OmCkYfJeMqMgr9wyN737xEA3I3+lpvaJcDEajbmGQFWsoGrJSWPLgh9q48MIDLV9penVCXATEnatKKWGzivrKhjAH00z0Jx3e82Umyay2pBH73H2BNGVc2KdZR/VF6qAaJDAUCcmYnny3p5u65WqGSjmf46fEfyLTQ7Jx9H/V1twCvmQl7lqmKvsUuVgnpYoydvS5oq7y8Ivvx78ynFKOzlEEi6LpSSMiN+vi3iLeA6UrsTf4n/GYN8PFLnj9m51yXAPn5+LBmAPXWXF4lp63dQLMMWcCx85oQMwBEAWIu8U3lGgLXCk9JfdfiHQY65QBoPAcimwoCOZKT6ACAVEyl15oYn48ePmYEz3+bdfmblCYaoNtiulwofauCdT3m/X6c+AOIySPND1Kpg/289SzuJ3QFAFm2mvVjn4qRZo1brb8sDI+uO8WnHCHj+qwGglvcZSxnu8BlH07pRvgRYJ3RVa+d970cOAEaArjj2RJdLBwDVcmVnVTk9eQdVfIk0jJYT6jdCqiXzp6RRgLzTjwMAqccYPwFPAR0/zegQNPrC49JioDzEZLBKAM00GL9pYhqychpG44+cKLkdh+UBwIb+bI59cIjE1QOAAXMpZVufYmtnMj7lt8cgVnfENJoaBEzijt0vcgBgHfJbV7fip1wiS7viKeO+gN40N7J1GgDcwq3XXoUv/v6n4IvpEJAMAK7wcIvkRlJrEAEACfAjAPAEwa/0vHSwyNFp6v23hPnyGG7cvIE9/e6+8jKeNjzbpGw+KeGltSB+SzK6gbOH9wBghT0AEwA4n6XTgvcFANlH0QTi3kxtBKRerhgATM/mecwFAFwQAPh13wjv+6mfhdN/8O3wyo2bcJZOOU4AIMvpPIGlnZ+6Z7FzkdV8Mqcq/aid98jPOhS8m+By9efXEc8rBQCnSOITAQB6ChfbdSkA4Ej/G//U+dkOUMSlnEgzCaRxNume5jim6Ogpi7nvNeX9BOIw/VlwLhUAxEeXeEsigyjGKGKzG320uKGm7Tog7B/1FdQoRAi8Qu3B9AHAusSw7/BV+lL82GgOweZqfYjCyMFU9OcNLLJf+j7ZaCYAsHxF90ZvGK1LmY6/e5QR2LYfIYmMPEcVkW0LkCmTHXC7IdkHAOmm4v/aeYqLaP0/qxtLnKDTYPQ1iooMJGbAjL/yALtfFy2HaGtTlxQVYxXZDfzIPQDAFg4hbJ5Nv8CckmEt/oZiTUYKejtQVX9ireNJXbXlIwOAqMi0npLfpQVLS8G8DgHAwGU0ysADgF3teSUAoBphZayVMuZ1FWaWJZMTZEg4JYONnknGvDAEusW5MbiAgTYDsAcAetbSY6H3ETePVLReE01/EQDZncHruETbZ0/u5+gmZV/ErJTgqhE/ZgDQ0AaJqhXV2LnoAYAyS70+9lAabyjHTppu8ks8qB00lqb8wi1gj+LGT6WS3wQAYC1DLLusyCuHtrMk4rzHlxB1dVNg1AB6QcSa9Jb9QADQO88680k0kkYRQwBwB1yvZ6DraY4BzJ0AwInBlxnHKADslfdMeF8/w4plN1L0kn8wyACkJp+dn+78xvot3Lkdq6nLu6KTAVuOPylBROWgZn0ueWktAJB2uhebNTw928JtzAD8FHzx4+kU4Bdhvn6IGXsFAJQMwCVlBM6PYD4/AUAA8Ai22wVsZgs4uf0UAoApEzBtZty6cQxffukLMFtfwGKWWjSwnuBsOtyASBmAR3Ms/724uA+ri1QCfAazWdqdl96dbFd9D0AF7tMiaP6wJThkP8RzmbZkFgCUjGYVVGQAcE4A4AvfAO/+pz8Nt77jO+HhnWfhwQxghdfw6DCDsv3zpAOA06gWXyUr0wIhrwFA3jw35LNBrtV+Vp9m+sr9UQbgSP9fA4BZh7zeAcDI3eqXm9YAYGVtezvsHb+bvc4gi5X1IivIUjxr/dSW3mn1/Ayv3wsAjPwN/gwBQLEn2qkpSSaYAZjfG8l3GWm/P2OLAjojcOzfDDMAuwBgpWHMoDQQJuuNG3jK5lMCcnoJ9xE2vqAFw/XDxc8uAKDVi4Kycr4+8Vmu9okQA/KhUgsz+1Ni+PR5uwSdq4UYAKxXp4o282bJVPwir6a6wdZD2VwinE8CABXLpoPHrL21GaSVPYl2H3Sc3NmhJwBQY0rp6bri4coBQKvAtAIkGtYCSNc4IR/VuTW1UXDOq3o2vaUTwAwAwDRWn1ElGYcy14DtzDvrAFlHu0r9qnp8HZT6FFx6HlGXSos4BMzZgNIwnObdBwALeKZVmWbgYY8KL85BCbAO2qVHYwEAhVPTFMsgAAAgAElEQVSai9z6QqV5F3Ony3Bx/fYAADXH5N/zQkr5r1XOWWd0t/wlI0rWsK/gCdBJ17RVWBXbVwH7VPXHjoGTH79Do3kTi9t2HF8OOnIG5UBGm6tf1lzPsMpYMgBm0VeXUQKsdQDOwmXw4irjEpdg2uuTUYZIrBqL1ik9H1iOCDHWAtGmIF5aeLDobD3m/gJU+k3t4CON1Q4Wvc6bQBrvVC7NjgkPq789sTsAaMaBC2pL8KeOM1NtFABeCgDYWaOWbZWs8ksBADs2tmuDY+s5EPnL/drtYNh8iVrH1wBgabpMhakDAHC7hqdmKQPwLmYAfqkLAKaMvXRqb8n+my9uEACIGYALmJ+ewvL0BsyXSwL2FjP4agIAt2u4cXIEq4tzth8zmKfTcbcA5xcPYZHOE5mvCQQ8TyXAFzCbJwCQS3RYl9WHgAiqJ2snNGKfxDmsI/3mF7MAgKSDSgk67VbLKY9pnVaLGwDPfz18/Y/9JNz+wHfD6q1vg3vbDVwcAABWva1cBmDxvrh8TvmXWjeI2O06/8tl7nHy0M76zPt7ow2CCfb7suesnzfqMavtsy3Ziv1Sf6J0/XwbdfgSUGtfxPyWT3UMZbM62KRr095T+673XwuIiPPDpq7ISO/Lc2R+/np/wq5kABYdYxIKHLPmzEYFohQ/nBOdVTSWZBH1i07iclOtq19i/9StGDvPtac+AoBMlmmOAdWgduz/lynOjlKJ8NQzOwDZKDOuBgD7POC/HWcAev/V6rDiThXfQeaY/hUAsMxWR7Z2sW0/Qc+rkQzwO22A3MUYanpaitT6t3zvwVkZkYlPzQNURRCfjZABQDxtl9qAsCYpnpl6hvF4Ep/k+E7obWlQ9IeMtshweWxZAwIATcRm8ZJOprIuAa5Xx1hfI48tGxdxrpEXrmBocXh6LgKWWf9IVSd/kPlE2RIDilv/Us+JvSluMdPWxyMAMLVkaUqoOj8j8xbb86yx7/zCJzs+Qr2DoUvICktYk5wDvsA72qcHl1YRu2TYJANLPQBjEvmJ++Pbk7GIeg7q8fSwTWmkKeEviokwSLR7okJlAlJkv15KAwRwJZCK4tdgbhlhVk2G3ftaamrXElNMyfZGVlSAE5CazQVNbxsZCRBkrQywGGYr2GdFJcBaLIl+nJqtBL3ifDfE2OUh5akNVg/58CBpoo/O8PP9L/9/9t7EybrlqA/Mc8+9t5dveYskEA+EpEEIEIvNojEzoWEZNhuEWAR2YP9lZvAEE4HArIOZwNjgMTCAPECwaFgcGAQCocAskt77lu6+yzl3ojIrqzKztnN6+TZ1v3jxdd97lqqsXH+VmTXFbZsjX2hQTQ+lxHmamSHqxqgzDzw1CkvcGi9SVNxrd1zJgNEFMru2RSsr+xZHxrDfvzesdVZmyw5IyJCrDianfoX7KUoQcUiIeJflJb6KvU15vdRENMFWU2hcT/9Qmql2FGwPOSuvs0tQFI0dIBBbJCRkbJQwBzkUE7BuRKtJbqu8sRWAtkpsW3za+n5yw+siUlHhJbEpkh9HxXXAG+oZyjSk8vuR07gHVOGyNCCwvkj6DjVqbz+DfZF1L+H90VVfYIDJ1oHdOKejaIBLGOFov4F7uw08/qOPwF/+5IcA/vavYDFsYNy6gziWVPrLitL1DkQA8Aj65TEM4xKOT+5hSfDZZgfr03uwWK9x49eV1+y2Gxg2F3DYbeCle3fh4uwsSKgDAB3Nx2EL47BzEBr9PrqTgPehBDjA8Rg9WIfdU4KzDLKnMkYaXwYA0x4DLyzpFWf//G+w79cAd98ML/+Tr4PXvuU74I17L8N49y7ssAegP/VYgIGWR4nGFQmqtGYgrtG6PfKIsA1X2QBolAC1ZP8y37fsrXomTr9ua1oASGvrJynJnwWItP3HtL1KmSGYl+OM2QGQDkhsCG81S+qjMgOKd0py5jIKhb8TtUu+hzA+3SUEFRghjmeKv5B5SEM/0x0WbYv+Bssf22FcC+lMmP7Bkp5h7P4X6Qfy7/R8r5vl5izjizi+OHe7PjnKpdewvxNmK5RfLaMppSf71tLHbvtyZX4N/CFUqF7pQgZs8Xql4SS0OlnVpABg7tboWFvOLN3P16H+siw3WWccklJ5zR1+rUNc6fknG+R7rlYlnGGUVXopX0OcaWD1T5JphsORa3TwhwA5mfOJQa4BP8ul/03SWPOe1U/M69pvk/KGh5qarLhUxug53N+u1oZG+QIYONL87EZMJKhco3p9SX41tDyn9DBvUrzlDtWzFivKZ6JlkU9burci3+z7op8mfRH+3baISns6Wvsr9SjS+eUf/L+rGkaXIMV+dMQ6NBBNgqDuiZJKmAqAVdGA2eczYh0fXSXvRAAwjF8BSv7TZAfUGpTYU83aQ2ZPOUY+FZinzPIs7SKLJSHPHgQ04FS4vwoAkgOX7AIaYynJnzqIWmDsUpWayEffoXY/pQfX1tCWrMYMMwePaWWQ3VG1Clq8D7mLAUDBx5x5WdPiUmj0+GlMArotPiZHGVXiGcCWyfY3DwhXbkeAXBi4xCBPf7W6UoOA3u/LLHQrILEKKw8ATtQHYoTyuU4GpVy67/ggGyUbXjCjiU31k72+XsJpDXBK7MPBnfAZf+jQgAk/wZtgh1y5ARHKa54iqN81DwCMRiu4LdWeF3qDBM2H29gsoQwTAUCJAkS9RPOyxs/+3Rn7ZZn8uQAAcemz2oZ3lgoMJZ2OEs9V9HvxvSyv9PySzsEnCwAwWZtsRkAqgVU9Ll6uNn382Fnf4Eixh24NADzAshthvd/C3d0Gzv7oI/BXDgD87zkA0M3GbdAt8f/FYg2L/hj2Q49A4Gp1Ap07EXh1RNl/KMYHePjgDex650DAlcv4E+uKJ7ZjkO2BP3dCsAP/Dq70eMBrnT6JHlqphIQDAN1zKEfHywCAQpuJIJOoHwHADvaLFcDpK/DKe98Hr33bB+DRq58Fu9NT2DqgEzN33f/1nqjlQMLLf3UCmv+DDpN2pNGEtGnfWk1MJ6j6OZck46k4X8ihomdw8h4S0Orr6/Yv9U1b9LLWqLW+rU0IpS2SDb5Mzy6fYYa2ycw8aELZm6piP6LtSD1I8v09bYubsNQ0v6rfzAbqLF5Bs1GzAaQnAgfgtRoAjOKVtxN1P5k3KGOMyX4lV0rh/d5/47mxrvZWJgEBixwrMw0D/Sv87cg/U34JQBG8M4G+rfWVe1YpT8r143jJPzHh94qPMJFxWhsCVt6sHOWz9oTF8Po+xM1VACAdtHq+2WwOPpIFAO1jxJrp+eZkJV2RqCcy+o/37RXbRT0Qh0JPoVPA6wCglAvZ4z31CWU8rfmeccXeX1JLfOLnBgCw4mSrTTbM4HUZbaR380urxyjjOLtMeXBPD6aWNJLDAXBOmUSQrG+kNiImClDGtyAA1VLDe3G2IsMc6lIDANG+3wKAIgicBABKEfSLwETPKFS7AJYpQ4wUUYVotySUdJ0AIBr2yFIKGkgAxUqAFwC0AnM3AkAM/iYAgMHxZhp44xzLl/kKrYAxFqoAgG7UBGBGRSwzL3NixzMtuQXs8F4XAEhZgNOVxxwHGnkxlyErydl4dQWbUeAKPjIzj9Z4rYJ/6gCglx3pXJZ5QWbMlQhZl6+bBADdAikHdlZPOhp3PQOQZcvP3TnMlYwZDB9EhjSyzBUAQGK5SN+asxCWVdCAgZJiFos85KSkAq9YQteS/EkZgEU97PVlLSJqKp8K/zb0P7cfyAXSvB5PFgD0m5ph3LG5PgeVZQCQRtx7APDebosZgB/HDMC/hsX+HA67nT8BmJ3bFADsl6fhEJDhsIDVyR3oVqtwWM1udwEwDrA7O4elKd9BABAG6BwAuN/AgNl/Gzr915X+umB9lABg6RTrHACYZ5I2AFPjYL3yCgB0vf66NcD6Ptz9yq+Ft33798Dutc+Ds6Mj2DlA1G+O1g9FamWIcX+fuga3Nl9e3Qp4m/ZtJoDQ0get79V4Juj7Vo/Q/CmocRQvMgAoXZoY1PvwN7B2w3+O9WWBaLpMVZag2dW9YQCQcYdiKE4XBDDgFgBsiR/5NxUAUMtnmuFjX6D86maFCoMn/inPMQDYJHThgusBAKPkR/3PsaeKpn0MpIN7julyJcAyS5SmwEKYR9EUAKg2xFObxv51JI3UTRpY06m6lBDhfiQASG+wwEVM+iKwTLfpEa6VH0aM2d1vVNIa/dI0ZNTjrPn0tew+pi1dk7f/NQBQzrzEi+wzXp5X3bhc1mH5Cdb/sC3lrgkAlAPQqDWVvsRligWQvL7aALYcIj3V/A6h7L9SxUZuJANQi4/KsJsCAMoJMtpfUlZewIgRWSQ1TWwAzgYhOiSZDEC5NAaXmZsB2C5xqzlAdQAQ2Z9LtBT4x1lBuWcbjlCAgwx4vZqRPdK432JQbPQs5cv5D/Sboyp8ngBANxVbAjxXWeWUrORBfl5px6ilD6yCt4AHHjoh9PdUrFQ+lzJ7dK0rFsY1H5bJEBAEjPBXKcDkl5a/vzEA0E8u2cFuBIWXyQAMs5MAYIa2yEtyLXI+lSFVO35OyxmMCo5/ZuZeBfKfNgCoWzBWRNegqooANSbXtj3/Ak3fxJeqZFjRV+X3o4yKchMrJejQ+pKg/Nja45dD4OfL97CDVQIA0Wn1GcMSALy722IGYAQAXdmuAwD9CcBsWUwG4HbXwendl6Hv13CxG2CAHnpfAuyef+/eKZw9egibx2dwvF7BMAwwjns8rMmBewt3jN5hFwDAA7hSYAIAcaQmoxjGgnfpN0OzPQIDsXWD77m2w17vLDL7M25U+8UaoL8Lp1/xXnj7d34Qhre9A86Oj/Ak4DIAqPkpBSjl9y0AMOVPy4OtDKCmfWsrsKuSVd1v/TU7H/U3Mn3DCPqMCH6JvfpFBABDTC4oq/xuaUeqGeT1vV3V+iTLBdcLACZ+blU704A0/6BGVndNywAsszi770E3c3alRxJkBqAcf+RDG5+m75L+iX5PLXahabbkX76Nbci1A4DG59T+jZx/auFS6c5Z2ekqqLUhoujhX6U0cg3tQHVUz/hujfRaAEAp9yG+ZDrz+Bh6yUAwys+09so3zQnLYPyr8G66wL2eMJdcD8CMdDLN8d+40RezAT3PB8ElD9gBgPgW/zXaX6zY9fNO9JwvAUYAkF7KM9V6xvho6I/QZ17EjYcoNie99ol6Mo0FG9YrnkpeYBxu7cJfK/5u5OawvLd4svQ9tVuP9Mtdd+MAIPXQk8pek1Si2MoIhhVvKNEqdYgRJBvLkoQmwjsBANQlDjxWFoK0REwrV3KQVIltJq24xoStOYQy64kAIIq1KkF4tgFAB0CV6GONPpdFRDDUGqu6QxUyTlTaPT2DDluRtNKKycaxegxRwc0FAJ1BKwNNvsxZEMgGFHUF0FY9aFDbSFf2QWgQKgGCXL/2SPJXeB0YzZ4AdBOD0spIlYZbAHwlELNNlpsHAHULBXdogFuvBjXZcoo2DToQjnxedWALgFgcAGcAxgFp/owyFHiBSzq9fVC63R9qxFmAQRtL/jdzbzmc5UOOKPiXDmXe9U374EZmlIo2vyatDZJaRmtTZoJz0HJzvLOXfWCNmYxzlrnf0lewnr+6Prby7msaYOXW56oAYHDs/DDtO/jv4N77HoBuW5bH7q6hQv0DLBeHUAIMf/6n8Gc/+SEYPvan0LmDOIYdLBzgJ7LeR6ztXUK/PML+f8v1HdgNAEtXBnx0CovlCharFezHAS62F3ByvAbXh/Dhp1+Hk6MjfOcen+t+3SP4dxi3MO4vYBx39Bke/OEc69H3/Auz9gazxAOyBDjnx90AAEhbMSib+24Fh+4OrL7oK+ALP/gDMLz9nXB+cgwXS3dCMgU+OiDMWAQ1tZzFaCjTDIBd4pGmvD7tCxqbO9J/D0M1GcyJH2QOgbIFC58JAKCKe5TvnR4CIlkARdbpkYxiC/ay3iDnyiXA0v6gjkt6euvBWW2u2wu5yZd6FOfjwLaFEYWKHnCLI6Jnoh8q9rjCMzEBqfyGSONoqnTMkR9zWMMJGbSKXqK8M35e8SFr4PFEXULushxFZj1LKrCyeVd6fcsfU/zv36tGd8MAYDLusAEm19otFG+M1f2XACiq7Fc+pZ7ulTxl3y/9C1yppAS4BADSkygD0PGQawyygAOn6uH4Nf8GOQl0l/67v1ZUQeIn4hBS9z4uIY7fad6yJdy2R2kSrxr+RGkNn6XaJrchqTOQlWQFELEuLkIAZvJ8C79pPc7GmBpgTOOLOfKVlniTKpB6Ly0BNgtCPcKs2aK/eRdWfqvBJ2b/hpNVXB2tvN1TnnkAUM1FnHqVmWPOHTW3BzQ8lwFoDbY2Xn6hcz0A2d5lFPCTzgBsAYBh3mHnj0CxYkZZDZXnjB3fYwDJ4Jk7du1jnjOKxLDwCwUANsv8yuqzDN9GHTHRV8leRoYmfpU4rOauVsYFXy6fewsAllfIypkN6Cg+jMJRAgAD3X3PQTYz0kVxoYM71VyuR+hpbHSWfF6Nv9Sp7sqMsfIr7yiz+1YrAW616bx5ALAlXakTpe+wtln+3Q7PUgDQRkV1B1r1oiCvQg2PHNz8Dzq0V8wADHyUGabkTaYEHwISAEBySmDvGWG5AFjvN9gD0AGAf/oTPwLjxz4K3e4MYHAHcfQBAHTOsevf0/Ur6GAF0B/B6uguDIcehqGDwR0Ccv8lWB8dw/JoDdvtBvb7Daz6Hi4ePYaj1Rr65QIPBtluzmHp2gnCDob9BRyGLRwcAIjgH+7hI221A+3GXmsi9rQAQKp4GGAFY3cCy3d9Kbzrgz8A8M4vgLM7p3DR9zC6Q1EwY1DKrwimw3oa6RWbf43QzrNGOXtWOtItKXwmvs8AFta1l38ja1sA0IhoLqCTdH2RAUDyH72fk2y8kyaz9jHRvZTmUdRw9E2JU6+eAWj9Kb2hq8cW4hU/XAQexCEG5Kg9XQCQY1X+twYAMisH6svgGH+vrY0OpkvyLd2jYE1VjPKkAUA90jpAUakcKEx4DkAR1ko8a2oPwGvTp9cOAPrDOFQySbmPNfOelK0IgnkOrSxSKAFGALCP5aIKAIxahEvQSasc0N/OZgL63p6c/Yeb5YJv3RPHDLZgK5aoR2nUX5I/9DxpRVsAoDsILQBbuawc8S48g3wO9FQE3MsPuW4AUCZkuKQNPIRYvH6OfEU65T1+tO+qByBHZYKIeMqr1JDCIMkgWjrSQW0G7TdnFeRgn38AkHeoigaiQRrOWvuMBgAFEO4CTj4UwJLOOiip68TGVvIVPSXW+3N2VOT7nKJ6EQBAil2nniqb5+BaBuB1GGmrY24BwCeYAZgpg75JANDJmXNIZDl2AkAaoS8ZxGDKaLtA7XzFkK1eUvL8A4BBI3pRbEEW9vu5AGCr51qqEfT6puPDEuBiePycAIB/8afQ7S9gMbo8Qcq4ppVx0rTAct9x7D34t4TV0R1YrU9gPHRwsdvDan0EXb8Ad8rvgwevw/F6DcNmi+CC07+7/QbcuRj9YoD97hyGvcs2dId/UF4il8kFADAEB96ZLnrJTxsAXMK4uAOLt70LvuD7fgCW7/4SBADP+x6GBdnp1D9lqeXqDOsFCJ4ubhZaPswHwi1pug77d63PMAAg60gpX1Fv+oCsVQJserragOiFBgAb4B9yHpbOCQobWXM9r+o/FvzT8OpVDwEpA4AUxSVvV8rYVheRPssDlnkwrW1h5mUAPu8AILa0ET+jbdkwUyGkGYD6AfXTVikyIiMyLYafA1C8EACgKgGmMlyUeAWOTWk1Eck8HQCkQ3JQ5iwA6BSDyOZjKxgBQHcXbj+KPtm6vJYTvGKsqzv+IQAoNwDcS9DHiT+UIM7eTuypzJ9atrp+ALC0eUJj1PYu1VF1+2X6eWZksyU2Nr558gDgv/7PRrI1wfQOq4kIGw4FEXea4ijrNbOAxiGpLq8vAa4VhrodzjhCZgD/76SSiWJ+iJ9Sff418vApYSiiqgQ4UqvaA7CS/cdPsO/X65032nKtWhkutXpFdBYbPR1w3hYA9NojBQD1J4w/Rx7JA4AkhLJnA7klbBxLAGBUIfG9sgS4Bf66u6qn7FHOhmLf6ywBpvdjW/ui+NXVZ70EeKavkr3crnHOwVAuseKnsuwpxZ9tnjylMrpdAuyh5QIpWvJl0/8zJcDFBaK5cwsBkvMICNGffMpeeaUkBWNoLfjdvJ/1kZSI0M8DS57EvrrJcGcAUD8yAkAWzsKWZoUlJpnmk8LtDqwcfzkE4flWSdwwb62M1KuV8NcbBKddV3iwtUHnvitQIJwAyfdEAJDvaFn/NJNb31ErUXfvqG5AhEe1tJh1BIVzKEQDw1sUScd4vgQYlSjA3u+kcwnwfXcC70f/BP7bv/0ROPzlR6HbnyMAiC63AADBZQTiKcBHsD6+C5udk8kejo7vwNHJKeyGA2y2O7SB9+7dhdff+DSWAHfjAZZ9DycnR/Dw4RtwcryCh298Evp+D+BO/h22PuuPJkDy7wE9/IN30ms9AKlEMVtKwtqk3SdBUbBmE3A9PYDgHjvCEobuBOC1dyIAePQlXw6P79yB8+US9t5vW6pTpEmWI5dTgOIp4Be1zQu6SIZvL3FyGaCWGrc075Z8XNmGmunK96H1sd8n7nbFNzD6N82GqLRPCN6xfn5LX2p6tDYc/GxnxCB6DonFAXnoSeAzfxnTM9L44EtqBdUtANgoeVTzDYslaJY9ITLelVtj/tY9xQKQ5P9HvyTn+6qMHuU7lgDAvJ+TUjfldmWxsj336NnZEmCThWWfHmkT7Ve6pvmxk1KtRTdC6zAbBp0pIRH9kBQAZP17OU1QBwBL8mPnXC9DlSOzPdJao058PePQWe2j48Wp2rOsw+jQCbKNSmpkZrxSkvFZ7jfKSGMFIE7j9TE7P3PKYY5so6NcKO43pPSRJupgqp1x4CP15OP5MAjoefHg4XnvCzg/gg4O4/WOG4KYaMOJMWEu8WRe9CAw/DH4B25oCA2Iv0p9Fb/L6Ra80twjV09lAGaZS64PxWel1efXaC7Suq8Vw/Oa5YYS1rHApjnXSQGAeACIuznOwOrrpjdj7Y3gDlyZV3/wVypSxKJRESCzvlaUWgrAfp8AHJlXywEnAGWi5TERNDuMZOKdM9g8A84aac297gC2519mUCcIcn45ho0CE525CJihiCn1Zmdj6ZeUVDWcp5bDNsn3KpDYGn8WTbkjwYY4Oi1awQT6+9KfLvQooetUeWl4mKebLxmuziFJGw6jJPdD9NBMWNM3YZV82KJnhr3bLFa4AlVLBQCc4qC1xlst0UOHbu4OuDLTnDRenGENng925goAIMpPzQ/J8gcPtx0g6YczX/r7Jzig/CbeTAj6QBju0vBp/bVwSm3Cmo/vx9HJDRr3QabkLsi16enDDoEwd1530R2pmuBGwcLo8/tFCQ9nDCsgwwu13YCwGRG0EXBpEWsW11/h0Q3epzGnO/z1N2pAstxqwUoh/522DKmIB65R3YWZk1GQrpLvcVOdsn5/uiNL+omvohJgX6qCgJrb8e5g8BsPDgBc7S7gpXELZ3/4EfjYz/wEwF/9OfTDBkuAmZMJBHTeNwGA0K2w/1+3OELga7PZQ78+wey/Rd/Ddr+D4+MjBNAfP3oEx6sVOu/jMMBicYCzxw9g0e1gHM6wDHgBrv+fOxDEETnaJA3mlagfLS/R/2pcGteFG1pn5NXTmABAGvboSpq6Yxg/5+3w2vs/CPe/8r1wfvc+nDkAsHebIR2s3CavPygm9EsOL4zZ/DntgTOzOwhB2KfM2WpAzYFN59xfPuVNl9JAEzawE/NlBm05JAHIghFlmRDs0h2a9r3lP7Q2iJG3qwSsd2pXvhebVfHh1DNarG8ebWJtcAdfYj2HA8QCSYe45AGZhAm1oeLAj6TnH0pflKAQQCsr7+2yBcHkBru3P/HK7AhrMhK1UPR37EPopFHRiV6RsmFbfPCktxiF94EVzjkPsgyIJfpEGJQQjfkxhsiv6j/q9cjZuDr3xBhQrgj/nvdtos4P+v+yTlBjg8g9P/qU+QPFoh9q17NtmxL1nk04iRSMG17sP0mK+xNthUzokmXKqQszKvJPuorSr9ZZZ7nVjZEZ4kMY09L/FE7x95E+ZAmpJZn0ZSIA6HsE++oABgBdFUKsjqONxIAvZGWD+ZXGLTMAcWRGHecyUON6H/ypwInUN8yhkOGmas3hN+ylta1uLUOQ5lofQM18YfhkAEA7ooaGSyYQdKq/sXvTvy4DgDqNNU+MBIxp06x6hdzRR/YtzJAn0gQAcZtmoitmAUB8v1WgcfiE6l8dACxmKCIAaMY+wanj6UY2jmxoKWGfP7eks+bAefs6E4Ev8JnnBeloadGK6cvswIgwIwARCgAMuxz8Tl5r3jmY0uTcOgPBK6OdyeccAGxJTsuBpxTz8pqOIRMld01Z9tiBqUFodHfdSZBurRxBTffE63wPqpKOZwGwu4vSwW71mVFk8fQQg27aN+k7CzBOZtWWF4hAisT3E44zyyNZe6GvGNwRO3DSLcHLMwBgauAq6xd6esa7rP3ArKcAwvpniQnl+DecWhY2DS5v1FryM3X98iNoycf8BHwbwJQPUcmPiEsylQtaJIItIUufeTUAsNGDS8gDvznJiAoZcHQFl9CwbnEAIPXJcT14APpuhNXuHF4ed/D4D38P/tIBgB//GPTDFmBPmXzuhwBAChgYAOz6Y3D/L1ensD4+hYvNDvaEL8La9QDcbeHk5ARGdyDIo8dwenKMJ/9uNuew6EbYXjwAgAtYgMv+IwCQ+sgIm2QArpiNmGg//KC9QTNHNjiAEhpUlLy5obE/RwCgOyDrCMa3fC689f0fhFfe+z8jAPh4uYJh2aPmXLt7+GChcJBXtOcRGsgzIZZQha+CezxjUmX9FMO0sv3zanPG+2ZcOsFXpDPAygZMAoAB+A6Xp/rHPqpu382GUTDOJ84AACAASURBVGZqbQCwtYFYp5edueUSe0hT9WkzNuQCh8p+FzOWFi9VRjxLvGSDhQFAymRMD/HSTyH/l2iSekrRR5JU00RoW6jypIuSJV7H69OysyUJTDKzrE1QFWLiKcnGLn2X8kukAP5mGC64iHPXnoxIUiGkHpPYt7a8+lmE9b4eALC8OqltigTS8WOOk2KFR5F8lt7VijNueSHsk7qfKy5YLuwGhy79JfJT9R4uV0XZRwrp+DE/L6ZFBCQjAOjul7TiCGkCAIjgn+8V7GNjBgApkooTCbKZ1XlRcqcBgHn+cG+MGZpzBCQ+r31Kdz0+rL2VfcB6lWM9QjUdNJLX1fxf1iVTdV/wbsQNtwCgJPmzBgBmSpysw5K4bn5xoytbN8EyYCZ9NZWdvFKrXK8VeCpKDB5MCYLZ2ZD36PsKACCi8FFhxlPKInirTY6/NmT/tehxCwDWlOQtAGgNjP67BVBah1zVncwIOEgWoy54FgHAHB/xzmWWx4yDy/qLJZbkej4AiHdhphfR67Kb38HpqwjIFN1Xvr2u232MMMdzSjKibgFAXdLSAgC7cYcZgK8ctvDoD34fPv7vfioAgItxD4MHq3IA4KFbw9HxPTwExJ0A3C/X8Phsg0He/fv3YLlawoOHD+H+vXuw32zg0cMHcLRewWZzRgDg5gF0Bw0AUlmQCCpM4EqgjrVxUUc9bQBwXKzg8PJnwVu+44Pwlq/9Oji//zKcrY5g15NmqAGAuHkb0D2eo56rA6gSP2KexBQzJPNvjA+PPtqsF06/+KoAYAYgR41zCwAW4/IWoJjcqAk6fW3Zntfi10wLIAS8fdQ5DwDM++98EEj4NgNwtTzo0qRrAGB4TSuCrlI0k8n3vAOAagfL+gfpSjyZDMAyB1wFAAzNZEqP9y0K5Nf1DQUJANJd2O6DfqN0Ap9hx3bT2kfKlqM70MduHKIk2ZNue1IAIAFTtG3JcsBZgOw5uw3A2Ebo2QAAW9pE8rwDaFsA35Tvi+o+Uz6ur6WMy5KX79q91FX+ZzwAyIJkycR0e6EzACcAcgyI5diIaDQBABRM2O7pZxj8KQKAPBJWV11mV045qyFVmhUtlzAIJR8cAA7+WwrnFgAsZrDyDnNZ/03IMNEKXXKf39OqatAagKRkx5xwNaW/i5v3zZcAm+lJB28OACgCfXZSgukrOlCtDEDqsicrDkIPQHxm7MFBAGT0pfDdJgMwp+s5u4epoIfKBIif0vsjwyXZf+zs+Euq+k44e3UzXf52gva47KObuh1XYCbCODcDUD7ezfUzKQMQud9lALpemnye3m4LR3tXAryBx3/w+/DXP/fTAJ/4S1jut9AdGADkzHKkGJ3Ft1jDCCtwIOD9l94EF7sBhsH1/XsJHj16DPvtBdx79RVYLlew3biTgBew3VzAOLqThUc4P3sAHbjef2eYAehKgLE8+dBrADA4+96dL/bIoZV9sgAgHerBesB1Zxr7JRzuvgpv/mffB5/zvm+Ex/dfhserNex7Vx7cwXKk/l+uHlqWAJOaFJFYkDLtDxEAOFNIlMSWA4gXDQAM87kFACMHGAWfBQAr/g+555fkv1YGoD+MIPjJPtqMOn5OBmBqpqb5X2XvsGX4pgCAtFHXelLh+1wW3zUDgHZzRflB2bYm8+ai/S/WbQryqvvHWdpFyj/NDEDtv+Ti2HggZHGSJkG4jhcYAFCVcCKaF0paywCgbsUlMwBb/tiTAwBpfWkDgB1zv+ay9yHaf6Ksaq8h4o5ycaWPyg39rf9OslsMQLDXcvgJ19a8ah0v2pLunBar95Aol/vbcuYcD9YAQFyBhu66DgDQvkKFkM96CbAlakDX/RfPOwCYnsLKzM2wVsMgNCJMagpavsiW/D4XAKDXGczYTClG2vOzJQWe8kvOZYu9TMoKLrcubDhZwdI1ZfVGPWBUEN1CDMxry+PTfFTiopoTV+ccP7fqKcJ1BzO4GZU5l3paoFHy5fk1/xpNV0nL2vfygzhubPpiZQAwUL9QKhLN6gzvNcOqU+/GIFlwIzbwZcNeZNACABjkz4fOxZJaAQAagBVjlw4wI6olY2F42WwlMXhsasynmnEvYS2TcdZEkG7hAJj8D5VPXj4+q8k+vzFZUlOionvM2HG2JfTSwZF/VS0DMOe7yQw5lNFKGw9VVtKUtctdUM2wzdhG63BJgMhRW8/vACOWytBeuvv+sL2A42ELn708wN/8+q/A3/3czwB88m9hNe4Bhh1eTzl3dBrw6ErxFisEABdLV/57B/bjArrlERwdn8K4JwcYMwfdqb8LZ8M6ODk+xkM+Hjz4NGw3j2EBe9hdPAToHPjnSoDd/weAkd6jTwSMAV7L3Fw3AFjzRZy8hRJgbDLuAMAeDndfgf5rvh7e+U3/DMbPeQ3Ojo9hcJ87KjoA000HIxnuVyT3GswMzZpzr6PLcZfn8IKQ5QIEyV/af7n8CIp3ZjaIZIUH6d1KEJ3JsEadpmyJCemMQpubQZxouMYhcSpAvAQJW/YzcRFkysaEDbgQX+fGxur7sko60wJDvcbbL/lZGlBGXZAOUZYAp9/eBACo+DPYoPLCtkr86i0kMtk5MwFAGz/pUzzZ44pclNjzFgO2eDo6mj7SqJ3CnFnh7PsjT1w3AJhfD/++nByonnFaGnO6W1CaJpuRkbLNyxBDnvLLACBXhwXPkSNQAf5V/Z7aolp/tao4fHtf9Ex8D0DyL+KPKQEO8ZCXXtRB8p3l9wV7ZfRezYdQoVdC3vRO24M67RKtfV4l/8Ehpeey7yffkvozJf3nBxsUeMobRLq6BzUFACzGH74SqcQtU0qA7bPtcJ/pEmA7cRlM8MSeHgAYg9+r6PAEAERn3TuWnMvS8tJLHGIEIiva9lRlk7LctD+NkuGWb9MK/vn9vPaK1gHEIHoVO0pxKR+GXdJAsuFhT4PURkj3nuCA5NwiAa14RZSnIqpq0SMC5zBzrZ8+AOhOnypwCTbBjbyck+d6pp3pGZUo42qBKCftF0u0Wrzd/v6aAEDL1OrFFe0yIQDhR0UAkD4hANBLTInnGofgUAKCRsh0C4E6AOjGoHtwleWEJLPdkzM2NVaaQ5VWSFDoFgCsc3kVAPR8wxyKbmipqir7mnYPwLYM1q+4SQCQbJIDAd0vBAB2+x2cDFt4C+zgE7/2y/D3P/uTAA8+lQCA6LBzw+5uiQAg9EdwfPIS7IcO9s5SLVbQu1ODnRJ1QLWnt/v7eH0EF+ePYBy3CAAu+xF2m0dwGM99BiABgIdx6Z1U2yJjmtfyNABAdlsoA3ABh+N70H/118O7vvX9sHvtNXh8fAzjooexWyB9UDegHc25/DIcYkVH/4aA5kpMNi9D4MYBQKPL7SrfAoB6sVtSYE1jkiHd4J2K+yNczdYoCi+5MQAwzjrfIzTKj+wRmTi74bCk6QJ2GQCwRr1qBo33gLS7pQEGyizO/HjQpAUApvxztZ6VqtxCEhyNgz8MIonyWdtlQIzs5CIo8mQBwOl8Uo4qIvBDT4vrOQUwSVxvRrA8famiNDaVUtUmIl6/VFa556l4bw0aonnxeGjtuURZzMK1NXMc7EtRo4WkNdYZgCX6RxpKDIavLsf46aFf9g0JQJUghokF00uUJHcI+RUHnoRoIDl0MvJ6YhnCxPLXxP7o5aCdaZ93f90GcD0BspYi2OLn4N9UMIVbAFCuzOQegERaTr++pPn2jqvZsfEAYFACMwEhq8CkqioxoSLBNQOArIJz755Dt8sCgDHFmMADAoyZqDnB9oo1VPeTFzNnrLcAoF/tgKWWqVdSv2y80+Q9eQcFfbUfyv7Lv/8qosXjK5UABw6r7q6JHWi18yz5s+LqzOBLmY0SZekJAoByGn7cUwBAvXL+5NQCO6ELbCKuCAAxH8QdUdRNtxmAVfm5DABoqsIrKdAm2Lr0rnl5CjcNAI4LttQL3EhfwgGOthfw5nEDf/Ur/wk+9TM/DnDxEJaDO5l3hME5oL43HWWYul0SBwCuEADcD0tYrk9huT6Bruthe7GFvu+hXy1h4UAv3CTq4Gi1hsePH8BhvID97hzWqw7G3Rnsdw9DCTBSZXQbNM7mPQcAoAP4uQQ4ZAAuABYnAF/99fCeb/9u2Lz2ufDoJAKAfGowZ9JTTzKRAZjskGmtnwAYVWkoeDHPSgbgBHtwCwAmYd6sFZ97KNHzBwBqnZxmsRowQAUPxlfxGftz/KwWAJgDDNRnUvad1qs02cpuH19nBiBmCOkR2wxA/HYygezk+FauWJIAoPAhw/NTXzivup4dAHBe3BVgnuDzy/i3BZgkiiC6jCG7kvGj1HPhqE+mSOdGX4mFAgBY8fkJNYhJKgGR83GrxJdx3d02Gr2TYyEJAlKCdXlM3Adb0ia80k+1Bn+5Cocig/sb5dtzGYA1BY0ZgAmr2xHR3468aUVNKT4s+Uvx2Ujxhn8huCIzjUYJMA6ttjYcheYpxHfWkqy6V3/wV6syVnOQWHldTkj1oJms0gHMuluGaa6UAZhwLmdgEVMQ4WyWQiDrZGCoJCCOtropqVfknFkjBXOykRBUa+0Q4vT0g6+zBHiqZ2WnVlKbtvxbA3NeyeFL+QlUHuTFH3duLgcAtvZzLGBDYwg8XSAEqsYkA9DdJedSpmKUvzjfvErIS6jq65BVTy3fxPKvfgjOjxI0sj80qhptcwpSKOxMk2v7omL5r7/wMmIl30H6ShgFT2r6hE9pEzoj3MxrLAxkcD7lqOo1qFN1Lz5RsAlRsQGgTtEfZv3SU3hjFxwrJaUSYD0ncleiLNm+f/FqXAlOoPb0f64BQFdeWu0S3Gx6IJPJszJY1b18SnoljVuuFTlEeZ1R2yXmO3L+hOXvufJKO7A1S6SfaB1QeUiEu1KWALvHWgBw3QEcbc/h1d0Z/NUv/xJ86t/9FHQXD6EfdtCNA/bUCTZWAYBrAHfgRbdGAPDQLWG3G+AwHGC5XMJqvYa+X+L9y9UKD/84e/wQNucPYBwu4Pioh3F/DtvNG9j/z+UQosPrAEAqTs6UAbct9JPMAHSjcfaZNbzTD64MGGAN8FVfB1/2ge+HM5cBeHoK42KJ36UAIE1XW9AK12TKwNtU4StY2ecZLBdw2pJFBizLBtI8uyEAdiSJ/JgNXpvBrcaRoY3xFj2hg4cVyoOJ43jzdKqVSqlQa9qP70gyOqavnjSJU++6FADYUj+1NW2QLj3AR7wsnAAeX5AG2InHpD6IG+j8sdGX6mPhm7F/NVO+aocQUsWB/kkyahMAsJxxF30K6T/HB+DejM8qNm9FXUr+hqFHYq91mXFtvG0elBEF9z7kTVH2Q32CQ6C79JeZ44XPVOQvf0giGqyy/9qKEOTBc/j2LKBR9nEvpzninHNVI5N9iGCI3MiJvjEDMP+UmLijaUYkZExBzkr87uN+9oO8C2vYQvKAz7ATcYMmL3ooJhalSQUQ0PTMTrRBIQZwT2nT0WUkxiuTtfQPUNTIZuiVJcMe4ZX6mXGUBABa2uc4TPpKVmYSC1htidFKHTIdJRI1Qwwn3mn869YatOSne9P/9ms1FZBQvoYmBpb3oyoh7rnrOHhAcnNpZ2Z21iFoThC9wQKZEoPi+vHoBWeQhAjB1Ke35t4tDULyViXZQqkEKos78FcHSNLuPWVi5H4q82tbFDJgLS4Sz7EGr3WqUnV3AZ+blvUxmVBVeYUgP1O0N2OX9phIKF2k2NuP1zN1OPQa8ElTeRbKgBF+3XBm2Z5lVsZ1D7Q4/mkAonbgsa2r502eR01C6iV47FKUS3xDjW+R0+r8xeayzNt5/IMtszfKZcloSoBYrvTajIGyq2flXQMgfkNBvSQ6J/pZwrALp9kBEC0jIp9TcqCtiOMoXI+tKj5SL7nNqY3EIc4A4VL/cwlwdJfkUxn8o8/CN0IY6bPIPxGAlHSOTk/sEUiBQS6oYHpS+dMV9Wsrw7/GoSF7VK1wtGfZjJ8gtUSzjGgxO9qCSWuX3d/Ef/kf+2hpw+Mq8mET3oVWAZMuEQkrplo7CPvkX6j5To8itbkt46bvVw4ilqhHF9M9yQKAoQTYnxbtAMCT3Tm8cvEQ/uwXfx4e/uIvQH/+CGB3AQtX7+F599DRc7vO5Qz2AB31AXS9/w4IgnHmHgUdy34By9URHjZyfHwKfQ+wOT+D3fkj2G/PMBOw7wcYh3MC/3Dn3wGAwg6obOSW50Rrfv0AYMUdc/bSZ+gHV+nQwbC+A/CFXwFf/s//FTx+7W3w+PQe7BeOZj1m/AadI/kmAQFLPKzlxV5VtQ+se0osRg5MRX74xMjyA5JDjZoWLV6QuJvm3uDFVnzLWgIAg0NRL/tCNDFldUhBbuxPucdf9OlLSq6lP2YsyCUuvdLb/SmotdeSvqu8ZQqAF4SkwOtTnuEHaUtq7ditHy4BYPJp9B0HrLEr/WSP6FAXq4PEwzc0T7QHhnYpwKf9vbkl5PxKGw1w5lH0jGRswzrN90flLRUpqJNqmqyv6v+2+kIQ3c6v5T/FW6MHKBcgLqf2C3lXOOgwf1Ms2PZrZA65mgXgS/2tNuepr677T2/omDko4NTOLw+s0qa8mwxfL508poHwrlh+SzKGh3pEEJqBSGUlKhnsxOfMR/EuxUpaYsgq4gUyoYkuavO/5Tkjz0lGbd2PydlvpSKyPjbRP0Sn6proL3BGoeLRGkA2Qf9r9aUBVHxzYYN9wqOzl3SvVgDA3B0tANB+nxuwVdR4TaFJvB1DFgCsOGBVBdQAAMmBkiCJZE4hoGKQOQBQy1dkIDYjVScr7NjmQMCrBac4vSuW/N4EAMgKhPSvD9TZ4nrVWBJ76U+S8PsgPlhS7fDXdhwdU+J/NS8sx/BsjBgALALQ6fNpPMRnYaTFydr7GQCsFr4ZkdL0sMa3kvxDl5Z6pPgHVR26huPoKFBOgMrL31xF2JpfS59TAiA7G6mClt/HdHCpRyz9fdN+71jeBAAYXJGugyHDW5Gy7Z57VjQSANAbz5LPKAFAyoaRPXdIvwW3J4xVGOGQL8TsyFfnndce8ST+jmS7LF7PCgAoed3aDzt+SZvyASZkb6OeIZcnZk+xjZ4DAMl1Ei6q70FTAgCjxEq/gH7XGxSsLjTP6XVW300KPHX2gcq4NKdUu2fbQ07wEBB/EIij6WoBcLq9gFcv3oCP/sd/D2/80n+A/uwxwP4Cuv0AHR5E1cHYudOD3bs9AAhLzADs1wTykfPs+v75GY0j9Ms1HJ/ch0W/wtN/zx+7zMIBhu0ZjIdzAQAOwX7EDfVnIQOwDP4RF8SMPg4gXKC7X54AvOvL4Mu+71/C2dveAWd3X4L9YgmHAACywY2yUJPryHHtHpQ10z/F1lQzeCdksNuWBlZXscyWxlIPj7zUXxIAxBUTL8jJh/X1k3E+bQCwGACyMrwqB0zhkvI1V317M4O8yiDelrSYqOHHsWxngUbzbBmP2ASS6LcIm4EKLj5E8ht60tUMeuVlZxaBDukreQhufNa/TQAOH0OE8KN17GeBFXQiivXLhA8pgCrhmorkFbb0rUXNXWdtiJcRAYKq+bfinwSw9bZcuHCB/xNbTt/oxBidbZnFHubSn5u0KQCQbDNlBOY0skwUClwb+UhtxAXPi57nAUAGnwi/YKZIY7X4/pKmiL5u4qsTBasJBlIGra5HAIxZgBYjbCbEuCnaWHxTKQM08H2dLxP5aqynlgErXKXMU6JJ1CWSRmYNEv1yeY1t9R3ygz3FOkOey78R4BYAVDyhMwCJuXMAoF2FuAQ3CQCmhqjtwLbcj5sGAG3movU1bY9C/p4d+GceAKwQmAxQLQP1FgCsGaAXCwCMhljPWRoUdrhjn8rrAgCDAyqsBTobQpVJV4XsehsAtOyflACLAEv4deG2WwCwrkBUhq9yQum+1B+I/FRzfiQAGEYgMqjYgbssABhdVuJ7XnudMRH5TwZu/LsOenz4mOyAagf2SQOABP65SNDNDPP24HR3Aa+eewDwF38R+vPHIQNwgSW5rnR4H4BDBwIC9HDoVrA8OoERTwheYPBJGQYU2IyHDk5OX4Z+6QDAHZw/egQr6GDYnL8wAKBuAeNadvSw744A3v5F8MXf9wOw+4IvgscOAHTA6aLHio0Qo4tYKfgPMkBJ/P80oLKXtJzrZhjt1q900QQAcMohWiUN0hwba5BbALBAwqtvsLf879b3Lf5r3f/kAcAisxcyDfUO3E0AgDVohEGXPB2fRQCQdJbuPZaBduRBFbwkCqhVHxbYyIJDzx4AqJSrAfNvFAD0cV22RzmOQySuoA3K+/9yu1sDgLQkYcnCX3qtp7VAiDKZckodAAxD5yJo/6gwLiW+GYAyzoIAtUQ9tN8vmfPJAYA+SstuEEUqyhLnli5u+RapGXY70OlT5RqmeMq8UTw7AKDYTQzOW0ZzPxsZgGVE+BYAVOKalC5rhcYqjhZafcfBqCjB4ijSAhXyjToDUGcQkb+rldSVMwAr8kbCaTIQxfU6xdgrfNGTIcC7RZ/qWckALLtY0zIAS+6XK0HLfVeWv3nqr5whxc+5bAZgoEhAYZ4+AMhzke6ANciasvMBwHRDoW7g5wOATFnWGZpBYslc6rxifqzNAPSKJ8dmN1UCLN+l3mvEKLYfkM660F9Z2dAAYOhakRGMXJ4wUk0CKTN6bIWVEePSDi5lTEinhfERyZvx/alDmTo8ep01CacE8FfLAKQMcR8oOhwQDnC638CbEAD8BXjDAICdBwAPCADikR6YBegAwBGWsDo6RRgR+wMjAChLeFxG4BpLgF0F7Pb8HLMKh83FMwoAWrtgs+lTu2EBQGc9h8UxwOd9Ibz7e/45DF/0Hji7/wpsHdTau8NTqASYnxR8g0obmSgKbf5oATAl0xzekVOw/OUEAJDKAMpvab6/aRBrPWbbG8y3GYBNAl/pghb/VR+ej7jFLbUKi8CkjRJh6bhLHycX7uZmU/bHS2wvfTICQEgKvLsdiyeb8+etlbL/+uxlABK9coczKIqLyicBV4iML+tT6Lgt/mW8lSR7Ta/f1TMAw0rGmDBkwSnoQ0VSaryeccoAoNWaqZ0Kz+MedjYDMAsAev4PAKCzd+wBST+FdC5qVxNgxAxAHw8mAYgsW3ebgpc/VZpmrbMmS/rEZgJae6tsqswIFWoEfb3EYM2zYNcOAHr/X8876pNqj1wPaJZmkB4QklKX1yBHdzokrpCg6W4Um+HSTUj0ZsWIPHUA0AF6OR+nVMJhARt1CoylYjMDizL8wo9B6cmg6AzAuCNbU6BeeP2D9YJEheme4E76CzLOFozNmVq4HCe0HbSW9/GkMwATt8ACcv6C4MhnBVSU+qjvtSjGU3/lWys1f+ng2iXADQK3DDUdAhLHbSuykQXC16mzLk/pJFXuU9O5wK9pINIgW+jsWuxBl+EpqmUHyvYwSshVUU5u2hEAJCLI8k02X/UmlnUX2ipLlcE2iVXimqDDgSCAUCkYY1rHWMqypb8uAbansLZ6mLSaaCt2MhmA/F3UbG0AsAmQmhKDnP6O2TqtEmBey7imev0OsAjpQERj6/xaADDQI7PW1wEA2hx+PuRArwMbCpssxG0fYkGIL6TVJksJlQmoKvrJHZAjATqkmGhrivbJeDe1HeewOgWPyH2f3xAQUp28vzYfP37xPj2+sm6LOk7b1cklwOw34Hi9J3Zw2vcAd4ctfPb+DH73x38Mtr/+G7A8ewQwbKBzymx0WW2Oz/d4nzvIAn0AWGLpL/YB7Fd44q9bi37RwcXFOQJdp6f3YDi4kmHsPgTLroP9xQYOww5gvIADbOAwbhxkhuuKtAgHATyNEmBJf6Kz1hdmfURJXchAHQc4rO4AvPp58Pnf+UFYf9XXwOund6Fbn8Chd2XT8eRg6XXVNpGFdm7VJCeWzfmrtZCllZGhrVHdfyN3sBQBlBMLWz6f/l77FFo/8/iEFjX+xC0AOI/ac6+uey/p06T+at87BQBUDnZm+BIKkH6OjI+UR1l5BvcAFRJq7Y+ZFG+QeOcQ/wlvbvbL8iWXlUVZNE9JNdJke5SZEuC56886LWbDEwE4uaBaAanaH+Wy9+Jzog9t9Q3bNkYcrC9bsbET4u+8Lo2f+tlmlB29t3iqqwPYiusfn5/vgRlpwHRGr54BGW7OpGJXom8EpEf6O3hYKqIlADCMz3ipon9tfD9zjo22zCGKicNW1gKegtUSYMmveL2fBo89XT/7Pvo72nP0Kv1j0wVqlexb+anFQy1/FMeV7YEafRWan+eHDCk5Ki3KdQOfrTXrCgCgeXhOZrA1jbtu1Hxvr7V4zzMDAEo0kxyfvINTBwBTa9HqAfhsAYDGYVbCnHMEXzwAMBHwihcTVGrhGgRjXOTUQilK0julB2DTotezDFAghcdiAbMUzTcBqwgQIgBIoBxeeXD9oGo/ZQMuFX7xCS5QrTlQuDa1K8o38yEVdAXNWwOAZGDtSda1nhn2bdcOAHojGVgyEDHjWJErJ4bk10L10jDr3ep5YU6lk/O97gzA9Hmaut70K5Dp6gCgCaEFayH11CFO3llCn8NLR+BHK0eZBgvXcAhICQDMSoQowQ087+U7OhpaXhU12HAWAXm7Ps5ZIBohNQz4FrhTDHYWwJFxwOkU9vSn+H6zQSTvtD0Myf8RHlfm3tQ9NXxgjmXDDFX/Undv6AHIOzXen+VsTbfeDgB8y+YR/N5P/CgMH/4wAYAHdwrwCDBQD0AGALHHH/YBpP8BAcAlAoBuYZZY7jvAftjBMAAslsdwenoXtptzcP0sx+0ODsMWDwGBZx4AzJli7egxfxArH3Duh9UpwL23wtve/71w8rX/E3z69A4clsfQrdZwcABgWIsoGzcFAKpj7TN+h+a/dGvKaK/i5ln0bXJ+X9PpmHHBLQBYqdG+vO84YwVa3tmcR+UAwJILXW+xMvWtIpgXfloArhMdXPY3MbOt1RPSDAsPaSqkCpYBIH7IiwAAj8BuiAAAIABJREFUegNUWi520pJNaL+VGGy7XUfvczNti8+prOelAcA4mXL4QO/Nn+rqM+yqACBNnNxpKyFR504DACO4mgKAvGFk9HgAAP27HX0zLVjSLDKfOehJpJ4a5EB6LAJ9MzziKTgrPpMyVRA7E88QfQMA2IhfniwAqA+hiwMnqsYkNE9lwybBRhdkD/1q4Y7m9HANAIyAc8Zflg/zfI6+6S0AKEMrl8FSAYBQAgQllZL0jv8TzQCUytRme+UcwecfALQZLVPdDm+eSIkXPJxnAQC0fazs/DAYDPralShyOE5X3gKATLECAIhrLxmg3jTX0v8mAECVmu3UjwIu5XwyYw89I2lOz1oGYE7WsmBWWBWtt2wG2LwS4NTZTDJQJMDnvhSyxSXAYUdPNg9/whmAkwDAkD0gHbpaAOX0Rf17yf9UguId4Qz4p671Q2gBgIk7bZzwUoCXAx9J/9Xmk5avVDMA/Ry0uTB2VfZsqx0C4jdugrbGxOsDgnyuBPjVs9fh937sRwB++zehP3uIWXkL9+yRS3joEBA6AdgCgC4DkDK5sUKiW8Ci72CxWMJm18HClb66ToGHEcbdFg6Dy/w7f8YBQOImG29JfnAndloA0K3nuDgCOH0LvPbt3w33v/4b4NN37sJhdQSHfgWHHmuAffuQJw8AWjlO5MPyvzJAef8tgn9MsfJBZO0grOVR3QKAtwBgjUfq1j0TmvraNKlXGeRg62D8tfCQFAAsvT16Ua6NQv6qWwDQro62dagtqwQWuuEWANQZgP4QEKrDZLqKDEA8fVeWmKfxe7BWwakmoAyv9CKSro8FAK1tsAtqUav4dw0ANBCisVo6E7BuYTiOoav0qcmJt9g8tCfh6AqgyDPVNDTe38wMwMTeTzCv4ZIMIF0FAKuHYJoX+8qzAAAW5PpKGYDsvNV0hg0QSwomMLjf8QmppZleDnKqtsm8YiiRDUX3ZABAsf5uHiojRQVcHBhpUG52CbBadB3M0PunlACnyoPnVy6/bHGmf8KVTwEuoG/+9aXduWjAWwFebh5eqUyYYinjZMKtXoE3TgFuPKi2PjRz0xbflBzUAUB9MrQtAUYDVGwiQPLRHF/LA3OZKpWfWhNzHF+VfbgJPpnSOGKSBy69U0NUgEGJt/ilIkPMz8EqyJQ+hiBG52in8+D1iwQqQnjHbxTU8+MVRKFf4zvTlHdNwGoJsLG3SEUzHf0nPZt3IVsZfykb6Lm6p80HAKmLZvgR68sObPxWAuhp+a+jYyzp0TPVQbfXja0d7ClKxABKWPLP91nfjHVm+N7zuHpPTV/GtdJDywuZdD5atj0kAmRPvcsTIueAKQDQXyC5JPUfPA8WaW3WUZUohhHQ3f5SyS9J8G/mZx1Wt8vqfnjjJjzL621H09PNGbzy6HX4vR/9PwB+97eg3zyG7uCO9jgADH67wp0CjK3ClwDdyvf9cz3tjkIJMHQ9nJ7cgbPzcywtOj4+wWsfvvEATu+cwmHcAwx7GPcu++8CQUBVAuz7F4WsBLPBOYV9r9JjKG7uxVDDvlMlLB/GkAFE/Eh6foAVwPGb4K3/9APwyjd/M3zqzj0EAIfFEmDZBx+OT0zkk5OD16TY3wqdlQ2jTy24oJsMJ9DDfACQgkT7o/X+VQDAmoH1FBKXJKe4c7kb66ZMCbB8A2fIyvnUbHyrpDo5BnEK04prWu5Ls8dJ3UGZOZr5l1fdo8zj5mQAOvl0KqJOo3LsUcycMj5LYouUAbT+SzwALajsIhHqPdB4GKXbpUeZWxn0jiunAMuNXr4/fwrw/HVP9EHQEaRLeW55/GOCzPsNWh1fZDihmAEonJgCA4UDHksMZux/fg0KtPNymT2FV2TCpSCw9kltj3HtG8i+9I4vF14d0SFd+KNs6kglwAj+xbYtscZCziV6tbSWMUtOjjC1Tsy1JB0l8Du8SS6wABrpe7Y86QLxJ8r39g+VWA1vIGdXSQyen6f9qdSXvUwGIL8mx2aJJBh97vgnLy35DMCmPTGEUPKZ3QyM+tXG+pihjdp5mhVAXjcZgMiiQZEavMt998oP/dqsOeFwK+OxD2sOnQFAM9BiCbCJnuJYmJByBO7ttqdWqlqD8nY7+MiT9CwkPY5Psph9T8rEQjUisSIN0n41CA1IIkXJ848pGWC/tNgF+/IGpnoIxqTHNtiHIu7sT7yzZqKtgGp6p2/Xz5qJbybjtPx+dXoZI6D4I3BiBLxMSWcMDKjHhEhx8nlmTB9Jp5KKIx4qqcBQIFFc4kbJBvfHKriY0wAlrd55TNjjypcFB/kJ4BDznOxwFlShkWehHZPV53fHMVhALmaT0c2KmliCLh9aNrh8d+x9wCUBmvja4bHjmyCwWX4q33fVDYa0iZx5lyp7dbpQrplP0a9soiyc/CCJfK6tz6DVjlzU2bgeRm6k1EluCBI0Iwi0GWg0Nj8afKDR90Y2gvPnrbZ1bujvgr7MymnZPqGNEyWuVE2vn93OMLL8GWseAneKSywA2JIIpqcnh+/xGHmoCVCZtdOzSzMIrSTkesxwUOH+5Q2mkUvMDwQAvvnh6/BbP/rDAL/vAMAz6A4DAYBObVP3P9++wIF/PgOwW8HRyV24uBigXx7BXXfa7X6EzXYD47iHvl/AcrlEn2Qc6MThYbeB/e4M+n4P43CGvQbhsI+dh1yEwxubGQCwSb+mSqnZf+9/4cy5VyytQI88HIMlfg1+ygd/da7FbAf7wTVAfBVeet83wWe//7vgwcuvwrhcw/YA0B+tYwagkA01KtFTifRryd/I2bPK/Cb4XS6rsfbDYKW2EuW/msuhLmjZB72BmHt2S/4lCUKwLfS1VH+Txm5KQKdkHE96buGiST2wZ+j/q4wlS//J4R/dLeU5BT94Q1hImwMeSoP2SjcPMtDKp6SZE07mbNMEoVLjnfO+EoXLq1YFOCYsdot10oyo9KH5GEdJXriJ5CXqON4U0X4Y+UPBFXJ3J8kzrclhdJwcYqHv8mMsLZEbZv6UP3rMpB7cpXHGzX3PqSLdMQ7IHlriX5t5qBvMArqDs7oeU8AKAX8IDYJ+/v80a0M/TyUpmK+kP2Yy5snfiODvlDWTh+QEok6WH/a/I69prosVJEGjeP8xxHYCAWvzcYvnDHfhoSLpU927iTuJv6oaJYkt+B0EAJJ8+v9zD2oJODNyeKzryyznEbNsJbCKuhU3aDLCo+RCrI27VMxXAbX0wCQBYxYAaMGQ3HLJa3IGKLlnBgDIQQAHQTZYomdbguUAQBlWCWXgAUBZdnc9AKBYJBVgeTijxaFFE+0itmcBAKxoeF/KVOIVXLHC/Mn41gHA5LlKubodvHlKxV5tef46AUAywDkniJVOGpAHAMrvMrUBwIoV9eXtldWjQLKYZn11AHCu+yYBwJgF6J+CxKGdOgqzc9kVltkirVNOSdfGluTKXTi6Wj/PnnraSvm24I6lTwoAznOYJf/isxtOFl9zNSmq3x0oJvgRlxK/kBQQdaphB9s5ZQy8UsalthO6RCNkpKqd7UjDJAMtZ1Iq00kBQLE+6EPKQwQKvCe7Avj387haAfkUHpbXoAMrh2gUZv196fjl/Pmx8hk5ALDsolFJDekgn092zQBBXR7zDibzlwOfLQDYHw5w54IAwN/80A/D4SO/Bf3WZQASBAYjzYdOAHZ6au17/y3h0K3g9M7LMB562GwPsN86IHAF/XKBAOB+u4F+1cN6fYStTYY9ZQDu9+cIAA67MzwMpO/GWNrt5OfGAcCaBXGzdmXOKyx15kPfXDm0K4seD9vEZ9MA4AL24wLg6D7c+dqvg9e+83vh0atvgXF9DBunAxwg2rsy6YoeVABgrScw27O8f3gZHVgDsKZtgF3mrSEca8JHqT1Lg6zSCLLyfZXhoj3SDtuNA4BXdRCvOt/G/TnvsHbLLACwAkQEs1c7xOJKAI13Pq6SvXDDtMcRznVQzZha+EALAMy/vswV0T8kEDD0wFcAX/SMefP0UhO9hgqJ1qF2Lfq1WEDPL+evRAprv9E+WQKAkf7kPyHygv87uy4xCMYqlJNVkTvLD3L+AQBULnEtfnH+ix5Pi15G+1d72LHfreaLPY3jJ3X+nqvdUtskM/gkHhRIVAGYc/ZLJnsRAMgbePUoeQpdMaQRG4L0fr1+1ouRPajDO+yGpv+C2FB70xKDY/6RY32OAUBmMptRkVmKED2FfQ9/kSa+c4awJZtQlrcAYIu1GwDKLQBYJOAtANgqP8nBGdwDg/hOHdOeAIC8u10DyeYBgFJhMxirz2i9BQBbGsN+HwFA0s/4Ny9ZkkAT1xJP6Q0n3dFupNwhDQZWZD5RRqZco7oTMtf/vykAcC5N4/X1+T3LACACZXiSbXRqbA/BqwIE1w4Ajge4ywDgj/4wjAgAugxAXwLMACBqLrd5RxmAsFjCoj+CEVawProLACvYbvewWvUBANxsqRS475ewcn3xsH5vgGF3AV23hd328TMFAFL1+wIWizUsllS+3DkwEEHdEWDcQdft1EFV+2Ef3GLCgxxM6Ep978D6H/+P8M7v/Rfw6E2fDcPJHdgsFjC4k5LXS9NIw0jLLQBYVB/XDQBmwuaq6rL69brlu6U35x460XredX8/N0S+BQCvdwVeGACQtarwhSj+8P7QZSb6GQgAcnIBc1kE2GhTj0BA0moRUHS/iY2N5xAAzEVQLyYAGPWHW8d2hURdQyu6YS6NrZCpV6FkAUBmrhwfZQDAwIuidQ3Psnvlh359cowTA7XyLTJ4m5wBiNBo7BjDIVpOlVs9RSUUtQBfLGgQSw4N/YzC7TyIGCCWAUA5uvz7SQH4XRh/ud6pfhEyAKur5Wsg8/SRiH1+reNOlQ5oK26mLfl6LjMAmaYOkJYT4F5AWOxvekCQHPjEfs6Pqqd4XTkD0JbI28CLobG8vuBU7akuWyhJxsMLyHsJp28G2fYZgNhTo97jkN7bAgCl+jTX4vs1/0/LAKzNWMuKpdyLnQEoVgPJ0PkSkYJ+9QaQQECilOuoyRYhOLdoXGjtHACo16hsP2qcUVrBKgDoRuA2RAIgYe2PtVW6f8dUOdHXPWUA0LQ4SOwf0qJkPw+4Y6qKwq85Q+gqAKDjtIV37McFAdD9MMJL2w286cGn4Dd/9IdhCACg37jAHWDevHDM6DLjVgALl+l3DAdYYR9A95nD95bLDjabcxjGPSyXCwIDhwMsuxUs+xUeOrJ3PQAPFzDsz2DcnWFmXTjc5alkAHr/CnW0y9A7gn55Cn1/7PsoOfBviycjw2GjAECX1Sgz4xAA7BxAegzL9/wjePf3/Ut49Oa3wvb0HmzXa9i50moHki58L8DE1PixeH1CD5f8pnkv7+9dTvLQMpieefJJz2sGoA1qat53yzO/BQDrvDU9uqHn3AKAl5fVfAxytee1MtgulwHIPmkqXdkMwEILK76bo+HZ2/HPNQDoPXdzCITFFyKFfXwVDv8gv596/rGnyCBg1GohA9N7pYwJlDCLZzEDsKTDaS4awOKWCkyB5y8DUPjgVwQAiT56pW1P/nwDhsg/RQAwxLuaQ23JM4+BZxUSJPwH3Ss/9BtVADAtGau3ncSH8ZiKx3CbQEdcb9Vtjvnk5RrwkHdXHuoHyNlDkQC6ByBOJdsDUAb9ZReHhV11AZxZAhwzVlJD5ObeqZKyqxmr+Xe33DvqedVqWTWnBNgGkDTmCeOYPzm8QwLaxA/X9y40KdUyjFTWKP4lAFDDT9JV5N/9vyUJvw4AsNLj0ZvIIuXnAYAx8y/uWoYVYnXmm/NSv6kpAGD9kBK71vZkbqkHeJpi84BHVdWwl2TMjAHIPcmWWDzbJcApHJtWn5uA3SsPkiXfk01sJjkgJII81BLgaQKA7hQStpEIXzd23q0Bn8staB+Fzkp6khkWtxkxc0uArQXmA2TScfuwo9ahgPNBhfxcNeMv9S8uA/OyxYm9ltw6urLW5TDCK/sdrD/+Mfj9n/63AH/8u5QByHMJgCaiY5QB6EHAfnUCCwb/sC+goxH1yRuGLYzjAMtVD7vNDvrFGu6e3EFA++L8Eez3lP1HPQB3zwAA6PoHOf9khdl//fIuZjjioWfu4BIc5xYO4wUClqhJDwcqa5Z2d9HB6A77WKwA3vr58AXf/69g/e4vg9fXJ7BZr2Hfu0aAiwAAhp5Xyi8QVSLcvN18X5KrazT3WREI5c5zBXvS9dInyN8wNwNQqQvh39e87UlDZVvZKMm9dvl/zkuAaxkqTneXm9xzmn3ZnyU7VTlo4AUoAW7583MT49JDQDT3twA/Kyt117Ek39H/px57UTqlL4TLq17Y7olrLo8lxnOEXFz7dEqARcSfnALre0rzwqt+pjKuClZKnBlAPZVlWyZuecG7vrQfV9bLUwHAuKK5mEQuRt6/Sfg02+ap3uPRe3CZtmv0/nbY07ZPNbay+o3fp+LK2SXA8Y2xwqs8CqJjlCJrH9138rPQ0qZEIFWqTz0Iy3TU9HN/tXoecoIEz2gCABgzkFLALCXMlQDAHJ0LIGJY7JjvUdjZrbGhDcC4Z5wI4osAYFvjUfB2tQzAZwsAzDgLCr2z0aRJ6zQkkwKbo2auB2BqsMsODD2z9X19HZ8mAJjSh0+VNSdNUd26mIg0VNUIWxwcktIhBK0VEWo10a5K3ywHUgCAvidYyLEPKpL6dOBpXQEArPNA65RiRZWAxuhZRcpHrdTWDhOuaG6gtA3o8w8ASlozpVOZpmxzysjiZXL/Uq8x1ufyVD/+rE7DthOj17GVAeiPIUZxfSIAoMmQbwXQNwMA5nSwdx9DFu00/dMa/wSpMiJ9OQDQ2hb3FNf/b7kf4dX9DvqPfRT+v5/+MYA/+Qj0u3Nyh30/Q+ZJAmcdAOgOsliBAwD7/ghLgt3pwO4AkEXvQDT3dAcC7qDve9htd7CAJRyt1vDy/Xvw6U//PZw9/hR0sIVl5w4AkRmA1OMxtkqIsuDm0C5xaVE0Rz+SKer9t4bl+g4s+jtYCuwY3/UzhHGDJxa7zMUaANj1PQzOB+uXAPffDG/9jg/Cq1/1tfDG3ZfgbL2GYekI7wBA1wfQu7dBaKNsk7wZWTe+WdYHuZr7UCee7zE0V8e0ViR+P8E+mIDDPlsCIEH7ZgYcA1KjD2vmN2PfWiW51y7/VwEAp6JDrTSwyoK2VvAWAJwuDXn5rgv41CXmZz9bACCanIK9S4U4VthMpOm1ZADaHi96Pa4gOj7688dciyw91cZHARZSWRF98hWHYbVjBZG/UB9qonvKEkAzDwB0bwodzPwhDugOhJ/WJvIVAMAJ9rFeQdXio5Z2a5hPs8FxMwBgHchM4quEZ+QcqQd09YnXAABKqlnt5jIA1fftDMCnDACiBBhGEMCBygBsZFOlWJAVjlsAsOmxVjWyYXaMyj3DZSzp9QCAtRGXAYOWalIqXshMa8dw6nPZ1JR2gyTLx1IhBjD4xCn2oK8CANZL8ALmlfWeVHJRduq1M5gumwEoR8wlwLREFgDMzc0owOoEc12gLfjnHQye/VyPscUwVRCwbUCffwCQHcS8LDN/ISX8oQzceoKXQgKAZAC93g/gUzkIaLFHa/lw+8cLsNxMuAUAXwQAUOiX7gD9CLAeDvDKbgvwZ38Cf/iTPwrw5/8V+r0EAOmADswDdWDYYgWHxRo6WCsAcOfO9xgPsFj0BAIiU7sMuR2M4wH6bgnHR0fQwwG228ew3TxAALDzpbW4eaZOKZS+Tvz95gDABYzQY/bfanUHusUpwGEJw+DmvUfwbwGuB+AGoKOsP/cz7Ha+tYUjD0nuiADgCmB9B47e9y3wjm/8Nrh4y+fApxcdHI5df8AF9N0CD2ThDEASOQEAsn2w5b+mRN3K820GYKTIXAAwia1zytLYt+cPAGzBt9Y3a1kM/X3Lwt8CgPPomcr3iw4A5jar86DQEwcAnWioQyr0IW8Y+l9pA4a9wxBpipY/9BklvsmXpFsZ8pN4udxIizRWJdihRUiITi4FAIbQwvdw0yHGLQBoV+x6MwDzRboBHzAIO8UhUsvILEraBJaAVmI9rgAAEj/HJ8b4R9hwCwC+/EMfrlowDXjUmY2Fgx8oT+8rqWmPs+e/9itrB6jfwwaWTWVJYwjChLdNBQDt8FpGn66PoEQUYYnA0jzqfcpuNgPwEtr1CQKAtr+AI5dFsNvmv+VClZ9g+ZmWy9KsxQt1cKFUIifBAhRsP8xQAhxADP7SGrGWPExJ0W70INPVhVlCZuVbAfjtFQyNFHw2F83MG3D/LwNA9A2VWXIAmQlh/EecUVlbQ+9EJMCev8efQJubBct3XffV+UeXtKVP0gnm6fc3DgDO9tD0fGUfrPRRXFIhXaA4x1iw4vv+hRJg2weQJYgPCREno1b24/KQY2Y1K0to14flmm9plgC31EtDfGyP3FYGje052sazywNk+xefoXUUS3B+Yy64WOprB37N+Um1r74/de/s8+s2Uq7fcjwgAPjqdgPjf/tj+MMf/xDAxz8K/f7Cn2ZMGzeYn+xLRxwA6LLk3GnASyyVPYb9/gB7lynQuQy6HrXdwmW4LTrYPHoI3WoFx+tjWC97OCDgt4Hd7jHsNg8RWMNTgL194FMKYyFJ4DwkY4sf2rTO7FAc3Azp9N8AAHYncDi4/oUj9fw7bPEAkA420HWuBJjGtXfgKepuAkjdf0ixvofD+g7Al34NvOf93wvbt70d/s75TicrOCx7WC5c7q/P/g3WgS2FB5vxyZoHiTfLPmPV32gLB1vtom3M0f+qHK5fVuNf0VO4sNDSP8EnFTak0rCZgvd6w6CU8nyqdonvZgHWzQx6d8jMnCbRuZWxMYQcecn3NGtStR91CazJL5XItU6yna7f2IrKEc02/8l0LhGDtJXS5CtaG/qTRdy/8bozAHM0j5OrxTZe9zl7KYQzasKU6fi7OuQhSDspQ6w+g5R/NT9Y6Ur93Zb/rO2dzVizJZxkc1htG1+VYw5WhJn+4bYHY9iUIqNGJfkzSoBteSnao3AoWgv8Y9qnNLqOEmCiUk3/TRHDMg8HMlcekyshZwDQ3d8qiS3ZM5oZty/L6yis4GkAgIn9lBmAPg62XBamq04hzhEhxY6SeC/ZYNNz6V76of9SlaDoABGzxYszt5kJTdlRqAkD+2ZShKXBoc8lA9UUIhGQBEgKuJwHNYnXKcImYAglA9PcNENuc6gDi5B2SuVSWwBQ9/DiHoBlI9rwb/0OSFnCWkJY3bHlDMCKFUX1URx+uydFy0AnZT8NnZQraZUrnQYELT6oOzilAMTyOfcjiMO3hi1YLRHQTDkEY0KRdGmKKG71AMN+K3dnWpSTipBK6Fja07nHtHhy6DEEzhwwkOfX8kji+NnQaY+6zn/sSpVo1ArA6L4qyCdOSJ1ibuU1Vr/m7o9GMPNtNeOark9nHh0GfL/riScOxXAUkzqLDoGQT7IrEv9GdvRjooNB7I8AAMNBDC0Hsk7Vln5MRiA2ud2byz3y+M76+Ajga/1Muaaw+tneMPLahn6T5fmYoZterz/x/DEhO9ONotpDyJNOcwzeVSAY3+D/DTxUk18ar7vCAYBHrgR4cw5v/M5/gb/4uZ8B+NtPQL/fCgAwlqTTbw7YO4K+P4FFdwTjocfeee6ZGLv5noB9v4bV8gifQycjD7DqAcbhHPvouR6A7hAQBwDGEmAnS6JXbFBW0XNKekJaykxu08A0XWAbBgf+uf5/DtB0wKYDOMfRH+rjDu5wpcrdHg4HAgA5E4QAQMp0d857PzqQs4Ox62C/PAZ4+7vhnf/0/XDnq98Lf3+8hkfLDg6rFSw7lwVoexY5OrocSVq//KrXt1CUv5jQJuqykgRO8T8SG+kfpjzTAgu29Edrg6EOAPt+WJjFrPU5673gL/Fg/ThH/+9cALClyRJ9WjlkhRe9LL2XAQAzXFRyArKOLVqpMA1rP3L+Z83HsD3+9CEgnrdnoHTZgJpHG9a0vEozXoUPYci+KD8N09Xy/6v81Aywpd+Rf1IVPs74n62ed6nHUpuB5iXUcWqDrEMboh0hobN4w9QLSs5fimBg+i50ySv+QdS6DR+mNEVcH3kvGaOosdM4IK9LfeCgfGW6N+nhlvi08h3S9yc6Wv8r0p/oRfaDaYcTmtGWKqU5t8UiQkywPwUHFectseFCD8B2CmZzh6HIwPmN4Xg5DV3b51YPzcAt5EJVG4DhJbYC3Yy2VsFG6x/5E5+HAK+dQ0SprL7SVXA24cFvhBY8F/QfTQGaHD7NT8/Abng0AUAKmNkpZycqz3yBHVkKfXZMTYfXD0HwbzZBk1zkXF+XlOPiCPQpKFaArh8ATHxG3NGvaDzDslcGABsGtCUABf0RHZhaDxXH7Y0NVlyB4hjrCo5vq/tf00Cw4OM0Auo8AFgycBmjaZZ+iu84nUb2fXUIvj26qvuEWqG5g2p2iFjhIcUavJm8XSn0GHijI4kqiWbk/sFEa19CphzuSYAJvTnwl3eQ4saAMHqTM2JTWhINKk22bc8qyzvkwahTUusrpr+V2Xf5+7zslNZpKgCofLgo0/ixC/TlngwDc/zOJONLgEjewZaxpwQAE91LrxMbPG0HqkbPID91/1Z5AyzLYcxVGrbHZzP85qx/+1rOVJtEhcxFcvzCCWZI1xMhshdfL/2Nuv6uZsD4pdbs26CpdKqbGQ7x1D/Hd6vxAMe7PbyyOYN/+PAvw8d/4ecAPvn3sPCgFgGFPnBA79Rt4C2x71/fHcMwOOBs6bN2nF5YYHnw0fF96GAF4wBweufU8/Aehv057LeP4fzs0wgEYglw507WdSW19C4CBHijgXlfLBXuSJd/8uotpxB8YMPgX+fnhQebrGAcezy9mFbTpTe6XoUOANwCeADQfccAIPoNowNVHcpJd236NcBLnwWf9Y3fDG/+xm+C119+CR6uexjWa58BaMA87AdLGZRTRVRSws0SM9KK5l3ya46GbH8Ylm+9AAAgAElEQVTzCrSoP2xmQK2Nb0N/XB0AZBDJ5E56muQy9tD+huy/y1C+rZn4iqb857p4+JvdOF18M32E04JupfDVVPQGSG79Wz2VFX9mDvlIAcDJCD55ORkgQMZbGQ2iZvhcAYCoYmo9udoecq1Ci/SOsT7NDbXpvE9X6jHaDPlUu2tuX6B+5FXV33lv2n+f56M6oNn2TVP9pOklD0Eg10321I9+Ak/BalrqfRu5NgFgZMmkfD7r1eAPWN+Etza0bYmAItEr4g2emg3ASa++5h+am+5p3crAK8mjoyuOyC95fh0ntC+YAELWOLoG4Mv2OVHfRx7l34rmOXJufgg+Q3p+IMoSkwE/TbyCOVA8jlyxBIswS6EAZNhTTBpRhtkQwF+b/xMAAPWCWIaTBMitwmUBwPiehpI2DtItAKhX4XkGAI3sZIV8yg68vLEFaL14AGDd/a3vgDxhAFB6n503hF6p5gFAzs2JK9zqMaR4QRmQ1AEge1xDMeu6CSn/GQsAegdKAoAuIPM1SyFzJNkx9TSl6C24Q6wLYkZt6rBSQC+d3baDWnVeGCQWItQK4NChVUnoNR55/gHA6OCTMxmLs3M7tMa5DQBvWcaaAEDidF0vADhiuS1tQKyGA5zsdvDS4wfw8f/08/APv/JLAA/egMWestrc/2w/qHwEYLU+QoAMwT+X7YYB2QJ9Pvf7CGs4OX0J1utTv1t9gPV6idlz280jBAC324cw7M4AXDktRAAQgT+XMVjzsi8NAGbWBHWhy2Ds8cCP1ZoONYFuCcN+hBHfNcLC6W7s+7d3kJ+nDQXie6SVH/MImAGIaBIAbF2p9J1X4eg9/wje9oHvhM3nfS48PDqC4WhNJdJ+cyeOzIF3lAGY+KW8cVmZ/y0ASBmVrDLlijNLtQBA5r0rZWpVlHBT/p82AKgYT+v6ALDMsB/KP3kCAKCVG+stkg9Ts5L1755qBuBzAQC24GkDABqAsdUx4+kCgLYCJkAlgWmuBgCmFTbTAUC3eeTGI0F/HQOQbFgA0AtE2CBh8ZgPAHLsyhwQ9EVIqkg3JHIZZjkJvAUAaWnTHpBzdJlP3vBsiz6bzDKV4J8PO1KAWutPac+eEAD4/1Y1TAREiNno4pxQxGw9a6RqRRY3AgCqGWmSawBQIgr0+7QSYK8YZuwdMk2wr0/xJw0GP7MzAO36zBHOQPFZN10OAGzBBPUVT9go0yOvniWpJE5plBrEoQ2KHiOJULyiNINWT0bOeOH7r5QBqAbhR+gVbhkAFORwwcyMU/+0O3ILACY8MDcD0IBvGBy6EmCRoYTZQaFzlN/eUlGGd8xCtqcpUgnX5qKStASYSiou95O6q21A/DMVAHR6KO7oliJGyjjEFfW+RmsDp9XDLgUe9HrrkfjvwrZ4vTwUNUJHW/r92MHRMMLpdgsvPXodPvrzPw2f/vCvAjx+AIvBHWxBP2Rf6K3OWTw6PoHBVfQ6oMuDZwQAUjYgA4Cnp/egX/Tw8NEDOD5ewWIxwMX5AwQA8TTd8RwGLAfeuKM0Ag2bPdOuAgAmokMZdy5b0QF/y9UxLPojGAZ3+J0rXXby51Z08Ad/DHAA9z/pVif7EgB0m5OLkTLwMDsQVnCAU4DP/x/gte/6ANz7yq+ET63XsDs6xpOAvfMWLBeeBn8gQDUFAP3K3yAAGAO4PL/n9If0eAJ5n+MMwAAA5lTs5VVveFqzBLHSIuNSGYDsFpEE+3HIEN34YonjFuU/bF89owBgq0KATe1llxEB9gZ6WPJ73TsDJe0AWLBaA5OHJGVdgDQes5fdbAag5a/cIOcAgKke0gCgt1FRugS8dRMZgLkedul8lHTNygDUAA2KruEJdWiCb1FCmASXrkmfwACAZNBV+GYTanQGYLvkVK4w58vrHo5ikzRMJk6qDgDG66YBgF7ZlYTwitl/ufXQ2pM3jeOnuRLgkpiX7Ktg7ysDgDL/DlEhU3KrzEXCf7Iyg0Yl+ZG4rVZifQ0ZgC//m99qqUlh5FhgIwCIp9MxLOgpHgXW1uynCqwJAEowxPcEIMebn6UVRuLwk4YOP/6cuPC3DQDIQY+CnjbRlwBenHvWfiQftgyK6xlga2b1O2b3ACzFWryqjZTkELMXJtjsAXilEmC3FDl6+ME0qxta+WsZfpxdAjxt5S9zVTD/lTVMAUvNYy3hTgA61vk4YNeHqUxrfBP2XSrP7uYAQFSX+G7spJUtAfaaKTiE1wgATlrQuryTA/18lwCT/JcZ1OrXaNA807gMwAAApuUNuqSCHTOmK5dIxLekvBijAfpNv+OqmSl25kmPDcMnLQCQgyrvDTSLF69aApw0MVb25/IlwMzbRPFoq6O9T6M01hXsUkf9V+AvNI3tmpoid7Jvr9ZIKzPmmZy4uytdbzp3jev/d7wf4M52Ayd/9zfwxz/9Idj8we8A7M6gx5JcdlpYXrwuCoBgj9lqy5UrB3YAHx0Ocnr3TbAfqK/e8ckxbLcXsNudwebiIcDBZfttEfQbhzM8DGQcLrCklrP/7LiT9W4YiHIJcM74RgDQZQAul8cIBI7utGOX+YpgjMuYdKCfA0Xdv14H4jqOcBhcViCDglQGzEDJCEtYLO/D7uW3wEv/y/vgHd/8rfCpO/fh/OgYxpUrl/aZfgeAHh+8gMGVVLvTgQt2vbYBELR3McKQAaGmNN2S6ie7HrUNtBYAg89C9i9xeLtJfLsHoM4AtPoylwHoEjaxBHhCgFjW15MMbLEHGT2X/b90AdFuiVLr1kamHo3QXX4DgL/XeHLJ/tP9yB1maDP2JylL2ACcVy0B9gNLoM3Ai2bDbG4EtJDxmNv/u4T+kbdYzrfftTOiajNoxWuc/1VUEEkJ8DSujlYzymf5HaY4P7wC7ZM/bCq+V1KsEwcn5Ti8vbq652A6u1oTIvf0ATeD/H2hv18c41UzAC02UQYAuX9s/DfR6EGfEV3IduXaS3j5Zv8iuwngXYKK/9IEADPMFClHL4/+JI1ZAmju2tYhGe2ECc2Xc3tcWjwm5UITQZiU1lpPQL6z7v+1Zbwsswe3s6msb4IX5W5mkjXsY5DfYpBSky6fv5oBJOWQupf/zW83VDCzkWd6HrT/FwFAP0B+UJiftyZ6/Ho5rhUAzJT7YDNpP2MKH7UCxL8CBaj59HQAUNJmimpvMdstAKioGHZibLDImrVc/+7Va7X9d27F5mcATln3qgqpPqDVU0WPN+WvlnBXATr2kFUQr4drHefEoQ1gul8R2d+oqJkn0jT0GL0FACdSLBWvytqGALYYXzKgWl5IY77FjhYBn6ifRb+oyI/e3oSAgzP/3L8RRLEZYnUAkJ4peV7r/8tQUWaYuqbyKSAutZdzEGolwFre2wDcMwsA+kkHn8CbVTrVWuqpaLRD9p9Yhpb+cw7YZX9o7UtZfjRy5BX8NW3ggnCW3wCh/n87uLfdQv/XfwH/9Sc/BLs//QOAgQFAB+K5N1JPOvf7wp1sizGEy1Qj72TZr0MGnQMAj05eQQDQ9XYahwFW6w7GcYun/rpy374b8PCPHWYCXrhCWQLWCoHFtQKAlvA8PywBdgebuP9dee4Ke9UM6Cy79WIAMK4dngzsNMLo+gIOETzCA09830BHu8Ud2J+8BP2Xfjm845u+Fbp3fTE8PDmBYbWAoY/r0WN37AUMHQOAuZ3IunwFLi3G3hwgpxeQjFteTzm11TKgZb+fFQBQ6jgLAMo5WEuh/g7R6nTHIMfnrNPpKXkQ4/IAoNVdsoeck00VXjU3x7S9cvZwujYrAoBBVdlDcSY+u9CDEimZAQDnlABLf9WNH6dbYfKc/mc2Qd1p7pXX0+awviZ9Xp4/iFKteO2mAUA+FKCSBZRUYcQxRwDBr3u4NspXPDld80agawukqNQYs/yVOrC64Qyo6wW1zXyeLgAo9ZDnEwECCg8hK1h0d10Gaxsw7RJg5tH4er1uDABGOzUfAJyui1GUZ1bU1ADAXPVHon+a/FdJT7iEvdHavQ0A1jVuTffQ2lGP0tLPcwEASgXMzBSZ6roBQFniG/pIealAg6N2gr2yvAUAKyxWN9DXngGoLDQbs8gvsalry5kJoSdbv2DSa3c+SQBQBcet6RS+v2kAkPU568oE4BPyFKRbOGU3mgF4CwA+9UNArpIBGAFALtXggDw6W/pUNcqEorCBQMA2AMiCE4E/6ZBeFQC0AQXan0pAgw5YpQfgiwQASv3Gv1NPMRNEB912iZ6MVwEAfbCRd3GJBzmTiIyHXlgsZnXZZQCwctl/uz3c325g8yd/BH/ykz8C8Dcfg254BAsEt9yi99B1S/x90RH4h6XRCAA6R889y/X3W8FycQzQHUG3ugfgMgK7BYzDHk5OV7Dfn8Nm8xBLfheww//3+zMY9xdwGOlQjVJUfX0AoDVIGI7jHLkM2AF/7gTgfrnGA00GrHV2Qa3LiHSZH/5EY9+rEMeMpxy7oNDNga6nM90daNjDAMcAyzsAn/N2eOs3fAu88r6vh9dPT2G36mBc9TD4xVzSKVBFADBUejRKgKv6QWWEaHrMAQCbIF/NN3iKGYAoxZ7/o5YlnJtAwLQEL4Ojq9m14oGE6zJA9xMFAGWJFma66hCxmh3v/Zd4x/UAgKymZBP9WTwmAECVherW1Abc8/ABlYl7HQCghEDsHBkAvHwQ/iwAgC4FugFSZmMmBhCC5fUbULpiowTAXBUAjJF+eezPBwDIM4kgGq/HNACQDyfMc2ErA1vWsLUA1XwrKd2ubT4A2ApMtQK4CQBQyrUu2faAY0G5pWiTmcslAEA5W7dh7dZPwcQGAGU5ym9kPxMA4PQSYKIXOWQsBLkMQMsygUCBCmUAMIO5hx0CdCwc0W0JsKBu/ZAPeSoPjZJ2af2IO9sk3iLa3lmXOcuz+wDWLSaVVEilQ6Pkn1wJcM7JsPBXaZduQgVVdYOvBZg1TwEOfSW9KVc7QKkIZ2VdkVTOXKkODwDWXaHWfHIlLzUV2XK8mhkuDf0bx5tXd9GA5EdSB+ioBDjoSc2KFMab0iqlIPF6XYYts59oRA0K1cQlAICilMS9IJwCzDIepCdTYt8ycKFjl8km4NHX5bnWRYz1aYMjiwOkQGd+mbsM1mJf19xrXHYeux35790O8vQSYF844QJ/Hzi5x7tSsfA3GtB4ctvVAEB20ZjP6NkJj5Yo3BLeTBVkUkomEsfw7XMBQCkfmfEkGYDymgnB2Y2VAJtM32BikywEraNttkBzCk0AsPKEUHKUY4BQgEMqKkREcbx0BQGAy/0AJ7stvLrdwMOP/C782U99CLpP/Q10g8vUc2AWgdcOAFx0DuRzWX1k8xb9AgbMfHNPdAChu8b1zzuBfn0XewG63sGuOOHOnTVst4/g7Ox12Fw8IABwMWA58LC7gMPB/c2OZcowSYkKXlJh9GabDalN3MX+5F3MAlzBAsuA1wH4HAcG/RwASA40agVfAuyI4rr9OQAQswURcBjx0JDRgYiHNUB/CvCmz4WX/vF74Qu+5/vgk3fuwMVqCXv3v+/Q4kqyJwGANQeIM4iKGpjprC8IHgiyXtrHKFCcDGjbANUsQHJIkrx4SglwZe29fEhALYJL9B51SjLLvDgF2IGAOkKqWQsOlqfTJJsB6KdUtVyO7pcqAcZFE0TW9EsTUuT1+trUfs8DAHEQ4oXueWwv45rFsZY8QMteykfjXqz+MWmAX2tQmeoWbBkjVAaBlGURsAcYadny8lWRIFvin3LWBCNfkf8aj8UNyrkiHmZJenE2AEjvI+2E26wi654z0b3tCfpH+krR3JWy93hGuR6zOhLR9l1aCzevAQ+pok9RUjIZgIp6SQ9AzWNR2ui94dQCfodZ7lBCz+/F50uflmdjbSr3b8vpKiPnNf6uZsxZXUMzaq2JonHYoKBBqBYBQl/kOHSaedLzL54mXBCBZg9QxxXiFUnJOWb65x/etiIsF5H/apIq7WC4zvsvgeZOHwsFVwcAI3+W3jslA7A8ZgTMzNeGN1/633+zqgFjhkdUShEA5PT3tAyY3xppQb+pgBgfGZk8KA7/KgT8xAlubJhQFINAp8ssTZ5pAZjpucFZJKSu4/VegQQB7ahMx588GZSLsV4qxd3rJjnCWs26uzzfAzCuoc34KoX/RJ/Y86y4yFXry6fkVFisJWXmez1+Lofj0XEAIRWffYH9O2dg0tORaAaSh73Qz3LAcyXaZdqkzkp6bcv9sHeokiFR6pFXYdZUpG9jADCIooS5urijzXe2Sn7leN1K4fXytX754kdsWPN0rAGkUiHLOEPqh9yMa0o+oXfU9OIrdi44FigIgX95SUTc17JFQYECxeG656J/OGdCahacjZZSifUHF7lI6Ym6nfQLOW1lyimeQNHmk0ndv8KGKEaxTEM64YAngsYSYF1OasdgnSWpLadK3jzq1vQ/y5gxwZXVY2DESpWwB1Jw8WPjkNmstSk7Pvz4JGO+NFRpcT3mwdqWv0qyFOhZNuMxvsHndjqHvLJUDCDlR+azDatLXbCg7qWZliJ+1Jy7BwsHeDknaxzgzn4Lbzo7g//+G/8PfOLf/yzAG38HfbcFwIw3AgDHoYPV8gj65RJWSweMLWCzuYDBAXj7ARYLB/at4XBYwXDo4fjOfYB+De5w3Lt37mCG33p1gP3uAex2j+Di/BGMww5BxnHg7D/0mrLAnnLQQwbSVFmosGrwdCk71wGjLmMPQcDFGhadKwVe+gyiA4wjZSlyJl4AAA98MjAdZNL5k4MPDgDs3CyXBAAu7wG89nZ4x/f/Czj+4vfA49UJbI7WsO0J9Oo9MOb6BroegCgZSS/AnHwJ2fJKr6wBynSTss4gRxAFz/eo/5v+R13/hFN6/bC1f5k2GU+09ISllyCNtLPRt/dPzQCAtLljaGr/zuowenp7eLKFAIMIQoFVWJb1T+0dNn6I8co0u6B7sKUyabR1ZsaN9/gAr7QuNW9Zxl6BYqbnOvXnLVHI++m1r40eko8KmeDi/nS2RDMNSvJoY+wWPzEkxEOH/AvQnska6wnc1bSXtWfIOKbEiKX7vY8ZAMDC/QYwk/aT5IfHwGvF1RPRV+CqKmrBIcG/hvBk4im2L7yOmnWIl0jcCZqU6yozVvk+tx2kfrLzpWu8h4gHiZFsUwm1fEK6ASY5zvkassWM1UDpWmU/EYCtjZcSgKy4fi3a89h4BJLXpJ5hAM3LUQCsmL8q70m7nkwZVEbbV3RYSwTNrXMAQOKJmv60D89oRBvbuIw/NWa7w08lu3Rbqu8lAROzZ6ibI43e8GroFxQu2gilH/9EwZ/ddABQTshN2gZurT4FYjnUzOIkpPJhIhIAGJ2BAAL6OdXTvCWg50Mjs15Jj8CwcJ5kgYBBvSilZXdnkowoI0RtALDh8OVKmHOM43vQMICbl7PKmjHLtA4JmdGzBDlAjV8YBFbhqICl0bI6p6ToLH9mxUcLwiQHXL5/PgDYyvBDFTHNl8SB5AG4kiKQDlJeGQUAUIwhXOkBQElJC3DUgnMeb316ZSXJCrJkI1hUrd6ICnimvZp1ea0JMD1Iji/3aDevDk/BLf3UDYh7/tUAwOiI2RFYADA/RpKHWQAg6gsC/g4hk1z2UcrRIuoDAgDZma3pCYYucwBPna56BA0ja4Zb0/9zZT1mRmkdJEG+VP60frQtE1qn5qrpJAFTW0CygVrwdFJNkNd9cX0WCACWNIgHcEpKiLMFak5mJbsiL79+bC6wdPQZF9BhttkAp9sNfNb5GXz0l/4DfPI//0dYuzLd/SP8jrL/XBafA8SW1HuwW2AfQNfbbzjs8V93jSsBdgDgCD2sTo7h+OQejOMS6dAddvDo0SfheD1gCbAD/cZxjwDkOO7cObr+oI2CxTcZkyWgsL3SicbwH7CfRCAgzwcODthceoDTZT86ADD6A9QD0KWbu0zIPZYx44EhPgOQAECAcbGCQ7cGcKcBv/JZcOfrvwHe+b9+Kzy++yo8Xq1g53okLhgAXCANawCgzWCxnKb+bgUrGVcFdbwPqmU2AMvJNACwbEGt/2v9y5Zv0bLfbMdC5p/MimR6+OHxn3QAiM8+arwguttWzzIf1ThR+69Miylz4qdKfZW+SccP0arX7Y58jgVk65Bmzi6V7Q/ZfypBU74QOkB6tPxRYGG8WT9b2qcYZ9Vspc6gya6U0a96bbgdhL8zCzjQ+8M6qf3kaQAgE8PNlioWpv7EDOWpd8z3Heq+SMwAzIygCh5J4ZQ+k2yfIqt7qP2K9KVZ61TxXwNypBtMcdzkBnDMF4HlONJo6wMA6CsmwlMqc6ZDdUSPZ1ExGORdZNyRzEgezCWgzFH6vJZRL1n9fu0AoDQqyk3042YD4OUwbpjS95UWeooXbo7/5z05CwCWHlHxO3O3oH5IxDHqSOoHTSVxLBuaO/z3YfM7PqzERS37bMeZAIDVB/hSOPWQ6L/i9sClAUCVWpoyvhZYlHz8KBp8vkISOG3YOhcAtABTrt+TXLxbALCu4FobYHOaFuP6P1UAUHhGnv2aG/BmB2FOCfCUgH/KNVJ+bwHASA3l9Bo2nqtY55kh4iOyL+WE/DyAoB2iFxcAlPo9yh3pCw8AolMiN5JKZtnbiIPPwmaZDM5gPkBmcCP9VjJLy8ErB2DZ0dqSeLtBWI7lM48rZQDGh9wCgFwilSPfhAzAKwCA5Ah2BFLtd3Bvt4X7n/oUAoCPfvvDcLx9CLvzB1TK6jMLFuABQA7bsf8fb6g6teJAsxVmzznwarFc4snAq9Up7Hd72G3o8I+L80/Beu3ev6eDM8YRgcCnBwCq6MMH7A7kdL0O3QnHK+g7KgWmnocyRdTpUjocBHv9CQAQ66QxY5iKYUanQPpjgMMRwPF9gC/+EnjXd343DG97J2zvvwTn7jqX9OCdf1c+zRvIuQxABAClTDayHuaAS1xiykH1iwwAshaVG/T17DHil1sAUMrNPAAQrarPSCmBgNJ6SZGj9UoBQHymat9wvQBgjAQjABnEL2OK5QY1x/PxslsAcFr9x9MHAOPaeQBQ2N1bAHCWUygURjuBR5RKUsxiMgCfdwCw1XNwTk/ZmwIAAw5pXNRc5GE/s5zxzAGANGABAIr+Tegem9mrCYXvBDgoUpCdISqVAEcIVid5TgEAlatqcvzpz7gMyGAi0MT9BbkLZXe4KgEghr6NU3KSHlKGaVqHPoTRv5AZgGFPylPFOicSiNbrWMLs8wBgNEnCTcVf8+uTV+Cc4p4DCviz6wcA9Vh0D8BU5UzJAJSUvM0AjCv39AFAVxLrRlF2ICI8me5Z0fh9/z1rnPBychzLIUAtA5AfKN7rsqYwaYB7AHJ6cSPIwEgazbMHDqwemAsAKumriWcSJDUuTntiGpGbB0y/AABgmH8eSJ2SAVjmb95xzblSdne/tHI17iZXwGpU+tC/E7MAD9DvdnB3s4H133wC/vrXfhUe/eHvwuL1v4PD9gwW/oAPdzjGsD/AcnmE5b+uDPhis0VADKXNZQQuVqKE1jUlXsDmYgMnp/cwu2HYX8Ci28NiscNegIdhiz3/nB6QAGDsFWRGf2MZgNZR8eVnODcCAAFW0C9c9h6f6M084ficDgUhAHDnDzJxwKnvEYggIPmDrq+gy5A8rE4B3vzZ8NZv+3a4+9X/BB64EumTY9gviJ5chhw2n00JMMGOusShBvAlHFxgu0AJ7ye+sACg8MKQ3qIEmOOCcvmo8KxMHCCBqRaJZQUOZgDOLFubnwEoK1Ra1sD6+zU7x15WLgQs23cOCEP2o39M4Dlr18U61UqAY9g2wTZXyVC/v5TdzWHYpQBANR79/tKpt/kpPCMZgEX65m1qejnzD/f/Y/1In8sSYD6VWXlYJSEMsbKJl4V75S5hXqJYh0t/U77IlgBfQwagjF/yJcBitqoCTd6ZX4SsbyD8gyeWAVh0b/wIZ2QAhjnN1KV5vivrrrb2TK+wGYAWT7Fvux4AUNoqnQEou/ghr/uMKY6tYqJIu51F1Lli3raFrsrIamVg33AGIDnvUjvY3msEntVYwC6QvDbAOf5DwuFi814CGGtPTxtmWgAnBXRyBis2UXW7yeGKjAK0LDvXIWkJxYsGAGJrJOExqxI/s0PpLtOnDtu1En9L3lRp47VdEx6J5GnNXym/lI3wlB1wMopx1VsAcNEMqTnmZCLviLUAQHkIiHtCCwBMeqBV4amS00uzlI5Dbt7RSWxJzfTvq6dah8dE/vBQVvYFrfEhPSeXAOfWlADAuoZlCJjvj3zARkp3SfG0x8uJt8sufBsARH4QejIe+EHdXZoNjVWWn3uQbGJdX1fKDyh5r3Xei08uy/d0rmpfmTf+ufE3xtPQda0d05z9ao8+XiEDaqK85NuUh8sAoHe6fJZdfgzEmVUXs1EmVeMPdOh8iZ2YoUcF/bsPHfTDAOvtDu5vNnD3k/8Av/OzPwXDn/0RwCf/FpYr1yOQTvjlU4AdMMWytVofwW5Hh4T0vcsOXMFms8WDQU5P7+C/m80GdpsdlvguFwdY9i7bb4OnATvArFscsHz44PoAHqgEGJGQpEcszUf+XF8JcEFDo34jALBbHPkMQPe352McjltDzO+jA0AEAEgZerxxQDaBy4qHbgXwylug+6IvhS/8wPfC5i2fDZvjI9gulzB2LoPStRgXDd0ZABQRTq2JfXZGRp2UAEPJ1zhTiRmHEtmpPQDLHN4qAbYZjta+Tclo5PGjNMsSYOH9p+AfBfvtsIepLA8qmKNz4zsCnVUSQU3/R9CypF90fgCPS9igBgFvsgTYjZn5V83dmza5bjy/oJ99goByPkXmX6gcrPaxSjPwUjrWeIDitxJ30+fWX5GftPnE6jdbwVNfvqcNALqKhxr/tuev/Bh8FJdAR+p6jy+2KvA3Bbet5AAIv67lI3Ccw4e90d/sIbCtEvzgp617APr5CpLoU2FNCTACMrEPao6SyH2JjymAlYZ86689r+RlsO8AACAASURBVM7Qe4TnVD2YCmmvkgFIj80lJLXiltZaK5679NwKGlmmLPoSb3VlAloKGWll92dLgPVsqKcerxhzVOQs5keOrSwAWLVGJTaQNzUAQK0vcviY5tHZJcD+DN6wA64n5P8KAuCdc3GRnWMLoY1NQxkQWJiSjVqAkQZQFqBIDynIGaxbANCKIy/p3BJgCXDh+VSzAUDLQUo6Cg6nNJQVh2SCQdMAXd0ARyNXFns2jEzfuQAgm9Cwm0uaJyxX/C0/7yoA6OATPmSJsxlEymTOwfzMAADZZXIha7lJZsuQuhWZBwCmFqLqH6KhCpLqeULzQSlIowCA+LssMSUAMPJ7PLQmnvQrgfHUyUwshOBn2aMlhDRFf+S5AgAzhylyTxs9wZbTX9d1TwcALDu4rYzIekYWcWbVfb5JAPBAUN5qP8DxZgcvXVzA4S8/Bh/5v/5PgE98FOCNT8Jy6XoEupNvKRPOgWHuMLHQnL1bwHp9DB2sYL+nrLX1eg2LvoNx2MM4jrBa9djjb3NxBkfrBWw3j/EwkN4deAGuF+DWnxY5IgDI/ZlJPzN1fMD3RABA8U50EJYAeAiIq1le4hxRu2BKH1swyv5zJcxcAoyZwgcHbB5gsXA0o2sd7VwgP2C25Brg3V8Gn/8d3wUnX/QeeHx6AuerNewWvoRarD+eQIrPiT+zemIKAIyfoHhPqFpr8V1vIb7WfYetTM2GWl6R1eVdAoAoDcYgXDsAKMC1oIGTzL9pTdBpLSUlOcDnOf//7L2Jl63JUR8Yd62q9173e92tVjfakMTSYMQy3g4jY2wkFgFmsGV8hM8cz981g2fAgAcMgmGwwIDODNtYbJIMGAbQIAECBFhIre631HKX786JiIzMiMjtu3Xf2l11Tne9uvdbMiMjY/llLO2jLQ0FRW0VdF5Kt266XDabJ1sAXwMQx6WjVwvEcM94mAAg7ykV11dweMU8TJLTSk/9PdO0YS9zm56q/o1WUgMlL66wGbe3V5LtVYpg9IPx49cAeMl+tfc/CgDQrUfGvo7eTf2mZ0PWZvigvmZannQPB6Lx1tljOupUIgBlwwb+4vc+GACQ5EzBvgoSOGV5ZECglVA5bwVtZKbvg6Da2+NxAgAjVxwc+edlekdE7PG1b+pSjABU6xEbDQnnN1iVpHtR3CUvWwOAwaIyo5fxsBxN2VVihmn3vL1r0mP1unBGhKKvM6AfKABowb9S3IjaMB4ElDG3ENqCAuYn8k2kbNCgrMmvTBjmq6kBFlrwrEtpiQOuAECvSqS+Td4lrb2bTQSjnOwrhk4RgKIh7GK3i2ZX1i5jGOMC2AFniITdpo8TACgjS52+olalOfFUxMQqG3JXAKBb/g6i7QGLUgSJVn95CmF6H5lke0UA5oKvVcMj6KA8hTFYduJOl6I0DgYA5XRXGjhJCkJIj4i+siFoy0DNnUPvAOYG2qOPANQKv6TeIihwSQDQPD/+kaAGH+F2BQBaTXZIBCCm5M52AxxtB7h+toGnz87gC7/zO/DHH/4ZgM//BcD5XVhQACy+hZtiYBQgd8ll53nYDrA4ugaz6QnssKHIbE4gznQGsFxip+A5nN69DRfnWPtvCydHM1hdnFLdP0z93e6wCQimzOLiIwDIqbQCjPI2TPvq4UQAJgAHAT9qADI9IgCQ6cBF+qhbY1BL1PBjwhGMFAUIOA9MB+aO4WhnaE2MdsAWm6lMjwGefyvc/Efvhbd94zfBnVtPwd2jI7iYLmCLKdWqizSCf7WUrOY+Vc5DL6OD6F3ay5VaoPezCQhxgEuZ8wDnoRGA0SoLi1GO/FPGfiMC28ouxTOS+RF0Qx2usDaNADr7RLXWgQH2PPIIQBVR2jZ16dsHBQAK7eL6hvVINDBuIv2RW70WXCZqZsRmGpfX4HAAsObMpX2Wopx64y8tx5MFAOb2j3foeY7hukzf1xgyeQo5vZ1/peTU/QAAhaciv3LvXzWMwF8PGQCMfF4E/cTWFMEffhfKgXgQKP2drOuWmCBx3TsFrT7g/kYAiutbl7cjBJ65xMqXfe8uXe8Bv2oEY1RBttFQ+0C5AACqaE7+J69rzQ7QAKAEV+jl1TpP78qy7DK7PdhK9x0A/A0tV804KLmMHOLkUKSIkcptkcJaOadr7QK0HD6lsqR1uACA2qb1lPObKR4F8oUI4GgGxyQRy7PWqLBLIDElYZs3JWRilMMYv1XjMJr52SuE0cTgqy5yR8r7JiBJkAfKtPZ44aU6IoiW0ZCfI85q0Wx8fa+LV1q/RLmWSCuttyKnq5HmUwjCKleWOHW6aqlmzbL7RADGkUcQ2ynz4ImkT/MFiQCg2lOaghJQEFNCCjUu9dyyLqhd5m/Tv6UbWWH1EmCrnM+C3I2vxV+e9+n1nS45PSMq7Qc7kDRq+Vd5o1EDUs2uVpgFEDiiwSalhi/19AmGCxGG31lfIR8BGJ4VOkCyAxUgFtlHBnxkcCR5HR2DwRhrMtG6Gk2jb+6+Dof2jJg2f2mFXxLSGp7PgQPpyqd5IHFtiR+1B1eafxsALMiH5gRy0mmHui0bA/d1rM2ewdaNACyhMWa/2Dnb4excmzzNawhlDdhiAo7WG7hxtoFb987gM//Pr8Kf/dIvANz9LMw25zAjrGvCzStgCkfLaxEEw3IiZ+cX2NoW5osbcHLyFJydreDk2gnM5xO4uMAUX6w5s4Vhcw7bNT5vCzPMoB2wBuAZRcxRI50AAHI33eAYGIclcMNDiwDE9+Fh7ZyiGyfTY0r/ZQAQxQpVdw4lDETKYMQfNzJB8A+bgnBtQEwBdrptArCl5y0AbjwHi6/77+Fd3/XP4e4b3wCvHh/D+QwBwFks1UizR0DQPcec2I+VBIplMv0RnuF3kjhXonTiju52IWtvEO882pQ55BPH3+7EtqeforRxzm/yCCQzRx3HxCF3dHt4eJQTzhkXmtU1vH0+rXHoZDo29bgPAOJTvQ7WOqEu/2l0WYh+S1+U6FXWP2wXYYSaet4e4I0+4NPTy0fnpbi1NvaOAMwMujJ/t2xWa7V09oezXvaNAGwd8Jbsx1yEdBRcZn85DWT4J/BCXIISb5Tep/nKrh+PN93TO+DQ8+O76ns8aksVIRxTImXeKNvx3x4ADC+yAI+fv91fkjFBzxM7cyinAAv/W9mTaFGTObm8TPQUeshvPf+SasFnMQDYUTz1iKeYRl1/gpXU1l9h+aHFdY9beyO135dl137PSFeLPNXkMuMvPdh0ea7ROsm4nP8tfTQAWHwdppxHvWb9//S5nVNjec1XpIlMSZq8BmAeAaj3t7JfJUDj5vf/eoX9GOzSAKDk7+tNb+W5ekGYIxtcfpMIAcaxm0790OxMeGDRgDJXsYhTs0yGReF+FbnI4k2elX5rpZcUaRClcTxJMCZBWcq5r9OAnePgJAeS6fniG7AeToXvWTw3AIqkRyossEMHX4n5MNTs6toUhOPVABm/S3xiU3KwpplmWGkik/ilDwCm59uVK8eA1wAYfqM/rbKU5hTmNg/X4mTlSZc+/NGql4aQ8wp+SoAlMQqfXuSjtQo8GsQh4rbXBdrzXr4fOyZiQ/v19KKUD9BzyiI8WiF4mUCtA8wmhFs4uCO+0BmhLn0NjUdpae57K0W19MgVqpc/+XStAeAS4Aojk2jrtOdkBctnK7rOhOwHUYJpJvyvEiAuc9K1WNKwRFa7T3KK5ReOKAhfN17t+5oCrgCi1hfcyItIULXGmZjy+8eOpdVUio2ZGncVtUb4UNbN6z57j9ajInXjPqmm3DQ2w55f7eOsRG4uCBVPoSSSpMmIH5gYjAPMdhs4DgDgzS/chj/6qZ+Ez//exwHOvgBHkw3V5iMOj6mvXJtuh40qJjOYzjgteLOZIqIFy6NrcHR0TADger2Cu6++DCfXltTt9+L0Dizm2OzjglKAKT2WBHTopI0dcGOXPwbVkr7MZQcpBgIEG5K2sY6FLRcIpfhmsqCuxpMJAoDY3VgAQKQLAn58os2ynFOaJQWYAUAEOFmB4d7RB7ZU5w+jChfXAb7k78CXvu87YPmud8ErxydwNp3DBqMpseNwUH/YAEAfAMsq9vSMXv2cV8bdTdQPl1rQqa1Esghew4rt/Ul7sifiWt6nBpRkZd10vV60dk2bNlE7RBWldIHJYKjLX8uDmCrOkqjvVPNI+/aXn0NlH5U16ch36JtL76sJxrxJlMw7USyN19oV/MyOCVOI/bOhrN373QV725OiWMJgc45q81gvwruXodEkUnh1mwY9+WDvHlXzLz7S82JNHogQaHEA35vzT1sp146H/d6mv6Mu0ePgsYW3x2i4KBKcvMvkmQFIJeNDC71E30zeZLGtiZ5j5YfeQ3RPxA944O68LZPe3QyNeCiSr8N+NVb1RkoLHQGlWtpvOECqyck2nUKEcE9INFjM7x5t7/Ye2ysvx/enCArWJdzkw6xruIwslE4TVz0+HemqeU/PqdskS13M7x+UbgvRjVURExKgM5WSPpiMAQBzkC9ssBiZV1dg+0Q0tUSNDNkIhioAmD/JOwtR0HkAsQQAZgYKP1/SeLQWTQCEt7wY6rcnsiVjQo89L5JrAUAGaKsQC75POQQl+opgLtIeOxyGiDsT2dHbeYYd9By55p85NXIAGgt4JYiN3BJAWl7QHoipAVaUYHlKkJfQCfQuCGBK4UxnWi3+rX3XN0DrT40cpviTKafMP83fRSFv+fS+A4BOIV6GRrV7ygCgjhBlwKkmH0mguiL/NYDZRwrI313jr+Fg470RoLXbXp2r8opGPlF7wxpVVmmJbku8IIaWUT8F0h4KAAbZGOmu+CtGBrrJhkhDthCtTGSlPEIzFCwRelL33uYFKRq5JiDbg8vuygFyO1/hK1nvniHaMkgSAKi1Zmu+XmeJGVTncq1Xo+gOIrxH2UNlQX99+3aAv8IeFLYB/MluCzNYEwD41OkG5n/+l/AHH/wPcPHpT8JkdQeW0y0BgETFGP2GgB8DgBgBOF8ew2y2hNmM6wBS0wrC5Taw3a5hveJGH1PA5h5rgOGiAAAipTkK0Ov7QwHAnn5q82eIAIwAoKQAI0GQLlzjj9cxdKakmn8I+nEKMAQAkHwrF8HHdFzAdnYM8OLb4Nmv/0fwpve+F27feArOZkvYYC3ACSUX0zsQPJxhIxDFmNLULfHBeOOmXKOzzNX+qcoEb8AwwcIMF3sdlCR+fcztGlP98JPawXkUyxWAuGlXBhJpp0j0la7rxrK/FIuT5JnlvwQAJhCwo6HHL7dbWOOJ1LXDpZ8/RjoWAEB9W1yENIjyIV7LxrT2u1eoXf3k5n8pAFANL9cpDR7u1DIT26K2RCX7ylsunfPlZoSc5nV57uEAYGs2ot9dPQIV5NK3t7ykzMusZPvam3DxJWo8rCU76bAhQ8yYsCoFxvjuGjFQ/C8mjQlD0XPia0X2jNmFrUP15M+WnhQRhPhlVtNuBADY09H5m5Wdp/yf4l4eAQDWOe7+AIB2ua3mpLWqGprWti6tgAaw8TmliEgtJ1r7k6ww37Va81nhcL8LAEZFK0ozpQBzA6X2SXuPAn0A0BVNTuBNALQ6O+SxAwCD7BOmRYfM8M8VAJhWtAEAjnfurAHBeFRS2nlNHnssa4QLMrxJAW6ztwEAi/LXPy+38Z4sAJDBP00zQ68rANAsMNJpXwCwZBQ23K9mhA3ed3kAUKfWWr7N9kz0rjz4V6mRZ3RKqvMzLgKQ9zc7q8HQaICw1gjWTT6CIdbvclJFCEk6XAGACmAoAXzeY/QE68jYSm2zMlgxxpwef01/ffNn9aIG9wYAhxVc327h1tkGXv74b8Of/B8fhMkXPgvT7SksMCJv2IZDuilF6293CPwhMDaltGA6EJwdwdHyOizmx3Bych02a+74O53s4N692xEAnMIatuuzAACuKToupfyGfecO/B49ADjjCEBKAV7AbjcLhxmh62+ISpdUVqr5R41MQhowAYB4LR/W2QPQKQzTOUUBwrVnAb7iq+DL3v9+2L35LXA2X1Aa8GqKzUIY9ENbFKMAudg880Y5Gm8carMPAFjn6tb+2h8ANMBbTDFrgAIdBMd/7Z/UswNbzuk4ANBHqTl7UkVw4KLyebJyEjtI5P7O83j5RNJ2HCuNf6i5MgcACxKvGefXBfDi4Zy12+U93fvd/PcFAPuEuQIAE43asiT67uZQXow9BXzJAzt7h+84DAA0JYgeIgAYZY9isIgJxM/yFEvPj716o4yflYWA3GsOpDJ7tw6KlmrM9feLyEemgESUxbk7gd6LeGvZU6UAqXHjS1d5i9V2febrHgoAGIbkS2ro+aCsb2Xk5DZx/wAubDFFkIcKAOoi9XrLyMApCbK5pg8UAKQIrHEaNjLqZQDALBNbRF8IXlZDeCQRgA0SPKgIwJ7hZ5WS+it6bfyEIgCoFJA//7WAVg8AlNpCdRalFOraZATEqEgYvO3xigD0Z4oO4BwJAIqKwKf1mkxkCrEaUbuv6B9zfa4cdY1GAW8byzsKANSgXwnYuCwAiDPE8dacKt3chcdg6+XxZ+0Ix2ITmOgkhUL8BVInx+WyAKB0wGodFPn9KwBgqjtLjQKqP20F2geIeoCYGG8NB/oqAtCsjvDN4wwAZjJLfVACAEvshxwxxei19RncHHbw7NkaPv3LvwJ/9eH/BNPbn4fp5gzmGMyHgBZF8HLK74AAINXGEyBwBpPpEmbTBUynmCo7g816BbPpDk5OlnD3zqtw/SSkAJ/dgd1wDtvNBUXGRQAwsuejjgD0+wRTNAQAXIZuwPPgELEhiwYz71OJAFQAIEUCriOgY20F6g0MQLX+FgBHNwHe+nb4om/7Nnj6XV8NZ8fX4Xx5BBfzGWyCjOUIQlwUGxdt17dtU+hrowNXk0+jjKT7DACqwxuOaGgVme87ID2Ap6elLwcA8lOTU6r5yvKYj77RB8w89pYDze/pLVNL+h8y/969/e8fMQDYibCLtFUEfJwAwGA+Ncnc4l8xo9oeaMvGyPf+4RGAeufoqck4ku+emD/NIJtLIwIt7b3yDtK0M1cY+5O5hK+Vg5mGRZ0jQmkD7xEBWFqVKG8M2eryuQf+sX6Th5XmVABPs5qe6v1uv0UAsGXQFLk7zZ75jUsmJHmbbhoDAOb6U91Pddr6kqylQjXvPAoAUGuInB5pckRJqQFYgH21H5k0T0/7JMrgm+j94RbmjAcWARgqr5gulYFx1AlCgHHiKG2No4PW3vCEkCnjpX0BwPBUMWyKNQTN/ApOauBoBoBqVSYySZVD1Q3hGsRhs8kB1Wisvj+wWKcIjDBlTU60UoDHs65iYrTQFH3bXfB6CqF9QjPGlL8CAAuqUIr2ouMaFnnsWmfraU4bL68Iynfy+hv3wESItpuwsOPZHlMENMJl+wKAbQDLlF8uyLsEvvGXlqNzhVJQxabuo3b4RPFbiSpNOzQASCZatbOlHlMyMjn1Gt/HNcbKcsbvX3wWOugKAGT7sPJzBQC2uJdW1tRUbTkjQmhP7DFSNB/F4woA6pGWHDgPANaYD++dD1s42m3gxmoFz5+v4b/85E/AK7/xqzC99yrMsEsvdbadYjIrAWEIWB0d34i1//Cz7TABzBLe7bj+7bXr12B1cQbb7QVFAM5Qv2OX3y2Cfms4P3sVplOsU8PAWF7U29b08xGA+3YB7kUwWfmZeIXlCP6HexlBTgQ3sSMw1izWdkswY3HPk22bAMDdbg2TCUY6IoH4Hl0+hLgZQVVsBDK7BvDcC3DyD/4hvP2fvgfOn3kOzo6vwWq5gDUVhsP7pVxKEmZir6Z57MPvlQhqxWQ9/VJKA7TuU6pnNyYFWF/DTl1rPj15UO92OEaT8/r09WtNvHOKk+i9EUhdzCwJuo30e3s9W2MsyQc9m57+HUOjw655BACgG3DPty+vrXKaD0YELx8BKFOpzaFn8/b4g5/f2mM5bx4GAKq9EtdJZpdsM87AIjRhBDbT2D/0GEslEwFFt1aoG0R57j33OCoxIB9w2DkM0gQrjqtuM5fW17/dNqnzeEZffjI95Kn+6YX7HQCY5XTpjIugXOw8RqDyas0kfECoFHER8fvc/uzzpxP645ezKAozFEXRJ1K1ulH7utynAGcr1CyhhraZXl8qahK2vWnvFyWBVmdjiodl41EROXF2DUHVo0AjBdgDgGEpDMoeIuB0zTENyI3hxZEaUOaY8dMeAKAW+E0AkOQov9GKl1yYPFoAUEdolgnZ61JadszDs0bUAOwpST8qb8S3AcBei/Q2eycDss5kVwBgWYnJiZwcOIxd50cBABqnnquAJwZunO8T93Qm5p2u+w0AKnOmmCqgowD52sTzPQeElBsZSGGSYrHqCoPOQcoBwKjPMkrmDmYyMhkAlO6kNSA2zCUKIZkbR+nwbFsnXFcAYEt9EgWvAMCmheFTWFoAoIAZeM10BzDfbeF4t4GnL1Zw43Mvw8d+4sfh7Hc/CrPVXZgNA6UjYuTflmxEbvaxWJ7AZDqn5h/42c2bz8Fms4PNegvb7QDLowWcn9+DzeaMogC36zXXwduuYDdcwOriLkwmWA+Qu/1ag7wfAfjwAEAG2xgAnNKc6TeBgPib9zrW4KO/Q+1DjpjEuW1gByuqe8hpzuGwNRrkYnjjgeIShskR7G7cgtlXvgve9O5/DMuXvhLOnnoaLo6WsAnAH8nSCAIGSRoc1MsCgK34sTEG+hUA2EjAiABmV8o5fZ9sGu/A+yf1AEovH/T99JYDHdyR7k/lsocNAObDiCZFaYQjGkH1/JM+fQ4HAPvvKF8hc2+zwMMGAI01rGxKBwCGy9pRbD34IKeL1kckoTtdzusdvrUNX6H/AwAAo4mN/wjyR3da1/w+6QQ34PwTIFqipbWL8QoElAw/KfvcA14+OCGleI/j6FSiR+YatJHgNkTflHJKJGlm5OzPL72RPmwAUDys4PUUm6hql9GTQwDfxDOuRo7bkS33piRfdFfyMfZFb0VGAIDiPurQ4UQC76A+zhGAwmza8a8KqCsAkORJrwnIWGAo0t6d4ncVRPMFYwDAtnq+AgCvAMCWEnrQAKCNtHO8aoAxI73oj70AQIN0KgfpgQGAAzVgkQ6lPE+/mWX/6jo0Ev2nojurXtYVANh1ja8AwKaNeSgAeG23hZvn57D71J/Cx3/ixwD+9A9htj6HWTCcd1OseSdpv3NO853OYTLD1FiMhpvDfLqExfwI5vM5HB0v4d69V+H09NUQBYhR8AgAcuffzfo0AIAhstZ1Qew1AXk0ACBG3zEAiNGADACGfY4HNvg3RQaGlGkE/KgGIIKf2O0YU4HxGeKQsPxiZ2kC0+kSBpjDdnkD4M1vh+e+/hvg1rvfDa9evw67GzeoGzCVs8CoxBANKIa+2B9XAGDdyb4sxjUGIGtFCrfANx5tdInD4EsgR88FarugVwBgx8bueLD1AiXBxX4MIgB7IETt+ysAMLfoPEDUzfAioV+TMAqJKizCg4gAFLEix0ucYZRqxhoAMByk+9Fru7wFABbry7uaSzqC+X4CgGyJO/tZlUeL+tC1MX5NA4DaRRFwN65HoJgDtHVNQDrwDBGfEQBUJZq8vIjeUIP9LSCJgLKqASgasIGR9LRfBwDErq0yuqBc1Q5IsSVpBnrDe/VcEqRjASS5LqPVqAjAtIEjQUP4Mo23uAApODaNsUBOE3EkM9SGiP6sRIE+iNV08igFuM5BvRz+iDFUFqcIACosYuz6BXXv+GnMCVEv9aNOP2ZV3xbDTjQ6IkUiSxpjeQVISTzwLsB187sE3XlqjGsCks8vni6pJltj1vr+RwB23A9nPGCaV/opg5uKfWM2hKWACPvItfHrcRGAWmK0qVaTLcXPs82qugOXDCQdAVgBAH2NJGqKVMIhC3aaKDnfaVhSf8sAoF/PwLEG7JTP2ntXVqdtoPfSXFrr09Ngcu+YncGjLHcBDjMJr7NPu/wZOd2ZFfFsjdXPpzf/ulwMorebYjSecvm7WL731relPcspjpFDY4qT1CgKaxgiABfDAE/BADdPT+Hsv/4e/O4HfxTgc38J880FTCX1Z7agZh+4DBT9hqAf1sWbzWCKQOBuBtPJnJpTTFF2TXaw3pxTiu98PoH1+RmlAO8IALwAAAbEYvH07IRepwBL04y0jvsCgJ0SMy6CWrRPei9HAAoAiN97ADD8HdL+bROQDdGBAcCga3UE4LCjSEzqsDxdwBq7AS9uwPHXfwO88Zu/BTZvfjNcHB/DZnkEA24FsvVCCnKI/rYpwPvy+wj90owy771PeDvtEi8bAkcm/USECn8GmdrWoPUdKKZ+RwPbd7vt1ouQ69mf/Xf7K2pWUVsOVHVIR0D15ne5t469a2wEYP15bBa0bMzSd+mzcoR++F7KgDSmIzXIxs44v669QH3+ufybiXIuBCjnxp6GsxZ7BqCZQ1MnL8g29xa/no+3HfTe4HEdEgEYrQU1ad8kwdfotwctkuGhqabp1QYAaQLGvskj4EtJu6LTqisTI1e5fihROFysR8qHA17eJN+Bvon+U86JvPXsKGwEYF6/VGRyWDx3pO7G0mD+MMoU+ke2lIpHlyxx1SWYza0a1Sq6TKdNlLZaS4DGRoLpxmx/dOSX1492CK0SHvxd4mfhRVd11qVscxNgVdqoAQBeRvL4iMxWBlvPuiD2u/n9v25W1DgocfDpEv5e/tbOYpnbejWw8ioCiiyG28NSegS2K+HTYuQE2QWHrC6krcM/iRFxvF9K4FvYhAFB7qUYtlNAMAKvzSZtBdA2UGkOIRWnx4yeQrLvuurNTCCqjPi6XgRgb1xEv5guaK9m9rEK0jelETVYfk87hx3vfbAAYHsL0/tVF+vS1aWeHHId3u/xASNg1VaPctzvv94CdcLkiYA1Hg9FzFuv8CIiBwDbA8z2Z6XEgdczSQLqqutBizbqvvgDEuu/h7pZGT3KRngP+minLYnHNAAAIABJREFUADNdPP/XAKq62vfGG58qCgjIfUtEDrX4WUcB6uvqeUQ90d8rUs3gZ0e+9r4Xqyk8xtOP16CzSdwUlbYNxmd5psyTtRq0UmrVpnD0tms5SrO7A+MFWsLzqFvHU+x79shTf3sOkPTm59dbG/ele22XwpQig8DT0XaAo9MzeAvs4M8//PPwqV/4WYC7L8N8WAGW6SP+Wh4DTGcwnWHkH0cCoszlOU9h2O7geHkMM4wU3O1gu13DxcU5pb0eLeawW58z+AcrGHYr6gA8obzusKdIgCcKWoeaU175p8RDu2aX8h4to3qNF4ouFp0rTaj4N86dox5DBGCs9Sl1P8UhwtIB3OSEAUBOd5aIBYlyRNtyFvre72AOq+kC4PhpmHzJV8A7/of3w+xLX4JXj4/h7HgBmzlVZIQZzGCKTp04dkGf6T2n592WMX37qgnfj0px7e2O+gh7d5a4oiQPe3JW6DXWJhzDV4dfkzT04c+qP+Fw+7Wnf3qreMj3bfsyd79ShItZczMFbW/3xtb0/oL2aNGn//ze2vd4O3uDKsLPYlWBCOFibV9XRW8koPVP8vF6kCKNONluehbu38aF0bOpZPQZgCevsZ6l+HZq0JdkaUqPTHqCF1vrcx54L4KUCueGHzncEruj5FtrGdXnHn6StxHirom0FT2grR/2rWWN5L12fScw+Ig/v5cK5pvlL7emiRpF28rye66/ZM/X9kUZgKrxsAXCiralAwB9SRM2W9IcdY3JdHhRHW1n++e2qQGw0Y+JAGhqVKMfarSMBBupoCMdsSf3+dHWfJBy1lTBkjMskDNMS8Z1AUC/aFrhpc1UbsbQ65KWNkdjAR11sq6xTQmej8tfzvhUWRTQ9jA3uK6qNQBQgQhtB7Mn/Os1VBMTtp7RN1DHAIA1QdlK34jMngGA9mmHGVDOgCnidRYgLAKAPSugIkZwJg8eAKx7yEj/vQFAze4YFYHyQs3ftzHPHGa1nlbdVYjUAwCLEbTpWb0MEb99LQDYM//891qRa9HeiLQzAHPZqDJGkEdkTYpmOFTInNLSPPqyQ44oFDUzWecP4MoAYGWD5NaxavATaEkhOkZNNlI+3H5O5ld1IdvytS3/2LBr03FMBLWmoQV4pYB/x9SMTXe8eThifEUdxM9h8HFfAHDfPWPppykubSBaTxyjQ+r39/Wb2XuFlAlv3Nt3JedLH2Qjz812AMfbLdw4u4CnX/kCfPrnfhY+8+u/CnB2G+bDmkAmWoHZAqaLJUymmPI7hWs3ngqgLX9/784pbDdbQL10tFzAanUBJyfHtG5n9+7CFKP/hgsYCADk7r+hsCPVp0lRCDxya3AKANiwr0gB9F2h2hp4+ygdyPH8JMKegT+JwBMAEK9RKf/x4ARlxpaAP6x1iL8FBCQHJB6u7mBGPcWQ07Db7wKGxQnAW78E3vKt3wUnX/N1cPfmTbh3vITVglOA57u5AgAlUjGVUzDzbJ//JVCyuWXq8qXNe/vuw/L1zRTbQnRiK+W1N6LcXu7d8eR/f5j92p9/T/+0nxDkY9M/bus/r18ZH0oPzCXHGLtERt1vonN5ydSnrZ1JZf/4j1H+6EEp+1ZsUfwdbeOef9o4AeNb6zSS4I80HEt7PZ58dtpWTd9m/ObsI+sfUI2ocYQOVyWbS6hv748BQ4Gu3fUPEeFm3EZuaxDKrkv32YrT9T6IVmp4QIoCVPaIiiKMK1ggFZtnDRo2v6/ZP2nf+znaN9n72/zCC/hwAUDmf31KbyNMx8iavg+gQZ685qHYG235EPma6hkr+dismdirQZ/XTpc1Ko2G5A7ahHvsyMMBwJ4D0osAaNyf5aiHiCc9v3YI/hUA2DPuHz0AqFM29+DceKli9ysAkKiiBUCnBm/s8htEbbGNuVF+VwCgZdLHHAC0EVjWHGCHrQfI7+MgeAAUDUTvZXpA26ur0t/7qLS0PGxM1s28ZIzWn99zwLLzeVUyg58fXYG6cLsCAC8j+EcCMIof7jMAeLLZwnPrDZx/4g/hkz/zITj/xP8LsLkLi2EbQKkpYA1AmGHTD0z/ncJiecTAIIfGUvOL1QXWuhtgPpvCbDaB3Raj37Ywm+xgc34PsBvudndBEYDS/IPkNdXAs1GQjycAmCL+xN7g2rsJINQRfmnPojG7g2EI0YDUIVgBgAT7scbD6MItLGCYHgG84U3w1De8F1549z+G8xdfgDsnR7CaT2CYTmB2BQAayyk74OuCnvWtegUAXlKMNW7r6Z/2G2vNt/RdDf1e4IUuYNFMSfWjfW0CgDJL7ZuWrZBQ4qRiojwcANCZs4UutNqjKAOALSjN2Zcx66Jsc+naaSPi/0hvZo1k7hMA6IG+zLeKU0t2L9l7xsRVx6BXAKATAO0I0wA5PmAA0I4h8RIvbvy7EmkgLPA6BQBZedS2/5MQAcgAiTnSMUyaR8jIibWwp9/V1gl+OBGALTOgfc6xDwCIT5LZ0lO76Vu6hmRUi2qwvkbR4QZUTu+0Pvid1DSMq96dQ5u23AW6RGNDqepDugB2g8iXiQD0A/EpwFkEoLtBR1COgDZURFiFBHtFAOYaVIwkebqpebg3OwlgpIGjIONqGNF9BQCtsdDeuYeffklqrpF+5kRXp+XmxMxHoOkXdhjh+3X5mp9+9gDBfRY1OBgNA/uwCMBcw8WIEEoNEtulDUSKDCid1uoOdKWZl8tQ8JUPOwLQywMPTpXHf0gnzTZdtcEuusur+9K2TjokjwBEVqZWFgPA9fUG3rhZw2d/8zfgUx/6jwB//RcwHbAByAYmuynsJjPY4tWYAowRgDPsBCxp/vjmKVw7vg4zrBG43cDq4owj3oYNwLCBKaagbDD9dw3bAX9j7T9p/qFr9iQ6PFwAsBAZTcycovpiBCBBdQH4pINcDQDKRvHryXuIIwAZFKVIQJVhIQAgvnMLcxhgAXDjOVj+w2+At7/3W2H11rfB7ZNjigDcIAAIWHdRUoDvRwSgl2+ay6MLWRRaST7sI9P2u/YyEYD+DVXVVxjKo62Jtx9t7sfVj3MEoDQZOMSO8BGh3l5MaXjRAiuQtc5Bde+RH9Me++ErWD/6q7w/i6i3Mkt0Rwb+BVPKvK9Un1xN+IEDgFFBppf2Iqy8f0CivrpKroZfoeSBKZFQ+L6WAozjSOgD1v5ThHtIAKDlPuYDXRMwJZjWM4i6gPpDiAC0PNmMR6yAreIJlBDO8FkxE+xRAYAKE3D+deKjGgCo9opiANblOJ8HGwGobdr4ei0kCxk/LRl3iQjAFLHVq8BD57KmZmBuWtCWaUrhcc5TWRWUU5ONiWYEWBiIyemyTyaDNuYDlUTfwwYAD1OCPQBQDBxaBdUvpaaYBRi06rMOAHjAxvNv18AqIazhdbQpJ+1GAjIvoaJPEe5Rtw3+yd11M+ZwAFCxo5p3NMc6IYDaoCNaNEKWEz3rq5vRywn+DKDrpBDkCtILi755q8fUXl8NYKWaD+UqZiXnzt7f4x36Pip4MWeCSZwB0zJPPf+++eoj/LzR0uf/9jtQ3aWfMH+FsuTsV4RcnCrVozzUBUj6I65YfGT7BJ5M22w/WPrn2kkbF3I81tj/SqP7q/BJ7fjoBKhUeW3A+mkP7qdUg1ZzqjgxtREgf15+hdu2QZXTKi/MdzSmcLM3IYnUtCaYAjwAPLVew7N3bsMf//zPwec/8p8BPvffYAkrrOzHtf4I/JtTB9zpfEEg4Ho7ADovi6MlnJxch7PTC1hgdOCwgc3qDNarM0rzxcYfEwQBpxjhEBphTLgWXuRJMjhlZCVaPOgU4ADxCuGIrjqlF/dXSP0NDBCLwlPartQErAOAKK+5MUgCATUAyPI8yM7dDLa7OcDJTYB3fCW89C/+FexeeglevXYCZxgBOEPbLVQNDNGH0b6piLn2AS5JiKr9moMjzpYspODe7526LwBobGOeXqtE74hD4Ps9I6fBOiqwt349wLJ3fy8Fsnt/hzy9CMDa92yHh1q8WSkjrbJl/+QDyeQh1WTOtVT7kKr+/FZ6q4zm8rrhwfIdP11KbOSjNJ84Wy6ybKH8iDKdwr7bNwU4zZuf1W4i5rvGFyRUlZBsO9Z0sAP/Clo+byInjLqHjR+bQrmRRzAxPSuOtJJx4SeKd5abTpRJko6DefX5/x18w/OArzHpImqzGnnZUJQP0nUPct7q31IqKeNr/3oe1PrdaZiOAE4R/wWaow3RFRCeP1vyKK+YY98vL8tfSk8lZStdo5mSQ7QcK9vIdVm2/nE/glvLC3mD8cg6KcGXAgC9Q1xbg8ceAKQaammrloqGmmWLKSvh02L02BMEANL42xvicACw5NYGFkVSaQCosKHbAKCtD1DaYhagcFcU1q8LOI6yKzRN207q3gCg2t1o3nHXVlE1ucHO8ymLdbwrAoCyJFnX0HQvPQkB1bCkKXKpIYUfCACoPc62BrAzlwMJp4Tin0p5Bseuvj9KdLX3j2KVIgDISHuameah9n7V7xwTAZBHOPdMADsrdMALJla4SJoseXq33qEmHmVzV8s3SG33HyvqpCrLXQzT48oAYG3Gdm1G1cBrnJ/j01o1anVEVZUAVQBQiLDfevv3tCMQ26fJDJ7cfwBQz0hLCjbHfUCq4q3gs5j7dwzwsLPDvIP1/+YDwNOrFTz7ysvw2x/8cTj72EdheX4PJttzmEzQ7JsRAEhJqlT/D7v/TmG+WMBm2MFsOYejoxM4Wl4jIbw6vwtn927DgPdjyuuw4np/uzWfEhD4p9OdgtH9OACAkSmE/9PvHABUHIRNQCgC3JisJrU7AYACAmIEYGqCkgzmcPo+WcBmdg3gbV8OX/5d74flf/d34eWTEzjDCEAEAKkLcTDSJwhA8rtrergH4BwCIFlZNEpb7H3RIQBgcb84UX6IZN57MoUbDp3fofc/tgAgyayg+5qAR92eKPFnHmlV0h9iTFIV0MKqJan8qCMA2zw4grsLABTd5XwLrW0jRe47AGhnI91IWxr+wQKAGjAp09I2BMHxB31gzBOppVwSAOUatunwhWeP/4+W4EgAkPSCKSNjOwLno8kBtZ5+8E0qs66MTQAwt8bSLPu1HKREzj4WYJZuHamrQcA0rmhvjYwAzGYUS36Uhf9+AGBZ1mk8yz+Paw/LT9mXFznJc90PAExNRvgdbM8oz68KsGsauxXUW60TEbgXAIjPlZQOTZKaEH0SAECVp5V1jI0GUJysawLyBACAXQG0BwAYpahScEWxnjRcwb1VmxBlFDG8/OSIfh2QE+OmpaRLAITl1kMBkPLppxY09xEAdN4r7UcMaghT4q8tPC/7NQatOvBOmoBEVe26gIkiFUfIpACH8TRd+McSAPTgh4YJEojHzkHNQC59/vgAgGyE8nji2hY0vd89FpDPU/7N7qGU+hYAyN/bn7rDYfSsEb5pD2XjrSmfitK2Ts1lIwDTnKzJZ+d6fwBAY7pmtOQI7sZPEQDcn4q1NzzOAGCVMnH7awclGGDObsYtZAFArCOHAOAObl5cwLXP/AV8/H//YYBPfAKuYbOOzTnsEACcIAA4g8XiBHa7Sej8O4GjkxNYbTaE7C4Wx/DMrTfAdrOB83u34fTuKwEAXAEMK9htVxH446YY+vT9SQIAlYb3Ia2k/3GlQp1AulSagCCEyp1HOQqQQUANAMYu8pTWO4X5ZAEXsAR44xfD27/ju+GZb/wm+NuTYzhfTmGF5TpC6jGXAuEU4JaN9HoHALvi9RFfcCiAd+j9jzsAyIeAwUb0AlGQqmqMZ+HAJKsR5w95nH7PcAhrGz/2AGBHAEjnWbMNGgCToU4LAMQSIrQ+5fyT9E2rBJdEJNU36YMHALVNXBuHMKZk13keSbo5e4I0ASlYmcz4FoIWlm97ZelhHMHFdkIfUHUlZ8Yga54HigEYyt5sIl7O/+i8/woAtP4dUQ/tvbD8ZHkTAKjsRCUPxB0Xn4L/3hMA1DZdLFEm2Ia8uRLoVJDfDiIwNqOwg2aLyc3v/zXjDRgHUIwxvQUmeKo97ocIo9JG/V2yrdogVf9t7Ss6uyDLscodVkMwBViV3/sYRQCOqm/Xpo8AdNlctZJreFp8n95Shppck089nOVfuqacspk2iDrXcewVuKuz/IcBgBINl/OMg06qG6adoum3rHVY8S+uQRgUJJHaA4BcJclcI3+rLsBxL6KzpZ4Xw/TDhwaQjdLGckf8q/D9finAk0ITU2sc1OuPKJooBkt4CVFP1Lpan2QacHRSa22LFrU6a+xJJpxfGgcnjKbKaenVaUw6SrkFvKZtpABAz4UjImBlhm5bxif5CFtdAwUvSil64ZZsw43RJWpNioZe6xlpDeJuUstyuQhAfp+uQqO5TUYzpgZuja7yjFRRpKJtaFI1IbeLjSIShWQjh9/dE6K2AO0BgO3RtVKI+nyRJF9OG28ImafFKel9FVbQPQr5A7eofIz8PMMU3u0Az1ycw+QTfwi/92M/CvAXn4bF+V2YTbd07RY70sIMbt58BobtDjbbATbDQE1A1psNuRXzxRJuXL9JeSerM4wAfBV223Pq+juh7r8Y/YeAl4B/enDjAECUtzUXkqrXVlKoSvxcWhGnbaJMjbLVHPDJgZyaB4W4og0wh+l0zvuKQD6eMwOACPwJCMiRkJzeKPqPFxQBwOV0AeebKcCtL4K3ve+74MVv/Q747LUTOF3OYD2fwQajDifYeiUYfp0atK8FALC1k3rz6+/CR3eFyM6alhXHrKkdGjayyJC6dHUZLIUXHUrfS6cAhwhABjiZQrmoL7mEahL+MASf4QCKjDYO0DDfO2XH1lfLRjokOvw+8GVTiQQbIANsEp0D1TPVk9SPtmW9xGXd1OYfZSuWeI+lIqcmVn7KEV364o7+zyL4ZT1Ts6a6jybvkXegTFYlttQwMitczBfRXz7NWswcBwL2ZIaeOSfQYzmP9NOrGT3m0Fc9zWxKnKPfX962K8sDbaWLTdPPjmOd2dp/uWWZHULKZOK+tysVt9AjjQC0/Kw9An2ATras83/RFsntTPUEJSO5trAFikspwOluW7uSpIFk2KnyDcG4SZMwS1agtxbhHXk9ufkDH7GPK0QU8AVMhggIhevGMZAimDEI81Dp+yC293tEowaZLuIZRVUv4oJO3NIm7AnwfsppzwFr+H+s9pv06Ok4HUEWn6SErdPp5l25AiwoPM8POuLKPFzXlPBz0vyl87x6CjQnjQfA29STza6f45vEtMjv62SUrvXrr8VHCQC0QptSz2rKn1KAo6YMe9wJFEWAMicKr/NLcDuVlGyLT+zwtCZ3EbdBDmlJ2DdgZA8EKUb7XSSanNiUCBQSaMwGFv7N+TiXzkwXqwALVjhGoBgl6lPi4pfhH2kVBDyumskxgrEuBbr4j0tEzg+IeFis+MK/U7KFjRgvZCXkALg2Zvzc9xPtMi59V82QrD3Zmn/+KgZhtEGhd58HQ/3dbWOUeScekBQ3X1++pfWVUdr9ao48MyKkFa3LEO+EpIHyv7wEVfwbFqjGv+X700jk+7aOLUjwKGLq9ZVo5BRwh/JTnBKOTJsPWzjebuHZ8zM4/dhH4Y//408BfO6vYLk6hQnW7wNs/nEEk+kSZlNOM8UGIKRLp9gIBH9hSvAEjo6O4eL8jADAARt+bM9ghum+1PSCm37E5hdmEcYBgFl8jgPk+gBgL0bH7i6bIaLlZJC5kaVC+QoyuqcwnSxhOl0wx2C9P9hEBzhF/4VoDJUCnGpI84PnkzmshxnAyTPw7Lv/CXz5+z8AX7h1C27PZ7BacoVGSslmazakANdtrB6A05OfrfuJOp0H0DhrRsioA979Zaa9Y4T9ecAr2k8P4FXnogZ5uvRtlSDojY3EV8cf6PHPAaQLe6U8+xS1nKzwEqsV8CsrZTqZhJ5//YFal4bNAbTlc9Qu3ZfUqdxbvx4A63N95fpk77K+lVUylmMxAlDrabGnlM5z/lLLP8G1oE7xTRnTJl7mfaj1kscaj4RukKg5DwLSjikuRjpM1TVkA+pgJpki+mhvKWCJKB0AHKVmKmno/Z1H8F+oARyvdkBXHFpo+sYBt3rAeuV9RK23lcJbKiaTzE9bQCnVWXZDsO8k+6eQAupn3uQAt/9LWQiVWRQIXLcF5eIMAG0J0FE1AO0w0r5k74z93zQD/Nuu2JAQichv6pm6bEwA/7QvpFO6c3uf16pOf1nL/H197pUrJDVbc436934A4CTWbJNhR2ZvSSI12poDOX5C9/nKVohijMhJ7+w3idgHAPQpsKW5GZWRXdCLnvTOVeYARy1apis6oMnIDmc56iF6Q/kn5KpMFIASGb0UQZO7GjZElQWk67BsrL6DnAlDPZ4RBjbNJGkBVQSdn9zcFvHmkZvHDZbkkYoAJOo6ZSmpTiWS4aW+a6RPKew5MCzA0kuFfD61pucoxfH5E+SYIlaewWgAMCjEZPDxmOnUhv+V761Qo8yKzhpAp29PfMrKQPNt2s/0qXkt17GqR3TlO6xXQ63V5Cfuz6oGKuy3yoGJKD1m6XT6yN0+LQXldTx//w797WGyXrZXy8DpOWgIALZ3p1ewmcnsN6WZVPXZlHuKACCCFfUfSeMoX6GbhAidlVERirq3DcC6/uH1c9+b/VuS1/r6XpHjtgNIT+qKzvyCJJta8YtcHxXBvGGQRlJ4/QYWwwZOtmt4w9kZfP5XfgX+/Bf+E8Crn4Xp6h7MiV/mMOxOYDo/gsVixiDgjDsBn1+s+N/09xSGYQAsTbddX8DF+R0Y1mcwpW6/GOnGHYFTHRqZS1gxmkinCYjjHtYH8oMOTrmGEl/RjjDJeU4ObOocZbpki20xTGE6PYLZbMk6czfAgDUQgY1vk/4rsjSAgGybqCh4dAomS4Cjp+Dm3383vPT+D8C951+AV48WcL5gAHAXAcC8pI2fU4+/enqtpz/bESXchKZGzVx/HCYvazKkpY96FllrRG3LljjhoBqhLP/rTeDG1MjtUbTnD/T4p/f83vfVJiD6kL5ixyLvZl1d3QuNM1sajKOv4dWObOa9rS7KwMYRAGBTefWo1wdw6zXP5NmWuPl65DouDrkKANYJl2XQtGyDcIhVN+/6O9D6N3lTjFz+4SIqANAExLBOsQYQl2AI1njwJpKO4hEqvRdemJ5iJZDmZ7EPDmER1I9xjgb8UyNTNqzd79buJ0lUWVpPZ0MjvZddxJ7VH8rG2wMArLFQyX72AGDvAKu/Ax079Iv6KfNlTBMQ93zFggIAag1rD/wZPxD+K64RCTGVlyX/FlnmDjjSwQzrNwMWB94wvK0Zpl/WsUDuHADUF+0ZAYhd5WR48lu2bg/t4NdeAYB2jfoCvS2kWwaoLgIc39o90bPjqwGARo5VJGwEGLw0U0ogP4ErOZT6pMc/Vb/8CgA0KnY34QgiRW+vf16fAGCiAhsJXqYxw1IKQBYBOAagS4r/SQcAJcI7kuiBA4D7mgxOnjoG7xl/PQdtfwCw4EE1IEQabsPDfyAAoD41jynoLTOwPEBttKe7k/yOwHemLJLt0OtS3Yo/EwO/zTF27BY04X1aIz86E8OEU4A5lQr71m5hOazh2mYNz5+dwqc/9DPwuV/9RYDTV2BycQ8W1Gl2DgMcw3S6hMWcwb4aAHj92jW4e+c2nJ3epoYfu815AQAsgXTB8jRd5Lx0z22HhwsA5uPR9g6nJ09jBOBicUSADabNIADI6Tep9l+qx5OcTA0A0joO2Oj3GGB+HY6/+u/BS9/zvbB+81vh3skx3EGgcHFEa5o4sG1fHSaN2gB10j11AfCgAcAmgCnpTP0YhUuRqU/5+wMANgXsQU2ISjVu2/roUoRq3DQGACRbpsBiuDuzCCf9rhEOZzclsgMC4vjN0Mw7gx2lXE0/jR4A36N3r8lgDgB2/LGsSSofhrqjm2BglsBpBeKwx2y9pyxjqj5D0hAYhFe7pABA+kvpXo3ROoCmDAASZ4UbJQqwMIhwsw0wmQZeDaM2/GFpz2OzAGDWtddlp/T4wX+PusisXjyg57GwaWDt/fSMKwBwX3r3I27VEy8RAWjZGY9ZQ5knKWmWAawK3yocOMcGnBUQEI1Hg1DIe+LGsr6ogIlBQFgDYoQ8zul9XwBAxeyxZoqSypEwHWn/hAGAeY2nvsJnODgJ8Z6D+cABQGfg+PF45eAFvm8iIRFHTcc1cGEOAObKM5+/vkaYN0UUpXoSJZV6SQBQEcEbBD2ONiVmsxMiHfxfEIUFIbCPwMSx+QhAZ35SrSMZY1wPNV9/ouPd4S7/mui2kAJcOHEebag98AhATyGRsTlvMgCoVQb+UahRkllYifPTCXrOrxaMCMbe3hGAbR5rRQA6265koZGJI3udfncAwGSyBsXpanzmBrw14Pbh/5qxWjV4S1uws8EPAgCz6MZ8AD0HvAsAUopgZRIUGaX1tDhUiebkAFYHIffWKUrPj2G/svrp+iz6Vb8r1qeqL0IPALQGU4l70r6Osx6ZAswA4I6MRAEAZztM/93AjfUK3nh2Cn/44z8Kt3/jIwCbU5icIwCIEa8YB3iMCakwnXFzC0kBJnpNp/Q5RgDOEGDcbmC9OoPN6hSGzRlFGaJpiv9tt1gHsEafHQABgLXvc5l2fwHA3HpI+jyMSRRIkOs6RRijgyXKcjY5gvn8iJ0qigBcUxowmeiYEhz+i/qfokzCGXocBoU0AcxPYDc9gelXfA185b/8XoB3vBPuXTuBO/js5ZK6M6ddoaNkD5E+RfHZjt6Nh0+1/RUiBBrL27NPWjMycr1yIUfIl8eX23f70a8nXe5HhJ6KzSgvUCe+uzejxzkCUMZesvvku24EYNdIyGWMppn3Jzw9S4BNusbaBvQmx/Cj7coaf3dSuMsAYNHyINFkVXHBtjERPYUmZMp35LfYvdf3F9PY8M5HBwDi3FO39jL5eW4WAHQR3frGgtPpa+4RP4nqCfd2o1gbm3wI2j+uRRHhLufVAAAgAElEQVQAlE1SyjhLdn+Jf+XVre9ShGQegTkmAnAfezgjRScF+EmLAPTsZDhUR0THeTP1oq5S8sdnL+ksqMhzw2Bklo0AzIWr5QONe6RIw55Ost/vDQBmXTFUsXM09rGIshtCluZW1xqPewSg1S+lGmSZCsvorUGqLoDSPdFpK1jvkGuFWjOg4vLFrjN18Yzlsmk1gyZnBhZgpM+KWnhxvQzNPKW5hc8MEOQ2ggKdshM8Db52i+hKCqJSmsWU5Nr3BRPWKIiwD5pMcHkApGTAewPBn9CaiL8MqMtVRS7gc5fDpACrni6XMs72AgA5PUz/+IxE/k5onNM6CdycF+nqLAJQeDi5kGX/iA2R1u7VgETaZJ397kVvtQhzmHmZIPEpbQeGyyDTtg1UpP1WkP9aSZr1qKsCvmwESNaSMr0DjZ6E6snnRw0ASue50jwmBdpZeah5ye0BX8e1yak1Kub1/w4zCEv70x9fjKjLEIebHCyRRbynE2Tm6zRa/YlJuJgCFABAdGguLuDZxRxO7tyF4U8+CZ/84L8H+KtPw3R1CtfnMzg/OycAEHZLmEwWBJiv1wghTmCxXFL9ufliQbXDhmELN596CjarCzi7dxvOz+7AYj5Q919sAIIgmDS8KK/A/gBg/pyW/umlAGv+4n8z/4VnFrx1rknL13L5HayJOIPZ7JhSgKeUco2AHwOAUgsxBwBZD+kkmjAC2M2PYcBOwC+9C77mA/8Gdm97BwOAFAG4hEEdSmA0YKuTdg9ga5XY4PqaWUiQ4k6JPq+5aJe3DWo7thYJpq+Xa3j52k0EeuLdj2PqDpDyovdmJCZ6qifLy9/XebhXo3XM+x5XADCuS0dc9my0rn4sgDL76H9fY9eCNWV7zTy/AuD1xt2bt7yDt6/en14iWHvNApql/at8mSxDp2Sn7mcPetrfbwDQ7Ikib9kAGAYBM45QH0gUHWsNPhBqd2aXm9kl9WmUye6mldszasqvny2x40v0BNkSXYFSNkHilxbIp79TngXruEumACf61CWZzQDLr8tMfaPP+rphjAw1Ev++pwC3Nbhk6AqN5UCE5638ew+ECh4Sk9d5FhEERGwFvScEANWT4g6vqHzLIzkA2NM3eQTlZQBAJx35T2H2Ugqcr9VQN1yeBABQb1l7Yl5iZw9ORdXB5mnHguyf6HQUgDeo1AYac4KqI8RKsxOGE3M7RgDWbFb3EAsAhk3VBAHDfB8GAChgpjoFNgaqA6No9Mbg8GszZuyeypc38scAgB6C8oBZmz1LAr4xXh0MNJI/Mp7bGwDUM8DC8qWUypJhFQR2PFXObxSwIDNgMt6sqLm9AUBROuOJZ/dXvjbNCEA6AGi9K6RAewBwpFZX6rNxx+X5/zIGnh9ITz4/zgBgCTz18kknO0pNLR0xxrvnck6Gj5Dnd9Xr3IxjG80PDOAx/hb2udMdLfmVOJv/Jfs53oPPdCloWj7iq6QGEN4z3e3gaDfA8cUKnjlfwfkf/T588j/8bwCvfBam56ew2AFsyeBbwAQBwOkCdpNpdGqwBiBG/6HOXywXcHR0BKd378Bk2MKwXVEE4GIW0l+fKABQ+EcDgLoAfNL7DACyDYm+BKYAT2YLmM8xZRqbgEwpIhIAax+uAwBYigAUiyQBPDgKjO0b5kcw4Bq89NUBAHw73MNU68kUtosFOZhUIJ+6NdcBQOGTGlhAxn6pRqdRSVjLsfzDxn5r7x0mG4vW6j6AkKQAj0VLRmxwDwC2I9AOn7/IqPLQ+jXmelPqOWQ9/dJ7fu/7Xspca+nG8LdoBz0Ozd5SHqHF41mQpTI5SuufaJb7Vp6eNfq3gJ+yXVeaAcqokvuur7X7N48Y9Dz8egMAvYYu29mkn0MAtwUA6zWY+UmBvsHWppRyX4ett4nU9/sBgKGAiMqAsNa0XXsL7mReRRGs9DZLFjHrfRF1+NYHP7ELbf2Aqqg/HksAUKjuea2vP1TAKB0EWgAwFYhJcifYkpXsFbJBaIsHMJjsQZeHE4abRssfxFqDehpa4HX9tTxCNA+6cnyXNwHJU9yuAMCWBHnCAUA6Dc9BgOi8G4Ag1WQZaxNeAYA1/hCe6gupGveRnHAGvQeUvQG8n8CvOfNKQjmLTACIsfyRze01BwDWARHeG+poSRa0mThmKbYvAJhFzD0EALAlPQ+NwugbOW3rr+egPQkAoN5rGgAUcEHgr3QgVDfKW4BaTslkgrMoyo37Hn1rjjnDdS0AMJlVdYBGGV4KxE7bK5e92QFJOFDDJyEAeG0CsLx3Cs/cvYA/+oUPwcVvfhjg9t/C5PwcFlJvdTcnEJA6CM/mBHDh/dvtDk6uXaNDChzzdrOBYbOBKSFhGxi2FwDbc9huL2AXauA9GRGANQDQORc7BD8TAEgNjzAderqA6ewIpjOMnEQ6IfC3pi7IENN/uRuyjy5kCEcMaDa+CQDcMQD4tf/6fwL44nfA3WvXQgrwgiIAZW9gnGEpAlD2QavERik6l0ZyHwFAox8Km2Xf/ZXbY40KAA8YAKTdp7ou+ukdqht4GYKMCgatpVfY/8XvxqEGjzsA2PFc6tUfwo1av5bsTRaPyX8oaRZTQ865Gm0AM5fPHkS5/wCgGmCsMVYDGIS6av4ZoPL6BgBzyo0EAImtBPyrWyU6BZjP864AQClD1reNXwsAYA2gd/uuoihlu4qu4IhkhdAZBo6oSIjKtDXiRTYJ+If2Ih0wqyjV/PAhH3+OxgQ581AAwHA6q+EJtFijMq105cyVNS+An0yestmuYHPpEh1jM4VUSpuIGQPAhvlWFyXW/POqNjylE4Lca0PfTSJsRgBqIVo2BXRNHqPO5BQlAgSpHlrJEOiBVPH7YvSf2ljRifQULyhS5C/X1VCEX+Q9Q3+rSHgo9oQpNyjsOMo1CzXlSimidQXW6zFa3x38zqxrrwN0DgMAgygMw8+UeebtpAhJZxfaaSj5WgMVeHIYoZaXJOB7+CH+BJlLlBoPLEnP+Hn6PrqO2YCFvrlbwlazokZNOIgD1bDC7fqnfTDG/cj3oZdgkkqRBlgGABv8GW6QbYvyqmjkN+dYkT1hkeuytUeFPMJ632fx9Cp3SQRYdRi5MZtfmjsx+prW67mDZfvHAwRen6SUXF61etMNm4rTo3zcg0qex72kRr0vQBF2XdzDqQJZMMzi+4Lp3yRQivCJO0NdX5K9GgDESzGFg85mJxOYDTtYrFdwa72BW1+4Db/70z8O649hA5AvwHw3gSPsMrvawGQyhykg6DcFwOi2o2NqdLFab2AYdvDss7dgvphT849rJ9dgt93AbrOC9foULk5ffQAAoAjc8DsuSps3WZL2eFy+598pBVhHAIpRjas5D3VUUVBLd+Q5zOZHMJnOyIHbbiTyTwBABv94bcKYRS658aHRPcwwAnAZAMB/A7svfiecXr9OKcDDfD4aAKRRh5rXwj8Zuzn+z1Rip8ty6kJfkRw0z7p87jt56bk1u6329AjoO/3vR1odXWFvenutFwHYqgHaklFpWXr6yo5+X3nVBQC9OTJOsLqrGt7HnhE8xbVr2C9aO+b8gxFysrfL9pKnpz+suQwAqLcD0t8PX/Zgc1qqDmyiiZZlPHOU11X7oLCWWUkaVa4o6bYQ0R5TgL1FIHu+J3s7Iws1CavcU40+rtuLdg4lyaTlc7LPJIjIRCyIWorR+RKBlZprBKslEsjzj4AtRKkCANiw7opyVdcQjACkMDG9PGVA8tisfMlpbX2NmnzRPCvPiJK/mwJc4B/Mxip2kLfybr+AkFLX7p6Fup/Ay+RBM5JEugDrMQjVnN7sAIAipmNEIBl/Je7hd8lBmranhQcNAEhNQJwdaobr6afWp0DaVL24TNe9U4Bv/btfT290E04GkKny1RCIluilEzytMEtGuZ6WrNm+LFZ7bslQEXxBT11fZ4pWFx/gNby/qI1EVmrqJ4GH6q0apdM2DqOAUgQsd93NmckYssphiABA/Kwxvy4IGwRqUEQxpawAMoji0SmeZPwaA8Aqn7JJfYhFJg5OjSOVASFskHkEaVQ0WncCnhuU9QhCopcTkOUU+zTecopCnVIxrsextQjA4vQK656J6HCNn28/JV4L5UDvjNZJCQRxrSZY2sRtM8FSp1BToWFptgF+VGAFeaFH2xF+JUDOVDjrCs8kQ+Klip56dLjmLQCwpsr2oXjvQMS+Qw6YlJHlX6Zj/EsGe6dGYst8Ke1ff31vPj0DrF0yo0bZ8UZXycYZ/1S7F2RttEvmjwBzO6z0NrWeJr7Lvq9fK6igH7Pah/W9jx1oKQKNetHOYL7bwcnqAp5bXcDTf/PX8Gs/+L8C/Nnvw9HqFHbbHQxblNUzwMYtU+DIv8X16/DMc89TNOBmM8CdO3fh+OQIA99gs17DzadvUiOP83u34dVX/hY2q3sRABwGBBNbEeT9GoCxRp1pLoTPlOpbjXq+VQfRWGnhD9F90ZQOVauTLOYEXYwAxEYpAgDOYTqdU/0/JAruBwYAMQJwSzX0BPzD79gUsml0qczBjqI0hxk2+jiCyUvvgq/6wP8I8I4vgYvrT1MK8Bq7NIe0XYrKpBRgPx9nuZqakXU8LlJg5AbqXq+jVgtbmnwUpMnI99EjOhkD/jW+qL7X1y3/LNqf1WOMtv3Kw62n6Yrsak1fAEZjIqhJ9gC8liRl69VppH1qWKnKBvX36H01Xq5f9kpTAqH0EMM/AgC6C4UkIxR/j3Uz+NbdQN+r9+nz36iPwj3Cq+kRcm/iDjq0UVHFbJ+FJ5WUpX5/Ri9fYiK8RxnN5b2rubVuwJX9Y0ugZF8WnpPVIMwNz9w+DXtW+39m3lrel1ZX+SIhgIHuoI8ZALQyJT+m01HMtDtcyq/+e58mMzQCN+SyfOM9maRX3QHQ75ex1vZmVG3hgjHyjeqLFH98gRbRy/p3fmORXuoVXryxfVvn0Z59W9Q38qE67M1H2novDrjRfVqzuaNf1BeBH31Na+maXtNcpBNCCjBJkgjCChH5dz1rxc60iX/2hHwMQGnIkFs/8BtVGcwOH5Yy1A/oET49TraIuTuLUGoToz709uyTUOHrqrooaIxSagQxdkAIx6thzRqduyjCqTOP5garsaGes61x03NIa8JEKBhP+A0AWJnEGAAw66pku0C57UBdb+NqhpBYZ4KZLswFEec+6psg+oY2QDWeS4Qn/Ql4valJaWVKAGAtYi7wBEW0qJ9KhAFTJc2HhFq4jcRr+EPZMumhNQBQGWIRQHQRfuP5U8amaW6Nj5bz0JOd9e/3W+PefPIi07kCaHFo9/lN+ZLLD3+5eTdNvRxR0eKD3g7T6iWLYHPCO5+OM8N8xHXVQGL+bjUA6PEI7YOOw9ddn+b9uqt5bzSX+97ryX2e0k2BDF2IZf1zA9jxX8Z8PsHTRlePG3tBR0b5xHu5ahtgdDjWoUPHZDKH+XaAaxfn8PzFGcz/+I/g4z+GDUA+BdfWmLa7o4a8lCqMKa2htt3s5ARObjwN6xV29OUi52icbjbnsF6tqOnFbDqB2WSgGoBTWN9nADA03SgCgKnDd3XdR4GAVlfEKL0I1MkaSASgBgAXCgDkDsDbzSrW/hsDAMZ9TIW3B9jNlrDdHcH0K94FL/2rfw3Td34pAYD3pnNYz7gLM1rgBOwaADDJdsM1DwgA9FTza9C27kQZp66X++xdudbX5MvG4ORnBgDKJAov17u3PLZ99n/+hDH7PwcUlJkyIqWqR1MEALXY6tXk889rg7f72Rq9sY753o+/x4P7zteMoesf2AyUIgcoAuI/tZ1KrOmEuweXbD1ctAcSAEj86/WzkYft8j6kWWpRWGFgffC+zgN59G++WgzAVJ4RAMAshpJoxlxt7ZvwfGPs+RMFa4Nn/K4+iPJXASKt/SqmYAkAxO9k7TVddJOhSAVtkLgITXNvFaip6ImSDFT8k9s/+Q0t0hb3b8O+zf0fmXjdIs9rDNq35gBgx9/cM0LZvL8ZodpybMgyzzd/aX0c/WJATnR2bQ5KCwCMHmkQC4Scmf2f6P9QAECSf20dMrkCAFmsXAGALfNAOdnS5U8BgHmi9xhTIyiZhw4A6rH1BKJIgSRsehFde6ULFACEKwCwiVipxbsCAGkHNWv4Neo7ESV75r3bxw8CAMwiUtReC6/XRvIVADhWto67bowTXXuSrTFoLHv+owQAklMk1zpDNEORtQGlmo/FiPEef1d4PDBR6YxczxUNaOpGSzw6hyUCgOdn8MLFGbz66x+BT37op2Dyyt/AyeYCtlts3oFz4yYfGNU2mc0p5XRxfA1WF0MAumbU5GIHawL+UF9gJCCmAGP339lkS+Cg1AA8PAIwgW0mRZciAHfU5KSZZ36/AUCsAbgLdQB3M2qUMp0tQgQgOtxb7n6828AOuwFTR2BO/61FAAoASM4bXj9fwhaOYfrlXwUvfc8HYPrOL4MzBABnM9guZrDDRiwE/E4ZAGRmNZEMIhkR8Ko5nHiXdpAzB3PEFmyZ56OkcyfCuTeEMQCglrle3yisIHtVGQDUe37M/q+z5xjZdQUA9jjAO/h2TXo8eAUA1sGUJxsAZL5I+IiAf5X5CqIRAwr4ev2x96Y4sj7JV7y2d6AqslgDKDoS0kcDXgGAfr3af5ebjCQZkX1fLdHE9xweAVjyB8dozV7t/TC++w0A0iGkRKWy/eokbPozs3f3k9Vjrj4MAEQzCdMy4pvGnEgpsIhZwMTf6ZpescRnxefPTzjGTDksrEPva2Ka+fe1DQCKCYU0uFwXZgcAqqixfo0gvWayCloVoHclzp2cWdTbwNuSfzvqYmrZRza+N11KTDamyKy9LzeA/XPd9Q2WpXMKJyCeSACwIuL0amtZR0o8AD8+orIHaFnpqUFALWt47e9/BGAOCPckUm8+j1sEYG8+tZDloi6rpbCpLeLlcjECMAyqrA+cvrmKAOwuoZfI9SjIunODz6gCgOEFAqykJg2yL2tD9DI77GGy9hUAGEofjAEAmiC3AyjzUaF+wI60KE5mcLTdwrWze/Di+Sl85sM/D5/5v34eZmevwtH6ArYDpgAjSLUD7PaLdtN0voDVDmB5dA2GYQYnJ9dhNp3C6elduLi4R+m9R8sjWF2cAwxbmE1wvhvYbs4JBEPg61AAEMeNKclCP12jD+vXEADY/ekdypTswlCvzziEWEIjAIAEAgYAcLqA2XwZAGPsiIxRlwgABhCwCQBKxE6A8BAAxAjAyRHMvuyr4KV/+QGYvuNL4ezpW3B3OoFhOScAEME//k+igG2Yn3DiFQDo8n98Bk+DNdJul4sERBi7//tBHL0UqSsAsLu5zQVPXAQgKSKeQhYBKKmhSh/lNXCTzmFtgyUClB9yUAQgISCFGPMETuwdAahUci51c7h2XARgjUekBmKwrSvZQvbwRMbAczQen0rVpScKnZWdKIUpSiOSZ+kDGcpSdM8lusjFCuDJrHdyiJX9GO4x0qoq35j6OcXtyH0KsPBpneLu/t727UYAhrVrPkftAe+PugPArMblIwMA1caPc7O81yMdUeY+A4Cc/psQl3YN28jR1aHmFU7bNrl/0CUAwMTxqSabSNBc5NQBCzH/LQOWmjZoJZ7VBNtvvokVnJNJjyluZmYaESq2RiErArm1LAtKA8ygj/ICP+AUYKa8XbOsq52zoHKAUG2qQAgW6+U5eoMsKbjSPWFsysGLsI1qPqKJZ/lNAEC9BiUAsAzc8F3tNvOxmUgYhH7/WPCzpkP6298qqJyJ9k8BztVLeYPFdaRGBNzJ1ivG1tb0fICCUf9gCjHp304EW12Ia/DPORiBP+8PANgGeHtKpje/Jw0AbB4ghCLMkSa0RE4FdtJ+WvQiGChjOmXABVWjV6wITMoAsSnAJfWLaLUDbu+xjsp/qr+ly1+9mlRowDVrzFr9bQddqIeZzUqvhjuV9WCtT8cJ8jkZMXbPI1V6EQMHA4AIwtE4pnC82cAbdht4+vOfhd/7kR+Ge7/9cVhuzmG+XoUUYAS9Bj5kw2gGbHmxPIHpdEldbhfzJaw3a6pxtxkuqPnHfD6jGoC0S4YNrC5OQ1xEqH034Qi4yLKhKQX/3a4BiEsvTTemk7lqmEWUo4YwvSYM45jU24WyJ/NGIBYAnFMEINb/iwAgpgBvMQVYdwGuNAGJzgm/n2m4BVgcwQaOAN7yDnjnd38PPPWur4Wzp27BndkUNhgBiDSnZOEAAgr/K5NGZtADAD19GnhYvjOkaH2FyKIfW+lC1PWyv0jVK0bJj5r46byYxz9V9Y60DVgaUqkrpX1JMQW5Mf9DAcBehJtPAfZD6d3fSwH2B6S95+3LCr3nEf32fejY6w9OAY5Skf4h9oGPCEvDET9PK57EkzFi1QCApfpR2t60k7X0zGNgfQ3TLEXZbRG2t8L7nBOLn1JUtFmh0h7L/XZWH5NCAIWejwIAzUGOpqjWyWIrJB9M9AtdJSWbAkMJABiGQrNo6SMP/Gm+lOcLH9R4QNZH7EIP4TlrpdMlu+9htGsQ9g84ulupCQC2CpyEUrrEW8IzKH/tbmeWu6SGyey77mxcxGDNvkzjScNNc9Cg7j4ZecSHQk8ii9039IZQo1Ko5DMAPADo8YOcAi3pygIygYDh2qbSsM+7JADIBOZHJRCMB2+J4gGZRPzyxHoRTk8mANiykBqb5yEAgHq9igalY3KzPi6cOxWQ1qc7apNqPSVqixg4d/zSuCQC0NXeiLUPrULz/BN8rbCvwrWZsioLElYotfXx3B/+VsKwn0KWdkzZ3OVPmwZW9dRN7UX1AOlaWBS1BYe71hVUA4C4VrUagMV5FfjgyQYAL6kARwCcTxwA2Es51gYEqQplno4x+BvPFyPPrkaSD8moS1wpnxX3w+seAEw1bsv0UQZ95YIe/FBbK3mctWVEkLGgSka8MI52NkINtx7A2TqjD/K/pQMoCo+clymcbNdw8/weXP+bz8Bv/+D3w+7P/gSO1iuYbtYU/Tcg+DQJKbWUYosRb0tYLE4oCnB5dAL37t6F7bAhkGuGwXD4fARxhoEi3jbrCwIA6WAKI9/2AgC9nMIJzijqjjoTT2bBwWKgEt/RirhImqljpIpNaNLAwjuqEYDYDRgjAJcdAHAT0n8LXYCrAOCSAcDn3wTveP/3wtPv+jpYPfMGAgBXC+4EbABAbwOoiJTXAwDYWt0eQNTSjGRvTjU8UQIntGCpAYDpLT3A0oupKwCw7XT31vfxBgCFL4KLbNLvtP7QdjYefATJ5mxr5k5uuhgDEShAerz9V+oCrHdAFwD0Jbr1gU8EAHk8XKLiEAAQa9DnMUbaekoAh9LNKvgjBUEEzMD5jKJfKIBgBzDD90WBE+gs/kJIAW7KI2VDxiwiHfEnCIVgJeE7UU0I8EQEI0RntjzAdoTx/gCg3o2Re5sOYHv/tk6w0+5wz1D0F5ua7BYqCeIAQOfLdUaT7ZR+hKt9ot0//QPmDAAs+st77F8DqO4PABLIHczmfnxon5q+CUnzmYW5P3IAMMqsMFetwBPMmJjuCgB0G+KAJiAJfkqURvoboTYWAFTh3BwxKSeDdpN4lvZrnBxy5cyFjoACNpu0HAeReXzAKjDkIxt1wALIg9jBIDD1f6whKiYDjzIpv1IEYAv+bZkPWqVWRUEFABR4kgvxK5VtIkTsU/WpGMsoG6ZvKCAyM/BHVBThYKSnpIMMDIZKHrn1ZEUAjlcgGf/3ALOOgalPPUs80nOI2gZMzyHL39h934EAoE8x1gaE8GANVBLZor9P8qZAvSsAMDa5KsqfSLzybh93AKLhtZzf8vWRUwqsn8LSU9wdlnNJb1ANoU4X7XYEoHxbdwHYweJ052ubNdy48wqs/uD34dM//iMwfflzsNhsYLLZEPiHXXs5ApD1EM12mAFMFvQfAXGYGjzFPhQILA6wpXp3A+wQQMTutxQNeHkAMHb9JfkeOu3CjKIQmXbsNO6wxp7SLTmO6rVTS8uFNTkYAMQuwKkGINYBlFRoqQMY11MEg2puQqtIEYBL2EyOAJ77InjrP3s/PPO1fw82z70Ad5dzOJ8DDBQBOEsRgK9TAJAAuo5+akXkVB3MIEwYANTmSV/feACFWSrtz6xkSMd5vgIA207mkwcAelmdwD+R095OiDYE+SzMg2xX2cAE/ub1BgC24E2tX3mj2YAB7cPperxCYwaU4nooAFB0uiRIi+rYtwlI0SZWgKDnFumaLn6pzmzyz6JZNE3/wwDAlm8oY+kCaJ0Ulny3SMRJWAHK8MojNhNGuH8EcJVkIyICMwCwLb7QdEraJu5vxQBhAevL6LyJQwHA8Grhr054jz1cyOjDAKj3d/KI30CCywCAN/+d6gLswKAEfXiXSitkdVTPIkKpf9/SOzc4PKL5oABAPTLDU4Fo4lu0UjzLTNQyakRAVrj4EUUAGsxoJADI+ygoAaUIOIybf0TQl2ebamFYVBrvQivR1uMpp9fugsEq8BfzU1oXdry00yff+SgPMSzTk/SoEw/bZ+f824qAGWMgd+RbNFZKykm7x1Fh6JoMBYHrhQkbQfbpdvaiqgNZAx/Ea+jvfGdou9wbZKJYxzgguQDVe6q0v9J+TOq54yVUF6G3gv3V6zlYvRJcen8VjR1pylMTMU0DpioV6xTpAZoeSXBtzr1Bla1MoS26iB7PR6X4XW8w9aa/bwqwH6/5u/eyPrvwFVqgNuODuQRC6Sfuz0aEHO+/dgpwkvhF7otZAnWZr6WDtg2SzqhJH5IshmHCfo+f1QDAJPWzNpBuoD3JMOy2nCi6A7ixXsHNV1+Bz/zKL8IX/u8Pw/SVl2GJ6maLoNWWIvsYAMRDqC0Zb9sNgn1LmC2OYbE8houLC74GNjCBLQMkW6z7h9cPoWg068rxEYBR+oc031RXFzsSSwQg2XO7AXBOCADKqT+xnPZ2MkOyZuOI/HUn9XS/0sPxb10DcA47AiaxC/AyNAg0GPAAACAASURBVANBYA67KXMTEAYAV6YJiE5X4rWVdwc7YNjCZLGENUYAPvcivOV93w3P/d1/AJvnX4R7yyWczwaKABxgRh0/OQ1Y7aHwT5mxlDwwW1LxkDKLog00dpvTdT0Hzh/Y6nf7kgt7vTjsv8bzmS8aOySaDl4GpXsSAJjv/ThcdbuuyVQ6/NIAoNYLtalzq5vyD1uebaHN869dgxB7K4KqQz+VJVMb4aNMAaY90DFQehHgPZZsAyylFEm7FvF4KCwy6gttJxh7gEC/cLgSAcAABIbdmwBAti5YLvpZKP3i9YmvoeYi0Nm8qdcAtORGeel5L9m89QjAAtUrhC6YW+ZmH2FlH5MHVkRSBcLLAYJkEM1COaH0koAAhGnWDhxiBF+4kd7T2Lp5sEOgezzQC/KvAUollVh/EbNH4/vO/mlLHx0tWdlJXQdCUzocp6qgDnb/4ubhRmYxpsQGiJRYyOtFT/ds55i9lEvm3oGEfd5EpewGcF/2dUFH57TO/UeT0huZjO/ktQ4Hu8R/ukamyrVUNQB5GC0NpFJ8ZRnMJLVy1MFI/NwMDNQGSQQP61w2ufWDv6VG5wliJxi2jNp5gmDVJuhSPwsnjj0AsKdAet+LAK2OUJ+CZ0LFglv1d9UXmBV43YDojT/RvHRlz32Re9L7KQIwzJN+jwAAc/AvsHVps0UpwWOzMxdRqZlaeE4McVEq8rl+gji8ad7WAaaYkMaG4xoTZv5ulEnhjqVtewXFGKle1dPA4cZ8zIEzXISoplZPGNcEk1V8Pm9TlIKA+7kQ1ZRrzb9s4Nv1ZgYKT4y8mr8zp6+OT7r8WnoD3L+np7D6AGBjbGGvtlIUU1H/AoeNSbntCKB9KWdLCJRWxX7m+TqLUFYQUzytDQo2sQbzTNuYKk+0t376LqFFlSZj6N0BUFtz0FshSGAtHdJQw0P0OOuOVtu41e5RkYKt+cR1cnvaPMiMMp9P40Q2mlzZgoT3maj18vq36E1ykFKAB5jv1nDr4gLednEGv/xv/y3s/uC/wvTeKSzQyMIGIBgBuBtgsZjBxcUpDLs1zGYzWM6PYBimALMFTOdLeOGNb4TTe3fh5c/9N5hhmjAZ8GxaEji3QRBR7CadRlvT/zJ5AcI46g/TfXe7KcwIYMP6f/g3v4OiDmEbGpyo++MO4vGkH/+37DalowOD0XxcGpgGGoEakmDu8zymJxNISXUS8TumOXUBLgCAyV5MeohMaOy+TDIAU/zmsJ0ew+7Gs/Dce74dvvifvIcBwKMlXEx2sMVuwJgOjfXpKEVVcYGk/8a9bE1svQpyVytKoydfKIOhIWT3B0gsn/RrZNrrfY3XtvyX2sB+F4W74v6rS87e/JItkouGMVaA3zW+ZhMzXF0J6ohafxVxhnagiyq4TcHsYNoASEjftlbr6udOiYQxNUBrOyBFYFv/wnGUlfZZ07vLu0cJ/Ev6n2wEZR/EQGEVzcXZS6HMBNlYTEVqhoX0jnaXB3Djjo/M2ANIrV1CiL0pieTxG6vjEQCkhEL3I/MtAAD+SsMghX3a0JF4dQLkhUZWKySrK0jmsL6abbUfQgCg0/9ROmgxLCY/bzHTiV3TNJMPLh1YXiWRiyTtKU2Tf5O6qmx/1nrMD+WfEE/a2KK7od5ky3NTcZ3d/vc1JvmeuhTQQ2NwnA8Hk1wRCcTPEHkQswMUf5T8NRmeXuO+3ynbx/Nv6cBkjFWvfHrMbnD8VfUOsoC3/P2ShRKpHOyCgXCGoIGw9LBEumbL0Vsbtx/c5aXZp89EnugJK0Q7HhDW5fPk5g9+tPBK9YrshFKrXUl4ruyPUkii20wPCwAsjZAmrsNGlZKozGjPj0WAj2HiPR99ycs1IEr83wEAdYRYdAOikZwUaSAlp2zhhUEKdEOY4yZivrI1JZSDEQQdAX7KiJgaAK0NAOKwSMA1HPUeYLMv2WkGDSttTFdmrSC9Ka27amvFmNbjksBIVCtuv8eI2QQA1gCqnoPkT/VozEY++AOEFNkyZh36Afr9p/T4oefgHXo/q8i6AdLEk8YAUi37YcT9noK9+ZrrVa0t2ZNRPqlTyEgBZ9izMdOOwOit8L4Ocsuerru5aRS1iD25oqUpyoZVDs6wXnMQziVUkJb3PToWv1cNhIrfR29HU9UJS2NAa1mkKeYmJ4/Q/FUYQOlp9jLukjuFLSyGFTx7cQbHn/oU/O6P/ijAX34aFhfnMB0YANyGcZJ6wk6+w4p27WK2gIvVBibzI3j65jNwdHQEF+encPeVl2GKC0p1A4Wxd7Bdr5RBrzvpVi0Y/iKmwnI0faz7FyIAUU/Q4Rel2CLIuCkAgPodnq/031ovB9q3AEBytoMjVAAAsT4hNgOZzhCoxKgbDQByN2RJAS4DgEhCBg8JAMQGHwgAntyEZ7/5O+Ed3/QtsH7+Bbi3WMB6OiEAcDOdwxYXS9Wo0/uGnZ2W7GVa9fR7L4W2Jw8ute/UTb7LoZe/PfndMF3Y1qsZUyOjSFv4Vlf+6IOgkYTaR96jk+ztK/0aFl+5E2uvyeVz+r4QQXUZALCJYLRXsFXjb4z9hO6htk9aEWtMLivrL9tfQPYe+xvJxa8CgFEXiP3PtiU1qRGJq/whATty+87aw2MAwKSpLgsAlhd4zPrEQ9PC/iDvreegOQBL71deyVBSKsp/m/WnH4+zyCNmmfpeDgjwguxCfpsjgf6TnhA+yKdDixrnKQAg/saoxBoAGOdGAGBZuPA1bRq25G/f/sj98xwAbIcwmqGTPcbgnwYAtSWF9g6L9JQWnADyFH8vNFGmVrEbc9KSZfsF6x8bq8Mg4mMoZPknl+/6+X4hre3i5ZP3X7W/mmBG9kEEAExySSvhunJqzrCTMi220D4HkF4+XwGAVwCgOYLzTUAEANRKUgRu7AZshK8FAIOMjDvAb8Ei4JdFesldIQLwEgCgiAFJCRFj32+evQCMEUZnz0G4DAAoY2dhY5NYrMDPdVfNVvRTSWYri6gUBRq+UTUgrwDAhoDfN2XWPeq1DgCyCRXAKmI15tB02qgo8IAAwLaL1NjkFYC09byew9/an68PANCYg1QTTzvMZWtcU00tyigAsLVaXMNottvCcljBc+dncPsjvwZ/+dP/J8CdL8BidQ5T1EUDZgHzcxaLBUXXbXcriuabT2cEAE4Xx3DtxlPwwosvwund2/C5v/4r2GEkngMAqQ6gThsT4KzGhvRayTJAXcAdbglUo+Yf8h8CazifAABSc5FNSDkuPLwJ4IjZquj+yABAPonHCEDmDYwARH11BLujp+DWe78T3v5N3wqbN74IdxcL2C5mHAEIcxjwulmKb3o9AoCe+/ezf/oAYHx+IRigZz5dAYAjIwBfpwAg278si6JuTGcpEloQXZAUzKAAoSsAsL0NmwBg8A0UguQBGO9fZSW+XIp0fFQQxgQwq6hsWnO1xgLKCEBo3xdsSbInWZoQCBlA+xoAKDIrRYQ2YuwcfpD5Ud0uvR0p6AJ09gUA9dNJWofov0in5FrTcVcVAFS2VDFwQ69LMOr50S2IC6MwewBgT0vwyzRgb56IID9Fakc4zz3QCk+NP+4LAMpsLc3bEeavbQBQdqsKyswQyBBGz0TbgY3oGrP47WtaBg3LGCkMG0YwFiEZNbTXTgRgAv3SXpITEAs6sUpOIdeKUAVEO4FHyqnIAMD0DJ8xOyYFOJ7m6C5TNGhJ4UjP388A7jPBoQBgVEZBuohRLPIMT6j9KVttVGNDs807gwBvA4DlNyYBWt9U2cmfjwAMqRqyhinSZQzt26fz/Sf0i6S/JiIAG4TYFxy71P7RBt5DAAD1nIzBuqfst/tkDDdx173WzxgA0N6foPr4eXhIMmRFu+Zvbr2v64D3pnypCED30CyFpjTiywOAeR2V9H6afwAAj7creP78DD7zMz8Hn/+lXwQ4fQXwM6zfh6f8NMzdFObzGcwXM6pdt7o4h8UMa91NOOUUpvCGN7yBovzufOFzsNuuYdisQudgjnyjCLZohXaOgEmFkUsT6+gi4MdxFgz8UZWyKQKCXP+P/+NuxTusl5el+sr8ffS15jNntiohXkwBHhsBOMWagNwIhJqUFJqA5BGADBBLBCA7A0jFBcDRU/D0e74jAoD3lkcwLOcEAA7AEYC7GUcAxVR3Sf+LDk9/v7ZO4B/3CEAvPXryye7OkQCgRJQUUtV68ieyeEnWPDERgHVBeXAKcI+AI1KAazo+xSfWr+AIwjSIhxkByFQNAKADhlgmpOMi8fV4n6faZlKiKYkwfSDAhyae5/XfqYRDTxnKaKMFz1JHbcCSvdwqITU2ArDFfa0IXLqvAAAmirjkcNfF1wMotCbagYvp85bGUbtgZJVUk7XnemZtWXqH7O34qAT48HdMaI78C4fK+BEFvOVJ7p4f6nZw5RuxwTopwF2T8xAA0C88RjSH6D+JAIyRk6IFKYVWAPLAnCHYg/dQonV8vCvJE7SCOtX3x7Yy6x4AOG5PiY6g5QwZfs6Kiw3l2vlwWFMw3XkZAFCPOPFxfR6PPQCYDV0zZAf9zjZ8Ae23xpMAgPu6nWrR9ogpF6VQKxMsDD+eDf2Vjx4AzIzTIIBFYPoUYDODsL4R8SduTV2E8RlZF1odzRMkc1vIyVrXAECnftX6huEo88MqV72VJaUn1TjgwYnoj+DYHvwzhi8OAQCjAy8vKpzCeADQj8l2SQ7f9raXARB0mkpSCHImFvmoQAwpyNyKoS/xRtp3/L6keFIKsOaa2jqMMZCyHbvn+j/pAOAYHt7nmscdAPSs7w3g3tbYhxZjrs0igLMBOuNY/0mbR2SefVu8TFIcqxutXQOnVS6B3t5sEsCmYBUgaYw/zqbbpaVgQinhUKYOP51J0rgCHZphB4vdFk42K3jh7Az+/Cd/Gj73y78E0/VdONqtsIMHpf8OW5ZNWMeOnUJsYrFFGI4j0mZLmMxmMJ8vqNvvsDpjAHDLTUGSI6lr6CnBX2OmBgBIwGDoCi+1QgUEjPOO6+fp4P42EVyhVpY1FlhWl2oAVgBAjFKUdGVuBoKgZQAAsUZhAAEJEEQaYbSkqplIcwgRkiYCEFOAYUERgE+959sJANy+8EVwenQMm/k0NAEJACACjlrfxdTfvO5UaQl6+t3f42vQ7Qe45SPwKWZjMgr0Uw6TdxUA0AF+cnjo7ezkotclZbSBwsVav4j46DrR6vE9fe2szWYNPn5/75CxN7rWCuSyzaz3iEf7S/z8u/JxRBMQo5IaTStyfdF6+xjtyRa86hOfpyGawSXwT+xKkjdqzPpyWtlmE5iO/ijZxE7f+PWQBol58yt+mE45xrXlkkjqRb2UXjcmvrXBSN0UYKEBP0anlJeeWgoAyuC3CNwGCx6fK2ddquxCDvCaVJJAL56hyCCMOBO/gEhFgE+yBIQclg/ykirxriqCGt6rD/Mc7Zvgj1zrAED7CNG34/YK496cAoxAIBXMCDnzzDZhP052/Hnk1VQ2K0bahVfqNRZbT6fkE38HYvK1etb3HwDMl4PnwXo6p7g9oHvtA4CeU7opwBlrHQQA5gIzCxGmmqeXN0v2cUDpLb0Q3p6Sbe691zYAKJI1L+uaBGZPHyXhr8xBEwFo+cEWxc2bgqQC5HphEhTkS4RGEFBOMfYEgHqit+cgtAz2aPzKSy4JAPbG2Po+pWhbBREBwFY9RaKp20BKQtccgDTvFIUiAK5EAMaTq4aouAIAR0rSmoy7hBjeR/5GvntIEYDemfR83/u+tE8ihnXJTdZ02Ml26S2CjWA3w2APoapNew4068c2Dz0cALClhFsCqAnvMak6qYk4v8WwhevrFbx4egZ/+iMfhM995D/DfLgHix2CdwIAptp7DEwhWLWlFBeMwNvNFjCZzakxiACAw+YCdgMDgPwjgJZ2jDswCS2STgGehxRgjARMhzdcSz44DGKIG/7yznjhb1Hm1XSaCgBIIJ14AakJiAcAZwQAhk7FlwAAxY3DSEsBAK9/0/vgne/5NhhefDMBgCvqP8JdgLfUBAS7AQfaED+oGMMO74ft0Ws0bbbk6woANAXky2BPVoKlIEfjnVSPP8mCnvwqieQHDwB6WdWRv5l0NmhOBs7sNf5Sxo1PuWt4WwJwtu1Dhz89bAAwNMHT2S06RVT2aIBjYiRYHDUdkKQ1y6ReT/22DpA84aKxkB6qAUaeA6d9l8AKklIKkGX1jnpHXuSjtttGiYJG6hfi++T5RXmoCEQAYO5h6Ydn+zfrZKrUshyeBQDP7IzA25jGGzSnek0CemS/pCnIrLkJiFTYEFtHnmWWPZu3kkFNABD1oXBUzkiPBABUacBc2ontRx1ZT5+piEnRjhH8cyIu7T0+GNQ+L85fgoSuAMB8mzV54AHUAMxEUq8JSDbkKwCwLVXNt1cAYL1IfxKIVp5IdIFsDauS0ZlKP1jE1xtcJUNTnST5LmQi/F6jAOClABnHwzaRIhWHJcXQBQCN+leh2Onz0gqKWpdU8isAsOjO1BuUBcu3Z7/2UkB6AH6mUC4DoD9CANDTp8XPRXteMKQ9tILZEZ0u4L0i/rEOa+39jef3HOhHDwCSR9GOUMitfyNYyrCD9hXaV6ABu9xu4fpmBW+6ewr/3w/8e3j5o78FR5NzmAxnMJkMsNluYTdgrB+Cb0GaoWdBAODAUXgBAMTtgWm/2wuMADyHCUYKFgFAKzeDW+RWWXEv1cDj2n+kcykVOEXrWyiUXMcgvMMJfYZkFwBAU8pF9HCA3UJkXooATN2NWeiHrnk4PuoCjGDfPNYspE7AE+xajBGA2GNv/whACwDOKQKQAcD3wTYAgOvZBIY5dwBGoJABQLxTIs2vAMDxoqwdARh1t0nBKzw9sHEN6n5yAMB8Bj39a20fuVohLu4A9QoAtPzDezdAC4qPPAhoo1ATUOZTbDOp1zuA6xwg5dyu32AjDB8EAFiGncS6lgM+b4EnbYNdbOXbEi9r4IxUcUgh1fPWNqYHALkGXG2XKCCvEOiogSZL5xYAyAaDNAOhA1ZdIk4FEepRpR1ZgGyM/NLUkgO38hwfHQAoNXOxuYoH+1z6LxFWauylZi0+AIPXQgGAwTm8AgDb8WxPNgA4oouQbyrhN7uxO6krExtjJfN3jGGyD+DBwquWAByEZGYY7zeyVg2Hlu8yZq69a4oCUqUAiygsPifIMa4HENyHcAJrhL60FlcP8atXbBKBax2Ua1I/YTvYF1he0ACDOxEOoiqfDr2ADfusSK1UMAmD3j8lp23ilVVrGmKPX+PT43qE3RH+nlL0R/2n93y6szZIr92DMkghDyk9V77yI7GPlnTAHlXkKaJwAsxB6Q7MI5K20QKoYpek3kZR34+il+b1joHYe17LoOe1r0cQ0Lft5W/GUpvUtwKNojvT82I0/RxAX+ML/zqRMRgRR+ZSZBGhgqrpY2qOWOlR2vzGkHOs57/Lp1qf/GXok+2PCkAXXcEOf/W6+JX0qYyh2sFTDzKm85U3kU7xyPd+cMzaAqa5O2td+sZs6UjDpoCsOyBkiQwDLLYbeGqzhjffPYXf+1++H27/zn+Bo9kKdpszmM0AtpstDJj+qwBASlmFUGNvMoHJbBk26w6G7QqG1SkAdQouAYAVKerR+iwtNwCABASyYEjcq/kYZ4YgHIKANf7W1BMaKTcoOt5srwnwxxEqAv75dGZU2AhQchQgNSgJTUsEAKQagJQS7QDAWL8QHVIZDz5fagBKKiDejeAeA4BP/dNvh3d+87fD+oU3wd3lEWzmE9jNEfRjAHCIEYCiV5PWGHMYEB3JMQzp7A+k3P72hn2R338PPQXYRflrm5qjSwRkSHK8Riqd0qev0ZxoaoSHL3oxduZZPUDHvbjVY55dA79/ctumdshWtl3S80R69sdfsaeKEYCpyFVPPtLOpgieiuwv2Qx7RgDyGPo6NrMXwgc0OnlnVovMScDoyymbQhlQJXq0AVch8FgDKX+DZh+d/mt1c1qBfSMAjS0lm1ERs8ybasULNezk26g51eUeANTp1SQKXI3vtnUbDMFCkEEEeEusqYKU8ghA5gnyIrB+ZVgAs4LufcxjwnAlezM5Z0leMHVSaY9CdOaYGqaFtFU9ZW7aoWRrhxWZr0KdfnUwIwC5PShM/M18pHarygZgj0yGESJYhVxB3PDWS+n6Moe8CUhpAu1JJR3DT7U8HeSXSitP9OPuvUa+6vEWDvfFJoi1BsPLanKiZWNH/6Gk7MJnugDXeCmcrsQAgpa3Pbn1Qx9TFJClrEj8wDzxWydQa3eFZckFfeZc2IiuIoHaLylEhNVv8IxTliVRzJXUXT86wd2lU1jHqo3OlJtf21oStgirbOeSEohjUzWk9Hjl39KFyw/CmjFlMR/r71mGMvaAZ94MUNGApqtBEYXMCALWgKTW5iFFUgCsR7wuXtJyACINCwoQv2MHwiJAPcCpuE77WHj4gLjvSdx6Du+IgTpF/Te8P5PSQT6lmi2qjoRfN98lq2tgOPFYjijdZ0U70/cRqCMi5qpyItkd1Zca46VwVfv4o5DCvScpaHs2BJ0xJgO+q81kcviKhj0PxLBiJo2thDHGcJEWFeOh56DcR0EuAKgMLxooI9IR8ykVSiSYi0Z0mWxEOHja5+9vuc98dbPGEp7M7+OwV3izuTzd+e1gsV7B05s1PPO3n4ff/p+/D4Y//gQczbYAm/NQv28HO2pDiMAbglucW0SHZ7stbDYDHF+7Qdw5bLdU9w/BQ0z/3e3WMJlgpKAevNKuUb6X5GbqZsm52vJ+ndYWnIMoZ4KNFyIGsUlIfgKUdmA4NuP5SPpZiDAkWybYcAzYBeAvRvzp+mjhvUgfBQDymDl6cTqdU5F4oRvWAMQoSnm2dqYYcEQwECMtU50h1KcRAFzcgKe+8X3wpd/6z2D1pjfDq/MF7JYzGELjD4z+G7Bmo9InEmlOIw/2RF3kYQdo3aX6EoBe6wRLDNSGzG3bJ03Ru6ckt5dH27xgPDIN08FxEtR9XeBBwLaNLs5NbYdfxoNQ8ySFkXirRLCsaaEbyt4R9npBR6Tw+hreBAiEnx5v4GWtJjWsX9vKDe2l9ntK9UKD7MevGimj/NzcgdX2ga0pllZI7g1vCk9Soi4Am7akkL5a66fWVmkbN3ndy2DPCmij9jj6atTDQDONFS9OewdVoz61ATdpH8ZL9HBLwJr38fWzTQmJnFZSLkS6LdvyQSUa0gbbSw6JPVA7LDAcoA4nkkYN+rDw3nwkgft1jUhXk1gAtXwSDPhRBke0MdBfTP5aPGpSL85qQjbWg3aHM8Iy+RnkgbIomOSCvcQAKDWI8EzxvOw7pI4mz5hrUKa0X00PMv2D/OT9WLI3rfTI7b39+EPLP70mZRkVAEAnpI3WcOstPkSUQU37NNg8MpCCPM/wDT/dWPN4r22SLg5rU7vbAYC8SPWQoPC9if8cs0D1jS655jLAvEtQezR+YvsAIG3jIgi4Zoh3j1YFeMQBNiNsvEuuvEXkI31NBB1v5hoAyICLCMGaqO7RIGHYnlO65llpw3jAxDU1qRk0Y4yhjJfCgFv38nDG7IHyMnZP7KOwLt/vAcB9IgrirrwMcWg41hRLO/WSD1Tr7feFCN6U88p81wMA+2tj+defUPbv3297Zgp+BABYfcMIUIgaEDTP8Hu829vf9fnjm9lAqL9DOCUqVp/qoRyMntGXapGIccpj129vOWSRx9SUOMKnR6P9eKB1tQYAaTxyQj1irTP5xSUAG/IprG1tevHe8gXy9SV3O69N3TSg6fQc1IMp3wQAee2XCP5ttjD70z+FP/i+7wP4zF/AEsGnLTcBoRQiOalHJw6j26esWzebFTx98xmYz49g2O7g3r07sF2fw7A9hclkTRGABHkVuwVOwgFPmcKZ7o4AoOxZMsHZ9NYRezRWBv7KAGCyWGMfxgoAKM5BBACVs8POe+AdeWfoUiwRgJyunABAZlgGTqlbMTUCUd2LCVzdUa0plmwCALKnjPqQAEDsgDy/Adff/S3w0vu+G1Zvfgu8slgAHC+A+rXQxVMCAPF60V0GAGR4t81i3P45XrOP/k2nF60N2N74vb33oCQXcZizj6I1oDJG9nm/PFPPqXl/Rz5FX2afQfjV7gCAXfvtAAHl6UuS3OiiHFzbV152I9w6h19dfu9FMEnqfYFOoXBPkYLJ8mzZJ065qK0UdVfH/jroAErqyysjh/+ZDm6S/crgyOEAYAKYxLfu2TyawL2IJZTFItO99Z8AQAGmxtiOHQPArb4GAHtbKzUgk1IYXPdPg8pt0RAaeKkXaX5IEZsl5uV5+RqApSYoWn/oki/Bw/Gn0uZlOkqdtLomJ/JfCQDkkZn+B2UeSRlYYlHHCEEBsKkGZRkAZFa3TUBywNTyiA/g2Nf/0hGyPf4g+6cCsIsu8vtf+whin7d1cC6jq9c7vIPsQtxvFSaVNWub73nUpdnvt37oo+7+3qbV34/dvPVt9loGADMB6SK2IlV6Vlyfk4tXMONY1N2nZLcAQI6uTwk3JRyhf8pzBQA2l69TA0wDJKXnPFoAkJWp/TmAmRuPioLXRbIcCgCaFBKXohA5/xAHomLAyMf7HFhk6z8CFHrcAUCZk1Fmal7iYIwBm16XAGCDB5AesysAsK09OwAgiuej9QqeH3bw6sc+Bn/+Qz8I8Pm/hSWm927WDFJxLHYCkcjBY2AIDciTk2tw69Yb4M7t23B67y5st+ewo/qBa0pWRSO5bLj2AMCUlsNH+qn2X/Egt/B9W38HgA3HqAFATOCdzimlGeUXgmQY2WgjANk21A4u0SgCgDzWiW5ggn/PkI6HAoDY3XAOu/l1OPr73whf+R3/AjZvezu8ulzCcLwkAJCB9skVAHhZ2/IKACTKXQGAHXvvAQGAyfIcd8DpAY7XOgAYD2ZC+sRYE7ZlLtDRjOp6/fgDgCmaMsUs8ah7fhWLxdc2AKgB4prrJdGcTsMG8gAAIABJREFUEfiT8huvIQCwJMHEbmkBgIxvtiPEvR3m39VKAHg4AOAP/5Zd+17MuokQHAsAVpREoQPvayUCsCQcSaT0inZd0iAr3XYwAKgMnJICYXyxl6Xe+74R4fkajwCUCEu9dprOsmtI8Vb44tEDgPeRYRuPuq8AoBJH3gEeVaNkrDVVmM/rKwKQy/NEJVdQA5qUJl0mXEspRuqilrthlWnaPeYdjQfo070I0D7mEYAtdZ1gqdYZYQ+wr+v4MaBsB3177CMAp5MdHGMH4AHgM7/8y/DZn/wgwMsIAA4A61WUzBgBmOrucQqwpKMcH1+D+WwJm/UGzs9PQ+rvOUwnG5hgoxAE0IpRpiMAQOPNVADA6ITrpmR8kGvdIb9adQCQwDva3Ni0g4FOU++IHiWxx4HHMO2YaoQyWIr0OhgADBEpHJmSSkRsKQLwOiy/9t3wd77zn8P27V8Ct09OYHu0gM0U340g4YRrAEYQkiNFAnQZ4gsbOXg4xasIwMyZjjQccUClOY7Wz9l8TVUb0YqOfDtAX/dSgB8GAGjsQxcB6Ev83P8IwAS1eelA+qWbwdBOAW6PNzRrqCgRkV3dDIdiqmtIn33EEYAkvkOgBnlCUoNMPuuIHw/YcQ1V8RdS3bmSbSOlVfweNOR2thcBgOGzdGgbPoiy83GJAEy2p0la3AcADD5uUGdZSZJqCnA4WBwVAahobCIMAwjZigDz/qKVnyoCMDqRCfpMNVqV5V1yNuMAhLN0E52UAsy8rCLO6PI0QhoblR5J1jX/K9mgDzUCUIdPKjFn/G5JAVa8LZGudEunxl4vf7W2tnGVVBOezDoTs6oiH1k29CIAf/g3L6Eex+HncXFrXgpxhCqwmduf3YTkTCl1FVK6Q2RsiwA+QtG+j43owrBFXiQShIs8ANhzvw6ZHwuDugLmBig2BdhHJPXCx2sRBOk+7WjknNqc/26EgeFSgP1axpDx2iZp8Is3RsuPqDvIrDvUDDsGsedHMYgrQ6eP7zcAeFBEWpai0hr5ft/lACArDm8A26fmkTU5P9s93EoBjit5CYm532xHXj3CwXqUEYAl/vRQtiVlr2ZdX34kY5r5I5MHryMAEClAEYDVFOa+9uErygz/xAOAYQK1Oph8dLWFa6sVvGm7g0/8zIfg7s/9LMDdV2G53cD/z967P9m+XPVhvfeeOee+zn0Kvbh6ABJGFiJWcMz7GSKwEWAHFbGryP+USiWppPyDU+iB7QQwBDAFmCDhGCFMjAEXkkCQiFiWkHR1Jd1zz5kzM3tSvV691urVq797z8w5c+6dqbp3zuz9fXSvXs9Pr7V6Q33vTgEEagdvIPAHeXFAuRs3bpbnnnlt+eIXvlCO7x2VcnavlFUtH67/1UNA6lXRWuwAABLI1w4dI72mwD8G3ThbUDuyI9umewC2kqZq12qvQ4T4oC/roJbbB6h8aqeMk8ZXDwGBcUnTUDwIZFQCLDDdtgKofBAIzqIe8HFaNmV78Fgp3/gt5V0//r6yevs3ldu3niz3Djbl9AD7yIYAIPX+Y+ihnkeclSGdq0XABQBYMwm+LFOlfRMfDVwkAMh8Gc7jAug3tbSXXALsT3n3gKIPEDVgxv239TUXCwCOdT9aV24xMaZilmGM+EDcggieTzol4/FZBjPI7hUCAElDmd7WTEt7CAgG72i6YwqM7G+LIxQUOCJiV3ao1tK9WzxlFkbokYq9buHnPgCAmtPAtXE92vz3WYbVVPZ5UuZCS0jpYdylmCLtpwBgEmBHvpcGyOob5DAKApJrTn37ofVP4gQ8RMQUIQ+cbF50BQJWK1o39Nryd4CTjqERHGzXg3ZJDVQfWy8tyWcq+J6AFrCzsZ8HxD1/GbzQGb3cDo+/jVq/8NUz/r6YEuD3f/QcPsLoVj3h2LEVLnuFAoBCGY0c0w61p8jMiTNKbQeAUwDARNPNAEDjAgQD9QZY1IRc64RsmdYVOzndYXzIAUAjQZGjEmRBahK+ugFATvEfezemtC6gr+dfy2+9AfIB7S7sfOHXXnkAsGVFdU4JfeB3ZrlnnQ8qR7Qbu8YxcaYbGu6B5wrw91jwXXsAzhL2Kz2zRu7egne2KfEORgHI8mk/4B6AwCLB6Xw0gdXZtqzX2/L40b3yhqPj8sc/93Pl6Ld+vZQ7LwEAeFjP+d2eltPTUyht3WwOwOGvn3HJbP13LZc93DxSTo6Py9m2An71vyPo/wcHXVwqAMilyWiHZQMS0s9p/j5q4r+l3AszGjUAKIcPQEbf2KPpWjTQpWYccADIeQFAPu2vZvExAPhoKV//jvKun3hfWX/jO8vLTz5Vjg435eQA+/5VALAeBGIyAKXsi6HPawAwkmfgpoFuuAYAl2vAGQDon2Svx+yOywUAx3PBHr/j75E9kgqgwaF97PyjxkoMkABUY//vSgGAQioCh5A8EuugTPEpqjj7sDUs2ye+Pahvbm+IAVAeionUNZAjNsDGb0buqReryjeUfvKoA5bEfr2PvVx6AAEbXp7pqJ3eYS62c5oBgAjIt164rRcvPjRPYKhXWPoYAMzJTx1ZBQBbxY3hghBHBgDe8eWwZbiMpY2p72nYEo6EUnyIH/C29Rd27UG6GACkSeEGnvox/GKTozpuhWnig+Cfg3iLZWgfsNm2fmnSKGqh4+8GCDT9GnMz+ufTDMDfPScAGHXuT6yCVwp0klw4BX3640KJ3SWDie1HRoB9MwD1s8VOgcKuZS+ZUc0nusv8lmSwMWOLQZilxHeDb0KkEWmfAbhw+exlkwxAXUI7EtCrnAG4hP9ma3gNAGZOhssAdAqcFai2jLYFgT7Fkgw2W4O9GPqCb7oEAND4knKKWqax/JzUoGr5Lh8ipJ0MZSlZ97KzNgKsdjNSjSdGAES0El4XgoN2VUuAF6x9HX8GALJrMyqPEY5XxDcBA8nCLtxh6X61AcCaxXd4cFYePzoqr/vKnfJvP/jBUj76kbI6ernc2J6UVT3Rd7stp9szAP8ODg8hI+L0FA+uYMAMSl3P1nhAxcm9st3eg/5/FQhsZbMRR54zA5BO+m19aFAe9Y+RK/QY1detafoYAPT6Vzn40SmmIFT1NERxm+H0YgQAa4lw/byOYVkGYKEMwAYU4MEmpzUr8eCRUr72G8o3/4OfKgfveFe58/Sz5e6Ng3JcT/+l04KvAcD9bNIo6PE+4C56m21ApE/C5wi/jt5CvLnLIDw5HnAGYDccF8BeVQCwkdwBgM5uxRmLpDjopN6MQzlrLr6GgIqrkgGofSDOm5NIn7S0AIDofST4FjxtNH+MLRQARO+JQIqh/Xb+H4tbA9ZqjrvdINE+FJ6kPvMOGpi0lya6cABwpiysvZMMzUEGIAOAAodCCzAF9MxeB0RpNPKHUtXnax8aAMABn0WvCktuM4YwIKCrcMMtRjm0RCh1hQFADcBq/mYSMn1G+IK2gzHZ8gW2GYpIMf0cu+HDDhV77njlqAUCzmcvALCFxrlQ8kkyfFVQbmpmwyyhPgSHb8Bxk+yn0GWeKhx71ywjZLjNSY8ZEV+DO/xvVOk5AIjXCPt1U9wFAGQDMZJnZk1NgyXP18ad2VU/S89dMgXsxHBe8qCxAzfKAJSgVQEMUUpsCgAuKTEec6dwQFoi5LZIbXjV0uZDXiYaZSbUA4BL1s+/S48pvT81DLSkO5+YOnMQGnXrOHWGlCjLRMdmGYCRlutLcOzDu9HODPh8enO/J4lvZq+fOWC+/LH3YxL9HI7cTdj0PO2zrbTzUp3TFACsj/YT9vQVZYtfsFHnPzJ6Gb1F93IZ0nyRYlk271/wEMvfrcTDuMkLwb9KLNSf41njBlf76QMES0dxeJT+3p/FHzQAiC0wRu5HzQC8sSnlqZPj8uwLL5bf/yf/pJQ//FhZVwCwAlTHx3Cyb1V564ODsj7Y4Ml6Z1s4FKMeMbc9rUDWWTnYHIIrcQonB5+UAicAc5/AsYDPegbbLAvXAxCEufXcg6km9gizZSJ+CDIAmWhGvitjugDH8TzLWHPT8B4GAPH7ChDiQSBhCbCMszbgroew1JPyWr9BzO6rAODNUl735vLOf/BT5cY3v7vceea5cufGQbkHAGD9rx5KUsuBW5YkB6289bOkBNh5lAukXF9iJNvdy97V/v5xah8W6JGR/prJPMyKLprZKJ40WJqBOA6fMUm7GPeHw7fO9DMeejD+2cffMqsPAEZ7Q99T0M78qmQASvfQoINT7zHh/Lx9rZ/1AKANctH+jn5mLWCakQrxmUr5WcLDzv6sNaY4ejcHlXnd/B/S5DRQBibs6wNOpBNYzRtM1ZnNAJz5r/57DTBq+US5sRvsEfg/8z8z36RRMuYB8GwmACCZkx10sreB2kNlpda8INwfIB/ZXIp63WcAYrxGPtVSxTgAAOENDgCs/l5TibYHZESEHgAkfg3dRn4ezg00l/InsMSXQSfSr0qfY3br0gxAJo4lUtbiQPMu00CXSCMZ2/O4XVB0H9OK6RvZMuECemQvnda2R3akmw+1RGGT0Pjb6sWmVcZ9nNtajC3Y6tkPRD0AG/HbrTG3VgdJkdQeWd05AOSg+pSDTDwnNU7rySmq/tHaoZZZDumTS6iZt3qRfO7Kf7WjMzRpxiCx8zEeBxvV6HlsRLI041rDv1gPgcFsTTyN8+T6P+AzSTEqZ7Bbj6mBDcTKSCz9scCZ7d9NSmqwGFO6wCnJgYHfwdzUAGToYQbOsKeGH+PModFDi9h+dn+nCGmXMZxylAHimljnK9B2N8S2UssAO+/2V58inrnvfQnctORc+3dk7NLlhj6b2U+inOG25JSpPXhejyTO2LVjhUQmtytlrpg40NAjRH6mElW4s5i5R5FomtHnHIxdRNFLMr7WZoFmM/Cy4R2EJWNhh4rfo3u07BpQw8pNAMBO9wQT1PMQjT50epbMkq9p9mF0V3w67i7vGF8rbuxABDfbUg63Z+WZk+Py1Bc/Vz72j/+nUv70TwAAXJ2elDU0RMd+cmfrVVlv1nD6b3VJqh7anpzAIREIbONLttt6cvBJWa0QuGoZAtE4V27Dw1/DG65MRwUAsiPJACCvV+cv6QXvF79VQBC1nL2mUAYHdlb7IFYJjgiKzwaPhmxm/QSvr5ui9FtlAEJH/DPMksT/Ks1YHsm5XtXDP/AkZR4LZwBuNzdKefq15c3v+dHytT/0w+UzNcvwqafKvc0BlgBDxmEtAW70q/FkAwH5lOW53iIC0AJpxz+3P77ES68wzydzT22+QM9DM30FbDl6QaXFuEIeXpb6Iwvskx6f1y2xRNhPM/9X/PuBCliin2clZzP6+fXpAYt8AdAeKP/mgjMAh9qR107FX80esqVcIhdtfkbTZExtIkotS73+Q/8k+8nlb54vMvEfswFELRZCIJSjJeo86kDAxkPBWECJWi2iSxUlg4luHW3waYusHVZcPbq52jFdledjtygGPIf/i/rFefquJnqmXWfcEadYtg0vez/xsmyscYbmyN7V/pbIv3zFGuxx23jo7+RPcN6hf6D0qu0J6meby461WXwvOwoYd4D+J8vNXCanBwMAqP17PgSENnI4g1R4xvsrdIquGbYeM3dRbhf4nn7GXoKfVasteisqnzjAuKM/fe/tCo8qSigid8bZQ7vuwgNOZfb4NfKYXEYl5DgeJws0qcZddjY4rkkGYAwANgXfHhkzE6Sgai0qjiexl6Nw7yDOmHSmwHdTAX5HfYIvpvpDHIxkCEtMpGFX7aCrI9dHA5mNvwf/HJN0O/i5yjSAq6v+FsMjhsAZ/4BOeYZN7xxpwQTbVzMAd2MBmeCsvFakIHk+9yybGprBBbMMD3+bH4rnr51OpYP1szvcFgC0bxNJ5fXNwD/JoLIziAG6MYG5GTs/hceHa97rjt2e398/A0D79QiynmWwlGGUMkfP4+3yvgQ5MvFz3htoIcqeBSo0H8+aYwgAkzAz6+G6YIfdcQcAJbLrH6xxDgD2GUhz2uRXoClu9Mv0uXa8hQV6u51zg9L/9V0IACKIHD1/Nr9d+Xn0POBS4/yPcYPZmNr3Ge/jVejw7WpFl48gsx0H21U5PD4rz57cK09+8T+W3/tf/odS/vzjZXPn5bKC0lM81Y4BwOoYV3O6WdfMxrOyPa6n/ALMJE40AoC1RyCCWZlDC7NwDradmed3DwBy9p+iuM/IndDWAICVD0cONAVF7RCSWFM1ABBXtfqDFbADv5BPCCQQNQIAmzySXEJvwgoC8kYJ9gAEgK8CgLeeLV/7Q3+3vOk9f6/89c1Hy+mtJ8tR7dVYDwkBABDXjzcrzwcAKpvEimrmnCzYQBtbx3kG1ExfVXYYH4KzqkmsaRHMzB/JJHEffbnL+5boS9Zro3HODtVA8RxRuV8fn8E306IeYOzl73w9AEfzbmyrdDTFI+gz4pzn0Rv6R1oMtL/h7b+l5QL/hzYox3w28a8UQ8Vylt/vN6gMJwwAcI5hfDjPug3bjtARL0K4kRbAz7V/oJ8/A7BNhZYD9Nn94jeLDyAlnY7qHQDoKwSjVRrTF3W6jU8udkMQmui5QWm7orm72QikGdpWtBfRj82Wq1fgXUjNWO/02i1aP+Ovpwk0M+kc6S4aO98Ohlr/gcAmfKx7ACv/EHxFiR04M1BmLvbW6DP3DvD/nHXK1r/evkGDpn4af9V/1UM3xva09ZTs9BUNnccbPcPiCaS7GCNhINiNDUu4jYSJPOM/kO6tUsfHIqRbHe7GlL5kALAi4HoCeoFxDbz/w6fHtRWaMWm6XNMUbi+arz4A0AuDsAYqIrMFRsKSeI1XBQDkIfqSubEj0H/zMACAOff3xmc3AJBDn7bgIT8Q6URSrwHA0MD0HJbpNr46dzDPDX6kIG1z5U2wxEwnGSCXCQBqZYMlqwLysQeqMwKcbrL25dUDAPK8JxVwO9vHkf4U5z/dvd5F+/a+gr9bQsxkkttZk6RsSBPlWjMAb56uytNHd8qTn/t0+dj//N+X8um/LJs7t8uqgnjbCl0dQBnpds0OcQUA1+Bo1gxAAP8giEEgEwDAgtl/9wcAtJO0/g9BPzMjI2F+f6q63EoO6GxDi08BxtADAUv+vQ8AWDMuGQDk0EpKgCsA+NjT5TXf90PlrT/y3vLlJ58p9x5/HADAbQUAqQS4VSpgRsf+GYAcUKm0uVc4ALirxOvrrwHAzPYjpbqenUEGrlaPHWC5IAszW0P2ENEU83bs7gCgjgUXAYB1Ugt6AHKFwngOuX+lwx8dhrfnTTZ4VQYguybioiwCAJuzJQCg0Jl9oZGCbiO+KADQR4viginQijHvDsR6aAFA5fACAequB288SqQpoNUuACBt3coWUw4A6ticvB8lA5q/ZMP+QQOAuqTZ+YaQLcoZaFoo1IbbwwoAhqgKZcjidxj7ieQuBgAxo1LWmjfATRzHnjE+HXyq+wcANmVUh2FaWASDQEZt9/QO4jUAaJjpwjMAvWm0BrHPEMmdEr6eDYNWnX0GoA3yOjBYTkiyY1RwVFdkAt8pw3oNAFrazQFAhaBMMwCt7GJgpNTbggzAqsm0+7Jbhh4XfGn9Qf+W8gqLCO32/F737J4xdV4Ab8H9I/8vAepllSQ60I5M4xkpqAN68smgFHw8IADQGlc7SR3seF2AisHptyy6WfBdmgEYOPh+STonefJOLb9oX1UGoNJ9VwEAtNphATG7S8a83/zFPIt2muGwz7DongoA3jg9K88e3S23PvOX5WP/439Xyn/6q7K58xJkAFbnZ7O+AXJzWqcCLeXWAABW0E9KgOEKBKq225P7CAB6+gaHgDj/LOLflufDAKC10OSFwq+85J/zzTEnEoE/zMBbrQ7abvGqbgQA93clwD4DEAFA7gWIJUBywu/mZimPPlme+e4fLF/3d3+83H72NeXuY48BAHhKmYeQsnlVMwCD7GFrCh58BuA5xCvMaJ7pS28KDb8u0MeRN5zNIesxVu9LE3S5BE69YPcMQFti53t2+U1sAwCeG/xr/jv6+7sDgFBASsbK+o4R1dkfawD6bINLDmEYPU61IeovwYxt/gkTAoKYVntPkJGkmNJ4lFMA0EszgQZCZ86+HTmAbX2EcuyfMxg3a7GUzs9mqrFs+t9Mjz7+05lLIymLfACU6sZziuLzmu8dVBJnAOoott6+GwCoX9j0EWc/NiAIXQR810zPyTP1IUQOYEWRzIKAJdhKdA0FbfAVpThywE/AFmekRS3BGn/QidbNmTO2FsavN3AfogzApjTQ/ehlw9NV8bRiGJtBSk6kyq9m/9/GIfgshhcvFQA02hHf2kAZ13ugOVKiUukfmQJbwqRjmd41YH+1ZQD2R45kgEMzKLLUjvSV3rya8CS1hcZybnd28WrNNtrgGpS8K6awYwVOccYWnp2xV2IOqr6Z9XybPzvjX9szcQfLZPRLdl8XsKU9MWWFjFhr8mXyxJkRvJ75Cdmz4hZdPzJewFEJMGrdWX89y889HYOMlnlTGPMYBM0G419Qwt/rTOtO+EMa/ByGDnKwY9TubeNlmRI3RR2qg88mIz5gwkiu9aVDfqqCJU4F38Gng2oHsOuiZKbRS1/fo3RP9QDv8SX+er6R6+UzMGaOXnfojCvRxB67bPDb5oehe+YD7qN0gnu0gyMeAL13f/oiABRpCpwfl8gukfP9JpqNfVPtw9Fxeb4Ce//hD8u/qz0AP/+ZcnDnqwIArlaHkMVWAUCMpVZls95gL5p6QvDJMRxUwQBgLf+9nAxAtJVCzzCwWwWIRbOxsYsqWwRYiiIl2fHVkY7Fz+g91PPPAoC1bAdLqqRn5arSrB4CgqXS/O7qCAMN9ThqH0DaTITn8gm/UAL8XHnq27+nvOU9P1qOXvcGyAC8SwAgZAAKnXB8LfsPXe7ZISDxfMcZgEYfmqAq5l/Dn528BSWmnYEYywXLWFYCjCVEl/PjvRHtVw7f2Dk87cpIDc5UYxZA1/HMAcCEOkEPZDuvJLtMywysANkAE/DXUtGWZUJSYspyeXQzOx3Sm7JhsYtUe5cORjPvF9/dxxvej7crSE8kx2YGACJ+MF6D2SnBumLQ2zgYl9Ojs1NTDT1SANA376d1dCBr1r9d69XovWM6K4rPSqgVvsnxEgOlSC/iS56rAamCDSPj38T84bOnMh44X0mwLZ+H5ZaMK9xYai4q2wceM9orwMc0D0pMsk8JcC+FnrP51F+IsWfg7oICfXyj1pJOKwtjsTJrnFb/xf4rr5GWoXYoCM+LdUHz0T0AqO06kzXT4Xr9L6IEeFhyTctux9soxzKBWY9IU99ey1Ma+U1b30ofbkmCVzf/Q+A+YRL2wEBFXUYGoA0+eRksS9oK/UigZ+7DzITk918DgLlzti8AOBI6nQGI8U5bH1Ed2vBlyxc4SPa91nmIDNoSIzei0KsTAHQUdmUWcUZoMxNcwoV0z2R3HjSggw1ha+LvWzXaDjVA5pk5+FOAze0oLtInNFycfe/gNnPXrujsrMx4fD+eUDoGP7qASYihAlB5sdbfVmYZsEeD2+h9eQCgCnwcD3ksFXjDLLJVGpY6PS298zizRp4RlwCAxn2alGj55+8CALIDEZXOzaXtfFdEwRE7x7vStI0kBwChz0w9/IG2WOeyPp+jH2sWXGzOzsrm+KQ8X7bl5A8+Vv74f/3Hpbzw2XJw+ytQAgxO36r2k1uXU5Kb9WYDNvEAMtoYADx5gACg89t0z56+A6zrCIuQmM8A1J/la6/tA8lmpQvpTOz9R6fwnuHhIXsBgJABeAKLjxmAq7Kt61EBwCe/pjz1bd9d3vKe95Z7r3t9ORIAEE8KhrRNBQJeNQBQc3QvbwMAcKFAor4fZ9ii7r1iAGAi4i50nSuDaQaNyoAZPG22gTyJXoLda7yD/9/8C5ydBzwsANia5svGNRFlvpE9mCD3omNPh6pGBJDsNu07Cxdv8ISEUbrmPgGAdCaD0LzPArQgbQcAKgPS8V8GANJGhfZtkCQqy3JBCXTTpc1HZ5dpEYCyEADkafIhC6jNm37vYj+q0GmADo6vrwCM/F/rN18eANjvQeP6ViYnAFCyePVs65gJABT6EaAr+vRhAgBZZoN4TmcgUjxiJFwnBKkegJIVx06rSJg7BdhlAD40AGAg2xX8YwCw9fO0+tD7sDZhoN6lAEDaAJ8969IBQDI9NBOtubsQNNzxyS1xBiKMg2N+5qKAXQ3gOgNwRtOm2qN12wkAZI91xABBiYS91II/1wBgT0ivUPISYC9r5F7qo9FNCbqVb6S/Mv0LAcBRuWJ9ku/h4v3COAOQjfT9BwD7DFQHUJolar1yRF91KEYsjz44y2ioX8m7T7ZzexCI000sU3LFAwcAF0av5CwjXRrIkZ54Tpfu8oZrAJAcdypH7Kz/NMsls/4LAMAJ+Dc9REPb/sCDITaSq/T8KgB44/S0vOH0uNz+1x8un/zZ95fy4ufLwctfaYeAUCkpA4A1G7AGSTULsGqGlgGIff/ubwagp33NAGR9w3qrzdhuZvDnfQagBQBHsGzk19WsXwYAEfjbBQDEUl+ioclETABAyAD83vKW9/xYOfqa15V7t2oGYM3YpB6AEC23MuBrALDxzDUAeH4AMI996IRGESGG/Uj24PMqJ1IPGQCALf+tQrmYMdIOjAIfS9n6fDz9tzBCAf34IKhlPQCV5egeHAOSDxYAZDJbwMn6Z2EGoJqd0YYzANBtHscA4Ei/ikcpAKsH4S4bAGSw0r+n/X3VMwAfXgCwbovOf3bFVnYHAAUPmIJ/LF0XAwCyjLK+g6dfwCEgizIAlVxXirGnxABg/c2yka1RvQwP0W2yXH0irdGrf/sAAECC/HT2CVO8SzX0AaxLa5/lcE8ZOQ/XrgIAyMu3RPnPhNYAOLIDNBb25hwET+5KXCPANggSxGnoaQ/jU0Gf3gH1Bgie7EEiNRU658oMwLCZy1CIDNoSNZjRvAZrqZDOQMxrtSgQAAAgAElEQVQ0zfoBlwB74shcmksI0jsCAF32VSsBVrthC0DABw8Ajle421GflADrPjas5qUEOARDmlFFWuuxZOCf3WMf0RCfhg/t4dpQMw0dRi6BkweRwGWnAJOliCIHHFMoX1kGoJfHXMLxNDKeP+umsc3oMwJ7yFlPpqq7BoVoascnJ3sHYgY2toxWfLbWRzAz6jGkg7jdMwDPpyU1X2n69dmZM+vWf4/ztVRqdqT1EIpmAJK1Q0+gRdZPvagCgAcnJ+Vrt8flxd/8jfKX/9vPlvLSC+XgZSwBBgiNDrGoGWd43u8a1rDaxfrf9vSEylghL63mEuIpwHQIiGQcDEhXe+qNV4/lqAFYtgTYkhZ77WkAELWGreJo3zO3c2Cqy3BbmRYCDvZnFHhUYaqZfq3kF5uo8d86AxB7JmIJsGrIPgQAsVS4ywB84jXlaQAA31vuvvb1BACuy+kaewXqd19YCbCxiRYF6Dfolssmm28tLX7DI/KRUqlckAGY3T/Tb6lvRXLPFBg/azmNwBrqB01unZbRQQbMaGR4aJX8hICPu7fzf7FRPv940NVXWOlT0bU+48dyyRhIoHp1GCcsIOv9BQDZl6HsqWkGHB5COS4Bznpk0uRhQ6QRwq5WX6LdA4DN/+p4fQgAGotqAv6mkavu09vf0WKRrlYk4HUXDaxaukSymB2iApShEmApcVSHtCHlyAP0vAYT6U+5jyqMWo6xniP5dFP5jezPcj+EdSrfYTMAtb/OVlDbx1EJcJz9B/6d6gE4G2Wk77kE2AKAGZFG3/E8JrbbHLLGfjY9E7ofIV2kBFjFQJ3WBIXkAEDX0qDpt56vREeqKYH804u4oi+NsbY5v4zsgdjVSo9ArkU+5CAQVT5OA/Japv6NLX6a9vcAIGdENh+s97R85NeehkYgs9GrZz/w0QGHIDLZf+kZx/1tAEJmlDGD7grgdQHWzAOBk95mFyWiOMmd91/zTJen3FvaWAAwMS405FkJgp+ZDTDx236sjV7eAdEKE8SZaDuet5giVBRmQC57yrGJNLd0iHs85ngNc/7iDJTx+uc92PoMr0idzhR99v2Mc71k9fzjniDBCRtYF/71NZjiIOFsWwN3UtEe1XLTSWSfFlKrKC/fNgPQ9ohbVgKcU7/XJ50LaB7ADhZLZtcD0E1XyydoSs/jbheYAY2+/cKIjpl8aXljXWwBNmPfyVnUbxKQfvB625yWAL+0NJtL7pCsiA/yw7VjjJ97gMyvpu6RR64IXWI3Kvg+qy+jEjekp3ToUQa0W3sariaN16V9SVGkIcYyoq+WUu1Fpe94Z9oSdKFi6h05xVfn878VIGUHw5mdWg4iKrFjFk7FAfIQsCwBDOlFUAJ8cq+88fi4fOpnP1Ruf+S3Srn9pXJ456VSKrBX+WTNElBPs8WMNmlqAOAB9xLC32flpGwJ1MJ+dgxuLVwMZz/LemNKWFtPRfTLvNOpey7W7wRgFMZtMgidv4zDjOOFp5Id4dON3eoNCgPx1F/u90enppBXgHqp2Ws8/AZ1A4KBUA5OAKB8B+NrZXPQN4d7AK5vlvL4a8qtd39bedMPv7ecvukt5eiJx8rR4aacrmu2VH1nLdUeZwBmJbKxH8Jj9jpt4J/ssOwSZIV2xKi9xU/N23jMDxmBNVNv8z3zsooEzji19mZX/ehbQvj7d1CWHdVW1Gcr8AlUVpxs1Wl7AMrG2zOiFpti1hQme4ayAjVNu3GR76akm1/FJWVoq5AXE/yS2q94Dd/7FI33+r6DmgH6U9ldfLhoObwMRT6C5zwkku3A0QN4mL3AHFf9C3fIitevi/qsLRY3uVA6epkSXLWuUoJKvoh2HIV/VnW7CeeteK/5CQwbJFFEUgLMsZ5wMfOps6tafiUD1ZFENrBdfIHT4jcovqvg0oLqgkX2PFse51Tghqv/kB+g5RlthvGfGRBVMVadbqcFlrl7FBlYgdE943Dr28rqbpzoM5D5btdCSOkrbnrEOo/1jeYRK5ma92iD76zXqwy8GgAQpq68egcu+pmLplHXeVI7bWTJFVxs9FkiRsyr/jfYwwqES9ZU88vkdWqJbU9T1LWNnr61E9FnoOD9mqB+tJNcPfvB3x2yIxLYz9qTUH3fZQeS4k6yAC8GABxNgZteJys3k5hwTvFNXgnPHs276Pq6+Smu1jM4HwCYOAfEdhri0gLGozAZgCGZm5jK15rzu0MH2vza6Tb9buZSgHUGAEYZKM3dIAU7ZJ+HBQB0BlZlKHgja+llFc4QABwx+iQ7EPjJydccAFQvW+RM5lK4CABUsRz7K81FdYeAOFWUA4AIgJuderAAXtGPjDxfG88xdKBqzy2tsh2AE28GDAQgOORE+Ge4eaQAQCGdIrBGdbvv+3lqALB9i5oK+cveo/k7LnFjq8c7eHZ/2qy/crrFdXKkSkwf3TJ24DzVxbEPN21iHtAZjHN7tPwKnpecvbD8VnOlPTXWPyQ/RZCXdmQLNGAi67MEAKSLN/WU3woA3rtXPvWhD5bbv/PbCADeva0AwGojqhxrAFADpCp7bcXlq5TVVoM8ArD2I5/yb0iP9gCg9dcAgFOchwAmM7INVRAA1B6gAixTAJAtaO9RWwCQMwLbe5t86iwKBQBSGbX4TjMA8LHXlKfe/W3l+R/5sXL6pjeXuxoArNHZWS1JRhDVZrj7nk65z6e8Fqu/J44KzHyHgLBeHul11kv6cdPHyssT/znZZesCW8gYcgFGsgMRAYA9lZMA95zjn8tcDVTHthXWgmy16CLSzRy22SxpJ4t6LakdTpZt3/GYkmPp+8aHMsg4+qCxKYAebIzeoe0oSIk7eGQXAHCZ3+7XXM1hEo/5U4GZx3BezWtjofP+v056qfO2+m/OMbteEWfg1fm2jQ07bnyDZBzRQUYSe5LfBTMF+fAZ3m2EOD/ZrgpFT/sgkGHl9I9fKTy11D5KrlEZYzgyUpURAEiPmEXudoNqV+oHU44AQL5MeI/lGDNQm4X0mX8VYMZ5zuYRjhw2n+1BJbpnHGyGzR3MlCjxITmxzm3zaN938VOnL73/gZTwfM8AYANgW10PT0DbPeDdwHSyrmJ6a7uoKxcjohhbzHI03QCw8tj1PqRDPrBSSbg+PMwUZNVkNBO+UG8c2bpEHy6yzzkAKHkQil4JO18DgM3MLJL4noV3BwDzElbP6F2JWapAyClWytg7rLsAgI39RaQNwNxtvICDTgpD0bMZt7nCnwKAkJRtF6sF+UrRhet5DQCm0curDQAMdiwt4NSXAF8+AKiQOFDdtqSwA1w7Ps/0fc///pRLFw5K0312WG2PPXoX3/SAAUB0tBtBZuAfODaOfnP/7BoAHGvxBw0AbsvN7Wl5zUtfLX/xs/+0vPzRf13KV784BADxFFtnjwXgw6AOT7C9agCgsswqa6kFiBSpSUl6C6SRvwOUpNP96MU2AJBkHQDJpmOs/qj3UCkwAS3bLdOPxkD0RaAbP6sbh6f1MJDVjVIeebY89Z9/e3n+R368nDz/pnJ06/GWAVg3HxkAlECZfR6M3GYZFj2gQeMShDx3BL0/lXk04tAHdkYHOhqMyqO/tq7xdU4fu4sWBRivUABQhXLC/+yXNjvhMyidLfWAigr4x1yjQSwchbFL1wCgwC0t4NZwgJVPzKBTNt65Sw8OAMRxyunmXp+SDvAtjPpNwvsLALYKFkHNUCsTib0/jCWKfn2aopmF0Q8WAKQebroG1YHMUICYZjImM5wAgPW1WE2w/89VBQDb4X6WPp6W3vMADeszABV7ZfxkbPFCAFCFKu299CH4TwoAJKhQMKI+XuAN1zZgRuDwkQHecKEAoPYiZAdJkywKBh1JwwgocBAZVNqxPDcuAR49/xWWAdhNs/YZqhk1yxXAWjlk5C4r+2cfZMsvG/vKirseg/Hu3mxwjX+WAoCDkKOzGvXNFaCMlATKE9Ev2J9hgTOnsHbag52xLIRdvjbRlVMD6J1yc4gHu6nOwAqhq4Nhd6d2yQDEV49Pqe36PwYBxF4ZgIooM+6aUX+vDEC3y6/H4MyV7RHUZaTdjwxA3W8PauyMPOwMABqCTwDAFiWp3S885Yof02eoOQpOIuRxBiDubJ8nA1A0Xh0sDcsEeQFzXSoAqEt9Fma/XmcAuhLFJRmAxJwHZ9vy2Nm2PPPlF8unPvSh8vLvf7SsvvqFcqAyAFGBVp7G3nYCAJJe1afaXW0AUNkKcWB1BiBmN5j58PZdpISN4LULxgAgSZvpqVbv0xmUZ8UCgPVrLEleS4CMAGAtAz5d3Szl0afLU+/+DgIA30wA4EE5qSXAoAvHJcBs3zIH61IBQG/8ByV44g/5Vina7A+di8yHuQgAcLxBzQBNbsOT8YltSPz/rE/IzLmCDNjcg9ABms4ea/928ZNimPpNOzWSMrFq0K9Lgs3rmRaaJgTwqICVbRT6Zgn6QFmHfX6SpTkH1VJqPwqwQRwjb7vRYFkGIHO0fhb/Ow/hfU/ALgNQ6Yn6lgoAMgAFb7gqACBXgXC25WAznXvKCZuoDEAMcS4YAHS86aUzBgBbpVnrQctJTVH6hbIXMLHxml8oAFhp17Xk8I6WxkAoA1AHxA4AhBa3QSWK+JbZ/Aw4StbInJp7WQBgJH96m47Xp/oDVt6tv82EUTE+twwTvYrf+QxA0FyAoPmIKgD4lI5susp9SFOaqXy/b5f1iA01nftwBADy6Hzs6BNoLQDYNjlbbDKeUU/9IEPfZACq3V9hAfN8zfwomNgTTFyQzlr6HlH+gl1LgHtzPHFgQAJny54Y+UnKub5T0rAXl2j1Y08zANlCqZf2AGA+V1ZIRsQ7BUbpterEV1HD2gAoAHBk2ONDADy9lRiQguP09WEDkwUBMMTtlINt3AcV4CD9YppNe6hIxsGYf3LnNuE7+mrGuZ0SWgQA0urD+qXm1aSs6RJg2Xl2AKAGmJteaKPUKeyorL1OsTTxPQCxPLbpm75FwZym2RVeH+nRQTiqDJ52+PmZmt9x7XoQqr2/BwDbd51rtTDTRj2dHQjF/Jm27GOlYG1cU+D+EIsBx1I/j9p3S2wGGPh8Bf0pvJ3mCB1j5XAkEUdWAsxBvwkOFPAbqOKQrS4iAxDIpKys2JkFOvC8AGDaY8fz1x6id9VKgPV6HW635VbZlqde+GL5xAc+UO784e+X1Vc+XzamBJgCrDMuAcYSWxXytmKVK50ByKNuTIXiiZtEvJkTAoDpujsX15RR1fQI659Z/wdLqKTYp/bSMRmADKDwSXnYvwl03HpTjteHpWweK4ff/K3lbX//vynb599ajm7dKncPKwBY4CAQOYWYshBbN0HW3qnG7DN+JQLRSjex4tXjHzkJTr750aMS4Mj/VKayXyVN21h7WUTEXRMFGPaSqAebsnD0gNxHSug/zdAc9bhqzlX+7nkPRA4QYZQ8n6FedvZUZwCqEmCQxA4EZDrQbxWpQqsclhJFUxzPxAMFe+75U9+jIDSy1cMMGw8AwmPHANTcXMy9Z2uH7Tzwbv1+RcMV6TXcJpShOG314EqAF7aB0T3mInqKPgtUELKHm78GdHTPNbf5wI+LpdNm7kscJZaRdSuyZz80KqUdAtRzzuErZgCh8W86eWFBjvQ3yxy38Onlk7GPGBTjEfpnq7+hV95srhP7NHlAHn/xhh+Ower7YGDhWia2TwKOxk1cAiwAoJJfMa2qIrY7xDECWxWzZqMJ5WdAv8RkG5XLR3xo+2BWXj2ojm2WcYwsqnyLhD3m9rkU2wPQBeM46IBBFVDYdhh0iNIY5hoAzAS4F95lAGBbEyjBJdI3tdocAvv2s4IADd7QvZ0UIO8a+gxA1o8giPSAfryWXwAQmUpLu8Ai7rkDqZWSnqcWtgpQaCfBK2O9A9ivFBqyoQ4OTtCzDsnU/Zpp9yl07ccWHwLizLX8WTMn9gQAqw4gB1yP4f4AgI1z7Q7vlJzTC3YBAMl/Uk42n2LZXrMI4Ox0bGTUB4Y+KbPGfkJ2Szt1F9zusRwAoqm2IwBoOI+b80PGFGsrNSLHzPWK/QDAZmL9KZl6KikAWOkqDihviCidSbSaORQXBQCyvmaeE3dzMoBrAHCHDEDnwN7YnpYnz07L45/7bPnEBz9Yjv7oD8r6pRfK5uilcnaKp85W/wdtHJ1uqw8BcdkAmEF3VUuA2ZoGAKCax/4AIHkNBgCsNsQe0uYz0NsGAwaFBgAUAKVqk1YqDBsz6zUBgI+W9Tv+s/K2n/iHZfXWtwMAeHR4WI7XNUNQV4gwUGBLgKUEb2A5uoxfiVKUk56lPe0AANYh6Iyxkc+jN6bYTwuHL19mDtp4l2EeYEwAQGK5PMZNLBYDgCMlO9ugmG6gLAMAtb/JtPd+IDrc4jnDn8wqAvZB9l+zujytFkMRLYzNbwCXfvfiTLsuY6/jqlagr0BJnynDd/mm+Rftn3k+jjZh7QyQ5hzxrFwGYOafLQnIpw7l5IJhhqmJO0YygIdQyWZl2BrAZoha/2cZAGjiPhNr4tN6+WUAkKgucaWyMRpQ6h4wAAAnrQ8iUi8CABP9kScPIfhno2kauz5Ijik0TSay+gH4Nt8fiqJ4Q4bZKeeZfwxrqxi00/eB4p76w45hfIYuHpeB/I60jXUmc5KMT/HlcAxpKXYsqNmpwJ2Oj7JjpQQ4fr5mPZBkrRCCE3y1LMay194zt89TAJDRbUXSDiTUTeWZI/B3U71jE797BmD0rMSBeUVmALb1uGgAEME/MZfdKTxGhUP1kxa3vmekHl8nAtEOrkHccwcyUzYinAEAKPdVAVv1PQAbaNEUEY/dclqjlRZG7Xzlzu3cfZgpVP/8+wYA0tC9a/JqAwBtmXNwqnRnJeyKNiPnHe/O1b3cDEAG//TwghIEe+xZf0ov9wT1fItBEvbmqhmAEQDog1WwH+aUYJ2Qita2OV+RLOUB3BIAkB1AH9hpuctk9BoAzHXclcoA9ADg6Wl58vReOfyrT5dPfPAD5ezjf1I2d14s66Pb5QxOAcaYXh9soU/ZbXBxCwrkFNsKWF2ZQ0B4jcjZVs60nPrLTjmXSFEg3fi7s0Ru4fnZ7NDTb/AfmgR1GzCwOdKAjxEAWEuAAQSEE/cwA/De+qCUehLw295Zvv4n/lE5fPs7ytGtJwEAPCEA8Eze7wBAI9ScLdTz8lUFAG0UOJBBUbiJ/5yU0M4DjFc+AAiHABAh5gCc43VSC2ziqie63rZ8NJQtbpjRZMBu3QcAoAE2Jx6kOeU78jlU6d+wNLndd/EAYD7+lilkx944ugFgTDeTlBKAslobzjJy5h58fgUADAPV2aJpdYFxKNj/wncAd5lTQ6Vo25Q26/ktyQD0oIP+O9YcCgBUQKZGBXi88Lt7SAwANkAcZyD0SVjkcgFALrHmKKjZeYau7OJa+e+zH933wSnDnpuAl5MsvykAqAkZsKq+v9P3o4y/So7A8fV8xPwgNUDVdiv/on5f23T4Kirkc+IBAsz0s4fscNEAIOt9opufX/1YTmUfDArXrxEe/S0loQ4E1HPnqzLrreUs0kSrZz/wUXd/Y0Jk654pdTJo93JZ+La8WR7UziWifd7aUMPWsXOAYcdpSDzR0H7+I0OjqyX86bojlvTwCZWsDkdkRZBEw2SJ2ZI1vN4Eq6YlC2W3GUa2YwcauofoUViHfQAAJhTu8utcCnozbf5f6m+eoJoHAg5IT3bMuCeY1k2+ia6ZqwCUpGy6jHC7fvxOPd2RcOZM176duG8oDXxRzYiYlgC3xQTXaJYBqCw06oIG3kS2wx8C4fNMjUFSGVYxPaLyEaKoOlXpvDTW7+aScRYcLf1A63ryVjfYxoBzfWb1yeKd+jAPFflv9IzmMFk90OvsPrNNDIcHASlgEB3gsigiAJDfV4351gGAmj8iTWtaghENTEliKkgzALDPysC0Py3XjnZB1kgmoxcBAPop6qyHLAMCpHWmQCaKKHUgp/JLD088lFxe8kNAIv3jrbOf/nw+7Qk3T0/LreN7Zf2Xf1H+7EMfKOXP/rQcHH2lrI9eKtsKAIIOooMtACjhHoD6rZqf6iEgeBAI8tkVOAXYGIBacmR9ox4APDXywSBFkxstU8ZTaEZUfMqagWdXKAYAaaWTDMAIADxeH5SzCgC+9W+UN//9f1hu/o13lXu3nipHB4fldLMup+sKGdZ1wI0bHZB0wB582QsTXtcYHOMVpz9mGYCJv+dFJ84ApJwJNbxFNlHGPhbQWYaIpUpAn2zuC3RTegiL888iMtpTeN0V58wArFSLSrwiP7B5qzbDVrL/qB3KZi8AEH1AXsX278iiWt8SARLm/BEjthhAS3R09VYDiqo0eeTf5eYnHz9KnouhNB3g4a0CqF7JEYqPSVkUzPygBPOim8yQGmTTmDy/jw77hAPZ8AdbTNG6PFOKUMeJbDuUAGtZT/0aqYzC8Vrtkgs9+nakU9m/UCBIZ8/jbXERNziVPBls2uIEhjEerwD/TfKU7k+cHlp7NBX++fpv7DGYLJ4AviM52hUAXOIv+aw1o1FaKITokSNDv362Qq8CgDoJaQQAMnharxeZVQBfuGocOk58Xv11RD/RsyAQTaMg29oJw/2JnfEVssCvwh+4gWZ1UtuQMeMI5jTT1TD8p99vAUB9LDoqIKuE2w63c3K7AVg0fGQA5uqV1KDb+WAFPurhFmZh1SEHabiGWUKBj5UA+oTtO1yQNt5mVkdKpFcSs4xI79DUgHv8dFw79l1BlZhyQx6rNYdNsTVdrNfPqKioRFxd3M/HjjYTVI88eiMN5CcStjHb+WrHCAFAfKM4XikA5ox1PXXJMosxP5puTYhzbbPIUc8e4QIofSozsqOTX82j0alCkRwrlcQ8za0BZvzqAcCRHhhPUY/fKVdYyGx7If8O3+mfz1aEZup2jbST3fhv7CQwAN3mZ6/NSkDa+sXUsb1V+muaadIC2bu+1qD1e5bGCBl62B3ojE1RDmvAj73SwGzXz1zT5c5hEP3SunO198ysxzTCo+2NyK3Md5iNn5NMnHfk99UCaRNi3uBIHt5n5E5GkpaE5fdG37LODu+cLw9lgO5Hvaj9CK+0drRATXLmhLJnN0+35da9k3Ljrz5dPv6hnylnH//jcnD3K2Vz/HI5PbkHRsT0kIOMcj7VlsfsAcBaAkzZf9UyqwB8dxpxxjFnWqm/Wa8p/Q/2f409CtXojHLQEoW0shlIAF4qgMufUokZLaxTA3oYe8QluOP1bfYFfRUoEWIAVZUAMwBYA+J65XZTS4APyvbG46U8//Xl697302X99e8ox088Ve4d3EAAkO25rCNmc8IQcfcw2HaJdQXOQPuqSkNkQWR6yoS13fUNHgAUAISGpS3k1LcQ4Yyv5AzpTPo6b07Nlf3O1C44feMP0UaqDmYyNrv2lSNCTPVPv4EEAbmjtfcJ5HUdq9h+a5i80ySu+qYH9VAKzrSDB1n5E53GvS6rfx+Af7gMwQZYp9+JZ3VJplEQPQ/ytJZsbmX4L77GL4J93/x+r80sGA6zEyDS+wt8iIGK1DSIEMSKnpfnNHCs6HlnAgACB3Qxh/LR1ACQbzzowlo8lsKwzYu2CMTMozUHs2mcIf5AfbEAqNejk+kSACgxWzAFlo6RjkEfuf1MAT/3oBmA1rSTeo/ZAEpsm/QHHysyPEQi/r7a3tDHV6/MAUQb34PZW9QzMJmTMKvSa2Ib+/s4g1p0KMx3DJpF/qSmDutO0ixTOzAzIbrnux89UN8AtFoYcA5tY3HIoWoDhp7HGAXdInPS7oXohXGLMpHZ8XJ5AJBPRcU7OORq93sHE6/qw2wt/NH3/MQow6cnc3M4e/fGZHAx83W7QFqJNgPjU4px0r3By5YOnUQJKxQ9mImXPw+YdnIqskff6/UjJSDrp+hhMy6Yo9wq6ut5iQdESHsW0im8cusIfNW60ytgHWwEmcWW8rbfhXaMUCE0RJ2FakmGjHbwGADEz/rdJe9rzhTM1ElPhBdjFLsDsQQAbIFxJpvjFzenqu9519+13zvwOXPZyYKM+Zuj57s0/iBtHOdPHBX0aWAa1Ot6AFBTCE/Z7Hf4eOQL5h/0oTRrkDojVv96eWlamlidV0TTZMEp7u25lWFrgE0nAdcAXAGAbNyNQefn0zy80xM5BInIuK+W0Hf506IrZyUas6enDhkMP9cw84xUO4JdHeTZ+NP1mQbgXAI+e0tmoa2G5fH4eY4AwKePt2X1F58qn/jQz5TyqY+XwztfKet7L5fTUwQAG0KJvFRDeCvPAwCQ/SYGswZTyAPg3QBAeIUDAPVrebPXxHOLAUA81k/49QwP9+gAUe8DJOMBDas2AHYGAFcVAHyslDe8ubz5fT9dDt7+zeX4iafL0cENAAixB2DV5byRQT0JOZdG+NNoJLW+3sJoD11R8aIAQH1oBC2czpbQdoe8k2ZGhyKU++ezDECrfWzJL9vmkY8DAefWhre65YP4XfuK/+y+qf4JAMAAjpT57fE8U2J3TgDQA4H7AIBWX4/tY2SrQ3JP/I8+w6q9s/lZs4XUnE+eeZgR2T8HNxOCMme9qMMUizS5LBy0JAmQ4NQMzJEFxyFwGy5np1Hb2gGQfuDsqGVUy32gLtvL+cOIJw/iX/kmzsLTcRU8hT4QeiwGAMcUPB8AyBl4y/0LvNImEYzuxvmOE3jgSZMN2WiTs71vlkGoM2KR/t2pvmbwVr9H89IJSrgqrN9jK6ABQJB3OgY3unrm6wsn8wbKTACC2M7fAuMbPic6pIXtKQ/ClFwGT1KywQpcvRDmJOwEGROSxMS2P7OvWjrD9bIZgLsAgPpxegjaCdKKOWaXWQ5HU3KKsCxk4CAygXtFFjsg7bqHHQCstNGHemjFj8YT56oNqQcAveqOMqoyweMd93h10YFv6rn3kHqFYc0JppCzKRwb3Gi+XjD2AQANZ9PwW6bfvEQtD8+XZKiNtdiDBQDJeEVb9lBtAvwAACAASURBVGbIWYAx09ALAJpEw83fHD3/fgKAbOA9lzDXLZj/BQGAxvYopRAZVb3LNgOgwAXQgbQGAME94Ka/bTfShNtDAJB1wjTqGjOZ2byZ8eJ+358LAJQMyWwKEwdjKp/22dcAYOO+R0635dnj03LyiT8tf1YBwP/3L8qNO18t6+M75eT0XjlbbZX/wfrwwG0iegAQy4BR89cO31QOPFjiqw8A1oFj7z0A6EwGYC2J3lA2Hem0+wgAnqw25fTGo6W85g3l+ff9t+XRd7y7HD3xdLl7WAHAjQCAEKRAKTQCgBKycNaya7LSB7zaz9XrTcbpCgCA4yAms5KYsTbLcrL+Xfsr9r91ePrKAABNJJSWewUBtCv52kwyAH0yBGzyK7/Ugiq7ZwAuBQDF7ZoF0TsDgM2haz59Znt97InX+s3M0eZmBQA7H0fNqW+BZccykw0/8hgAjKWz6aE4iojAf50tNIs9cGzLAcDI1cYEZhdF6jWnrMRoBZEWrYXNCADsyiDVw/okJSONsLljPkkzrv0oZwBapjvpvUkyDQNk+q1dJHCpAGAPzkU9L41+T0uuuFVA4wc/Rz+/DgCUpgpOzpBV+p9JrJJpjiVA+f0GAH0Cps4Gh1Qv2DBDm/wAAcARWTX4N3Y5tAuwPwBIT+EUrkHmXu97XSUAsKfRopJZwQewhxv/aOPdQKrqIKgsMXVDBDuMfNUQBARS5mYmK1GWBrRNV3a7YcbIDbKxmk7CjKZxJlM7ZQ2Fv56CW8c/MsDNmWAaM5janNucz2dGeImUDKUtyAC0gGuf0doUsriKw/mHBp8+FBaEkrfsZw7Dje9eAIBFg6QHzt8cPX8ZAAiMSjpHc5Beb6DRJMU03+FbMP8LAAB1oObl3zuUYpBE6cw43AGAUALcMg+30LJf6TAnEHIKKDlykgGIFtCecjzhxH6rvc9A9/I4n13+0r0BQHqxL5H2blE9xTz64TVdVEOrHvBqAQDheD2l+XjnW2dQP3JyWp47OS5Hf/LH5c8rAPgfP11u3H0ZAMBjygD0PXDbgSBxUIQ9ANuJtRYA7K3B1QMACbwU+atUbCXNDQCsfFmPNSD7wIFYBwBipuDo5zwZgBUA3N54pJw99dry/E/+dHn8Xd9ajp58ptw5vFlONhtoMA4HOEumYTsVuNl5PbaBvZDBR/5vnjWRy5t7X5IBGPkRzQckP8YTWZy62AuJD0nSysKvHI23OQdGxqLX+wyoK58BqEqAeT6eemOfjnkJf4Pf4DIgEQDkwkxu8K8zitirYadZ1XO4rLd9MgCtO7Uk4yfjB07rSrzcQdzGupmTGGL9MPbwtN4UTzdQMwwAMhhgNjdplbIYdScAkIFaVb5XW0CMtB+OG+M3o2JkkVq5JAuaaIwZMCsPTHzMBc9AwMLZOlUVaObmnictbOiiIQCoU0gMOEv0SSi4GwDYr0SPv3kPP4/gIn+6X0xeaVuSCzKQluT6EuDee532EHSxb5cB6A/ldLS26+taHDjtz+ZGcwu3VGB7ixVB/c9QztTDPO9PffcF/P3AAUBShDA3ADawxQrODfXfiAOttYk1qOsBuDQDMHqYd37EC4jfzCYQLH6iAmU3oVf2qHv0e+xzRm4Nv+/BZwD2c/IBBRJvTB+NL2jBAvagHWwwYGR8BCBKSxtbyfTMwM1Kls8LAPoSc/FZaX61JFfWmYBOVibIHo12+hAQVBb9KabMrNquaQdCVmyw0+tP4U3MK+aATHouJMLTDjlRF/kS4L6Pj+K5Ogd3CpweP669LXD3G0BY4tV+en6wPD7rMWENZn6IA6vAkXiM3UMeb7Q6cwBQ3ot7MZ0CNnJIPammxoiGZAHBjHvwhurgZEnqtiG95yYCzEnFaLkRCqnYAzS10xu83pkbZDIA11T+yyasAiLsADbCykCRH9tK4vtpjfYAAO04LX1FzuntSwxoJp9I1vyUtvB+reRwlRVUZfVZb/3b95ghjADhaH0uGvDrOSx5+YLkzVkCox9/2OJC6yftMlDJychTefTkpLz25F757O98uHzu1365lE//P+XG0Z2yOj4qJ9uT7oRqNLLszyBvCYBNPGsOAYEMQM4GjLXV1QQAm5VEbiNA04B8CAA24SYqdwCglcFxyTo7u3kPQH0K8Ml6XcqNR8v2ydeUp//LHytv+M4fKHeeebbcuflIOd6sy3aNh7Y0mxUBgMa6pWClyKnJenJlsTtmoBjfTwGAbVRxFQL7L9536fXN2ErqnskjPWftgbdXeYsf0OwAgGjt1MaD+mvW5WqmgZPvp/pn7n+0/PWl47CeAIN9rKTFR6UP2uyVdVL8pXN4+o3v3n8w4RLRn61D76Mk9wfTZbNlnpNmAIqXERIPOWHmQQ8sm6o6SH0TXQLsYyIJAuIyXLDv2cOd6mDObjqdtkKTZ2DyBlLUuAUwv1h2hWILxrakz6eehvff7fpUX0fbM7xT84ONT9B31f6fp6fOMBR/TM3L80fX2mMR/2k+tFJg4zNmKuXhTxhAWIicsF7G2mRg3cI103dpgMytf40F2L4kwLqspzBUe6k9hAIHrZtMmZ6P9CDtkfqSfj/fnofxIRx7jOLhiDZwj7Knmu8zrSHzfwgAQOFMjnXqhhEJTF2XvEC5lz+vaC8IACRGNMI2cqudVtwJAHSBjAl+Fy25SXm+/wBgJN32Mw8g9eCfFqmawRY7HuwMSF8fuo6dXSOISv+JSlE6buj8yc752Pm5NACQdDEAgHrnkywOUtU6cHVKtol2AgA651DoSXRhhYU8pFSgO4V35r5cNACoATh2GwQEDYxht+PjDolBAKNpes/Br1YAsKlW24VDrzfwCPHDQEw7wXkoAEDFBKyvUidblwAHAGDmRfsMIAk498wAdNq2a7Cc79hmuUqxDjwfAKhHKxqtvYi+Ng6Y2huECysIcg0AGp9XgxZ46px1lNgvePT0uLz23p3ymQ//VvnrX/uVUv6/vyoHRy+X1ckxUrTiW+YQG7AwBgTsMtjgfbXslwIlKQGOg7mrBwBanmzar50milJCQKhEd3SfnhAoS53Byj0NI1lC+swOAdEA4GnVNYePlO2t58qzP/Cj5fXf9f3l7mu+prx885FyDwDADZQo9wBg8ylY6tqIIk2unaW8BHg3wN15DxEAqHxgWRnlo4DsZ0BXFiDzCaED5c6zHgeAuU9ev33oAcAgI3DsDbtvJJOjLRhTjDdf8Q6t6FlPWK3F/qi3b12OphdDdwiXGWEAImjdqV1fiaV8UL0TAGPpgzOdedCjsiB0y2clvNID0JPYWozhYbBLAUDJxlVZgLz9mj3DA4CyxwJhRwwAaCBkxosYGyz1TvuMNA8A2lPj7dvBKrj4wgOAvizTlhgHI3Xjv1gA0PUAdLGeyGZCvi5eShbEb6731NOyzwzLb8DfLYNOtd4aOecEAmgQyfQkZfBP3R+VqGrbaDoaMmg1Y8I9AUA7X1XMTiphytUPEwDIhlyVAPvkKE/m3j73C3EBACAxpSj6nVieHMDRUtlsHC9/dgdkqSJr1z0YAHAkjRSEOACpVwKg+eljWwKsbZaEE67PVQcQKT/CqBLOGJwIby3yyX4uGgDkdzEvQNihHF6fQcbXs3JdBAAqI80Zb+xgsRy2VXQg4xUEAPsU/bZiHgD0BnqcO0T8+irNAKTZc46XARFMOHgNANoegFcIAPSHHkxqceTrqWOhFOJFAoDor9m3+78Y7OegH04hSwCA3QCJBZ6cu4R8zPjGaQbO/BCQfTMAmW4ZAPjYyb3yhtO75S9//V+WL/7ar5bV5z5b1ndul9XpMYJGAADqHn4Q4jgAkDOkCcCCEuB6ki5lzb1iAEAPTOhMSGBc4gHNsXzohlhp11NRsw3Rb3IKMKwnJGLWQz42ZXtwoxQGAL/z+8rd176uvPzoow4AVH2kSV/7DdQx52u/0/vC5Kspmd1N3pxPGwCAjJ9q/0RTu7ZYaL5gNAv5Nvgyz4CD0Rl31o83Kglrr4kAwKteAuyJNKtomGtMp8E5eBWgzscLisdUgM3rb6/uYyKTpCsZNBlC0MYXxkss1QqPMDOaAoDjeAhnmsV1HB9qKvumazpe6u0nA4BNA/ndMnz/aCPmQQGAKOM4/yjiTu2u9k92BAD1KdjwGHM/Z6C1ddH0mQGAbqXAZAC+nuyCeQDzwgHA8JC+uVTDFYF/k61LimDURYab9UYbZ0+2yD08xCMRb59FKvfDBntQ/B70JFQaQpWnagKMPWYTK8GhgPFge1uDa6BLhoV+r0AAEGcLBJIWEaAdkwpCpm0Wr6yefv/vGYrrU3X7BpvRDq0F6XrAYPx6aGc4q/FRwKIHAH1p1KhXgxlBtKtl/MyMXFbw9SEb7RvlCHc7UNbZEsKrV/oSSjv2TkWWViLXj8CeUEws5Hr2aQHkJzCdRed0Xk/7oDt11l1rv+cmoe2ifsfA7/I0mml6aYdXO7hDXUfOEgCAaD1bCXBgRDUNundZD8eWGV8wANjzvCWwL5GZ9ZD08ml3fPyhLUSopMsAvk+ZALfDh6NtqxI7zHR/ZDAT46/XaGSSx+4l36HHz851G/PcwcOx83v4aWKSkx6AeKfVN31PwER/EiOP0sDtyGi+UjrCK9N6zGg5wglxLyKWF8qgVRPuMwAdxTWYXu9zPQDx1C+6J1islhFNpQgsvzoD0Ohv9UdHur7YjIp0R+xjPl9iUP2DpgDgcHlb+GNkyJw63d8sACD55tcAYGOqpveb1EU9Z5gdH68A4PGd8ql/+cvlhV/7lbJ+4fOlvPxS2ZxtywqA7BrwnJD0s+TrzDc6BEOYAgOkHgDUTr3Tl6k7svQUYKXrICM0fihSyupDW4JIh3wofa46kJGSYFnm5/h3qZJYuMSOJ/YHRZsq+lXnl0Z7Vishqn7YQkBgAMDVAQCAz/3g3yuv+47vLfde/8Zy+7HHypHJACQAkMZjKwqsfesVhZ/fRWYA2vWIMkSqeRHqqKGwz8L8Pd4EGFtItk+ZDWSZQro4XwBYeQwCQgmTaUFiD7Wb226aeyYj2UMWlBfPTkE+PwBoOUp4mj62w6e/FKjm9b3VHr3FkrUkP2CnHpSDEkV5i8qoaRmMyQJY5ulEy1vA7oLw/mhXSTOI87eoBFhpSPsaihdzAHDCqU5Gxc/iPOlBEM+9/+r12nYZd8fFLnotZk4NPnMsPIFmg5507RaSd+X8tox4siaONDohhP1W36dP1uLCAMAZJfT3llfQH0+NcMi3rA719CfsHm8wC7FV4KpKvxvt8E2oj3qfJ6IAPtq2kGj6zPnbrI9cz1KnvRxY2+sfQ2mlL9heAX+5wY54v469AoaddC/I7GNr5TNOjWwRPTMLifTiEWja4yDA/07Zz2n4mdGjCvBmJ5IbFtBh9fT7P2aeoAGb+IQdp0CNd8AEUAzoAL7qOO/+055n2aNnlb6EKxLe9tluou1sAzk8/RKo8cILGoNogAaumiAMOcDmjB3oY2I4l8E34yuemc6m8worEmd/BkjUc8pQ2wSwXn00oMGH6tjrDH/qGGvprxdW/DteUcz8wx6XZl7kTHn6RFmF+hr+XgPmkSUgExmyvKiLhAln69ZJwORQFj8Q73vEeJUzKOohHWDdvV+NkObZP60RIHSo9SPcAPMmrUs1jVbgjoVmCxAZK8Wn6RrLDn47aTFyupjn49mM+0DUZ3n9gYYWJ1V/c5PgeE2U5NIFDKBLNoCc0gtP5JnLv1smDfQLKKWeAsxdReTx6u0dvY3UcUWrkKJXn1biLMDTS2MvP2P7VO/uA6acQXL9LdwRLq3o2y5A0PIS3FofOwAG/NXTDbilInQp181PWc9f2/MVcIBessT+PnF8r7z+zu3yyV/+F+XF3/zVsnnxC+XszkvlQDJTKj+c4APhmdT3DogP0kcbnHq9uF8elgFLBiHLpOuh5AEIn+HeNmCItwVQwzHYDbYKGNaMxCYHXZN0ZUOhRM2wd9U19tRiexKl5md+v7bJdTT8/mbL4w0kfLGiHOosBlBJ16AjjOAfZ0egf7CCDMCz9Y1Snni2PPv97ymv+87vLcdveL68/NgT5ehgU07XG9iQMDYMgF01th0zZOhOGxOMAshZdlQAno3Y1fu9pjfyMM5fatzGDkoESjaZxIwFIUYXkPgm9nin9v2mI/QAiPM/op5VzXjkPQplLOkgEtogx041I1/R9L2+Rfkmgb2UV3S+FY2ebId+B6grun7UdJ9XIgM/GOTTFND8ULNTZgkCCf4UAtuemDN/0YPS/v4t6LMsDMs8eOLVURZOsCbiD8F36Pcl7j/QgOUhkn0N7Ef8kz17xp7yPNaHzM2qpcs4AYn0t2N/39Gzg3vUJJE2lv5+g3yWAbiIX1IJ9RQcU1R7v+x/wdVzFeBsHQ+I9ad/SFAZaeaA34/UBV9aeaeqS+0D+ISQdkgTxQzOZbXU0DZfzcGMzd2hGSjA7vFQsaaN7FIRHQbfI+0t/4wyBkcsEAGS+toeALRPMi3dgpekh0D6ZGbho3YIyGxzLjrV2ViX3QFAtwTdohGH0Mg8QHK+gCMPmIA+mr/oA+MET83x8gvYRc1OieoASeWgzI5xriNJS2gDBq9NAYFKRAe745fPjelnHBJnoDzDIZ7b7tCIt9d701PlODSBG5tziPPBYJDnxmPl8fBaLAEAI8Q+ckQ0HUc6PBXwSSqycHNipXOO79dzdihLbxC10AxKyumm3hXqeyim7+90RfDEyaEoHkA/Tw/F5ZK+/ErlrrfSdJ8FJ/RsJVZm518JoDgVw3LJMYfUscQAYCsfsQAqr0fs9NYxDgFAsfc8Hvy9DACkm0N5sfPzCePnBQD9ys7sUwwAjj28dINA7eRGHAarMHEeM3ER3knYd78NueXycL4rzwsAtreLfBl6sq8SjxIAwJdvlz/75V8sX/rNXymbL3++bAkAXJU1gecYQOKPO/gCKhwc4AYZJzXrVQGAssiqhEoALmscen9Cla/ClrM7hEQ7wBVQgvG0rDs+iXG0Th0ACOXLjYgWALS+AFgWccooOBB6oN2x82F7ws/pCwAhw4/Kpjm4ygDAsn6knD3xdHnu+99TXvvt311O3vjm8vLjT5S7m0053RxAj0x9kBFmdurEGJWxeD5mDoz13Lrv2qOLX7IMADz/hOYBiPXI+usbDTzgMBsdspbdAOv0d3yoJDwaPMzJhmmewT0Dh+Qt4VS8fu7nr7Nl57zCL9EqjgN67dOLz5yU3OGz8vkh+e36NZlE2b90AHCaoZVDYAwA8mzNQmndNVhB0yPbX+N9NuUHtvgsozHSVq4IfAEPAHrAaRcAKhh+B06a+As2ZELKyaO8/cjRMFvSfTUAQE0VXtABT4XrO9Ni4+/hgMHqKpC2MrSTzaORXpjriykACBmY+pghzjCk+Ufg9XTDrPE7Vw9kEpoCZFQC3/yMiJZWvrpDLyf5ndug5Fm/ZZYBPovHZ/d3OI56udiLLEZQAGpInVcSAMhuoxXZuRHbV0SR7vku4kUAgNn4ulOcRgAg6emUV9w12pjzGO4HAAhyrXbHccxnZQsgIBV+E/dXQKKt+3it2ZisVfAjJeQDcEVnAY7W4BoArDRvXHUNABI/ugwsiEO8paMMD5apbDdYO3qWF8eG/tUAAHZy6RwQC9jNbcHVAwDzACZzIK4BwMYd5wEA//yXf7G8QADg2dHLWAJ8tgbn3GbQabAI180DgKgra1+2epAIlwO3lepLqK46AOhRauthCIBFconyxXJI+SAyRb2h5IJfWsoZAAgZgpIBeFBWm0fL2eNPl+d+4IcAADx+w5vLnSdulSMCAGuvwIcZAIwAFuAw9pM4AyxXI/u6wOkGBXgGEsDiK2YAoN8wyUpUZwAgv388uXkGoG0z5J90FQDA3qMXTEYdQP/KBAArQFJntj9zVwAwe0IOwLcyyZDHLhEAZK/7GgB0AM/klPWuR14WEI8WVX1ukn9e0QAgxTV6x/kaAKSS68TCTDaYZgBgjv2MbKpmUHWIZ/CwPUqAXfh5hTIAY2LNg759vZ/7AQCGABMpLQoxpO4eEf1BBiBNcppyH6SdavN6HgAQE7otw3jT3f5umlk7enzqL68ZB3a8FiNngMFMLAHmt2CQwbtaER/M7MMrDwC0gJ6miew4yIcXnwHoM/o6/jAZtOOmsfvK9F73KXbif0oGhgKse17CDEDQUCzTgVFlhz7mxYcDAKx0hWwLygAaAZrhjrFigsyesj7UaUUPOwCY9dCqNM1LuMhpS5j6OgPQCZwSMs4A/PNf+cXywr/61XLw4l+XLQGA5RTgdaCsg7wMtS3gxV9VALD2DjylfoAPOQBojITSR3KKbAP8PD0M7agkqYEuu2cAagBwWw7K6uDRsjUA4JvK3cefLHcPDsrpppYIP9wAYLThxv4M/H7IAcCpfnMZgB2A6ABII6zugLzY/2tAdP99H1tofkZ7FJc593qjPb2ZuyUZgL39b2NY0fpjTCCjpQsAKE8rLuax0/3PAFTOgAI47dpo/z736BgAjK5CvyyjwXht+XmaH7TPc54MQO0T+1ZIPj7juGcfvzaaudYtwMPsnA5e0B9S4L1Y97eawGVnADJtfIyxlFbRIXIijUFMMHruKMa8WhmA5Eu6jDhLu0mGJDyicdWFZABypcRw0SwXP2wZgBkvSjyegRSvvAxAT5IpRJPuEM1SNGfKIO6T2O7KATdMeY5nQMvrWlJ5he57JFw2AAglyTxgGYxyOVTTS5i7IYCE6IZAmQLWt+sj480Q5GkTVU4lCR0ASLfNOCl0EpJDHrjB6GhUnbEIXjCGd2LO3JWfvQHH+43bklCXe7zo9U/WYEEJsC5JFQWnpnolS4BpXugw4mAZqDbBmCeNygDU9+p/W/6P1nzMIfU5sxJgezcby2Y0TU+QPUuAW7CDJYoVCBxnNOo59vw108c+I/phBgDRXcpLEGenis502lUDAI2DBnLlyoJmh4YNAxFyPYkgKIrK9lbBdVggA4Cf+KWfLy9++NfLwZc+pwBA7vfHPePiwAaGC0K8hv6zGHDj4SEIAtIBIJTxftUzAD2ReoBGrVcGAMJupVkB2rtjjYS/fQuULAOQS4MrvLqtXQFXlAH4xNPlWcoAPHn9m8qdJ56iEuBNKZsNHaSGVu9+lwDPWvbiBlEzHN0GWXSQhc5EeYUDgLqEHaxW3eA1omgDQA+Q1Hh2qCMD/9aqF3q2c0btnzlI5N/dBdTmhSNb388AP0HOgX/zPwgQZb/k4QIAZwBDAzwJrpg2YDsvALi0wZv4O84HngGMvgS4cyF5bZuTZTjGx4td9Dw5RTR6n/XdrHzZ53MP2ZGE6YMtesMdAYCdOISlNSq8dBmBffzcS3TmY9qZ9BnENZ90JNPh2iUcagFAXmB2YKydjMecR4+7lQCTRLmWCj1/TWLwHQHAjl8NAInzy9845k9w+Wo1R7Lg5y0BnsUr5/le4uOBeHH5ti6j7nr2P6gSYGcz96RDzuD40ExBYcbceX52BwDbaqFhHgOA6JAGCipzcGg+o9rx82YAzgHAVtYj+/eJh+UzAmW2sCzBqZ0Ll8s7YfxcLAHmnxassEPkDczsda+sDEAvD7l81dVBgKkt8HlKgOtTogxAvQZXGQCsvMMl6QwASilWxEi+BNhlArL6GooPXKC/9e7J1QEAcaR4aqkBR53y9WTaBe/hfmP64AR/CMisH+xVKgFeYr9mAGDHIp7eex3KdR6Lmd97fwFAcmqpF6M4VCRTFQB87e2Xyid/6RfKix/5jbL6wn8qq5O7ZbU9Lett7aWHB9q06Jrlr+lN5N8a9VUAcINnInQAIJ+Efb96ADafaHQCI/MeytRAx8ghQsqeOoZrAHZ9Jx2Kwlk1AgByUMPvasFNBgCKdwd9ilpvwAoAwierTVltHivbEADEDMCyWT/UACAerNTLlFDwIQYAYQ5U0j3WGkrWEGYPLAoSKGqxkQGA7J8z//dktpszeH2TFrx+niWWacTe9lufbOafivSCm1ZT/trbHr4MwFk/zgoAamrO48MLAQBHi6CCEJFHd+1eAKANbtIzJlIAsJKzCgCPyTFbs4dsJ+m3ATFH8TU+rGUADrzYpInoRQOATIvRcs2+9/LtsYX6/QgADNdBbdREOqAHAJV9nPYA1DY5pv3+AGCjYMpfoWJr/LIkA9A/wvYEXKJbx/jPNQBYygMpAfbsuMSIxUZyruCvFgCoA4SWHBeJJwQWUhLTZt8LnGVw6WdDRPX69f4CgOyiq9WbZQQq0E8XAOnbEpuBLpdhKKskbIDf+GdIl8kpXdcAIHiWssCvdgBQ+1LYi8r2rDR6TDJkmg8G0qzj4eke9tjhhZCbNwScCOoDiNTqmf5cIEvKo67j2ucQkOaKWAAQcp+8Q+zDt8n3+vIOAIQSpwoH4M+iQ4gmiOP9PASEw8esx9EMAJw5aK/WDEBrmXxQjX9XAPA1X/1K+cQv/UL56kd+o5QvfLast/cAAFydbQDUs2tDzxHnHDOSNADIYOHp9oROEOZDQfDe+5MB2IRq7A9gsI0AXPNb7AZNzbTzpyxYH6cDAMNTgJluKsAhUHYGAOI6npU1HQ7CJ5vjAQ8VAHxUAYDfU1oG4DUAGPvUu32a+WLgGezZA5C5CDZwBj2aee01QOcBQA2wCKBBD6+/RmeECBeTLMcxyuUCgGHYrnQLOrvzDBgGLvSJXJzFlfegGgfPzCX3twR4FwBwSWxY1x97AEY/6ItlNJgfUgXLFfSGa/TLnx9mADoAkLXmaA7ZBLsN9wEI2Hw4C3LH8XWzAeh/5Jl+I41zPwBAFyqm6ULCUXKTzQC8BgCX2I5rAHAJlZZc4+2Zv2dRBuAzP/P7RuQlgBelNYbn2HlsD1DOHx1DXU/Lkx9Y+9Y3RyYwnO1INesb8mv6LjL2ZbNTqrKFQIWQKHDjuGjaoMq2rrIOSVoWnS/JtAqrf7deP3QQXIjiltNTz/+tL4e3cJIziAAAIABJREFU6RJgGLILnrgkZei0uSeKdyImsWX+gQdpywU1QDJamx4AVCwYlLhmWRAzsHEWQM/uD403kQjXYpQhqunl57dEfVAo6uhvAby5E+UroA0gGjBTL60qGB1kAOrZeIBxdkz7MkrseZVZJ3wGzwYopwFA/SW/DmQTZdiDfn0ZU88psWa2a2YAQJFJ4qku+5j1Cf0+W2GPOXrRHADUjh5xrwwSs3J0BmAFR/VplZFsazzOZHAMgHlTMrsXABhRVfFo12Q6l5G5fVliv8b8OWsiPLbexK+7pFjuKSa73GZ2eF1/LxChrOXC0CDYMEXLFvKcLjNuVrkCgM99+cXy8V/6+XL7w79ZygufK6vtPQCbMDCMAECWU3wOAoBrBRbiitRy1VoGzKcBo6GuACCfKkz3O/SjA8xl/Uhm9SEbZ7rfLSqkdigJEss+jxVa8ysa/yKfI781nu0BQDd/eQnSa2UAQD4FmJ65onJoAv/qrVZ+ECBtICnrXLqPTgfGNhIIAK4PHy2njz9dXvN9P1Re9+3fU+6+/vly99bT5e6GAUBfAmx7KGP0PpOiCeMlAjArQNHZzMg3Vl9Ay5dgeHwVBPgDX2yJdx2ZLWOPe7OkEhLxkAaddd37Q20U7F+Keazj5pL5AQ11jQjYJ0VQIIsroV5UAhz67Q7rl3lb/4UnX2dFkr6L+nPXsgeo393kb/h8YxsNhUxPQOYnXoGYy5su8BPhE5L1fUjzpm+rxGc/M9Ey7mkQKzhpUPKxhLt5AyOhAPVoZk2j56I3UaM5+pnLyskX2AM6/8G72Ddi+pp7WG27B82eXC+f9dxONBt9NXoL268cAAzjI56kk91uLIJijynY6Uu7gC16Vzxr+4S2G5pnwPLYAED+bgQnj9Yt51JwYH1UQazI3KSf4J+W+6YyebUI/tTddgowWgJ/6E44r5QPe6kYxsjmUtKFXQ/CmZyP9RcA02kPVMqQjYSNPpttwEd6Q3PUTEaz2fG9I/qFAKDzn1fPvf8PwncA60gPnrzTgX7AGl5An7gnY8op98yxWS+xCNceAgkJkp1Bsc+XWAKMunvpSWJtRBztg5tKp/YKo3RZBQiyxVRQ/fhYHTuP0rN/pCKE9rkuh8t8QMtpvPIMno8CG8bqub6wBkd6lPhvo9ZUr6BEnM1reF/UKyjkfxXwAR495rE8g1JEUN7tn5QpyIjc7OOQuqP+LaPxIaCihx8FCCP64/sTJ6SC+A4w1c8H0+RKkDRAF819moHqgtIlAOqYv2ZNrrM7SSIngEO43sRRGgDMZMAq8sYV7BzqnpW6pFVYWT/cgSYa37EOTMRTWKrI7jvYAFWCFQOAPjCyz0V+Zm5G/c/AH/62JSheJjw/weUuwOHpy72KyfoS4Pma2ytyE93pP9HD0PxNdMscCOzHhfTPHRwO8MNZsTJJpuxldLahsSv1/PW2CfNMm9v+f8BKzr6lUwQ+sfTzThOMgGksm1l4D2QAfvnF8qe/+PPl9kf+FQKAp0dlU2r/PtB+pZQDsl/0Hk1Q4VOUKw2+oeN4WgqAgPXfCGIBAKhYro0+5sOW0Y60bBmHZFsNgFW/tzSHg3nIDkQAYVs/5mULljb+5Oeo61g1iH23+gVWR+hVNxoaHSSrq+pfJgIApAwA0qgJvK2hPATKcDQzHjh0VhAAPHn0yfLMf/Hd5a0/+J7y0uvfVG4/8VQ5OtQAoNqUJv9F+GqBDA1lwmdrBfx7HnmqpPMBGz+PY2P2LyMtAtcAWBr/hPbFXWq40m3KhP1Lu6bklq/7DatYfnEY7jsO4t2EMgByWALsxG2she2k9XWoIXL7MV5/lKPGfv7JIrXxI8KzjWDBm1VifEE9Ifa3lE9iyM4tYPocdb+huT+fZxvgqONiDuFP3fpoACGQTz8TfIpeQ7+e0Jk8nB7IJ33lr8B1nQSwoplpFBXg7th+UqKURjdz/2L/dVP8CcPvaaQsj3oN2w/+KJOfdogeX216tgF5nb3btpxftP0NrO59Sxq1WiaWR80X9jPSTLD4KvkxIsEC1WABt56L7P6t4nmit/d//HrqHqr1Ow0II/8yA+NgmzuKf/f4jJ3U7P1jAFzzdZuX8YfnrC+xzEhJ+kNBtKzL/IXsnmM1vWndO3/d8p8exyh26NZoIIQyGsUWs3jBP2ohAKiMxkQjIABIP669gACAyleMlUB7QAoAdjvYdnAspM3J7Qd/ET0Ae/MXLaFPg0bDwU2nRV1GAGAyT2+wu4A51r3tdTtq+K6JpApy4VEhAJi5mD47ghSNNgkSJPTmOB7+eNdeAEAGAX3LGPdAh08Eu+3OwChTNxZ9Kx9KHMThE/dvgoAhANhkblcAMD9kAAFqbbw7ANDvKKim5GxgNUmzbAWR+gWGEY2PsHHIBvXrvMn1nPlnGUees81aEhuOuN8YA/H0rbOJ/Nee6gHAMKOCNgzqI7HFm8o2zmgrWU0tswlKaOklIQA4AdBlWgyZhABgo1Cvz5qA1qFDCbLxDXIpW7ZDN+KDqQQjwBSAdAikNWd2HwCwjmrGvzpDM7Bu0+wlUa1089UCANl4Kf5wPQtz2ep7xHinSeso5HMGoUq5RQDgx3/xF8pLBgA8LmerutdfBfywYJVDPJLGz3qjC3Uq9q07KSsFfG0lAxB9VzXzkElDAFAAN84+bEIP+oyVMJ2CivMA6YI+hbE/o7LzVOAM9sBs4FXhbNe2+ZMsqQ2GFACkd/QZ3xoAZPniUryzstrW7EwNAD5STh65VZ751u8qX/eDP1K++oY3ldtPPq0AwAPbAxAOKco3vOdWg4XJB7Pn7zndvdtlRGgbWt9uAECn+5fYx8iGG7ul/ojtsfPFCKBtltsOyrRoiTKAA/9Mf8QtKoYa3YlpeggIPyTjhwBEamHh3H6MeclvfvS8lFktzsLz17A9QR7Hnnk8XrYFmYvg7QXbteiemX+2TI7G80ZwpwKAoxH3G0jWP/bPZh3F8qstOHicgzTQcXyD7+vH1/yinAp8twBVZkoTnligx3YFDJatWbvK84vXHZYyTZ9brhxz5OyQpA4AVBUcmqawuqrFjehRWvYm094u9yAheC1g4hFwh986MNiBiLP1QQBQ85+lYaaB4Eqnv/z7LADIh+ywLIwAQJzstMdfGPMon0+WvfF5F9/mDuAcAAR+UBrQB6hmw2ou/3Z8uf5H2Rj3MeShjLULWVF1wYxfPOs9cACwsVKsJl9ZAKBWI5RDsNY7WHqHfActoZ0wVwKRKWBN+9HbvDz0gKkzQg4A9ArGvAdSvGMAsFfA+J7MOTFmxw1cAj8hCFnSawAwAQl6ALArGVAAIDgrQQZqxsleuU0rIjSv082J+zcFUGZStisAqJ+3eyDZGwx0cNrPPgAgw39T2t5HAJCzI2sGII8vWsd6cir/RACkd8o7fupKdmcrnruonQG9BgB3IWjZLQNQOYP0Fg9Q5v6f6//Kz1A3aYBDAEACsG7dwwzAWgL80kf+z1K+iBmA64IAICJ0BwQAxmRo/gvLNgEiNbsasONTAAIZNGsAIJdu5hZvBgCeuTJlyRCkYJYDJMhOBHAOgUqo1KjOqWR4twxF2HMiucKea7r5Ppcx10xGX8HBAXajRcsAZODQnoq8BAAEDQItZxAAJLe4dgYsZXOjbB+5VZ4iAPD21771GgAkCj3sAGAEMJnNoUDevZQ+eAAw0WAdANpfGwJvpDb9d+BB1wxAAYZqiw/jNWNxTKLRfTzx4AHAmkWceYCWZj0AGNh7jQcYeGUOAFjS+VOJ27dLAEA9crZTTH8cCcVeCUIww0d2BQx2MvaSAT6wjR00evkAYFEZgOJXKj1RNxD4ID/2PnRZf/8ZUriBNciLDACC/ec9MvhmASqryDVbn2sAcMaROQRq24kEiUOvRgBQYCopAZ71IVNGxPfgUM4G+pw+ZTsrBZ6UAD90GYBWwQFgAgCgwFNBY/EZgzuTE9B/aNB134PgNRqu5K+lRCNA5+GaAADU3GPHUlO4FwCAoDcd0JiSpRfkawCwJxiqxnG2JACuLgMQ+iupRewAYZ8ROPNApAzMj296o2QAZqwwy6CaSdf9BwDJSVBOiQUAG12Ep+UjBLW13LKDMAX/xGshEIDeb0tog0NA9swAZACQg/doHer8dFN37QR3mUXazhgHatTmfbbyvA4TAOYaAFxCSLnmQQOAXYYp8D2Vuqy2UJVVwbjquN86PirPvvil8on/4xfKS7/9W6V86fMNAFxjBmA9DARsGDv3hhoEQEq0p0BACuAqPSCQI9DRAIAT/wY41PUAbBnhcDSGypBBPm5lyBSIQBkalydXX4QBwA0BgDUrsAY0eMpudZjZxcAAFMuwWhIslzHj4SZxmQuDoFwgRLZdMjCbrbf615cA43UV/MORnJUa4PG46ly2tefg40+VJ9/9XeUtP/jD5e6bvr7ceeqZcnR4WE42m3K2dqcAv8oyAKclwCrTfqSj+fMw48tkh0LNskpY6YOz7pA2J7Ch/A5spbiNiYY6NwDoK2BMuWAWfPKgnF/rzA33mQunMADrNEinHyeAL42RMwBl/UgXLgUAYXakDKJ7JsUrCzfzx34/H5SYZgC6zOwcUKH1ul8AYGY5HU7Evg/z9DUASBbX9Qn0/n7Xoz8AALX+AgBQ6bwuIUwDwoyPqAwybD2hfhhh53LkRY54u/88ACCPZCTPIFlOSPsMwOo/MzNqQJv8CdMTWOEYF54BiMrp4kuAVUqtt1X1lV2Gvaem1U8PXQbgs6MegKKAbFDJYRFzuQ+QR0qfd5245FXp2NB1RhGYA4C+CbV2IPAd2Q5RpoGXfecVTFxSrB3cBgLmACAz2hwI0SPterC5aYQ9tSZTHY3A7N7zMxwACBk+qoRQ+IdXnbMOCIjyPVPk3QsBQBMQueypltCv1uMBZwDqUw5FlbCDtmjOGYCXL+wUAITt9HpVc7F8k1toQq5f4wHANICoO9AYuokR5p6D2otNpjFzMh8uANBKBzp7PgPQA4Ca+lZSofIA2KOXYAnWwh6kTSh8Ca0vm5gC85JB1PL84OAP0AsskWpOqsQTMv58Rqnq80QuiPBPpKdm65+XCM8DuMsuAfas7+fzsJUAd6IcOV1yUV/C5e/PrWOfAch8j+veAj7UYpiJB5lkBAA+95UXy5/8/D8vd//NR8r6qy+Ws7u3MQMQAMAqnweqkbvnlzkAKCUg1N+uSkQD3XmzZTzLEQAIWTFkWysQJoeR0JzlPgmgasYfAoEMHNbs2/V6XdabdamnFm+3CABWFY9iWR1y7kNHGYNMx9rfEGhpQcA2txbCYtqRdqTbv9v8yA8lEJL9Q25vgBmAdQnb+p2t1mVz45Fy78YT5cY3vbu8/Yd/vJy97R3lK4/fKkeHNwgAbAfLwHo+ZADgKEBkCrJ/DhwURIIz7zLd/oCXKN1N/9T35KeoMsIdv8WDxxJeDgY9+z5yIxBESmc5KO5n/tclZGTP6HEd+EAxTT+ORjg/lBle4E0727MIBAQNpw6F6WKXCdjLLKTfmVOutWkZuXCz+30Rrn4O8nTWZUzrFNIYYY8u8T5thpb4J+57M5n+He3rcQbgJOQyrYBi8I9lzwqDbsEVjWxY4jkb0J7fZ258713xiPXIcx/MlwB7/kD8JuEy1xPQt5hh6rZo3CZANDuE74GRq9fxGXr4HL1RRiOd6Z5JD+hRBuC0/FY3qNHjde9rG7Z4EX7t/SbNgyqWo82RIfX1syKZMjcGSh+IPdvgt/zTb0DrFwcj7QDAniPGDUMCDtf2kgg60mD7lABrTQXu0Ix/nvnA+BAQ5Fnb5JQFWoytPgRgsCPF6wy/TckrDncsntcA4K7daGY9DftDPHojPTPKLAIZACjBvQIAiZ2UxFEGIJcpBac+idgvAsNcRsQ1AJiabVRPCYDIACCXq0GI3Nrfo/C2/hYYQOHf8O8gILADqqdKuU8kvSRzrJZ7I6Mm6UufcH8zAP2o8JAfDQFahU40ygRWe4/8eKWnZ4cQRT03zCNncpkCgH1muc0A6U91FJ6SOYwdRAl4ksW+BgBtC5nL7gHYLcVVAADBU8Lef6s1gnZryQB8ofzJv/jfy93/67fL6qUvlwIA4AmWAFfWMxmAyjlm/14cMObTpm+bk45yDLy48gBgrgdHh4Bwf6wKAiIAyMAeaf3VmoBLyGPETEEHAG7WB+Xg8LBsNptyuj0tJyfHZXtaM/vOymYDkwdQEBuvQ10whUB0wAmAfzVjECQRrxeFTwGFOIDewaeQSTIcMUuSsxCRvEQ3Crp0BmAFcCsIuj64WY5v3iqH3/Tu8rb3/FhZf+M7y4uPPVGODm6U08NDwEj5FWi/Hq4egKMMPva52R+cxcFL7WEfp7V1i0ty8wDe9o/0sUDQw3NWohrEidnclgCA4/uZn9tLNQAwBgDVIF2Q2x26Bt+PDfwIANRi1cCL+w8AZrSf+4dNxqPnmLgyfJFEKvJtD5h7/lT+8IMGANmGMOTC/rTIQG8btL8aWY5rANAxigEAyd829MXrNQCoS49iq9Xe0QAzfAqYSr4JWC+PtvfNAIRNzGTrwkiWGkJ0CrCmmMyH0KnsHVMQUoySp8GCuAYmALuPE9Ol5JsrPcwd+t0RAOifrxcv10++PREOWdlLmsMDBQCfHgCATCPfwy0EALWichIh/SY4o/AaADSO67gEWJvt5e7ZrgCgfrKAuhMnS8wqM4NWNHyKHtnRtMSPeo5hCRXecJ0B2DYh0/6JsnAXnQGo+E4BgPy6U1JgvDthTu0jANCUCKcOeT2GzvK28O8MWFooEg83AIjgn3byOwBw0lKk3yFE9SOyPjmF/LIBQA/4+WWNMpbBlboiAGB+SHTz9vY9BMTT4zoD0FIkj/cXZgDWRxIAWBsAMQD4JJQAf5EAwA+X1W0EADdnCADiu3UJMIcKzZFsp9yxnm4OaQgAli2CZKT/ZjZgdwAQS3zXmw3oFt4RbxmCCASuVwcAGh4c3iAAcFuOCQCErHVolFTLOduhHFXX1jnBScacTQl9BDlLiuamlrDZijgQavK/HwB4tjoo20eeLOuaAfhfvbccvONbypceebzcu3GznBxsStnUEmAc0MMIAEY7/Absa/XaCy3mDpeBers4AFBskgzBQhhd9vkOQx1d+kABQPGfJdqikloFKLpTuzv76OMtfcgBMfUrFgAk+s1sgKZZDKho3aMO1XuAACCPufk59vCztn1iwedrALCtNlgoowx7LQCbbtIKS50qTJtZYBMMBN90Ej46b4/W3o9PuQYAtfHv/aVmiScgBOi2fQDAzGgEm1XgF2oN8yoCAFvpmDXymkwmQKPLtME5DwCIDbTzDg+Y0q7GZ8/F7o4BN8ZgiQORAPT4VntBD8DV7xnRZuWBd4JyGR4CcpEAYBvjLBDF8qe8EXAPACpCkv0EsaF1iUoQUXfWcdVMBD51FBWwfrtQymx1jk2+LQGO5mHXAhqaJzsl/pjyviTDrr/nVvOtGzbMtAZTRD5NV7k0OAmvUZtolXtAQy7HN2uASdOeGqu7ElLuAciv1PxUP6t/WxqNBaguqRNf1XTeT2q/SaYAYCLb4oDNdugSHdKabS9RNPE1fojdDq4zT/4pfAqw/tyU8HT6x8mfSyGXIEwU2GRdIAMQZY71ZSsBpkMGaHDRchiAUPcsbQKSEteXmNuLXU+R8EmBU6DVXcpDzVnMNmYWsKG8sQcAZ3KRj9/r+tkG0v6cPLozG1+jX3S32JfBozlI0vQNS4Dr/dXRq0AVHSaxoQzAZ770BQAAj373d0p56cWyIgAQstFABmzPTBMu6A0tsnU2nKAKB5YPAs7OavksZ7f5FB/xHHDS4xJgDmRtBuBqdYAbbet62i8eQiLPkTGuy6ocYAfO9QGAhVXvnJ5WsO8MS4AFADyRA0GgP2DNvAMAEx1nKa2mDMAz+s1L1nyoWAoWAYBgIwHONCXAldanNfPxkSfL6m3fUr7xR36ibP7mt5QXH32iHDEAuK5gKHNKywBk9XYufg82sS5avnxP3m68E/s1baQb1KDqlYKDYpQK8v4O+xhiTzt15fznbgJB7DFTeQsXDR5DJ2HHt0QefrsStJM5RdKWAPcZIL0+6xIsnBjgARfjWKDPAFT06piYWq50m4btpfCvhL6RLt3Ffmk649g7D0ddMvMttF8xWnT7DPSfshH3AKB9cr4efhTznoPBuJ08YZsRxU38vSwWfgAzUy1UIut53zMAp7zkIyY/6mytOHYZXxMfkt6uZ3q0yhKOx2hcerOc43hZstZ/dsR9PQDo+G8WXxh+9cSsPdr1m1lfIQ0zyvGTsMeo0mmOYL6nHfytYvTLywAMFFEfDGFP4qG+J1lVZLPhTHCnm1urEOr5snkNIybn5/f8hkOeVLhOkjv8tKOM6mkJ8LMftCXArJOd2oR31WlwjbwYdH1KI32ozVUrBfX9MfBiIVFIw+rQ5UYg2yEHp9AcstFzSi4m/QGpXUaM4yHr4BlXCYOLzsCzve0zBIBFJta1uur5jzZYsyvPaj6DadzNAJivR4/HdVbOakaRKvv1J5Bah8WVAEs5qh8zCZ8xeMYKysT0oQGWw5rKa/2GaD3UoCy39QI8o6B9p7valXPWbz0gq0ZJa996KPbvpvFN/CR7X+MX75xHzhj3kONG66KWlZBreTfv4sa3Ax5dUgJiS2L6ic64fwoAzgKkiXRlX18EAOif3zlwEwJwry5+Dp9wVm8D/Uglb/IeEez+wXAPZPm0nxCfEOPAJQ6tjywC7qUwCCjaj5bWykMvf6IC1DvG5rdmOGUOf+Qia4ov151+nQAIp95mmXswrWCYlHHkwcxs/vndOKecRvqU5v1EJaNx/u4su1zGYrbcu+06F1xTD8Czs1IBwCfvHZWnX/jr8kc//8/L8e//GwUA0sm9QJ0KpCmJEAfSzUuBa82BPivYswnLjwGMW50WPAiEHXPniQngoO0fvYtO76U25lT62wDAAll9COyJHldrDNnGIKC1ZLhehycD88nBUG4KHjSV9Z6dSBYgZEJIOVXr6YcONP0HfQ4RcBTxFYDD6xv8u+n/1gMQy6U1SIqljUAFytzAzeNVOVsflNPDx8vq695Z/tZ//Y/K8dv/ZnmhAoA3b5bTgwMghQ6iQB8GfpdQO0/5JX3Ds+t3UnsAcOLfJl9rX2Eoe4mCBtjUHfLlfQUP0swAp/51TQ6W2Hs/D/+8mb3vxje5ASHq+KJZCZvQfzYoNal2yA9+aFtwRPpO6xEC19XzRvFB2+jQgJ6yp50hHXBQEoDgyHIG9RU9nr+sfVbzpwmgPzAisG1P1c/AS0jfky8mQ3tffMKw1vewiiPizQ3sgL5qBPj0MCkjiw3Iz5rEBn7k0QZzZtdnCSXO0DjdX/1Jn2HF5ESgKecf7j+7gwC6fD69QEY/KcAVP0fe9G/aFt8V3VLLZyD6DekuYcTEI97/pcWUjaWozBevGfGM3jDC2Nz7F/ZvmW/aqiXmkEVlyFABFq2fZ9xAAGRd2vs9YNkl8BgEkBOOOqtDY2J9y3Ti36iTcNSzUuucN21PwoCOExBwVKFlyswTAV4998F/K5SGf+i0Zx47C4M7Irte7gMArVAhAJYDDfzumDMFgaKqz8JT8uIfHG9mBFbQc3CkhVlUMhDQ6+fuVEw3ONMzjAnKWvAyAEBAaEYrnBnPdo+oGWi6z0add0CIzdVrohJPAQhhA43WZACsNZJxo3IeJ/02QRSPk4RPKT/8xi5ADgDqZuP4PO3Px4DNMhpaag44lgBArZSijICWNYt0nNjwzD7HGsVCOOqazh2gEyArYKNGonghdqD4kfMDeFIAyQCkkXO8wL/KNhBgaXdxHnYj9WUAgGZHZ8EOkQYA60xhA4emIQBgN62Y51Ef7wAAooEgMUX+iQBA7azEGdRKY5jxzzdIsMQ8syAz6dpV/nG6DACOsp+F5Jc5vlhk7GrPKi2CLCb9gFkJ91xiJj1IU+2X78DP/AefjQcg3GoL/f8qAPjUvaPy1Oc/W/79z/+zcvJ/f7SUr36prI5eLgcVfJKd+QoYaf5ytqwSQAwmZQvqXWbJkK0A4AkAgAJudcrRO6TM281u6lJeeO96AwDean1IwB/2AmxjVnYV7D+OETMFCQwUlKyuFZb81rLeOt7a4w+BS86GggmLhhEAEDICuVy4fo80Q3mPZEx/3xxwzCCkd1L/iDrNFAA8eLys3vKO8q6f+Kly9s6/VV547Fa5e+NwCADyDLSfwzOa9oSdbFj7U43TdCvIMBvvAvtN2V7WbHVM+P30ELS2NvAvpy6jAMS+R90/0zWRt7LnPUbsBkqohfRj+zCGB/N4Jn6llt+oAihS2Fo2IgDQ2y+SG/q4y3jxAU2q3+ftZfIgfxRgK//Qt9hy/v3cvsyMnAc4HHcm/JWBw+TUTLIJRZMMOHDsW1QywEoSPUZ+8iwBJq+AaEARD9DI8wL/EgDAmQs1cgLk4Kv4AqRB7n/t3uLHP0/Jvmkrg3FwS3hqk2x3YA/QsY9HJb9qejYjq9cufQKR1002huUDy4Ykdl8AAGhMipWfTp+LOd/dDz4fAKgHzj7KxJsMevx1FYVdRVMEMTe9h+1YeBNTvAABAP1BVXN/116xO/+2+yG+pPVkTxASPHaQx2sAMNkBjJyIqwYA5qVlcwPOjMM7TAwActo5O+oazGAfItxtpZJabZi0o2rVWQtcWhAQfaYM6c4AoJg2ddJgCyhMCWtoy3ZVfMn1VxIA1CCK4hc4+INKNGuANQAANf/0yu8aAJzp4lmGr6epNtCi6xN8C/Y/yOjVy64aAMhnhMAUQmJZeRLHmPdkR3Nnwl0mwBZk8Fq3Jd+hh2svcXyVVtRFY+iXzMg3O+V5HqDNXKKrAwACuESnAB9sKwB4tzz52c+UP/q5f1ZO/t3vAQC4PrlbNrsAgCajVoFdBALyoUkIajkAkDJIlcunSg6tM4oIHGXwQYaL/6iwAAAgAElEQVQfgne1hBfKwuQQEDoMhNLepIQRmEUDgJj9BxmAcopwzaDBjA0ea6FMPJ/Zx8LcAEDsC2gP3eHxjrnQlADDFoIGAFEDIgCIAZvPAFxtbpTj9SOlPP+N5Zt+7H3l8N1/BwDAo5v1EJAD2ZRgGjM/e9ztGgAkD+0hAABnGkd5hGmLIM7uSMzrtELHhXumZBhgcNOCYwkAqBfAnxLOI21tXXxGTDfgBwwA9nh5880r7eYZ5rtFvMOMmYBprhIACMMLsd7x/Ov4rwFAv7CTeE5vztFhYFw1o5+EknYNAGa69sEAgHZEPoPd4H+6rN7cdg0AhrqGgy8N/CzOAFSocxf0DnZhqpBd/QxAB2kNM4oQuY9O+ZLd+CDzbQYQ1OeNQAY8QGAa4lHpDEqAAIDm9MKWyQlqTz1SSg0IPOOeemZnarhJ1ByWVhbVB0noevIugHUQugzA0Y6UAQ7bM/ypl5aWanxLvcpsx8rvaNWAqxJcxXL8TwxAKMBZ/O4lF+rFi3iHv8eRIEB6RgAgPT9Yz5jLsv1zfNayDEBNFafgJ1PGnhWDi4DV5vKxhKrRNbMMwHkGR/9UDwByxjZf6WeDCXhIgErrCADsfcvmJPnn7ZsBKPqAWuzAiFRG9JgPHACoB7tk8/kSAbYmHzGHLCtRBUIMWGxJcNMDpPphsIG5LwOLgI5h7IcdAGTbiwXbFgB8+uhuufWZv0IA8A8+WsrtF8t6e1w2tUefZACqTQ6x3+1QK0t9vVYKsAPmbyXAurwVl66VA7eeYzkAWA/wwPLdWqK8LqsN/j4725SzaqSXAoCVe7arsl5v4L+qf7bbk3K6PS6rFZdC28wmw39cAlxPTZbMPeb5CgBiL8LRTwcA0gEpAECSXgMpIX8FchuhDLj2aKynAN8o91aPlPLGt5W3vfcny6N/+zs6AJAqomEI1Z8Va6ME5xoAXAAABn485Fcoh3FXXTTzD86j2lCyoORlpMDnJ2nuNKFdMwB7sMICWNEGEw6IA9+uB90VygBEgMqTXvnmAgBqIvsbZn/b5z8MACC7bPB7koFvnVtLi2sAMBLrSGD1Z+3fiHewPWnP0pvQW7Az4wDD8/f5MwD5gDDSXtT6oo0ujmD5+zgDUN3tetIgL/Z6aInexbuS+Evs9kyJjuM/r7xdgp/oQR6v3xCXMZoJzQBA9F8aVcb+8YxOl5UBaKP4xL9KS4DpPn6YZnwBA2t5iX6+poUv/w1AwMzA1+deNQAwJqVSGgZQMHAO8Gr7Gr+DXSbU9KTLrbBl+F19QlqSwj0UBvwp66qAmKUAYPhIGnoD/3iHMhMDNQrIYOCeSkwHRhaRWva/mXghgIVvcPeq05viEnBNnfl7lHkYB/SIerTyJyqB0iCqjJS9gIssAaYptbULHEyeCAgfV3DiOvLwl6u7ueGYO/gWBFnUc8Too4sFAHcpAYsAwEieDT0noFbn0HMKHTFOb0pbj4pKa+zx2RZZ877lCynSMz5m93zn4ZiMZFj+CjZQKTsD2sKHtgR/rFtnDkJi4NI+MnOAbXaKXMaPSwDAukEz7nODO8z5j9IntICWWnkAnsryNPjYRS8OVheAqNH69iVv9inzEuCZfmnsiyAcZwAenp6VZ47uloM//2T5D//0A6V88o9LufOVclDLXs8q8IVu/7YKtHhbbL8YAGz985oD6hwkY5tqMEEn6HZBRTsZGJ8lkJTy0nitdQbgIdhULPfflLKuWW9tY8ZnAOoS4tpO4+xsVban23KwOSw3b94EoO3evaNyenYPQDbOABztsvQZgNwDEPl2dwCQS6BaSTFSAuphAPyrY1oBULgqq4PDckwA4De8933l0b/97eWFx57EQ0AOD0rZ2L7MkgHY2Uok80z/7yYRc/0Tl0e3t3BAF7/XN4n3V+32flgxpzDETVGPtvHAvI/XjGb7a//8yUv8mPwQh9nIF9C76ynp9YOdvW/q7ktAzXgj2+LjM3eIiR0x9wQdW2bOkkxtt3qnz0is+revKEK+BH4z9oG9lbEOtRnG3GIgGf+kBBgPiRn91B67Mx7IZIxkI3iBrPpONti+ax8A0MyGWitkM3z4SoCdB+Gdb/M1+c6uH6CpQgF/fcQhEcDdXhAB4HkJsG9hZU+GbjZ43NQMOETFGFP9Bj0a99PAEEJCy6CxfzeTHk2t/to+Rrf6ry8h94BbnKWYAIAqWEfpXWJFxrO8DADQ2+hshHkJsFt6NvbsCNTfkAE45v8Gu7BDpZlvwlrIQJfTA5CHTGZmuELzBDoLcvQludzkFLWIaWrNAGDYQwiH5N/vSW2bCHfmO9997RqdqgxAQe5x4Vhp6KylfmyMGDVF5cOUzJWQgMBkQnrlwUZuifOqD9mg600mILsZdVT+PXZdlyuq5D4ghv0+OgSkKehlc1w8No0xw6LaebNx4OehA6ZU8ACcGov/nIZ5gN7P/5UAAGYKWctUdF1nsF0AoelJktuc6QAApD06lHHHSP0p0QGn7QgA2n4p/aFIsZHfzwEB7r5kAFCf4u3H/iAAwI5SpqQFRyh4VbDmZg47BR+LtZB9xSUDgMgD8dhAu8h39R/UA7CclQoAPnt0t9z4s0+UPyIAcHP3JcgAXNEpvVx6KhQNSnB9ADt2uFHX6ROA7ajbybrxbPj0Sta5XAJ8QwDA2g+59vbrAcCWVYCZg/UZG/LtKgB4Vg4ODsqNwxsIAB4flZPTe2VdCasO44jGhQE5Hm5iS4BxnJY+gfRTBjp+w4eQVP+CS5EboFidacjf22JmYm3gjwDgzVLe+PbyDZIB+GS5Ww8BqSXAawuS+YzWyN/aj9ND6swksPMX/FMeOAA46dHnezBdHO0u6kl5AIfyur/9saMM/LnJoTLeX7QAIPfaVj6aToHhipMsPrsfAKAigs+A8hlSTVfjoPsKM01D7V+S/jSIHFdcxbyi49lYOjFjY8whFwMApj7wzja40efVDAC60IbNRyfJPmNsJK+MeXAFjU7ayPgjawm7HwBoD03RYKRMMjkBmGM8HvMcAMz1Y6aFAR6bAoD7P7/p5aafe4DPboB3GwThIR5LAcDzW4YrCwBGC3sRACC6cQuat5PZvQwAUJhfwqGxge8BwOhaRjd5x4qoJ8qbhPacAKCISnsdAYojMexLgM3oBwCg3dVTMIIDgACookw6Ubhik5shYmWZu1H4rWQABuXQWsE1jZ4rEF9C1DIBtV/nkTEYyZ6O324AoAeMdaadjPU8OlKzBlZzDX+0XPBlsx6JKUC+4BQvPK1x9NN/94oDADNQNVirrfYoPELruZZKGGQ3/SEEALFEa8C0CxrEdwCgOURk1iSfD6FXDoZj1ZZh3PPwVQAAowD81QIAshbPnNS6wS0Wrh5sQYeAMAB485OfKP+eAcCjBgDW6xBAtPp+JacC82m6OsMxyWgkI9kcVLaf9fkITjLo1c+HxlB79pHdwo3N2gOwAYBwGEgHAFZwrgUVGgCs/0afD4G6WgJcEdPT02M4qRgBQD6Qgz07F0IJAFj7G6oegES3BgB6GUfdb+03l/qqDUYBIPG7eoALAoA1O7QCgDcIAPyGghmA31G+WDMAb1IGYI3o1EEYs5L26wxAu759AOq/39ePat7eheFvneDUjNGYb/HShT3UMgVjvusBwGwDn8egw8weALRuah8AJxgzJM0Gp7DKmC8oA5Ceh/pS50vVnqJj3w85x1aY2ab7vsUM6qP207dc0m+7BgCJsxKA2Gec+tW6ihmAIfjHA3c+Yw6AqRiWNhJ7ADAHiF99AGCz4w0AzOK7XYNb7yfYv31GLvsvsvxdiXOrkGqjfBUBgM+qU4CFSIN4a1EJsFG/1ojrpUbgID/hFFxfd+qkZiUU9MkpqVCC1gdwbSxjByVWJBFx6LOqXKi3DvoPrEDYKNXdZnboG23iUwTpe/U6Ho+mY3YIiIBYhNKwqtIzsGuK48O6ffOWsAQUA1wLAqJDQ9mO1J9gNwDQZzJEgQGNjS144oCFAGCYI8vv0fwwEITh+zgQcxfoiNt5s13GgSqbFyB2Vx0ZjY/GwADg6JG+HKPjrwAEzvzfPAOASrYWO9DUM3Hp9XQqVLqKO/YAnAWA4ICbLGele5qasGFBMMAm63alfA/AdogAOvpGtqF/CeX4UZxb3WltohX8EVAV+Tndofananl6gj4gXS+ngzdvzPdEtYPA9gijggYYXSIb+L0lbif6kxpRXwLsX6cBaSPmas5z+fCzbn/7HcvuWR0A5Z7lvgezRJdowD8e4xwgXSqKo+vyDLC8BBis684ZEnYklX0FBFhty5YAwBunZ+W5o7vl5ic/Xv6QAMCDo9tlva2lr6fSE7UDAKEiolIYwbg4A9BzkdIRoD/8ymQAINscD/7BGYZls24lwPUgEN5gQ5mq9K0AoAp0+BTgckCnAbM9RD1Q+fHsFEFDTM7TJ/v6efH6VfCSDzghX8gAgFEZOI6p2yATfYN0Mr0Az/AE5zqmurGEAODNcry6UcobKwD4k+XRv/Nd5YuPPQUlwDUDcFv7GGoA0BzKgLyi3YyZ/u/lM3NOZhKofZL4OVmAzqeuj0fQv99pS5y9WlZrX3qb4zUZbsAMtUuqPiJ/N7ohf35vIOz1DALGT4YMy4GPMPdrI+NkP2P+jjdS+/WHDUCZgAcfOENW2deJgv7/2XsTJ/uXqz6s770zv+UtepueAAkQIBRK7AYqxOAYW5gdFauDnaSKSipV/p/iWFgswpgECnCCwdhQmMggtsQIAQLCJgwILe9J7/22mbk31Wfps/Tp09/vzPy292ZUT7+Ze79L9+mzfvqc0zMAsLYByH/G5YZo9S21hV/x8wwABNkzGeykE4iEUFwIp5zJfOGEcsWwmXtHIxhXsNHm49jFwAyncR6Q6NWh/Uv7tC84RCxUODLi/FDysWzyYy8EALalH1Mw82/Yd8tGaTbEedBJGx3W5bz2qwFA8jl5bFU3ZPyRHcIC0BMA4sojNwzLtlctstqsA+nSobB0r011rqniSxIw0LznwWeve9Unwam8VlYi8C3TNk4fdkNDeup3dP5+AABGtU8tLuIexhBc6c0SZLJghSb60n49o2/6sKBEH+K9tK0BPZFIuXnhR3/LRZhyAX+hhcY4Qwun2l7QgQeoIEcsRv5l7kBMemahgeVAEgdsx3PRJbT3xyXA8lZxNnEUvQi48agSgaUOEc6SnhMZUEUFyyy1JxdyRjOOnLFJHzaT1oAqWT8QPY5/SDmBeVYMqflH2EcEu61XKlrLA1MB2Hjk9C9pBqsgepphnocaqY4WOv636caN23h6gcK6/wAgS7ruEKH9+omCjzwoL8cDPaDM2uCKzPlmPWTHtz4DsDdRZj0nOsxTZxYAVoUuBlb4mmXX6B/aEddDsDIuJT5DHRn558owYc8/OuGzOS/8RtE1UnZuqZNSL2cdB4TiyyXgmTvH/PgsAPP8ENmnDONLM1hJE5rOQ44gbMA9nVi7s4dmbOmI5zoAl7KvJjyaFiJMSoDzR88DkDkLJBxU52sCOOdwTjb3UFZIRqY6aDxTkAII9Ot/FUTal+P9obxw5045+v3flRLgu6+UXe0BWBAoRAfe2ev2NzqiVr+PaDHyQZTNAudTn6JL94B+5p5//Bz+F3sQYg9APAm4/i0Bh2TSiXWg50E2IR0iwuu0r+/nAmIuwbUAoARU5NtBQF4Bw3poh3OgWw/A5jQoQ8u+YSw5EujXrE05XKECgNzXBwqCN8fl9OhGKc9/Rvmc7/on5ebf/brysSefKfeOr5f90Q6BzC36MOi/xIAH65WZ/jdctiBD2bZEiHg0t1+Z/OJG7GSDXIMlzleLwptIl5oRmjnPD6Eb6V/x0a1/GdnuEYX4TqZxW0Pr0dm/nELztscDIvn+kfipo+u0ftA+QhuUAlCBR6mlMY6rtzp9BvHMwUkyANup4JnuHPMnjpc9aH2d8osYgPA7z839k3k2qEUTSvmikh0ovoWPx+xoo56ClsNyeJPt1ZgDZ6YbZxff3/h39hD1PepfjnH6Gy3gIOuw4hXm0jQDsDljQ+91AcCU678Iv7Jv698teqDfYMS3yenaWm7BMlZ5pP/gyhR/6Mfu8TTPX1kykBCe17f+Sy3Sms/v59s8UaMumm89ccMzgLRxj3plBxgbEkQ9qHIJ6w8x9TR1Eq0BwIDtesDZEkDmy8+lhzTwTx7KvJInIUz4dwKwzuRS09tIM/NDOwNBxf90Ifg7zysAsMkrONbWJTRI80ieZ6PthGXexDs7xZDtQDYc3dS5Mb0iwMUxXGuIrcHx0tU3Ze7lzxl21yPEO0zx3OkZwAT6eQw3KgOpHgAKrgN8JAiEuxj4czyCS696ADIE6YPabsBs/tB8t/XK6j4Mo+ZMlwKAHYJfJyfZCKhe7YDTjBVmSJNjk8Px/nmNvjTH2SlKM5Fj/tZ8w+toyqEHDwozTCeg+3xMcsV0KV2GzzoAUORgNKZcPQd7Q5OePQwAIteI7I0cBW9gNbfhPRLERbKO8Wrg5BDbAQDIfM7Vbu1yNT4e7prFS6qL9GP06DDAngNLelajILHOqwMAA3Eza2wGk2z+twmoNsEBs6QAIPGuX52M57zDefEeWnZTInr3aDxLSphFl/SMg3wXbYoo+ff2zZW4p/7pBPxbytJ80l8PAN5GAPDHfriUP/hA2TUAkDMARwCgpKYaALCBg5ETG60Cz553nyMAEE/3FbvFZXEo2wgAVtCPwDzdc7HpVk1l1plVTiVjsEkK9GTGMlvZ2ZNxdQAElOjWDEB/uAmPj3sOWj8Fn80bIAEPAZ8IXeppjPVvDwDuy1E5u/ZEKc+8qbzlXd9Tnv66bygfe/LZcu/a9bKvPRGhB6AFAEfyCvw87dmmo/Hcu2xUnxmhlTpZB4pcpbHkEbACgX/WIseBK+P1q/57pr8i3S5+uvBlc62cYXHesplmpL96f8MdUqLmGL1zlhFl6az87EG2uvb/ovf59YBDMyChIZq5PmU41ZyKRWYAYJZ/5Utwey6DQ6zqUM1CK7+DA3YDABIHmGDDPxu5rN+PVzqz6gMXz/SiltEp4y6KeC4YwOf8u8Q/cRzHAOAAlfCHJFw0/s0BwDkPYkLW+RUgAoBjDyb0jYlksOlHp8rDR1r2yTaaBJkDFqSDTmv8umaN8pYCujcvDpHnNfANaFMQNcIo8wvXYJRhDGd8JD8zALDPsBMDwktjTYrMBXXxEgAw9ZjN+luAu4+L+vnYZKJhRl7oK+UbCHn/8cvRH6P1YX7IzxhwAKBmORcn5WVgS7yL8JqHBwDK/OZKPp+evf9+A4Ckp2RIIRhDzrUJ9CEPUuXz4ZcYoIm66XvSKScsBP+sxxT5x9Yh1NTk8kKlFKgEJ9XrK/jtCgBEXjBp30RuTD7vlaRZoQUZgCuWo7u0d8jdJa8zAJBnD1L3iAOAOeeQgfPL+RAAQKtxFGq5CMi2AGA3Z0rJ8C4K6i9yvjwNEoG53wBgR4vUfZ4Dtcyn0ZQeBQBwpptIO3YZgNfO9uX5u7fL0R9QBiAAgK9SBmACAJoX6hJW8hM6EHBJCDgCAGtWHwJ1CADi5pW4pRsMgKmslzMAW2ABzKYOKSOPQADFmiFXAUb2DyrwRwAgAHv1RzIBIdDgEhvW2w0ojN5TAUqmi+2V2A75ADlaAgAiIMkAIPpJ23J22JXDjadKefqF8uI3fFt54ze9q/xtzQC8dqOc7WqJNFUtqAxAL+MtDHu9A4BIVMUP4jeGckYbAH0WB9mGif7l8v6hL9ht4NpRzDYw0PdYd0rxWgBQF/hxUGZ0MAHyozk+ygAgwQ6pikVg/hwAIOtJTnkcvEX3UEQ5vQIAefMkItnrBQBENWXBHTAlKlzNAEDmIxu7ckaz6IwlPrDWmL3+kDf0ACCM2C0j/y0+weMFADr7McmSn20geQC7AwCdAu0APheALgcAGT8Zc8BjCQBGSoNpdH6cPtbexsAHl9T3zY5Zn5VwjTIAHx4ACLNqsxV4jT9ygKLPkHB0MuynF4gMqF2zEQCoATh/hyjRNlbtuGmAhjJyMj4xOyqUHaJUGpTgZEFl6m1EPNS2CN3cYRm8C7M0A9C4cPJH5MU5AMvnYT/oDEC7qboQAAwWdJ3hG6/aXKdYCclLOvx7OLg8//u7YPA+ZwDySEUG+k0SPaYHnQEYrXv7bLSYOmhkAFBvtw6Wh29blQHIMYB6ZuJCLVAnPQDI40IVwn0W7aM8AFj/bkBC8tYHCQCyezlettcPAAi1dZsDlPbuDmelAoAv3L1ddg0A/F0FACYlwN5db8RlXcT2Xf+bsSGBdF0JMAFmcGpvBekYBKRtPnqvZADWflk1H1gBbQ0A9KW5NaOQnskZg/Va4HXsr4eOmYB6nEkhPcVIb1egEJi/STNNFgd4mQAgZ3JK19FNOa244BPPlPLkc+W5f/hN5c3f/t3lb598Fk8B3u3KrvY8rtN9DQOAOobM7Lb1zXTwqTSE1uUT7Ylxwxhgm+l3zH+fVFCkY5jrr3mA6fR6fmxo55238mOaLEi9piGX5EdK2E29emuccHZZGYC+Z54npz2Co/evRu05mh8DKUbe8snfDZBqRl5b19rkapKiZPyxvsLpvBmApJ2S81Rxhhfq4WVqRHpG7mPDEbNLBNVKgF9XGYAx7UzzVrY6KwBApKpuUyQA4HmzFv0p2DgsfhNBecmhd/JejstRPliv9AkdyEXjDEDtmQZ0nPQIXJ8BKO9A+5BTcq6f2Y+K5LEHgGc9ta8AwIGOmQfqE28g/Drv3wP8kdv/6UvPDwBqWGr8mlkTc58gbJreU4aPdcqEoeE3pwzMtW5RehdbC4cDwFghkpPGYtifSuZKEFvvP1ZdykwFACALOVPQDLmmVOuSpJb1ND4lOj/0JFonvY7apCK1jPow2RkcSKUus6ZinwveJq+dGlH4oPzc/GvJsQZ/3JkxZbumBKk6jNSkuGUAml33uYsxP6VuKoKrLujXdzzGOaDCQXciv5PRZasPKxmUMEq5r3BXA14XBhAIIGEIxAYcTDVk9OhBx/SB08pYHqn0FwK8ToGI8zGrxIho0T/O9tCK7YbclfXAmgWIPL/REi5xMObMaQFAaArvbvJBXfuaShh5LZn2miYdoO3t3QVLZJCJxtbbuk92YrMMGvLfho9fkgGY0l9nnIeqfe4/zNa3OfkENtQegBoAPHzg/y0f/PH3lvJHHyxHd2+VzdkJNoagHoCcdde9h2guJWq8Dkxx1k2DtTGC6kto+RlY2qsBwNbjj2hX+Qs+o39xseidAQCI9oifSc9XdmxTA3LIAuTMP32ISFCC2DIF6Z2m1C8BACclwLxucIgJlBgfyqFlJzIwuSmn9debT5fy5PPlya/+b8tb3vW95c6bP7t8crctJ1sGAKU2gjcg9Xo2O/MIZACuAhyg56rMRGyK+kzhK5E9tSXscbA2spH1eVgBmliBNAtw7p/k8t0HgLGcJvoxOUUC5jew50iT3rMHs651PBxS6LhN3aa913ohlAA3mnnKnqMEuEHfMSVz+9CXAHt6SPan5y6S4K6E1ljHBQAgu+DIK7A5oXrgQXwR0NNKRbxOQOj0kIdHAQDUK6TWfwAAruX//JAMYl1NXy0vXfJDz2MXLwEee+is74x0OQDQlzYi2XRsSE03mc3aoS1IdyhxT37C0TUWt8oPTWNeVm/XQ56OOiUqSZX4IRpmdkgJkiH3HduOxIAGHM+G7huRevwGewjQEg01zQCcrdeopL/xsrZJr8ES4JnDfLnfzw38wnh5OKxHEwAUo+VDGNuzj3pcsZzPSiZIXmNzpgyjohYKnwoSPcDkglh4ipFYlUUWAYDO+HoAIs+A65f18gBAfDao8R7FIEXMp0xmXJ+pLzEm8gRlsB8DALD4Q2g63rm4RtDkNzu2KvAcvcX7OXY1iNZjH2GGeU0KpO8zAAgMihqi2eKVAOCuBv4UB415nVyeCSszGRs5o+tdU578kXmGRnvf4CEzALC5L8n65y6OOGRM/wgAHD/DZrBcAYArdcUDBAA5aGQA8DqVAO9/57fL7/3YjwAAuDu5U7b7M3UISJ1PdIKtGMm2QeA2lyww6xncAxcaAGQaYt8/AAChV99R6wPIvFr/xQxADA2g/6Y23s2plQzADgBsAR0F2AAAVhrUv6t7T70AeaOi9VQifwNKgNnm6d5JFGSFJcAcGWjvqNfsWHIsvQVbNlMdAxzqUkodabn+JAKAX/W15bO+4/vKnbd8Vvnk0VG5t9thTyc6qRzoNToFmIGbNRtw0xLVZXpXS81FAECgqvMhdQDeIBrts+n5uvk07z1T8sBaIwUumZdxgDiPD1QHm+4RAuvm/lvWhSrtOQzDi43LyOR4Gnc9JTVAr8Jv9ru5B6CekVD3HADgBKTJcSQPVnCPM/GtMQOUf3p/zJ/a2QEOaY89tbNJ+gcBQHHqLwYAgkJIfcBV8hiwoYbv/Ndz7u/vRn24APjmlzl+68YwCcCbi043mvjsgQCAEwCOQLXGgYsAQOZfim1NDGuzABcBgLMQkQZHFjHNOh32fLsQAJjox4Q/YFqTHpivbQAQQdc+84dV0Ly9xEX1x6X3AIyU0DRKXunXt8vpxLbs9lmP1ZlsPU4AIINxumcKOAisgBYE6B7Lkr9jRp0BgNAYnfJ02Qkh9xztLBte+rA6THqYOugNS0weWgagOCkXAwDXMv/jAQC2RA0KALMyzLUU0Nf7584yAEMRYJ+PnZDE4fRjnemPCXZ0fzMAyZE9LwBYswAhwFVZB5eRAagBQE8ff6p1Tu/7DwBmvMnOa84DcQagS2QiXWjf1o4WoBdcAYArNcVDBABv7LEE+O7/8xvlQwAA/l4pJ3fKMWSZ0MmzML5BCMctOFoAokAwk5UZcd8IAGQbzoF0DU4Z/MPDQCJ/B7MC6YTbxrhsxW1vvh4AbJEiZthw9h8Bby3g5Iw9QJR4nDV7opYA1/HW8Z0HANc7vYMAACAASURBVIx5BqmWAIC8abI7LmfHN0q58Ux54iu/pnzOd//TcvvNn11ePr4CAIGCKsP4MgDAzl5OMpgZrI5XmTO6Bnpj2sN13uJk1sdu1nLEB3BMw8xv0HR+1AFAErPxAlhvv+iMok6zcTm4ciB6ANC9agoAsq5EneMBy/UlwBoORj2bAcQXDeCvAECMIs/305/ia54T2GcdgwJY7BhG/9k8v/sKANoIfcpvnWJh2JAzi/0FKBej+K0HMKO1oM+csr4CAF8TAOBvpjEup6WeT0Bnd/UIuxdg00LCP25SP14vrztAPMFWhmccB8/wzTzTfTkEgCWs4x9fMKYNEtJWdrk5+68pIchAX64c2zz1cNpcewBQnkyOOVgj+RTpJcqD5d+DikIxBBy0Sm8Kd7QbrgBAvTs9BJxW0AOdFx19Wwr1Dq8O0iiMYZSgW+KFqGx3nzb5dcWFf+pQuUcEDxs34IXiFmDJT1CCFHVfAkyLg0+MQWFDtocAAHqTqFPyZ+7CCOCKJDQCZAIVk8r3qAQYqet0SZUn59CO+Fx85CADkEfUSoStC8UyxwBg1YBtrkadCS+OArHInRB/re84AtlGA5Xl6Y3vTHiQ5jl6XmVfv+Ewszj++yzDgbcyWqI/ySeMWM1x+Aw/t0AHav3Ooq71cuWX7BzG+XwT+9Hsp71Ggth5Dy1PC2N6iKnOO34DfA8m2hdkzykiV2j9ya0uzqAE+Ob+UF64c6vc+c33lw/VEuA/RgDwCDa4JGOultZaGdEl1+qQiy4LLrPr9MTGWHVsOtOO5BYyABEA3JQjk42obbUAgNr2sNzRv/WrlpHOB4toWcbrNpz9dzjFDEDOODEAoAIBAWGqNOHTiq3gtAoAOMREOI+zWEbeF2886vdzBiD3IUTc8bjsj2+Wcu2pcvPLv7q87R//jwAAvnR8rdytGYB1Pe9zBmDuH66Lf9cBDvWEY1pY1qXG/m/AHpkcLUfwTj/1q2SMTycL5H9ENOj9yd765oeU5b45TjW/RgOA0ZUzAOk8AKD2YfoMQ49qWn8cMwDtj9YktgcnXzumwSZP8dNc0zNq5zTUU9ETbm/ZgDRibCuaC0AGALbSBtFlRquCf5C1JNE6UPxsgfzqb6SXaF7eFzHrP1LpCU0yK8CUzDnY6vTuEKbcex0lL7W7FpUAq3fEG/ijQaD+uSgA6GnY6NUAQHm/90GNfnB4wgwABO6ZZEh69u7X0n4yOROX3qftpOi4PsGGefpxBQA52zJjYrv6vX0Uiobr5eLr0L5qP0zQJNW5MR4frkcu4fV9ozWf2S5Y3QH/8bR0fOTtLUjec+/99VS/wOCSOcwyPnzTRQ9gTDWQ22E3z1sCABLAwoo7BgF5AVmZ4oSBQBPACQ147qZm9GtZIvDGnl1meJdffyz3UQrPNcn164EAqcy3GR3V688qVM3s2GNGs4fdYZEAfehn4CkGYnCWBtfsmsxS1DsC2rVqr2+pzmJQ65WwQ+K9itQFc8rAlwx171EOHs/JJH2yk4Jfavkx2ZeBDgJ4HXqWOSWJrNb6y6U+wgVLgIfGmV6q/TNeGW8StXT6sYaqSTNsInyw0rl3Nd2bDG9X65fuHuOC5iUmLgO3yWdQWdXJHrivGzoZM5qr2t0OCOnnBpxortPOp2hBfU1aQqUyiCMeZP2bxhR0kE/Kw8mX0fisk2jXB0qAKxC4xHPvoSGTkTkaln30ohcNZzgKUEXhyhrym8S9rABCbqGZHuEAmgN0vjlg5vnFIL6J+yX9fqBPXs3sOytHh7Ny/eysvHj7Vrn9q/+pfOgn/3Upf/3npbzyEgBgR63XFPKB8Lvv80eKln2YGgC3DS/rxPf0Q+dGskjBGqnLsAR4S4eAbDYVCKwHgUjfqqZ7KsAF/eDQHmhra3tw8oaUnCgs/g9u1h7OTks5nAIICuCbBgBbRl4duztYhE8pbkAfjQMMcKWFKk8GAcT72/oRkfmwEeRKdQgJ+CHqlOJSD3TZYAnwtZulHD9Zrn/pV5V3/NP/qdx+81vLS9eulTu7upLYxoGt7KWWAFdCT+zLzMDMAL8Zf/sAlIfEw8L76f8DfzryfzXn+udD9TXb9sZoxkMU1QOvzuQbV2U8R+sbRb7BVm2wwtzdw7x/5JfLj3wWD/jJT/VvZriU/my+EfsWLeyQbSqYX+uBR+vA/gO9R8s/av5JiGo2sYyygyfqQw3gSabkN5qc80WHGaJ4Xd+yi5mUeAPCB+YDu3o4P66BGHkY2D+U+cw2dCDbSD47XEX2n5/mAcCQf2Y6YMADS6xmfir1ghfDS8bXzfRPxr4g3jpAdMqi8gvwo3m9n/V4bMQhnX7QsjKaG/t4PglQ3o72zscHwBFsi0h3Zgfh1L60PMDZasy+Bwvn4l32TkdxjNhLpIT3dz3/+PXIzjgAWnUV2HYWUgLcc/M8AWMOAKaHegQAnGc1XJ+M8vo7t2E8OyIIFUYiIm31xCY6/6y1NJgJWvD9TD5APp977/uTEVKAmGiiRxkARLcSAaYI+NMZZ0g/ckQVIJZntBx0i7RwiTBDYETA3IEBo+RPgTBv6XdQvIPie6rtlUKCDBo+ddeNnoNcGGG6/mJAyFzi5n2jJtIfFad9Sf1TZ1BF74p3NeQ5uQHsFZ4fgRwSzCNus8AQw5xCox0NnoxcHzIABRfynQ8S7f1sI/HpfQlLX5IyLnOp34yavHJ25zRCWdPzaKSEFKk6B6k5cHjzTCL0KyaUJ5Qzd6MivvTvyHRvajqmJUo1ML8YAGi4UGeYUXscCOX5tOtusPj+0U9zpPiCbj497zofzwDW/Xss73pfFLGMCX0u0CQWtH00/2RjaR0A2M+4nsPKOm2Jg5/x3pLvTIAWzssGdXpFYevgIgAgG94ZyjGaiAtel8zXX5PTWGkbPp16c1p2h9NyEwDA2+XVX/mP5Q9/8n8v5SN/UbZ3PlX2pycAANbs2qqtegDQ9wRUdmUVAKjBEVvmpgGzLWX+7bZHAADyjjJkrrC8gg2itewAQLYAyAdyKBfOwwKA+x4ArD3+GkjAJbkJAEggQYuKwL6Q32Wy9RUAqJQKBjT2BOI2z1aiTFnTFQCs99YegMdPlOtf/BXli/77/7ncfstbyyeObyAAWMd+PwHA8zCtumcWgM90SGSfvD+n/TL/PDhEZjCHJj3qgnlTf+1fzQD+3BuYbYDWYVf/X0Nk3j5p+rYkAZovT8vQZ6U/dCEAMNCfLWbhwTXAjTxGhZihP21p6AGEDB4DMkwAQPu8ecBuWanGLxFzKR7Rw28Ogvjh6L+P+USvf+R/yEYF0o8aFQgHmA17jAe0/EQAYBcZZE7iRD9kPm6LT86tY+a9AmcZbrNXd4B5oyfdGQKAjblTcHJGG95ATNwLPGRULSi+GfmJ2U3rP+OjZi1A2vSEwTt/eka84PseAEzwK6hY0RtxCwBAl3G72dZNxXigAOCaDPJeDi0AaC3JFACcbiDnJeD4fNni4K2mNh2oyFoCAAoBBI+Yyw6yUSb8qr1Q4xf1LmDFeRuLjI1ka3OwhlcAoCYMOaKvVQDQ7diBg0Qle5pNPVh6HgAQRQ9T8DNB1wYCHRbnIkyyPK8AwCsAcKwA+x1rf+3rAgAMdjKRDpkLpTL6mGjnAAABQVI/VryVoyUud3vxQwMAyQf0gS9sitApwJlOzAzyFQC4wut9SADgcTkrN85Oy5tu3S6f+Pe/UP7kp3+ilI//VdneeQUAwN2mlC04vqXstzqDqQrIJQKALYBnhlShJQVSFQCsWYAbKAXG8JXLGplfEeAiALA6+CqKwRYfsiklACDqBtngpZN/K+B3OCuHPZ6GXDMB69M50PAlwRhPKZCvAYCkfxYDgMg3PQDI2exIIzilmDJHYXR1Pa7XDMAnyg0GAN/8OeWl6zfKre0Oh0Ygd6XupWcArmD36NIHDQD6MWQtFq4AwMniTgPABczhAJNHEQAUgDT3J/rZLgEAfQAt4F8NLHD/bhxk6/ijf7/NJqzPAfus0zivAMAFTJp44H6D9TECANlDNv5rx2oTH9oB8jm3zkn9QAFA2IDf2aRmNf+WwdlSHPtY9NEDAB2ArzKmycMIFuEKABxy5jQDsEOUdVg13rmRF1oBW1MCjL7dOTMAa2YyZ6D4SJCD1cNjlgG4EgDkMrfzAoCVTGCAk1JLv0P0wAHAZqCYz2Sx2w5b+0g5H0YtDhgECdAXAhqnwvE3WR1UOcsyAMcOUJIBCO/xZ1AHYr5yx9s/od8xs1fIDq6o36UbpnN3MwcAedWyDPBkZWmFxka7zzDuqTPLAIQiQC6TMqXFcR+6RpOWAYglwPHPbHbOJK4EAH1AzbxgJcyOzY/ofmYAonjmJVCtVITmrjMAFBwz99zoiisAcDGplumnyeNyDlf+B2TC14DwtFQA8CYAgLfK3/7cz5U//zc/BQDg7t6r5ez0BLL+awYgwGqmhNEDgE3DtGzkvgQ4Cwn6Hnw4XbFVWwL+tls5BbiBgNxTFjb5MFhuAQQxNloA9TxdoswZi1ySeziDA1AWA4BtbbRtJZqwDVwDAFZat4wG1WdQZQkjAEiHtDAAWHsAHt8sN7/kKzEDEADAmwAAVgD39QoAgn5O5AeTI+cSpB/yqGcAemnzAbX2PyNsqTu0I9M/lw0AclsewtRxfL4E2GYcTTMAQSmM3QObQeL9KVAw7uZlPgXrsTgDUHScb1nQsv24bHfyurDHohoxqkHK5jkcYHPHuPtKN9YrrzIAJwbXsYOVl8AfN/yj7SVL6jgayPx/jp9siwsXe1APylEGYO+tE6uYL/IoxB+ysTS2GVG5K+HPHnjeDEAtU7CpKD9WJ3JJMt6AJdN2QA8TAIQxOUAh14dzPMpkALKaGinQqf5/DWYAgoPmUX7DQjZ1ctbjbpalMgvefQDHNbuwNrqfBhlT8AZplxoBwHEJbMTwXnAvuwS43xG2CigtAV4AAPrsv0aWkY+gNIIGH/hyBgDh76jHTAeQ9Uo6s/EXywC0PfW8O7wEAMx6JDDtOojjEgHAvGi2N07agCzqsbUSAOS1MuCI/sMJfAQALq4YnPYAlR3mEQ9FTn5n8BKfJ7O/lwUAcp8keJcKAnhYHWhGsgaxLWXgLgjjwlma+a0AANuSU4sBM9b2ZW9wfUnSzGG6aInKLMDV/Az6gIy9HteakOcKAJwEEEb4FmxQTB4353tcydovrr5td7Qvx4ezcuP0pDz70kvlL3/qp8rHf+nfl/LSX0MGIB40gQLWl1doANAHM9Qfy5x6P+Mc36NTFCnYeQDo5PRf7AdITqXWs9CHiXoKagfdg5e+FJfcepwrld1C37/aB7AeSjLJAGz3awCQFmwtAEgBfwcAMp5YtgBu1gAEshDh0JQ67+Ny2N0oh6MbpXzuF5Qv+f5/Vjaf/47y0rWb5dUdAoAHLgEetBzIQ7wV/BxcOusp1wFUfkN95evZ7yUTQSVS44ekHWjIHpm7fcZat/kk1Jz7H3lAdp4S4M4/X9LEXwOlvul1Rn8qYdMxSuevpv2nJHuW41i9fuy7aC2iEyTwWkvDNfaS9ZyUsblYg9pZ5DByRiB6njKmvqRYnk3zUO0GQC954UxT861OFvoxjQgAVH4lDk1ecgUAzpxha9OsfgvsXVcCbrj53CXAqN9wXUcsgSZRMZBxNqUzvpUvzazu/oA03n/tT91dqcDp8mZR3QuMflkAAPq36/vNAUn1hS7e4hJgltFHAQC0CWKe3/qyXUu+qJrO8XMXcyalwOcAAI37W0m+xwqL8/54H7U71OqiJcC+xAsXIEPNrEGaAYBGQCMHKqENCAl934JxAjTYkHJQjT59veMxAACNRnJG2RF01vTTlwDfDwCQl02vR1vKCcA0A3hnDs3Mwc4APAj4Jz0ALwcAFMZmfhS2th0ku/k4B68Tkc4hdz0pZk32zwMA1sEzj3qk5DIBwCSzFOlgAcCQl7IYfAow5h0ULw0AJCdG84ZAAX7Fscdc/dEA4NCAzPgHPSkmZ5/NqtDaptkZpKyZUnQKezxevEMvQQfITWzfTP5nhjPN6PCBQFACLDuCszfh91cA4DI6ofg+YABwcyi7HQOA98pzL71U/vTH/4/yyV/5xVJe/puyufMqDZ7DQgbGlIVrJcCaqznQxRNnJSLx0atXRr5/sHyPdoABQDlcBE/8xe9YsvDSyszRISB6PfggDj0ullEE1gAIfNAAoGryb045bbqrzjUCACsVrpX99hoCgG97R/my7/9n8G/NAKwA4NnrFAAUtep5UPMDVrhkJnLub3gFLu970ABgpHlGJdYU77YkgUaDcwGAQkEMsBVNlgCAetNPbcLBU12j+8sEAMmDUn2sXKwBAOAq7nBLwHpR+b8hYMxOiO+Fim0NzE+afNLzOo5fdBxkAHYAYKNEfwiIGi+vqvd1OgqtiOdz6bSHsKywrGLHJvy3yr9qwbS3U8nIhofAqDUf3J7RBm/hXrDxAzoA0F8W9F/rM/DyUTDOwI+GnnMX/GHqRr7nZQGA7OGgH2HjOcPPajroZljmftAZgOmhIK5XqI+1Zfxagq309jR/HQOAEOc7DYwI90xtCZO4Q2CdMkfOy4q0ZgDRuQFAMgvpISBBymunQy75EBBwWLQT4Azeo5YBWPnDh0KaRlOALgAfxPGpCHl+xMqsZOPhA4CB/8IuSeB89/RyDmVoXGQFvIKc+iLnBQCjcYBacAo1OARkXcTh/Gnz3gkAyIyUGOSpf54M9sEDgEhbdsrr2HezHZbJsSuGRCszAOv8PQBoZF83W6Yv+kNu0k3g7lS01b5Vwt/R3PHUSMFwrgDA8Q47+uBzN324Zg8JALy+OSs3Tu6VZz/xifKHP/Kj5db7frmUT3207E5uq1Mv6ZRAIz9RD0D2nkk2m78kffdk/ppW+Lvb/mn+FgOADPYJIIgbmDy6+uzqY0GhLwCALRSh5fHhqjqNtw0MgU7MfjwfAIiZiviDJw3SXKclwGzf8N8GAJqNizEAuNtcL6c1C/DoegMAN297R3n5+pPlle22nOwwA5BZNWo5cAEOnqqjmf9zWRmADZxQmzM4uKxNxhwA7MENS60eQJDvHxUAsJsD86nS820hLw0AXLC7qLhH2xwjsVACHPt3eI/1D1cBOqRJ8gzAEfWmrC9xonJCox5npDUom0vpg9YD0HoVGrLu9KcBLGnsEMjWg510BiAOSvLAcLg+gzOqQPIa1Y9uTULPLJKeVUDlqzA/yGAVv7zWAMDAN+ZTcnld0Ncey8BjDQAq7AJEBAXCzlZlpCOAZjnuYQOA5oz5MNmB8+tUvmNzkvp1rettP30NA4BAkvQURqqR1YYqIZ4ocnFCux0cp7G8gPkluRQAUKy7Ai+RMcwx5l6bUh+grIkG0jC4UTnXvZIWKWoOIjtu1DSDEXq/A9cF0C7A7U4lizIiVXn0bIPPx8+yHjRCOl2RrGlHCmw6Pv7RAK4xpKyIuh4k7llJgF/XZtbDEgBts37WoZrd34NAOvDrFUwr9TBgi+YHTS8aS+aDOYW8yqBXUi4CACm4rRKTIYpdiVV/yrW9fZx+YJ0sRR/zAHtKVY/30cWJEskBQBegB+10MnJAoA73zBfQlwDJ/PUbOPuPjNSCHk7TU6KcOHXr4zIAwUfQGxTqhE0v5RR22w0CDxDnBLwYAAgeSx7AeP3DAGDn1C+Jd1wG4MJbVuPhYl1Vzzf6sAcslQMbxaQOoPdj9iVR5vsWEExmmiyBceCWEkxdl68uwmT1f3iab80ALOV6OStPnNwtz33i4+X3f/AHy63/9H+XcusTZXvvlktt9mXAmW4nHdlq1ojuzcDySFtooXrz8YQ44082XnkEuNElmYC6fIcb5VsAECS1L48y7SnwmlbuTADggQ4C4bLgzWZf9lASrHv0yZhlXPiZ9P2CHQKiqT48pb6TTwFWAf8AAMS5xhmAu3IEGYBn2+tl+/lfWL6cMgA/UTMAj4/Lvc2+HHgXmvRBC3YW89E5GJPlcdZjz/k3Y4AkH4MORG1QmkMMmXemOVberiTuwICJlkIXPqUGlnlvNLeoZEtdSy0wvANuRjDxH5v5IZvWAOJcsRCjU/2ScqJbCeCSzPs2FcnCsd4nlSAqG9n5d24TZY3/x/Y5BgDZx8gTNOaSYZ0mm2HFRFY6AOYjB/304iP8LJnQdRR6LTSP0u8VTCQAEHsmOw+rxV9CbLgKNgSXMEPLpcrDQUew2ZOXAYCJE3VZGYDG1suo8w2OqIek55jx2CP/Ud+Nd+YlwMwXYz617/cAoPTg7J/Ad8IhW/SzOgNQMwCHKyMwzrf4qrIyOIMhjh8swI12AuWp2cQZAAgk54FyD3qUvyg2TPnbbW5Ea9QltHSHrvj1F9m2UB6OGcVhxHOk69TXm0yPQ4/JLEEps71kQtwpzpoGjXZDEenf3eFDz7z319LbsaRk9NMDKMsNjDdl+I4uY8uluBMriWlUwgUE8XXqNHhd2spLHAffelHm1ddYsjZmmFgtDK7nCSjjgw4HqbpW089PlXK/9kmXYWXn0DmQdL0O2qMyYHmjzIhCjkEJH87ROjwIqGrGlVMHxypYiySvDgSyaIFtRYUCNImjTAqzPXW4uTjxy7v10JexSsxNtG0Sz4pQu87eISbBb/oylpO2HnSCYTQBfPLYwUK6JuPv8f0OC7UZlPS0RCl6zscsgJj8I4DWgtJBEECPBE5TRhOo4QbAHMD+y1CSlR7REqB9RQ3S5dws384PAXEp+C0k15Mh4wULas1a74B5mkyCqHQiAjh4yUAdgkKKjgRJY0dgO16bL6wlfylF1XWxz2EeNCthsj0zIz9mqfuPr9UlwDyQmfWYBQEjyjQHlC5gfa3NFc5POexux8f36PS2rgGAdJ8p4W76cyTfpOuSpe3s1aINCXpg0wMZheoGz6GcbbiW5VBulkN56uROuflf/qL82b/+V+WTv/a+Um69XHYndx0jM+ClNEIlmAL1/NqJpNJquOvLVjXd7sC4+p4KyWxxY5LhS9DTWPqrS4AReKtlx1qOOCuaR+K5L3JKyQZVZxR60uB/tSQYT/2tPffwb80fGAdsylbPSWectc0PbQ/1WDXAimPwJcCoXTADEH44S7HUcuWa1bMp+821crq7Ucpb3la+6H/4X8qTX/aV5aM3bpRbN66XO/sKAFapJKiTal4ZKJ9l6M0C8Jnsps8PfN/Ivx7F8J09Gp5iPhplo+pQQvP5+XXtHzOOLTjszPWrLznr3yD+bzSa2B8wXS+kAF1NtvkLk4o+ewotnZatHeBJOpgG8mFuuhxY6fWhhgP/eEzlebym/c/mfdNQoizmdXY6NhHsE3B8I6W/AP5VXQMLx//qd9IYle5kDoLwXWds8SKi4iAtwgcZWJp5WcK/cYM5ywCzIxNaGq7MhGAdOe3VE/ub79aTOp30yGwv7DLhyLOe3p9PPscnTX5mSKlZAsuswodljlgErYyLKfSLu4xtsCyiOFYBgM5/hSexT9PIFtOvzdvxp/bFeSIaIYgyXBkPgPdTT3GecxdjGcCKZVEopJ/fKDNkgcgXscvsxxuVALfHG70rsaBDSAhEigI+a+3EngwmEHwc9TjN7Lf4O7EimCJURsdRQpt61OYNCQAIjJtmaPUBYF6DbUSlj8aJwYY6L8AKuqaGiuiR891n0oyYbO68gAmYlti5OacGv08n5dIZNh3chL4JoGOybjw+A9ApZL4+Av367DVUZZphPf3R4ZHA3+946oy5+iw8pTl3IzUPM/AH91bfxpUA65JtHWzxMywASCpw+Hrt/Iy4MlNS/pRI9uD0C+3L+wzAxEACMahpSTS8FkBoA+Qdm/FYwClyALf1KTZQ4ml/fJ8WciQG5MsNdKx/tBHzGWw8Pm1czAyd8dYZXs2pD8YaZ6LaU7CWcIt/dCRjcg2B/44/eQVxvNqpDDZAjH7qebXK6tSIDBXyGADEQAX5X/lMxp/Cx9oSNKtPzkNRbd3mLu60hMPpSyM9q7I4cFweAHT2uRelqXYcLo4UsDD/TPQByo7O6PA9lux6wF81A6LeSAFAt36Jh92elqj/0Q72eNbqmwUAIABZNYONgsrKDwgA3i5P/OWflz/+kR8qr/zm+8vmzqfK5u4dOnSDOToAADmbjBSbljgrqfhN20DhAAru176HjgLQYiIAiHoXZQx2ThEAhEN3+K1VPyMIaDJaTNmOXtPI5yH5hcPd9mDbIfNvf1Yk8696Jacta4/lmsFlAQBpXCxEaXuU9hS15UEHfDBnU3YTbqJUv4MAQMjaP6s5gWVzti+H3fVysr1eymd+fvmCf/z95Zmv/OrysSdullcBACwWAKxNwHSgNfHvAAAfMGPmGfAtSwBAU+I5q3jQ7O8CyMonbbw6S3soTHMAcC6HS6gQP4UL2ZPhufC6U59m85f3GiN/gCyRRf5YzCvd2gWcE0umK+1hRqfMNwap8BWfXs1jTfw73qDN7H9gURtvgTjwoUUxFWcAtpot6SXRLd52z3nBXqF9NP8NfKedQwb8FABYqdmf8hqNTz6zJXza90A/SHgu9j3Y92yxxQAAHm946ncQU+UssJascn1z1s//gjlATK8LAUDfc9ZPZe7f2XgjuH8Rgnd+Euo766tqzJm4K12JOEXM7TEXAQDrQ+D9ZgwDPoVBsuKSWVj+lU2Wpo18Dz+2bzRpvUFPlrJteEIc4Y/1dnzRbehOWTO3H7ZHf92fXN5jEcevN5iIlsavz7MI1lq3vfG95j1Uq70YeRgy/sQD6Tb0LfdeGACEBjMa4R6f6+6kMGZcX1Jphkvz1J9lpzhqQWHG12YXg+9sCSOH2JmqhwwANmPPtPHjuSAA6FWn1rdAue7QkcsFADlArv+iUyAK8LUBACoKK12jAdmx+SKAbriFoF1B/D3fkPOycDkAIKunTk1llpQd22ADwsqyDavB7OnAP8gIblLdSvilbNXv9Poh2nwE6+DgSKaTMsv5GdyReAAAIABJREFU4AFAp78UDda7SXMAUJdgtLhfv8il+Vt9MncQ0zEvzgAcr1nmAHOG4xq6PWwAUDukddYdwGbsIZ2yKO5rhzC3API1AgDWDambZV+ePrldbnz4z8rvv+cHyt3f+vVS7t0qu9N7FS0izYSOpj/VrwJwmlxao6YAINO9nRKsAtmmOOXU3+ZzUQY468S6YcglsZwBaH0kzlrBUfYtALQs4Ivrpi6WslB2TAX/ahYglf7KqbtWXjUAiGPA/5oTfB8BwM3mDMDK6iPst8flZHsNAMC3vuv7ypu+5u+XTzz1VPnk8VG5W4HT7Q43E+tcX6MAINsZDpi0LU60H+dVrlFx7tq1IZLc/toGAKeRL8pesDjWnxrTF/X74wgAguZCT0ohaS37DzY9GPxTJX4cLPgNFNpkxGwlDafrADwC/+I1Ep+tB1iYe6N1Qzf9CgA0BnKSAYs8MFI/Sf+1C2is0a2vRQDQAvx9yxj2fzn+jvEWggKjbONHHgBsEquSKbSn9joAAPsgl4kyzwD0AKB1iEeuBRO4l+yoJ1wWUldEel3ILfoEHOVZj8PJ0x92BmBbqQgARITO6LNZCbAGJOrvoxKJ9l5Xgr2pO/Gq9C/LAKzPqAHXaAU9+Nd2cHUa9KISYOkl92AzALGvlCD45KyNDNplA4Dekh1sxlpo6JzC1vgbG2PNUX0PRCXb6sIhlDMT3kEGsvCpfXIDiXlbQgGAevwCEuL9HEBbcNFTyPX8owwoMSH99zM/ZAYAcogeLCV9pJygYHdypp/sbuJstD09okN0RG5lbUaZnl2PV6OvHm0AEMHNZYEcU+6hAoAtoNKC6ft2WsjKil+/Hs2e0AKvLQFuMduA9R5sBiDk1hEAeAsAwN/53/552f/n3y7l5HbZndzDrD0MzeH/zwUAQmSOdBb5Ibq3wzI0AMjr1QOAmx1CeHUcNRMOS4DxPyi/3bgs7WYDkOCzHqAI/iHYCZn9lAVYoNwXy/FqCTCCgDa7CdsjbMq2NlZsSlLx3nQDdlkJMPcpwuajNUuxgpMCAJ5tduV0hxmAb/6m7ypv/rp/VF56+uny0tGunGx3FgBcUQIM03sMMgD1phaX7LPWyuG5xzMDUGtko1/8ZqCrZjFgA7MpRb5hBmCVHtdCwasxyMBtA9IZgMvsxshu6hB1lJN0XgDQRQwmexg1RqSb1voOaisqIAVBCi36Ig8N/ekK/rUYw9/sOZp9boYUdQsUCwAyOAe6fZDdDzRtU5VD5sb+mf2GKy4ebAnwMl6LVnBZBqCt4tCbjPn9PK7x+IxMdgO8AgC9/W4UBcLNMwA9n/sSXe9/zRKubIZJH++uKwGmOSQYzEUyAMkBkjhKmj2oVA6HTjhWze1nL1GPZAagN3xawc1KgD0A6KcMGY/a23BE7g1mfihEbmDtt954oiE28MUkYycI6F3ANwuw3Yiy7QzKrrAc5kuA/ZxGgB6/149vDQDoqRUZCFAIasgI4C4rAYbnJY0+23KpjC4mfwuJnEDW8VgH0Daye9AA4PQQDQW4efCVAzur/9zsshLgwCuZOawMyACdQbtZd5ABtpC/miKxi8LrGJn5mWsSneKM9+DOrw/A2eFmxcwl4sw3/nvsIYTPgt/8ho/5Owf42DGezUn5j9P9z6ziC+kqALNdKXzLTD89bAAwbwGgjcf6AAPLkPMfD0Auc3j5mXMAUNOfZScMNEPv2xeQrKNBo55mjMmOrCnr6k5ZtOshsNS6cQn1Zi0YzvfcdtfSEuBamLdFOar264nNvjx9eqvs/+CD5UM/+C9L+d3fKeXe7bI9uddaHlRN0PSzGuaiDMAGLjCgJwG1rUig75vRtwAg8BZlAGoAsEAWIAKA9X8oY01jm4NzsGxHeXzt0C78bF9LaDn7r84ZMoo4i6Ue/nFK5b8eAJTAG/QQHkWMmlunobdDQGIBkACH9DT3GKIAnXV2zcxEuapQDfUppAxAAACPbpTyhjeVF971feUt/+Abyq0XXiifgFOAj8phs4PT0mE9SWfUREA0f7hYIz2SlVAuCQ7WlgB7KvkATX8P9hGIrza9fVlw0qS83rXOG4/WcAkVYjk/bwYgr1Xn7geHYtXMT5EM9keJTxngDUqplcSkSsr6S3F7lNEDGm8PLkD9QwscXANg1SQDcPRuMRla52OpvW5RsKLirntV44yBcOEYGHJjH41sLvk9XfsSZ9+sBbVAlfQEJAlvoB/P2Q6sjznwVPXGb5ED5mbtAUDfQ3Dmr6XM5r8c+ONrnjH1h4b0Jr2pHVjj+PAo/OIHNB86cY8fANjr76RkNfBfdQkwWyaWAa330GXoS0z9BpA/JbzjDZ9gkzAPig8b+Ti56rJLgEF+Fshd7F1gCxemm/c1RP94G6Ge5ugzky09/9436++2CUTWd/Lr39/tgfn+jA0oAdZGygbA6zMA/SA6A9EpWXuHzgBscj9YYEjJTUpwtW1suB0BTs0Hbzta8dJZhzzq0beG+2wAFSx3l3I3AwC9A9oFnOfIACRzCMPTDlIEqJpDPcBhXgkApiXYSvC65qf4nbYp2mGHOZAS1BrigQOAANAlbpYiqnb4WA7tDofnn0kJcGdt5jvW2CNF7VrrEvIlGWaDndPIhufZb7S+kXyr/nKe/zMAsC4DA9as8/CIo3EGoHXCBQAUoyFEftAAIPJ4rlNmDuUVAGgD1KnDa2TqAgDgzFMgJXz+8Nn2qmqvCwDA3uUW62g7SDj7N/C9llrExrlLb1hCM33NUgBwsy9ndFhNBYI6APCDHyjl7qtle3ICACA7XhiAWwf+QQGALfOaS4CJhljVoADAw9b1abVtC3gDhMkGz1U6xQOA9RAQKWObAYCS6ThcuvRQF92flPQ0ZBqKzms+Xktz4/Fhv8Lqv5yWbTk7vlnKG14sL7zrnwAA+Mpzz5aXj2pp8BFkAO7osDsEAA8lBAADPtU7+n6OS2T3vgOAKXiVn1L4OAOAIS6m4gWubtGxD/qS0gMV41nZHOT1XeK3NHkyWYaXCwDWd9T4d9R2BKCzxxEAFPMjurb5fEhZ9nsaAGiCRS2o7nflb9O5wKhOQvCv91qZXxgcQPrHpdqRznt9AYC23YRkVo6sQe/L6vhuSby81kVYc/1llAB3IVmGoC8AAI395iQGFfv6Q+4iADDrMWcAqwnWZgBAhatoKeoAQPJzx+uQW1HcnFz200szH8rEoKWuiOgjvDYSO6F5loEa3hUAuBYATLI4dEAfYB3mI1YkvOvzmgIAlQR0PfmceCzJANSEm1W4dYewXDIACLZZ93UTWW3D5Ol7ABAvsArkCgBkisZK0wOAnp+MQYZNHrcH+5gDgNoe6axA5qXoyAytS0YluyG1pxlqG9rhHxu4KwAwMf5T+nKjcVGgcwBQuxtYjpT9DDMAl/gsUwArf0gIsDkA0B8qxaWpFGa5AoCA+5UzpPXwwunZJv1LblpzzZR+eKBFXUMAADelHFEG4FMnr1AG4HtKqQDgnVfK9vQUD9WgMTxMALDtKkFCTj38g/evMUsHM3VqP95aAqxKcFvZIiXqt4oM0nDKftdPEACUrL8xAIiZd13PkC5DRC0g7D4kG2TGuT8fAFgB3ZP9ppwd3yjlmRfLC9/OAOBzVwAgAVzjAOrxzQC8AgApd+6xBQBtuN4OO+Js3OaIEgAwBABNNGOQOgYA2da1LTMTo5JepOdfAYDOAKcZgFcA4KyGIz0U5BEDAOvK64Qg74ppANAnQ7T9OZ39P/XP5huI5wEARbPQIW4McrR+6BqIFuv4ugQAsafM6KeWoGRFAhTANjBVE7ZH+4HBVMZPY5oBxhsDPqLOedQtMKm7e7DI0mAW+8eMQFwGN7TLr64mAGRNTOKbbnb3GgCFe/qoMRqlUBFsC8sbwCbIkJwBgDA7mq4vt43m2QFEKQAYlSROEH4NAKqpMjgjwC4HMNqd7UPSriR6un0Q8ym9zdbXuGcB1AaBWfYStaDtVwrm6t8qRRne6QC2VWfQqAztmGcxZVxnha0GALlRo9MakQ4R+R5LkOkxqNBoPmHW92BqATrzCp0SzXPijpPoyLHziBf7nVwI8LV+oJ5VElxECFNXlJJMbrZ5dBkA4Fg/i+yMNPxUOFQPMztNlE+RHZ89zFfPSoAz7TzW2/T0xQCgjH1WIm/TeTkDMLGQvkfqyoqF2QbMmLlwTGzf5DopC4ASwe5UIF02cChbyNCS+fU949RO6cq54fjGtBMdu87CtqubQzfSdgQqVQAQMukO5Wi7K0+Ws/KG01fL2e9/oHzoPe8phw/+LgCAm9OTstvaDECvf3TLApyaBQwtz45KgPE+uBfAO2Zkfz2tzLZgnz06aGNf+/wRAFhLY6WqAp+py0b9erYMftLj+7Pa3y8GACvgd2glwNwP0K0nHZoyXEGjnnpeUNA8Zmp3GYC8oUVXUokwHFJyqJl8FQAslAH4xvJGKAH+xvLJZ54vLx9fK6e1BHi7DTIA67phhr3BFtxEZhmAvJKj+S/JAAz9LvpQJ6B60Ivtmaaqz17j/o76HVrrdwmafokyE+EHFBJh/IA+3949INE30asRbyaLQv2tGdBhXYM2Ucakz2DUfDDTWm3d/RgVuDQ+P1rNM7Vh1T9g/o857HIyAPnZuv8fznD2/qwHR++d83uYumTDiJj2U7bx9WCiEfcG0mccEc97PkMTaat5xPILl2AvywDkbC3SwmifXY8Xk0FujcV6I8gO3rQRyvjRNl4MAhzXUksAL5IzMz8WhpH09CvcpjBUoOJjridQdofya4TVOl7wTwj9qST+Q/qOtYn/xpcAI0/Jj09a6DIAtVdOVQ+shyJN7PGCGADEO6scoj3RHI5j6wFAGrc5lCdaD3zW8CfskbSQnhRfG/+2rQdH7f37jb6ZlgC79dHtVqhi0q9R04L0Im0nbAYhKoiOOok+9C21Nk8HJcBCbG5SPWBR2L0dLc5o4TKGtyVGOI+cASIHSs+/GRniwA3kbEtDWCZfE/fO4wmMBLI0kiktYRmxrYywI1+nY2X+3pFjMHHE7vVOn6GXOS6j0gahYV9D3vmDDAA2oZ+XyUUCLuoXPSBveLUd1wLZ84MlqPk+0St25cYU9vGrBrXAfdhWAF1e1J/C21GwvbpJSmcF6ZvmHGarqmfST1gf4sAgWRaTL+InMiwzeGveo63PLhRliBk7owCK+QVc1gqEKx6S76ixvdpVBsoSmSDfiUA/lvgmI/S5V95LV4JVW359rvtwrJk+nR8z3wM6nl9yIUH6yzUmw5b4dj7HWE+SCzk0/yBfCYly1yp2NgwASJtFmS7oASw7W0M9FQzy5zN+GTkHPKae/60N7QM0S7D+/fI9Lp93MFj3RNSdI67WAeG3ZxaMfYCxDzj+Jn8+znQPfdLOyLPdVQDwcFqeP7tdbv32r5c/eve/KOXP/qSUO6+WcnqvHFcAkMoCq37LesChe6B7Znl3jVusNAtr/J1D7WsHG6y0JtVv6U4Jxiy6et1mtwXAEMvStqUCgdtCAGLmS3UmSNFtX0G+Mzxcg04BZkAQM/7OoA+gHACi+aIizDMj68rKpaMWLWu9n59JO/bUYxio2QA6VtpybR1vnf3ZvpT97kbZv+GN5cl3flt5+7d9d3n5mRfLS7vjcna9AoC06VVtdd2wA3CIchiagxagTfWEYUe7zj72Bt+w69R9DERDuIXBXNKUzW6R5R38Ld5rEJC7afoMZi2NM+mdSSyeyqoh8v4O7FE5e9Lg+7YJJZkrjZsaAOh1luVXHXDBMFzFQ7rdhzf4Gpy2icu+zGhzbLo3Em7wCC1g7C0oz2zsgH5gYP13YpXBP5ocgiObF9HaVv/YWdcmUL28RWzA/BlrmYFz0B7EAKZIhC0FZv0tic3+PaP58yt0CgmuJ+kV+r3LwHdkmtn/VDTI/0oBpol+ssdQR/SUmXrwb26Xxf/ma/2GxEg2mv/jALRxz3C8Y1bhEfvDuOotPiJ2qZ/GgJ/M3H4/ot9yBdcDgE5+VBmw6Y9Fl4F1VEwMvYOVpdX6PVw/b/BUBijoVgIAxTbQy5p5tgeF4TsGPgLpT/1930PQ3ov2VOya2aAbuiLis8AKNZmgdingEATUgNvGaye2K76GuGosJsixQ/Onh2SmPRhqNIfN0z/6axDDtCxIYiAeXHVgI1e/rdvglM4xaquJ4QjTFJaaQVJCwgDAaAmao9QMMaQ80FxZGO0+IxiUIaM0NXVBAFCegwZsMANwNmIXo8nGeHXgJfoUshHAp/klugaFgkRVI5ZBvKczthicmCnxSAKaUqL17wyvUhsGAJx41LOeaBNpdNrWwtNNTlo2me+h6XvwRZJljQReEQVJSKHz0FZPgntMNgM3yeJZRD+X/bWKpkb0dfYk0kBnlcGY1XprKWKe3VIDe2M4iZwdT7GRIrpyq3sL+klw1fqDLrfflhRTvGTgwBpjPtTOGHxMd9jy+2fK0J8CHWXYXoA8XUWhIaDxyHouy2Y24km058IZvQNuZ2Plr39jZNL0qs6przPy+lFbevsMhqhHVM5TWqPpTGB8M4+2f89so45H3o13Gt3PxptplxkHoITXqzADsJSj7bY8sT8pz5+8Wm791vvLH7/73aX8xZ+Vcu9W2ZydliMChxj49T0AvYB7ABADYuQv9F/sBpEG++D3LQN4eJ8FANXbKoi13dGGU+3jtysHUFy2af9Mnr2BA4D07JQO1yBvhA4CgQzAzRkdAsKOvXMmAQAcOVR+fUZ8JbyHAYZcx+4IZLrCfIVHIQ9yU8pZPbB4d72cPf3GcvPvf2P5r971veXl5z69vHx0vZxdr6cARwAgUgIBPXpm4IT4Qxg8AJgfEoLjO89P89dhaOKz8p9e50Z+gpykiiOIgoioAoCHPJOuJfPiliOjayP9ueS5OCE5IIs3ABsn0bLaMtDAhlAFAcur7wnOG4zjMUXann0ZC9R2z+BNy8HDtb8ZXcLZZVGWZ9PHTJDFRGUQFOMSX4FkHsOJFokDgAVkcsFsQ8UPM+sBL7p0PLnufSpDE+UfEcoRGDsClFjeTNZfkMiA208jAuX+21T+mvCMF2AGiNmWIKwlIg0g8fRiG0O+uV4dP548vqmxvJ2bT/Do9GAKeHK0rSkr8mviYFrLWcaf9Q96W+jjGc+p3jxkACDrftFVdSVkLuzaapp0ZwhkegAepe/ufdNu/apVUZtozX4b2DExgg7/6U4RNt/XDUEWVhznlL/xqiaDnc9LHX5GuAgfMjm0X5MMzzVqN7OR2nZHWAmvfcdf9x8ATLR/B2wEU7wkABB3G9FB5NIcvWPBo4Qd5alTphTEeT04YrwrADBm67YebodBuwu8TA8XALQlXlrJgrNo+OMKAFyj8GpQJ/lHHIRZg+Z3/Oq3rAyhCxY0gsdm8E25K8daayeWewmiNlAC7A2n/E0GPVNx2YSvAMCUHbTDFV74QADAnGOvAMCmqfNSDSLjow4AXtvtys3Te+WZOy+XT/3Gr5Y/f8+/LOUvP1zKye1yXPnt7LSBhnVKjxIAWNNpAFCEgzwqcFhRzYsBgFjmixmAuv8f/A79LxkAZL2s9HQVjocIAEK2zRYzAMv2Wjk8/cZy/N/8g/IF7/re8qkXP7O8fO1G2V87fiwBQAYl9IaF2C0UtmYLBxuFr3sAkCPlAUANGGGLFyh8MBVJtEWY2v8rADDb43lcAMCRF8BZll3QTR9cAYCJ//Q6BwAxjpBNihD8cwkZIwAwAv/YCnAKUQQALgPIaGSvcQCQ4w0ty9xi47ULAFIJMNd24ylojOHXBtIXzQBUYNmIw1PUebyDvCYDkA//QMRW7VaoCI6fp4cT2nZddud6JK0BOED+U7CxgpHjIgMcekLfC2YA6qE9yAxAs8eQAMAPHwC0J+ZqJdF+TwFAv34OUDLp3HqdFQg2BatzjlyWASgvCUsOA7le1N9mIixosLT5UkFmW/yYAPXTqtMgA7D+q1P4lVFtlKTH6CAK4lcoA8YvO10A+wkXWAD1zpgUY93XxpM4EFcZgOurx/wG8bQEp0sNsFzSVLRa4GiHLlp/XP2HmwEIItgG50F4rZNGcmA/f1QBwD1lAF7b7sqNe7fLM7dfLi+//33lwz/0nlL+y1+WcjgpxzVbowMAM/uL/pPNiFibAYiHeXDm4CgDELiuRtPwPmgKCOBf6yEIa5jrk54H61MxQ2W/P6sngkhGAZQEEwBo+vJpIBCaqD6YDEDm0ibANI7tppxVn68CgE8+V3Zf9ffKF37Hf1deftNbyitPPFVOj6/BKcCwl1DLf1sJMFKjZhghUBZZAFuCy9drOs4yABcVnGR2EjIUKM9DbShJBhLevCQDsMm6UmHdIW9uLOfd++LH3M8MQN0eI8wA9DIRTcZlvOAlrNPQt0jLgB1gKNmkKvdnpDofYgZgMiTyyZZmAGZlKn2P2XkGoB1ZngFIa5Uw6SwDcEk2G6sG4QphkcsAADPxn2LPk/gwB4C87xHpch6BiqmzAevvLgMAdF55V4Hi9dUlZgCCXo16KCuPyWcAdg1V0hY+1uxwTONLkbV+57hTVgXtYL33vgCA1MaBySz0oJjJ4BeqhYfKAPRNEoy76XyWJRmAoJnIL8/1iZYeKc1vGgbaJ4j99LIGNFUZ4hHbm1Oal8rFyuuaVA7shY9x9eM3b/A9AJUDxEBZ6uImh4AgwXz54srZXWIGYHU2KqLLYCCabhegBCWFduFdmcqFAcAscOIeZGOazU4BvUgJMI/MZNhdcgnwzIHEAFxoJAoeudM3OY56QBiGX3tqhie98aRtg2BUvqz4SOGaHic+A7CpTfolSKnWff5MecKMcmPH39JDTojkVgCa4rbkxffcwz5862GW5TqgzbKbO30z0D/NSGrwT5VgaGetz/zDgAk3Q+ZB87KViOc8kn68utdPPpAzJQRdRuH6EmBf0rsWNHjcS4DtKsmhUdHqjYEB/xTvhbq/FRPoniXIeVYn5CX4l1sCDByomTuUQRIqus7qX2bILMKdSE9i/1FCsp/Mc0G9xcE7H/Zzfbsr1++8Wt68PSkf/g8/Xz78nneX8rGPlO3hrBwdzsqhAYD4ZnTwR3O4AABI8t8y+Rof2ECrHWpQrycAsIJ+tfudgH/Nkk8pZqlpHfbW+6+CgRX8O1RAkDIEIRvQgX9AoGyV/PpEJcDaRupT+yiwcfa8P+SMy+B35fDEM+X6V/y98vnf+h3lU5/51nL7mefLvaPrZb89sgBgg9QYAORMjUCupy0W7D02IBk1eFluH9k/CjcfJ6vtMwCBhRw9R6WPy0eYX3m/AEC/OR4BgALmaS2ifgcWi8I+mVM7SKx9FF1vvI0WE2WBGTzuAQCAckCQnhN7H14b4N8aZKAKuXiRSTZyHU0TXcRQm4L2UZ6Ih1RNfi4IAI61e0wnPZoZAJhlgFGkmrrXKcDRfPMxAToAy8U33eZVR+qB7MzWBJa9139rS4A9cWYtinLAc3kJMFs1f4iL95c1AMixhMQ0zPvj9an+uI7DfS9zfUikB/9gCTauTNrFCH3JbmDj1Ed2vn1s1Hpok99me2TXnsnSwgPZsx3JSsrF+3Q2BpoBgK0H4LS1DNJGrw/MRmdcLgAAZ/bRN3HLDg1bIjLRNRcHAClIBoN0KQCgMLQESeec3gMBACOASR8GwGMnk60DIdfDItWPwZegsDr5F8GKUk/1Y+43AOgZfNZjYW0PwBl48mgCgIpf3Jo2Jc998AxAPAIA6SFADKtUcf1VYOV6lMykapagNsoAxBkGALkPuCY7WLPxLf/eB4dIle7UNLapipIdsOnS6oG6CqsAEwW4i1Xf2hAbGVw+iRCwMC4sC4QDH/njfj0liOZ5yHCuAMCZfpktHW4WZVdNmmbOXuC+f9QAQDs8DfBoeVQcNzvVqqPHbIX6AK99AqTPAkAPMHnnVnoAVgCwrvO1zQYAwLdsT8qf/vz/Wf7qvT9cysc/UnaHfdntz8phf0K76Q8SACSbEJTzagCw6ivoA9gAwKM++3ACmWpPB36v2X3a/kApsACArUSYAEDbRB17LvcwrV5zt0ahfRO/y/cQ6jYcfE8oqmeph6KcXXuqlLd/aXn7u76nbL74S8pHbzxZzm4+XfbbYwUA1ooXCUwxA3Dca9cEDAtk3QOADeVZcG8kOnqTHpZLVw0oykdSEgGA2aEfq0V3wZzuCwCoN03JufanV8rZND6ItYDGkgwPS9scMHzUMgBHAOBIq2pfCTZJJ+p7rXzkLFMBQHvFPAMwf+IsA3A2v+z9CCig7tLggt9Uy9v85wAnlyCHszw3AOhBvWwMPQi0QOzxkksAAD3tUkAYAJ3mSdMw9dzWAYDwgI5BLD08AAic0Dn8OQDI9Ky3bfdSzYQkRIEwet89Xw6joEICtUARAKhCELhSP6471MQFJHKIHma+WPynzwDU8T3LiPfSdI71EgDQ+iBj2tZvsAcn/mgZpcFPMwAfRQAwkr8GLbgvMQPwvgCASPgZADFVFpcKAG5bBmDLh3WAS3Ooiest+4gj2gw5F+UPJpLbR8oQ6C66AgCbUD6SGYBzg1iFCpa17VBiIGROGfU806RUnv+wAEClEs0o+wyvPMieyvfiC3oAELW2O0ZOKXP9aPaFOiXvUuPZweXsPy7/ZYPApcT62TMIQxsYP13vC/DfyAqVX/oG7/YZQv8+UL0CAJeuzYgNY6dEXZ3754u5my981ADAqf3zJTg+I2O2ADP6qfv5UrmFwdk0XB2uATbwRwC3FrTWn+NyKE+d3C2ftr9V/uBnfqJ8/Cd+vJRPfAwAwO3ZCQGADBEZaQ3ec9EMwKoD+BAQ388PFATmiFbQtW7cQnCBJcC15LWVDreRLQvWDDwHWX6sY7Cf6n5/Cq7zZoPZf9AjsDWz11kdEQDo7UVUIRJcQ5UkawBAXl9oY7Mv5d7RE6V8+ueVN379t5QXv/6d5aNPPl1Obj5bznYVAKxlwrUEGFtMAj0aAAAgAElEQVTecGbo/QYA+1PEl6sMtGm9r2icfbU/4aVkBgAyh2UjmgVAs9k8KACwn7u2yiP9oU6BDP2KJSXAEQUenUNA7j8A6GusUg9owi4PFgAE3ztNcewzZr3PGQGAIFeoZLpD7SwB+g34jkB00nNIOHZ6k2yoOANQy8PMZsy+T5b0ggBgfziir1Dq342AvndKxI5rW4d3y/xCX/CCAGA0hzbqisuo+Ka+3/Qypwo4rsLt/X9O4VAnqS/IAPQAoKai5Zd+7RGQhpHSxpnxJtphYpL1JBUuUWzG9OenrAMA+a7YCcUNDPmue/9jmAHo9Q//bXwCdVEDAJsIuJ5ljP+O/PhxySXe0e6bOfojPZEBgBD/5w9GB4VLNWsJMDnNLNwOocQm2jiYLvgxCrUa8QrHjwEQvH/cIQRGAim+bg6cPsv6x9HGiFTqgdVT5uyzZ/GYB2wvIwPQMKHj0Nl4sARObvI9lWoJsP6ZlQTMUsQTcyXGIB00HxohGWoiCRMAEJhOOfS0/nI/GS+VJTGj30jw2bjpjE1dNit0sEo+BgAzqs1GmFNcJJHkzGUc4niYx3tdYLWQLdkWs09XsdwDICAZgDzCZiBaUIU3zGfImqCfqx8xy1uTw9q2gHYNIwP/YEqA7bj7+costL6J9Kifb0a7tqqDi2rwbJY/0JPztVkk8UuY9FKu8QCgz3Hr9ZemKNsi/Lf+PyZgaYPWO21WJdsedYa/zSnccQbg+TIyht6FoSnLhp7xrEdjJp3oUBOdyLYfHfbl2cNpefHup8oHfvLHyif/zU+X8rG/LduaAViBrv0JZC7YA4pGFm4pAGg0jJqzAHp4oAevnVAAOhpXH4IAQDxVeFe22wplBv0HowxAFlQisKwG7th7ALBGxfvDKfg/GgDc1Pt9UNcF0Px0+jf0XyKfingaergIn2cZgAgAIrRb+eTu7kYpz725XPuqv1ve9l3fU1598TPKJ68/WU521zHXvWZQ7mrWJHI9+mcXzQC0vO0zji4CAIJ70EqthNOtD0e2J9GhRv5XtEgZW131xLTnlu2hHCtQ5R2Hc4gn5mkQ250odnD+sn58l3F8nhJuy/+pf7YguTy7X04BHlvBSF9HepbtgLbpDJBl2ttm4/gV7m2RfxauhqyJuPvky7VTus9nfrMMwLUAYOR98im1baZmTZ0u7KZwWQDgiDZVv2uKL+n5N1/DxSvR+mcqi+My9LIEIuR9mwOYxXd1DWADqb4XbJXlLfwrsj2KC71MLgAAZXbST1w8Bm6j1FMNeUb0H8cfup0BZxjyVHr5sfrf01OfEB5zo9eHsYS2+QD5xE/pKhRbyxTHdwSK9xnD+Kw2Np/hr+JltOF6DWktybfzFIZvwf+T9fXvJ3YhsN4+gdcj43f0QeSKvmR/rJud6otfk2zwcQsJ1t2R69f1AMSdZOMCmRfbkrtIWCIF0YZgvoyN16gklm/Vzm+O+BvzQpwPp3pRP512GAhNGJJtqGl3o4FhHmYonjcBgEMQjmiZaDE0wFrInNOuFtgLef07cmGEyLSrrSCKacnMmgyOYKlsD7FeuXl2n2WImvTlggFVc3rJAOQGx77Rzz+nn/T0w3f0V/ul1/OB9TE9E3uDPjtGXp+Cy8aJ/wXVRRkLi43u5MLm1LNMwLRl3h390gW8eI9AuyMXKXTdZ0xCErRDOAkJsvBafW5zdwq3KqHyQb5W+GgoFjhozqEIncR0TZwBJDZsmrftIkcP4R528t3FAHAo+DOAZ3/IgdY+/Zh8T9LYMqjxprR57QGAvYHMCCD8zhZbl5jVz6p/qnMwfEsF/XQ0deJyNl+Oi0AJeBGnDrlQ8/Ra/vIOt/XVvG3stfAsA2ng+zVtDkFBPeQCEon35fhQyrOHk/LG2y+X3/yR95S7//ZnS3nl5bI7nJbNvv6HgJg+HMjS3lJ0fgiI3iD083UAIPktZlO2glZ0UBsAgZsj7P23qUAWgYbNTgf0NBusko3XNhaohI35iucPWySbfTnbn7QMwBgAjBxc+mwR+MfchbzWMgCJF6cAYMFTmwEArFmRTz1Tytu/qLz1O7+v3PyirygfuXaj3D6+DjqtrtW29k4EymFmOQKrmFgZhT6+RLQfz7hHpM9AiDV4Iv/Ngba9ogG4QMtHsol/edujbQi/pbfvqQKe+580jvAppGvGMuz1m+tJ2iIccVYat8AvasZ68Tq/lb/kQJDu61jXyw/zY06j3iKqB88d0NwCRuKl7pg9frRBEq2JB/9waWMdjdQPery52eh4vsVcdI2svrxD9wC03l5PJv+8RaukNhdgetoPDh6gwyXvO6OzaXmT7ZGsS7aAY9ryUOYlwNmsmwYwmW62Oi67f0FCw4zoMH0tD3rVetpowBL1MmaaGXqoJ1o6c0KM8lmGNd5WJzT9qOcD5FNvV/qYL6slpnJFv57wiIGQ4seyRpWVdtUyKUygAoCGSu5ZfY9CrRzYl7d0tuN1erSTX6tYMWNW5olzU9cAgq83j2XAEFN1mx6WZn1LBg1a10OF+H3K7jZl5vlpQxmAou87G+mX1+nWqf852cRJe0iPzJDXj6k5yQ3EEADEhesPJbhMALDZDyNUM6Vnv58FHB1AQwLLgZDOvuPd9EYy4ygEPcg2e3IMz6/EzfiB6AIAwkzdo9m5i9VTZKGsAE4BwBU7wC45D17eHyKglHPA0DkAaB2IumbbGtyom8TZjSyNNnD4ve9xM3OQcATxVd4B6R2OOl5tgvodoAoA2iX2/M/380h4TnSXAuxntnbp90ZnO2fZ7hhjiWn2M+tRORtTCACGoRjTTZlNBsfaLiFe02QKAH9noExJcL/2WiZnJ7Ti3Hoe5DnzSCc5wo1Ejb8MSJlT0BvUTD5na4EBq07pQfBhtg2hn7sWAMzHVB268evHlJ/NVL6fWaPlT7oPV3YOJ82YgbrWokY7WeMZIW87h4scVHRU8fnQ3oABGL8jG2bkx/YR3xdov8yjNWSc9WeMHEq7DnUMCADi3K5tSnnm7F554ZWPl9/84feUez/3b8vm1itlW4GkBgDy6eDGcQlygZdkAHrpd+tTPVro/adPAybNwj4alQlV4G9bjgD8q70AD6pnYPPnDCgS8YL1czDgwv9gpASAhgCgvo5J0wVYtLgt0PZy0TvpWo9aALDfALYZLRWkPIXsze1hU062R2X/xNOlvPjmcuNrv7G8+eu+obzypk8rr1y7Uc4APN2WIzgQZEMAYO2pWGcNtVjd+sIn7hTA3r86G6rHOtPZqaeBeXIEwzXUfpAFAPMAwJvvcIM0f8RQscmG5eAS2kRbcwqkpUdfPt7wluY2KR6nz2Q6gX/YObXev7F/6wyaeJaOeLOIcaWZkIA7vjF/XVR+P7O4DrDwTfzN7esBwGbSyHUij41iUZYX/amq0/NDd/0wF5H2XAAgrrH2Ddu7tJ4jMCC8Lhzc3PtIAZ7ZhI0waUd//l589CUAgI5fxF/WciPRbg4A8ngsrK1jCD51vVndSYl3RsJI//uWDN5f9sYg9VHb+uD8q4tSLbzmH/v8frT5oSfo0124B2V7LbbasBuUzkdiABA+tujYDACs32MCF/0E/i+6QmBZ1fPHVJ7pz6wH6BI57gFNu0YzAHBmerUIM12chQr8UhnDAwQAR+bRQaTJjhIrHS1E6wFANXnyfpqvQOU0IahkDIMEQrgzPF4mPhRipEgMoPI6BACn7obyYB5NALBXLsINHADiLMEdcgDrIwsAqoXR3P1aAAA1z0UAoPTUcOvVOXBzAPT1BgCOwnem+dqWBDP9cAUAameddNEjBQCOna/IgVrkVDUHcB6ozBwwhHUO5bCrv+3Ltc2hPH1ypzz/8kfL+9/z7nL4D/+ubO7cLpvDSdnsz6BkGK9E0EV+onleBgBYX1KdjNoLkMB2ErL2fgLh7ycAiJn49T8uCfYZgNJA3WR1Gg/ag38z91aCCdajawHAw/YUyoB3+23Zb47K6fGNUp5+AQ4D+exv/66yeccXlpdu3CynFTDdHpWtAwChIgZaDSCnGNvxOgAAc/3bf2sBpx4A8iJDRcCj4MBmJnFo2ZZhOQAY71OizHqIT0UItOTjK2anisKzLhn0M1onPWV79uorALBjPAcAzjc3Re+vAQD5vTlrzO3bax4ANBtFtYVXpTfKI/xmEiAEkLSaWvyi6i+ak7vDQ6qWab0HDQBCBmDNUldm9GEDgLKBhX6KAGoULEFZJa8WbiByNNz+JfV6uQAggYDDjUZ6+0R/Po4AoPVRUoi5bJ5576/Zg1pIoNZkAI7Mo9oXGUgUQWeCwC3IJrFKcQoAMu8x2zmfExWwmgHmkOJedujg2x3yqDTEhgW5El8DAOox8dimvoU7pfihZgA6Us/df++g1Z15bopOAhxVjLcF6Jn/MjMAM3CHh6BLwHD9rLR4BdMDxhqeliCrBSOTHpjLTFl+1SMFAIYKnTOVUdZ4vADkU/afBmVF3rFEPvphWfPhAQMK7OzNMiBflwCgJqnb35np63X8+mAyAGdjyu3f7O759yMOBd4MSzhF76F+kSdcVgnwsgzA3PngkWkbNg61uw1jIFw2H/x+QQhHGFsDAO/dKs9+/G/Kr//gu0v5pV8su3t3sPffZQGAygXmHnMySucvgH6aAYB4jQEA4SRgyc69aAYgBk26J2D1nLEXIB4CwmutbVS9RKdY+CqKOe9rXQ1QLfcQIqbJ/JlaqI0AYAEAsOZPnNThvPjmUt702eWp//pry2d967eWj918stzdHZfTmjl5fA1kqgZaWBeMPaGjwgigx2s8A3Duo8kaNs4dAHSdLJ4jA9Bqs8C/o3eL75616VjQw2+SkDAFAKcO+hIZGIVP8wysRz0DsPN/je/QmjS1ajQNODAMlNvfLD0joOsVANiB7mMOnfPfOu4WG9LsSQcAyhMRAPQlwKghOgCQnvNAAUCwkF6DWm5NPSQNnJEvU+2S1qO+B76n95oMwF6O+JOxV4YJLKz55YwF2SzT4A5uINqNNKEAeDHGX8PgXvfow57E/BNUqHJg1vwR7hkccaIFlKMrHicA0I9fouGxFd88+yO/Zr9dAwAGp/h0DFiXS5dBaoeQGyyrBV3WRFyxwJqS1cp6rmZf70CCQqljCtsQEhilhZJ2hjUB+2O1LwcAjEs8FLhONOwBDatiHiYAWIfo8dbcwfQO2oMHAPEUxuRnssOAd7KrovebgduohUT9nh2VatC0whUFKj1VlNJcyf/dTBIPEdfGGtMHnQHYOwKRyRQDxKh9K5VXLQJ5PhbZt8YN5EOVjuhj4is1uISV7Qzvxo05ZGzixYEdSYHVHXyVbgMwqcCmnpn96LRZXuqk8bvsaIMxen9B3WD00xJwRkd83fX3HwBMRZ917uCitl5LCeyuG7tf+GT8f60vvAPNLWq8PqG/A/rrsna/3lEJcL7/QOUl6vV+A6YDUCaIg2EtBhBCIcArZbffcrzYeZb3fdlyBuBdBADf/4P/opT3/Uo5uv1qKWcnpZydYgks+AhBkBE4+7MemXx4h+27pGY5BQBreSr2+qv9/1oJ8OaIAEBkqvMCgM3dqb5OdfbpVGAEA/EE4DM4FZj8I9PfRwOAxJtdgD0TDhtArAEAIfyqbVoqiQ5VTrblsN2V/c2nS3njZ5bjL/ii8tbv+M5y68VPK3euPVHuHV8v5fh62UOWRc3622Lzv7Yc9FmTez70ZLl/4EvYJuyuuikF76gJFeRQzUqAR/o+KwFuY/P6fDTdQD+bDpf++3MCgPL6OYCXV+DM78963M04F326C9QYRi9wC4b8NF6ghw0A+qxZPyXcEFf+sW4xwj0i+SYDxtI96TG9bCdnUqZG9YABwJSH0vJq0usZQjFj0NBPU740e/9D93RJD2w7iClgrjaSsERUA0Y+lu67TGJ4PwMA1RUXEE+I2twGkDkAg1s8JPpzHB3odGeKXCgD8DIBQOxR2CIj9JnEuQSANfvZ06GqVADf7FHTSU094Uyb/dY2lN8Pdtq/TXSDbEDyNcQPtObgDbfBL9tsxA2F8QJdAYDO4GiG0Eech7aK2ElnPemUZXZKZc1tz7SZ/gJmnQAgnp+0AkJe0UcCSEpxH1OQg9sy6kho/Cm7rqfRZZUALw36ewDVqpiHDQDqNVVyO1hqDipE4DcPOAPwcgBAMtam4AQVz6ExGv1tAvqmjlsPJtsTb87/cxlKTBAEuY8AAGicMjteMV3WcYGrBOcwAbDWN74Dbw3YWzC1OUDPO3Yj6+M8AAhvTf3LMX3ZtN3PHoB4aE7PBaOAMOOXtQBgRBavn2YJEl2Aah76gADAkX+wFMCcC+HwCu/yak2Csql7MDKvSWlX3+PEPrGnv/1ek/tcACC9gJ/jAUDyGNv85/IkpMJrR2X4uGgzALDCfniSIAKA12sJ8N1b5bmP/3V5/w++uxze9yvl+NYr5XB6Ug4VAKwUv3QAkPR8C3AVw40AwHb4DwOAeACIAID1FGB5jgEAjVAFUaDSt6zvqh5k0I+tQnXmKwC4VwBgt2EDHrTny8TmdJKgNdW6DEB8L0Z4G+6HuN2Ws6MbZfPMi+Xw1s8vz/7Dd5YXv/pryu0bT5dXt8fl5OgY+gEirF57ANoepx3/zjbB3QbhwwAAdUDnW9yNAECW19kGUxeuKYXhvYfLygCUd3r/0I7G+gZxhDK2vXT9JAMwV+33CwBUcp2esjz2Tdj3sOVfc0Ol/Sq4etIDEIL+FABx9iYCABtPaR8PH5r20MIBpj2wenWj9ZX2v0e0keeHtkvLv2ohM6c0vntWYXKhEuBQ11o/mjO/h9KzMgFhFQAItPMZY8xM2nvW8sAekmY6AYMwA1BBPhcAUOsbcgCwHjJRM9DGq51yZ1PcpMnuIwDYqBpU7IzDG05gQRsJ/ihn7HVCj2tge6bipqImj80AFG+Xf7MZgN5vcgBg6zE4nsGsB+8VAHjJAGBEUB2Q4465/kmj6xQAhDud8OkFD8uDogxAJYi+Z1jX0+oBAoB1fl639E2crYp5lABANs9jBdlnAD5+AGALfQNXhBUo8zu7zNopkgDovmQAZg7SIw4Asnw3kF0561ptidPqdyyt8wkOF52oiY5rBQD5wAMEE3b11E125JSxHANZYxOvXZjYRXDOsYpJmpuaOBf18kcBABQJQMB6OOQAUPN+RG2BrNy9uC6U6bTO9Q+XYBYAzwDMZY7++CrPoeISYenFRQHA3tTGbwRdTcGMPgRklAGIa05On3qJzwDVp+gxLTOW9vQGANCUOIsuBfPfHEzRo/A52fkK+0GPt+0BDou4VvYAAD5fAcD3vLvsKwB4GwHAUrPfyL5fbgagd2QVBaJDQIi2rbiNrskBQFrXKaBhd85TAHBfN0f2ZV+BUb9Jw5kbrem37je2Mihv/HMeAJA5EYOU7XZbTquPeeMNpXz6Z5an/tE3lbf+g28orz75TPlkBQCPr8P3IFmbvofjaw0ApJSJ0OOe6b6R1mrcq8BRBkeMbF9CBuAsw4wzU+KxPq4ZgBrwmMRHwdfefq5Z57UAINqMEfU5QNPzUSlZ3SnRbJvwXxhL3YQYvAM/XqlrXAZgH4/auWgAknncXHEFAFrdkgLWGnzl0s0oRa/BVS3vvGWRUkYXQWbiCdI6XAGAjn8VwBrhIT2+a70zaTHDACDHWK6MkjCUBwsAsvwPFFB3qGF/3esAAHx/09AAKKmmmlaIkDhWIaLAjhx2vp8zAFFhZybbO1xz5Z1lAC4BALslp4hG7mXy0FzdaXB0Jo+4qO6UzIiG+p0IIBIF4WJ7CnCrKgpO/owMt3VQkdimDMNFbH4HaZZRaY1bv5brThnNdwfRPVAOBJQ5MX0IPrlgD0B2QSIVAfKQnnIq4NDYGWYeFvBJu0Scss73M5il+yrgd3GT9VXr1Q1yIl9AWwsIdABzGlDy+uZO6tBDlG5+fYDJpl2PsQmEbdAvTqtfgxgABGqTw3BRAFAyNkccNmlC7uAuHJtyaxP+B2hEWXDtJ1s4xI4t37H38xAaen0bcRcACuoRmjOaW0cf4jgs71gAkL4fGCCtucc8Fnyj1XECIvrxrnrHwov7qelZKWdLLJABRfddk2v/xPxvzyeYMcK9eykDsyt9VavmTpnzAKA51W2STesDLC5X1jNAHpcAwQKAQjspAUYAsJrd7eEMAMBn7rxanq8lwO95dzl93y9TCfDpBQBAvdg2/OZxYN+B+p3q29fsD50ArHUtg7HqmtoDcFOOIROwngQs1pMPM6o9byzjoX1TMga79NjTr45tt0UPZ39Gff6oBJjLeTAD0PYANKVb9bumeIzlWwzPa4rhBq5oFl+h1O/ogxVv5dDb3RYy/A67G6W88Gll89VfW97+ze8qZ5/xWeWl3fVy9+haOYM5V2h9KQAo1ttp0i4Fy2cA9hpOnkAeTrJhwhkX5CGwXVA2oVk8Jr23FwGC31bJ6cGFKktVTAvApmXXyusoeiA5VhU6/v29jx7YpsT1EC0xukiuCOc+dWuqLGngWz/FGLmYtB1pVD8TuiPLYGmWWYs33ce8BU0asiVwIxNfShyw0e14bUQk2ulrC6gkXJfkEUBs0hxclvQ4wwrfK6fMR7uLke13+qVLSHES7nqa9dOV+U+4KeSBaQbgpIQxMM0D74vtprKdoJwm8T0lCSzVDWEGoNJNkrXNAGDkRYpmRBaSXnD1+TLiep32lw5lu60b+MQb9d5LyADUGpvXi+Mmy59WUmRksSKBqxWADG6KOwQkOoXcWNkEcIWNXHII4F1dhqo//IqjcZmH7skJLTYAcrAxutF6Rl7iDMCIl2BV6zLXFizmgazl8FNTAmweFNB4AQA4SbCenu/EdB3Jhy+JNtdN7K9es9HzZxnum2ff+xuGMuygW3KNVXxmOxqDq345qwBAcvaMw6Ah6RT8QZLMbDQoDPUCHTBLerxS4k0/shKxJSJeIJN8FzRQpoSLlxGZ2tO2mSZmjEFzavOU4PQ6zSwzBp31AJjRNzMMDLLkxgMzrtqcDCA36NfYru6NR7eDP7FcKA8xl3MGRu4+6l1mBGSU+YEMM9mlxndpEFAMJs4FAWPJ0hAHBycS8Uy33oo+fux9D8mJdzjJKMl2gOsw9ClW9U1xCTtLsm0wz86oBSnJOWi6gSA4tKYGUoanuS0uC2BjCTBrEh4fGGL2J4dloDQqALwiJ4YXwX835jekgus/NtWBdv1mGWvrwD/Wr/QOxyrRrDUAGMmNBZjZlbNOtNEHk0NwfIA001d+/hk8G8mbVyczek/Uj/paU5MDqIxX8Jp8/M2YyXscgfgKdLS1PcULxzpcK23qBRhMNtUuLQAk3aYyb0XbKTtpZBEHK/mBpHWbPUS7X0Gz2sam9oqrAOD1w1l57u7t8uRf/Gn59R/6gXL4rV8tR3deBfDvcIYZgKCBmx437rabYTQ7J48UYDabAMAdV0EwgF/L+O3hV600qtmnOgksA67gX/0XilihpYGyKREASEEGyp5k2e12lXq1v2At9d1DCTTrslr2iz0AuUQL+ZO0r7JRuoQr1oPsM0XBoVCL+M0gmP3pvFEPZu4zBtnHoMR35Wx7rZSnny/ly76yfN63vKvs3vEl5aO7a+WkAoCQAQjHqtCGt4yizwDUNlfNT2f+JEKelyApex8+wwK6yMfW5wUN4WSadRzbT+Mf6H7dzeliC5hrq0Yleh9qJ2G4ThpmJZHkW4x8aBg/BPyzn/gK0A3Tm3P/Z36/V6hWBuyGhVgUvov5WeySH4/9u9vQJ9dJLAXJKLidSDszwhGzKP3PtgANQGxhfIa03MNvbBrPHWTFI6UDAIx/7BgS/hytD74H6deoaRgF7vTr7zKZfQZg/DZ6yIKWIDrjfca1c8YO7HdkgYY8rksyke6eJjn39/6ff5XnDq+fO4AT6I8HTCF/0voxX+pNflj+oKoHDDsDWpHNURsTE/S7j+ctgaUEGOnnTyk2uT0umaI+KSthhyfCVISqEHcs4LOx/hivELL+HheVGIHjsUZF1/u4recBt8x6ANDrJy6JpieqMyHA5lKFlaYy4zBAB1+iHMaffs1VsDYRutmhKf72i5Tgi/SOjVBmnlhWMxmdzWfz7I86AHCy4zFVWuqCxoTKKYkAQHEcdIYXamePYHYlrDMNlQwYVY0lsQ9APYDBTjILNgAG6hGdgouMjBpTDUD6HzHXHcNRBhA8tgGAYzaZHaoSGkE9vkkT0IxBZ7wiJWXxlewcaSMBAFXzJi4GAM7GV7+vO0ajn8i0+GulbBe/Qf4hY8FNYpth0N9xSrV2Xijg4YCN5UNtU2jOicY3/d7NN3dwez7tzMtEPn0JRdgjrjHpEgBQ5YfoEmaVKSgU5UxBGWRfIm97kEBZmDLCY/pQgWbLsIkkhZ0b4hrF10OeC8qyM/7UDtLMYPDr18h0G3IwiIj/upYJjj96ALDuEsrDgeO0E0CHtgxpoHZ4fXDc3aMzK9uXY1080x881tl18++ZkkE2SQbAh/PpNdQoiNLjj2k3yoDWOovetxAQMaPj8l56XLf2pDe9DGqWwt5v9Yd6wTHAASWqCADWuVU/YFfOys1yVp69/Wq58Sd/jKcAf+A3LQBYdW71Qw0AuFRiel6CnqMchwIvHwGQx5mAbC8AANRz4RJbvUFFACD4FOBX1LRGPiQG7Umf0S5rBf11tqUc7bZlu6MTHmuZbw0K9nvM9KtA4B77/h2KBwAZbOIFQw+rC8DdgrETDdmgfkPGbdl4wMybZ72h1DbTVJC4gxqwXdlvj/EwkC/+O+Vt3/odZfMlX14+ev1mOdkdwyEgCH1uXcWL7bkb61PW6Uu8A3coXacIMOsh+2k9PknWoSe7+gntU1BNwreMKgqWZon1sjjusj/Tj0hfBGOjn8rPeRP3+Rr4FgJzXezoC2Ncepctrwf90/XQsx6jBgDj11idEgGAQmf0SZo71dmHuX1pdgDu7eMzpoQGfqyPoGpxAAIAACAASURBVGyZPt/TZPbJnARQibggs834Hr+BHlk/s34dAGjf22gXLDlfmYnsRQCD/pVz32QGUAvAhaNeAi6NuB0obiZPvKw+0/NHvtRz0LqzAkV4QIXdZHT83oFq6vugP6sMBaUJqwjGM1oPAOKzvF+MM+vXK8sAq1dLRhtFjeqgjLFelDH0+kN0oh8NA4Bw2Bc93AOA3QY5A/QAAGJPe5knv0FRnXsCs5wFAGC/GkK98wOAy5T0DDDzY5udwjyzDHMJTp6wBAie9Yi9nwCgto2tbC0oAWaliiVrUVNzIcKjAQDKzCBDTvHWwwAAsx4Yac8tAfqHXPYgMgBHzuUVAEhBWDMpDxYAZGfAb74Ju8fqS6vaWeCQAYDWeSFn0wEJbMZ5n6zpGbDuOD5t8jCDjgxkkCHlS9i9ga5FduxQi2M9Ck9qBgeX2EUGiB0eur95DWMXkrN5xubMuThqjqhnfT6FPIlfv8xUxo6OpkQUfml9FIFKvoUBuBNqQPoQlsjR6g20fNI7qNpCSYabnf/5TXTOHzPXIKLkPEAzT31oAKCx/GpIaziL3XNx0D09oxJgu9o1w0cBgBvOqKpXKQCQMhl3h7PyxGZfnnn1U+XaH/9h+Y0f+Oel/MF/Lkd3X0GXHspP8OjV+wsAEnjH/hAcdMKgII19Q2W3DQFDPq09cgEA3GLGIPY0lX9586ltZAKZD6UCY1Vd7o7q/XWqZ+XuvTtQ+gt7+3UZKAsQD/+gA0BquTAJqA0eea19ymHPAyYo1IgetS9BjYb39QCg1ZUdAAhfY3Yk/AYH+x6V/e6o7I+fKOULvrS89du+s2y/7CvKx28+WfbXb1AGYAUAq7a3P3kGII9TAz25nM+a4i8CAAmMbpTlQY/ETeuFSQa110LZbCKrpTMA/b0z/Yj26goAJLM9wCkcIBKUNLYwXFVUaRYxHkCYAah8CrX/ztlZft2N/1cliAO8JsckH6Y/K5dxWtBADrGKuWtZBqCSSy/PzgXwvUy7DWl/vXoej3DsveGhEZf3M/dNrgBAG62QNbBuQrCG+JE/tMLZAkiY4+dL+nXzexUjvDYBQIpPCcRFAFADnVaWgaJXAKBhorkEJ9ricQAAefgsFF1LIlKoKCu25CJIUO92iGcAQ6Zs65jOlwEoT+0zhvrwMdshjDMAWU31pqQBHGSIMQFRYBA/XzBgakidQ5sYNBjFI50BqDMxopXuIYi1PfMuJwMw4hdcCegxR7wvpcCStSEBD5kQyBJhc0KgWJIBqJe3KRtts9wGtplvcCy73+HTdYG6tKjJfeYNuRT4eql2uNh5kQCQ1tM4lOKRYiaPKoPSvUF0BuAwA4I3IJR/oHpWwPiobEic6pGGwX0wmU/k+IUQWeofdiXAiTnxgB4G6Oxoc22Ycf9X9QNqvOXW2AYANEC6xrZYIDdL3W8c7gMUFbQZ1vEvAwBVwKIMTg8A8rMVDboN4fObaGbTiQik600UIimNShnG4+tnF71qfH8oZuYRsx6oy0YwJoA9BbEFWArpGO/gA+wlAAJlzAnwRVqXKx4qCHY4K0/WHoCvfqocfej3y2/8wP9ayh99oBzdu2UAQARtuDYhkuHRjHpaw4nCOjsASoAJAGw9b2sJsN4YrdkRDADqd1X9VQG8WgoswB/oaD7NloGwljkrJb98wNnZ2Wk5o5N9ub8ftj7eCxBI5b/cL5BHYXgGHIh1AW/fY9YWka0DABnUZwCwnuqLKGAFAA/HT5byue8on/Xt31WO/s5XlZeeekM5u1EPAanAHxQA9/kluqcqKUAr32yjlvHFeQHAJlmk5NdRWdnIFQDgAkXVXWK33/psuUw35gA/BpoPOwOQPfWQNt2iXHYGYNOI7fUGYOKvW6k1+4sWNnMegHzJDoSCwX0GYJb+iP6gGoQp5yStZ97Rg4CXAwCO7VCsr1h29YYRkri7Xi18vxo9V/j1mclt9j6JFxIL2r1AS5wvAX7wGYDgkbagQssHH+4SZADynML+g2Rj4Rqbodqs74Dokb+W9mirb2AQm0EwAsDMK8xGrLMWvoekW8r7kwGoeFlJKJTzmxJgiV9aMbYZPh1iqbJ3/aEgHqAXAJCMZzskDK/0eIUIHGcua3+AWzhEVsTJ/EI/5HWXAfjcv/oty6uzLce1XgAh5BCcmwad9kEofH0GYFyCK/c+agCgJ08e/NmeAWBgDP1twODBP3gXbGyrINkNYLZjnRuYRxkAxAwvCZ4ixuyd8AcPAFoV6N9vAxpuVq6PVdedBtdlAFrOIAXrchqgEexApoH7nIBdNgCoCnbFwaLxWACQZ8MBFl3UHEgMapYAgKRqYN62ZKoHAE0A4/r+IX0S5yvsaaivXxYkdne4Phxizp2+cBkzPF6jk9ShR0jKmUtq56vI377o3G0FqkUZ3M2fI/0n47PSXYcGGZhq56t7vykpsSV28LROIdv59vLQgzZrTGCu/92Tkn6SpoxSKe2orEQ/Ne8xNjvkyMWC3cRnAKDXQGsoB8zY6R9DT1cibJ4O+yTUAbAuMW+aNNrhukuPp305qoeA3LtT3nRyt3zqV99XPvSTP1bK//fBcnRSAcAqTJj5pkNa/GKpzPTcgAAgZSVzDz/ou4c2ADOS5W8aSNluK+2xRKrJLPlPAADSxh2ODHmYtiScEOiDCvAAEAb90OmvQCNlPkI2LgZVSAcJlCufxby+SgI6Bpk1wff2o+ewSp8aqCBNsAfgtuxrFmAFAN/y9vLC139zeeM7v6F87OaT5fQmAoB4BAhBgHqD7REAAIHqbuOQAxfOYA/9Ot2Kh3/nBNm1osnmd1Zi5DYnmRv5ddmhcb3997aH+Xo8eASoxz8XLQGekc1XMdgMs/OUAHt5coCCzjDTdrdl00oJcL3TWb/BdJRFdhmAeMjB2IMUe89+m+gMAGiaAWc7yyCgOkhAAQy2JHOmW7x/1Y/T+HDGNsS+WRYv8Whmo2IiWznuSd+eNzQvc9/ELg1XFGkLZh/uS4CtLxZpV+etmcn3JcD6CVX2eDNN7Kjlk3EPQNQkvT+H/IPDsGvYqKWmbP2JHlKNDtnQc2jfdwCgenJaiSFjjPgHerxTjMa8WlsQeT1qxsS6mewEUCKodAb51/obNtxtGw/sCY8v7A8MqviFklvacBVPALN/NYfp94EfwVUVNOZelQgozFuuuu+9bABHUre891+TydmpHzOF776flQjPJTh54WVkAN5PABBYhwwSlma4Bva86CSrvgTYnDjI1zqA8rwAIDPlZWcA+uXKjcFyAFAHrxoIxCQncvOdoQDm8j11fBNN1pMj0/8oZgCqsaquJsEMeiP+qAGA9lRABgDJCdrUHW5Rv+AwKSvWusUMMgA7glAGlTEWrqTW3oMvW1MCbFgwMDqRCzECsOMAQDsIaNnaOysAqI3tIAOwuQZ0vYzp8gFACMaHOjx2MjMbw3pg4Mq2YJ/nyHqXHQbv4EFwTANcdiiPHV3z341MqhV1zo8/ZMbPw54S7By4QylHqgSbHRu9ft4jtPIVAYDWdbpsAHCNv2CCEXNjEMiQcOT6b9ZjbA4A5uNfAgCuoUBvPTMAiPsHDeWr9deSoBP0f8ugrtAal+jvy/HhrNw8vVdeuP1qeelX/mP5o5/68VL+7PfK0ekdGBj3wlsO+M3n3noAgq6iQzz4EBCzIepbo3CTdG6qTe+q90A5LwZXGGSS9MPz/GEiPEabnYS+177s+URgyqYA4A/qfPThHxmfLQ2HI1r1APDMfoTfg2BxZqQAgGfHT5Xy6W8rL77zm8sbv/4by8efeqrcu36tnGwvDwAcxu68XMkpm83eB6TB0+mbVi942jcD2uPDLWz7C3AIVgDYAXWnAKDRzl0GVX/omLp+Guiif5LR+H4CgKP3eo53EIkBJtb3AMxDRoi32J675cJ2GmrLaMacAd/5DMA91FCNHyQtPyyww+AMDFUBfFKuHwGAc3u2Vj8Ym4uDcf/ZJ7ZLAtpEAE5mAeqbpht06Z7sHD7oAUA/ot7H0vzreZf/pojTHPvUt9PLAUDw3c0pxjGPWCDPzrmL/4mXcJwyt7Y2ilXb3JSeMbJbzVyq3yrnU4sLei9nwPntsAiAw5WwY/Tv5022ej/z6mUBgOjT1PfjWzk24E0+sD8tQ5x8icZQpHth+iSrQAPxU5rboVhOA6pgedypvv5QS71hYtN9+ECQFrzEorY2oeFRBgADNTvzrmYZjZv7BQA20KA6KnRyG5ueyFwQC3Y9APkEGL7nMnoAasbsevYZwKwPcDpAbZIxmS/Q5QKALMRaEqJDFToFnzgCj2QJsFYo0tY4clc65/bRBwDZwOG/PQAoPVUeBAA4yutAYjtjHGZYZS6QNYD8RL5jCQDom003cBweJuWu+LmMF8zufQYAwTSmhyrl1BUHQWjI4+5F1vINU1YAQOldqFdEn2F06QCgAWPR1ZnJ31IAcGDtO4TPbHCyNvBeVnsY6ntL27mTPePwpd+bYMTcZJ10oORjAwDOXJSEOlmGH+mf0QmhrJ+QTBLUYYsDoefOAICn5enDvjz10sfLJ375l8qf/sxPlPLhPyzHp3ewesFkvS1d1fy6HgDk/n80A3VoVAO326ZNPaVc94UkL4pOu62+DdgPAOyQjxkA9JlXrdSIT16kf6XEl8qp9pIBqPXT2NFcizJY72SZ/55CQBjEQF/E2mIGS4AP2+NyUjMAX/zc8qZ3fgsAgB+rAODN6+UEDk6hA0AcvjqvqEDekub1+fq3ErLwsv4QkMa9BO7uuc8tKToEtBUAONiEQ3t4BQBeJAPQB7jAuWlWBpckqqB/9SEguT1iADCOsQQAHHHlTN6WAIAMygCgwO4qvNCXQHM2ovNd1CFICAiKTpgFtPG8xvrB2FxeQAMC2ie2S4IX8SiXWrzHDQAEAKYF4uhPtyLbUM9MAMCuhF/stADE+jOOEDIKa/nAe9u6ROAfuwcumtH4xViDV/tKBqIdgkF0IVxAJ0/EXPgwAUBpocBygP8y3RgAxJHHGYAQ5VCVgpYA2phx/nQPANoIDuWLKGXkkbd6XFk3K+HLcccmgO/6l1xqBqAmixbEzIWebdDdDwDQC087iYac9vF4JQNHhAUtatM7GnBblGFk38bPaTuhjkA2ZV2y6/gpawBAUVMDhQXOuTMwHaCICk3vIEgGIJaE6jJpb8BNT7XAQckMGoh2AmDwe9e6+DAMIkm2e4jq3jo8ej74Xi5tiriKlKsifwhAJBPAgDFeP12cG709cgiynpEWIMf3SkUHzRb4Q4I+v2NiR9oDTD4fLSsBxnWaG9s8/MqVpt+/928Tfua58JpK70T9fuErY/qVDyn8AgCgAy2R33kUYpyB05Rz336fpGGnJU6k1XKH0WhCJTc0zPa1c6IJ5pAdZnxLV+JBZxihHbXznZk7tr3R+uvv4Kk0yfUAoHhodXgVsPEuntOg8me3w0x2pBHcz5ezapq1oWclK3Qe5deMic0lYyesp3uzWvSVzvKYZcBkA8RMsZF+m60/QQhpCRiyeM7h2XtMz8rwwnz8jaac9ccGb4PlZ1joWX9qBuBpeWazLzf/9iPl47/4C+XP/6+fKuWv/qQcn94dAIDnnxdPhUuAkcuxd19MLypnhhuRb+v/IwDoJEABgHDKcQAAsjY1PUqJRpz9Bw6/Bz1px96XRtnA3GjkORsZZ9ZOJgckZvSvAQxmuR4oKxLM+XZX9mVHAODnlE9757eU59/5jeWjTz1VTm7eQACw0rCCgA6gMQCgcsjrrxIOMwCIUx9WqcAy9vIps+JTkftruJ0Ob2xxJgfyM+n6ILevaRJ+SVAC7LVftoBZiVy0gefXM8sAzME0om3XpVGPNm/ij5ppnC05Y1y0azN+lbVDTSU2B1WR3sLAZxlPh/hD/JqJt9BKw3u+Q9tvD9XSc+Qnmzdo1ut6J9f8J19DpTEi5F+xUHqzAukg/KD8Fw0AOvrYQ35mK5R/3+ZrGJ7XJ/aF2HxET45WJlutpr+TYY59Am1Xx2/pWvh0qsTyp5W5bnu9a3+B7StiLx6fHJXpyoT7M1Es/duTNZKW0otlCC/SI9O6J1wr59+DLEYZ2kSyGjsxAMix2ygDkK12P3Qbo2n+0roCCA/+CtqMueUj/ej0h3YWkP+YTuLGKVhXnULPF6qIHfzrer9vUSK8yQlcPG+0U0zA3v5xhjJrd1EQzXIFazqTskwP2HvPt8Ewfv75AMAxsCXcHVnpng7T988AwOmOUO+bGGrEX0+MmNZtxmTWzVtncPWuhF8HX39Oz2XFFAulNVJdBt3aHoktvZ0FUp+KNxNjzphRAKAxwgwAkhA7YoOv617hDZgFPDAlV//4EWpAcOkut34eOk1NvBcFh8ZF8iXgEwdQZzgF7EEOyliAHTm6C9MEr0Wzs9TWzp/PsAP2bQuyRLLs06JZwlMGbBi7QPF4+dMOoHXP1iUPzIuZFLDTyhzTjCL3xYBm9+6nyYg82TrQvDulc4H4GeyIknZQO1jeGQP5UinvIRdNGGjWgz0qmdWbAb4Hhi73s3JGYLrGCzjLpw28BxMm6j3ImFNUCHqfrCoBdiXrTP+51pS1xNI4dYe5OeJwP+PZ22bfJ84BH4JDjwBAKgooOVsHHiWOEPZAtc73WgcmA6jHI/caPbvy/PQhq5bWbWMAHrxD9QFSWkCy/wAAxCbvrFOO96flmcNpecMn/rb8zc//dPnwz/5MKR/5q3J8epIAgBedn7O2UKIrP3yIuN0I81UVUkpmNvzg6F6mD/IKAIJALz4Vt/7ugl7qLQjZf+YQJDwBmXJ5kRtdiq0ELbxxm9PHBDnBOvb6R57HJeAx9+E4MfuvHoKCB4CgeNVfjsu93c1SPv2zIQPw+Xd+c/nok28opzdvlnsAAGLLmt2eD2BB2eOeSOwXcwYn17ZuKcAxfs6IBK7EjC+zlwsFNC2aFoA2IaLjwD9TRl0/i8ekn+P9l7XazwOAHcCnMnB6Q71Mw6TaJd3AoP6WyQO8TV8zIgE+xgvMAS9vvLF84sYtBtCWZuKbeC1rNzebdjRD5qUf2W0/3/799k4/M83XsAmhLojf2Wc9CorkrRfppXbgkQZnUY/1gPPMQ5npH2VS4VKrC8O7k1dG1yfibyx6p085Ky2don+6/js7JAGtpj+V2OggDdYo2iCP8aC8D8L9y4UtkUfiSXgAUAAiWof2Hsw+zBJSlljiCM9oc/btsUg/m+eqa+oIzyoAThcAN5MARrPFz/pR6vcz1fAzkQ/W8JiFOXoS3m3shNlgshamXqfhe6SNl0ktE3YDA//C7D+xxf38LC0seBnZD3kC84Adg5mlhSuc+m5WcqDWfQn6Gu1/vmsjfKWjmMOMPE/ojROzAdyUMT+RW7WMxzotAfYZI/5R6A8ORO8cGXr8fAlySfGT7NgMEnTis5/OQLUxceCkiBUYAHGoyODOInYzGJu+Hin4GRvxfG3qPZkp8G0t7f1KgP878rwO9tRlGJ8CLKy6oPkbjzEqmctnZDIZm0Jcorr5/ZHBS0zspMm1LTn0Y99Qb53x86WkbLaSC7+vuypmRw35n5WenGI5f543Iv6Oph4T8mfSheO0N5tTnJphlDd3JfezDLrmZ5Bhah4rGcEIAHQqSZxiO97eWSZai29DAJcYXO+sVwBwXIbIAXOigBfwZ9OJbNx1RnRXIkOKkkoSdPY0faO26Plsr6F9TGO26QZAAAAagNjxR/3TnwLmM5h9Vkmu/WcGnp39uSwlK7ga5lfSADvIumQqBAAbP/fj9TK4HgBcrnsvQqVz3ztwhsRP0PpRvwWZz8GjFgAsBzhUBp3efakA4Bv2J+Xpj/5V+cjP/VT5y1/42VI+8jfl6KQCgOhp9oDVZdKvGmunECrDwzy8luEMwCbVOD53iJhkFBKdFAAIQUUriVY9/SoAeDijwz7qv2x+fMkCtzARDXUuAHDkw3X+o1/rrEcgaQbK/APMrwGAdZRH5aQCgJ/5eZAB+AIBgPeu1RJgqarY7nd0AnOdI2YUAp3p8byh0QI0PiSFdd+EPUYB+FJbDRqhAYCc0Ss2wHoP/tArX+JFXgaNOcrg+//Ze+8v25OrPnSf033DzJ0ZaaJmkIyEJEsgsoVIQiiDARm83lq2eX/b8y82VjAgPUyOD2OShaKFBEgIFJEQyqO5qcPpt2qH2qF2VX1Ph9v3znSvddftPucbqnbt+Km9dzXjagBgvYKyzcYa+th6gW8cZhAmAEd8X097LBkXaePREyhDqF4hp9gb/qkbdr0XMmNZX82GXBHQiJVC7rFJ/2+qYDQxULD42fPtM8WHyocv9qpvZxt9arL/JByj0bE32/DTyIYHf262qPJCAwLWj2b3Jt8LVQfRCd5lJaTxjy3WNh3DNvpRAcBsfLrutt0IDaYezGHXpf5Op8+3kEC2TrR54fIMK+hoy8VZ52anxBqaRF2Xkau3nnhvFosYhNLzI63boQHBSRebpAJyLTojtHqyLaKQ8cSqHCnPnbICX+D5qdVV2kvWHv6h8Q5bhDqRFkvIy3+rxEr3kcrpShAkT8gIbHmR+SZDboXgXWLM/fup/l1K6IXXbQsAil9hNCBZHSajAoBMuSh44ZTpxv4tyQAc+TAnBQBHylHKG6ob3wBecwejBwBGFpcdXL8DJAGpjnLmcHgCny0AWMaMJcD80oyWFwDgWDLvOgCw2YPxZm1WQhnNTb6jo2odHZCBgI/c9y4AaAYR7z8JAKhzMYq9k4KZy30LWPrxBQOJJcLaB7Qa5To/LBIbAoCzU8Qi4BO5NWZUisOtMh975LCp6ACAakhw/767Myv+3Dh80w0AG0IY8jRvGGWIphlw4dTNWUZ61L++yXSk7txBmNv1UQA4u5sCxAsAcECnMwYASXoLH2zgCgKAt+G+L34Ovvx7vw5f/JM/AvjSP8MuZgDeKQDQNc2qijrjMhx1iMDVPtAdFQCUrBo84IK+Q+fStZQocywaT0/+JSBQoglEVJy3Uf9kSb/zAGDj0prB0oEfOMcKAFLAWQDAg937Ab79lQgAPv7Gn4Kv3f8g3NrdwRLgDWcAro5yAFDeSiXcZENRfzEAiIdRLdkAb2vgKFQKNrnqYfO5fOZLvBV2kOxwq5v9cy8AwJNp7wUAIB8S4DIABWioeHrugNlP61oHYHkrABAZK+QgoTg7DnECNQNVgvoJwij2te9FDAFAvC1mDGXP6j2fRz92YnTMgvBcAIDGhaM1VP5jADAtyaWMMCmL92RvUl2R72z2cnkp/R3/0XDK8vQ2SOX7yMn278rLHX4Q/97JXQAAK4uwjrYAmtjjRiac8m5lvY0ruPYLDbT3Uc8SACQaepml+SrB0tHXjF1hG7oq0ipmgZbv4ynArSeY8Y31R0bCPffv70oAkLM2yFYzLV3Wp86Zer5qMltjD1wFR0vds8kATJyUnoufmz6jAqTJMdOiPdV2vMhdALC+OKoMLwCacswZBYsyAPmZVRPoLGeAQOPOchfdOsvQWH8GCN11AKBxbomNt3PB2vmO7pemCT3uI4PS40E0ULGE0D3KO9DZW4wqTL7ud0Ds0Wa23vYl9O7l8hEHaJ3OnIItoDYb39YAYH1x7hikJYwm8LK2lwK//mpHXsQ3lh1Po1W3zQAkee8bqfEhId7hiToApccBJFSCgHPEiHT05jlvjO5H483gKPophkHsbGMZ8jaAJ87vOQwA9h0oobC0hrD2ZeQQJQ7Ati0t+qr0bL4ZAYDI35k8s01oMgANz5cS4BKuIHBDGYCXSwnw4W24/Pl/hK/87m/Al/78T+DoS1+EnYM9s8lm9el2tmsJgainr7/SZ2KZtTY9fKrrXTdEaGx46Ac+kHfqMWOaymJRbisAyOBfKftF8KtkLtkegGJKDH/VHptK1xhAjHvIcsBx7AzAtnzSgxllfjs4/ZKpjxmA6yM4xKyEy3BYDgF58XfBY2/6GXjBG98CX7vvfri9swMH6xVsMNNFyn8lK5P4xdlYlh9Zsx1UwFQaWUBAoUzPN8h6TDUWO8mkruuNa8R+VOH3tS0BZt9G1UVjiez+We1pzOM+nQzAEQWWSMT4mtmGfMywjE87iQTTOvWfQGeEysYBA8TibzIQR3jHyAP1PCSgst00snMaZgBmDp59fwQbeOlGMdrQnZptMMZyw6qnWHch345LBifcQZ7JUpNYDa76mtYGb8utQrch/c48A5B1QzJ49OE6GxB6l2oj4q2YmWftkZSE6qaIvjaLQ1oA0GWExXdlLWGCeun5oTKf0Xoi1wWAfJahTRmMymZ46Jar0LEL7HWFHauNK2QcSLs7DABa8DXWSMrmgdKQ5iM6MPXEWPZyFVcqpEY1vAPwr7ocI+Eex774CFm8bYX7mNfPWqz5x/rkLvyLq0HkuiIvaocMcMwXUI9KRhOSDNcGAIzzGuW30LWeqREwsQG4bhHT1bOmaZLq7eyiIUS43+8gBW0QbKsV1H6KMjMNakcJwMWTK05k31jjBJuAZeRiJAzasVd27HWWSQlws35nXQI8ySBLfQ7WIMyWAT6YmPTOISn5XXcGAOzBeMQp/TIlOXU1V2E538wAtkiHVj6MSV7gG42zGObu8+jQE7FvI4mKJf+kAeeK3WkCU/Yf9r8DuawzQ6bQlni1tCXmH5UAnxUAWMdS9Q2thWYEic48gYEM/BHXqQcAWjrZ+KL8ftYAYFsCu6X+3dqwz2Wg/0h/WIA4n2m1QyW+X8+2AffWE7i7b5gCgNnwdU3yjFFxmY5gvZaTMTdw5fAAnndwC3Y/80n47HveCd/6338O8Mw3YedwfwAA3mnyubChBXTqISLlOj5UpJbVURpczQCs/kNxElsAEHVXaAkSAyiVN6WpjbhH2eVkHZOT0ISk0xLgEQAoD+EMQCnfLc8sh4CsL8HmykMAr/hBeMFbfw4uf+/3we2HH4aDS7twWPrqMbhcMgCbDClZAvYPrY5DAJDLwkRSexoYm7pm9gAAIABJREFUXcwE/Iy+nvX3PLdJvRlaKgZ8fd/H5hCAVCBohLhnZBLKlwCAjU00k3WBbEdM5hvikXpEfAXARvZtLpsn0959AJDWUFtsCMtUHc+L2gtAe5nupw0A+vd7Wkp43wXQJqHQbPO5gnv1tbIazMv4+fzAA+dvuHiTn7eURapyE/+S3730/o432SPTUv0QwaE+V2fzjW/3f1P2cP5ElQ2t9JCYRW+yPjNzTNPCSDRY8F0kA7C7CanrUE1CU8auz5TlQ72aTKnOZ7SeeMq9/rSHqLQ3W30tGYFylbeXXttEnWDnWDVLOPQx6v9GfwaDu00JMD3b0lz7AdpscuJHlVWhmKW/jpMpkQrB0RCA1livZzx8dmJ7lcylLzHnDQDOLJTd6FH+NZJpDn2q/GMeGuPPaFfuGABYBaLsUA5/NEsnFeJwSqevSW8XfJ4BaNVwABdc01HyjMYAYCz5XeJe+DFnDvPIIZwBQmebAcjqYuoIeHXgga8lNDIK+S4DACkloGdRCBwaO3OZkoo0EQLLqYAzteEsWHd8lfMH6zf2feZrd1IA0Jx6YnLKW8egSxEXRLYOUjZ1fDp/gSdI8u+RFmTw7j4A0GcljFZwYiC7O5lM7XIKmuwuJQtQn24yWC4AQEuoFgDEFtphySw/RjKPAfot9MTdeukiADCTTJL1KQDImYAlA/Dq4T48tHcT1v/4d/CZX30n3PjAewGuPw07m4MOAHinidbqWz9zU/JLBVPlGAvN/uM6WFsCTO4YgX8FBMSDP1Yb2BwdUAag2aDHt0feDCVbccPp/AFAtZ24WiUTcPcyHMAlgPueD/Ca18ML3vAWWL/ilXDroQfg6NIlOMQegOSHrgp4WifhMxKYw9yGtysBXsAeac/OZGMu1+IUoPkegDJe4X/LMz6bvdElfMiJZLzfGQBwZp8kKJWgk/6nJZm3AJotwdyDGQSPgwzAmi0VfEORocqVrgTX+LmJrLG7QSG6+CdRHm3yxQK/nOS7d2F2IEBLj/5r5gF4q59lRUR3XwCAWwGAQ4Wb2I9Jj06t9BXdEUqAPVxWczppGHE3wTMrclfoAei5y/OP8FnlN263IPfU2XVUyux7fI4BROk9PoHDHmIokmPjc2npUvEOq75CspS1p9G2ih2lhCmmQ+LMeIAn4g9xg6ld/zgf0v1ctWQSLQoQiv+46ogAQd+vvvUP5vI/7ln97M8AHGVQEw8pJ9HmkQSjtJYCAHftQahAi7r6jgCAVkBsQJ2Z1lFKPRLgVAHACoEQoSvDK9HplE9VZhcAoAdwR8Fpvr5UVsnJ5E0G6dRhe84BgN6B3+YQEMrEHSvhkwEIc/f5JABgGXkrb9YYjoIH4qQYINtobeQfi87CjBnRuYE5KQZ5bgKARBIGAMsfzuNR2lvdX36/AAAtE10AgDN932bUmzu6+s0GkZmUkw4pTvYO2yIBAB+89Qwc/O1fw+fe/S7Y/8gHAW49MwEA5zpoOsfhBXb8SQDn7p0AgAXMCj0A1wUA5ey/4vhv4ACOjg44I1BKxOi9rYNfAgxzeIiGf3VU5wcAZuvCoN7uVTjcuQrw1Evgwde9BR75sZ+AvRe+EG7cfxWOdnc4A7DMdg3rjQ0A24Ck9gBkT4bOpJ9Z3cjDfQaI3GsDprYZP/OHyQr3LSLuNQCwteACVt0rAKBrH8LTsXKUZaBY4LUB3GUzjRmj9z27JlPVMwMAR/WzDSDTvG0OAFwAgKP0AQJwzhIAjABQXEJZY1v6q79TXKyalvSrxhQ+dmln6g8BaXSdAaA4Ag8bUKGpT1biaMzAtgAgvdPb3HjqfaUXy+XZA4ABRI0Zr1tmAEoJqc6DGhccoU+g8ls2wgot1gIEso2x8aP3D+ayjzpqCEA/ywHAYQVe7r/405YFAOz7oFkGoPMoH37XB7p3F/mb9aiyJcC45Lyg8lA5paSyQ9ldbQyFDinrGSNpuMhgBQA0gl4cd/2xgJ7W5Vs3wgXzFMEHhN0zLgGAqgRsCXMddZ1QdNDp73GIYDWULyZ19wVmkcB6lAGI6rj0HBkMoKyvTXOelWRYflgS+jjSCKWlNAKBgzaoGXkteQ/AgQMtLXGSS4ifsgDRcNSoRQE9YBK+DaS8BrDZIzSItd/q65iyw9fXrj7+BXaXeOoijuc3LqltAR/rcIj49d5QZlgAwGDyBiXAI83CLkQwkFUFOCLTHhiJfSmbGzhpkwj3pCXAKL88Nqfd6ofKJ9jJTBRDc1e20KzrBkss77R0shJLGYBKdyvv9hvNqOT1NJOyr297bOmGg3cwcsY9lxLgvgWdiIfspusC42yT5/XYrC73VI6Pd8ESHX+8Jy+96/j6U3ap2xJ94kzqAUj9/8rP1cM9eOj603D7ox+CT//qOwH+5iMAezdhpwBi9SdmxWiZ39IZDaxVx0rJx62tdOuPG6RSskrXrmBXMwAdAEiZBSRvJfvvkLP/yv9lvhQAKEDBFRBuhNQj0AUKYcNpxJ9t+W92DKMVBz//Vnfb771eomGvYL2+BPuY/fcwPPB9r4EHXvt6uPK93w+3n3gcnrm0C7C7pu6HXAsrAY+ugH9u6blntR+HwJNtN0PEMXs7XxdVgwn4iLZi43nuBvzL2o9YQMryND6bS4CDKVzM1k15EeuykQex7anlVT3WxR9kiC1QXjPvZjb5LGFBeL5qBkMYyuJgbjwSey3cKZ+bv831+lzZRE8yctOy+f4sYvzdkmzchF+0TP6GTAb9lRkAKHqbJHbBIlrtfBeWAM95KL+i0LYHAGpmXpDWoUNQOa/eZA+xiKOwvNoAgByEh4LZAADSCtJPto7bAYCs7gJPxJJdyzM+9q3WocNSSO+mJ6K3OVkPc9Gd5X/bEzBOmyihGidmWHugl8FNzgD0vReNxbEHdAgo5+TBTjbxH5wCkFLv8r/JAkTQjwBAzQTkbEMTw4pKphna9/Zl2Pd8zORgIv+hxVz7hNH9lIE6i2Fn8rvN95a/eoklMeNT/RyuSKiYlN2A7Wjg2IIvkGP18DveN6RwBIja15iS3QhSlUbIpsVAmTD1VglKq6oI37ie2FUYjy6yQSC9OQMA1UBadYBLbSJMcaAsCEgtBtVwrbGERn68u0ALI+FFEC4+hTOGByPAqThnkuGljpq+U+jmg0FPzZhhg4CduSQ6PC6tNCxuxhgRICyAaO5Ekem2Tc3L3yXHgHqH8XoODVbCbVs2rZ/1bLSnKPcFeeYmzr7fRkV42YjuLc2nckLHsFqO9auInM3Dxd+DB+j5s3UYtlOwvIM20DAjB48CkuyKLFAUmdWXoUTWptut8avm2DnZFPw1eioJ1FQxH3d95/fZQ2oak4qsQPOSQCQCgOQ4tIECvVnlsGq4IF92jpYbXGlIdQZ1PpHPWFXm76wTK4CE5W/JaGp1/5xy1VpMLlVdn144aJI9HwOePrD1+6M2mbhA82Ec8wpRzef1/p7d9Vw2mpw6roEz8U+SmkM8BKSI0f0H+/DI9afhmQ+9Fz73m++Gg499GGDvNuyWHoBir0zZoWQh9Y9y2pbwuY7ydBDuoFWJwLAe+lGuK/3vyiEgpgwYHRztA1gAUDrwo9jlAvwxAMgBgB5SkI3NAoB2ripTY8toZW/W2zV5f+M7tJIT/Ywj2CnHvcCll34fPP4jr4Pbr/wuuPqqV8Heww/DzR0+wRL1pdF2/Lt+YmwM9lSUM5cEUO1svEV2KP4w98xOOYUPsenZSHmvPwXYAsD8VE8E9yqxD2IPyCqovm0yCGIP7+EhaeNTOzP+bUgUlI9NKBAQf6gBJsqL/Ncel45tA2U79Tm892p7RxO/cg8yB4yZG1zWZwV/WwrQu3P/rX4aBmj1ff19dIgZl6SN6TfWgXSqqdFwJiEgo6zzubJS+bsIALQr0KPCiD3tOlla9GnQoVh9iQAexhp22ZeI67+mQ20qD6axPBevjhU/2S5OrLE08NatxCelJYXVSf2y/+oJV57y5bvoWcYef9FshYXavkecausYX+XrGSSViUFrXHoUF/tCesj3X2T7L9dXW0hvEZrWhCz8mG1oXde4SNQCpLxHNvbpirIAgsNQi4n6eX1bC8QaLmvi1Bp3SjVgx88eVwwd0anRvQyncGBGJoNnDQAuCR+8DhCbo/NSoJjWgQ5043WeHDI5Sv7ClX34HX/V1UGY8mlelisxETt/+o0Ydzpxje5EuI6BY+NCOQSW2ZpftcIMRKk9F4WEb6zOUXbKpi11kD1ZeqQHhGw/AyL8GAD0FBBE3AoWv6XOSdSl3NkDAEV+yZ/QpquNCm4Uq3dS3Km2RVBdybR/mt3hGRkoG2TYU2zKULoZorKdzKcayrqSAen3MOmNY0a/3n3DDD9kpAWWqjsoVqizQR/7e02pl0coQGLXve9GxNkJ7aOByOm7ZH59J1kbx/ZoXEeRUqgPAIbLq0dklCdLoALg+VxUl1gdlQCAx17Dk92YnVJdKY4eDetf7lmlJT1sINgCdG1kWJr2lHUdf6VgdSDEMTEOR9X1Hmgm5aslr7LyQn+hfpsBqBsw/toldD0p/7YO45K3yjVljissuRz99OVnm3ed1bW2xOOs3nFWzyX7bHu4sePAK4La9eiQNxHXcP/BHjx+42n4+vv+HD7zW++Go49/DFa3bxEAiPxLJwZXbufd77MDADO9KZ+xRa26jwZY7T3qhQIA7hqnkQ4BQQcSHUk6GbcCgFj6azIAi7w6gKcdT14xoDTyd2SSYHX2qOQnS5Wby3cEAHcvXYHb6/vh8r/+QXj8R18Pm1d9N8BLXgJ7Dz2IJwCjzFb/UiAmmoXMxc5J9KXMDPVXPfxhLPlI+UEJFM1uVIJAOhZBRA7ufAboXLJ8OV97PQbg5qfZIJwAgLNT3Ef6JdP33p8e605rr3qUIHpN9HM3ivKxxZza8YqVky8cbwEoQtaf+t9RVvqVCYnV9uvYYU27HgUImFUEUWzW8+9mFPFgDqmy8fOykmf7Fj9e5oC5GNIjEj/SqdfZdE75+6pvmoMvFPMY2+d2/nHDP24gGUKQfXC0k1Ot2e9jmuklqo+XkLwCgAP2QUAqrI273LxIpNFl0gVAOQUAB4PdGgDkuFfjK6+/RbbrGGOZs6w1/4/2vPrNVt/xGrjrif42qrIAoNBb9YulpDzPAoAiEuxLiE9hmEaf4G1+qzK9bUe/wsiby7w0Ls4UAJzYR98CI7NvSzj1+IJtE+CWPUV1/KoQkYdXPZC7HwA0LLECOODddZyWBKl8Cc1NMwjpT8PkRwUA3NHmk2ggNOm+OOPFQWp3SC8AQKTlBQA4LvFFfXlc50Ws0knun6mEDADEhQ1ZgP3nxNGRHLY7RPKE6OALiJe+IenBFd8XT9Fqx9NXwBcAIGVQpGso7HeOACDv9SJr2IxJ4S/d+GHuuQAAEzEaB7EzDXHW3z9XAMCy1XltnwDAL//F/4TP/ta7AT71ibsAAAzSjw4gIgVs4i3/ZABgyQCUXeMSTHA2oACAxf5hGTQBoeXwjwIC6qEgssFK44gZS3nJfRkTja/ajxDoeL5tgQ2fh9ZLdNeAM5ODCCAV/7McALJ/6QG48sofgid+/A1w5Qf+Ddx6wZNw64FrcHtnjRUrdB/5maHLVKOLY4AiG7jix540vLA6ltxf/8Qqn7yedTN6IShz/gBghM+V3+P6oZ3hfBha7+0BQJcAYMCBvh4dg9LLjsnoPf0CALQZgIQHXACA1RdXt8lJs5WLswEAxbm0mdACEJV2EQoAopasgM1YHwuQlwGGMmen3bCCkAFAkXe0VfzjwBHSB6K3Kw3PAwBkmiCVjMGM4B/al60BQDt5OgBKcDTpV7gcAJR1VvvL9Xk8Lll/WlcB0/KYLgcAPcCs14gdo7HLQVas0y8AwOp5qCTyb/cGAKhpwEV8JTisgB+X9cnfLi8tAQAl5bTut4mTVnrYHBUA0GsEcWrs80Uo7mwGYOlxUBpqqgNgewja/TtRjtR6RhXsaWYAyjB8r4G+61NdLDN+mwFYxpYBFOKElllICafQIC8BHo/Bfjvr2RefdC9nALY7ZFpiVPPzJxHGiQHAmu7drhHxrHfCRynHGVQ6Gv7xAUB2BiRDVYQrCYqqUcbpcVOBtFXBch49zSt7AKDIpsoaGentSoCzEkK/Spp+TrOy2QmUQUXlkxZYtsCf1X1U+k8r7nRiZQLhb6svT5IBKOazB9LPA8i4Y7zN2qL+u8gA3IZkp3qtz9D3PgJxRvEdqAS49Hp7YH8PnrjxNHzxf/0hfO633wPwmU/Car+UAB/kp47ekQxAy7tcPmH0rg8glgKAJdONMiMloxwzzfAUYDkAhE4Gpr9VS+cAYBhjBWaKfjDefLO6PgvAtmKp70xBmurNmby8lnXKm9d8KemnFRyU5115EHa+6zXw1GvfDPe/+ofgxmNPwM1r93EGoBx2wnoKg7mO/sAe2X6DBi+tNvHkuaEjANAH1MIbEoSPg3GiVuhBmkjfaWcAVtY1wa/3AXTcFwBgyPAzfEVrN2R/XuI+H2S+odhm4f5ZBiBB/OFJE59U2SzC6xZwyE3Bcz0DUMEekeARD4TkGtzAMYszPIRA/D2rvzkj1Pj8bQ/MBSCgWdp4f+MvcsWYzrbVFvI46SnrrNF5AYAsmyX+t36z9Z9FA6ut0+2bWu3IG3Qy6xhzVSCt9rKj2dfr2T+nz+g7rcxyV1I2uZzhwIJmD51QADCztepLC4/yy0IFDGMbksgl9tlWVpg7TicDMNclOPvJKdj9O+03vfjCt8Bb9iyhY6sbkTtOGwB8/tvf6yTKp+wfpwRYs5YK8Ff0jc8OiWnz2Y6POng0HulHYIhSnC8MQC1EVu7T5pX0FK8Ezx4A9A6YBMb54lPPK9sTz9b5y/jl3iKgruNeJwOrsiM6+FovbhXRMmbUwD69vltjb5w4AXt5UAoA0uxQwBc7DIniOUkGHw6zL7xTGnFG6+i6ESCGCmj4etsDTRUDgX8mCLI23dZQ4i2euMKP1kA4VebooUe/9+aI9mmwgJ0OfuZxngDWqXVGb7YY1ep4Q+R7YLbOid+V4/5/RYvU1pknYM7ZmBd8PwIA1ajTvDAfuhIwD7ybU5kn7O8Av6YUpQUAxaXIQUDb2oB5P+jv0y0BFgL3Jjle23LXBQB4IvW8gMNP95ImI2uoYDewWh3C+ugIdjcreHBvDx59+mvwD7/76/CVP/sDgM/8Paz392DHAoC5O3vsSXgH1Pe8NOEAP/80AMDdcvZxPSyEzEhpfVKCu5L5x//LycB4IIjqVD/RURNt9l4kQ6HjQEiARBmNwcax/+Y3Qe1YxsFm+TYCgIewA0dXHgB4+Q/CS9/6NoDv+m7Ye/KpPgA4sPHkPoRG866H9Alth7NpHQ+ybDBbOtWAd0wbelrbA7Z9S2/t0Zt0B8hlI2wDuEiT+LfX1VFztyVV/fFNKVArZAbiO8xcJXt7/FVuMwALv+K4+aFeP/BcXYLATPUEKjTlezp6BwAwfwxPEET+b+OL2Yicv1lhCRL/2JPLgQnJg8f+M/GoixA3viQzluBTy17VQ7P3bzPXba8V3neb1DX5RSS4/1TJzhvx5/QUYLuBU0vCM5m1ktp3Klvpb6VUXFi7faLr7OXdyscSALBZzxIfDQg0LwHutaZQk13BPLSFmrFnexvqajaQaF1g8u/LRl3Ijy/jx8xI6rdmZcLivWIndHXkhOliByhSkx6rjqs4K3cEAEquvMvsaxL3zRkHKQAosqdvj/GA5/bxqfYo/RPlfDIAcH6IyPb2weoek+GJpCn+ofRzplWcHTI5m//qrABA6fUnPQBxWtWZUlgg3T0y+iNmzEmKrxhJaywJGKGdaxGRKE7bA4DewHnj5VNk9URb06SxEQLzhALoSRYBzxn7bjiHmxeav7cti4mmXiE6dRoAwLj7sMQg0TsGV3bLKGgktUcOa17KiFTBfTYAgD0d43kzp+GsxE57LJrgyEm1N0C+xOXsAUBS0EqByCptz6x4tb9DjL996mIH2wVMJPltD1PvcPgMN92cIP01Cn6WSM/Jr8kzbDN3geZFBsfO0VPvuACgkLY+GR9LTofNAJQZi96wb6+ZzV3M/ywyAI+/BmWuFwDgSQLc49P+uHc2AGDrU+qj2VfYOTqCS4cAz9vbg+d/7V/gE7/9a/D1v/wjgM9/CtYHe7CzOWAN1xb8nVRDHB8APG4J8CXM/qu94tC5p97HCgCyD1UyAjcHgL1oUhBQAIzeatUc9s4FpYm3OW2wCwDa2y3F2+Cx9c/0EzzcqRwCcukawMu+H779zT8Ll77vB+D2k0/BjfuvYgZgIQTZbdJc6rPmU5iVAJ8IQEg2eOMoNENLHEjxPUdOm6XJTNJGHH5cAJCtwmyIzSEEklEhQW7/QAAM/mYJcvcUACiWlNejyuSAiNWZstcoVQQwsYDCNiXWyDmImOnzZwHnSD5R3ppDQcb8+VwDAGNFxsw3nsUXKeBjnLjYwiHPCDUbUzN1Er6nQ3SSGCDEnXWewSe3AOa5AIDd+Ne4GbJFU5OWVP957ar+hVJEZu4BOv3UetzR2fGnLMelsdnlYqmbMwvICPIJwKRVYwmwS0hBxLHPlZJfIqXL+UaHzunEACAplS5Xbg8ABl5NH63XXACAfAgIsUUx3GQwPFtHs6As5A+ZkKdoKZo3ONQTULMARYsYA+U4asEhIFSTmzIQOYrWACYpms9SANBDPgl9WDFGwPUCAPSsNDPQxP8Z+Fc+Y+NplNBZA4AuoKnVUTQACxKJBBNnaKmRD6FbvrGn6lmXd5FfUQenemIGAIps00gUADwqGTHOkM1crUUj3PqiuxIArP6LGvsIAuI3Aeg7HwBwtm79AOoCAGzXcGsGvsM3tADgaP0LeH0IO5sjuHK4gufdvg3XvvR5+LvfeDdcf+8fA3z5C7BzsAfrIQA4yn+eT35rAJD1ad3gDAq5PQQk9gBUALAAgeJf1cRvzgIkH6qEA9wPkLcVpITMB4JKY52P2ATTs6mOXR38FgCUIKa3bjbAmEI8enqzgCGrXThc3wfw4u+BF77p38J9P/TDcPupp+D6MQHA5tAkk0EknLENKGI5htzOfpZDee4cABzrv9EptjSWUUB3GgDgeHyRdrLBJbQZAawZdzSHmMwQpLsiA9B6Qtlp2R0bVit0zPcOsOC1NXb6AgC0PG+yteaq/NSvkFWzGYDb6pJZfCEZZengXYUX8WAEAGk8Iz0c5TsB+0IVltc4HEFUHvXfSv6zeO9yRoDMxx4CUUdph3TSDMAJACjxj7UFtgbSVv8RgBnhUNXChcyYwDosmvP0GU1PAEBSgVpBpNgMfS6HsCr43FYiVP7BAfZ1ek0I6mYAOguICVLqLQQuXZCgEVtoRD53JfFTCa4SqWNqwEUvC2cHADJfNMfI+0nM9EWTARhPdV1yCrC4eKRsmJG4jxYSQHpEcU6OdzqCQ1cuNgxOpwDzpMxOdNwJETExITwzolc4TQZMLadk0IBQvcrEoww12h2xOXnlZjl1UEuPqzg0dtqkxPJ3bQkwK1j+3hZME111rFHB4bWWft0d0X4QbF0PpLGMk5ek7QFRVS/+YgOy8qxSAmwBIVfSPBXA9oJpj7/ZM09UAhyzrYyyNrQeCeHU/8TxRQcQTTFbgjF/90qA5QnNjquhR3aKr3e4yzH1mcLxPGmDmKyzQX2CHBI0WzO9wZsal6nCnMmniOsjo7MS/uYU+o1btEEQlKXjLx7//MJxDwwau4bYvgSYXTb3EicvC6rv0/ITZkfvQHCoaPRDDWBFV9SA1roI3lmIO35ZC4NItZ72qvPvCaBsUgyW4eQZgP0Mcp/pPeeF87hiFkCcZEx9q3P8p2rFAK0+Sgf6IJ7PSKuSXO8cbeDSwQYeLgDg5z8DH/21X4ZbH/hTgK//C+wcWgBQti7VRY7wlujVZTOQEhKjnehYXv5ZFli5Ki0sEZH7uGSk9o3ZgdX6EvoopQy4jF0yAbGUFTNeD9n/KXa6nAh86DMAeYffA31KWw0Qlf6eFt6jqCUsjTPf07nhiNSkr6t9X8nkLj+lx2MNcnbuB3jRd8IL3/Bv4dqP/TjcRADwPrhVMgDX5G+WsvDys5m0+WgA56yEcMAM3p4GSol/lwoK07GWNIri1QxA+qQNxtwn7LPnQxzYPeHQSQA8LAGu1S7524U2dvo1oLIfduJNucRe2gCASKKBBRktUM24Xybt7VVLSoClZJXXosnGHeiIeKBGnafMVwy5bnVSix770yGuXBIcwNbUBv80ECFev1UGIPJP9uNW3M8mICLjEuAcjGlkqkei4xq46l/R0MUHi7/3RudWr8aIOY+eBgBI0+zxYeQmT5Soi6zGsrGliqixNZxYoNaYsr1cfaGR7TpCQ9/o3+FXRjwWlQBbG+QmZD1zkl/1p+lvOq9A1yZzVWVMeAf/kctoe2DRFOCqMpQDgLXsN/Ch6kwdP1YDuRJ7tzLEJZzxWQ8v4Wz7PBOPWqSJp+ZNvfcjehp4CgBu1QNQAiZdsPwQNLW8E3w5GbbYXOIdpJNZ7Fq5wXfOMhinAODD/832AGxNpjfg2qPGMyCLnAEAD7mHluwoaTFIpiiUUSqD4FDaY8gVYqR77DiE7Ib83KNCmSXXyWpc6ylukrY7AIjk1B3NxJK5+f8rjzXOBAGA3v8wjfIT87ammmGau1HuVrnh75UwfsatQzZwIFixW1GzY9VX6Ducg8VNsmWs5X81uMsEuCfY8vkSAHDkwswOFYn8khks0eBxRkjZCcC43Eewb265vkePtMfHAuCnPi84x5Z/RLnWOVRbEA2bKDXJAjYK1Gl1C2bNVp71w6oEsxa013epLWceT2Wi5X98gluYPgdlwMJgA6wJV0e8qQbT0sLImskAlU0VNDgy+AhOMj+28+vTOgUARfGaoD17pu5uaq+pKiOsC0k+lAq+By2Ny7WJCARrz0j2cxmecokKlHeoBuw2ktGZfNM1j4IXAAAgAElEQVRwO0+YBMAy+yWScFbXNFmcSU9Rx50GwUXeMYcEZmO0juCiOUx2TJqWIWQp2V7qapBjTP8KAHh5s4FHbt2C1cc+An/zP34FNh//MMA3vwKXDvdhVTIArZIz9Qt2bbe3aHPb29KkZ5HocwX0aCMSD/vAkt9d+g4BwvJ/6QVI34lvhpJYHHgsjS5AIB0Cok50aehsS3ZldNwcvm5FeFuV5UiWwFPtRykF1vXQOZNByXWkZOeMLSjpZz3BEGtELj8A8MiL4PHXvQUeedNPwe0XvQievnoFbuys8dCe8sRSFl5+NoU+AxseN4gJv83m0l/J0f5EnDs5/Grjmtmb04DlO3m+8LA+s1Gm24E/dUr5GhB397d4/WF9OX0al5nVaZU1KSFPlAdtYPqxNfo66H9fsSLyoA+PAOIsw2MWoGnbINIksQegz8C02X+s08j5MSJj55vpl57+IJ4qgHy+6dNZ46H4VQ50VnAUlLb87K2nHlJg5cxZoL69FQDFsP0MAGxtd5S/gTO9hZ8tM7D87qhncCIFBGf2gza+RkcRzUuALW1Fzxt5cPjVeDxT+xgrRti/7Zn8qD/IfkUA0IxVOMOdPaUgnfiwznoh/t73MpsWY+puVD2t61gOG6vpUsNMuWpZ+WZ7lwVbtQdclhlsW9i0gup9cZqn1WfCi3SYmkiC1TXR+/F23wKpeiXxiLiRUrZdS4I5C7IqjBAf+EMnc88gaoNuCTBP0I06zehrnlg/yBPwlEZlXvNRRuOlfmpr/7xOhTKAwQtmGf6rRxoAcGQw9ZQ5dUHM4AUAXK3gkG0vlnyGLJXRzkUFAJl7MrZ1Dinh6sEV0dEJgixUyu2VKnXvwM0AHKvw+HfUVrYPS5YiZFasKXJnQ9xJeUYAkH/suquw+h2jyFo+QBLnYWDFMSPTULwqJHpyVM4xgLd/48ycgKVclLhy/Y9mAOBM+GYBvF3h6WhrpquOd5zBtWQPrzd3mdlIXi3guhVZuxd7AJAzYsyaymh0Z0vNPhlY7yRY2Y0do4Kqa8ZEGSwZAJgNv+OcZBkMCx23zAFBiRowXZS0KX9G/RDGK/04SA5LRoHOXWVTJ1QCHHF0lnBEFwAk6dc8qlSF6KEf6cYB9x5z5jUE2wPNxL1I4iZRnP+ohI4yMGYg4ohOM/0xurdmSE4yFJes01ldswgANIsU6VHYV/qppWMc7cCycHjrnts/erY/NMkDT157a7PqDWcAHsCjt27CwQfeBx//jffA0ac+BjvPfB17AJ4fANhY70FwSw5XzZitrVYI5NvZucwZcJT9VwBBygIUX4UyD6kkt4CABfgrzqU9BKSA5f6wjqrvuXR4RHMjmbV5tVRs+I1B1Yp9vJed5AkgLBs00qql3IUA4POegsde+2Z4/pveCvvf/hL41rWrcHN3B45KBmABABEgXsEG7UuuhdCinPAQEHxGxwhkQIz6T3y6ZGSRAAA2GVaNbTNysdDuLdc1zI89IxcqWLpWe3D/Bvlu8IP00J/GH4s952I54vD7+SEgUwDQgJQYObhDQKzOyk7Mtu2tjLfkZKLj9ziqaPwjAKBYd70se05JYJhxQ6K9J/7RyH8SwMpoiDCA8XzdYaMuIYEe4w8BIZvif5hWmFbO0NCQv2f08d9LHGffXEdgDwDJyruTVy0CAAdDbGbvEI94COeE9hXy0ijBvbqJn+hQvt4Pkt0AnOXKmNHnsqcCAIhLaA6pEr/YLifxywkAQN4kFz+aAECVN5pbPkean0UurHWle3IA0MyA7djoHXo19QysQt3wm4yVxxsO8HNIVJPRL5sxxCOqVvntDNxKGXQli11/l/08i5yYsqPLEnB8lNGX8SGJQ59H6yFn26kBnX6riPl9/M5hyfVYfnDkdwoA1Pl7JRHXhww0M4khmihGJzy4gLlhEliQSlu889+uhQrk8QFAkVZyuBWlPzsAUHhDaWN6I/KXLUAXaja7qdtMpQQAlDXLfO82AFThQCpfAIDR5h1DNfRvifSfnfK17cuXA4A2suFiO2SFfpbfeQCA/RL2OWXuCgBQxJRNhhUvDpGtFwF3AwCoNo0P/TD2cxtAbXwqmWxOXACAc07uX3HeAKB3rVpb7/2H9tT0YH3qRC0AuLvZYKbfYzdvwjf/9E/gM7/1awD/9Pewe+tpWO3fBjg6NDl/1pfIddky1zQ404sWKTqaTI9qiAlwsdUW6/UlagOyppLfAvghAAgEAMLa9giUgKIAgAVYOSQAkE/olRIf9KcoejIBFNOlAjI9n4s+l8ClBQC9x3saACBSqQBB5WHrNRzsXgV48El46EffAI++6adh78UvhpsPPQA3L+8iAFh+KFATeuUOPj73AgAccG481ToNoYaZMLR2nVeUNkN3OQA4879slmKZaw4A5uBfoQo9X/hTYyehmO2BNtDyupnHGYBt3JnHWXMAsBf5JaMJJ9xm460ZgN3JTECooJaOnQF4jgCgWA45nGFkOk4fADTCaE+1Zf9zBIYQ6e36hMU4JwDQ0s+DbrTfNdognmYAGtCK5DsCgJ5f22xtBvoqff1qu4xwB5DxdVsBgO0p3HX2WaZn06/QrGeoDqLRGGzHJCqUT6nU1WZv8h2sYGSzvGZEM6GmJa7PWgCQ13eYAXheACCsQEuAfZvOqCBaAJBLBtjzq9VsfGGT/de1QMSMCliMOGEEAEbALKrbYHBqv51olMWkhnEMMgDpTV5J9gJkcZQahyns6p5GBmBUkpYicXxNz8ULANAxUB5ajEz6+Lu7CwAk/kUO5on6bAo/ewGsREKsBOWhg8kArL00eoFn7hieNwA4W+lW3jMQwGgKS2zT3wmNLAaslDE5SZypwzq1DMDqtXp3K6rv2DO04/fQx5wNOUygGzbRv8gAnPHfHQUAq433o3IcbzJgIw8Lf+vdqlGsG12+P2Rnszjkl44OYXd/Dx67eQO+/Ae/D1/4/d8E+OI/wKXDG3C0dxtgwwAgZzPKPnzcsJjRsv1+HKzq9VHmRUPyZqMBAOshIHw656qAfKUMc4ey/aTsl0qASyYgZwFyphQCc1wCvFqVHoCcCSh+iMkAJEDQau0CChbgcAz+YdYGP4ecfsk8bCl0UgBQ0KPVhjdlCwC4cwXg/sfh2o+9ER59w1vh8DteCrcefghuXbkEB1yzjoEaJvlIT8XO6t3lAKBtMZX7bVkQflyvJPrYdwIAHDWdb0uAzyIDUDgjizBixprXZT6DrAUAjf/vMmr0TREAtP4MxQJLdIzGPyT/WVVZ+xxMvwis0nKOp8qIs8SOj65xAKA4NaGNTC6p7COFRdqw/pJ77oUMQBmrgMc9epG8LygBHhiuxvIEerVbYH1+Iy7LbJkuiq8UmQMYrsULvkCfhW8KIFXksW6PPIlXDFDVs98uXslAMQsCOgBQnGJ6mYxX/hDLynVW6Sq5nrspAKjcQr8p/WXcViR0Y9TfR3Sza8djdp+zHuFxOFETnSK4jvkSxRgzALVaRN5kW6TVntmSVTnaHOLhO5pGCiYZ6PFQtkiz+IjzyQA0oxg2GZzLT5MB2AJEdsoLS4CxdKI0UKZDH7xIRlfck3QnHFqhTBccTenrExRKPHWW1f5AxRkjW0vSxCDqfPuF1kHhIYPHxu/CzomLEADA2oOwyhqNxSmZZDYSqO/gu4lq5Z6YgurWtwIEA5PbywDslIssBQBpPi3iP1mo5usm4zCUSGdO2TbvsKvbC2vq88wOVtscnPk+OhzbbKEuGHhMYW5c8sBv0yax4Z0xAzDFr135Okug4xdjhMwAo0GqRqAzb1cCXO2VOrOt8s7c077DMiP3STMAh8ZJDNikJKnNqPTziaW3BABawzCWkNMCAHNaHoE784Azauy1jd9hvnw2AIB0yHxvDdoAdl5SNuPa7b7PyhDd+oyiNTwEaosS4OQEvPzx1on1VyjArf4C8bA2Uy5zKr5J+Wxncwi7B/twZf8AHr1xHb74u78NX/zj30EAcHXzadhdr2BzWLLgZNbWZtH6HN/GLNU9PStEvf00qCod1/hwDyz110M+Su8/AfskC7D8T/eTv0L6qAT10gOQMwD54C70KCIAyAEXlXm3JcIx47859GNyauCJAUDJOTkivVeA0P1L9wNcfQSuvPq18NRbfg6OXvZyuP68a3Dz6iU44BYJpfwZDw45Oh4AKBvVM96goKejHRMfa9sS4OzJ/nXRq+nbj7nmSJ5VFHxPR7BcjpoYjeiTPTcCOnHM7Snh/oqZfo09AGsCRrZW5bOkB5R17S1pCh+0PQA5PqlMElbPNBg3Gq/GAC0AGBfD+kvtIQJKncQWhUC/9deiR9dyUMb7cYQ2K0roqXqhHZd/S+DnrMeXCa7qqeSdiIv8XcmAPp8SYLsm0gKmJ5ty6GJ1j4M/Oc9QDfLRAIBZC5Zc4DNfAtWDWRNNFKB2QeF1yTR9DBnjGbf6iZ4Vs9XzKMb0mZ+CztEPxboRoHN99WgEbQYgftpVvWMAEFOkXYaw6IjGx+YPsAKYWVzGziPLx+E2GFiXhLJsfFyYgju9Hm/TE5Dt+wXPEbygyh7b9W0P6Wv0DQp03/9u4umoPyYbLGdTAmxW724GAAttDt2Okopjj+QFwPJGkf+qqK83WCT+eofLIPGcPPBf9JkakLKo1FP1BkFafbKvc587TBwhmQv1EBL+MDGyjTowfUPw1GQRZu4RYEduT3nGWYeebM2YzwoA5LUZ9odaQMALAHDswEaubZtcz0IU//wpAGh4T+4kPustpp6EGd3F1qEMc609AA3HN7tg3gGMoziPDEBrhPqmnUYaM+JagNdpy2aHFWkqafQ1A/DuAQDR/popxJ6hmfMga3gBAC5QkCe85E4CgN0MkKGKMj4FtqulQ7XEYcRvjwjiEj9PAMDywaUCAO7vwZW9fXjsxnX4/G//BvzzH/8uwL98CtZ7z2D+10YyALmBgTqM/O7tVKi19kPnXi+0QuKsOR7mYUsACeQrwB/5RVISvN65hAeAbPhgEKRIyfrD+3XDku5SAHCUAUilvHbn/u4FAGmuBQBcw/5uAQAfhav/RgHAGw8/CDcu78D+Dm1er47K8R/lfymRbgUJV6WTAXg3AIDLRN+Cdq2ttPajfV7G+Po85MM19+hNBkNq3wTwyeNIfpfNpFw1AzTOAgCMNsr6O7Fk1VtrPzcEAHm+MQjvESHzByQeItrFNTWAmfOVNHhPqZ0FuhzoG/xskF+UL2IZ38gHcnRAPMNXlDTgCDFs0LH6Z5vh499+rwGAI3AI+TIckrNthVBcGwLY9FM5IMLzjI1ADe2TOCACgCJLEpuOAEDSC6pvylujPMx0B+E5AmKqLpIZ0BkG+ewoVXZpB+lcvnR8eZwyU31zANCO3WMljHC4yTFck8hxJqUW79C1oA1tBiV4AhT/GdtQWzdwhSVnAMptNfaTHu9sK84GAOzblwsA0NFmuwxAdLRdTwnjrHdo3gKAfOGKhVNSaA3KbAHAmMHYBx7sAIQxs4yUmM03ckbOHgAsO4Txp1L1CKBkUIqokUPkc5gvAMDlzqS4EtaczWJR4aRnSwagAwxjOn2LX1fiKp2WHDpRQEA1tNahjO6cl1opATYrdJcDgLLD3+PC6LA4h40d4N69WUmiBfjRdbvLMgAvAMCLDEDh5wwAnDrwqCAESogAIFnC8i3KnXFGyyFlmAF4eACXD/bh6u09eOzGM/CpX3s3fOV//QHAVz8H6/3rdyEAKPAjzqqe+ks0LJNifwUjKwMErj0ASKf/ls3COQBY6jhq65VwCMg9AwDyRvG6AICXrgFcUQAQXvZyuPH8B+H6FQMAljkjz+xQ/8Dk514BAHs+cAygtUeTTjbdIHMAe/SIyAOid9oWHbnf2rS4CY+7VwDA6nNLFQi7JAJY2dnbUNr6888eAFAWsfd/1fh8umgfApwDgEk0NAj6fAJP+16Nl6IXSu+52zIA25LaQI8GAPTfzzLsPIWoZYoHACNAb4EsBXxEPuLSbAsAtv5ACwDWMScVBY22MgCg2DidczmdnuLnnBvaDMAW+gzRY+bQ8BhmYG5mg7YFALFigYckvGM3DPD8LzfjXrTB/kY9dKquMFe0kA0o09UNWWkvUjYOS6sQ5hUGUfG90lJE1sWVCFkQlUZ9OhmA/Tk+6wHAh//bXzmZEAAtV8na0wOXol5kRYbEqOyiEgDI5auh3DQDUtilreizN/6Czuv/1ODUm1YFAJmN+7alZgnQE4i5CPBQcfeA4uBhMoy6U7bg2iICXHIiYyjAkZsVKwxRu+iURn41zXMFMKimd3KK2eyYaCkxrM+zpQ6JMmtLgNV5RgrzeGRH4CQFVLhbUNbLMEE8JTnjs5FKS9wJ99HweWYoDR24VjamqE93pLcZbLIDFse7bQbgCAAUhyjjdH0vt3lfIA49Y9u7dUkJsG2yjVIeHnaSDEAKdKIG6meUiz6z2rLhtwiyGgOIenVScBgzot38cACUIaS06HM0Od/mCZnuMeNp/W49BThnY+oh5A76MmCOOl6I1rQ/9SS8gQGXcp3Ue8IarWlDxD7/8SnxC3i7N8Im4zvYM1odwzGjU3O31BVLLh9toFmbkD0LbVVn6er1poRBZllnm/KbfZP6FsIrPgOQaId+RQoAbhAAvHJwAPfdug2P33gGPvnud8FX/vSPAL7xBVjv3YCd1dE5ZgBaiohbzk4zO8+15x9DnQLwE/hCGVgFFFyvqdRXMgAJAKTDQMQR1wCorOwhHgRSMgA1S6vt8UcAIPtOuJb+lGBtUs4ejnwvGzWTEmBMskgZlbXYdIfXh27rUgK8cx/AfY/DlVf/BDz15p8DeOlLEQAsGYAHu2vY1GqTwjf9DECyfyqbaOnk0DlTS9XTsA2/h3lW+TKfu6bvaf5oyewUnaHBXk8+W+pGZWayRvgrnQ+ve+IhybJIJqq9xNu/YD/Nn5U+WzhxdyoDkGxjW6JoM6Zd/MMEsNQVf0BoYwFAXME676Yuz6hPuxpWR7BUZxmAyXopENspA87kjHtoeQmzAIJdOOIV/0OZV7McKqGZxA/1SandHZcEz8ynPY2cHm9fQvLts866CooSxJYYWXMN8RV9EOkS+YUunTgfDgC046epofodPMM/PQcA/STFPslEvEBHekgLIaEqixVZlLrhzSvREDN6R5iuX6kptKz80+gvqT4SPpQ2Iap5jxKP29EkyJflVb8+IlcjazBZy4aXjipgZjPj7GWS0VfXOACALnkKGUJhQXlOf8SFwW2CFEmmZABalUHPkMPFNpyZip4Z8TqDgBbQI/8xbr4pHZFn6niXCZrdZC5j8vhL+4yTAoAK0Gbjm6+3btK19+P8hwpN0JX+e1aPvOP97fpWBVQcHJ9RVpmi9juzAk/fouDy/8hOCGqx2gxjaTJeTAq8XSx/+Ed9mmzJ8LBszz4xhn3GEBCqAm5cQpTekabA83zdDUqPPHshODwhQhID464yWkWMQG9JKwA45y0qaIo7Ojweb7opiovmvHxCgNtARZgUXrzKPUeagS8TXrzdOdx8n3n9aQOAs5FFQC1e3xq8YFKTADkakdEYZg7vbPxzANg/wSpkaeBur7BZNmpA7K6Tf15UkJZeQoceK9dSt+YC4xgYB7OadceDXn/NTqHNTrGuwQ4qv0CvsAAewK+ubL2qBfh1fOIU2UfaBF/d2ZMr/NyIXnwaKNNs3IIyyynUt4+ys6pu5U0akX0vvyZgNpNS94sVBvYszDk53RBxamHQ16g4Q+4UxWTtBiUeNKe4CTWTOEM/BgxGYULi4i5/AV45NgTb8XuQ3WMEOE5XhPI+cuhKtpmlkZcpBLTqDzc4D469BOFCu9LLzWbels/LIWWlzLP0ALy6vw8P7O3DlS98Hv7lD34LvvRnfwjwzS/Beu867CBGvKmZAOqHKG9amd+2h1jMwPD2JDrY4t/wibYo3iLj9D+tp26rof+G/f/WcIS/78IRH1QmPQCJR1jq7CEeq+Kol0NAjL+14UM+ZGOSmyjRgSCUKVjoVUtg6/PUGhCywf+QAD3/IWN1gwqLUtlCIgodDnbvA3jgSXjox98Mj7zuzbB5yUvhxkMPwI1La1hd3oUNpmWVYLDQpQCAAwc6eEVRv/sN5Xagsw3QPmXom9b+W/mQvo5R6pYTrG7Yms0zGROxXx++oR65fnW9zfBBcWr7pgDv8rnEK9vIZeGzTO+uDICxIGDZsBMOn/rupgS4WvDKAEJLzxGqbyTeUV6l981mab1NI5cj4+40sOdgfXuQa0wFaqk1KwGOKxL1Zds/1wOA3r+c0WKpfOoabNtD274BM6SiA+YmSC0cnPRuoyoRIDAbMrg4wbua8EeyYp5I6SEZ/Qgmi9/i1dZ+Uw9D9mI6cxcNFPWH9KVF68YvqfqSiF/1p9yrMY3oV84AFH859e891xtLxwlFbtWN92LdM3qG1ecW/8g1E9sp/0R3qcb3rB9sv8XQPo0HIHl5+KeufyQ++xvOBhvwry6apYYCgPQpyyMuOG3ER0vrWBbHo/ws3802EKL82HfMxKlJGNmyByD5Qp2fqW4WT64/ynn83/ddcAUezgBAA8JZALAOo4J/tIgZiIAZgMJACwHAqp5NT7vqzprSX3lyeb5HcA0AiAI+cS3rDpYSOAd0+rtKnkGCgelmzOj7slJRr6KVeWQpR0EvJD1XRiwQKoQJcXfrS+/P/TA+Baz3gorga18m/5yTAYCZYbjXAMB4iEYk5UxBnaTJaE92e/oK6Z04JHbMOQBoTwH2vFSCxt5P5fee/uTxbAMOoU46ZQBwSC/zZSu3bfBLTrszWdVLkLHbbx0AyAJhtFkAgIpO1EMDivM8AgA5d3M0Pd7B95foODUDsIKk7oVySnvL5fRJ1f6pLm9plQ31+AAgjgCdklzBIfy0MFDKiUjz74EA1Q6MbXh/fZY4GJNDiGaAlpelIas0X8b1Q0c92dF1+sWMl3xPf8qhHY/A1wXPiQCgHAKyPiwA4AE8tLcHV7/wOfj87/y/8JW//J8Az3wFVre+hYeAlKw2Wxqm60V+geXeGb18SX+bQeT0K66f3WHnQz3sulYDwgd5uPUkf4hsOpf88um/chpw2RBgC0+79y5g3OAJyC67oGbskVxhgCGeOJ6IQFmCOQBoAR+m2kD/92RGvbrgb03ZjzjpsJQAP++F8LzXvhme99o3AnzHS+Hmg9fg+s4K1pd3WaaLXVrD0eAQkEo31gGYwRVUWS0ZzMZWo5uZle9TQk6ZxSvwMQEwqJ+rPp2SiS9AeTSHWHhgnbXzEAD08qkBmx1BrTkjNouD65RfL53D6Lptuac+axsAsNDPTCpr4SPPjRmAsmJakOQ3PMr3euhJOxvSr7NZyuDEF+H/F9g1sdEtSBT9GpL7zF4PY5nEYvhTjzP7ewYA4CDLZqbvp3waA4AAALoNd5blbdwBf+iSVQa8ekOA3feMa+fCmT7TSeoFKQDI6k+GYn10OcSkqkr3LuXtCuAFGlU7xESL8iIAijyJnqP8OwNYevEa+SbckqRHnwSf2KaHYVuy3L4I19/oAD+fZH0LzmKBnuqdhhKKemiY6mxav0wmhZ5aAmw4AnUUVhIkvOjWvfgbrsJgrt/i+ijQy9Z7ghGdFADEioiueZ/pZuLFUXww48+ZaHYBQOTf4tCYDMAqoIMAWlSMOgvLMwArOY4FANLdqDANw7c8ZVajAl0WAMxIdmcBwFZNq5DlThTzGJKAmy4buz4yGJoiTPO+AABnIuO/P2kG4N0OAI5PBScd4QL0YMytPoi/498XAKB3adKMM6IwmVGTMoqb6qq7xOm4lwDAWjJnqKD+h3dQoh3NAorEBRoesznKACQbeAEAjjTinQAA7ftjxkRtON0A+7J7TeU90lwf5YjjFjwX9uAQ7j84gIduEwD46V//Zfj6e/8E4ObXYYdLgIuOQgCQTzQWhyzLj50FhGMAUPwXjh7qXjxCMezfSEYae0uI99TwJWSUzADAkmFSnie7DtHBll49Bri75wHAFRxeeQDg4W+HR37yp+DBH30drBgAvFFcx5LyiQRhAJBPVe7LgAZGz0oAkAGJ6PsTN84yAJ+9ACB7y2GDzW8uUmILWa1KrwHWezcCgDNoOm+hsg0AuE3+jmRIaXBzRzIA72kA0AC7FdnR9RmfInzvAICCV0QMQTevSGIRAET2oSttBqf6k0qfqT0PhqHeydjCsMLiLgUAdSPGrv9xAUDDf/jgNuHDHubXAKAWDEkAQMR8ejl2rLxifGrjhpn/+pwGAAvtIwAoBkEIl+0w2UB0WgJsFlgWpgUCJfT1O8hoVLGHHt9RgjVpgs1MkQOAJmgOJalpycZgF619vkd1m5KHAAf3DosQvSIjdSBeYGykjlzAGYA14ybNQuSnRzsdMrys8c83ii4yAC8AwACIGtaqPMy8aXVH/e45BgCK60Hzb93rfBcsAIAWLOMSvPq04eZMlgEoAW8b4i7ZYUxP8TYZxOKgi73w+i72XPVjiP0MsyB8CgLWcsP87tgCIV41zqC4QxmAMqjRTk42vWn2h+9hlnHkzAGeOVDZsNx0on0yPQHTFQs7JlRmqEG2+B4kXrwpmPQALBmA66NyCMgGrtzeg4f39+HqP30WPvmet8M33//nBAAe3MRDQGwGYCwBjvuzM3r1AUASGsrIU0DP7K/jlPD7JgNwKQBYSoFLC4DyjzIG15IxxnLid9gNIChyJACgXH8PZABKgFDWqgz36OpDAE+8FB55XQEAfxzgJd8BN+6/D267/n8EAG6OAQC6gAP/6MAoo+8q8/chGIQpa6/B7TMAF6kTAQBtCbCxMdF/tTJLsqgZujJd/16dXzMeJ8xTTZJcMIavvKc+en7nu6BfrS6sgKkFjySxwT3OjDEpAaYAV7yF6kHVJ/iMOE9Bso2zWerTa1k+69T2bY115A/iymV3ap5gDMiTvM/uYsQWLGcOAOJU+oWQM32vE86JBMoAACAASURBVOnwYrRnIQOryQAM6mQsw9LixIAw1R+i8cz4Y9xj8HQzAMVkSzyL+o1LPlNVySfds5rh+aj1FKmx+teXzHsAEJ+DNDE+xeSUlIzzbSbjuQOAdfw00iUZgF49Gf1gVQX7KO38bcWN4TuxgYk/flIAcKQ/LP4isYKNGbb1X9uMu75+xchqWOEw083nkAGYZfxYIhWBVNxIehTkakhgu1EPQGE2m5qJm9omC5AUML/VMJADAMXZjwCgSLVzqCwAaHs4tQEpldj11WwExqQHj1poj3hHhTByoPDNrkN+35zUNeIeSSlwKBv9RsINfsA7uuVkQNMpYmhhEgQxmG4BZGtGaABcrXHNrH57qEji5PT8s77r3XUwtv3iuQ4ANi4hM541gvaaZkflnAFAd0gI6uOxSxUd0KZHrZtsdEYCtVB8UIulgk2f6kljubEyjqWcul6fFg1MDwBkhdswfz/9XJwrGmPr3MZgqOoj5/CGptQNeWj8+eYDnzCW9BXyxBwHgcMVQhvUz/7WXmbbag25flwCbCm7NBb2+nIw9oFVsxSbBTjbOlCWUqmkTRxuay8pQCglqsKNNCk7fszgLD0Aje0rY5b8rt3NIVy5dRse2zuEw0/8LXz61/87XP/YBwBufhXW+zdgFysK9DTA0wYANYNG1kpKfunv6o9JmWlQOBzGhdOAxW/QDdEC+FHPvwIgKgBY+aUDAFbKJt9Tvz8T7J9JCXAmv9a7Getr1qAVNN25cgVur+8DeNF3wuOv/2l4+LWvg5tPPAHXr16G27srWO0U/6eUI5FengGACJiaEuCdUhJrQO2SOWo9TOfvTYc+hmCQ/08KAI42iFEB0RhqKMdjzjd0vB4knTUGAEm/jvTnCfS3iVSyN8zDr4leN+Baz97RITmqoKweQt/X2sMIENYMf8sonh4akLbMRIHubJY2qteAvW7cydA7flE/gyxfNz9Ke4jBMhsae0a3/tdplgAbWTYqZ5l9dFdZC+UnGkuA3Lf9U2at0eurEQEAnQSzvmLLMeGPsfSdHgDouLA8ltVCFwDE7z1vC9jjqpKC/tEWI8Qn1t0QX9ba+NkhE5H2KEGiI2P8nrB4bJ8WK+9Hh0gs2aCPLb5mAOA4Ay+yceafqw5xuI3MPQKApsKmfLVtBmCegayEdhxiWsEInQv9Rzw+69HrNmOT9XX2OX6fzDdewhROlaNQemg9J6ceNSXAEQCMwA06NJXrucSkF6HVkjUVqVEwVx4rp/XVhXM1+b6fE7podReA7mgyABuKWqcqnlJZDLK9oT0ko1lDpIWyUAOghoBmWwBQHMb6htifz/hPpMtLs28/yoiCW+MRub9mBFTDP3POJiaCAdkLAJDoGAHfe70EeMYdKB2DQOe8S4AbgGfokEUDFfVFoEa642+ukd4XHQCwXBkBSi9tbAKMw1EcBqONAsxTAEA+BbgpUegE2tEjCQqDgmU7b+p5VLWs9H/lMXr9xwBg847qLQw6YDBsOgSMlpjIfoBEjuQsSp8FqGMJIX3QPqMf8o2eF5uKz4I/piG/PgPtzxIATGcyOdXN8g8CeXjIBP8kWIIAgBQM63WS31UAwKu3bsFjtw/g9sc+Ap/9zV+FGx//MMD1r8LO4U3YKfIiAOAZlAB7ALA4HwVwVBBQ/QkO2MKhePxpBwCUnq0E/pV/a87+kwxApGf1YUzJr9YBiSdA/X1CDx536m8FAHuHgBynB+BIhuf87XXoGtaXr8De7jWAl3wvPPWmn4Frr/lhuP2CJ+Bbl3dgf3eH/b8jzA4lAJDolv5gD0TtYVf4qwKAdDuWjncBwLEou3XJLi2vOCkA2FW9bDmkRM7qBhfgDuwl8mYKAKp2G5cgim/d07FL1r/PPzKKmYbvLhODJz3wD0fPAZjoHwdOyCFQBkAmfjX2LxzSF8cy6gFF75zRSN5mAndeM1o/emMv0B7xz5y95eAgc+WsJ5fdMC5Z3M3ibQcARs7yjyMALoR4rud96r+6G3y82dCkyWi35oxj2g7717Ga7+kznYXG/2Z9JWt+gX8zie5oJ22Ln14PQMeFMwBwUOVSQcBqtWzpKm1oVL+OAUAB4egAEKUTemZJBq+dbmQ/vNuMb3rIWj3Ei57a+NIRwXOiQmMd6a9TAQAH6+v1gtchOLYGgDI7Tqxgqh7eEgAU36ebtJG0p7K9oMntHunHWQLE7H6yz1WGmoXiHsoD+o5HN9k7i/wb3oMuSjwERBxOoY0wtJzqW5tho3Qo4NZlwiINg0NAqqnjxdoeAMROPnUhKwCI7+0RSJRCATNlgViYnEJeAgB6B6MFAD3VlwKAVShC03OXcRHAP1yzTgZgDwRMewAuVugj55wV2gUA6Kj5bAMAxw7CGPxDx/JuygBE+RmHAyfPAPRKKfagi87mzEDFEhh/KEw0H0Unsr5knSynjuciH0tcrTOrbqZxNzlYIGVe3Smzy9YAgJNTxMfuDWeodJnQbxhlcxwFSBK0LVaHW1+Yn4JcbaJ53kzO6j3hEIhheYTcxA8/LwBQ3is7wCMJdAAgLv/hcINBejjWwBu9HskA3MDO4T5c29uDR27chqc/+D74p99+D+x98q8Bbn0Ddo/2ccOmAoDM3ad5CEh1YivwVzL0GAisp/rqQjl5rarEbnyK3bX21wCACGjyicDu+WUk5dTfQ5ch4vnHAoCovbE8mqgpv5esHjn5zgKKfH3NAGCmmx4CMvIxZuAG00D6PRUAdOcK7F99Pqxe+Wr4jre+DXa+73vg1hOPw/Uru7BX2snwCcba55E3TDqybTM0nk0AoNih2sPOCKXEBEiSrQFA37OpBZAsFGAVVKYBl6x/n38yPTO2/pEJfIv2CASSf6MWzMY29CS/ARbBC8x+P08AcNhOhGVrapgyiETksj31fXaolvVvypNPAgB6bybzZ7IMQG45xUZLN0QMbzTInAXfAg+ZCdiYu1xlN38tSGKfkGAKvGlJ30R/1ZV5D6oAgmvQ0X4nywCkOXo+ahKOshLgJq63VOBWGvxc2yMYIQuWR/H7aP9YdQ5t/KjOcBm8YsKSpa68JAk6/Eiqp+v/EPio19xtAGCLoIy0ppEo7PXHEYCjcUsLywOzDECSf+vXD2xABwC0K04nD/fWqLUdrbzl7xefVjZochJMDkFlgH756Fra9jbwq8/9yDve7zDaCgAaRkbXkDdWYoApgJvf2TIDCQAgftMoSFpTSY+3z1KBoEW3KZnoy0tAKzXpUgJs3puQhZtRZgCg2e2lk+snAtwHAEnheBc6LWlNbGQVigUAoAMFwynAPcMhyzAbn5rqjAzLAMDRDulsB2NJCfBQwY6X72Tf8ilP27x/BgB6czQf3olOAebs2RGLz3r8jLL7dPR9I2ib8Na6/+AUjKiA8t95fLsbSE/y13tvwp8qPleo25cAZwBgoJQb4CjIiRnMRV/ZLdl4bwYAdqjLxNP9K+aSELFFh4WAP7qWAkWjsRN5KeptqGJNn5cqG+aGzEHTGYkH0HlDPXAlZyCk3jTAmV0wcgDzHohtIMgzmr0KE8CDM+wNriNNs/J2Q0leOWqAzguyYFgTG8pWZklJRChFkxKh7AWSXVSzOMx6Yg9A2MDu4R48uLcPj1y/CV/9338O//R7/wMOPvlRWB9eh53DPaRnceJEz8YS4LjLOMuYzFp6IESAoB+V5+L/CAiuwnq2JfOkKkypsOhOZgPyzySLjU4RlhOAy3sVUCT/CgFAAfQq79DD0J+pGYAk4XQ9+WUCnpVNHbojAoBVK1RfjvT/iING3490o8+komy+HYCdy7C59hisXvXD8NKf+Xk4euUr4NZjj8CNy7uwubQDhwcH5uQ9AXh0/pHPvP0yGYA8f5cBkFQADOeOr+3TBv3yob4P8H+NQvx8Mh0nWiRmAMr8SbdzBU5HxVF/Tp0BTUfDrVy31jeHsKxHB8sDandonPGepN7ZXFJ95aG2siqU3h2Df3u71Qdlvrj9Zt9pzvSS+yw5BwlAePkoAV7pPbJBSm8LDpHPrht5rKE9ZWp1ln7s35TJZ1iTsAGgCRn5IsSSyGLumnca/6nnD9k1s3R3a2PYBTenTKKJwLrbAYDJnNhei2i2XM6yKu7XwCepdLBZn85+11lX2ZiVOM42YNH/WhYEkA1JSskjd4puQf1mAUBDvr5WjPog8htavRoExBJgzQIU++Xvd95VSGbLsqRnLb4ifZuYZagAyDYOPcyQodmWAOOiVMq28Vig3zSjmPXuEABsdbyYuhQANOtOFajRJwgaINHpyHuurRwB7ETvHgWtvKgGVB3RtxiVh00GYB2WUTKp/qhGtgUnnW2YeE64Eon/7jL4H3n7+8j/JPHEDBE0avyZAH/YyYPfXuWdiScmHQ1c5Bd85uggY72BDGQbdBn2pFHyLeSA8Km3FQAUBSDGOVEvlYEsAEiM25RAzxDA4GisOAOvfuyauvoArUxjCiDEC2wJMG/AOP1rAMDKnh1tKUI3UiCzDKTpyobxRrdspiCHAKBMYOiwzRCG4c3jL5HF5tSzD2kNoFdmmTE8wQiH2THVeR1MYZTCjgZ61mOgn4Yb0q9teVhwKEdK2spbQqgYZHBicI0NLGCCK2F6HmV0n/V8dPfMSoBDhkA1MdaBtTuETfzSAoDtmL0TTqG6ZkdH381nBFY3lx+rNqDLk+Z16mQbHe/0Wfu8lt9cvlVzapvLoEz7WfVdRTXp+WxwKsPbqYdf1WmpqvEOvLHtdJ8tYWWAIAMAe+NYVmKScIXYUOv8iH2vq405YVP1M7piK0Cs86ZufJHF8zwHS8OMnmXM66NDuLTZwxOAn/jWTfjs//cH8OW/+EPY/+wnYH3zGwD7N9EfKEGI6DmK12TGzOyGAFvPtzwCJ2gAQAQBuQxY5IUnETN2BQAU0rX2kp5DwJ/4RKUXIPt56qgwAHjg3ErmXtPYyEYUZQF4R77QBIG/UCYcM/yq70V2b+gA27GlvLHU9hJ9D0v58+oSwAOPwNWf/Bl44Zt+GtavfCV8476rcGtnDfurIy7hpQUl/6zQzWiKRAc7+57qjH6AMdvAW08y7GbS6QAoq6jE+gb/sg1AbQGzXwTeY3c+hup8vVasiNWn3U0Ok41TntBdYVYKVv/LgUDkLthxy1Osr9WWd7XupLedPdtq18Btxlu+kd+5JyC9qw3e0w2GQYg/yxCkhKa+nNgjRmzmE8pmaOXBZDVkqKuNn9V4o17hy3Fb+iUZMDZeSGS+6QE4tdFROll7J7aa+NP38PQljGV1pD2DJatyAK6HYaRGX0d/GQ+xpB+7TJlcy2MtV0a/oOpreWbTUsNxa9gwzpQs+4vJVzPwkPhlrKNTtc60INb18ZFc39eoxImiAxq/iXv6y/14KrCRU30uf55kqNt32+dnAODMP4vzF5Cqp/t8vDUvUR2XANMGvf1pM0ZzniCGjZts/KEpo27vVu5tehimG8BxfNxSo7aW0O+r/uGlU9+FRiFvRhrXsfNVXUMaNrEa+9/n7/JIPHSML6leheFpWk99uRy6W+mWZChaazbzH2wPX6tjqk/z6Nv/ilQSl2zBarcyhTTixF0ZNqiNPDMiLMbd1VjXvWFPJC9knvIRQGwEwaLusgNpllcFjpa7NbEWaGgD6CiwM4e+EWAjUDjPUQ/AcoGceJJqwnZnX0RMFlNKs+vtARDJAke3GmnQbAczcoL6Csj6HSMfZKYglwGAPenlsc+85J4Vmn2Ojx8buPjtDACcvXLb70f2V+W+/9TsUCB7NSqgrjXmHYyG/s6E8uNYEXYRlxzIdYD7QuJYIxtrSFzKdvK80wYA2y18TxsrYfhN0H/98EwG7+UXn2cMUg4AqpYx7inZ/LDWzdKGQz5iSU8s4Yz48EgflFf7pszS5FonNJbG3B3psk2S4dBoRvNCCZg8TUgGMiAaN9WCh1YARbGl1fYNdPRMf/bkX3Y+s/1jyx++g9lCATOXzeznccdfuXug2y0drTTI7wUAvHK0Dw/euAFPfPMGfPoPfw++9Bd/CAdf+AfYufUtWB3cwhqzouPODACsvkvJ+OPsP1MCjDuElcckA1BnIzqcPpGMPtGVpkULAz2SkVscTdUt6hMdHSUAoPHxfNd0PuChVGaUnW4un3VZgTUANWCBAQFrSc9ICBeA0NntqvkocD+E4tteAnjkKbjvDT8LT77hLbB62cvgG5cvw+2dNWzWxR0r8ldddSj2JQOw6H0eABF59RkCY400m/8wA3/B3uawpKqcAt0BAIWeNsM6FTXrv4aqIc2YEu7UDZU+AOhXMncHdGXj/ChOsa0rIv0l4CIge2ovUBZ7P61vPMM7JMOo0fH1FbGp2vj9IwAQZ+oVRDMRzY4WuugqOz+B7/T06oCo9i2sO3IK5iVwPmD2dzYA4DR+6bw5WXg8LMoBgJzZLJKO5QqqD7K1Jn5UvTCNJxkAtMvUi5eq32o2lkcblK2/1NJirH9GsV/VEN08JPJ7phLWDMrGJUMAMCqkxK/19MGmrE7qY4au1wm0qTWSfrwes0MFQ/GAzyzBJT5b9EI3pHJ4gtjtvoaaA4BRvrYIlh2IJiMu98umYDq7+iHdYeUl67loeZD0hdfvwV6YTD96fGg5Id8HvWH5xM6kcjl/OMVTzHCQEggAykxtjEt0tmdqlGc3AGCFLY3t5HfQ8ydNOMMhXk28dWYAIBM4OgGB3VxEOyVuWDTagRR3jRilBQADE8Yd6OBETRV2X9bwG3s/LvsZAIAiNvh43mQTsZ0BNk6xLDKeIyNwAQBeAIDHBQAzEycK0nK4seqJ7D37AEA7Sd9jyDsn/Z1s94TggFvnMs1WcIB2zAAc71J7fSxb8wEOCy0NzhMARM4a6sB2/pEFsUecGORO9kJ1QaqSFrfnyGXYsQVzO5W45tsAgAtAAXlmvkHmHdh7FQCM4B/yZqBjAQDvhwO49swz8NjXvgn/+Pu/A1/6yz+CzRc/Bbv7N2G92cfKXCwB5m7nuNq1sT/bRsPixwM8y3MEAJSDQPjZuKGHoVzjX1ClhuhH8X8KiBgOQyvzrr2BacugZJYNAUCOarRcSprhe4dTWZoBQAQCSx9BzgbkrEASEb/5Wv6OO+CtivcBwsT9cl+r5yIA4CU4Wl8GeMGL4aE3/zt4wU++EQ5e9EL4VjkZuACACL7T+ySg0woTziBo4qOg31xG0jyAvpsBQOS6kLHUxNwGABTbohshfv5RJuf6t5eBrc89KQDorW3CXfc4AOh7nPn5Ef0lB9DKpl43ggOaDJ5MOCcAIPUQ9e87SwDQep1xbgX8830aWRfwoRSUJeN7KMcyc+XHTF8nJXkBAHT+GZNFxvxsBABnCQpTALABDRRWatkx6alp9Fu7KbEMAKRUcfbpQrhS8IAs0unZMdGRvXumJbrhwecHAIpcV+5Nt1t8xnMiHw7A2xIARH/PegHenkR/MNojC+pm6zWyX9UWbu5OALD6N0MAUFJx664au3GypvyUWALsDf1MAEYmZlyChXLHjiyNrAMAVmkSZ1KABnL07AiOVwKs7BEBQOqRYL4PTV9pA7ZHgzwDUJ5WZ6Mb/qYk2rwzWNhtFNKJSoBdCUGu8mYZIMsyAEdhwcKIeJvIQq5FRh9TM377rMwA7NIuZgBaamTBkZFGl1vfX5wTA4D1FEx6x/lnAPq51pLdjgXKNIcG5e0pgDZLLWu43chb0E0RNBRDIloM768il2QIWAAwOEuowSfyhOALTxDDdT6tE8mzaEPD68XRDjr1Vxn3WNENKD39rQmSE9dHHIRYQo8ZgLLDX+fZt4ONvYo9txK+ibvicbz3egZgBBqQNZjXbIXBTgEAjw7gwWeegYe//FX4h9//Tfjnv/hDgH/+DIJ/5fsiI26X9lQBwOgc+xOAbUuWanKsfEjVhji5R6W0l7IIV1ha0B4mInMROSv+B60/7dofQckA1B18dwp52X0/2nDZO0U9mh0nJ3r2AMAW/FMAcGR8o4e23FCrtSE6HEIBAK8AvOjl8PBbfx6e+Ik34AnAz1wpGYArBACloQxVVviMy2qxBi5r9H1nOWbjHXxtMZDNeklyTZMB6Mae9I6Mm+ymhNDq+qrv72UAMDpnmf04RQCQ9K7alDwL8vgZgA1bFuCKSx4zXiE7Y4M5Gx9Fjmv93HZ7MuHSUwcA/SxHm2M6Gr3HzSLJAir2wYZkvvpNAMCSlW3zhPX5jbwNSyzpFJOq4TogEvpFdiPw1DMA47o5D3KicPv6eUkGYLYJbV84LwG27zcl5512LNFftE3+MwBQ+9nmZHBQiCtdpuspo3z5T/X9OrfcnQCgcKhYhbImnBhS5b8LaTr8o7VXNk40LUNwfYMuYJqp/0z3Ztl91Z+y2Iz46eazmY3txQ9yn2zA0COZV2sS2vllAMr4ViMAUIIUSbnMhVWJbJWUE6aBw4R06fCGVe69QJdKNPQhPoDUfleaamqMnJQ1G2FreviFwc12+KPczlKATwIACkvh/6zw5FAEq8LrmLYMkOm+DKiRJ/aVv45ndBrzXDHOAcD5M45ZQTR/8AUAOOkhwrxThdfy0gQArArTcnm7JCcFAGNJapHvkVNy2iXAYwCKwgVRkKOd8SqRQZfGU25FpxNVRSH0FbSMrwZ/xfFN9LVdYuMOc8Cj6yb07s2lAQADoBVLgGOJyYyeloNwGoMMbZrmgj4r/FALrsb3+E6GulscKd+1oR0xqKfes6punrelzvf8QT0AZ+Z7riiPf8VxHLClAODu5hB2bj4DT24O4cEvfhH+7jfeA1953x8DfPULCBetNoec7SeZanLqZAiQrMM464kaTmnWgIS4DQE84zQ3ZZSxJxz3CCXgr4Qbu3yYCP2/kgNFKKytwSb1lisAV3mdnKx3CJtSAmyqJIp8YdlNyerjA0A0ZPUAEpbnbeQkYX4mIhDi+JrfK1fNwqO+jzHlqhqdrWF1tAOb1SXYrK4CvPgV8NQv/Cd4+Ed+Ap553kNw46oAgHSIB6oFBgDpHeph4rc2aAgtX/yGb2vjZj1z/ZwEADwdCcwgHLNbQ/xnBoAcEvRjtQN8HfGPCW9MRQpqTksrLHFiPufPZ6uf63NjE2OG4jYlwPHlgcz0dUXIA7u1dnnEjzIPOrSCkgLyuVt+9/Rrn+8zmmRtnMTUwyvy0Sl9I0BP19P3MlI/4pMDgEoLFCuTyNCT+qyn5ZiHctmxNkJ+t+2rMAGa9WC166sVAqrYB/AOAIBW1Vi/QNy2zM7ZVRb5HdEn10dC/VZ/tVzU189nCQDqOEKTHOswmImLBt8aAJyUWEb9pLxCI9wWAIwt1MY2bnKKLOpv/4S43tG/2grfSHWY2HqWuwAANj0G2Q+po2xONTIlvNxmxNrkjD7CtRL7eABwbEvbMyzGKzCzX1gCHDdZDAAY6d/aO5XBCFCXmRy3BPhYAKBT0pUuVOdfTYTLXkia3Kb075Ox+nDJOpRH2R4taKrijksZWfXaRFlp7XxUX80pimGFthKQBRktVJnTY8pxBqCQRO5WephSvS0DwMzJGDR5MyCCv7OGSC4jaCxMqTCH9ZxmCG3/iuPfgbI5VgHx22dbBmDsyeKJycqrsndVzR1gOUqjkdfOKp0mAFhegac2DpJGzxsAHJmvbNykm4kLkZohWJs1cq4AoGww2B1rExqkmYEGPKv2QRznDo0b/R0FyDVtpmjTXnL3AoDiiRkgJqFB5uj3FVRrHyx/uGct1HLEI+piPdsBwMu3b8CThwdw32c+DR/79V+Bb3z4zwC+9kVYF0YqYNbhIfX4YZqc7iEgMcC360m6sgEAo73BAdEhH/Yk4RVcQgBwvb6MoOCaDwGhklaVmCOgU3wL5HV4tA9Hq8N6si+GuoVHSybk0SFsNnRCrtIAPQ7doAg9ABFGq6cGR11ePYQJZ/YDzClLi84qYdhmBzZwCTbr+wBe9t3wbb/wi/DgD/0I3HjoIbh59RLc3qF2Kh4ArFoTX1VnaoRsXPHRBtDbAYARcM69sxEdquubXuTzm60PX33L0SngdL6fO3BD+4bz1oml1d0OAEYaoe+c9OAzWW2zDQp5pAB+CADWFgLZolh+3x4ArLpbdLhkAPb8J21gkW52kX9gMqvMc0RDDeXQ0Cr17yvIaABACwaGm7YDABPdUQbNPGntoy/95b5uEQAsJ4ljQL82hyf4d5xmBqBon6p7zH5t9aQHDiFOtTkExBO0r49a/ZxHOtwHNlncOwIA8hpVoDoTyOpntRUj0wzAOwgAbu+v3dsAYOEciqeUiVt+VRtadNEsI7PqW9EroYQ4xjv4ZmFsPsTW/Bn3xxyXi23N5YK9qvgC1wal7an+rAMALf5pF6dSMhiIHjGrQ2KWYBEAWB/Ygn/evaMH34sAoDUUUHv9EAPO6Dl1ogcZgHLqWuI36UeDU+zm724B3QsAcAnV9JqRgyq6aQQqzXpKnhgAdAO0TW1twNgf4XMdALTkEyrV3R1eYMmSq+CfOyFxrCOGAKDY7gBkGXOOnrTduaolszMAsPM9Otim+TCVKIbMlRFDhwDmzDIADeHIhekBgD7gkwNDbODed0jGG0TiUKJdW7gR9FwDAK9t9uHRWzfg0if/Dj7y7nfCrU98CI6+9s8Ect1xALDYOws4TABALgGuIOHRGoE+yfxbrXYrALi7cxnK38CZguv1LpbPF/0tfegKwAfrUrpDoCCBfvv87wD/XsEhuxjEt4eHxNeYUYgfSZYf/1//zrwta8tGbvRCgY6m0QGApcffZdisH4CdV34/PPULvwhXf+DVcOvBa3D7vsuwtwNwuOLyv5oB6Md8NwCA2/hzY/CvwgpNLqYLQkwT8RArsb+smeTVYnPPtFEGYH1W1N3Ome35OhoUnqgH4IyYyHbZIRz6/qXe2HkAgFUczcFffrySiWiy/9x6WLkjYvlsmgXxxd0EAGYbbjxfAQBdFiAdN4DzJmCbAUBzgNKsh9m0p/ygBNiKggOHqwfIpQAAIABJREFUTrUEuKdbOwCg4Q/yM88XAJQsTaIPy2Wc0gUAWMX+vDMAm1OMIwBoN5yaHn4nBwDTZCvjYFufWVsZ9bX8zMb6HqxsIe+mDMBH3v4+9B9JZsr2FDWdtqmsFBTQFQ2gwEInNBRDR5fThK2ddTa3oqP6aURVnSwngeY0A7CuUNvktgbMNig0gBXd6o29Bzxm+TPznlbhELaG09pTYaIJ93/HEuClDsqYxXV9vG61p621TyikOylgNywBXjy5UXCx+CHthcgaYy8ydoDYLgPwmIGPGekUAKyeON3U2M4Jg84zYuPuscgT/d+eEpb1ihqs0QRg7mWEVX0V1u8sMgB7o4+6Ll6nmpNG22TZJQ5tm1Lu+VNOc7fvGnHwFAAc5C8rN1Xroj1Kkx4eyIpyYlYdVBi/ZE9URtWeeXVOC8EufPIplABXS2fXQ0BW02SdQyjNuQgOtDQsjqn+lAlm5NOQxAFGQXijTUb6NrQJ9G0yALWG5OTaaHtdO8uwifJt52zfhrbIZpsAwKXNATwIG3jk5jOw/tuPwId++Zfg6NN/C5uvfYkAwAKQHZbS17PMACxUNf5PY0+8jxE3PDRDsDCf9v2T0t/V6hJlAK4pI/AIy4J3MWPQg40lkDtEABBPAsay4DL3AwcAls/Wa+3FE0t6qt8nTm4tAZbV6HHRyEYfk/MqALiC1WYNh6srcLTzAFx61avhyX//f8Ol7/l+uPXQNbh99RLsl9OeEQDkgL/aRe8lRn6L/lns+RwzOJsSqIlINBXfzfV92qj/OnpJbE6g12Lma+lhbXS8rFKFB9icU4zAWQ+2DDgML5bERX20LIO7Srk7pITCCT2ZmsAb679zAFY9nRlf6Xs8BUNM0Gyzq70TnUvsRCXddBJw9hMjkmUZgC6jlx9c4zdtmdthAltCyU+qZLFoD3prftwGiMofnmcOjnyPSoGOOmj8zcESNuDcJOMe+/+x+0m2gv4Q3i7HGm1KS4RSCsyU8Nq56EU/oBEAiNzJAGDu33kiaGxtPMMaQ7crgHLblFT662i8kYj0mfgrzj65Syn+G2n02IKm8XEH1TYILk4UgnyvvnS+yJWv7GBRSMwHjW8kJ9v39acdnq2ckDtm8W9k87YEeKyjpiWgJy0BnqjIVkyZn8T+V/yEdGYcb6yocvhKOMEXaeoOFZutixxcZqyWMArf6sbPc+15Itt7r7WDjLnV41BOfNO4xdia5Hs6FbmrfRv7WO0C+zerR97xfqeyxClUY85qdEgVVhWu/BdVmgldvANu3IwmTy3KfJ2gAZSEcL027fI9CaAoklbZReJZhtRArG+uTU/6dBWmCsAYgPgAXPrBKUKZ2q7PqL5LtoO5DSsrA9p1oNWlHkL2pwEgZk1wJ0OZ0W/WYzE64GG0Q/gCZWQCMI31Y8+BNNzP/KmfmDx/7hUzItEcgAt3h/k04w/2c5YBGPeAcwfNO8zilLfgX1GY1mIxfw10D/Ug6ijARKHP+CkqyG0kpblWDwxVsQw9o+YBj07OAoDx9+E4ZZENnfQjs+DBODq5ZkkReYh+Z9cIBf2lels0yAytmwQRfMhSDCQbvS4Gfwv6E7nGPQAxSGZjitbFkDMhu9eVfF/8MLj9HDq2AHC25tGhsRrI0qjaNnbQmkzSCtDqiaj5GvtPW308dqdmJZEzANDSoMzJHqJC31FJf/1hdiufXdocwv2bfXj85jOw+fAH4IP/5f8B+NKnYOfGNzH4O9oc1gBKnhFLgCcVQgvUR1jt2SE4bsK6YUu1Ki0ACEcE+lkAEAooWHsNapkpHQiyD5vS76+EuFgOfEAgIJcB0+m+fGBI7QlY/PJMTuSzkZWcRBi8hgsI2V6SAYDXHoFr3/MaeOJtvwjwna+Cbz14FfauXqKAPui/MjLiZxljq1XoFl3DwGp8ZlEuAxGgmM1R/EHHzIE+UXeQnPdlMJM/e/VsA40kjEgg5b/4fyewxzkYlV9/n5gBIbHa755vRT5+7d/WAed6tM4BWqvJ5VRuekLEV8hf0jhD50qyUOB3oQGxzsiL3wIAjMkRAsZOepJGXmoPvfJWzA5XeL/PXaVH4Zirty0Qavh1aF60+qDHjwJ0oe0w/2iNaO7VJ0Tgj04Lb8WKrw0TjsuL4zdjrhueTCbvP3i/ufy1RvDYVkGIfOeEaHp4pvxA/Cr+jkkHgnkCykR/Y4DcWSRJGu+ySLDdMwUpms4MqQ+PEN1iDNKWoPbAehqM5RE7vDqEsfuTVq/oqvfsjr5p6j/xWRwZ6crTx/QZH8KKstHwE+s+AQCrffS87MejRBolWKntsDwX9JMYJFqdVvtX+dRnRJttxzaLzyL9ygbX8KcB3Gf+j6EbX+rGO1GwVf75phijrB5+x/vdCHIAMG/8HieqOxQsHFkGYDPfNsCLJLTCZBUmKcucsazDIKWq7Zm/7VJFAHC8nAXRRhisu+YzwIEb6nTvx4Cm8+1UPSBpThkAdI5GAACzzZc7AAD26TM7w1O0RV8ItwcA42gmfzv6sHE3ynOmgOYAYJjbwOMSp8besQwANAqcjp0LP1FG6W8F2PXydgfVaXT3XMzqmQCADfUnAfapAoC4A0uGSH6ajNZQVjMyHhkAuA1Akj677tAxnXGonmeqnkk2YMbWzmcA2+fIfb02AmJBus5jfQA5+WnzXiG7DThPEwD0CRLaOy86tmUc3k+ZkY2+N2ujQcj41kxfiOMknKh2Wh3gHABU/TgKoCy/eABw5PTRPKYO7MyBNuQQANDzQj+LoBwCggDgresAH3wffOC//meAf/ok7Oxdp+Mzy+4qR/hnBwD69Zz6C/Zy7K8rgEQAABHNo3LgAgyudnbp79UlhCGoFFhyTjkAXB1hH0DM/BOg74hKfzFUKP9jZqACgFXEUr0vuasjJ5cDhmUSsd1VHKhLL6qD1RWAa4/C/T/wY/CCt/0nOHz5KxAA3L96WYNUG7iYjGQL6uggfP/rODgpGRwNelsQsAXYPf28uMwzsEb+gzyrp1NUh28PAFpdFH/P6CX6Z65fhB7j7KTemrT0MBE0KgEFAKnE2fv/Kr/ky6kuGgGAPflYDgBGP0DoNdOvng4WBGopJK6B5bFphpdEnAnBtZ/ocrG265P5q049svlC85sC0qz3+KbC5ztNFqAHAA+5/5+8mw11NfCxJU4DAIZDtXo9j3Vkxnc0AKB/bt/OLgMAxQktvpTqE+T2mb88W7pRhswMABxmB+Yvju7CjP+bQ/IMoJXFJ428MKCbSfA2/CnPFV+N5jG3jVKxlFEDN6fvBgCw00PUZ2ezJMVDncQ4MDl8hqSlj48px/o9yD1fHPGUav86DyvXR/4a4TW0nJZT5uub0ajyCiaYSC5yPsiyMVt/rLzJ5ujdCACGNXcTkB5SqtApJTt1GsSBk7KABQJ1AQBGSqpxaRXaBQDoFf9MZfjvy73oAFT2pZQxDAoyrztNAZ4FV2JIeF0vAMChy/LcBgADr7DHfwEAdmRsCQBYnViDRs6cZmux7b68zS7kx0U1YcG+GAxZhxZBwKPS4p4e+lwFAO87ogxA+ND74IMFAPzs38P64CaX/m6qGr5bAcBYAkynAcuhIIUb+HTgNZ8OvNoNACAHfaVXpwUAMQOwnOpLh38QIRj8W3HfQHYuR5tUc4BriRO8WGD8hQgAkqAUXj/cuQpw7XG4/4dfD0++7T/A7W9/MVx/4CocXHn2AICBAATxDlyE4wKA9j0VbJIAw+CO8dURVMw2J1Jfnp99AQB6rV4AHvQYQwh0PADQNpuQ9+gK3ssAoHg2nk55hZrNBLRUKJl/G9P/z/ntLGTjntiUMWVlovZEtkFvhX48sIeAHMcHdwoAzDasnezPVPMdBgDjcGYJEhcA4Ch+PKUMwAsAkNjyXgQAybgsKQPm1H6bbaGdBSsBcqgu/zTVLWUs4tNwBuAwAw9LbMXJDM6mWDTzIpvx1AumbEYPnQrV/xnu6OMLxnO/OzIAlX+jP+mGf24ZgH0AeJzAXaWyu4DbZQBmO3F+bDFj1fOOOWExiaoyfuwbuLifwX87ADDpYVlL/4gkp5sBaGmh2Ud2FKeVAdjbvZtl2FwAgMG9Mz1eKONS9yZdc6iOBFn5sUBidaxDxk0MYE+UAcgPs7C7dbj7+p15n612IyV+U82XAGO2gZYIqcU5DgCoUUGW/Vm/NSchO5NmXimaqcpFbX6uMun2Js2mBGVp9uyct6nzAN2v8GyHfpsM120zAHeODuHqZh8eu/ktWH/4/fCh//KfAT73CYD9m7AqGW2l3wwTxQKAtmtaJ/FtFhb17c2WJcB9ALBkAJqSYAcArk0GoCnTRWCvZACWtAEq9T065AzAKqf0HfaewbLfMcB0twCA2H9o5z6AB5+EKz/2Znjqbf8X3Py2F8Kt+6/CwaUCjjJQiAUTBvRwJZ0tnEWnrOc/55EBGPXnbH2mAfICTkYNYME/vifLunIeAJNzBgLajee5flFff9SfrDetbkkbeUNJBqDXi1kGoFhMzHhLS4B7EcTxMgBlPcqIZ/o10iF6q/b7PgDYo+ayEuB5J3V9/uwQg2Y+PQRabHsB5MykpZqg9gM0Je4ozxYAlJcZHyYCgPH1DX8Ff7z6RXUivkfn1gBgAOC68s5ziPoa5S34O8FDHGuIexgAZLenb6tNe5hMgq3eyh6SypOpCFoiF1SBmP+U588zAMc1+ttVoFlf0Cax9DLR23i5OdTJTE3sRK6jiE/HaIqULLdeeSt39MnseeeSAWjsJvXoFQ5ofbFMX1q+nJYACwDo3SJdFRtQ1+W0hh1vVDJaY18M9MxANWGT9Myr6YwtE9nF1GOmLQjIV1Tujg6fLn7bp8y/z4c/rSDaJq9jTZl/e/4AoI4rU2gOUDkFAHAG0LQG3ouo7VnRL1uLJqynQrftARh50UIPugFgQUk/X8OjCwHAnGsq1MJfa19B+76sfF5651TfZnoIyLSNIqvRCkHQo2uD16x3VH99HCDJmb0RJBil7s/467QBwHiIUMO/d1UJcBydNsEWNR571swMpD3Uo3Kl1RMTADDrE+m4A0GItgS41ROs003PVWuLMjmygVuVh6AqrE6kwEuzjpbpnxkFKUBJaccuij0JOaoNkQ0t+1Wnxn5mvR07RVuinWtJbwHnAfpyK1iePO1Rk5R0y7yIZ2l81UUy1xcA8MpmDwHA1YffD//nXb8E8JmPA1z/JpUAbzbUFN6ouBKvicMl+rNvPeZznTWNHz6h8hrr1lLqWzMAPQBYSn6xDyBmAJajLqg1CN1JlC7AHgKAWOaL4S5mAGIpNJYBF2JQFqAEumkPeTPo8wYAcSa45iuA3QcAXvhd8Ogbfwau/OjrYO/bvg32rl6Gw52SJRlsDguS2humSdjxvNMAYOQH35MytS5DFpoBgDMOdp5GkqE8Ck6R/2yskPweM5Pn+kV9qOMAgI0FjCVpVeGznu+UllLvbioBRvvE0X7UudHf8u/fHgAkG8QuVtqja7yijTWS+ZpguF4zDbjnAGDssTvbcI+e4Tx+DCkAhiFFN0UAkPwJOVxMb7AAYKMvGH2whxxEL7yhfENsA5RYWeIbaVzkL0vvuVGJINq/SYBa5b/6YSo/qDVX67QYaaYX6vf3GACYaVDHc67p5zh2yeJl+yxWCQ5kip/R38oosQR+g1n5vZ/SmHXknQj4PYh/Fzs3CbdbZzTdyW3128weNT7rFKILksp9i90mH18ys1Xlspm+OesS4CPccVacgawQj/yIWtJZ2LIFVE0CXblyVgJM7mG/B2CTIuwUrPT58gCgeuMFANwMm/hbAFAyUMTI0f9Ri/q/5RAQrae3A2y1owc0Y5NQcbRVI0/0q1j+xfqydfDOswegFwnrWMg4PSDTZok0PS4mTYlnAE2joHFQuubWQbTOUH8Bxis4c0g8hTzgR++UHozsbmDGqFHobmBHsK4ZCLk6mu3IGNfPlxZLNu7olEmxPk0GxIB6SwxEXSOzVikAGGVZnZGc3+jEvwwA7MEqM/46DwBwqBxsmWkCBG2TIZW+J8hP49iOMgCHO2TEGLGnrPgz5BzNvNPm3MFmCtK0OfYAjI5WlZuTAIBZCb7LfGnBv3x9TIQ2c2AMgNUCisYRkAO4kMCsBYIQjEDAjDdkjfp7zPIyVQLzAH25KSxPPS4ASMxH45Px2wzW8s3u0SFc3uzBo9efhvX/+QB85J4FAHmyFQAsQKAAgFoCjOAg9gA0fQOrA1kY6BA2eAIwgX0EYGywBJgAPwIJkabcfBodzIENOF8AUA6mwNAZ4NKDAK94DXzbT/0C7L76h+HWE4/DzdLx0GTheH+x6K9CM+JEpMk9BgDOKiBmAddIWrMNDgl65b4lQVUEAasbImxtBjHXL+oznD4ASD3/ZFMPabsFAIiyYA9KrNUWfSqN3eUCsPkS4Oi/zE6Bbfxp+0E1XmRIqnfrYryxPo89kDP/wtnqbTKgOSAfUI/1GL2hBVyIV2xcgxa1tsfQQx7kCeUQEK3aspaRRiGAjIxpO/8sZErVJBcdfwUAmZfGOUrMr9HHkMGV5yNAZLO1vM89OwTEyWrCCpShlP9UGvVYaJxcvsiRmOm3WQ/L+BL7POmXaOcXeXG0/ikA6GSrxU8aAHB2yM/skIiJD74s3mz9wEq3WELhCLodAGjppePy8f9EG7HfMkVtuo+Z8dN5AIC2wXhcbhqvxRt8Ne/q+fEQEEIg8IdDuC0BQA/2jTM4jqrC7OoAE8zgVKQELSk5wN43zlTJ9VapWQlrGeECAHQegGsCkClsCvB5zc8tA/BuAQCtmyS/c/DBnjFtyKgQWicaA64EhHMOkgrmQNfFHoLK57GprzNYxwAAhxtM1ekSJW1NZVYCbJV5LrNLMwDvFQBwZLCiw51lgm3nYGYe2siAHjcDUDVFAwBap3bmXVSQuE+l8wYA7YmXNSMstU0yB6J3f+qy6kRDWl8NVLyD2QKAjcPKH1heqkGOfNeLoFBVKYCWr4K3ofMAfeyiBetzLADQv8HTzo5PMgALALj6yAfgrwsA+OmPA9x4GlZlY/KgtHwn8ouc2QxAiv6XFOoM+Dc48LMNCvckKTWvPk8pMGTAD0/5lUNAdmC9uwsr6f8nGYACaFeAq4SvcggIZZmsC/B1VIBByQIsIKAAgOWk5BHzVEs3tlXDJirL+aW5kuWw9O7CoP3K82H9A2+Gl7/tP8Dhd383fP3a/bCHp9can7We+sve7z0MAErm42iFZgHNeHX94QqZzZ3dH22cb/JOK2qfMdcv6jfcbQBg3fp1G0mjYPQYGYDOvgrAs1yG2pJxH8+xSagP7PlZcsEMAIynIG+l/3iDqMdjNTsmbI7ZcDgCgDg/NHtko31HAO/H6uGSSt+iQav3Y4jTH6Ndm+MAgHFtvY/dyrcJ0sqvNSOqrlj1N5AWgwqgKLsZl830S5Rvb9/G7bWWcPXs/acJAHJoV4e1SPeFTWWLlwgfOp/IPLT8OstIo1MI+yMZZyDPewDq2Dp67AIADCSyazHS/XKbj89iBqAmtpHmsu5k4aUWAOQ7BLJ5/js7pwDz+wW/7wWaUUFEwE+CjVZYyzcEALbsyc5XuKl8KocmVDNfdabUgFe1RG6xc+gCwZsS4NI8Oxi8Jgj15oMUWM8MFgsyM5FjNXaiU5iQ+Cd4f92h9DxspxvXP9LizmQA6vi2KwGO/JBw6ZJTsCyJHTOXLxgg5UyrCAAWAEEReg8A0mPbkH8aL1XQwN4vAc3ATXf3ES1mDtl2AKCdqwUAgxNU5y3gg1rJNsMzp0+P60fzEQNeHTg73CXeRuoBeQXeXjILoP0d1rkULXkiEHCaAagFlKh/WZ/JOFo6O+q5Q25Q2kKA0tDDkIOeHbOwAz14h3lU9u16g0R9PCljqjl9PC5rXQp3RgDQ9sutttPtwfGsussub6ALdG25k21D8MnzyMy67I3KkdMSLtEfIx71mw0xQ2rWw3FkndDBnSi7rAIhWmgJMsvzIgB439EBPP+Zb8LqIx+Ej77rvyIAuLpBJcBHhzkAaHdcOylAi7XFyUqAdZNWykJWUPrZce+/o1L2exmBv3JacMlmKycA4ynAVe6FCbi0F/ao9JdLgMvvRQYON4f1NGDpAYjcMcowwEdnvBOd4EiusU5cTFzE/dZwiFk+a4CrD8PV1/97+Fdv/XnY/9evgH9Zr2B95XICAKrdJP9Gebz1D3XbOZvFpAJuGJwtCX8pPu/RSzOSezQbBcjW1nTvD19EeZ6tpPPWbXZc54VNBibbCLrc2h7fOqHPM+MRevqYgEqA/44CE7eRAM3i17EibjLRZu8fc7tUhGk8xF6j2NmYITS1d+0uvp1iFt85742nU7PqBhWKurmlT5j5m/Zd6EuUjYker8hWe7B/jUdlqhzI4yDDi/0a4166Kb8j8NBkAWLFZV6VMhqjy+Jzzlwo18OMbC4Bxl2p+NTW14z8S3NXH8PTT7hIqjOKvSyZ5H0enEWXsw2iKL5NKDXIAsxm3+jgUYYc8sXYP48xWATctBSbNdCMIGaAEm7pLT7jr/2+reg9MQDonON2neP85no0rMoUAMSooj525E9YeoiM5hmwvUXQjcsRU3sPPGiLAT+V+2LPzOY9zf1G5hriJvJc9Wk+Sv94KQH3HjGuEMvV6uF3fdCtmOvxNE3BFfcuJ3jGwJKxUV3D5h3VlGnQYkx7GZ8rRS0lXdio1Jkpx1SKkgZiywAr4WUw+iwy3COpHjlZAgDO3KCBgsVeIvnPoqeGVJMGkLP2ILwmPl8Yx10WTwFxGr09Rr5JUZ2Mb+z+aFq/XLcOGawtOOuDj7bE1896VkLTpvJYhuYSxuIscr8mCgiIpzDAdfwVAUAaSxNEzRa+Mox1iNn0B0DTb/B52pQ7FgF8s0VypSQqT3gKadhhRIeB5RKLWwYl0U4PsJRKk20d0tgiywEHdgoNFQaPmC7FBGDTHqULhdyMRQGm/gBn4OB4h14AP5olyf+oIHTAb2kpa6tb3UwqcelT+c5fY90nD3b12DLVY8nFWcksk4CvLgAgBZpFjst6INhQ5ZpopuMu/D41qu1IDGg6W097c7S/dT51MceWjZ5FQU7/x9vUBgAc2M7MP4hyuM18ZW2I3qw7a0FDy7e7Rxu4Bkfw6O3rsP7oR+DD//2X4PBvPgCrm9/EQKsAgNHN8iWtzL8zJTDTj+b7rQDBykoiR8XeMADI2X+l758DAMthIPVwEDu7Qp8DgPKvlAEbALBkEfgMQOkBqKXAvSm2FSAjh1fW7XQIWma3Xu8ghHlQGOmRF8LzfvY/wmOveyvcePKFcOuBB+AgaSHhZCiW/Lq/y/xPZ6w5/Wa0ajN0Z/KXH3LRf3te4qrXz/yjsfWl9R7rAf+EfIM+t95IveEA5vzrKZNnVGTUox6AVEKKloH5xtmwBRswM4C2fC/z1GQN9RgtQEB0jvGE599of+3f6M0OjGc0EwjQsT+3VEq2AQDLYGzPvbgO6XwjzZMMd+FHAgCzbH3Vm3FDk1rS8MZ1uWziQFOPPuMhBH1TDxSrLRlmAKCnQquevECo/9v6bovM1mB+Qsfhc3xCIgGu1buSHr4BRhm4UFGXTCpgJd8zHSI9S3usoZ+XgK5DjGuAnpbnu0M6EC7QCkz0ZzrEo9J/uaLopRxpbzM8kwd2deSYJ1q3cHseihlqI14hehVrLj/i9ySSnyr+EnxLRmSukSIpmqsGFRuk7zNb1Nd+4/UJ9qbGkjrKmf9BALzX4uodA6yeHwDAEqCIjl+itAXM6DqAtVcBDaMuOC9Qu07s9Ky00amYLJyKAQDxnbhBIYwQJyqG0DpS0amKS+6ZyhukSJEeAxpqDHdo5yp2K4OYeiIxQPMKZuQgVXEeOVFYXmM0dthRiQEvyY81oMEB2TJjMRqZtcnwEVMZTKLbMc8BQBnTZAe9vlyvp3fx/GSHyQCAkgFIsJ7011R62BJg1+BzzirJFa1CbjJmPDtY04u/LwIAlyiKShctGccSC2xarz/qMBLf0gZksw1bb7CvLlTMAcCuGeVn58StkjPg/6hN7JNIO8TNCW8gJmesDFfdOgDZhc637DxpGQAoN+e722b12oxV1A9KJTsmMk3B4ZnwkpX3bPd2VlVcZ7IAh0N+Ytbz79UZewAQEADErEDsm2v1AGmFwp9WA87EOurgJWsqz7TOdPy9XjMZwEj26NZoX1obPHqFHVe8bpu52jkTgWlcmvHXSurO0QbuOyoA4A1Y/81H4a9/5e1w8NfvvYcAQLsBS3oGwT50iqj8lwDA0seOT/5d0yEgkjGoCHUB9Q4Qwi4AIG9PYTag6wEoB4AIoD8sMcqyd0cas+WnmXwMeasURK/XcHi0hoNyAMoT/woe+rn/CI/95Fvh5mMvgFtX7yMAcPAQ9A/MJk6syEAAYqnSOdZkxvRqD+0ay18OAOYUEFetT595huHIdSQ9yHY+fUnrX48zfj2Bl+iPRQFyfWynp1qyrhXw41MYhG+aUMzMO6PVDABEQMJuEBm7g/OPAauraGp5y42Px+Y/y+IlIkAL3pwxAIiyO0oxnPhfxi+xS+g2/iZtSCwAiLJYD6Zj4g2PiaeSPYxfORCL8Ytu/0tP1hEAGBlxVkIuFRltnLBEVWE8z4ew9a6fyX/0313GJTtdWZ9voXs7Y3OwUFIC2foY/RgetZurqZQMT8ctI5humOFN9JMsRLp0VvEnb65yzbbpRADgcPHG9icHASdOvHnfDMCKlMaeku7xvfVLPkdh6wOAwqsajauHS7aK9Kl9v8MPmg2dua8zrKAg/Nn8FD1hWq7xeHrUlvG65Q0JKQ0AaEtslyiBMQBoi6CYmKgwaHG6bgcrZmqaq43gMWB0AKBtyizOiC6jNumNCyFvzpjHf+bxqPicvvKotLsAAN32zbMbABQ1watvUszFbGsJsOVX5tkCelekwRj6JYLYvcZL2fkDgCozBIgEALD2lPfIyzjDTpVbAAALtklEQVQLiR3QexAADPjXMVa6r4MWBUDoP/fdNA+QbwsAFgAXzVCdVzsmLTHJZhJtRBUPAVeH/fT65Ow5kNHhOAsAcOYUt04q206+cal7VS1hCOScAzPhuHsNANTpcMBUDXjrjBUA8NLBPjy2fxt2P/438NF3vxMOPvwX/39759YiVxHE8TozezHkoptNAnkRfFIDIooPiqKQJ8XLgw/q9xO8oX4HwQdBEDREE+KnULP3mZGq6uqurr6cc2Z2dnd2zkLI7syZMzN9qa7+9b+qoDn4hxSA05MT7+zJQRn7JNygHkB37ZAOs7ufApCCC108B1tTgn1e4TeCRgHAZoQgEEOAsQqwdnedrZ0KAETloyv6MePQX10EJEATUcCVXdDzVQAiABzDpBnDdPMKTO88Dzsffw43374Pezu7sLe17WB9uWMGAFgPllpEAci2PChs0l5IV4TLBAD9yluBgBcPANoVMvgPqwgAtY6KvolTSLKdl7/LK/aiAFALAuj9k4iqIGIha18NAbYzqAsA9CWyOqxO8SUMsNosQPfb0mzXbj+9NBz+61VG/EjtT8rruR95fa4pzGQVL32DeQBgvBLWbJsDSgMA7DxAcgDOH2Qmd1kPANgWAk7AMts2bs/87Lf5EOCuvVIGgGF6ue0LT2dflaQgwfCnMhIaECTrhA4TACifVKCidLz7279NjsbaQZKqddIcK9ktabm5LhsATI5s9PBKJ12sALQGOQ0v66t41EAAO+F8FYDpAiwhExoAhuTcrr387tICwDIm7zo/k09kQpgY+NsxHebK6SsAw3ghtI+5qfzbSxnzIP3nCOk8eLJ977bAxuCVARlrC8txOL4VKsQmZ1Vii1RRAPqj5nxvduIKlRPqTgCw9gWw6VVIfVt7WTUYnW1L7iOT+88jFCVBtv1JrWLa3p7+1YpM2W6LHMg5FYAGm1C4Dyr+OARYFICi7HX9KrmtDKBuEw7ZEHdaP3vSwxzsWxcAKApAbrI8ABwdHcLtyRFsPXkED3/8Bo5/+xlg/18YOwDI7FrbCOXUy9zrNFG7WexeAJCzi4U8sxEAdNaQAOAIF0aCf5wHsAFAGBhNrhkp/UYzUQCy8o9A4HRCNniKz6lKwOzPVRQ42fydLQYn00/dWi69CtcXDAGeYPGTZ67D9O4LsPvJF7Dz1rvw343nYH9ry+XsKr8D26+whgwKQN1WiykA2Q6tAgAMRrdryFoXBWDim5mDmrBfKvsHZ68ATH1csSN2PSM45kKUu87hfv7/4grAOJAyhEhz6DYDwNoB6SIAkEa+SglE7k4SEiJjb1kKQMmz3bWHwnUEZJYIAEvrtl/Nye8KBxTeN/PLNVfJrvafiViLW8HYJp/jMbaB+v4DAOznDMX+TvraxIdPxltpfmYe76kAlHEWjQmzIU4OpKKL232d+RSAIWqKUrMU9gRoj/MAUM3h5QBA6Uh9QpyQo7C/k6f8DlC2h9r3ZmdjfgBoNwFmgBQMfVCw9BvYvokvEwCkJjCjLUqqnwGAJv7cTvhFq4BdbAAoDoS4uRIWGMJ/4xMMMRh86iWnWP2X5rYNjTyvAI08pAA8PrRMAEgBoJUTzzA2AihOHESVZV0DQBkXAltLLvQqAMCS5eHvGBTS9jt2AYD1sWXnc/uCFsMSp9h2b1JT3eXgX25dix8rw9USJ/Mr0xwAUDY4wSVnUE25YRCVNAgA+Xefu4dW4TDLdYh6FwBoN1DR+M98h1w7+qntfhkAIDcEKgARAN6ZHsP2348JAB7++hPAwX/QYOjWBCvgujHvB1QMAE+RV2WnYn1DXAKAbAlJAzHahNEYlX8C/VwoMMFAvobGGP2bQIOwD3MAuqIfVELD5QTE57EACEFAN6hrObjo/RPvtKMNKRimvoAUv/tJswmz0TMAL70Gtz78DLZeeR2Od2/C0fY2TLHYS8UIShuVLymnpziddbveXqscAnwaANA6KLZIWFsRodzBQNxvLQCopYo3hxCG/UwtxM+uL7S8V3JM4l2XDQDbPm8c0RPOkmXatylU7Bw5fwDo1mpfkMb2f+xZ8AZc52F0YcASxWaMS2wO+d4zlduL2yu8h05hMY8C0O7X7Hjy+QrnMFZnAQC14t7vWlzzCPzTbarDt2VtqwHAsoKMeUGUIEIfYotPa/bEywaAiT2oAmqX47TiaFaLtBgekxsibT5s2vamhSL7Fq911oeX8dbNPp8CAMwcyPSbJu2+zvwAkFtH7E+tb3Q7Jv7T8gAgW9DgIOqF0HVOtoHjBZP9TGcoBwDYb/zh1R7o8EuTqr2lnbIK3PMG1hs79aIaAMzkNFg/AMjtLjnBJGRLFIGuV2Q5CUoVJ8zjlnbtPSeD1oPG5jxMQtzPFABKyIMehPx75JjQwuucaFOlW48n/OhjySrn20rlYktmz8VUAOpubuvyXI7BGFC1mQz7DrllV9+j9onSBY8VppLpySrYwsaoJMSsmKcoN1c0xt0fOUUCz8VQjbjWOoRRVEhKDgCSMsoV/UAVIOUAPCsAmFEE2u+c7U3VhdX2dS5wPceZcdoyQL/axpVE+NJPbSM4/zx/LtxAOYsShaLjaxAAbk1O4M7kCDYf/wUPfvhaAcAZQ8BEJXyBACDNqzgEmMOAMayefaYRFv0Y4WMMAOn6BnMDbpC6F79iyCeElY+d6g+VfVMsCILhwHEIsABAAhC1HFznDQCx70djOBlvA2zfgPG9N2D3/U9h496rcLjzLBxtbTqFSHmEUUh19WcAgG02tPT8xQeAdfhHa8kaA0Dq15YUIqsJAEX9ZxWAMh6ChyUKHF6rxJ+UA2ubr8z6Hep+zl7bA/cBAKbVjn1kRAbIUYv2UADWAKCkP1FbieS8zwLwAQD22z+kAMzwH0EYskPOFGHJA975AKBnnrKHMItX9HyriGDNASAZRCnTnhT1yEONsFV03eoVLosqAHOdYQdJlxDgntuRS6kA1ABQJ/GPwS62VMQHE4fpsocAcxU4Blq8WWPXgv9X+EPMmwrHtQrAVmvTaWCePwA0H5NCTFMMwayZ56wGAWlRGZXNCgFg0xC0CbKO1QWAEQh0TZSeuAUbJotTdwAo7yD/yyvbsFBpqOUAoFMZibMW3drNAqWQ6zSI5aKSanuNAGCfzbd1bmiKteKNNsCx2gBw+/gYbh0dQPPnA/jj+69g9vsvMD56CnCCWk69qfODLmQv1vFfvQZu94urihgp2CZhTDQfgrKPACACwRGCsJFag0YMABv3mN91zmDmoB8pA6ZTGDHOJnUgq/6CAnAVACAWP5luX4XZtdtw7dU34dr9j2Dj5Vdg//pVONoYM8CpnGkMAHCJOQCp3RcLAV6uAnAAgG1FCdqKiPVJ8k/rUa8igMsIASbdGP8TkER2VRVOUkUMEXDyMqCr//YDgCGNFoasxmuDbw+3f8bUFPL5TIWAzKKSjt9VUwCWFLqlw8EA/xjetofsp3v+kHrF5B8cFIDJGLMpefiCNq8y+FIXDgBWDqRz+yspwJT36AYAyApApULTdD4nD9VVd7jBJcRtEQBY6whjJKNNZZrEvrvr7q5cCwCoJrxpv7UHgG53EZZtztlUdHv1XPGnHylY7T0OBYqYDjlbBaD51KQOSwEgwz+P/txGnF+bA4ByV2ylDdz0XgIAGO1JbZ4T+6RacLUD1K6g6nIo0mek5QAgK2g8KzG+AefamTOR9AAAq53jcW4NcKwxANyYTqHZewq7B/sAD/+AR999CfDkdxgf7jn1HwNACiP04/YiKQB1cKGsEZzbT0JXMeSc8uJS7mTM6Idrz4iKY3Bl4DD78Lfp5Jgq5REAxBBpmzdnxQAg4svmynVodu7Cc6+9A1fe+wCaF+/B3tUrcIBglBlU8WcAgAMArJnIdVcArgUAJGc0BwAlBG9+AKjhH6FHCwC9v84VadEe+91DJTw8gJjY4boMALDm1/YOAS74kAJ1JdVF2JPE9nBQAGrr2H5gYm1pWoX9fBWAtHcs/Oi9VUCYtbzcFx8A/g/O1oac5vgs0QAAAABJRU5ErkJggg=='
\ No newline at end of file
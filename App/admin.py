@@ -1,12 +1,32 @@
 from django.contrib import admin
 
 from .models import DailyIndicators, Product, ProductQuote, Quote, Template, TemplateProduct
+from .services.invalidation import deferred_invalidation
+
+
+class DeferredInvalidationAdmin(admin.ModelAdmin):
+    """
+    Admin whose views invalidate caches once per request instead of once per
+    saved or deleted row (bulk deletes, list_editable saves, inlines).
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        with deferred_invalidation():
+            return super().changelist_view(request, extra_context)
+
+    def changeform_view(self, request, object_id=None, form_url="", extra_context=None):
+        with deferred_invalidation():
+            return super().changeform_view(request, object_id, form_url, extra_context)
+
+    def delete_view(self, request, object_id, extra_context=None):
+        with deferred_invalidation():
+            return super().delete_view(request, object_id, extra_context)
 
 
 # Register your models here.
 admin.site.register(DailyIndicators)
-admin.site.register(Product)
-admin.site.register(ProductQuote)
-admin.site.register(Quote)
+admin.site.register(Product, DeferredInvalidationAdmin)
+admin.site.register(ProductQuote, DeferredInvalidationAdmin)
+admin.site.register(Quote, DeferredInvalidationAdmin)
 admin.site.register(Template)
 admin.site.register(TemplateProduct)
@@ -7,3 +7,7 @@ class AppConfig(AppConfig):
 
     def ready(self):
         import App.signals
+
+        from django.db.backends.signals import connection_created
+        from .services.perf import install_query_wrapper
+        connection_created.connect(install_query_wrapper, dispatch_uid="perf_query_wrapper")
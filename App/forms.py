@@ -1,5 +1,7 @@
 from django import forms
 from .models import Quote, Product, ProductQuote, Template
+from .services.product_search import product_label
+from .services.session_cache import get_products
 
 from AuthUser.models import Entity, SalesRep, Client
 
@@ -77,11 +79,28 @@ class QuoteForm(forms.ModelForm):
         fields = ['client', 'salesRep', 'currency', 'total_net', 'iva', 'final']
 
 
+class ProductSelect(forms.Select):
+    """
+    Select that only renders the chosen product. The rest of the catalog is
+    loaded on demand by `product_search_view`, so a row does not carry every product.
+    """
+    placeholder = "Seleccione producto"
+
+    def optgroups(self, name, value, attrs=None):
+        selected = [pk for pk in value if pk]
+        products = get_products(int(pk) for pk in selected if str(pk).isdigit())
+
+        options = [self.create_option(name, "", self.placeholder, not products, 0, attrs=attrs)]
+        for index, product in enumerate(products.values(), start=1):
+            options.append(self.create_option(name, str(product.pk), product_label(product), True, index, attrs=attrs))
+        return [(None, options, 0)]
+
+
 class ProductQuoteForm(forms.ModelForm):
     product = forms.ModelChoiceField(
         queryset=Product.objects.all(),
         required=True,
-        widget=forms.Select(attrs={
+        widget=ProductSelect(attrs={
             'list': 'product-list',
         })
     )
@@ -0,0 +1,145 @@
+import re
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from App.models import DailyIndicators, ProductQuote
+from App.services.quote_queries import quote_list_queryset
+from AuthUser.models import SalesRep
+
+
+SQLITE_SCAN = re.compile(r"\bSCAN (?!CONSTANT ROW)(\S+)(.*)$")
+# Full-text lookups show as a scan of the virtual table with a MATCH constraint.
+SQLITE_FTS_MATCH = re.compile(r"VIRTUAL TABLE INDEX \d+:\S")
+PG_NODE = re.compile(r"(?:->\s*)?((?:Parallel )?(?:Seq Scan|Index Only Scan|Index Scan|Bitmap Index Scan))\b")
+
+
+def _sqlite_full_reads(lines):
+    reads = []
+    for line in lines:
+        match = SQLITE_SCAN.search(line)
+        if match and not SQLITE_FTS_MATCH.search(match.group(2)):
+            reads.append((line, "USING" in match.group(2)))
+    return reads
+
+
+def _postgresql_full_reads(lines):
+    reads = []
+    node = None
+    for line in lines + ["->"]:
+        if line.startswith("->") or PG_NODE.match(line):
+            if node is not None:
+                kind, text, has_cond = node
+                if kind.endswith("Seq Scan"):
+                    reads.append((text, False))
+                elif not has_cond:
+                    reads.append((text, True))
+            found = PG_NODE.match(line)
+            node = [found.group(1), line, False] if found else None
+        elif node is not None and line.startswith("Index Cond:"):
+            node[2] = True
+    return reads
+
+
+def full_reads(plan, vendor):
+    """
+    Return `(line, index_walk)` for each step of an `EXPLAIN` plan that reads a
+    whole table, or a whole index (`index_walk`) because no condition limits it.
+
+    Only lookups bounded by an index condition (`SEARCH ... (col=?)`, `Index
+    Cond:`) count as indexed.
+    """
+    lines = [line.strip() for line in plan.splitlines()]
+    if vendor == "postgresql":
+        return _postgresql_full_reads(lines)
+    if vendor == "sqlite":
+        return _sqlite_full_reads(lines)
+    return []
+
+
+def build_checks():
+    """
+    Return `(name, queryset, allowed)` for the queries behind the list and
+    filter views. `allowed` is "ordered" for unfiltered pages, which may walk
+    the ordering index and stop at the page size, and "substring" for
+    `icontains` filters, which no B-tree index can serve.
+    """
+    rep_pk = SalesRep.objects.values_list("pk", flat=True).first() or 1
+    today = date.today().isoformat()
+
+    def page(role, **params):
+        return quote_list_queryset(rep_pk, role, params)[:10]
+
+    return [
+        ("quote_list manager", page("MAN"), "ordered"),
+        ("quote_list rep", page("REP"), None),
+        ("quote_list manager status", page("MAN", status="WT"), None),
+        ("quote_list rep status", page("REP", status="WT"), None),
+        ("quote_list manager date", page("MAN", date=today), None),
+        ("quote_list rep status date", page("REP", status="AP", date=today), None),
+        ("quote_list count rep status", quote_list_queryset(rep_pk, "REP", {"status": "WT"}).values("pk"), None),
+        ("quote_list search", page("MAN", q="clinica"), None),
+        ("quote_list rep search", page("REP", q="clinica"), None),
+        ("quote_list public_id", page("MAN", public_id="2025"), "substring"),
+        ("quote_list entity", page("MAN", entity="clinica"), "substring"),
+        ("quote_list client", page("MAN", client="perez"), "substring"),
+        ("quote_list sales_rep", page("MAN", sales_rep="juan"), "substring"),
+        ("quote_products", ProductQuote.objects.filter(quote__pk=1)[:6], None),
+        ("microsoft_callback", SalesRep.objects.filter(email="user@example.com")[:1], None),
+        ("indicators", DailyIndicators.objects.filter(date__lte=today).order_by("-date")[:1], None),
+    ]
+
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN on the quote list/filter queries and flag full table or index scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help='Also fail on substring (icontains) filters',
+        )
+        parser.add_argument(
+            '--verbose-plans',
+            action='store_true',
+            help='Print the full plan of every query',
+        )
+
+    def handle(self, *args, **kwargs):
+        vendor = connection.vendor
+        if vendor not in ("sqlite", "postgresql"):
+            raise CommandError(f"Unsupported database backend: {vendor}")
+
+        failures = []
+
+        with transaction.atomic():
+            if vendor == "postgresql":
+                # Small tables are always scanned sequentially; forbidding it shows
+                # whether an index could serve the query at all. The planner then
+                # falls back to whole-index walks, which are flagged too.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for name, queryset, allowed in build_checks():
+                plan = queryset.explain()
+                reads = full_reads(plan, vendor)
+                if allowed == "ordered":
+                    reads = [(line, index_walk) for line, index_walk in reads if not index_walk]
+                scans = [line for line, _ in reads]
+
+                if kwargs["verbose_plans"]:
+                    self.stdout.write(f"{name}:\n{plan}\n")
+
+                if not scans:
+                    self.stdout.write(self.style.SUCCESS(f"OK    {name}"))
+                elif allowed == "substring" and not kwargs["strict"]:
+                    self.stdout.write(self.style.WARNING(f"SCAN  {name} (substring filter): {'; '.join(scans)}"))
+                else:
+                    self.stdout.write(self.style.ERROR(f"SCAN  {name}: {'; '.join(scans)}"))
+                    failures.append(name)
+
+        if failures:
+            raise CommandError(f"Full scans in: {', '.join(failures)}")
+
+        self.stdout.write(self.style.SUCCESS("No unexpected full scans."))
@@ -1,32 +1,76 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from ...models import DailyIndicators
+from ...services.indicators import invalidate_indicators
+from ...services.indicator_sources import get_source
 
 import requests
 from datetime import date
 
 
 class Command(BaseCommand):
-    help = "Fetch daily UF and Dólar observado from mindicador.cl"
+    help = (
+        "Fetch daily UF and Dólar observado from mindicador.cl (or a JSON file) "
+        "and save the days missing between --from and --to (default: today)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from',
+            dest='start',
+            type=date.fromisoformat,
+            help='First day to backfill, YYYY-MM-DD (default: --to)',
+        )
+        parser.add_argument(
+            '--to',
+            dest='end',
+            type=date.fromisoformat,
+            help='Last day to backfill, YYYY-MM-DD (default: today)',
+        )
+        parser.add_argument(
+            '--source',
+            default='mindicador',
+            help='"mindicador" or the path to a JSON file with the mindicador.cl uf and dolar series',
+        )
 
     def handle(self, *args, **kwargs):
-        today = date.today()
-        if DailyIndicators.objects.filter(date=today).exists():
-            self.stdout.write("Indicators for today already exist.")
+        end = kwargs['end'] or date.today()
+        start = kwargs['start'] or end
+        if start > end:
+            raise CommandError("--from must not be after --to.")
+
+        existing = set(
+            DailyIndicators.objects
+            .filter(date__range=(start, end))
+            .values_list('date', flat=True)
+        )
+        if len(existing) == (end - start).days + 1:
+            self.stdout.write("Indicators for today already exist." if start == end == date.today()
+                              else "Indicators for the whole range already exist.")
             return
 
-        response = requests.get("https://mindicador.cl/api")
-        if response.status_code != 200:
-            self.stderr.write("Failed to fetch indicators.")
+        try:
+            source = get_source(kwargs['source'])
+            values = source.fetch(start, end)
+        except (ValueError, OSError, requests.RequestException) as e:
+            self.stderr.write(f"Failed to fetch indicators: {e}")
             return
 
-        data = response.json()
-        uf = data['uf']['valor']
-        dolar = data['dolar']['valor']
+        rows = [
+            DailyIndicators(date=day, uf=value['uf'], dolar=value['dolar'])
+            for day, value in sorted(values.items())
+            if day not in existing
+        ]
+        # One INSERT; ignore_conflicts covers a concurrent run saving the same days.
+        DailyIndicators.objects.bulk_create(rows, ignore_conflicts=True)
+        if rows:
+            # bulk_create skips post_save, which normally invalidates the memoized rows.
+            invalidate_indicators(rows[0].date)
 
-        DailyIndicators.objects.create(
-            date=today,
-            uf=uf,
-            dolar=dolar
-        )
+        if len(rows) == 1:
+            self.stdout.write(f"Saved indicators for {rows[0].date}: UF={rows[0].uf}, USD={rows[0].dolar}")
+        else:
+            self.stdout.write(f"Saved indicators for {len(rows)} days between {start} and {end}.")
 
-        self.stdout.write(f"Saved indicators: UF={uf}, USD={dolar}")
+        missing = (end - start).days + 1 - len(existing) - len(rows)
+        if missing:
+            self.stderr.write(f"{missing} days have no published values in the source.")
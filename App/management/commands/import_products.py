@@ -1,11 +1,105 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from App.models import Product
-import pandas as pd
+from App.signals import clear_product_cache
+from App.services.invalidation import deferred_invalidation
+from decimal import Decimal, InvalidOperation
+from openpyxl import load_workbook
 import random
 import os
+import re
+import time
+
+
+# Accepted header names per Product field, compared lowercased.
+COLUMNS = {
+    'code': ('item', 'code', 'codigo', 'código'),
+    'material_number': ('mat', 'material', 'material_number'),
+    'description': ('des', 'description', 'descripcion', 'descripción'),
+    'price': ('price', 'precio', 'precio lista', 'list price'),
+}
+
+
+def column_map(header, price_column=None):
+    """
+    Return `{field: column index}` for a header row. Files without a recognized
+    code column are read positionally as code, material number, description.
+    """
+    names = [str(name).strip().lower() if name is not None else "" for name in header]
+    columns = {}
+    for field, aliases in COLUMNS.items():
+        if field == 'price' and price_column:
+            aliases = (price_column.strip().lower(),)
+        for alias in aliases:
+            if alias in names:
+                columns[field] = names.index(alias)
+                break
+
+    if price_column and 'price' not in columns:
+        raise CommandError(f"Price column not found: {price_column}")
+    if 'code' not in columns:
+        columns.update(code=0, material_number=1, description=2)
+    return columns
+
+
+def parse_price(value):
+    """
+    Return a price as a whole number, or None when the cell is blank or invalid.
+    Text uses the Chilean format: "." groups thousands and "," marks decimals.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = re.sub(r"[^\d,.-]", "", value).replace(".", "").replace(",", ".")
+    try:
+        price = Decimal(str(value)).to_integral_value()
+    except InvalidOperation:
+        return None
+    return int(price) if price >= 0 else None
+
+
+def read_products(file_path, price_column=None):
+    """
+    Yield a dict per row of the first sheet with `code`, `material_number`,
+    `description` and, when the file has a price column, `price`. Rows are
+    streamed in read-only mode; the first row is the header.
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = column_map(header, price_column)
+
+        for row in rows:
+            def cell(field):
+                index = columns.get(field)
+                return row[index] if index is not None and index < len(row) else None
+
+            code = str(cell('code') or "").strip()[:255]
+            if not code:
+                continue
+            material_number = cell('material_number')
+            material_number = str(material_number).strip()[:255] if material_number is not None else None
+
+            product = {
+                'code': code,
+                'material_number': material_number,
+                'description': str(cell('description') or "").strip()[:255],
+            }
+            if 'price' in columns:
+                product['price'] = parse_price(cell('price'))
+            yield product
+    finally:
+        workbook.close()
+
 
 class Command(BaseCommand):
-    help = "Import products from Excel and create Product entries"
+    help = (
+        "Sync products from Excel: insert new codes and update the ones whose "
+        "material number, description or (when the file has a price column) price changed"
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -14,28 +108,105 @@ class Command(BaseCommand):
             help='Path to Excel file (e.g., src/list.xlsx)',
             required=True
         )
+        parser.add_argument(
+            '--price-column',
+            type=str,
+            help='Header of the price column, when it is not one of: ' + ', '.join(COLUMNS['price']),
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Print the changes without writing them',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows per INSERT ... ON CONFLICT statement',
+        )
 
     def handle(self, *args, **kwargs):
         file_path = kwargs['file']
-        
+        batch_size = kwargs['batch_size']
+        dry_run = kwargs['dry_run']
+        verbose = dry_run or kwargs['verbosity'] > 1
+
         if not os.path.exists(file_path):
-            self.stderr.write(self.style.ERROR(f"File not found: {file_path}"))
-            return
+            raise CommandError(f"File not found: {file_path}")
+
+        started = time.perf_counter()
+
+        # One query for the whole catalog; the diff is computed in memory.
+        existing = {
+            code: {'material_number': material_number, 'description': description, 'price': price}
+            for code, material_number, description, price
+            in Product.objects.values_list('code', 'material_number', 'description', 'price')
+        }
+
+        read = inserted = updated = unchanged = invalid = 0
+        seen = set()
+        changes = []
+        has_prices = False
 
-        df = pd.read_excel(file_path)
-
-        created = 0
-        for row in df.itertuples(index=False):
-            Product.objects.get_or_create(
-                code=list(row)[0],
-                defaults={
-                    'code': list(row)[0],
-                    'material_number': list(row)[1],
-                    'description': list(row)[2][:255],
-                    'price': random.randrange(5000, 50000)
-                }
-            )
-            created += 1
-            print(f"Row for {list(row)[0]}, {list(row)[1]}, {len(list(row)[2])}  created")
-
-        self.stdout.write(self.style.SUCCESS(f"Successfully imported {created} products."))
+        for row in read_products(file_path, kwargs['price_column']):
+            read += 1
+            code = row.pop('code')
+            if code in seen:
+                continue
+            seen.add(code)
+
+            current = existing.get(code)
+
+            if 'price' in row:
+                has_prices = True
+                if row['price'] is None:
+                    if current is None:
+                        invalid += 1
+                        if verbose:
+                            self.stdout.write(self.style.WARNING(f"! {code}: missing or invalid price, skipped"))
+                        continue
+                    # Blank price cell: keep the current one.
+                    row['price'] = current['price']
+
+            if current is None:
+                inserted += 1
+                row.setdefault('price', random.randrange(5000, 50000))
+                changes.append(Product(code=code, **row))
+                if verbose:
+                    self.stdout.write(f"+ {code}: {row['description']}" + (f" ({row['price']})" if has_prices else ""))
+                continue
+
+            diff = {field: (current[field], value) for field, value in row.items() if current[field] != value}
+            if not diff:
+                unchanged += 1
+                continue
+
+            updated += 1
+            changes.append(Product(code=code, **{**current, **row}))
+            if verbose:
+                self.stdout.write(f"~ {code}: " + "; ".join(f"{field} {old!r} -> {new!r}" for field, (old, new) in diff.items()))
+
+        if not dry_run and changes:
+            update_fields = ['material_number', 'description'] + (['price'] if has_prices else [])
+            with deferred_invalidation(), transaction.atomic():
+                for start in range(0, len(changes), batch_size):
+                    Product.objects.bulk_create(
+                        changes[start:start + batch_size],
+                        update_conflicts=True,
+                        unique_fields=['code'],
+                        update_fields=update_fields,
+                    )
+                # bulk_create skips the per-row signals: invalidate the catalog once.
+                clear_product_cache(Product)
+
+        missing = len(existing.keys() - seen)
+        elapsed = time.perf_counter() - started
+        summary = (
+            f"{'Dry run: ' if dry_run else ''}Read {read} rows in {elapsed:.2f}s "
+            f"({read / elapsed if elapsed else 0:.0f} rows/s): {inserted} inserted, {updated} updated, "
+            f"{unchanged} unchanged, {invalid} invalid, {read - len(seen)} duplicate codes skipped, "
+            f"{missing} products not in the file (kept)."
+        )
+        if not has_prices:
+            summary += " No price column: existing prices kept, new products got placeholder prices."
+        self.stdout.write(self.style.SUCCESS(summary))
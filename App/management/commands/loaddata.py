@@ -0,0 +1,14 @@
+from django.core.management.commands.loaddata import Command as LoadDataCommand
+
+from App.services.invalidation import deferred_invalidation
+
+
+class Command(LoadDataCommand):
+    """
+    Django's `loaddata`, invalidating the product and quote caches once for
+    the whole fixture instead of once per object.
+    """
+
+    def handle(self, *fixture_labels, **options):
+        with deferred_invalidation(using=options["database"]):
+            return super().handle(*fixture_labels, **options)
@@ -0,0 +1,67 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+
+from .services.metrics import publish
+from .services.perf import astream_request, end_request, finish_request, server_timing, start_request, stream_request
+
+
+class PerformanceMiddleware:
+    """
+    Measure each request: wall time, query count and time, cache hits and
+    misses, and template render time.
+
+    Totals and latency histograms are kept per URL name (see `perf_stats()`),
+    requests over their `PERF_BUDGETS` entry are logged with their slowest SQL,
+    and the numbers are sent back in a `Server-Timing` header when
+    `PERF_SERVER_TIMING` is on. Streaming responses are timed until their body
+    has been sent, so they get no header. The worker's totals are published
+    for `/metrics` every few seconds. Works under WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        stats, token = start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+        return self._finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats, token = start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+        return self._finish(request, response, stats)
+
+    def _finish(self, request, response, stats):
+        match = request.resolver_match
+        view = match.view_name if match else "<unresolved>"
+
+        # Files handed to the server's sendfile are plain I/O, not app work.
+        if response.streaming and getattr(response, "file_to_stream", None) is None:
+            stream = astream_request if response.is_async else stream_request
+            response.streaming_content = stream(stats, response.streaming_content, lambda: self._record(view, stats))
+            return response
+
+        total_ms = self._record(view, stats)
+        if settings.PERF_SERVER_TIMING:
+            response["Server-Timing"] = server_timing(stats, total_ms)
+        return response
+
+    def _record(self, view, stats):
+        total_ms = finish_request(view, stats)
+        publish()
+        return total_ms
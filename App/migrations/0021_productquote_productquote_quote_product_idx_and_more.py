@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0020_quote_public_id'),
+        ('AuthUser', '0005_rename_first_name_client_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productquote',
+            index=models.Index(fields=['quote', 'product'], name='productquote_quote_product_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quote',
+            index=models.Index(fields=['salesRep', 'status', 'date'], name='quote_rep_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quote',
+            index=models.Index(fields=['status', 'date'], name='quote_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quote',
+            index=models.Index(fields=['date', 'id'], name='quote_date_id_idx'),
+        ),
+    ]
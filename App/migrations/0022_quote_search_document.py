@@ -0,0 +1,119 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:09
+
+import unicodedata
+
+from django.db import DatabaseError, OperationalError, migrations, models, transaction
+
+
+# Frozen copies of App.services.search as of this migration, so later changes
+# to the app code cannot change what it does.
+SQLITE_TABLE = 'App_quote_search'
+TRIGRAM_INDEX = 'quote_search_trgm_idx'
+
+SQLITE_SETUP = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} USING fts5(
+        search_document, content='App_quote', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_TABLE}_ai AFTER INSERT ON App_quote BEGIN
+        INSERT INTO {SQLITE_TABLE}(rowid, search_document) VALUES (new.id, new.search_document);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_TABLE}_ad AFTER DELETE ON App_quote BEGIN
+        INSERT INTO {SQLITE_TABLE}({SQLITE_TABLE}, rowid, search_document) VALUES ('delete', old.id, old.search_document);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_TABLE}_au AFTER UPDATE OF search_document ON App_quote BEGIN
+        INSERT INTO {SQLITE_TABLE}({SQLITE_TABLE}, rowid, search_document) VALUES ('delete', old.id, old.search_document);
+        INSERT INTO {SQLITE_TABLE}(rowid, search_document) VALUES (new.id, new.search_document);
+    END
+    """,
+]
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    return ''.join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def build_search_document(*parts):
+    return normalize(' '.join(str(part) for part in parts if part))
+
+
+def fill_search_documents(apps, schema_editor):
+    Quote = apps.get_model('App', 'Quote')
+    quotes = Quote.objects.using(schema_editor.connection.alias).select_related('client__entity', 'salesRep')
+
+    batch = []
+    for quote in quotes.iterator(chunk_size=500):
+        quote.search_document = build_search_document(
+            quote.public_id,
+            quote.client.entity.name,
+            quote.client.name,
+            quote.salesRep.first_name,
+            quote.salesRep.last_name,
+        )
+        batch.append(quote)
+        if len(batch) >= 500:
+            Quote.objects.bulk_update(batch, ['search_document'])
+            batch = []
+    Quote.objects.bulk_update(batch, ['search_document'])
+
+
+def create_search_index(apps, schema_editor):
+    """
+    pg_trgm is a prerequisite on PostgreSQL. Without the privilege to create
+    it the index is skipped; the post-migrate hook retries and logs why.
+    """
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            try:
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            except DatabaseError:
+                return
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX} ON "App_quote" '
+                f'USING gin (search_document gin_trgm_ops)'
+            )
+        elif connection.vendor == 'sqlite':
+            try:
+                for statement in SQLITE_SETUP:
+                    cursor.execute(statement)
+                cursor.execute(f"INSERT INTO {SQLITE_TABLE}({SQLITE_TABLE}) VALUES ('rebuild')")
+            except OperationalError:
+                # SQLite built without FTS5/trigram, searches fall back to a scan.
+                pass
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'DROP INDEX IF EXISTS {TRIGRAM_INDEX}')
+        elif connection.vendor == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                cursor.execute(f'DROP TRIGGER IF EXISTS {SQLITE_TABLE}_{suffix}')
+            cursor.execute(f'DROP TABLE IF EXISTS {SQLITE_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0021_productquote_productquote_quote_product_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quote',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_documents, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
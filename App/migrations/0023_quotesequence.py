@@ -0,0 +1,40 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:14
+
+from django.db import migrations, models
+
+
+def seed_sequences(apps, schema_editor):
+    """
+    Continue each year's numbering after the highest `public_id` already issued.
+    """
+    Quote = apps.get_model('App', 'Quote')
+    QuoteSequence = apps.get_model('App', 'QuoteSequence')
+    alias = schema_editor.connection.alias
+
+    last_values = {}
+    for public_id in Quote.objects.using(alias).exclude(public_id=None).values_list('public_id', flat=True).iterator():
+        year, _, number = public_id.partition('-')
+        if year.isdigit() and number.isdigit():
+            last_values[int(year)] = max(last_values.get(int(year), 0), int(number))
+
+    QuoteSequence.objects.using(alias).bulk_create(
+        QuoteSequence(year=year, last_value=last_value) for year, last_value in last_values.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0022_quote_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteSequence',
+            fields=[
+                ('year', models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:41
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_dates(apps, schema_editor):
+    """
+    Existing quotes only know the day they were last saved; use it.
+    """
+    Quote = apps.get_model('App', 'Quote')
+    Quote.objects.using(schema_editor.connection.alias).update(priced_on=F('date'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('App', '0023_quotesequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quote',
+            name='priced_on',
+            field=models.DateField(default=django.utils.timezone.localdate, editable=False, verbose_name='Fecha de precios'),
+        ),
+        migrations.RunPython(copy_dates, migrations.RunPython.noop),
+    ]
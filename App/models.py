@@ -1,8 +1,10 @@
-from django.db import models
+from django.db import IntegrityError, models, router, transaction
 from django.utils import timezone
 
 from AuthUser.models import Client, SalesRep
 
+from .services.search import quote_search_document
+
 
 # Create your models here.
 
@@ -25,6 +27,37 @@ class Product(models.Model):
         return f"{self.code[:20]}: {self.description[:40]}..."
 
 
+class QuoteSequence(models.Model):
+    """
+    Last `public_id` number handed out per year.
+    """
+    year = models.PositiveIntegerField(primary_key=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def allocate(cls, year, using=None):
+        """
+        Return the next number of `year`.
+
+        The `UPDATE` locks the year's row until the surrounding transaction
+        ends, so concurrent creations queue up and numbers stay gap-free as
+        long as the caller inserts in that same transaction.
+        """
+        manager = cls.objects.db_manager(using)
+        while not manager.filter(year=year).update(last_value=models.F("last_value") + 1):
+            try:
+                with transaction.atomic(using=manager.db):
+                    manager.create(year=year, last_value=1)
+                return 1
+            except IntegrityError:
+                # Another request created the row first, increment it instead.
+                continue
+        return manager.filter(year=year).values_list("last_value", flat=True).get()
+
+    def __str__(self):
+        return f"{self.year}: {self.last_value}"
+
+
 class Quote(models.Model):
     status_choices = [
         ("AP", "Aprobada"),
@@ -41,6 +74,8 @@ class Quote(models.Model):
     salesRep = models.ForeignKey("AuthUser.SalesRep", verbose_name="Rep. Ventas", on_delete=models.CASCADE, related_name='sales_rep')
     status = models.CharField("Estado", max_length=50, choices=status_choices, default="WT")
     date = models.DateField("Fecha", auto_now=True)
+    # Day whose exchange rates price the lines; unlike `date`, kept on edits.
+    priced_on = models.DateField("Fecha de precios", default=timezone.localdate, editable=False)
     approved_by = models.ForeignKey("AuthUser.SalesRep", verbose_name="Aprobador", on_delete=models.CASCADE, default=1, related_name='manager')
     currency = models.CharField("Moneda", max_length=50, choices=currency_choices, default="USD")
     
@@ -50,14 +85,47 @@ class Quote(models.Model):
 
     public_id = models.CharField(max_length=20, unique=True, blank=True, null=True)
 
+    # Normalized "public_id entity client rep" text behind the list search box,
+    # indexed for substring matches (see App.services.search).
+    search_document = models.TextField(default="", blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["salesRep", "status", "date"], name="quote_rep_status_date_idx"),
+            models.Index(fields=["status", "date"], name="quote_status_date_idx"),
+            models.Index(fields=["date", "id"], name="quote_date_id_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._search_state = instance._search_key()
+        return instance
+
+    def _search_key(self):
+        return tuple(self.__dict__.get(name) for name in ("public_id", "client_id", "salesRep_id"))
+
     def save(self, *args, **kwargs):
-        is_new = self.pk is None
+        if self.pk is None and not self.public_id:
+            # Numbered before the insert, in the same transaction as the
+            # sequence row lock, so a new quote is written once.
+            using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+            with transaction.atomic(using=using, savepoint=False):
+                year = timezone.now().year
+                self.public_id = f"{year}-{QuoteSequence.allocate(year, using):04d}"
+                self._save(*args, **kwargs)
+        else:
+            self._save(*args, **kwargs)
+
+    def _save(self, *args, **kwargs):
+        if not self.search_document or self._search_key() != getattr(self, "_search_state", None):
+            self.search_document = quote_search_document(self)
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "search_document"}
 
         super().save(*args, **kwargs)
 
-        if is_new and not self.public_id:
-            self.public_id = f"{timezone.now().year}-{self.pk:04d}"
-            super().save(update_fields=["public_id"])
+        self._search_state = self._search_key()
     
 
     @property
@@ -100,6 +168,11 @@ class ProductQuote(models.Model):
     quantity = models.PositiveIntegerField("Cantidad", default=1)
     subtotal = models.DecimalField("Subtotal", max_digits=20, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["quote", "product"], name="productquote_quote_product_idx"),
+        ]
+
     def __str__(self):
         return f"{self.product.code}: {self.product.description}"
     
@@ -0,0 +1,125 @@
+import secrets, threading
+from collections import Counter
+
+from django.core.cache import cache
+
+from .perf import record_cache
+
+
+MANAGER_ROLES = ("MAN", "ADM")
+PRODUCTS_NAMESPACE = "products"
+MANAGER_QUOTES_NAMESPACE = "quotes:managers"
+
+_lock = threading.Lock()
+_stats = Counter()
+_local = {}
+
+
+def quotes_namespace(pk=None, role="REP"):
+    """
+    Return the namespace holding the quote lists visible to a user.
+
+    Managers and administrators share one namespace, each sales rep has their own.
+    """
+    if role in MANAGER_ROLES:
+        return MANAGER_QUOTES_NAMESPACE
+    return f"quotes:rep:{pk}"
+
+
+def _version_key(namespace):
+    return f"ns:{namespace}"
+
+
+def _new_version():
+    return secrets.token_hex(4)
+
+
+def namespace_version(namespace):
+    """
+    Return the current version token of `namespace`.
+
+    Versions are random rather than counters: the file cache culls entries at
+    random once it is full, and a counter restarting at 1 after its key was
+    culled would make old entries of that namespace valid again.
+    """
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), _new_version(), timeout=None)
+        # Another worker may have won the race; use whichever token is stored.
+        version = cache.get(_version_key(namespace)) or _new_version()
+    return version
+
+
+def versioned_key(namespace, key):
+    return f"{namespace}:v{namespace_version(namespace)}:{key}"
+
+
+def bump_namespace(*namespaces):
+    """
+    Invalidate every key stored under the given namespaces.
+
+    Old entries are not deleted, they simply stop being addressed and expire
+    on their own timeout or are culled.
+    """
+    for namespace in namespaces:
+        cache.set(_version_key(namespace), _new_version(), timeout=None)
+
+
+def record(namespace, hit):
+    name = namespace.split(":", 1)[0]
+    with _lock:
+        _stats[(name, "hits" if hit else "misses")] += 1
+    record_cache(hit)
+
+
+def get_cached(namespace, key, loader, timeout=None, refresh=False, local=False):
+    """
+    Return the value stored under `key` in `namespace`, loading and storing it on a miss.
+
+    Args:
+        namespace (str): The namespace, e.g. `PRODUCTS_NAMESPACE` or `quotes_namespace()`.
+        key (str): The key inside the namespace.
+        loader (callable): Builds the value on a miss.
+        timeout (int, optional): Cache timeout in seconds, None to never expire.
+        refresh (bool): Ignore the cached value and reload it.
+        local (bool): Also keep the value in this process until the namespace
+            version changes, skipping the shared cache read and unpickling.
+
+    Returns:
+        The cached or freshly loaded value.
+    """
+    full_key = versioned_key(namespace, key)
+
+    if local and not refresh:
+        entry = _local.get((namespace, key))
+        if entry is not None and entry[0] == full_key:
+            record(namespace, True)
+            return entry[1]
+
+    value = None if refresh else cache.get(full_key)
+    record(namespace, value is not None)
+
+    if value is None:
+        value = loader()
+        cache.set(full_key, value, timeout=timeout)
+
+    if local:
+        with _lock:
+            _local[(namespace, key)] = (full_key, value)
+    return value
+
+
+def cache_stats():
+    """
+    Return the hit/miss counters of this process, grouped by namespace.
+    """
+    with _lock:
+        snapshot = dict(_stats)
+
+    stats = {}
+    for (name, kind), count in snapshot.items():
+        stats.setdefault(name, {"hits": 0, "misses": 0})[kind] = count
+    for values in stats.values():
+        total = values["hits"] + values["misses"]
+        values["hit_ratio"] = round(values["hits"] / total, 4) if total else None
+    return stats
@@ -0,0 +1,116 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from .session_cache import generate_temp_id
+
+
+DRAFT_TTL = 60 * 60 * 4
+DRAFT_HEADER = "X-Draft-Id"
+
+
+def _owner(request):
+    session = request.session
+    if not session.session_key:
+        session.save()
+    return session.session_key
+
+
+def get_draft_id(request):
+    """
+    Return the draft id sent by the quote editor, either through the
+    `X-Draft-Id` header (set with `hx-headers` on the editor) or a `draft` parameter.
+    """
+    draft = request.headers.get(DRAFT_HEADER) or request.GET.get("draft") or request.POST.get("draft")
+    if draft and draft.isalnum():
+        return draft
+    return "default"
+
+
+def _key(request, name, draft=None):
+    return f"draft:{_owner(request)}:{draft or get_draft_id(request)}:{name}"
+
+
+def _row_keys(request, last_index, draft=None):
+    return [_key(request, f"row:{index}", draft) for index in range(last_index + 1)]
+
+
+def new_draft(request, lines=0):
+    """
+    Start a new draft for the current session and return its id.
+
+    `lines` is the number of rows already rendered by the editor (indexes
+    `0..lines-1`), so newly added rows continue from there. Every key of the
+    draft expires after `DRAFT_TTL` seconds without activity.
+    """
+    draft = generate_temp_id()
+    cache.set_many(
+        {
+            _key(request, "next_index", draft): lines,
+            **{key: True for key in _row_keys(request, lines - 1, draft)},
+        },
+        timeout=DRAFT_TTL,
+    )
+    return draft
+
+
+def allocate_line(request):
+    """
+    Reserve a new row index in the current draft.
+
+    Each row is claimed with `cache.add`, retrying with the next index when
+    another request took it, so concurrent "add product" clicks never share a
+    row. `add` is atomic on Redis, Memcached and the local-memory cache; the
+    file cache checks and writes separately, so two workers racing on the
+    same draft could still collide there.
+
+    Returns:
+        tuple[int, int]: The new row index and the number of rows in the draft.
+    """
+    next_key = _key(request, "next_index")
+    index = cache.get(next_key, 0)
+    while not cache.add(_key(request, f"row:{index}"), True, timeout=DRAFT_TTL):
+        index += 1
+    cache.set(next_key, index + 1, timeout=DRAFT_TTL)
+    rows = len(cache.get_many(_row_keys(request, index)))
+    return index, rows
+
+
+def release_line(request, index):
+    """
+    Drop a row from the current draft, removing its subtotal from the totals.
+    """
+    if index is None:
+        return
+
+    cache.delete_many([_key(request, f"line:{index}"), _key(request, f"row:{index}")])
+
+
+def set_line_subtotal(request, index, subtotal):
+    cache.set(_key(request, f"line:{index}"), Decimal(subtotal), timeout=DRAFT_TTL)
+
+
+def remove_line_subtotal(request, index):
+    cache.delete(_key(request, f"line:{index}"))
+
+
+def line_subtotals(request):
+    """
+    Return the subtotal of every priced row of the current draft, keyed by row index.
+    """
+    last_index = cache.get(_key(request, "next_index"), 0)
+    keys = {_key(request, f"line:{index}"): index for index in range(last_index + 1)}
+    values = cache.get_many(keys)
+    return {keys[key]: value for key, value in values.items()}
+
+
+def discard_draft(request):
+    """
+    Delete every key of the current draft once the quote has been saved.
+    """
+    last_index = cache.get(_key(request, "next_index"), 0)
+    cache.delete_many(
+        [_key(request, f"line:{index}") for index in range(last_index + 1)]
+        + _row_keys(request, last_index)
+        + [_key(request, "next_index")]
+    )
@@ -0,0 +1,91 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+import requests
+
+
+MINDICADOR_URL = "https://mindicador.cl/api"
+INDICATORS = ("uf", "dolar")
+
+
+def _parse_series(payload):
+    """
+    Return `{date: Decimal}` from a mindicador.cl series, either the full
+    response (`{"serie": [...]}`) or the bare list of `{"fecha", "valor"}`.
+    """
+    if isinstance(payload, dict):
+        payload = payload.get("serie", [])
+    return {
+        date.fromisoformat(point["fecha"][:10]): Decimal(str(point["valor"]))
+        for point in payload
+    }
+
+
+def merge_series(series, start, end):
+    """
+    Return `{date: {"uf": Decimal, "dolar": Decimal}}` for the days between
+    `start` and `end` (inclusive) that have a value for every indicator.
+
+    The dólar observado is not published on weekends and holidays: those days
+    carry the last published value, as the Banco Central does.
+    """
+    days = sorted(set().union(*(values.keys() for values in series.values())))
+    last = {}
+    rows = {}
+    for day in days:
+        for name in INDICATORS:
+            if day in series[name]:
+                last[name] = series[name][day]
+        if start <= day <= end and len(last) == len(INDICATORS):
+            rows[day] = dict(last)
+    return rows
+
+
+class MindicadorSource:
+    """
+    Daily values from the mindicador.cl API, one request per indicator and year.
+    """
+
+    def __init__(self, url=MINDICADOR_URL, timeout=10):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def fetch(self, start, end):
+        series = {name: {} for name in INDICATORS}
+        with requests.Session() as session:
+            for name in INDICATORS:
+                for year in range(start.year, end.year + 1):
+                    response = session.get(f"{self.url}/{name}/{year}", timeout=self.timeout)
+                    response.raise_for_status()
+                    series[name].update(_parse_series(response.json()))
+        return merge_series(series, start, end)
+
+
+class JsonFileSource:
+    """
+    Daily values from a local JSON file, to backfill without network access.
+
+    The file maps each indicator to its mindicador.cl series:
+    `{"uf": {"serie": [{"fecha": "2025-01-02T03:00:00.000Z", "valor": 38419.17}, ...]}, "dolar": {...}}`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def fetch(self, start, end):
+        with open(self.path, encoding="utf-8") as file:
+            data = json.load(file)
+        series = {name: _parse_series(data.get(name, [])) for name in INDICATORS}
+        return merge_series(series, start, end)
+
+
+def get_source(name):
+    """
+    Return the source for `name`: "mindicador" or the path to a JSON file.
+    """
+    if name == "mindicador":
+        return MindicadorSource()
+    if name.endswith(".json"):
+        return JsonFileSource(name)
+    raise ValueError(f"Unknown indicators source: {name}")
@@ -0,0 +1,149 @@
+import threading, time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+from ..models import DailyIndicators
+
+from .cache_versions import bump_namespace, namespace_version, record
+
+
+INDICATORS_NAMESPACE = "indicators"
+MISS_TTL = 60 * 5
+MAX_ENTRIES = 512
+# Seconds between two reads of the shared generation; a bump made by another
+# worker is picked up at most this late.
+GENERATION_CHECK_INTERVAL = 5
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_memo = OrderedDict()
+_generation = None
+_checked_at = None
+
+
+def _sync_generation():
+    """
+    Drop every memoized entry when another process bumped the shared
+    generation, checked at most every `GENERATION_CHECK_INTERVAL` seconds.
+    """
+    global _generation, _checked_at
+    now = time.monotonic()
+    if _checked_at is not None and now - _checked_at < GENERATION_CHECK_INTERVAL:
+        return
+    _checked_at = now
+    generation = namespace_version(INDICATORS_NAMESPACE)
+    if generation != _generation:
+        with _lock:
+            _memo.clear()
+            _generation = generation
+
+
+def _load(day):
+    return (
+        DailyIndicators.objects
+        .filter(date__lte=day)
+        .order_by("-date")
+        .first()
+    )
+
+
+def get_indicators(day=None):
+    """
+    Return the `DailyIndicators` row that applies to `day` (defaults to today).
+
+    Rows are memoized per date for the lifetime of the process, keeping the
+    `MAX_ENTRIES` most recently used dates. When the exact
+    date is missing, the most recent prior row is used instead, and that
+    fallback (or the absence of any row) is remembered for `MISS_TTL` seconds
+    so a late `fetch_daily_indicators` run is still picked up.
+
+    Args:
+        day (date, optional): The date to price at.
+
+    Returns:
+        DailyIndicators | None: The applicable indicators, or None if there are none.
+    """
+    day = day or date.today()
+    if isinstance(day, datetime):
+        day = day.date()
+    _sync_generation()
+
+    now = time.monotonic()
+    entry = _memo.get(day)
+    if entry is not None:
+        value, expires_at = entry
+        if expires_at is None or expires_at > now:
+            with _lock:
+                if day in _memo:
+                    _memo.move_to_end(day)
+            record("indicators", hit=True)
+            return None if value is _MISSING else value
+
+    record("indicators", hit=False)
+
+    indicators = _load(day)
+
+    if indicators is not None and indicators.date == day:
+        entry = (indicators, None)
+    else:
+        entry = (indicators if indicators is not None else _MISSING, now + MISS_TTL)
+
+    with _lock:
+        _memo[day] = entry
+        _memo.move_to_end(day)
+        while len(_memo) > MAX_ENTRIES:
+            _memo.popitem(last=False)
+
+    return indicators
+
+
+class Rates(NamedTuple):
+    date: date
+    uf: Decimal
+    dolar: Decimal
+
+
+def rate_for(day=None):
+    """
+    Return the UF and dólar values to price at on `day` (defaults to today).
+
+    Backed by the `get_indicators` memo, so pricing every line of a quote at
+    the quote's date reads the database once per date, not once per line.
+
+    Args:
+        day (date, optional): The date to price at.
+
+    Returns:
+        Rates: The date of the applicable indicators and their values.
+
+    Raises:
+        ValueError: If there are no indicators on or before `day`.
+    """
+    indicators = get_indicators(day)
+    if indicators is None:
+        raise ValueError("Indicators not found. Please ensure `fetch_daily_indicators` has run at least once.")
+    return Rates(indicators.date, Decimal(indicators.uf), Decimal(indicators.dolar))
+
+
+def invalidate_indicators(day=None):
+    """
+    Forget memoized indicators so the next lookup reads the database again.
+
+    Entries on or after `day` are dropped locally (a new row can become the
+    fallback for later dates), and the shared generation is bumped so other
+    worker processes drop theirs too. Without `day` everything is dropped.
+    """
+    global _generation, _checked_at
+    with _lock:
+        if day is None:
+            _memo.clear()
+        else:
+            for key in [key for key in _memo if key >= day]:
+                _memo.pop(key, None)
+
+    bump_namespace(INDICATORS_NAMESPACE)
+    _generation = namespace_version(INDICATORS_NAMESPACE)
+    _checked_at = time.monotonic()
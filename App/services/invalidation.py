@@ -0,0 +1,60 @@
+import threading
+from contextlib import ContextDecorator
+
+from django.db import transaction
+
+
+_state = threading.local()
+
+
+def invalidate(func, *args, using=None):
+    """
+    Run the cache invalidation `func(*args)` once the data it covers is committed.
+
+    Inside `deferred_invalidation()` identical calls are coalesced and run once
+    when the block ends. Otherwise the call runs on commit of the current
+    transaction, or right away in autocommit mode. Arguments must be hashable.
+    """
+    pending = getattr(_state, "pending", None)
+    if pending is not None:
+        pending.setdefault((func, args), None)
+        return
+    transaction.on_commit(lambda: func(*args), using=using)
+
+
+def _flush(pending):
+    for func, args in pending:
+        func(*args)
+
+
+class deferred_invalidation(ContextDecorator):
+    """
+    Collect the cache invalidations fired by `Product`, `Quote` and
+    `ProductQuote` signals and run each distinct one once, after the
+    outermost transaction commits.
+
+    Usable as a context manager or a decorator, and nestable: only the
+    outermost block flushes. Meant for bulk writes (imports, admin actions,
+    fixtures), which would otherwise invalidate and rebuild caches per row.
+
+    Args:
+        using (str, optional): The database alias whose commit to wait for.
+    """
+
+    def __init__(self, using=None):
+        self.using = using
+
+    def __enter__(self):
+        _state.depth = getattr(_state, "depth", 0) + 1
+        if _state.depth == 1:
+            _state.pending = {}
+        return self
+
+    def __exit__(self, *exc_info):
+        _state.depth -= 1
+        if _state.depth == 0:
+            pending, _state.pending = _state.pending, None
+            if pending:
+                # Dropped by Django if the transaction rolls back.
+                transaction.on_commit(lambda: _flush(pending), using=self.using)
+        return False
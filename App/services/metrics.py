@@ -0,0 +1,339 @@
+import json, logging, os, threading, time
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from MicrosoftAuth.client import msal_stats
+
+from ..models import DailyIndicators, Quote
+
+from .cache_versions import cache_stats
+from .pdf_jobs import RENDER_BUCKETS, pdf_job_counters
+from .perf import BUCKETS_MS, connection_stats, perf_stats
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines: single process.
+    fcntl = None
+
+
+# Seconds between two snapshots of a worker, unless forced.
+PUBLISH_INTERVAL = 5
+# Seconds between two warnings about an unwritable METRICS_DIR.
+ERROR_LOG_INTERVAL = 300
+ARCHIVE = "archive.json"
+
+_started = time.time_ns()
+_publish_lock = threading.Lock()
+_published_at = 0.0
+_error_logged_at = None
+
+
+def _snapshot():
+    """
+    Return this process's counters (summed across workers, kept after they
+    exit) and gauges (summed across live workers only).
+    """
+    pdf = pdf_job_counters()
+    pending = pdf.pop("pending")
+    db = connection_stats()
+    return {
+        "counters": {
+            "requests": perf_stats(),
+            "cache": {
+                namespace: {"hits": values["hits"], "misses": values["misses"]}
+                for namespace, values in cache_stats().items()
+            },
+            "pdf": pdf,
+            "db": {"opened": db["opened"]},
+            "msal": msal_stats(),
+        },
+        "gauges": {
+            "pdf_pending": pending,
+            "db_open": db["open"],
+        },
+    }
+
+
+def _metrics_dir():
+    os.makedirs(settings.METRICS_DIR, exist_ok=True)
+    return settings.METRICS_DIR
+
+
+def publish(force=False):
+    """
+    Write this process's snapshot to `METRICS_DIR`, where `/metrics` sums the
+    snapshots of every gunicorn worker. Runs at most every `PUBLISH_INTERVAL`
+    seconds unless `force` is set.
+
+    Called while serving requests, so it never raises: a missing, read-only
+    or full directory is logged (at most every `ERROR_LOG_INTERVAL` seconds)
+    and only costs the cross-worker totals.
+
+    Returns:
+        bool: False if the snapshot could not be written.
+    """
+    global _published_at, _error_logged_at
+    now = time.monotonic()
+    if not force and now - _published_at < PUBLISH_INTERVAL:
+        return True
+    with _publish_lock:
+        if not force and now - _published_at < PUBLISH_INTERVAL:
+            return True
+        _published_at = now
+        try:
+            directory = _metrics_dir()
+            path = os.path.join(directory, f"{os.getpid()}-{_started}.json")
+            part = f"{path}.part"
+            with open(part, "w") as file:
+                json.dump(_snapshot(), file)
+            os.replace(part, path)
+        except OSError as e:
+            if _error_logged_at is None or now - _error_logged_at >= ERROR_LOG_INTERVAL:
+                _error_logged_at = now
+                logger.warning("Could not publish metrics to %s: %s", settings.METRICS_DIR, e)
+            return False
+    return True
+
+
+def _merge(total, part):
+    for key, value in part.items():
+        if isinstance(value, dict):
+            _merge(total.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            current = total.get(key) or [0] * len(value)
+            total[key] = [a + b for a, b in zip(current, value)]
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def _is_alive(pid):
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _read(path):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def collect():
+    """
+    Return the counters and gauges of all workers, publishing this one's first.
+
+    Snapshots of exited workers are folded into `archive.json`, so counters
+    never go backwards when gunicorn replaces a worker. When `METRICS_DIR` is
+    unusable only this process's numbers are returned.
+    """
+    if not publish(force=True):
+        snapshot = _snapshot()
+        return snapshot["counters"], snapshot["gauges"]
+    directory = _metrics_dir()
+
+    latest = {}
+    for name in os.listdir(directory):
+        pid, _, started = name.removesuffix(".json").partition("-")
+        if name.endswith(".json") and name != ARCHIVE and pid.isdigit() and started.isdigit():
+            latest.setdefault(int(pid), []).append((int(started), name))
+
+    counters, gauges, dead = {}, {}, []
+    for pid, files in latest.items():
+        files.sort()
+        # An older file of a reused pid belongs to a worker that is gone.
+        dead.extend(name for _, name in files[:-1])
+        name = files[-1][1]
+        if not _is_alive(pid):
+            dead.append(name)
+            continue
+        snapshot = _read(os.path.join(directory, name))
+        if snapshot:
+            _merge(counters, snapshot["counters"])
+            _merge(gauges, snapshot["gauges"])
+
+    lock_file = open(os.path.join(directory, "archive.lock"), "w")
+    try:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        archive = _read(os.path.join(directory, ARCHIVE)) or {}
+        if dead:
+            for name in dead:
+                snapshot = _read(os.path.join(directory, name))
+                if snapshot:
+                    _merge(archive, snapshot["counters"])
+            with open(os.path.join(directory, f"{ARCHIVE}.part"), "w") as file:
+                json.dump(archive, file)
+            os.replace(os.path.join(directory, f"{ARCHIVE}.part"), os.path.join(directory, ARCHIVE))
+            for name in dead:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass
+    finally:
+        lock_file.close()
+
+    return _merge(counters, archive), gauges
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_label(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Exposition:
+    """
+    Prometheus text format (version 0.0.4) writer.
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def metric(self, name, kind, help_text, samples):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            self.lines.append(f"{name}{suffix}{_labels(**labels)} {float(value)!r}")
+
+    def histogram(self, name, help_text, series):
+        """
+        `series` yields `(labels, bounds, bucket counts, sum)`, with one more
+        count than bounds for the observations above the last bound.
+        """
+        samples = []
+        for labels, bounds, buckets, total in series:
+            cumulative = 0
+            for bound, count in zip(bounds, buckets):
+                cumulative += count
+                samples.append(("_bucket", {**labels, "le": bound}, cumulative))
+            cumulative += buckets[-1]
+            samples.append(("_bucket", {**labels, "le": "+Inf"}, cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, cumulative))
+        self.metric(name, "histogram", help_text, samples)
+
+    def render(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def _indicators_age():
+    latest = DailyIndicators.objects.aggregate(latest=Max("date"))["latest"]
+    if latest is None:
+        return None
+    published = datetime.combine(latest, datetime.min.time())
+    if settings.USE_TZ:
+        published = timezone.make_aware(published)
+    return (timezone.now() - published).total_seconds()
+
+
+def _server_connections():
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()")
+        return cursor.fetchone()[0]
+
+
+def render_metrics():
+    """
+    Return every metric of the app, across all gunicorn workers, in the
+    Prometheus text format.
+    """
+    counters, gauges = collect()
+    out = _Exposition()
+
+    requests = counters.get("requests", {})
+    bounds_s = [ms / 1000 for ms in BUCKETS_MS]
+    out.histogram(
+        "smarty_request_duration_seconds", "Request wall time per view.",
+        (({"view": view}, bounds_s, entry["buckets"], entry["total_ms"] / 1000) for view, entry in sorted(requests.items())),
+    )
+    for field, name, help_text, scale in (
+        ("queries", "smarty_request_db_queries_total", "Database queries run by requests per view.", 1),
+        ("db_ms", "smarty_request_db_seconds_total", "Time spent in database queries per view.", 1000),
+        ("template_ms", "smarty_request_template_seconds_total", "Time spent rendering templates per view.", 1000),
+        ("over_budget", "smarty_request_over_budget_total", "Requests over their PERF_BUDGETS entry per view.", 1),
+    ):
+        out.metric(name, "counter", help_text, [
+            ("", {"view": view}, entry[field] / scale) for view, entry in sorted(requests.items())
+        ])
+
+    cache = counters.get("cache", {})
+    out.metric("smarty_cache_requests_total", "counter", "Versioned cache lookups per namespace.", [
+        ("", {"namespace": namespace, "result": result}, values.get(result, 0))
+        for namespace, values in sorted(cache.items()) for result in ("hits", "misses")
+    ])
+    out.metric("smarty_cache_hit_ratio", "gauge", "Share of versioned cache lookups served from the cache.", [
+        ("", {"namespace": namespace}, values.get("hits", 0) / total)
+        for namespace, values in sorted(cache.items())
+        if (total := values.get("hits", 0) + values.get("misses", 0))
+    ])
+
+    pdf = counters.get("pdf", {})
+    out.metric("smarty_pdf_jobs_total", "counter", "PDF jobs by outcome.", [
+        ("", {"result": result}, pdf.get(result, 0))
+        for result in ("submitted", "completed", "failed", "rejected", "cached")
+    ])
+    out.histogram(
+        "smarty_pdf_render_seconds", "Render time of completed PDFs.",
+        [({}, RENDER_BUCKETS, pdf.get("render_buckets") or [0] * (len(RENDER_BUCKETS) + 1), pdf.get("render_seconds", 0))],
+    )
+    out.metric("smarty_pdf_queue_depth", "gauge", "PDF jobs pending across live workers.", [
+        ("", {}, gauges.get("pdf_pending", 0)),
+    ])
+    out.metric("smarty_pdf_queue_limit", "gauge", "Pending PDF jobs allowed per worker.", [
+        ("", {}, settings.PDF_QUEUE_LIMIT),
+    ])
+
+    msal = counters.get("msal", {})
+    operations = sorted(name.removesuffix("_calls") for name in msal if name.endswith("_calls"))
+    out.metric("smarty_msal_calls_total", "counter", "MSAL calls per operation.", [
+        ("", {"operation": operation}, msal.get(f"{operation}_calls", 0)) for operation in operations
+    ])
+    out.metric("smarty_msal_seconds_total", "counter", "Time spent in MSAL calls per operation.", [
+        ("", {"operation": operation}, msal.get(f"{operation}_seconds", 0)) for operation in operations
+    ])
+
+    age = _indicators_age()
+    if age is not None:
+        out.metric("smarty_indicators_age_seconds", "gauge", "Time since the date of the latest DailyIndicators row.", [
+            ("", {}, age),
+        ])
+
+    by_status = dict(Quote.objects.order_by().values_list("status").annotate(count=Count("pk")))
+    out.metric("smarty_quotes", "gauge", "Quotes by status.", [
+        ("", {"status": status}, by_status.get(status, 0)) for status, _ in Quote.status_choices
+    ])
+
+    out.metric("smarty_db_connections_opened_total", "counter", "Database connections opened by the workers.", [
+        ("", {}, counters.get("db", {}).get("opened", 0)),
+    ])
+    out.metric("smarty_db_connections_open", "gauge", "Database connections currently open in live workers.", [
+        ("", {"alias": alias}, count) for alias, count in sorted(gauges.get("db_open", {}).items())
+    ])
+    server = _server_connections()
+    if server is not None:
+        out.metric("smarty_db_server_connections", "gauge", "Connections to the database, from any client.", [
+            ("", {}, server),
+        ])
+
+    return out.render()
@@ -0,0 +1,101 @@
+from django.core import signing
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class CountedPaginator(Paginator):
+    """
+    Paginator that trusts an already known total instead of running `COUNT(*)`.
+    """
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        return self._count
+
+
+class CursorPage:
+    """
+    One page of a queryset paginated by keyset on `(field, id)`.
+
+    Instead of `OFFSET`, each page continues from the last row of the previous
+    one, so its cost does not grow with depth. Cursors are signed and opaque.
+
+    Args:
+        queryset (QuerySet): The filtered rows to paginate.
+        cursor (str, optional): A `next_cursor`/`previous_cursor` token, None for the first page.
+        per_page (int): Rows per page.
+        field (str): The leading ordering field, ties are broken by `id`.
+    """
+
+    salt = "App.pagination.cursor"
+
+    def __init__(self, queryset, cursor=None, per_page=10, field="date"):
+        self.per_page = per_page
+        self.field = field
+
+        position = self._decode(cursor)
+        if position is None:
+            backwards = False
+            rows = list(queryset.order_by(field, "id")[:per_page + 1])
+        else:
+            backwards = position["b"]
+            value, pk = position["v"], position["i"]
+            if backwards:
+                rows = list(
+                    queryset
+                    .filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk}))
+                    .order_by(f"-{field}", "-id")[:per_page + 1]
+                )
+            else:
+                rows = list(
+                    queryset
+                    .filter(Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk}))
+                    .order_by(field, "id")[:per_page + 1]
+                )
+
+        more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        if backwards:
+            rows.reverse()
+            self._has_previous, self._has_next = more, True
+        else:
+            self._has_previous, self._has_next = position is not None, more
+
+        self.object_list = rows
+
+    def _decode(self, cursor):
+        if not cursor:
+            return None
+        try:
+            return signing.loads(cursor, salt=self.salt)
+        except signing.BadSignature:
+            return None
+
+    def _encode(self, row, backwards):
+        return signing.dumps(
+            {"v": str(getattr(row, self.field)), "i": row.pk, "b": backwards},
+            salt=self.salt,
+        )
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    @property
+    def next_cursor(self):
+        return self._encode(self.object_list[-1], False) if self.has_next() else None
+
+    @property
+    def previous_cursor(self):
+        return self._encode(self.object_list[0], True) if self.has_previous() else None
@@ -0,0 +1,104 @@
+import os, threading, time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+EVICT_INTERVAL = 60
+# ZIP exports share the directory but only live as long as their job.
+EXPORT_PREFIX = "export-"
+
+_lock = threading.Lock()
+_last_evict = 0.0
+
+
+def cache_dir():
+    path = Path(settings.PDF_CACHE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def pdf_path(digest):
+    return cache_dir() / f"{digest}.pdf"
+
+
+def _pointer_key(quote_pk):
+    return f"pdf_digest:{quote_pk}"
+
+
+def cached_pdf(digest):
+    """
+    Return the path of the stored PDF for `digest`, or None when it is not stored.
+
+    A hit refreshes the file's access time, which eviction uses as recency.
+    """
+    path = pdf_path(digest)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    os.utime(path, (time.time(), stat.st_mtime))
+    return path
+
+
+def remember_pdf(quote_pk, digest):
+    """
+    Record `digest` as the current PDF of the quote, deleting the one it replaces.
+    """
+    previous = cache.get(_pointer_key(quote_pk))
+    cache.set(_pointer_key(quote_pk), digest, timeout=None)
+    if previous and previous != digest:
+        pdf_path(previous).unlink(missing_ok=True)
+
+
+def forget_quote_pdf(quote_pk):
+    """
+    Delete the stored PDF of a quote whose fields or lines changed.
+
+    Entries are content-addressed, so a stale one is never served; this only
+    frees the space right away instead of waiting for eviction.
+    """
+    digest = cache.get(_pointer_key(quote_pk))
+    if digest:
+        cache.delete(_pointer_key(quote_pk))
+        pdf_path(digest).unlink(missing_ok=True)
+
+
+def evict_pdfs(force=False):
+    """
+    Delete stored PDFs older than `PDF_CACHE_MAX_AGE` and exports older than
+    `PDF_JOB_TTL`, then the least recently used files until the store fits in
+    `PDF_CACHE_MAX_BYTES`. Runs at most once per `EVICT_INTERVAL` unless
+    `force` is set.
+
+    Returns:
+        int: The number of files deleted.
+    """
+    global _last_evict
+    now = time.time()
+    with _lock:
+        if not force and now - _last_evict < EVICT_INTERVAL:
+            return 0
+        _last_evict = now
+
+    entries = []
+    for path in cache_dir().iterdir():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+
+    deleted = 0
+    total = sum(size for _, size, _ in entries)
+    # Oldest first: expired files go regardless of size, the rest while over budget.
+    for used, size, path in sorted(entries, key=lambda entry: entry[0]):
+        max_age = settings.PDF_JOB_TTL if path.name.startswith(EXPORT_PREFIX) else settings.PDF_CACHE_MAX_AGE
+        if now - used <= max_age and total <= settings.PDF_CACHE_MAX_BYTES:
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+        deleted += 1
+
+    return deleted
@@ -0,0 +1,168 @@
+import os, threading, uuid, zipfile
+from collections import deque
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Prefetch
+
+from ..models import ProductQuote, Quote
+
+from .pdf_cache import EXPORT_PREFIX, cache_dir
+from .pdf_jobs import DONE, FAILED, PENDING, QueueFull, check_queue, quote_pdf_filename, render_quote_pdf, save_job
+
+
+CHUNK_SIZE = 50
+EXPORT_FILENAME = "Cotizaciones.zip"
+# Exports built at once by one web worker; more are refused like a full queue.
+MAX_EXPORTS = 1
+
+_exports = threading.BoundedSemaphore(MAX_EXPORTS)
+
+
+def _archive_name(quote):
+    return quote_pdf_filename(quote).replace("/", "-").replace("\\", "-")
+
+
+def _quotes_in_chunks(pks):
+    """
+    Yield the quotes with the given `pks` in order, loading them with their
+    lines `CHUNK_SIZE` at a time.
+    """
+    lines = Prefetch("products", queryset=ProductQuote.objects.select_related("product").order_by("pk"))
+
+    for start in range(0, len(pks), CHUNK_SIZE):
+        chunk = pks[start:start + CHUNK_SIZE]
+        loaded = (
+            Quote.objects
+            .filter(pk__in=chunk)
+            .select_related("client__entity", "salesRep")
+            .prefetch_related(lines)
+            .in_bulk()
+        )
+        for pk in chunk:
+            if pk in loaded:
+                yield loaded[pk]
+
+
+def _rendered_pdfs(pks, window):
+    """
+    Yield `(archive name, path, error)` per quote, in order, keeping at most
+    `window` renders in flight. Stored PDFs are reused without rendering.
+    """
+    in_flight = deque()
+
+    def settle():
+        name, path, future = in_flight.popleft()
+        error = future.exception() if future is not None else None
+        return name, path, error
+
+    for quote in _quotes_in_chunks(pks):
+        _, path, future = render_quote_pdf(quote, list(quote.products.all()))
+        in_flight.append((_archive_name(quote), path, future))
+        if len(in_flight) >= window:
+            yield settle()
+
+    while in_flight:
+        yield settle()
+
+
+def export_path(job_id):
+    return cache_dir() / f"{EXPORT_PREFIX}{job_id}.zip"
+
+
+def write_quote_pdfs(pks, path, window=None):
+    """
+    Write a ZIP archive with the PDF of every quote in `pks` to `path`.
+
+    PDFs are rendered by the worker pool, at most `window` at a time
+    (`PDF_WORKERS` by default, so interactive jobs queue behind a few export
+    renders only), and each is added to the archive as soon as it and the
+    ones before it are done. Memory stays bounded by the window, not by the
+    number of quotes. Quotes that fail to render are listed in `errores.txt`
+    at the end of the archive. The archive only appears at `path` once complete.
+
+    Args:
+        pks (list[int]): The quotes to export, in archive order.
+        path (Path): Where to write the archive.
+        window (int, optional): Maximum renders in flight.
+    """
+    window = window or settings.PDF_WORKERS
+    part = path.with_name(f"{path.name}.part")
+    errors = []
+
+    with zipfile.ZipFile(part, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for name, pdf, error in _rendered_pdfs(pks, window):
+            if error is not None:
+                errors.append(f"{name}: {error}")
+                continue
+            try:
+                archive.write(pdf, arcname=name)
+            except FileNotFoundError:
+                errors.append(f"{name}: evicted before it could be added")
+
+        if errors:
+            archive.writestr("errores.txt", "\n".join(errors))
+
+    os.replace(part, path)
+
+
+def _run_export(job, pks):
+    try:
+        write_quote_pdfs(pks, export_path(job["id"]))
+    except Exception as e:
+        print(f"Export {job['id']} failed:", e)
+        export_path(job["id"]).with_suffix(".zip.part").unlink(missing_ok=True)
+        job.update(status=FAILED, error=str(e))
+    else:
+        job.update(status=DONE)
+    finally:
+        _exports.release()
+        connection.close()
+    save_job(job)
+
+
+def submit_quote_export(quotes, owner=None, retry=None):
+    """
+    Queue a ZIP export of `quotes` as a job that the PDF job status and
+    download views can follow, like `submit_quote_pdf`.
+
+    The archive is built by a background thread of this web worker (the
+    renders themselves run in the PDF pool), so no request waits for it and
+    the web server's timeout does not cut it short.
+
+    Args:
+        quotes (QuerySet): The quotes to export, in archive order.
+        owner (int, optional): The session user allowed to see the job.
+        retry (str, optional): URL that starts the same export again.
+
+    Returns:
+        str: The job id.
+
+    Raises:
+        QueueFull: If `PDF_QUEUE_LIMIT` renders are already pending, or this
+            worker is already building `MAX_EXPORTS` exports.
+    """
+    check_queue()
+    if not _exports.acquire(blocking=False):
+        raise QueueFull()
+
+    try:
+        pks = list(quotes.values_list("pk", flat=True))
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "status": PENDING,
+            "quote": None,
+            "owner": owner,
+            "filename": EXPORT_FILENAME,
+            "content_type": "application/zip",
+            "digest": job_id,
+            "path": str(export_path(job_id)),
+            "retry": retry,
+        }
+        save_job(job)
+        threading.Thread(target=_run_export, args=(job, pks), name=f"export-{job_id}", daemon=True).start()
+    except BaseException:
+        _exports.release()
+        raise
+    return job_id
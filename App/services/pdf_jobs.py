@@ -0,0 +1,329 @@
+import hashlib, json, multiprocessing, threading, time, uuid
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.templatetags.static import static
+from django.template.loader import get_template, render_to_string
+
+from ..models import ProductQuote, Quote
+
+from . import pdf_worker
+from .pdf_cache import cached_pdf, evict_pdfs, pdf_path, remember_pdf
+
+
+PDF_TEMPLATE = "docs/quote.html"
+
+# Downscaled copies of the static images, sized for print (see static/img/pdf).
+PDF_ASSETS = {
+    'logo': "img/pdf/logo.png",
+    'ISO9001': "img/pdf/iso9001.jpg",
+    'ISO13485': "img/pdf/iso13485.png",
+}
+PENDING, DONE, FAILED = "pending", "done", "failed"
+# Upper bounds of the render time histogram buckets, in seconds.
+RENDER_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 30)
+
+_lock = threading.Lock()
+_pool = None
+_futures = {}
+_stats = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "rejected": 0,
+    "cached": 0,
+    "pending": 0,
+    "render_seconds": 0.0,
+}
+_render_buckets = [0] * (len(RENDER_BUCKETS) + 1)
+
+
+class QueueFull(Exception):
+    """
+    Raised when `PDF_QUEUE_LIMIT` jobs are already pending in this process.
+    """
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            # Spawned, not forked: workers never inherit database connections or locks.
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=pdf_worker.warm_up,
+            )
+        return _pool
+
+
+def _reset_pool(pool):
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+
+
+def load_quote(quote_id):
+    return Quote.objects.select_related("client__entity", "salesRep").get(pk=quote_id)
+
+
+def quote_pdf_filename(quote):
+    return f"Cotizacion #{quote} - {quote.client.entity.name}.pdf"
+
+
+def quote_pdf_products(quote):
+    return list(ProductQuote.objects.filter(quote=quote).select_related("product").order_by("pk"))
+
+
+def pdf_assets():
+    """
+    Return the template variables of the PDF images: their static URLs, which
+    the worker's url_fetcher resolves to local files.
+    """
+    return {name: static(path) for name, path in PDF_ASSETS.items()}
+
+
+def _static_dirs():
+    return [str(directory) for directory in (settings.STATIC_ROOT, *settings.STATICFILES_DIRS) if directory]
+
+
+@lru_cache(maxsize=1)
+def _template_version():
+    digest = hashlib.sha256(get_template(PDF_TEMPLATE).template.source.encode())
+    for name, path in sorted(PDF_ASSETS.items()):
+        digest.update(name.encode())
+        found = finders.find(path)
+        if found:
+            with open(found, "rb") as file:
+                digest.update(file.read())
+        else:
+            digest.update(static(path).encode())
+    return digest.hexdigest()
+
+
+def quote_pdf_digest(quote, products):
+    """
+    Hash everything `docs/quote.html` prints, plus the template and asset
+    versions, so equal digests always mean identical PDFs.
+    """
+    entity = quote.client.entity
+    inputs = [
+        _template_version(),
+        quote.public_id, entity.name, entity.get_region_display(), str(quote.date),
+        quote.salesRep.first_name, quote.salesRep.last_name,
+        quote.currency, str(quote.total_net), str(quote.iva), str(quote.final),
+        [(line.product.code, line.product.description, line.quantity) for line in products],
+    ]
+    return hashlib.sha256(json.dumps(inputs).encode()).hexdigest()
+
+
+def render_quote_html(quote, products=None):
+    """
+    Render the `docs/quote.html` document of `quote`, ready for WeasyPrint.
+    """
+    if products is None:
+        products = quote_pdf_products(quote)
+    return render_to_string(
+        PDF_TEMPLATE,
+        {
+            'quote': quote,
+            'products': products,
+            **pdf_assets(),
+        }
+    )
+
+
+def _job_key(job_id):
+    return f"pdf_job:{job_id}"
+
+
+def get_job(job_id):
+    """
+    Return the job dict (`id`, `status`, `quote`, `owner`, `filename`, `digest`, `path`),
+    or None if it is unknown or expired. Jobs live in the shared cache, so any
+    web worker can report on them.
+    """
+    return cache.get(_job_key(job_id))
+
+
+def save_job(job):
+    cache.set(_job_key(job["id"]), job, timeout=settings.PDF_JOB_TTL)
+
+
+def render_quote_pdf(quote, products=None):
+    """
+    Start rendering the PDF of `quote` in the worker pool, unless it is stored.
+
+    The HTML is rendered here, where the database is available; only
+    WeasyPrint runs in the pool. Not subject to `PDF_QUEUE_LIMIT`, callers
+    bound how many renders they keep in flight.
+
+    Args:
+        quote (Quote): The quote, with `client.entity` and `salesRep` loaded.
+        products (list[ProductQuote], optional): Its lines, with `product` loaded.
+
+    Returns:
+        tuple[str, Path, Future | None]: The digest, the stored PDF path and
+        the render future, None when the PDF was already stored.
+    """
+    if products is None:
+        products = quote_pdf_products(quote)
+    digest = quote_pdf_digest(quote, products)
+    path = pdf_path(digest)
+
+    if cached_pdf(digest) is not None:
+        with _lock:
+            _stats["cached"] += 1
+        return digest, path, None
+
+    html = render_quote_html(quote, products)
+    pool = _get_pool()
+
+    with _lock:
+        _stats["pending"] += 1
+        _stats["submitted"] += 1
+
+    try:
+        future = pool.submit(
+            pdf_worker.render_pdf,
+            html,
+            str(settings.BASE_DIR),
+            str(path),
+            settings.STATIC_URL,
+            _static_dirs(),
+        )
+    except BaseException:
+        with _lock:
+            _stats["pending"] -= 1
+            _stats["failed"] += 1
+        raise
+
+    future.add_done_callback(partial(_rendered, quote.pk, digest, pool))
+    return digest, path, future
+
+
+def _rendered(quote_pk, digest, pool, future):
+    try:
+        seconds = future.result()
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            _reset_pool(pool)
+        print(f"PDF of quote #{quote_pk} failed:", e)
+        failed, seconds = True, 0.0
+    else:
+        failed = False
+        remember_pdf(quote_pk, digest)
+        evict_pdfs()
+
+    with _lock:
+        _stats["pending"] -= 1
+        _stats["failed" if failed else "completed"] += 1
+        _stats["render_seconds"] += seconds
+        if not failed:
+            _render_buckets[bisect_left(RENDER_BUCKETS, seconds)] += 1
+
+
+def check_queue():
+    """
+    Raise `QueueFull` when `PDF_QUEUE_LIMIT` renders are already pending here.
+    """
+    with _lock:
+        if _stats["pending"] >= settings.PDF_QUEUE_LIMIT:
+            _stats["rejected"] += 1
+            raise QueueFull()
+
+
+def submit_quote_pdf(quote, owner=None):
+    """
+    Queue the PDF of `quote` as a job that status and download views can follow.
+
+    When a PDF with the same digest is already stored the job is created
+    finished and nothing is rendered.
+
+    Args:
+        quote (Quote): The quote, with `client.entity` and `salesRep` loaded.
+        owner (int, optional): The session user allowed to see the job.
+
+    Returns:
+        str: The job id.
+
+    Raises:
+        QueueFull: If `PDF_QUEUE_LIMIT` renders are already pending.
+    """
+    check_queue()
+
+    digest, path, future = render_quote_pdf(quote)
+
+    job = {
+        "id": uuid.uuid4().hex,
+        "status": PENDING if future else DONE,
+        "quote": quote.pk,
+        "owner": owner,
+        "filename": quote_pdf_filename(quote),
+        "digest": digest,
+        "path": str(path),
+    }
+    save_job(job)
+
+    if future is not None:
+        _futures[job["id"]] = future
+        future.add_done_callback(partial(_finish, job))
+    return job["id"]
+
+
+def _finish(job, future):
+    if future.exception() is None:
+        job.update(status=DONE)
+    else:
+        job.update(status=FAILED, error=str(future.exception()))
+    save_job(job)
+    _futures.pop(job["id"], None)
+
+
+def wait_for_job(job_id, timeout=None):
+    """
+    Block until `job_id` finishes, when it was submitted by this process.
+
+    Returns:
+        dict | None: The job, as `get_job` returns it.
+    """
+    future = _futures.get(job_id)
+    if future is not None:
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            pass
+        # The done callback may still be running in the pool's thread.
+        for _ in range(100):
+            if job_id not in _futures:
+                break
+            time.sleep(0.01)
+    return get_job(job_id)
+
+
+def pdf_job_counters():
+    """
+    Return the raw job counters of this process, with the render time
+    histogram of completed jobs per `RENDER_BUCKETS` upper bound.
+    """
+    with _lock:
+        return {**_stats, "render_buckets": list(_render_buckets)}
+
+
+def pdf_job_stats():
+    """
+    Return the job counters and queue depth of this process's PDF pool.
+    """
+    stats = pdf_job_counters()
+    stats.pop("render_buckets")
+    completed = stats["completed"]
+    stats["avg_render_seconds"] = round(stats.pop("render_seconds") / completed, 3) if completed else 0.0
+    stats["workers"] = settings.PDF_WORKERS
+    stats["queue_limit"] = settings.PDF_QUEUE_LIMIT
+    return stats
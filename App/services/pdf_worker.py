@@ -0,0 +1,81 @@
+"""
+Code that runs inside the PDF worker processes.
+
+Kept free of Django imports: workers are spawned fresh and only need WeasyPrint.
+"""
+import mimetypes, os, time, uuid
+from urllib.parse import unquote, urlparse
+
+
+_assets = {}
+
+
+def warm_up():
+    """
+    Import WeasyPrint once per worker, so the first job does not pay for it.
+    """
+    import weasyprint  # noqa: F401
+
+
+def _read_asset(static_url, static_dirs, url):
+    """
+    Return the bytes and MIME type of a static file referenced by `url`, or None
+    when it is not one. Files are read once per worker.
+    """
+    path = unquote(urlparse(url).path)
+    if not path.startswith(static_url):
+        return None
+
+    name = path[len(static_url):]
+    if name not in _assets:
+        for directory in static_dirs:
+            root = os.path.realpath(directory)
+            candidate = os.path.realpath(os.path.join(root, name))
+            if candidate.startswith(root + os.sep) and os.path.isfile(candidate):
+                with open(candidate, "rb") as file:
+                    _assets[name] = (file.read(), mimetypes.guess_type(candidate)[0])
+                break
+        else:
+            return None
+    return _assets[name]
+
+
+def asset_fetcher(static_url, static_dirs):
+    """
+    Build a WeasyPrint `url_fetcher` that serves `STATIC_URL` references from
+    the local static directories and refuses anything else but `data:` URIs,
+    so rendering never goes to the network.
+    """
+    from weasyprint import default_url_fetcher
+
+    def fetch(url, *args, **kwargs):
+        if url.startswith("data:"):
+            return default_url_fetcher(url, *args, **kwargs)
+        asset = _read_asset(static_url, static_dirs, url)
+        if asset is None:
+            raise ValueError(f"Not a local asset: {url}")
+        data, mime_type = asset
+        return {"string": data, "mime_type": mime_type, "redirected_url": url}
+
+    return fetch
+
+
+def render_pdf(html, base_url, path, static_url="/static/", static_dirs=()):
+    """
+    Render `html` to `path`, writing through a temporary file so readers never
+    see a partial PDF.
+
+    Returns:
+        float: Seconds spent rendering.
+    """
+    from weasyprint import HTML
+
+    started = time.perf_counter()
+    partial = f"{path}.{uuid.uuid4().hex}.part"
+    HTML(
+        string=html,
+        base_url=base_url,
+        url_fetcher=asset_fetcher(static_url, static_dirs),
+    ).write_pdf(partial)
+    os.replace(partial, path)
+    return time.perf_counter() - started
@@ -0,0 +1,237 @@
+import logging, threading, time, weakref
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# SQL statements kept per request for the budget warning.
+MAX_LOGGED_QUERIES = 200
+
+_current = ContextVar("perf_request", default=None)
+
+_lock = threading.Lock()
+_views = {}
+_connections = weakref.WeakSet()
+_connections_opened = 0
+
+
+class RequestStats:
+    """
+    What one request spent, filled in by the DB wrapper, the cache counters
+    and the template backend while the request runs.
+    """
+
+    __slots__ = ("started", "queries", "db_seconds", "cache_hits", "cache_misses", "template_seconds", "statements")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_seconds = 0.0
+        self.statements = []
+
+
+def start_request():
+    """
+    Start collecting stats for the current request (thread or task).
+
+    Returns:
+        tuple: The `RequestStats` and the token to pass to `end_request`.
+    """
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def stream_request(stats, content, done):
+    """
+    Wrap the body of a streaming response so the work done while the server
+    sends it (queries, rendering) counts towards `stats`, calling `done` once
+    the body is exhausted or closed.
+    """
+    iterator = iter(content)
+    try:
+        while True:
+            token = _current.set(stats)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield chunk
+    finally:
+        done()
+
+
+async def astream_request(stats, content, done):
+    """
+    `stream_request` for the async iterators of ASGI streaming responses.
+    """
+    iterator = aiter(content)
+    try:
+        while True:
+            token = _current.set(stats)
+            try:
+                chunk = await anext(iterator)
+            except StopAsyncIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield chunk
+    finally:
+        done()
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper, installed on every connection by the app config.
+    Times each statement into the current request, if any.
+    """
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if len(stats.statements) < MAX_LOGGED_QUERIES:
+            stats.statements.append((sql, elapsed))
+
+
+def install_query_wrapper(connection, **kwargs):
+    global _connections_opened
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+    with _lock:
+        _connections.add(connection)
+        _connections_opened += 1
+
+
+def connection_stats():
+    """
+    Return the database connections opened by this process so far and, per
+    alias, how many are open now (one per thread at most).
+    """
+    with _lock:
+        connections = list(_connections)
+        opened = _connections_opened
+    open_now = Counter(connection.alias for connection in connections if connection.connection is not None)
+    return {"opened": opened, "open": dict(open_now)}
+
+
+def record_cache(hit):
+    stats = _current.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+def record_template(seconds):
+    stats = _current.get()
+    if stats is not None:
+        stats.template_seconds += seconds
+
+
+def _empty_view():
+    return {
+        "requests": 0,
+        "buckets": [0] * (len(BUCKETS_MS) + 1),
+        "total_ms": 0.0,
+        "db_ms": 0.0,
+        "queries": 0,
+        "template_ms": 0.0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "over_budget": 0,
+    }
+
+
+def _budget(view):
+    budgets = settings.PERF_BUDGETS
+    return budgets.get(view) or budgets.get("default") or {}
+
+
+def _log_over_budget(view, stats, total_ms):
+    slowest = sorted(stats.statements, key=lambda statement: statement[1], reverse=True)[:5]
+    repeated = Counter(sql for sql, _ in stats.statements).most_common(1)
+    lines = [f"  {elapsed * 1000:.1f}ms {sql}" for sql, elapsed in slowest]
+    if repeated and repeated[0][1] > 1:
+        lines.append(f"  repeated {repeated[0][1]}x: {repeated[0][0]}")
+    logger.warning(
+        "%s over budget: %.1fms, %d queries (%.1fms DB), %.1fms templates\n%s",
+        view, total_ms, stats.queries, stats.db_seconds * 1000, stats.template_seconds * 1000, "\n".join(lines),
+    )
+
+
+def finish_request(view, stats):
+    """
+    Add a finished request to the per-view histograms and check its budget.
+
+    Returns:
+        float: The wall time of the request, in milliseconds.
+    """
+    total_ms = (time.perf_counter() - stats.started) * 1000
+    budget = _budget(view)
+    over = (
+        total_ms > budget.get("ms", float("inf"))
+        or stats.queries > budget.get("queries", float("inf"))
+    )
+
+    with _lock:
+        entry = _views.get(view)
+        if entry is None:
+            entry = _views[view] = _empty_view()
+        entry["requests"] += 1
+        entry["buckets"][bisect_left(BUCKETS_MS, total_ms)] += 1
+        entry["total_ms"] += total_ms
+        entry["db_ms"] += stats.db_seconds * 1000
+        entry["queries"] += stats.queries
+        entry["template_ms"] += stats.template_seconds * 1000
+        entry["cache_hits"] += stats.cache_hits
+        entry["cache_misses"] += stats.cache_misses
+        entry["over_budget"] += over
+
+    if over:
+        _log_over_budget(view, stats, total_ms)
+    return total_ms
+
+
+def server_timing(stats, total_ms):
+    """
+    Return the `Server-Timing` header value for a finished request.
+    """
+    return ", ".join((
+        f"total;dur={total_ms:.1f}",
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"',
+        f"tpl;dur={stats.template_seconds * 1000:.1f}",
+        f'cache;desc="{stats.cache_hits} hits, {stats.cache_misses} misses"',
+    ))
+
+
+def perf_stats():
+    """
+    Return the per-view totals and latency histograms of this process.
+
+    `buckets` holds the request count per `BUCKETS_MS` upper bound, the last
+    one counting slower requests.
+    """
+    with _lock:
+        return {view: {**entry, "buckets": list(entry["buckets"])} for view, entry in _views.items()}
@@ -0,0 +1,85 @@
+import re, threading
+from bisect import bisect_left
+
+from .search import normalize
+from .session_cache import get_product_index
+
+
+SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+_lock = threading.Lock()
+_state = {"source": None, "tokens": [], "pks": []}
+
+
+def product_label(product):
+    return f"{product.code[:20]}: {product.description[:40]}..."
+
+
+def _tokens(product):
+    text = normalize(f"{product.code} {product.material_number or ''} {product.description}")
+    tokens = set(text.split())
+    tokens.update(SEPARATORS.split(text))
+    tokens.discard("")
+    return tokens
+
+
+def _build(index):
+    entries = sorted((token, pk) for pk, product in index.items() for token in _tokens(product))
+    return [token for token, _ in entries], [pk for _, pk in entries]
+
+
+def _prefix_index():
+    """
+    Return the sorted `(tokens, pks)` prefix index, rebuilding it whenever the
+    catalog snapshot changes (i.e. after `clear_product_cache` bumps the namespace).
+    """
+    index = get_product_index()
+    if _state["source"] is not index:
+        tokens, pks = _build(index)
+        with _lock:
+            _state.update(source=index, tokens=tokens, pks=pks)
+    return index, _state["tokens"], _state["pks"]
+
+
+def reset_product_search():
+    with _lock:
+        _state.update(source=None, tokens=[], pks=[])
+
+
+def _matching(tokens, pks, prefix):
+    found = set()
+    position = bisect_left(tokens, prefix)
+    while position < len(tokens) and tokens[position].startswith(prefix):
+        found.add(pks[position])
+        position += 1
+    return found
+
+
+def search_products(q, limit=20):
+    """
+    Return up to `limit` products whose code, material number or description
+    has a word starting with every word of `q`, ordered by code.
+
+    Args:
+        q (str): The text typed by the user.
+        limit (int): Maximum number of products returned.
+
+    Returns:
+        list[ProductRow]: The matching products.
+    """
+    index, tokens, pks = _prefix_index()
+    terms = SEPARATORS.split(normalize(q))
+    terms = [term for term in terms if term]
+
+    if not terms:
+        return list(index.values())[:limit]
+
+    found = None
+    for term in sorted(terms, key=len, reverse=True):
+        matches = _matching(tokens, pks, term)
+        found = matches if found is None else found & matches
+        if not found:
+            return []
+
+    # The snapshot is ordered by code, keep that order.
+    return [product for pk, product in index.items() if pk in found][:limit]
@@ -0,0 +1,136 @@
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple, Optional
+
+from ..models import Product, ProductQuote
+
+
+LINE_FIELDS = ("product", "discount", "profit_margin", "quantity", "unit_price", "subtotal")
+
+# Same bounds as ProductQuoteForm.
+LIMITS = {
+    "discount": (0, 100),
+    "profit_margin": (0, 100),
+    "quantity": (1, 500),
+}
+
+
+class QuoteLine(NamedTuple):
+    pk: Optional[int]
+    product: int
+    discount: int
+    profit_margin: int
+    quantity: int
+    unit_price: Decimal
+    subtotal: Decimal
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _decimal(value):
+    try:
+        value = Decimal(str(value).replace(",", "."))
+    except (InvalidOperation, TypeError):
+        return None
+    return value if value.is_finite() else None
+
+
+def parse_quote_lines(data, with_pk=False):
+    """
+    Read the parallel row lists posted by the quote form into `QuoteLine`s.
+
+    Each list is read once and the rows are zipped together. Rows with a
+    value that does not parse or is out of bounds are left out.
+
+    Args:
+        data (QueryDict): The POST data.
+        with_pk (bool): Whether rows carry the `product_pk` of an existing line.
+
+    Returns:
+        tuple[list[QuoteLine], set[int]]: The valid lines and the pks of every
+        existing line the form submitted, valid or not.
+    """
+    columns = [data.getlist(name) for name in LINE_FIELDS]
+    pks = data.getlist("product_pk") if with_pk else []
+
+    lines, submitted = [], set()
+    for position, row in enumerate(zip(*columns)):
+        values = dict(zip(LINE_FIELDS, row))
+        pk = _int(pks[position]) if position < len(pks) else None
+        if pk is not None:
+            submitted.add(pk)
+
+        product = _int(values["product"])
+        numbers = {name: _int(values[name]) for name in LIMITS}
+        unit_price, subtotal = _decimal(values["unit_price"]), _decimal(values["subtotal"])
+
+        if product is None or unit_price is None or subtotal is None:
+            continue
+        if any(numbers[name] is None or not low <= numbers[name] <= high for name, (low, high) in LIMITS.items()):
+            continue
+
+        lines.append(QuoteLine(pk, product, unit_price=unit_price, subtotal=subtotal, **numbers))
+
+    return lines, submitted
+
+
+def save_quote_lines(quote, lines, submitted=(), batch_size=100):
+    """
+    Write `lines` as the products of `quote` with a fixed number of queries.
+
+    Products are checked with a single `in_bulk`, lines whose pk belongs to the
+    quote are updated, the rest are created, and existing lines the form did
+    not submit (removed in the UI) are deleted.
+
+    Bulk writes skip the `ProductQuote` signals; the quote list caches they
+    would clear are already invalidated by saving the quote itself.
+
+    Returns:
+        list[ProductQuote]: Every line the quote has after saving.
+    """
+    products = Product.objects.in_bulk({line.product for line in lines})
+    existing = {line.pk: line for line in quote.products.all()} if quote.pk else {}
+
+    created, updated = [], []
+    for line in lines:
+        product = products.get(line.product)
+        if product is None:
+            continue
+
+        instance = existing.get(line.pk)
+        if instance is None:
+            instance = ProductQuote(quote=quote)
+            created.append(instance)
+        else:
+            updated.append(instance)
+
+        instance.product = product
+        instance.discount = line.discount
+        instance.profit_margin = line.profit_margin
+        instance.quantity = line.quantity
+        instance.unit_price = line.unit_price
+        instance.subtotal = line.subtotal
+
+    if created:
+        ProductQuote.objects.bulk_create(created, batch_size=batch_size)
+    if updated:
+        ProductQuote.objects.bulk_update(
+            updated,
+            ["product", "discount", "profit_margin", "quantity", "unit_price", "subtotal"],
+            batch_size=batch_size,
+        )
+
+    updated_pks = {instance.pk for instance in updated}
+    untouched = [instance for pk, instance in existing.items() if pk in submitted and pk not in updated_pks]
+
+    removed = [pk for pk in existing if pk not in updated_pks and pk not in submitted]
+    if removed:
+        # Through the related manager the deleted rows already know their quote,
+        # so the post_delete receivers do not fetch it once per line.
+        quote.products.filter(pk__in=removed).delete()
+
+    return updated + untouched + created
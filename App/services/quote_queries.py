@@ -0,0 +1,57 @@
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+from .session_cache import get_visible_quotes
+from .search import search_quotes
+
+
+QUOTE_ROW_RELATED = ("client__entity", "salesRep", "approved_by")
+
+
+def filter_quotes(quotes, params):
+    """
+    Apply the quote list filters (`q`, `public_id`, `entity`, `client`,
+    `sales_rep`, `date`, `date_from`, `date_to`, `status`) found in `params`
+    to `quotes`. `date_from` and `date_to` are inclusive.
+
+    `q` is matched against the indexed search document and should be preferred
+    over the individual `icontains` filters, which scan the table.
+    """
+    q = params.get("q")
+    if q:
+        quotes = search_quotes(quotes, q)
+
+    filters = {
+        "public_id__icontains": params.get("public_id"),
+        "client__entity__name__icontains": params.get("entity"),
+        "client__name__icontains": params.get("client"),
+        "date": params.get("date"),
+        "date__gte": params.get("date_from"),
+        "date__lte": params.get("date_to"),
+        "status": params.get("status"),
+    }
+
+    sales_rep = params.get("sales_rep")
+
+    if sales_rep:
+        quotes = quotes.annotate(
+            full_name=Concat(
+                "salesRep__first_name",
+                Value(" "),
+                "salesRep__last_name"
+            )
+        ).filter(full_name__icontains=sales_rep)
+
+    for key, value in filters.items():
+        if value:
+            quotes = quotes.filter(**{key: value})
+
+    return quotes
+
+
+def quote_list_queryset(pk, role, params):
+    """
+    Return the quotes shown by `quote_list_view` for a user and its filters.
+    """
+    quotes = get_visible_quotes(pk, role).select_related(*QUOTE_ROW_RELATED).order_by("date")
+    return filter_quotes(quotes, params)
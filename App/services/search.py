@@ -0,0 +1,185 @@
+import logging, unicodedata
+
+from django.db import DatabaseError, OperationalError, connection, transaction
+from django.db.models.expressions import RawSQL
+
+
+SQLITE_TABLE = "App_quote_search"
+TRIGRAM_INDEX = "quote_search_trgm_idx"
+MIN_TRIGRAM = 3
+
+_sqlite_ready = None
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(text):
+    """
+    Lowercase `text` and strip accents, so "Clínica" matches "clinica".
+    """
+    text = unicodedata.normalize("NFKD", str(text or ""))
+    return "".join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def build_search_document(public_id, entity, client, first_name, last_name):
+    return normalize(" ".join(str(part) for part in (public_id, entity, client, first_name, last_name) if part))
+
+
+def quote_search_document(quote):
+    client = quote.client
+    return build_search_document(
+        quote.public_id,
+        client.entity.name,
+        client.name,
+        quote.salesRep.first_name,
+        quote.salesRep.last_name,
+    )
+
+
+def refresh_search_documents(quotes, batch_size=500):
+    """
+    Recompute the search document of `quotes`, writing only the ones that changed.
+
+    Returns:
+        set[int]: The sales reps owning the changed quotes.
+    """
+    from ..models import Quote
+
+    changed = []
+    for quote in quotes.select_related("client__entity", "salesRep").iterator(chunk_size=batch_size):
+        document = quote_search_document(quote)
+        if document != quote.search_document:
+            quote.search_document = document
+            changed.append(quote)
+
+    Quote.objects.bulk_update(changed, ["search_document"], batch_size=batch_size)
+    return {quote.salesRep_id for quote in changed}
+
+
+SQLITE_SETUP = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} USING fts5(
+        search_document, content='App_quote', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_TABLE}_ai AFTER INSERT ON App_quote BEGIN
+        INSERT INTO {SQLITE_TABLE}(rowid, search_document) VALUES (new.id, new.search_document);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_TABLE}_ad AFTER DELETE ON App_quote BEGIN
+        INSERT INTO {SQLITE_TABLE}({SQLITE_TABLE}, rowid, search_document) VALUES ('delete', old.id, old.search_document);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_TABLE}_au AFTER UPDATE OF search_document ON App_quote BEGIN
+        INSERT INTO {SQLITE_TABLE}({SQLITE_TABLE}, rowid, search_document) VALUES ('delete', old.id, old.search_document);
+        INSERT INTO {SQLITE_TABLE}(rowid, search_document) VALUES (new.id, new.search_document);
+    END
+    """,
+]
+
+
+def _install_pg_trgm(conn, cursor):
+    """
+    Make sure the pg_trgm extension exists, returning False if it cannot be
+    created (the role lacks CREATE on the database, or Azure Database for
+    PostgreSQL does not list it in `azure.extensions`).
+    """
+    cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    if cursor.fetchone():
+        return True
+    try:
+        with transaction.atomic(using=conn.alias):
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as e:
+        logger.warning(
+            "pg_trgm is not installed and could not be created (%s). Quote search "
+            "works without it but scans the table; have an administrator run "
+            "CREATE EXTENSION pg_trgm, then migrate again.", e,
+        )
+        return False
+    return True
+
+
+def install_search_index(conn=None):
+    """
+    Create the substring index over `Quote.search_document`.
+
+    PostgreSQL gets a pg_trgm GIN index. The extension is a prerequisite: it
+    is created here when the database role may do so, otherwise the index is
+    skipped with a warning. SQLite gets an FTS5 trigram table shadowing
+    `App_quote`, kept in sync by triggers. Safe to run repeatedly; it runs
+    after every `migrate` because SQLite table rebuilds drop triggers.
+    """
+    global _sqlite_ready
+    conn = conn or connection
+
+    with conn.cursor() as cursor:
+        if conn.vendor == "postgresql":
+            if not _install_pg_trgm(conn, cursor):
+                return
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX} ON "App_quote" '
+                f"USING gin (search_document gin_trgm_ops)"
+            )
+        elif conn.vendor == "sqlite":
+            names = [SQLITE_TABLE] + [f"{SQLITE_TABLE}_{suffix}" for suffix in ("ai", "ad", "au")]
+            cursor.execute(
+                f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({', '.join(['%s'] * len(names))})",
+                names,
+            )
+            if cursor.fetchone()[0] == len(names):
+                return
+            try:
+                for statement in SQLITE_SETUP:
+                    cursor.execute(statement)
+                cursor.execute(f"INSERT INTO {SQLITE_TABLE}({SQLITE_TABLE}) VALUES ('rebuild')")
+            except OperationalError:
+                # SQLite built without FTS5/trigram, searches fall back to a scan.
+                return
+            if conn.alias == connection.alias:
+                _sqlite_ready = True
+
+
+def uninstall_search_index(conn=None):
+    conn = conn or connection
+
+    with conn.cursor() as cursor:
+        if conn.vendor == "postgresql":
+            cursor.execute(f"DROP INDEX IF EXISTS {TRIGRAM_INDEX}")
+        elif conn.vendor == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {SQLITE_TABLE}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {SQLITE_TABLE}")
+
+
+def _sqlite_search_available():
+    global _sqlite_ready
+    if _sqlite_ready is None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = %s", [SQLITE_TABLE])
+            _sqlite_ready = cursor.fetchone() is not None
+    return _sqlite_ready
+
+
+def search_quotes(quotes, q):
+    """
+    Filter `quotes` to those whose ID, entity, client or sales rep contains
+    every word of `q`, using the substring index of the current database.
+    """
+    terms = normalize(q).split()
+
+    indexed = [term for term in terms if len(term) >= MIN_TRIGRAM]
+    if indexed and connection.vendor == "sqlite" and _sqlite_search_available():
+        match = " AND ".join('"{}"'.format(term.replace('"', '""')) for term in indexed)
+        quotes = quotes.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s", [match])
+        )
+        terms = [term for term in terms if len(term) < MIN_TRIGRAM]
+
+    for term in terms:
+        quotes = quotes.filter(search_document__contains=term)
+
+    return quotes
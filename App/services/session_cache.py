@@ -1,30 +1,106 @@
-import random, time
+import random, time, hashlib
 from datetime import date
+from typing import NamedTuple
 
-from django.core.cache import cache
+from ..models import Product, Quote
 
-from ..models import DailyIndicators
+from .indicators import get_indicators
+from .cache_versions import MANAGER_ROLES, PRODUCTS_NAMESPACE, quotes_namespace, get_cached
 
-from ..models import Product, Quote
+
+PAGINATION_PARAMS = ("page", "cursor", "refresh")
+
+
+class ProductRow(NamedTuple):
+    pk: int
+    code: str
+    material_number: str | None
+    description: str
+    price: int
+
+
+def _load_products():
+    rows = (
+        Product.objects
+        .order_by("code")
+        .values_list("pk", "code", "material_number", "description", "price")
+    )
+    return {row[0]: ProductRow(*row) for row in rows}
+
+
+def get_product_index(refresh=None):
+    """
+    Return a snapshot of the catalog as `{pk: ProductRow}`, ordered by code.
+
+    The snapshot lives in the shared cache and in each worker's memory until
+    a `Product` write bumps the products namespace.
+    """
+    return get_cached(
+        PRODUCTS_NAMESPACE,
+        "index",
+        _load_products,
+        timeout=None,
+        refresh=refresh,
+        local=True,
+    )
 
 
 def get_all_products(refresh=None):
-    products = cache.get("all_products")
-    if products is None or refresh:
-        products = Product.objects.all()
-        cache.set("all_products", products, timeout=None)
-    return products
+    return tuple(get_product_index(refresh).values())
 
 
-def get_all_quotes(pk=None, role="REP", refresh=None):
-    quotes = cache.get(f"quotes_{pk}_{role}")
-    if quotes is None or refresh:
-        if role == "MAN" or role == "ADM":
-            quotes = Quote.objects.all()
-        else:
-            quotes = Quote.objects.filter(salesRep__pk=pk)
-        cache.set(f"quotes_{pk}_{role}", quotes, timeout=60*60)
-    return quotes
+def get_product(pk):
+    try:
+        return get_product_index().get(int(pk))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_products(pks):
+    index = get_product_index()
+    return {pk: index[pk] for pk in pks if pk in index}
+
+
+def get_visible_quotes(pk=None, role="REP"):
+    """
+    Return the quotes a user may see: every quote for managers and
+    administrators, only their own for sales reps. Scoping is done in SQL.
+    """
+    if role in MANAGER_ROLES:
+        return Quote.objects.all()
+    return Quote.objects.filter(salesRep__pk=pk)
+
+
+def get_quote_count(pk, role, quotes, params=None, scope="list", refresh=None):
+    """
+    Return `quotes.count()`, cached per user namespace and filter combination
+    until a quote of that namespace changes.
+
+    Args:
+        pk (int): The user's primary key.
+        role (str): The user's role.
+        quotes (QuerySet): The filtered quotes to count.
+        params (QueryDict, optional): The request parameters used to filter `quotes`.
+        scope (str): Distinguishes lists that share parameters but not base filters.
+        refresh (bool): Ignore the cached count.
+
+    Returns:
+        int: The number of quotes.
+    """
+    filters = sorted(
+        (key, value)
+        for key, values in (params.lists() if params else [])
+        if key not in PAGINATION_PARAMS
+        for value in values
+    )
+    digest = hashlib.md5(repr(filters).encode()).hexdigest()
+    return get_cached(
+        quotes_namespace(pk, role),
+        f"count:{scope}:{digest}",
+        quotes.count,
+        timeout=60*60,
+        refresh=refresh,
+    )
 
 
 def generate_temp_id():
@@ -32,10 +108,5 @@ def generate_temp_id():
 
 
 def set_indicators():
-    today = date.today()
-    try:
-        indicators = DailyIndicators.objects.get(date=today)
-        cache.set("indicators", indicators, timeout=60 * 60 * 24)
-        return True
-    except DailyIndicators.DoesNotExist:
-        return False
\ No newline at end of file
+    indicators = get_indicators()
+    return indicators is not None and indicators.date == date.today()
\ No newline at end of file
@@ -1,8 +1,7 @@
-from django.core.cache import cache
-from django.core.cache import cache
 from decimal import Decimal, InvalidOperation
 
-from .session_cache import set_indicators
+from .indicators import rate_for
+from .drafts import set_line_subtotal, remove_line_subtotal, line_subtotals
 
 FREIGHT = Decimal(0.04)
 INSURANCE = Decimal(0.02)
@@ -10,17 +9,11 @@ CUSTOMS = Decimal(0.02)
 WARRANT_AND_MAINTENANCE = Decimal(0.03)
 
 
-def exchange_currency(price, exchange: str):
-    set_indicators()
-    indicators = cache.get("indicators")
-    
-    if indicators is None:
-        raise ValueError("Indicators not found in cache. Please ensure `set_indicators()` is called daily.")
+def exchange_currency(price, exchange: str, day=None):
+    _, uf, dolar = rate_for(day)
 
     try:
         price = Decimal(price)
-        dolar = Decimal(indicators.dolar)
-        uf = Decimal(indicators.uf)
     except InvalidOperation:
         raise ValueError("Invalid values")
 
@@ -55,24 +48,34 @@ def calculate_subtotal(index, price, discount=None, profit_margin=None, quantity
     return unit_price, subtotal
 
 
+def price_product(product, exchange, discount=0, profit_margin=35, quantity=1, day=None):
+    price = exchange_currency(product.price, exchange, day)
+
+    unit_price, subtotal = calculate_subtotal(
+        None,
+        price,
+        int(discount),
+        int(profit_margin),
+        int(quantity)
+    )
+
+    if exchange == "CLP":
+        unit_price = int(unit_price)
+        subtotal = int(subtotal)
+
+    return unit_price, subtotal
+
+
 def remove_item_from_subtotal(request, index):
-    current_total = cache.get('total_net', {})
-    item_subtotal = current_total.get(str(index))
-    
-    if item_subtotal:
-        current_total.pop(str(index))
-        cache.set('total_net', current_total)
+    remove_line_subtotal(request, index)
 
 
-def set_total_net(index, subtotal):
-    current_total = cache.get('total_net', {})
-    current_total[index] = Decimal(subtotal)
-    cache.set('total_net', current_total)
+def set_total_net(request, index, subtotal):
+    set_line_subtotal(request, index, subtotal)
 
 
-def calculate_quote_totals(exchange):
-    current_total = cache.get('total_net', {})
-    total_net = sum([value for value in current_total.values()])
+def calculate_quote_totals(request, exchange):
+    total_net = sum(line_subtotals(request).values(), Decimal(0))
     iva = round(total_net * Decimal(0.19), 2)
     final = total_net + iva
 
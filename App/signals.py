@@ -1,8 +1,16 @@
-from django.db.models.signals import post_save, post_delete
+from django.db import connections
+from django.db.models.signals import post_save, post_delete, post_migrate
 from django.dispatch import receiver
-from django.core.cache import cache
 
-from .models import Product, Quote, ProductQuote
+from .models import DailyIndicators, Product, Quote, ProductQuote
+from .services.indicators import invalidate_indicators
+from .services.search import install_search_index, refresh_search_documents
+from .services.product_search import reset_product_search
+from .services.pdf_cache import forget_quote_pdf
+from .services.invalidation import invalidate
+
+from AuthUser.models import Client, Entity, SalesRep
+from .services.cache_versions import MANAGER_QUOTES_NAMESPACE, PRODUCTS_NAMESPACE, quotes_namespace, bump_namespace
 
 
 """@receiver(post_save, sender=ProductQuote)
@@ -17,10 +25,70 @@ def update_quote_total(sender, instance, **kwargs):
 @receiver(post_save, sender=Product)
 @receiver(post_delete, sender=Product)
 def clear_product_cache(sender, **kwargs):
-    cache.delete("all_products")
+    invalidate(bump_namespace, PRODUCTS_NAMESPACE)
+    invalidate(reset_product_search)
 
 
 @receiver(post_save, sender=Quote)
 @receiver(post_delete, sender=Quote)
-def clear_quote_cache(sender, **kwargs):
-    cache.delete("all_quotes")
+def clear_quote_cache(sender, instance, **kwargs):
+    invalidate(bump_namespace, quotes_namespace(instance.salesRep_id))
+    invalidate(bump_namespace, MANAGER_QUOTES_NAMESPACE)
+    invalidate(forget_quote_pdf, instance.pk)
+
+
+def clear_quote_owner_cache(quote_pk):
+    sales_rep = Quote.objects.filter(pk=quote_pk).values_list("salesRep_id", flat=True).first()
+    # A deleted quote already cleared its owner's namespace in clear_quote_cache.
+    if sales_rep is not None:
+        bump_namespace(quotes_namespace(sales_rep))
+
+
+@receiver(post_save, sender=ProductQuote)
+@receiver(post_delete, sender=ProductQuote)
+def clear_product_quote_cache(sender, instance, **kwargs):
+    invalidate(forget_quote_pdf, instance.quote_id)
+    invalidate(bump_namespace, MANAGER_QUOTES_NAMESPACE)
+    if ProductQuote.quote.is_cached(instance):
+        invalidate(bump_namespace, quotes_namespace(instance.quote.salesRep_id))
+    else:
+        # Looked up once per quote when the invalidations run, not per line.
+        invalidate(clear_quote_owner_cache, instance.quote_id)
+
+
+@receiver(post_save, sender=DailyIndicators)
+@receiver(post_delete, sender=DailyIndicators)
+def clear_indicators_cache(sender, instance, **kwargs):
+    invalidate_indicators(instance.date)
+
+
+def refresh_quote_search(quotes):
+    sales_reps = refresh_search_documents(quotes)
+    if sales_reps:
+        bump_namespace(*(quotes_namespace(pk) for pk in sales_reps), MANAGER_QUOTES_NAMESPACE)
+
+
+@receiver(post_save, sender=Entity)
+def refresh_entity_search(sender, instance, created, **kwargs):
+    if not created:
+        refresh_quote_search(Quote.objects.filter(client__entity=instance))
+
+
+@receiver(post_save, sender=Client)
+def refresh_client_search(sender, instance, created, **kwargs):
+    if not created:
+        refresh_quote_search(Quote.objects.filter(client=instance))
+
+
+@receiver(post_save, sender=SalesRep)
+def refresh_sales_rep_search(sender, instance, created, update_fields=None, **kwargs):
+    # Logins save last_login only, skip those.
+    if created or (update_fields is not None and not {"first_name", "last_name"} & set(update_fields)):
+        return
+    refresh_quote_search(Quote.objects.filter(salesRep=instance))
+
+
+@receiver(post_migrate)
+def reinstall_search_index(sender, using, **kwargs):
+    if sender.name == "App":
+        install_search_index(connections[using])
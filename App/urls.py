@@ -5,6 +5,8 @@ from App.views import (
     sidebar,
 
     dashboard_view,
+    cache_stats_view,
+    metrics_view,
     list_layout_view,
     quote_list_view,
     pending_quote_list_view,
@@ -13,7 +15,9 @@ from App.views import (
     product_form_view,
     product_form_from_template_view,
     remove_product_form_view,
+    product_search_view,
     update_product_prices_view,
+    update_quote_prices_view,
     update_quote_totals_view,
     quote_detail_view,
     quote_create_or_update_view,
@@ -22,12 +26,18 @@ from App.views import (
     template_selector_view,
     template_products_view,
     generate_quote_pdf_view,
+    export_quote_pdfs_view,
+    pdf_job_status_view,
+    pdf_job_download_view,
+    pdf_job_stats_view,
 )
 
 urlpatterns = [
     path('', index, name='index'),
     path('dashboard', dashboard_view, name='dashboard'),
     path('sidebar', sidebar, name='sidebar'),
+    path('cache-stats/', cache_stats_view, name='cache_stats'),
+    path('metrics', metrics_view, name='metrics'),
 
     path('list-layout/', list_layout_view, name='list_layout'),
     path('quotes/', quote_list_view, name='quote_list'),
@@ -38,7 +48,9 @@ urlpatterns = [
     path('product-form/', product_form_view, name='product_form'),
     path('product-form-from-template/', product_form_from_template_view, name='product_form_from_template'),
     path('remove-product-form/', remove_product_form_view, name='remove_product_form'),
+    path('product-search/', product_search_view, name='product_search'),
     path('update-product-prices/', update_product_prices_view, name='update_product_prices'),
+    path('update-quote-prices/', update_quote_prices_view, name='update_quote_prices'),
     path('update-quote-totals/', update_quote_totals_view, name='update_quote_totals'),
 
     path('quotes/create_or_update/', quote_create_or_update_view, name='create_or_update_quote'),
@@ -50,4 +62,8 @@ urlpatterns = [
     path('template-products/', template_products_view, name='template_products'),
 
     path('quotes/<int:quote_id>/generate-pdf/', generate_quote_pdf_view, name='generate_pdf'),
+    path('quotes/export/', export_quote_pdfs_view, name='export_quotes'),
+    path('pdf-jobs/<str:job_id>/', pdf_job_status_view, name='pdf_job_status'),
+    path('pdf-jobs/<str:job_id>/download/', pdf_job_download_view, name='pdf_job_download'),
+    path('pdf-jobs-stats/', pdf_job_stats_view, name='pdf_job_stats'),
 ]
@@ -1,45 +1,49 @@
-from weasyprint import HTML
+import hmac, os
+from datetime import date
 
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpRequest, HttpResponse
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse, JsonResponse
 from django.db import transaction, IntegrityError
-from django.db.models import Value
-from django.db.models.functions import Concat
-from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.core.paginator import Paginator
-from django.core.cache import cache
 from django.contrib.auth.decorators import login_required
 
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_http_methods
 
-from .services.session_cache import set_indicators, get_all_products, get_all_quotes
-from .services.utils import exchange_currency, set_total_net, calculate_subtotal, remove_item_from_subtotal, calculate_quote_totals
+from .services.session_cache import set_indicators, get_product, get_products, get_visible_quotes, get_quote_count
+from .services.quote_queries import QUOTE_ROW_RELATED, quote_list_queryset
+from .services.pagination import CountedPaginator, CursorPage
+from .services.cache_versions import MANAGER_ROLES, cache_stats
+from .services.product_search import product_label, search_products
+from .services.quote_lines import parse_quote_lines, save_quote_lines
+from .services.pdf_jobs import DONE, QueueFull, get_job, load_quote, pdf_job_stats, submit_quote_pdf, wait_for_job
+from .services.pdf_export import submit_quote_export
+from .services.metrics import render_metrics
+from .services.drafts import new_draft, allocate_line, release_line, discard_draft
+from .services.utils import exchange_currency, set_total_net, price_product, remove_item_from_subtotal, calculate_quote_totals
 
 from .models import Quote, Product, ProductQuote, Template, TemplateProduct
 
 from AuthUser.models import SalesRep, Entity
 
-from .forms import QuoteForm, ProductQuoteForm, PricingForm, ProductQuoteFullForm
-
-from .Constants.logo import OLYMPUS_LOGO
-from .Constants.bg import BACKGROUND
-from .Constants.ISO9001 import ISO9001
-from .Constants.ISO13485 import ISO13845
+from .forms import QuoteForm, ProductQuoteForm, PricingForm
 
 
 def index(request):
-    if request.session.get("user_email"):
+    if request.principal.is_authenticated:
         return redirect("dashboard")
     
-    return render(request, 'index.html', {'bg': BACKGROUND})
+    return render(request, 'index.html')
 
 
 def dashboard_view(request: HttpRequest) -> HttpResponse:
     """
     Renders the main dashboard view for authenticated users.
 
-    Redirects to the homepage if the session does not contain a valid 'user_email'.
+    Redirects to the homepage if the session holds no logged-in user.
     Calls `set_indicators()` to prepare dashboard metrics.
     
     Context variables passed to the 'home.html' template:
@@ -54,27 +58,65 @@ def dashboard_view(request: HttpRequest) -> HttpResponse:
     Returns:
         HttpResponse: A rendered response of the dashboard or a redirect to '/'.
     """
-    session = request.session
-    user_email = session.get("user_email")
+    principal = request.principal
 
-    if not user_email:
+    if not principal.is_authenticated:
         return redirect("/")
 
     set_indicators()
 
-    role = session.get("role")
-    role_display = dict(SalesRep.ROLE_CHOICES).get(role, "Invitado")
-
     context = {
-        "user_email": user_email,
-        "full_name": session.get("full_name"),
-        "role": role,
-        "role_display": role_display,
+        "user_email": principal.email,
+        "full_name": principal.name,
+        "role": principal.role,
+        "role_display": principal.role_display,
     }
 
     return render(request, "home.html", context)
 
 
+def cache_stats_view(request: HttpRequest) -> JsonResponse:
+    """
+    Return the cache hit/miss counters of the worker that served the request.
+
+    Only available to managers and administrators.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request.
+
+    Returns:
+        JsonResponse: Hits, misses and hit ratio per cache namespace.
+    """
+    if request.principal.role not in MANAGER_ROLES:
+        return JsonResponse({"detail": "Forbidden"}, status=403)
+
+    return JsonResponse(cache_stats())
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Return the app metrics of every gunicorn worker in the Prometheus text format.
+
+    Scrapers authenticate with `Authorization: Bearer <METRICS_TOKEN>`. Without
+    a configured token the endpoint only answers when DEBUG is on.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request.
+
+    Returns:
+        HttpResponse: The metrics, or 404 when the token is missing or wrong.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        sent = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(sent.encode(), token.encode()):
+            raise Http404
+    elif not settings.DEBUG:
+        raise Http404
+
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 def sidebar(request: HttpRequest) -> HttpResponse:
     """
     Render the sidebar partial with the active tab highlighted.
@@ -105,79 +147,86 @@ def list_layout_view(request: HttpRequest) -> HttpResponse:
     Returns:
         HttpResponse: The rendered list layout page.
     """
-    role = request.session.get("role", "REP")
+    role = request.principal.role or "REP"
     return render(request, "quote/list_layout.html", {"role": role})
 
 
-def quote_list_view(request: HttpRequest) -> HttpResponse:
+def paginate_quotes(request: HttpRequest, quotes, scope: str) -> dict:
     """
-    Render a paginated and filtered list of quotes for the current user.
+    Build the pagination context shared by the quote list views.
 
-    Filters are applied based on query parameters (e.g., client, sales rep, status),
-    and results are paginated to 10 items per page. Empty slots are padded with
-    `None` to ensure a consistent list size.
+    Uses numbered pages over a cached count by default, or keyset pagination
+    on `(date, id)` with a capped count when `QUOTE_LIST_CURSOR_PAGINATION`
+    is enabled. The page is padded with `None` up to 10 rows.
 
     Args:
         request (HttpRequest): The incoming HTTP request with session and GET params.
+        quotes (QuerySet): The filtered quotes.
+        scope (str): Identifies the list for the cached count.
 
     Returns:
-        HttpResponse: Rendered HTML partial with quote data and pagination.
+        dict: Context with `quotes`, `real_quotes`, `page_obj` and pagination details.
     """
-    session = request.session
-    user_pk = session.get("pk")
-    user_role = session.get("role")
-    refresh = request.GET.get("refresh")
-
-    quotes = get_all_quotes(user_pk, user_role, refresh).order_by("date")
-
-    filters = {
-        "public_id__icontains": request.GET.get("public_id"),
-        "client__entity__name__icontains": request.GET.get("entity"),
-        "client__name__icontains": request.GET.get("client"),
-        "date": request.GET.get("date"),
-        "status": request.GET.get("status"),
-    }
-
-    sales_rep = request.GET.get("sales_rep")
+    user_pk = request.principal.pk
+    user_role = request.principal.role
+    refresh = request.GET.get("refresh") or None
 
-    if sales_rep:
-        quotes = quotes.annotate(
-            full_name=Concat(
-                "salesRep__first_name",
-                Value(" "),
-                "salesRep__last_name"
-            )
-        ).filter(full_name__icontains=sales_rep)
-
-    for key, value in filters.items():
-        if value:
-            quotes = quotes.filter(**{key: value})
-
-    paginator = Paginator(quotes, 10)
-    page_number = request.GET.get("page") or 1
-    page_obj = paginator.get_page(page_number)
+    if settings.QUOTE_LIST_CURSOR_PAGINATION:
+        cap = settings.QUOTE_LIST_COUNT_CAP
+        count = get_quote_count(user_pk, user_role, quotes[:cap + 1], request.GET, f"{scope}:capped", refresh)
+        page_obj = CursorPage(quotes, request.GET.get("cursor"), 10)
+        count_label = f"{cap}+" if count > cap else count
+    else:
+        count = get_quote_count(user_pk, user_role, quotes, request.GET, scope, refresh)
+        paginator = CountedPaginator(quotes, 10, count)
+        page_obj = paginator.get_page(request.GET.get("page") or 1)
+        count_label = count
 
-    real_quotes = quotes.exists()
     paginated_quotes = list(page_obj.object_list)
     paginated_quotes += [None] * (10 - len(paginated_quotes))
 
-    context = {
+    return {
         "quotes": paginated_quotes,
-        "real_quotes": real_quotes,
+        "real_quotes": count > 0,
         "page_obj": page_obj,
+        "cursor_mode": settings.QUOTE_LIST_CURSOR_PAGINATION,
+        "count_label": count_label,
         "current_filters": request.GET.urlencode(),
     }
 
+
+def quote_list_view(request: HttpRequest) -> HttpResponse:
+    """
+    Render a paginated and filtered list of quotes for the current user.
+
+    Filters are applied based on query parameters (e.g., client, sales rep, status),
+    and results are paginated to 10 items per page. Empty slots are padded with
+    `None` to ensure a consistent list size. Rows are rendered inline, with their
+    client, entity and users loaded in the same query.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request with session and GET params.
+
+    Returns:
+        HttpResponse: Rendered HTML partial with quote data and pagination.
+    """
+    quotes = quote_list_queryset(request.principal.pk, request.principal.role, request.GET)
+
+    context = paginate_quotes(request, quotes, "list")
     return render(request, "quote/partials/quote_list.html", context)
     
 
 # Deletion incoming
 def pending_quote_list_view(request):
-    user_pk = request.session.get("pk")
-    user_role = request.session.get("role")
-    refresh = request.GET.get("refresh") or None
-
-    quotes = get_all_quotes(user_pk, user_role, refresh).filter(status="WT").order_by("date")
+    user_pk = request.principal.pk
+    user_role = request.principal.role
+
+    quotes = (
+        get_visible_quotes(user_pk, user_role)
+        .select_related(*QUOTE_ROW_RELATED)
+        .filter(status="WT")
+        .order_by("date")
+    )
 
     pk = request.GET.get("pk")
     client = request.GET.get("client")
@@ -196,37 +245,22 @@ def pending_quote_list_view(request):
     if status:
         quotes = quotes.filter(status=status)
 
-    paginator = Paginator(quotes, 10)
-    page_number = request.GET.get("page", 1) or 1
-    page_obj = paginator.get_page(page_number)
-
-    real_quotes = quotes.exists()
-
-    quotes = list(page_obj.object_list)
-    quotes += [None] * (10 - len(quotes))
-
-    context = {
-        "quotes": quotes,
-        "real_quotes": real_quotes,
-        "page_obj": page_obj,
-        "current_filters": request.GET.urlencode(),
-    }
-
+    context = paginate_quotes(request, quotes, "pending")
     return render(request, "quote/partials/quote_list.html", context=context)
 
 
 def quote_view(request, pk):
-    quote = Quote.objects.get(pk=pk)
+    quote = Quote.objects.select_related(*QUOTE_ROW_RELATED).get(pk=pk)
 
     return render(request, "quote/partials/quote.html", {"quote": quote})
 
 
 def set_quote_status_view(request, pk, status):
-    user_pk = request.session.get("pk")
-    user = get_object_or_404(SalesRep, pk=user_pk)
+    if not request.principal.is_authenticated:
+        raise Http404
+    user = request.principal.reference
     quote = get_object_or_404(Quote, pk=pk)
 
-    quote = Quote.objects.get(pk=pk)
     if status == "AP":
         quote.approve_by_manager(user)
     elif status == "RJ":
@@ -238,8 +272,8 @@ def set_quote_status_view(request, pk, status):
     
 
 def quote_products_view(request, pk):
-    role = request.session.get("role")
-    products = ProductQuote.objects.filter(quote__pk=pk)
+    role = request.principal.role
+    products = ProductQuote.objects.filter(quote__pk=pk).select_related("product").order_by("pk")
 
     paginator = Paginator(products, 6)
     page_number = request.GET.get("page", 1) or 1
@@ -259,17 +293,15 @@ def quote_products_view(request, pk):
 
 
 def product_form_view(request):
-    role = request.session.get("role")
+    role = request.principal.role
     pk = request.GET.get("pk")
-    index = cache.get("form_counter", 0) + 1
+    index, _ = allocate_line(request)
 
     exchage = request.GET.get("exchage") or "USD"
 
-    cache.set("form_counter", index)
-    
     if pk:
-        instance = ProductQuote.objects.get(pk=pk)
-        instance.price = exchange_currency(instance.price, exchage)
+        instance = ProductQuote.objects.select_related("quote").get(pk=pk)
+        instance.price = exchange_currency(instance.price, exchage, instance.quote.priced_on)
     else:
         instance = None
 
@@ -286,13 +318,13 @@ def product_form_view(request):
 
 
 def product_form_from_template_view(request):
-    role = request.session.get("role")
+    role = request.principal.role
     pk = request.GET.get("product-form")
-    
-    index = cache.get("form_counter", 0)
-    cache.set("form_counter", index + 1)
 
-    if int(index) >= 10:
+    index, rows = allocate_line(request)
+
+    if rows > 10:
+        release_line(request, index)
         return HttpResponse("")
     
     if pk:
@@ -306,26 +338,56 @@ def product_form_from_template_view(request):
             initial = None
 
     product_form = ProductQuoteForm(index=index, initial=initial) 
-    products = get_all_products()
     context = {
         "role": role,
         "index": index,
         "product_pk": pk,
         "product_form": product_form,
-        "products": products
     }
 
     return render(request, "quote/partials/product_form.html", context=context)
 
 
 def remove_product_form_view(request):
-    cache.set("form_counter", cache.get("form_counter", 0) - 1)
-    index = request.GET.get("product_pk")
-    remove_item_from_subtotal(request, index)
+    index = request.GET.get("index")
+    release_line(request, index)
     
     return HttpResponse("")
 
 
+def product_search_view(request: HttpRequest) -> HttpResponse:
+    """
+    Return the `<option>` list for a product row's select, matching `q`.
+
+    Matches come from the in-memory prefix index over code, material number and
+    description, so a keystroke costs no queries. The currently selected
+    `product` is kept first so an unrelated search does not silently change the row.
+    """
+    q = request.GET.get("q", "")
+    selected = get_product(request.GET.get("product"))
+
+    products = [product for product in search_products(q) if selected is None or product.pk != selected.pk]
+    if selected is not None:
+        products.insert(0, selected)
+
+    context = {
+        "options": [(product.pk, product_label(product)) for product in products],
+        "selected": selected.pk if selected else None,
+    }
+    return render(request, "quote/partials/product_options.html", context=context)
+
+
+def _pricing_date(request):
+    """
+    Return the `pricing_date` sent by the edit form of an existing quote, so its
+    lines are repriced at the quote's own exchange rates, or None for today.
+    """
+    try:
+        return date.fromisoformat(request.GET.get("pricing_date") or "")
+    except ValueError:
+        return None
+
+
 def update_product_prices_view(request):
     form_counter = request.GET.get("index", 0)
     product = request.GET.get("product")
@@ -338,30 +400,17 @@ def update_product_prices_view(request):
     if not product:
         return HttpResponse("")
     
-    try:
-        product = Product.objects.get(pk=product)
-    except Product.DoesNotExist:
+    product = get_product(product)
+    if product is None:
         return HttpResponse("")
 
-    price = exchange_currency(product.price, exchange)
-
-    unit_price, subtotal = calculate_subtotal(
-        form_counter,
-        price,
-        int(discount),
-        int(profit_margin),
-        int(quantity)
-    )
+    unit_price, subtotal = price_product(product, exchange, discount, profit_margin, quantity, _pricing_date(request))
 
     if product.code == "MDO":
         custom = True
     else:
         custom = False
 
-    if exchange == "CLP":
-        unit_price = int(unit_price)
-        subtotal = int(subtotal)
-
     pricing_form = PricingForm(initial={"unit_price": unit_price, "subtotal": subtotal}, index=form_counter, custom=custom)
 
     context = {
@@ -372,20 +421,83 @@ def update_product_prices_view(request):
     return render(request, "quote/partials/prices.html", context=context)
 
 
+def update_quote_prices_view(request: HttpRequest) -> HttpResponse:
+    """
+    Reprice every line of the quote being edited in a single request.
+
+    Expects the row inputs of `#quote_items` (`index`, `product`, `discount`,
+    `profit_margin`, `quantity`) as parallel lists plus `exchange` and, for an
+    existing quote, `pricing_date`. Products are
+    read from the cached catalog snapshot, each line is priced with `price_product`
+    and the running totals are updated. The response carries every row's
+    pricing fragment and the totals as htmx out-of-band swaps.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request with the line inputs.
+
+    Returns:
+        HttpResponse: The rendered out-of-band pricing fragments.
+    """
+    exchange = request.GET.get("exchange") or "USD"
+    day = _pricing_date(request)
+
+    lines = zip(
+        request.GET.getlist("index"),
+        request.GET.getlist("product"),
+        request.GET.getlist("discount"),
+        request.GET.getlist("profit_margin"),
+        request.GET.getlist("quantity"),
+    )
+
+    parsed = []
+    for index, product, discount, profit_margin, quantity in lines:
+        try:
+            parsed.append((index, int(product), int(discount or 0), int(profit_margin or 35), int(quantity or 1)))
+        except ValueError:
+            remove_item_from_subtotal(request, index)
+
+    products = get_products([line[1] for line in parsed])
+
+    rows = []
+    for index, product_pk, discount, profit_margin, quantity in parsed:
+        product = products.get(product_pk)
+        if product is None:
+            remove_item_from_subtotal(request, index)
+            continue
+
+        unit_price, subtotal = price_product(product, exchange, discount, profit_margin, quantity, day)
+        set_total_net(request, index, subtotal)
+
+        rows.append({
+            "index": index,
+            "pricing_form": PricingForm(
+                initial={"unit_price": unit_price, "subtotal": subtotal},
+                index=index,
+                custom=product.code == "MDO",
+            ),
+        })
+
+    context = {
+        "rows": rows,
+        **calculate_quote_totals(request, exchange),
+    }
+    return render(request, "quote/partials/batch_prices.html", context=context)
+
+
 def update_quote_totals_view(request):
     index = request.GET.get("index") or None
     price = request.GET.get("subtotal") or None
     exchange = request.GET.get("exchange") or None
 
     if index and price:
-        set_total_net(index, price)
+        set_total_net(request, index, price)
 
-    context = calculate_quote_totals(exchange)
+    context = calculate_quote_totals(request, exchange)
     return render(request, "quote/partials/total_prices.html", context=context)
 
 
 def quote_detail_view(request, pk):
-    role = request.session.get("role")
+    role = request.principal.role
     quote = Quote.objects.get(pk=pk)
 
     context = {
@@ -399,8 +511,6 @@ def quote_detail_view(request, pk):
 @csrf_protect
 @require_http_methods(["GET", "POST"])
 def quote_create_or_update_view(request):
-    cache.set('total_net', {})
-
     pk = request.GET.get("pk") or None
     action = request.GET.get("action") or "create"
 
@@ -420,16 +530,7 @@ def quote_create_or_update_view(request):
         iva = request.POST.get("iva") or 0
         final = request.POST.get("final") or 0
 
-        items = []
-        keys = ['product', 'discount', 'profit_margin', 'unit_price', 'quantity', 'subtotal']
-        if action == "update":
-            keys.append("product_pk")
-        
-        length = len(request.POST.getlist('product'))
-
-        for i in range(length):
-            item = {key: request.POST.getlist(key)[i] for key in keys}
-            items.append(item)
+        lines, submitted = parse_quote_lines(request.POST, with_pk=action == "update")
 
         try:
             with transaction.atomic():                    
@@ -468,37 +569,24 @@ def quote_create_or_update_view(request):
                         print("Unexpected error while saving quote:", e)
                         raise
 
-                    for item in items:
-                        item["quote"] = quote
-                        try:
-                            product_pk = int(item.pop("product_pk", None))
-                        except (ValueError, TypeError):
-                            product_pk = None
-                        instance = ProductQuote.objects.filter(pk=product_pk).first() if product_pk else None
-                        
-                        product_quote_form = ProductQuoteFullForm(item, instance=instance)
-                        if product_quote_form.is_valid():
-                            print("form valid")
-                            product_quote = product_quote_form.save()
-                            print(f"Product quote #{product_quote.pk} related to Quote #{quote} saved!")
-
-                    if quote.status == "WT" and not quote.has_discounted_items:
+                    product_quotes = save_quote_lines(quote, lines, submitted)
+                    print(f"{len(product_quotes)} product quotes related to Quote #{quote} saved!")
+
+                    if quote.status == "WT" and not any(pq.discount > 0 for pq in product_quotes):
                         quote.status = "AP"
                         quote.approved_by = quote.salesRep
                         quote.save(update_fields=["status", "approved_by"])
 
+            discard_draft(request)
             return redirect("dashboard")
 
         except Exception as e:
             print("Transaction failed:", e)
             print("Changes reverted.")
 
-    request.session["form_counter"] = 0
-    request.session["total_net"] = {}
-
     quote_form = QuoteForm(instance=quote)
 
-    role = request.session.get("role")
+    role = request.principal.role
     context = {
         "role": role,
         'quote_form': quote_form,
@@ -515,7 +603,8 @@ def quote_create_or_update_view(request):
         ]
 
         context["product_forms"] = product_forms
-        request.session["form_counter"] = len(products)
+
+    context["draft"] = new_draft(request, lines=len(context.get("product_forms", [])))
 
     return render(request, "quote/partials/create_or_update.html", context=context)
 
@@ -539,20 +628,137 @@ def template_products_view(request):
     return render(request, "quote/partials/template_products.html", {'products_pks': products_pks})
 
 
-def generate_quote_pdf_view(request, quote_id):
-    quote = Quote.objects.get(id=quote_id)
-    products = ProductQuote.objects.filter(quote=quote)
-    html_string_pdf = render_to_string(
-        "docs/quote.html",
-        {
-            'quote': quote,
-            'products': products,
-            'logo': OLYMPUS_LOGO,
-            'ISO9001': ISO9001,
-            'ISO13485': ISO13845,
-        }
+def _pdf_job_response(request, job):
+    """
+    Stream a finished job's file. Stored files never change under a digest, so
+    the digest is the `ETag` and revalidations get a 304 without reading the file.
+    """
+    path = job["path"]
+    etag = quote_etag(job["digest"])
+    last_modified = int(os.stat(path).st_mtime)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    response = FileResponse(
+        open(path, "rb"),
+        as_attachment=True,
+        filename=job["filename"],
+        content_type=job.get("content_type", "application/pdf"),
     )
-    pdf = HTML(string=html_string_pdf).write_pdf()
-    response = HttpResponse(pdf, content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="Cotizacion #{quote} - {quote.client.entity.name}.pdf"'
-    return response
\ No newline at end of file
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _own_job(request, job_id):
+    job = get_job(job_id)
+    if job is None or job["owner"] != request.principal.pk:
+        raise Http404("PDF job not found")
+    return job
+
+
+def generate_quote_pdf_view(request: HttpRequest, quote_id: int) -> HttpResponse:
+    """
+    Queue the quote's PDF in the worker pool instead of rendering it inline.
+
+    htmx requests get the `pdf_job.html` status fragment, which polls
+    `pdf_job_status_view` until the download link is ready. Plain requests
+    (a direct link) wait for the job and receive the file.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request.
+        quote_id (int): The quote to render.
+
+    Returns:
+        HttpResponse: The status fragment, or the PDF for non-htmx requests.
+    """
+    try:
+        quote = load_quote(quote_id)
+    except Quote.DoesNotExist:
+        raise Http404("Quote not found")
+
+    htmx = bool(request.headers.get("HX-Request"))
+
+    try:
+        job_id = submit_quote_pdf(quote, owner=request.principal.pk)
+    except QueueFull:
+        if htmx:
+            return render(request, "quote/partials/pdf_job.html", {"job": None, "quote": quote})
+        return HttpResponse("Too many documents being generated, try again shortly.", status=503)
+
+    if htmx:
+        return render(request, "quote/partials/pdf_job.html", {"job": get_job(job_id), "quote": quote})
+
+    job = wait_for_job(job_id)
+    if job is None or job["status"] != DONE:
+        return HttpResponse("The document could not be generated.", status=500)
+    return _pdf_job_response(request, job)
+
+
+def export_quote_pdfs_view(request: HttpRequest) -> HttpResponse:
+    """
+    Queue a ZIP export of the PDFs of every quote matching the quote list filters.
+
+    Takes the same query parameters as `quote_list_view` (plus `date_from` and
+    `date_to`). The archive is built in the background, reusing stored PDFs,
+    and the `pdf_job.html` fragment polls until it can be downloaded.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request with session and GET params.
+
+    Returns:
+        HttpResponse: The status fragment, or 400 when more than
+        `PDF_EXPORT_MAX_QUOTES` quotes match.
+    """
+    quotes = quote_list_queryset(request.principal.pk, request.principal.role, request.GET)
+
+    count = quotes[:settings.PDF_EXPORT_MAX_QUOTES + 1].count()
+    if count > settings.PDF_EXPORT_MAX_QUOTES:
+        return HttpResponse(
+            f"Too many quotes to export at once (max {settings.PDF_EXPORT_MAX_QUOTES}), narrow the filters.",
+            status=400,
+        )
+
+    retry = request.get_full_path()
+    try:
+        job_id = submit_quote_export(quotes, owner=request.principal.pk, retry=retry)
+    except QueueFull:
+        return render(request, "quote/partials/pdf_job.html", {"job": None, "retry": retry})
+
+    return render(request, "quote/partials/pdf_job.html", {"job": get_job(job_id)})
+
+
+def pdf_job_status_view(request: HttpRequest, job_id: str) -> HttpResponse:
+    """
+    Render the status fragment of a PDF job; it keeps polling while pending.
+    """
+    job = _own_job(request, job_id)
+    return render(request, "quote/partials/pdf_job.html", {"job": job})
+
+
+def pdf_job_download_view(request: HttpRequest, job_id: str) -> FileResponse:
+    """
+    Stream the finished PDF of a job.
+    """
+    job = _own_job(request, job_id)
+    if job["status"] != DONE:
+        raise Http404("PDF not ready")
+    try:
+        return _pdf_job_response(request, job)
+    except FileNotFoundError:
+        raise Http404("PDF expired")
+
+
+def pdf_job_stats_view(request: HttpRequest) -> JsonResponse:
+    """
+    Return the PDF pool counters and queue depth of the worker that served the request.
+
+    Only available to managers and administrators.
+    """
+    if request.principal.role not in MANAGER_ROLES:
+        return JsonResponse({"detail": "Forbidden"}, status=403)
+
+    return JsonResponse(pdf_job_stats())
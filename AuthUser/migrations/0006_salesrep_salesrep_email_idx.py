@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AuthUser', '0005_rename_first_name_client_name_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='salesrep',
+            index=models.Index(fields=['email'], name='salesrep_email_idx'),
+        ),
+    ]
@@ -110,6 +110,9 @@ class SalesRep(EnterpriseUser, AbstractUser):
     class Meta:
         verbose_name = "Ingeniero"
         verbose_name_plural = "Ingenieros"
+        indexes = [
+            models.Index(fields=["email"], name="salesrep_email_idx"),
+        ]
 
     def __str__(self):
         return f"{self.last_name} {self.first_name}"
@@ -0,0 +1,87 @@
+"""
+Per-request view of the logged-in sales rep, built from the session.
+
+The session holds a compact snapshot (`pk`, `role`, `email`, `name`) written
+once at login, so views read who the user is without touching the database.
+"""
+
+from django.utils.functional import SimpleLazyObject, cached_property
+
+from .models import SalesRep
+
+
+SESSION_KEY = "principal"
+# Keys written by logins before the snapshot existed.
+LEGACY_KEYS = {"pk": "pk", "role": "role", "email": "user_email", "name": "full_name"}
+
+
+class Principal:
+    """
+    The logged-in sales rep, as stored in the session.
+
+    Attributes:
+        pk (int | None): The `SalesRep` primary key, None for anonymous requests.
+        role (str | None): The role code (see `SalesRep.ROLE_CHOICES`).
+        email (str | None): The Microsoft account email.
+        name (str | None): The full name from the Microsoft account.
+    """
+
+    def __init__(self, pk=None, role=None, email=None, name=None):
+        self.pk = pk
+        self.role = role
+        self.email = email
+        self.name = name
+
+    @classmethod
+    def from_session(cls, session):
+        data = session.get(SESSION_KEY)
+        if data is None:
+            data = {key: session.get(legacy) for key, legacy in LEGACY_KEYS.items()}
+        return cls(**data)
+
+    @property
+    def is_authenticated(self):
+        return self.pk is not None and bool(self.email)
+
+    @property
+    def role_display(self):
+        return dict(SalesRep.ROLE_CHOICES).get(self.role, "Invitado")
+
+    @cached_property
+    def user(self):
+        """
+        The `SalesRep` row, loaded on first access only.
+        """
+        return SalesRep.objects.get(pk=self.pk)
+
+    @property
+    def reference(self):
+        """
+        An unsaved `SalesRep` carrying only the pk, to assign foreign keys
+        without loading the row.
+        """
+        return SalesRep(pk=self.pk)
+
+
+def store_principal(session, user, email, name):
+    """
+    Save the snapshot of `user` in `session` at login, dropping the legacy keys.
+    """
+    for legacy in LEGACY_KEYS.values():
+        session.pop(legacy, None)
+    session[SESSION_KEY] = {"pk": user.pk, "role": user.role, "email": email, "name": name}
+
+
+class PrincipalMiddleware:
+    """
+    Set `request.principal`, built from the session the first time it is used.
+
+    Must come after `SessionMiddleware`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.principal = SimpleLazyObject(lambda: Principal.from_session(request.session))
+        return self.get_response(request)
@@ -10,7 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
-import os, environ
+import os, tempfile, environ
 
 from pathlib import Path
 
@@ -92,11 +92,13 @@ MIDDLEWARE = [
 
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    'App.middleware.PerformanceMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
 
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'AuthUser.principal.PrincipalMiddleware',
 
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -106,7 +108,7 @@ ROOT_URLCONF = 'Coti.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'App.template_backends.DjangoTemplates',
         'DIRS': ['Templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -146,6 +148,22 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Shared by every gunicorn worker on the host. Point CACHE_URL at redis:// or
+# memcache:// to share it across hosts, or locmemcache:// for a per-process cache.
+# The file cache culls a third of its entries at random when full, so anything
+# stored in it must tolerate disappearing at any time (see cache_versions), and
+# its add() is not atomic across workers (see drafts.allocate_line).
+
+CACHES = {
+    'default': env.cache(
+        'CACHE_URL',
+        default=f"filecache://{Path(tempfile.gettempdir()) / 'smarty-cache'}?max_entries=10000",
+    ),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -183,7 +201,16 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Hashed, compressed file names let WhiteNoise serve static files with
+# far-future cache headers. STATICFILES_STORAGE is ignored since Django 5.1.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -192,6 +219,50 @@ REST_FRAMEWORK = {
     ]
 }
 
+# Quote lists: keyset pagination keeps deep pages cheap on large tables,
+# at the cost of page numbers. The total shown is capped at QUOTE_LIST_COUNT_CAP.
+QUOTE_LIST_CURSOR_PAGINATION = env.bool('QUOTE_LIST_CURSOR_PAGINATION', default=False)
+QUOTE_LIST_COUNT_CAP = env.int('QUOTE_LIST_COUNT_CAP', default=1000)
+
+# Quote PDFs are rendered by a pool of PDF_WORKERS processes per web worker, so
+# WeasyPrint never blocks request threads. Jobs beyond PDF_QUEUE_LIMIT pending
+# ones are refused; job records are kept for PDF_JOB_TTL seconds.
+PDF_WORKERS = env.int('PDF_WORKERS', default=2)
+PDF_QUEUE_LIMIT = env.int('PDF_QUEUE_LIMIT', default=20)
+PDF_JOB_TTL = env.int('PDF_JOB_TTL', default=60 * 60)
+# Largest number of quotes a single ZIP export may include. Exports are built in
+# the background (one at a time per web worker) and downloaded once ready.
+PDF_EXPORT_MAX_QUOTES = env.int('PDF_EXPORT_MAX_QUOTES', default=500)
+
+# Rendered PDFs are stored in PDF_CACHE_DIR under a hash of their contents and
+# reused until evicted by age (seconds) or total size (bytes).
+PDF_CACHE_DIR = env.str('PDF_CACHE_DIR', default=str(Path(tempfile.gettempdir()) / 'smarty-pdf-cache'))
+PDF_CACHE_MAX_AGE = env.int('PDF_CACHE_MAX_AGE', default=30 * 24 * 60 * 60)
+PDF_CACHE_MAX_BYTES = env.int('PDF_CACHE_MAX_BYTES', default=500 * 1024 * 1024)
+
+# Per-request timings (App.middleware.PerformanceMiddleware). Requests over
+# their view's budget (wall time in ms, query count) are logged with their SQL;
+# "default" applies to views without their own entry. The Server-Timing header
+# exposes query counts, so it is only sent in DEBUG unless turned on.
+PERF_SERVER_TIMING = env.bool('PERF_SERVER_TIMING', default=DEBUG)
+PERF_BUDGETS = {
+    "default": {"ms": 1000, "queries": 30},
+    "update_product_prices": {"ms": 150, "queries": 5},
+    "update_quote_prices": {"ms": 300, "queries": 10},
+    "quote_products": {"ms": 200, "queries": 10},
+    "product_search": {"ms": 100, "queries": 5},
+    # Waits for the render when the request is not made through htmx.
+    "generate_pdf": {"ms": 15000, "queries": 20},
+    "export_quotes": {"ms": 5000, "queries": 50},
+}
+
+# /metrics (Prometheus text format). Each gunicorn worker writes its totals to
+# METRICS_DIR, which must be shared by the workers; scrapers send
+# "Authorization: Bearer <METRICS_TOKEN>". Without a token the endpoint is
+# only served in DEBUG.
+METRICS_DIR = env.str('METRICS_DIR', default=str(Path(tempfile.gettempdir()) / 'smarty-metrics'))
+METRICS_TOKEN = env.str('METRICS_TOKEN', default='')
+
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
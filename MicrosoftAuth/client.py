@@ -0,0 +1,100 @@
+import environ, logging, threading, time
+from collections import Counter
+from contextlib import contextmanager
+
+from msal import ConfidentialClientApplication, TokenCache
+
+logger = logging.getLogger(__name__)
+
+env = environ.Env()
+
+if env.str('ENV', default='development') != 'production':
+    environ.Env.read_env()
+
+# Environment Variables
+TENANT = env("MICROSOFT_TENANT", default="")
+CLIENT_ID = env("MICROSOFT_CLIENT_ID", default="")
+CLIENT_SECRET = env("MICROSOFT_CLIENT_SECRET", default="")
+
+_lock = threading.Lock()
+_client = None
+
+_stats_lock = threading.Lock()
+_stats = Counter()
+
+
+class _DiscardingTokenCache(TokenCache):
+    """
+    Token cache that keeps nothing.
+
+    The client is shared by every login of the worker, but each login's tokens
+    are only needed by its own callback, which stores the refresh token per
+    user (`RefreshToken`). Kept in MSAL's cache they would pile up for every
+    user who ever logged in and never be read.
+    """
+
+    def add(self, event, now=None):
+        pass
+
+
+def get_client():
+    """
+    Return this process's `ConfidentialClientApplication`, building it on first use.
+
+    Building the client runs the authority discovery round-trips, so it is done
+    once per worker instead of once per login; MSAL's HTTP session is reused
+    as well. Tokens are not cached (see `_DiscardingTokenCache`). Safe to call
+    from several threads.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                started = time.perf_counter()
+                _client = ConfidentialClientApplication(
+                    CLIENT_ID,
+                    CLIENT_SECRET,
+                    authority=f"https://login.microsoftonline.com/{TENANT}",
+                    token_cache=_DiscardingTokenCache(),
+                )
+                _record("build_client", time.perf_counter() - started)
+    return _client
+
+
+def _record(operation, seconds):
+    with _stats_lock:
+        _stats[f"{operation}_calls"] += 1
+        _stats[f"{operation}_seconds"] += seconds
+    logger.debug("MSAL %s took %.3fs", operation, seconds)
+
+
+@contextmanager
+def timed(operation):
+    """
+    Time an MSAL call into `msal_stats()` under `operation`.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(operation, time.perf_counter() - started)
+
+
+def initiate_auth_code_flow(**kwargs):
+    client = get_client()
+    with timed("initiate_auth_code_flow"):
+        return client.initiate_auth_code_flow(**kwargs)
+
+
+def acquire_token_by_auth_code_flow(auth_flow, auth_response, **kwargs):
+    client = get_client()
+    with timed("acquire_token_by_auth_code_flow"):
+        return client.acquire_token_by_auth_code_flow(auth_flow, auth_response, **kwargs)
+
+
+def msal_stats():
+    """
+    Return the call counts and total seconds spent per MSAL operation in this process.
+    """
+    with _stats_lock:
+        return dict(_stats)
@@ -1,5 +1,7 @@
-import jwt, requests, base64, environ, logging
+import jwt, requests, base64, environ, logging, threading, time, uuid
+from functools import lru_cache
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
@@ -14,12 +16,31 @@ if env.str('ENV', default='development') != 'production':
 
 # Environment Variables
 TENANT = env("MICROSOFT_TENANT", default="")
+CLIENT_ID = env("MICROSOFT_CLIENT_ID", default="")
+# Access tokens for `api://{CLIENT_ID}/...` scopes carry the app as audience:
+# its client ID in v2.0 tokens, its application ID URI in v1.0 ones.
+TOKEN_AUDIENCES = [CLIENT_ID, f"api://{CLIENT_ID}"]
+# Issuers of v2.0 and v1.0 tokens, for the tenant ID (`tid`) the token was issued in.
+TOKEN_ISSUERS = ("https://login.microsoftonline.com/{tid}/v2.0", "https://sts.windows.net/{tid}/")
+JWKS_URL = env("MICROSOFT_JWKS_URL", default=f"https://login.microsoftonline.com/{TENANT}/discovery/v2.0/keys")
+# Microsoft rotates signing keys every few weeks and publishes them well ahead.
+JWKS_TTL = env.int("MICROSOFT_JWKS_TTL", default=60 * 60 * 24)
+# Unknown kids trigger a refresh at most this often, so forged tokens can't hammer the endpoint.
+JWKS_MIN_REFRESH = 60 * 5
+HTTP_TIMEOUT = (3.05, 10)
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=4, max_retries=2))
+_session.mount("http://", HTTPAdapter(pool_maxsize=4, max_retries=2))
+
+_refresh_lock = threading.Lock()
+_keys = {}
+_fetched_at = None
 
 
 def get_microsoft_public_keys():
-    url = f"https://login.microsoftonline.com/{TENANT}/discovery/v2.0/keys"
     try:
-        response = requests.get(url)
+        response = _session.get(JWKS_URL, timeout=HTTP_TIMEOUT)
         response.raise_for_status()  # Raises an error for bad status codes
         keys = response.json().get("keys", [])
         if not keys:
@@ -29,47 +50,123 @@ def get_microsoft_public_keys():
         raise AuthenticationFailed(f"Error fetching Microsoft public keys: {str(e)}")
 
 
+def _refresh_keys(seen_at):
+    """
+    Replace the cached key set, unless another thread already did after
+    `seen_at`: concurrent logins wait for a single fetch.
+    """
+    global _keys, _fetched_at
+    with _refresh_lock:
+        if _fetched_at != seen_at:
+            return
+        try:
+            keys = get_microsoft_public_keys()
+        except AuthenticationFailed as e:
+            if not _keys:
+                raise
+            # Keep serving the known keys; retry after JWKS_MIN_REFRESH.
+            logger.warning("Keeping cached Microsoft public keys: %s", e)
+            _fetched_at = time.monotonic() - JWKS_TTL + JWKS_MIN_REFRESH
+            return
+        _keys = {key["kid"]: key for key in keys if "kid" in key}
+        _fetched_at = time.monotonic()
+
+
+def get_signing_key(kid):
+    """
+    Return the Microsoft JWK with key ID `kid`.
+
+    The key set is cached per process for `JWKS_TTL` seconds. An unknown `kid`
+    (a rotation) refreshes it early, at most once every `JWKS_MIN_REFRESH`.
+    """
+    seen_at = _fetched_at
+    if seen_at is None or time.monotonic() - seen_at > JWKS_TTL:
+        _refresh_keys(seen_at)
+
+    key = _keys.get(kid)
+    if key is None:
+        seen_at = _fetched_at
+        if time.monotonic() - seen_at > JWKS_MIN_REFRESH:
+            _refresh_keys(seen_at)
+            key = _keys.get(kid)
+
+    if key is None:
+        raise AuthenticationFailed("Unable to find appropriate key.")
+    return key
+
+
 def base64url_decode(base64url):
     padding = '=' * (4 - len(base64url) % 4)
     base64url += padding
     return base64.urlsafe_b64decode(base64url)
 
 
-def jwk_to_pem(jwk):
-    e = int.from_bytes(base64url_decode(jwk["e"]), byteorder='big')
-    n = int.from_bytes(base64url_decode(jwk["n"]), byteorder='big')
+@lru_cache(maxsize=32)
+def _public_key(n, e):
+    e = int.from_bytes(base64url_decode(e), byteorder='big')
+    n = int.from_bytes(base64url_decode(n), byteorder='big')
+    return rsa.RSAPublicNumbers(e=e, n=n).public_key(default_backend())
 
-    rsa_key = rsa.RSAPublicNumbers(e=e, n=n).public_key(default_backend())
 
-    pem = rsa_key.public_bytes(
+@lru_cache(maxsize=32)
+def _pem(n, e):
+    return _public_key(n, e).public_bytes(
         Encoding.PEM,
         PublicFormat.SubjectPublicKeyInfo
     )
-    return pem
 
 
-def validate_microsoft_token(token):
+def jwk_to_public_key(jwk):
+    return _public_key(jwk["n"], jwk["e"])
+
+
+def jwk_to_pem(jwk):
+    return _pem(jwk["n"], jwk["e"])
+
+
+def _is_tenant_id(value):
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def validate_microsoft_token(token, tenant_id=None):
+    """
+    Check the signature, expiry, audience and issuer of a Microsoft access token.
+
+    The issuer must belong to the token's own `tid`, which must match
+    `MICROSOFT_TENANT` when that is a tenant ID rather than a domain name or
+    `organizations`, and `tenant_id` (the `tid` of the login's ID token) when given.
+
+    Returns:
+        str: "success".
+
+    Raises:
+        AuthenticationFailed: If the token is not valid.
+    """
     try:
         header = jwt.get_unverified_header(token)
 
-        # Fetch public keys
-        public_keys = get_microsoft_public_keys()
-
-        # Find the correct key based on the key ID (kid)
-        rsa_key = {}
-        for key in public_keys:
-            if key["kid"] == header["kid"]:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"],
-                }
-                break
-
-        if not rsa_key:
-            raise AuthenticationFailed("Unable to find appropriate key.")
+        # Find the correct key based on the key ID (kid), from the cached key set
+        key = get_signing_key(header.get("kid"))
+
+        claims = jwt.decode(
+            token,
+            jwk_to_public_key(key),
+            algorithms=["RS256"],
+            audience=TOKEN_AUDIENCES,
+            options={"require": ["exp", "aud", "iss", "tid"]},
+            leeway=60,
+        )
+        tid = claims["tid"]
+        if _is_tenant_id(TENANT) and tid.lower() != TENANT.lower():
+            raise AuthenticationFailed("Token issued by another tenant.")
+        if tenant_id and tid != tenant_id:
+            raise AuthenticationFailed("Token issued by another tenant.")
+        if claims["iss"] not in [issuer.format(tid=tid) for issuer in TOKEN_ISSUERS]:
+            raise AuthenticationFailed("Invalid token issuer.")
 
         return "success"
 
@@ -1,3 +1,47 @@
+import base64
+
+from cryptography.fernet import Fernet, InvalidToken
+
 from django.db import models
+from django.utils.crypto import salted_hmac
+
+
+def _fernet():
+    key = salted_hmac("MicrosoftAuth.RefreshToken", "fernet", algorithm="sha256").digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
 
 # Create your models here.
+class RefreshToken(models.Model):
+    """
+    Latest Microsoft refresh token of a sales rep, kept out of the session row.
+
+    Encrypted with a key derived from `SECRET_KEY`: rotating it makes the
+    stored tokens unreadable and users simply log in again.
+    """
+
+    user = models.OneToOneField(
+        "AuthUser.SalesRep",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="microsoft_token",
+    )
+    token = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def store(cls, user_pk, token):
+        cls.objects.update_or_create(user_id=user_pk, defaults={"token": _fernet().encrypt(token.encode())})
+
+    @classmethod
+    def get_token(cls, user_pk):
+        """
+        Return the decrypted refresh token of `user_pk`, or None.
+        """
+        row = cls.objects.filter(user_id=user_pk).values_list("token", flat=True).first()
+        if row is None:
+            return None
+        try:
+            return _fernet().decrypt(bytes(row)).decode()
+        except InvalidToken:
+            return None
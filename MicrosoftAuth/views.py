@@ -1,7 +1,5 @@
 import environ, logging
 
-from msal import ConfidentialClientApplication
-
 from django.http import HttpRequest, HttpResponseRedirect, JsonResponse
 from django.shortcuts import render, redirect
 from django.contrib import messages
@@ -9,8 +7,12 @@ from django.contrib.auth import login, logout
 from django.views.decorators.cache import never_cache
 
 from .functions import validate_microsoft_token
+from .client import CLIENT_ID, acquire_token_by_auth_code_flow, initiate_auth_code_flow
 
 from App.models import SalesRep
+from AuthUser.principal import store_principal
+
+from .models import RefreshToken
 
 from rest_framework.exceptions import AuthenticationFailed
 
@@ -24,23 +26,12 @@ if ENVIRONMENT != 'production':
     environ.Env.read_env()
 
 # Environment Variables
-TENANT = env("MICROSOFT_TENANT", default="")
-CLIENT_ID = env("MICROSOFT_CLIENT_ID", default="")
-CLIENT_SECRET = env("MICROSOFT_CLIENT_SECRET", default="")
 REDIRECT_URI = env(
     "MICROSOFT_REDIRECT_URI" if ENVIRONMENT == "production" else "DEVELOPMENT_REDIRECT_URI",
     default=""
 )
 
 
-def set_client():
-    return ConfidentialClientApplication(
-        CLIENT_ID,
-        CLIENT_SECRET,
-        authority=f"https://login.microsoftonline.com/{TENANT}",
-    )
-
-
 @never_cache
 def microsoft_login(request: HttpRequest) -> HttpResponseRedirect:
     """
@@ -67,8 +58,7 @@ def microsoft_login(request: HttpRequest) -> HttpResponseRedirect:
         - The `auth_flow` stored in the session should not contain sensitive information.
         - Consider storing the redirect URI in an environment variable instead of hardcoding it.
     """   
-    _confidential_client = set_client()
-    auth_flow = _confidential_client.initiate_auth_code_flow(
+    auth_flow = initiate_auth_code_flow(
         scopes=[f"api://{CLIENT_ID}/User.Read"],
         redirect_uri=REDIRECT_URI,
     )
@@ -82,7 +72,6 @@ def microsoft_login(request: HttpRequest) -> HttpResponseRedirect:
 
 @never_cache
 def microsoft_callback(request):
-    _confidential_client = set_client()
     auth_flow = request.session.pop("auth_flow", None)
     auth_response = request.GET
 
@@ -90,7 +79,7 @@ def microsoft_callback(request):
         messages.error(request, "Ha ocurrido un error, intente de nuevo.")
         return redirect("/")
 
-    result = _confidential_client.acquire_token_by_auth_code_flow(
+    result = acquire_token_by_auth_code_flow(
         auth_flow, auth_response,
         scopes=[f"api://{CLIENT_ID}/User.Read"]
     )
@@ -104,7 +93,7 @@ def microsoft_callback(request):
     claims = result.get("id_token_claims")
     
     try:
-        validation_result = validate_microsoft_token(access_token)
+        validation_result = validate_microsoft_token(access_token, tenant_id=claims.get("tid"))
         if validation_result == "success":
             user_email = claims.get("preferred_username")
             full_name = claims.get("name")
@@ -121,19 +110,17 @@ def microsoft_callback(request):
     
     login(request, user)
 
-    request.session["pk"] = user.pk
-    request.session["role"] = user.role
-    request.session["user_email"] = user_email
-    request.session["full_name"] = full_name
-    request.session["token"] = result["refresh_token"]
-        
-    request.session.modified = True
+    store_principal(request.session, user, user_email, full_name)
+    if result.get("refresh_token"):
+        RefreshToken.store(user.pk, result["refresh_token"])
 
     return redirect("dashboard")
 
 
 @never_cache
 def microsoft_logout(request: HttpRequest, app_type: str = "server"):
+    if request.principal.is_authenticated:
+        RefreshToken.objects.filter(user_id=request.principal.pk).delete()
     logout(request)
     
     request.session.flush()